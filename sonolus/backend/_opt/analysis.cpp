@@ -0,0 +1,23748 @@
+/* Generated by Cython 3.3.0 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [
+            "sonolus/backend/_opt/_ops_gen.h",
+            "sonolus/backend/_opt/khash_shim.h"
+        ],
+        "include_dirs": [
+            "sonolus/backend/_opt"
+        ],
+        "language": "c++",
+        "name": "sonolus.backend._opt.analysis",
+        "sources": [
+            "sonolus/backend/_opt/analysis.pyx"
+        ]
+    },
+    "module_name": "sonolus.backend._opt.analysis"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+/* InitLimitedAPI */
+#if defined(Py_LIMITED_API)
+  #if !defined(CYTHON_LIMITED_API)
+  #define CYTHON_LIMITED_API 1
+  #endif
+#elif defined(CYTHON_LIMITED_API)
+  #ifdef _MSC_VER
+  #pragma message ("Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.")
+  #else
+  #warning Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.
+  #endif
+#endif
+
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x03090000
+    #error Cython requires Python 3.9+.
+#elif defined(Py_LIMITED_API) && (Py_LIMITED_API & 0xFFFF0000) > (PY_VERSION_HEX & 0xFFFF0000)
+    #error 'Py_LIMITED_API' can only select past Python X.Y versions, not future ones.
+#else
+#define __PYX_ABI_VERSION "3_3_0"
+#define CYTHON_HEX_VERSION 0x030300F0
+#define CYTHON_FUTURE_DIVISION 1
+/* CModulePreamble */
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(_WIN32) && !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifdef __has_builtin
+  #define __Pyx_has_cbuiltin(name) __has_builtin(name)
+#else
+  #define __Pyx_has_cbuiltin(name) (0)
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#define __PYX_LIMITED_VERSION_HEX PY_VERSION_HEX
+#if defined(CYTHON_LIMITED_API)
+  #ifdef Py_LIMITED_API
+    #undef __PYX_LIMITED_VERSION_HEX
+    #define __PYX_LIMITED_VERSION_HEX Py_LIMITED_API
+    #if Py_LIMITED_API < 0x03090000
+      #error "Cython 3.3 requires the Python Limited API version to be 3.9 or greater."
+    #endif
+  #endif
+  #if defined(GRAALVM_PYTHON) || defined(PYPY_VERSION)
+    #ifdef _MSC_VER
+      #pragma message ("Py_LIMITED_API is defined on PyPy or GraalPy. This takes precedence over Cython's specialized\
+        code for PyPy and GraalPy and is unlikely to work.")
+    #else
+      #warning "Py_LIMITED_API is defined on PyPy or GraalPy. This takes precedence over Cython's specialized\
+        code for PyPy and GraalPy and is unlikely to work."
+    #endif
+  #endif
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 1
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #endif
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_VECTORCALL
+  #define CYTHON_VECTORCALL (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
+  #ifndef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW (CYTHON_VECTORCALL && __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (__PYX_LIMITED_VERSION_HEX >= 0x030F0000 && PY_VERSION_HEX > 0x030F00A8)
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND (__PYX_LIMITED_VERSION_HEX >= 0x030A0000)
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 1
+  #endif
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #if __PYX_LIMITED_VERSION_HEX < 0x030E0000
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+  #elif !defined(CYTHON_OPAQUE_OBJECTS)
+  #define CYTHON_OPAQUE_OBJECTS (__PYX_LIMITED_VERSION_HEX >= 0x030F0000)
+  #endif
+#elif defined(GRAALVM_PYTHON)
+  /* For very preliminary testing purposes. Most variables are set the same as PyPy.
+     The existence of this section does not imply that anything works or is even tested */
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 1
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 0
+  #endif
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW CYTHON_VECTORCALL
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 1
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+#elif defined(PYPY_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 1
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW (PYPY_VERSION_NUM >= 0x07030800 && CYTHON_VECTORCALL)
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PYPY_VERSION_NUM >= 0x07030C00)
+  #endif
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC (PYPY_VERSION_NUM >= 0x07031100)
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #ifdef Py_GIL_DISABLED
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 1
+  #else
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #endif
+  #if PY_VERSION_HEX < 0x030A0000
+    #undef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #elif !defined(CYTHON_USE_TYPE_SLOTS)
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #ifndef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #ifndef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLIST_INTERNALS)
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #elif !defined(CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS)
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #ifndef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_FAST_GIL
+    #define CYTHON_FAST_GIL 0
+  #elif !defined(CYTHON_FAST_GIL)
+    #define CYTHON_FAST_GIL (PY_VERSION_HEX < 0x030C00A6)
+  #endif
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW CYTHON_VECTORCALL
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #ifndef CYTHON_USE_SYS_MONITORING
+    #define CYTHON_USE_SYS_MONITORING (PY_VERSION_HEX >= 0x030d00B1)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS 0
+  #elif !defined(CYTHON_USE_DICT_VERSIONS)
+    #define CYTHON_USE_DICT_VERSIONS  (PY_VERSION_HEX < 0x030C00A5 && !CYTHON_USE_MODULE_STATE)
+  #endif
+  #ifndef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 1
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR (PY_VERSION_HEX < 0x030C00B2)
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+    #define CYTHON_USE_FREELISTS (!CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+  #if defined(CYTHON_IMMORTAL_CONSTANTS) && PY_VERSION_HEX < 0x030C0000
+    #undef CYTHON_IMMORTAL_CONSTANTS
+    #define CYTHON_IMMORTAL_CONSTANTS 0  // definitely won't work
+  #elif !defined(CYTHON_IMMORTAL_CONSTANTS)
+    #define CYTHON_IMMORTAL_CONSTANTS (PY_VERSION_HEX >= 0x030C0000 && !CYTHON_USE_MODULE_STATE && CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+  #ifndef CYTHON_OPAQUE_OBJECTS
+    #define CYTHON_OPAQUE_OBJECTS 0
+  #endif
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(maybe_unused) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(maybe_unused)
+        #define CYTHON_UNUSED [[maybe_unused]]
+      #endif
+    #endif
+  #elif defined(__STDC_VERSION__) && __STDC_VERSION__ >= 202311L
+    #define CYTHON_UNUSED [[maybe_unused]]
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+  #define CYTHON_MAYBE_UNUSED_VAR(x) CYTHON_UNUSED_VAR(x)
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_USE_CPP_STD_MOVE
+  #if defined(__cplusplus) && (\
+    __cplusplus >= 201103L || (defined(_MSC_VER) && _MSC_VER >= 1600))
+    #define CYTHON_USE_CPP_STD_MOVE 1
+  #else
+    #define CYTHON_USE_CPP_STD_MOVE 0
+  #endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#include <stdint.h>
+typedef uintptr_t  __pyx_uintptr_t;
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(fallthrough) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(fallthrough)
+        #define CYTHON_FALLTHROUGH [[fallthrough]]
+      #endif
+    #endif
+    #ifndef CYTHON_FALLTHROUGH
+      #if __has_cpp_attribute(clang::fallthrough)
+        #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+      #elif __has_cpp_attribute(gnu::fallthrough)
+        #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+      #endif
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+#ifdef Py_UNREACHABLE
+  #define __Pyx_UNREACHABLE() Py_UNREACHABLE()
+#elif __Pyx_has_cbuiltin(__builtin_unreachable)
+  #define __Pyx_UNREACHABLE() __builtin_unreachable()
+#elif defined(__clang__) || defined(__INTEL_COMPILER) || (defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 5)))
+  #define __Pyx_UNREACHABLE() __builtin_unreachable()
+#elif defined(_MSC_VER)
+  #define __Pyx_UNREACHABLE() __assume(0)
+#else
+  #define __Pyx_UNREACHABLE() Py_FatalError("Unreachable C code path reached")
+#endif
+#ifndef Py_UNREACHABLE
+  #define Py_UNREACHABLE() __Pyx_UNREACHABLE()
+#endif
+#ifdef __cplusplus
+  template <typename T>
+  struct __PYX_IS_UNSIGNED_IMPL {static const bool value = T(0) < T(-1);};
+  #define __PYX_IS_UNSIGNED(type) (__PYX_IS_UNSIGNED_IMPL<type>::value)
+#else
+  #define __PYX_IS_UNSIGNED(type) (((type)-1) > 0)
+#endif
+#if CYTHON_COMPILING_IN_PYPY == 1
+  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX < 0x030A0000)
+#else
+  #define __PYX_NEED_TP_PRINT_SLOT  0
+#endif
+#define __PYX_REINTERPRET_FUNCION(func_pointer, other_pointer) ((func_pointer)(void(*)(void))(other_pointer))
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+#define __Pyx_PyErr_FetchException(petype, peval, petb) PyErr_Fetch(petype, peval, petb)
+#define __Pyx_PyErr_RestoreException(etype, eval, etb) PyErr_Restore(etype, eval, etb)
+#else
+#define __Pyx_PyErr_FetchException(petype, peval, petb) *(petype)=NULL; *(peval)=PyErr_GetRaisedException(); *(petb)=NULL
+#define __Pyx_PyErr_RestoreException(etype, eval, etb) PyErr_SetRaisedException(eval)
+#endif
+
+/* CppInitCode */
+#ifndef __cplusplus
+  #error "Cython files generated with the C++ option must be compiled with a C++ compiler."
+#endif
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #else
+    #define CYTHON_INLINE inline
+  #endif
+#endif
+template<typename T>
+void __Pyx_call_destructor(T& x) {
+    x.~T();
+}
+template<typename T>
+class __Pyx_FakeReference {
+  public:
+    __Pyx_FakeReference() : ptr(NULL) { }
+    __Pyx_FakeReference(const T& ref) : ptr(const_cast<T*>(&ref)) { }
+    T *operator->() { return ptr; }
+    T *operator&() { return ptr; }
+    operator T&() { return *ptr; }
+    template<typename U> bool operator ==(const U& other) const { return *ptr == other; }
+    template<typename U> bool operator !=(const U& other) const { return *ptr != other; }
+    template<typename U> bool operator==(const __Pyx_FakeReference<U>& other) const { return *ptr == *other.ptr; }
+    template<typename U> bool operator!=(const __Pyx_FakeReference<U>& other) const { return *ptr != *other.ptr; }
+  private:
+    T *ptr;
+};
+
+/* PythonCompatibility */
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#define __Pyx_BUILTIN_MODULE_NAME "builtins"
+#define __Pyx_DefaultClassType PyType_Type
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #ifndef CO_OPTIMIZED
+    static int CO_OPTIMIZED;
+    #endif
+    #ifndef CO_NEWLOCALS
+    static int CO_NEWLOCALS;
+    #endif
+    #ifndef CO_VARARGS
+    static int CO_VARARGS;
+    #endif
+    #ifndef CO_VARKEYWORDS
+    static int CO_VARKEYWORDS;
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+    static int CO_ASYNC_GENERATOR;
+    #endif
+    #ifndef CO_GENERATOR
+    static int CO_GENERATOR;
+    #endif
+    #ifndef CO_COROUTINE
+    static int CO_COROUTINE;
+    #endif
+#else
+    #ifndef CO_COROUTINE
+      #define CO_COROUTINE 0x80
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+      #define CO_ASYNC_GENERATOR 0x200
+    #endif
+#endif
+static int __Pyx_init_co_variables(void);
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_Is)
+  #define __Pyx_Py_Is(x, y)  Py_Is(x, y)
+#else
+  #define __Pyx_Py_Is(x, y) ((x) == (y))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsNone)
+  #define __Pyx_Py_IsNone(ob) Py_IsNone(ob)
+#else
+  #define __Pyx_Py_IsNone(ob) __Pyx_Py_Is((ob), Py_None)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsTrue)
+  #define __Pyx_Py_IsTrue(ob) Py_IsTrue(ob)
+#else
+  #define __Pyx_Py_IsTrue(ob) __Pyx_Py_Is((ob), Py_True)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsFalse)
+  #define __Pyx_Py_IsFalse(ob) Py_IsFalse(ob)
+#else
+  #define __Pyx_Py_IsFalse(ob) __Pyx_Py_Is((ob), Py_False)
+#endif
+#define __Pyx_NoneAsNull(obj)  (__Pyx_Py_IsNone(obj) ? NULL : (obj))
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static unsigned long __Pyx_Runtime_TPFLAGS_SEQUENCE;
+static unsigned long __Pyx_Runtime_TPFLAGS_MAPPING;
+#else
+#define __Pyx_Runtime_TPFLAGS_SEQUENCE Py_TPFLAGS_SEQUENCE
+#define __Pyx_Runtime_TPFLAGS_MAPPING Py_TPFLAGS_MAPPING
+#endif
+static int __Pyx_init_tpflags_variables(void);
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef Py_TPFLAGS_SEQUENCE
+  #define Py_TPFLAGS_SEQUENCE (CYTHON_COMPILING_IN_LIMITED_API ? 0 : 1 << 5)
+#endif
+#ifndef Py_TPFLAGS_MAPPING
+  #define Py_TPFLAGS_MAPPING (CYTHON_COMPILING_IN_LIMITED_API ? 0 : 1 << 6)
+#endif
+#ifndef Py_TPFLAGS_IMMUTABLETYPE
+  #define Py_TPFLAGS_IMMUTABLETYPE (1UL << 8)
+#endif
+#ifndef Py_TPFLAGS_DISALLOW_INSTANTIATION
+  #define Py_TPFLAGS_DISALLOW_INSTANTIATION (1UL << 7)
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if !defined(METH_FASTCALL) || CYTHON_COMPILING_IN_PYPY
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #if PY_VERSION_HEX >= 0x030d00A4
+  #  define __Pyx_PyCFunctionFast PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords PyCFunctionFastWithKeywords
+  #else
+  #  define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+  #endif
+#endif
+#if CYTHON_VECTORCALL
+  #define __Pyx_METH_FASTCALL METH_FASTCALL
+  #define __Pyx_PyCFunction_FastCall __Pyx_PyCFunctionFast
+  #define __Pyx_PyCFunction_FastCallWithKeywords __Pyx_PyCFunctionFastWithKeywords
+#else
+  #define __Pyx_METH_FASTCALL METH_VARARGS
+  #define __Pyx_PyCFunction_FastCall PyCFunction
+  #define __Pyx_PyCFunction_FastCallWithKeywords PyCFunctionWithKeywords
+#endif
+#if CYTHON_VECTORCALL
+  #define __pyx_vectorcallfunc vectorcallfunc
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  PY_VECTORCALL_ARGUMENTS_OFFSET
+  #define __Pyx_PyVectorcall_NARGS(n)  PyVectorcall_NARGS((size_t)(n))
+#else
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  0
+  #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(n))
+#endif
+#define __Pyx_PyCFunction_CheckExact(func) PyCFunction_CheckExact(func)
+#define __Pyx_CyOrPyCFunction_Check(func)  PyCFunction_Check(func)
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  (((PyCFunctionObject*)(func))->m_ml->ml_meth)
+#elif !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  PyCFunction_GET_FUNCTION(func)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FLAGS(func)  (((PyCFunctionObject*)(func))->m_ml->ml_flags)
+static CYTHON_INLINE PyObject* __Pyx_CyOrPyCFunction_GET_SELF(PyObject *func) {
+    return (__Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_STATIC) ? NULL : ((PyCFunctionObject*)func)->m_self;
+}
+#endif
+static CYTHON_INLINE int __Pyx__IsSameCFunction(PyObject *func, void (*cfunc)(void)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    return PyCFunction_Check(func) && PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+#else
+    return PyCFunction_Check(func) && PyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+#endif
+}
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCFunction(func, cfunc)
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  ((void)m, PyType_FromSpecWithBases(s, b))
+#else
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  PyType_FromModuleAndSpec(m, s, b)
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
+#else
+  #define __Pyx_PyCMethod  PyCMethod
+#endif
+#ifndef METH_METHOD
+  #define METH_METHOD 0x200
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)
+#elif CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) GraalPyFrame_SetLineNumber((frame), (lineno))
+#elif CYTHON_COMPILING_IN_GRAAL
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) _PyFrame_SetLineNumber((frame), (lineno))
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyThreadState_Current PyThreadState_Get()
+#elif !CYTHON_FAST_THREAD_STATE
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x030d00A1
+  #define __Pyx_PyThreadState_Current PyThreadState_GetUnchecked()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#endif
+#if CYTHON_OPAQUE_OBJECTS && CYTHON_COMPILING_IN_LIMITED_API
+    #define __PYX_SHARED_SIZEOF(T) -((int)sizeof(T))
+    #define __PYX_SHARED_RELATIVE_OFFSET Py_RELATIVE_OFFSET
+    #define CYTHON_OPAQUE_SHARED_TYPES 1
+#else
+    #define __PYX_SHARED_SIZEOF(T) sizeof(T)
+    #define __PYX_SHARED_RELATIVE_OFFSET 0
+    #define CYTHON_OPAQUE_SHARED_TYPES 0
+#endif
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_INLINE void *__Pyx__PyModule_GetState(PyObject *op)
+{
+    void *result;
+    result = PyModule_GetState(op);
+    if (!result)
+        Py_FatalError("Couldn't find the module state");
+    return result;
+}
+#define __Pyx_PyModule_GetState(o) (__pyx_mstatetype *)__Pyx__PyModule_GetState(o)
+#else
+#define __Pyx_PyModule_GetState(op) ((void)op,__pyx_mstate_global)
+#endif
+#define __Pyx_PyObject_GetSlot(obj, name, func_ctype)  __Pyx_PyType_GetSlot(Py_TYPE((PyObject *) obj), name, func_ctype)
+#define __Pyx_PyObject_TryGetSlot(obj, name, func_ctype) __Pyx_PyType_TryGetSlot(Py_TYPE(obj), name, func_ctype)
+#define __Pyx_PyObject_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#define __Pyx_PyObject_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((type)->name)
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype) __Pyx_PyType_GetSlot(type, name, func_ctype)
+  #define __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype) (((type)->sub) ? ((type)->sub->name) : NULL)
+  #define __Pyx_PyType_TryGetSubSlot(type, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype)
+#else
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((func_ctype) PyType_GetSlot((type), Py_##name))
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype)\
+    ((__PYX_LIMITED_VERSION_HEX >= 0x030A0000 ||\
+     (PyType_GetFlags(type) & Py_TPFLAGS_HEAPTYPE) || __Pyx_get_runtime_version() >= 0x030A0000) ?\
+     __Pyx_PyType_GetSlot(type, name, func_ctype) : NULL)
+  #define __Pyx_PyType_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSlot(obj, name, func_ctype)
+  #define __Pyx_PyType_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSlot(obj, name, func_ctype)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+#define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStrWithError(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStr(PyObject *dict, PyObject *name) {
+    PyObject *res = __Pyx_PyDict_GetItemStrWithError(dict, name);
+    if (res == NULL && PyErr_Occurred()) {
+        PyErr_WriteUnraisable(NULL);
+    }
+    return res;
+}
+#elif !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
+#define __Pyx_PyDict_GetItemStrWithError  PyDict_GetItemWithError
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#else
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict, PyObject *name) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyDict_GetItem(dict, name);
+#else
+    PyDictEntry *ep;
+    PyDictObject *mp = (PyDictObject*) dict;
+    long hash = ((PyStringObject *) name)->ob_shash;
+    assert(hash != -1);
+    ep = (mp->ma_lookup)(mp, name, hash);
+    if (ep == NULL) {
+        return NULL;
+    }
+    return ep->me_value;
+#endif
+}
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetFlags(tp)   (((PyTypeObject *)tp)->tp_flags)
+  #define __Pyx_PyType_HasFeature(type, feature)  ((__Pyx_PyType_GetFlags(type) & (feature)) != 0)
+#else
+  #define __Pyx_PyType_GetFlags(tp)   (PyType_GetFlags((PyTypeObject *)tp))
+  #define __Pyx_PyType_HasFeature(type, feature)  PyType_HasFeature(type, feature)
+#endif
+#define __Pyx_PyObject_GetIterNextFunc(iterator)  __Pyx_PyObject_GetSlot(iterator, tp_iternext, iternextfunc)
+#if CYTHON_USE_TYPE_SPECS
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  {\
+    PyTypeObject *type = Py_TYPE((PyObject*)obj);\
+    assert(__Pyx_PyType_HasFeature(type, Py_TPFLAGS_HEAPTYPE));\
+    PyObject_GC_Del(obj);\
+    Py_DECREF(type);\
+}
+#else
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  PyObject_GC_Del(obj)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_ReadChar(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((void)u, 1114111U)
+  #define __Pyx_PyUnicode_KIND(u)         ((void)u, (0))
+  #define __Pyx_PyUnicode_KIND_04(u)      __Pyx_PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)k, PyUnicode_ReadChar((PyObject*)(d), i))
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GetLength(u))
+#else
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         ((int)PyUnicode_KIND(u))
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, (Py_UCS4) ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+  static CYTHON_INLINE int __Pyx_PyUnicode_KIND_04(PyObject *o) {
+      return __Pyx_PyUnicode_KIND(o) - (int) !!PyUnicode_IS_ASCII(o);
+  }
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #if !defined(PyUnicode_DecodeUnicodeEscape)
+    #define PyUnicode_DecodeUnicodeEscape(s, size, errors)  PyUnicode_Decode(s, size, "unicode_escape", errors)
+  #endif
+  #if !defined(PyUnicode_Contains)
+    #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+  #endif
+  #if !defined(PyByteArray_Check)
+    #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+  #endif
+  #if !defined(PyObject_Format)
+    #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+  #endif
+#endif
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && PyUnstable_Object_IsUniquelyReferenced(obj)) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#elif CYTHON_COMPILING_IN_CPYTHON
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && Py_REFCNT(obj) == 1) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#else
+  #define __Pyx_PySequence_ListKeepNew(obj)  PySequence_List(obj)
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        Py_IS_TYPE(obj, &PySet_Type)
+#endif
+enum __Pyx_ReferenceSharing {
+  __Pyx_ReferenceSharing_DefinitelyUnique, // We created it so we know it's unshared - no need to check
+  __Pyx_ReferenceSharing_OwnStrongReference,
+  __Pyx_ReferenceSharing_FunctionArgument,
+  __Pyx_ReferenceSharing_SharedReference, // Never trust it to be unshared because it's a global or similar
+};
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX >= 0x030E0000
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing)\
+    (sharing == __Pyx_ReferenceSharing_DefinitelyUnique ? 1 :\
+      (sharing == __Pyx_ReferenceSharing_FunctionArgument ? PyUnstable_Object_IsUniqueReferencedTemporary(o) :\
+      (sharing == __Pyx_ReferenceSharing_OwnStrongReference ? PyUnstable_Object_IsUniquelyReferenced(o) : 0)))
+#elif (CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING) || CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)sharing), Py_REFCNT(o) == 1)
+#else
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)o), ((void)sharing), 0)
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+  #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyList_GetItemRef(o, i) (likely((i) >= 0) ? PySequence_GetItem(o, i) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+  #else
+    #define __Pyx_PyList_GetItemRef(o, i) PySequence_ITEM(o, i)
+  #endif
+#elif CYTHON_COMPILING_IN_LIMITED_API || !(CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE)
+  #define __Pyx_PyList_GetItemRef(o, i) __Pyx_XNewRef(PyList_GetItem(o, i))
+#else
+  #define __Pyx_PyList_GetItemRef(o, i) (likely(__Pyx_is_valid_index(i, PyList_GET_SIZE(o))) ?\
+    __Pyx_NewRef(PyList_GET_ITEM(o, i)) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+#endif
+#if CYTHON_AVOID_BORROWED_REFS || CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_PyList_GetItemRef(o, i))
+#elif CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared) (\
+      __Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+      __Pyx_NewRef(PyList_GET_ITEM(o, i)) : __Pyx_PyList_GetItemRef(o, i))
+  #else
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared) (\
+      __Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+      __Pyx_XNewRef(PyList_GetItem(o, i)) : __Pyx_PyList_GetItemRef(o, i))
+  #endif
+#elif CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_NewRef(PyList_GET_ITEM(o, i)))
+#else
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_XNewRef(PyList_GetItem(o, i)))
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_PyDict_GetItemRef(dict, key, result) PyDict_GetItemRef(dict, key, result)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyObject_GetItem(dict, key);
+  if (*result == NULL) {
+    if (PyErr_ExceptionMatches(PyExc_KeyError)) {
+      PyErr_Clear();
+      return 0;
+    }
+    return -1;
+  }
+  return 1;
+}
+#else
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyDict_GetItemWithError(dict, key);
+  if (*result == NULL) {
+    return PyErr_Occurred() ? -1 : 0;
+  }
+  Py_INCREF(*result);
+  return 1;
+}
+#endif
+#if defined(CYTHON_DEBUG_VISIT_CONST) && CYTHON_DEBUG_VISIT_CONST
+  #define __Pyx_VISIT_CONST(obj)  Py_VISIT(obj)
+#else
+  #define __Pyx_VISIT_CONST(obj)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_ITEM(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) (PyTuple_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GET_ITEM(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) (PyList_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GET_ITEM(o, i)
+#else
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_GetItem(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) PyTuple_SetItem(o, i, v)
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GetItem(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) PyList_SetItem(o, i, v)
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GetItem(o, i)
+#endif
+#if CYTHON_ASSUME_SAFE_SIZE
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_GET_SIZE(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_GET_SIZE(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_GET_SIZE(o)
+  #define __Pyx_PyDict_GET_SIZE(o) PyDict_GET_SIZE(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_GET_SIZE(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_GET_SIZE(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GET_LENGTH(o)
+#else
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_Size(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_Size(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_Size(o)
+  #define __Pyx_PyDict_GET_SIZE(o) PyDict_Size(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_Size(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_Size(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GetLength(o)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_InternFromString)
+  #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+#endif
+#define __Pyx_PyLong_FromHash_t PyLong_FromSsize_t
+#define __Pyx_PyLong_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#if __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+    #define __Pyx_PySendResult PySendResult
+#else
+    typedef enum {
+        PYGEN_RETURN = 0,
+        PYGEN_ERROR = -1,
+        PYGEN_NEXT = 1,
+    } __Pyx_PySendResult;
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX < 0x030A00A3
+  typedef __Pyx_PySendResult (*__Pyx_pyiter_sendfunc)(PyObject *iter, PyObject *value, PyObject **result);
+#else
+  #define __Pyx_pyiter_sendfunc sendfunc
+#endif
+#if !CYTHON_USE_AM_SEND
+#define __PYX_HAS_PY_AM_SEND 0
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+#define __PYX_HAS_PY_AM_SEND 1
+#else
+#define __PYX_HAS_PY_AM_SEND 2  // our own backported implementation
+#endif
+#if __PYX_HAS_PY_AM_SEND < 2
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+#else
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+        __Pyx_pyiter_sendfunc am_send;
+    } __Pyx_PyAsyncMethodsStruct;
+    #define __Pyx_SlotTpAsAsync(s) ((PyAsyncMethods*)(s))
+#endif
+#if CYTHON_USE_AM_SEND && PY_VERSION_HEX < 0x030A00F0
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (1UL << 21)
+#else
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (0)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030A0000
+#ifdef __cplusplus
+extern "C"
+#endif
+PyAPI_FUNC(void *) PyMem_Calloc(size_t nelem, size_t elsize);
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_init_co_variable(PyObject *inspect, const char* name, int *write_to) {
+    int value;
+    PyObject *py_value = PyObject_GetAttrString(inspect, name);
+    if (!py_value) return 0;
+    value = (int) PyLong_AsLong(py_value);
+    Py_DECREF(py_value);
+    *write_to = value;
+    return value != -1 || !PyErr_Occurred();
+}
+static int __Pyx_init_co_variables(void) {
+    PyObject *inspect;
+    int result;
+    inspect = PyImport_ImportModule("inspect");
+    result =
+#if !defined(CO_OPTIMIZED)
+        __Pyx_init_co_variable(inspect, "CO_OPTIMIZED", &CO_OPTIMIZED) &&
+#endif
+#if !defined(CO_NEWLOCALS)
+        __Pyx_init_co_variable(inspect, "CO_NEWLOCALS", &CO_NEWLOCALS) &&
+#endif
+#if !defined(CO_VARARGS)
+        __Pyx_init_co_variable(inspect, "CO_VARARGS", &CO_VARARGS) &&
+#endif
+#if !defined(CO_VARKEYWORDS)
+        __Pyx_init_co_variable(inspect, "CO_VARKEYWORDS", &CO_VARKEYWORDS) &&
+#endif
+#if !defined(CO_ASYNC_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_ASYNC_GENERATOR", &CO_ASYNC_GENERATOR) &&
+#endif
+#if !defined(CO_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_GENERATOR", &CO_GENERATOR) &&
+#endif
+#if !defined(CO_COROUTINE)
+        __Pyx_init_co_variable(inspect, "CO_COROUTINE", &CO_COROUTINE) &&
+#endif
+        1;
+    Py_DECREF(inspect);
+    return result ? 0 : -1;
+}
+static int __Pyx_init_tpflags_bitcount(unsigned long flag) {
+    int count = 0;
+    while (flag) {
+        count += (int) (flag & 1);
+        flag >>= 1;
+    }
+    return count;
+}
+static int __Pyx_init_tpflags_variables(void) {
+    if (__Pyx_Runtime_TPFLAGS_SEQUENCE != 0 && __Pyx_Runtime_TPFLAGS_MAPPING != 0) {
+        return 0;
+    }
+    PyObject *collections_abc = PyImport_ImportModule("collections.abc");
+    if (!collections_abc) return -1;
+    int result = 0;
+    PyObject *sequence = NULL, *mapping = NULL;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030D0000
+    if (PyObject_GetOptionalAttrString(collections_abc, "Sequence", &sequence) != 1) goto fail;
+    if (PyObject_GetOptionalAttrString(collections_abc, "Mapping", &mapping) != 1) goto fail;
+#else
+    sequence = PyObject_GetAttrString(collections_abc, "Sequence");
+    if (!sequence) goto fail_attr_lookup;
+    mapping = PyObject_GetAttrString(collections_abc, "Mapping");
+    if (!mapping) goto fail_attr_lookup;
+#endif
+    if (!PyType_Check(sequence) || !PyType_Check(mapping)) goto fail;
+    {
+        unsigned long sequence_flags = PyType_GetFlags((PyTypeObject*)sequence);
+        unsigned long mapping_flags = PyType_GetFlags((PyTypeObject*)mapping);
+        unsigned long mutual_flags = sequence_flags & mapping_flags;
+        sequence_flags = sequence_flags ^ mutual_flags;
+        mapping_flags = mapping_flags ^ mutual_flags;
+        if (__Pyx_Runtime_TPFLAGS_SEQUENCE == 0 && __Pyx_init_tpflags_bitcount(sequence_flags) == 1) {
+            __Pyx_Runtime_TPFLAGS_SEQUENCE = sequence_flags;
+        }
+        if (__Pyx_Runtime_TPFLAGS_MAPPING == 0 && __Pyx_init_tpflags_bitcount(mapping_flags) == 1) {
+            __Pyx_Runtime_TPFLAGS_MAPPING = mapping_flags;
+        }
+    }
+    cleanup:
+    Py_XDECREF(mapping);
+    Py_XDECREF(sequence);
+    Py_DECREF(collections_abc);
+    return result;
+#if __PYX_LIMITED_VERSION_HEX < 0x030D0000
+    fail_attr_lookup:
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    }
+#endif
+    fail:
+    result = PyErr_Occurred() ? -1 : 0;
+    goto cleanup;
+}
+#else
+static int __Pyx_init_co_variables(void) {
+    return 0;  // It's a limited API-only feature
+}
+static int __Pyx_init_tpflags_variables(void) {
+    return 0;  // It's a limited API-only feature
+}
+#endif
+
+/* MathInitCode */
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #ifndef _USE_MATH_DEFINES
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#ifndef CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#define CYTHON_CLINE_IN_TRACEBACK_RUNTIME 0
+#endif
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+#define CYTHON_CLINE_IN_TRACEBACK CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#endif
+#if CYTHON_CLINE_IN_TRACEBACK
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; __pyx_clineno = __LINE__; (void) __pyx_clineno; }
+#else
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; (void) __pyx_clineno; }
+#endif
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifdef CYTHON_EXTERN_C
+    #undef __PYX_EXTERN_C
+    #define __PYX_EXTERN_C CYTHON_EXTERN_C
+#elif defined(__PYX_EXTERN_C)
+    #ifdef _MSC_VER
+    #pragma message ("Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.")
+    #else
+    #warning Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.
+    #endif
+#else
+    #define __PYX_EXTERN_C extern "C++"
+#endif
+
+#define __PYX_HAVE__sonolus__backend___opt__analysis
+#define __PYX_HAVE_API__sonolus__backend___opt__analysis
+/* Early includes */
+#include <stdint.h>
+#include "khash_shim.h"
+#include <string.h>
+#include <stdlib.h>
+#include "_ops_gen.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+#ifdef CYTHON_FREETHREADING_COMPATIBLE
+#if CYTHON_FREETHREADING_COMPATIBLE
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_NOT_USED
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char*);
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AS_STRING(s)
+#else
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AsString(s)
+#endif
+#define __Pyx_PyObject_AsWritableString(s)    ((char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromOrdinal(o)       PyUnicode_FromOrdinal((int)o)
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+static CYTHON_INLINE PyObject *__Pyx_NewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_NewRef)
+    return Py_NewRef(obj);
+#else
+    Py_INCREF(obj);
+    return obj;
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_XNewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_XNewRef)
+    return Py_XNewRef(obj);
+#else
+    Py_XINCREF(obj);
+    return obj;
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b);
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x);
+#define __Pyx_PyObject_RichCompareBool(a,b,cmp)  __Pyx_PyObject_IsTrueAndDecref(PyObject_RichCompare((a),(b),(cmp)))
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __Pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AS_DOUBLE(x)
+#define __Pyx_PyFloat_IsNonZero(x) (PyFloat_AS_DOUBLE(x) != 0.0)
+#else
+#define __Pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_IsNonZero(x) PyObject_IsTrue(x)
+#endif
+#define __Pyx_PyFloat_AsFloat(x) ((float) __Pyx_PyFloat_AsDouble(x))
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_VERSION_HEX >= 0x030C00A7
+  #ifndef _PyLong_SIGN_MASK
+    #define _PyLong_SIGN_MASK 3
+  #endif
+  #ifndef _PyLong_NON_SIZE_BITS
+    #define _PyLong_NON_SIZE_BITS 3
+  #endif
+  #define __Pyx_PyLong_SignBits(x)  ((int) (((PyLongObject*)x)->long_value.lv_tag & _PyLong_SIGN_MASK))
+  #define __Pyx_PyLong_Sign(x)  (1 - __Pyx_PyLong_SignBits(x))
+  #define __Pyx_PyLong_IsNeg(x)  ((__Pyx_PyLong_SignBits(x) & 2) != 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (!__Pyx_PyLong_IsNeg(x))
+  #define __Pyx_PyLong_IsZero(x)  (__Pyx_PyLong_SignBits(x) & 1)
+  #define __Pyx_PyLong_IsPos(x)  (__Pyx_PyLong_SignBits(x) == 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  (__Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  ((Py_ssize_t) (((PyLongObject*)x)->long_value.lv_tag >> _PyLong_NON_SIZE_BITS))
+  #define __Pyx_PyLong_SignedDigitCount(x)\
+        (((Py_ssize_t) __Pyx_PyLong_Sign(x)) * __Pyx_PyLong_DigitCount(x))
+  #if defined(PyUnstable_Long_IsCompact) && defined(PyUnstable_Long_CompactValue)
+    #define __Pyx_PyLong_IsCompact(x)     PyUnstable_Long_IsCompact((PyLongObject*) x)
+    #define __Pyx_PyLong_CompactValue(x)  PyUnstable_Long_CompactValue((PyLongObject*) x)
+  #else
+    #define __Pyx_PyLong_IsCompact(x)     (((PyLongObject*)x)->long_value.lv_tag < (2 << _PyLong_NON_SIZE_BITS))
+    #define __Pyx_PyLong_CompactValue(x)  (((Py_ssize_t) __Pyx_PyLong_Sign(x)) * (Py_ssize_t) __Pyx_PyLong_Digits(x)[0])
+  #endif
+  static CYTHON_INLINE Py_ssize_t __Pyx_PyLong_CompareSignAndSize(PyObject *a, PyObject *b) {
+      uintptr_t tag_a = ((PyLongObject*)a)->long_value.lv_tag;
+      uintptr_t tag_b = ((PyLongObject*)b)->long_value.lv_tag;
+      if (tag_a == tag_b) return 0;
+      int sign_a = (int) (tag_a & _PyLong_SIGN_MASK);
+      int sign_b = (int) (tag_b & _PyLong_SIGN_MASK);
+      if (sign_a > sign_b) return -1;
+      if (sign_a < sign_b) return 1;
+      Py_ssize_t size_a = (Py_ssize_t) (tag_a >> _PyLong_NON_SIZE_BITS);
+      Py_ssize_t size_b = (Py_ssize_t) (tag_b >> _PyLong_NON_SIZE_BITS);
+      return (1 - sign_a) * (size_a - size_b);
+  }
+  typedef Py_ssize_t  __Pyx_compact_pylong;
+  typedef size_t  __Pyx_compact_upylong;
+  #else
+  #define __Pyx_PyLong_Sign(x)  ((int) ((Py_SIZE(x) == 0) ? 0 : (Py_SIZE(x) < 0) ? -1 : 1))
+  #define __Pyx_PyLong_IsNeg(x)  (Py_SIZE(x) < 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (Py_SIZE(x) >= 0)
+  #define __Pyx_PyLong_IsZero(x)  (Py_SIZE(x) == 0)
+  #define __Pyx_PyLong_IsPos(x)  (Py_SIZE(x) > 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  ((Py_SIZE(x) == 0) ? 0 : __Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  __Pyx_sst_abs(Py_SIZE(x))
+  #define __Pyx_PyLong_SignedDigitCount(x)  Py_SIZE(x)
+  #define __Pyx_PyLong_IsCompact(x)  (Py_SIZE(x) == 0 || Py_SIZE(x) == 1 || Py_SIZE(x) == -1)
+  #define __Pyx_PyLong_CompactValue(x)\
+        ((Py_SIZE(x) == 0) ? (sdigit) 0 : ((Py_SIZE(x) < 0) ? -(sdigit)__Pyx_PyLong_Digits(x)[0] : (sdigit)__Pyx_PyLong_Digits(x)[0]))
+  #define __Pyx_PyLong_CompareSignAndSize(a, b)  (Py_SIZE(a) - Py_SIZE(b))
+  typedef sdigit  __Pyx_compact_pylong;
+  typedef digit  __Pyx_compact_upylong;
+  #endif
+  #if PY_VERSION_HEX >= 0x030C00A5
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->long_value.ob_digit)
+  #else
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->ob_digit)
+  #endif
+  #define __Pyx_PyLong_IsNonZero(x)  (!__Pyx_PyLong_IsZero(x))
+#else
+  #define __Pyx_PyLong_IsNonZero(x)  PyObject_IsTrue(x)
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#elif __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeASCII(c_str, size, NULL)
+#else
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+/* PretendToInitialize */
+#ifdef __cplusplus
+#if __cplusplus > 201103L
+#include <type_traits>
+#endif
+template <typename T>
+static void __Pyx_pretend_to_initialize(T* ptr) {
+#if __cplusplus > 201103L
+    if ((std::is_trivially_default_constructible<T>::value))
+#endif
+        *ptr = T();
+    (void)ptr;
+}
+#else
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+#endif
+
+
+#if !CYTHON_USE_MODULE_STATE
+static PyObject *__pyx_m = NULL;
+#endif
+static const char * const __pyx_cfilenm = __FILE__;
+
+/* #### Code section: filename_table ### */
+
+static const char* const __pyx_f[] = {
+  "sonolus/backend/_opt/analysis.pyx",
+  "(tree fragment)",
+  "sonolus/backend/_opt/ir.pxd",
+};
+/* #### Code section: utility_code_proto_before_types ### */
+/* Atomics.proto (used by UnpackUnboundCMethod) */
+#include <pythread.h>
+#ifndef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 1
+#endif
+#define __PYX_CYTHON_ATOMICS_ENABLED() CYTHON_ATOMICS
+#define __PYX_GET_CYTHON_COMPILING_IN_CPYTHON_FREETHREADING() CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __pyx_atomic_int_type int
+#define __pyx_nonatomic_int_type int
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__))
+    #include <stdatomic.h>
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)))
+    #include <atomic>
+#endif
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__) &&\
+                       ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type atomic_int
+    #define __pyx_atomic_ptr_type atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) atomic_fetch_add_explicit(value, 1, memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) atomic_fetch_add_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) atomic_fetch_sub_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) atomic_load_explicit(value, memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) atomic_load_explicit(value, memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C atomics"
+    #endif
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)) &&\
+                    ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type std::atomic_int
+    #define __pyx_atomic_ptr_type std::atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) std::atomic_fetch_sub_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) std::atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) std::atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) std::atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) std::atomic_load_explicit(value, std::memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) std::atomic_load_explicit(value, std::memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) std::atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C++ atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C++ atomics"
+    #endif
+#elif CYTHON_ATOMICS && (__GNUC__ >= 5 || (__GNUC__ == 4 &&\
+                    (__GNUC_MINOR__ > 1 ||\
+                    (__GNUC_MINOR__ == 1 && __GNUC_PATCHLEVEL__ >= 2))))
+    #define __pyx_atomic_ptr_type void*
+    #define __pyx_nonatomic_ptr_type void*
+    #define __pyx_atomic_incr_relaxed(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) __sync_fetch_and_sub(value, 1)
+    #define __pyx_atomic_sub(value, arg) __sync_fetch_and_sub(value, arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_store(value, new_value) __sync_lock_test_and_set(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_load_acquire(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) __sync_lock_test_and_set(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_nonatomic_ptr_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Using GNU atomics"
+    #endif
+#elif CYTHON_ATOMICS && defined(_MSC_VER)
+    #include <intrin.h>
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type long
+    #define __pyx_atomic_ptr_type void*
+    #undef __pyx_nonatomic_int_type
+    #define __pyx_nonatomic_int_type long
+    #define __pyx_nonatomic_ptr_type void*
+    #pragma intrinsic (_InterlockedExchangeAdd, _InterlockedExchange, _InterlockedCompareExchange, _InterlockedCompareExchangePointer, _InterlockedExchangePointer)
+    #define __pyx_atomic_incr_relaxed(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) _InterlockedExchangeAdd(value, -1)
+    #define __pyx_atomic_sub(value, arg) _InterlockedExchangeAdd(value, -arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = _InterlockedCompareExchange(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) _InterlockedExchangeAdd(value, 0)
+    #define __pyx_atomic_store(value, new_value) _InterlockedExchange(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) *(void * volatile *)value
+    #define __pyx_atomic_pointer_load_acquire(value) _InterlockedCompareExchangePointer(value, 0, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) _InterlockedExchangePointer(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_atomic_ptr_type old = _InterlockedCompareExchangePointer(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #pragma message ("Using MSVC atomics")
+    #endif
+#else
+    #undef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 0
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Not using atomics"
+    #endif
+#endif
+
+/* CriticalSectionsDefinition.proto (used by CriticalSections) */
+#if !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyCriticalSection void*
+#define __Pyx_PyCriticalSection2 void*
+#define __Pyx_PyCriticalSection_End(cs)
+#define __Pyx_PyCriticalSection2_End(cs)
+#else
+#define __Pyx_PyCriticalSection PyCriticalSection
+#define __Pyx_PyCriticalSection2 PyCriticalSection2
+#define __Pyx_PyCriticalSection_End PyCriticalSection_End
+#define __Pyx_PyCriticalSection2_End PyCriticalSection2_End
+#endif
+
+/* CriticalSections.proto (used by ParseKeywordsImpl) */
+#if !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyCriticalSection_Begin(cs, arg) (void)(cs)
+#define __Pyx_PyCriticalSection2_Begin(cs, arg1, arg2) (void)(cs)
+#else
+#define __Pyx_PyCriticalSection_Begin PyCriticalSection_Begin
+#define __Pyx_PyCriticalSection2_Begin PyCriticalSection2_Begin
+#endif
+#if PY_VERSION_HEX < 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_BEGIN_CRITICAL_SECTION(o) {
+#define __Pyx_END_CRITICAL_SECTION() }
+#else
+#define __Pyx_BEGIN_CRITICAL_SECTION Py_BEGIN_CRITICAL_SECTION
+#define __Pyx_END_CRITICAL_SECTION Py_END_CRITICAL_SECTION
+#endif
+
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+/* IncludeStructmemberH.proto (used by CythonFunctionShared) */
+#include <structmember.h>
+
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+/* #### Code section: numeric_typedefs ### */
+/* #### Code section: complex_type_declarations ### */
+/* #### Code section: type_declarations ### */
+
+/*--- Type declarations ---*/
+struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func;
+struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness;
+struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators;
+struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest;
+struct __pyx_t_7sonolus_7backend_4_opt_2ir_Instr;
+struct __pyx_t_7sonolus_7backend_4_opt_2ir_Edge;
+struct __pyx_t_7sonolus_7backend_4_opt_2ir_BlockInfo;
+struct __pyx_t_7sonolus_7backend_4_opt_2ir_PlaceInfo;
+struct __pyx_t_7sonolus_7backend_4_opt_2ir_TempInfo;
+
+/* "sonolus/backend/_opt/ir.pxd":225
+ * 
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     FLAG_PURE = 1
+ *     FLAG_SIDE_EFFECT = 2
+*/
+enum  {
+  __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_PURE = 1,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_SIDE_EFFECT = 2,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_PINNED = 4,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_STMT_ROOT = 8,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_CONST_IS_INT = 16,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_MUST_FOLD = 32
+};
+
+/* "sonolus/backend/_opt/ir.pxd":245
+ * 
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     PLACE_TEMP_SCALAR = 0
+ *     PLACE_TEMP_ARRAY = 1
+*/
+enum  {
+  __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_SCALAR = 0,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_ARRAY = 1,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_SIZE0 = 2,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_REAL_BLOCK = 3,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_DYNAMIC_BLOCK = 4
+};
+
+/* "sonolus/backend/_opt/ir.pxd":253
+ * 
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     PLACE_WRITABLE = 1
+ *     PLACE_BLOCK_IS_ENUM = 2
+*/
+enum  {
+  __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_WRITABLE = 1,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_BLOCK_IS_ENUM = 2,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_RUNTIME_CONST = 4
+};
+
+/* "sonolus/backend/_opt/ir.pxd":265
+ * 
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     EDGE_COND_NONE = 0
+ *     EDGE_COND_VALUE = 1
+*/
+enum  {
+  __pyx_e_7sonolus_7backend_4_opt_2ir_EDGE_COND_NONE = 0,
+  __pyx_e_7sonolus_7backend_4_opt_2ir_EDGE_COND_VALUE = 1
+};
+
+/* "sonolus/backend/_opt/ir.pxd":183
+ * 
+ * 
+ * cdef struct Instr:             # <<<<<<<<<<<<<<
+ *     uint16_t op
+ *     uint8_t flags
+*/
+struct __pyx_t_7sonolus_7backend_4_opt_2ir_Instr {
+  uint16_t op;
+  uint8_t flags;
+  int32_t block;
+  int32_t arg_start;
+  int16_t nargs;
+  int32_t aux;
+};
+
+/* "sonolus/backend/_opt/ir.pxd":192
+ * 
+ * 
+ * cdef struct Edge:             # <<<<<<<<<<<<<<
+ *     int32_t src
+ *     int32_t dst
+*/
+struct __pyx_t_7sonolus_7backend_4_opt_2ir_Edge {
+  int32_t src;
+  int32_t dst;
+  uint8_t cond_kind;
+  uint8_t cond_is_int;
+  double cond;
+};
+
+/* "sonolus/backend/_opt/ir.pxd":200
+ * 
+ * 
+ * cdef struct BlockInfo:             # <<<<<<<<<<<<<<
+ *     int32_t instr_start
+ *     int32_t instr_count
+*/
+struct __pyx_t_7sonolus_7backend_4_opt_2ir_BlockInfo {
+  int32_t instr_start;
+  int32_t instr_count;
+  int32_t test_val;
+  int32_t edge_start;
+  int32_t edge_count;
+  int32_t phi_start;
+  int32_t phi_count;
+  int32_t rpo;
+  int32_t idom;
+};
+
+/* "sonolus/backend/_opt/ir.pxd":212
+ * 
+ * 
+ * cdef struct PlaceInfo:             # <<<<<<<<<<<<<<
+ *     uint8_t kind
+ *     uint8_t flags
+*/
+struct __pyx_t_7sonolus_7backend_4_opt_2ir_PlaceInfo {
+  uint8_t kind;
+  uint8_t flags;
+  int32_t block_ref;
+  int32_t index_val;
+  int32_t offset;
+};
+
+/* "sonolus/backend/_opt/ir.pxd":220
+ * 
+ * 
+ * cdef struct TempInfo:             # <<<<<<<<<<<<<<
+ *     int32_t name_id
+ *     int32_t size
+*/
+struct __pyx_t_7sonolus_7backend_4_opt_2ir_TempInfo {
+  int32_t name_id;
+  int32_t size;
+};
+
+/* "sonolus/backend/_opt/_ops_gen.pxd":7
+ * # declaration order (id == enumeration index); the synthetic mid-end opcodes
+ * # follow. OP_TABLE_SIZE is the total, and the metadata arrays are sized to it.
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     OP_Abs = 0
+ *     OP_Add = 1
+*/
+enum  {
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Abs = 0,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Add = 1,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_AddLifeScheduled = 2,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_And = 3,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arccos = 4,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arcsin = 5,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arctan = 6,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arctan2 = 7,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_BeatToBPM = 8,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_BeatToStartingBeat = 9,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_BeatToStartingTime = 10,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_BeatToTime = 11,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Block = 12,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Break = 13,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Ceil = 14,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Clamp = 15,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Copy = 16,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Cos = 17,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Cosh = 18,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DebugLog = 19,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DebugPause = 20,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPost = 21,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPostPointed = 22,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPostShifted = 23,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPre = 24,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPrePointed = 25,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPreShifted = 26,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Degree = 27,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DestroyParticleEffect = 28,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Divide = 29,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DoWhile = 30,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Draw = 31,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedB = 32,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedBT = 33,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedL = 34,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedLR = 35,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedR = 36,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedT = 37,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInBack = 38,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInCirc = 39,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInCubic = 40,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInElastic = 41,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInExpo = 42,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutBack = 43,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutCirc = 44,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutCubic = 45,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutElastic = 46,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutExpo = 47,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutQuad = 48,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutQuart = 49,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutQuint = 50,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutSine = 51,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInQuad = 52,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInQuart = 53,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInQuint = 54,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInSine = 55,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutBack = 56,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutCirc = 57,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutCubic = 58,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutElastic = 59,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutExpo = 60,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInBack = 61,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInCirc = 62,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInCubic = 63,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInElastic = 64,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInExpo = 65,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInQuad = 66,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInQuart = 67,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInQuint = 68,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInSine = 69,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutQuad = 70,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutQuart = 71,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutQuint = 72,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutSine = 73,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Equal = 74,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Execute = 75,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Execute0 = 76,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_ExportValue = 77,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Floor = 78,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Frac = 79,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Get = 80,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_GetPointed = 81,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_GetShifted = 82,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Greater = 83,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_GreaterOr = 84,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_HasEffectClip = 85,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_HasParticleEffect = 86,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_HasSkinSprite = 87,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_If = 88,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPost = 89,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPostPointed = 90,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPostShifted = 91,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPre = 92,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPrePointed = 93,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPreShifted = 94,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Judge = 95,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_JudgeSimple = 96,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_JumpLoop = 97,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Lerp = 98,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_LerpClamped = 99,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Less = 0x64,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_LessOr = 0x65,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Log = 0x66,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Max = 0x67,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Min = 0x68,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Mod = 0x69,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_MoveParticleEffect = 0x6A,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Multiply = 0x6B,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Negate = 0x6C,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Not = 0x6D,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_NotEqual = 0x6E,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Or = 0x6F,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Paint = 0x70,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Play = 0x71,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_PlayLooped = 0x72,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_PlayLoopedScheduled = 0x73,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_PlayScheduled = 0x74,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Power = 0x75,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Print = 0x76,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Radian = 0x77,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Random = 0x78,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_RandomInteger = 0x79,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Rem = 0x7A,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Remap = 0x7B,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_RemapClamped = 0x7C,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Round = 0x7D,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Set = 0x7E,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetAdd = 0x7F,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetAddPointed = 0x80,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetAddShifted = 0x81,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetDivide = 0x82,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetDividePointed = 0x83,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetDivideShifted = 0x84,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetMod = 0x85,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetModPointed = 0x86,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetModShifted = 0x87,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetMultiply = 0x88,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetMultiplyPointed = 0x89,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetMultiplyShifted = 0x8A,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetPointed = 0x8B,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetPower = 0x8C,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetPowerPointed = 0x8D,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetPowerShifted = 0x8E,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetRem = 0x8F,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetRemPointed = 0x90,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetRemShifted = 0x91,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetShifted = 0x92,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetSubtract = 0x93,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetSubtractPointed = 0x94,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetSubtractShifted = 0x95,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Sign = 0x96,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Sin = 0x97,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Sinh = 0x98,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Spawn = 0x99,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SpawnParticleEffect = 0x9A,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackEnter = 0x9B,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackGet = 0x9C,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackGetFrame = 0x9D,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackGetFramePointer = 0x9E,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackGetPointer = 0x9F,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackGrow = 0xA0,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackInit = 0xA1,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackLeave = 0xA2,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackPop = 0xA3,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackPush = 0xA4,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackSet = 0xA5,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackSetFrame = 0xA6,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackSetFramePointer = 0xA7,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackSetPointer = 0xA8,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StopLooped = 0xA9,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StopLoopedScheduled = 0xAA,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StreamGetNextKey = 0xAB,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StreamGetPreviousKey = 0xAC,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StreamGetValue = 0xAD,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StreamHas = 0xAE,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StreamSet = 0xAF,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Subtract = 0xB0,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Switch = 0xB1,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SwitchInteger = 0xB2,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SwitchIntegerWithDefault = 0xB3,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SwitchWithDefault = 0xB4,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Tan = 0xB5,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Tanh = 0xB6,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TimeToScaledTime = 0xB7,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TimeToStartingScaledTime = 0xB8,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TimeToStartingTime = 0xB9,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TimeToTimeScale = 0xBA,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Trunc = 0xBB,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Unlerp = 0xBC,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_UnlerpClamped = 0xBD,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_While = 0xBE,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_PHI = 0xBF,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_CONST = 0xC0,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_GET = 0xC1,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_SET = 0xC2,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_UNDEF = 0xC3,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_RUNTIME_COUNT = 0xBF,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TABLE_SIZE = 0xC4
+};
+
+/* "sonolus/backend/_opt/ir.pxd":270
+ * 
+ * 
+ * cdef class Func:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         Instr* instrs
+*/
+struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7sonolus_7backend_4_opt_2ir_Func *__pyx_vtab;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_Instr *instrs;
+  int32_t n_instrs;
+  int32_t cap_instrs;
+  uint32_t *args;
+  int32_t n_args;
+  int32_t cap_args;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_BlockInfo *blocks;
+  int32_t n_blocks;
+  int32_t cap_blocks;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_Edge *edges;
+  int32_t n_edges;
+  int32_t cap_edges;
+  double *consts;
+  int32_t n_consts;
+  int32_t cap_consts;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_PlaceInfo *places;
+  int32_t n_places;
+  int32_t cap_places;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_TempInfo *temps;
+  int32_t n_temps;
+  int32_t cap_temps;
+  int32_t *locs;
+  int32_t cap_locs;
+  int32_t cur_loc;
+  int32_t entry_block;
+  int is_ssa;
+  int32_t undef_val;
+  PyObject *_ssa_undef;
+  kh_i64i32_t *_const_intern;
+  PyObject *names;
+  PyObject *_temp_intern;
+  PyObject *_place_intern;
+  PyObject *blocks_type;
+  PyObject *callback;
+  PyObject *_block_enum_by_id;
+  PyObject *_block_map;
+};
+
+
+/* "sonolus/backend/_opt/analysis.pxd":29
+ * 
+ * 
+ * cdef class Liveness:             # <<<<<<<<<<<<<<
+ *     # Owning arena (kept alive; only its C buffers are read in nogil regions).
+ *     cdef Func func
+*/
+struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_vtab;
+  struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *func;
+  int32_t n_temps;
+  int32_t n_words;
+  int32_t n_blocks;
+  int32_t n_instrs;
+  int32_t n_roots;
+  uint64_t *live_in;
+  uint64_t *live_out;
+  uint64_t *array_defs_out;
+  uint64_t *array_mask;
+  uint64_t *root_live;
+  int32_t *root_slot;
+  uint8_t *is_array_init;
+};
+
+
+/* "sonolus/backend/_opt/analysis.pxd":73
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef class Dominators:             # <<<<<<<<<<<<<<
+ *     cdef Func func
+ *     cdef int32_t n_blocks
+*/
+struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_vtab;
+  struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *func;
+  int32_t n_blocks;
+  int32_t *idom;
+  int32_t *tin;
+  int32_t *tout;
+  int32_t *pred_head;
+  int32_t *pred_src;
+  int32_t *child_head;
+  int32_t *child_list;
+};
+
+
+/* "sonolus/backend/_opt/analysis.pxd":112
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef class LoopForest:             # <<<<<<<<<<<<<<
+ *     cdef Func func
+ *     cdef int32_t n_blocks
+*/
+struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_vtab;
+  struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *func;
+  int32_t n_blocks;
+  int32_t n_loops;
+  int32_t nwb;
+  int32_t *depth;
+  int32_t *innermost;
+  int32_t *header;
+  int32_t *parent;
+  int32_t *loop_depth;
+  uint64_t *body;
+};
+
+
+
+/* "sonolus/backend/_opt/ir.pxd":270
+ * 
+ * 
+ * cdef class Func:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         Instr* instrs
+*/
+
+struct __pyx_vtabstruct_7sonolus_7backend_4_opt_2ir_Func {
+  int32_t (*_alloc_instr)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *);
+  int (*_inherit_locs)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *);
+  int32_t (*_emit)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, uint16_t, uint8_t, int32_t, int32_t, PyObject *);
+  int32_t (*_intern_const)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, double);
+  int (*_rebuild_const_intern)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *);
+  int32_t (*_intern_temp)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *);
+  int (*_writable_for_block)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *);
+  int32_t (*_intern_place)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *, int32_t);
+  int32_t (*_value_of)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *, int32_t);
+  int32_t (*_emit_const)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *, int32_t);
+  int32_t (*_emit_pure)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *, int32_t);
+  int32_t (*_emit_impure)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *, int32_t);
+  int (*_emit_stmt)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *, int32_t);
+  int (*_push_edge)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, int32_t, int32_t, PyObject *);
+  int (*_begin_marshal)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *, PyObject *);
+  int (*_alloc_blocks)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, int32_t, int);
+  int (*_marshal_block)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, int32_t, PyObject *, PyObject *, PyObject *, int);
+  int (*_marshal)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *, PyObject *, PyObject *);
+  int (*_marshal_context)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *, PyObject *, PyObject *);
+  PyObject *(*_make_const)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, double, int);
+  PyObject *(*_export_place)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, int32_t, PyObject *);
+  PyObject *(*_export_place_components)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, int32_t, PyObject *);
+  PyObject *(*_export_value)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, int32_t, PyObject *, int);
+  PyObject *(*_export_stmt)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, int32_t, PyObject *);
+  PyObject *(*_export_fused_rmw)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, int32_t, uint16_t, PyObject *);
+  PyObject *(*_assign_temp_names)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *);
+  PyObject *(*_pack)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *);
+  int (*_unpack)(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, PyObject *);
+};
+static struct __pyx_vtabstruct_7sonolus_7backend_4_opt_2ir_Func *__pyx_vtabptr_7sonolus_7backend_4_opt_2ir_Func;
+
+
+/* "sonolus/backend/_opt/analysis.pyx":137
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef class Liveness:             # <<<<<<<<<<<<<<
+ *     def __cinit__(self):
+ *         self.func = None
+*/
+
+struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Liveness {
+  PyObject *(*_bitset_names)(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *, uint64_t const *);
+};
+static struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_Liveness;
+
+
+/* "sonolus/backend/_opt/analysis.pyx":504
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef class Dominators:             # <<<<<<<<<<<<<<
+ *     def __cinit__(self):
+ *         self.func = None
+*/
+
+struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Dominators {
+  int (*dominates)(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *, int32_t, int32_t);
+};
+static struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_Dominators;
+
+
+/* "sonolus/backend/_opt/analysis.pyx":698
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef class LoopForest:             # <<<<<<<<<<<<<<
+ *     def __cinit__(self):
+ *         self.func = None
+*/
+
+struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_LoopForest {
+  int (*in_loop)(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *, int32_t, int32_t);
+  int (*crosses_loop)(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *, int32_t, int32_t);
+};
+static struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_LoopForest;
+/* #### Code section: utility_code_proto ### */
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, Py_ssize_t);
+    void (*DECREF)(void*, PyObject*, Py_ssize_t);
+    void (*GOTREF)(void*, PyObject*, Py_ssize_t);
+    void (*GIVEREF)(void*, PyObject*, Py_ssize_t);
+    void* (*SetupContext)(const char*, Py_ssize_t, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_XINCREF(r)  do { if((r) == NULL); else {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) == NULL); else {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) == NULL); else {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) == NULL); else {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContextNogil()
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_Py_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; Py_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* CopyObjectArray.proto (used by TupleOrListFromArrayImpl) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length);
+#endif
+
+/* TupleOrListFromArrayImpl.proto (used by TupleFromArray) */
+#if PY_VERSION_HEX >= 0x030F0000 && !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_PyTuple_FromArray(src, n) PyTuple_FromArray(src, ((n)<0) ? 0 : (n))
+#else
+CYTHON_UNUSED static PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n);
+#endif
+
+/* TupleFromArray.proto (used by fastcall) */
+
+
+/* IncludeStringH.proto (used by PyObjectCompare) */
+#include <string.h>
+
+/* PyObjectCompare.proto (used by UnicodeEquals) */
+static CYTHON_INLINE int __Pyx_PyObject_CompareBoolEq_str_str(PyObject *op1, PyObject *op2, int pyop);
+
+/* UnicodeEquals.proto (used by fastcall) */
+#define __Pyx_PyUnicode_Equals(s1, s2)  __Pyx_PyObject_CompareBoolEq_str_str(s1, s2, Py_EQ)
+
+/* fastcall.proto */
+#if CYTHON_AVOID_BORROWED_REFS
+    #define __Pyx_ArgRef_VARARGS(args, i) __Pyx_PySequence_ITEM(args, i)
+#elif CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_ArgRef_VARARGS(args, i) __Pyx_NewRef(__Pyx_PyTuple_GET_ITEM(args, i))
+#else
+    #define __Pyx_ArgRef_VARARGS(args, i) __Pyx_XNewRef(PyTuple_GetItem(args, i))
+#endif
+#define __Pyx_NumKwargs_VARARGS(kwds) PyDict_Size(kwds)
+#define __Pyx_KwValues_VARARGS(args, nargs) NULL
+#define __Pyx_GetKwValue_VARARGS(kw, kwvalues, s) __Pyx_PyDict_GetItemStrWithError(kw, s)
+#define __Pyx_KwargsAsDict_VARARGS(kw, kwvalues) PyDict_Copy(kw)
+#if CYTHON_VECTORCALL
+    #define __Pyx_ArgRef_FASTCALL(args, i) __Pyx_NewRef(args[i])
+    #define __Pyx_NumKwargs_FASTCALL(kwds) __Pyx_PyTuple_GET_SIZE(kwds)
+    #define __Pyx_KwValues_FASTCALL(args, nargs) ((args) + (nargs))
+    static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_GRAAL
+    CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues);
+  #else
+    #define __Pyx_KwargsAsDict_FASTCALL(kw, kwvalues) _PyStack_AsDict(kwvalues, kw)
+  #endif
+#else
+    #define __Pyx_ArgRef_FASTCALL __Pyx_ArgRef_VARARGS
+    #define __Pyx_NumKwargs_FASTCALL __Pyx_NumKwargs_VARARGS
+    #define __Pyx_KwValues_FASTCALL __Pyx_KwValues_VARARGS
+    #define __Pyx_GetKwValue_FASTCALL __Pyx_GetKwValue_VARARGS
+    #define __Pyx_KwargsAsDict_FASTCALL __Pyx_KwargsAsDict_VARARGS
+#endif
+#if CYTHON_VECTORCALL_TPNEW
+    #if !CYTHON_VECTORCALL
+        #error Enabling CYTHON_VECTORCALL_TPNEW without CYTHON_VECTORCALL is not supported
+    #endif
+    #define __Pyx_ArgRef_FASTCALL_TPNEW __Pyx_ArgRef_FASTCALL
+    #define __Pyx_NumKwargs_FASTCALL_TPNEW __Pyx_NumKwargs_FASTCALL
+    #define __Pyx_KwValues_FASTCALL_TPNEW __Pyx_KwValues_FASTCALL
+    #define __Pyx_GetKwValue_FASTCALL_TPNEW __Pyx_GetKwValue_FASTCALL
+    #define __Pyx_KwargsAsDict_FASTCALL_TPNEW __Pyx_KwargsAsDict_FASTCALL
+#else
+    #define __Pyx_ArgRef_FASTCALL_TPNEW __Pyx_ArgRef_VARARGS
+    #define __Pyx_NumKwargs_FASTCALL_TPNEW __Pyx_NumKwargs_VARARGS
+    #define __Pyx_KwValues_FASTCALL_TPNEW __Pyx_KwValues_VARARGS
+    #define __Pyx_GetKwValue_FASTCALL_TPNEW __Pyx_GetKwValue_VARARGS
+    #define __Pyx_KwargsAsDict_FASTCALL_TPNEW __Pyx_KwargsAsDict_VARARGS
+#endif
+#define __Pyx_ArgsSlice_VARARGS(args, start, stop) PyTuple_GetSlice(args, start, stop)
+#if CYTHON_VECTORCALL
+#define __Pyx_ArgsSlice_FASTCALL(args, start, stop) __Pyx_PyTuple_FromArray(args + start, stop - start)
+#else
+#define __Pyx_ArgsSlice_FASTCALL __Pyx_ArgsSlice_VARARGS
+#endif
+
+/* RaiseArgTupleInvalid.export */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* py_dict_items.proto (used by OwnedDictNext) */
+#define __Pyx_PyDict_items_TypePtr  (&PyDictKeys_Type)
+#define __Pyx_PyDict_items_Check(obj)  PyObject_TypeCheck((obj), __Pyx_PyDictItems_TypePtr)
+#define __Pyx_PyDict_items_CheckExact(obj)  Py_IS_TYPE((obj), __Pyx_PyDictItems_TypePtr)
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Items(PyObject* d);
+
+/* CallCFunction.proto (used by CallUnboundCMethod0) */
+#define __Pyx_CallCFunction(cfunc, self, args)\
+    ((PyCFunction)(void(*)(void))(cfunc)->func)(self, args)
+#define __Pyx_CallCFunctionWithKeywords(cfunc, self, args, kwargs)\
+    ((PyCFunctionWithKeywords)(void(*)(void))(cfunc)->func)(self, args, kwargs)
+#define __Pyx_CallCFunctionFast(cfunc, self, args, nargs)\
+    ((__Pyx_PyCFunctionFast)(void(*)(void))(PyCFunction)(cfunc)->func)(self, args, nargs)
+#define __Pyx_CallCFunctionFastWithKeywords(cfunc, self, args, nargs, kwnames)\
+    ((__Pyx_PyCFunctionFastWithKeywords)(void(*)(void))(PyCFunction)(cfunc)->func)(self, args, nargs, kwnames)
+
+/* PyObjectCall.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectFastCall.proto (used by PyObjectCallOneArg) */
+#define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject * const*args, size_t nargsf, PyObject *kwargs);
+
+/* PyObjectCallOneArg.proto (used by CallUnboundCMethod0) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* UnpackUnboundCMethod_decl.proto (used by UnpackUnboundCMethod) */
+typedef struct {
+    PyObject *type;
+    PyObject **method_name;
+    PyCFunction func;
+    PyObject *method;
+    int flag;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && CYTHON_ATOMICS
+    __pyx_atomic_int_type initialized;
+#endif
+} __Pyx_CachedCFunction;
+
+/* IgnoreException.proto (used by UnpackUnboundCMethod_impl) */
+static CYTHON_INLINE int __Pyx_IgnoreGivenException(PyObject *given_exception, PyObject *ignorable_exception);
+#define __Pyx_IgnoreException(ignorable_exception) __Pyx_IgnoreGivenException(NULL, ignorable_exception)
+
+/* FastTypeChecks.proto (used by UnpackUnboundCMethod_impl) */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
+#define __Pyx_PyAnySet_Check(obj)  __Pyx_TypeCheck2(obj, &PySet_Type, &PyFrozenSet_Type)
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
+#define __Pyx_PyAnySet_Check(obj)  PyAnySet_Check(obj)
+#endif
+
+/* PyObjectGetAttrStr.proto (used by UnpackUnboundCMethod_impl) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* UnpackUnboundCMethod_impl.export */
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target);
+
+/* UnpackUnboundCMethod.proto (used by CallUnboundCMethod0) */
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+static CYTHON_INLINE int __Pyx_CachedCFunction_GetAndSetInitializing(__Pyx_CachedCFunction *cfunc) {
+#if !CYTHON_ATOMICS
+    return 1;
+#else
+    __pyx_nonatomic_int_type expected = 0;
+    if (__pyx_atomic_int_cmp_exchange(&cfunc->initialized, &expected, 1)) {
+        return 0;
+    }
+    return expected;
+#endif
+}
+static CYTHON_INLINE void __Pyx_CachedCFunction_SetFinishedInitializing(__Pyx_CachedCFunction *cfunc) {
+#if CYTHON_ATOMICS
+    __pyx_atomic_store(&cfunc->initialized, 2);
+#endif
+}
+#else
+#define __Pyx_CachedCFunction_GetAndSetInitializing(cfunc) 2
+#define __Pyx_CachedCFunction_SetFinishedInitializing(cfunc)
+#endif
+
+/* CallUnboundCMethod0.proto */
+CYTHON_UNUSED
+static PyObject* __Pyx__CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self);
+#else
+#define __Pyx_CallUnboundCMethod0(cfunc, self)  __Pyx__CallUnboundCMethod0(cfunc, self)
+#endif
+
+/* py_dict_values.proto (used by OwnedDictNext) */
+#define __Pyx_PyDict_values_TypePtr  (&PyDictKeys_Type)
+#define __Pyx_PyDict_values_Check(obj)  PyObject_TypeCheck((obj), __Pyx_PyDictValues_TypePtr)
+#define __Pyx_PyDict_values_CheckExact(obj)  Py_IS_TYPE((obj), __Pyx_PyDictValues_TypePtr)
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Values(PyObject* d);
+
+/* OwnedDictNext.proto (used by RejectKeywords) */
+#if CYTHON_AVOID_BORROWED_REFS
+static int __Pyx_PyDict_NextRef(PyObject *p, PyObject **ppos, PyObject **pkey, PyObject **pvalue);
+#else
+CYTHON_INLINE
+static int __Pyx_PyDict_NextRef(PyObject *p, Py_ssize_t *ppos, PyObject **pkey, PyObject **pvalue);
+#endif
+
+/* RejectKeywords.export */
+static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds);
+
+/* PyTypeError_Check.proto */
+#define __Pyx_PyExc_TypeError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_TypeError)
+
+/* PyThreadStateGet.proto (used by PyErrFetchRestore) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#if PY_VERSION_HEX >= 0x030C00A6
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
+#else
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
+#endif
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto (used by RaiseException) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* RaiseException.export */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* RaiseDoubleKeywords.proto (used by ParseKeywordsImpl) */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywordsImpl.export */
+static int __Pyx_ParseKeywordsTuple(
+    PyObject *kwds,
+    PyObject * const *kwvalues,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs
+);
+static int __Pyx_ParseKeywordDictToDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name
+);
+static int __Pyx_ParseKeywordDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs
+);
+
+/* CallUnboundCMethod2.proto */
+CYTHON_UNUSED
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2);
+#else
+#define __Pyx_CallUnboundCMethod2(cfunc, self, arg1, arg2)  __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2)
+#endif
+
+/* ParseKeywords.proto */
+static CYTHON_INLINE int __Pyx_ParseKeywords(
+    PyObject *kwds, PyObject *const *kwvalues, PyObject ** const argnames[],
+    PyObject *kwds2, PyObject *values[],
+    Py_ssize_t num_pos_args, Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs
+);
+
+/* PyValueError_Check.proto */
+#define __Pyx_PyExc_ValueError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_ValueError)
+
+/* GivenExceptionMatches.proto (used by PyErrExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2) {
+    return PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2);
+}
+#endif
+#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
+
+/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto (used by GetBuiltinName) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* GetBuiltinName.proto (used by GetModuleGlobalName) */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyDictVersioning.proto (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __Pyx_XNewRef(__pyx_dict_cached_value);\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_mstate_global->__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyObjectFastCallMethod.proto */
+#if CYTHON_VECTORCALL
+#define __Pyx_PyObject_FastCallMethod(name, args, nargsf) PyObject_VectorcallMethod(name, args, nargsf, NULL)
+#else
+static PyObject *__Pyx_PyObject_FastCallMethod(PyObject *name, PyObject *const *args, size_t nargsf);
+#endif
+
+/* ListCompAppendAndDecref.proto */
+static CYTHON_INLINE int __Pyx_ListComp_AppendAndDecref(PyObject* list, PyObject* x);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x);
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* AllocateExtensionType.proto */
+static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final);
+
+/* CallSlotAsVectorcall.proto */
+#if CYTHON_VECTORCALL_TPNEW
+typedef PyObject * (*__Pyx_tpnewvectorcallfunc)(PyTypeObject* o, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames);
+static PyObject * __Pyx_CallTpnewAsVectorcall(__Pyx_tpnewvectorcallfunc f, PyTypeObject* o, PyObject *a, PyObject *k);
+#endif
+
+/* FormatTypeName.proto (used by RaiseErrorWithObjectType) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%N"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) Py_NewRef((PyObject*)tp)
+#define __Pyx_DECREF_TypeName(obj) Py_DECREF(obj)
+#elif CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%U"
+#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
+static __Pyx_TypeName __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp);
+#else  // !LIMITED_API
+typedef const char *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%.200s"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) ((tp)->tp_name)
+#define __Pyx_DECREF_TypeName(obj)
+#endif
+
+/* RaiseErrorWithObjectType.proto (used by CallNewInitFromVectorcall) */
+#define __Pyx_RaiseTypeErrorWithObjectType(message, obj)  __Pyx_RaiseErrorWithObjectType(PyExc_TypeError, message, obj)
+#define __Pyx_RaiseErrorWithObjectType(exc_type, message, obj)  __Pyx_RaiseErrorWithType(exc_type, message, Py_TYPE(obj))
+CYTHON_UNUSED
+static void __Pyx_RaiseErrorWithType(PyObject* exc_type, const char* message, PyTypeObject *type_obj);
+
+/* CallNewInitFromVectorcall.proto */
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__Pyx_CallNewInitFromVectorcall(PyTypeObject *t, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+#endif
+
+/* DeallocKeepAlive.proto */
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_DeallocKeepAliveBegin(o) do {\
+        _Py_atomic_store_uintptr_relaxed(&(o)->ob_tid, _Py_ThreadId());\
+        _Py_atomic_store_uint32_relaxed(&(o)->ob_ref_local, 1);\
+        _Py_atomic_store_ssize_relaxed(&(o)->ob_ref_shared, 0);\
+    } while (0)
+#define __Pyx_DeallocKeepAliveEnd(o)\
+        _Py_atomic_store_uint32_relaxed(&(o)->ob_ref_local, 0)
+#else
+#define __Pyx_DeallocKeepAliveBegin(o) Py_SET_REFCNT(o, Py_REFCNT(o) + 1)
+#define __Pyx_DeallocKeepAliveEnd(o)   Py_SET_REFCNT(o, Py_REFCNT(o) - 1)
+#endif
+
+/* CallTypeTraverse.proto */
+#if !CYTHON_USE_TYPE_SPECS
+#define __Pyx_call_type_traverse(o, always_call, visit, arg) 0
+#else
+static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg);
+#endif
+
+/* FunctionExport.proto */
+static int __Pyx_ExportFunction(PyObject *api_dict, const char *name, void (*f)(void), const char *sig);
+
+/* GetApiDict.proto */
+static PyObject *__Pyx_ApiExport_GetApiDict(void);
+
+/* PyObjectCallMethod0.proto (used by PyType_Ready) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* GetTypeDictOffset.proto (used by ValidateBasesTuple) */
+#if !CYTHON_USE_TYPE_SLOTS
+CYTHON_UNUSED static Py_ssize_t __Pyx_GetTypeDictOffset(PyObject *tp, int require_cython_valid_result);
+#endif
+
+/* RaiseErrorWithObjectType1.proto (used by ValidateBasesTuple) */
+#define __Pyx_RaiseTypeErrorWithObjectType1(message, arg, obj) __Pyx_RaiseErrorWithObjectType1(PyExc_TypeError, message, arg, obj)
+#define __Pyx_RaiseErrorWithObjectType1(exc_type, message, arg, obj) __Pyx_RaiseErrorWithType1(exc_type, message, arg, Py_TYPE(obj))
+CYTHON_UNUSED
+static void __Pyx_RaiseErrorWithType1(PyObject* exc_type, const char* message, const char *arg, PyTypeObject *type_obj);
+
+/* ValidateBasesTuple.proto (used by PyType_Ready) */
+#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
+static int __Pyx_validate_bases_tuple(const char *type_name, int has_dictoffset, PyObject *bases);
+#endif
+
+/* PyType_Ready.export */
+CYTHON_UNUSED static int __Pyx_PyType_Ready(PyTypeObject *t);
+
+/* GetVTable.proto (used by MergeVTables) */
+static int __Pyx_GetVtable(PyTypeObject *type, void** table);
+
+/* RaiseErrorWithObjectTypes.proto (used by MergeVTables) */
+#define __Pyx_RaiseErrorWithObjectTypes1(exc_type, message, arg, obj1, obj2) __Pyx_RaiseErrorWithTypes1(exc_type, message, arg, Py_TYPE(obj1), Py_TYPE(obj2))
+#define __Pyx_RaiseTypeErrorWithObjectTypes(message, obj1, obj2) __Pyx_RaiseTypeErrorWithTypes(message, Py_TYPE(obj1), Py_TYPE(obj2))
+#define __Pyx_RaiseTypeErrorWithTypes(message, type_obj1, type_obj2) __Pyx_RaiseErrorWithTypes1(PyExc_TypeError, "%.1s" message, "", type_obj1, type_obj2)
+CYTHON_UNUSED
+static void __Pyx_RaiseErrorWithTypes1(PyObject* exc_type, const char *message, const char *arg, PyTypeObject *type_obj1, PyTypeObject *type_obj2);
+
+/* MergeVTables.proto (used by SetVTable) */
+static int __Pyx_MergeVtables(PyTypeObject *type);
+
+/* SetVTable.export */
+static int __Pyx_SetVtable(PyTypeObject* typeptr , void* vtable);
+
+/* LimitedApiGetTypeTypeDict.proto (used by DelItemOnTypeDict) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_GetTypeTypeDict(PyTypeObject *tp);
+#endif
+
+/* DelItemOnTypeDict.proto (used by SetupReduce) */
+#define __Pyx_DelItemOnTypeDict(tp, k) __Pyx__DelItemOnTypeDict((PyTypeObject*)tp, k)
+
+/* DelItemOnTypeDict.export */
+static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k);
+
+/* SetItemOnTypeDict.proto (used by SetupReduce) */
+#define __Pyx_SetItemOnTypeDict(tp, k, v) __Pyx__SetItemOnTypeDict((PyTypeObject*)tp, k, v)
+
+/* SetItemOnTypeDict.export */
+static int __Pyx__SetItemOnTypeDict(PyTypeObject *tp, PyObject *k, PyObject *v);
+
+/* SetupReduce.export */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_3_3_0
+#define __PYX_HAVE_RT_ImportType_proto_3_3_0
+#if defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if (defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L) || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_3_3_0(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_3_3_0(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_3_3_0 {
+   __Pyx_ImportType_CheckSize_Error_3_3_0 = 0,
+   __Pyx_ImportType_CheckSize_Warn_3_3_0 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_3_3_0 = 2
+};
+static PyTypeObject *__Pyx_ImportType_3_3_0(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_3_0 check_size);
+#endif
+
+/* HasAttr.proto (used by ImportImpl) */
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_HasAttr(o, n)  PyObject_HasAttrWithError(o, n)
+#else
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+#endif
+
+/* TupleOrListFromArrayImpl.proto (used by ListFromArray) */
+CYTHON_UNUSED static PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n);
+
+/* ListFromArray.proto (used by ImportImpl) */
+
+
+/* ImportImpl.export */
+static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level);
+
+/* Import.proto */
+static CYTHON_INLINE PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level);
+
+/* ImportFrom.export */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* dict_setdefault.proto (used by FetchCommonType) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value);
+
+/* AddModuleRef.proto (used by FetchSharedCythonModule) */
+#if ((CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX < 0x030F00a3) ||\
+     __PYX_LIMITED_VERSION_HEX < 0x030d0000)
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name);
+#else
+  #define __Pyx_PyImport_AddModuleRef(name) PyImport_AddModuleRef(name)
+#endif
+
+/* FetchSharedCythonModule.proto (used by FetchCommonType) */
+static PyObject *__Pyx_FetchSharedCythonABIModule(void);
+
+/* VerifyCachedType.proto (used by FetchCommonType) */
+static int __Pyx_VerifyCachedType(PyObject *cached_type,
+                               const char *name,
+                               Py_ssize_t expected_basicsize);
+
+/* FetchCommonType.proto (used by CommonTypesMetaclass) */
+static PyTypeObject* __Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases);
+
+/* CommonTypesMetaclass.proto (used by CythonFunctionShared) */
+static int __pyx_CommonTypesMetaclass_init(PyObject *module);
+#define __Pyx_CommonTypesMetaclass_USED
+
+/* CythonFunctionPerModule.proto (used by CythonFunctionShared) */
+#define __Pyx_CyFunction_USED
+#if CYTHON_OPAQUE_SHARED_TYPES
+#define __Pyx_as_CyFunctionObject(o) ((__pyx_CyFunctionObject *)PyObject_GetTypeData((o), __pyx_mstate_global->__pyx_CyFunctionType))
+#else
+#define __Pyx_as_CyFunctionObject(o) ((__pyx_CyFunctionObject *)o)
+#endif
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CYFUNCTION_COROUTINE     0x08
+#define __Pyx_CyFunction_GetClosure(f)\
+    ((__Pyx_as_CyFunctionObject(f))->func_closure)
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx__CyFunction_GetClassObj(f)\
+      ((f)->func_classobj)
+#else
+  #define __Pyx__CyFunction_GetClassObj(f)\
+      ((PyObject*) ((PyCMethodObject *) (f))->mm_class)
+#endif
+#define __Pyx_CyFunction_GetClassObj(f)\
+    __Pyx__CyFunction_GetClassObj(__Pyx_as_CyFunctionObject(f))
+#define __Pyx_CyFunction_SetClassObj(f, classobj)\
+    __Pyx__CyFunction_SetClassObj(__Pyx_as_CyFunctionObject(f), (classobj))
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)((__Pyx_as_CyFunctionObject(f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    (__Pyx_as_CyFunctionObject(f))->defaults_getter = (g)
+typedef struct {
+#if CYTHON_COMPILING_IN_LIMITED_API
+#if !CYTHON_OPAQUE_OBJECTS
+    PyObject_HEAD
+#endif
+    PyMethodDef *func_methoddef;
+    PyObject *func_module;
+#else
+    PyCMethodObject func;
+#endif
+#if (CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY) && CYTHON_VECTORCALL
+    __pyx_vectorcallfunc func_vectorcall;
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_weakreflist;
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_dict;
+#endif
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_classobj;
+#endif
+    PyObject *defaults;
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+    PyObject *func_is_coroutine;
+#endif
+} __pyx_CyFunctionObject;
+#undef __Pyx_CyOrPyCFunction_Check
+#define __Pyx_CyFunction_Check(obj)  __Pyx_TypeCheck(obj, __pyx_mstate_global->__pyx_CyFunctionType)
+#define __Pyx_CyOrPyCFunction_Check(obj)  __Pyx_TypeCheck2(obj, __pyx_mstate_global->__pyx_CyFunctionType, &PyCFunction_Type)
+#define __Pyx_CyFunction_CheckExact(obj)  Py_IS_TYPE(obj, __pyx_mstate_global->__pyx_CyFunctionType)
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void));
+#undef __Pyx_IsSameCFunction
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCyOrCFunction(func, cfunc)
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj);
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_InitDefaults(PyObject *func,
+                                                         PyTypeObject *defaults_type);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(PyObject *module);
+#if CYTHON_VECTORCALL
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+#define __Pyx_CyFunction_func_vectorcall(f) ((f)->func_vectorcall)
+#else
+#define __Pyx_CyFunction_func_vectorcall(f) (((PyCFunctionObject*)f)->vectorcall)
+#endif
+#endif
+
+/* PyMethodNew.proto (used by CythonFunctionShared) */
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ);
+
+/* PyVectorcallFastCallDict.proto (used by CythonFunctionShared) */
+#if CYTHON_VECTORCALL
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw);
+#endif
+
+/* CythonFunctionShared.proto (used by CythonFunction) */
+static PyObject *__Pyx_CyFunction_Init(PyObject *op_in, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+#if CYTHON_VECTORCALL
+static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+#endif
+
+/* CythonFunction.export */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static PyTypeObject *__Pyx_Get_CyFunction_Type(void);
+
+/* CLineInTraceback.proto (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#else
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#endif
+
+/* CodeObjectCache.proto (used by AddTraceback) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject __Pyx_CachedCodeObjectType;
+#else
+typedef PyCodeObject __Pyx_CachedCodeObjectType;
+#endif
+typedef struct {
+    __Pyx_CachedCodeObjectType* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_int_type accessor_count;
+  #endif
+};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
+
+/* PyObjectVectorcallKwds.proto (used by PyObjectVectorcallMethodKwds) */
+#if CYTHON_VECTORCALL
+#define __Pyx_Object_VectorcallKwds PyObject_Vectorcall
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject *kwnames, Py_ssize_t i);
+#else
+#define __Pyx_Object_VectorcallKwds __Pyx_PyObject_FastCallDict
+CYTHON_UNUSED static PyObject *__Pyx_MakeKwargDict(PyObject **keys, PyObject **values, Py_ssize_t n);
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject **kwnames, Py_ssize_t i);
+#endif
+
+/* PyObjectVectorcallMethodKwds.proto (used by CIntToPy) */
+#if CYTHON_VECTORCALL
+#define __Pyx_Object_VectorcallMethodKwds PyObject_VectorcallMethod
+#else
+static PyObject *__Pyx_Object_VectorcallMethodKwds(PyObject *name, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int32_t(int32_t value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int32_t __Pyx_PyLong_As_int32_t(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_uint8_t(uint8_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
+
+/* GetRuntimeVersion.proto */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+static unsigned long __Pyx_cached_runtime_version = 0;
+static void __Pyx_init_runtime_version(void);
+#else
+#define __Pyx_init_runtime_version()
+#endif
+static unsigned long __Pyx_get_runtime_version(void);
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer);
+
+/* DecompressString.proto */
+static PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo);
+
+/* DecompressString_LZSS.proto */
+static PyObject *__Pyx_DecompressString_LZSS(const char *s, size_t compressed_length, size_t uncompressed_length);
+
+/* MultiPhaseInitModuleState.proto */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#include <stdlib.h>
+static PyObject *__Pyx_State_FindModule(void*);
+static int __Pyx_State_AddModule(PyObject* module, void*);
+static int __Pyx_State_RemoveModule(void*);
+#elif CYTHON_USE_MODULE_STATE
+#define __Pyx_State_FindModule PyState_FindModule
+#define __Pyx_State_AddModule PyState_AddModule
+#define __Pyx_State_RemoveModule PyState_RemoveModule
+#endif
+
+/* #### Code section: module_declarations ### */
+/* CythonABIVersion.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #if CYTHON_VECTORCALL
+        #define __PYX_VECTORCALL_ABI_SUFFIX  "_vectorcall"
+    #else
+        #define __PYX_VECTORCALL_ABI_SUFFIX
+    #endif
+    #define __PYX_LIMITED_ABI_SUFFIX "limited" __PYX_VECTORCALL_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
+#else
+    #define __PYX_LIMITED_ABI_SUFFIX
+#endif
+#if __PYX_HAS_PY_AM_SEND == 1
+    #define __PYX_AM_SEND_ABI_SUFFIX
+#elif __PYX_HAS_PY_AM_SEND == 2
+    #define __PYX_AM_SEND_ABI_SUFFIX "amsendbackport"
+#else
+    #define __PYX_AM_SEND_ABI_SUFFIX "noamsend"
+#endif
+#ifndef __PYX_MONITORING_ABI_SUFFIX
+    #define __PYX_MONITORING_ABI_SUFFIX
+#endif
+#if CYTHON_USE_TP_FINALIZE
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX
+#else
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX "nofinalize"
+#endif
+#if CYTHON_USE_FREELISTS || !defined(__Pyx_AsyncGen_USED)
+    #define __PYX_FREELISTS_ABI_SUFFIX
+#else
+    #define __PYX_FREELISTS_ABI_SUFFIX "nofreelists"
+#endif
+#if CYTHON_OPAQUE_OBJECTS && CYTHON_COMPILING_IN_LIMITED_API
+    #define __PYX_OPAQUE_OBJECTS_ABI_SUFFIX "opaque"
+#else
+    #define __PYX_OPAQUE_OBJECTS_ABI_SUFFIX
+#endif
+#define CYTHON_ABI  __PYX_ABI_VERSION __PYX_LIMITED_ABI_SUFFIX __PYX_MONITORING_ABI_SUFFIX __PYX_TP_FINALIZE_ABI_SUFFIX __PYX_FREELISTS_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX __PYX_OPAQUE_OBJECTS_ABI_SUFFIX
+#define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
+#define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
+
+static PyObject *__pyx_f_7sonolus_7backend_4_opt_8analysis_8Liveness__bitset_names(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self, uint64_t const *__pyx_v_bs); /* proto*/
+static int __pyx_f_7sonolus_7backend_4_opt_8analysis_10Dominators_dominates(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self, int32_t __pyx_v_a, int32_t __pyx_v_b); /* proto*/
+static int __pyx_f_7sonolus_7backend_4_opt_8analysis_10LoopForest_in_loop(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self, int32_t __pyx_v_loop_id, int32_t __pyx_v_block); /* proto*/
+static int __pyx_f_7sonolus_7backend_4_opt_8analysis_10LoopForest_crosses_loop(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self, int32_t __pyx_v_def_block, int32_t __pyx_v_use_block); /* proto*/
+
+/* Module declarations from "libc.stdint" */
+
+/* Module declarations from "sonolus.backend._opt._khash" */
+
+/* Module declarations from "sonolus.backend._opt.ir" */
+
+/* Module declarations from "libc.string" */
+
+/* Module declarations from "libc.stdlib" */
+
+/* Module declarations from "sonolus.backend._opt._ops_gen" */
+
+/* Module declarations from "sonolus.backend._opt.analysis" */
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get(uint64_t const *, int32_t); /*proto*/
+static CYTHON_INLINE void __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_set(uint64_t *, int32_t); /*proto*/
+static CYTHON_INLINE void __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_clear(uint64_t *, int32_t); /*proto*/
+static struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_liveness(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *); /*proto*/
+static struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_dominators(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *); /*proto*/
+static struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_loops(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *); /*proto*/
+static void __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_value(struct __pyx_t_7sonolus_7backend_4_opt_2ir_Instr *, uint32_t *, struct __pyx_t_7sonolus_7backend_4_opt_2ir_PlaceInfo *, uint64_t *, int32_t); /*proto*/
+static void __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_place_write(struct __pyx_t_7sonolus_7backend_4_opt_2ir_Instr *, uint32_t *, struct __pyx_t_7sonolus_7backend_4_opt_2ir_PlaceInfo *, uint64_t *, int32_t); /*proto*/
+static CYTHON_INLINE uint64_t *__pyx_f_7sonolus_7backend_4_opt_8analysis__c64(int64_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_8analysis__or_into(uint64_t *, uint64_t const *, int32_t); /*proto*/
+static int32_t __pyx_f_7sonolus_7backend_4_opt_8analysis__dom_intersect(int32_t *, int32_t, int32_t); /*proto*/
+/* #### Code section: typeinfo ### */
+/* #### Code section: before_global_var ### */
+#define __Pyx_MODULE_NAME "sonolus.backend._opt.analysis"
+extern int __pyx_module_is_main_sonolus__backend___opt__analysis;
+int __pyx_module_is_main_sonolus__backend___opt__analysis = 0;
+
+/* Implementation of "sonolus.backend._opt.analysis" */
+/* #### Code section: global_var ### */
+/* #### Code section: string_decls ### */
+static const char __pyx_k_Liveness_analysis_over_the_arena[] = "Liveness analysis over the arena IR.\n\nLiveness over the non-SSA arena form (size-1 temp reads/writes are explicit\nOPX_GET / OPX_SET; there are no phis). It computes, for every basic block:\n\n* ``live_in`` / ``live_out`` bitsets over temp ids;\n* per-statement-root live-out bitsets (``root_live``), shared with the\n  allocators for interference and dead-store elimination;\n* ``is_array_init`` per OPX_SET (the forward array pass), and\n  ``array_defs_out`` per block.\n\nSemantics:\n\n* Uses of a statement = every temp *read* anywhere in the operand tree\n  (OPX_GET of a temp place, plus temps read in a dynamic block/index subtree).\n  The OPX_SET *target* temp is a def, not a use.\n* Def = the OPX_SET target temp when it is a size-1 (scalar) temp.\n* array_defs = the OPX_SET target when it is a size>1 (array) temp.\n* Array rule: an array is live once any element is *read*; an array-element\n  *write* kills whole-array liveness only when it is provably the first write on\n  every path (``is_array_init``); arrays are not live before any write (the\n  live-out filter drops arrays not yet in ``array_defs_out``).\n* Size-0 temps are treated as ordinary temps for use-gen (a read makes them\n  live) but are never defs/array_defs; they are filtered out at allocation time.\n* ``can_skip``: a store whose value is not side-effecting and whose def set is\n  non-empty and disjoint from live-out contributes nothing (its uses do not\n  keep operands alive).\n* Block tests count as uses at block end.\n\nBackward dataflow runs to a fixpoint over a worklist seeded from all blocks (so\nexit-unreachable regions are analyzed too, not just those a backward walk from an\nexit reaches); a CFG with no exit block at all is a non-terminating callback and\nraises ValueError. The forward array-init pass runs to a fixpoint from the entry\nblock. Both are monotone so the result is order-independent (deterministic).\n";
+/* #### Code section: decls ### */
+static int __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness___cinit__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self); /* proto */
+static void __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_2__dealloc__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_4live_in_names(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_6live_out_names(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_8root_live_names(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_10array_defs_out_names(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_12is_array_init_map(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_14__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_16__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_liveness_debug(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_entry, PyObject *__pyx_v_mode, PyObject *__pyx_v_callback); /* proto */
+static int __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators___cinit__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self); /* proto */
+static void __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_2__dealloc__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_4idom_map(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_6children_map(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_8dominates_q(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self, int __pyx_v_a, int __pyx_v_b); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_2dominators_debug(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_entry, PyObject *__pyx_v_mode, PyObject *__pyx_v_callback); /* proto */
+static int __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest___cinit__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self); /* proto */
+static void __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_2__dealloc__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_4depth_map(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_6innermost_map(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_8loops(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_10crosses_loop_q(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self, int __pyx_v_def_block, int __pyx_v_use_block); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_12__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_14__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_4loops_debug(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_entry, PyObject *__pyx_v_mode, PyObject *__pyx_v_callback); /* proto */
+static PyObject *__pyx_tp_new__initialisation_7sonolus_7backend_4_opt_8analysis_Liveness(PyObject *o, 
+#if CYTHON_VECTORCALL_TPNEW
+    PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames
+#else
+    PyObject *a, PyObject *k
+#endif
+); /*proto*/
+static PyObject *__pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_Liveness(PyTypeObject *t, 
+#if CYTHON_VECTORCALL_TPNEW
+    PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames
+#else
+    PyObject *a, PyObject *k
+#endif
+); /*proto*/
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_new_7sonolus_7backend_4_opt_8analysis_Liveness(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+#endif
+#if !CYTHON_VECTORCALL_TPNEW
+#define __pyx_tp_new_7sonolus_7backend_4_opt_8analysis_Liveness __pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_Liveness
+#endif
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_Liveness(PyObject *t, PyObject *const *args, size_t nargsf, PyObject *kwnames); /*proto*/
+#endif
+static PyObject *__pyx_tp_new__initialisation_7sonolus_7backend_4_opt_8analysis_Dominators(PyObject *o, 
+#if CYTHON_VECTORCALL_TPNEW
+    PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames
+#else
+    PyObject *a, PyObject *k
+#endif
+); /*proto*/
+static PyObject *__pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_Dominators(PyTypeObject *t, 
+#if CYTHON_VECTORCALL_TPNEW
+    PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames
+#else
+    PyObject *a, PyObject *k
+#endif
+); /*proto*/
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_new_7sonolus_7backend_4_opt_8analysis_Dominators(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+#endif
+#if !CYTHON_VECTORCALL_TPNEW
+#define __pyx_tp_new_7sonolus_7backend_4_opt_8analysis_Dominators __pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_Dominators
+#endif
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_Dominators(PyObject *t, PyObject *const *args, size_t nargsf, PyObject *kwnames); /*proto*/
+#endif
+static PyObject *__pyx_tp_new__initialisation_7sonolus_7backend_4_opt_8analysis_LoopForest(PyObject *o, 
+#if CYTHON_VECTORCALL_TPNEW
+    PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames
+#else
+    PyObject *a, PyObject *k
+#endif
+); /*proto*/
+static PyObject *__pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_LoopForest(PyTypeObject *t, 
+#if CYTHON_VECTORCALL_TPNEW
+    PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames
+#else
+    PyObject *a, PyObject *k
+#endif
+); /*proto*/
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_new_7sonolus_7backend_4_opt_8analysis_LoopForest(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+#endif
+#if !CYTHON_VECTORCALL_TPNEW
+#define __pyx_tp_new_7sonolus_7backend_4_opt_8analysis_LoopForest __pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_LoopForest
+#endif
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_LoopForest(PyObject *t, PyObject *const *args, size_t nargsf, PyObject *kwnames); /*proto*/
+#endif
+/* #### Code section: late_includes ### */
+/* #### Code section: module_state ### */
+/* SmallCodeConfig */
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+#ifdef __cplusplus
+namespace {
+  #endif
+  typedef struct {
+    PyObject *__pyx_d;
+    PyObject *__pyx_b;
+    PyObject *__pyx_cython_runtime;
+    PyObject *__pyx_empty_tuple;
+    PyObject *__pyx_empty_bytes;
+    PyObject *__pyx_empty_unicode;
+    PyTypeObject *__pyx_ptype_7sonolus_7backend_4_opt_2ir_Func;
+    PyObject *__pyx_type_7sonolus_7backend_4_opt_8analysis_Liveness;
+    PyObject *__pyx_type_7sonolus_7backend_4_opt_8analysis_Dominators;
+    PyObject *__pyx_type_7sonolus_7backend_4_opt_8analysis_LoopForest;
+    PyTypeObject *__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness;
+    PyTypeObject *__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators;
+    PyTypeObject *__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest;
+    __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_items;
+    __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
+    __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
+    PyObject *__pyx_tuple[1];
+    PyObject *__pyx_codeobj_tab[21];
+    PyObject *__pyx_string_tab[125];
+/* #### Code section: module_state_contents ### */
+/* CommonTypesMetaclass.module_state_decls */
+PyTypeObject *__pyx_CommonTypesMetaclassType;
+
+/* CachedMethodType.module_state_decls */
+#if CYTHON_COMPILING_IN_LIMITED_API
+PyObject *__Pyx_CachedMethodType;
+#endif
+
+/* CythonFunctionPerModule.module_state_decls */
+PyTypeObject *__pyx_CyFunctionType;
+
+/* CodeObjectCache.module_state_decls */
+struct __Pyx_CodeObjectCache __pyx_code_cache;
+
+/* #### Code section: module_state_end ### */
+} __pyx_mstatetype;
+#ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+
+#if CYTHON_USE_MODULE_STATE
+#ifdef __cplusplus
+namespace {
+extern struct PyModuleDef __pyx_moduledef;
+} /* anonymous namespace */
+#else
+static struct PyModuleDef __pyx_moduledef;
+#endif
+
+#define __pyx_mstate_global (__Pyx_PyModule_GetState(__Pyx_State_FindModule(&__pyx_moduledef)))
+
+#define __pyx_m (__Pyx_State_FindModule(&__pyx_moduledef))
+#else
+static __pyx_mstatetype __pyx_mstate_global_static =
+#ifdef __cplusplus
+    {};
+#else
+    {0};
+#endif
+static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_static;
+#endif
+/* #### Code section: constant_name_defines ### */
+#define __pyx_kp_u_tree_fragment __pyx_string_tab[0]
+#define __pyx_kp_u__2 __pyx_string_tab[1]
+#define __pyx_kp_u_ __pyx_string_tab[2]
+#define __pyx_kp_u_Infinite_loop_detected __pyx_string_tab[3]
+#define __pyx_kp_u_disable __pyx_string_tab[4]
+#define __pyx_kp_u_enable __pyx_string_tab[5]
+#define __pyx_kp_u_gc __pyx_string_tab[6]
+#define __pyx_kp_u_isenabled __pyx_string_tab[7]
+#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[8]
+#define __pyx_kp_u_sonolus_backend__opt_analysis_py __pyx_string_tab[9]
+#define __pyx_n_u_D __pyx_string_tab[10]
+#define __pyx_n_u_Dominators __pyx_string_tab[11]
+#define __pyx_n_u_Dominators___reduce_cython __pyx_string_tab[12]
+#define __pyx_n_u_Dominators___setstate_cython __pyx_string_tab[13]
+#define __pyx_n_u_Dominators_children_map __pyx_string_tab[14]
+#define __pyx_n_u_Dominators_dominates_q __pyx_string_tab[15]
+#define __pyx_n_u_Dominators_idom_map __pyx_string_tab[16]
+#define __pyx_n_u_F __pyx_string_tab[17]
+#define __pyx_n_u_L __pyx_string_tab[18]
+#define __pyx_n_u_Liveness __pyx_string_tab[19]
+#define __pyx_n_u_Liveness___reduce_cython __pyx_string_tab[20]
+#define __pyx_n_u_Liveness___setstate_cython __pyx_string_tab[21]
+#define __pyx_n_u_Liveness_array_defs_out_names __pyx_string_tab[22]
+#define __pyx_n_u_Liveness_is_array_init_map __pyx_string_tab[23]
+#define __pyx_n_u_Liveness_live_in_names __pyx_string_tab[24]
+#define __pyx_n_u_Liveness_live_out_names __pyx_string_tab[25]
+#define __pyx_n_u_Liveness_root_live_names __pyx_string_tab[26]
+#define __pyx_n_u_LoopForest __pyx_string_tab[27]
+#define __pyx_n_u_LoopForest___reduce_cython __pyx_string_tab[28]
+#define __pyx_n_u_LoopForest___setstate_cython __pyx_string_tab[29]
+#define __pyx_n_u_LoopForest_crosses_loop_q __pyx_string_tab[30]
+#define __pyx_n_u_LoopForest_depth_map __pyx_string_tab[31]
+#define __pyx_n_u_LoopForest_innermost_map __pyx_string_tab[32]
+#define __pyx_n_u_LoopForest_loops __pyx_string_tab[33]
+#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[34]
+#define __pyx_n_u_annotate __pyx_string_tab[35]
+#define __pyx_n_u_func __pyx_string_tab[36]
+#define __pyx_n_u_getstate __pyx_string_tab[37]
+#define __pyx_n_u_main __pyx_string_tab[38]
+#define __pyx_n_u_module __pyx_string_tab[39]
+#define __pyx_n_u_name __pyx_string_tab[40]
+#define __pyx_n_u_pyx_capi __pyx_string_tab[41]
+#define __pyx_n_u_pyx_state __pyx_string_tab[42]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[43]
+#define __pyx_n_u_qualname __pyx_string_tab[44]
+#define __pyx_n_u_reduce __pyx_string_tab[45]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[46]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[47]
+#define __pyx_n_u_set_name __pyx_string_tab[48]
+#define __pyx_n_u_setstate __pyx_string_tab[49]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[50]
+#define __pyx_n_u_test __pyx_string_tab[51]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[52]
+#define __pyx_n_u_a __pyx_string_tab[53]
+#define __pyx_n_u_array_defs_out __pyx_string_tab[54]
+#define __pyx_n_u_array_defs_out_names __pyx_string_tab[55]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[56]
+#define __pyx_n_u_b __pyx_string_tab[57]
+#define __pyx_n_u_callback __pyx_string_tab[58]
+#define __pyx_n_u_children __pyx_string_tab[59]
+#define __pyx_n_u_children_map __pyx_string_tab[60]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[61]
+#define __pyx_n_u_crosses __pyx_string_tab[62]
+#define __pyx_n_u_crosses_loop_q __pyx_string_tab[63]
+#define __pyx_n_u_d __pyx_string_tab[64]
+#define __pyx_n_u_def_block __pyx_string_tab[65]
+#define __pyx_n_u_depth __pyx_string_tab[66]
+#define __pyx_n_u_depth_map __pyx_string_tab[67]
+#define __pyx_n_u_dominates __pyx_string_tab[68]
+#define __pyx_n_u_dominates_q __pyx_string_tab[69]
+#define __pyx_n_u_dominators_debug __pyx_string_tab[70]
+#define __pyx_n_u_entry __pyx_string_tab[71]
+#define __pyx_n_u_f __pyx_string_tab[72]
+#define __pyx_n_u_func_2 __pyx_string_tab[73]
+#define __pyx_n_u_i __pyx_string_tab[74]
+#define __pyx_n_u_idom __pyx_string_tab[75]
+#define __pyx_n_u_idom_map __pyx_string_tab[76]
+#define __pyx_n_u_innermost __pyx_string_tab[77]
+#define __pyx_n_u_innermost_map __pyx_string_tab[78]
+#define __pyx_n_u_is_array_init __pyx_string_tab[79]
+#define __pyx_n_u_is_array_init_map __pyx_string_tab[80]
+#define __pyx_n_u_items __pyx_string_tab[81]
+#define __pyx_n_u_k __pyx_string_tab[82]
+#define __pyx_n_u_li __pyx_string_tab[83]
+#define __pyx_n_u_live_in __pyx_string_tab[84]
+#define __pyx_n_u_live_in_names __pyx_string_tab[85]
+#define __pyx_n_u_live_out __pyx_string_tab[86]
+#define __pyx_n_u_live_out_names __pyx_string_tab[87]
+#define __pyx_n_u_liveness_debug __pyx_string_tab[88]
+#define __pyx_n_u_loops __pyx_string_tab[89]
+#define __pyx_n_u_loops_debug __pyx_string_tab[90]
+#define __pyx_n_u_marshal_in __pyx_string_tab[91]
+#define __pyx_n_u_members __pyx_string_tab[92]
+#define __pyx_n_u_mode __pyx_string_tab[93]
+#define __pyx_n_u_n_blocks __pyx_string_tab[94]
+#define __pyx_n_u_n_loops __pyx_string_tab[95]
+#define __pyx_n_u_out __pyx_string_tab[96]
+#define __pyx_n_u_pid __pyx_string_tab[97]
+#define __pyx_n_u_pop __pyx_string_tab[98]
+#define __pyx_n_u_root_live_names __pyx_string_tab[99]
+#define __pyx_n_u_self __pyx_string_tab[100]
+#define __pyx_n_u_setdefault __pyx_string_tab[101]
+#define __pyx_n_u_sonolus_backend__opt_analysis __pyx_string_tab[102]
+#define __pyx_n_u_sonolus_backend__opt_ir __pyx_string_tab[103]
+#define __pyx_n_u_stmt_live __pyx_string_tab[104]
+#define __pyx_n_u_use_block __pyx_string_tab[105]
+#define __pyx_n_u_values __pyx_string_tab[106]
+#define __pyx_n_u_verify __pyx_string_tab[107]
+#define __pyx_kp_b_struct___pyx_obj_7sonolus_7backe __pyx_string_tab[108]
+#define __pyx_kp_b_iso88591_Q __pyx_string_tab[109]
+#define __pyx_kp_b_iso88591_A_t1D_9Cy __pyx_string_tab[110]
+#define __pyx_kp_b_iso88591_A_t1D_Qi_1 __pyx_string_tab[111]
+#define __pyx_kp_b_iso88591_A_a_E_at1_Qe1D_1Ct5_Qd_Qd_kYZZ __pyx_string_tab[112]
+#define __pyx_kp_b_iso88591_A_a_E_at1_Qe4uAQ_q __pyx_string_tab[113]
+#define __pyx_kp_b_iso88591_A_a_E_at1_Qe4vQa_q __pyx_string_tab[114]
+#define __pyx_kp_b_iso88591_A_a_E_at1_Qe4z_q __pyx_string_tab[115]
+#define __pyx_kp_b_iso88591_A_a_E_at1_Qe4_Qat81IRr_Q_q __pyx_string_tab[116]
+#define __pyx_kp_b_iso88591_A_a_E_at1_Qe4_Qat9AYb_a_q __pyx_string_tab[117]
+#define __pyx_kp_b_iso88591_A_a_E_at1_Qe4_Qat_9Bb_A_q __pyx_string_tab[118]
+#define __pyx_kp_b_iso88591_A_a_d_E_at1_t_Qc_1_q_q_c_7_2Q_q __pyx_string_tab[119]
+#define __pyx_kp_b_iso88591_A_a_d_E_at1_t_Qc_A_t_4z_4zQRRUUW __pyx_string_tab[120]
+#define __pyx_kp_b_iso88591_A_F_q_A_ar_U_q_Ks_e1IUXXZZ_eef_w __pyx_string_tab[121]
+#define __pyx_kp_b_iso88591_V_QgV1_q_1_QfA_A_QnA_AQ_1A_1A __pyx_string_tab[122]
+#define __pyx_kp_b_iso88591_Q_V_QgV1_q_aq_1N_A_A_Q_a_0_A_AQ __pyx_string_tab[123]
+#define __pyx_kp_b_iso88591_Kq_V_QgV1_q_1_A_AQ_Qa __pyx_string_tab[124]
+/* #### Code section: module_state_clear ### */
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
+  __pyx_mstatetype *clear_module_state = __Pyx_PyModule_GetState(m);
+  if (!clear_module_state) return 0;
+  Py_CLEAR(clear_module_state->__pyx_d);
+  Py_CLEAR(clear_module_state->__pyx_b);
+  Py_CLEAR(clear_module_state->__pyx_cython_runtime);
+  Py_CLEAR(clear_module_state->__pyx_empty_tuple);
+  Py_CLEAR(clear_module_state->__pyx_empty_bytes);
+  Py_CLEAR(clear_module_state->__pyx_empty_unicode);
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __Pyx_State_RemoveModule(NULL);
+  #endif
+  Py_CLEAR(clear_module_state->__pyx_ptype_7sonolus_7backend_4_opt_2ir_Func);
+  Py_CLEAR(clear_module_state->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness);
+  Py_CLEAR(clear_module_state->__pyx_type_7sonolus_7backend_4_opt_8analysis_Liveness);
+  Py_CLEAR(clear_module_state->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators);
+  Py_CLEAR(clear_module_state->__pyx_type_7sonolus_7backend_4_opt_8analysis_Dominators);
+  Py_CLEAR(clear_module_state->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest);
+  Py_CLEAR(clear_module_state->__pyx_type_7sonolus_7backend_4_opt_8analysis_LoopForest);
+  Py_CLEAR(clear_module_state->__pyx_umethod_PyDict_Type_items.method);
+  Py_CLEAR(clear_module_state->__pyx_umethod_PyDict_Type_pop.method);
+  Py_CLEAR(clear_module_state->__pyx_umethod_PyDict_Type_values.method);
+  for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<21; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<125; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+/* #### Code section: module_state_clear_contents ### */
+/* CommonTypesMetaclass.module_state_clear */
+Py_CLEAR(clear_module_state->__pyx_CommonTypesMetaclassType);
+
+/* CythonFunctionPerModule.module_state_clear */
+Py_CLEAR(clear_module_state->__pyx_CyFunctionType);
+
+/* #### Code section: module_state_clear_end ### */
+return 0;
+}
+#endif
+/* #### Code section: module_state_traverse ### */
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
+  __pyx_mstatetype *traverse_module_state = __Pyx_PyModule_GetState(m);
+  if (!traverse_module_state) return 0;
+  Py_VISIT(traverse_module_state->__pyx_d);
+  Py_VISIT(traverse_module_state->__pyx_b);
+  Py_VISIT(traverse_module_state->__pyx_cython_runtime);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_tuple);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
+  Py_VISIT(traverse_module_state->__pyx_ptype_7sonolus_7backend_4_opt_2ir_Func);
+  Py_VISIT(traverse_module_state->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness);
+  Py_VISIT(traverse_module_state->__pyx_type_7sonolus_7backend_4_opt_8analysis_Liveness);
+  Py_VISIT(traverse_module_state->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators);
+  Py_VISIT(traverse_module_state->__pyx_type_7sonolus_7backend_4_opt_8analysis_Dominators);
+  Py_VISIT(traverse_module_state->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest);
+  Py_VISIT(traverse_module_state->__pyx_type_7sonolus_7backend_4_opt_8analysis_LoopForest);
+  Py_VISIT(traverse_module_state->__pyx_umethod_PyDict_Type_items.method);
+  Py_VISIT(traverse_module_state->__pyx_umethod_PyDict_Type_pop.method);
+  Py_VISIT(traverse_module_state->__pyx_umethod_PyDict_Type_values.method);
+  for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<21; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<125; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+/* #### Code section: module_state_traverse_contents ### */
+/* CommonTypesMetaclass.module_state_traverse */
+Py_VISIT(traverse_module_state->__pyx_CommonTypesMetaclassType);
+
+/* CythonFunctionPerModule.module_state_traverse */
+Py_VISIT(traverse_module_state->__pyx_CyFunctionType);
+
+/* #### Code section: module_state_traverse_end ### */
+return 0;
+}
+#endif
+/* #### Code section: module_code ### */
+
+/* "sonolus/backend/_opt/ir.pxd":367
+ * 
+ * 
+ * cdef inline void take_loc(Func dst, Func src, int32_t v) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Stamp the next instr emitted into ``dst`` with the location of ``src`` instr
+ *     # ``v`` (a no-op unless ``dst`` tracks locations; see "locs" above).
+*/
+
+static CYTHON_INLINE void __pyx_f_7sonolus_7backend_4_opt_2ir_take_loc(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_dst, struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_src, int32_t __pyx_v_v) {
+  int __pyx_t_1;
+
+  /* "sonolus/backend/_opt/ir.pxd":370
+ *     # Stamp the next instr emitted into ``dst`` with the location of ``src`` instr
+ *     # ``v`` (a no-op unless ``dst`` tracks locations; see "locs" above).
+ *     if dst.locs != NULL:             # <<<<<<<<<<<<<<
+ *         dst.cur_loc = src.locs[v]
+*/
+  __pyx_t_1 = (__pyx_v_dst->locs != NULL);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/ir.pxd":371
+ *     # ``v`` (a no-op unless ``dst`` tracks locations; see "locs" above).
+ *     if dst.locs != NULL:
+ *         dst.cur_loc = src.locs[v]             # <<<<<<<<<<<<<<
+*/
+    __pyx_v_dst->cur_loc = (__pyx_v_src->locs[__pyx_v_v]);
+
+    /* "sonolus/backend/_opt/ir.pxd":370
+ *     # Stamp the next instr emitted into ``dst`` with the location of ``src`` instr
+ *     # ``v`` (a no-op unless ``dst`` tracks locations; see "locs" above).
+ *     if dst.locs != NULL:             # <<<<<<<<<<<<<<
+ *         dst.cur_loc = src.locs[v]
+*/
+  }
+
+  /* "sonolus/backend/_opt/ir.pxd":367
+ * 
+ * 
+ * cdef inline void take_loc(Func dst, Func src, int32_t v) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Stamp the next instr emitted into ``dst`` with the location of ``src`` instr
+ *     # ``v`` (a no-op unless ``dst`` tracks locations; see "locs" above).
+*/
+
+  /* function exit code */
+}
+
+/* "sonolus/backend/_opt/analysis.pxd":17
+ * 
+ * 
+ * cdef inline bint bs_get(const uint64_t* bs, int32_t i) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return <bint>((bs[i >> 6] >> (i & 63)) & <uint64_t>1)
+ * 
+*/
+
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get(uint64_t const *__pyx_v_bs, int32_t __pyx_v_i) {
+  int __pyx_r;
+
+  /* "sonolus/backend/_opt/analysis.pxd":18
+ * 
+ * cdef inline bint bs_get(const uint64_t* bs, int32_t i) noexcept nogil:
+ *     return <bint>((bs[i >> 6] >> (i & 63)) & <uint64_t>1)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = ((((__pyx_v_bs[(__pyx_v_i >> 6)]) >> (__pyx_v_i & 63)) & ((uint64_t)1)) != 0);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pxd":17
+ * 
+ * 
+ * cdef inline bint bs_get(const uint64_t* bs, int32_t i) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return <bint>((bs[i >> 6] >> (i & 63)) & <uint64_t>1)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pxd":21
+ * 
+ * 
+ * cdef inline void bs_set(uint64_t* bs, int32_t i) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     bs[i >> 6] |= (<uint64_t>1 << (i & 63))
+ * 
+*/
+
+static CYTHON_INLINE void __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_set(uint64_t *__pyx_v_bs, int32_t __pyx_v_i) {
+  long __pyx_t_1;
+
+  /* "sonolus/backend/_opt/analysis.pxd":22
+ * 
+ * cdef inline void bs_set(uint64_t* bs, int32_t i) noexcept nogil:
+ *     bs[i >> 6] |= (<uint64_t>1 << (i & 63))             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+
+  __pyx_t_1 = (__pyx_v_i >> 6);
+  (__pyx_v_bs[__pyx_t_1]) = ((__pyx_v_bs[__pyx_t_1]) | (((uint64_t)1) << (__pyx_v_i & 63)));
+
+  /* "sonolus/backend/_opt/analysis.pxd":21
+ * 
+ * 
+ * cdef inline void bs_set(uint64_t* bs, int32_t i) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     bs[i >> 6] |= (<uint64_t>1 << (i & 63))
+ * 
+*/
+
+  /* function exit code */
+}
+
+/* "sonolus/backend/_opt/analysis.pxd":25
+ * 
+ * 
+ * cdef inline void bs_clear(uint64_t* bs, int32_t i) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     bs[i >> 6] &= ~(<uint64_t>1 << (i & 63))
+ * 
+*/
+
+static CYTHON_INLINE void __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_clear(uint64_t *__pyx_v_bs, int32_t __pyx_v_i) {
+  long __pyx_t_1;
+
+  /* "sonolus/backend/_opt/analysis.pxd":26
+ * 
+ * cdef inline void bs_clear(uint64_t* bs, int32_t i) noexcept nogil:
+ *     bs[i >> 6] &= ~(<uint64_t>1 << (i & 63))             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+
+  __pyx_t_1 = (__pyx_v_i >> 6);
+  (__pyx_v_bs[__pyx_t_1]) = ((__pyx_v_bs[__pyx_t_1]) & (~(((uint64_t)1) << (__pyx_v_i & 63))));
+
+  /* "sonolus/backend/_opt/analysis.pxd":25
+ * 
+ * 
+ * cdef inline void bs_clear(uint64_t* bs, int32_t i) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     bs[i >> 6] &= ~(<uint64_t>1 << (i & 63))
+ * 
+*/
+
+  /* function exit code */
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":65
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef void _gen_value(Instr* instrs, uint32_t* args, PlaceInfo* places,             # <<<<<<<<<<<<<<
+ *                      uint64_t* bs, int32_t vid) noexcept nogil:
+ *     cdef uint16_t op = instrs[vid].op
+*/
+
+static void __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_value(struct __pyx_t_7sonolus_7backend_4_opt_2ir_Instr *__pyx_v_instrs, uint32_t *__pyx_v_args, struct __pyx_t_7sonolus_7backend_4_opt_2ir_PlaceInfo *__pyx_v_places, uint64_t *__pyx_v_bs, int32_t __pyx_v_vid) {
+  uint16_t __pyx_v_op;
+  int32_t __pyx_v_astart;
+  int32_t __pyx_v_nargs;
+  int32_t __pyx_v_k;
+  int32_t __pyx_v_pid;
+  uint8_t __pyx_v_kind;
+  int32_t __pyx_v_br;
+  int32_t __pyx_v_iv;
+  uint16_t __pyx_t_1;
+  int __pyx_t_2;
+  int32_t __pyx_t_3;
+  uint8_t __pyx_t_4;
+  int16_t __pyx_t_5;
+  int32_t __pyx_t_6;
+  int32_t __pyx_t_7;
+
+  /* "sonolus/backend/_opt/analysis.pyx":67
+ * cdef void _gen_value(Instr* instrs, uint32_t* args, PlaceInfo* places,
+ *                      uint64_t* bs, int32_t vid) noexcept nogil:
+ *     cdef uint16_t op = instrs[vid].op             # <<<<<<<<<<<<<<
+ *     cdef int32_t astart, nargs, k, pid
+ *     cdef uint8_t kind
+*/
+  __pyx_t_1 = (__pyx_v_instrs[__pyx_v_vid]).op;
+
+  __pyx_v_op = __pyx_t_1;
+
+  /* "sonolus/backend/_opt/analysis.pyx":71
+ *     cdef uint8_t kind
+ *     cdef int32_t br, iv
+ *     if op == OPX_CONST:             # <<<<<<<<<<<<<<
+ *         return
+ *     if op == OPX_GET:
+*/
+  __pyx_t_2 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_CONST);
+
+  if (__pyx_t_2) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":72
+ *     cdef int32_t br, iv
+ *     if op == OPX_CONST:
+ *         return             # <<<<<<<<<<<<<<
+ *     if op == OPX_GET:
+ *         pid = instrs[vid].aux
+*/
+    {
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/analysis.pyx":71
+ *     cdef uint8_t kind
+ *     cdef int32_t br, iv
+ *     if op == OPX_CONST:             # <<<<<<<<<<<<<<
+ *         return
+ *     if op == OPX_GET:
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":73
+ *     if op == OPX_CONST:
+ *         return
+ *     if op == OPX_GET:             # <<<<<<<<<<<<<<
+ *         pid = instrs[vid].aux
+ *         kind = places[pid].kind
+*/
+  __pyx_t_2 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_GET);
+
+  if (__pyx_t_2) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":74
+ *         return
+ *     if op == OPX_GET:
+ *         pid = instrs[vid].aux             # <<<<<<<<<<<<<<
+ *         kind = places[pid].kind
+ *         br = places[pid].block_ref
+*/
+    __pyx_t_3 = (__pyx_v_instrs[__pyx_v_vid]).aux;
+
+    __pyx_v_pid = __pyx_t_3;
+
+    /* "sonolus/backend/_opt/analysis.pyx":75
+ *     if op == OPX_GET:
+ *         pid = instrs[vid].aux
+ *         kind = places[pid].kind             # <<<<<<<<<<<<<<
+ *         br = places[pid].block_ref
+ *         iv = places[pid].index_val
+*/
+    __pyx_t_4 = (__pyx_v_places[__pyx_v_pid]).kind;
+
+    __pyx_v_kind = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":76
+ *         pid = instrs[vid].aux
+ *         kind = places[pid].kind
+ *         br = places[pid].block_ref             # <<<<<<<<<<<<<<
+ *         iv = places[pid].index_val
+ *         if kind == PLACE_TEMP_SCALAR or kind == PLACE_TEMP_ARRAY or kind == PLACE_TEMP_SIZE0:
+*/
+    __pyx_t_3 = (__pyx_v_places[__pyx_v_pid]).block_ref;
+
+    __pyx_v_br = __pyx_t_3;
+
+    /* "sonolus/backend/_opt/analysis.pyx":77
+ *         kind = places[pid].kind
+ *         br = places[pid].block_ref
+ *         iv = places[pid].index_val             # <<<<<<<<<<<<<<
+ *         if kind == PLACE_TEMP_SCALAR or kind == PLACE_TEMP_ARRAY or kind == PLACE_TEMP_SIZE0:
+ *             bs_set(bs, br)
+*/
+    __pyx_t_3 = (__pyx_v_places[__pyx_v_pid]).index_val;
+
+    __pyx_v_iv = __pyx_t_3;
+
+    /* "sonolus/backend/_opt/analysis.pyx":78
+ *         br = places[pid].block_ref
+ *         iv = places[pid].index_val
+ *         if kind == PLACE_TEMP_SCALAR or kind == PLACE_TEMP_ARRAY or kind == PLACE_TEMP_SIZE0:             # <<<<<<<<<<<<<<
+ *             bs_set(bs, br)
+ *         elif kind == PLACE_DYNAMIC_BLOCK:
+*/
+    switch (__pyx_v_kind) {
+      case __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_SCALAR:
+      case __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_ARRAY:
+      case __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_SIZE0:
+
+      /* "sonolus/backend/_opt/analysis.pyx":79
+ *         iv = places[pid].index_val
+ *         if kind == PLACE_TEMP_SCALAR or kind == PLACE_TEMP_ARRAY or kind == PLACE_TEMP_SIZE0:
+ *             bs_set(bs, br)             # <<<<<<<<<<<<<<
+ *         elif kind == PLACE_DYNAMIC_BLOCK:
+ *             _gen_value(instrs, args, places, bs, br)
+*/
+      __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_set(__pyx_v_bs, __pyx_v_br);
+
+      /* "sonolus/backend/_opt/analysis.pyx":78
+ *         br = places[pid].block_ref
+ *         iv = places[pid].index_val
+ *         if kind == PLACE_TEMP_SCALAR or kind == PLACE_TEMP_ARRAY or kind == PLACE_TEMP_SIZE0:             # <<<<<<<<<<<<<<
+ *             bs_set(bs, br)
+ *         elif kind == PLACE_DYNAMIC_BLOCK:
+*/
+      break;
+      case __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_DYNAMIC_BLOCK:
+
+      /* "sonolus/backend/_opt/analysis.pyx":81
+ *             bs_set(bs, br)
+ *         elif kind == PLACE_DYNAMIC_BLOCK:
+ *             _gen_value(instrs, args, places, bs, br)             # <<<<<<<<<<<<<<
+ *         if iv >= 0:
+ *             _gen_value(instrs, args, places, bs, iv)
+*/
+      __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_value(__pyx_v_instrs, __pyx_v_args, __pyx_v_places, __pyx_v_bs, __pyx_v_br);
+
+      /* "sonolus/backend/_opt/analysis.pyx":80
+ *         if kind == PLACE_TEMP_SCALAR or kind == PLACE_TEMP_ARRAY or kind == PLACE_TEMP_SIZE0:
+ *             bs_set(bs, br)
+ *         elif kind == PLACE_DYNAMIC_BLOCK:             # <<<<<<<<<<<<<<
+ *             _gen_value(instrs, args, places, bs, br)
+ *         if iv >= 0:
+*/
+      break;
+      default: break;
+    }
+
+    /* "sonolus/backend/_opt/analysis.pyx":82
+ *         elif kind == PLACE_DYNAMIC_BLOCK:
+ *             _gen_value(instrs, args, places, bs, br)
+ *         if iv >= 0:             # <<<<<<<<<<<<<<
+ *             _gen_value(instrs, args, places, bs, iv)
+ *         return
+*/
+    __pyx_t_2 = (__pyx_v_iv >= 0);
+
+    if (__pyx_t_2) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":83
+ *             _gen_value(instrs, args, places, bs, br)
+ *         if iv >= 0:
+ *             _gen_value(instrs, args, places, bs, iv)             # <<<<<<<<<<<<<<
+ *         return
+ *     # Runtime op (pure or side-effecting): read every operand subtree.
+*/
+      __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_value(__pyx_v_instrs, __pyx_v_args, __pyx_v_places, __pyx_v_bs, __pyx_v_iv);
+
+      /* "sonolus/backend/_opt/analysis.pyx":82
+ *         elif kind == PLACE_DYNAMIC_BLOCK:
+ *             _gen_value(instrs, args, places, bs, br)
+ *         if iv >= 0:             # <<<<<<<<<<<<<<
+ *             _gen_value(instrs, args, places, bs, iv)
+ *         return
+*/
+    }
+
+    /* "sonolus/backend/_opt/analysis.pyx":84
+ *         if iv >= 0:
+ *             _gen_value(instrs, args, places, bs, iv)
+ *         return             # <<<<<<<<<<<<<<
+ *     # Runtime op (pure or side-effecting): read every operand subtree.
+ *     astart = instrs[vid].arg_start
+*/
+    {
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/analysis.pyx":73
+ *     if op == OPX_CONST:
+ *         return
+ *     if op == OPX_GET:             # <<<<<<<<<<<<<<
+ *         pid = instrs[vid].aux
+ *         kind = places[pid].kind
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":86
+ *         return
+ *     # Runtime op (pure or side-effecting): read every operand subtree.
+ *     astart = instrs[vid].arg_start             # <<<<<<<<<<<<<<
+ *     nargs = instrs[vid].nargs
+ *     for k in range(nargs):
+*/
+  __pyx_t_3 = (__pyx_v_instrs[__pyx_v_vid]).arg_start;
+
+  __pyx_v_astart = __pyx_t_3;
+
+  /* "sonolus/backend/_opt/analysis.pyx":87
+ *     # Runtime op (pure or side-effecting): read every operand subtree.
+ *     astart = instrs[vid].arg_start
+ *     nargs = instrs[vid].nargs             # <<<<<<<<<<<<<<
+ *     for k in range(nargs):
+ *         _gen_value(instrs, args, places, bs, <int32_t>args[astart + k])
+*/
+  __pyx_t_5 = (__pyx_v_instrs[__pyx_v_vid]).nargs;
+
+  __pyx_v_nargs = __pyx_t_5;
+
+  /* "sonolus/backend/_opt/analysis.pyx":88
+ *     astart = instrs[vid].arg_start
+ *     nargs = instrs[vid].nargs
+ *     for k in range(nargs):             # <<<<<<<<<<<<<<
+ *         _gen_value(instrs, args, places, bs, <int32_t>args[astart + k])
+ * 
+*/
+
+  __pyx_t_3 = __pyx_v_nargs;
+  __pyx_t_6 = __pyx_t_3;
+
+  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+    __pyx_v_k = __pyx_t_7;
+
+    /* "sonolus/backend/_opt/analysis.pyx":89
+ *     nargs = instrs[vid].nargs
+ *     for k in range(nargs):
+ *         _gen_value(instrs, args, places, bs, <int32_t>args[astart + k])             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+    __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_value(__pyx_v_instrs, __pyx_v_args, __pyx_v_places, __pyx_v_bs, ((int32_t)(__pyx_v_args[(__pyx_v_astart + __pyx_v_k)])));
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":65
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef void _gen_value(Instr* instrs, uint32_t* args, PlaceInfo* places,             # <<<<<<<<<<<<<<
+ *                      uint64_t* bs, int32_t vid) noexcept nogil:
+ *     cdef uint16_t op = instrs[vid].op
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+
+
+
+
+
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":92
+ * 
+ * 
+ * cdef void _gen_place_write(Instr* instrs, uint32_t* args, PlaceInfo* places,             # <<<<<<<<<<<<<<
+ *                            uint64_t* bs, int32_t pid) noexcept nogil:
+ *     # Uses contributed by an OPX_SET *target* place: the block temp is a def
+*/
+
+static void __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_place_write(struct __pyx_t_7sonolus_7backend_4_opt_2ir_Instr *__pyx_v_instrs, uint32_t *__pyx_v_args, struct __pyx_t_7sonolus_7backend_4_opt_2ir_PlaceInfo *__pyx_v_places, uint64_t *__pyx_v_bs, int32_t __pyx_v_pid) {
+  uint8_t __pyx_v_kind;
+  int32_t __pyx_v_br;
+  int32_t __pyx_v_iv;
+  uint8_t __pyx_t_1;
+  int32_t __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "sonolus/backend/_opt/analysis.pyx":96
+ *     # Uses contributed by an OPX_SET *target* place: the block temp is a def
+ *     # (not a use), but a dynamic block pointer and a dynamic index are reads.
+ *     cdef uint8_t kind = places[pid].kind             # <<<<<<<<<<<<<<
+ *     cdef int32_t br = places[pid].block_ref
+ *     cdef int32_t iv = places[pid].index_val
+*/
+  __pyx_t_1 = (__pyx_v_places[__pyx_v_pid]).kind;
+
+  __pyx_v_kind = __pyx_t_1;
+
+  /* "sonolus/backend/_opt/analysis.pyx":97
+ *     # (not a use), but a dynamic block pointer and a dynamic index are reads.
+ *     cdef uint8_t kind = places[pid].kind
+ *     cdef int32_t br = places[pid].block_ref             # <<<<<<<<<<<<<<
+ *     cdef int32_t iv = places[pid].index_val
+ *     if kind == PLACE_DYNAMIC_BLOCK:
+*/
+  __pyx_t_2 = (__pyx_v_places[__pyx_v_pid]).block_ref;
+
+  __pyx_v_br = __pyx_t_2;
+
+  /* "sonolus/backend/_opt/analysis.pyx":98
+ *     cdef uint8_t kind = places[pid].kind
+ *     cdef int32_t br = places[pid].block_ref
+ *     cdef int32_t iv = places[pid].index_val             # <<<<<<<<<<<<<<
+ *     if kind == PLACE_DYNAMIC_BLOCK:
+ *         _gen_value(instrs, args, places, bs, br)
+*/
+  __pyx_t_2 = (__pyx_v_places[__pyx_v_pid]).index_val;
+
+  __pyx_v_iv = __pyx_t_2;
+
+  /* "sonolus/backend/_opt/analysis.pyx":99
+ *     cdef int32_t br = places[pid].block_ref
+ *     cdef int32_t iv = places[pid].index_val
+ *     if kind == PLACE_DYNAMIC_BLOCK:             # <<<<<<<<<<<<<<
+ *         _gen_value(instrs, args, places, bs, br)
+ *     if iv >= 0:
+*/
+  __pyx_t_3 = (__pyx_v_kind == __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_DYNAMIC_BLOCK);
+
+  if (__pyx_t_3) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":100
+ *     cdef int32_t iv = places[pid].index_val
+ *     if kind == PLACE_DYNAMIC_BLOCK:
+ *         _gen_value(instrs, args, places, bs, br)             # <<<<<<<<<<<<<<
+ *     if iv >= 0:
+ *         _gen_value(instrs, args, places, bs, iv)
+*/
+    __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_value(__pyx_v_instrs, __pyx_v_args, __pyx_v_places, __pyx_v_bs, __pyx_v_br);
+
+    /* "sonolus/backend/_opt/analysis.pyx":99
+ *     cdef int32_t br = places[pid].block_ref
+ *     cdef int32_t iv = places[pid].index_val
+ *     if kind == PLACE_DYNAMIC_BLOCK:             # <<<<<<<<<<<<<<
+ *         _gen_value(instrs, args, places, bs, br)
+ *     if iv >= 0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":101
+ *     if kind == PLACE_DYNAMIC_BLOCK:
+ *         _gen_value(instrs, args, places, bs, br)
+ *     if iv >= 0:             # <<<<<<<<<<<<<<
+ *         _gen_value(instrs, args, places, bs, iv)
+ * 
+*/
+  __pyx_t_3 = (__pyx_v_iv >= 0);
+
+  if (__pyx_t_3) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":102
+ *         _gen_value(instrs, args, places, bs, br)
+ *     if iv >= 0:
+ *         _gen_value(instrs, args, places, bs, iv)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+    __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_value(__pyx_v_instrs, __pyx_v_args, __pyx_v_places, __pyx_v_bs, __pyx_v_iv);
+
+    /* "sonolus/backend/_opt/analysis.pyx":101
+ *     if kind == PLACE_DYNAMIC_BLOCK:
+ *         _gen_value(instrs, args, places, bs, br)
+ *     if iv >= 0:             # <<<<<<<<<<<<<<
+ *         _gen_value(instrs, args, places, bs, iv)
+ * 
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":92
+ * 
+ * 
+ * cdef void _gen_place_write(Instr* instrs, uint32_t* args, PlaceInfo* places,             # <<<<<<<<<<<<<<
+ *                            uint64_t* bs, int32_t pid) noexcept nogil:
+ *     # Uses contributed by an OPX_SET *target* place: the block temp is a def
+*/
+
+  /* function exit code */
+
+
+
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":109
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef inline uint64_t* _c64(int64_t count) except NULL:             # <<<<<<<<<<<<<<
+ *     # count is int64 so callers can pass nb*nw products without int32 overflow;
+ *     # an oversized request fails cleanly in calloc (MemoryError) rather than
+*/
+
+static CYTHON_INLINE uint64_t *__pyx_f_7sonolus_7backend_4_opt_8analysis__c64(int64_t __pyx_v_count) {
+  int64_t __pyx_v_n;
+  uint64_t *__pyx_v_p;
+  uint64_t *__pyx_r;
+  int64_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":113
+ *     # an oversized request fails cleanly in calloc (MemoryError) rather than
+ *     # wrapping to a small buffer that the strided passes then overrun.
+ *     cdef int64_t n = count if count > 0 else 1             # <<<<<<<<<<<<<<
+ *     cdef uint64_t* p = <uint64_t*>calloc(<size_t>n, sizeof(uint64_t))
+ *     if p == NULL:
+*/
+  __pyx_t_2 = (__pyx_v_count > 0);
+
+  if (__pyx_t_2) {
+
+    __pyx_t_1 = __pyx_v_count;
+  } else {
+
+    __pyx_t_1 = 1;
+  }
+
+  __pyx_v_n = __pyx_t_1;
+
+  /* "sonolus/backend/_opt/analysis.pyx":114
+ *     # wrapping to a small buffer that the strided passes then overrun.
+ *     cdef int64_t n = count if count > 0 else 1
+ *     cdef uint64_t* p = <uint64_t*>calloc(<size_t>n, sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *     if p == NULL:
+ *         raise MemoryError()
+*/
+  __pyx_v_p = ((uint64_t *)calloc(((size_t)__pyx_v_n), (sizeof(uint64_t))));
+
+  /* "sonolus/backend/_opt/analysis.pyx":115
+ *     cdef int64_t n = count if count > 0 else 1
+ *     cdef uint64_t* p = <uint64_t*>calloc(<size_t>n, sizeof(uint64_t))
+ *     if p == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     return p
+*/
+  __pyx_t_2 = (__pyx_v_p == NULL);
+
+  if (unlikely(__pyx_t_2)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":116
+ *     cdef uint64_t* p = <uint64_t*>calloc(<size_t>n, sizeof(uint64_t))
+ *     if p == NULL:
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     return p
+ * 
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 116, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":115
+ *     cdef int64_t n = count if count > 0 else 1
+ *     cdef uint64_t* p = <uint64_t*>calloc(<size_t>n, sizeof(uint64_t))
+ *     if p == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     return p
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":117
+ *     if p == NULL:
+ *         raise MemoryError()
+ *     return p             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = __pyx_v_p;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":109
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef inline uint64_t* _c64(int64_t count) except NULL:             # <<<<<<<<<<<<<<
+ *     # count is int64 so callers can pass nb*nw products without int32 overflow;
+ *     # an oversized request fails cleanly in calloc (MemoryError) rather than
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis._c64", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+
+
+
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":120
+ * 
+ * 
+ * cdef inline bint _or_into(uint64_t* dst, const uint64_t* src, int32_t nw) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # dst |= src; return whether dst changed.
+ *     cdef int32_t w
+*/
+
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_8analysis__or_into(uint64_t *__pyx_v_dst, uint64_t const *__pyx_v_src, int32_t __pyx_v_nw) {
+  int32_t __pyx_v_w;
+  uint64_t __pyx_v_before;
+  int __pyx_v_changed;
+  int __pyx_r;
+  int32_t __pyx_t_1;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "sonolus/backend/_opt/analysis.pyx":124
+ *     cdef int32_t w
+ *     cdef uint64_t before
+ *     cdef bint changed = False             # <<<<<<<<<<<<<<
+ *     for w in range(nw):
+ *         before = dst[w]
+*/
+  __pyx_v_changed = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":125
+ *     cdef uint64_t before
+ *     cdef bint changed = False
+ *     for w in range(nw):             # <<<<<<<<<<<<<<
+ *         before = dst[w]
+ *         dst[w] = before | src[w]
+*/
+
+  __pyx_t_1 = __pyx_v_nw;
+  __pyx_t_2 = __pyx_t_1;
+
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_w = __pyx_t_3;
+
+    /* "sonolus/backend/_opt/analysis.pyx":126
+ *     cdef bint changed = False
+ *     for w in range(nw):
+ *         before = dst[w]             # <<<<<<<<<<<<<<
+ *         dst[w] = before | src[w]
+ *         if dst[w] != before:
+*/
+    __pyx_v_before = (__pyx_v_dst[__pyx_v_w]);
+
+    /* "sonolus/backend/_opt/analysis.pyx":127
+ *     for w in range(nw):
+ *         before = dst[w]
+ *         dst[w] = before | src[w]             # <<<<<<<<<<<<<<
+ *         if dst[w] != before:
+ *             changed = True
+*/
+    (__pyx_v_dst[__pyx_v_w]) = (__pyx_v_before | (__pyx_v_src[__pyx_v_w]));
+
+    /* "sonolus/backend/_opt/analysis.pyx":128
+ *         before = dst[w]
+ *         dst[w] = before | src[w]
+ *         if dst[w] != before:             # <<<<<<<<<<<<<<
+ *             changed = True
+ *     return changed
+*/
+    __pyx_t_4 = ((__pyx_v_dst[__pyx_v_w]) != __pyx_v_before);
+
+    if (__pyx_t_4) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":129
+ *         dst[w] = before | src[w]
+ *         if dst[w] != before:
+ *             changed = True             # <<<<<<<<<<<<<<
+ *     return changed
+ * 
+*/
+      __pyx_v_changed = 1;
+
+      /* "sonolus/backend/_opt/analysis.pyx":128
+ *         before = dst[w]
+ *         dst[w] = before | src[w]
+ *         if dst[w] != before:             # <<<<<<<<<<<<<<
+ *             changed = True
+ *     return changed
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":130
+ *         if dst[w] != before:
+ *             changed = True
+ *     return changed             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = __pyx_v_changed;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":120
+ * 
+ * 
+ * cdef inline bint _or_into(uint64_t* dst, const uint64_t* src, int32_t nw) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # dst |= src; return whether dst changed.
+ *     cdef int32_t w
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":138
+ * 
+ * cdef class Liveness:
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self.func = None
+ *         self.live_in = NULL
+*/
+
+/* Python wrapper */
+static int __pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_1__cinit__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL_TPNEW
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static int __pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_1__cinit__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL_TPNEW
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL_TPNEW
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL_TPNEW
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL_TPNEW(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, __pyx_nargs); return -1; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL_TPNEW(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return -1;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__cinit__", __pyx_kwds); return -1;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness___cinit__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness___cinit__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":139
+ * cdef class Liveness:
+ *     def __cinit__(self):
+ *         self.func = None             # <<<<<<<<<<<<<<
+ *         self.live_in = NULL
+ *         self.live_out = NULL
+*/
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF((PyObject *)__pyx_v_self->func);
+  __Pyx_DECREF((PyObject *)__pyx_v_self->func);
+  __pyx_v_self->func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)Py_None);
+
+  /* "sonolus/backend/_opt/analysis.pyx":140
+ *     def __cinit__(self):
+ *         self.func = None
+ *         self.live_in = NULL             # <<<<<<<<<<<<<<
+ *         self.live_out = NULL
+ *         self.array_defs_out = NULL
+*/
+  __pyx_v_self->live_in = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":141
+ *         self.func = None
+ *         self.live_in = NULL
+ *         self.live_out = NULL             # <<<<<<<<<<<<<<
+ *         self.array_defs_out = NULL
+ *         self.array_mask = NULL
+*/
+  __pyx_v_self->live_out = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":142
+ *         self.live_in = NULL
+ *         self.live_out = NULL
+ *         self.array_defs_out = NULL             # <<<<<<<<<<<<<<
+ *         self.array_mask = NULL
+ *         self.root_live = NULL
+*/
+  __pyx_v_self->array_defs_out = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":143
+ *         self.live_out = NULL
+ *         self.array_defs_out = NULL
+ *         self.array_mask = NULL             # <<<<<<<<<<<<<<
+ *         self.root_live = NULL
+ *         self.root_slot = NULL
+*/
+  __pyx_v_self->array_mask = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":144
+ *         self.array_defs_out = NULL
+ *         self.array_mask = NULL
+ *         self.root_live = NULL             # <<<<<<<<<<<<<<
+ *         self.root_slot = NULL
+ *         self.is_array_init = NULL
+*/
+  __pyx_v_self->root_live = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":145
+ *         self.array_mask = NULL
+ *         self.root_live = NULL
+ *         self.root_slot = NULL             # <<<<<<<<<<<<<<
+ *         self.is_array_init = NULL
+ * 
+*/
+  __pyx_v_self->root_slot = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":146
+ *         self.root_live = NULL
+ *         self.root_slot = NULL
+ *         self.is_array_init = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+*/
+  __pyx_v_self->is_array_init = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":138
+ * 
+ * cdef class Liveness:
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self.func = None
+ *         self.live_in = NULL
+*/
+
+  /* function exit code */
+  __pyx_r = 0;
+
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":148
+ *         self.is_array_init = NULL
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.live_in)
+ *         free(self.live_out)
+*/
+
+/* Python wrapper */
+static void __pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_3__dealloc__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_2__dealloc__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_2__dealloc__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self) {
+
+  /* "sonolus/backend/_opt/analysis.pyx":149
+ * 
+ *     def __dealloc__(self):
+ *         free(self.live_in)             # <<<<<<<<<<<<<<
+ *         free(self.live_out)
+ *         free(self.array_defs_out)
+*/
+  free(__pyx_v_self->live_in);
+
+  /* "sonolus/backend/_opt/analysis.pyx":150
+ *     def __dealloc__(self):
+ *         free(self.live_in)
+ *         free(self.live_out)             # <<<<<<<<<<<<<<
+ *         free(self.array_defs_out)
+ *         free(self.array_mask)
+*/
+  free(__pyx_v_self->live_out);
+
+  /* "sonolus/backend/_opt/analysis.pyx":151
+ *         free(self.live_in)
+ *         free(self.live_out)
+ *         free(self.array_defs_out)             # <<<<<<<<<<<<<<
+ *         free(self.array_mask)
+ *         free(self.root_live)
+*/
+  free(__pyx_v_self->array_defs_out);
+
+  /* "sonolus/backend/_opt/analysis.pyx":152
+ *         free(self.live_out)
+ *         free(self.array_defs_out)
+ *         free(self.array_mask)             # <<<<<<<<<<<<<<
+ *         free(self.root_live)
+ *         free(self.root_slot)
+*/
+  free(__pyx_v_self->array_mask);
+
+  /* "sonolus/backend/_opt/analysis.pyx":153
+ *         free(self.array_defs_out)
+ *         free(self.array_mask)
+ *         free(self.root_live)             # <<<<<<<<<<<<<<
+ *         free(self.root_slot)
+ *         free(self.is_array_init)
+*/
+  free(__pyx_v_self->root_live);
+
+  /* "sonolus/backend/_opt/analysis.pyx":154
+ *         free(self.array_mask)
+ *         free(self.root_live)
+ *         free(self.root_slot)             # <<<<<<<<<<<<<<
+ *         free(self.is_array_init)
+ * 
+*/
+  free(__pyx_v_self->root_slot);
+
+  /* "sonolus/backend/_opt/analysis.pyx":155
+ *         free(self.root_live)
+ *         free(self.root_slot)
+ *         free(self.is_array_init)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _bitset_names(self, const uint64_t* bs):
+*/
+  free(__pyx_v_self->is_array_init);
+
+  /* "sonolus/backend/_opt/analysis.pyx":148
+ *         self.is_array_init = NULL
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.live_in)
+ *         free(self.live_out)
+*/
+
+  /* function exit code */
+
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":157
+ *         free(self.is_array_init)
+ * 
+ *     cdef object _bitset_names(self, const uint64_t* bs):             # <<<<<<<<<<<<<<
+ *         cdef Func f = self.func
+ *         cdef set out = set()
+*/
+
+static PyObject *__pyx_f_7sonolus_7backend_4_opt_8analysis_8Liveness__bitset_names(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self, uint64_t const *__pyx_v_bs) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_f = 0;
+  PyObject *__pyx_v_out = 0;
+  int32_t __pyx_v_t;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_bitset_names", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":158
+ * 
+ *     cdef object _bitset_names(self, const uint64_t* bs):
+ *         cdef Func f = self.func             # <<<<<<<<<<<<<<
+ *         cdef set out = set()
+ *         cdef int32_t t
+*/
+  __pyx_t_1 = ((PyObject *)__pyx_v_self->func);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_f = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":159
+ *     cdef object _bitset_names(self, const uint64_t* bs):
+ *         cdef Func f = self.func
+ *         cdef set out = set()             # <<<<<<<<<<<<<<
+ *         cdef int32_t t
+ *         for t in range(self.n_temps):
+*/
+  __pyx_t_1 = PySet_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_out = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":161
+ *         cdef set out = set()
+ *         cdef int32_t t
+ *         for t in range(self.n_temps):             # <<<<<<<<<<<<<<
+ *             if bs_get(bs, t):
+ *                 out.add(f.names[f.temps[t].name_id])
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_temps;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_t = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":162
+ *         cdef int32_t t
+ *         for t in range(self.n_temps):
+ *             if bs_get(bs, t):             # <<<<<<<<<<<<<<
+ *                 out.add(f.names[f.temps[t].name_id])
+ *         return out
+*/
+    __pyx_t_5 = __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get(__pyx_v_bs, __pyx_v_t);
+
+    if (__pyx_t_5) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":163
+ *         for t in range(self.n_temps):
+ *             if bs_get(bs, t):
+ *                 out.add(f.names[f.temps[t].name_id])             # <<<<<<<<<<<<<<
+ *         return out
+ * 
+*/
+      if (unlikely(__pyx_v_f->names == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+        __PYX_ERR(0, 163, __pyx_L1_error)
+      }
+      __pyx_t_1 = __Pyx_PyList_GET_ITEM(__pyx_v_f->names, (__pyx_v_f->temps[__pyx_v_t]).name_id);
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_t_6 = PySet_Add(__pyx_v_out, __pyx_t_1); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 163, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":162
+ *         cdef int32_t t
+ *         for t in range(self.n_temps):
+ *             if bs_get(bs, t):             # <<<<<<<<<<<<<<
+ *                 out.add(f.names[f.temps[t].name_id])
+ *         return out
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":164
+ *             if bs_get(bs, t):
+ *                 out.add(f.names[f.temps[t].name_id])
+ *         return out             # <<<<<<<<<<<<<<
+ * 
+ *     # --- python debug accessors -------------------------------------------
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_out);
+      __pyx_r = __pyx_v_out;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":157
+ *         free(self.is_array_init)
+ * 
+ *     cdef object _bitset_names(self, const uint64_t* bs):             # <<<<<<<<<<<<<<
+ *         cdef Func f = self.func
+ *         cdef set out = set()
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Liveness._bitset_names", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_f);
+  __Pyx_XDECREF(__pyx_v_out);
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":168
+ *     # --- python debug accessors -------------------------------------------
+ * 
+ *     def live_in_names(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_5live_in_names(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_5live_in_names = {"live_in_names", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_5live_in_names, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_5live_in_names(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("live_in_names (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("live_in_names", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("live_in_names", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_4live_in_names(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_4live_in_names(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self) {
+  PyObject *__pyx_v_d = 0;
+  int32_t __pyx_v_b;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("live_in_names", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":169
+ * 
+ *     def live_in_names(self):
+ *         cdef dict d = {}             # <<<<<<<<<<<<<<
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_d = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":171
+ *         cdef dict d = {}
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):             # <<<<<<<<<<<<<<
+ *             d[b] = self._bitset_names(&self.live_in[<int64_t>b * self.n_words])
+ *         return d
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_blocks;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_b = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":172
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+ *             d[b] = self._bitset_names(&self.live_in[<int64_t>b * self.n_words])             # <<<<<<<<<<<<<<
+ *         return d
+ * 
+*/
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self->__pyx_vtab)->_bitset_names(__pyx_v_self, (&(__pyx_v_self->live_in[(((int64_t)__pyx_v_b) * __pyx_v_self->n_words)]))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyLong_From_int32_t(__pyx_v_b); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 172, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (unlikely((PyDict_SetItem(__pyx_v_d, __pyx_t_5, __pyx_t_1) < 0))) __PYX_ERR(0, 172, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":173
+ *         for b in range(self.n_blocks):
+ *             d[b] = self._bitset_names(&self.live_in[<int64_t>b * self.n_words])
+ *         return d             # <<<<<<<<<<<<<<
+ * 
+ *     def live_out_names(self):
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_d);
+      __pyx_r = __pyx_v_d;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":168
+ *     # --- python debug accessors -------------------------------------------
+ * 
+ *     def live_in_names(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Liveness.live_in_names", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_d);
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":175
+ *         return d
+ * 
+ *     def live_out_names(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_7live_out_names(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_7live_out_names = {"live_out_names", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_7live_out_names, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_7live_out_names(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("live_out_names (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("live_out_names", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("live_out_names", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_6live_out_names(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_6live_out_names(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self) {
+  PyObject *__pyx_v_d = 0;
+  int32_t __pyx_v_b;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("live_out_names", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":176
+ * 
+ *     def live_out_names(self):
+ *         cdef dict d = {}             # <<<<<<<<<<<<<<
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_d = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":178
+ *         cdef dict d = {}
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):             # <<<<<<<<<<<<<<
+ *             d[b] = self._bitset_names(&self.live_out[<int64_t>b * self.n_words])
+ *         return d
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_blocks;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_b = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":179
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+ *             d[b] = self._bitset_names(&self.live_out[<int64_t>b * self.n_words])             # <<<<<<<<<<<<<<
+ *         return d
+ * 
+*/
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self->__pyx_vtab)->_bitset_names(__pyx_v_self, (&(__pyx_v_self->live_out[(((int64_t)__pyx_v_b) * __pyx_v_self->n_words)]))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyLong_From_int32_t(__pyx_v_b); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (unlikely((PyDict_SetItem(__pyx_v_d, __pyx_t_5, __pyx_t_1) < 0))) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":180
+ *         for b in range(self.n_blocks):
+ *             d[b] = self._bitset_names(&self.live_out[<int64_t>b * self.n_words])
+ *         return d             # <<<<<<<<<<<<<<
+ * 
+ *     def root_live_names(self):
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_d);
+      __pyx_r = __pyx_v_d;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":175
+ *         return d
+ * 
+ *     def live_out_names(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Liveness.live_out_names", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_d);
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":182
+ *         return d
+ * 
+ *     def root_live_names(self):             # <<<<<<<<<<<<<<
+ *         """Map each statement-root instr index to its live-out temp-name set."""
+ *         cdef dict d = {}
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_9root_live_names(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_7sonolus_7backend_4_opt_8analysis_8Liveness_8root_live_names, "Map each statement-root instr index to its live-out temp-name set.");
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_9root_live_names = {"root_live_names", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_9root_live_names, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7sonolus_7backend_4_opt_8analysis_8Liveness_8root_live_names};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_9root_live_names(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("root_live_names (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("root_live_names", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("root_live_names", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_8root_live_names(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_8root_live_names(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self) {
+  PyObject *__pyx_v_d = 0;
+  CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_f = 0;
+  int32_t __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("root_live_names", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":184
+ *     def root_live_names(self):
+ *         """Map each statement-root instr index to its live-out temp-name set."""
+ *         cdef dict d = {}             # <<<<<<<<<<<<<<
+ *         cdef Func f = self.func
+ *         cdef int32_t i
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_d = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":185
+ *         """Map each statement-root instr index to its live-out temp-name set."""
+ *         cdef dict d = {}
+ *         cdef Func f = self.func             # <<<<<<<<<<<<<<
+ *         cdef int32_t i
+ *         for i in range(self.n_instrs):
+*/
+  __pyx_t_1 = ((PyObject *)__pyx_v_self->func);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_f = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":187
+ *         cdef Func f = self.func
+ *         cdef int32_t i
+ *         for i in range(self.n_instrs):             # <<<<<<<<<<<<<<
+ *             if self.root_slot[i] >= 0:
+ *                 d[i] = self._bitset_names(&self.root_live[<int64_t>self.root_slot[i] * self.n_words])
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_instrs;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":188
+ *         cdef int32_t i
+ *         for i in range(self.n_instrs):
+ *             if self.root_slot[i] >= 0:             # <<<<<<<<<<<<<<
+ *                 d[i] = self._bitset_names(&self.root_live[<int64_t>self.root_slot[i] * self.n_words])
+ *         return d
+*/
+    __pyx_t_5 = ((__pyx_v_self->root_slot[__pyx_v_i]) >= 0);
+
+    if (__pyx_t_5) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":189
+ *         for i in range(self.n_instrs):
+ *             if self.root_slot[i] >= 0:
+ *                 d[i] = self._bitset_names(&self.root_live[<int64_t>self.root_slot[i] * self.n_words])             # <<<<<<<<<<<<<<
+ *         return d
+ * 
+*/
+      __pyx_t_1 = ((struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self->__pyx_vtab)->_bitset_names(__pyx_v_self, (&(__pyx_v_self->root_live[(((int64_t)(__pyx_v_self->root_slot[__pyx_v_i])) * __pyx_v_self->n_words)]))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 189, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_6 = __Pyx_PyLong_From_int32_t(__pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 189, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      if (unlikely((PyDict_SetItem(__pyx_v_d, __pyx_t_6, __pyx_t_1) < 0))) __PYX_ERR(0, 189, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "sonolus/backend/_opt/analysis.pyx":188
+ *         cdef int32_t i
+ *         for i in range(self.n_instrs):
+ *             if self.root_slot[i] >= 0:             # <<<<<<<<<<<<<<
+ *                 d[i] = self._bitset_names(&self.root_live[<int64_t>self.root_slot[i] * self.n_words])
+ *         return d
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":190
+ *             if self.root_slot[i] >= 0:
+ *                 d[i] = self._bitset_names(&self.root_live[<int64_t>self.root_slot[i] * self.n_words])
+ *         return d             # <<<<<<<<<<<<<<
+ * 
+ *     def array_defs_out_names(self):
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_d);
+      __pyx_r = __pyx_v_d;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":182
+ *         return d
+ * 
+ *     def root_live_names(self):             # <<<<<<<<<<<<<<
+ *         """Map each statement-root instr index to its live-out temp-name set."""
+ *         cdef dict d = {}
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Liveness.root_live_names", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_d);
+  __Pyx_XDECREF((PyObject *)__pyx_v_f);
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":192
+ *         return d
+ * 
+ *     def array_defs_out_names(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_11array_defs_out_names(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_11array_defs_out_names = {"array_defs_out_names", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_11array_defs_out_names, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_11array_defs_out_names(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("array_defs_out_names (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("array_defs_out_names", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("array_defs_out_names", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_10array_defs_out_names(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_10array_defs_out_names(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self) {
+  PyObject *__pyx_v_d = 0;
+  int32_t __pyx_v_b;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("array_defs_out_names", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":193
+ * 
+ *     def array_defs_out_names(self):
+ *         cdef dict d = {}             # <<<<<<<<<<<<<<
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_d = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":195
+ *         cdef dict d = {}
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):             # <<<<<<<<<<<<<<
+ *             d[b] = self._bitset_names(&self.array_defs_out[<int64_t>b * self.n_words])
+ *         return d
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_blocks;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_b = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":196
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+ *             d[b] = self._bitset_names(&self.array_defs_out[<int64_t>b * self.n_words])             # <<<<<<<<<<<<<<
+ *         return d
+ * 
+*/
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self->__pyx_vtab)->_bitset_names(__pyx_v_self, (&(__pyx_v_self->array_defs_out[(((int64_t)__pyx_v_b) * __pyx_v_self->n_words)]))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyLong_From_int32_t(__pyx_v_b); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (unlikely((PyDict_SetItem(__pyx_v_d, __pyx_t_5, __pyx_t_1) < 0))) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":197
+ *         for b in range(self.n_blocks):
+ *             d[b] = self._bitset_names(&self.array_defs_out[<int64_t>b * self.n_words])
+ *         return d             # <<<<<<<<<<<<<<
+ * 
+ *     def is_array_init_map(self):
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_d);
+      __pyx_r = __pyx_v_d;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":192
+ *         return d
+ * 
+ *     def array_defs_out_names(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Liveness.array_defs_out_names", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_d);
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":199
+ *         return d
+ * 
+ *     def is_array_init_map(self):             # <<<<<<<<<<<<<<
+ *         """Map each array-target OPX_SET root instr index to its is_array_init bit."""
+ *         cdef dict d = {}
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_13is_array_init_map(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_7sonolus_7backend_4_opt_8analysis_8Liveness_12is_array_init_map, "Map each array-target OPX_SET root instr index to its is_array_init bit.");
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_13is_array_init_map = {"is_array_init_map", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_13is_array_init_map, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7sonolus_7backend_4_opt_8analysis_8Liveness_12is_array_init_map};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_13is_array_init_map(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_array_init_map (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("is_array_init_map", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("is_array_init_map", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_12is_array_init_map(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_12is_array_init_map(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self) {
+  PyObject *__pyx_v_d = 0;
+  struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_f = 0;
+  int32_t __pyx_v_i;
+  int32_t __pyx_v_pid;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  int __pyx_t_5;
+  int32_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("is_array_init_map", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":201
+ *     def is_array_init_map(self):
+ *         """Map each array-target OPX_SET root instr index to its is_array_init bit."""
+ *         cdef dict d = {}             # <<<<<<<<<<<<<<
+ *         cdef Func f = self.func
+ *         cdef int32_t i, pid
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 201, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_d = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":202
+ *         """Map each array-target OPX_SET root instr index to its is_array_init bit."""
+ *         cdef dict d = {}
+ *         cdef Func f = self.func             # <<<<<<<<<<<<<<
+ *         cdef int32_t i, pid
+ *         for i in range(self.n_instrs):
+*/
+  __pyx_t_1 = ((PyObject *)__pyx_v_self->func);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_f = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":204
+ *         cdef Func f = self.func
+ *         cdef int32_t i, pid
+ *         for i in range(self.n_instrs):             # <<<<<<<<<<<<<<
+ *             if self.root_slot[i] < 0:
+ *                 continue
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_instrs;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":205
+ *         cdef int32_t i, pid
+ *         for i in range(self.n_instrs):
+ *             if self.root_slot[i] < 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             if f.instrs[i].op != OPX_SET:
+*/
+    __pyx_t_5 = ((__pyx_v_self->root_slot[__pyx_v_i]) < 0);
+
+    if (__pyx_t_5) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":206
+ *         for i in range(self.n_instrs):
+ *             if self.root_slot[i] < 0:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             if f.instrs[i].op != OPX_SET:
+ *                 continue
+*/
+      goto __pyx_L3_continue;
+
+      /* "sonolus/backend/_opt/analysis.pyx":205
+ *         cdef int32_t i, pid
+ *         for i in range(self.n_instrs):
+ *             if self.root_slot[i] < 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             if f.instrs[i].op != OPX_SET:
+*/
+    }
+
+    /* "sonolus/backend/_opt/analysis.pyx":207
+ *             if self.root_slot[i] < 0:
+ *                 continue
+ *             if f.instrs[i].op != OPX_SET:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             pid = f.instrs[i].aux
+*/
+    __pyx_t_5 = ((__pyx_v_f->instrs[__pyx_v_i]).op != __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_SET);
+
+    if (__pyx_t_5) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":208
+ *                 continue
+ *             if f.instrs[i].op != OPX_SET:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             pid = f.instrs[i].aux
+ *             if f.places[pid].kind == PLACE_TEMP_ARRAY:
+*/
+      goto __pyx_L3_continue;
+
+      /* "sonolus/backend/_opt/analysis.pyx":207
+ *             if self.root_slot[i] < 0:
+ *                 continue
+ *             if f.instrs[i].op != OPX_SET:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             pid = f.instrs[i].aux
+*/
+    }
+
+    /* "sonolus/backend/_opt/analysis.pyx":209
+ *             if f.instrs[i].op != OPX_SET:
+ *                 continue
+ *             pid = f.instrs[i].aux             # <<<<<<<<<<<<<<
+ *             if f.places[pid].kind == PLACE_TEMP_ARRAY:
+ *                 d[i] = bool(self.is_array_init[i])
+*/
+    __pyx_t_6 = (__pyx_v_f->instrs[__pyx_v_i]).aux;
+
+    __pyx_v_pid = __pyx_t_6;
+
+    /* "sonolus/backend/_opt/analysis.pyx":210
+ *                 continue
+ *             pid = f.instrs[i].aux
+ *             if f.places[pid].kind == PLACE_TEMP_ARRAY:             # <<<<<<<<<<<<<<
+ *                 d[i] = bool(self.is_array_init[i])
+ *         return d
+*/
+    __pyx_t_5 = ((__pyx_v_f->places[__pyx_v_pid]).kind == __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_ARRAY);
+
+    if (__pyx_t_5) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":211
+ *             pid = f.instrs[i].aux
+ *             if f.places[pid].kind == PLACE_TEMP_ARRAY:
+ *                 d[i] = bool(self.is_array_init[i])             # <<<<<<<<<<<<<<
+ *         return d
+ * 
+*/
+      __pyx_t_1 = __Pyx_PyBool_FromLong((!(!((__pyx_v_self->is_array_init[__pyx_v_i]) != 0)))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 211, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_7 = __Pyx_PyLong_From_int32_t(__pyx_v_i); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 211, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (unlikely((PyDict_SetItem(__pyx_v_d, __pyx_t_7, __pyx_t_1) < 0))) __PYX_ERR(0, 211, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "sonolus/backend/_opt/analysis.pyx":210
+ *                 continue
+ *             pid = f.instrs[i].aux
+ *             if f.places[pid].kind == PLACE_TEMP_ARRAY:             # <<<<<<<<<<<<<<
+ *                 d[i] = bool(self.is_array_init[i])
+ *         return d
+*/
+    }
+    __pyx_L3_continue:;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":212
+ *             if f.places[pid].kind == PLACE_TEMP_ARRAY:
+ *                 d[i] = bool(self.is_array_init[i])
+ *         return d             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_d);
+      __pyx_r = __pyx_v_d;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":199
+ *         return d
+ * 
+ *     def is_array_init_map(self):             # <<<<<<<<<<<<<<
+ *         """Map each array-target OPX_SET root instr index to its is_array_init bit."""
+ *         cdef dict d = {}
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Liveness.is_array_init_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_d);
+  __Pyx_XDECREF((PyObject *)__pyx_v_f);
+
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_15__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_15__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_15__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_15__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__reduce_cython__", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_14__reduce_cython__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_14__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Liveness.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_17__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_17__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_17__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_17__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  CYTHON_UNUSED PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(1, 3, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__setstate_cython__", 0) < (0)) __PYX_ERR(1, 3, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, i); __PYX_ERR(1, 3, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+    }
+    __pyx_v___pyx_state = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 3, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Liveness.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_16__setstate_cython__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_v_self), __pyx_v___pyx_state);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_8Liveness_16__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Liveness.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":219
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef Liveness compute_liveness(Func func):             # <<<<<<<<<<<<<<
+ *     cdef Liveness L = Liveness()
+ *     L.func = func
+*/
+
+static struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_liveness(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_func) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_L = 0;
+  int32_t __pyx_v_n_temps;
+  int32_t __pyx_v_nb;
+  int32_t __pyx_v_ni;
+  int32_t __pyx_v_ne;
+  int32_t __pyx_v_nw;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_Instr *__pyx_v_instrs;
+  uint32_t *__pyx_v_args;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_PlaceInfo *__pyx_v_places;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_BlockInfo *__pyx_v_blocks;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_Edge *__pyx_v_edges;
+  int32_t __pyx_v_i;
+  int32_t __pyx_v_b;
+  int32_t __pyx_v_t;
+  int32_t __pyx_v_e;
+  int32_t __pyx_v_w;
+  int32_t __pyx_v_n_roots;
+  int __pyx_v_has_exit;
+  uint64_t *__pyx_v_array_written;
+  int32_t *__pyx_v_pred_head;
+  int32_t *__pyx_v_pred_src;
+  int32_t *__pyx_v_cursor;
+  uint64_t *__pyx_v_array_defs_in;
+  uint64_t *__pyx_v_acc;
+  uint64_t *__pyx_v_live;
+  uint8_t *__pyx_v_visited;
+  uint8_t *__pyx_v_inq;
+  int32_t *__pyx_v_stack;
+  int32_t __pyx_v_aw_pid;
+  int32_t __pyx_v_sp;
+  int32_t __pyx_v_istart;
+  int32_t __pyx_v_icount;
+  int32_t __pyx_v_s;
+  int32_t __pyx_v_vid;
+  int32_t __pyx_v_pid;
+  int32_t __pyx_v_dt;
+  int32_t __pyx_v_adt;
+  int32_t __pyx_v_tv;
+  int32_t __pyx_v_rs;
+  uint16_t __pyx_v_op;
+  uint8_t __pyx_v_kind;
+  uint8_t __pyx_v_side_eff;
+  int __pyx_v_can_skip;
+  int __pyx_v_has_defs;
+  int __pyx_v_dlive;
+  int __pyx_v_changed;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  size_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_Instr *__pyx_t_5;
+  uint32_t *__pyx_t_6;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_PlaceInfo *__pyx_t_7;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_BlockInfo *__pyx_t_8;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_Edge *__pyx_t_9;
+  long __pyx_t_10;
+  int __pyx_t_11;
+  int32_t __pyx_t_12;
+  int32_t __pyx_t_13;
+  uint64_t *__pyx_t_14;
+  int __pyx_t_15;
+  int64_t __pyx_t_16;
+  int32_t __pyx_t_17;
+  long __pyx_t_18;
+  uint16_t __pyx_t_19;
+  uint8_t __pyx_t_20;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("compute_liveness", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":220
+ * 
+ * cdef Liveness compute_liveness(Func func):
+ *     cdef Liveness L = Liveness()             # <<<<<<<<<<<<<<
+ *     L.func = func
+ * 
+*/
+  __pyx_t_2 = NULL;
+  __pyx_t_3 = 1;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness, __pyx_callargs+__pyx_t_3, (1-__pyx_t_3) | (__pyx_t_3*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 220, __pyx_L1_error)
+    __Pyx_GOTREF((PyObject *)__pyx_t_1);
+  }
+  __pyx_v_L = ((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":221
+ * cdef Liveness compute_liveness(Func func):
+ *     cdef Liveness L = Liveness()
+ *     L.func = func             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int32_t n_temps = func.n_temps
+*/
+  __Pyx_INCREF((PyObject *)__pyx_v_func);
+  __Pyx_GIVEREF((PyObject *)__pyx_v_func);
+  __Pyx_GOTREF((PyObject *)__pyx_v_L->func);
+  __Pyx_DECREF((PyObject *)__pyx_v_L->func);
+  __pyx_v_L->func = __pyx_v_func;
+
+  /* "sonolus/backend/_opt/analysis.pyx":223
+ *     L.func = func
+ * 
+ *     cdef int32_t n_temps = func.n_temps             # <<<<<<<<<<<<<<
+ *     cdef int32_t nb = func.n_blocks
+ *     cdef int32_t ni = func.n_instrs
+*/
+  __pyx_t_4 = __pyx_v_func->n_temps;
+
+  __pyx_v_n_temps = __pyx_t_4;
+
+  /* "sonolus/backend/_opt/analysis.pyx":224
+ * 
+ *     cdef int32_t n_temps = func.n_temps
+ *     cdef int32_t nb = func.n_blocks             # <<<<<<<<<<<<<<
+ *     cdef int32_t ni = func.n_instrs
+ *     cdef int32_t ne = func.n_edges
+*/
+  __pyx_t_4 = __pyx_v_func->n_blocks;
+
+  __pyx_v_nb = __pyx_t_4;
+
+  /* "sonolus/backend/_opt/analysis.pyx":225
+ *     cdef int32_t n_temps = func.n_temps
+ *     cdef int32_t nb = func.n_blocks
+ *     cdef int32_t ni = func.n_instrs             # <<<<<<<<<<<<<<
+ *     cdef int32_t ne = func.n_edges
+ *     cdef int32_t nw = (n_temps + 63) >> 6
+*/
+  __pyx_t_4 = __pyx_v_func->n_instrs;
+
+  __pyx_v_ni = __pyx_t_4;
+
+  /* "sonolus/backend/_opt/analysis.pyx":226
+ *     cdef int32_t nb = func.n_blocks
+ *     cdef int32_t ni = func.n_instrs
+ *     cdef int32_t ne = func.n_edges             # <<<<<<<<<<<<<<
+ *     cdef int32_t nw = (n_temps + 63) >> 6
+ *     L.n_temps = n_temps
+*/
+  __pyx_t_4 = __pyx_v_func->n_edges;
+
+  __pyx_v_ne = __pyx_t_4;
+
+  /* "sonolus/backend/_opt/analysis.pyx":227
+ *     cdef int32_t ni = func.n_instrs
+ *     cdef int32_t ne = func.n_edges
+ *     cdef int32_t nw = (n_temps + 63) >> 6             # <<<<<<<<<<<<<<
+ *     L.n_temps = n_temps
+ *     L.n_blocks = nb
+*/
+  __pyx_v_nw = ((__pyx_v_n_temps + 63) >> 6);
+
+  /* "sonolus/backend/_opt/analysis.pyx":228
+ *     cdef int32_t ne = func.n_edges
+ *     cdef int32_t nw = (n_temps + 63) >> 6
+ *     L.n_temps = n_temps             # <<<<<<<<<<<<<<
+ *     L.n_blocks = nb
+ *     L.n_instrs = ni
+*/
+  __pyx_v_L->n_temps = __pyx_v_n_temps;
+
+  /* "sonolus/backend/_opt/analysis.pyx":229
+ *     cdef int32_t nw = (n_temps + 63) >> 6
+ *     L.n_temps = n_temps
+ *     L.n_blocks = nb             # <<<<<<<<<<<<<<
+ *     L.n_instrs = ni
+ *     L.n_words = nw
+*/
+  __pyx_v_L->n_blocks = __pyx_v_nb;
+
+  /* "sonolus/backend/_opt/analysis.pyx":230
+ *     L.n_temps = n_temps
+ *     L.n_blocks = nb
+ *     L.n_instrs = ni             # <<<<<<<<<<<<<<
+ *     L.n_words = nw
+ * 
+*/
+  __pyx_v_L->n_instrs = __pyx_v_ni;
+
+  /* "sonolus/backend/_opt/analysis.pyx":231
+ *     L.n_blocks = nb
+ *     L.n_instrs = ni
+ *     L.n_words = nw             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Instr* instrs = func.instrs
+*/
+  __pyx_v_L->n_words = __pyx_v_nw;
+
+  /* "sonolus/backend/_opt/analysis.pyx":233
+ *     L.n_words = nw
+ * 
+ *     cdef Instr* instrs = func.instrs             # <<<<<<<<<<<<<<
+ *     cdef uint32_t* args = func.args
+ *     cdef PlaceInfo* places = func.places
+*/
+  __pyx_t_5 = __pyx_v_func->instrs;
+
+  __pyx_v_instrs = __pyx_t_5;
+
+  /* "sonolus/backend/_opt/analysis.pyx":234
+ * 
+ *     cdef Instr* instrs = func.instrs
+ *     cdef uint32_t* args = func.args             # <<<<<<<<<<<<<<
+ *     cdef PlaceInfo* places = func.places
+ *     cdef BlockInfo* blocks = func.blocks
+*/
+  __pyx_t_6 = __pyx_v_func->args;
+
+  __pyx_v_args = __pyx_t_6;
+
+  /* "sonolus/backend/_opt/analysis.pyx":235
+ *     cdef Instr* instrs = func.instrs
+ *     cdef uint32_t* args = func.args
+ *     cdef PlaceInfo* places = func.places             # <<<<<<<<<<<<<<
+ *     cdef BlockInfo* blocks = func.blocks
+ *     cdef Edge* edges = func.edges
+*/
+  __pyx_t_7 = __pyx_v_func->places;
+
+  __pyx_v_places = __pyx_t_7;
+
+  /* "sonolus/backend/_opt/analysis.pyx":236
+ *     cdef uint32_t* args = func.args
+ *     cdef PlaceInfo* places = func.places
+ *     cdef BlockInfo* blocks = func.blocks             # <<<<<<<<<<<<<<
+ *     cdef Edge* edges = func.edges
+ * 
+*/
+  __pyx_t_8 = __pyx_v_func->blocks;
+
+  __pyx_v_blocks = __pyx_t_8;
+
+  /* "sonolus/backend/_opt/analysis.pyx":237
+ *     cdef PlaceInfo* places = func.places
+ *     cdef BlockInfo* blocks = func.blocks
+ *     cdef Edge* edges = func.edges             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int32_t i, b, t, e, w
+*/
+  __pyx_t_9 = __pyx_v_func->edges;
+
+  __pyx_v_edges = __pyx_t_9;
+
+  /* "sonolus/backend/_opt/analysis.pyx":242
+ * 
+ *     # Root slots.
+ *     L.root_slot = <int32_t*>malloc(<size_t>(ni if ni > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     if L.root_slot == NULL:
+ *         raise MemoryError()
+*/
+  __pyx_t_11 = (__pyx_v_ni > 0);
+
+  if (__pyx_t_11) {
+
+    __pyx_t_10 = __pyx_v_ni;
+  } else {
+
+    __pyx_t_10 = 1;
+  }
+
+  __pyx_v_L->root_slot = ((int32_t *)malloc((((size_t)__pyx_t_10) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":243
+ *     # Root slots.
+ *     L.root_slot = <int32_t*>malloc(<size_t>(ni if ni > 0 else 1) * sizeof(int32_t))
+ *     if L.root_slot == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     cdef int32_t n_roots = 0
+*/
+  __pyx_t_11 = (__pyx_v_L->root_slot == NULL);
+
+  if (unlikely(__pyx_t_11)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":244
+ *     L.root_slot = <int32_t*>malloc(<size_t>(ni if ni > 0 else 1) * sizeof(int32_t))
+ *     if L.root_slot == NULL:
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     cdef int32_t n_roots = 0
+ *     for i in range(ni):
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 244, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":243
+ *     # Root slots.
+ *     L.root_slot = <int32_t*>malloc(<size_t>(ni if ni > 0 else 1) * sizeof(int32_t))
+ *     if L.root_slot == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     cdef int32_t n_roots = 0
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":245
+ *     if L.root_slot == NULL:
+ *         raise MemoryError()
+ *     cdef int32_t n_roots = 0             # <<<<<<<<<<<<<<
+ *     for i in range(ni):
+ *         if instrs[i].flags & FLAG_STMT_ROOT:
+*/
+  __pyx_v_n_roots = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":246
+ *         raise MemoryError()
+ *     cdef int32_t n_roots = 0
+ *     for i in range(ni):             # <<<<<<<<<<<<<<
+ *         if instrs[i].flags & FLAG_STMT_ROOT:
+ *             L.root_slot[i] = n_roots
+*/
+
+  __pyx_t_4 = __pyx_v_ni;
+  __pyx_t_12 = __pyx_t_4;
+
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_i = __pyx_t_13;
+
+    /* "sonolus/backend/_opt/analysis.pyx":247
+ *     cdef int32_t n_roots = 0
+ *     for i in range(ni):
+ *         if instrs[i].flags & FLAG_STMT_ROOT:             # <<<<<<<<<<<<<<
+ *             L.root_slot[i] = n_roots
+ *             n_roots += 1
+*/
+    __pyx_t_11 = (((__pyx_v_instrs[__pyx_v_i]).flags & __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_STMT_ROOT) != 0);
+
+    if (__pyx_t_11) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":248
+ *     for i in range(ni):
+ *         if instrs[i].flags & FLAG_STMT_ROOT:
+ *             L.root_slot[i] = n_roots             # <<<<<<<<<<<<<<
+ *             n_roots += 1
+ *         else:
+*/
+      (__pyx_v_L->root_slot[__pyx_v_i]) = __pyx_v_n_roots;
+
+      /* "sonolus/backend/_opt/analysis.pyx":249
+ *         if instrs[i].flags & FLAG_STMT_ROOT:
+ *             L.root_slot[i] = n_roots
+ *             n_roots += 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             L.root_slot[i] = -1
+*/
+      __pyx_v_n_roots = (__pyx_v_n_roots + 1);
+
+      /* "sonolus/backend/_opt/analysis.pyx":247
+ *     cdef int32_t n_roots = 0
+ *     for i in range(ni):
+ *         if instrs[i].flags & FLAG_STMT_ROOT:             # <<<<<<<<<<<<<<
+ *             L.root_slot[i] = n_roots
+ *             n_roots += 1
+*/
+      goto __pyx_L6;
+    }
+
+    /* "sonolus/backend/_opt/analysis.pyx":251
+ *             n_roots += 1
+ *         else:
+ *             L.root_slot[i] = -1             # <<<<<<<<<<<<<<
+ *     L.n_roots = n_roots
+ * 
+*/
+    /*else*/ {
+      (__pyx_v_L->root_slot[__pyx_v_i]) = -1;
+    }
+    __pyx_L6:;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":252
+ *         else:
+ *             L.root_slot[i] = -1
+ *     L.n_roots = n_roots             # <<<<<<<<<<<<<<
+ * 
+ *     L.live_in = _c64(<int64_t>nb * nw)
+*/
+  __pyx_v_L->n_roots = __pyx_v_n_roots;
+
+  /* "sonolus/backend/_opt/analysis.pyx":254
+ *     L.n_roots = n_roots
+ * 
+ *     L.live_in = _c64(<int64_t>nb * nw)             # <<<<<<<<<<<<<<
+ *     L.live_out = _c64(<int64_t>nb * nw)
+ *     L.array_defs_out = _c64(<int64_t>nb * nw)
+*/
+  __pyx_t_14 = __pyx_f_7sonolus_7backend_4_opt_8analysis__c64((((int64_t)__pyx_v_nb) * __pyx_v_nw)); if (unlikely(__pyx_t_14 == ((void *)NULL))) __PYX_ERR(0, 254, __pyx_L1_error)
+  __pyx_v_L->live_in = __pyx_t_14;
+
+  /* "sonolus/backend/_opt/analysis.pyx":255
+ * 
+ *     L.live_in = _c64(<int64_t>nb * nw)
+ *     L.live_out = _c64(<int64_t>nb * nw)             # <<<<<<<<<<<<<<
+ *     L.array_defs_out = _c64(<int64_t>nb * nw)
+ *     L.array_mask = _c64(nw)
+*/
+  __pyx_t_14 = __pyx_f_7sonolus_7backend_4_opt_8analysis__c64((((int64_t)__pyx_v_nb) * __pyx_v_nw)); if (unlikely(__pyx_t_14 == ((void *)NULL))) __PYX_ERR(0, 255, __pyx_L1_error)
+  __pyx_v_L->live_out = __pyx_t_14;
+
+  /* "sonolus/backend/_opt/analysis.pyx":256
+ *     L.live_in = _c64(<int64_t>nb * nw)
+ *     L.live_out = _c64(<int64_t>nb * nw)
+ *     L.array_defs_out = _c64(<int64_t>nb * nw)             # <<<<<<<<<<<<<<
+ *     L.array_mask = _c64(nw)
+ *     L.root_live = _c64(<int64_t>n_roots * nw)
+*/
+  __pyx_t_14 = __pyx_f_7sonolus_7backend_4_opt_8analysis__c64((((int64_t)__pyx_v_nb) * __pyx_v_nw)); if (unlikely(__pyx_t_14 == ((void *)NULL))) __PYX_ERR(0, 256, __pyx_L1_error)
+  __pyx_v_L->array_defs_out = __pyx_t_14;
+
+  /* "sonolus/backend/_opt/analysis.pyx":257
+ *     L.live_out = _c64(<int64_t>nb * nw)
+ *     L.array_defs_out = _c64(<int64_t>nb * nw)
+ *     L.array_mask = _c64(nw)             # <<<<<<<<<<<<<<
+ *     L.root_live = _c64(<int64_t>n_roots * nw)
+ *     L.is_array_init = <uint8_t*>calloc(<size_t>(ni if ni > 0 else 1), sizeof(uint8_t))
+*/
+  __pyx_t_14 = __pyx_f_7sonolus_7backend_4_opt_8analysis__c64(__pyx_v_nw); if (unlikely(__pyx_t_14 == ((void *)NULL))) __PYX_ERR(0, 257, __pyx_L1_error)
+  __pyx_v_L->array_mask = __pyx_t_14;
+
+  /* "sonolus/backend/_opt/analysis.pyx":258
+ *     L.array_defs_out = _c64(<int64_t>nb * nw)
+ *     L.array_mask = _c64(nw)
+ *     L.root_live = _c64(<int64_t>n_roots * nw)             # <<<<<<<<<<<<<<
+ *     L.is_array_init = <uint8_t*>calloc(<size_t>(ni if ni > 0 else 1), sizeof(uint8_t))
+ *     if L.is_array_init == NULL:
+*/
+  __pyx_t_14 = __pyx_f_7sonolus_7backend_4_opt_8analysis__c64((((int64_t)__pyx_v_n_roots) * __pyx_v_nw)); if (unlikely(__pyx_t_14 == ((void *)NULL))) __PYX_ERR(0, 258, __pyx_L1_error)
+  __pyx_v_L->root_live = __pyx_t_14;
+
+  /* "sonolus/backend/_opt/analysis.pyx":259
+ *     L.array_mask = _c64(nw)
+ *     L.root_live = _c64(<int64_t>n_roots * nw)
+ *     L.is_array_init = <uint8_t*>calloc(<size_t>(ni if ni > 0 else 1), sizeof(uint8_t))             # <<<<<<<<<<<<<<
+ *     if L.is_array_init == NULL:
+ *         raise MemoryError()
+*/
+  __pyx_t_11 = (__pyx_v_ni > 0);
+
+  if (__pyx_t_11) {
+
+    __pyx_t_10 = __pyx_v_ni;
+  } else {
+
+    __pyx_t_10 = 1;
+  }
+
+  __pyx_v_L->is_array_init = ((uint8_t *)calloc(((size_t)__pyx_t_10), (sizeof(uint8_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":260
+ *     L.root_live = _c64(<int64_t>n_roots * nw)
+ *     L.is_array_init = <uint8_t*>calloc(<size_t>(ni if ni > 0 else 1), sizeof(uint8_t))
+ *     if L.is_array_init == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+*/
+  __pyx_t_11 = (__pyx_v_L->is_array_init == NULL);
+
+  if (unlikely(__pyx_t_11)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":261
+ *     L.is_array_init = <uint8_t*>calloc(<size_t>(ni if ni > 0 else 1), sizeof(uint8_t))
+ *     if L.is_array_init == NULL:
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     # array_mask: temps with size > 1.
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 261, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":260
+ *     L.root_live = _c64(<int64_t>n_roots * nw)
+ *     L.is_array_init = <uint8_t*>calloc(<size_t>(ni if ni > 0 else 1), sizeof(uint8_t))
+ *     if L.is_array_init == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":264
+ * 
+ *     # array_mask: temps with size > 1.
+ *     for t in range(n_temps):             # <<<<<<<<<<<<<<
+ *         if func.temps[t].size > 1:
+ *             bs_set(L.array_mask, t)
+*/
+
+  __pyx_t_4 = __pyx_v_n_temps;
+  __pyx_t_12 = __pyx_t_4;
+
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_t = __pyx_t_13;
+
+    /* "sonolus/backend/_opt/analysis.pyx":265
+ *     # array_mask: temps with size > 1.
+ *     for t in range(n_temps):
+ *         if func.temps[t].size > 1:             # <<<<<<<<<<<<<<
+ *             bs_set(L.array_mask, t)
+ * 
+*/
+    __pyx_t_11 = ((__pyx_v_func->temps[__pyx_v_t]).size > 1);
+
+    if (__pyx_t_11) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":266
+ *     for t in range(n_temps):
+ *         if func.temps[t].size > 1:
+ *             bs_set(L.array_mask, t)             # <<<<<<<<<<<<<<
+ * 
+ *     # A CFG with no exit block at all (whole-callback `while True` with no break,
+*/
+      __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_set(__pyx_v_L->array_mask, __pyx_v_t);
+
+      /* "sonolus/backend/_opt/analysis.pyx":265
+ *     # array_mask: temps with size > 1.
+ *     for t in range(n_temps):
+ *         if func.temps[t].size > 1:             # <<<<<<<<<<<<<<
+ *             bs_set(L.array_mask, t)
+ * 
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":273
+ *     # for it regardless; this is a policy rejection, done before any raw allocation
+ *     # so the raise cannot leak.
+ *     cdef bint has_exit = False             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         if blocks[b].edge_count == 0:
+*/
+  __pyx_v_has_exit = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":274
+ *     # so the raise cannot leak.
+ *     cdef bint has_exit = False
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         if blocks[b].edge_count == 0:
+ *             has_exit = True
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_12 = __pyx_t_4;
+
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_b = __pyx_t_13;
+
+    /* "sonolus/backend/_opt/analysis.pyx":275
+ *     cdef bint has_exit = False
+ *     for b in range(nb):
+ *         if blocks[b].edge_count == 0:             # <<<<<<<<<<<<<<
+ *             has_exit = True
+ *             break
+*/
+    __pyx_t_11 = ((__pyx_v_blocks[__pyx_v_b]).edge_count == 0);
+
+    if (__pyx_t_11) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":276
+ *     for b in range(nb):
+ *         if blocks[b].edge_count == 0:
+ *             has_exit = True             # <<<<<<<<<<<<<<
+ *             break
+ *     if nb > 0 and not has_exit:
+*/
+      __pyx_v_has_exit = 1;
+
+      /* "sonolus/backend/_opt/analysis.pyx":277
+ *         if blocks[b].edge_count == 0:
+ *             has_exit = True
+ *             break             # <<<<<<<<<<<<<<
+ *     if nb > 0 and not has_exit:
+ *         raise ValueError("Infinite loop detected")
+*/
+      goto __pyx_L12_break;
+
+      /* "sonolus/backend/_opt/analysis.pyx":275
+ *     cdef bint has_exit = False
+ *     for b in range(nb):
+ *         if blocks[b].edge_count == 0:             # <<<<<<<<<<<<<<
+ *             has_exit = True
+ *             break
+*/
+    }
+  }
+  __pyx_L12_break:;
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":278
+ *             has_exit = True
+ *             break
+ *     if nb > 0 and not has_exit:             # <<<<<<<<<<<<<<
+ *         raise ValueError("Infinite loop detected")
+ * 
+*/
+  __pyx_t_15 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L15_bool_binop_done;
+  }
+  __pyx_t_15 = (!__pyx_v_has_exit);
+
+
+  __pyx_t_11 = __pyx_t_15;
+
+  __pyx_L15_bool_binop_done:;
+  if (unlikely(__pyx_t_11)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":279
+ *             break
+ *     if nb > 0 and not has_exit:
+ *         raise ValueError("Infinite loop detected")             # <<<<<<<<<<<<<<
+ * 
+ *     # All raw scratch buffers are allocated up front and checked for NULL in a
+*/
+    __pyx_t_2 = NULL;
+    __pyx_t_3 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_mstate_global->__pyx_kp_u_Infinite_loop_detected};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_3, (2-__pyx_t_3) | (__pyx_t_3*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 279, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 279, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":278
+ *             has_exit = True
+ *             break
+ *     if nb > 0 and not has_exit:             # <<<<<<<<<<<<<<
+ *         raise ValueError("Infinite loop detected")
+ * 
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":286
+ *     # and freed by __dealloc__; these raw locals are freed at the end (``cursor``
+ *     # is freed early once the CSR is built).
+ *     cdef uint64_t* array_written = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *     cdef int32_t* pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     cdef int32_t* pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+*/
+  __pyx_t_11 = (__pyx_v_nw > 0);
+
+  if (__pyx_t_11) {
+
+    __pyx_t_10 = __pyx_v_nw;
+  } else {
+
+    __pyx_t_10 = 1;
+  }
+
+  __pyx_v_array_written = ((uint64_t *)calloc(((size_t)__pyx_t_10), (sizeof(uint64_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":287
+ *     # is freed early once the CSR is built).
+ *     cdef uint64_t* array_written = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))
+ *     cdef int32_t* pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     cdef int32_t* pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+*/
+  __pyx_v_pred_head = ((int32_t *)calloc(((size_t)(__pyx_v_nb + 1)), (sizeof(int32_t))));
+
+  /* "sonolus/backend/_opt/analysis.pyx":288
+ *     cdef uint64_t* array_written = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))
+ *     cdef int32_t* pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     cdef int32_t* pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef uint64_t* array_defs_in = <uint64_t*>calloc(<size_t>(<int64_t>nb * nw if nb > 0 and nw > 0 else 1), sizeof(uint64_t))
+*/
+  __pyx_t_11 = (__pyx_v_ne > 0);
+
+  if (__pyx_t_11) {
+
+    __pyx_t_10 = __pyx_v_ne;
+  } else {
+
+    __pyx_t_10 = 1;
+  }
+
+  __pyx_v_pred_src = ((int32_t *)malloc((((size_t)__pyx_t_10) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":289
+ *     cdef int32_t* pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     cdef int32_t* pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     cdef uint64_t* array_defs_in = <uint64_t*>calloc(<size_t>(<int64_t>nb * nw if nb > 0 and nw > 0 else 1), sizeof(uint64_t))
+ *     cdef uint64_t* acc = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))
+*/
+  __pyx_t_11 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_11) {
+
+    __pyx_t_10 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_10 = 1;
+  }
+
+  __pyx_v_cursor = ((int32_t *)malloc((((size_t)__pyx_t_10) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":290
+ *     cdef int32_t* pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef uint64_t* array_defs_in = <uint64_t*>calloc(<size_t>(<int64_t>nb * nw if nb > 0 and nw > 0 else 1), sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *     cdef uint64_t* acc = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))
+ *     cdef uint64_t* live = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))
+*/
+  __pyx_t_15 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L17_bool_binop_done;
+  }
+  __pyx_t_15 = (__pyx_v_nw > 0);
+
+
+  __pyx_t_11 = __pyx_t_15;
+
+  __pyx_L17_bool_binop_done:;
+  if (__pyx_t_11) {
+
+    __pyx_t_16 = (((int64_t)__pyx_v_nb) * __pyx_v_nw);
+  } else {
+
+    __pyx_t_16 = 1;
+  }
+
+  __pyx_v_array_defs_in = ((uint64_t *)calloc(((size_t)__pyx_t_16), (sizeof(uint64_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":291
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef uint64_t* array_defs_in = <uint64_t*>calloc(<size_t>(<int64_t>nb * nw if nb > 0 and nw > 0 else 1), sizeof(uint64_t))
+ *     cdef uint64_t* acc = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *     cdef uint64_t* live = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))
+ *     cdef uint8_t* visited = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+*/
+  __pyx_t_11 = (__pyx_v_nw > 0);
+
+  if (__pyx_t_11) {
+
+    __pyx_t_10 = __pyx_v_nw;
+  } else {
+
+    __pyx_t_10 = 1;
+  }
+
+  __pyx_v_acc = ((uint64_t *)calloc(((size_t)__pyx_t_10), (sizeof(uint64_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":292
+ *     cdef uint64_t* array_defs_in = <uint64_t*>calloc(<size_t>(<int64_t>nb * nw if nb > 0 and nw > 0 else 1), sizeof(uint64_t))
+ *     cdef uint64_t* acc = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))
+ *     cdef uint64_t* live = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *     cdef uint8_t* visited = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     cdef uint8_t* inq = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+*/
+  __pyx_t_11 = (__pyx_v_nw > 0);
+
+  if (__pyx_t_11) {
+
+    __pyx_t_10 = __pyx_v_nw;
+  } else {
+
+    __pyx_t_10 = 1;
+  }
+
+  __pyx_v_live = ((uint64_t *)calloc(((size_t)__pyx_t_10), (sizeof(uint64_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":293
+ *     cdef uint64_t* acc = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))
+ *     cdef uint64_t* live = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))
+ *     cdef uint8_t* visited = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))             # <<<<<<<<<<<<<<
+ *     cdef uint8_t* inq = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+*/
+  __pyx_t_11 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_11) {
+
+    __pyx_t_10 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_10 = 1;
+  }
+
+  __pyx_v_visited = ((uint8_t *)calloc(((size_t)__pyx_t_10), (sizeof(uint8_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":294
+ *     cdef uint64_t* live = <uint64_t*>calloc(<size_t>(nw if nw > 0 else 1), sizeof(uint64_t))
+ *     cdef uint8_t* visited = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     cdef uint8_t* inq = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))             # <<<<<<<<<<<<<<
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if (array_written == NULL or pred_head == NULL or pred_src == NULL or cursor == NULL
+*/
+  __pyx_t_11 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_11) {
+
+    __pyx_t_10 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_10 = 1;
+  }
+
+  __pyx_v_inq = ((uint8_t *)calloc(((size_t)__pyx_t_10), (sizeof(uint8_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":295
+ *     cdef uint8_t* visited = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     cdef uint8_t* inq = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     if (array_written == NULL or pred_head == NULL or pred_src == NULL or cursor == NULL
+ *             or array_defs_in == NULL or acc == NULL or live == NULL
+*/
+  __pyx_t_11 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_11) {
+
+    __pyx_t_10 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_10 = 1;
+  }
+
+  __pyx_v_stack = ((int32_t *)malloc((((size_t)__pyx_t_10) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":296
+ *     cdef uint8_t* inq = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if (array_written == NULL or pred_head == NULL or pred_src == NULL or cursor == NULL             # <<<<<<<<<<<<<<
+ *             or array_defs_in == NULL or acc == NULL or live == NULL
+ *             or visited == NULL or inq == NULL or stack == NULL):
+*/
+  __pyx_t_15 = (__pyx_v_array_written == NULL);
+
+  if (!__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L20_bool_binop_done;
+  }
+  __pyx_t_15 = (__pyx_v_pred_head == NULL);
+
+  if (!__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L20_bool_binop_done;
+  }
+  __pyx_t_15 = (__pyx_v_pred_src == NULL);
+
+  if (!__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L20_bool_binop_done;
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":297
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if (array_written == NULL or pred_head == NULL or pred_src == NULL or cursor == NULL
+ *             or array_defs_in == NULL or acc == NULL or live == NULL             # <<<<<<<<<<<<<<
+ *             or visited == NULL or inq == NULL or stack == NULL):
+ *         free(array_written); free(pred_head); free(pred_src); free(cursor)
+*/
+  __pyx_t_15 = (__pyx_v_cursor == NULL);
+
+  if (!__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L20_bool_binop_done;
+  }
+  __pyx_t_15 = (__pyx_v_array_defs_in == NULL);
+
+  if (!__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L20_bool_binop_done;
+  }
+  __pyx_t_15 = (__pyx_v_acc == NULL);
+
+  if (!__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L20_bool_binop_done;
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":298
+ *     if (array_written == NULL or pred_head == NULL or pred_src == NULL or cursor == NULL
+ *             or array_defs_in == NULL or acc == NULL or live == NULL
+ *             or visited == NULL or inq == NULL or stack == NULL):             # <<<<<<<<<<<<<<
+ *         free(array_written); free(pred_head); free(pred_src); free(cursor)
+ *         free(array_defs_in); free(acc); free(live)
+*/
+  __pyx_t_15 = (__pyx_v_live == NULL);
+
+  if (!__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L20_bool_binop_done;
+  }
+  __pyx_t_15 = (__pyx_v_visited == NULL);
+
+  if (!__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L20_bool_binop_done;
+  }
+  __pyx_t_15 = (__pyx_v_inq == NULL);
+
+  if (!__pyx_t_15) {
+
+  } else {
+
+    __pyx_t_11 = __pyx_t_15;
+
+    goto __pyx_L20_bool_binop_done;
+  }
+  __pyx_t_15 = (__pyx_v_stack == NULL);
+
+
+  __pyx_t_11 = __pyx_t_15;
+
+  __pyx_L20_bool_binop_done:;
+
+  /* "sonolus/backend/_opt/analysis.pyx":296
+ *     cdef uint8_t* inq = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if (array_written == NULL or pred_head == NULL or pred_src == NULL or cursor == NULL             # <<<<<<<<<<<<<<
+ *             or array_defs_in == NULL or acc == NULL or live == NULL
+ *             or visited == NULL or inq == NULL or stack == NULL):
+*/
+  if (unlikely(__pyx_t_11)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":299
+ *             or array_defs_in == NULL or acc == NULL or live == NULL
+ *             or visited == NULL or inq == NULL or stack == NULL):
+ *         free(array_written); free(pred_head); free(pred_src); free(cursor)             # <<<<<<<<<<<<<<
+ *         free(array_defs_in); free(acc); free(live)
+ *         free(visited); free(inq); free(stack)
+*/
+    free(__pyx_v_array_written);
+    free(__pyx_v_pred_head);
+    free(__pyx_v_pred_src);
+    free(__pyx_v_cursor);
+
+    /* "sonolus/backend/_opt/analysis.pyx":300
+ *             or visited == NULL or inq == NULL or stack == NULL):
+ *         free(array_written); free(pred_head); free(pred_src); free(cursor)
+ *         free(array_defs_in); free(acc); free(live)             # <<<<<<<<<<<<<<
+ *         free(visited); free(inq); free(stack)
+ *         raise MemoryError()
+*/
+    free(__pyx_v_array_defs_in);
+    free(__pyx_v_acc);
+    free(__pyx_v_live);
+
+    /* "sonolus/backend/_opt/analysis.pyx":301
+ *         free(array_written); free(pred_head); free(pred_src); free(cursor)
+ *         free(array_defs_in); free(acc); free(live)
+ *         free(visited); free(inq); free(stack)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+*/
+    free(__pyx_v_visited);
+    free(__pyx_v_inq);
+    free(__pyx_v_stack);
+
+    /* "sonolus/backend/_opt/analysis.pyx":302
+ *         free(array_defs_in); free(acc); free(live)
+ *         free(visited); free(inq); free(stack)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     # array_written: arrays with at least one write anywhere in the func. The
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 302, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":296
+ *     cdef uint8_t* inq = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if (array_written == NULL or pred_head == NULL or pred_src == NULL or cursor == NULL             # <<<<<<<<<<<<<<
+ *             or array_defs_in == NULL or acc == NULL or live == NULL
+ *             or visited == NULL or inq == NULL or stack == NULL):
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":311
+ *     # never-written -1.0 padding, matching the bump allocators).
+ *     cdef int32_t aw_pid
+ *     for i in range(ni):             # <<<<<<<<<<<<<<
+ *         if instrs[i].op == OPX_SET and (instrs[i].flags & FLAG_STMT_ROOT):
+ *             aw_pid = instrs[i].aux
+*/
+
+  __pyx_t_4 = __pyx_v_ni;
+  __pyx_t_12 = __pyx_t_4;
+
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_i = __pyx_t_13;
+
+    /* "sonolus/backend/_opt/analysis.pyx":312
+ *     cdef int32_t aw_pid
+ *     for i in range(ni):
+ *         if instrs[i].op == OPX_SET and (instrs[i].flags & FLAG_STMT_ROOT):             # <<<<<<<<<<<<<<
+ *             aw_pid = instrs[i].aux
+ *             if places[aw_pid].kind == PLACE_TEMP_ARRAY:
+*/
+    __pyx_t_15 = ((__pyx_v_instrs[__pyx_v_i]).op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_SET);
+
+    if (__pyx_t_15) {
+
+    } else {
+
+      __pyx_t_11 = __pyx_t_15;
+
+      goto __pyx_L33_bool_binop_done;
+    }
+    __pyx_t_15 = (((__pyx_v_instrs[__pyx_v_i]).flags & __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_STMT_ROOT) != 0);
+
+
+    __pyx_t_11 = __pyx_t_15;
+
+    __pyx_L33_bool_binop_done:;
+    if (__pyx_t_11) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":313
+ *     for i in range(ni):
+ *         if instrs[i].op == OPX_SET and (instrs[i].flags & FLAG_STMT_ROOT):
+ *             aw_pid = instrs[i].aux             # <<<<<<<<<<<<<<
+ *             if places[aw_pid].kind == PLACE_TEMP_ARRAY:
+ *                 bs_set(array_written, places[aw_pid].block_ref)
+*/
+      __pyx_t_17 = (__pyx_v_instrs[__pyx_v_i]).aux;
+
+      __pyx_v_aw_pid = __pyx_t_17;
+
+      /* "sonolus/backend/_opt/analysis.pyx":314
+ *         if instrs[i].op == OPX_SET and (instrs[i].flags & FLAG_STMT_ROOT):
+ *             aw_pid = instrs[i].aux
+ *             if places[aw_pid].kind == PLACE_TEMP_ARRAY:             # <<<<<<<<<<<<<<
+ *                 bs_set(array_written, places[aw_pid].block_ref)
+ * 
+*/
+      __pyx_t_11 = ((__pyx_v_places[__pyx_v_aw_pid]).kind == __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_ARRAY);
+
+      if (__pyx_t_11) {
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":315
+ *             aw_pid = instrs[i].aux
+ *             if places[aw_pid].kind == PLACE_TEMP_ARRAY:
+ *                 bs_set(array_written, places[aw_pid].block_ref)             # <<<<<<<<<<<<<<
+ * 
+ *     # Predecessor CSR (pred_head[b]..pred_head[b+1] index into pred_src).
+*/
+        __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_set(__pyx_v_array_written, (__pyx_v_places[__pyx_v_aw_pid]).block_ref);
+
+        /* "sonolus/backend/_opt/analysis.pyx":314
+ *         if instrs[i].op == OPX_SET and (instrs[i].flags & FLAG_STMT_ROOT):
+ *             aw_pid = instrs[i].aux
+ *             if places[aw_pid].kind == PLACE_TEMP_ARRAY:             # <<<<<<<<<<<<<<
+ *                 bs_set(array_written, places[aw_pid].block_ref)
+ * 
+*/
+      }
+
+      /* "sonolus/backend/_opt/analysis.pyx":312
+ *     cdef int32_t aw_pid
+ *     for i in range(ni):
+ *         if instrs[i].op == OPX_SET and (instrs[i].flags & FLAG_STMT_ROOT):             # <<<<<<<<<<<<<<
+ *             aw_pid = instrs[i].aux
+ *             if places[aw_pid].kind == PLACE_TEMP_ARRAY:
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":318
+ * 
+ *     # Predecessor CSR (pred_head[b]..pred_head[b+1] index into pred_src).
+ *     for e in range(ne):             # <<<<<<<<<<<<<<
+ *         pred_head[edges[e].dst + 1] += 1
+ *     for b in range(nb):
+*/
+
+  __pyx_t_4 = __pyx_v_ne;
+  __pyx_t_12 = __pyx_t_4;
+
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_e = __pyx_t_13;
+
+    /* "sonolus/backend/_opt/analysis.pyx":319
+ *     # Predecessor CSR (pred_head[b]..pred_head[b+1] index into pred_src).
+ *     for e in range(ne):
+ *         pred_head[edges[e].dst + 1] += 1             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         pred_head[b + 1] += pred_head[b]
+*/
+
+    __pyx_t_10 = ((__pyx_v_edges[__pyx_v_e]).dst + 1);
+    (__pyx_v_pred_head[__pyx_t_10]) = ((__pyx_v_pred_head[__pyx_t_10]) + 1);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":320
+ *     for e in range(ne):
+ *         pred_head[edges[e].dst + 1] += 1
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         pred_head[b + 1] += pred_head[b]
+ *     for b in range(nb):
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_12 = __pyx_t_4;
+
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_b = __pyx_t_13;
+
+    /* "sonolus/backend/_opt/analysis.pyx":321
+ *         pred_head[edges[e].dst + 1] += 1
+ *     for b in range(nb):
+ *         pred_head[b + 1] += pred_head[b]             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         cursor[b] = pred_head[b]
+*/
+
+    __pyx_t_10 = (__pyx_v_b + 1);
+    (__pyx_v_pred_head[__pyx_t_10]) = ((__pyx_v_pred_head[__pyx_t_10]) + (__pyx_v_pred_head[__pyx_v_b]));
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":322
+ *     for b in range(nb):
+ *         pred_head[b + 1] += pred_head[b]
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         cursor[b] = pred_head[b]
+ *     for e in range(ne):
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_12 = __pyx_t_4;
+
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_b = __pyx_t_13;
+
+    /* "sonolus/backend/_opt/analysis.pyx":323
+ *         pred_head[b + 1] += pred_head[b]
+ *     for b in range(nb):
+ *         cursor[b] = pred_head[b]             # <<<<<<<<<<<<<<
+ *     for e in range(ne):
+ *         pred_src[cursor[edges[e].dst]] = edges[e].src
+*/
+    (__pyx_v_cursor[__pyx_v_b]) = (__pyx_v_pred_head[__pyx_v_b]);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":324
+ *     for b in range(nb):
+ *         cursor[b] = pred_head[b]
+ *     for e in range(ne):             # <<<<<<<<<<<<<<
+ *         pred_src[cursor[edges[e].dst]] = edges[e].src
+ *         cursor[edges[e].dst] += 1
+*/
+
+  __pyx_t_4 = __pyx_v_ne;
+  __pyx_t_12 = __pyx_t_4;
+
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_e = __pyx_t_13;
+
+    /* "sonolus/backend/_opt/analysis.pyx":325
+ *         cursor[b] = pred_head[b]
+ *     for e in range(ne):
+ *         pred_src[cursor[edges[e].dst]] = edges[e].src             # <<<<<<<<<<<<<<
+ *         cursor[edges[e].dst] += 1
+ *     free(cursor)
+*/
+    __pyx_t_17 = (__pyx_v_edges[__pyx_v_e]).src;
+
+    (__pyx_v_pred_src[(__pyx_v_cursor[(__pyx_v_edges[__pyx_v_e]).dst])]) = __pyx_t_17;
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":326
+ *     for e in range(ne):
+ *         pred_src[cursor[edges[e].dst]] = edges[e].src
+ *         cursor[edges[e].dst] += 1             # <<<<<<<<<<<<<<
+ *     free(cursor)
+ *     cursor = NULL
+*/
+
+    __pyx_t_17 = (__pyx_v_edges[__pyx_v_e]).dst;
+    (__pyx_v_cursor[__pyx_t_17]) = ((__pyx_v_cursor[__pyx_t_17]) + 1);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":327
+ *         pred_src[cursor[edges[e].dst]] = edges[e].src
+ *         cursor[edges[e].dst] += 1
+ *     free(cursor)             # <<<<<<<<<<<<<<
+ *     cursor = NULL
+ * 
+*/
+  free(__pyx_v_cursor);
+
+  /* "sonolus/backend/_opt/analysis.pyx":328
+ *         cursor[edges[e].dst] += 1
+ *     free(cursor)
+ *     cursor = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int32_t sp, istart, icount, s, vid, pid, dt, adt, tv, rs
+*/
+  __pyx_v_cursor = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":335
+ *     cdef bint can_skip, has_defs, dlive, changed
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         # ---- forward array-init pass (from entry) ------------------------
+ *         sp = 0
+*/
+  {
+      PyThreadState * _save;
+      _save = PyEval_SaveThread();
+      __Pyx_FastGIL_Remember();
+      /*try:*/ {
+
+        /* "sonolus/backend/_opt/analysis.pyx":337
+ *     with nogil:
+ *         # ---- forward array-init pass (from entry) ------------------------
+ *         sp = 0             # <<<<<<<<<<<<<<
+ *         stack[sp] = func.entry_block
+ *         sp += 1
+*/
+        __pyx_v_sp = 0;
+
+        /* "sonolus/backend/_opt/analysis.pyx":338
+ *         # ---- forward array-init pass (from entry) ------------------------
+ *         sp = 0
+ *         stack[sp] = func.entry_block             # <<<<<<<<<<<<<<
+ *         sp += 1
+ *         inq[func.entry_block] = 1
+*/
+        __pyx_t_4 = __pyx_v_func->entry_block;
+
+        (__pyx_v_stack[__pyx_v_sp]) = __pyx_t_4;
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":339
+ *         sp = 0
+ *         stack[sp] = func.entry_block
+ *         sp += 1             # <<<<<<<<<<<<<<
+ *         inq[func.entry_block] = 1
+ *         while sp > 0:
+*/
+        __pyx_v_sp = (__pyx_v_sp + 1);
+
+        /* "sonolus/backend/_opt/analysis.pyx":340
+ *         stack[sp] = func.entry_block
+ *         sp += 1
+ *         inq[func.entry_block] = 1             # <<<<<<<<<<<<<<
+ *         while sp > 0:
+ *             sp -= 1
+*/
+        (__pyx_v_inq[__pyx_v_func->entry_block]) = 1;
+
+        /* "sonolus/backend/_opt/analysis.pyx":341
+ *         sp += 1
+ *         inq[func.entry_block] = 1
+ *         while sp > 0:             # <<<<<<<<<<<<<<
+ *             sp -= 1
+ *             b = stack[sp]
+*/
+        while (1) {
+          __pyx_t_11 = (__pyx_v_sp > 0);
+
+
+          if (!__pyx_t_11) break;
+
+          /* "sonolus/backend/_opt/analysis.pyx":342
+ *         inq[func.entry_block] = 1
+ *         while sp > 0:
+ *             sp -= 1             # <<<<<<<<<<<<<<
+ *             b = stack[sp]
+ *             inq[b] = 0
+*/
+          __pyx_v_sp = (__pyx_v_sp - 1);
+
+          /* "sonolus/backend/_opt/analysis.pyx":343
+ *         while sp > 0:
+ *             sp -= 1
+ *             b = stack[sp]             # <<<<<<<<<<<<<<
+ *             inq[b] = 0
+ *             memcpy(acc, &array_defs_in[<int64_t>b * nw], <size_t>nw * sizeof(uint64_t))
+*/
+          __pyx_v_b = (__pyx_v_stack[__pyx_v_sp]);
+
+          /* "sonolus/backend/_opt/analysis.pyx":344
+ *             sp -= 1
+ *             b = stack[sp]
+ *             inq[b] = 0             # <<<<<<<<<<<<<<
+ *             memcpy(acc, &array_defs_in[<int64_t>b * nw], <size_t>nw * sizeof(uint64_t))
+ *             istart = blocks[b].instr_start
+*/
+          (__pyx_v_inq[__pyx_v_b]) = 0;
+
+          /* "sonolus/backend/_opt/analysis.pyx":345
+ *             b = stack[sp]
+ *             inq[b] = 0
+ *             memcpy(acc, &array_defs_in[<int64_t>b * nw], <size_t>nw * sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *             istart = blocks[b].instr_start
+ *             icount = blocks[b].instr_count
+*/
+          (void)(memcpy(__pyx_v_acc, (&(__pyx_v_array_defs_in[(((int64_t)__pyx_v_b) * __pyx_v_nw)])), (((size_t)__pyx_v_nw) * (sizeof(uint64_t)))));
+
+          /* "sonolus/backend/_opt/analysis.pyx":346
+ *             inq[b] = 0
+ *             memcpy(acc, &array_defs_in[<int64_t>b * nw], <size_t>nw * sizeof(uint64_t))
+ *             istart = blocks[b].instr_start             # <<<<<<<<<<<<<<
+ *             icount = blocks[b].instr_count
+ *             for i in range(istart, istart + icount):
+*/
+          __pyx_t_4 = (__pyx_v_blocks[__pyx_v_b]).instr_start;
+
+          __pyx_v_istart = __pyx_t_4;
+
+          /* "sonolus/backend/_opt/analysis.pyx":347
+ *             memcpy(acc, &array_defs_in[<int64_t>b * nw], <size_t>nw * sizeof(uint64_t))
+ *             istart = blocks[b].instr_start
+ *             icount = blocks[b].instr_count             # <<<<<<<<<<<<<<
+ *             for i in range(istart, istart + icount):
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):
+*/
+          __pyx_t_4 = (__pyx_v_blocks[__pyx_v_b]).instr_count;
+
+          __pyx_v_icount = __pyx_t_4;
+
+          /* "sonolus/backend/_opt/analysis.pyx":348
+ *             istart = blocks[b].instr_start
+ *             icount = blocks[b].instr_count
+ *             for i in range(istart, istart + icount):             # <<<<<<<<<<<<<<
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):
+ *                     continue
+*/
+
+          __pyx_t_4 = (__pyx_v_istart + __pyx_v_icount);
+          __pyx_t_12 = __pyx_t_4;
+
+          for (__pyx_t_13 = __pyx_v_istart; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+            __pyx_v_i = __pyx_t_13;
+
+            /* "sonolus/backend/_opt/analysis.pyx":349
+ *             icount = blocks[b].instr_count
+ *             for i in range(istart, istart + icount):
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 if instrs[i].op == OPX_SET:
+*/
+            __pyx_t_11 = (!(((__pyx_v_instrs[__pyx_v_i]).flags & __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_STMT_ROOT) != 0));
+
+            if (__pyx_t_11) {
+
+
+              /* "sonolus/backend/_opt/analysis.pyx":350
+ *             for i in range(istart, istart + icount):
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 if instrs[i].op == OPX_SET:
+ *                     pid = instrs[i].aux
+*/
+              goto __pyx_L49_continue;
+
+              /* "sonolus/backend/_opt/analysis.pyx":349
+ *             icount = blocks[b].instr_count
+ *             for i in range(istart, istart + icount):
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 if instrs[i].op == OPX_SET:
+*/
+            }
+
+            /* "sonolus/backend/_opt/analysis.pyx":351
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):
+ *                     continue
+ *                 if instrs[i].op == OPX_SET:             # <<<<<<<<<<<<<<
+ *                     pid = instrs[i].aux
+ *                     if places[pid].kind == PLACE_TEMP_ARRAY:
+*/
+            __pyx_t_11 = ((__pyx_v_instrs[__pyx_v_i]).op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_SET);
+
+            if (__pyx_t_11) {
+
+
+              /* "sonolus/backend/_opt/analysis.pyx":352
+ *                     continue
+ *                 if instrs[i].op == OPX_SET:
+ *                     pid = instrs[i].aux             # <<<<<<<<<<<<<<
+ *                     if places[pid].kind == PLACE_TEMP_ARRAY:
+ *                         t = places[pid].block_ref
+*/
+              __pyx_t_17 = (__pyx_v_instrs[__pyx_v_i]).aux;
+
+              __pyx_v_pid = __pyx_t_17;
+
+              /* "sonolus/backend/_opt/analysis.pyx":353
+ *                 if instrs[i].op == OPX_SET:
+ *                     pid = instrs[i].aux
+ *                     if places[pid].kind == PLACE_TEMP_ARRAY:             # <<<<<<<<<<<<<<
+ *                         t = places[pid].block_ref
+ *                         if not bs_get(acc, t):
+*/
+              __pyx_t_11 = ((__pyx_v_places[__pyx_v_pid]).kind == __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_ARRAY);
+
+              if (__pyx_t_11) {
+
+
+                /* "sonolus/backend/_opt/analysis.pyx":354
+ *                     pid = instrs[i].aux
+ *                     if places[pid].kind == PLACE_TEMP_ARRAY:
+ *                         t = places[pid].block_ref             # <<<<<<<<<<<<<<
+ *                         if not bs_get(acc, t):
+ *                             L.is_array_init[i] = 1
+*/
+                __pyx_t_17 = (__pyx_v_places[__pyx_v_pid]).block_ref;
+
+                __pyx_v_t = __pyx_t_17;
+
+                /* "sonolus/backend/_opt/analysis.pyx":355
+ *                     if places[pid].kind == PLACE_TEMP_ARRAY:
+ *                         t = places[pid].block_ref
+ *                         if not bs_get(acc, t):             # <<<<<<<<<<<<<<
+ *                             L.is_array_init[i] = 1
+ *                             bs_set(acc, t)
+*/
+                __pyx_t_11 = (!__pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get(__pyx_v_acc, __pyx_v_t));
+
+                if (__pyx_t_11) {
+
+
+                  /* "sonolus/backend/_opt/analysis.pyx":356
+ *                         t = places[pid].block_ref
+ *                         if not bs_get(acc, t):
+ *                             L.is_array_init[i] = 1             # <<<<<<<<<<<<<<
+ *                             bs_set(acc, t)
+ *                         else:
+*/
+                  (__pyx_v_L->is_array_init[__pyx_v_i]) = 1;
+
+                  /* "sonolus/backend/_opt/analysis.pyx":357
+ *                         if not bs_get(acc, t):
+ *                             L.is_array_init[i] = 1
+ *                             bs_set(acc, t)             # <<<<<<<<<<<<<<
+ *                         else:
+ *                             L.is_array_init[i] = 0
+*/
+                  __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_set(__pyx_v_acc, __pyx_v_t);
+
+                  /* "sonolus/backend/_opt/analysis.pyx":355
+ *                     if places[pid].kind == PLACE_TEMP_ARRAY:
+ *                         t = places[pid].block_ref
+ *                         if not bs_get(acc, t):             # <<<<<<<<<<<<<<
+ *                             L.is_array_init[i] = 1
+ *                             bs_set(acc, t)
+*/
+                  goto __pyx_L54;
+                }
+
+                /* "sonolus/backend/_opt/analysis.pyx":359
+ *                             bs_set(acc, t)
+ *                         else:
+ *                             L.is_array_init[i] = 0             # <<<<<<<<<<<<<<
+ *             changed = (not visited[b]) or (memcmp(acc, &L.array_defs_out[<int64_t>b * nw],
+ *                                                   <size_t>nw * sizeof(uint64_t)) != 0)
+*/
+                /*else*/ {
+                  (__pyx_v_L->is_array_init[__pyx_v_i]) = 0;
+                }
+                __pyx_L54:;
+
+                /* "sonolus/backend/_opt/analysis.pyx":353
+ *                 if instrs[i].op == OPX_SET:
+ *                     pid = instrs[i].aux
+ *                     if places[pid].kind == PLACE_TEMP_ARRAY:             # <<<<<<<<<<<<<<
+ *                         t = places[pid].block_ref
+ *                         if not bs_get(acc, t):
+*/
+              }
+
+              /* "sonolus/backend/_opt/analysis.pyx":351
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):
+ *                     continue
+ *                 if instrs[i].op == OPX_SET:             # <<<<<<<<<<<<<<
+ *                     pid = instrs[i].aux
+ *                     if places[pid].kind == PLACE_TEMP_ARRAY:
+*/
+            }
+            __pyx_L49_continue:;
+          }
+
+
+          /* "sonolus/backend/_opt/analysis.pyx":360
+ *                         else:
+ *                             L.is_array_init[i] = 0
+ *             changed = (not visited[b]) or (memcmp(acc, &L.array_defs_out[<int64_t>b * nw],             # <<<<<<<<<<<<<<
+ *                                                   <size_t>nw * sizeof(uint64_t)) != 0)
+ *             if changed:
+*/
+          __pyx_t_15 = (!((__pyx_v_visited[__pyx_v_b]) != 0));
+
+          if (!__pyx_t_15) {
+
+          } else {
+
+            __pyx_t_11 = __pyx_t_15;
+
+            goto __pyx_L55_bool_binop_done;
+          }
+
+          /* "sonolus/backend/_opt/analysis.pyx":361
+ *                             L.is_array_init[i] = 0
+ *             changed = (not visited[b]) or (memcmp(acc, &L.array_defs_out[<int64_t>b * nw],
+ *                                                   <size_t>nw * sizeof(uint64_t)) != 0)             # <<<<<<<<<<<<<<
+ *             if changed:
+ *                 visited[b] = 1
+*/
+          __pyx_t_15 = (memcmp(__pyx_v_acc, (&(__pyx_v_L->array_defs_out[(((int64_t)__pyx_v_b) * __pyx_v_nw)])), (((size_t)__pyx_v_nw) * (sizeof(uint64_t)))) != 0);
+
+
+          __pyx_t_11 = __pyx_t_15;
+
+          __pyx_L55_bool_binop_done:;
+          __pyx_v_changed = __pyx_t_11;
+
+          /* "sonolus/backend/_opt/analysis.pyx":362
+ *             changed = (not visited[b]) or (memcmp(acc, &L.array_defs_out[<int64_t>b * nw],
+ *                                                   <size_t>nw * sizeof(uint64_t)) != 0)
+ *             if changed:             # <<<<<<<<<<<<<<
+ *                 visited[b] = 1
+ *                 memcpy(&L.array_defs_out[<int64_t>b * nw], acc, <size_t>nw * sizeof(uint64_t))
+*/
+          if (__pyx_v_changed) {
+
+            /* "sonolus/backend/_opt/analysis.pyx":363
+ *                                                   <size_t>nw * sizeof(uint64_t)) != 0)
+ *             if changed:
+ *                 visited[b] = 1             # <<<<<<<<<<<<<<
+ *                 memcpy(&L.array_defs_out[<int64_t>b * nw], acc, <size_t>nw * sizeof(uint64_t))
+ *                 for e in range(blocks[b].edge_start, blocks[b].edge_start + blocks[b].edge_count):
+*/
+            (__pyx_v_visited[__pyx_v_b]) = 1;
+
+            /* "sonolus/backend/_opt/analysis.pyx":364
+ *             if changed:
+ *                 visited[b] = 1
+ *                 memcpy(&L.array_defs_out[<int64_t>b * nw], acc, <size_t>nw * sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *                 for e in range(blocks[b].edge_start, blocks[b].edge_start + blocks[b].edge_count):
+ *                     s = edges[e].dst
+*/
+            (void)(memcpy((&(__pyx_v_L->array_defs_out[(((int64_t)__pyx_v_b) * __pyx_v_nw)])), __pyx_v_acc, (((size_t)__pyx_v_nw) * (sizeof(uint64_t)))));
+
+            /* "sonolus/backend/_opt/analysis.pyx":365
+ *                 visited[b] = 1
+ *                 memcpy(&L.array_defs_out[<int64_t>b * nw], acc, <size_t>nw * sizeof(uint64_t))
+ *                 for e in range(blocks[b].edge_start, blocks[b].edge_start + blocks[b].edge_count):             # <<<<<<<<<<<<<<
+ *                     s = edges[e].dst
+ *                     _or_into(&array_defs_in[<int64_t>s * nw], acc, nw)
+*/
+
+            __pyx_t_4 = ((__pyx_v_blocks[__pyx_v_b]).edge_start + (__pyx_v_blocks[__pyx_v_b]).edge_count);
+            __pyx_t_12 = __pyx_t_4;
+
+            for (__pyx_t_13 = (__pyx_v_blocks[__pyx_v_b]).edge_start; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+              __pyx_v_e = __pyx_t_13;
+
+              /* "sonolus/backend/_opt/analysis.pyx":366
+ *                 memcpy(&L.array_defs_out[<int64_t>b * nw], acc, <size_t>nw * sizeof(uint64_t))
+ *                 for e in range(blocks[b].edge_start, blocks[b].edge_start + blocks[b].edge_count):
+ *                     s = edges[e].dst             # <<<<<<<<<<<<<<
+ *                     _or_into(&array_defs_in[<int64_t>s * nw], acc, nw)
+ *                     if not inq[s]:
+*/
+              __pyx_t_17 = (__pyx_v_edges[__pyx_v_e]).dst;
+
+              __pyx_v_s = __pyx_t_17;
+
+              /* "sonolus/backend/_opt/analysis.pyx":367
+ *                 for e in range(blocks[b].edge_start, blocks[b].edge_start + blocks[b].edge_count):
+ *                     s = edges[e].dst
+ *                     _or_into(&array_defs_in[<int64_t>s * nw], acc, nw)             # <<<<<<<<<<<<<<
+ *                     if not inq[s]:
+ *                         stack[sp] = s
+*/
+              (void)(__pyx_f_7sonolus_7backend_4_opt_8analysis__or_into((&(__pyx_v_array_defs_in[(((int64_t)__pyx_v_s) * __pyx_v_nw)])), __pyx_v_acc, __pyx_v_nw));
+
+              /* "sonolus/backend/_opt/analysis.pyx":368
+ *                     s = edges[e].dst
+ *                     _or_into(&array_defs_in[<int64_t>s * nw], acc, nw)
+ *                     if not inq[s]:             # <<<<<<<<<<<<<<
+ *                         stack[sp] = s
+ *                         sp += 1
+*/
+              __pyx_t_11 = (!((__pyx_v_inq[__pyx_v_s]) != 0));
+
+              if (__pyx_t_11) {
+
+
+                /* "sonolus/backend/_opt/analysis.pyx":369
+ *                     _or_into(&array_defs_in[<int64_t>s * nw], acc, nw)
+ *                     if not inq[s]:
+ *                         stack[sp] = s             # <<<<<<<<<<<<<<
+ *                         sp += 1
+ *                         inq[s] = 1
+*/
+                (__pyx_v_stack[__pyx_v_sp]) = __pyx_v_s;
+
+                /* "sonolus/backend/_opt/analysis.pyx":370
+ *                     if not inq[s]:
+ *                         stack[sp] = s
+ *                         sp += 1             # <<<<<<<<<<<<<<
+ *                         inq[s] = 1
+ * 
+*/
+                __pyx_v_sp = (__pyx_v_sp + 1);
+
+                /* "sonolus/backend/_opt/analysis.pyx":371
+ *                         stack[sp] = s
+ *                         sp += 1
+ *                         inq[s] = 1             # <<<<<<<<<<<<<<
+ * 
+ *         # ---- backward liveness pass (seeded from all blocks) -------------
+*/
+                (__pyx_v_inq[__pyx_v_s]) = 1;
+
+                /* "sonolus/backend/_opt/analysis.pyx":368
+ *                     s = edges[e].dst
+ *                     _or_into(&array_defs_in[<int64_t>s * nw], acc, nw)
+ *                     if not inq[s]:             # <<<<<<<<<<<<<<
+ *                         stack[sp] = s
+ *                         sp += 1
+*/
+              }
+            }
+
+
+            /* "sonolus/backend/_opt/analysis.pyx":362
+ *             changed = (not visited[b]) or (memcmp(acc, &L.array_defs_out[<int64_t>b * nw],
+ *                                                   <size_t>nw * sizeof(uint64_t)) != 0)
+ *             if changed:             # <<<<<<<<<<<<<<
+ *                 visited[b] = 1
+ *                 memcpy(&L.array_defs_out[<int64_t>b * nw], acc, <size_t>nw * sizeof(uint64_t))
+*/
+          }
+        }
+
+        /* "sonolus/backend/_opt/analysis.pyx":384
+ *         # stores feeding them are not DSE'd), as do the exit-unreachable blocks
+ *         # themselves.
+ *         memset(inq, 0, <size_t>(nb if nb > 0 else 1) * sizeof(uint8_t))             # <<<<<<<<<<<<<<
+ *         memset(visited, 0, <size_t>(nb if nb > 0 else 1) * sizeof(uint8_t))
+ *         sp = 0
+*/
+        __pyx_t_11 = (__pyx_v_nb > 0);
+
+        if (__pyx_t_11) {
+
+          __pyx_t_10 = __pyx_v_nb;
+        } else {
+
+          __pyx_t_10 = 1;
+        }
+
+        (void)(memset(__pyx_v_inq, 0, (((size_t)__pyx_t_10) * (sizeof(uint8_t)))));
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":385
+ *         # themselves.
+ *         memset(inq, 0, <size_t>(nb if nb > 0 else 1) * sizeof(uint8_t))
+ *         memset(visited, 0, <size_t>(nb if nb > 0 else 1) * sizeof(uint8_t))             # <<<<<<<<<<<<<<
+ *         sp = 0
+ *         for b in range(nb):
+*/
+        __pyx_t_11 = (__pyx_v_nb > 0);
+
+        if (__pyx_t_11) {
+
+          __pyx_t_10 = __pyx_v_nb;
+        } else {
+
+          __pyx_t_10 = 1;
+        }
+
+        (void)(memset(__pyx_v_visited, 0, (((size_t)__pyx_t_10) * (sizeof(uint8_t)))));
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":386
+ *         memset(inq, 0, <size_t>(nb if nb > 0 else 1) * sizeof(uint8_t))
+ *         memset(visited, 0, <size_t>(nb if nb > 0 else 1) * sizeof(uint8_t))
+ *         sp = 0             # <<<<<<<<<<<<<<
+ *         for b in range(nb):
+ *             stack[sp] = b
+*/
+        __pyx_v_sp = 0;
+
+        /* "sonolus/backend/_opt/analysis.pyx":387
+ *         memset(visited, 0, <size_t>(nb if nb > 0 else 1) * sizeof(uint8_t))
+ *         sp = 0
+ *         for b in range(nb):             # <<<<<<<<<<<<<<
+ *             stack[sp] = b
+ *             sp += 1
+*/
+
+        __pyx_t_4 = __pyx_v_nb;
+        __pyx_t_12 = __pyx_t_4;
+
+        for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+          __pyx_v_b = __pyx_t_13;
+
+          /* "sonolus/backend/_opt/analysis.pyx":388
+ *         sp = 0
+ *         for b in range(nb):
+ *             stack[sp] = b             # <<<<<<<<<<<<<<
+ *             sp += 1
+ *             inq[b] = 1
+*/
+          (__pyx_v_stack[__pyx_v_sp]) = __pyx_v_b;
+
+          /* "sonolus/backend/_opt/analysis.pyx":389
+ *         for b in range(nb):
+ *             stack[sp] = b
+ *             sp += 1             # <<<<<<<<<<<<<<
+ *             inq[b] = 1
+ *         while sp > 0:
+*/
+          __pyx_v_sp = (__pyx_v_sp + 1);
+
+          /* "sonolus/backend/_opt/analysis.pyx":390
+ *             stack[sp] = b
+ *             sp += 1
+ *             inq[b] = 1             # <<<<<<<<<<<<<<
+ *         while sp > 0:
+ *             sp -= 1
+*/
+          (__pyx_v_inq[__pyx_v_b]) = 1;
+        }
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":391
+ *             sp += 1
+ *             inq[b] = 1
+ *         while sp > 0:             # <<<<<<<<<<<<<<
+ *             sp -= 1
+ *             b = stack[sp]
+*/
+        while (1) {
+          __pyx_t_11 = (__pyx_v_sp > 0);
+
+
+          if (!__pyx_t_11) break;
+
+          /* "sonolus/backend/_opt/analysis.pyx":392
+ *             inq[b] = 1
+ *         while sp > 0:
+ *             sp -= 1             # <<<<<<<<<<<<<<
+ *             b = stack[sp]
+ *             inq[b] = 0
+*/
+          __pyx_v_sp = (__pyx_v_sp - 1);
+
+          /* "sonolus/backend/_opt/analysis.pyx":393
+ *         while sp > 0:
+ *             sp -= 1
+ *             b = stack[sp]             # <<<<<<<<<<<<<<
+ *             inq[b] = 0
+ * 
+*/
+          __pyx_v_b = (__pyx_v_stack[__pyx_v_sp]);
+
+          /* "sonolus/backend/_opt/analysis.pyx":394
+ *             sp -= 1
+ *             b = stack[sp]
+ *             inq[b] = 0             # <<<<<<<<<<<<<<
+ * 
+ *             # live := live_out[b] with written arrays not yet defined on any path
+*/
+          (__pyx_v_inq[__pyx_v_b]) = 0;
+
+          /* "sonolus/backend/_opt/analysis.pyx":398
+ *             # live := live_out[b] with written arrays not yet defined on any path
+ *             # dropped (never-written arrays keep ordinary read-liveness).
+ *             for w in range(nw):             # <<<<<<<<<<<<<<
+ *                 live[w] = L.live_out[<int64_t>b * nw + w] & ~(
+ *                     (L.array_mask[w] & array_written[w]) & ~L.array_defs_out[<int64_t>b * nw + w]
+*/
+
+          __pyx_t_4 = __pyx_v_nw;
+          __pyx_t_12 = __pyx_t_4;
+
+          for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+            __pyx_v_w = __pyx_t_13;
+
+            /* "sonolus/backend/_opt/analysis.pyx":399
+ *             # dropped (never-written arrays keep ordinary read-liveness).
+ *             for w in range(nw):
+ *                 live[w] = L.live_out[<int64_t>b * nw + w] & ~(             # <<<<<<<<<<<<<<
+ *                     (L.array_mask[w] & array_written[w]) & ~L.array_defs_out[<int64_t>b * nw + w]
+ *                 )
+*/
+            (__pyx_v_live[__pyx_v_w]) = ((__pyx_v_L->live_out[((((int64_t)__pyx_v_b) * __pyx_v_nw) + __pyx_v_w)]) & (~(((__pyx_v_L->array_mask[__pyx_v_w]) & (__pyx_v_array_written[__pyx_v_w])) & (~(__pyx_v_L->array_defs_out[((((int64_t)__pyx_v_b) * __pyx_v_nw) + __pyx_v_w)])))));
+          }
+
+
+          /* "sonolus/backend/_opt/analysis.pyx":404
+ * 
+ *             # Block test counts as a use at block end.
+ *             tv = blocks[b].test_val             # <<<<<<<<<<<<<<
+ *             if tv >= 0:
+ *                 _gen_value(instrs, args, places, live, tv)
+*/
+          __pyx_t_4 = (__pyx_v_blocks[__pyx_v_b]).test_val;
+
+          __pyx_v_tv = __pyx_t_4;
+
+          /* "sonolus/backend/_opt/analysis.pyx":405
+ *             # Block test counts as a use at block end.
+ *             tv = blocks[b].test_val
+ *             if tv >= 0:             # <<<<<<<<<<<<<<
+ *                 _gen_value(instrs, args, places, live, tv)
+ * 
+*/
+          __pyx_t_11 = (__pyx_v_tv >= 0);
+
+          if (__pyx_t_11) {
+
+
+            /* "sonolus/backend/_opt/analysis.pyx":406
+ *             tv = blocks[b].test_val
+ *             if tv >= 0:
+ *                 _gen_value(instrs, args, places, live, tv)             # <<<<<<<<<<<<<<
+ * 
+ *             istart = blocks[b].instr_start
+*/
+            __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_value(__pyx_v_instrs, __pyx_v_args, __pyx_v_places, __pyx_v_live, __pyx_v_tv);
+
+            /* "sonolus/backend/_opt/analysis.pyx":405
+ *             # Block test counts as a use at block end.
+ *             tv = blocks[b].test_val
+ *             if tv >= 0:             # <<<<<<<<<<<<<<
+ *                 _gen_value(instrs, args, places, live, tv)
+ * 
+*/
+          }
+
+          /* "sonolus/backend/_opt/analysis.pyx":408
+ *                 _gen_value(instrs, args, places, live, tv)
+ * 
+ *             istart = blocks[b].instr_start             # <<<<<<<<<<<<<<
+ *             icount = blocks[b].instr_count
+ *             for i in range(istart + icount - 1, istart - 1, -1):
+*/
+          __pyx_t_4 = (__pyx_v_blocks[__pyx_v_b]).instr_start;
+
+          __pyx_v_istart = __pyx_t_4;
+
+          /* "sonolus/backend/_opt/analysis.pyx":409
+ * 
+ *             istart = blocks[b].instr_start
+ *             icount = blocks[b].instr_count             # <<<<<<<<<<<<<<
+ *             for i in range(istart + icount - 1, istart - 1, -1):
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):
+*/
+          __pyx_t_4 = (__pyx_v_blocks[__pyx_v_b]).instr_count;
+
+          __pyx_v_icount = __pyx_t_4;
+
+          /* "sonolus/backend/_opt/analysis.pyx":410
+ *             istart = blocks[b].instr_start
+ *             icount = blocks[b].instr_count
+ *             for i in range(istart + icount - 1, istart - 1, -1):             # <<<<<<<<<<<<<<
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):
+ *                     continue
+*/
+
+          __pyx_t_10 = (__pyx_v_istart - 1);
+          __pyx_t_18 = __pyx_t_10;
+
+          for (__pyx_t_4 = ((__pyx_v_istart + __pyx_v_icount) - 1); __pyx_t_4 > __pyx_t_18; __pyx_t_4-=1) {
+            __pyx_v_i = __pyx_t_4;
+
+            /* "sonolus/backend/_opt/analysis.pyx":411
+ *             icount = blocks[b].instr_count
+ *             for i in range(istart + icount - 1, istart - 1, -1):
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 rs = L.root_slot[i]
+*/
+            __pyx_t_11 = (!(((__pyx_v_instrs[__pyx_v_i]).flags & __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_STMT_ROOT) != 0));
+
+            if (__pyx_t_11) {
+
+
+              /* "sonolus/backend/_opt/analysis.pyx":412
+ *             for i in range(istart + icount - 1, istart - 1, -1):
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 rs = L.root_slot[i]
+ *                 memcpy(&L.root_live[<int64_t>rs * nw], live, <size_t>nw * sizeof(uint64_t))
+*/
+              goto __pyx_L68_continue;
+
+              /* "sonolus/backend/_opt/analysis.pyx":411
+ *             icount = blocks[b].instr_count
+ *             for i in range(istart + icount - 1, istart - 1, -1):
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 rs = L.root_slot[i]
+*/
+            }
+
+            /* "sonolus/backend/_opt/analysis.pyx":413
+ *                 if not (instrs[i].flags & FLAG_STMT_ROOT):
+ *                     continue
+ *                 rs = L.root_slot[i]             # <<<<<<<<<<<<<<
+ *                 memcpy(&L.root_live[<int64_t>rs * nw], live, <size_t>nw * sizeof(uint64_t))
+ *                 op = instrs[i].op
+*/
+            __pyx_v_rs = (__pyx_v_L->root_slot[__pyx_v_i]);
+
+            /* "sonolus/backend/_opt/analysis.pyx":414
+ *                     continue
+ *                 rs = L.root_slot[i]
+ *                 memcpy(&L.root_live[<int64_t>rs * nw], live, <size_t>nw * sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *                 op = instrs[i].op
+ *                 if op == OPX_SET:
+*/
+            (void)(memcpy((&(__pyx_v_L->root_live[(((int64_t)__pyx_v_rs) * __pyx_v_nw)])), __pyx_v_live, (((size_t)__pyx_v_nw) * (sizeof(uint64_t)))));
+
+            /* "sonolus/backend/_opt/analysis.pyx":415
+ *                 rs = L.root_slot[i]
+ *                 memcpy(&L.root_live[<int64_t>rs * nw], live, <size_t>nw * sizeof(uint64_t))
+ *                 op = instrs[i].op             # <<<<<<<<<<<<<<
+ *                 if op == OPX_SET:
+ *                     vid = <int32_t>args[instrs[i].arg_start]
+*/
+            __pyx_t_19 = (__pyx_v_instrs[__pyx_v_i]).op;
+
+            __pyx_v_op = __pyx_t_19;
+
+            /* "sonolus/backend/_opt/analysis.pyx":416
+ *                 memcpy(&L.root_live[<int64_t>rs * nw], live, <size_t>nw * sizeof(uint64_t))
+ *                 op = instrs[i].op
+ *                 if op == OPX_SET:             # <<<<<<<<<<<<<<
+ *                     vid = <int32_t>args[instrs[i].arg_start]
+ *                     pid = instrs[i].aux
+*/
+            __pyx_t_11 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_SET);
+
+            if (__pyx_t_11) {
+
+
+              /* "sonolus/backend/_opt/analysis.pyx":417
+ *                 op = instrs[i].op
+ *                 if op == OPX_SET:
+ *                     vid = <int32_t>args[instrs[i].arg_start]             # <<<<<<<<<<<<<<
+ *                     pid = instrs[i].aux
+ *                     side_eff = instrs[vid].flags & FLAG_SIDE_EFFECT
+*/
+              __pyx_v_vid = ((int32_t)(__pyx_v_args[(__pyx_v_instrs[__pyx_v_i]).arg_start]));
+
+              /* "sonolus/backend/_opt/analysis.pyx":418
+ *                 if op == OPX_SET:
+ *                     vid = <int32_t>args[instrs[i].arg_start]
+ *                     pid = instrs[i].aux             # <<<<<<<<<<<<<<
+ *                     side_eff = instrs[vid].flags & FLAG_SIDE_EFFECT
+ *                     kind = places[pid].kind
+*/
+              __pyx_t_12 = (__pyx_v_instrs[__pyx_v_i]).aux;
+
+              __pyx_v_pid = __pyx_t_12;
+
+              /* "sonolus/backend/_opt/analysis.pyx":419
+ *                     vid = <int32_t>args[instrs[i].arg_start]
+ *                     pid = instrs[i].aux
+ *                     side_eff = instrs[vid].flags & FLAG_SIDE_EFFECT             # <<<<<<<<<<<<<<
+ *                     kind = places[pid].kind
+ *                     dt = -1
+*/
+              __pyx_v_side_eff = ((__pyx_v_instrs[__pyx_v_vid]).flags & __pyx_e_7sonolus_7backend_4_opt_2ir_FLAG_SIDE_EFFECT);
+
+              /* "sonolus/backend/_opt/analysis.pyx":420
+ *                     pid = instrs[i].aux
+ *                     side_eff = instrs[vid].flags & FLAG_SIDE_EFFECT
+ *                     kind = places[pid].kind             # <<<<<<<<<<<<<<
+ *                     dt = -1
+ *                     adt = -1
+*/
+              __pyx_t_20 = (__pyx_v_places[__pyx_v_pid]).kind;
+
+              __pyx_v_kind = __pyx_t_20;
+
+              /* "sonolus/backend/_opt/analysis.pyx":421
+ *                     side_eff = instrs[vid].flags & FLAG_SIDE_EFFECT
+ *                     kind = places[pid].kind
+ *                     dt = -1             # <<<<<<<<<<<<<<
+ *                     adt = -1
+ *                     if kind == PLACE_TEMP_SCALAR:
+*/
+              __pyx_v_dt = -1;
+
+              /* "sonolus/backend/_opt/analysis.pyx":422
+ *                     kind = places[pid].kind
+ *                     dt = -1
+ *                     adt = -1             # <<<<<<<<<<<<<<
+ *                     if kind == PLACE_TEMP_SCALAR:
+ *                         dt = places[pid].block_ref
+*/
+              __pyx_v_adt = -1;
+
+              /* "sonolus/backend/_opt/analysis.pyx":423
+ *                     dt = -1
+ *                     adt = -1
+ *                     if kind == PLACE_TEMP_SCALAR:             # <<<<<<<<<<<<<<
+ *                         dt = places[pid].block_ref
+ *                     elif kind == PLACE_TEMP_ARRAY:
+*/
+              switch (__pyx_v_kind) {
+                case __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_SCALAR:
+
+                /* "sonolus/backend/_opt/analysis.pyx":424
+ *                     adt = -1
+ *                     if kind == PLACE_TEMP_SCALAR:
+ *                         dt = places[pid].block_ref             # <<<<<<<<<<<<<<
+ *                     elif kind == PLACE_TEMP_ARRAY:
+ *                         adt = places[pid].block_ref
+*/
+                __pyx_t_12 = (__pyx_v_places[__pyx_v_pid]).block_ref;
+
+                __pyx_v_dt = __pyx_t_12;
+
+                /* "sonolus/backend/_opt/analysis.pyx":423
+ *                     dt = -1
+ *                     adt = -1
+ *                     if kind == PLACE_TEMP_SCALAR:             # <<<<<<<<<<<<<<
+ *                         dt = places[pid].block_ref
+ *                     elif kind == PLACE_TEMP_ARRAY:
+*/
+                break;
+                case __pyx_e_7sonolus_7backend_4_opt_2ir_PLACE_TEMP_ARRAY:
+
+                /* "sonolus/backend/_opt/analysis.pyx":426
+ *                         dt = places[pid].block_ref
+ *                     elif kind == PLACE_TEMP_ARRAY:
+ *                         adt = places[pid].block_ref             # <<<<<<<<<<<<<<
+ *                     can_skip = False
+ *                     if not side_eff:
+*/
+                __pyx_t_12 = (__pyx_v_places[__pyx_v_pid]).block_ref;
+
+                __pyx_v_adt = __pyx_t_12;
+
+                /* "sonolus/backend/_opt/analysis.pyx":425
+ *                     if kind == PLACE_TEMP_SCALAR:
+ *                         dt = places[pid].block_ref
+ *                     elif kind == PLACE_TEMP_ARRAY:             # <<<<<<<<<<<<<<
+ *                         adt = places[pid].block_ref
+ *                     can_skip = False
+*/
+                break;
+                default: break;
+              }
+
+              /* "sonolus/backend/_opt/analysis.pyx":427
+ *                     elif kind == PLACE_TEMP_ARRAY:
+ *                         adt = places[pid].block_ref
+ *                     can_skip = False             # <<<<<<<<<<<<<<
+ *                     if not side_eff:
+ *                         has_defs = (dt >= 0) or (adt >= 0)
+*/
+              __pyx_v_can_skip = 0;
+
+              /* "sonolus/backend/_opt/analysis.pyx":428
+ *                         adt = places[pid].block_ref
+ *                     can_skip = False
+ *                     if not side_eff:             # <<<<<<<<<<<<<<
+ *                         has_defs = (dt >= 0) or (adt >= 0)
+ *                         if has_defs:
+*/
+              __pyx_t_11 = (!(__pyx_v_side_eff != 0));
+
+              if (__pyx_t_11) {
+
+
+                /* "sonolus/backend/_opt/analysis.pyx":429
+ *                     can_skip = False
+ *                     if not side_eff:
+ *                         has_defs = (dt >= 0) or (adt >= 0)             # <<<<<<<<<<<<<<
+ *                         if has_defs:
+ *                             dlive = ((dt >= 0 and bs_get(live, dt)) or
+*/
+                __pyx_t_15 = (__pyx_v_dt >= 0);
+
+                if (!__pyx_t_15) {
+
+                } else {
+
+                  __pyx_t_11 = __pyx_t_15;
+
+                  goto __pyx_L73_bool_binop_done;
+                }
+                __pyx_t_15 = (__pyx_v_adt >= 0);
+
+
+                __pyx_t_11 = __pyx_t_15;
+
+                __pyx_L73_bool_binop_done:;
+                __pyx_v_has_defs = __pyx_t_11;
+
+                /* "sonolus/backend/_opt/analysis.pyx":430
+ *                     if not side_eff:
+ *                         has_defs = (dt >= 0) or (adt >= 0)
+ *                         if has_defs:             # <<<<<<<<<<<<<<
+ *                             dlive = ((dt >= 0 and bs_get(live, dt)) or
+ *                                      (adt >= 0 and bs_get(live, adt)))
+*/
+                if (__pyx_v_has_defs) {
+
+                  /* "sonolus/backend/_opt/analysis.pyx":431
+ *                         has_defs = (dt >= 0) or (adt >= 0)
+ *                         if has_defs:
+ *                             dlive = ((dt >= 0 and bs_get(live, dt)) or             # <<<<<<<<<<<<<<
+ *                                      (adt >= 0 and bs_get(live, adt)))
+ *                             if not dlive:
+*/
+                  __pyx_t_15 = (__pyx_v_dt >= 0);
+
+                  if (!__pyx_t_15) {
+
+                    goto __pyx_L77_next_or;
+                  } else {
+
+                  }
+                  __pyx_t_15 = __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get(__pyx_v_live, __pyx_v_dt);
+
+                  if (!__pyx_t_15) {
+
+                  } else {
+
+                    __pyx_t_11 = __pyx_t_15;
+
+                    goto __pyx_L76_bool_binop_done;
+                  }
+                  __pyx_L77_next_or:;
+
+                  /* "sonolus/backend/_opt/analysis.pyx":432
+ *                         if has_defs:
+ *                             dlive = ((dt >= 0 and bs_get(live, dt)) or
+ *                                      (adt >= 0 and bs_get(live, adt)))             # <<<<<<<<<<<<<<
+ *                             if not dlive:
+ *                                 can_skip = True
+*/
+                  __pyx_t_15 = (__pyx_v_adt >= 0);
+
+                  if (__pyx_t_15) {
+
+                  } else {
+
+                    __pyx_t_11 = __pyx_t_15;
+
+                    goto __pyx_L76_bool_binop_done;
+                  }
+                  __pyx_t_15 = __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get(__pyx_v_live, __pyx_v_adt);
+
+
+                  __pyx_t_11 = __pyx_t_15;
+
+                  __pyx_L76_bool_binop_done:;
+                  __pyx_v_dlive = __pyx_t_11;
+
+                  /* "sonolus/backend/_opt/analysis.pyx":433
+ *                             dlive = ((dt >= 0 and bs_get(live, dt)) or
+ *                                      (adt >= 0 and bs_get(live, adt)))
+ *                             if not dlive:             # <<<<<<<<<<<<<<
+ *                                 can_skip = True
+ *                     if can_skip:
+*/
+                  __pyx_t_11 = (!__pyx_v_dlive);
+
+                  if (__pyx_t_11) {
+
+
+                    /* "sonolus/backend/_opt/analysis.pyx":434
+ *                                      (adt >= 0 and bs_get(live, adt)))
+ *                             if not dlive:
+ *                                 can_skip = True             # <<<<<<<<<<<<<<
+ *                     if can_skip:
+ *                         continue
+*/
+                    __pyx_v_can_skip = 1;
+
+                    /* "sonolus/backend/_opt/analysis.pyx":433
+ *                             dlive = ((dt >= 0 and bs_get(live, dt)) or
+ *                                      (adt >= 0 and bs_get(live, adt)))
+ *                             if not dlive:             # <<<<<<<<<<<<<<
+ *                                 can_skip = True
+ *                     if can_skip:
+*/
+                  }
+
+                  /* "sonolus/backend/_opt/analysis.pyx":430
+ *                     if not side_eff:
+ *                         has_defs = (dt >= 0) or (adt >= 0)
+ *                         if has_defs:             # <<<<<<<<<<<<<<
+ *                             dlive = ((dt >= 0 and bs_get(live, dt)) or
+ *                                      (adt >= 0 and bs_get(live, adt)))
+*/
+                }
+
+                /* "sonolus/backend/_opt/analysis.pyx":428
+ *                         adt = places[pid].block_ref
+ *                     can_skip = False
+ *                     if not side_eff:             # <<<<<<<<<<<<<<
+ *                         has_defs = (dt >= 0) or (adt >= 0)
+ *                         if has_defs:
+*/
+              }
+
+              /* "sonolus/backend/_opt/analysis.pyx":435
+ *                             if not dlive:
+ *                                 can_skip = True
+ *                     if can_skip:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     if dt >= 0:
+*/
+              if (__pyx_v_can_skip) {
+
+                /* "sonolus/backend/_opt/analysis.pyx":436
+ *                                 can_skip = True
+ *                     if can_skip:
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     if dt >= 0:
+ *                         bs_clear(live, dt)
+*/
+                goto __pyx_L68_continue;
+
+                /* "sonolus/backend/_opt/analysis.pyx":435
+ *                             if not dlive:
+ *                                 can_skip = True
+ *                     if can_skip:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     if dt >= 0:
+*/
+              }
+
+              /* "sonolus/backend/_opt/analysis.pyx":437
+ *                     if can_skip:
+ *                         continue
+ *                     if dt >= 0:             # <<<<<<<<<<<<<<
+ *                         bs_clear(live, dt)
+ *                     if L.is_array_init[i] and adt >= 0:
+*/
+              __pyx_t_11 = (__pyx_v_dt >= 0);
+
+              if (__pyx_t_11) {
+
+
+                /* "sonolus/backend/_opt/analysis.pyx":438
+ *                         continue
+ *                     if dt >= 0:
+ *                         bs_clear(live, dt)             # <<<<<<<<<<<<<<
+ *                     if L.is_array_init[i] and adt >= 0:
+ *                         bs_clear(live, adt)
+*/
+                __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_clear(__pyx_v_live, __pyx_v_dt);
+
+                /* "sonolus/backend/_opt/analysis.pyx":437
+ *                     if can_skip:
+ *                         continue
+ *                     if dt >= 0:             # <<<<<<<<<<<<<<
+ *                         bs_clear(live, dt)
+ *                     if L.is_array_init[i] and adt >= 0:
+*/
+              }
+
+              /* "sonolus/backend/_opt/analysis.pyx":439
+ *                     if dt >= 0:
+ *                         bs_clear(live, dt)
+ *                     if L.is_array_init[i] and adt >= 0:             # <<<<<<<<<<<<<<
+ *                         bs_clear(live, adt)
+ *                     _gen_place_write(instrs, args, places, live, pid)
+*/
+              __pyx_t_15 = ((__pyx_v_L->is_array_init[__pyx_v_i]) != 0);
+
+              if (__pyx_t_15) {
+
+              } else {
+
+                __pyx_t_11 = __pyx_t_15;
+
+                goto __pyx_L84_bool_binop_done;
+              }
+              __pyx_t_15 = (__pyx_v_adt >= 0);
+
+
+              __pyx_t_11 = __pyx_t_15;
+
+              __pyx_L84_bool_binop_done:;
+              if (__pyx_t_11) {
+
+
+                /* "sonolus/backend/_opt/analysis.pyx":440
+ *                         bs_clear(live, dt)
+ *                     if L.is_array_init[i] and adt >= 0:
+ *                         bs_clear(live, adt)             # <<<<<<<<<<<<<<
+ *                     _gen_place_write(instrs, args, places, live, pid)
+ *                     _gen_value(instrs, args, places, live, vid)
+*/
+                __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_clear(__pyx_v_live, __pyx_v_adt);
+
+                /* "sonolus/backend/_opt/analysis.pyx":439
+ *                     if dt >= 0:
+ *                         bs_clear(live, dt)
+ *                     if L.is_array_init[i] and adt >= 0:             # <<<<<<<<<<<<<<
+ *                         bs_clear(live, adt)
+ *                     _gen_place_write(instrs, args, places, live, pid)
+*/
+              }
+
+              /* "sonolus/backend/_opt/analysis.pyx":441
+ *                     if L.is_array_init[i] and adt >= 0:
+ *                         bs_clear(live, adt)
+ *                     _gen_place_write(instrs, args, places, live, pid)             # <<<<<<<<<<<<<<
+ *                     _gen_value(instrs, args, places, live, vid)
+ *                 else:
+*/
+              __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_place_write(__pyx_v_instrs, __pyx_v_args, __pyx_v_places, __pyx_v_live, __pyx_v_pid);
+
+              /* "sonolus/backend/_opt/analysis.pyx":442
+ *                         bs_clear(live, adt)
+ *                     _gen_place_write(instrs, args, places, live, pid)
+ *                     _gen_value(instrs, args, places, live, vid)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     # Bare side-effecting statement root.
+*/
+              __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_value(__pyx_v_instrs, __pyx_v_args, __pyx_v_places, __pyx_v_live, __pyx_v_vid);
+
+              /* "sonolus/backend/_opt/analysis.pyx":416
+ *                 memcpy(&L.root_live[<int64_t>rs * nw], live, <size_t>nw * sizeof(uint64_t))
+ *                 op = instrs[i].op
+ *                 if op == OPX_SET:             # <<<<<<<<<<<<<<
+ *                     vid = <int32_t>args[instrs[i].arg_start]
+ *                     pid = instrs[i].aux
+*/
+              goto __pyx_L71;
+            }
+
+            /* "sonolus/backend/_opt/analysis.pyx":445
+ *                 else:
+ *                     # Bare side-effecting statement root.
+ *                     _gen_value(instrs, args, places, live, i)             # <<<<<<<<<<<<<<
+ * 
+ *             # live is now live_in[b]; always propagate to predecessors so a
+*/
+            /*else*/ {
+              __pyx_f_7sonolus_7backend_4_opt_8analysis__gen_value(__pyx_v_instrs, __pyx_v_args, __pyx_v_places, __pyx_v_live, __pyx_v_i);
+            }
+            __pyx_L71:;
+            __pyx_L68_continue:;
+          }
+
+
+          /* "sonolus/backend/_opt/analysis.pyx":450
+ *             # first-touch reaches them even when live_in is empty. Re-enqueue a
+ *             # predecessor when it is first touched or its live_out grew.
+ *             memcpy(&L.live_in[<int64_t>b * nw], live, <size_t>nw * sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *             for e in range(pred_head[b], pred_head[b + 1]):
+ *                 s = pred_src[e]
+*/
+          (void)(memcpy((&(__pyx_v_L->live_in[(((int64_t)__pyx_v_b) * __pyx_v_nw)])), __pyx_v_live, (((size_t)__pyx_v_nw) * (sizeof(uint64_t)))));
+
+          /* "sonolus/backend/_opt/analysis.pyx":451
+ *             # predecessor when it is first touched or its live_out grew.
+ *             memcpy(&L.live_in[<int64_t>b * nw], live, <size_t>nw * sizeof(uint64_t))
+ *             for e in range(pred_head[b], pred_head[b + 1]):             # <<<<<<<<<<<<<<
+ *                 s = pred_src[e]
+ *                 changed = _or_into(&L.live_out[<int64_t>s * nw], live, nw)
+*/
+
+          __pyx_t_4 = (__pyx_v_pred_head[(__pyx_v_b + 1)]);
+          __pyx_t_12 = __pyx_t_4;
+
+          for (__pyx_t_13 = (__pyx_v_pred_head[__pyx_v_b]); __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+            __pyx_v_e = __pyx_t_13;
+
+            /* "sonolus/backend/_opt/analysis.pyx":452
+ *             memcpy(&L.live_in[<int64_t>b * nw], live, <size_t>nw * sizeof(uint64_t))
+ *             for e in range(pred_head[b], pred_head[b + 1]):
+ *                 s = pred_src[e]             # <<<<<<<<<<<<<<
+ *                 changed = _or_into(&L.live_out[<int64_t>s * nw], live, nw)
+ *                 if (not visited[s]) or changed:
+*/
+            __pyx_v_s = (__pyx_v_pred_src[__pyx_v_e]);
+
+            /* "sonolus/backend/_opt/analysis.pyx":453
+ *             for e in range(pred_head[b], pred_head[b + 1]):
+ *                 s = pred_src[e]
+ *                 changed = _or_into(&L.live_out[<int64_t>s * nw], live, nw)             # <<<<<<<<<<<<<<
+ *                 if (not visited[s]) or changed:
+ *                     visited[s] = 1
+*/
+            __pyx_v_changed = __pyx_f_7sonolus_7backend_4_opt_8analysis__or_into((&(__pyx_v_L->live_out[(((int64_t)__pyx_v_s) * __pyx_v_nw)])), __pyx_v_live, __pyx_v_nw);
+
+            /* "sonolus/backend/_opt/analysis.pyx":454
+ *                 s = pred_src[e]
+ *                 changed = _or_into(&L.live_out[<int64_t>s * nw], live, nw)
+ *                 if (not visited[s]) or changed:             # <<<<<<<<<<<<<<
+ *                     visited[s] = 1
+ *                     if not inq[s]:
+*/
+            __pyx_t_15 = (!((__pyx_v_visited[__pyx_v_s]) != 0));
+
+            if (!__pyx_t_15) {
+
+            } else {
+
+              __pyx_t_11 = __pyx_t_15;
+
+              goto __pyx_L89_bool_binop_done;
+            }
+
+            __pyx_t_11 = __pyx_v_changed;
+            __pyx_L89_bool_binop_done:;
+            if (__pyx_t_11) {
+
+
+              /* "sonolus/backend/_opt/analysis.pyx":455
+ *                 changed = _or_into(&L.live_out[<int64_t>s * nw], live, nw)
+ *                 if (not visited[s]) or changed:
+ *                     visited[s] = 1             # <<<<<<<<<<<<<<
+ *                     if not inq[s]:
+ *                         stack[sp] = s
+*/
+              (__pyx_v_visited[__pyx_v_s]) = 1;
+
+              /* "sonolus/backend/_opt/analysis.pyx":456
+ *                 if (not visited[s]) or changed:
+ *                     visited[s] = 1
+ *                     if not inq[s]:             # <<<<<<<<<<<<<<
+ *                         stack[sp] = s
+ *                         sp += 1
+*/
+              __pyx_t_11 = (!((__pyx_v_inq[__pyx_v_s]) != 0));
+
+              if (__pyx_t_11) {
+
+
+                /* "sonolus/backend/_opt/analysis.pyx":457
+ *                     visited[s] = 1
+ *                     if not inq[s]:
+ *                         stack[sp] = s             # <<<<<<<<<<<<<<
+ *                         sp += 1
+ *                         inq[s] = 1
+*/
+                (__pyx_v_stack[__pyx_v_sp]) = __pyx_v_s;
+
+                /* "sonolus/backend/_opt/analysis.pyx":458
+ *                     if not inq[s]:
+ *                         stack[sp] = s
+ *                         sp += 1             # <<<<<<<<<<<<<<
+ *                         inq[s] = 1
+ * 
+*/
+                __pyx_v_sp = (__pyx_v_sp + 1);
+
+                /* "sonolus/backend/_opt/analysis.pyx":459
+ *                         stack[sp] = s
+ *                         sp += 1
+ *                         inq[s] = 1             # <<<<<<<<<<<<<<
+ * 
+ *     free(array_defs_in)
+*/
+                (__pyx_v_inq[__pyx_v_s]) = 1;
+
+                /* "sonolus/backend/_opt/analysis.pyx":456
+ *                 if (not visited[s]) or changed:
+ *                     visited[s] = 1
+ *                     if not inq[s]:             # <<<<<<<<<<<<<<
+ *                         stack[sp] = s
+ *                         sp += 1
+*/
+              }
+
+              /* "sonolus/backend/_opt/analysis.pyx":454
+ *                 s = pred_src[e]
+ *                 changed = _or_into(&L.live_out[<int64_t>s * nw], live, nw)
+ *                 if (not visited[s]) or changed:             # <<<<<<<<<<<<<<
+ *                     visited[s] = 1
+ *                     if not inq[s]:
+*/
+            }
+          }
+
+        }
+      }
+
+      /* "sonolus/backend/_opt/analysis.pyx":335
+ *     cdef bint can_skip, has_defs, dlive, changed
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         # ---- forward array-init pass (from entry) ------------------------
+ *         sp = 0
+*/
+      /*finally:*/ {
+        /*normal exit:*/{
+          __Pyx_FastGIL_Forget();
+          PyEval_RestoreThread(_save);
+          goto __pyx_L46;
+        }
+        __pyx_L46:;
+      }
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":461
+ *                         inq[s] = 1
+ * 
+ *     free(array_defs_in)             # <<<<<<<<<<<<<<
+ *     free(array_written)
+ *     free(acc)
+*/
+  free(__pyx_v_array_defs_in);
+
+  /* "sonolus/backend/_opt/analysis.pyx":462
+ * 
+ *     free(array_defs_in)
+ *     free(array_written)             # <<<<<<<<<<<<<<
+ *     free(acc)
+ *     free(live)
+*/
+  free(__pyx_v_array_written);
+
+  /* "sonolus/backend/_opt/analysis.pyx":463
+ *     free(array_defs_in)
+ *     free(array_written)
+ *     free(acc)             # <<<<<<<<<<<<<<
+ *     free(live)
+ *     free(visited)
+*/
+  free(__pyx_v_acc);
+
+  /* "sonolus/backend/_opt/analysis.pyx":464
+ *     free(array_written)
+ *     free(acc)
+ *     free(live)             # <<<<<<<<<<<<<<
+ *     free(visited)
+ *     free(inq)
+*/
+  free(__pyx_v_live);
+
+  /* "sonolus/backend/_opt/analysis.pyx":465
+ *     free(acc)
+ *     free(live)
+ *     free(visited)             # <<<<<<<<<<<<<<
+ *     free(inq)
+ *     free(stack)
+*/
+  free(__pyx_v_visited);
+
+  /* "sonolus/backend/_opt/analysis.pyx":466
+ *     free(live)
+ *     free(visited)
+ *     free(inq)             # <<<<<<<<<<<<<<
+ *     free(stack)
+ *     free(pred_head)
+*/
+  free(__pyx_v_inq);
+
+  /* "sonolus/backend/_opt/analysis.pyx":467
+ *     free(visited)
+ *     free(inq)
+ *     free(stack)             # <<<<<<<<<<<<<<
+ *     free(pred_head)
+ *     free(pred_src)
+*/
+  free(__pyx_v_stack);
+
+  /* "sonolus/backend/_opt/analysis.pyx":468
+ *     free(inq)
+ *     free(stack)
+ *     free(pred_head)             # <<<<<<<<<<<<<<
+ *     free(pred_src)
+ *     return L
+*/
+  free(__pyx_v_pred_head);
+
+  /* "sonolus/backend/_opt/analysis.pyx":469
+ *     free(stack)
+ *     free(pred_head)
+ *     free(pred_src)             # <<<<<<<<<<<<<<
+ *     return L
+ * 
+*/
+  free(__pyx_v_pred_src);
+
+  /* "sonolus/backend/_opt/analysis.pyx":470
+ *     free(pred_head)
+ *     free(pred_src)
+ *     return L             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+    struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF((PyObject *)__pyx_v_L);
+      __pyx_r = __pyx_v_L;
+    }
+    __Pyx_XDECREF((PyObject *)__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":219
+ * # --------------------------------------------------------------------------
+ * 
+ * cdef Liveness compute_liveness(Func func):             # <<<<<<<<<<<<<<
+ *     cdef Liveness L = Liveness()
+ *     L.func = func
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.compute_liveness", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_L);
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":477
+ * # --------------------------------------------------------------------------
+ * 
+ * def liveness_debug(entry, mode=None, callback=None):             # <<<<<<<<<<<<<<
+ *     """Marshal ``entry`` into an arena, compute liveness, return name-set dicts.
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_1liveness_debug(PyObject *__pyx_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_7sonolus_7backend_4_opt_8analysis_liveness_debug, "Marshal ``entry`` into an arena, compute liveness, return name-set dicts.\n\n    Returns ``{\"live_in\", \"live_out\", \"stmt_live\", \"array_defs_out\",\n    \"is_array_init\", \"n_blocks\"}`` where the block keys are arena block ids\n    (reverse-postorder, matching ``traverse_cfg_reverse_postorder(entry)``) and\n    values are sets of the original source temp names. ``stmt_live`` maps\n    statement-root instr indices to their live-out sets; ``is_array_init`` maps\n    OPX_SET instr indices to whether that write is the array\047s first.\n    ");
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_1liveness_debug = {"liveness_debug", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_1liveness_debug, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7sonolus_7backend_4_opt_8analysis_liveness_debug};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_1liveness_debug(PyObject *__pyx_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_entry = 0;
+  PyObject *__pyx_v_mode = 0;
+  PyObject *__pyx_v_callback = 0;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("liveness_debug (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_entry,&__pyx_mstate_global->__pyx_n_u_mode,&__pyx_mstate_global->__pyx_n_u_callback,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(0, 477, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 477, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 477, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 477, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "liveness_debug", 0) < (0)) __PYX_ERR(0, 477, __pyx_L3_error)
+      if (!values[1]) values[1] = __Pyx_NewRef(((PyObject *)Py_None));
+      if (!values[2]) values[2] = __Pyx_NewRef(((PyObject *)Py_None));
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("liveness_debug", 0, 1, 3, i); __PYX_ERR(0, 477, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 477, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 477, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 477, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      if (!values[1]) values[1] = __Pyx_NewRef(((PyObject *)Py_None));
+      if (!values[2]) values[2] = __Pyx_NewRef(((PyObject *)Py_None));
+    }
+    __pyx_v_entry = values[0];
+    __pyx_v_mode = values[1];
+    __pyx_v_callback = values[2];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("liveness_debug", 0, 1, 3, __pyx_nargs); __PYX_ERR(0, 477, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.liveness_debug", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_liveness_debug(__pyx_self, __pyx_v_entry, __pyx_v_mode, __pyx_v_callback);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_liveness_debug(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_entry, PyObject *__pyx_v_mode, PyObject *__pyx_v_callback) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_func = 0;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *__pyx_v_L = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("liveness_debug", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":487
+ *     OPX_SET instr indices to whether that write is the array's first.
+ *     """
+ *     cdef Func func = <Func>marshal_in(entry, mode, callback)             # <<<<<<<<<<<<<<
+ *     func.verify()
+ *     cdef Liveness L = compute_liveness(func)
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_marshal_in); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 487, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[4] = {__pyx_t_2, __pyx_v_entry, __pyx_v_mode, __pyx_v_callback};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (4-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 487, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_3 = __pyx_t_1;
+  __Pyx_INCREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":488
+ *     """
+ *     cdef Func func = <Func>marshal_in(entry, mode, callback)
+ *     func.verify()             # <<<<<<<<<<<<<<
+ *     cdef Liveness L = compute_liveness(func)
+ *     return {
+*/
+  __pyx_t_1 = ((PyObject *)__pyx_v_func);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, NULL};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_verify, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 488, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":489
+ *     cdef Func func = <Func>marshal_in(entry, mode, callback)
+ *     func.verify()
+ *     cdef Liveness L = compute_liveness(func)             # <<<<<<<<<<<<<<
+ *     return {
+ *         "live_in": L.live_in_names(),
+*/
+  __pyx_t_3 = ((PyObject *)__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_liveness(__pyx_v_func)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 489, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_L = ((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":491
+ *     cdef Liveness L = compute_liveness(func)
+ *     return {
+ *         "live_in": L.live_in_names(),             # <<<<<<<<<<<<<<
+ *         "live_out": L.live_out_names(),
+ *         "stmt_live": L.root_live_names(),
+*/
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = ((PyObject *)__pyx_v_L);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_live_in_names, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 491, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_live_in, __pyx_t_1) < (0)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":492
+ *     return {
+ *         "live_in": L.live_in_names(),
+ *         "live_out": L.live_out_names(),             # <<<<<<<<<<<<<<
+ *         "stmt_live": L.root_live_names(),
+ *         "array_defs_out": L.array_defs_out_names(),
+*/
+  __pyx_t_2 = ((PyObject *)__pyx_v_L);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_live_out_names, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 492, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_live_out, __pyx_t_1) < (0)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":493
+ *         "live_in": L.live_in_names(),
+ *         "live_out": L.live_out_names(),
+ *         "stmt_live": L.root_live_names(),             # <<<<<<<<<<<<<<
+ *         "array_defs_out": L.array_defs_out_names(),
+ *         "is_array_init": L.is_array_init_map(),
+*/
+  __pyx_t_2 = ((PyObject *)__pyx_v_L);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_root_live_names, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 493, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_stmt_live, __pyx_t_1) < (0)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":494
+ *         "live_out": L.live_out_names(),
+ *         "stmt_live": L.root_live_names(),
+ *         "array_defs_out": L.array_defs_out_names(),             # <<<<<<<<<<<<<<
+ *         "is_array_init": L.is_array_init_map(),
+ *         "n_blocks": L.n_blocks,
+*/
+  __pyx_t_2 = ((PyObject *)__pyx_v_L);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_array_defs_out_names, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 494, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array_defs_out, __pyx_t_1) < (0)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":495
+ *         "stmt_live": L.root_live_names(),
+ *         "array_defs_out": L.array_defs_out_names(),
+ *         "is_array_init": L.is_array_init_map(),             # <<<<<<<<<<<<<<
+ *         "n_blocks": L.n_blocks,
+ *     }
+*/
+  __pyx_t_2 = ((PyObject *)__pyx_v_L);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_is_array_init_map, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 495, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_is_array_init, __pyx_t_1) < (0)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":496
+ *         "array_defs_out": L.array_defs_out_names(),
+ *         "is_array_init": L.is_array_init_map(),
+ *         "n_blocks": L.n_blocks,             # <<<<<<<<<<<<<<
+ *     }
+ * 
+*/
+  __pyx_t_1 = __Pyx_PyLong_From_int32_t(__pyx_v_L->n_blocks); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 496, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_n_blocks, __pyx_t_1) < (0)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_3;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":477
+ * # --------------------------------------------------------------------------
+ * 
+ * def liveness_debug(entry, mode=None, callback=None):             # <<<<<<<<<<<<<<
+ *     """Marshal ``entry`` into an arena, compute liveness, return name-set dicts.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.liveness_debug", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_func);
+  __Pyx_XDECREF((PyObject *)__pyx_v_L);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":505
+ * 
+ * cdef class Dominators:
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self.func = None
+ *         self.n_blocks = 0
+*/
+
+/* Python wrapper */
+static int __pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_1__cinit__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL_TPNEW
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static int __pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_1__cinit__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL_TPNEW
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL_TPNEW
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL_TPNEW
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL_TPNEW(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, __pyx_nargs); return -1; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL_TPNEW(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return -1;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__cinit__", __pyx_kwds); return -1;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators___cinit__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators___cinit__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":506
+ * cdef class Dominators:
+ *     def __cinit__(self):
+ *         self.func = None             # <<<<<<<<<<<<<<
+ *         self.n_blocks = 0
+ *         self.idom = NULL
+*/
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF((PyObject *)__pyx_v_self->func);
+  __Pyx_DECREF((PyObject *)__pyx_v_self->func);
+  __pyx_v_self->func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)Py_None);
+
+  /* "sonolus/backend/_opt/analysis.pyx":507
+ *     def __cinit__(self):
+ *         self.func = None
+ *         self.n_blocks = 0             # <<<<<<<<<<<<<<
+ *         self.idom = NULL
+ *         self.tin = NULL
+*/
+  __pyx_v_self->n_blocks = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":508
+ *         self.func = None
+ *         self.n_blocks = 0
+ *         self.idom = NULL             # <<<<<<<<<<<<<<
+ *         self.tin = NULL
+ *         self.tout = NULL
+*/
+  __pyx_v_self->idom = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":509
+ *         self.n_blocks = 0
+ *         self.idom = NULL
+ *         self.tin = NULL             # <<<<<<<<<<<<<<
+ *         self.tout = NULL
+ *         self.pred_head = NULL
+*/
+  __pyx_v_self->tin = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":510
+ *         self.idom = NULL
+ *         self.tin = NULL
+ *         self.tout = NULL             # <<<<<<<<<<<<<<
+ *         self.pred_head = NULL
+ *         self.pred_src = NULL
+*/
+  __pyx_v_self->tout = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":511
+ *         self.tin = NULL
+ *         self.tout = NULL
+ *         self.pred_head = NULL             # <<<<<<<<<<<<<<
+ *         self.pred_src = NULL
+ *         self.child_head = NULL
+*/
+  __pyx_v_self->pred_head = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":512
+ *         self.tout = NULL
+ *         self.pred_head = NULL
+ *         self.pred_src = NULL             # <<<<<<<<<<<<<<
+ *         self.child_head = NULL
+ *         self.child_list = NULL
+*/
+  __pyx_v_self->pred_src = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":513
+ *         self.pred_head = NULL
+ *         self.pred_src = NULL
+ *         self.child_head = NULL             # <<<<<<<<<<<<<<
+ *         self.child_list = NULL
+ * 
+*/
+  __pyx_v_self->child_head = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":514
+ *         self.pred_src = NULL
+ *         self.child_head = NULL
+ *         self.child_list = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+*/
+  __pyx_v_self->child_list = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":505
+ * 
+ * cdef class Dominators:
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self.func = None
+ *         self.n_blocks = 0
+*/
+
+  /* function exit code */
+  __pyx_r = 0;
+
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":516
+ *         self.child_list = NULL
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.idom)
+ *         free(self.tin)
+*/
+
+/* Python wrapper */
+static void __pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_3__dealloc__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_2__dealloc__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_2__dealloc__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self) {
+
+  /* "sonolus/backend/_opt/analysis.pyx":517
+ * 
+ *     def __dealloc__(self):
+ *         free(self.idom)             # <<<<<<<<<<<<<<
+ *         free(self.tin)
+ *         free(self.tout)
+*/
+  free(__pyx_v_self->idom);
+
+  /* "sonolus/backend/_opt/analysis.pyx":518
+ *     def __dealloc__(self):
+ *         free(self.idom)
+ *         free(self.tin)             # <<<<<<<<<<<<<<
+ *         free(self.tout)
+ *         free(self.pred_head)
+*/
+  free(__pyx_v_self->tin);
+
+  /* "sonolus/backend/_opt/analysis.pyx":519
+ *         free(self.idom)
+ *         free(self.tin)
+ *         free(self.tout)             # <<<<<<<<<<<<<<
+ *         free(self.pred_head)
+ *         free(self.pred_src)
+*/
+  free(__pyx_v_self->tout);
+
+  /* "sonolus/backend/_opt/analysis.pyx":520
+ *         free(self.tin)
+ *         free(self.tout)
+ *         free(self.pred_head)             # <<<<<<<<<<<<<<
+ *         free(self.pred_src)
+ *         free(self.child_head)
+*/
+  free(__pyx_v_self->pred_head);
+
+  /* "sonolus/backend/_opt/analysis.pyx":521
+ *         free(self.tout)
+ *         free(self.pred_head)
+ *         free(self.pred_src)             # <<<<<<<<<<<<<<
+ *         free(self.child_head)
+ *         free(self.child_list)
+*/
+  free(__pyx_v_self->pred_src);
+
+  /* "sonolus/backend/_opt/analysis.pyx":522
+ *         free(self.pred_head)
+ *         free(self.pred_src)
+ *         free(self.child_head)             # <<<<<<<<<<<<<<
+ *         free(self.child_list)
+ * 
+*/
+  free(__pyx_v_self->child_head);
+
+  /* "sonolus/backend/_opt/analysis.pyx":523
+ *         free(self.pred_src)
+ *         free(self.child_head)
+ *         free(self.child_list)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint dominates(self, int32_t a, int32_t b) noexcept nogil:
+*/
+  free(__pyx_v_self->child_list);
+
+  /* "sonolus/backend/_opt/analysis.pyx":516
+ *         self.child_list = NULL
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.idom)
+ *         free(self.tin)
+*/
+
+  /* function exit code */
+
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":525
+ *         free(self.child_list)
+ * 
+ *     cdef bint dominates(self, int32_t a, int32_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         # a dominates b iff a's Euler interval encloses b's (reflexive).
+ *         return self.tin[a] <= self.tin[b] and self.tout[b] <= self.tout[a]
+*/
+
+static int __pyx_f_7sonolus_7backend_4_opt_8analysis_10Dominators_dominates(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self, int32_t __pyx_v_a, int32_t __pyx_v_b) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "sonolus/backend/_opt/analysis.pyx":527
+ *     cdef bint dominates(self, int32_t a, int32_t b) noexcept nogil:
+ *         # a dominates b iff a's Euler interval encloses b's (reflexive).
+ *         return self.tin[a] <= self.tin[b] and self.tout[b] <= self.tout[a]             # <<<<<<<<<<<<<<
+ * 
+ *     # --- python debug accessors ------------------------------------------
+*/
+  __pyx_t_2 = ((__pyx_v_self->tin[__pyx_v_a]) <= (__pyx_v_self->tin[__pyx_v_b]));
+
+  if (__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_self->tout[__pyx_v_b]) <= (__pyx_v_self->tout[__pyx_v_a]));
+
+
+  __pyx_t_1 = __pyx_t_2;
+
+  __pyx_L3_bool_binop_done:;
+  {
+    __pyx_r = __pyx_t_1;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":525
+ *         free(self.child_list)
+ * 
+ *     cdef bint dominates(self, int32_t a, int32_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         # a dominates b iff a's Euler interval encloses b's (reflexive).
+ *         return self.tin[a] <= self.tin[b] and self.tout[b] <= self.tout[a]
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":531
+ *     # --- python debug accessors ------------------------------------------
+ * 
+ *     def idom_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_5idom_map(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10Dominators_5idom_map = {"idom_map", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_5idom_map, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_5idom_map(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("idom_map (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("idom_map", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("idom_map", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_4idom_map(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_4idom_map(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self) {
+  PyObject *__pyx_v_d = 0;
+  int32_t __pyx_v_b;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("idom_map", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":532
+ * 
+ *     def idom_map(self):
+ *         cdef dict d = {}             # <<<<<<<<<<<<<<
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_d = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":534
+ *         cdef dict d = {}
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):             # <<<<<<<<<<<<<<
+ *             d[b] = self.idom[b]
+ *         return d
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_blocks;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_b = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":535
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+ *             d[b] = self.idom[b]             # <<<<<<<<<<<<<<
+ *         return d
+ * 
+*/
+    __pyx_t_1 = __Pyx_PyLong_From_int32_t((__pyx_v_self->idom[__pyx_v_b])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 535, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyLong_From_int32_t(__pyx_v_b); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 535, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (unlikely((PyDict_SetItem(__pyx_v_d, __pyx_t_5, __pyx_t_1) < 0))) __PYX_ERR(0, 535, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":536
+ *         for b in range(self.n_blocks):
+ *             d[b] = self.idom[b]
+ *         return d             # <<<<<<<<<<<<<<
+ * 
+ *     def children_map(self):
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_d);
+      __pyx_r = __pyx_v_d;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":531
+ *     # --- python debug accessors ------------------------------------------
+ * 
+ *     def idom_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Dominators.idom_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_d);
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":538
+ *         return d
+ * 
+ *     def children_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b, k
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_7children_map(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10Dominators_7children_map = {"children_map", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_7children_map, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_7children_map(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("children_map (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("children_map", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("children_map", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_6children_map(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_6children_map(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self) {
+  PyObject *__pyx_v_d = 0;
+  int32_t __pyx_v_b;
+  int32_t __pyx_7genexpr__pyx_v_k;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  int32_t __pyx_t_5;
+  int32_t __pyx_t_6;
+  int32_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("children_map", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":539
+ * 
+ *     def children_map(self):
+ *         cdef dict d = {}             # <<<<<<<<<<<<<<
+ *         cdef int32_t b, k
+ *         for b in range(self.n_blocks):
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_d = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":541
+ *         cdef dict d = {}
+ *         cdef int32_t b, k
+ *         for b in range(self.n_blocks):             # <<<<<<<<<<<<<<
+ *             d[b] = [self.child_list[k] for k in range(self.child_head[b], self.child_head[b + 1])]
+ *         return d
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_blocks;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_b = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":542
+ *         cdef int32_t b, k
+ *         for b in range(self.n_blocks):
+ *             d[b] = [self.child_list[k] for k in range(self.child_head[b], self.child_head[b + 1])]             # <<<<<<<<<<<<<<
+ *         return d
+ * 
+*/
+    { /* enter inner scope */
+      __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 542, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+
+      __pyx_t_5 = (__pyx_v_self->child_head[(__pyx_v_b + 1)]);
+      __pyx_t_6 = __pyx_t_5;
+
+      for (__pyx_t_7 = (__pyx_v_self->child_head[__pyx_v_b]); __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+        __pyx_7genexpr__pyx_v_k = __pyx_t_7;
+        __pyx_t_8 = __Pyx_PyLong_From_int32_t((__pyx_v_self->child_list[__pyx_7genexpr__pyx_v_k])); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 542, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_GIVEREF(__pyx_t_8);
+        if (unlikely(__Pyx_ListComp_AppendAndDecref(__pyx_t_1, __pyx_t_8))) __PYX_ERR(0, 542, __pyx_L1_error)
+        __pyx_t_8 = 0;
+      }
+
+    } /* exit inner scope */
+    __pyx_t_8 = __Pyx_PyLong_From_int32_t(__pyx_v_b); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 542, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (unlikely((PyDict_SetItem(__pyx_v_d, __pyx_t_8, __pyx_t_1) < 0))) __PYX_ERR(0, 542, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":543
+ *         for b in range(self.n_blocks):
+ *             d[b] = [self.child_list[k] for k in range(self.child_head[b], self.child_head[b + 1])]
+ *         return d             # <<<<<<<<<<<<<<
+ * 
+ *     def dominates_q(self, int a, int b):
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_d);
+      __pyx_r = __pyx_v_d;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":538
+ *         return d
+ * 
+ *     def children_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b, k
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Dominators.children_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_d);
+
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":545
+ *         return d
+ * 
+ *     def dominates_q(self, int a, int b):             # <<<<<<<<<<<<<<
+ *         return bool(self.dominates(<int32_t>a, <int32_t>b))
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_9dominates_q(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10Dominators_9dominates_q = {"dominates_q", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_9dominates_q, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_9dominates_q(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  int __pyx_v_a;
+  int __pyx_v_b;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("dominates_q (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_a,&__pyx_mstate_global->__pyx_n_u_b,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(0, 545, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 545, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 545, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "dominates_q", 0) < (0)) __PYX_ERR(0, 545, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("dominates_q", 1, 2, 2, i); __PYX_ERR(0, 545, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 545, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 545, __pyx_L3_error)
+    }
+    __pyx_v_a = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_a == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 545, __pyx_L3_error)
+    __pyx_v_b = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_b == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 545, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("dominates_q", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 545, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Dominators.dominates_q", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_8dominates_q(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_v_self), __pyx_v_a, __pyx_v_b);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+
+
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_8dominates_q(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self, int __pyx_v_a, int __pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("dominates_q", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":546
+ * 
+ *     def dominates_q(self, int a, int b):
+ *         return bool(self.dominates(<int32_t>a, <int32_t>b))             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_1 = ((struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_v_self->__pyx_vtab)->dominates(__pyx_v_self, ((int32_t)__pyx_v_a), ((int32_t)__pyx_v_b));
+
+  __pyx_t_2 = __Pyx_PyBool_FromLong((!(!__pyx_t_1))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_2;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":545
+ *         return d
+ * 
+ *     def dominates_q(self, int a, int b):             # <<<<<<<<<<<<<<
+ *         return bool(self.dominates(<int32_t>a, <int32_t>b))
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Dominators.dominates_q", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_11__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10Dominators_11__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_11__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_11__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__reduce_cython__", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_10__reduce_cython__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Dominators.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_13__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10Dominators_13__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_13__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_13__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  CYTHON_UNUSED PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(1, 3, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__setstate_cython__", 0) < (0)) __PYX_ERR(1, 3, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, i); __PYX_ERR(1, 3, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+    }
+    __pyx_v___pyx_state = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 3, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Dominators.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_12__setstate_cython__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_v_self), __pyx_v___pyx_state);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10Dominators_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.Dominators.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":549
+ * 
+ * 
+ * cdef int32_t _dom_intersect(int32_t* idom, int32_t a, int32_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # CHK "intersect": walk the two fingers up (by id == RPO number) to the
+ *     # nearest common dominator.
+*/
+
+static int32_t __pyx_f_7sonolus_7backend_4_opt_8analysis__dom_intersect(int32_t *__pyx_v_idom, int32_t __pyx_v_a, int32_t __pyx_v_b) {
+  int32_t __pyx_r;
+  int __pyx_t_1;
+
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":552
+ *     # CHK "intersect": walk the two fingers up (by id == RPO number) to the
+ *     # nearest common dominator.
+ *     while a != b:             # <<<<<<<<<<<<<<
+ *         while a > b:
+ *             a = idom[a]
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_a != __pyx_v_b);
+
+
+    if (!__pyx_t_1) break;
+
+    /* "sonolus/backend/_opt/analysis.pyx":553
+ *     # nearest common dominator.
+ *     while a != b:
+ *         while a > b:             # <<<<<<<<<<<<<<
+ *             a = idom[a]
+ *         while b > a:
+*/
+    while (1) {
+      __pyx_t_1 = (__pyx_v_a > __pyx_v_b);
+
+
+      if (!__pyx_t_1) break;
+
+      /* "sonolus/backend/_opt/analysis.pyx":554
+ *     while a != b:
+ *         while a > b:
+ *             a = idom[a]             # <<<<<<<<<<<<<<
+ *         while b > a:
+ *             b = idom[b]
+*/
+      __pyx_v_a = (__pyx_v_idom[__pyx_v_a]);
+    }
+
+    /* "sonolus/backend/_opt/analysis.pyx":555
+ *         while a > b:
+ *             a = idom[a]
+ *         while b > a:             # <<<<<<<<<<<<<<
+ *             b = idom[b]
+ *     return a
+*/
+    while (1) {
+      __pyx_t_1 = (__pyx_v_b > __pyx_v_a);
+
+
+      if (!__pyx_t_1) break;
+
+      /* "sonolus/backend/_opt/analysis.pyx":556
+ *             a = idom[a]
+ *         while b > a:
+ *             b = idom[b]             # <<<<<<<<<<<<<<
+ *     return a
+ * 
+*/
+      __pyx_v_b = (__pyx_v_idom[__pyx_v_b]);
+    }
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":557
+ *         while b > a:
+ *             b = idom[b]
+ *     return a             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = __pyx_v_a;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":549
+ * 
+ * 
+ * cdef int32_t _dom_intersect(int32_t* idom, int32_t a, int32_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # CHK "intersect": walk the two fingers up (by id == RPO number) to the
+ *     # nearest common dominator.
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":560
+ * 
+ * 
+ * cdef Dominators compute_dominators(Func func):             # <<<<<<<<<<<<<<
+ *     cdef Dominators D = Dominators()
+ *     D.func = func
+*/
+
+static struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_dominators(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_func) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_D = 0;
+  int32_t __pyx_v_nb;
+  int32_t __pyx_v_ne;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_Edge *__pyx_v_edges;
+  int32_t __pyx_v_i;
+  int32_t __pyx_v_b;
+  int32_t __pyx_v_e;
+  int32_t __pyx_v_s;
+  int32_t __pyx_v_p;
+  int32_t __pyx_v_new_idom;
+  int32_t __pyx_v_cur;
+  int32_t *__pyx_v_cursor;
+  int32_t __pyx_v_entry;
+  int __pyx_v_changed;
+  int32_t *__pyx_v_ccur;
+  int32_t *__pyx_v_stack;
+  int32_t *__pyx_v_it;
+  int32_t __pyx_v_timer;
+  int32_t __pyx_v_sp;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  size_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_Edge *__pyx_t_5;
+  long __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int32_t __pyx_t_9;
+  int32_t __pyx_t_10;
+  int32_t __pyx_t_11;
+  int32_t __pyx_t_12;
+  int32_t __pyx_t_13;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("compute_dominators", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":561
+ * 
+ * cdef Dominators compute_dominators(Func func):
+ *     cdef Dominators D = Dominators()             # <<<<<<<<<<<<<<
+ *     D.func = func
+ *     cdef int32_t nb = func.n_blocks
+*/
+  __pyx_t_2 = NULL;
+  __pyx_t_3 = 1;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators, __pyx_callargs+__pyx_t_3, (1-__pyx_t_3) | (__pyx_t_3*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 561, __pyx_L1_error)
+    __Pyx_GOTREF((PyObject *)__pyx_t_1);
+  }
+  __pyx_v_D = ((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":562
+ * cdef Dominators compute_dominators(Func func):
+ *     cdef Dominators D = Dominators()
+ *     D.func = func             # <<<<<<<<<<<<<<
+ *     cdef int32_t nb = func.n_blocks
+ *     cdef int32_t ne = func.n_edges
+*/
+  __Pyx_INCREF((PyObject *)__pyx_v_func);
+  __Pyx_GIVEREF((PyObject *)__pyx_v_func);
+  __Pyx_GOTREF((PyObject *)__pyx_v_D->func);
+  __Pyx_DECREF((PyObject *)__pyx_v_D->func);
+  __pyx_v_D->func = __pyx_v_func;
+
+  /* "sonolus/backend/_opt/analysis.pyx":563
+ *     cdef Dominators D = Dominators()
+ *     D.func = func
+ *     cdef int32_t nb = func.n_blocks             # <<<<<<<<<<<<<<
+ *     cdef int32_t ne = func.n_edges
+ *     D.n_blocks = nb
+*/
+  __pyx_t_4 = __pyx_v_func->n_blocks;
+
+  __pyx_v_nb = __pyx_t_4;
+
+  /* "sonolus/backend/_opt/analysis.pyx":564
+ *     D.func = func
+ *     cdef int32_t nb = func.n_blocks
+ *     cdef int32_t ne = func.n_edges             # <<<<<<<<<<<<<<
+ *     D.n_blocks = nb
+ * 
+*/
+  __pyx_t_4 = __pyx_v_func->n_edges;
+
+  __pyx_v_ne = __pyx_t_4;
+
+  /* "sonolus/backend/_opt/analysis.pyx":565
+ *     cdef int32_t nb = func.n_blocks
+ *     cdef int32_t ne = func.n_edges
+ *     D.n_blocks = nb             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Edge* edges = func.edges
+*/
+  __pyx_v_D->n_blocks = __pyx_v_nb;
+
+  /* "sonolus/backend/_opt/analysis.pyx":567
+ *     D.n_blocks = nb
+ * 
+ *     cdef Edge* edges = func.edges             # <<<<<<<<<<<<<<
+ *     cdef int32_t i, b, e, s, p, new_idom, cur
+ * 
+*/
+  __pyx_t_5 = __pyx_v_func->edges;
+
+  __pyx_v_edges = __pyx_t_5;
+
+  /* "sonolus/backend/_opt/analysis.pyx":570
+ *     cdef int32_t i, b, e, s, p, new_idom, cur
+ * 
+ *     D.idom = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     D.tin = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     D.tout = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_D->idom = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":571
+ * 
+ *     D.idom = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     D.tin = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     D.tout = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     D.pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_D->tin = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":572
+ *     D.idom = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     D.tin = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     D.tout = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     D.pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     D.pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_D->tout = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":573
+ *     D.tin = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     D.tout = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     D.pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     D.pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+ *     D.child_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+*/
+  __pyx_v_D->pred_head = ((int32_t *)calloc(((size_t)(__pyx_v_nb + 1)), (sizeof(int32_t))));
+
+  /* "sonolus/backend/_opt/analysis.pyx":574
+ *     D.tout = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     D.pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     D.pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     D.child_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     D.child_list = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+*/
+  __pyx_t_7 = (__pyx_v_ne > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_ne;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_D->pred_src = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":575
+ *     D.pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     D.pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+ *     D.child_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     D.child_list = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if (D.idom == NULL or D.tin == NULL or D.tout == NULL or D.pred_head == NULL
+*/
+  __pyx_v_D->child_head = ((int32_t *)calloc(((size_t)(__pyx_v_nb + 1)), (sizeof(int32_t))));
+
+  /* "sonolus/backend/_opt/analysis.pyx":576
+ *     D.pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+ *     D.child_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     D.child_list = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     if (D.idom == NULL or D.tin == NULL or D.tout == NULL or D.pred_head == NULL
+ *             or D.pred_src == NULL or D.child_head == NULL or D.child_list == NULL):
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_D->child_list = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":577
+ *     D.child_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     D.child_list = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if (D.idom == NULL or D.tin == NULL or D.tout == NULL or D.pred_head == NULL             # <<<<<<<<<<<<<<
+ *             or D.pred_src == NULL or D.child_head == NULL or D.child_list == NULL):
+ *         raise MemoryError()
+*/
+  __pyx_t_8 = (__pyx_v_D->idom == NULL);
+
+  if (!__pyx_t_8) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_8;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_8 = (__pyx_v_D->tin == NULL);
+
+  if (!__pyx_t_8) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_8;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_8 = (__pyx_v_D->tout == NULL);
+
+  if (!__pyx_t_8) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_8;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":578
+ *     D.child_list = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if (D.idom == NULL or D.tin == NULL or D.tout == NULL or D.pred_head == NULL
+ *             or D.pred_src == NULL or D.child_head == NULL or D.child_list == NULL):             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+*/
+  __pyx_t_8 = (__pyx_v_D->pred_head == NULL);
+
+  if (!__pyx_t_8) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_8;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_8 = (__pyx_v_D->pred_src == NULL);
+
+  if (!__pyx_t_8) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_8;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_8 = (__pyx_v_D->child_head == NULL);
+
+  if (!__pyx_t_8) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_8;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_8 = (__pyx_v_D->child_list == NULL);
+
+
+  __pyx_t_7 = __pyx_t_8;
+
+  __pyx_L4_bool_binop_done:;
+
+  /* "sonolus/backend/_opt/analysis.pyx":577
+ *     D.child_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     D.child_list = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if (D.idom == NULL or D.tin == NULL or D.tout == NULL or D.pred_head == NULL             # <<<<<<<<<<<<<<
+ *             or D.pred_src == NULL or D.child_head == NULL or D.child_list == NULL):
+ *         raise MemoryError()
+*/
+  if (unlikely(__pyx_t_7)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":579
+ *     if (D.idom == NULL or D.tin == NULL or D.tout == NULL or D.pred_head == NULL
+ *             or D.pred_src == NULL or D.child_head == NULL or D.child_list == NULL):
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     # Predecessor CSR.
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 579, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":577
+ *     D.child_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     D.child_list = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if (D.idom == NULL or D.tin == NULL or D.tout == NULL or D.pred_head == NULL             # <<<<<<<<<<<<<<
+ *             or D.pred_src == NULL or D.child_head == NULL or D.child_list == NULL):
+ *         raise MemoryError()
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":582
+ * 
+ *     # Predecessor CSR.
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     if cursor == NULL:
+ *         raise MemoryError()
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_cursor = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":583
+ *     # Predecessor CSR.
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if cursor == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     for e in range(ne):
+*/
+  __pyx_t_7 = (__pyx_v_cursor == NULL);
+
+  if (unlikely(__pyx_t_7)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":584
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if cursor == NULL:
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     for e in range(ne):
+ *         D.pred_head[edges[e].dst + 1] += 1
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 584, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":583
+ *     # Predecessor CSR.
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if cursor == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     for e in range(ne):
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":585
+ *     if cursor == NULL:
+ *         raise MemoryError()
+ *     for e in range(ne):             # <<<<<<<<<<<<<<
+ *         D.pred_head[edges[e].dst + 1] += 1
+ *     for b in range(nb):
+*/
+
+  __pyx_t_4 = __pyx_v_ne;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_e = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":586
+ *         raise MemoryError()
+ *     for e in range(ne):
+ *         D.pred_head[edges[e].dst + 1] += 1             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         D.pred_head[b + 1] += D.pred_head[b]
+*/
+
+    __pyx_t_6 = ((__pyx_v_edges[__pyx_v_e]).dst + 1);
+    (__pyx_v_D->pred_head[__pyx_t_6]) = ((__pyx_v_D->pred_head[__pyx_t_6]) + 1);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":587
+ *     for e in range(ne):
+ *         D.pred_head[edges[e].dst + 1] += 1
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         D.pred_head[b + 1] += D.pred_head[b]
+ *     for b in range(nb):
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_b = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":588
+ *         D.pred_head[edges[e].dst + 1] += 1
+ *     for b in range(nb):
+ *         D.pred_head[b + 1] += D.pred_head[b]             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         cursor[b] = D.pred_head[b]
+*/
+
+    __pyx_t_6 = (__pyx_v_b + 1);
+    (__pyx_v_D->pred_head[__pyx_t_6]) = ((__pyx_v_D->pred_head[__pyx_t_6]) + (__pyx_v_D->pred_head[__pyx_v_b]));
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":589
+ *     for b in range(nb):
+ *         D.pred_head[b + 1] += D.pred_head[b]
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         cursor[b] = D.pred_head[b]
+ *     for e in range(ne):
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_b = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":590
+ *         D.pred_head[b + 1] += D.pred_head[b]
+ *     for b in range(nb):
+ *         cursor[b] = D.pred_head[b]             # <<<<<<<<<<<<<<
+ *     for e in range(ne):
+ *         D.pred_src[cursor[edges[e].dst]] = edges[e].src
+*/
+    (__pyx_v_cursor[__pyx_v_b]) = (__pyx_v_D->pred_head[__pyx_v_b]);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":591
+ *     for b in range(nb):
+ *         cursor[b] = D.pred_head[b]
+ *     for e in range(ne):             # <<<<<<<<<<<<<<
+ *         D.pred_src[cursor[edges[e].dst]] = edges[e].src
+ *         cursor[edges[e].dst] += 1
+*/
+
+  __pyx_t_4 = __pyx_v_ne;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_e = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":592
+ *         cursor[b] = D.pred_head[b]
+ *     for e in range(ne):
+ *         D.pred_src[cursor[edges[e].dst]] = edges[e].src             # <<<<<<<<<<<<<<
+ *         cursor[edges[e].dst] += 1
+ *     free(cursor)
+*/
+    __pyx_t_11 = (__pyx_v_edges[__pyx_v_e]).src;
+
+    (__pyx_v_D->pred_src[(__pyx_v_cursor[(__pyx_v_edges[__pyx_v_e]).dst])]) = __pyx_t_11;
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":593
+ *     for e in range(ne):
+ *         D.pred_src[cursor[edges[e].dst]] = edges[e].src
+ *         cursor[edges[e].dst] += 1             # <<<<<<<<<<<<<<
+ *     free(cursor)
+ * 
+*/
+
+    __pyx_t_11 = (__pyx_v_edges[__pyx_v_e]).dst;
+    (__pyx_v_cursor[__pyx_t_11]) = ((__pyx_v_cursor[__pyx_t_11]) + 1);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":594
+ *         D.pred_src[cursor[edges[e].dst]] = edges[e].src
+ *         cursor[edges[e].dst] += 1
+ *     free(cursor)             # <<<<<<<<<<<<<<
+ * 
+ *     # CHK iterative idom over RPO (block id order). entry (0) dominates itself.
+*/
+  free(__pyx_v_cursor);
+
+  /* "sonolus/backend/_opt/analysis.pyx":597
+ * 
+ *     # CHK iterative idom over RPO (block id order). entry (0) dominates itself.
+ *     cdef int32_t entry = func.entry_block             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         D.idom[b] = -1
+*/
+  __pyx_t_4 = __pyx_v_func->entry_block;
+
+  __pyx_v_entry = __pyx_t_4;
+
+  /* "sonolus/backend/_opt/analysis.pyx":598
+ *     # CHK iterative idom over RPO (block id order). entry (0) dominates itself.
+ *     cdef int32_t entry = func.entry_block
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         D.idom[b] = -1
+ *     D.idom[entry] = entry
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_b = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":599
+ *     cdef int32_t entry = func.entry_block
+ *     for b in range(nb):
+ *         D.idom[b] = -1             # <<<<<<<<<<<<<<
+ *     D.idom[entry] = entry
+ *     cdef bint changed = True
+*/
+    (__pyx_v_D->idom[__pyx_v_b]) = -1;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":600
+ *     for b in range(nb):
+ *         D.idom[b] = -1
+ *     D.idom[entry] = entry             # <<<<<<<<<<<<<<
+ *     cdef bint changed = True
+ *     while changed:
+*/
+  (__pyx_v_D->idom[__pyx_v_entry]) = __pyx_v_entry;
+
+  /* "sonolus/backend/_opt/analysis.pyx":601
+ *         D.idom[b] = -1
+ *     D.idom[entry] = entry
+ *     cdef bint changed = True             # <<<<<<<<<<<<<<
+ *     while changed:
+ *         changed = False
+*/
+  __pyx_v_changed = 1;
+
+  /* "sonolus/backend/_opt/analysis.pyx":602
+ *     D.idom[entry] = entry
+ *     cdef bint changed = True
+ *     while changed:             # <<<<<<<<<<<<<<
+ *         changed = False
+ *         for b in range(nb):
+*/
+  while (1) {
+    if (!__pyx_v_changed) break;
+
+    /* "sonolus/backend/_opt/analysis.pyx":603
+ *     cdef bint changed = True
+ *     while changed:
+ *         changed = False             # <<<<<<<<<<<<<<
+ *         for b in range(nb):
+ *             if b == entry:
+*/
+    __pyx_v_changed = 0;
+
+    /* "sonolus/backend/_opt/analysis.pyx":604
+ *     while changed:
+ *         changed = False
+ *         for b in range(nb):             # <<<<<<<<<<<<<<
+ *             if b == entry:
+ *                 continue
+*/
+
+    __pyx_t_4 = __pyx_v_nb;
+    __pyx_t_9 = __pyx_t_4;
+
+    for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+      __pyx_v_b = __pyx_t_10;
+
+      /* "sonolus/backend/_opt/analysis.pyx":605
+ *         changed = False
+ *         for b in range(nb):
+ *             if b == entry:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             new_idom = -1
+*/
+      __pyx_t_7 = (__pyx_v_b == __pyx_v_entry);
+
+      if (__pyx_t_7) {
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":606
+ *         for b in range(nb):
+ *             if b == entry:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             new_idom = -1
+ *             for i in range(D.pred_head[b], D.pred_head[b + 1]):
+*/
+        goto __pyx_L24_continue;
+
+        /* "sonolus/backend/_opt/analysis.pyx":605
+ *         changed = False
+ *         for b in range(nb):
+ *             if b == entry:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             new_idom = -1
+*/
+      }
+
+      /* "sonolus/backend/_opt/analysis.pyx":607
+ *             if b == entry:
+ *                 continue
+ *             new_idom = -1             # <<<<<<<<<<<<<<
+ *             for i in range(D.pred_head[b], D.pred_head[b + 1]):
+ *                 p = D.pred_src[i]
+*/
+      __pyx_v_new_idom = -1;
+
+      /* "sonolus/backend/_opt/analysis.pyx":608
+ *                 continue
+ *             new_idom = -1
+ *             for i in range(D.pred_head[b], D.pred_head[b + 1]):             # <<<<<<<<<<<<<<
+ *                 p = D.pred_src[i]
+ *                 if D.idom[p] == -1:
+*/
+
+      __pyx_t_11 = (__pyx_v_D->pred_head[(__pyx_v_b + 1)]);
+      __pyx_t_12 = __pyx_t_11;
+
+      for (__pyx_t_13 = (__pyx_v_D->pred_head[__pyx_v_b]); __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+        __pyx_v_i = __pyx_t_13;
+
+        /* "sonolus/backend/_opt/analysis.pyx":609
+ *             new_idom = -1
+ *             for i in range(D.pred_head[b], D.pred_head[b + 1]):
+ *                 p = D.pred_src[i]             # <<<<<<<<<<<<<<
+ *                 if D.idom[p] == -1:
+ *                     continue
+*/
+        __pyx_v_p = (__pyx_v_D->pred_src[__pyx_v_i]);
+
+        /* "sonolus/backend/_opt/analysis.pyx":610
+ *             for i in range(D.pred_head[b], D.pred_head[b + 1]):
+ *                 p = D.pred_src[i]
+ *                 if D.idom[p] == -1:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 if new_idom == -1:
+*/
+        __pyx_t_7 = ((__pyx_v_D->idom[__pyx_v_p]) == -1L);
+
+        if (__pyx_t_7) {
+
+
+          /* "sonolus/backend/_opt/analysis.pyx":611
+ *                 p = D.pred_src[i]
+ *                 if D.idom[p] == -1:
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 if new_idom == -1:
+ *                     new_idom = p
+*/
+          goto __pyx_L27_continue;
+
+          /* "sonolus/backend/_opt/analysis.pyx":610
+ *             for i in range(D.pred_head[b], D.pred_head[b + 1]):
+ *                 p = D.pred_src[i]
+ *                 if D.idom[p] == -1:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 if new_idom == -1:
+*/
+        }
+
+        /* "sonolus/backend/_opt/analysis.pyx":612
+ *                 if D.idom[p] == -1:
+ *                     continue
+ *                 if new_idom == -1:             # <<<<<<<<<<<<<<
+ *                     new_idom = p
+ *                 else:
+*/
+        __pyx_t_7 = (__pyx_v_new_idom == -1L);
+
+        if (__pyx_t_7) {
+
+
+          /* "sonolus/backend/_opt/analysis.pyx":613
+ *                     continue
+ *                 if new_idom == -1:
+ *                     new_idom = p             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     new_idom = _dom_intersect(D.idom, p, new_idom)
+*/
+          __pyx_v_new_idom = __pyx_v_p;
+
+          /* "sonolus/backend/_opt/analysis.pyx":612
+ *                 if D.idom[p] == -1:
+ *                     continue
+ *                 if new_idom == -1:             # <<<<<<<<<<<<<<
+ *                     new_idom = p
+ *                 else:
+*/
+          goto __pyx_L30;
+        }
+
+        /* "sonolus/backend/_opt/analysis.pyx":615
+ *                     new_idom = p
+ *                 else:
+ *                     new_idom = _dom_intersect(D.idom, p, new_idom)             # <<<<<<<<<<<<<<
+ *             if new_idom != -1 and D.idom[b] != new_idom:
+ *                 D.idom[b] = new_idom
+*/
+        /*else*/ {
+          __pyx_v_new_idom = __pyx_f_7sonolus_7backend_4_opt_8analysis__dom_intersect(__pyx_v_D->idom, __pyx_v_p, __pyx_v_new_idom);
+        }
+        __pyx_L30:;
+        __pyx_L27_continue:;
+      }
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":616
+ *                 else:
+ *                     new_idom = _dom_intersect(D.idom, p, new_idom)
+ *             if new_idom != -1 and D.idom[b] != new_idom:             # <<<<<<<<<<<<<<
+ *                 D.idom[b] = new_idom
+ *                 changed = True
+*/
+      __pyx_t_8 = (__pyx_v_new_idom != -1L);
+
+      if (__pyx_t_8) {
+
+      } else {
+
+        __pyx_t_7 = __pyx_t_8;
+
+        goto __pyx_L32_bool_binop_done;
+      }
+      __pyx_t_8 = ((__pyx_v_D->idom[__pyx_v_b]) != __pyx_v_new_idom);
+
+
+      __pyx_t_7 = __pyx_t_8;
+
+      __pyx_L32_bool_binop_done:;
+      if (__pyx_t_7) {
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":617
+ *                     new_idom = _dom_intersect(D.idom, p, new_idom)
+ *             if new_idom != -1 and D.idom[b] != new_idom:
+ *                 D.idom[b] = new_idom             # <<<<<<<<<<<<<<
+ *                 changed = True
+ * 
+*/
+        (__pyx_v_D->idom[__pyx_v_b]) = __pyx_v_new_idom;
+
+        /* "sonolus/backend/_opt/analysis.pyx":618
+ *             if new_idom != -1 and D.idom[b] != new_idom:
+ *                 D.idom[b] = new_idom
+ *                 changed = True             # <<<<<<<<<<<<<<
+ * 
+ *     # Write idom back into the reserved BlockInfo field.
+*/
+        __pyx_v_changed = 1;
+
+        /* "sonolus/backend/_opt/analysis.pyx":616
+ *                 else:
+ *                     new_idom = _dom_intersect(D.idom, p, new_idom)
+ *             if new_idom != -1 and D.idom[b] != new_idom:             # <<<<<<<<<<<<<<
+ *                 D.idom[b] = new_idom
+ *                 changed = True
+*/
+      }
+      __pyx_L24_continue:;
+    }
+
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":621
+ * 
+ *     # Write idom back into the reserved BlockInfo field.
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         func.blocks[b].idom = D.idom[b]
+ * 
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_b = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":622
+ *     # Write idom back into the reserved BlockInfo field.
+ *     for b in range(nb):
+ *         func.blocks[b].idom = D.idom[b]             # <<<<<<<<<<<<<<
+ * 
+ *     # Dom-tree child CSR (each non-entry block is a child of its idom).
+*/
+    (__pyx_v_func->blocks[__pyx_v_b]).idom = (__pyx_v_D->idom[__pyx_v_b]);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":625
+ * 
+ *     # Dom-tree child CSR (each non-entry block is a child of its idom).
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         if b != entry and D.idom[b] != -1:
+ *             D.child_head[D.idom[b] + 1] += 1
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_b = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":626
+ *     # Dom-tree child CSR (each non-entry block is a child of its idom).
+ *     for b in range(nb):
+ *         if b != entry and D.idom[b] != -1:             # <<<<<<<<<<<<<<
+ *             D.child_head[D.idom[b] + 1] += 1
+ *     for b in range(nb):
+*/
+    __pyx_t_8 = (__pyx_v_b != __pyx_v_entry);
+
+    if (__pyx_t_8) {
+
+    } else {
+
+      __pyx_t_7 = __pyx_t_8;
+
+      goto __pyx_L39_bool_binop_done;
+    }
+    __pyx_t_8 = ((__pyx_v_D->idom[__pyx_v_b]) != -1L);
+
+
+    __pyx_t_7 = __pyx_t_8;
+
+    __pyx_L39_bool_binop_done:;
+    if (__pyx_t_7) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":627
+ *     for b in range(nb):
+ *         if b != entry and D.idom[b] != -1:
+ *             D.child_head[D.idom[b] + 1] += 1             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         D.child_head[b + 1] += D.child_head[b]
+*/
+
+      __pyx_t_6 = ((__pyx_v_D->idom[__pyx_v_b]) + 1);
+      (__pyx_v_D->child_head[__pyx_t_6]) = ((__pyx_v_D->child_head[__pyx_t_6]) + 1);
+
+      /* "sonolus/backend/_opt/analysis.pyx":626
+ *     # Dom-tree child CSR (each non-entry block is a child of its idom).
+ *     for b in range(nb):
+ *         if b != entry and D.idom[b] != -1:             # <<<<<<<<<<<<<<
+ *             D.child_head[D.idom[b] + 1] += 1
+ *     for b in range(nb):
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":628
+ *         if b != entry and D.idom[b] != -1:
+ *             D.child_head[D.idom[b] + 1] += 1
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         D.child_head[b + 1] += D.child_head[b]
+ *     cdef int32_t* ccur = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_b = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":629
+ *             D.child_head[D.idom[b] + 1] += 1
+ *     for b in range(nb):
+ *         D.child_head[b + 1] += D.child_head[b]             # <<<<<<<<<<<<<<
+ *     cdef int32_t* ccur = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if ccur == NULL:
+*/
+
+    __pyx_t_6 = (__pyx_v_b + 1);
+    (__pyx_v_D->child_head[__pyx_t_6]) = ((__pyx_v_D->child_head[__pyx_t_6]) + (__pyx_v_D->child_head[__pyx_v_b]));
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":630
+ *     for b in range(nb):
+ *         D.child_head[b + 1] += D.child_head[b]
+ *     cdef int32_t* ccur = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     if ccur == NULL:
+ *         raise MemoryError()
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_ccur = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":631
+ *         D.child_head[b + 1] += D.child_head[b]
+ *     cdef int32_t* ccur = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if ccur == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     for b in range(nb):
+*/
+  __pyx_t_7 = (__pyx_v_ccur == NULL);
+
+  if (unlikely(__pyx_t_7)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":632
+ *     cdef int32_t* ccur = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if ccur == NULL:
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         ccur[b] = D.child_head[b]
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 632, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":631
+ *         D.child_head[b + 1] += D.child_head[b]
+ *     cdef int32_t* ccur = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if ccur == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     for b in range(nb):
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":633
+ *     if ccur == NULL:
+ *         raise MemoryError()
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         ccur[b] = D.child_head[b]
+ *     for b in range(nb):
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_b = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":634
+ *         raise MemoryError()
+ *     for b in range(nb):
+ *         ccur[b] = D.child_head[b]             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         if b != entry and D.idom[b] != -1:
+*/
+    (__pyx_v_ccur[__pyx_v_b]) = (__pyx_v_D->child_head[__pyx_v_b]);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":635
+ *     for b in range(nb):
+ *         ccur[b] = D.child_head[b]
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         if b != entry and D.idom[b] != -1:
+ *             p = D.idom[b]
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_b = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":636
+ *         ccur[b] = D.child_head[b]
+ *     for b in range(nb):
+ *         if b != entry and D.idom[b] != -1:             # <<<<<<<<<<<<<<
+ *             p = D.idom[b]
+ *             D.child_list[ccur[p]] = b
+*/
+    __pyx_t_8 = (__pyx_v_b != __pyx_v_entry);
+
+    if (__pyx_t_8) {
+
+    } else {
+
+      __pyx_t_7 = __pyx_t_8;
+
+      goto __pyx_L49_bool_binop_done;
+    }
+    __pyx_t_8 = ((__pyx_v_D->idom[__pyx_v_b]) != -1L);
+
+
+    __pyx_t_7 = __pyx_t_8;
+
+    __pyx_L49_bool_binop_done:;
+    if (__pyx_t_7) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":637
+ *     for b in range(nb):
+ *         if b != entry and D.idom[b] != -1:
+ *             p = D.idom[b]             # <<<<<<<<<<<<<<
+ *             D.child_list[ccur[p]] = b
+ *             ccur[p] += 1
+*/
+      __pyx_v_p = (__pyx_v_D->idom[__pyx_v_b]);
+
+      /* "sonolus/backend/_opt/analysis.pyx":638
+ *         if b != entry and D.idom[b] != -1:
+ *             p = D.idom[b]
+ *             D.child_list[ccur[p]] = b             # <<<<<<<<<<<<<<
+ *             ccur[p] += 1
+ *     free(ccur)
+*/
+      (__pyx_v_D->child_list[(__pyx_v_ccur[__pyx_v_p])]) = __pyx_v_b;
+
+      /* "sonolus/backend/_opt/analysis.pyx":639
+ *             p = D.idom[b]
+ *             D.child_list[ccur[p]] = b
+ *             ccur[p] += 1             # <<<<<<<<<<<<<<
+ *     free(ccur)
+ * 
+*/
+
+      __pyx_t_11 = __pyx_v_p;
+      (__pyx_v_ccur[__pyx_t_11]) = ((__pyx_v_ccur[__pyx_t_11]) + 1);
+
+      /* "sonolus/backend/_opt/analysis.pyx":636
+ *         ccur[b] = D.child_head[b]
+ *     for b in range(nb):
+ *         if b != entry and D.idom[b] != -1:             # <<<<<<<<<<<<<<
+ *             p = D.idom[b]
+ *             D.child_list[ccur[p]] = b
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":640
+ *             D.child_list[ccur[p]] = b
+ *             ccur[p] += 1
+ *     free(ccur)             # <<<<<<<<<<<<<<
+ * 
+ *     # Euler-tour tin/tout over the dom tree (iterative DFS from entry).
+*/
+  free(__pyx_v_ccur);
+
+  /* "sonolus/backend/_opt/analysis.pyx":643
+ * 
+ *     # Euler-tour tin/tout over the dom tree (iterative DFS from entry).
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         D.tin[b] = -1
+ *         D.tout[b] = -1
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_b = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":644
+ *     # Euler-tour tin/tout over the dom tree (iterative DFS from entry).
+ *     for b in range(nb):
+ *         D.tin[b] = -1             # <<<<<<<<<<<<<<
+ *         D.tout[b] = -1
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(2 * nb if nb > 0 else 1) * sizeof(int32_t))
+*/
+    (__pyx_v_D->tin[__pyx_v_b]) = -1;
+
+    /* "sonolus/backend/_opt/analysis.pyx":645
+ *     for b in range(nb):
+ *         D.tin[b] = -1
+ *         D.tout[b] = -1             # <<<<<<<<<<<<<<
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(2 * nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* it = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+*/
+    (__pyx_v_D->tout[__pyx_v_b]) = -1;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":646
+ *         D.tin[b] = -1
+ *         D.tout[b] = -1
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(2 * nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     cdef int32_t* it = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if stack == NULL or it == NULL:
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = (2 * __pyx_v_nb);
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_stack = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":647
+ *         D.tout[b] = -1
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(2 * nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* it = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     if stack == NULL or it == NULL:
+ *         free(stack); free(it)
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_it = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":648
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(2 * nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* it = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if stack == NULL or it == NULL:             # <<<<<<<<<<<<<<
+ *         free(stack); free(it)
+ *         raise MemoryError()
+*/
+  __pyx_t_8 = (__pyx_v_stack == NULL);
+
+  if (!__pyx_t_8) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_8;
+
+    goto __pyx_L54_bool_binop_done;
+  }
+  __pyx_t_8 = (__pyx_v_it == NULL);
+
+
+  __pyx_t_7 = __pyx_t_8;
+
+  __pyx_L54_bool_binop_done:;
+  if (unlikely(__pyx_t_7)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":649
+ *     cdef int32_t* it = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if stack == NULL or it == NULL:
+ *         free(stack); free(it)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     cdef int32_t timer = 0
+*/
+    free(__pyx_v_stack);
+    free(__pyx_v_it);
+
+    /* "sonolus/backend/_opt/analysis.pyx":650
+ *     if stack == NULL or it == NULL:
+ *         free(stack); free(it)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     cdef int32_t timer = 0
+ *     cdef int32_t sp = 0
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 650, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":648
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(2 * nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* it = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if stack == NULL or it == NULL:             # <<<<<<<<<<<<<<
+ *         free(stack); free(it)
+ *         raise MemoryError()
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":651
+ *         free(stack); free(it)
+ *         raise MemoryError()
+ *     cdef int32_t timer = 0             # <<<<<<<<<<<<<<
+ *     cdef int32_t sp = 0
+ *     for b in range(nb):
+*/
+  __pyx_v_timer = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":652
+ *         raise MemoryError()
+ *     cdef int32_t timer = 0
+ *     cdef int32_t sp = 0             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         it[b] = D.child_head[b]
+*/
+  __pyx_v_sp = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":653
+ *     cdef int32_t timer = 0
+ *     cdef int32_t sp = 0
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         it[b] = D.child_head[b]
+ *     stack[sp] = entry
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_9 = __pyx_t_4;
+
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_b = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":654
+ *     cdef int32_t sp = 0
+ *     for b in range(nb):
+ *         it[b] = D.child_head[b]             # <<<<<<<<<<<<<<
+ *     stack[sp] = entry
+ *     sp += 1
+*/
+    (__pyx_v_it[__pyx_v_b]) = (__pyx_v_D->child_head[__pyx_v_b]);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":655
+ *     for b in range(nb):
+ *         it[b] = D.child_head[b]
+ *     stack[sp] = entry             # <<<<<<<<<<<<<<
+ *     sp += 1
+ *     D.tin[entry] = timer
+*/
+  (__pyx_v_stack[__pyx_v_sp]) = __pyx_v_entry;
+
+  /* "sonolus/backend/_opt/analysis.pyx":656
+ *         it[b] = D.child_head[b]
+ *     stack[sp] = entry
+ *     sp += 1             # <<<<<<<<<<<<<<
+ *     D.tin[entry] = timer
+ *     timer += 1
+*/
+  __pyx_v_sp = (__pyx_v_sp + 1);
+
+  /* "sonolus/backend/_opt/analysis.pyx":657
+ *     stack[sp] = entry
+ *     sp += 1
+ *     D.tin[entry] = timer             # <<<<<<<<<<<<<<
+ *     timer += 1
+ *     while sp > 0:
+*/
+  (__pyx_v_D->tin[__pyx_v_entry]) = __pyx_v_timer;
+
+  /* "sonolus/backend/_opt/analysis.pyx":658
+ *     sp += 1
+ *     D.tin[entry] = timer
+ *     timer += 1             # <<<<<<<<<<<<<<
+ *     while sp > 0:
+ *         cur = stack[sp - 1]
+*/
+  __pyx_v_timer = (__pyx_v_timer + 1);
+
+  /* "sonolus/backend/_opt/analysis.pyx":659
+ *     D.tin[entry] = timer
+ *     timer += 1
+ *     while sp > 0:             # <<<<<<<<<<<<<<
+ *         cur = stack[sp - 1]
+ *         if it[cur] < D.child_head[cur + 1]:
+*/
+  while (1) {
+    __pyx_t_7 = (__pyx_v_sp > 0);
+
+
+    if (!__pyx_t_7) break;
+
+    /* "sonolus/backend/_opt/analysis.pyx":660
+ *     timer += 1
+ *     while sp > 0:
+ *         cur = stack[sp - 1]             # <<<<<<<<<<<<<<
+ *         if it[cur] < D.child_head[cur + 1]:
+ *             s = D.child_list[it[cur]]
+*/
+    __pyx_v_cur = (__pyx_v_stack[(__pyx_v_sp - 1)]);
+
+    /* "sonolus/backend/_opt/analysis.pyx":661
+ *     while sp > 0:
+ *         cur = stack[sp - 1]
+ *         if it[cur] < D.child_head[cur + 1]:             # <<<<<<<<<<<<<<
+ *             s = D.child_list[it[cur]]
+ *             it[cur] += 1
+*/
+    __pyx_t_7 = ((__pyx_v_it[__pyx_v_cur]) < (__pyx_v_D->child_head[(__pyx_v_cur + 1)]));
+
+    if (__pyx_t_7) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":662
+ *         cur = stack[sp - 1]
+ *         if it[cur] < D.child_head[cur + 1]:
+ *             s = D.child_list[it[cur]]             # <<<<<<<<<<<<<<
+ *             it[cur] += 1
+ *             D.tin[s] = timer
+*/
+      __pyx_v_s = (__pyx_v_D->child_list[(__pyx_v_it[__pyx_v_cur])]);
+
+      /* "sonolus/backend/_opt/analysis.pyx":663
+ *         if it[cur] < D.child_head[cur + 1]:
+ *             s = D.child_list[it[cur]]
+ *             it[cur] += 1             # <<<<<<<<<<<<<<
+ *             D.tin[s] = timer
+ *             timer += 1
+*/
+
+      __pyx_t_4 = __pyx_v_cur;
+      (__pyx_v_it[__pyx_t_4]) = ((__pyx_v_it[__pyx_t_4]) + 1);
+
+      /* "sonolus/backend/_opt/analysis.pyx":664
+ *             s = D.child_list[it[cur]]
+ *             it[cur] += 1
+ *             D.tin[s] = timer             # <<<<<<<<<<<<<<
+ *             timer += 1
+ *             stack[sp] = s
+*/
+      (__pyx_v_D->tin[__pyx_v_s]) = __pyx_v_timer;
+
+      /* "sonolus/backend/_opt/analysis.pyx":665
+ *             it[cur] += 1
+ *             D.tin[s] = timer
+ *             timer += 1             # <<<<<<<<<<<<<<
+ *             stack[sp] = s
+ *             sp += 1
+*/
+      __pyx_v_timer = (__pyx_v_timer + 1);
+
+      /* "sonolus/backend/_opt/analysis.pyx":666
+ *             D.tin[s] = timer
+ *             timer += 1
+ *             stack[sp] = s             # <<<<<<<<<<<<<<
+ *             sp += 1
+ *         else:
+*/
+      (__pyx_v_stack[__pyx_v_sp]) = __pyx_v_s;
+
+      /* "sonolus/backend/_opt/analysis.pyx":667
+ *             timer += 1
+ *             stack[sp] = s
+ *             sp += 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             D.tout[cur] = timer
+*/
+      __pyx_v_sp = (__pyx_v_sp + 1);
+
+      /* "sonolus/backend/_opt/analysis.pyx":661
+ *     while sp > 0:
+ *         cur = stack[sp - 1]
+ *         if it[cur] < D.child_head[cur + 1]:             # <<<<<<<<<<<<<<
+ *             s = D.child_list[it[cur]]
+ *             it[cur] += 1
+*/
+      goto __pyx_L60;
+    }
+
+    /* "sonolus/backend/_opt/analysis.pyx":669
+ *             sp += 1
+ *         else:
+ *             D.tout[cur] = timer             # <<<<<<<<<<<<<<
+ *             timer += 1
+ *             sp -= 1
+*/
+    /*else*/ {
+      (__pyx_v_D->tout[__pyx_v_cur]) = __pyx_v_timer;
+
+      /* "sonolus/backend/_opt/analysis.pyx":670
+ *         else:
+ *             D.tout[cur] = timer
+ *             timer += 1             # <<<<<<<<<<<<<<
+ *             sp -= 1
+ *     free(stack)
+*/
+      __pyx_v_timer = (__pyx_v_timer + 1);
+
+      /* "sonolus/backend/_opt/analysis.pyx":671
+ *             D.tout[cur] = timer
+ *             timer += 1
+ *             sp -= 1             # <<<<<<<<<<<<<<
+ *     free(stack)
+ *     free(it)
+*/
+      __pyx_v_sp = (__pyx_v_sp - 1);
+    }
+    __pyx_L60:;
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":672
+ *             timer += 1
+ *             sp -= 1
+ *     free(stack)             # <<<<<<<<<<<<<<
+ *     free(it)
+ *     return D
+*/
+  free(__pyx_v_stack);
+
+  /* "sonolus/backend/_opt/analysis.pyx":673
+ *             sp -= 1
+ *     free(stack)
+ *     free(it)             # <<<<<<<<<<<<<<
+ *     return D
+ * 
+*/
+  free(__pyx_v_it);
+
+  /* "sonolus/backend/_opt/analysis.pyx":674
+ *     free(stack)
+ *     free(it)
+ *     return D             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+    struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF((PyObject *)__pyx_v_D);
+      __pyx_r = __pyx_v_D;
+    }
+    __Pyx_XDECREF((PyObject *)__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":560
+ * 
+ * 
+ * cdef Dominators compute_dominators(Func func):             # <<<<<<<<<<<<<<
+ *     cdef Dominators D = Dominators()
+ *     D.func = func
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.compute_dominators", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_D);
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":677
+ * 
+ * 
+ * def dominators_debug(entry, mode=None, callback=None):             # <<<<<<<<<<<<<<
+ *     """Marshal ``entry``, compute dominators, return idom / children / a few queries.
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_3dominators_debug(PyObject *__pyx_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_7sonolus_7backend_4_opt_8analysis_2dominators_debug, "Marshal ``entry``, compute dominators, return idom / children / a few queries.\n\n    Returns ``{\"idom\", \"children\", \"n_blocks\", \"dominates\"}`` keyed by arena block\n    id (reverse-postorder). ``dominates`` is the callable O(1) query object.\n    ");
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_3dominators_debug = {"dominators_debug", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_3dominators_debug, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7sonolus_7backend_4_opt_8analysis_2dominators_debug};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_3dominators_debug(PyObject *__pyx_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_entry = 0;
+  PyObject *__pyx_v_mode = 0;
+  PyObject *__pyx_v_callback = 0;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("dominators_debug (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_entry,&__pyx_mstate_global->__pyx_n_u_mode,&__pyx_mstate_global->__pyx_n_u_callback,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(0, 677, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 677, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 677, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 677, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "dominators_debug", 0) < (0)) __PYX_ERR(0, 677, __pyx_L3_error)
+      if (!values[1]) values[1] = __Pyx_NewRef(((PyObject *)Py_None));
+      if (!values[2]) values[2] = __Pyx_NewRef(((PyObject *)Py_None));
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("dominators_debug", 0, 1, 3, i); __PYX_ERR(0, 677, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 677, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 677, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 677, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      if (!values[1]) values[1] = __Pyx_NewRef(((PyObject *)Py_None));
+      if (!values[2]) values[2] = __Pyx_NewRef(((PyObject *)Py_None));
+    }
+    __pyx_v_entry = values[0];
+    __pyx_v_mode = values[1];
+    __pyx_v_callback = values[2];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("dominators_debug", 0, 1, 3, __pyx_nargs); __PYX_ERR(0, 677, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.dominators_debug", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_2dominators_debug(__pyx_self, __pyx_v_entry, __pyx_v_mode, __pyx_v_callback);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_2dominators_debug(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_entry, PyObject *__pyx_v_mode, PyObject *__pyx_v_callback) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_func = 0;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_D = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("dominators_debug", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":683
+ *     id (reverse-postorder). ``dominates`` is the callable O(1) query object.
+ *     """
+ *     cdef Func func = <Func>marshal_in(entry, mode, callback)             # <<<<<<<<<<<<<<
+ *     func.verify()
+ *     cdef Dominators D = compute_dominators(func)
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_marshal_in); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 683, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[4] = {__pyx_t_2, __pyx_v_entry, __pyx_v_mode, __pyx_v_callback};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (4-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 683, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_3 = __pyx_t_1;
+  __Pyx_INCREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":684
+ *     """
+ *     cdef Func func = <Func>marshal_in(entry, mode, callback)
+ *     func.verify()             # <<<<<<<<<<<<<<
+ *     cdef Dominators D = compute_dominators(func)
+ *     return {
+*/
+  __pyx_t_1 = ((PyObject *)__pyx_v_func);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, NULL};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_verify, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 684, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":685
+ *     cdef Func func = <Func>marshal_in(entry, mode, callback)
+ *     func.verify()
+ *     cdef Dominators D = compute_dominators(func)             # <<<<<<<<<<<<<<
+ *     return {
+ *         "idom": D.idom_map(),
+*/
+  __pyx_t_3 = ((PyObject *)__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_dominators(__pyx_v_func)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_D = ((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":687
+ *     cdef Dominators D = compute_dominators(func)
+ *     return {
+ *         "idom": D.idom_map(),             # <<<<<<<<<<<<<<
+ *         "children": D.children_map(),
+ *         "n_blocks": D.n_blocks,
+*/
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = ((PyObject *)__pyx_v_D);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_idom_map, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 687, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_idom, __pyx_t_1) < (0)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":688
+ *     return {
+ *         "idom": D.idom_map(),
+ *         "children": D.children_map(),             # <<<<<<<<<<<<<<
+ *         "n_blocks": D.n_blocks,
+ *         "dominates": D.dominates_q,
+*/
+  __pyx_t_2 = ((PyObject *)__pyx_v_D);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_children_map, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 688, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_children, __pyx_t_1) < (0)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":689
+ *         "idom": D.idom_map(),
+ *         "children": D.children_map(),
+ *         "n_blocks": D.n_blocks,             # <<<<<<<<<<<<<<
+ *         "dominates": D.dominates_q,
+ *     }
+*/
+  __pyx_t_1 = __Pyx_PyLong_From_int32_t(__pyx_v_D->n_blocks); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 689, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_n_blocks, __pyx_t_1) < (0)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":690
+ *         "children": D.children_map(),
+ *         "n_blocks": D.n_blocks,
+ *         "dominates": D.dominates_q,             # <<<<<<<<<<<<<<
+ *     }
+ * 
+*/
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_D), __pyx_mstate_global->__pyx_n_u_dominates_q); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 690, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_dominates, __pyx_t_1) < (0)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_3;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":677
+ * 
+ * 
+ * def dominators_debug(entry, mode=None, callback=None):             # <<<<<<<<<<<<<<
+ *     """Marshal ``entry``, compute dominators, return idom / children / a few queries.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.dominators_debug", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_func);
+  __Pyx_XDECREF((PyObject *)__pyx_v_D);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":699
+ * 
+ * cdef class LoopForest:
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self.func = None
+ *         self.n_blocks = 0
+*/
+
+/* Python wrapper */
+static int __pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_1__cinit__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL_TPNEW
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static int __pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_1__cinit__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL_TPNEW
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL_TPNEW
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL_TPNEW
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL_TPNEW(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, __pyx_nargs); return -1; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL_TPNEW(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return -1;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__cinit__", __pyx_kwds); return -1;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest___cinit__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest___cinit__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":700
+ * cdef class LoopForest:
+ *     def __cinit__(self):
+ *         self.func = None             # <<<<<<<<<<<<<<
+ *         self.n_blocks = 0
+ *         self.n_loops = 0
+*/
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF((PyObject *)__pyx_v_self->func);
+  __Pyx_DECREF((PyObject *)__pyx_v_self->func);
+  __pyx_v_self->func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)Py_None);
+
+  /* "sonolus/backend/_opt/analysis.pyx":701
+ *     def __cinit__(self):
+ *         self.func = None
+ *         self.n_blocks = 0             # <<<<<<<<<<<<<<
+ *         self.n_loops = 0
+ *         self.nwb = 0
+*/
+  __pyx_v_self->n_blocks = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":702
+ *         self.func = None
+ *         self.n_blocks = 0
+ *         self.n_loops = 0             # <<<<<<<<<<<<<<
+ *         self.nwb = 0
+ *         self.depth = NULL
+*/
+  __pyx_v_self->n_loops = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":703
+ *         self.n_blocks = 0
+ *         self.n_loops = 0
+ *         self.nwb = 0             # <<<<<<<<<<<<<<
+ *         self.depth = NULL
+ *         self.innermost = NULL
+*/
+  __pyx_v_self->nwb = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":704
+ *         self.n_loops = 0
+ *         self.nwb = 0
+ *         self.depth = NULL             # <<<<<<<<<<<<<<
+ *         self.innermost = NULL
+ *         self.header = NULL
+*/
+  __pyx_v_self->depth = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":705
+ *         self.nwb = 0
+ *         self.depth = NULL
+ *         self.innermost = NULL             # <<<<<<<<<<<<<<
+ *         self.header = NULL
+ *         self.parent = NULL
+*/
+  __pyx_v_self->innermost = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":706
+ *         self.depth = NULL
+ *         self.innermost = NULL
+ *         self.header = NULL             # <<<<<<<<<<<<<<
+ *         self.parent = NULL
+ *         self.loop_depth = NULL
+*/
+  __pyx_v_self->header = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":707
+ *         self.innermost = NULL
+ *         self.header = NULL
+ *         self.parent = NULL             # <<<<<<<<<<<<<<
+ *         self.loop_depth = NULL
+ *         self.body = NULL
+*/
+  __pyx_v_self->parent = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":708
+ *         self.header = NULL
+ *         self.parent = NULL
+ *         self.loop_depth = NULL             # <<<<<<<<<<<<<<
+ *         self.body = NULL
+ * 
+*/
+  __pyx_v_self->loop_depth = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":709
+ *         self.parent = NULL
+ *         self.loop_depth = NULL
+ *         self.body = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+*/
+  __pyx_v_self->body = NULL;
+
+  /* "sonolus/backend/_opt/analysis.pyx":699
+ * 
+ * cdef class LoopForest:
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self.func = None
+ *         self.n_blocks = 0
+*/
+
+  /* function exit code */
+  __pyx_r = 0;
+
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":711
+ *         self.body = NULL
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.depth)
+ *         free(self.innermost)
+*/
+
+/* Python wrapper */
+static void __pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_3__dealloc__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_2__dealloc__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_2__dealloc__(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self) {
+
+  /* "sonolus/backend/_opt/analysis.pyx":712
+ * 
+ *     def __dealloc__(self):
+ *         free(self.depth)             # <<<<<<<<<<<<<<
+ *         free(self.innermost)
+ *         free(self.header)
+*/
+  free(__pyx_v_self->depth);
+
+  /* "sonolus/backend/_opt/analysis.pyx":713
+ *     def __dealloc__(self):
+ *         free(self.depth)
+ *         free(self.innermost)             # <<<<<<<<<<<<<<
+ *         free(self.header)
+ *         free(self.parent)
+*/
+  free(__pyx_v_self->innermost);
+
+  /* "sonolus/backend/_opt/analysis.pyx":714
+ *         free(self.depth)
+ *         free(self.innermost)
+ *         free(self.header)             # <<<<<<<<<<<<<<
+ *         free(self.parent)
+ *         free(self.loop_depth)
+*/
+  free(__pyx_v_self->header);
+
+  /* "sonolus/backend/_opt/analysis.pyx":715
+ *         free(self.innermost)
+ *         free(self.header)
+ *         free(self.parent)             # <<<<<<<<<<<<<<
+ *         free(self.loop_depth)
+ *         free(self.body)
+*/
+  free(__pyx_v_self->parent);
+
+  /* "sonolus/backend/_opt/analysis.pyx":716
+ *         free(self.header)
+ *         free(self.parent)
+ *         free(self.loop_depth)             # <<<<<<<<<<<<<<
+ *         free(self.body)
+ * 
+*/
+  free(__pyx_v_self->loop_depth);
+
+  /* "sonolus/backend/_opt/analysis.pyx":717
+ *         free(self.parent)
+ *         free(self.loop_depth)
+ *         free(self.body)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint in_loop(self, int32_t loop_id, int32_t block) noexcept nogil:
+*/
+  free(__pyx_v_self->body);
+
+  /* "sonolus/backend/_opt/analysis.pyx":711
+ *         self.body = NULL
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.depth)
+ *         free(self.innermost)
+*/
+
+  /* function exit code */
+
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":719
+ *         free(self.body)
+ * 
+ *     cdef bint in_loop(self, int32_t loop_id, int32_t block) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         return bs_get(&self.body[<int64_t>loop_id * self.nwb], block)
+ * 
+*/
+
+static int __pyx_f_7sonolus_7backend_4_opt_8analysis_10LoopForest_in_loop(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self, int32_t __pyx_v_loop_id, int32_t __pyx_v_block) {
+  int __pyx_r;
+
+  /* "sonolus/backend/_opt/analysis.pyx":720
+ * 
+ *     cdef bint in_loop(self, int32_t loop_id, int32_t block) noexcept nogil:
+ *         return bs_get(&self.body[<int64_t>loop_id * self.nwb], block)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint crosses_loop(self, int32_t def_block, int32_t use_block) noexcept nogil:
+*/
+  {
+
+    __pyx_r = __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get((&(__pyx_v_self->body[(((int64_t)__pyx_v_loop_id) * __pyx_v_self->nwb)])), __pyx_v_block);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":719
+ *         free(self.body)
+ * 
+ *     cdef bint in_loop(self, int32_t loop_id, int32_t block) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         return bs_get(&self.body[<int64_t>loop_id * self.nwb], block)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":722
+ *         return bs_get(&self.body[<int64_t>loop_id * self.nwb], block)
+ * 
+ *     cdef bint crosses_loop(self, int32_t def_block, int32_t use_block) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         # Sinking a def into use_block crosses a loop iff use_block is in some
+ *         # loop that does not contain def_block. Because the loops containing a
+*/
+
+static int __pyx_f_7sonolus_7backend_4_opt_8analysis_10LoopForest_crosses_loop(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self, int32_t __pyx_v_def_block, int32_t __pyx_v_use_block) {
+  int32_t __pyx_v_li;
+  int __pyx_r;
+  int __pyx_t_1;
+
+  /* "sonolus/backend/_opt/analysis.pyx":727
+ *         # block form a nested chain, this holds iff def_block is not in
+ *         # use_block's innermost loop.
+ *         cdef int32_t li = self.innermost[use_block]             # <<<<<<<<<<<<<<
+ *         if li < 0:
+ *             return False
+*/
+  __pyx_v_li = (__pyx_v_self->innermost[__pyx_v_use_block]);
+
+  /* "sonolus/backend/_opt/analysis.pyx":728
+ *         # use_block's innermost loop.
+ *         cdef int32_t li = self.innermost[use_block]
+ *         if li < 0:             # <<<<<<<<<<<<<<
+ *             return False
+ *         return not self.in_loop(li, def_block)
+*/
+  __pyx_t_1 = (__pyx_v_li < 0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":729
+ *         cdef int32_t li = self.innermost[use_block]
+ *         if li < 0:
+ *             return False             # <<<<<<<<<<<<<<
+ *         return not self.in_loop(li, def_block)
+ * 
+*/
+    {
+
+      __pyx_r = 0;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/analysis.pyx":728
+ *         # use_block's innermost loop.
+ *         cdef int32_t li = self.innermost[use_block]
+ *         if li < 0:             # <<<<<<<<<<<<<<
+ *             return False
+ *         return not self.in_loop(li, def_block)
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":730
+ *         if li < 0:
+ *             return False
+ *         return not self.in_loop(li, def_block)             # <<<<<<<<<<<<<<
+ * 
+ *     # --- python debug accessors ------------------------------------------
+*/
+  {
+
+    __pyx_r = (!((struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_v_self->__pyx_vtab)->in_loop(__pyx_v_self, __pyx_v_li, __pyx_v_def_block));
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":722
+ *         return bs_get(&self.body[<int64_t>loop_id * self.nwb], block)
+ * 
+ *     cdef bint crosses_loop(self, int32_t def_block, int32_t use_block) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         # Sinking a def into use_block crosses a loop iff use_block is in some
+ *         # loop that does not contain def_block. Because the loops containing a
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":734
+ *     # --- python debug accessors ------------------------------------------
+ * 
+ *     def depth_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_5depth_map(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_5depth_map = {"depth_map", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_5depth_map, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_5depth_map(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("depth_map (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("depth_map", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("depth_map", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_4depth_map(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_4depth_map(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self) {
+  PyObject *__pyx_v_d = 0;
+  int32_t __pyx_v_b;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("depth_map", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":735
+ * 
+ *     def depth_map(self):
+ *         cdef dict d = {}             # <<<<<<<<<<<<<<
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_d = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":737
+ *         cdef dict d = {}
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):             # <<<<<<<<<<<<<<
+ *             d[b] = self.depth[b]
+ *         return d
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_blocks;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_b = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":738
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+ *             d[b] = self.depth[b]             # <<<<<<<<<<<<<<
+ *         return d
+ * 
+*/
+    __pyx_t_1 = __Pyx_PyLong_From_int32_t((__pyx_v_self->depth[__pyx_v_b])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 738, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyLong_From_int32_t(__pyx_v_b); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 738, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (unlikely((PyDict_SetItem(__pyx_v_d, __pyx_t_5, __pyx_t_1) < 0))) __PYX_ERR(0, 738, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":739
+ *         for b in range(self.n_blocks):
+ *             d[b] = self.depth[b]
+ *         return d             # <<<<<<<<<<<<<<
+ * 
+ *     def innermost_map(self):
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_d);
+      __pyx_r = __pyx_v_d;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":734
+ *     # --- python debug accessors ------------------------------------------
+ * 
+ *     def depth_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.LoopForest.depth_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_d);
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":741
+ *         return d
+ * 
+ *     def innermost_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_7innermost_map(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_7innermost_map = {"innermost_map", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_7innermost_map, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_7innermost_map(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("innermost_map (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("innermost_map", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("innermost_map", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_6innermost_map(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_6innermost_map(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self) {
+  PyObject *__pyx_v_d = 0;
+  int32_t __pyx_v_b;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("innermost_map", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":742
+ * 
+ *     def innermost_map(self):
+ *         cdef dict d = {}             # <<<<<<<<<<<<<<
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 742, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_d = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":744
+ *         cdef dict d = {}
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):             # <<<<<<<<<<<<<<
+ *             d[b] = self.innermost[b]
+ *         return d
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_blocks;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_b = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":745
+ *         cdef int32_t b
+ *         for b in range(self.n_blocks):
+ *             d[b] = self.innermost[b]             # <<<<<<<<<<<<<<
+ *         return d
+ * 
+*/
+    __pyx_t_1 = __Pyx_PyLong_From_int32_t((__pyx_v_self->innermost[__pyx_v_b])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 745, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyLong_From_int32_t(__pyx_v_b); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 745, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (unlikely((PyDict_SetItem(__pyx_v_d, __pyx_t_5, __pyx_t_1) < 0))) __PYX_ERR(0, 745, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":746
+ *         for b in range(self.n_blocks):
+ *             d[b] = self.innermost[b]
+ *         return d             # <<<<<<<<<<<<<<
+ * 
+ *     def loops(self):
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_d);
+      __pyx_r = __pyx_v_d;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":741
+ *         return d
+ * 
+ *     def innermost_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.LoopForest.innermost_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_d);
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":748
+ *         return d
+ * 
+ *     def loops(self):             # <<<<<<<<<<<<<<
+ *         # For each loop id: (header, parent, depth, sorted body block ids).
+ *         cdef list out = []
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_9loops(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_9loops = {"loops", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_9loops, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_9loops(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("loops (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("loops", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("loops", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_8loops(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_8loops(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self) {
+  PyObject *__pyx_v_out = 0;
+  int32_t __pyx_v_li;
+  PyObject *__pyx_v_members = NULL;
+  int32_t __pyx_8genexpr1__pyx_v_b;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int32_t __pyx_t_2;
+  int32_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  int32_t __pyx_t_5;
+  int32_t __pyx_t_6;
+  int32_t __pyx_t_7;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("loops", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":750
+ *     def loops(self):
+ *         # For each loop id: (header, parent, depth, sorted body block ids).
+ *         cdef list out = []             # <<<<<<<<<<<<<<
+ *         cdef int32_t li, b
+ *         for li in range(self.n_loops):
+*/
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 750, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_out = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":752
+ *         cdef list out = []
+ *         cdef int32_t li, b
+ *         for li in range(self.n_loops):             # <<<<<<<<<<<<<<
+ *             members = [b for b in range(self.n_blocks) if bs_get(&self.body[<int64_t>li * self.nwb], b)]
+ *             out.append((self.header[li], self.parent[li], self.loop_depth[li], members))
+*/
+
+  __pyx_t_2 = __pyx_v_self->n_loops;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_li = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/analysis.pyx":753
+ *         cdef int32_t li, b
+ *         for li in range(self.n_loops):
+ *             members = [b for b in range(self.n_blocks) if bs_get(&self.body[<int64_t>li * self.nwb], b)]             # <<<<<<<<<<<<<<
+ *             out.append((self.header[li], self.parent[li], self.loop_depth[li], members))
+ *         return out
+*/
+    { /* enter inner scope */
+      __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 753, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+
+      __pyx_t_5 = __pyx_v_self->n_blocks;
+      __pyx_t_6 = __pyx_t_5;
+
+      for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+        __pyx_8genexpr1__pyx_v_b = __pyx_t_7;
+        __pyx_t_8 = __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get((&(__pyx_v_self->body[(((int64_t)__pyx_v_li) * __pyx_v_self->nwb)])), __pyx_8genexpr1__pyx_v_b);
+
+        if (__pyx_t_8) {
+
+          __pyx_t_9 = __Pyx_PyLong_From_int32_t(__pyx_8genexpr1__pyx_v_b); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 753, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_GIVEREF(__pyx_t_9);
+          if (unlikely(__Pyx_ListComp_AppendAndDecref(__pyx_t_1, __pyx_t_9))) __PYX_ERR(0, 753, __pyx_L1_error)
+          __pyx_t_9 = 0;
+        }
+      }
+
+    } /* exit inner scope */
+    __Pyx_XDECREF_SET(__pyx_v_members, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "sonolus/backend/_opt/analysis.pyx":754
+ *         for li in range(self.n_loops):
+ *             members = [b for b in range(self.n_blocks) if bs_get(&self.body[<int64_t>li * self.nwb], b)]
+ *             out.append((self.header[li], self.parent[li], self.loop_depth[li], members))             # <<<<<<<<<<<<<<
+ *         return out
+ * 
+*/
+    __pyx_t_1 = __Pyx_PyLong_From_int32_t((__pyx_v_self->header[__pyx_v_li])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 754, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = __Pyx_PyLong_From_int32_t((__pyx_v_self->parent[__pyx_v_li])); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 754, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_10 = __Pyx_PyLong_From_int32_t((__pyx_v_self->loop_depth[__pyx_v_li])); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 754, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_11 = PyTuple_New(4); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 754, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_GIVEREF(__pyx_t_1);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_1) != (0)) __PYX_ERR(0, 754, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_9);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_9) != (0)) __PYX_ERR(0, 754, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_10);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 2, __pyx_t_10) != (0)) __PYX_ERR(0, 754, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_members);
+    __Pyx_GIVEREF(__pyx_v_members);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 3, __pyx_v_members) != (0)) __PYX_ERR(0, 754, __pyx_L1_error);
+    __pyx_t_1 = 0;
+    __pyx_t_9 = 0;
+    __pyx_t_10 = 0;
+    __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_out, __pyx_t_11); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 754, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":755
+ *             members = [b for b in range(self.n_blocks) if bs_get(&self.body[<int64_t>li * self.nwb], b)]
+ *             out.append((self.header[li], self.parent[li], self.loop_depth[li], members))
+ *         return out             # <<<<<<<<<<<<<<
+ * 
+ *     def crosses_loop_q(self, int def_block, int use_block):
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_out);
+      __pyx_r = __pyx_v_out;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":748
+ *         return d
+ * 
+ *     def loops(self):             # <<<<<<<<<<<<<<
+ *         # For each loop id: (header, parent, depth, sorted body block ids).
+ *         cdef list out = []
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.LoopForest.loops", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_out);
+
+  __Pyx_XDECREF(__pyx_v_members);
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":757
+ *         return out
+ * 
+ *     def crosses_loop_q(self, int def_block, int use_block):             # <<<<<<<<<<<<<<
+ *         return bool(self.crosses_loop(<int32_t>def_block, <int32_t>use_block))
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_11crosses_loop_q(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_11crosses_loop_q = {"crosses_loop_q", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_11crosses_loop_q, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_11crosses_loop_q(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  int __pyx_v_def_block;
+  int __pyx_v_use_block;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("crosses_loop_q (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_def_block,&__pyx_mstate_global->__pyx_n_u_use_block,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(0, 757, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 757, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 757, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "crosses_loop_q", 0) < (0)) __PYX_ERR(0, 757, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("crosses_loop_q", 1, 2, 2, i); __PYX_ERR(0, 757, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 757, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 757, __pyx_L3_error)
+    }
+    __pyx_v_def_block = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_def_block == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 757, __pyx_L3_error)
+    __pyx_v_use_block = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_use_block == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 757, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("crosses_loop_q", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 757, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.LoopForest.crosses_loop_q", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_10crosses_loop_q(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_v_self), __pyx_v_def_block, __pyx_v_use_block);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+
+
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_10crosses_loop_q(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self, int __pyx_v_def_block, int __pyx_v_use_block) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("crosses_loop_q", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":758
+ * 
+ *     def crosses_loop_q(self, int def_block, int use_block):
+ *         return bool(self.crosses_loop(<int32_t>def_block, <int32_t>use_block))             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_1 = ((struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_v_self->__pyx_vtab)->crosses_loop(__pyx_v_self, ((int32_t)__pyx_v_def_block), ((int32_t)__pyx_v_use_block));
+
+  __pyx_t_2 = __Pyx_PyBool_FromLong((!(!__pyx_t_1))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 758, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_2;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":757
+ *         return out
+ * 
+ *     def crosses_loop_q(self, int def_block, int use_block):             # <<<<<<<<<<<<<<
+ *         return bool(self.crosses_loop(<int32_t>def_block, <int32_t>use_block))
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.LoopForest.crosses_loop_q", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_13__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_13__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_13__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_13__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__reduce_cython__", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_12__reduce_cython__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_12__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.LoopForest.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_15__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_15__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_15__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_15__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  CYTHON_UNUSED PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(1, 3, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__setstate_cython__", 0) < (0)) __PYX_ERR(1, 3, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, i); __PYX_ERR(1, 3, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+    }
+    __pyx_v___pyx_state = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 3, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.LoopForest.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_14__setstate_cython__(((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_v_self), __pyx_v___pyx_state);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_10LoopForest_14__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.LoopForest.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":761
+ * 
+ * 
+ * cdef LoopForest compute_loops(Func func, Dominators D):             # <<<<<<<<<<<<<<
+ *     cdef LoopForest F = LoopForest()
+ *     F.func = func
+*/
+
+static struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_loops(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_func, struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_D) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_F = 0;
+  int32_t __pyx_v_nb;
+  int32_t __pyx_v_ne;
+  int32_t __pyx_v_nwb;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_Edge *__pyx_v_edges;
+  int32_t __pyx_v_e;
+  int32_t __pyx_v_b;
+  int32_t __pyx_v_u;
+  int32_t __pyx_v_h;
+  int32_t __pyx_v_li;
+  int32_t __pyx_v_lj;
+  int32_t __pyx_v_p;
+  int32_t __pyx_v_w;
+  uint8_t *__pyx_v_is_header;
+  int32_t __pyx_v_n_loops;
+  int32_t *__pyx_v_loop_of_header;
+  int32_t *__pyx_v_pred_head;
+  int32_t *__pyx_v_pred_src;
+  int32_t *__pyx_v_cursor;
+  int32_t *__pyx_v_stack;
+  uint64_t *__pyx_v_lbody;
+  int32_t __pyx_v_sp;
+  int32_t __pyx_v_di;
+  int32_t __pyx_v_best;
+  int32_t __pyx_v_best_depth;
+  int32_t __pyx_v_cnt;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  size_t __pyx_t_3;
+  int32_t __pyx_t_4;
+  struct __pyx_t_7sonolus_7backend_4_opt_2ir_Edge *__pyx_t_5;
+  long __pyx_t_6;
+  int __pyx_t_7;
+  int32_t __pyx_t_8;
+  int32_t __pyx_t_9;
+  int32_t __pyx_t_10;
+  int64_t __pyx_t_11;
+  int __pyx_t_12;
+  int32_t __pyx_t_13;
+  int32_t __pyx_t_14;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("compute_loops", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":762
+ * 
+ * cdef LoopForest compute_loops(Func func, Dominators D):
+ *     cdef LoopForest F = LoopForest()             # <<<<<<<<<<<<<<
+ *     F.func = func
+ *     cdef int32_t nb = func.n_blocks
+*/
+  __pyx_t_2 = NULL;
+  __pyx_t_3 = 1;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest, __pyx_callargs+__pyx_t_3, (1-__pyx_t_3) | (__pyx_t_3*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 762, __pyx_L1_error)
+    __Pyx_GOTREF((PyObject *)__pyx_t_1);
+  }
+  __pyx_v_F = ((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":763
+ * cdef LoopForest compute_loops(Func func, Dominators D):
+ *     cdef LoopForest F = LoopForest()
+ *     F.func = func             # <<<<<<<<<<<<<<
+ *     cdef int32_t nb = func.n_blocks
+ *     cdef int32_t ne = func.n_edges
+*/
+  __Pyx_INCREF((PyObject *)__pyx_v_func);
+  __Pyx_GIVEREF((PyObject *)__pyx_v_func);
+  __Pyx_GOTREF((PyObject *)__pyx_v_F->func);
+  __Pyx_DECREF((PyObject *)__pyx_v_F->func);
+  __pyx_v_F->func = __pyx_v_func;
+
+  /* "sonolus/backend/_opt/analysis.pyx":764
+ *     cdef LoopForest F = LoopForest()
+ *     F.func = func
+ *     cdef int32_t nb = func.n_blocks             # <<<<<<<<<<<<<<
+ *     cdef int32_t ne = func.n_edges
+ *     cdef int32_t nwb = (nb + 63) >> 6
+*/
+  __pyx_t_4 = __pyx_v_func->n_blocks;
+
+  __pyx_v_nb = __pyx_t_4;
+
+  /* "sonolus/backend/_opt/analysis.pyx":765
+ *     F.func = func
+ *     cdef int32_t nb = func.n_blocks
+ *     cdef int32_t ne = func.n_edges             # <<<<<<<<<<<<<<
+ *     cdef int32_t nwb = (nb + 63) >> 6
+ *     F.n_blocks = nb
+*/
+  __pyx_t_4 = __pyx_v_func->n_edges;
+
+  __pyx_v_ne = __pyx_t_4;
+
+  /* "sonolus/backend/_opt/analysis.pyx":766
+ *     cdef int32_t nb = func.n_blocks
+ *     cdef int32_t ne = func.n_edges
+ *     cdef int32_t nwb = (nb + 63) >> 6             # <<<<<<<<<<<<<<
+ *     F.n_blocks = nb
+ *     F.nwb = nwb
+*/
+  __pyx_v_nwb = ((__pyx_v_nb + 63) >> 6);
+
+  /* "sonolus/backend/_opt/analysis.pyx":767
+ *     cdef int32_t ne = func.n_edges
+ *     cdef int32_t nwb = (nb + 63) >> 6
+ *     F.n_blocks = nb             # <<<<<<<<<<<<<<
+ *     F.nwb = nwb
+ * 
+*/
+  __pyx_v_F->n_blocks = __pyx_v_nb;
+
+  /* "sonolus/backend/_opt/analysis.pyx":768
+ *     cdef int32_t nwb = (nb + 63) >> 6
+ *     F.n_blocks = nb
+ *     F.nwb = nwb             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Edge* edges = func.edges
+*/
+  __pyx_v_F->nwb = __pyx_v_nwb;
+
+  /* "sonolus/backend/_opt/analysis.pyx":770
+ *     F.nwb = nwb
+ * 
+ *     cdef Edge* edges = func.edges             # <<<<<<<<<<<<<<
+ *     cdef int32_t e, b, u, h, li, lj, p, w
+ * 
+*/
+  __pyx_t_5 = __pyx_v_func->edges;
+
+  __pyx_v_edges = __pyx_t_5;
+
+  /* "sonolus/backend/_opt/analysis.pyx":775
+ *     # Header blocks: a block h with a back edge u->h (h dominates u). Deterministic
+ *     # loop ids assigned in ascending header-block order.
+ *     cdef uint8_t* is_header = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))             # <<<<<<<<<<<<<<
+ *     if is_header == NULL:
+ *         raise MemoryError()
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_is_header = ((uint8_t *)calloc(((size_t)__pyx_t_6), (sizeof(uint8_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":776
+ *     # loop ids assigned in ascending header-block order.
+ *     cdef uint8_t* is_header = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     if is_header == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     for e in range(ne):
+*/
+  __pyx_t_7 = (__pyx_v_is_header == NULL);
+
+  if (unlikely(__pyx_t_7)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":777
+ *     cdef uint8_t* is_header = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     if is_header == NULL:
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     for e in range(ne):
+ *         u = edges[e].src
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 777, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":776
+ *     # loop ids assigned in ascending header-block order.
+ *     cdef uint8_t* is_header = <uint8_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(uint8_t))
+ *     if is_header == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     for e in range(ne):
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":778
+ *     if is_header == NULL:
+ *         raise MemoryError()
+ *     for e in range(ne):             # <<<<<<<<<<<<<<
+ *         u = edges[e].src
+ *         h = edges[e].dst
+*/
+
+  __pyx_t_4 = __pyx_v_ne;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_e = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":779
+ *         raise MemoryError()
+ *     for e in range(ne):
+ *         u = edges[e].src             # <<<<<<<<<<<<<<
+ *         h = edges[e].dst
+ *         if D.dominates(h, u):
+*/
+    __pyx_t_10 = (__pyx_v_edges[__pyx_v_e]).src;
+
+    __pyx_v_u = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":780
+ *     for e in range(ne):
+ *         u = edges[e].src
+ *         h = edges[e].dst             # <<<<<<<<<<<<<<
+ *         if D.dominates(h, u):
+ *             is_header[h] = 1
+*/
+    __pyx_t_10 = (__pyx_v_edges[__pyx_v_e]).dst;
+
+    __pyx_v_h = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":781
+ *         u = edges[e].src
+ *         h = edges[e].dst
+ *         if D.dominates(h, u):             # <<<<<<<<<<<<<<
+ *             is_header[h] = 1
+ * 
+*/
+    __pyx_t_7 = ((struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_v_D->__pyx_vtab)->dominates(__pyx_v_D, __pyx_v_h, __pyx_v_u);
+
+    if (__pyx_t_7) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":782
+ *         h = edges[e].dst
+ *         if D.dominates(h, u):
+ *             is_header[h] = 1             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int32_t n_loops = 0
+*/
+      (__pyx_v_is_header[__pyx_v_h]) = 1;
+
+      /* "sonolus/backend/_opt/analysis.pyx":781
+ *         u = edges[e].src
+ *         h = edges[e].dst
+ *         if D.dominates(h, u):             # <<<<<<<<<<<<<<
+ *             is_header[h] = 1
+ * 
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":784
+ *             is_header[h] = 1
+ * 
+ *     cdef int32_t n_loops = 0             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         if is_header[b]:
+*/
+  __pyx_v_n_loops = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":785
+ * 
+ *     cdef int32_t n_loops = 0
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         if is_header[b]:
+ *             n_loops += 1
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_b = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":786
+ *     cdef int32_t n_loops = 0
+ *     for b in range(nb):
+ *         if is_header[b]:             # <<<<<<<<<<<<<<
+ *             n_loops += 1
+ *     F.n_loops = n_loops
+*/
+    __pyx_t_7 = ((__pyx_v_is_header[__pyx_v_b]) != 0);
+
+    if (__pyx_t_7) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":787
+ *     for b in range(nb):
+ *         if is_header[b]:
+ *             n_loops += 1             # <<<<<<<<<<<<<<
+ *     F.n_loops = n_loops
+ * 
+*/
+      __pyx_v_n_loops = (__pyx_v_n_loops + 1);
+
+      /* "sonolus/backend/_opt/analysis.pyx":786
+ *     cdef int32_t n_loops = 0
+ *     for b in range(nb):
+ *         if is_header[b]:             # <<<<<<<<<<<<<<
+ *             n_loops += 1
+ *     F.n_loops = n_loops
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":788
+ *         if is_header[b]:
+ *             n_loops += 1
+ *     F.n_loops = n_loops             # <<<<<<<<<<<<<<
+ * 
+ *     F.depth = <int32_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(int32_t))
+*/
+  __pyx_v_F->n_loops = __pyx_v_n_loops;
+
+  /* "sonolus/backend/_opt/analysis.pyx":790
+ *     F.n_loops = n_loops
+ * 
+ *     F.depth = <int32_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     F.innermost = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     F.header = <int32_t*>malloc(<size_t>(n_loops if n_loops > 0 else 1) * sizeof(int32_t))
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_F->depth = ((int32_t *)calloc(((size_t)__pyx_t_6), (sizeof(int32_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":791
+ * 
+ *     F.depth = <int32_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(int32_t))
+ *     F.innermost = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     F.header = <int32_t*>malloc(<size_t>(n_loops if n_loops > 0 else 1) * sizeof(int32_t))
+ *     F.parent = <int32_t*>malloc(<size_t>(n_loops if n_loops > 0 else 1) * sizeof(int32_t))
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_F->innermost = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":792
+ *     F.depth = <int32_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(int32_t))
+ *     F.innermost = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     F.header = <int32_t*>malloc(<size_t>(n_loops if n_loops > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     F.parent = <int32_t*>malloc(<size_t>(n_loops if n_loops > 0 else 1) * sizeof(int32_t))
+ *     F.loop_depth = <int32_t*>calloc(<size_t>(n_loops if n_loops > 0 else 1), sizeof(int32_t))
+*/
+  __pyx_t_7 = (__pyx_v_n_loops > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_n_loops;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_F->header = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":793
+ *     F.innermost = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     F.header = <int32_t*>malloc(<size_t>(n_loops if n_loops > 0 else 1) * sizeof(int32_t))
+ *     F.parent = <int32_t*>malloc(<size_t>(n_loops if n_loops > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     F.loop_depth = <int32_t*>calloc(<size_t>(n_loops if n_loops > 0 else 1), sizeof(int32_t))
+ *     F.body = <uint64_t*>calloc(<size_t>(<int64_t>n_loops * nwb if n_loops > 0 and nwb > 0 else 1), sizeof(uint64_t))
+*/
+  __pyx_t_7 = (__pyx_v_n_loops > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_n_loops;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_F->parent = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":794
+ *     F.header = <int32_t*>malloc(<size_t>(n_loops if n_loops > 0 else 1) * sizeof(int32_t))
+ *     F.parent = <int32_t*>malloc(<size_t>(n_loops if n_loops > 0 else 1) * sizeof(int32_t))
+ *     F.loop_depth = <int32_t*>calloc(<size_t>(n_loops if n_loops > 0 else 1), sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     F.body = <uint64_t*>calloc(<size_t>(<int64_t>n_loops * nwb if n_loops > 0 and nwb > 0 else 1), sizeof(uint64_t))
+ *     if (F.depth == NULL or F.innermost == NULL or F.header == NULL or F.parent == NULL
+*/
+  __pyx_t_7 = (__pyx_v_n_loops > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_n_loops;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_F->loop_depth = ((int32_t *)calloc(((size_t)__pyx_t_6), (sizeof(int32_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":795
+ *     F.parent = <int32_t*>malloc(<size_t>(n_loops if n_loops > 0 else 1) * sizeof(int32_t))
+ *     F.loop_depth = <int32_t*>calloc(<size_t>(n_loops if n_loops > 0 else 1), sizeof(int32_t))
+ *     F.body = <uint64_t*>calloc(<size_t>(<int64_t>n_loops * nwb if n_loops > 0 and nwb > 0 else 1), sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *     if (F.depth == NULL or F.innermost == NULL or F.header == NULL or F.parent == NULL
+ *             or F.loop_depth == NULL or F.body == NULL):
+*/
+  __pyx_t_12 = (__pyx_v_n_loops > 0);
+
+  if (__pyx_t_12) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_12;
+
+    goto __pyx_L10_bool_binop_done;
+  }
+  __pyx_t_12 = (__pyx_v_nwb > 0);
+
+
+  __pyx_t_7 = __pyx_t_12;
+
+  __pyx_L10_bool_binop_done:;
+  if (__pyx_t_7) {
+
+    __pyx_t_11 = (((int64_t)__pyx_v_n_loops) * __pyx_v_nwb);
+  } else {
+
+    __pyx_t_11 = 1;
+  }
+
+  __pyx_v_F->body = ((uint64_t *)calloc(((size_t)__pyx_t_11), (sizeof(uint64_t))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":796
+ *     F.loop_depth = <int32_t*>calloc(<size_t>(n_loops if n_loops > 0 else 1), sizeof(int32_t))
+ *     F.body = <uint64_t*>calloc(<size_t>(<int64_t>n_loops * nwb if n_loops > 0 and nwb > 0 else 1), sizeof(uint64_t))
+ *     if (F.depth == NULL or F.innermost == NULL or F.header == NULL or F.parent == NULL             # <<<<<<<<<<<<<<
+ *             or F.loop_depth == NULL or F.body == NULL):
+ *         free(is_header)
+*/
+  __pyx_t_12 = (__pyx_v_F->depth == NULL);
+
+  if (!__pyx_t_12) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_12;
+
+    goto __pyx_L13_bool_binop_done;
+  }
+  __pyx_t_12 = (__pyx_v_F->innermost == NULL);
+
+  if (!__pyx_t_12) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_12;
+
+    goto __pyx_L13_bool_binop_done;
+  }
+  __pyx_t_12 = (__pyx_v_F->header == NULL);
+
+  if (!__pyx_t_12) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_12;
+
+    goto __pyx_L13_bool_binop_done;
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":797
+ *     F.body = <uint64_t*>calloc(<size_t>(<int64_t>n_loops * nwb if n_loops > 0 and nwb > 0 else 1), sizeof(uint64_t))
+ *     if (F.depth == NULL or F.innermost == NULL or F.header == NULL or F.parent == NULL
+ *             or F.loop_depth == NULL or F.body == NULL):             # <<<<<<<<<<<<<<
+ *         free(is_header)
+ *         raise MemoryError()
+*/
+  __pyx_t_12 = (__pyx_v_F->parent == NULL);
+
+  if (!__pyx_t_12) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_12;
+
+    goto __pyx_L13_bool_binop_done;
+  }
+  __pyx_t_12 = (__pyx_v_F->loop_depth == NULL);
+
+  if (!__pyx_t_12) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_12;
+
+    goto __pyx_L13_bool_binop_done;
+  }
+  __pyx_t_12 = (__pyx_v_F->body == NULL);
+
+
+  __pyx_t_7 = __pyx_t_12;
+
+  __pyx_L13_bool_binop_done:;
+
+  /* "sonolus/backend/_opt/analysis.pyx":796
+ *     F.loop_depth = <int32_t*>calloc(<size_t>(n_loops if n_loops > 0 else 1), sizeof(int32_t))
+ *     F.body = <uint64_t*>calloc(<size_t>(<int64_t>n_loops * nwb if n_loops > 0 and nwb > 0 else 1), sizeof(uint64_t))
+ *     if (F.depth == NULL or F.innermost == NULL or F.header == NULL or F.parent == NULL             # <<<<<<<<<<<<<<
+ *             or F.loop_depth == NULL or F.body == NULL):
+ *         free(is_header)
+*/
+  if (unlikely(__pyx_t_7)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":798
+ *     if (F.depth == NULL or F.innermost == NULL or F.header == NULL or F.parent == NULL
+ *             or F.loop_depth == NULL or F.body == NULL):
+ *         free(is_header)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     for b in range(nb):
+*/
+    free(__pyx_v_is_header);
+
+    /* "sonolus/backend/_opt/analysis.pyx":799
+ *             or F.loop_depth == NULL or F.body == NULL):
+ *         free(is_header)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         F.innermost[b] = -1
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 799, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":796
+ *     F.loop_depth = <int32_t*>calloc(<size_t>(n_loops if n_loops > 0 else 1), sizeof(int32_t))
+ *     F.body = <uint64_t*>calloc(<size_t>(<int64_t>n_loops * nwb if n_loops > 0 and nwb > 0 else 1), sizeof(uint64_t))
+ *     if (F.depth == NULL or F.innermost == NULL or F.header == NULL or F.parent == NULL             # <<<<<<<<<<<<<<
+ *             or F.loop_depth == NULL or F.body == NULL):
+ *         free(is_header)
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":800
+ *         free(is_header)
+ *         raise MemoryError()
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         F.innermost[b] = -1
+ * 
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_b = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":801
+ *         raise MemoryError()
+ *     for b in range(nb):
+ *         F.innermost[b] = -1             # <<<<<<<<<<<<<<
+ * 
+ *     # loop id per header block (ascending header order == ascending block id).
+*/
+    (__pyx_v_F->innermost[__pyx_v_b]) = -1;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":804
+ * 
+ *     # loop id per header block (ascending header order == ascending block id).
+ *     cdef int32_t* loop_of_header = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     if loop_of_header == NULL:
+ *         free(is_header)
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_loop_of_header = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":805
+ *     # loop id per header block (ascending header order == ascending block id).
+ *     cdef int32_t* loop_of_header = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if loop_of_header == NULL:             # <<<<<<<<<<<<<<
+ *         free(is_header)
+ *         raise MemoryError()
+*/
+  __pyx_t_7 = (__pyx_v_loop_of_header == NULL);
+
+  if (unlikely(__pyx_t_7)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":806
+ *     cdef int32_t* loop_of_header = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if loop_of_header == NULL:
+ *         free(is_header)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     for b in range(nb):
+*/
+    free(__pyx_v_is_header);
+
+    /* "sonolus/backend/_opt/analysis.pyx":807
+ *     if loop_of_header == NULL:
+ *         free(is_header)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         loop_of_header[b] = -1
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 807, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":805
+ *     # loop id per header block (ascending header order == ascending block id).
+ *     cdef int32_t* loop_of_header = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if loop_of_header == NULL:             # <<<<<<<<<<<<<<
+ *         free(is_header)
+ *         raise MemoryError()
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":808
+ *         free(is_header)
+ *         raise MemoryError()
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         loop_of_header[b] = -1
+ *     li = 0
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_b = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":809
+ *         raise MemoryError()
+ *     for b in range(nb):
+ *         loop_of_header[b] = -1             # <<<<<<<<<<<<<<
+ *     li = 0
+ *     for b in range(nb):
+*/
+    (__pyx_v_loop_of_header[__pyx_v_b]) = -1;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":810
+ *     for b in range(nb):
+ *         loop_of_header[b] = -1
+ *     li = 0             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         if is_header[b]:
+*/
+  __pyx_v_li = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":811
+ *         loop_of_header[b] = -1
+ *     li = 0
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         if is_header[b]:
+ *             loop_of_header[b] = li
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_b = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":812
+ *     li = 0
+ *     for b in range(nb):
+ *         if is_header[b]:             # <<<<<<<<<<<<<<
+ *             loop_of_header[b] = li
+ *             F.header[li] = b
+*/
+    __pyx_t_7 = ((__pyx_v_is_header[__pyx_v_b]) != 0);
+
+    if (__pyx_t_7) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":813
+ *     for b in range(nb):
+ *         if is_header[b]:
+ *             loop_of_header[b] = li             # <<<<<<<<<<<<<<
+ *             F.header[li] = b
+ *             F.parent[li] = -1
+*/
+      (__pyx_v_loop_of_header[__pyx_v_b]) = __pyx_v_li;
+
+      /* "sonolus/backend/_opt/analysis.pyx":814
+ *         if is_header[b]:
+ *             loop_of_header[b] = li
+ *             F.header[li] = b             # <<<<<<<<<<<<<<
+ *             F.parent[li] = -1
+ *             li += 1
+*/
+      (__pyx_v_F->header[__pyx_v_li]) = __pyx_v_b;
+
+      /* "sonolus/backend/_opt/analysis.pyx":815
+ *             loop_of_header[b] = li
+ *             F.header[li] = b
+ *             F.parent[li] = -1             # <<<<<<<<<<<<<<
+ *             li += 1
+ * 
+*/
+      (__pyx_v_F->parent[__pyx_v_li]) = -1;
+
+      /* "sonolus/backend/_opt/analysis.pyx":816
+ *             F.header[li] = b
+ *             F.parent[li] = -1
+ *             li += 1             # <<<<<<<<<<<<<<
+ * 
+ *     # Predecessor CSR for backward reachability.
+*/
+      __pyx_v_li = (__pyx_v_li + 1);
+
+      /* "sonolus/backend/_opt/analysis.pyx":812
+ *     li = 0
+ *     for b in range(nb):
+ *         if is_header[b]:             # <<<<<<<<<<<<<<
+ *             loop_of_header[b] = li
+ *             F.header[li] = b
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":819
+ * 
+ *     # Predecessor CSR for backward reachability.
+ *     cdef int32_t* pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     cdef int32_t* pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+*/
+  __pyx_v_pred_head = ((int32_t *)calloc(((size_t)(__pyx_v_nb + 1)), (sizeof(int32_t))));
+
+  /* "sonolus/backend/_opt/analysis.pyx":820
+ *     # Predecessor CSR for backward reachability.
+ *     cdef int32_t* pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     cdef int32_t* pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+*/
+  __pyx_t_7 = (__pyx_v_ne > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_ne;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_pred_src = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":821
+ *     cdef int32_t* pred_head = <int32_t*>calloc(<size_t>(nb + 1), sizeof(int32_t))
+ *     cdef int32_t* pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if pred_head == NULL or pred_src == NULL or cursor == NULL or stack == NULL:
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_cursor = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":822
+ *     cdef int32_t* pred_src = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *     if pred_head == NULL or pred_src == NULL or cursor == NULL or stack == NULL:
+ *         free(is_header); free(loop_of_header); free(pred_head); free(pred_src); free(cursor); free(stack)
+*/
+  __pyx_t_7 = (__pyx_v_nb > 0);
+
+  if (__pyx_t_7) {
+
+    __pyx_t_6 = __pyx_v_nb;
+  } else {
+
+    __pyx_t_6 = 1;
+  }
+
+  __pyx_v_stack = ((int32_t *)malloc((((size_t)__pyx_t_6) * (sizeof(int32_t)))));
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":823
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if pred_head == NULL or pred_src == NULL or cursor == NULL or stack == NULL:             # <<<<<<<<<<<<<<
+ *         free(is_header); free(loop_of_header); free(pred_head); free(pred_src); free(cursor); free(stack)
+ *         raise MemoryError()
+*/
+  __pyx_t_12 = (__pyx_v_pred_head == NULL);
+
+  if (!__pyx_t_12) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_12;
+
+    goto __pyx_L28_bool_binop_done;
+  }
+  __pyx_t_12 = (__pyx_v_pred_src == NULL);
+
+  if (!__pyx_t_12) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_12;
+
+    goto __pyx_L28_bool_binop_done;
+  }
+  __pyx_t_12 = (__pyx_v_cursor == NULL);
+
+  if (!__pyx_t_12) {
+
+  } else {
+
+    __pyx_t_7 = __pyx_t_12;
+
+    goto __pyx_L28_bool_binop_done;
+  }
+  __pyx_t_12 = (__pyx_v_stack == NULL);
+
+
+  __pyx_t_7 = __pyx_t_12;
+
+  __pyx_L28_bool_binop_done:;
+  if (unlikely(__pyx_t_7)) {
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":824
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if pred_head == NULL or pred_src == NULL or cursor == NULL or stack == NULL:
+ *         free(is_header); free(loop_of_header); free(pred_head); free(pred_src); free(cursor); free(stack)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     for e in range(ne):
+*/
+    free(__pyx_v_is_header);
+    free(__pyx_v_loop_of_header);
+    free(__pyx_v_pred_head);
+    free(__pyx_v_pred_src);
+    free(__pyx_v_cursor);
+    free(__pyx_v_stack);
+
+    /* "sonolus/backend/_opt/analysis.pyx":825
+ *     if pred_head == NULL or pred_src == NULL or cursor == NULL or stack == NULL:
+ *         free(is_header); free(loop_of_header); free(pred_head); free(pred_src); free(cursor); free(stack)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     for e in range(ne):
+ *         pred_head[edges[e].dst + 1] += 1
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 825, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/analysis.pyx":823
+ *     cdef int32_t* cursor = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     cdef int32_t* stack = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+ *     if pred_head == NULL or pred_src == NULL or cursor == NULL or stack == NULL:             # <<<<<<<<<<<<<<
+ *         free(is_header); free(loop_of_header); free(pred_head); free(pred_src); free(cursor); free(stack)
+ *         raise MemoryError()
+*/
+  }
+
+  /* "sonolus/backend/_opt/analysis.pyx":826
+ *         free(is_header); free(loop_of_header); free(pred_head); free(pred_src); free(cursor); free(stack)
+ *         raise MemoryError()
+ *     for e in range(ne):             # <<<<<<<<<<<<<<
+ *         pred_head[edges[e].dst + 1] += 1
+ *     for b in range(nb):
+*/
+
+  __pyx_t_4 = __pyx_v_ne;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_e = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":827
+ *         raise MemoryError()
+ *     for e in range(ne):
+ *         pred_head[edges[e].dst + 1] += 1             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         pred_head[b + 1] += pred_head[b]
+*/
+
+    __pyx_t_6 = ((__pyx_v_edges[__pyx_v_e]).dst + 1);
+    (__pyx_v_pred_head[__pyx_t_6]) = ((__pyx_v_pred_head[__pyx_t_6]) + 1);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":828
+ *     for e in range(ne):
+ *         pred_head[edges[e].dst + 1] += 1
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         pred_head[b + 1] += pred_head[b]
+ *     for b in range(nb):
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_b = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":829
+ *         pred_head[edges[e].dst + 1] += 1
+ *     for b in range(nb):
+ *         pred_head[b + 1] += pred_head[b]             # <<<<<<<<<<<<<<
+ *     for b in range(nb):
+ *         cursor[b] = pred_head[b]
+*/
+
+    __pyx_t_6 = (__pyx_v_b + 1);
+    (__pyx_v_pred_head[__pyx_t_6]) = ((__pyx_v_pred_head[__pyx_t_6]) + (__pyx_v_pred_head[__pyx_v_b]));
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":830
+ *     for b in range(nb):
+ *         pred_head[b + 1] += pred_head[b]
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         cursor[b] = pred_head[b]
+ *     for e in range(ne):
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_b = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":831
+ *         pred_head[b + 1] += pred_head[b]
+ *     for b in range(nb):
+ *         cursor[b] = pred_head[b]             # <<<<<<<<<<<<<<
+ *     for e in range(ne):
+ *         pred_src[cursor[edges[e].dst]] = edges[e].src
+*/
+    (__pyx_v_cursor[__pyx_v_b]) = (__pyx_v_pred_head[__pyx_v_b]);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":832
+ *     for b in range(nb):
+ *         cursor[b] = pred_head[b]
+ *     for e in range(ne):             # <<<<<<<<<<<<<<
+ *         pred_src[cursor[edges[e].dst]] = edges[e].src
+ *         cursor[edges[e].dst] += 1
+*/
+
+  __pyx_t_4 = __pyx_v_ne;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_e = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":833
+ *         cursor[b] = pred_head[b]
+ *     for e in range(ne):
+ *         pred_src[cursor[edges[e].dst]] = edges[e].src             # <<<<<<<<<<<<<<
+ *         cursor[edges[e].dst] += 1
+ * 
+*/
+    __pyx_t_10 = (__pyx_v_edges[__pyx_v_e]).src;
+
+    (__pyx_v_pred_src[(__pyx_v_cursor[(__pyx_v_edges[__pyx_v_e]).dst])]) = __pyx_t_10;
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":834
+ *     for e in range(ne):
+ *         pred_src[cursor[edges[e].dst]] = edges[e].src
+ *         cursor[edges[e].dst] += 1             # <<<<<<<<<<<<<<
+ * 
+ *     # Body of each loop: header + backward reach from every latch, stopping at
+*/
+
+    __pyx_t_10 = (__pyx_v_edges[__pyx_v_e]).dst;
+    (__pyx_v_cursor[__pyx_t_10]) = ((__pyx_v_cursor[__pyx_t_10]) + 1);
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":840
+ *     cdef uint64_t* lbody
+ *     cdef int32_t sp
+ *     for e in range(ne):             # <<<<<<<<<<<<<<
+ *         u = edges[e].src
+ *         h = edges[e].dst
+*/
+
+  __pyx_t_4 = __pyx_v_ne;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_e = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":841
+ *     cdef int32_t sp
+ *     for e in range(ne):
+ *         u = edges[e].src             # <<<<<<<<<<<<<<
+ *         h = edges[e].dst
+ *         if not D.dominates(h, u):
+*/
+    __pyx_t_10 = (__pyx_v_edges[__pyx_v_e]).src;
+
+    __pyx_v_u = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":842
+ *     for e in range(ne):
+ *         u = edges[e].src
+ *         h = edges[e].dst             # <<<<<<<<<<<<<<
+ *         if not D.dominates(h, u):
+ *             continue
+*/
+    __pyx_t_10 = (__pyx_v_edges[__pyx_v_e]).dst;
+
+    __pyx_v_h = __pyx_t_10;
+
+    /* "sonolus/backend/_opt/analysis.pyx":843
+ *         u = edges[e].src
+ *         h = edges[e].dst
+ *         if not D.dominates(h, u):             # <<<<<<<<<<<<<<
+ *             continue
+ *         li = loop_of_header[h]
+*/
+    __pyx_t_7 = (!((struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_v_D->__pyx_vtab)->dominates(__pyx_v_D, __pyx_v_h, __pyx_v_u));
+
+    if (__pyx_t_7) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":844
+ *         h = edges[e].dst
+ *         if not D.dominates(h, u):
+ *             continue             # <<<<<<<<<<<<<<
+ *         li = loop_of_header[h]
+ *         lbody = &F.body[<int64_t>li * nwb]
+*/
+      goto __pyx_L40_continue;
+
+      /* "sonolus/backend/_opt/analysis.pyx":843
+ *         u = edges[e].src
+ *         h = edges[e].dst
+ *         if not D.dominates(h, u):             # <<<<<<<<<<<<<<
+ *             continue
+ *         li = loop_of_header[h]
+*/
+    }
+
+    /* "sonolus/backend/_opt/analysis.pyx":845
+ *         if not D.dominates(h, u):
+ *             continue
+ *         li = loop_of_header[h]             # <<<<<<<<<<<<<<
+ *         lbody = &F.body[<int64_t>li * nwb]
+ *         bs_set(lbody, h)
+*/
+    __pyx_v_li = (__pyx_v_loop_of_header[__pyx_v_h]);
+
+    /* "sonolus/backend/_opt/analysis.pyx":846
+ *             continue
+ *         li = loop_of_header[h]
+ *         lbody = &F.body[<int64_t>li * nwb]             # <<<<<<<<<<<<<<
+ *         bs_set(lbody, h)
+ *         if not bs_get(lbody, u):
+*/
+    __pyx_v_lbody = (&(__pyx_v_F->body[(((int64_t)__pyx_v_li) * __pyx_v_nwb)]));
+
+    /* "sonolus/backend/_opt/analysis.pyx":847
+ *         li = loop_of_header[h]
+ *         lbody = &F.body[<int64_t>li * nwb]
+ *         bs_set(lbody, h)             # <<<<<<<<<<<<<<
+ *         if not bs_get(lbody, u):
+ *             bs_set(lbody, u)
+*/
+    __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_set(__pyx_v_lbody, __pyx_v_h);
+
+    /* "sonolus/backend/_opt/analysis.pyx":848
+ *         lbody = &F.body[<int64_t>li * nwb]
+ *         bs_set(lbody, h)
+ *         if not bs_get(lbody, u):             # <<<<<<<<<<<<<<
+ *             bs_set(lbody, u)
+ *             sp = 0
+*/
+    __pyx_t_7 = (!__pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get(__pyx_v_lbody, __pyx_v_u));
+
+    if (__pyx_t_7) {
+
+
+      /* "sonolus/backend/_opt/analysis.pyx":849
+ *         bs_set(lbody, h)
+ *         if not bs_get(lbody, u):
+ *             bs_set(lbody, u)             # <<<<<<<<<<<<<<
+ *             sp = 0
+ *             stack[sp] = u
+*/
+      __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_set(__pyx_v_lbody, __pyx_v_u);
+
+      /* "sonolus/backend/_opt/analysis.pyx":850
+ *         if not bs_get(lbody, u):
+ *             bs_set(lbody, u)
+ *             sp = 0             # <<<<<<<<<<<<<<
+ *             stack[sp] = u
+ *             sp += 1
+*/
+      __pyx_v_sp = 0;
+
+      /* "sonolus/backend/_opt/analysis.pyx":851
+ *             bs_set(lbody, u)
+ *             sp = 0
+ *             stack[sp] = u             # <<<<<<<<<<<<<<
+ *             sp += 1
+ *             while sp > 0:
+*/
+      (__pyx_v_stack[__pyx_v_sp]) = __pyx_v_u;
+
+      /* "sonolus/backend/_opt/analysis.pyx":852
+ *             sp = 0
+ *             stack[sp] = u
+ *             sp += 1             # <<<<<<<<<<<<<<
+ *             while sp > 0:
+ *                 sp -= 1
+*/
+      __pyx_v_sp = (__pyx_v_sp + 1);
+
+      /* "sonolus/backend/_opt/analysis.pyx":853
+ *             stack[sp] = u
+ *             sp += 1
+ *             while sp > 0:             # <<<<<<<<<<<<<<
+ *                 sp -= 1
+ *                 b = stack[sp]
+*/
+      while (1) {
+        __pyx_t_7 = (__pyx_v_sp > 0);
+
+
+        if (!__pyx_t_7) break;
+
+        /* "sonolus/backend/_opt/analysis.pyx":854
+ *             sp += 1
+ *             while sp > 0:
+ *                 sp -= 1             # <<<<<<<<<<<<<<
+ *                 b = stack[sp]
+ *                 for p in range(pred_head[b], pred_head[b + 1]):
+*/
+        __pyx_v_sp = (__pyx_v_sp - 1);
+
+        /* "sonolus/backend/_opt/analysis.pyx":855
+ *             while sp > 0:
+ *                 sp -= 1
+ *                 b = stack[sp]             # <<<<<<<<<<<<<<
+ *                 for p in range(pred_head[b], pred_head[b + 1]):
+ *                     w = pred_src[p]
+*/
+        __pyx_v_b = (__pyx_v_stack[__pyx_v_sp]);
+
+        /* "sonolus/backend/_opt/analysis.pyx":856
+ *                 sp -= 1
+ *                 b = stack[sp]
+ *                 for p in range(pred_head[b], pred_head[b + 1]):             # <<<<<<<<<<<<<<
+ *                     w = pred_src[p]
+ *                     if not bs_get(lbody, w):
+*/
+
+        __pyx_t_10 = (__pyx_v_pred_head[(__pyx_v_b + 1)]);
+        __pyx_t_13 = __pyx_t_10;
+
+        for (__pyx_t_14 = (__pyx_v_pred_head[__pyx_v_b]); __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+          __pyx_v_p = __pyx_t_14;
+
+          /* "sonolus/backend/_opt/analysis.pyx":857
+ *                 b = stack[sp]
+ *                 for p in range(pred_head[b], pred_head[b + 1]):
+ *                     w = pred_src[p]             # <<<<<<<<<<<<<<
+ *                     if not bs_get(lbody, w):
+ *                         bs_set(lbody, w)
+*/
+          __pyx_v_w = (__pyx_v_pred_src[__pyx_v_p]);
+
+          /* "sonolus/backend/_opt/analysis.pyx":858
+ *                 for p in range(pred_head[b], pred_head[b + 1]):
+ *                     w = pred_src[p]
+ *                     if not bs_get(lbody, w):             # <<<<<<<<<<<<<<
+ *                         bs_set(lbody, w)
+ *                         stack[sp] = w
+*/
+          __pyx_t_7 = (!__pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get(__pyx_v_lbody, __pyx_v_w));
+
+          if (__pyx_t_7) {
+
+
+            /* "sonolus/backend/_opt/analysis.pyx":859
+ *                     w = pred_src[p]
+ *                     if not bs_get(lbody, w):
+ *                         bs_set(lbody, w)             # <<<<<<<<<<<<<<
+ *                         stack[sp] = w
+ *                         sp += 1
+*/
+            __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_set(__pyx_v_lbody, __pyx_v_w);
+
+            /* "sonolus/backend/_opt/analysis.pyx":860
+ *                     if not bs_get(lbody, w):
+ *                         bs_set(lbody, w)
+ *                         stack[sp] = w             # <<<<<<<<<<<<<<
+ *                         sp += 1
+ * 
+*/
+            (__pyx_v_stack[__pyx_v_sp]) = __pyx_v_w;
+
+            /* "sonolus/backend/_opt/analysis.pyx":861
+ *                         bs_set(lbody, w)
+ *                         stack[sp] = w
+ *                         sp += 1             # <<<<<<<<<<<<<<
+ * 
+ *     # Loop depth = number of loops containing a loop's header (including itself).
+*/
+            __pyx_v_sp = (__pyx_v_sp + 1);
+
+            /* "sonolus/backend/_opt/analysis.pyx":858
+ *                 for p in range(pred_head[b], pred_head[b + 1]):
+ *                     w = pred_src[p]
+ *                     if not bs_get(lbody, w):             # <<<<<<<<<<<<<<
+ *                         bs_set(lbody, w)
+ *                         stack[sp] = w
+*/
+          }
+        }
+
+      }
+
+      /* "sonolus/backend/_opt/analysis.pyx":848
+ *         lbody = &F.body[<int64_t>li * nwb]
+ *         bs_set(lbody, h)
+ *         if not bs_get(lbody, u):             # <<<<<<<<<<<<<<
+ *             bs_set(lbody, u)
+ *             sp = 0
+*/
+    }
+    __pyx_L40_continue:;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":865
+ *     # Loop depth = number of loops containing a loop's header (including itself).
+ *     cdef int32_t di
+ *     for li in range(n_loops):             # <<<<<<<<<<<<<<
+ *         di = 0
+ *         for lj in range(n_loops):
+*/
+
+  __pyx_t_4 = __pyx_v_n_loops;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_li = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":866
+ *     cdef int32_t di
+ *     for li in range(n_loops):
+ *         di = 0             # <<<<<<<<<<<<<<
+ *         for lj in range(n_loops):
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):
+*/
+    __pyx_v_di = 0;
+
+    /* "sonolus/backend/_opt/analysis.pyx":867
+ *     for li in range(n_loops):
+ *         di = 0
+ *         for lj in range(n_loops):             # <<<<<<<<<<<<<<
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):
+ *                 di += 1
+*/
+
+    __pyx_t_10 = __pyx_v_n_loops;
+    __pyx_t_13 = __pyx_t_10;
+
+    for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+      __pyx_v_lj = __pyx_t_14;
+
+      /* "sonolus/backend/_opt/analysis.pyx":868
+ *         di = 0
+ *         for lj in range(n_loops):
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):             # <<<<<<<<<<<<<<
+ *                 di += 1
+ *         F.loop_depth[li] = di
+*/
+      __pyx_t_7 = __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get((&(__pyx_v_F->body[(((int64_t)__pyx_v_lj) * __pyx_v_nwb)])), (__pyx_v_F->header[__pyx_v_li]));
+
+      if (__pyx_t_7) {
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":869
+ *         for lj in range(n_loops):
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):
+ *                 di += 1             # <<<<<<<<<<<<<<
+ *         F.loop_depth[li] = di
+ * 
+*/
+        __pyx_v_di = (__pyx_v_di + 1);
+
+        /* "sonolus/backend/_opt/analysis.pyx":868
+ *         di = 0
+ *         for lj in range(n_loops):
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):             # <<<<<<<<<<<<<<
+ *                 di += 1
+ *         F.loop_depth[li] = di
+*/
+      }
+    }
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":870
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):
+ *                 di += 1
+ *         F.loop_depth[li] = di             # <<<<<<<<<<<<<<
+ * 
+ *     # Parent loop of L = the loop (other than L) containing L's header with the
+*/
+    (__pyx_v_F->loop_depth[__pyx_v_li]) = __pyx_v_di;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":875
+ *     # greatest depth (the immediately-enclosing loop).
+ *     cdef int32_t best, best_depth
+ *     for li in range(n_loops):             # <<<<<<<<<<<<<<
+ *         best = -1
+ *         best_depth = 0
+*/
+
+  __pyx_t_4 = __pyx_v_n_loops;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_li = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":876
+ *     cdef int32_t best, best_depth
+ *     for li in range(n_loops):
+ *         best = -1             # <<<<<<<<<<<<<<
+ *         best_depth = 0
+ *         for lj in range(n_loops):
+*/
+    __pyx_v_best = -1;
+
+    /* "sonolus/backend/_opt/analysis.pyx":877
+ *     for li in range(n_loops):
+ *         best = -1
+ *         best_depth = 0             # <<<<<<<<<<<<<<
+ *         for lj in range(n_loops):
+ *             if lj == li:
+*/
+    __pyx_v_best_depth = 0;
+
+    /* "sonolus/backend/_opt/analysis.pyx":878
+ *         best = -1
+ *         best_depth = 0
+ *         for lj in range(n_loops):             # <<<<<<<<<<<<<<
+ *             if lj == li:
+ *                 continue
+*/
+
+    __pyx_t_10 = __pyx_v_n_loops;
+    __pyx_t_13 = __pyx_t_10;
+
+    for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+      __pyx_v_lj = __pyx_t_14;
+
+      /* "sonolus/backend/_opt/analysis.pyx":879
+ *         best_depth = 0
+ *         for lj in range(n_loops):
+ *             if lj == li:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):
+*/
+      __pyx_t_7 = (__pyx_v_lj == __pyx_v_li);
+
+      if (__pyx_t_7) {
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":880
+ *         for lj in range(n_loops):
+ *             if lj == li:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):
+ *                 if F.loop_depth[lj] > best_depth:
+*/
+        goto __pyx_L56_continue;
+
+        /* "sonolus/backend/_opt/analysis.pyx":879
+ *         best_depth = 0
+ *         for lj in range(n_loops):
+ *             if lj == li:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):
+*/
+      }
+
+      /* "sonolus/backend/_opt/analysis.pyx":881
+ *             if lj == li:
+ *                 continue
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):             # <<<<<<<<<<<<<<
+ *                 if F.loop_depth[lj] > best_depth:
+ *                     best_depth = F.loop_depth[lj]
+*/
+      __pyx_t_7 = __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get((&(__pyx_v_F->body[(((int64_t)__pyx_v_lj) * __pyx_v_nwb)])), (__pyx_v_F->header[__pyx_v_li]));
+
+      if (__pyx_t_7) {
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":882
+ *                 continue
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):
+ *                 if F.loop_depth[lj] > best_depth:             # <<<<<<<<<<<<<<
+ *                     best_depth = F.loop_depth[lj]
+ *                     best = lj
+*/
+        __pyx_t_7 = ((__pyx_v_F->loop_depth[__pyx_v_lj]) > __pyx_v_best_depth);
+
+        if (__pyx_t_7) {
+
+
+          /* "sonolus/backend/_opt/analysis.pyx":883
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):
+ *                 if F.loop_depth[lj] > best_depth:
+ *                     best_depth = F.loop_depth[lj]             # <<<<<<<<<<<<<<
+ *                     best = lj
+ *         F.parent[li] = best
+*/
+          __pyx_v_best_depth = (__pyx_v_F->loop_depth[__pyx_v_lj]);
+
+          /* "sonolus/backend/_opt/analysis.pyx":884
+ *                 if F.loop_depth[lj] > best_depth:
+ *                     best_depth = F.loop_depth[lj]
+ *                     best = lj             # <<<<<<<<<<<<<<
+ *         F.parent[li] = best
+ * 
+*/
+          __pyx_v_best = __pyx_v_lj;
+
+          /* "sonolus/backend/_opt/analysis.pyx":882
+ *                 continue
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):
+ *                 if F.loop_depth[lj] > best_depth:             # <<<<<<<<<<<<<<
+ *                     best_depth = F.loop_depth[lj]
+ *                     best = lj
+*/
+        }
+
+        /* "sonolus/backend/_opt/analysis.pyx":881
+ *             if lj == li:
+ *                 continue
+ *             if bs_get(&F.body[<int64_t>lj * nwb], F.header[li]):             # <<<<<<<<<<<<<<
+ *                 if F.loop_depth[lj] > best_depth:
+ *                     best_depth = F.loop_depth[lj]
+*/
+      }
+      __pyx_L56_continue:;
+    }
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":885
+ *                     best_depth = F.loop_depth[lj]
+ *                     best = lj
+ *         F.parent[li] = best             # <<<<<<<<<<<<<<
+ * 
+ *     # Per-block innermost loop (max depth) and depth (count of containing loops).
+*/
+    (__pyx_v_F->parent[__pyx_v_li]) = __pyx_v_best;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":889
+ *     # Per-block innermost loop (max depth) and depth (count of containing loops).
+ *     cdef int32_t cnt, bi
+ *     for b in range(nb):             # <<<<<<<<<<<<<<
+ *         cnt = 0
+ *         best = -1
+*/
+
+  __pyx_t_4 = __pyx_v_nb;
+  __pyx_t_8 = __pyx_t_4;
+
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_b = __pyx_t_9;
+
+    /* "sonolus/backend/_opt/analysis.pyx":890
+ *     cdef int32_t cnt, bi
+ *     for b in range(nb):
+ *         cnt = 0             # <<<<<<<<<<<<<<
+ *         best = -1
+ *         best_depth = 0
+*/
+    __pyx_v_cnt = 0;
+
+    /* "sonolus/backend/_opt/analysis.pyx":891
+ *     for b in range(nb):
+ *         cnt = 0
+ *         best = -1             # <<<<<<<<<<<<<<
+ *         best_depth = 0
+ *         for li in range(n_loops):
+*/
+    __pyx_v_best = -1;
+
+    /* "sonolus/backend/_opt/analysis.pyx":892
+ *         cnt = 0
+ *         best = -1
+ *         best_depth = 0             # <<<<<<<<<<<<<<
+ *         for li in range(n_loops):
+ *             if bs_get(&F.body[<int64_t>li * nwb], b):
+*/
+    __pyx_v_best_depth = 0;
+
+    /* "sonolus/backend/_opt/analysis.pyx":893
+ *         best = -1
+ *         best_depth = 0
+ *         for li in range(n_loops):             # <<<<<<<<<<<<<<
+ *             if bs_get(&F.body[<int64_t>li * nwb], b):
+ *                 cnt += 1
+*/
+
+    __pyx_t_10 = __pyx_v_n_loops;
+    __pyx_t_13 = __pyx_t_10;
+
+    for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+      __pyx_v_li = __pyx_t_14;
+
+      /* "sonolus/backend/_opt/analysis.pyx":894
+ *         best_depth = 0
+ *         for li in range(n_loops):
+ *             if bs_get(&F.body[<int64_t>li * nwb], b):             # <<<<<<<<<<<<<<
+ *                 cnt += 1
+ *                 if F.loop_depth[li] > best_depth:
+*/
+      __pyx_t_7 = __pyx_f_7sonolus_7backend_4_opt_8analysis_bs_get((&(__pyx_v_F->body[(((int64_t)__pyx_v_li) * __pyx_v_nwb)])), __pyx_v_b);
+
+      if (__pyx_t_7) {
+
+
+        /* "sonolus/backend/_opt/analysis.pyx":895
+ *         for li in range(n_loops):
+ *             if bs_get(&F.body[<int64_t>li * nwb], b):
+ *                 cnt += 1             # <<<<<<<<<<<<<<
+ *                 if F.loop_depth[li] > best_depth:
+ *                     best_depth = F.loop_depth[li]
+*/
+        __pyx_v_cnt = (__pyx_v_cnt + 1);
+
+        /* "sonolus/backend/_opt/analysis.pyx":896
+ *             if bs_get(&F.body[<int64_t>li * nwb], b):
+ *                 cnt += 1
+ *                 if F.loop_depth[li] > best_depth:             # <<<<<<<<<<<<<<
+ *                     best_depth = F.loop_depth[li]
+ *                     best = li
+*/
+        __pyx_t_7 = ((__pyx_v_F->loop_depth[__pyx_v_li]) > __pyx_v_best_depth);
+
+        if (__pyx_t_7) {
+
+
+          /* "sonolus/backend/_opt/analysis.pyx":897
+ *                 cnt += 1
+ *                 if F.loop_depth[li] > best_depth:
+ *                     best_depth = F.loop_depth[li]             # <<<<<<<<<<<<<<
+ *                     best = li
+ *         F.depth[b] = cnt
+*/
+          __pyx_v_best_depth = (__pyx_v_F->loop_depth[__pyx_v_li]);
+
+          /* "sonolus/backend/_opt/analysis.pyx":898
+ *                 if F.loop_depth[li] > best_depth:
+ *                     best_depth = F.loop_depth[li]
+ *                     best = li             # <<<<<<<<<<<<<<
+ *         F.depth[b] = cnt
+ *         F.innermost[b] = best
+*/
+          __pyx_v_best = __pyx_v_li;
+
+          /* "sonolus/backend/_opt/analysis.pyx":896
+ *             if bs_get(&F.body[<int64_t>li * nwb], b):
+ *                 cnt += 1
+ *                 if F.loop_depth[li] > best_depth:             # <<<<<<<<<<<<<<
+ *                     best_depth = F.loop_depth[li]
+ *                     best = li
+*/
+        }
+
+        /* "sonolus/backend/_opt/analysis.pyx":894
+ *         best_depth = 0
+ *         for li in range(n_loops):
+ *             if bs_get(&F.body[<int64_t>li * nwb], b):             # <<<<<<<<<<<<<<
+ *                 cnt += 1
+ *                 if F.loop_depth[li] > best_depth:
+*/
+      }
+    }
+
+
+    /* "sonolus/backend/_opt/analysis.pyx":899
+ *                     best_depth = F.loop_depth[li]
+ *                     best = li
+ *         F.depth[b] = cnt             # <<<<<<<<<<<<<<
+ *         F.innermost[b] = best
+ * 
+*/
+    (__pyx_v_F->depth[__pyx_v_b]) = __pyx_v_cnt;
+
+    /* "sonolus/backend/_opt/analysis.pyx":900
+ *                     best = li
+ *         F.depth[b] = cnt
+ *         F.innermost[b] = best             # <<<<<<<<<<<<<<
+ * 
+ *     free(is_header)
+*/
+    (__pyx_v_F->innermost[__pyx_v_b]) = __pyx_v_best;
+  }
+
+
+  /* "sonolus/backend/_opt/analysis.pyx":902
+ *         F.innermost[b] = best
+ * 
+ *     free(is_header)             # <<<<<<<<<<<<<<
+ *     free(loop_of_header)
+ *     free(pred_head)
+*/
+  free(__pyx_v_is_header);
+
+  /* "sonolus/backend/_opt/analysis.pyx":903
+ * 
+ *     free(is_header)
+ *     free(loop_of_header)             # <<<<<<<<<<<<<<
+ *     free(pred_head)
+ *     free(pred_src)
+*/
+  free(__pyx_v_loop_of_header);
+
+  /* "sonolus/backend/_opt/analysis.pyx":904
+ *     free(is_header)
+ *     free(loop_of_header)
+ *     free(pred_head)             # <<<<<<<<<<<<<<
+ *     free(pred_src)
+ *     free(cursor)
+*/
+  free(__pyx_v_pred_head);
+
+  /* "sonolus/backend/_opt/analysis.pyx":905
+ *     free(loop_of_header)
+ *     free(pred_head)
+ *     free(pred_src)             # <<<<<<<<<<<<<<
+ *     free(cursor)
+ *     free(stack)
+*/
+  free(__pyx_v_pred_src);
+
+  /* "sonolus/backend/_opt/analysis.pyx":906
+ *     free(pred_head)
+ *     free(pred_src)
+ *     free(cursor)             # <<<<<<<<<<<<<<
+ *     free(stack)
+ *     return F
+*/
+  free(__pyx_v_cursor);
+
+  /* "sonolus/backend/_opt/analysis.pyx":907
+ *     free(pred_src)
+ *     free(cursor)
+ *     free(stack)             # <<<<<<<<<<<<<<
+ *     return F
+ * 
+*/
+  free(__pyx_v_stack);
+
+  /* "sonolus/backend/_opt/analysis.pyx":908
+ *     free(cursor)
+ *     free(stack)
+ *     return F             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+    struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF((PyObject *)__pyx_v_F);
+      __pyx_r = __pyx_v_F;
+    }
+    __Pyx_XDECREF((PyObject *)__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":761
+ * 
+ * 
+ * cdef LoopForest compute_loops(Func func, Dominators D):             # <<<<<<<<<<<<<<
+ *     cdef LoopForest F = LoopForest()
+ *     F.func = func
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.compute_loops", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_F);
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/analysis.pyx":911
+ * 
+ * 
+ * def loops_debug(entry, mode=None, callback=None):             # <<<<<<<<<<<<<<
+ *     """Marshal ``entry``, compute dominators + loop forest, return a summary dict.
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_5loops_debug(PyObject *__pyx_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_7sonolus_7backend_4_opt_8analysis_4loops_debug, "Marshal ``entry``, compute dominators + loop forest, return a summary dict.\n\n    Keyed by arena block id (reverse-postorder). ``crosses`` is the O(1)\n    ``crosses_loop(def_block, use_block)`` query used by treeify.\n    ");
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_8analysis_5loops_debug = {"loops_debug", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_5loops_debug, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7sonolus_7backend_4_opt_8analysis_4loops_debug};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_8analysis_5loops_debug(PyObject *__pyx_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_entry = 0;
+  PyObject *__pyx_v_mode = 0;
+  PyObject *__pyx_v_callback = 0;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("loops_debug (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_entry,&__pyx_mstate_global->__pyx_n_u_mode,&__pyx_mstate_global->__pyx_n_u_callback,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(0, 911, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 911, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 911, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 911, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "loops_debug", 0) < (0)) __PYX_ERR(0, 911, __pyx_L3_error)
+      if (!values[1]) values[1] = __Pyx_NewRef(((PyObject *)Py_None));
+      if (!values[2]) values[2] = __Pyx_NewRef(((PyObject *)Py_None));
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("loops_debug", 0, 1, 3, i); __PYX_ERR(0, 911, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 911, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 911, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 911, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      if (!values[1]) values[1] = __Pyx_NewRef(((PyObject *)Py_None));
+      if (!values[2]) values[2] = __Pyx_NewRef(((PyObject *)Py_None));
+    }
+    __pyx_v_entry = values[0];
+    __pyx_v_mode = values[1];
+    __pyx_v_callback = values[2];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("loops_debug", 0, 1, 3, __pyx_nargs); __PYX_ERR(0, 911, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.loops_debug", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_8analysis_4loops_debug(__pyx_self, __pyx_v_entry, __pyx_v_mode, __pyx_v_callback);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_8analysis_4loops_debug(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_entry, PyObject *__pyx_v_mode, PyObject *__pyx_v_callback) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *__pyx_v_func = 0;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *__pyx_v_D = 0;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *__pyx_v_F = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("loops_debug", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":917
+ *     ``crosses_loop(def_block, use_block)`` query used by treeify.
+ *     """
+ *     cdef Func func = <Func>marshal_in(entry, mode, callback)             # <<<<<<<<<<<<<<
+ *     func.verify()
+ *     cdef Dominators D = compute_dominators(func)
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_marshal_in); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 917, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[4] = {__pyx_t_2, __pyx_v_entry, __pyx_v_mode, __pyx_v_callback};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (4-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 917, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_3 = __pyx_t_1;
+  __Pyx_INCREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":918
+ *     """
+ *     cdef Func func = <Func>marshal_in(entry, mode, callback)
+ *     func.verify()             # <<<<<<<<<<<<<<
+ *     cdef Dominators D = compute_dominators(func)
+ *     cdef LoopForest F = compute_loops(func, D)
+*/
+  __pyx_t_1 = ((PyObject *)__pyx_v_func);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, NULL};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_verify, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 918, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":919
+ *     cdef Func func = <Func>marshal_in(entry, mode, callback)
+ *     func.verify()
+ *     cdef Dominators D = compute_dominators(func)             # <<<<<<<<<<<<<<
+ *     cdef LoopForest F = compute_loops(func, D)
+ *     return {
+*/
+  __pyx_t_3 = ((PyObject *)__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_dominators(__pyx_v_func)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 919, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_D = ((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":920
+ *     func.verify()
+ *     cdef Dominators D = compute_dominators(func)
+ *     cdef LoopForest F = compute_loops(func, D)             # <<<<<<<<<<<<<<
+ *     return {
+ *         "depth": F.depth_map(),
+*/
+  __pyx_t_3 = ((PyObject *)__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_loops(__pyx_v_func, __pyx_v_D)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 920, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_F = ((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":922
+ *     cdef LoopForest F = compute_loops(func, D)
+ *     return {
+ *         "depth": F.depth_map(),             # <<<<<<<<<<<<<<
+ *         "innermost": F.innermost_map(),
+ *         "loops": F.loops(),
+*/
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 922, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = ((PyObject *)__pyx_v_F);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_depth_map, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 922, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_depth, __pyx_t_1) < (0)) __PYX_ERR(0, 922, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":923
+ *     return {
+ *         "depth": F.depth_map(),
+ *         "innermost": F.innermost_map(),             # <<<<<<<<<<<<<<
+ *         "loops": F.loops(),
+ *         "n_blocks": F.n_blocks,
+*/
+  __pyx_t_2 = ((PyObject *)__pyx_v_F);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_innermost_map, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 923, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_innermost, __pyx_t_1) < (0)) __PYX_ERR(0, 922, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":924
+ *         "depth": F.depth_map(),
+ *         "innermost": F.innermost_map(),
+ *         "loops": F.loops(),             # <<<<<<<<<<<<<<
+ *         "n_blocks": F.n_blocks,
+ *         "n_loops": F.n_loops,
+*/
+  __pyx_t_2 = ((PyObject *)__pyx_v_F);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_loops, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 924, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_loops, __pyx_t_1) < (0)) __PYX_ERR(0, 922, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":925
+ *         "innermost": F.innermost_map(),
+ *         "loops": F.loops(),
+ *         "n_blocks": F.n_blocks,             # <<<<<<<<<<<<<<
+ *         "n_loops": F.n_loops,
+ *         "crosses": F.crosses_loop_q,
+*/
+  __pyx_t_1 = __Pyx_PyLong_From_int32_t(__pyx_v_F->n_blocks); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 925, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_n_blocks, __pyx_t_1) < (0)) __PYX_ERR(0, 922, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":926
+ *         "loops": F.loops(),
+ *         "n_blocks": F.n_blocks,
+ *         "n_loops": F.n_loops,             # <<<<<<<<<<<<<<
+ *         "crosses": F.crosses_loop_q,
+ *     }
+*/
+  __pyx_t_1 = __Pyx_PyLong_From_int32_t(__pyx_v_F->n_loops); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 926, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_n_loops, __pyx_t_1) < (0)) __PYX_ERR(0, 922, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":927
+ *         "n_blocks": F.n_blocks,
+ *         "n_loops": F.n_loops,
+ *         "crosses": F.crosses_loop_q,             # <<<<<<<<<<<<<<
+ *     }
+*/
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_F), __pyx_mstate_global->__pyx_n_u_crosses_loop_q); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 927, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_crosses, __pyx_t_1) < (0)) __PYX_ERR(0, 922, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_3;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":911
+ * 
+ * 
+ * def loops_debug(entry, mode=None, callback=None):             # <<<<<<<<<<<<<<
+ *     """Marshal ``entry``, compute dominators + loop forest, return a summary dict.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("sonolus.backend._opt.analysis.loops_debug", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_func);
+  __Pyx_XDECREF((PyObject *)__pyx_v_D);
+  __Pyx_XDECREF((PyObject *)__pyx_v_F);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+/* #### Code section: module_exttypes ### */
+static struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Liveness __pyx_vtable_7sonolus_7backend_4_opt_8analysis_Liveness;
+
+static PyObject *__pyx_tp_new__initialisation_7sonolus_7backend_4_opt_8analysis_Liveness(PyObject *o, 
+#if CYTHON_VECTORCALL_TPNEW
+    CYTHON_UNUSED PyObject *const *args, CYTHON_UNUSED Py_ssize_t nargs, CYTHON_UNUSED PyObject *kwnames
+#else
+    CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k
+#endif
+) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *p = ((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_Liveness;
+  p->func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)Py_None); Py_INCREF(Py_None);
+  {
+    int cinit_result = __pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_1__cinit__(
+    #if CYTHON_VECTORCALL_TPNEW
+    o, NULL, 0, NULL);
+    #else
+    o, __pyx_mstate_global->__pyx_empty_tuple, NULL);
+    #endif
+    if (unlikely(cinit_result)) goto bad;
+  }
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static PyObject *__pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_Liveness(PyTypeObject *t, 
+#if CYTHON_VECTORCALL_TPNEW
+    PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames
+#else
+    PyObject *a, PyObject *k
+#endif
+) {
+  PyObject *o;
+  o = __Pyx_AllocateExtensionType(t, 0);
+  if (unlikely(!o)) return 0;
+  return __pyx_tp_new__initialisation_7sonolus_7backend_4_opt_8analysis_Liveness(o, 
+#if CYTHON_VECTORCALL_TPNEW
+    args, nargs, kwnames
+#else
+    a, k
+#endif
+);
+}
+
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_new_7sonolus_7backend_4_opt_8analysis_Liveness(PyTypeObject *t, PyObject *a, PyObject *k) {
+  return __Pyx_CallTpnewAsVectorcall(__pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_Liveness, t, a, k);
+}
+#endif
+
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_Liveness(PyObject *t, PyObject *const *args, size_t nargsf, PyObject *kwnames) {
+  if (unlikely((PyTypeObject*)t != __pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness || __Pyx_PyType_HasFeature((PyTypeObject*)t, Py_TPFLAGS_IS_ABSTRACT))) {
+    return __Pyx_CallNewInitFromVectorcall((PyTypeObject*)t, args, nargsf, kwnames);
+  }
+  Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+  PyObject *o = __pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_Liveness((PyTypeObject*)t, args, nargs, kwnames);
+  return o;
+}
+#endif
+
+static void __pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_Liveness(PyObject *o) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *p = (struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(__Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_Liveness) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    __Pyx_PyErr_FetchException(&etype, &eval, &etb);
+    __Pyx_DeallocKeepAliveBegin(o);
+    __pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_3__dealloc__(o);
+    __Pyx_DeallocKeepAliveEnd(o);
+    __Pyx_PyErr_RestoreException(etype, eval, etb);
+  }
+  Py_CLEAR(p->func);
+  PyTypeObject *tp = Py_TYPE(o);
+  #if CYTHON_USE_TYPE_SLOTS
+  (*tp->tp_free)(o);
+  #else
+  {
+    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
+    if (tp_free) tp_free(o);
+  }
+  #endif
+  #if CYTHON_USE_TYPE_SPECS
+  Py_DECREF(tp);
+  #endif
+}
+
+static int __pyx_tp_traverse_7sonolus_7backend_4_opt_8analysis_Liveness(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *p = (struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)o;
+  {
+    e = __Pyx_call_type_traverse(o, 1, v, a);
+    if (e) return e;
+  }
+  if (p->func) {
+    e = (*v)(((PyObject *)p->func), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_7sonolus_7backend_4_opt_8analysis_Liveness(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *p = (struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *)o;
+  tmp = ((PyObject*)p->func);
+  p->func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_7sonolus_7backend_4_opt_8analysis_Liveness[] = {
+  {"live_in_names", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_5live_in_names, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"live_out_names", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_7live_out_names, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"root_live_names", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_9root_live_names, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7sonolus_7backend_4_opt_8analysis_8Liveness_8root_live_names},
+  {"array_defs_out_names", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_11array_defs_out_names, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"is_array_init_map", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_13is_array_init_map, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7sonolus_7backend_4_opt_8analysis_8Liveness_12is_array_init_map},
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_15__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_8Liveness_17__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_7sonolus_7backend_4_opt_8analysis_Liveness_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_Liveness},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_7sonolus_7backend_4_opt_8analysis_Liveness},
+  {Py_tp_clear, (void *)__pyx_tp_clear_7sonolus_7backend_4_opt_8analysis_Liveness},
+  {Py_tp_methods, (void *)__pyx_methods_7sonolus_7backend_4_opt_8analysis_Liveness},
+  {Py_tp_new, (void *)__pyx_tp_new_7sonolus_7backend_4_opt_8analysis_Liveness},
+  #if (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800) && (!CYTHON_COMPILING_IN_LIMITED_API || __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #if CYTHON_VECTORCALL_TPNEW
+  {Py_tp_vectorcall, (void *)__pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_Liveness},
+  #endif
+  #endif
+  {0, 0},
+};
+static PyType_Spec __pyx_type_7sonolus_7backend_4_opt_8analysis_Liveness_spec = {
+  "sonolus.backend._opt.analysis.Liveness",
+  sizeof(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
+  __pyx_type_7sonolus_7backend_4_opt_8analysis_Liveness_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_7sonolus_7backend_4_opt_8analysis_Liveness = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "sonolus.backend._opt.analysis.""Liveness", /*tp_name*/
+  sizeof(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_Liveness, /*tp_dealloc*/
+  0, /*tp_vectorcall_offset*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  0, /*tp_as_async*/
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_7sonolus_7backend_4_opt_8analysis_Liveness, /*tp_traverse*/
+  __pyx_tp_clear_7sonolus_7backend_4_opt_8analysis_Liveness, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7sonolus_7backend_4_opt_8analysis_Liveness, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7sonolus_7backend_4_opt_8analysis_Liveness, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #if (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800) && (!CYTHON_COMPILING_IN_LIMITED_API || __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #if CYTHON_VECTORCALL_TPNEW
+  __pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_Liveness, /*tp_vectorcall*/
+  #else
+  NULL, /*tp_vectorcall*/
+  #endif
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+static struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_Dominators __pyx_vtable_7sonolus_7backend_4_opt_8analysis_Dominators;
+
+static PyObject *__pyx_tp_new__initialisation_7sonolus_7backend_4_opt_8analysis_Dominators(PyObject *o, 
+#if CYTHON_VECTORCALL_TPNEW
+    CYTHON_UNUSED PyObject *const *args, CYTHON_UNUSED Py_ssize_t nargs, CYTHON_UNUSED PyObject *kwnames
+#else
+    CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k
+#endif
+) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *p = ((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_Dominators;
+  p->func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)Py_None); Py_INCREF(Py_None);
+  {
+    int cinit_result = __pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_1__cinit__(
+    #if CYTHON_VECTORCALL_TPNEW
+    o, NULL, 0, NULL);
+    #else
+    o, __pyx_mstate_global->__pyx_empty_tuple, NULL);
+    #endif
+    if (unlikely(cinit_result)) goto bad;
+  }
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static PyObject *__pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_Dominators(PyTypeObject *t, 
+#if CYTHON_VECTORCALL_TPNEW
+    PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames
+#else
+    PyObject *a, PyObject *k
+#endif
+) {
+  PyObject *o;
+  o = __Pyx_AllocateExtensionType(t, 0);
+  if (unlikely(!o)) return 0;
+  return __pyx_tp_new__initialisation_7sonolus_7backend_4_opt_8analysis_Dominators(o, 
+#if CYTHON_VECTORCALL_TPNEW
+    args, nargs, kwnames
+#else
+    a, k
+#endif
+);
+}
+
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_new_7sonolus_7backend_4_opt_8analysis_Dominators(PyTypeObject *t, PyObject *a, PyObject *k) {
+  return __Pyx_CallTpnewAsVectorcall(__pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_Dominators, t, a, k);
+}
+#endif
+
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_Dominators(PyObject *t, PyObject *const *args, size_t nargsf, PyObject *kwnames) {
+  if (unlikely((PyTypeObject*)t != __pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators || __Pyx_PyType_HasFeature((PyTypeObject*)t, Py_TPFLAGS_IS_ABSTRACT))) {
+    return __Pyx_CallNewInitFromVectorcall((PyTypeObject*)t, args, nargsf, kwnames);
+  }
+  Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+  PyObject *o = __pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_Dominators((PyTypeObject*)t, args, nargs, kwnames);
+  return o;
+}
+#endif
+
+static void __pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_Dominators(PyObject *o) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *p = (struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(__Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_Dominators) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    __Pyx_PyErr_FetchException(&etype, &eval, &etb);
+    __Pyx_DeallocKeepAliveBegin(o);
+    __pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_3__dealloc__(o);
+    __Pyx_DeallocKeepAliveEnd(o);
+    __Pyx_PyErr_RestoreException(etype, eval, etb);
+  }
+  Py_CLEAR(p->func);
+  PyTypeObject *tp = Py_TYPE(o);
+  #if CYTHON_USE_TYPE_SLOTS
+  (*tp->tp_free)(o);
+  #else
+  {
+    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
+    if (tp_free) tp_free(o);
+  }
+  #endif
+  #if CYTHON_USE_TYPE_SPECS
+  Py_DECREF(tp);
+  #endif
+}
+
+static int __pyx_tp_traverse_7sonolus_7backend_4_opt_8analysis_Dominators(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *p = (struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)o;
+  {
+    e = __Pyx_call_type_traverse(o, 1, v, a);
+    if (e) return e;
+  }
+  if (p->func) {
+    e = (*v)(((PyObject *)p->func), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_7sonolus_7backend_4_opt_8analysis_Dominators(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *p = (struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)o;
+  tmp = ((PyObject*)p->func);
+  p->func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_7sonolus_7backend_4_opt_8analysis_Dominators[] = {
+  {"idom_map", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_5idom_map, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"children_map", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_7children_map, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"dominates_q", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_9dominates_q, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_11__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10Dominators_13__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_7sonolus_7backend_4_opt_8analysis_Dominators_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_Dominators},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_7sonolus_7backend_4_opt_8analysis_Dominators},
+  {Py_tp_clear, (void *)__pyx_tp_clear_7sonolus_7backend_4_opt_8analysis_Dominators},
+  {Py_tp_methods, (void *)__pyx_methods_7sonolus_7backend_4_opt_8analysis_Dominators},
+  {Py_tp_new, (void *)__pyx_tp_new_7sonolus_7backend_4_opt_8analysis_Dominators},
+  #if (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800) && (!CYTHON_COMPILING_IN_LIMITED_API || __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #if CYTHON_VECTORCALL_TPNEW
+  {Py_tp_vectorcall, (void *)__pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_Dominators},
+  #endif
+  #endif
+  {0, 0},
+};
+static PyType_Spec __pyx_type_7sonolus_7backend_4_opt_8analysis_Dominators_spec = {
+  "sonolus.backend._opt.analysis.Dominators",
+  sizeof(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
+  __pyx_type_7sonolus_7backend_4_opt_8analysis_Dominators_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_7sonolus_7backend_4_opt_8analysis_Dominators = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "sonolus.backend._opt.analysis.""Dominators", /*tp_name*/
+  sizeof(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_Dominators, /*tp_dealloc*/
+  0, /*tp_vectorcall_offset*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  0, /*tp_as_async*/
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_7sonolus_7backend_4_opt_8analysis_Dominators, /*tp_traverse*/
+  __pyx_tp_clear_7sonolus_7backend_4_opt_8analysis_Dominators, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7sonolus_7backend_4_opt_8analysis_Dominators, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7sonolus_7backend_4_opt_8analysis_Dominators, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #if (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800) && (!CYTHON_COMPILING_IN_LIMITED_API || __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #if CYTHON_VECTORCALL_TPNEW
+  __pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_Dominators, /*tp_vectorcall*/
+  #else
+  NULL, /*tp_vectorcall*/
+  #endif
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+static struct __pyx_vtabstruct_7sonolus_7backend_4_opt_8analysis_LoopForest __pyx_vtable_7sonolus_7backend_4_opt_8analysis_LoopForest;
+
+static PyObject *__pyx_tp_new__initialisation_7sonolus_7backend_4_opt_8analysis_LoopForest(PyObject *o, 
+#if CYTHON_VECTORCALL_TPNEW
+    CYTHON_UNUSED PyObject *const *args, CYTHON_UNUSED Py_ssize_t nargs, CYTHON_UNUSED PyObject *kwnames
+#else
+    CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k
+#endif
+) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *p = ((struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_LoopForest;
+  p->func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)Py_None); Py_INCREF(Py_None);
+  {
+    int cinit_result = __pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_1__cinit__(
+    #if CYTHON_VECTORCALL_TPNEW
+    o, NULL, 0, NULL);
+    #else
+    o, __pyx_mstate_global->__pyx_empty_tuple, NULL);
+    #endif
+    if (unlikely(cinit_result)) goto bad;
+  }
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static PyObject *__pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_LoopForest(PyTypeObject *t, 
+#if CYTHON_VECTORCALL_TPNEW
+    PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames
+#else
+    PyObject *a, PyObject *k
+#endif
+) {
+  PyObject *o;
+  o = __Pyx_AllocateExtensionType(t, 0);
+  if (unlikely(!o)) return 0;
+  return __pyx_tp_new__initialisation_7sonolus_7backend_4_opt_8analysis_LoopForest(o, 
+#if CYTHON_VECTORCALL_TPNEW
+    args, nargs, kwnames
+#else
+    a, k
+#endif
+);
+}
+
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_new_7sonolus_7backend_4_opt_8analysis_LoopForest(PyTypeObject *t, PyObject *a, PyObject *k) {
+  return __Pyx_CallTpnewAsVectorcall(__pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_LoopForest, t, a, k);
+}
+#endif
+
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_LoopForest(PyObject *t, PyObject *const *args, size_t nargsf, PyObject *kwnames) {
+  if (unlikely((PyTypeObject*)t != __pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest || __Pyx_PyType_HasFeature((PyTypeObject*)t, Py_TPFLAGS_IS_ABSTRACT))) {
+    return __Pyx_CallNewInitFromVectorcall((PyTypeObject*)t, args, nargsf, kwnames);
+  }
+  Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+  PyObject *o = __pyx_tp_new_vectorcall_7sonolus_7backend_4_opt_8analysis_LoopForest((PyTypeObject*)t, args, nargs, kwnames);
+  return o;
+}
+#endif
+
+static void __pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_LoopForest(PyObject *o) {
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *p = (struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(__Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_LoopForest) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    __Pyx_PyErr_FetchException(&etype, &eval, &etb);
+    __Pyx_DeallocKeepAliveBegin(o);
+    __pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_3__dealloc__(o);
+    __Pyx_DeallocKeepAliveEnd(o);
+    __Pyx_PyErr_RestoreException(etype, eval, etb);
+  }
+  Py_CLEAR(p->func);
+  PyTypeObject *tp = Py_TYPE(o);
+  #if CYTHON_USE_TYPE_SLOTS
+  (*tp->tp_free)(o);
+  #else
+  {
+    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
+    if (tp_free) tp_free(o);
+  }
+  #endif
+  #if CYTHON_USE_TYPE_SPECS
+  Py_DECREF(tp);
+  #endif
+}
+
+static int __pyx_tp_traverse_7sonolus_7backend_4_opt_8analysis_LoopForest(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *p = (struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)o;
+  {
+    e = __Pyx_call_type_traverse(o, 1, v, a);
+    if (e) return e;
+  }
+  if (p->func) {
+    e = (*v)(((PyObject *)p->func), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_7sonolus_7backend_4_opt_8analysis_LoopForest(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *p = (struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *)o;
+  tmp = ((PyObject*)p->func);
+  p->func = ((struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_7sonolus_7backend_4_opt_8analysis_LoopForest[] = {
+  {"depth_map", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_5depth_map, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"innermost_map", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_7innermost_map, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"loops", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_9loops, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"crosses_loop_q", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_11crosses_loop_q, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_13__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_8analysis_10LoopForest_15__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_7sonolus_7backend_4_opt_8analysis_LoopForest_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_LoopForest},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_7sonolus_7backend_4_opt_8analysis_LoopForest},
+  {Py_tp_clear, (void *)__pyx_tp_clear_7sonolus_7backend_4_opt_8analysis_LoopForest},
+  {Py_tp_methods, (void *)__pyx_methods_7sonolus_7backend_4_opt_8analysis_LoopForest},
+  {Py_tp_new, (void *)__pyx_tp_new_7sonolus_7backend_4_opt_8analysis_LoopForest},
+  #if (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800) && (!CYTHON_COMPILING_IN_LIMITED_API || __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #if CYTHON_VECTORCALL_TPNEW
+  {Py_tp_vectorcall, (void *)__pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_LoopForest},
+  #endif
+  #endif
+  {0, 0},
+};
+static PyType_Spec __pyx_type_7sonolus_7backend_4_opt_8analysis_LoopForest_spec = {
+  "sonolus.backend._opt.analysis.LoopForest",
+  sizeof(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
+  __pyx_type_7sonolus_7backend_4_opt_8analysis_LoopForest_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_7sonolus_7backend_4_opt_8analysis_LoopForest = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "sonolus.backend._opt.analysis.""LoopForest", /*tp_name*/
+  sizeof(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7sonolus_7backend_4_opt_8analysis_LoopForest, /*tp_dealloc*/
+  0, /*tp_vectorcall_offset*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  0, /*tp_as_async*/
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_7sonolus_7backend_4_opt_8analysis_LoopForest, /*tp_traverse*/
+  __pyx_tp_clear_7sonolus_7backend_4_opt_8analysis_LoopForest, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7sonolus_7backend_4_opt_8analysis_LoopForest, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7sonolus_7backend_4_opt_8analysis_LoopForest, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #if (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800) && (!CYTHON_COMPILING_IN_LIMITED_API || __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #if CYTHON_VECTORCALL_TPNEW
+  __pyx_tp_vectorcall_7sonolus_7backend_4_opt_8analysis_LoopForest, /*tp_vectorcall*/
+  #else
+  NULL, /*tp_vectorcall*/
+  #endif
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+/* #### Code section: initfunc_declarations ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitAfterSharedUtility(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
+/* #### Code section: init_module ### */
+
+static int __Pyx_modinit_Global_init_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Variable_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Function_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Function_export_code", 0);
+  /*--- Function export code ---*/
+  {
+    __pyx_t_1 = __Pyx_ApiExport_GetApiDict(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    const char * __pyx_export_signature = __Pyx_PyBytes_AsString(__pyx_mstate_global->__pyx_kp_b_struct___pyx_obj_7sonolus_7backe);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (unlikely(!__pyx_export_signature)) __PYX_ERR(0, 1, __pyx_L1_error)
+    #endif
+    const char * __pyx_export_name = __pyx_export_signature + 414;
+    void (*const __pyx_export_pointers[])(void) = {(void (*)(void))&__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_dominators, (void (*)(void))&__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_liveness, (void (*)(void))&__pyx_f_7sonolus_7backend_4_opt_8analysis_compute_loops, (void (*)(void)) NULL};
+    void (*const *__pyx_export_pointer)(void) = __pyx_export_pointers;
+    const char *__pyx_export_current_signature = __pyx_export_signature;
+    while (*__pyx_export_pointer) {
+      if (__Pyx_ExportFunction(__pyx_t_1, __pyx_export_name, *__pyx_export_pointer, __pyx_export_current_signature) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+      ++__pyx_export_pointer;
+      __pyx_export_name = strchr(__pyx_export_name, '\0') + 1;
+      __pyx_export_signature = strchr(__pyx_export_signature, '\0') + 1;
+      if (*__pyx_export_signature != '\0') __pyx_export_current_signature = __pyx_export_signature;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness", 0);
+  /*--- Exttype __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness ---*/
+  __pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_Liveness = &__pyx_vtable_7sonolus_7backend_4_opt_8analysis_Liveness;
+  __pyx_vtable_7sonolus_7backend_4_opt_8analysis_Liveness._bitset_names = (PyObject *(*)(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *, uint64_t const *))__pyx_f_7sonolus_7backend_4_opt_8analysis_8Liveness__bitset_names;
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_7sonolus_7backend_4_opt_8analysis_Liveness_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness)) __PYX_ERR(0, 137, __pyx_L1_error)
+  #else
+  __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness = &__pyx_type_7sonolus_7backend_4_opt_8analysis_Liveness;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness) < (0)) __PYX_ERR(0, 137, __pyx_L1_error)
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness);
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness->tp_dictoffset && __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness->tp_getattro = PyObject_GenericGetAttr;
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness, __pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_Liveness) < (0)) __PYX_ERR(0, 137, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_Liveness, (PyObject *) __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness) < (0)) __PYX_ERR(0, 137, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness) < (0)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators", 0);
+  /*--- Exttype __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators ---*/
+  __pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_Dominators = &__pyx_vtable_7sonolus_7backend_4_opt_8analysis_Dominators;
+  __pyx_vtable_7sonolus_7backend_4_opt_8analysis_Dominators.dominates = (int (*)(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *, int32_t, int32_t))__pyx_f_7sonolus_7backend_4_opt_8analysis_10Dominators_dominates;
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_7sonolus_7backend_4_opt_8analysis_Dominators_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators)) __PYX_ERR(0, 504, __pyx_L1_error)
+  #else
+  __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators = &__pyx_type_7sonolus_7backend_4_opt_8analysis_Dominators;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators);
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators->tp_dictoffset && __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators->tp_getattro = PyObject_GenericGetAttr;
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators, __pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_Dominators) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_Dominators, (PyObject *) __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest", 0);
+  /*--- Exttype __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest ---*/
+  __pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_LoopForest = &__pyx_vtable_7sonolus_7backend_4_opt_8analysis_LoopForest;
+  __pyx_vtable_7sonolus_7backend_4_opt_8analysis_LoopForest.in_loop = (int (*)(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *, int32_t, int32_t))__pyx_f_7sonolus_7backend_4_opt_8analysis_10LoopForest_in_loop;
+  __pyx_vtable_7sonolus_7backend_4_opt_8analysis_LoopForest.crosses_loop = (int (*)(struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *, int32_t, int32_t))__pyx_f_7sonolus_7backend_4_opt_8analysis_10LoopForest_crosses_loop;
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_7sonolus_7backend_4_opt_8analysis_LoopForest_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest)) __PYX_ERR(0, 698, __pyx_L1_error)
+  #else
+  __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest = &__pyx_type_7sonolus_7backend_4_opt_8analysis_LoopForest;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest) < (0)) __PYX_ERR(0, 698, __pyx_L1_error)
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest);
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest->tp_dictoffset && __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest->tp_getattro = PyObject_GenericGetAttr;
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest, __pyx_vtabptr_7sonolus_7backend_4_opt_8analysis_LoopForest) < (0)) __PYX_ERR(0, 698, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_LoopForest, (PyObject *) __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest) < (0)) __PYX_ERR(0, 698, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest) < (0)) __PYX_ERR(0, 698, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_Type_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("sonolus.backend._opt.ir"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 270, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_2ir_Func = __Pyx_ImportType_3_3_0(__pyx_t_1, "sonolus.backend._opt.ir", "Func",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func), __PYX_GET_STRUCT_ALIGNMENT_3_3_0(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func), __PYX_GET_STRUCT_ALIGNMENT_3_3_0(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func),
+  #else
+  sizeof(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func), __PYX_GET_STRUCT_ALIGNMENT_3_3_0(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_3_0); if (!__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_2ir_Func) __PYX_ERR(2, 270, __pyx_L1_error)
+  if (unlikely(__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_7sonolus_7backend_4_opt_2ir_Func, (void**)&__pyx_vtabptr_7sonolus_7backend_4_opt_2ir_Func) != 1)) __PYX_ERR(2, 270, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_Variable_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Function_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_analysis(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_analysis},
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  {Py_mod_gil, __Pyx_FREETHREADING_COMPATIBLE},
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000 && CYTHON_USE_MODULE_STATE
+  {Py_mod_multiple_interpreters, Py_MOD_MULTIPLE_INTERPRETERS_NOT_SUPPORTED},
+  #endif
+  {0, NULL}
+};
+#endif
+
+#ifdef __cplusplus
+namespace {
+  struct PyModuleDef __pyx_moduledef =
+  #else
+  static struct PyModuleDef __pyx_moduledef =
+  #endif
+  {
+      PyModuleDef_HEAD_INIT,
+      "analysis",
+      __pyx_k_Liveness_analysis_over_the_arena, /* m_doc */
+    #if CYTHON_USE_MODULE_STATE
+      sizeof(__pyx_mstatetype), /* m_size */
+    #else
+      (CYTHON_PEP489_MULTI_PHASE_INIT) ? 0 : -1, /* m_size */
+    #endif
+      __pyx_methods /* m_methods */,
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      __pyx_moduledef_slots, /* m_slots */
+    #else
+      NULL, /* m_reload */
+    #endif
+    #if CYTHON_USE_MODULE_STATE
+      __pyx_m_traverse, /* m_traverse */
+      __pyx_m_clear, /* m_clear */
+      NULL /* m_free */
+    #else
+      NULL, /* m_traverse */
+      NULL, /* m_clear */
+      NULL /* m_free */
+    #endif
+  };
+  #ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+
+/* PyModInitFuncType */
+#ifndef CYTHON_NO_PYINIT_EXPORT
+  #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#else
+  #ifdef __cplusplus
+  #define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+  #else
+  #define __Pyx_PyMODINIT_FUNC PyObject *
+  #endif
+#endif
+
+__Pyx_PyMODINIT_FUNC PyInit_analysis(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_analysis(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+/* ModuleCreationPEP489 */
+#if CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x030A0000 &&\
+      (defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)))
+static PY_INT64_T __Pyx_GetCurrentInterpreterId(void) {
+    {
+        PyObject *module = PyImport_ImportModule("_interpreters"); // 3.13+ I think
+        if (!module) {
+            if (!PyErr_ExceptionMatches(PyExc_Exception)) {
+                goto bad; // BaseException
+            }
+            PyErr_Clear(); // just try the 3.8-3.12 version
+            module = PyImport_ImportModule("_xxsubinterpreters");
+            if (!module) goto bad;
+        }
+        PyObject *current = PyObject_CallMethod(module, "get_current", NULL);
+        Py_DECREF(module);
+        if (!current) goto bad;
+        if (PyTuple_Check(current)) {
+            PyObject *new_current = PySequence_GetItem(current, 0);
+            Py_DECREF(current);
+            current = new_current;
+            if (!new_current) goto bad;
+        }
+        long long as_c_int = PyLong_AsLongLong(current);
+        Py_DECREF(current);
+        return as_c_int;
+    }
+  bad:
+    PySys_WriteStderr("__Pyx_GetCurrentInterpreterId failed. Try setting the C define CYTHON_PEP489_MULTI_PHASE_INIT=0\n");
+    return -1;
+}
+#endif
+#if !CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    static PY_INT64_T main_interpreter_id = -1;
+#if CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+    PY_INT64_T current_id = GraalPyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_GRAAL
+    PY_INT64_T current_id = PyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x030A0000 &&\
+      (defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)))
+    PY_INT64_T current_id = __Pyx_GetCurrentInterpreterId();
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+#else
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+#endif
+    if (unlikely(current_id == -1)) {
+        return -1;
+    }
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return 0;
+    } else if (unlikely(main_interpreter_id != current_id)) {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+#endif
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
+{
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    CYTHON_UNUSED_VAR(def);
+    #if !CYTHON_USE_MODULE_STATE
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    #endif
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_analysis(PyObject *__pyx_pyinit_module)
+#endif
+{
+  int stringtab_initialized = 0;
+  #if CYTHON_USE_MODULE_STATE
+  int pystate_addmodule_run = 0;
+  #endif
+  __pyx_mstatetype *__pyx_mstate = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'analysis' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #else
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_t_1 = __pyx_pyinit_module;
+  Py_INCREF(__pyx_t_1);
+  #else
+  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  {
+    int add_module_result = __Pyx_State_AddModule(__pyx_t_1, &__pyx_moduledef);
+    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "analysis" pseudovariable */
+    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    pystate_addmodule_run = 1;
+  }
+  #else
+  __pyx_m = __pyx_t_1;
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  PyUnstable_Module_SetGIL(__pyx_m, Py_MOD_GIL_USED);
+  #endif
+  __pyx_mstate = __pyx_mstate_global;
+  CYTHON_UNUSED_VAR(__pyx_t_1);
+  __pyx_mstate->__pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_mstate->__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_mstate->__pyx_d);
+  __pyx_mstate->__pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_mstate->__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_cython_runtime = __Pyx_PyImport_AddModuleRef("cython_runtime"); if (unlikely(!__pyx_mstate->__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_mstate->__pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /* ImportRefnannyAPI */
+  #if CYTHON_REFNANNY
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+  if (!__Pyx_RefNanny) {
+    if (PyErr_ExceptionMatches(PyExc_Exception)) {
+      PyErr_Clear();
+      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+    }
+    if (!__Pyx_RefNanny)
+        Py_FatalError("failed to import 'refnanny' module");
+  }
+  #endif
+  
+__Pyx_RefNannySetupContext("PyInit_analysis", 0);
+  __Pyx_init_runtime_version();
+  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_mstate->__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Library function declarations ---*/
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  stringtab_initialized = 1;
+  if (__Pyx_InitGlobals() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_module_is_main_sonolus__backend___opt__analysis) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_name, __pyx_mstate_global->__pyx_n_u_main) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "sonolus.backend._opt.analysis")) {
+      if (unlikely((PyDict_SetItemString(modules, "sonolus.backend._opt.analysis", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_CreateCodeObjects(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_Global_init_code(__pyx_mstate);
+  (void)__Pyx_modinit_Variable_export_code(__pyx_mstate);
+  if (unlikely((__Pyx_modinit_Function_export_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Type init code ---*/
+  if (unlikely((__Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely((__Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely((__Pyx_modinit_Exttype___pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely((__Pyx_modinit_Type_import_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_Variable_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_Function_import_code(__pyx_mstate);
+  if (__Pyx_InitAfterSharedUtility() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Execution code ---*/
+
+  /* "sonolus/backend/_opt/analysis.pyx":57
+ * from sonolus.backend._opt._ops_gen cimport OPX_CONST, OPX_GET, OPX_SET
+ * 
+ * from sonolus.backend._opt.ir import marshal_in             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_marshal_in};
+    __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_ir, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 57, __pyx_L1_error)
+  }
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_marshal_in};
+    __pyx_t_3 = 0; {
+      __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_2, __pyx_imported_names[__pyx_t_3]); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 57, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_imported_names[__pyx_t_3], __pyx_t_4) < (0)) __PYX_ERR(0, 57, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":168
+ *     # --- python debug accessors -------------------------------------------
+ * 
+ *     def live_in_names(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_5live_in_names, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Liveness_live_in_names, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness, __pyx_mstate_global->__pyx_n_u_live_in_names, __pyx_t_2) < (0)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":175
+ *         return d
+ * 
+ *     def live_out_names(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_7live_out_names, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Liveness_live_out_names, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness, __pyx_mstate_global->__pyx_n_u_live_out_names, __pyx_t_2) < (0)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":182
+ *         return d
+ * 
+ *     def root_live_names(self):             # <<<<<<<<<<<<<<
+ *         """Map each statement-root instr index to its live-out temp-name set."""
+ *         cdef dict d = {}
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_9root_live_names, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Liveness_root_live_names, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness, __pyx_mstate_global->__pyx_n_u_root_live_names, __pyx_t_2) < (0)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":192
+ *         return d
+ * 
+ *     def array_defs_out_names(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_11array_defs_out_names, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Liveness_array_defs_out_names, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness, __pyx_mstate_global->__pyx_n_u_array_defs_out_names, __pyx_t_2) < (0)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":199
+ *         return d
+ * 
+ *     def is_array_init_map(self):             # <<<<<<<<<<<<<<
+ *         """Map each array-target OPX_SET root instr index to its is_array_init bit."""
+ *         cdef dict d = {}
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_13is_array_init_map, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Liveness_is_array_init_map, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 199, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Liveness, __pyx_mstate_global->__pyx_n_u_is_array_init_map, __pyx_t_2) < (0)) __PYX_ERR(0, 199, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_15__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Liveness___reduce_cython, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[5])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_reduce_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_8Liveness_17__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Liveness___setstate_cython, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":477
+ * # --------------------------------------------------------------------------
+ * 
+ * def liveness_debug(entry, mode=None, callback=None):             # <<<<<<<<<<<<<<
+ *     """Marshal ``entry`` into an arena, compute liveness, return name-set dicts.
+ * 
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_1liveness_debug, 0, __pyx_mstate_global->__pyx_n_u_liveness_debug, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[7])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[0]);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_liveness_debug, __pyx_t_2) < (0)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":531
+ *     # --- python debug accessors ------------------------------------------
+ * 
+ *     def idom_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10Dominators_5idom_map, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Dominators_idom_map, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[8])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators, __pyx_mstate_global->__pyx_n_u_idom_map, __pyx_t_2) < (0)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":538
+ *         return d
+ * 
+ *     def children_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b, k
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10Dominators_7children_map, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Dominators_children_map, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[9])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 538, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators, __pyx_mstate_global->__pyx_n_u_children_map, __pyx_t_2) < (0)) __PYX_ERR(0, 538, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":545
+ *         return d
+ * 
+ *     def dominates_q(self, int a, int b):             # <<<<<<<<<<<<<<
+ *         return bool(self.dominates(<int32_t>a, <int32_t>b))
+ * 
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10Dominators_9dominates_q, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Dominators_dominates_q, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[10])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_Dominators, __pyx_mstate_global->__pyx_n_u_dominates_q, __pyx_t_2) < (0)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10Dominators_11__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Dominators___reduce_cython, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[11])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_reduce_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10Dominators_13__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Dominators___setstate_cython, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[12])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":677
+ * 
+ * 
+ * def dominators_debug(entry, mode=None, callback=None):             # <<<<<<<<<<<<<<
+ *     """Marshal ``entry``, compute dominators, return idom / children / a few queries.
+ * 
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_3dominators_debug, 0, __pyx_mstate_global->__pyx_n_u_dominators_debug, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[13])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 677, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[0]);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_dominators_debug, __pyx_t_2) < (0)) __PYX_ERR(0, 677, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":734
+ *     # --- python debug accessors ------------------------------------------
+ * 
+ *     def depth_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_5depth_map, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_LoopForest_depth_map, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[14])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 734, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest, __pyx_mstate_global->__pyx_n_u_depth_map, __pyx_t_2) < (0)) __PYX_ERR(0, 734, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":741
+ *         return d
+ * 
+ *     def innermost_map(self):             # <<<<<<<<<<<<<<
+ *         cdef dict d = {}
+ *         cdef int32_t b
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_7innermost_map, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_LoopForest_innermost_map, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[15])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 741, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest, __pyx_mstate_global->__pyx_n_u_innermost_map, __pyx_t_2) < (0)) __PYX_ERR(0, 741, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":748
+ *         return d
+ * 
+ *     def loops(self):             # <<<<<<<<<<<<<<
+ *         # For each loop id: (header, parent, depth, sorted body block ids).
+ *         cdef list out = []
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_9loops, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_LoopForest_loops, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[16])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 748, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest, __pyx_mstate_global->__pyx_n_u_loops, __pyx_t_2) < (0)) __PYX_ERR(0, 748, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":757
+ *         return out
+ * 
+ *     def crosses_loop_q(self, int def_block, int use_block):             # <<<<<<<<<<<<<<
+ *         return bool(self.crosses_loop(<int32_t>def_block, <int32_t>use_block))
+ * 
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_11crosses_loop_q, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_LoopForest_crosses_loop_q, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[17])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 757, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_7sonolus_7backend_4_opt_8analysis_LoopForest, __pyx_mstate_global->__pyx_n_u_crosses_loop_q, __pyx_t_2) < (0)) __PYX_ERR(0, 757, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_13__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_LoopForest___reduce_cython, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[18])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_reduce_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_10LoopForest_15__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_LoopForest___setstate_cython, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[19])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":911
+ * 
+ * 
+ * def loops_debug(entry, mode=None, callback=None):             # <<<<<<<<<<<<<<
+ *     """Marshal ``entry``, compute dominators + loop forest, return a summary dict.
+ * 
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_8analysis_5loops_debug, 0, __pyx_mstate_global->__pyx_n_u_loops_debug, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_analysis, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[20])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 911, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[0]);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_loops_debug, __pyx_t_2) < (0)) __PYX_ERR(0, 911, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/analysis.pyx":1
+ * # cython: language_level=3             # <<<<<<<<<<<<<<
+ * """Liveness analysis over the arena IR.
+ * 
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_2) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  if (__pyx_m) {
+    if (__pyx_mstate->__pyx_d && stringtab_initialized) {
+      __Pyx_AddTraceback("init sonolus.backend._opt.analysis", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    #if !CYTHON_USE_MODULE_STATE
+    Py_CLEAR(__pyx_m);
+    #else
+    Py_DECREF(__pyx_m);
+    if (pystate_addmodule_run) {
+      PyObject *tp, *value, *tb;
+      __Pyx_PyErr_FetchException(&tp, &value, &tb);
+      __Pyx_State_RemoveModule(&__pyx_moduledef);
+      __Pyx_PyErr_RestoreException(tp, value, tb);
+    }
+    #endif
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init sonolus.backend._opt.analysis");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #else
+  return __pyx_m;
+  #endif
+}
+/* #### Code section: pystring_table ### */
+/* #### Code section: cached_builtins ### */
+
+static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+
+  /* Cached unbound methods */
+  __pyx_mstate->__pyx_umethod_PyDict_Type_items.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_items.method_name = &__pyx_mstate->__pyx_n_u_items;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_pop.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_pop.method_name = &__pyx_mstate->__pyx_n_u_pop;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_values.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_values.method_name = &__pyx_mstate->__pyx_n_u_values;
+  return 0;
+}
+/* #### Code section: cached_constants ### */
+
+static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "sonolus/backend/_opt/analysis.pyx":477
+ * # --------------------------------------------------------------------------
+ * 
+ * def liveness_debug(entry, mode=None, callback=None):             # <<<<<<<<<<<<<<
+ *     """Marshal ``entry`` into an arena, compute liveness, return name-set dicts.
+ * 
+*/
+  {
+    PyObject* __pyx_temp[2] = {Py_None, Py_None};
+    __pyx_mstate_global->__pyx_tuple[0] = __Pyx_PyTuple_FromArray(__pyx_temp, 2); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 477, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[0]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[0]);
+  #if CYTHON_IMMORTAL_CONSTANTS
+  {
+    PyObject **table = __pyx_mstate->__pyx_tuple;
+    for (Py_ssize_t i=0; i<1; ++i) {
+      #if PY_VERSION_HEX >= 0x030F0000
+      PyUnstable_SetImmortal(table[i]);
+      #elif CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+      if ((PY_SSIZE_T_MAX <= _Py_IMMORTAL_REFCNT_LOCAL)) break;
+      #if PY_VERSION_HEX < 0x030E0000
+      if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
+      #else
+      if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
+      #endif
+      {
+        Py_SET_REFCNT(table[i], ((Py_ssize_t)_Py_IMMORTAL_REFCNT_LOCAL + 1));
+      }
+      #else
+      if ((PY_SSIZE_T_MAX < _Py_IMMORTAL_INITIAL_REFCNT)) break;
+      Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
+      #endif
+    }
+  }
+  #endif
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+/* #### Code section: init_constants ### */
+
+static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  {
+    const struct { const unsigned int length: 6; } str_length_index[] = {{15},{1},{1},{22},{7},{6},{2},{9},{50},{33},{1},{10},{28},{30},{23},{22},{19},{1},{1},{8},{26},{28},{29},{26},{22},{23},{24},{10},{28},{30},{25},{20},{24},{16},{20},{12},{8},{12},{8},{10},{8},{12},{11},{14},{12},{10},{17},{13},{12},{12},{19},{8},{13},{1},{14},{20},{18},{1},{8},{8},{12},{18},{7},{14},{1},{9},{5},{9},{9},{11},{16},{5},{1},{4},{1},{4},{8},{9},{13},{13},{17},{5},{1},{2},{7},{13},{8},{14},{14},{5},{11},{10},{7},{4},{8},{7},{3},{3},{3},{15},{4},{10},{29},{23},{9},{9},{6},{6}};
+    const struct { const unsigned int length: 9; } bytes_length_index[] = {{463},{9},{23},{23},{74},{40},{40},{40},{56},{56},{56},{119},{89},{108},{103},{99},{76}};
+    #ifndef CYTHON_COMPRESS_STRINGS
+      #define CYTHON_COMPRESS_STRINGS 90
+    #endif
+    #if (CYTHON_COMPRESS_STRINGS) == 1 /* compression: zlib (1199 bytes) */
+static const char cstring[] = "x\332\275T=o\333F\030\226\002\031\021R\247\215\022\307u\334\016\022\352\030\261\235\312U\340\302q\206\006j\034\027F\202\2404\3408\037n\016\047\362d_M\362$\336\321\265\034\240\310\250\221#G\216\0345j\344\250\221\243\306\374\204\374\204\276G\212\224d9\205\235\002\025 \335\351\375z\336\217\347\336{\302\"\244X\267\360\201AL\261T~\274m\326\251I\005)\352\2145\212\032\021D\025D\323(\3075\235\020S\376\036\250\224\3077\315d`R\307\266.\212\010YD\263U\202PQ\263IQ\260\242\311\314\037\205E\217)\326A\253\312\260\010qf2\335\346\2535\254\036\021S[E\254!V\261\211\365\026\247\274\334h\235ln2\203\232X0\213\017o\3454\272\332\022\207\314DhL\307\211\340\002\213s\265\352!\3255\213\230\310\300\215\021\261\026_\tG\315\021)\005\2614\334z\376\234\036\023\223p\236\234\223\031\214h&\360S\035\266,\334B\320#\216\230-\220\211\r2\014I9\212\365Qk\0006\325\350p\001\351\031\373H:\031\306bL\240H\027\313ap[\314\"\\\014o\347d?\252\233\314\177\250U-\3069\264I\362\0015G\024\032i\210\303(\353\241\214\232&\261\014\306\305\031\271t\346\010\375\336:\201\357&U\005zAN\304\016\251#\204M\223E\330\360\251\333\246*\317\203$\037\370\030\030\372 O\246\331z$\221U\312\023\310\202T\334\240\311}\340\"\257\307B\322S*\2326\326\023\207\204\240\023\315H\005\344D\376\201v\244 |$\225\2116!\004\004\002R#\230\244\312,\030\r5\t\036\237\371y\014\300\274e\252\224\225S\037^S\261\256\3137\221\320u\224\266\252\016&\222\016\302\302*\211\254\342\241\214\317F\003\020T\323\231z\024\215&\235OJ\365\021\316k)\347!\265\232}\000\217\337j\325e\377\251|\003\311;H\34796\3301\336N\220\030\226\207\301\217t:\340\360\030\225\023\006\2173Y\03709N%\342JL\230\350\277\201-~\210u\210a\020\243F,\016L\200\276D\205r3\252\235C\250\006\325\032\254q\346-p\242\327aj\203\0355\330=\345\301\356)\313\335SNv\317\271Jjqa\304\001mNb\314c\254\333\204\037\023\213\326[\\X\266*w\237$\035\253\375\211\326\007a\320\372 \016Z\223\201\320\303\004fd5\025\227\357]\330\377\001\265\320\026L\247\270\274\224\371\002\320dW\374\237\220\351\353\3772\320\373\305\377\330\334\245\214\312""\214\206\r\317uH\366T\224Pn(\2204\372\220\355\347\256\265W\034\345C\265\237\377\246-\234\212\263\351^\363J\336\206\377\304ou\263\243\342\353\236\342Q\377}w)\250H\361\254\203?\346\247\333O\235\333\016v\204[\351O_o+m\022\231~\345U\274\047\236\360\177\356Lu\224\216\326]\t\224@\353-\364\216\302\327o\3027\373\341\376\273\360\035\222\221\233\377\026i\315\261\335\252\253\\\300\356\330U\\|\001\273S\257\340\225.`\3677\224\212!\377\207\235Jg\273\273\323\265\202\231@\271\204\337F\247\332y\335\255\005W\202\205\000_\302\357q\267\324\335\010~\rj\275\\\257:\360\373(\375\244\263\346\226\316\270\313\311<\202\322U\357\246W\351\337(HI\323\271\3524\335+\356\002H\013\221\354\246Sr\326\335\222\373\000Z\231\032\344\334-\357\007O\001\003\247\340\334\225\341\334M\357k\037\373\315\313\300\336\362\252\303\010\277\370\005\277\344\257\371\247\335\002pd-8\r\225\235pg7\334\335\013\367\336\206o\367\323\300snVF\334\002/\231H\265?\rP\216\345\316\270\273\336]\257\351\347\374g\035\336]\014\262A\001\372Gz\225\336v\270\373*|\005\324\001\336\220\220\324e\016\17795p\376\r\230\366\324\237\361\367\240\343\273\335\205\356Q\257\320\273\333\213\213\0103\337:\357\275\322\247\351\314\324\254\363\322}\004M>\360_v*\375\\\276}\265\335\354\347\346\302\271eH\031\004s\021\273\353~\265\237\233\352\347eE\313\220W\376\266\2438&\324\030I\026\335l\077\077\343T\035`\302-\240yup\204\231yw\305S>\315|\016f6\234]\204\3616\243\330\322\345\205$\241\214\204\274\030$2\350\347\347\335R\370\335O\035\200\271\343\026\302\371\373\220N\014\030f\276w\237y\315\213T\002\0207\234\254s\307\035@\374\221`)q9\370\037\016\206h\351";
+    PyObject *data = __Pyx_DecompressString(cstring, 1199, 1);
+    #define __Pyx_DecompressString_LZSS_UNUSED
+    if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
+    const char* const bytes = __Pyx_PyBytes_AsString(data);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
+    #endif
+    #elif (CYTHON_COMPRESS_STRINGS) > 0 && (CYTHON_COMPRESS_STRINGS) <= 90 /* compression: lzss (1488 bytes) */
+static const char cstring[] = "\377(tree fr\377agment).\377?Infinit\377e loop d\377etectedd\377isableen\336\002\001gcis\004\003dn\375o \000fault \377__reduce\377__ due t\377o non-tr_ivial\033\000cS\001\377__sonolu\377s/backen\377d/_opt/a\377nalysis.\377pyxDDomi\277nators\000\007.\376U\006cython_\375_\017\nsetsta\367te_\013\020chil\377dren_mapzF\010d`\003es_q\\\010\371i\024\000%\001FLLiv\037eness\000\005p\017\017\010\374o\016-\006array_\377defs_out\337_nameI\007is\241_\032\003\226\"\235\000d\006l{\000_\343in!\014\021\0025\017roo\343t_-\002Y\003\266@For\017estL\001\006\253\020\020\t\256\017>0\007cross\244 \214a\373_qH\010depth\374\322!\\\010innerm\347ost\t\014\311as__\367Pyx\001\000Dict\377_NextRef\277__anno\267B_\277__func\004\000_\231g\310E\021\000ma\205 \004\001o\027dul\333`_\300\"\"\001\252`\237_capi\004\005\375C_\346\023\001vt\253\204\001G\001qua\301l\362!S\001\231\204\005\274n\263\204\006ex\310{\001\314`\\\006s\200\010\326n__qt\344 \266\000\307@cor\337@\317inea\346K\356Qas\277yncio.+\006s\037bcall\220\205\001\247\204\005\253\204\t\363clT\000\213atrac\321e!\002\217C\216Kd\344`_b\017lock\226B\227F\342\204\006\351\204\010\375d\334\205\006_debug\277entryf\374!i\300\200\205\001\200\205\005\307F\314J\253\204\n\264\204\016it?emskli\275\204\004\276\204\n\004\272\204\005\274\204\013l\345\205\004\205\003\247b\253c\226\002\377marshal_\377inmember\277smoden\343\003s\373n_\326boutpi\357dpop\375\204\014sel?fsetde\237\210\002\365\207\004\225.\365\207\004.\370\207\001.\364\207\005\010\022i\357rstm\327\205\003use\376\327#valuesv\377erifystr\363uc\370\210\001\210\204\001obj_m7\331\210\004_7\332\210\004_4\336\210\001s_8\333\210\005\256\210\010 *(\027&\3772ir_Func\017 *)\000B0\306\210\005\007i\376\207\006\366\262\2003, \236\201<)\000co?mpute_\343\204\007\n\006\374\353e\007\007oops\200\001\377\330\004\n\210+\220Q\200\377A\330\010\017\210t\2201\377\220D\230\n\240!\2409\277\250C\250y\270\001\013\t\r\377\240Q\240i\250{\270)\373\3001*\001\026\220a\340\010\377\014\210E\220\025\220a\220\377t\2301\330\014\r\210Q\373""\210e=\002\013\2401\240C\377\240t\2505\260\005\260Q\377\260d\270+\300Q\300d\377\310$\310k\320YZ\320\377Z\\\320\\^\320^_\372m\001q.\0314\220u\230A\373\230Q\005 v\230Q\230a\276- z\240\021\240!U ~\372\350\000a\275\0008\2601\260I\377\270R\270r\300\024\300Q\376\r(9\260A\260Y\270b\277\300\002\300$\300aE(?\377\270!\2709\300B\300bo\310\004\310A\231$\340\010\347 \235\330\002\000d\230!\342,\255A:\376\370\000c\240\022\2401\330\020\377\021\330\014\017\210q\220\007\377\220q\230\002\230$\230c\373\240\021\017\002\022\220!\2207\317\230!\2302\310 \030\006\004\230\337F\240#\240Q2\000\220\021\373\220%\274A\230D\240\016\250wa\250qK)\023\240A8\007\377>\250\021\250!\2504\250\367z\270\021\241`4\300z\320\377QR\320RU\320UW\277\320W[\320[\\\307\006\030\353\230\001\266aFu\000q\230\004\357\230A\330\014\311`\220r\230\377\024\230U\240%\240q\250\377\004\250K\260s\270&\300\367\001\300\021\275 e\3101\310?I\320UX\320X\270`\265`\357e\320ef\345\001w\220b\372:\000G\347`E\250\024\250W\376\357 U\270$\270k\310\021\367\310%\310\277\003\320\000\027\220\377{\240!\360\014\000\005\026\377\220V\230:\240Q\240g\377\250V\2601\330\004\010\210\377\007\210q\330\004\030\320\030\331*\260\000\016\000\030\230\332\204\001f\250\177A\330\004\005\330\010\021\221 \375*\225\000\010\025\220Q\220n\374\341\000\r\002&\230\001\330\010\024\377\220A\220Q\330\010\023\220\3671\220A\000\004\320\000\032\230\337+\240Q\360\024O\025\026\320?\026&\240a\240qW\0026\001\211N\201\204\001F\001_X\001b\000\034\002\330\377\010\032\230!\320\0330\260~d\000\031\230\021\320\032,\214\000\376k\003\320\000\034\230K\240q\374\246\200!\274\000\020\220\001\220\031\230\265!\247\003]d\005Q\330\312\002a";
+    PyObject *data = __Pyx_DecompressString_LZSS(cstring, 1488, 2817);
+    #define __Pyx_DecompressString_UNUSED
+    if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
+    const char* const bytes = __Pyx_PyBytes_AsString(data);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
+    #endif
+    #else /* compression: none (2817 bytes) */
+static const char bytes[] = "(tree fragment).?Infinite loop detecteddisableenablegcisenabledno default __reduce__ due to non-trivial __cinit__sonolus/backend/_opt/analysis.pyxDDominatorsDominators.__reduce_cython__Dominators.__setstate_cython__Dominators.children_mapDominators.dominates_qDominators.idom_mapFLLivenessLiveness.__reduce_cython__Liveness.__setstate_cython__Liveness.array_defs_out_namesLiveness.is_array_init_mapLiveness.live_in_namesLiveness.live_out_namesLiveness.root_live_namesLoopForestLoopForest.__reduce_cython__LoopForest.__setstate_cython__LoopForest.crosses_loop_qLoopForest.depth_mapLoopForest.innermost_mapLoopForest.loops__Pyx_PyDict_NextRef__annotate____func____getstate____main____module____name____pyx_capi____pyx_state__pyx_vtable____qualname____reduce____reduce_cython____reduce_ex____set_name____setstate____setstate_cython____test___is_coroutineaarray_defs_outarray_defs_out_namesasyncio.coroutinesbcallbackchildrenchildren_mapcline_in_tracebackcrossescrosses_loop_qddef_blockdepthdepth_mapdominatesdominates_qdominators_debugentryffunciidomidom_mapinnermostinnermost_mapis_array_initis_array_init_mapitemsklilive_inlive_in_nameslive_outlive_out_namesliveness_debugloopsloops_debugmarshal_inmembersmoden_blocksn_loopsoutpidpoproot_live_namesselfsetdefaultsonolus.backend._opt.analysissonolus.backend._opt.irstmt_liveuse_blockvaluesverifystruct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)\000struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Liveness *(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *)\000struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_LoopForest *(struct __pyx_obj_7sonolus_7backend_4_opt_2ir_Func *, struct __pyx_obj_7sonolus_7backend_4_opt_8analysis_Dominators *)\000compute_dominators\000compute_liveness\000compute_loops\200\001\330\004\n\210+\220Q\200A\330\010\017\210t\2201\220D\230\n\240!\2409\250C\250y\270\001\200A\330\010\017\210t\2201\220D\230\r\240Q\240i\250{\270)\3001\200A\330\010\026\220a""\340\010\014\210E\220\025\220a\220t\2301\330\014\r\210Q\210e\2201\220D\230\013\2401\240C\240t\2505\260\005\260Q\260d\270+\300Q\300d\310$\310k\320YZ\320Z\\\320\\^\320^_\330\010\017\210q\200A\330\010\026\220a\340\010\014\210E\220\025\220a\220t\2301\330\014\r\210Q\210e\2204\220u\230A\230Q\330\010\017\210q\200A\330\010\026\220a\340\010\014\210E\220\025\220a\220t\2301\330\014\r\210Q\210e\2204\220v\230Q\230a\330\010\017\210q\200A\330\010\026\220a\340\010\014\210E\220\025\220a\220t\2301\330\014\r\210Q\210e\2204\220z\240\021\240!\330\010\017\210q\200A\330\010\026\220a\340\010\014\210E\220\025\220a\220t\2301\330\014\r\210Q\210e\2204\220~\240Q\240a\240t\2508\2601\260I\270R\270r\300\024\300Q\330\010\017\210q\200A\330\010\026\220a\340\010\014\210E\220\025\220a\220t\2301\330\014\r\210Q\210e\2204\220~\240Q\240a\240t\2509\260A\260Y\270b\300\002\300$\300a\330\010\017\210q\200A\330\010\026\220a\340\010\014\210E\220\025\220a\220t\2301\330\014\r\210Q\210e\2204\220~\240Q\240a\240t\250?\270!\2709\300B\300b\310\004\310A\330\010\017\210q\200A\340\010\026\220a\330\010\026\220d\230!\340\010\014\210E\220\025\220a\220t\2301\330\014\017\210t\220:\230Q\230c\240\022\2401\330\020\021\330\014\017\210q\220\007\220q\230\002\230$\230c\240\021\330\020\021\330\014\022\220!\2207\230!\2302\230Q\330\014\017\210q\220\007\220q\230\004\230F\240#\240Q\330\020\021\220\021\220%\220t\2301\230D\240\016\250a\250q\330\010\017\210q\200A\340\010\026\220a\330\010\026\220d\230!\340\010\014\210E\220\025\220a\220t\2301\330\014\017\210t\220:\230Q\230c\240\023\240A\330\020\021\220\021\220%\220t\230>\250\021\250!\2504\250z\270\021\270)\3004\300z\320QR\320RU\320UW\320W[\320[\\\330\010\017\210q\200A\340\010\030\230\001\340\010\014\210F\220%\220q\230\004\230A\330\014\026\220a\220r\230\024\230U\240%\240q\250\004\250K\260s\270&\300\001\300\021\300$\300e\3101\310I\320UX\320XZ\320Z^\320^e\320ef\330\014\017\210w\220b\230\004\230G\2401\240E\250\024\250W\260A\260U\270$\270k\310\021\310%\310q\330\010\017\210q\320\000\027\220{\240!""\360\014\000\005\026\220V\230:\240Q\240g\250V\2601\330\004\010\210\007\210q\330\004\030\320\030*\250!\2501\330\004\030\230\r\240Q\240f\250A\330\004\005\330\010\021\220\021\220*\230A\330\010\025\220Q\220n\240A\330\010\021\220\021\220&\230\001\330\010\024\220A\220Q\330\010\023\2201\220A\330\010\023\2201\220A\320\000\032\230+\240Q\360\024\000\005\026\220V\230:\240Q\240g\250V\2601\330\004\010\210\007\210q\330\004\026\320\026&\240a\240q\330\004\005\330\010\023\2201\220N\240!\330\010\024\220A\220_\240A\330\010\025\220Q\320\026&\240a\330\010\032\230!\320\0330\260\001\330\010\031\230\021\320\032,\250A\330\010\024\220A\220Q\320\000\034\230K\240q\360\014\000\005\026\220V\230:\240Q\240g\250V\2601\330\004\010\210\007\210q\330\004\030\320\030*\250!\2501\330\004\005\330\010\020\220\001\220\031\230!\330\010\024\220A\220]\240!\330\010\024\220A\220Q\330\010\025\220Q\220a";
+    PyObject *data = NULL;
+    #define __Pyx_DecompressString_UNUSED
+    #define __Pyx_DecompressString_LZSS_UNUSED
+    #endif
+    PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
+    Py_ssize_t pos = 0;
+    for (int i = 0; i < 108; i++) {
+      Py_ssize_t bytes_length = str_length_index[i].length;
+      PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
+      if (likely(string) && i >= 10) PyUnicode_InternInPlace(&string);
+      if (unlikely(!string)) {
+        Py_XDECREF(data);
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+      stringtab[i] = string;
+      pos += bytes_length;
+    }
+    for (int i = 108; i < 125; i++) {
+      Py_ssize_t bytes_length = bytes_length_index[i-108].length;
+      PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
+      stringtab[i] = string;
+      pos += bytes_length;
+      if (unlikely(!string)) {
+        Py_XDECREF(data);
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+    }
+    Py_XDECREF(data);
+    for (Py_ssize_t i = 0; i < 125; i++) {
+      if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+    }
+    #if CYTHON_IMMORTAL_CONSTANTS
+    {
+      PyObject **table = stringtab + 108;
+      for (Py_ssize_t i=0; i<17; ++i) {
+        #if PY_VERSION_HEX >= 0x030F0000
+        PyUnstable_SetImmortal(table[i]);
+        #elif CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+        if ((PY_SSIZE_T_MAX <= _Py_IMMORTAL_REFCNT_LOCAL)) break;
+        #if PY_VERSION_HEX < 0x030E0000
+        if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
+        #else
+        if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
+        #endif
+        {
+          Py_SET_REFCNT(table[i], ((Py_ssize_t)_Py_IMMORTAL_REFCNT_LOCAL + 1));
+        }
+        #else
+        if ((PY_SSIZE_T_MAX < _Py_IMMORTAL_INITIAL_REFCNT)) break;
+        Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
+        #endif
+      }
+    }
+    #endif
+  }
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_codeobjects ### */
+#ifdef __cplusplus
+namespace {
+#endif
+typedef struct {
+    unsigned int argcount : 2;
+    unsigned int num_posonly_args : 1;
+    unsigned int num_kwonly_args : 1;
+    unsigned int nlocals : 3;
+    unsigned int flags : 10;
+    unsigned int first_line : 10;
+} __Pyx_PyCode_New_function_description;
+#ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+/* NewCodeObj.proto */
+static PyObject* __Pyx_PyCode_New(
+        const __Pyx_PyCode_New_function_description descr,
+        PyObject * const *varnames,
+        PyObject *filename,
+        PyObject *funcname,
+        PyObject *line_table,
+        PyObject *tuple_dedup_map
+);
+
+
+static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
+  PyObject* tuple_dedup_map = PyDict_New();
+  if (unlikely(!tuple_dedup_map)) return -1;
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 168};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_b};
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_live_in_names, __pyx_mstate->__pyx_kp_b_iso88591_A_a_E_at1_Qe4_Qat81IRr_Q_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 175};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_b};
+    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_live_out_names, __pyx_mstate->__pyx_kp_b_iso88591_A_a_E_at1_Qe4_Qat9AYb_a_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 182};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_f, __pyx_mstate->__pyx_n_u_i};
+    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_root_live_names, __pyx_mstate->__pyx_kp_b_iso88591_A_a_d_E_at1_t_Qc_A_t_4z_4zQRRUUW, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 192};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_b};
+    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_array_defs_out_names, __pyx_mstate->__pyx_kp_b_iso88591_A_a_E_at1_Qe4_Qat_9Bb_A_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 199};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_f, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_pid};
+    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_is_array_init_map, __pyx_mstate->__pyx_kp_b_iso88591_A_a_d_E_at1_t_Qc_1_q_q_c_7_2Q_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 1};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[5] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_tree_fragment, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[5])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 3};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_pyx_state};
+    __pyx_mstate_global->__pyx_codeobj_tab[6] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_tree_fragment, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[6])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 477};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_entry, __pyx_mstate->__pyx_n_u_mode, __pyx_mstate->__pyx_n_u_callback, __pyx_mstate->__pyx_n_u_func_2, __pyx_mstate->__pyx_n_u_L};
+    __pyx_mstate_global->__pyx_codeobj_tab[7] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_liveness_debug, __pyx_mstate->__pyx_kp_b_iso88591_Q_V_QgV1_q_aq_1N_A_A_Q_a_0_A_AQ, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[7])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 531};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_b};
+    __pyx_mstate_global->__pyx_codeobj_tab[8] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_idom_map, __pyx_mstate->__pyx_kp_b_iso88591_A_a_E_at1_Qe4uAQ_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[8])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 538};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_b, __pyx_mstate->__pyx_n_u_k, __pyx_mstate->__pyx_n_u_k};
+    __pyx_mstate_global->__pyx_codeobj_tab[9] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_children_map, __pyx_mstate->__pyx_kp_b_iso88591_A_a_E_at1_Qe1D_1Ct5_Qd_Qd_kYZZ, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[9])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 545};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_a, __pyx_mstate->__pyx_n_u_b};
+    __pyx_mstate_global->__pyx_codeobj_tab[10] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_dominates_q, __pyx_mstate->__pyx_kp_b_iso88591_A_t1D_9Cy, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[10])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 1};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[11] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_tree_fragment, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[11])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 3};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_pyx_state};
+    __pyx_mstate_global->__pyx_codeobj_tab[12] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_tree_fragment, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[12])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 677};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_entry, __pyx_mstate->__pyx_n_u_mode, __pyx_mstate->__pyx_n_u_callback, __pyx_mstate->__pyx_n_u_func_2, __pyx_mstate->__pyx_n_u_D};
+    __pyx_mstate_global->__pyx_codeobj_tab[13] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_dominators_debug, __pyx_mstate->__pyx_kp_b_iso88591_Kq_V_QgV1_q_1_A_AQ_Qa, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[13])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 734};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_b};
+    __pyx_mstate_global->__pyx_codeobj_tab[14] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_depth_map, __pyx_mstate->__pyx_kp_b_iso88591_A_a_E_at1_Qe4vQa_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[14])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 741};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_b};
+    __pyx_mstate_global->__pyx_codeobj_tab[15] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_innermost_map, __pyx_mstate->__pyx_kp_b_iso88591_A_a_E_at1_Qe4z_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[15])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 748};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_out, __pyx_mstate->__pyx_n_u_li, __pyx_mstate->__pyx_n_u_b, __pyx_mstate->__pyx_n_u_members, __pyx_mstate->__pyx_n_u_b};
+    __pyx_mstate_global->__pyx_codeobj_tab[16] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_loops, __pyx_mstate->__pyx_kp_b_iso88591_A_F_q_A_ar_U_q_Ks_e1IUXXZZ_eef_w, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[16])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 757};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_def_block, __pyx_mstate->__pyx_n_u_use_block};
+    __pyx_mstate_global->__pyx_codeobj_tab[17] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_crosses_loop_q, __pyx_mstate->__pyx_kp_b_iso88591_A_t1D_Qi_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[17])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 1};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[18] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_tree_fragment, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[18])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 3};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_pyx_state};
+    __pyx_mstate_global->__pyx_codeobj_tab[19] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_tree_fragment, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[19])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 911};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_entry, __pyx_mstate->__pyx_n_u_mode, __pyx_mstate->__pyx_n_u_callback, __pyx_mstate->__pyx_n_u_func_2, __pyx_mstate->__pyx_n_u_D, __pyx_mstate->__pyx_n_u_F};
+    __pyx_mstate_global->__pyx_codeobj_tab[20] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_analysis_py, __pyx_mstate->__pyx_n_u_loops_debug, __pyx_mstate->__pyx_kp_b_iso88591_V_QgV1_q_1_QfA_A_QnA_AQ_1A_1A, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[20])) goto bad;
+  }
+  Py_DECREF(tuple_dedup_map);
+  return 0;
+  bad:
+  Py_DECREF(tuple_dedup_map);
+  return -1;
+}
+/* #### Code section: init_globals ### */
+
+static int __Pyx_InitGlobals(void) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  /* PythonCompatibility.init */
+  if (likely(__Pyx_init_co_variables() == 0 && __Pyx_init_tpflags_variables() == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* CommonTypesMetaclass.init */
+  if (likely(__pyx_CommonTypesMetaclass_init(__pyx_m) == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* CachedMethodType.init */
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  {
+      PyObject *typesModule=NULL;
+      typesModule = PyImport_ImportModule("types");
+      if (typesModule) {
+          __pyx_mstate_global->__Pyx_CachedMethodType = PyObject_GetAttrString(typesModule, "MethodType");
+          Py_DECREF(typesModule);
+      }
+  } // error handling follows
+  #endif
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_after_shared_utility ### */
+
+static int __Pyx_InitAfterSharedUtility(void) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  /* CythonFunctionPerModule.init */
+  if (likely(__pyx_CyFunction_init(__pyx_m) == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#ifdef _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
+#endif
+
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* CopyObjectArray (used by TupleOrListFromArrayImpl) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
+    }
+}
+#endif
+
+/* TupleOrListFromArrayImpl (used by TupleFromArray) */
+#if !(PY_VERSION_HEX >= 0x030F0000 && !CYTHON_COMPILING_IN_LIMITED_API)
+CYTHON_UNUSED static PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n) {
+    if (n <= 0) {
+        return __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_tuple);
+    }
+    PyObject *res = PyTuple_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    __Pyx_copy_object_array(src, ((PyTupleObject*)res)->ob_item, n);
+    #else
+    Py_ssize_t i;
+    for (i = 0; i < n; i++) {
+        Py_INCREF(src[i]);
+        if (unlikely(__Pyx_PyTuple_SET_ITEM(res, i, src[i]) < (0))) {
+            Py_DECREF(res);
+            return NULL;
+        }
+    }
+    #endif
+    return res;
+}
+#endif
+
+/* PyObjectCompare (used by UnicodeEquals) */
+#ifndef __Pyx_DEFINED_PyObject_CompareStrStrBoolEq
+#define __Pyx_DEFINED_PyObject_CompareStrStrBoolEq
+static CYTHON_INLINE int __Pyx_PyObject_CompareStrStrBoolEq(PyObject* s1, PyObject* s2) {
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030e0000
+    int result = PyUnicode_Equal(s1, s2);
+    #if !CYTHON_COMPILING_IN_CPYTHON
+    if (unlikely(result == -1)) return -1;
+    #endif
+    if (result == 0) goto __pyx_return_false; else goto __pyx_return_true;
+    #else
+    int result = PyUnicode_Compare(s1, s2);
+    if (unlikely((result == -1) && PyErr_Occurred())) return -1;
+    if (result == 0) goto __pyx_return_true; else goto __pyx_return_false;
+    #endif
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
+}
+#endif
+static CYTHON_INLINE int __Pyx_PyObject_CompareBoolEq_str_str(PyObject *op1, PyObject *op2, int pyop) {
+    CYTHON_UNUSED_VAR(pyop);
+    if (unlikely(op1 == Py_None)) {
+        if (op2 == Py_None) goto __pyx_return_true; else goto __pyx_return_false;
+    }
+    if (unlikely(op2 == Py_None)) {
+        if (op1 == Py_None) goto __pyx_return_true; else goto __pyx_return_false;
+    }
+    
+    if (likely(op1 != Py_None)) {
+        if (op1 == op2) goto __pyx_return_true;
+        if (likely(op2 != Py_None)) {
+            return __Pyx_PyObject_CompareStrStrBoolEq(op1, op2);
+        }
+        goto __pyx_richcmp;
+    }
+    
+    if ((0)) goto __pyx_richcmp;
+    if ((0)) goto __pyx_return_true;
+    if ((0)) goto __pyx_return_false;
+__pyx_richcmp:
+    return __Pyx_PyObject_RichCompareBool(op1, op2, Py_EQ);
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
+}
+
+/* fastcall */
+#if CYTHON_VECTORCALL
+static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s)
+{
+    Py_ssize_t i, n = __Pyx_PyTuple_GET_SIZE(kwnames);
+    #if !CYTHON_ASSUME_SAFE_SIZE
+    if (unlikely(n == -1)) return NULL;
+    #endif
+    for (i = 0; i < n; i++)
+    {
+        PyObject *namei = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(!namei)) return NULL;
+        #endif
+        if (s == namei) return kwvalues[i];
+    }
+    for (i = 0; i < n; i++)
+    {
+        PyObject *namei = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(!namei)) return NULL;
+        #endif
+        int eq = __Pyx_PyUnicode_Equals(s, namei);
+        if (unlikely(eq != 0)) {
+            if (unlikely(eq < 0)) return NULL;
+            return kwvalues[i];
+        }
+    }
+    return NULL;
+}
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_GRAAL
+CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues) {
+    Py_ssize_t i, nkwargs;
+    PyObject *dict;
+#if !CYTHON_ASSUME_SAFE_SIZE
+    nkwargs = PyTuple_Size(kwnames);
+    if (unlikely(nkwargs < 0)) return NULL;
+#else
+    nkwargs = PyTuple_GET_SIZE(kwnames);
+#endif
+    dict = PyDict_New();
+    if (unlikely(!dict))
+        return NULL;
+    for (i=0; i<nkwargs; i++) {
+#if !CYTHON_ASSUME_SAFE_MACROS
+        PyObject *key = PyTuple_GetItem(kwnames, i);
+        if (!key) goto bad;
+#else
+        PyObject *key = PyTuple_GET_ITEM(kwnames, i);
+#endif
+        if (unlikely(PyDict_SetItem(dict, key, kwvalues[i]) < 0))
+            goto bad;
+    }
+    return dict;
+bad:
+    Py_DECREF(dict);
+    return NULL;
+}
+#endif
+#endif
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* PyObjectCall (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = __Pyx_CyOrPyCFunction_GET_FUNCTION(func);
+    self = __Pyx_CyOrPyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectFastCall (used by PyObjectCallOneArg) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs) {
+    PyObject *argstuple;
+    PyObject *result = 0;
+    size_t i;
+    argstuple = PyTuple_New((Py_ssize_t)nargs);
+    if (unlikely(!argstuple)) return NULL;
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        if (__Pyx_PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]) != (0)) goto bad;
+    }
+    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
+  bad:
+    Py_DECREF(argstuple);
+    return result;
+}
+#endif
+#if CYTHON_VECTORCALL && !(CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY)
+  #if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE vectorcallfunc __Pyx_PyVectorcall_Function(PyObject *callable) {
+    PyTypeObject *tp = Py_TYPE(callable);
+    #if defined(__Pyx_CyFunction_USED)
+    if (__Pyx_CyFunction_CheckExact(callable)) {
+        return __Pyx_CyFunction_func_vectorcall(callable);
+    }
+    #endif
+    if (!PyType_HasFeature(tp, Py_TPFLAGS_HAVE_VECTORCALL)) {
+        return NULL;
+    }
+    assert(PyCallable_Check(callable));
+    Py_ssize_t offset = tp->tp_vectorcall_offset;
+    assert(offset > 0);
+    vectorcallfunc ptr;
+    memcpy(&ptr, (char *) callable + offset, sizeof(ptr));
+    return ptr;
+}
+  #else
+    #define __Pyx_PyVectorcall_Function(callable) PyVectorcall_Function(callable)
+  #endif
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwargs) {
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(nargsf);
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (nargs == 0 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
+            return __Pyx_PyObject_CallMethO(func, NULL);
+    }
+    else if (nargs == 1 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_O))
+            return __Pyx_PyObject_CallMethO(func, args[0]);
+    }
+#endif
+    if (kwargs == NULL) {
+        #if CYTHON_VECTORCALL
+          #if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+            return PyObject_Vectorcall(func, args, nargsf, NULL);
+          #else
+            vectorcallfunc f = __Pyx_PyVectorcall_Function(func);
+            if (f) {
+                return f(func, args, nargsf, NULL);
+            }
+          #endif
+        #endif
+    }
+    if (nargs == 0) {
+        return __Pyx_PyObject_Call(func, __pyx_mstate_global->__pyx_empty_tuple, kwargs);
+    }
+    #if CYTHON_COMPILING_IN_LIMITED_API
+    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
+    #elif CYTHON_COMPILING_IN_PYPY
+    return PyObject_VectorcallDict(func, args, (size_t) nargs, kwargs);
+    #else
+    return PyObject_VectorcallDict(func, args, nargsf, kwargs);
+    #endif
+}
+
+/* PyObjectCallOneArg (used by CallUnboundCMethod0) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *args[2] = {NULL, arg};
+    return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* IgnoreException (used by UnpackUnboundCMethod_impl) */
+static CYTHON_INLINE int __Pyx_IgnoreGivenException(PyObject *given_exception, PyObject *ignorable_exception) {
+    if (PyErr_GivenExceptionMatches(given_exception ? given_exception : PyErr_Occurred(), ignorable_exception)) {
+        PyErr_Clear();
+        return 1;
+    }
+    return 0;
+}
+
+/* FastTypeChecks (used by UnpackUnboundCMethod_impl) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+}
+#endif
+
+/* PyObjectGetAttrStr (used by UnpackUnboundCMethod_impl) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* UnpackUnboundCMethod_impl (used by UnpackUnboundCMethod) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030C0000
+static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+    PyObject *selfless_args = PyTuple_GetSlice(args, 1, PyTuple_Size(args));
+    if (unlikely(!selfless_args)) return NULL;
+    result = PyObject_Call(method, selfless_args, kwargs);
+    Py_DECREF(selfless_args);
+    return result;
+}
+#else
+static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return PyObject_Vectorcall(method, args ? args+1 : NULL, nargs ? (size_t) nargs-1 : 0, kwnames);
+}
+#endif
+static PyMethodDef __Pyx_UnboundCMethod_Def = {
+     "CythonUnboundCMethod",
+     __PYX_REINTERPRET_FUNCION(PyCFunction, __Pyx_SelflessCall),
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030C0000
+     METH_VARARGS | METH_KEYWORDS,
+#else
+     METH_FASTCALL | METH_KEYWORDS,
+#endif
+     NULL
+};
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
+    PyObject *method, *result=NULL;
+    method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
+    if (unlikely(!method))
+        return -1;
+    result = method;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (likely(__Pyx_TypeCheck(method, &PyMethodDescr_Type)))
+    {
+        PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
+        target->func = descr->d_method->ml_meth;
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST);
+    } else
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+#else
+    if (PyCFunction_Check(method))
+#endif
+    {
+        PyObject *self;
+        int self_found;
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+        self = PyObject_GetAttrString(method, "__self__");
+        if (!self && !__Pyx_IgnoreException(PyExc_AttributeError)) {
+            return -1;
+        }
+#else
+        self = PyCFunction_GET_SELF(method);
+#endif
+        self_found = (self && self != Py_None);
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+        Py_XDECREF(self);
+#endif
+        if (self_found) {
+            PyObject *unbound_method = PyCFunction_New(&__Pyx_UnboundCMethod_Def, method);
+            if (unlikely(!unbound_method)) return -1;
+            Py_DECREF(method);
+            result = unbound_method;
+        }
+    }
+#if !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    if (unlikely(target->method)) {
+        Py_DECREF(result);
+    } else
+#endif
+    target->method = result;
+    return 0;
+}
+
+/* CallUnboundCMethod0 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self) {
+    int was_initialized = __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
+    if (likely(was_initialized == 2 && cfunc->func)) {
+        if (likely(cfunc->flag == METH_NOARGS))
+            return __Pyx_CallCFunction(cfunc, self, NULL);
+        if (likely(cfunc->flag == METH_FASTCALL))
+            return __Pyx_CallCFunctionFast(cfunc, self, NULL, 0);
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, NULL, 0, NULL);
+        if (likely(cfunc->flag == (METH_VARARGS | METH_KEYWORDS)))
+            return __Pyx_CallCFunctionWithKeywords(cfunc, self, __pyx_mstate_global->__pyx_empty_tuple, NULL);
+        if (cfunc->flag == METH_VARARGS)
+            return __Pyx_CallCFunction(cfunc, self, __pyx_mstate_global->__pyx_empty_tuple);
+        return __Pyx__CallUnboundCMethod0(cfunc, self);
+    }
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    else if (unlikely(was_initialized == 1)) {
+        __Pyx_CachedCFunction tmp_cfunc = {
+#ifndef __cplusplus
+            0
+#endif
+        };
+        tmp_cfunc.type = cfunc->type;
+        tmp_cfunc.method_name = cfunc->method_name;
+        return __Pyx__CallUnboundCMethod0(&tmp_cfunc, self);
+    }
+#endif
+    PyObject *result = __Pyx__CallUnboundCMethod0(cfunc, self);
+    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
+    return result;
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self) {
+    PyObject *result;
+    if (unlikely(!cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+    result = __Pyx_PyObject_CallOneArg(cfunc->method, self);
+    return result;
+}
+
+/* py_dict_items (used by OwnedDictNext) */
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Items(PyObject* d) {
+    return __Pyx_CallUnboundCMethod0(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_items, d);
+}
+
+/* py_dict_values (used by OwnedDictNext) */
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Values(PyObject* d) {
+    return __Pyx_CallUnboundCMethod0(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_values, d);
+}
+
+/* OwnedDictNext (used by RejectKeywords) */
+#if CYTHON_AVOID_BORROWED_REFS
+static int __Pyx_PyDict_NextRef(PyObject *p, PyObject **ppos, PyObject **pkey, PyObject **pvalue) {
+    PyObject *next = NULL;
+    if (!*ppos) {
+        if (pvalue) {
+            PyObject *dictview = pkey ? __Pyx_PyDict_Items(p) : __Pyx_PyDict_Values(p);
+            if (unlikely(!dictview)) goto bad;
+            *ppos = PyObject_GetIter(dictview);
+            Py_DECREF(dictview);
+        } else {
+            *ppos = PyObject_GetIter(p);
+        }
+        if (unlikely(!*ppos)) goto bad;
+    }
+    next = PyIter_Next(*ppos);
+    if (!next) {
+        if (PyErr_Occurred()) goto bad;
+        return 0;
+    }
+    if (pkey && pvalue) {
+        *pkey = __Pyx_PySequence_ITEM(next, 0);
+        if (unlikely(*pkey)) goto bad;
+        *pvalue = __Pyx_PySequence_ITEM(next, 1);
+        if (unlikely(*pvalue)) goto bad;
+        Py_DECREF(next);
+    } else if (pkey) {
+        *pkey = next;
+    } else {
+        assert(pvalue);
+        *pvalue = next;
+    }
+    return 1;
+  bad:
+    Py_XDECREF(next);
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+    PyErr_FormatUnraisable("Exception ignored in __Pyx_PyDict_NextRef");
+#else
+    PyErr_WriteUnraisable(__pyx_mstate_global->__pyx_n_u_Pyx_PyDict_NextRef);
+#endif
+    if (pkey) *pkey = NULL;
+    if (pvalue) *pvalue = NULL;
+    return 0;
+}
+#else // !CYTHON_AVOID_BORROWED_REFS
+static int __Pyx_PyDict_NextRef(PyObject *p, Py_ssize_t *ppos, PyObject **pkey, PyObject **pvalue) {
+    int result = PyDict_Next(p, ppos, pkey, pvalue);
+    if (likely(result == 1)) {
+        if (pkey) Py_INCREF(*pkey);
+        if (pvalue) Py_INCREF(*pvalue);
+    }
+    return result;
+}
+#endif
+
+/* RejectKeywords */
+static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds) {
+    PyObject *key = NULL;
+    if (CYTHON_VECTORCALL && likely(PyTuple_Check(kwds))) {
+        key = __Pyx_PySequence_ITEM(kwds, 0);
+    } else {
+#if CYTHON_AVOID_BORROWED_REFS
+        PyObject *pos = NULL;
+#else
+        Py_ssize_t pos = 0;
+#endif
+#if !CYTHON_COMPILING_IN_PYPY || defined(PyArg_ValidateKeywordArguments)
+        if (unlikely(!PyArg_ValidateKeywordArguments(kwds))) return;
+#endif
+        __Pyx_PyDict_NextRef(kwds, &pos, &key, NULL);
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_XDECREF(pos);
+#endif
+    }
+    if (likely(key)) {
+        PyErr_Format(PyExc_TypeError,
+            "%s() got an unexpected keyword argument '%U'",
+            function_name, key);
+        Py_DECREF(key);
+    }
+}
+
+/* PyErrFetchRestore (used by RaiseException) */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
+    }
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
+}
+#endif
+
+/* RaiseException */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+        PyException_SetTraceback(value, tb);
+#elif CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+
+/* RaiseDoubleKeywords (used by ParseKeywordsImpl) */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+}
+
+/* CallUnboundCMethod2 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2) {
+    int was_initialized = __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
+    if (likely(was_initialized == 2 && cfunc->func)) {
+        PyObject *args[2] = {arg1, arg2};
+        if (cfunc->flag == METH_FASTCALL) {
+            return __Pyx_CallCFunctionFast(cfunc, self, args, 2);
+        }
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, args, 2, NULL);
+    }
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    else if (unlikely(was_initialized == 1)) {
+        __Pyx_CachedCFunction tmp_cfunc = {
+#ifndef __cplusplus
+            0
+#endif
+        };
+        tmp_cfunc.type = cfunc->type;
+        tmp_cfunc.method_name = cfunc->method_name;
+        return __Pyx__CallUnboundCMethod2(&tmp_cfunc, self, arg1, arg2);
+    }
+#endif
+    PyObject *result = __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2);
+    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
+    return result;
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2){
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        PyObject *result = NULL;
+        PyObject *args = PyTuple_New(2);
+        if (unlikely(!args)) return NULL;
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 0, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 1, arg2);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = __Pyx_CallCFunctionWithKeywords(cfunc, self, args, NULL);
+        else
+            result = __Pyx_CallCFunction(cfunc, self, args);
+        Py_DECREF(args);
+        return result;
+    }
+#endif
+    {
+        PyObject *args[4] = {NULL, self, arg1, arg2};
+        return __Pyx_PyObject_FastCall(cfunc->method, args+1, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+    }
+}
+
+/* ParseKeywordsImpl (used by ParseKeywords) */
+static int __Pyx_ValidateDuplicatePosArgs(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    const char* function_name)
+{
+    PyObject ** const *name = argnames;
+    while (name != first_kw_arg) {
+        PyObject *key = **name;
+        int found = PyDict_Contains(kwds, key);
+        if (unlikely(found)) {
+            if (found == 1) __Pyx_RaiseDoubleKeywordsError(function_name, key);
+            goto bad;
+        }
+        name++;
+    }
+    return 0;
+bad:
+    return -1;
+}
+#if CYTHON_USE_UNICODE_INTERNALS
+static CYTHON_INLINE int __Pyx_UnicodeKeywordsEqual(PyObject *s1, PyObject *s2) {
+    int kind;
+    Py_ssize_t len = PyUnicode_GET_LENGTH(s1);
+    if (len != PyUnicode_GET_LENGTH(s2)) return 0;
+    kind = PyUnicode_KIND(s1);
+    if (kind != PyUnicode_KIND(s2)) return 0;
+    const void *data1 = PyUnicode_DATA(s1);
+    const void *data2 = PyUnicode_DATA(s2);
+    return (memcmp(data1, data2, (size_t) len * (size_t) kind) == 0);
+}
+#endif
+static int __Pyx_MatchKeywordArg_str(
+    PyObject *key,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    size_t *index_found,
+    const char *function_name)
+{
+    PyObject ** const *name;
+    #if CYTHON_USE_UNICODE_INTERNALS
+    Py_hash_t key_hash = ((PyASCIIObject*)key)->hash;
+    if (unlikely(key_hash == -1)) {
+        key_hash = PyObject_Hash(key);
+        if (unlikely(key_hash == -1))
+            goto bad;
+    }
+    #endif
+    name = first_kw_arg;
+    while (*name) {
+        PyObject *name_str = **name;
+        #if CYTHON_USE_UNICODE_INTERNALS
+        if (key_hash == ((PyASCIIObject*)name_str)->hash && __Pyx_UnicodeKeywordsEqual(name_str, key)) {
+            *index_found = (size_t) (name - argnames);
+            return 1;
+        }
+        #else
+        #if CYTHON_ASSUME_SAFE_SIZE
+        if (PyUnicode_GET_LENGTH(name_str) == PyUnicode_GET_LENGTH(key))
+        #endif
+        {
+            int cmp = PyUnicode_Compare(name_str, key);
+            if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+            if (cmp == 0) {
+                *index_found = (size_t) (name - argnames);
+                return 1;
+            }
+        }
+        #endif
+        name++;
+    }
+    name = argnames;
+    while (name != first_kw_arg) {
+        PyObject *name_str = **name;
+        #if CYTHON_USE_UNICODE_INTERNALS
+        if (unlikely(key_hash == ((PyASCIIObject*)name_str)->hash)) {
+            if (__Pyx_UnicodeKeywordsEqual(name_str, key))
+                goto arg_passed_twice;
+        }
+        #else
+        #if CYTHON_ASSUME_SAFE_SIZE
+        if (PyUnicode_GET_LENGTH(name_str) == PyUnicode_GET_LENGTH(key))
+        #endif
+        {
+            if (unlikely(name_str == key)) goto arg_passed_twice;
+            int cmp = PyUnicode_Compare(name_str, key);
+            if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+            if (cmp == 0) goto arg_passed_twice;
+        }
+        #endif
+        name++;
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+bad:
+    return -1;
+}
+static int __Pyx_MatchKeywordArg_nostr(
+    PyObject *key,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    size_t *index_found,
+    const char *function_name)
+{
+    PyObject ** const *name;
+    if (unlikely(!PyUnicode_Check(key))) goto invalid_keyword_type;
+    name = first_kw_arg;
+    while (*name) {
+        int cmp = PyObject_RichCompareBool(**name, key, Py_EQ);
+        if (cmp == 1) {
+            *index_found = (size_t) (name - argnames);
+            return 1;
+        }
+        if (unlikely(cmp == -1)) goto bad;
+        name++;
+    }
+    name = argnames;
+    while (name != first_kw_arg) {
+        int cmp = PyObject_RichCompareBool(**name, key, Py_EQ);
+        if (unlikely(cmp != 0)) {
+            if (cmp == 1) goto arg_passed_twice;
+            else goto bad;
+        }
+        name++;
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+bad:
+    return -1;
+}
+static CYTHON_INLINE int __Pyx_MatchKeywordArg(
+    PyObject *key,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    size_t *index_found,
+    const char *function_name)
+{
+    return likely(PyUnicode_CheckExact(key)) ?
+        __Pyx_MatchKeywordArg_str(key, argnames, first_kw_arg, index_found, function_name) :
+        __Pyx_MatchKeywordArg_nostr(key, argnames, first_kw_arg, index_found, function_name);
+}
+static void __Pyx_RejectUnknownKeyword(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    const char *function_name)
+{
+    #if CYTHON_AVOID_BORROWED_REFS
+    PyObject *pos = NULL;
+    #else
+    Py_ssize_t pos = 0;
+    #endif
+    PyObject *key = NULL;
+    __Pyx_BEGIN_CRITICAL_SECTION(kwds);
+    #if CYTHON_AVOID_BORROWED_REFS
+    while (__Pyx_PyDict_NextRef(kwds, &pos, &key, NULL))
+    #else
+    (void) __Pyx_PyDict_NextRef;
+    while (PyDict_Next(kwds, &pos, &key, NULL))
+    #endif
+    {
+        PyObject** const *name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (!*name) {
+            size_t index_found = 0;
+            int cmp = __Pyx_MatchKeywordArg(key, argnames, first_kw_arg, &index_found, function_name);
+            if (cmp != 1) {
+                if (cmp == 0) {
+                    PyErr_Format(PyExc_TypeError,
+                        "%s() got an unexpected keyword argument '%U'",
+                        function_name, key);
+                }
+                #if CYTHON_AVOID_BORROWED_REFS
+                Py_DECREF(key);
+                #endif
+                break;
+            }
+        }
+        #if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(key);
+        #endif
+    }
+    __Pyx_END_CRITICAL_SECTION();
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_XDECREF(pos);
+    #endif
+    assert(PyErr_Occurred());
+}
+static int __Pyx_ParseKeywordDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs)
+{
+    PyObject** const *name;
+    PyObject** const *first_kw_arg = argnames + num_pos_args;
+    Py_ssize_t extracted = 0;
+#if !CYTHON_COMPILING_IN_PYPY || defined(PyArg_ValidateKeywordArguments)
+    if (unlikely(!PyArg_ValidateKeywordArguments(kwds))) return -1;
+#endif
+    name = first_kw_arg;
+    while (*name && num_kwargs > extracted) {
+        PyObject * key = **name;
+        PyObject *value;
+        int found = 0;
+        #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+        found = PyDict_GetItemRef(kwds, key, &value);
+        #else
+        value = PyDict_GetItemWithError(kwds, key);
+        if (value) {
+            Py_INCREF(value);
+            found = 1;
+        } else {
+            if (unlikely(PyErr_Occurred())) goto bad;
+        }
+        #endif
+        if (found) {
+            if (unlikely(found < 0)) goto bad;
+            values[name-argnames] = value;
+            extracted++;
+        }
+        name++;
+    }
+    if (num_kwargs > extracted) {
+        if (ignore_unknown_kwargs) {
+            if (unlikely(__Pyx_ValidateDuplicatePosArgs(kwds, argnames, first_kw_arg, function_name) == -1))
+                goto bad;
+        } else {
+            __Pyx_RejectUnknownKeyword(kwds, argnames, first_kw_arg, function_name);
+            goto bad;
+        }
+    }
+    return 0;
+bad:
+    return -1;
+}
+static int __Pyx_ParseKeywordDictToDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject** const *name;
+    PyObject** const *first_kw_arg = argnames + num_pos_args;
+    Py_ssize_t len;
+#if !CYTHON_COMPILING_IN_PYPY || defined(PyArg_ValidateKeywordArguments)
+    if (unlikely(!PyArg_ValidateKeywordArguments(kwds))) return -1;
+#endif
+    if (PyDict_Update(kwds2, kwds) < 0) goto bad;
+    name = first_kw_arg;
+    while (*name) {
+        PyObject *key = **name;
+        PyObject *value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && (PY_VERSION_HEX >= 0x030d00A2 || defined(PyDict_Pop))
+        int found = PyDict_Pop(kwds2, key, &value);
+        if (found) {
+            if (unlikely(found < 0)) goto bad;
+            values[name-argnames] = value;
+        }
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+        int found = PyDict_GetItemRef(kwds2, key, &value);
+        if (found) {
+            if (unlikely(found < 0)) goto bad;
+            values[name-argnames] = value;
+            if (unlikely(PyDict_DelItem(kwds2, key) < 0)) goto bad;
+        }
+#else
+    #if CYTHON_COMPILING_IN_CPYTHON
+        value = _PyDict_Pop(kwds2, key, kwds2);
+    #else
+        value = __Pyx_CallUnboundCMethod2(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_pop, kwds2, key, kwds2);
+    #endif
+        if (value == kwds2) {
+            Py_DECREF(value);
+        } else {
+            if (unlikely(!value)) goto bad;
+            values[name-argnames] = value;
+        }
+#endif
+        name++;
+    }
+    len = PyDict_Size(kwds2);
+    if (len > 0) {
+        return __Pyx_ValidateDuplicatePosArgs(kwds, argnames, first_kw_arg, function_name);
+    } else if (unlikely(len == -1)) {
+        goto bad;
+    }
+    return 0;
+bad:
+    return -1;
+}
+static int __Pyx_ParseKeywordsTuple(
+    PyObject *kwds,
+    PyObject * const *kwvalues,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs)
+{
+    PyObject *key = NULL;
+    PyObject** const * name;
+    PyObject** const *first_kw_arg = argnames + num_pos_args;
+    for (Py_ssize_t pos = 0; pos < num_kwargs; pos++) {
+#if CYTHON_AVOID_BORROWED_REFS
+        key = __Pyx_PySequence_ITEM(kwds, pos);
+#else
+        key = __Pyx_PyTuple_GET_ITEM(kwds, pos);
+#endif
+#if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(!key)) goto bad;
+#endif
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            PyObject *value = kwvalues[pos];
+            values[name-argnames] = __Pyx_NewRef(value);
+        } else {
+            size_t index_found = 0;
+            int cmp = __Pyx_MatchKeywordArg(key, argnames, first_kw_arg, &index_found, function_name);
+            if (cmp == 1) {
+                PyObject *value = kwvalues[pos];
+                values[index_found] = __Pyx_NewRef(value);
+            } else {
+                if (unlikely(cmp == -1)) goto bad;
+                if (kwds2) {
+                    PyObject *value = kwvalues[pos];
+                    if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+                } else if (!ignore_unknown_kwargs) {
+                    goto invalid_keyword;
+                }
+            }
+        }
+        #if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(key);
+        key = NULL;
+        #endif
+    }
+    return 0;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    goto bad;
+bad:
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_XDECREF(key);
+    #endif
+    return -1;
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseKeywords(
+    PyObject *kwds,
+    PyObject * const *kwvalues,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs)
+{
+    if (CYTHON_VECTORCALL && likely(PyTuple_Check(kwds)))
+        return __Pyx_ParseKeywordsTuple(kwds, kwvalues, argnames, kwds2, values, num_pos_args, num_kwargs, function_name, ignore_unknown_kwargs);
+    else if (kwds2)
+        return __Pyx_ParseKeywordDictToDict(kwds, argnames, kwds2, values, num_pos_args, function_name);
+    else
+        return __Pyx_ParseKeywordDict(kwds, argnames, values, num_pos_args, num_kwargs, function_name, ignore_unknown_kwargs);
+}
+
+/* GivenExceptionMatches (used by PyErrExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+}
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
+
+/* PyObjectGetAttrStrNoError (used by GetBuiltinName) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    return result;
+#else
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+#endif
+}
+
+/* GetBuiltinName (used by GetModuleGlobalName) */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_mstate_global->__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+            "name '%U' is not defined", name);
+    }
+    return result;
+}
+
+/* PyDictVersioning (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        if (!PyErr_Occurred())
+            PyErr_SetNone(PyExc_NameError);
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+    if (!__Pyx_IgnoreException(PyExc_Exception)) {
+        return NULL; // BaseException
+    }
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) {
+        if (!__Pyx_IgnoreException(PyExc_Exception)) {
+            return NULL; // BaseException
+        }
+    }
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyObject *exc = PyErr_Occurred();
+    if (unlikely(exc) && !__Pyx_IgnoreGivenException(exc, PyExc_Exception)) {
+        return NULL; // BaseException
+    }
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyObjectFastCallMethod */
+#if !CYTHON_VECTORCALL
+static PyObject *__Pyx_PyObject_FastCallMethod(PyObject *name, PyObject *const *args, size_t nargsf) {
+    PyObject *result;
+    switch (__Pyx_PyVectorcall_NARGS(nargsf)) {
+        case 1:
+            return PyObject_CallMethodObjArgs(args[0], name, NULL);
+        case 2:
+            return PyObject_CallMethodObjArgs(args[0], name, args[1], NULL);
+        case 3:
+            return PyObject_CallMethodObjArgs(args[0], name, args[1], args[2], NULL);
+        case 4:
+            return PyObject_CallMethodObjArgs(args[0], name, args[1], args[2], args[3], NULL);
+        case 5:
+            return PyObject_CallMethodObjArgs(args[0], name, args[1], args[2], args[3], args[4], NULL);
+    }
+    PyObject *attr = PyObject_GetAttr(args[0], name);
+    if (unlikely(!attr))
+        return NULL;
+    result = __Pyx_PyObject_FastCall(attr, args+1, nargsf - 1);
+    Py_DECREF(attr);
+    return result;
+}
+#endif
+
+/* ListAppendAndDecrefInternal (used by ListCompAppendAndDecref) */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+static CYTHON_INLINE void __Pyx__ListComp_AppendAndDecref(PyObject* list, Py_ssize_t len, PyObject* x) {
+    PyList_SET_ITEM(list, len, x);
+    Py_SET_SIZE(list, len + 1);
+}
+#endif
+
+/* ListCompAppendAndDecref */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+static CYTHON_INLINE int __Pyx_ListComp_AppendAndDecref(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        __Pyx__ListComp_AppendAndDecref(list, len, x);
+        return 0;
+    }
+    int result = PyList_Append(list, x);
+    Py_DECREF(x);
+    return result;
+}
+#else
+static CYTHON_INLINE int __Pyx_ListComp_AppendAndDecref(PyObject* list, PyObject* x) {
+    int result = PyList_Append(list, x);
+    Py_DECREF(x);
+    return result;
+}
+#endif
+
+/* ListAppend */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        __Pyx__ListComp_AppendAndDecref(list, len, x);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#endif
+
+/* AllocateExtensionType */
+static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final) {
+    if (is_final || likely(!__Pyx_PyType_HasFeature(t, Py_TPFLAGS_IS_ABSTRACT))) {
+        allocfunc alloc_func = __Pyx_PyType_GetSlot(t, tp_alloc, allocfunc);
+        return alloc_func(t, 0);
+    } else {
+        newfunc tp_new = __Pyx_PyType_TryGetSlot(&PyBaseObject_Type, tp_new, newfunc);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+        if (!tp_new) {
+            PyObject *new_str = PyUnicode_FromString("__new__");
+            if (likely(new_str)) {
+                PyObject *o = PyObject_CallMethodObjArgs((PyObject *)&PyBaseObject_Type, new_str, t, NULL);
+                Py_DECREF(new_str);
+                return o;
+            } else
+                return NULL;
+        } else
+    #endif
+        return tp_new(t, __pyx_mstate_global->__pyx_empty_tuple, 0);
+    }
+}
+
+/* CallSlotAsVectorcallUnpackDict (used by CallSlotAsVectorcall) */
+static CYTHON_INLINE int __Pyx_CallSlotAsVectorcallUnpackDict(Py_ssize_t args_size, PyObject *keys_dict, PyObject **args, PyObject *kwnames) {
+    Py_ssize_t pos = 0, i = 0;
+    PyObject *key, *value;
+    while (PyDict_Next(keys_dict, &pos, &key, &value)) {
+        Py_INCREF(value);
+        args[args_size+i] = value;
+        Py_INCREF(key);
+        if (unlikely(__Pyx_PyTuple_SET_ITEM(kwnames, i, key) == -1)) {
+            return -1;
+        }
+        ++i;
+    }
+    return 0;
+}
+
+/* CallSlotAsVectorcall */
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject * __Pyx_CallTpnewAsVectorcall(__Pyx_tpnewvectorcallfunc f, PyTypeObject* o, PyObject *a, PyObject *k) {
+    Py_ssize_t k_size = k ? __Pyx_PyDict_GET_SIZE(k) : 0;
+#if !CYTHON_ASSUME_SAFE_SIZE
+    if (unlikely(k_size < 0)) return NULL;
+#endif
+    Py_ssize_t a_size = __Pyx_PyTuple_GET_SIZE(a);
+#if !CYTHON_ASSUME_SAFE_SIZE
+    if (unlikely(a_size < 0)) return NULL;
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+    if (k_size == 0) {
+        return f(o, &PyTuple_GET_ITEM(a, 0), a_size, NULL);
+    }
+#else
+    if (k_size == 0 && a_size == 0) {
+        return f(o, NULL, 0, NULL);
+    }
+#endif
+    PyObject *stack_args[5];
+    PyObject **args = stack_args;
+    Py_ssize_t maxnargs = PY_SSIZE_T_MAX / sizeof(PyObject*) - 1;
+    if (a_size > maxnargs - k_size) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    Py_ssize_t total_size = a_size + k_size;
+    if (total_size > 5) {
+        args = (PyObject**)PyMem_Malloc(((size_t)total_size)*sizeof(PyObject*));
+        if (unlikely(!args)) {
+            PyErr_NoMemory();
+            return NULL;
+        }
+    }
+    PyObject * result = NULL;
+    PyObject *kwnames = NULL;
+    int unpack_dict_result;
+    Py_ssize_t i = 0;
+    for (; i < a_size; ++i) {
+        args[i] = __Pyx_PyTuple_GET_ITEM(a, i);
+#if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(!args[i])) goto cleanup;
+#endif
+    }
+#if !CYTHON_ASSUME_SAFE_MACROS
+    if (k)  // There's a specific shortcut earlier for ASSUME_SAFE_MACROS with no keywords
+#endif
+    {
+        kwnames = PyTuple_New(k_size);
+        if (unlikely(!kwnames)) goto cleanup;
+        __Pyx_BEGIN_CRITICAL_SECTION(k);
+        unpack_dict_result = __Pyx_CallSlotAsVectorcallUnpackDict(a_size, k, args, kwnames);
+        __Pyx_END_CRITICAL_SECTION();
+        if (unlikely(unpack_dict_result == -1)) goto cleanup;
+    }
+    result = f(o, args, a_size, kwnames);
+  cleanup:
+    Py_XDECREF(kwnames);
+    for (i=a_size; i<total_size; ++i) {
+        Py_XDECREF(args[i]);
+    }
+    if (args != stack_args) {
+        PyMem_Free(args);
+    }
+    return result;
+}
+#endif
+
+/* FormatTypeName (used by RaiseErrorWithObjectType) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static __Pyx_TypeName
+__Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
+{
+    PyObject *module = NULL, *name = NULL, *result = NULL;
+    #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+    name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_qualname);
+    #else
+    name = PyType_GetQualName(tp);
+    #endif
+    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) goto bad;
+    module = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_module);
+    if (unlikely(module == NULL) || unlikely(!PyUnicode_Check(module))) goto bad;
+    if (PyUnicode_CompareWithASCIIString(module, "builtins") == 0) {
+        result = name;
+        name = NULL;
+        goto done;
+    }
+    result = PyUnicode_FromFormat("%U.%U", module, name);
+    if (unlikely(result == NULL)) goto bad;
+  done:
+    Py_XDECREF(name);
+    Py_XDECREF(module);
+    return result;
+  bad:
+    PyErr_Clear();
+    if (name) {
+        result = name;
+        name = NULL;
+    } else {
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u_);
+    }
+    goto done;
+}
+#endif
+
+/* RaiseErrorWithObjectType (used by CallNewInitFromVectorcall) */
+static void __Pyx_RaiseErrorWithType(PyObject* exc_type, const char* message, PyTypeObject *type_obj) {
+    __Pyx_TypeName type_name = __Pyx_PyType_GetFullyQualifiedName(type_obj);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name)) return;
+    #endif
+    PyErr_Format(exc_type, message, type_name);
+    __Pyx_DECREF_TypeName(type_name);
+}
+
+/* CallNewInitFromVectorcall */
+#if CYTHON_VECTORCALL_TPNEW
+static PyObject *__Pyx_CallNewInitFromVectorcall(PyTypeObject *t, PyObject *const *args, size_t nargsf, PyObject *kwnames) {
+    newfunc tp_new = __Pyx_PyType_GetSlot(t, tp_new, newfunc);
+    if (unlikely(!tp_new)) {
+        __Pyx_RaiseErrorWithType(PyExc_TypeError, "cannot create " __Pyx_FMT_TYPENAME " instances", t);
+        return NULL;
+    }
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(nargsf);
+    PyObject *result = NULL, *args_tuple = NULL, *kwds_dict = NULL;
+    Py_ssize_t kw_size = kwnames ? __Pyx_PyTuple_GET_SIZE(kwnames) : 0;
+#if !CYTHON_ASSUME_SAFE_SIZE
+    if (unlikely(kw_size == -1)) {
+        return NULL;
+    }
+#endif
+    if (kw_size) {
+        kwds_dict = __Pyx_PyDict_NewPresized(kw_size);
+        if (unlikely(!kwds_dict)) {
+            return NULL;
+        }
+        for (Py_ssize_t i=0; i<kw_size; ++i) {
+            PyObject *v = args[nargs + i];
+            PyObject *k = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+#if !CYTHON_ASSUME_SAFE_MACROS
+            if (unlikely(!k)) {
+                goto end;
+            }
+#endif
+            if (unlikely(PyDict_SetItem(kwds_dict, k, v) < 0)) {
+                goto end;
+            }
+        }
+    }
+    if (nargs) {
+        args_tuple = __Pyx_PyTuple_FromArray(args, nargs);
+        if (unlikely(!args_tuple)) {
+            goto end;
+        }
+    } else {
+        args_tuple = __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_tuple);
+    }
+    result = tp_new(t, args_tuple, kwds_dict);
+    if (unlikely(!result)) {
+        goto end;
+    }
+    if (PyObject_TypeCheck(result, t)) {
+        initproc tp_init = __Pyx_PyObject_GetSlot(result, tp_init, initproc);
+        if (tp_init && unlikely(tp_init(result, args_tuple, kwds_dict) < 0)) {
+            Py_CLEAR(result);
+        }
+    }
+  end:
+    Py_XDECREF(args_tuple);
+    Py_XDECREF(kwds_dict);
+    return result;
+}
+#endif
+
+/* CallTypeTraverse */
+#if !CYTHON_USE_TYPE_SPECS
+#else
+static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg) {
+    if (!always_call) {
+        PyTypeObject *base = __Pyx_PyObject_GetSlot(o, tp_base, PyTypeObject*);
+        unsigned long flags = PyType_GetFlags(base);
+        if (flags & Py_TPFLAGS_HEAPTYPE) {
+            return 0;
+        }
+    }
+    Py_VISIT((PyObject*)Py_TYPE(o));
+    return 0;
+}
+#endif
+
+/* FunctionExport */
+static int __Pyx_ExportFunction(PyObject *api_dict, const char *name, void (*f)(void), const char *sig) {
+    PyObject *cobj;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    tmp.fp = f;
+    cobj = PyCapsule_New(tmp.p, sig, 0);
+    if (!cobj)
+        goto bad;
+    if (PyDict_SetItemString(api_dict, name, cobj) < 0)
+        goto bad;
+    Py_DECREF(cobj);
+    return 0;
+bad:
+    Py_XDECREF(cobj);
+    return -1;
+}
+
+/* GetApiDict */
+static PyObject *__Pyx_ApiExport_GetApiDict(void) {
+    PyObject *d;
+    if (__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_pyx_capi, &d) == -1)
+        return NULL;
+    if (!d) {
+        d = PyDict_New();
+        if (!d)
+            goto bad;
+        if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_pyx_capi, d) < 0)
+            goto bad;
+    }
+    return d;
+bad:
+    Py_XDECREF(d);
+    return NULL;
+}
+
+/* PyObjectCallMethod0 (used by PyType_Ready) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+#if CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || !CYTHON_COMPILING_IN_LIMITED_API)
+    return PyObject_VectorcallMethod(method_name, &obj, 1 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_CallMethodObjArgs(obj, method_name, NULL);
+#else
+    return PyObject_CallMethodNoArgs(obj, method_name);
+#endif
+}
+
+/* GetTypeDictOffset (used by ValidateBasesTuple) */
+#if !CYTHON_USE_TYPE_SLOTS
+CYTHON_UNUSED static Py_ssize_t __Pyx_GetTypeDictOffset(PyObject *tp, int require_cython_valid_result) {
+    PyObject *tp_dictoffset_o;
+    Py_ssize_t tp_dictoffset;
+    tp_dictoffset_o = PyObject_GetAttrString(tp, "__dictoffset__");
+    if (unlikely(!tp_dictoffset_o)) return -1;
+    tp_dictoffset = PyLong_AsSsize_t(tp_dictoffset_o);
+    Py_DECREF(tp_dictoffset_o);
+    if (unlikely(require_cython_valid_result && tp_dictoffset == 0)) {
+        PyErr_SetString(
+            PyExc_TypeError,
+            "'type' doesn't have a dictoffset");
+        return -1;
+    } else if (unlikely(require_cython_valid_result && tp_dictoffset < 0)) {
+        PyErr_SetString(
+            PyExc_TypeError,
+            "'type' has an unexpected negative dictoffset. "
+            "Please report this as Cython bug");
+        return -1;
+    }
+    return tp_dictoffset;
+}
+#endif
+
+/* RaiseErrorWithObjectType1 (used by ValidateBasesTuple) */
+static void __Pyx_RaiseErrorWithType1(PyObject* exc_type, const char* message, const char *arg, PyTypeObject *type_obj) {
+    __Pyx_TypeName type_name = __Pyx_PyType_GetFullyQualifiedName(type_obj);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name)) return;
+    #endif
+    PyErr_Format(exc_type, message, arg, type_name);
+    __Pyx_DECREF_TypeName(type_name);
+}
+
+/* ValidateBasesTuple (used by PyType_Ready) */
+#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
+static int __Pyx_validate_bases_tuple(const char *type_name, int has_dictoffset, PyObject *bases) {
+    Py_ssize_t i, n;
+#if CYTHON_ASSUME_SAFE_SIZE
+    n = PyTuple_GET_SIZE(bases);
+#else
+    n = PyTuple_Size(bases);
+    if (unlikely(n < 0)) return -1;
+#endif
+    if (!has_dictoffset) {
+        PyObject *b;
+#if CYTHON_AVOID_BORROWED_REFS
+        b = PySequence_GetItem(bases, 0);
+        if (!b) return -1;
+#elif CYTHON_ASSUME_SAFE_MACROS
+        b = PyTuple_GET_ITEM(bases, 0);
+#else
+        b = PyTuple_GetItem(bases, 0);
+        if (!b) return -1;
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+        has_dictoffset = ((PyTypeObject*)b)->tp_dictoffset != 0;
+#else
+        Py_ssize_t dictoffset = __Pyx_GetTypeDictOffset(b, 0);
+        has_dictoffset = dictoffset != 0;
+#endif
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(b);
+#endif
+#if !CYTHON_USE_TYPE_SLOTS
+        if (dictoffset == -1 && PyErr_Occurred()) return -1;
+#endif
+    }
+    for (i = 1; i < n; i++)
+    {
+        PyTypeObject *b;
+#if CYTHON_AVOID_BORROWED_REFS
+        PyObject *b0 = PySequence_GetItem(bases, i);
+        if (!b0) return -1;
+#elif CYTHON_ASSUME_SAFE_MACROS
+        PyObject *b0 = PyTuple_GET_ITEM(bases, i);
+#else
+        PyObject *b0 = PyTuple_GetItem(bases, i);
+        if (!b0) return -1;
+#endif
+        b = (PyTypeObject*) b0;
+        if (!__Pyx_PyType_HasFeature(b, Py_TPFLAGS_HEAPTYPE))
+        {
+            __Pyx_RaiseErrorWithType(
+                PyExc_TypeError, "base class '" __Pyx_FMT_TYPENAME "' is not a heap type", b);
+#if CYTHON_AVOID_BORROWED_REFS
+            Py_DECREF(b0);
+#endif
+            return -1;
+        }
+        if (!has_dictoffset)
+        {
+            Py_ssize_t b_dictoffset = 0;
+#if CYTHON_USE_TYPE_SLOTS
+            b_dictoffset = b->tp_dictoffset;
+#else
+            b_dictoffset = __Pyx_GetTypeDictOffset((PyObject*)b, 0);
+            if (b_dictoffset == -1 && PyErr_Occurred()) goto dictoffset_return;
+#endif
+            if (b_dictoffset) {
+                __Pyx_RaiseErrorWithType1(
+                    PyExc_TypeError,
+                    "extension type '%.200s' has no __dict__ slot, "
+                    "but base type '" __Pyx_FMT_TYPENAME "' has: "
+                    "either add 'cdef dict __dict__' to the extension type "
+                    "or add '__slots__ = [...]' to the base type",
+                    type_name, b);
+#if !CYTHON_USE_TYPE_SLOTS
+              dictoffset_return:
+#endif
+#if CYTHON_AVOID_BORROWED_REFS
+                Py_DECREF(b0);
+#endif
+                return -1;
+            }
+        }
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(b0);
+#endif
+    }
+    return 0;
+}
+#endif
+
+/* PyType_Ready */
+CYTHON_UNUSED static int __Pyx_PyType_HasMultipleInheritance(PyTypeObject *t) {
+    while (t) {
+        PyObject *bases = __Pyx_PyType_GetSlot(t, tp_bases, PyObject*);
+        if (bases) {
+            return 1;
+        }
+        t = __Pyx_PyType_GetSlot(t, tp_base, PyTypeObject*);
+    }
+    return 0;
+}
+static int __Pyx_PyType_Ready(PyTypeObject *t) {
+#if CYTHON_USE_TYPE_SPECS || !CYTHON_COMPILING_IN_CPYTHON
+    (void)__Pyx_PyObject_CallMethod0;
+#if CYTHON_USE_TYPE_SPECS
+    (void)__Pyx_validate_bases_tuple;
+#endif
+    return PyType_Ready(t);
+#else
+    int r;
+    if (!__Pyx_PyType_HasMultipleInheritance(t)) {
+        return PyType_Ready(t);
+    }
+    PyObject *bases = __Pyx_PyType_GetSlot(t, tp_bases, PyObject*);
+    if (bases && unlikely(__Pyx_validate_bases_tuple(t->tp_name, t->tp_dictoffset != 0, bases) == -1))
+        return -1;
+    {
+        int gc_was_enabled;
+    #if PY_VERSION_HEX >= 0x030A00b1
+        gc_was_enabled = PyGC_Disable();
+        (void)__Pyx_PyObject_CallMethod0;
+    #else
+        PyObject *ret, *py_status;
+        PyObject *gc = NULL;
+        #if (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM+0 >= 0x07030400) &&\
+                !CYTHON_COMPILING_IN_GRAAL
+        gc = PyImport_GetModule(__pyx_mstate_global->__pyx_kp_u_gc);
+        #endif
+        if (unlikely(!gc)) gc = PyImport_Import(__pyx_mstate_global->__pyx_kp_u_gc);
+        if (unlikely(!gc)) return -1;
+        py_status = __Pyx_PyObject_CallMethod0(gc, __pyx_mstate_global->__pyx_kp_u_isenabled);
+        if (unlikely(!py_status)) {
+            Py_DECREF(gc);
+            return -1;
+        }
+        gc_was_enabled = __Pyx_PyObject_IsTrue(py_status);
+        Py_DECREF(py_status);
+        if (gc_was_enabled > 0) {
+            ret = __Pyx_PyObject_CallMethod0(gc, __pyx_mstate_global->__pyx_kp_u_disable);
+            if (unlikely(!ret)) {
+                Py_DECREF(gc);
+                return -1;
+            }
+            Py_DECREF(ret);
+        } else if (unlikely(gc_was_enabled == -1)) {
+            Py_DECREF(gc);
+            return -1;
+        }
+    #endif
+        t->tp_flags |= Py_TPFLAGS_HEAPTYPE;
+#if PY_VERSION_HEX >= 0x030A0000
+        t->tp_flags |= Py_TPFLAGS_IMMUTABLETYPE;
+#endif
+        r = PyType_Ready(t);
+        t->tp_flags &= ~Py_TPFLAGS_HEAPTYPE;
+    #if PY_VERSION_HEX >= 0x030A00b1
+        if (gc_was_enabled)
+            PyGC_Enable();
+    #else
+        if (gc_was_enabled) {
+            PyObject *tp, *v, *tb;
+            PyErr_Fetch(&tp, &v, &tb);
+            ret = __Pyx_PyObject_CallMethod0(gc, __pyx_mstate_global->__pyx_kp_u_enable);
+            if (likely(ret || r == -1)) {
+                Py_XDECREF(ret);
+                PyErr_Restore(tp, v, tb);
+            } else {
+                Py_XDECREF(tp);
+                Py_XDECREF(v);
+                Py_XDECREF(tb);
+                r = -1;
+            }
+        }
+        Py_DECREF(gc);
+    #endif
+    }
+    return r;
+#endif
+}
+
+/* GetVTable (used by MergeVTables) */
+static int __Pyx_GetVtable(PyTypeObject *type, void** table) {
+    void* ptr;
+    *table = NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
+#else
+    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
+#endif
+    if (!ob)
+        goto no_attr;
+    ptr = PyCapsule_GetPointer(ob, 0);
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    *table = ptr;
+    return 1;
+no_attr:
+    if (PyErr_ExceptionMatches(CYTHON_COMPILING_IN_LIMITED_API ? PyExc_AttributeError : PyExc_KeyError)) {
+        return 0;
+    }
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* RaiseErrorWithObjectTypes (used by MergeVTables) */
+static void __Pyx_RaiseErrorWithTypes1(PyObject* exc_type, const char *message, const char *arg, PyTypeObject *type_obj1, PyTypeObject *type_obj2) {
+    __Pyx_TypeName type_name1 = __Pyx_PyType_GetFullyQualifiedName(type_obj1);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name1)) return;
+    #endif
+    __Pyx_TypeName type_name2 = __Pyx_PyType_GetFullyQualifiedName(type_obj2);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name2)) goto type2_failed;
+    #endif
+    PyErr_Format(exc_type, message, arg, type_name1, type_name2);
+    __Pyx_DECREF_TypeName(type_name2);
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+type2_failed:
+#endif
+    __Pyx_DECREF_TypeName(type_name1);
+}
+
+/* MergeVTables (used by SetVTable) */
+static int __Pyx_MergeVtables(PyTypeObject *type) {
+    int i=0;
+    Py_ssize_t size;
+    void** base_vtables;
+    void* unknown = (void*)-1;
+    PyObject* bases = __Pyx_PyType_GetSlot(type, tp_bases, PyObject*);
+    int base_depth = 0;
+    {
+        PyTypeObject* base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+        while (base) {
+            base_depth += 1;
+            base = __Pyx_PyType_TryGetSlot(base, tp_base, PyTypeObject*);
+        }
+    }
+    base_vtables = (void**) PyMem_Malloc(sizeof(void*) * (size_t)(base_depth + 1));
+    if (unlikely(!base_vtables)) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    base_vtables[0] = unknown;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    size = PyTuple_Size(bases);
+    if (size < 0) goto other_failure;
+#else
+    size = PyTuple_GET_SIZE(bases);
+#endif
+    for (i = 1; i < size; i++) {
+        PyObject *basei;
+        void* base_vtable;
+#if CYTHON_AVOID_BORROWED_REFS
+        basei = PySequence_GetItem(bases, i);
+        if (unlikely(!basei)) goto other_failure;
+#elif !CYTHON_ASSUME_SAFE_MACROS
+        basei = PyTuple_GetItem(bases, i);
+        if (unlikely(!basei)) goto other_failure;
+#else
+        basei = PyTuple_GET_ITEM(bases, i);
+#endif
+        int get_vtable_result = __Pyx_GetVtable((PyTypeObject*)basei, &base_vtable);
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(basei);
+#endif
+        if (get_vtable_result != 1) {
+            if (get_vtable_result == -1) {
+                goto other_failure;
+            }
+            PyErr_Clear(); // Class doesn't have a vtable.
+        } else {
+            assert(base_vtable != NULL);
+            int j;
+            PyTypeObject* base = __Pyx_PyType_TryGetSlot(type, tp_base, PyTypeObject*);
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+            if (!base) goto bad;
+#endif
+            for (j = 0; j < base_depth; j++) {
+                if (base_vtables[j] == unknown) {
+                    switch (__Pyx_GetVtable(base, &base_vtables[j])) {
+                        case 1:
+                            assert(base_vtables[j] == NULL);
+                            break;
+                        case 0:
+                            goto bad;
+                        case -1:
+                        default:
+                            goto other_failure;
+                    }
+                    base_vtables[j + 1] = unknown;
+                }
+                if (base_vtables[j] == base_vtable) {
+                    break;
+                }
+                base = __Pyx_PyType_TryGetSlot(base, tp_base, PyTypeObject*);
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+                if (!base) goto bad;
+#endif
+            }
+        }
+    }
+    PyMem_Free(base_vtables);
+    return 0;
+bad:
+    {
+        PyTypeObject* tp_base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+        PyTypeObject* basei;
+#if CYTHON_AVOID_BORROWED_REFS
+        basei = (PyTypeObject*)PySequence_GetItem(bases, i);
+        if (unlikely(!basei)) goto other_failure;
+#elif !CYTHON_ASSUME_SAFE_MACROS
+        basei = (PyTypeObject*)PyTuple_GetItem(bases, i);
+        if (unlikely(!basei)) goto other_failure;
+#else
+        basei = (PyTypeObject*)PyTuple_GET_ITEM(bases, i);
+#endif
+    __Pyx_RaiseTypeErrorWithTypes(
+        "multiple bases have vtable conflict: '" __Pyx_FMT_TYPENAME "' and '" __Pyx_FMT_TYPENAME "'", tp_base, basei);
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(basei);
+#endif
+    }
+other_failure:
+    PyMem_Free(base_vtables);
+    return -1;
+}
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyTypeObject *type, void *vtable) {
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+    if (unlikely(!ob))
+        goto bad;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(PyObject_SetAttr((PyObject *) type, __pyx_mstate_global->__pyx_n_u_pyx_vtable, ob) < 0))
+#else
+    if (unlikely(PyDict_SetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable, ob) < 0))
+#endif
+        goto bad;
+    Py_DECREF(ob);
+    return __Pyx_MergeVtables(type);
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* LimitedApiGetTypeTypeDict (used by DelItemOnTypeDict) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_GetTypeTypeDict(PyTypeObject *tp) {
+    static Py_ssize_t tp_dictoffset = 0;
+    if (unlikely(tp_dictoffset == 0)) {
+        tp_dictoffset = __Pyx_GetTypeDictOffset((PyObject*)(&PyType_Type), 1);
+        if (unlikely(tp_dictoffset == -1 && PyErr_Occurred())) {
+            tp_dictoffset = 0; // try again next time?
+            return NULL;
+        }
+    }
+    return *(PyObject**)((char*)tp + tp_dictoffset);
+}
+#endif
+
+/* DelItemOnTypeDict (used by SetupReduce) */
+static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k) {
+    int result;
+    PyObject *tp_dict;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    tp_dict = __Pyx_GetTypeTypeDict(tp);
+    if (unlikely(!tp_dict)) return -1;
+#else
+    tp_dict = tp->tp_dict;
+#endif
+    result = PyDict_DelItem(tp_dict, k);
+    if (likely(!result)) PyType_Modified(tp);
+    return result;
+}
+
+/* SetItemOnTypeDict (used by SetupReduce) */
+static int __Pyx__SetItemOnTypeDict(PyTypeObject *tp, PyObject *k, PyObject *v) {
+    int result;
+    PyObject *tp_dict;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    tp_dict = __Pyx_GetTypeTypeDict(tp);
+    if (unlikely(!tp_dict)) return -1;
+#else
+    tp_dict = tp->tp_dict;
+#endif
+    result = PyDict_SetItem(tp_dict, k, v);
+    if (likely(!result)) {
+        PyType_Modified(tp);
+        if (unlikely(PyObject_HasAttr(v, __pyx_mstate_global->__pyx_n_u_set_name))) {
+            PyObject *setNameResult = PyObject_CallMethodObjArgs(v, __pyx_mstate_global->__pyx_n_u_set_name,  (PyObject *) tp, k, NULL);
+            if (!setNameResult) return -1;
+            Py_DECREF(setNameResult);
+        }
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStrNoError(meth, __pyx_mstate_global->__pyx_n_u_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0) && __Pyx_IgnoreException(PyExc_Exception)) {
+      ret = 0;  // But BaseException is still propagated.
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static PyObject *__Pyx_setup_reduce_get_reduce_attribute(PyObject *type_obj, PyObject *name, int allow_not_present) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+    CYTHON_UNUSED_VAR(allow_not_present);
+    return _PyType_Lookup((PyTypeObject*)type_obj, name);
+#else
+    if (allow_not_present) {
+        return __Pyx_PyObject_GetAttrStrNoError(type_obj, name);
+    } else {
+        return __Pyx_PyObject_GetAttrStr(type_obj, name);
+    }
+#endif
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+    getstate = __Pyx_setup_reduce_get_reduce_attribute(type_obj, __pyx_mstate_global->__pyx_n_u_getstate, 1);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+    if (getstate) {
+        object_getstate = __Pyx_setup_reduce_get_reduce_attribute((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_getstate, 1);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+    object_reduce_ex = __Pyx_setup_reduce_get_reduce_attribute((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce_ex, 0);
+    if (unlikely(!object_reduce_ex)) goto __PYX_BAD;
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_mstate_global->__pyx_n_u_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+        object_reduce = __Pyx_setup_reduce_get_reduce_attribute((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce, 0);
+        if (!object_reduce) goto __PYX_BAD;
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_mstate_global->__pyx_n_u_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        int try_to_replace_reduce = (reduce == object_reduce);
+        if (!try_to_replace_reduce) {
+            try_to_replace_reduce = __Pyx_setup_reduce_is_named(reduce, __pyx_mstate_global->__pyx_n_u_reduce_cython);
+            if (unlikely(try_to_replace_reduce < 0)) {
+                goto __PYX_BAD;
+            }
+        }
+        if (try_to_replace_reduce) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = __Pyx_SetItemOnTypeDict((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = __Pyx_DelItemOnTypeDict((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_setstate);
+            int try_to_replace_setstate;
+            if (!setstate) {
+                PyObject *exc = PyErr_Occurred();
+                if (exc && !__Pyx_IgnoreGivenException(exc, PyExc_Exception)) {
+                    goto __PYX_BAD;
+                }
+                try_to_replace_setstate = 1;
+            } else {
+                try_to_replace_setstate = __Pyx_setup_reduce_is_named(setstate, __pyx_mstate_global->__pyx_n_u_setstate_cython);
+                if (unlikely(try_to_replace_setstate < 0)) {
+                    goto __PYX_BAD;
+                }
+            }
+            if (try_to_replace_setstate) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = __Pyx_SetItemOnTypeDict((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = __Pyx_DelItemOnTypeDict((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred()) {
+        __Pyx_RaiseErrorWithType(
+            PyExc_RuntimeError,
+            "Unable to initialize pickling for " __Pyx_FMT_TYPENAME,
+            (PyTypeObject*)type_obj);
+    }
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_3_3_0
+#define __PYX_HAVE_RT_ImportType_3_3_0
+static PyTypeObject *__Pyx_ImportType_3_3_0(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_3_0 check_size)
+{
+    PyObject *result = 0;
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#if defined(Py_LIMITED_API) || (defined(CYTHON_COMPILING_IN_LIMITED_API) && CYTHON_COMPILING_IN_LIMITED_API)
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#if !( defined(Py_LIMITED_API) || (defined(CYTHON_COMPILING_IN_LIMITED_API) && CYTHON_COMPILING_IN_LIMITED_API) )
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    if (size == 0) {
+        return (PyTypeObject *)result;
+    }
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize+itemsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_3_3_0 &&
+            ((size_t)basicsize > size || (size_t)(basicsize + itemsize) < size)) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd-%zd from PyObject",
+            module_name, class_name, size, basicsize, basicsize+itemsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_3_3_0 && (size_t)basicsize > size) {
+        if (PyErr_WarnFormat(NULL, 0,
+                "%.200s.%.200s size changed, may indicate binary incompatibility. "
+                "Expected %zd from C header, got %zd from PyObject",
+                module_name, class_name, size, basicsize) < 0) {
+            goto bad;
+        }
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* HasAttr (used by ImportImpl) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!PyUnicode_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_PyObject_GetAttrStrNoError(o, n);
+    if (!r) {
+        return (unlikely(PyErr_Occurred())) ? -1 : 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+#endif
+
+/* TupleOrListFromArrayImpl (used by ListFromArray) */
+CYTHON_UNUSED static PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n) {
+    PyObject *res = PyList_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    __Pyx_copy_object_array(src, ((PyListObject*)res)->ob_item, n);
+    #else
+    Py_ssize_t i;
+    for (i = 0; i < n; i++) {
+        Py_INCREF(src[i]);
+        if (unlikely(__Pyx_PyList_SET_ITEM(res, i, src[i]) < (0))) {
+            Py_DECREF(res);
+            return NULL;
+        }
+    }
+    #endif
+    return res;
+}
+
+/* ImportImpl (used by Import) */
+static int __Pyx__Import_GetModule(PyObject *qualname, PyObject **module) {
+    PyObject *imported_module = PyImport_GetModule(qualname);
+    if (unlikely(!imported_module)) {
+        *module = NULL;
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+        return 0;
+    }
+    *module = imported_module;
+    return 1;
+}
+static int __Pyx__Import_Lookup(PyObject *qualname, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject **module) {
+    PyObject *imported_module;
+    PyObject *top_level_package_name;
+    Py_ssize_t i;
+    int status, module_found;
+    Py_ssize_t dot_index;
+    module_found = __Pyx__Import_GetModule(qualname, &imported_module);
+    if (unlikely(!module_found || module_found == -1)) {
+        *module = NULL;
+        return module_found;
+    }
+    if (imported_names) {
+        for (i = 0; i < len_imported_names; i++) {
+            PyObject *imported_name = imported_names[i];
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+            int has_imported_attribute = PyObject_HasAttr(imported_module, imported_name);
+#else
+            int has_imported_attribute = PyObject_HasAttrWithError(imported_module, imported_name);
+            if (unlikely(has_imported_attribute == -1)) goto error;
+#endif
+            if (!has_imported_attribute) {
+                goto not_found;
+            }
+        }
+        *module = imported_module;
+        return 1;
+    }
+    dot_index = PyUnicode_FindChar(qualname, '.', 0, PY_SSIZE_T_MAX, 1);
+    if (dot_index == -1) {
+        *module = imported_module;
+        return 1;
+    }
+    if (unlikely(dot_index == -2)) goto error;
+    top_level_package_name = PyUnicode_Substring(qualname, 0, dot_index);
+    if (unlikely(!top_level_package_name)) goto error;
+    Py_DECREF(imported_module);
+    status = __Pyx__Import_GetModule(top_level_package_name, module);
+    Py_DECREF(top_level_package_name);
+    return status;
+error:
+    Py_DECREF(imported_module);
+    *module = NULL;
+    return -1;
+not_found:
+    Py_DECREF(imported_module);
+    *module = NULL;
+    return 0;
+}
+static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level) {
+    PyObject *module = 0;
+    PyObject *empty_dict = 0;
+    PyObject *from_list = 0;
+    int module_found;
+    if (!qualname) {
+        qualname = name;
+    }
+    module_found = __Pyx__Import_Lookup(qualname, imported_names, len_imported_names, &module);
+    if (likely(module_found == 1)) {
+        return module;
+    } else if (unlikely(module_found == -1)) {
+        return NULL;
+    }
+    #if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030f00a6
+    empty_dict = PyFrozenDict_New(NULL);
+    #else
+    empty_dict = PyDict_New();
+    #endif
+    if (unlikely(!empty_dict))
+        goto bad;
+    if (imported_names) {
+        from_list = __Pyx_PyList_FromArray(imported_names, len_imported_names);
+        if (unlikely(!from_list))
+            goto bad;
+    }
+    if (level == -1) {
+        const char* package_sep = strchr(__Pyx_MODULE_NAME, '.');
+        if (package_sep != (0)) {
+            module = PyImport_ImportModuleLevelObject(
+                name, moddict, empty_dict, from_list, 1);
+            if (unlikely(!module)) {
+                if (unlikely(!PyErr_ExceptionMatches(PyExc_ImportError)))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        level = 0;
+    }
+    if (!module) {
+        module = PyImport_ImportModuleLevelObject(
+            name, moddict, empty_dict, from_list, level);
+    }
+bad:
+    Py_XDECREF(from_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level) {
+    return __Pyx__Import(name, imported_names, len_imported_names, qualname, __pyx_mstate_global->__pyx_d, level);
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        const char* module_name_str = 0;
+        PyObject* module_name = 0;
+        PyObject* module_dot = 0;
+        PyObject* full_name = 0;
+        PyErr_Clear();
+        module_name_str = PyModule_GetName(module);
+        if (unlikely(!module_name_str)) { goto modbad; }
+        module_name = PyUnicode_FromString(module_name_str);
+        if (unlikely(!module_name)) { goto modbad; }
+        module_dot = PyUnicode_Concat(module_name, __pyx_mstate_global->__pyx_kp_u__2);
+        if (unlikely(!module_dot)) { goto modbad; }
+        full_name = PyUnicode_Concat(module_dot, name);
+        if (unlikely(!full_name)) { goto modbad; }
+        #if (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400) ||\
+                CYTHON_COMPILING_IN_GRAAL
+        {
+            PyObject *modules = PyImport_GetModuleDict();
+            if (unlikely(!modules))
+                goto modbad;
+            value = PyObject_GetItem(modules, full_name);
+        }
+        #else
+        value = PyImport_GetModule(full_name);
+        #endif
+      modbad:
+        Py_XDECREF(full_name);
+        Py_XDECREF(module_dot);
+        Py_XDECREF(module_name);
+    }
+    if (unlikely(!value)) {
+        PyErr_Format(PyExc_ImportError, "cannot import name %S", name);
+    }
+    return value;
+}
+
+/* dict_setdefault (used by FetchCommonType) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value) {
+    PyObject* value;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030F0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4)
+    PyDict_SetDefaultRef(d, key, default_value, &value);
+#elif CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    PyObject *args[] = {d, key, default_value};
+    value = PyObject_VectorcallMethod(__pyx_mstate_global->__pyx_n_u_setdefault, args, 3 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    value = PyObject_CallMethodObjArgs(d, __pyx_mstate_global->__pyx_n_u_setdefault, key, default_value, NULL);
+#else
+    value = PyDict_SetDefault(d, key, default_value);
+    if (unlikely(!value)) return NULL;
+    Py_INCREF(value);
+#endif
+    return value;
+}
+
+/* AddModuleRef (used by FetchSharedCythonModule) */
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX < 0x030F00a3
+  static PyObject *__Pyx_PyImport_AddModuleObjectRef(PyObject *name) {
+      PyObject *module_dict = PyImport_GetModuleDict();
+      PyObject *m;
+      if (PyMapping_GetOptionalItem(module_dict, name, &m) < 0) {
+          return NULL;
+      }
+      if (m != NULL && PyModule_Check(m)) {
+          return m;
+      }
+      Py_XDECREF(m);
+      m = PyModule_NewObject(name);
+      if (m == NULL)
+          return NULL;
+      if (PyDict_CheckExact(module_dict)) {
+          PyObject *new_m;
+          (void)PyDict_SetDefaultRef(module_dict, name, m, &new_m);
+          Py_DECREF(m);
+          return new_m;
+      } else {
+           if (PyObject_SetItem(module_dict, name, m) != 0) {
+                Py_DECREF(m);
+                return NULL;
+            }
+            return m;
+      }
+  }
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      if ((PY_VERSION_HEX >= 0x030E0000) &&  Py_Version >= 0x030E0100) {
+          return PyImport_AddModuleRef(name);
+      }
+      PyObject *py_name = PyUnicode_FromString(name);
+      if (!py_name) return NULL;
+      PyObject *module = __Pyx_PyImport_AddModuleObjectRef(py_name);
+      Py_DECREF(py_name);
+      return module;
+  }
+#elif __PYX_LIMITED_VERSION_HEX < 0x030d0000
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      PyObject *module = PyImport_AddModule(name);
+      Py_XINCREF(module);
+      return module;
+  }
+#endif
+
+/* FetchSharedCythonModule (used by FetchCommonType) */
+static PyObject *__Pyx_FetchSharedCythonABIModule(void) {
+    return __Pyx_PyImport_AddModuleRef(__PYX_ABI_MODULE_NAME);
+}
+
+/* VerifyCachedType (used by FetchCommonType) */
+static int __Pyx_VerifyCachedType(PyObject *cached_type,
+                               const char *name,
+                               Py_ssize_t expected_basicsize) {
+    Py_ssize_t basicsize;
+    if (!PyType_Check(cached_type)) {
+        PyErr_Format(PyExc_TypeError,
+            "Shared Cython type %.200s is not a type object", name);
+        return -1;
+    }
+    if (expected_basicsize == 0) {
+        return 0; // size is inherited, nothing useful to check
+    }
+#if CYTHON_COMPILING_IN_LIMITED_API && CYTHON_OPAQUE_OBJECTS
+    if (expected_basicsize < 0) {
+        basicsize = PyType_GetTypeDataSize((PyTypeObject*)cached_type);
+    } else
+#endif
+    {
+    #if CYTHON_COMPILING_IN_LIMITED_API
+        PyObject *py_basicsize;
+        py_basicsize = PyObject_GetAttrString(cached_type, "__basicsize__");
+        if (unlikely(!py_basicsize)) return -1;
+        basicsize = PyLong_AsSsize_t(py_basicsize);
+        Py_DECREF(py_basicsize);
+        py_basicsize = NULL;
+        if (unlikely(basicsize == (Py_ssize_t)-1) && PyErr_Occurred()) return -1;
+    #else
+        basicsize = ((PyTypeObject*) cached_type)->tp_basicsize;
+    #endif
+    }
+    if ((expected_basicsize >= 0) ?
+            (basicsize != expected_basicsize) :
+            (basicsize < -expected_basicsize)) {
+        PyErr_Format(PyExc_TypeError,
+            "Shared Cython type %.200s has the wrong size, try recompiling",
+            name);
+        return -1;
+    }
+    return 0;
+}
+
+/* FetchCommonType (used by CommonTypesMetaclass) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+static PyObject* __Pyx_PyType_FromMetaclass(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases) {
+    PyObject *result = __Pyx_PyType_FromModuleAndSpec(module, spec, bases);
+    if (result && metaclass) {
+        PyObject *old_tp = (PyObject*)Py_TYPE(result);
+        Py_INCREF((PyObject*)metaclass);
+        Py_SET_TYPE(result, metaclass);
+        Py_DECREF(old_tp);
+        PyType_Modified((PyTypeObject*)result);
+    }
+    return result;
+}
+#else
+#define __Pyx_PyType_FromMetaclass(me, mo, s, b) PyType_FromMetaclass(me, mo, s, b)
+#endif
+static PyTypeObject *__Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases) {
+    PyObject *abi_module = NULL, *cached_type = NULL, *abi_module_dict, *new_cached_type, *py_object_name;
+    int get_item_ref_result;
+    const char* object_name = strrchr(spec->name, '.');
+    object_name = object_name ? object_name+1 : spec->name;
+    py_object_name = PyUnicode_FromString(object_name);
+    if (!py_object_name) return NULL;
+    abi_module = __Pyx_FetchSharedCythonABIModule();
+    if (!abi_module) goto done;
+    abi_module_dict = PyModule_GetDict(abi_module);
+    if (!abi_module_dict) goto done;
+    get_item_ref_result = __Pyx_PyDict_GetItemRef(abi_module_dict, py_object_name, &cached_type);
+    if (get_item_ref_result == 1) {
+        if (__Pyx_VerifyCachedType(
+              cached_type,
+              object_name,
+              spec->basicsize) < 0) {
+            goto bad;
+        }
+        goto done;
+    } else if (unlikely(get_item_ref_result == -1)) {
+        goto bad;
+    }
+    cached_type = __Pyx_PyType_FromMetaclass(
+        metaclass,
+        CYTHON_USE_MODULE_STATE ? module : abi_module,
+        spec, bases);
+    if (unlikely(!cached_type)) goto bad;
+    new_cached_type = __Pyx_PyDict_SetDefault(abi_module_dict, py_object_name, cached_type);
+    if (unlikely(new_cached_type != cached_type)) {
+        if (unlikely(!new_cached_type)) goto bad;
+        Py_DECREF(cached_type);
+        cached_type = new_cached_type;
+        if (__Pyx_VerifyCachedType(
+                cached_type,
+                object_name,
+                spec->basicsize) < 0) {
+            goto bad;
+        }
+        goto done;
+    } else {
+        Py_DECREF(new_cached_type);
+    }
+done:
+    Py_XDECREF(abi_module);
+    Py_DECREF(py_object_name);
+    assert(cached_type == NULL || PyType_Check(cached_type));
+    return (PyTypeObject *) cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+
+/* CommonTypesMetaclass (used by CythonFunctionShared) */
+static PyObject* __pyx_CommonTypesMetaclass_get_module(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED void* context) {
+    return PyUnicode_FromString(__PYX_ABI_MODULE_NAME);
+}
+#if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+static PyObject* __pyx_CommonTypesMetaclass_call(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED PyObject *args, CYTHON_UNUSED PyObject *kwds) {
+    PyErr_SetString(PyExc_TypeError, "Cannot instantiate Cython internal types");
+    return NULL;
+}
+static int __pyx_CommonTypesMetaclass_setattr(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED PyObject *attr, CYTHON_UNUSED PyObject *value) {
+    PyErr_SetString(PyExc_TypeError, "Cython internal types are immutable");
+    return -1;
+}
+#endif
+static PyGetSetDef __pyx_CommonTypesMetaclass_getset[] = {
+    {"__module__", __pyx_CommonTypesMetaclass_get_module, NULL, NULL, NULL},
+    {0, 0, 0, 0, 0}
+};
+static PyType_Slot __pyx_CommonTypesMetaclass_slots[] = {
+    {Py_tp_getset, (void *)__pyx_CommonTypesMetaclass_getset},
+    #if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+    {Py_tp_call, (void*)__pyx_CommonTypesMetaclass_call},
+    {Py_tp_new, (void*)__pyx_CommonTypesMetaclass_call},
+    {Py_tp_setattro, (void*)__pyx_CommonTypesMetaclass_setattr},
+    #endif
+    {0, 0}
+};
+static PyType_Spec __pyx_CommonTypesMetaclass_spec = {
+    __PYX_TYPE_MODULE_PREFIX "_common_types_metatype",
+    0,
+    0,
+    Py_TPFLAGS_IMMUTABLETYPE |
+    Py_TPFLAGS_DISALLOW_INSTANTIATION |
+    Py_TPFLAGS_DEFAULT,
+    __pyx_CommonTypesMetaclass_slots
+};
+static int __pyx_CommonTypesMetaclass_init(PyObject *module) {
+    __pyx_mstatetype *mstate = __Pyx_PyModule_GetState(module);
+    PyObject *bases = PyTuple_Pack(1, &PyType_Type);
+    if (unlikely(!bases)) {
+        return -1;
+    }
+    mstate->__pyx_CommonTypesMetaclassType = __Pyx_FetchCommonTypeFromSpec(NULL, module, &__pyx_CommonTypesMetaclass_spec, bases);
+    Py_DECREF(bases);
+    if (unlikely(mstate->__pyx_CommonTypesMetaclassType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+
+/* CythonFunctionPerModule (used by CythonFunctionShared) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunctionNoMethod(PyObject *func, void (*cfunc)(void)) {
+    if (__Pyx_CyFunction_Check(func)) {
+        return __Pyx_as_CyFunctionObject(func)->func_methoddef->ml_meth == (PyCFunction) cfunc;
+    } else if (PyCFunction_Check(func)) {
+        return PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void)) {
+    if ((PyObject*)Py_TYPE(func) == __pyx_mstate_global->__Pyx_CachedMethodType) {
+        int result;
+        PyObject *newFunc = PyObject_GetAttr(func, __pyx_mstate_global->__pyx_n_u_func);
+        if (unlikely(!newFunc)) {
+            PyErr_Clear(); // It's only an optimization, so don't throw an error
+            return 0;
+        }
+        result = __Pyx__IsSameCyOrCFunctionNoMethod(newFunc, cfunc);
+        Py_DECREF(newFunc);
+        return result;
+    }
+    return __Pyx__IsSameCyOrCFunctionNoMethod(func, cfunc);
+}
+#else
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void)) {
+    if (PyMethod_Check(func)) {
+        func = PyMethod_GET_FUNCTION(func);
+    }
+    return __Pyx_CyOrPyCFunction_Check(func) && __Pyx_CyOrPyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+}
+#endif
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    __Pyx_Py_XDECREF_SET(
+        __Pyx__CyFunction_GetClassObj(f),
+            ((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#else
+    __Pyx_Py_XDECREF_SET(
+        ((PyCMethodObject *) (f))->mm_class,
+        (PyTypeObject*)((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_InitDefaults(PyObject *func, PyTypeObject *defaults_type) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->defaults = PyObject_CallObject((PyObject*)defaults_type, NULL); // _PyObject_New(defaults_type);
+    if (unlikely(!m->defaults))
+        return NULL;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* PyMethodNew (used by CythonFunctionShared) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ) {
+    PyObject *result;
+    CYTHON_UNUSED_VAR(typ);
+    if (!self)
+        return __Pyx_NewRef(func);
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    {
+        PyObject *args[] = {func, self};
+        result = PyObject_Vectorcall(__pyx_mstate_global->__Pyx_CachedMethodType, args, 2, NULL);
+    }
+    #else
+    result = PyObject_CallFunctionObjArgs(__pyx_mstate_global->__Pyx_CachedMethodType, func, self, NULL);
+    #endif
+    return result;
+}
+#else
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ) {
+    CYTHON_UNUSED_VAR(typ);
+    if (!self)
+        return __Pyx_NewRef(func);
+    return PyMethod_New(func, self);
+}
+#endif
+
+/* PyVectorcallFastCallDict (used by CythonFunctionShared) */
+#if CYTHON_VECTORCALL
+static PyObject *__Pyx_PyVectorcall_FastCallDict_kw(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
+{
+    PyObject *res = NULL;
+    PyObject *kwnames;
+    PyObject **newargs;
+    PyObject **kwvalues;
+    Py_ssize_t i;
+    #if CYTHON_AVOID_BORROWED_REFS
+    PyObject *pos;
+    #else
+    Py_ssize_t pos;
+    #endif
+    size_t j;
+    PyObject *key, *value;
+    unsigned long keys_are_strings;
+    #if !CYTHON_ASSUME_SAFE_SIZE
+    Py_ssize_t nkw = PyDict_Size(kw);
+    if (unlikely(nkw == -1)) return NULL;
+    #else
+    Py_ssize_t nkw = PyDict_GET_SIZE(kw);
+    #endif
+    newargs = (PyObject **)PyMem_Malloc((nargs + (size_t)nkw) * sizeof(args[0]));
+    if (unlikely(newargs == NULL)) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    for (j = 0; j < nargs; j++) newargs[j] = args[j];
+    kwnames = PyTuple_New(nkw);
+    if (unlikely(kwnames == NULL)) {
+        PyMem_Free(newargs);
+        return NULL;
+    }
+    kwvalues = newargs + nargs;
+    pos = 0;
+    i = 0;
+    keys_are_strings = Py_TPFLAGS_UNICODE_SUBCLASS;
+    while (__Pyx_PyDict_NextRef(kw, &pos, &key, &value)) {
+        keys_are_strings &=
+        #if CYTHON_COMPILING_IN_LIMITED_API
+            PyType_GetFlags(Py_TYPE(key));
+        #else
+            Py_TYPE(key)->tp_flags;
+        #endif
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(PyTuple_SetItem(kwnames, i, key) < 0)) goto cleanup;
+        #else
+        PyTuple_SET_ITEM(kwnames, i, key);
+        #endif
+        kwvalues[i] = value;
+        i++;
+    }
+    if (unlikely(!keys_are_strings)) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        goto cleanup;
+    }
+    res = vc(func, newargs, nargs, kwnames);
+cleanup:
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(pos);
+    #endif
+    Py_DECREF(kwnames);
+    for (i = 0; i < nkw; i++)
+        Py_DECREF(kwvalues[i]);
+    PyMem_Free(newargs);
+    return res;
+}
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
+{
+    Py_ssize_t kw_size =
+        likely(kw == NULL) ?
+        0 :
+#if !CYTHON_ASSUME_SAFE_SIZE
+        PyDict_Size(kw);
+#else
+        PyDict_GET_SIZE(kw);
+#endif
+    if (kw_size == 0) {
+        return vc(func, args, nargs, NULL);
+    }
+#if !CYTHON_ASSUME_SAFE_SIZE
+    else if (unlikely(kw_size == -1)) {
+        return NULL;
+    }
+#endif
+    return __Pyx_PyVectorcall_FastCallDict_kw(func, vc, args, nargs, kw);
+}
+#endif
+
+/* CythonFunctionShared (used by CythonFunction) */
+static PyObject *
+__Pyx_CyFunction_get_doc_locked(__pyx_CyFunctionObject *op)
+{
+    if (unlikely(op->func_doc == NULL)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+        const char *doc = op->func_methoddef->ml_doc;
+#else
+        const char *doc = ((PyCFunctionObject*)op)->m_ml->ml_doc;
+#endif
+        if (doc) {
+            op->func_doc = PyUnicode_FromString(doc);
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static PyObject *
+__Pyx_CyFunction_get_doc(PyObject *op_in, void *closure) {
+    PyObject *result;
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    CYTHON_UNUSED_VAR(closure);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    result = __Pyx_CyFunction_get_doc_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_doc(PyObject *op_in, PyObject *value, void *context)
+{
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    CYTHON_UNUSED_VAR(context);
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_doc, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name_locked(__pyx_CyFunctionObject *op)
+{
+    if (unlikely(op->func_name == NULL)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+        const char *name = op->func_methoddef->ml_name;
+#else
+        const char *name = ((PyCFunctionObject*)op)->m_ml->ml_name;
+#endif
+        op->func_name = PyUnicode_InternFromString(name);
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(PyObject *op, void *context)
+{
+    PyObject *result = NULL;
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_name_locked(__Pyx_as_CyFunctionObject(op));
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_name(PyObject *op_in, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(value == NULL || !PyUnicode_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_name, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(PyObject *op_in, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject *result;
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    Py_INCREF(op->func_qualname);
+    result = op->func_qualname;
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_qualname(PyObject *op_in, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(value == NULL || !PyUnicode_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_qualname, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+#endif
+static PyObject *
+__Pyx_CyFunction_get_globals(PyObject *op_in, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(PyObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(op);
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(PyObject *op_in, void *context)
+{
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op, PyObject *op_obj) {
+    int result = 0;
+    PyObject *res = op->defaults_getter(op_obj);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = __Pyx_PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = __Pyx_PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(PyObject *op_in, PyObject* value, void *context) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    CYTHON_UNUSED_VAR(context);
+    if (!value) {
+        value = Py_None;
+    } else if (unlikely(value != Py_None && !PyTuple_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__defaults__ will not "
+                 "currently affect the values used in function calls", 1);
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->defaults_tuple, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults_locked(PyObject *op_in) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject* result = op->defaults_tuple;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (unlikely(__Pyx_CyFunction_init_defaults(op, op_in) < 0)) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(PyObject *op, void *context) {
+    PyObject* result = NULL;
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_defaults_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(PyObject *op_in, PyObject* value, void *context) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    CYTHON_UNUSED_VAR(context);
+    if (!value) {
+        value = Py_None;
+    } else if (unlikely(value != Py_None && !PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__kwdefaults__ will not "
+                 "currently affect the values used in function calls", 1);
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->defaults_kwdict, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults_locked(PyObject *op_in) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject* result = op->defaults_kwdict;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (unlikely(__Pyx_CyFunction_init_defaults(op, op_in) < 0)) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(PyObject *op, void *context) {
+    PyObject* result;
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_kwdefaults_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int __Pyx_CyFunction_set_annotate_in_dict_if_exists(PyObject *op_in, PyObject *value);
+static int
+__Pyx_CyFunction_set_annotations(PyObject *op_in, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_XINCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_annotations, value);
+    __Pyx_END_CRITICAL_SECTION();
+    if (unlikely(__Pyx_CyFunction_set_annotate_in_dict_if_exists(op_in, Py_None) < 0)) return -1;
+    return 0;
+}
+static int
+__Pyx_CyFunction_get_dict_if_exists(PyObject *op_in, PyObject **dict) {
+    /* Return 1 if the function dict exists, 0 otherwise.  This cannot fail:
+     * _PyObject_GetDictPtr() may clear errors internally, but never reports them. */
+#if CYTHON_COMPILING_IN_PYPY
+    *dict = PyObject_GenericGetDict(op_in, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX < 0x030C0000
+    *dict = __Pyx_as_CyFunctionObject(op_in)->func_dict;
+#else
+    PyObject **dictptr = _PyObject_GetDictPtr(op_in);
+    *dict = likely(dictptr) ? *dictptr : NULL;
+#endif
+    return *dict ? 1 : 0;
+}
+static int
+__Pyx_CyFunction_get_annotate_from_dict_if_exists(PyObject *op_in, PyObject **annotate) {
+    PyObject *dict;
+    int dict_found;
+    *annotate = NULL;
+    dict_found = __Pyx_CyFunction_get_dict_if_exists(op_in, &dict);
+    if (!dict_found) return 0;
+    return __Pyx_PyDict_GetItemRef(dict, __pyx_mstate_global->__pyx_n_u_annotate, annotate);
+}
+static int
+__Pyx_CyFunction_set_annotate_in_dict_if_exists(PyObject *op_in, PyObject *value) {
+    PyObject *dict;
+    int dict_found;
+    dict_found = __Pyx_CyFunction_get_dict_if_exists(op_in, &dict);
+    if (!dict_found) return 0;
+    if (value) {
+        return PyDict_SetItem(dict, __pyx_mstate_global->__pyx_n_u_annotate, value);
+    } else {
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+        return PyDict_Pop(dict, __pyx_mstate_global->__pyx_n_u_annotate, NULL);
+#else
+        int result = PyDict_Contains(dict, __pyx_mstate_global->__pyx_n_u_annotate);
+        if (result == 1) {
+            result = PyDict_DelItem(dict, __pyx_mstate_global->__pyx_n_u_annotate);
+        }
+        return result;
+#endif
+    }
+}
+static int
+__Pyx_CyFunction_set_annotate_in_dict(PyObject *op_in, PyObject *value) {
+    PyObject *dict;
+    int result;
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+    dict = __Pyx_CyFunction_get_dict(__Pyx_as_CyFunctionObject(op_in), NULL);
+#else
+    dict = PyObject_GenericGetDict(op_in, NULL);
+#endif
+    if (unlikely(!dict)) return -1;
+    result = PyDict_SetItem(dict, __pyx_mstate_global->__pyx_n_u_annotate, value);
+    Py_DECREF(dict);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations_locked(__pyx_CyFunctionObject *op) {
+    PyObject* result = op->func_annotations;
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(PyObject *op_in, void *context) {
+    PyObject *annotate = NULL;
+    PyObject *result = NULL;
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    result = __Pyx_XNewRef(op->func_annotations);
+    __Pyx_END_CRITICAL_SECTION();
+    if (result) return result;
+    if (unlikely(__Pyx_CyFunction_get_annotate_from_dict_if_exists(op_in, &annotate) < 0)) return NULL;
+    if (!annotate || annotate == Py_None) {
+        Py_XDECREF(annotate);
+        __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+        result = __Pyx_CyFunction_get_annotations_locked(op);
+        __Pyx_END_CRITICAL_SECTION();
+        return result;
+    }
+    PyObject *format = PyLong_FromLong(1L);  // annotationlib.Format.VALUE
+    if (likely(format)) {
+        if (!Py_EnterRecursiveCall(" cyfunction __annotations__.__get__")) {
+            result = __Pyx_PyObject_CallOneArg(annotate, format);
+            Py_LeaveRecursiveCall();
+            Py_DECREF(format);
+        }
+    }
+    Py_DECREF(annotate);
+    if (unlikely(!result)) return NULL;
+    if (unlikely(!PyDict_Check(result))) {
+        PyErr_SetString(PyExc_TypeError, "__annotate__ must return a dict");
+        Py_DECREF(result);
+        return NULL;
+    }
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_annotations, __Pyx_NewRef(result));
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static PyObject *__Pyx_CyFunction_annotate_impl(PyObject *self, PyObject *arg) {
+    CYTHON_UNUSED_VAR(arg);
+    if (unlikely(!self)) {
+        PyErr_SetString(PyExc_SystemError, "cython __annotate__ called without 'self' argument");
+        return NULL;
+    }
+    PyObject *result;
+    if (Py_EnterRecursiveCall(" in cyfunction annotate")) {
+        return NULL;
+    }
+    result = __Pyx_CyFunction_get_annotations(self, NULL);
+    Py_LeaveRecursiveCall();
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotate(PyObject *op_in, void *context);
+static int
+__Pyx_CyFunction_set_annotate(PyObject *op_in, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (value == NULL) {
+        PyErr_SetString(PyExc_TypeError, "__annotate__ cannot be deleted");
+        return -1;
+    }
+    if (unlikely(value != Py_None && !PyCallable_Check(value))) {
+        PyErr_SetString(PyExc_TypeError, "__annotate__ must be callable or None");
+        return -1;
+    }
+    if (unlikely(__Pyx_TypeCheck(value, &PyCFunction_Type))) {
+#if !CYTHON_ASSUME_SAFE_MACROS && !CYTHON_COMPILING_IN_PYPY
+        PyCFunction cfunction = PyCFunction_GetFunction(value);
+        if (unlikely(!cfunction)) return -1;
+        PyObject *value_self = PyCFunction_GetSelf(value);
+        if (unlikely(!value_self && PyErr_Occurred())) return -1;
+#else
+        PyCFunction cfunction = PyCFunction_GET_FUNCTION(value);
+        PyObject *value_self = PyCFunction_GET_SELF(value);
+#endif
+        if (cfunction == __Pyx_CyFunction_annotate_impl && value_self == op_in) {
+            return __Pyx_CyFunction_set_annotate_in_dict_if_exists(op_in, NULL);
+        }
+    }
+    if (value != Py_None) {
+        __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+        __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+        Py_CLEAR(op->func_annotations);
+        __Pyx_END_CRITICAL_SECTION();
+    }
+    return __Pyx_CyFunction_set_annotate_in_dict(op_in, value);
+}
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+static PyObject *
+__Pyx_CyFunction_get_is_coroutine_value(__pyx_CyFunctionObject *op) {
+    int is_coroutine = op->flags & __Pyx_CYFUNCTION_COROUTINE;
+    if (is_coroutine) {
+        PyObject *is_coroutine_value, *module, *fromlist, *marker = __pyx_mstate_global->__pyx_n_u_is_coroutine;
+        fromlist = PyList_New(1);
+        if (unlikely(!fromlist)) return NULL;
+        Py_INCREF(marker);
+#if CYTHON_ASSUME_SAFE_MACROS
+        PyList_SET_ITEM(fromlist, 0, marker);
+#else
+        if (unlikely(PyList_SetItem(fromlist, 0, marker) < 0)) {
+            Py_DECREF(fromlist);
+            return NULL;
+        }
+#endif
+        module = PyImport_ImportModuleLevelObject(__pyx_mstate_global->__pyx_n_u_asyncio_coroutines, NULL, NULL, fromlist, 0);
+        Py_DECREF(fromlist);
+        if (unlikely(!module)) {
+            goto ignore_or_error;
+        }
+        is_coroutine_value = __Pyx_PyObject_GetAttrStr(module, marker);
+        Py_DECREF(module);
+        if (likely(is_coroutine_value)) {
+            return is_coroutine_value;
+        }
+ignore_or_error:
+        if (!__Pyx_IgnoreException(PyExc_Exception)) {
+            return NULL;
+        }
+    }
+    return __Pyx_PyBool_FromLong(is_coroutine);
+}
+static PyObject *
+__Pyx_CyFunction_get_is_coroutine(PyObject *op_in, void *context) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject *result;
+    CYTHON_UNUSED_VAR(context);
+    if (op->func_is_coroutine) {
+        return __Pyx_NewRef(op->func_is_coroutine);
+    }
+    result = __Pyx_CyFunction_get_is_coroutine_value(op);
+    if (unlikely(!result))
+        return NULL;
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    if (op->func_is_coroutine) {
+        Py_DECREF(result);
+        result = __Pyx_NewRef(op->func_is_coroutine);
+    } else {
+        op->func_is_coroutine = __Pyx_NewRef(result);
+    }
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+#endif
+static void __Pyx_CyFunction_raise_argument_count_error(PyObject *func, const char* message, Py_ssize_t size) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *py_name = __Pyx_CyFunction_get_name(func, NULL);
+    if (!py_name) return;
+    PyErr_Format(PyExc_TypeError,
+        "%.200S() %s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+        py_name, message, size);
+    Py_DECREF(py_name);
+#else
+    const char* name = ((PyCFunctionObject*)func)->m_ml->ml_name;
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() %s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+        name, message, size);
+#endif
+}
+static void __Pyx_CyFunction_raise_type_error(PyObject *func, const char* message) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *py_name = __Pyx_CyFunction_get_name(func, NULL);
+    if (!py_name) return;
+    PyErr_Format(PyExc_TypeError,
+        "%.200S() %s",
+        py_name, message);
+    Py_DECREF(py_name);
+#else
+    const char* name = ((PyCFunctionObject*)func)->m_ml->ml_name;
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() %s",
+        name, message);
+#endif
+}
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *
+__Pyx_CyFunction_get_module(PyObject *op_in, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_INCREF(op->func_module);
+    return op->func_module;
+}
+static int
+__Pyx_CyFunction_set_module(PyObject *op_in, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    PyObject *old = op->func_module;
+    op->func_module = value;
+    Py_DECREF(old);
+    return 0;
+}
+#endif
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {"func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {"__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {"func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {"__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {"__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+    {"func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)PyObject_GenericSetDict, 0, 0},
+    {"__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)PyObject_GenericSetDict, 0, 0},
+#else
+    {"func_dict", (getter)PyObject_GenericGetDict, (setter)PyObject_GenericSetDict, 0, 0},
+    {"__dict__", (getter)PyObject_GenericGetDict, (setter)PyObject_GenericSetDict, 0, 0},
+#endif
+    {"func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {"__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {"func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {"__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {"func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {"__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {"func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {"__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {"__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {"__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {"__annotate__", (getter)__Pyx_CyFunction_get_annotate, (setter)__Pyx_CyFunction_set_annotate, 0, 0},
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+    {"_is_coroutine", (getter)__Pyx_CyFunction_get_is_coroutine, 0, 0, 0},
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {"__module__", (getter)__Pyx_CyFunction_get_module, (setter)__Pyx_CyFunction_set_module, 0, 0},
+#endif
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    {"__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), 0, 0},
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    {"__dictoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_dict),
+        __PYX_SHARED_RELATIVE_OFFSET | READONLY, 0},
+#endif
+#if CYTHON_VECTORCALL
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+    {"__vectorcalloffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_vectorcall),
+        __PYX_SHARED_RELATIVE_OFFSET | READONLY, 0},
+#else
+    {"__vectorcalloffset__", T_PYSSIZET, offsetof(PyCFunctionObject, vectorcall), READONLY, 0},
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {"__weaklistoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_weakreflist),
+        __PYX_SHARED_RELATIVE_OFFSET | READONLY, 0},
+#else
+    {"__weaklistoffset__", T_PYSSIZET, offsetof(PyCFunctionObject, m_weakreflist), READONLY, 0},
+#endif
+#endif
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(PyObject *m_in, PyObject *args)
+{
+    PyObject *result = NULL;
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(m_in);
+    CYTHON_UNUSED_VAR(args);
+    __Pyx_BEGIN_CRITICAL_SECTION(m_in);
+    Py_INCREF(m->func_qualname);
+    result = m->func_qualname;
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__annotate_cython__", __Pyx_CyFunction_annotate_impl, METH_O,
+        "Placeholder __annotate__ function to allow 'functools.wraps' to work "
+        "on Cython functions."},
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_NOARGS, 0},
+    {0, 0, 0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_get_annotate(PyObject *op_in, void *context) {
+    PyObject *annotate = NULL;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(__Pyx_CyFunction_get_annotate_from_dict_if_exists(op_in, &annotate) < 0)) return NULL;
+    if (annotate) return annotate;
+    PyObject *method = PyCFunction_New(
+        &__pyx_CyFunction_methods[0],
+        op_in);
+    return method;
+}
+#if CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) (((PyCFunctionObject*)cyfunc)->m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(PyObject *op_in,
+                                       PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    __pyx_CyFunctionObject* op = __Pyx_as_CyFunctionObject(op_in);
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunctionObject *cf = (PyCFunctionObject*) op;
+#endif
+    if (unlikely(op == NULL))
+        return NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    op->func_methoddef = ml;
+    Py_INCREF(module);
+    op->func_module = module;
+#endif
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    cf->m_ml = ml;
+    cf->m_self = (PyObject *) op;
+#endif
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    Py_XINCREF(module);
+    cf->m_module = module;
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    op->func_dict = NULL;
+#endif
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    op->func_classobj = NULL;
+#else
+    ((PyCMethodObject*)op)->mm_class = NULL;
+#endif
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+    op->func_is_coroutine = NULL;
+#endif
+#if CYTHON_VECTORCALL
+    switch (ml->ml_flags & (METH_VARARGS | METH_FASTCALL | METH_NOARGS | METH_O | METH_KEYWORDS | METH_METHOD)) {
+    case METH_NOARGS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_NOARGS;
+        break;
+    case METH_O:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_O;
+        break;
+    case METH_METHOD | METH_FASTCALL | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD;
+        break;
+    case METH_FASTCALL | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS;
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = NULL;
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
+        Py_DECREF(op_in);
+        return NULL;
+    }
+#endif
+    return op_in;
+}
+static int __Pyx__CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_CLEAR(m->func_module);
+#else
+    Py_CLEAR(((PyCFunctionObject*)m)->m_module);
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    Py_CLEAR(m->func_dict);
+#elif PY_VERSION_HEX < 0x030d0000
+    _PyObject_ClearManagedDict((PyObject*)m);
+#else
+    PyObject_ClearManagedDict((PyObject*)m);
+#endif
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_CLEAR(m->func_classobj);
+#else
+    {
+        PyObject *cls = (PyObject*) ((PyCMethodObject *) (m))->mm_class;
+        ((PyCMethodObject *) (m))->mm_class = NULL;
+        Py_XDECREF(cls);
+    }
+#endif
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+    Py_CLEAR(m->func_is_coroutine);
+#endif
+    Py_CLEAR(m->defaults);
+    return 0;
+}
+static int
+__Pyx_CyFunction_clear(PyObject *m)
+{
+    return __Pyx__CyFunction_clear(__Pyx_as_CyFunctionObject(m));
+}
+static void __Pyx__CyFunction_dealloc(PyObject *m)
+{
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(m);
+    if (__Pyx_CyFunction_weakreflist(cyfunc) != NULL)
+        PyObject_ClearWeakRefs(m);
+    __Pyx__CyFunction_clear(cyfunc);
+    __Pyx_PyHeapTypeObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(PyObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(PyObject *m_in, visitproc visit, void *arg)
+{
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(m_in);
+    {
+        int e = __Pyx_call_type_traverse(m_in, 1, visit, arg);
+        if (e) return e;
+    }
+    Py_VISIT(m->func_closure);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_VISIT(m->func_module);
+#else
+    Py_VISIT(((PyCFunctionObject*)m)->m_module);
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    Py_VISIT(m->func_dict);
+#else
+    {
+        int e =
+#if PY_VERSION_HEX < 0x030d0000
+            _PyObject_VisitManagedDict
+#else
+            PyObject_VisitManagedDict
+#endif
+                ((PyObject*)m, visit, arg);
+        if (e != 0) return e;
+    }
+#endif
+    __Pyx_VISIT_CONST(m->func_name);
+    __Pyx_VISIT_CONST(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    __Pyx_VISIT_CONST(m->func_code);
+    Py_VISIT(__Pyx__CyFunction_GetClassObj(m));
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    Py_VISIT(m->func_annotations);
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+    Py_VISIT(m->func_is_coroutine);
+#endif
+    Py_VISIT(m->defaults);
+    return 0;
+}
+static PyObject*
+__Pyx_CyFunction_repr(PyObject *op_in)
+{
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject *repr;
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    repr = PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+    __Pyx_END_CRITICAL_SECTION();
+    return repr;
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    int flags = cyfunc->func_methoddef->ml_flags;
+#else
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    int flags = f->m_ml->ml_flags;
+#endif
+    Py_ssize_t size;
+    switch (flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void(*)(void))meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+#if CYTHON_ASSUME_SAFE_SIZE
+            size = PyTuple_GET_SIZE(arg);
+#else
+            size = PyTuple_Size(arg);
+            if (unlikely(size < 0)) return NULL;
+#endif
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            __Pyx_CyFunction_raise_argument_count_error(
+                func,
+                "takes no arguments", size);
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+#if CYTHON_ASSUME_SAFE_SIZE
+            size = PyTuple_GET_SIZE(arg);
+#else
+            size = PyTuple_Size(arg);
+            if (unlikely(size < 0)) return NULL;
+#endif
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = __Pyx_PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+            __Pyx_CyFunction_raise_argument_count_error(
+                func,
+                "takes exactly one argument", size);
+            return NULL;
+        }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
+        return NULL;
+    }
+    __Pyx_CyFunction_raise_type_error(
+        func, "takes no keyword arguments");
+    return NULL;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    result = __Pyx_CyFunction_CallMethod(func, func, arg, kw);
+    return result;
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+#if CYTHON_VECTORCALL
+     __pyx_vectorcallfunc vc = __Pyx_CyFunction_func_vectorcall(cyfunc);
+    if (vc) {
+#if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+        return __Pyx_PyVectorcall_FastCallDict(func, vc, &PyTuple_GET_ITEM(args, 0), (size_t)PyTuple_GET_SIZE(args), kw);
+#else
+        (void) &__Pyx_PyVectorcall_FastCallDict;
+        return PyVectorcall_Call(func, args, kw);
+#endif
+    }
+#endif
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+#if CYTHON_ASSUME_SAFE_SIZE
+        argc = PyTuple_GET_SIZE(args);
+#else
+        argc = PyTuple_Size(args);
+        if (unlikely(argc < 0)) return NULL;
+#endif
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
+    }
+    return result;
+}
+#if CYTHON_VECTORCALL
+static CYTHON_INLINE int __Pyx_CyFunction_Vectorcall_CheckArgs(PyObject *func, __pyx_CyFunctionObject *cyfunc, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int ret = 0;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        if (unlikely(nargs < 1)) {
+            __Pyx_CyFunction_raise_type_error(
+                func, "needs an argument");
+            return -1;
+        }
+        ret = 1;
+    }
+    if (unlikely(kwnames) && unlikely(__Pyx_PyTuple_GET_SIZE(kwnames))) {
+        __Pyx_CyFunction_raise_type_error(
+            func, "takes no keyword arguments");
+        return -1;
+    }
+    return ret;
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, kwnames)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = func;
+        break;
+    default:
+        return NULL;
+    }
+    if (unlikely(nargs != 0)) {
+        __Pyx_CyFunction_raise_argument_count_error(
+            func, "takes no arguments", nargs);
+        return NULL;
+    }
+    return meth(self, NULL);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, kwnames)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = func;
+        break;
+    default:
+        return NULL;
+    }
+    if (unlikely(nargs != 1)) {
+        __Pyx_CyFunction_raise_argument_count_error(
+            func, "takes exactly one argument", nargs);
+        return NULL;
+    }
+    return meth(self, args[0]);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = func;
+        break;
+    default:
+        return NULL;
+    }
+    return ((__Pyx_PyCFunctionFastWithKeywords)(void(*)(void))meth)(self, args, nargs, kwnames);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    PyTypeObject *cls = (PyTypeObject *) __Pyx__CyFunction_GetClassObj(cyfunc);
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = func;
+        break;
+    default:
+        return NULL;
+    }
+    #if PY_VERSION_HEX < 0x030e00A6
+    size_t nargs_value = (size_t) nargs;
+    #else
+    Py_ssize_t nargs_value = nargs;
+    #endif
+    return ((__Pyx_PyCMethod)(void(*)(void))meth)(self, cls, args, nargs_value, kwnames);
+}
+#endif
+static PyType_Slot __pyx_CyFunctionType_slots[] = {
+    {Py_tp_dealloc, (void *)__Pyx_CyFunction_dealloc},
+    {Py_tp_repr, (void *)__Pyx_CyFunction_repr},
+    {Py_tp_call, (void *)__Pyx_CyFunction_CallAsMethod},
+    {Py_tp_traverse, (void *)__Pyx_CyFunction_traverse},
+    {Py_tp_clear, (void *)__Pyx_CyFunction_clear},
+    {Py_tp_methods, (void *)__pyx_CyFunction_methods},
+    {Py_tp_members, (void *)__pyx_CyFunction_members},
+    {Py_tp_getset, (void *)__pyx_CyFunction_getsets},
+    {Py_tp_descr_get, (void *)__Pyx_PyMethod_New},
+    {0, 0},
+};
+static PyType_Spec __pyx_CyFunctionType_spec = {
+    __PYX_TYPE_MODULE_PREFIX "cython_function_or_method",
+    __PYX_SHARED_SIZEOF(__pyx_CyFunctionObject),
+    0,
+#ifdef Py_TPFLAGS_METHOD_DESCRIPTOR
+    Py_TPFLAGS_METHOD_DESCRIPTOR |
+#endif
+#if CYTHON_VECTORCALL
+#if defined(Py_TPFLAGS_HAVE_VECTORCALL)
+    Py_TPFLAGS_HAVE_VECTORCALL |
+#elif defined(_Py_TPFLAGS_HAVE_VECTORCALL)
+    _Py_TPFLAGS_HAVE_VECTORCALL |
+#endif
+#endif // CYTHON_VECTORCALL
+#if PY_VERSION_HEX >= 0x030C0000 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_TPFLAGS_MANAGED_DICT |
+#endif
+    Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_DISALLOW_INSTANTIATION |
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    __pyx_CyFunctionType_slots
+};
+static int __pyx_CyFunction_init(PyObject *module) {
+    __pyx_mstatetype *mstate = __Pyx_PyModule_GetState(module);
+    mstate->__pyx_CyFunctionType = __Pyx_FetchCommonTypeFromSpec(
+        mstate->__pyx_CommonTypesMetaclassType, module, &__pyx_CyFunctionType_spec, NULL);
+    if (unlikely(mstate->__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    (void)&__Pyx_Get_CyFunction_Type;
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(PyObject, __pyx_mstate_global->__pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
+}
+static PyTypeObject *__Pyx_Get_CyFunction_Type(void) {
+    PyTypeObject *tp = __pyx_mstate_global->__pyx_CyFunctionType;
+    Py_INCREF((PyObject*)tp);
+    return tp;
+}
+
+/* CLineInTraceback (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+#define __Pyx_PyProbablyModule_GetDict(o) __Pyx_XNewRef(PyModule_GetDict(o))
+#elif !CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyProbablyModule_GetDict(o) PyObject_GenericGetDict(o, NULL);
+#else
+PyObject* __Pyx_PyProbablyModule_GetDict(PyObject *o) {
+    PyObject **dict_ptr = _PyObject_GetDictPtr(o);
+    return dict_ptr ? __Pyx_XNewRef(*dict_ptr) : NULL;
+}
+#endif
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+    PyObject *use_cline = NULL;
+    PyObject *ptype, *pvalue, *ptraceback;
+    PyObject *cython_runtime_dict;
+    CYTHON_MAYBE_UNUSED_VAR(tstate);
+    if (unlikely(!__pyx_mstate_global->__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+    cython_runtime_dict = __Pyx_PyProbablyModule_GetDict(__pyx_mstate_global->__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, cython_runtime_dict,
+            __Pyx_PyDict_SetDefault(cython_runtime_dict, __pyx_mstate_global->__pyx_n_u_cline_in_traceback, Py_False))
+    }
+    if (use_cline == NULL || use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    Py_XDECREF(use_cline);
+    Py_XDECREF(cython_runtime_dict);
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache (used by AddTraceback) */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static __Pyx_CachedCodeObjectType *__pyx__find_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line) {
+    __Pyx_CachedCodeObjectType* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!code_cache->entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if (unlikely(pos >= code_cache->count) || unlikely(code_cache->entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = code_cache->entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__find_code_object;
+    return NULL; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just miss.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type old_count = __pyx_atomic_incr_acq_rel(&code_cache->accessor_count);
+    if (old_count < 0) {
+        __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+        return NULL;
+    }
+#endif
+    __Pyx_CachedCodeObjectType *result = __pyx__find_code_object(code_cache, code_line);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+#endif
+    return result;
+#endif
+}
+static void __pyx__insert_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line, __Pyx_CachedCodeObjectType* code_object)
+{
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = code_cache->entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            code_cache->entries = entries;
+            code_cache->max_count = 64;
+            code_cache->count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if ((pos < code_cache->count) && unlikely(code_cache->entries[pos].code_line == code_line)) {
+        __Pyx_CachedCodeObjectType* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_INCREF(code_object);
+        Py_DECREF(tmp);
+        return;
+    }
+    if (code_cache->count == code_cache->max_count) {
+        int new_max = code_cache->max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            code_cache->entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        code_cache->entries = entries;
+        code_cache->max_count = new_max;
+    }
+    for (i=code_cache->count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    code_cache->count++;
+    Py_INCREF(code_object);
+}
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__insert_code_object;
+    return; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just fail.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type expected = 0;
+    if (!__pyx_atomic_int_cmp_exchange(&code_cache->accessor_count, &expected, INT_MIN)) {
+        return;
+    }
+#endif
+    __pyx__insert_code_object(code_cache, code_line, code_object);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_sub(&code_cache->accessor_count, INT_MIN);
+#endif
+#endif
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API && !defined(PYPY_VERSION)
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
+                                                       PyObject *firstlineno, PyObject *name) {
+    PyObject *replace = NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
+    replace = PyObject_GetAttrString(code, "replace");
+    if (likely(replace)) {
+        PyObject *result = PyObject_Call(replace, __pyx_mstate_global->__pyx_empty_tuple, scratch_dict);
+        Py_DECREF(replace);
+        return result;
+    }
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
+    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
+    PyObject *exc_type, *exc_value, *exc_traceback;
+    int success = 0;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+    }
+    __Pyx_PyErr_FetchException(&exc_type, &exc_value, &exc_traceback);
+    code_object = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!code_object) {
+        code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
+        if (unlikely(!code_object)) goto bad;
+        py_py_line = PyLong_FromLong(py_line);
+        if (unlikely(!py_py_line)) goto bad;
+        if (c_line) {
+            py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        } else {
+            py_funcname = PyUnicode_FromString(funcname);
+        }
+        if (unlikely(!py_funcname)) goto bad;
+        dict = PyDict_New();
+        if (unlikely(!dict)) goto bad;
+        {
+            PyObject *old_code_object = code_object;
+            code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
+            Py_DECREF(old_code_object);
+        }
+        if (unlikely(!code_object)) goto bad;
+        __pyx_insert_code_object(c_line ? -c_line : py_line, code_object);
+    } else {
+        dict = PyDict_New();
+    }
+    getframe = PySys_GetObject("_getframe");
+    if (unlikely(!getframe)) goto bad;
+    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
+    frame = PyEval_EvalCode(code_object, dict, dict);
+    if (unlikely(!frame) || frame == Py_None) goto bad;
+    success = 1;
+  bad:
+    __Pyx_PyErr_RestoreException(exc_type, exc_value, exc_traceback);
+    Py_XDECREF(code_object);
+    Py_XDECREF(py_py_line);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(dict);
+    Py_XDECREF(replace);
+    if (success) {
+        PyTraceBack_Here(
+            (struct _frame*)frame);
+    }
+    Py_XDECREF(frame);
+}
+#else
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    if (c_line) {
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+    }
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    Py_XDECREF(py_funcname);
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_mstate_global->__pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+#endif
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static int __Pyx_LargePyLong___Pyx_PyLong_As_int(PyObject *x);
+static int __Pyx_raise_neg_overflow___Pyx_PyLong_As_int(void) {
+    const char* type_name = "int";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (int) -1;
+}
+static int __Pyx_raise_overflow___Pyx_PyLong_As_int(void) {
+    const char* type_name = "int";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (int) -1;
+}
+static CYTHON_INLINE int __Pyx_PyULong___Pyx_PyLong_As_int(PyObject *x) {
+    const int is_unsigned = 1;
+#if CYTHON_USE_PYLONG_INTERNALS
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (int) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
+#endif
+    if ((sizeof(int) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static CYTHON_INLINE int __Pyx_PySLong___Pyx_PyLong_As_int(PyObject *x) {
+    const int is_unsigned = 0;
+#if CYTHON_USE_PYLONG_INTERNALS
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        {}
+    }
+#endif
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(int) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(int) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+    } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static int __Pyx_LargePyLong___Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    int val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
+    } else {
+        ret = 0;
+    }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
+#else
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (int) -1;
+        assert(PyLong_CheckExact(v));
+    }
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
+            return (int) -1;
+        }
+        is_negative = result == 1;
+    }
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to int");
+        return (int) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (int) -1;
+    } else {
+        stepval = v;
+    }
+    v = NULL;
+    val = (int) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((int) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((int) idigit) << bits;
+    }
+    if (!is_unsigned) {
+        if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
+    }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
+#endif
+    if (unlikely(ret))
+        return (int) -1;
+    return val;
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static CYTHON_INLINE int __Pyx_PyLong___Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else
+        #endif
+        {
+            return __Pyx_PyULong___Pyx_PyLong_As_int(x);
+        }
+    } else {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else
+        #endif
+        {
+            return __Pyx_PySLong___Pyx_PyLong_As_int(x);
+        }
+    }
+#if CYTHON_USE_PYLONG_INTERNALS
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+#endif
+}
+static int __Pyx_NonPyLong___Pyx_PyLong_As_int(PyObject *x) {
+    int val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (int) -1;
+    val = __Pyx_PyLong_As_int(tmp);
+    Py_DECREF(tmp);
+    return val;
+}
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+    if (likely(PyLong_Check(x))) {
+        return __Pyx_PyLong___Pyx_PyLong_As_int(x);
+    } else {
+        return __Pyx_NonPyLong___Pyx_PyLong_As_int(x);
+    }
+}
+
+/* PyObjectVectorcallKwds (used by PyObjectVectorcallMethodKwds) */
+#if CYTHON_VECTORCALL
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject *kwnames, Py_ssize_t i) {
+    PyObject *key = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+#if !CYTHON_ASSUME_SAFE_MACROS
+    if (unlikely(!key)) return -1;
+#endif
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return 0;
+}
+#else
+CYTHON_UNUSED static PyObject *__Pyx_MakeKwargDict(PyObject **keys, PyObject **values, Py_ssize_t n) {
+    PyObject *out = PyDict_New();
+    if (unlikely(!out)) return NULL;
+    for (Py_ssize_t i=0; i<n; ++i) {
+        if (unlikely(PyDict_SetItem(out, keys[i], values[i]) < 0)) {
+            Py_DECREF(out);
+            return NULL;
+        }
+    }
+    return out;
+}
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject **kwnames, Py_ssize_t i) {
+    PyObject *key = kwnames[i];
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return 0;
+}
+#endif
+
+/* PyObjectVectorcallMethodKwds (used by CIntToPy) */
+#if !CYTHON_VECTORCALL
+static PyObject *__Pyx_Object_VectorcallMethodKwds(PyObject *name, PyObject *const *args, size_t nargsf, PyObject *kwnames) {
+    PyObject *result;
+    PyObject *obj = PyObject_GetAttr(args[0], name);
+    if (unlikely(!obj))
+        return NULL;
+    result = __Pyx_Object_VectorcallKwds(obj, args+1, nargsf-1, kwnames);
+    Py_DECREF(obj);
+    return result;
+}
+#endif
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int32_t(int32_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int32_t neg_one = (int32_t) -1, const_zero = (int32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int32_t) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int32_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(int32_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int32_t) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int32_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int32_t),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int32_t));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
+    }
+}
+
+/* CIntFromPy */
+static int32_t __Pyx_LargePyLong___Pyx_PyLong_As_int32_t(PyObject *x);
+static int32_t __Pyx_raise_neg_overflow___Pyx_PyLong_As_int32_t(void) {
+    const char* type_name = "int32_t";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (int32_t) -1;
+}
+static int32_t __Pyx_raise_overflow___Pyx_PyLong_As_int32_t(void) {
+    const char* type_name = "int32_t";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (int32_t) -1;
+}
+static CYTHON_INLINE int32_t __Pyx_PyULong___Pyx_PyLong_As_int32_t(PyObject *x) {
+    const int is_unsigned = 1;
+#if CYTHON_USE_PYLONG_INTERNALS
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(int32_t) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int32_t) >= 2 * PyLong_SHIFT)) {
+                return (int32_t) (((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int32_t) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int32_t) >= 3 * PyLong_SHIFT)) {
+                return (int32_t) (((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int32_t) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int32_t) >= 4 * PyLong_SHIFT)) {
+                return (int32_t) (((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+            }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (int32_t) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
+#endif
+    if ((sizeof(int32_t) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int32_t, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(int32_t) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int32_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int32_t(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int32_t();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int32_t();
+}
+static CYTHON_INLINE int32_t __Pyx_PySLong___Pyx_PyLong_As_int32_t(PyObject *x) {
+    const int is_unsigned = 0;
+#if CYTHON_USE_PYLONG_INTERNALS
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int32_t) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int32_t, long, ival)
+            } else if ((8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT)) {
+                return (int32_t) (((int32_t) -1) * (((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int32_t) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int32_t, long, ival)
+            } else if ((8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT)) {
+                return (int32_t) (((int32_t) -1) * (((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int32_t) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int32_t, long, ival)
+            } else if ((8 * sizeof(int32_t) - 1 > 4 * PyLong_SHIFT)) {
+                return (int32_t) (((int32_t) -1) * (((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int32_t) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT)) {
+                return (int32_t) (((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int32_t) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT)) {
+                return (int32_t) (((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int32_t) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int32_t) - 1 > 4 * PyLong_SHIFT)) {
+                return (int32_t) (((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+            }
+        } else
+        {}
+    }
+#endif
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(int32_t) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int32_t, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(int32_t) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int32_t, long, PyLong_AsLong(x))
+    } else if ((sizeof(int32_t) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int32_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int32_t(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int32_t();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int32_t();
+}
+static int32_t __Pyx_LargePyLong___Pyx_PyLong_As_int32_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int32_t neg_one = (int32_t) -1, const_zero = (int32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    int32_t val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
+    } else {
+        ret = 0;
+    }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
+#else
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (int32_t) -1;
+        assert(PyLong_CheckExact(v));
+    }
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
+            return (int32_t) -1;
+        }
+        is_negative = result == 1;
+    }
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to int32_t");
+        return (int32_t) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (int32_t) -1;
+    } else {
+        stepval = v;
+    }
+    v = NULL;
+    val = (int32_t) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(int32_t) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((int32_t) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(int32_t) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((int32_t) idigit) << bits;
+    }
+    if (!is_unsigned) {
+        if (unlikely(val & (((int32_t) 1) << (sizeof(int32_t) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
+    }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
+#endif
+    if (unlikely(ret))
+        return (int32_t) -1;
+    return val;
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int32_t();
+}
+static CYTHON_INLINE int32_t __Pyx_PyLong___Pyx_PyLong_As_int32_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int32_t neg_one = (int32_t) -1, const_zero = (int32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int32_t, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else
+        #endif
+        {
+            return __Pyx_PyULong___Pyx_PyLong_As_int32_t(x);
+        }
+    } else {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int32_t, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else
+        #endif
+        {
+            return __Pyx_PySLong___Pyx_PyLong_As_int32_t(x);
+        }
+    }
+#if CYTHON_USE_PYLONG_INTERNALS
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int32_t();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int32_t();
+#endif
+}
+static int32_t __Pyx_NonPyLong___Pyx_PyLong_As_int32_t(PyObject *x) {
+    int32_t val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (int32_t) -1;
+    val = __Pyx_PyLong_As_int32_t(tmp);
+    Py_DECREF(tmp);
+    return val;
+}
+static CYTHON_INLINE int32_t __Pyx_PyLong_As_int32_t(PyObject *x) {
+    if (likely(PyLong_Check(x))) {
+        return __Pyx_PyLong___Pyx_PyLong_As_int32_t(x);
+    } else {
+        return __Pyx_NonPyLong___Pyx_PyLong_As_int32_t(x);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_uint8_t(uint8_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint8_t neg_one = (uint8_t) -1, const_zero = (uint8_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(uint8_t) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(uint8_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(uint8_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(uint8_t) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(uint8_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(uint8_t),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(uint8_t));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
+    }
+}
+
+/* CIntFromPy */
+static long __Pyx_LargePyLong___Pyx_PyLong_As_long(PyObject *x);
+static long __Pyx_raise_neg_overflow___Pyx_PyLong_As_long(void) {
+    const char* type_name = "long";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (long) -1;
+}
+static long __Pyx_raise_overflow___Pyx_PyLong_As_long(void) {
+    const char* type_name = "long";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (long) -1;
+}
+static CYTHON_INLINE long __Pyx_PyULong___Pyx_PyLong_As_long(PyObject *x) {
+    const int is_unsigned = 1;
+#if CYTHON_USE_PYLONG_INTERNALS
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (long) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
+#endif
+    if ((sizeof(long) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_long(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static CYTHON_INLINE long __Pyx_PySLong___Pyx_PyLong_As_long(PyObject *x) {
+    const int is_unsigned = 0;
+#if CYTHON_USE_PYLONG_INTERNALS
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        {}
+    }
+#endif
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(long) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(long) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+    } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_long(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static long __Pyx_LargePyLong___Pyx_PyLong_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    long val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
+    } else {
+        ret = 0;
+    }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
+#else
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (long) -1;
+        assert(PyLong_CheckExact(v));
+    }
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
+            return (long) -1;
+        }
+        is_negative = result == 1;
+    }
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to long");
+        return (long) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (long) -1;
+    } else {
+        stepval = v;
+    }
+    v = NULL;
+    val = (long) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((long) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((long) idigit) << bits;
+    }
+    if (!is_unsigned) {
+        if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
+    }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
+#endif
+    if (unlikely(ret))
+        return (long) -1;
+    return val;
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static CYTHON_INLINE long __Pyx_PyLong___Pyx_PyLong_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else
+        #endif
+        {
+            return __Pyx_PyULong___Pyx_PyLong_As_long(x);
+        }
+    } else {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else
+        #endif
+        {
+            return __Pyx_PySLong___Pyx_PyLong_As_long(x);
+        }
+    }
+#if CYTHON_USE_PYLONG_INTERNALS
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+#endif
+}
+static long __Pyx_NonPyLong___Pyx_PyLong_As_long(PyObject *x) {
+    long val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (long) -1;
+    val = __Pyx_PyLong_As_long(tmp);
+    Py_DECREF(tmp);
+    return val;
+}
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
+    if (likely(PyLong_Check(x))) {
+        return __Pyx_PyLong___Pyx_PyLong_As_long(x);
+    } else {
+        return __Pyx_NonPyLong___Pyx_PyLong_As_long(x);
+    }
+}
+
+/* GetRuntimeVersion */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+void __Pyx_init_runtime_version(void) {
+    if (__Pyx_cached_runtime_version == 0) {
+        const char* rt_version = Py_GetVersion();
+        unsigned long version = 0;
+        unsigned long factor = 0x01000000UL;
+        unsigned int digit = 0;
+        int i = 0;
+        while (factor) {
+            while ('0' <= rt_version[i] && rt_version[i] <= '9') {
+                digit = digit * 10 + (unsigned int) (rt_version[i] - '0');
+                ++i;
+            }
+            version += factor * digit;
+            if (rt_version[i] != '.')
+                break;
+            digit = 0;
+            factor >>= 8;
+            ++i;
+        }
+        __Pyx_cached_runtime_version = version;
+    }
+}
+#endif
+static unsigned long __Pyx_get_runtime_version(void) {
+#if __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+    return Py_Version & ~0xFFUL;
+#else
+    return __Pyx_cached_runtime_version;
+#endif
+}
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer) {
+    const unsigned long MAJOR_MINOR = 0xFFFF0000UL;
+    if ((rt_version & MAJOR_MINOR) == (ct_version & MAJOR_MINOR))
+        return 0;
+    if (likely(allow_newer && (rt_version & MAJOR_MINOR) > (ct_version & MAJOR_MINOR)))
+        return 1;
+    {
+        char message[200];
+        PyOS_snprintf(message, sizeof(message),
+                      "compile time Python version %d.%d "
+                      "of module '%.100s' "
+                      "%s "
+                      "runtime version %d.%d",
+                       (int) (ct_version >> 24), (int) ((ct_version >> 16) & 0xFF),
+                       __Pyx_MODULE_NAME,
+                       (allow_newer) ? "was newer than" : "does not match",
+                       (int) (rt_version >> 24), (int) ((rt_version >> 16) & 0xFF)
+       );
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+}
+
+/* NewCodeObj */
+#if CYTHON_COMPILING_IN_LIMITED_API
+    static PyObject* __Pyx__PyCode_New(int a, int p, int k, int l, int s, int f,
+                                       PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                       PyObject *fv, PyObject *cell, PyObject* fn,
+                                       PyObject *name, int fline, PyObject *lnos) {
+        PyObject *exception_table = NULL;
+        PyObject *types_module=NULL, *code_type=NULL, *result=NULL;
+        #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+        PyObject *version_info;
+        PyObject *py_minor_version = NULL;
+        #endif
+        long minor_version = 0;
+        #if __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+        minor_version = 11;
+        #else
+        if (!(version_info = PySys_GetObject("version_info"))) goto end;
+        if (!(py_minor_version = PySequence_GetItem(version_info, 1))) goto end;
+        minor_version = PyLong_AsLong(py_minor_version);
+        Py_DECREF(py_minor_version);
+        if (minor_version == -1 && PyErr_Occurred()) goto end;
+        #endif
+        if (!(types_module = PyImport_ImportModule("types"))) goto end;
+        if (!(code_type = PyObject_GetAttrString(types_module, "CodeType"))) goto end;
+        if (minor_version <= 10) {
+            result = PyObject_CallFunction(code_type, "iiiiiiOOOOOOiOOO", a,p, k, l, s, f, code,
+                          c, n, v, fn, name, fline, lnos, fv, cell);
+        } else {
+            if (!(exception_table = PyBytes_FromStringAndSize(NULL, 0))) goto end;
+            result = PyObject_CallFunction(code_type, "iiiiiiOOOOOOOiOOOO", a,p, k, l, s, f, code,
+                          c, n, v, fn, name, name, fline, lnos, exception_table, fv, cell);
+        }
+    end:
+        Py_XDECREF(code_type);
+        Py_XDECREF(exception_table);
+        Py_XDECREF(types_module);
+        if (!result) {
+            PyObject *exc_type, *exc_value, *exc_tb;
+            PyErr_Fetch(&exc_type, &exc_value, &exc_tb);
+            if (PyErr_WarnFormat(
+                    PyExc_RuntimeWarning, 1,
+                    "Code object creation failed in Cython module: %S\nTry recompiling with a more recent version of Cython.",
+                    exc_value ? exc_value : exc_type) == 0) {
+                result = Py_None;
+                Py_INCREF(result);
+            }
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+        }
+        return result;
+    }
+#elif PY_VERSION_HEX >= 0x030B0000
+  static PyCodeObject* __Pyx__PyCode_New(int a, int p, int k, int l, int s, int f,
+                                         PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                         PyObject *fv, PyObject *cell, PyObject* fn,
+                                         PyObject *name, int fline, PyObject *lnos) {
+    PyCodeObject *result;
+    result =
+      #if PY_VERSION_HEX >= 0x030C0000
+        PyUnstable_Code_NewWithPosOnlyArgs
+      #else
+        PyCode_NewWithPosOnlyArgs
+      #endif
+        (a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, name, fline, lnos, __pyx_mstate_global->__pyx_empty_bytes);
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030c00A1
+    if (likely(result))
+        result->_co_firsttraceable = 0;
+    #endif
+    return result;
+  }
+#elif !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx__PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_NewWithPosOnlyArgs(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#else
+  #define __Pyx__PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+static PyObject* __Pyx_PyCode_New(
+        const __Pyx_PyCode_New_function_description descr,
+        PyObject * const *varnames,
+        PyObject *filename,
+        PyObject *funcname,
+        PyObject *line_table,
+        PyObject *tuple_dedup_map
+) {
+    PyObject *code_obj = NULL, *varnames_tuple_dedup = NULL, *code_bytes = NULL;
+    Py_ssize_t var_count = (Py_ssize_t) descr.nlocals;
+    PyObject *varnames_tuple = PyTuple_New(var_count);
+    if (unlikely(!varnames_tuple)) return NULL;
+    for (Py_ssize_t i=0; i < var_count; i++) {
+        Py_INCREF(varnames[i]);
+        if (__Pyx_PyTuple_SET_ITEM(varnames_tuple, i, varnames[i]) != (0)) goto done;
+    }
+    #if CYTHON_COMPILING_IN_LIMITED_API
+    varnames_tuple_dedup = PyDict_GetItem(tuple_dedup_map, varnames_tuple);
+    if (!varnames_tuple_dedup) {
+        if (unlikely(PyDict_SetItem(tuple_dedup_map, varnames_tuple, varnames_tuple) < 0)) goto done;
+        varnames_tuple_dedup = varnames_tuple;
+    }
+    #else
+    varnames_tuple_dedup = PyDict_SetDefault(tuple_dedup_map, varnames_tuple, varnames_tuple);
+    if (unlikely(!varnames_tuple_dedup)) goto done;
+    #endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(varnames_tuple_dedup);
+    #endif
+    if (__PYX_LIMITED_VERSION_HEX >= (0x030b0000) && line_table != NULL && !CYTHON_COMPILING_IN_GRAAL) {
+        Py_ssize_t line_table_length = __Pyx_PyBytes_GET_SIZE(line_table);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(line_table_length == -1)) goto done;
+        #endif
+        Py_ssize_t code_len = (line_table_length * 2 + 4) & ~3LL;
+        code_bytes = PyBytes_FromStringAndSize(NULL, code_len);
+        if (unlikely(!code_bytes)) goto done;
+        char* c_code_bytes = PyBytes_AsString(code_bytes);
+        if (unlikely(!c_code_bytes)) goto done;
+        memset(c_code_bytes, 0, (size_t) code_len);
+    }
+    code_obj = (PyObject*) __Pyx__PyCode_New(
+        (int) descr.argcount,
+        (int) descr.num_posonly_args,
+        (int) descr.num_kwonly_args,
+        (int) descr.nlocals,
+        0,
+        (int) descr.flags,
+        code_bytes ? code_bytes : __pyx_mstate_global->__pyx_empty_bytes,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        varnames_tuple_dedup,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        filename,
+        funcname,
+        (int) descr.first_line,
+        (__PYX_LIMITED_VERSION_HEX >= (0x030b0000) && line_table) ? line_table : __pyx_mstate_global->__pyx_empty_bytes
+    );
+done:
+    Py_XDECREF(code_bytes);
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_XDECREF(varnames_tuple_dedup);
+    #endif
+    Py_DECREF(varnames_tuple);
+    return code_obj;
+}
+
+/* DecompressString */
+CYTHON_UNUSED
+static CYTHON_SMALL_CODE PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo) {
+#ifdef __Pyx_DecompressString_UNUSED
+    CYTHON_UNUSED_VAR(s);
+    CYTHON_UNUSED_VAR(length);
+    CYTHON_UNUSED_VAR(algo);
+    return NULL;
+#else
+    PyObject *module = NULL, *decompress, *compressed_bytes, *decompressed;
+    const char* module_name = algo == 3 ? "compression.zstd" : algo == 2 ? "bz2" : "zlib";
+    PyObject *methodname = PyUnicode_FromString("decompress");
+    if (unlikely(!methodname)) return NULL;
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030e0000
+    if (algo == 3) {
+        PyObject *fromlist = Py_BuildValue("[O]", methodname);
+        if (unlikely(!fromlist)) goto bad;
+        module = PyImport_ImportModuleLevel("compression.zstd", NULL, NULL, fromlist, 0);
+        Py_DECREF(fromlist);
+    } else
+    #endif
+        module = PyImport_ImportModule(module_name);
+    if (unlikely(!module)) goto import_failed;
+    decompress = PyObject_GetAttr(module, methodname);
+    if (unlikely(!decompress)) goto import_failed;
+    {
+        #ifdef __cplusplus
+            char *memview_bytes = const_cast<char*>(s);
+        #else
+            #if defined(__clang__)
+              #pragma clang diagnostic push
+              #pragma clang diagnostic ignored "-Wcast-qual"
+            #elif !defined(__INTEL_COMPILER) && defined(__GNUC__)
+              #pragma GCC diagnostic push
+              #pragma GCC diagnostic ignored "-Wcast-qual"
+            #endif
+            char *memview_bytes = (char*) s;
+            #if defined(__clang__)
+              #pragma clang diagnostic pop
+            #elif !defined(__INTEL_COMPILER) && defined(__GNUC__)
+              #pragma GCC diagnostic pop
+            #endif
+        #endif
+        #if CYTHON_COMPILING_IN_LIMITED_API && !defined(PyBUF_READ)
+        int memview_flags = 0x100;
+        #else
+        int memview_flags = PyBUF_READ;
+        #endif
+        compressed_bytes = PyMemoryView_FromMemory(memview_bytes, length, memview_flags);
+    }
+    if (unlikely(!compressed_bytes)) {
+        Py_DECREF(decompress);
+        goto bad;
+    }
+    decompressed = PyObject_CallFunctionObjArgs(decompress, compressed_bytes, NULL);
+    Py_DECREF(compressed_bytes);
+    Py_DECREF(decompress);
+    Py_DECREF(module);
+    Py_DECREF(methodname);
+    return decompressed;
+import_failed:
+    PyErr_Format(PyExc_ImportError,
+        "Failed to import '%.20s.decompress' - cannot initialise module strings. "
+        "String compression was configured with the C macro 'CYTHON_COMPRESS_STRINGS=%d'.",
+        module_name, algo);
+bad:
+    Py_XDECREF(module);
+    Py_DECREF(methodname);
+    return NULL;
+#endif
+}
+
+/* DecompressString_LZSS */
+#ifndef __Pyx_DecompressString_LZSS_UNUSED
+CYTHON_UNUSED
+static CYTHON_SMALL_CODE size_t __pyx_lzss_decompress(const uint8_t* src, uint8_t* dst, size_t dst_len) {
+    size_t pos = 0, out_pos = 0;
+    while (1) {
+        uint32_t flags = src[pos++] | 0xFF00;
+        while (flags & 0x100) {
+            if (flags & 1) {
+                dst[out_pos++] = src[pos++];
+            } else {
+                uint32_t lo = src[pos++], hi = src[pos++];
+                uint32_t end_offset_of_last_occurrence, match_length;
+                if (!(lo & 0x80)) {
+                    end_offset_of_last_occurrence = lo;
+                    match_length = hi;
+                } else if (!(hi & 0x80)) {
+                    end_offset_of_last_occurrence = 0x80 + (((hi << 2) & 0x180) | (lo & 0x7F));
+                    match_length = hi & 0x1F;
+                } else {
+                    end_offset_of_last_occurrence = 0x80 + ((hi & 0x7F) << 7 | (lo & 0x7F));
+                    match_length = src[pos++];
+                }
+                match_length += 3;
+                size_t ref_pos = out_pos - end_offset_of_last_occurrence - match_length;
+                memcpy(dst + out_pos, dst + ref_pos, match_length);
+                out_pos += match_length;
+            }
+            if (out_pos >= dst_len) return pos;
+            flags >>= 1;
+        }
+    }
+}
+#endif
+static CYTHON_SMALL_CODE PyObject *__Pyx_DecompressString_LZSS(const char *s, size_t compressed_length, size_t uncompressed_length) {
+#ifdef __Pyx_DecompressString_LZSS_UNUSED
+    CYTHON_UNUSED_VAR(s);
+    CYTHON_UNUSED_VAR(compressed_length);
+    CYTHON_UNUSED_VAR(uncompressed_length);
+    return NULL;
+#else
+    PyObject *result;
+    unsigned char *result_data;
+    size_t src_length;
+    result = PyBytes_FromStringAndSize(NULL, (Py_ssize_t) uncompressed_length);
+    if (unlikely(!result)) return NULL;
+    result_data = __Pyx_PyBytes_AsWritableUString(result);
+    if (unlikely(!result_data)) goto bad;
+    src_length = __pyx_lzss_decompress((const uint8_t*) s, result_data, uncompressed_length);
+    if (unlikely(src_length != compressed_length)) goto decompression_failed;
+    return result;
+decompression_failed:
+    PyErr_SetString(PyExc_RuntimeError, "LZSS string data decompression failed");
+bad:
+    Py_DECREF(result);
+    return NULL;
+#endif
+}
+
+#include <string.h>
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s) {
+    size_t len = strlen(s);
+    if (unlikely(len > (size_t) PY_SSIZE_T_MAX)) {
+        PyErr_SetString(PyExc_OverflowError, "byte string is too long");
+        return -1;
+    }
+    return (Py_ssize_t) len;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return PyByteArray_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {
+        const char* result;
+        Py_ssize_t unicode_length;
+        CYTHON_MAYBE_UNUSED_VAR(unicode_length); // only for __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        #if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+        if (unlikely(PyArg_Parse(o, "s#", &result, length) < 0)) return NULL;
+        #else
+        result = PyUnicode_AsUTF8AndSize(o, length);
+        #endif
+        #if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        unicode_length = PyUnicode_GetLength(o);
+        if (unlikely(unicode_length < 0)) return NULL;
+        if (unlikely(unicode_length != *length)) {
+            PyUnicode_AsASCIIString(o);
+            return NULL;
+        }
+        #endif
+        return result;
+    }
+#else
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+#endif
+}
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+    if (PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+    if (PyByteArray_Check(o)) {
+#if (CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS) || (CYTHON_COMPILING_IN_PYPY && (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE)))
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+#else
+        *length = PyByteArray_Size(o);
+        if (*length == -1) return NULL;
+        return PyByteArray_AsString(o);
+#endif
+    } else
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_LongWrongResultType(PyObject* result) {
+    __Pyx_TypeName result_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(result));
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!result_type_name)) goto bad;
+    #endif
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ").  "
+                "The ability to return an instance of a strict subclass of int is deprecated, "
+                "and may be removed in a future version of Python.",
+                result_type_name)) {
+            __Pyx_DECREF_TypeName(result_type_name);
+            goto bad;
+        }
+        __Pyx_DECREF_TypeName(result_type_name);
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ")",
+                 result_type_name);
+    __Pyx_DECREF_TypeName(result_type_name);
+bad:
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  PyObject *res = NULL;
+  if (likely(PyLong_Check(x)))
+      return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  if (likely(m && m->nb_int)) {
+      res = m->nb_int(x);
+  }
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+      res = PyNumber_Long(x);
+  }
+#endif
+  if (likely(res)) {
+      if (unlikely(!PyLong_CheckExact(res))) {
+          return __Pyx_PyNumber_LongWrongResultType(res);
+      }
+  }
+  else if (!PyErr_Occurred()) {
+      PyErr_SetString(PyExc_TypeError,
+                      "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyLong_AsSsize_t(PyObject* b) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    Py_ssize_t ival;
+    const Py_ssize_t size = __Pyx_PyLong_DigitCount(b);
+    const int is_neg = __Pyx_PyLong_IsNeg(b);
+    const digit* digits = __Pyx_PyLong_Digits(b);
+    if (size == 0) return 0;
+    #if SIZEOF_SIZE_T * 8 > 1 * PyLong_SHIFT
+    if (size == 1) {
+        ival = (Py_ssize_t) (((size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 2 * PyLong_SHIFT
+    if (size == 2) {
+        ival = (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 3 * PyLong_SHIFT
+    if (size == 3) {
+        ival = (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 4 * PyLong_SHIFT
+    if (size == 4) {
+        ival = (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+        return PyLong_AsSsize_t(b);
+    return is_neg ? -ival : ival;
+    #else
+    return PyLong_AsSsize_t(b);
+    #endif
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+    if (likely(PyLong_Check(b))) {
+        return __Pyx_PyLong_AsSsize_t(b);
+    } else {
+        Py_ssize_t ival;
+        PyObject *x = PyNumber_Index(b);
+        if (unlikely(!x)) return -1;
+        ival = __Pyx_PyLong_AsSsize_t(x);
+        Py_DECREF(x);
+        return ival;
+    }
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyLong_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b) {
+    CYTHON_UNUSED_VAR(b);
+    return __Pyx_NewRef(Py_None);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return __Pyx_NewRef(b ? Py_True: Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t ival) {
+    return PyLong_FromSize_t(ival);
+}
+
+
+/* MultiPhaseInitModuleState */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#ifndef CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#if (CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX >= 0x030C0000)
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 1
+#else
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 0
+#endif
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE && !CYTHON_ATOMICS
+#error "Module state with PEP489 requires atomics. Currently that's one of\
+ C11, C++11, gcc atomic intrinsics or MSVC atomic intrinsics"
+#endif
+#if !CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#define __Pyx_ModuleStateLookup_Lock()
+#define __Pyx_ModuleStateLookup_Unlock()
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+static PyMutex __Pyx_ModuleStateLookup_mutex = {0};
+#define __Pyx_ModuleStateLookup_Lock() PyMutex_Lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() PyMutex_Unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(__cplusplus) && __cplusplus >= 201103L
+#include <mutex>
+static std::mutex __Pyx_ModuleStateLookup_mutex;
+#define __Pyx_ModuleStateLookup_Lock() __Pyx_ModuleStateLookup_mutex.lock()
+#define __Pyx_ModuleStateLookup_Unlock() __Pyx_ModuleStateLookup_mutex.unlock()
+#elif defined(__STDC_VERSION__) && (__STDC_VERSION__ > 201112L) && !defined(__STDC_NO_THREADS__)
+#include <threads.h>
+static mtx_t __Pyx_ModuleStateLookup_mutex;
+static once_flag __Pyx_ModuleStateLookup_mutex_once_flag = ONCE_FLAG_INIT;
+static void __Pyx_ModuleStateLookup_initialize_mutex(void) {
+    mtx_init(&__Pyx_ModuleStateLookup_mutex, mtx_plain);
+}
+#define __Pyx_ModuleStateLookup_Lock()\
+  call_once(&__Pyx_ModuleStateLookup_mutex_once_flag, __Pyx_ModuleStateLookup_initialize_mutex);\
+  mtx_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() mtx_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(HAVE_PTHREAD_H)
+#include <pthread.h>
+static pthread_mutex_t __Pyx_ModuleStateLookup_mutex = PTHREAD_MUTEX_INITIALIZER;
+#define __Pyx_ModuleStateLookup_Lock() pthread_mutex_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() pthread_mutex_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(_WIN32)
+#include <Windows.h>  // synchapi.h on its own doesn't work
+static SRWLOCK __Pyx_ModuleStateLookup_mutex = SRWLOCK_INIT;
+#define __Pyx_ModuleStateLookup_Lock() AcquireSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() ReleaseSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#else
+#error "No suitable lock available for CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE.\
+ Requires C standard >= C11, or C++ standard >= C++11,\
+ or pthreads, or the Windows 32 API, or Python >= 3.13."
+#endif
+typedef struct {
+    int64_t id;
+    PyObject *module;
+} __Pyx_InterpreterIdAndModule;
+typedef struct {
+    char interpreter_id_as_index;
+    Py_ssize_t count;
+    Py_ssize_t allocated;
+    __Pyx_InterpreterIdAndModule table[1];
+} __Pyx_ModuleStateLookupData;
+#define __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE 32
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_int_type __Pyx_ModuleStateLookup_read_counter = 0;
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_ptr_type __Pyx_ModuleStateLookup_data = 0;
+#else
+static __Pyx_ModuleStateLookupData* __Pyx_ModuleStateLookup_data = NULL;
+#endif
+static __Pyx_InterpreterIdAndModule* __Pyx_State_FindModuleStateLookupTableLowerBound(
+        __Pyx_InterpreterIdAndModule* table,
+        Py_ssize_t count,
+        int64_t interpreterId) {
+    __Pyx_InterpreterIdAndModule* begin = table;
+    __Pyx_InterpreterIdAndModule* end = begin + count;
+    if (begin->id == interpreterId) {
+        return begin;
+    }
+    while ((end - begin) > __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+        __Pyx_InterpreterIdAndModule* halfway = begin + (end - begin)/2;
+        if (halfway->id == interpreterId) {
+            return halfway;
+        }
+        if (halfway->id < interpreterId) {
+            begin = halfway;
+        } else {
+            end = halfway;
+        }
+    }
+    for (; begin < end; ++begin) {
+        if (begin->id >= interpreterId) return begin;
+    }
+    return begin;
+}
+static PyObject *__Pyx_State_FindModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return NULL;
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData* data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+    {
+        __pyx_atomic_incr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        if (likely(data)) {
+            __Pyx_ModuleStateLookupData* new_data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_acquire(&__Pyx_ModuleStateLookup_data);
+            if (likely(data == new_data)) {
+                goto read_finished;
+            }
+        }
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        __Pyx_ModuleStateLookup_Lock();
+        __pyx_atomic_incr_relaxed(&__Pyx_ModuleStateLookup_read_counter);
+        data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+        __Pyx_ModuleStateLookup_Unlock();
+    }
+  read_finished:;
+#else
+    __Pyx_ModuleStateLookupData* data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_InterpreterIdAndModule* found = NULL;
+    if (unlikely(!data)) goto end;
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            found = data->table+interpreter_id;
+        }
+    } else {
+        found = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+    }
+  end:
+    {
+        PyObject *result=NULL;
+        if (found && found->id == interpreter_id) {
+            result = found->module;
+        }
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+#endif
+        return result;
+    }
+}
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static void __Pyx_ModuleStateLookup_wait_until_no_readers(void) {
+    while (__pyx_atomic_load(&__Pyx_ModuleStateLookup_read_counter) != 0);
+}
+#else
+#define __Pyx_ModuleStateLookup_wait_until_no_readers()
+#endif
+static int __Pyx_State_AddModuleInterpIdAsIndex(__Pyx_ModuleStateLookupData **old_data, PyObject* module, int64_t interpreter_id) {
+    Py_ssize_t to_allocate = (*old_data)->allocated;
+    while (to_allocate <= interpreter_id) {
+        if (to_allocate == 0) to_allocate = 1;
+        else to_allocate *= 2;
+    }
+    __Pyx_ModuleStateLookupData *new_data = *old_data;
+    if (to_allocate != (*old_data)->allocated) {
+         new_data = (__Pyx_ModuleStateLookupData *)realloc(
+            *old_data,
+            sizeof(__Pyx_ModuleStateLookupData)+(to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+        if (!new_data) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (Py_ssize_t i = new_data->allocated; i < to_allocate; ++i) {
+            new_data->table[i].id = i;
+            new_data->table[i].module = NULL;
+        }
+        new_data->allocated = to_allocate;
+    }
+    new_data->table[interpreter_id].module = module;
+    if (new_data->count < interpreter_id+1) {
+        new_data->count = interpreter_id+1;
+    }
+    *old_data = new_data;
+    return 0;
+}
+static void __Pyx_State_ConvertFromInterpIdAsIndex(__Pyx_ModuleStateLookupData *data) {
+    __Pyx_InterpreterIdAndModule *read = data->table;
+    __Pyx_InterpreterIdAndModule *write = data->table;
+    __Pyx_InterpreterIdAndModule *end = read + data->count;
+    for (; read<end; ++read) {
+        if (read->module) {
+            write->id = read->id;
+            write->module = read->module;
+            ++write;
+        }
+    }
+    data->count = write - data->table;
+    for (; write<end; ++write) {
+        write->id = 0;
+        write->module = NULL;
+    }
+    data->interpreter_id_as_index = 0;
+}
+static int __Pyx_State_AddModule(PyObject* module, CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    int result = 0;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *old_data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *old_data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_ModuleStateLookupData *new_data = old_data;
+    if (!new_data) {
+        new_data = (__Pyx_ModuleStateLookupData *)calloc(1, sizeof(__Pyx_ModuleStateLookupData));
+        if (!new_data) {
+            result = -1;
+            PyErr_NoMemory();
+            goto end;
+        }
+        new_data->allocated = 1;
+        new_data->interpreter_id_as_index = 1;
+    }
+    __Pyx_ModuleStateLookup_wait_until_no_readers();
+    if (new_data->interpreter_id_as_index) {
+        if (interpreter_id < __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+            result = __Pyx_State_AddModuleInterpIdAsIndex(&new_data, module, interpreter_id);
+            goto end;
+        }
+        __Pyx_State_ConvertFromInterpIdAsIndex(new_data);
+    }
+    {
+        Py_ssize_t insert_at = 0;
+        {
+            __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+                new_data->table, new_data->count, interpreter_id);
+            assert(lower_bound);
+            insert_at = lower_bound - new_data->table;
+            if (unlikely(insert_at < new_data->count && lower_bound->id == interpreter_id)) {
+                lower_bound->module = module;
+                goto end;  // already in table, nothing more to do
+            }
+        }
+        if (new_data->count+1 >= new_data->allocated) {
+            Py_ssize_t to_allocate = (new_data->count+1)*2;
+            new_data =
+                (__Pyx_ModuleStateLookupData*)realloc(
+                    new_data,
+                    sizeof(__Pyx_ModuleStateLookupData) +
+                    (to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+            if (!new_data) {
+                result = -1;
+                new_data = old_data;
+                PyErr_NoMemory();
+                goto end;
+            }
+            new_data->allocated = to_allocate;
+        }
+        ++new_data->count;
+        int64_t last_id = interpreter_id;
+        PyObject *last_module = module;
+        for (Py_ssize_t i=insert_at; i<new_data->count; ++i) {
+            int64_t current_id = new_data->table[i].id;
+            new_data->table[i].id = last_id;
+            last_id = current_id;
+            PyObject *current_module = new_data->table[i].module;
+            new_data->table[i].module = last_module;
+            last_module = current_module;
+        }
+    }
+  end:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, new_data);
+#else
+    __Pyx_ModuleStateLookup_data = new_data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return result;
+}
+static int __Pyx_State_RemoveModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *data = __Pyx_ModuleStateLookup_data;
+#endif
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            data->table[interpreter_id].module = NULL;
+        }
+        goto done;
+    }
+    {
+        __Pyx_ModuleStateLookup_wait_until_no_readers();
+        __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+        if (!lower_bound) goto done;
+        if (lower_bound->id != interpreter_id) goto done;
+        __Pyx_InterpreterIdAndModule *end = data->table+data->count;
+        for (;lower_bound<end-1; ++lower_bound) {
+            lower_bound->id = (lower_bound+1)->id;
+            lower_bound->module = (lower_bound+1)->module;
+        }
+    }
+    --data->count;
+    if (data->count == 0) {
+        free(data);
+        data = NULL;
+    }
+  done:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, data);
+#else
+    __Pyx_ModuleStateLookup_data = data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return 0;
+}
+#endif
+
+/* #### Code section: utility_code_pragmas_end ### */
+#ifdef _MSC_VER
+#pragma warning( pop )
+#endif
+
+
+
+/* #### Code section: end ### */
+#endif /* Py_PYTHON_H */
@@ -29,11 +29,14 @@ from sonolus.backend._opt.lower cimport (
     if_convert,
     lower_from_ssa,
 )
-from sonolus.backend._opt.emit cimport emit_func
+from sonolus.backend._opt.emit cimport emit_func, emit_func_located
 
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-from sonolus.backend._opt.ir import marshal_in, register_phase, to_basic_blocks
+from sonolus.backend._opt.ir import func_from_bytes, marshal_in, register_phase, to_basic_blocks
+from sonolus.backend._opt.nodes import NodeTable
+from sonolus.backend.optimize.cache import decode_node, encode_node
 from sonolus.backend.optimize.flow import cfg_to_text
 from sonolus.backend.optimize import profiling as _prof
 
@@ -214,6 +217,14 @@ cdef Func _pipeline(Func func, int level, bint allocate):
 # Python-callable entry points (used by the optimize/__init__ shim).
 # --------------------------------------------------------------------------
 
+cdef Func _as_arena(entry, mode, callback):
+    # ``entry`` is a BasicBlock CFG, or an arena the frontend traced straight into
+    # (``marshal_context``) for the same mode and callback.
+    if isinstance(entry, Func):
+        return <Func>entry
+    return <Func>marshal_in(entry, mode, callback)
+
+
 def run_pipeline_cfg(entry, level, mode=None, callback=None, allocate=True):
     """marshal_in -> level pipeline -> (allocate) -> to_basic_blocks.
 
@@ -234,18 +245,72 @@ def run_pipeline_cfg(entry, level, mode=None, callback=None, allocate=True):
     return bb
 
 
-def optimize_and_finalize_cfg(entry, level, mode=None, callback=None):
-    """marshal_in -> level pipeline -> allocate -> emit (fused; no export)."""
+def optimize_and_finalize_cfg(entry, level, mode=None, callback=None, cache=None, attribution=None, shared=None):
+    """marshal_in -> level pipeline -> allocate -> emit (fused; no export).
+
+    ``entry`` may also be an arena ``Func`` from ``marshal_context``, which is
+    optimized as is (and consumed). With a ``CompileCache`` (sonolus/backend/optimize/cache.py), the marshalled
+    arena is hashed after marshal-in; a hit returns the cached node without
+    running the pipeline or emit, and a miss stores the emitted node. A
+    ``SharedNodes`` table of the build is looked up before the cache and
+    stores nodes from both, so a callback that traces to the same arena as one
+    optimized earlier in the build (e.g. in another mode) reuses its node.
+
+    With an ``attribution`` dict neither is used (a cached node carries no
+    locations); if the CFG carries ``statement_locs``, the dict is updated with
+    the emitted node's counts per source location (``_attribute``).
+    """
     cdef int lvl = _level_code(level)
     cdef bint prof = _prof.enabled
     cdef long long t0 = 0
     if prof: t0 = _prof.now_ns()
-    cdef Func func = <Func>marshal_in(entry, mode, callback)
+    cdef Func func = _as_arena(entry, mode, callback)
     if prof: _prof.record("marshal_in", _prof.now_ns() - t0)
+    key = None
+    shared_key = None
+    if (cache is not None or shared is not None) and attribution is None:
+        if prof: t0 = _prof.now_ns()
+        digest = func.digest()
+        node = None
+        if shared is not None:
+            shared_key = shared.key(digest, level)
+            node = shared.get(shared_key)
+        if node is None and cache is not None:
+            key = cache.key(digest, level, mode, callback)
+            node = cache.get(key)
+            if node is not None and shared_key is not None:
+                shared.put(shared_key, node)
+        if prof: _prof.record("opt_cache", _prof.now_ns() - t0)
+        if node is not None:
+            return node
     cdef Func result = _pipeline(func, lvl, True)
     if prof: t0 = _prof.now_ns()
-    node = emit_func(result)
+    if attribution is not None and result.locs != NULL:
+        node = _attribute(result, mode, callback, attribution)
+    else:
+        node = emit_func(result)
     if prof: _prof.record("emit", _prof.now_ns() - t0)
+    if shared_key is not None:
+        shared.put(shared_key, node)
+    if key is not None:
+        if prof: t0 = _prof.now_ns()
+        cache.put(key, node)
+        if prof: _prof.record("opt_cache", _prof.now_ns() - t0)
+    return node
+
+
+cdef object _attribute(Func func, mode, callback, dict attribution):
+    """Emit ``func`` and add its node counts per source location to ``attribution``."""
+    global _ATTRIBUTE_NODE
+    if _ATTRIBUTE_NODE is None:
+        from sonolus.build.report import attribute_node as _an
+        _ATTRIBUTE_NODE = _an
+    cdef dict node_locs = {}
+    node = emit_func_located(func, node_locs)
+    for loc, counts in _ATTRIBUTE_NODE(node, node_locs, mode, callback).items():
+        total = attribution.setdefault(loc, [0, 0])
+        total[0] += counts[0]
+        total[1] += counts[1]
     return node
 
 
@@ -259,38 +324,77 @@ def optimize_and_finalize_cfg(entry, level, mode=None, callback=None):
 #
 # Result-dict shapes: archetype callbacks -> {"index", "order"}; global
 # callbacks -> bare node index.
+#
+# ``cache`` (a ``CompileCache`` or None) is handed through to
+# ``optimize_and_finalize``; callbacks are still traced and marshalled on a hit,
+# since the arena digest is the cache key. So is ``project_state.shared_nodes``
+# (a ``SharedNodes`` set by ``ProjectContextState.from_build_config``), through
+# which a callback that traces to the same arena as one optimized earlier in
+# the build -- commonly the same callback body in another mode -- reuses its
+# node.
+#
+# ``jobs > 1`` splits the per-callback work into two phases: every callback is
+# traced first (serially, in the fixed order below), then the traced CFGs are
+# optimized+emitted on a ``jobs``-thread pool. The arena passes share no mutable
+# state (see ir.pxd) and their ``nogil`` regions release the GIL, so callbacks
+# overlap there (and fully, on a free-threaded interpreter). Nodes are still
+# registered into the mode's ``NodeTable`` in trace order, so the output is
+# byte-identical to the serial (``jobs == 1``) build, which keeps the lower peak
+# memory of optimizing each CFG right after it is traced.
+#
+# ``workers > 1`` takes the same two-phase route but optimizes on a process
+# pool instead (taking precedence over ``jobs``): each traced CFG is marshalled
+# here and shipped as a ``Func.to_bytes`` arena, and the worker sends the
+# emitted node back as an ``encode_node`` table. This sidesteps the GIL for the
+# parts of the pipeline that still hold it, at the cost of process start-up.
+#
+# With node attribution on (``project_state.source_locations`` set next to a
+# ``compile_report``, CLI --node-attribution), every callback is optimized past
+# the cache and its emitted nodes are counted per source line; process workers
+# count them before encoding the node and send the counts back with it.
+#
+# With cost budgets configured (``project_state.cost_budget``, from
+# ``BuildConfig.cost_budgets``), each emitted node's estimated runtime cost is
+# checked against its callback's budget as it is registered.
+#
+# With timeline profiling on (``profiling.enable_trace``, CLI --profile-trace),
+# the whole mode and each callback's tracing, optimization and node
+# registration run in ``profiling`` scopes, so every stage sample is attributed
+# to its (mode, archetype, callback); process workers send their events back
+# with the emitted node.
 # --------------------------------------------------------------------------
 
 # Lazily-populated Python deps (avoid import-time cycles / heavy top-level imports).
 _MODE_STATE = None
-_OUTPUT_GEN = None
 _OPT_CONFIG = None
 _OPT_FINALIZE = None
 _STANDARD_LEVEL = None
 _PLAY_MODE = None
 _COMPILATION_ERROR = None
+_LEVEL_NAME = None
+_ATTRIBUTE_NODE = None
 
 
 cdef _ensure_compile_deps():
-    global _MODE_STATE, _OUTPUT_GEN, _OPT_CONFIG, _OPT_FINALIZE, _STANDARD_LEVEL, _PLAY_MODE
-    global _COMPILATION_ERROR
+    global _MODE_STATE, _OPT_CONFIG, _OPT_FINALIZE, _STANDARD_LEVEL, _PLAY_MODE
+    global _COMPILATION_ERROR, _LEVEL_NAME
     if _MODE_STATE is None:
         from sonolus.backend.optimize import (
             STANDARD_PASSES as _sp,
             OptimizerConfig as _oc,
+            _level_name as _ln,
             optimize_and_finalize as _of,
         )
         from sonolus.backend.mode import Mode as _mode
-        from sonolus.build.node import OutputNodeGenerator as _og
         from sonolus.script.internal.context import ModeContextState as _ms
         from sonolus.script.internal.error import CompilationError as _ce
         _MODE_STATE = _ms
-        _OUTPUT_GEN = _og
         _OPT_CONFIG = _oc
         _OPT_FINALIZE = _of
         _STANDARD_LEVEL = _sp
         _PLAY_MODE = _mode.PLAY
         _COMPILATION_ERROR = _ce
+        _LEVEL_NAME = _ln
 
 
 def compile_mode(
@@ -301,34 +405,119 @@ def compile_mode(
     callback_to_cfg,
     level=None,
     validate_only=False,
+    jobs=1,
+    cache=None,
+    workers=1,
 ):
     _ensure_compile_deps()
     if level is None:
         level = _STANDARD_LEVEL
 
+    with _prof.span(getattr(mode, "name", str(mode)), "mode"):
+        return _compile_mode(
+            mode, project_state, archetypes, global_callbacks, callback_to_cfg, level, validate_only, jobs, cache, workers
+        )
+
+
+def _compile_mode(
+    mode,
+    project_state,
+    archetypes,
+    global_callbacks,
+    callback_to_cfg,
+    level,
+    validate_only,
+    jobs,
+    cache,
+    workers,
+):
     mode_state = _MODE_STATE(mode, archetypes)
-    nodes = _OUTPUT_GEN()
+    nodes = NodeTable()
     results = {}
-
-    def optimize_cfg(cfg, cb_name):
+    # (target dict, key, cfg, callback name, reuse, archetype name) for each traced
+    # callback awaiting optimization; only used by the parallel (jobs/workers > 1) paths.
+    pending = []
+    cdef bint deferred = (jobs > 1 or workers > 1) and not validate_only
+    trace_cache = None if validate_only else project_state.trace_cache
+    report = None if validate_only else project_state.compile_report
+    shared = None if validate_only else project_state.shared_nodes
+    budget = None if validate_only else project_state.cost_budget
+    source_locations = None if report is None else project_state.source_locations
+    # (archetype name, callback name) -> {location id: [emitted, effective]}
+    attributions = None if source_locations is None else {}
+
+    def trace(cb, cb_name, archetype):
+        """Trace one callback -> ``(cfg, reuse)``.
+
+        Without a trace cache ``reuse`` is None. With one (the dev server's
+        incremental rebuilds, see sonolus/build/incremental.py), a callback whose
+        dependencies are unchanged is not traced: ``cfg`` is None and ``reuse`` is
+        its recorded node. Otherwise ``reuse`` is the recorder that keeps the node
+        for the next rebuild once it is emitted."""
+        if trace_cache is None:
+            return callback_to_cfg(project_state, mode_state, cb, cb_name, archetype), None
+        node = trace_cache.lookup(project_state, mode_state, archetype, cb_name, level)
+        if node is not None:
+            return None, node
+        recorder = trace_cache.recorder(project_state, mode_state, archetype, cb_name, level)
+        with recorder.installed(project_state):
+            cfg = callback_to_cfg(project_state, mode_state, cb, cb_name, archetype)
+        return cfg, recorder
+
+    def emit_traced(cfg, reuse, cb_name, arch_name):
+        """optimize+emit the result of ``trace`` (serial path)."""
+        if cfg is None:
+            return reuse
+        node = optimize_cfg(cfg, cb_name, arch_name)
+        if reuse is not None:
+            reuse.store(node)
+        return node
+
+    def optimize_cfg(cfg, cb_name, arch_name):
         """optimize + emit for one already-traced CFG -> its EngineNode.
 
         Failures are wrapped with the callback name and mode as a
         CompilationError so the cli/dev-server pretty handlers catch them."""
         try:
-            return _OPT_FINALIZE(cfg, level, _OPT_CONFIG(mode=mode, callback=cb_name))
+            attribution = None
+            if attributions is not None:
+                attribution = attributions[arch_name, cb_name] = {}
+            with _prof.callback_scope(mode, arch_name, cb_name):
+                return _OPT_FINALIZE(
+                    cfg,
+                    level,
+                    _OPT_CONFIG(mode=mode, callback=cb_name),
+                    cache=cache,
+                    attribution=attribution,
+                    shared=shared,
+                )
         except _COMPILATION_ERROR:
             raise
         except Exception as e:
-            raise _COMPILATION_ERROR(
-                f"Optimization failed for callback {cb_name!r} in {getattr(mode, 'name', mode)} mode: {e}"
-            ) from e
+            raise _optimization_error(e, cb_name, mode) from e
+
+    def register(node, cb_name, arch_name):
+        """Add an emitted callback node to the mode's ``NodeTable`` -> its root index."""
+        if report is not None:
+            attribution = None if attributions is None else attributions.get((arch_name, cb_name))
+            if attribution is not None:
+                attribution = source_locations.resolve(attribution)
+            report.add(mode, arch_name, cb_name, node, attribution)
+        if budget is not None:
+            budget.check(mode, arch_name, cb_name, node)
+        if not _prof.enabled:
+            return nodes.add(node)
+        with _prof.callback_scope(mode, arch_name, cb_name):
+            t0 = _prof.now_ns()
+            index = nodes.add(node)
+            _prof.record("nodes", _prof.now_ns() - t0)
+        return index
 
     # DETERMINISM: ``callback_to_cfg`` populates shared, first-touch-ordered maps
     # -- ``project_state`` ROM / const / debug-string indices and ``mode_state``
     # global-memory offsets. Tracing callbacks in one fixed serial order makes
     # those first-touch assignments deterministic, and registering nodes into the
-    # shared ``OutputNodeGenerator`` in that same order makes node indices
+    # shared ``NodeTable`` in that same order makes node indices
     # deterministic too.
     base_archetype_entries = {}
 
@@ -370,10 +559,19 @@ def compile_mode(
                 cb_order = getattr(cb, "_callback_order_", 0)
                 if not cb_info.supports_order and cb_order != 0:
                     raise ValueError(f"Callback '{cb_name}' does not support a non-zero order")
-                # Trace, then optimize+emit -- always traced (validation traces too).
-                cfg = callback_to_cfg(project_state, mode_state, cb, cb_info.name, archetype)
+                # Trace, then optimize+emit -- always traced (validation traces too),
+                # unless the trace cache reuses the callback's previous output.
+                with _prof.callback_scope(mode, archetype.name, cb_info.name):
+                    cfg, reuse = trace(cb, cb_info.name, archetype)
+                if deferred:
+                    entry = {"index": 0, "order": cb_order}
+                    pending.append((entry, "index", cfg, cb_info.name, reuse, archetype.name))
+                    archetype_data[cb_info.name] = entry
+                    continue
                 archetype_data[cb_info.name] = {
-                    "index": 0 if validate_only else nodes.add(optimize_cfg(cfg, cb_info.name)),
+                    "index": 0
+                    if validate_only
+                    else register(emit_traced(cfg, reuse, cb_info.name, archetype.name), cb_info.name, archetype.name),
                     "order": cb_order,
                 }
 
@@ -381,8 +579,32 @@ def compile_mode(
 
     if global_callbacks is not None:
         for cb_info, cb in global_callbacks:
-            cfg = callback_to_cfg(project_state, mode_state, cb, cb_info.name, None)
-            results[cb_info.name] = 0 if validate_only else nodes.add(optimize_cfg(cfg, cb_info.name))
+            with _prof.callback_scope(mode, None, cb_info.name):
+                cfg, reuse = trace(cb, cb_info.name, None)
+            if deferred:
+                results[cb_info.name] = 0
+                pending.append((results, cb_info.name, cfg, cb_info.name, reuse, None))
+                continue
+            results[cb_info.name] = (
+                0 if validate_only else register(emit_traced(cfg, reuse, cb_info.name, None), cb_info.name, None)
+            )
+
+    if pending:
+        traced = [p for p in pending if p[2] is not None]
+        if workers > 1:
+            optimized = iter(
+                _optimize_in_processes(traced, _LEVEL_NAME(level), mode, workers, cache, attributions, shared)
+            )
+        else:
+            optimized = iter(_optimize_parallel(optimize_cfg, traced, jobs))
+        for target, key, cfg, cb_name, reuse, arch_name in pending:
+            if cfg is None:
+                node = reuse
+            else:
+                node = next(optimized)
+                if reuse is not None:
+                    reuse.store(node)
+            target[key] = register(node, cb_name, arch_name)
 
     if archetypes is not None:
         results["archetypes"] = [
@@ -394,6 +616,148 @@ def compile_mode(
     return results
 
 
+def _optimize_parallel(optimize_cfg, list pending, int jobs):
+    """Optimize+emit every pending ``(target, key, cfg, name, reuse, archetype)`` on a thread pool.
+
+    Returns the emitted nodes in ``pending`` order. The first failure in that
+    order is re-raised (after cancelling the not-yet-started callbacks), so error
+    reporting matches the serial build.
+    """
+    cdef list nodes = []
+    if not pending:
+        return nodes
+    with ThreadPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+        futures = [executor.submit(optimize_cfg, cfg, name, arch) for _, _, cfg, name, _, arch in pending]
+        try:
+            for future in futures:
+                nodes.append(future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return nodes
+
+
+def _optimize_in_processes(list pending, str level_name, mode, int workers, cache, attributions=None, shared=None):
+    """Optimize+emit every pending ``(target, key, cfg, name, reuse, archetype)`` on a process pool.
+
+    Marshal-in and lookups/stores in the cache and the ``shared`` nodes of the
+    build stay in this process; only misses are shipped to the workers. Returns
+    the emitted nodes in ``pending`` order, re-raising the first failure in that
+    order like ``_optimize_parallel``. With an ``attributions`` dict both are
+    skipped and each callback's node counts per location are stored in it under
+    ``(archetype, callback)``.
+    """
+    cdef bint prof = _prof.enabled
+    cdef long long t0 = 0
+    cdef list nodes = [None] * len(pending)
+    cdef list keys = [None] * len(pending)
+    cdef list shared_keys = [None] * len(pending)
+    cdef list shipped = []
+    cdef Py_ssize_t i
+    for i, (_, _, cfg, name, _, arch) in enumerate(pending):
+        try:
+            with _prof.callback_scope(mode, arch, name):
+                if prof: t0 = _prof.now_ns()
+                func = _as_arena(cfg, mode, name)
+                if prof: _prof.record("marshal_in", _prof.now_ns() - t0)
+        except _COMPILATION_ERROR:
+            raise
+        except Exception as e:
+            raise _optimization_error(e, name, mode) from e
+        if (cache is not None or shared is not None) and attributions is None:
+            digest = func.digest()
+            if shared is not None:
+                shared_keys[i] = shared.key(digest, level_name)
+                nodes[i] = shared.get(shared_keys[i])
+                if nodes[i] is not None:
+                    continue
+            if cache is not None:
+                keys[i] = cache.key(digest, level_name, mode, name)
+                nodes[i] = cache.get(keys[i])
+                if nodes[i] is not None:
+                    if shared is not None:
+                        shared.put(shared_keys[i], nodes[i])
+                    continue
+        scope = (getattr(mode, "name", str(mode)), arch, name) if _prof.tracing else None
+        shipped.append((i, name, arch, func.to_bytes(), scope))
+    if not shipped:
+        return nodes
+    with ProcessPoolExecutor(max_workers=min(workers, len(shipped))) as executor:
+        futures = [
+            (
+                i,
+                name,
+                arch,
+                executor.submit(_optimize_arena, data, level_name, scope, mode, name, attributions is not None),
+            )
+            for i, name, arch, data, scope in shipped
+        ]
+        try:
+            for i, name, arch, future in futures:
+                try:
+                    encoded, events, counts = future.result()
+                    nodes[i] = decode_node(encoded)
+                except _COMPILATION_ERROR:
+                    raise
+                except Exception as e:
+                    raise _optimization_error(e, name, mode) from e
+                if events is not None:
+                    _prof.add_events(events)
+                if counts is not None:
+                    attributions[arch, name] = counts
+                if shared_keys[i] is not None:
+                    shared.put(shared_keys[i], nodes[i])
+                if keys[i] is not None:
+                    cache.put(keys[i], nodes[i])
+        except BaseException:
+            for _, _, _, future in futures:
+                future.cancel()
+            raise
+    return nodes
+
+
+def _optimize_arena(bytes data, str level_name, scope=None, mode=None, callback=None, bint attributing=False):
+    """Worker side of ``_optimize_in_processes``: arena bytes -> ``(encoded emitted node, events, counts)``.
+
+    With a ``(mode, archetype, callback)`` ``scope`` (timeline profiling in the
+    parent), the worker records its own stage events and returns them from
+    ``profiling.take_events``; ``events`` is None otherwise. With ``attributing``
+    and an arena that carries locations, ``counts`` are the node counts per
+    location of ``_attribute``; None otherwise.
+    """
+    cdef Func func
+    cdef Func result
+    cdef long long t0 = 0
+    cdef dict counts = None
+    if scope is None:
+        func = <Func>func_from_bytes(data)
+        result = _pipeline(func, _level_code(level_name), True)
+        if attributing and result.locs != NULL:
+            counts = {}
+            return encode_node(_attribute(result, mode, callback, counts)), None, counts
+        return encode_node(emit_func(result)), None, None
+    _prof.enable_trace()
+    _prof.take_events()  # drop anything inherited from the parent or left by an earlier task
+    with _prof.callback_scope(*scope):
+        func = <Func>func_from_bytes(data)
+        result = _pipeline(func, _level_code(level_name), True)
+        t0 = _prof.now_ns()
+        if attributing and result.locs != NULL:
+            counts = {}
+            node = _attribute(result, mode, callback, counts)
+        else:
+            node = emit_func(result)
+        _prof.record("emit", _prof.now_ns() - t0)
+    return encode_node(node), _prof.take_events(), counts
+
+
+def _optimization_error(exc, cb_name, mode):
+    return _COMPILATION_ERROR(
+        f"Optimization failed for callback {cb_name!r} in {getattr(mode, 'name', mode)} mode: {exc}"
+    )
+
+
 # --------------------------------------------------------------------------
 # Debug phase registry (consulted by ir.debug_run).
 # --------------------------------------------------------------------------
@@ -6,10 +6,12 @@ for the full contract), including idempotent re-flattening of associative left
 spines during emission.
 
 ``emit_func`` is the ``cdef`` entry the fused ``optimize_and_finalize`` path
-calls directly on an already-lowered arena; ``emit_cfg`` (a ``def`` in the
-``.pyx``) is the marshal-in + emit convenience used by tests/goldens.
+calls directly on an already-lowered arena; ``emit_func_located`` additionally
+records the source location of every emitted node. ``emit_cfg`` (a ``def`` in
+the ``.pyx``) is the marshal-in + emit convenience used by tests/goldens.
 """
 
 from sonolus.backend._opt.ir cimport Func
 
 cdef object emit_func(Func func)
+cdef object emit_func_located(Func func, dict node_locs)
@@ -33,7 +33,7 @@ for the emitter's lifetime.
 Consing is applied to **all** ops, pure and impure (``Random``, ``Get`` reads,
 ``Set``/``Draw``/... stores), not just pure ones. This is correct because:
 
-* the downstream ``OutputNodeGenerator`` already dedups the emitted tree by
+* the downstream ``NodeTable`` (nodes.pyx) already dedups the emitted tree by
   structural (value) equality, so emit-level structural consing is a strict
   subset of that and cannot change the final artifact;
 * the real Sonolus runtime (and the ``interpret.py`` oracle) *re-executes* every
@@ -160,6 +160,8 @@ cdef class _Emitter:
     cdef list _pin          # keeps interned objects alive so their id() is stable
     cdef list _block_map    # old block id -> emitted index (elided -> exit index)
     cdef int32_t _exit_index  # index of the trailing halt sentinel (# emitted blocks)
+    cdef dict _locs         # id(FunctionNode) -> location id of its first emission, or None
+    cdef int32_t _cur_loc   # location of the instruction being emitted
 
     def __cinit__(self, Func func):
         self.func = func
@@ -170,6 +172,8 @@ cdef class _Emitter:
         self._pin = []
         self._block_map = None
         self._exit_index = func.n_blocks
+        self._locs = None
+        self._cur_loc = -1
 
     # -- leaf / function-node interning ------------------------------------
 
@@ -200,6 +204,8 @@ cdef class _Emitter:
             node = FunctionNode(op_member, tuple(children))
             self._fn_table[key] = node
             self._pin.append(node)
+            if self._locs is not None:
+                self._locs[id(node)] = self._cur_loc
         return node
 
     # -- numeric constant emission ----------------------------------------
@@ -237,6 +243,9 @@ cdef class _Emitter:
             return cached
         cdef uint16_t op = self.func.instrs[vid].op
         cdef object result
+        cdef int32_t outer_loc = self._cur_loc
+        if self._locs is not None and self.func.locs[vid] >= 0:
+            self._cur_loc = self.func.locs[vid]
         if op == <uint16_t>OPX_CONST:
             result = self._emit_numeric(self.func.consts[self.func.instrs[vid].aux])
         elif op == <uint16_t>OPX_GET:
@@ -245,6 +254,7 @@ cdef class _Emitter:
             raise AssertionError("OPX_SET encountered in value position")
         else:
             result = self._emit_op(vid, op)
+        self._cur_loc = outer_loc
         self._val_cache[vid] = result
         return result
 
@@ -401,6 +411,8 @@ cdef class _Emitter:
 
     cdef object _emit_stmt(self, int32_t i):
         cdef uint16_t op = self.func.instrs[i].op
+        if self._locs is not None:
+            self._cur_loc = self.func.locs[i]
         if op == <uint16_t>OPX_SET:
             return self._emit_set(i)
         # A runtime op carrying a place id (aux >= 0) is a place-based fused RMW op.
@@ -519,6 +531,7 @@ cdef class _Emitter:
         for i in range(istart, istart + icount):
             if self.func.instrs[i].flags & <int32_t>FLAG_STMT_ROOT:
                 statements.append(self._emit_stmt(i))
+        self._cur_loc = -1
         statements.append(self._emit_terminator(bid))
         return self._intern_fn(_OP_EXECUTE, statements)
 
@@ -587,6 +600,18 @@ cdef object emit_func(Func func):
     return em.run()
 
 
+cdef object emit_func_located(Func func, dict node_locs):
+    """``emit_func`` that also fills ``node_locs`` with ``{id(FunctionNode): location id}``.
+
+    ``func`` must track locations (``func.locs`` non-NULL). A node shared by several
+    instructions keeps the location of its first emission; nodes emitted for no
+    located instruction (the control-flow skeleton) get -1.
+    """
+    cdef _Emitter em = _Emitter(func)
+    em._locs = node_locs
+    return em.run()
+
+
 def emit_cfg(entry, mode=None, callback=None):
     """Marshal a Python ``BasicBlock`` CFG into the arena and emit its EngineNode.
 
@@ -149,8 +149,30 @@ temps / names
                     uniformly to v0/v1/... by first-touch order, so these source
                     names matter only for interning identity, not output.
 
+------------------------------------------------------------------------------
+locs                        optional source-location ids, parallel to instrs
+------------------------------------------------------------------------------
+* locs[i]       i32 id of the frontend source location (file, line, function)
+                instr ``i`` was traced from, or -1 (none / synthesized by a
+                pass). Ids index the ``SourceLocations`` interner of the
+                project (sonolus/build/report.py); the arena never resolves
+                them.
+
+``locs`` is NULL unless the marshalled CFG carries ``statement_locs`` (the CLI
+``--node-attribution`` flag), so the default build pays nothing for it. When set,
+``_alloc_instr`` stamps every new instruction with ``cur_loc``; passes that copy
+an instruction into a fresh arena set ``dst.cur_loc`` from the source first
+(``take_loc``), and the bulk builders fill ``locs`` alongside ``instrs``. In-place
+passes keep instruction indices, so they need no bookkeeping. ``locs`` never
+affects codegen and is left out of ``digest``.
+
 Ownership: every buffer is owned by ``Func`` and freed once in ``__dealloc__``.
 Growth doubles capacity via realloc. No per-node allocation.
+
+Serialization: ``Func.to_bytes`` packs every array field by field into int32
+words (the same packing ``digest`` hashes) plus the boundary state export needs;
+``func_from_bytes`` rebuilds an equivalent arena (minus the marshal-in interning
+dicts) and verifies it. Used to ship traced callbacks to worker processes.
 """
 
 from libc.stdint cimport int16_t, int32_t, uint8_t, uint16_t, uint32_t
@@ -275,6 +297,12 @@ cdef class Func:
         int32_t n_temps
         int32_t cap_temps
 
+        # Optional source-location id per instr (see "locs" above); NULL when
+        # locations are not tracked. ``cur_loc`` stamps new instrs.
+        int32_t* locs
+        int32_t cap_locs
+        int32_t cur_loc
+
         int32_t entry_block
 
         # SSA form: set by build_ssa, cleared by out_of_ssa / marshal_in.
@@ -305,6 +333,7 @@ cdef class Func:
 
     # Growable-buffer + interning + marshal helpers (implemented in ir.pyx).
     cdef int32_t _alloc_instr(self) except -1
+    cdef int _inherit_locs(self, Func src) except -1
     cdef int32_t _emit(self, uint16_t op, uint8_t flags, int32_t block, int32_t aux, list arg_vids) except -1
     cdef int32_t _intern_const(self, double d) except -1
     cdef int _rebuild_const_intern(self) except -1
@@ -317,7 +346,11 @@ cdef class Func:
     cdef int32_t _emit_impure(self, object node, int32_t block_id) except -1
     cdef int _emit_stmt(self, object stmt, int32_t block_id) except -1
     cdef int _push_edge(self, int32_t src, int32_t dst, object cond) except -1
+    cdef int _begin_marshal(self, object mode, object callback) except -1
+    cdef int _alloc_blocks(self, int32_t nb, bint track) except -1
+    cdef int _marshal_block(self, int32_t bid, object statements, object stmt_locs, object test, bint track) except -1
     cdef int _marshal(self, object entry, object mode, object callback) except -1
+    cdef int _marshal_context(self, list rpo_contexts, object mode, object callback) except -1
     cdef object _make_const(self, double d, bint is_int)
     cdef object _export_place(self, int32_t pid, dict names)
     cdef tuple _export_place_components(self, int32_t pid, dict names)
@@ -325,5 +358,14 @@ cdef class Func:
     cdef object _export_stmt(self, int32_t i, dict names)
     cdef object _export_fused_rmw(self, int32_t i, uint16_t op, dict names)
     cdef _assign_temp_names(self, dict names)
+    cdef bytearray _pack(self)
+    cdef int _unpack(self, bytes data) except -1
     # SSA export helpers (_export_ssa / _export_phis / _ssa_* / _dom) are plain
     # ``def`` methods in ir.pyx -- they run under the GIL at the export boundary.
+
+
+cdef inline void take_loc(Func dst, Func src, int32_t v) noexcept nogil:
+    # Stamp the next instr emitted into ``dst`` with the location of ``src`` instr
+    # ``v`` (a no-op unless ``dst`` tracks locations; see "locs" above).
+    if dst.locs != NULL:
+        dst.cur_loc = src.locs[v]
@@ -32,6 +32,11 @@ from sonolus.backend._opt._khash cimport (
     kh_put_i64i32,
 )
 
+import marshal as _marshal
+import sys as _sys
+from hashlib import blake2b as _blake2b
+from importlib import import_module as _import_module
+
 from sonolus.backend.ir import IRConst, IRGet, IRInstr, IRPureInstr, IRSet
 from sonolus.backend.ops import Op as _Op
 from sonolus.backend.place import BlockPlace, SSAPlace, TempBlock
@@ -76,6 +81,14 @@ RUNTIME_CONSTANT_BLOCKS = frozenset({
     "TutorialData",
 })
 
+# Layout version of ``Func.to_bytes``; bump when the packed layout or the
+# carried boundary state changes.
+ARENA_FORMAT_VERSION = 2
+
+cdef enum:
+    # Leading words of ``Func._pack``: seven element counts + entry/is_ssa/undef.
+    _PACK_HEADER_WORDS = 10
+
 # Canonical quiet-NaN used so all NaN constants intern to one id.
 cdef uint64_t _CANON_NAN_BITS = <uint64_t>0x7FF8000000000000
 cdef double _CANON_NAN = 0.0
@@ -123,6 +136,47 @@ def _edge_sort_key(edge):
     return (0, float(edge.cond))
 
 
+cdef list _ordered_context_edges(dict outgoing):
+    # ``(cond, target)`` pairs of a Context in ``_edge_sort_key`` order. The
+    # conditions are dict keys, so unlike FlowEdge sets they never tie.
+    if len(outgoing) <= 1:
+        return list(outgoing.items())
+    return sorted(outgoing.items(), key=_context_edge_sort_key)
+
+
+def _context_edge_sort_key(item):
+    if item[0] is None:
+        return (1, 0.0)
+    return (0, float(item[0]))
+
+
+cdef list _context_reverse_postorder(object entry):
+    # ``traverse_cfg_reverse_postorder`` over a Context graph (see flow.py for the
+    # order contract).
+    cdef set visited = {entry}
+    cdef list order = []
+    cdef list stack = [(entry, iter(_ordered_context_edges(entry.outgoing)))]
+    cdef bint descended
+    while stack:
+        node, edges = stack[len(stack) - 1]
+        descended = False
+        for _, dst in edges:
+            if dst in visited:
+                continue
+            visited.add(dst)
+            if dst.outgoing:
+                stack.append((dst, iter(_ordered_context_edges(dst.outgoing))))
+                descended = True
+                break
+            else:
+                order.append(dst)
+        if not descended:
+            order.append(node)
+            stack.pop()
+    order.reverse()
+    return order
+
+
 cdef class Func:
     """One per-callback arena. See ir.pxd for the field contract."""
 
@@ -148,6 +202,9 @@ cdef class Func:
         self.temps = NULL
         self.n_temps = 0
         self.cap_temps = 0
+        self.locs = NULL
+        self.cap_locs = 0
+        self.cur_loc = -1
         self.entry_block = 0
         self.is_ssa = False
         self.undef_val = -1
@@ -171,6 +228,7 @@ cdef class Func:
         free(self.consts)
         free(self.places)
         free(self.temps)
+        free(self.locs)
         kh_destroy_i64i32(self._const_intern)  # NULL-safe
 
     # -- growable-buffer allocation helpers --------------------------------
@@ -178,9 +236,23 @@ cdef class Func:
     cdef int32_t _alloc_instr(self) except -1:
         self.instrs = <Instr*>_grow(<void*>self.instrs, &self.cap_instrs, self.n_instrs + 1, sizeof(Instr))
         cdef int32_t i = self.n_instrs
+        if self.locs != NULL:
+            self.locs = <int32_t*>_grow(<void*>self.locs, &self.cap_locs, i + 1, sizeof(int32_t))
+            self.locs[i] = self.cur_loc
         self.n_instrs += 1
         return i
 
+    cdef int _inherit_locs(self, Func src) except -1:
+        # Track source locations iff ``src`` does; instrs already present get none.
+        cdef int32_t i
+        if src is None or src.locs == NULL or self.locs != NULL:
+            return 0
+        self.locs = <int32_t*>_grow(NULL, &self.cap_locs, self.n_instrs if self.n_instrs > 0 else 1, sizeof(int32_t))
+        for i in range(self.n_instrs):
+            self.locs[i] = -1
+        self.cur_loc = -1
+        return 0
+
     cdef int32_t _emit(self, uint16_t op, uint8_t flags, int32_t block, int32_t aux, list arg_vids) except -1:
         cdef int32_t nargs = len(arg_vids)
         cdef int32_t astart = self.n_args
@@ -460,7 +532,7 @@ cdef class Func:
         self.n_edges += 1
         return 0
 
-    cdef int _marshal(self, object entry, object mode, object callback) except -1:
+    cdef int _begin_marshal(self, object mode, object callback) except -1:
         self.callback = callback
         if mode is not None:
             self.blocks_type = mode.blocks
@@ -468,40 +540,86 @@ cdef class Func:
         else:
             self.blocks_type = None
             self._block_map = {}
+        return 0
 
-        rpo_blocks = list(traverse_cfg_reverse_postorder(entry))
-        cdef int32_t nb = len(rpo_blocks)
-        cdef int32_t i
+    cdef int _alloc_blocks(self, int32_t nb, bint track) except -1:
+        if track:
+            self.locs = <int32_t*>_grow(NULL, &self.cap_locs, 1, sizeof(int32_t))
         if nb == 0:
             raise ValueError("Empty CFG")
         self.blocks = <BlockInfo*>_grow(<void*>self.blocks, &self.cap_blocks, nb, sizeof(BlockInfo))
         self.n_blocks = nb
         self.entry_block = 0
+        return 0
+
+    cdef int _marshal_block(self, int32_t bid, object statements, object stmt_locs, object test, bint track) except -1:
+        # Statements and test of block ``bid``; the caller pushes its edges.
+        cdef int32_t istart = self.n_instrs
+        self.blocks[bid].instr_start = istart
+        self.blocks[bid].phi_start = 0
+        self.blocks[bid].phi_count = 0
+        self.blocks[bid].rpo = bid
+        self.blocks[bid].idom = -1
+        if track:
+            # The block test has no location of its own; it keeps that of the
+            # last statement, which is where the frontend computed it.
+            self.cur_loc = -1
+            if stmt_locs is None or len(stmt_locs) != len(statements):
+                # A block built or rewritten after tracing has no locations.
+                stmt_locs = [-1] * len(statements)
+            for stmt, loc in zip(statements, stmt_locs):
+                self.cur_loc = loc
+                self._emit_stmt(stmt, bid)
+        else:
+            for stmt in statements:
+                self._emit_stmt(stmt, bid)
+        self.blocks[bid].test_val = self._value_of(test, bid)
+        self.blocks[bid].instr_count = self.n_instrs - istart
+        self.blocks[bid].edge_start = self.n_edges
+        return 0
+
+    cdef int _marshal(self, object entry, object mode, object callback) except -1:
+        self._begin_marshal(mode, callback)
+        rpo_blocks = list(traverse_cfg_reverse_postorder(entry))
+        cdef int32_t nb = len(rpo_blocks)
+        cdef int32_t i
+        cdef bint track = entry.statement_locs is not None
+        self._alloc_blocks(nb, track)
 
         block_id = {b: i for i, b in enumerate(rpo_blocks)}
 
-        cdef int32_t bid, tv, istart
+        cdef int32_t bid
         for bid in range(nb):
             pyb = rpo_blocks[bid]
             if pyb.phis:
                 raise ValueError("block.phis must be empty on marshal-in (input is not SSA)")
-            istart = self.n_instrs
-            self.blocks[bid].instr_start = istart
-            self.blocks[bid].phi_start = 0
-            self.blocks[bid].phi_count = 0
-            self.blocks[bid].rpo = bid
-            self.blocks[bid].idom = -1
-            for stmt in pyb.statements:
-                self._emit_stmt(stmt, bid)
-            tv = self._value_of(pyb.test, bid)
-            self.blocks[bid].test_val = tv
-            self.blocks[bid].instr_count = self.n_instrs - istart
-            self.blocks[bid].edge_start = self.n_edges
+            self._marshal_block(bid, pyb.statements, pyb.statement_locs, pyb.test, track)
             for e in sorted(pyb.outgoing, key=_edge_sort_key):
                 self._push_edge(bid, <int32_t>block_id[e.dst], e.cond)
             self.blocks[bid].edge_count = self.n_edges - self.blocks[bid].edge_start
         return 0
 
+    cdef int _marshal_context(self, list rpo_contexts, object mode, object callback) except -1:
+        # Same arena as ``_marshal(context_to_cfg(entry))``, read straight off the
+        # frontend's Context graph (``rpo_contexts`` from ``_context_reverse_postorder``):
+        # blocks and edges in the same order, and no BasicBlock or FlowEdge built in between.
+        self._begin_marshal(mode, callback)
+        cdef int32_t nb = len(rpo_contexts)
+        cdef int32_t i
+        cdef bint track = nb > 0 and rpo_contexts[0].statement_locs is not None
+        self._alloc_blocks(nb, track)
+
+        context_id = {c: i for i, c in enumerate(rpo_contexts)}
+
+        cdef int32_t bid
+        for bid in range(nb):
+            context = rpo_contexts[bid]
+            self._marshal_block(bid, context.statements, context.statement_locs, context.test, track)
+            for cond, dst in _ordered_context_edges(context.outgoing):
+                self._push_edge(bid, <int32_t>context_id[dst], cond)
+            self.blocks[bid].edge_count = self.n_edges - self.blocks[bid].edge_start
+        return 0
+
     # -- marshal out -------------------------------------------------------
 
     cdef object _make_const(self, double d, bint is_int):
@@ -1003,6 +1121,224 @@ cdef class Func:
             "phis": nphi,
         }
 
+    cdef bytearray _pack(self):
+        # Every array element field by field as int32 words (never as a raw
+        # struct, whose padding bytes are uninitialized); f64s take two words.
+        # Header: the seven element counts, then entry_block, is_ssa, undef_val.
+        # Shared by ``digest`` and ``to_bytes``; ``_unpack`` is the inverse.
+        cdef Py_ssize_t n_words = (
+            _PACK_HEADER_WORDS
+            + 6 * <Py_ssize_t>self.n_instrs
+            + self.n_args
+            + 9 * <Py_ssize_t>self.n_blocks
+            + 6 * <Py_ssize_t>self.n_edges
+            + 2 * <Py_ssize_t>self.n_consts
+            + 5 * <Py_ssize_t>self.n_places
+            + 2 * <Py_ssize_t>self.n_temps
+        )
+        cdef bytearray buf = bytearray(n_words * sizeof(int32_t))
+        cdef int32_t* w = <int32_t*>(<char*>buf)
+        cdef Py_ssize_t k
+        cdef int32_t i
+        w[0] = self.n_instrs
+        w[1] = self.n_args
+        w[2] = self.n_blocks
+        w[3] = self.n_edges
+        w[4] = self.n_consts
+        w[5] = self.n_places
+        w[6] = self.n_temps
+        w[7] = self.entry_block
+        w[8] = self.is_ssa
+        w[9] = self.undef_val
+        k = _PACK_HEADER_WORDS
+        for i in range(self.n_instrs):
+            w[k] = self.instrs[i].op
+            w[k + 1] = self.instrs[i].flags
+            w[k + 2] = self.instrs[i].block
+            w[k + 3] = self.instrs[i].arg_start
+            w[k + 4] = self.instrs[i].nargs
+            w[k + 5] = self.instrs[i].aux
+            k += 6
+        if self.n_args:
+            memcpy(&w[k], self.args, self.n_args * sizeof(uint32_t))
+            k += self.n_args
+        for i in range(self.n_blocks):
+            w[k] = self.blocks[i].instr_start
+            w[k + 1] = self.blocks[i].instr_count
+            w[k + 2] = self.blocks[i].test_val
+            w[k + 3] = self.blocks[i].edge_start
+            w[k + 4] = self.blocks[i].edge_count
+            w[k + 5] = self.blocks[i].phi_start
+            w[k + 6] = self.blocks[i].phi_count
+            w[k + 7] = self.blocks[i].rpo
+            w[k + 8] = self.blocks[i].idom
+            k += 9
+        for i in range(self.n_edges):
+            w[k] = self.edges[i].src
+            w[k + 1] = self.edges[i].dst
+            w[k + 2] = self.edges[i].cond_kind
+            w[k + 3] = self.edges[i].cond_is_int
+            memcpy(&w[k + 4], &self.edges[i].cond, sizeof(double))
+            k += 6
+        if self.n_consts:
+            memcpy(&w[k], self.consts, self.n_consts * sizeof(double))
+            k += 2 * self.n_consts
+        for i in range(self.n_places):
+            w[k] = self.places[i].kind
+            w[k + 1] = self.places[i].flags
+            w[k + 2] = self.places[i].block_ref
+            w[k + 3] = self.places[i].index_val
+            w[k + 4] = self.places[i].offset
+            k += 5
+        for i in range(self.n_temps):
+            w[k] = self.temps[i].name_id
+            w[k + 1] = self.temps[i].size
+            k += 2
+        return buf
+
+    cdef int _unpack(self, bytes data) except -1:
+        # Inverse of ``_pack`` into a fresh Func. Sizes are validated here; the
+        # cross-references are left to ``verify`` (see ``func_from_bytes``).
+        cdef Py_ssize_t size = len(data)
+        cdef Py_ssize_t n_words, k
+        cdef int32_t i
+        cdef int32_t header[_PACK_HEADER_WORDS]
+        if size < _PACK_HEADER_WORDS * <Py_ssize_t>sizeof(int32_t) or size % sizeof(int32_t):
+            raise ValueError("Truncated arena data")
+        memcpy(header, <char*>data, sizeof(header))
+        for i in range(7):
+            if header[i] < 0:
+                raise ValueError("Negative element count in arena data")
+        n_words = (
+            _PACK_HEADER_WORDS
+            + 6 * <Py_ssize_t>header[0]
+            + header[1]
+            + 9 * <Py_ssize_t>header[2]
+            + 6 * <Py_ssize_t>header[3]
+            + 2 * <Py_ssize_t>header[4]
+            + 5 * <Py_ssize_t>header[5]
+            + 2 * <Py_ssize_t>header[6]
+        )
+        if size != n_words * <Py_ssize_t>sizeof(int32_t):
+            raise ValueError("Arena data size does not match its header")
+        # Copy once into an aligned buffer (the bytes payload has no alignment guarantee).
+        cdef bytearray copy = bytearray(data)
+        cdef int32_t* w = <int32_t*>(<char*>copy)
+        # ``_grow`` reports failure as NULL, so empty arrays stay unallocated.
+        if header[0]:
+            self.instrs = <Instr*>_grow(<void*>self.instrs, &self.cap_instrs, header[0], sizeof(Instr))
+        if header[1]:
+            self.args = <uint32_t*>_grow(<void*>self.args, &self.cap_args, header[1], sizeof(uint32_t))
+        if header[2]:
+            self.blocks = <BlockInfo*>_grow(<void*>self.blocks, &self.cap_blocks, header[2], sizeof(BlockInfo))
+        if header[3]:
+            self.edges = <Edge*>_grow(<void*>self.edges, &self.cap_edges, header[3], sizeof(Edge))
+        if header[4]:
+            self.consts = <double*>_grow(<void*>self.consts, &self.cap_consts, header[4], sizeof(double))
+        if header[5]:
+            self.places = <PlaceInfo*>_grow(<void*>self.places, &self.cap_places, header[5], sizeof(PlaceInfo))
+        if header[6]:
+            self.temps = <TempInfo*>_grow(<void*>self.temps, &self.cap_temps, header[6], sizeof(TempInfo))
+        self.n_instrs = header[0]
+        self.n_args = header[1]
+        self.n_blocks = header[2]
+        self.n_edges = header[3]
+        self.n_consts = header[4]
+        self.n_places = header[5]
+        self.n_temps = header[6]
+        self.entry_block = header[7]
+        self.is_ssa = header[8] != 0
+        self.undef_val = header[9]
+        k = _PACK_HEADER_WORDS
+        for i in range(self.n_instrs):
+            self.instrs[i].op = <uint16_t>w[k]
+            self.instrs[i].flags = <uint8_t>w[k + 1]
+            self.instrs[i].block = w[k + 2]
+            self.instrs[i].arg_start = w[k + 3]
+            self.instrs[i].nargs = <int16_t>w[k + 4]
+            self.instrs[i].aux = w[k + 5]
+            if self.instrs[i].op >= OP_TABLE_SIZE:
+                raise ValueError(f"instr {i}: unknown op {self.instrs[i].op}")
+            k += 6
+        if self.n_args:
+            memcpy(self.args, &w[k], self.n_args * sizeof(uint32_t))
+            k += self.n_args
+        for i in range(self.n_blocks):
+            self.blocks[i].instr_start = w[k]
+            self.blocks[i].instr_count = w[k + 1]
+            self.blocks[i].test_val = w[k + 2]
+            self.blocks[i].edge_start = w[k + 3]
+            self.blocks[i].edge_count = w[k + 4]
+            self.blocks[i].phi_start = w[k + 5]
+            self.blocks[i].phi_count = w[k + 6]
+            self.blocks[i].rpo = w[k + 7]
+            self.blocks[i].idom = w[k + 8]
+            k += 9
+        for i in range(self.n_edges):
+            self.edges[i].src = w[k]
+            self.edges[i].dst = w[k + 1]
+            self.edges[i].cond_kind = <uint8_t>w[k + 2]
+            self.edges[i].cond_is_int = <uint8_t>w[k + 3]
+            memcpy(&self.edges[i].cond, &w[k + 4], sizeof(double))
+            k += 6
+        if self.n_consts:
+            memcpy(self.consts, &w[k], self.n_consts * sizeof(double))
+            k += 2 * self.n_consts
+        for i in range(self.n_places):
+            self.places[i].kind = <uint8_t>w[k]
+            self.places[i].flags = <uint8_t>w[k + 1]
+            self.places[i].block_ref = w[k + 2]
+            self.places[i].index_val = w[k + 3]
+            self.places[i].offset = w[k + 4]
+            k += 5
+        for i in range(self.n_temps):
+            self.temps[i].name_id = w[k]
+            self.temps[i].size = w[k + 1]
+            k += 2
+        if self.n_blocks and not (0 <= self.entry_block < self.n_blocks):
+            raise ValueError("Arena entry block out of range")
+        return 0
+
+    def digest(self):
+        """Return a stable content hash of the arena as a hex string.
+
+        Hashes the packed arrays (see ``_pack``) followed by the names table, so
+        equal marshals of the same CFG hash equal across processes on one machine.
+        Keys the persistent compile cache (``sonolus.backend.optimize.cache``).
+        """
+        h = _blake2b(self._pack(), digest_size=20)
+        h.update("\0".join(self.names).encode("utf-8", "surrogatepass"))
+        return h.hexdigest()
+
+    def to_bytes(self):
+        """Serialize the arena to a self-contained byte string; ``func_from_bytes`` reads it back.
+
+        Carries the packed arrays plus the boundary state that export and emit
+        need (names, callback, the mode's block enum and the enum members of real
+        places), so an arena can be optimized in another process or saved for a
+        bug report. The interning dicts of marshal-in are not carried: a
+        deserialized arena can be optimized and exported, not marshalled into.
+        Source locations are carried when the arena tracks them.
+        """
+        members = tuple(sorted(
+            (block_id, _class_ref(type(member)), member.name)
+            for block_id, member in self._block_enum_by_id.items()
+        ))
+        blocks_type = None if self.blocks_type is None else _class_ref(self.blocks_type)
+        locs = None
+        if self.locs != NULL:
+            locs = (<char*>self.locs)[:<Py_ssize_t>self.n_instrs * sizeof(int32_t)]
+        return _marshal.dumps((
+            ARENA_FORMAT_VERSION,
+            _sys.byteorder,
+            bytes(self._pack()),
+            tuple(self.names),
+            self.callback,
+            blocks_type,
+            members,
+            locs,
+        ))
+
     def intern_const(self, value):
         """Intern a numeric constant, returning its const id (test/kernel API)."""
         return self._intern_const(<double>float(value))
@@ -1050,6 +1386,23 @@ def marshal_in(entry, mode=None, callback=None):
     return func
 
 
+def marshal_context(entry, mode=None, callback=None):
+    """Marshal a traced frontend ``Context`` graph into a fresh arena ``Func`` (GIL held).
+
+    Produces the same arena as ``marshal_in(context_to_cfg(entry), ...)``. Like
+    ``context_to_cfg``, it consumes the graph: the contexts' ``outgoing`` links are
+    deleted afterwards to break reference cycles.
+    """
+    cdef list order = _context_reverse_postorder(entry)
+    cdef Func func = Func()
+    try:
+        func._marshal_context(order, mode, callback)
+    finally:
+        for context in order:
+            del context.outgoing
+    return func
+
+
 def to_basic_blocks(func):
     """Export an arena ``Func`` back to a fresh Python BasicBlock CFG."""
     if not isinstance(func, Func):
@@ -1057,6 +1410,63 @@ def to_basic_blocks(func):
     return (<Func>func)._export()
 
 
+def func_from_bytes(data):
+    """Rebuild an arena ``Func`` from ``Func.to_bytes`` output.
+
+    Raises ValueError if the data is malformed, from another format version or
+    byte order, or fails ``verify``.
+    """
+    try:
+        version, byteorder, packed, names, callback, blocks_type, members, locs = _marshal.loads(data)
+    except (EOFError, ValueError, TypeError) as e:
+        raise ValueError("Malformed arena data") from e
+    if version != ARENA_FORMAT_VERSION:
+        raise ValueError(f"Unsupported arena format version {version!r} (expected {ARENA_FORMAT_VERSION})")
+    if byteorder != _sys.byteorder:
+        raise ValueError(f"Arena data was written on a {byteorder}-endian machine")
+    cdef Func func = Func()
+    func._unpack(packed)
+    cdef bytes locs_data
+    if locs is not None:
+        locs_data = locs
+        if len(locs_data) != <Py_ssize_t>func.n_instrs * <Py_ssize_t>sizeof(int32_t):
+            raise ValueError("Arena locations do not match its instructions")
+        func.locs = <int32_t*>_grow(NULL, &func.cap_locs, func.n_instrs if func.n_instrs > 0 else 1, sizeof(int32_t))
+        memcpy(func.locs, <char*>locs_data, len(locs_data))
+    func.names = list(names)
+    cdef int32_t tid, name_id
+    for tid in range(func.n_temps):
+        name_id = func.temps[tid].name_id
+        if not (0 <= name_id < len(func.names)):
+            raise ValueError(f"temp {tid}: name id out of range")
+        func._temp_intern.setdefault((func.names[name_id], func.temps[tid].size), tid)
+    func._rebuild_const_intern()
+    func._ssa_undef = set() if func.is_ssa else None
+    func.callback = callback
+    if blocks_type is not None:
+        func.blocks_type = _resolve_class(blocks_type)
+        func._block_map = {int(m): m for m in func.blocks_type}
+    for block_id, enum_ref, name in members:
+        func._block_enum_by_id[block_id] = _resolve_class(enum_ref)[name]
+    try:
+        func.verify()
+    except AssertionError as e:
+        raise ValueError(f"Invalid arena data: {e}") from e
+    return func
+
+
+def _class_ref(cls):
+    return cls.__module__, cls.__qualname__
+
+
+def _resolve_class(ref):
+    module, qualname = ref
+    obj = _import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
 # Debug phase registry: name -> callable(Func) -> Func. Populated by the driver
 # module on import (see driver.pyx); debug_run consults it below.
 _PHASE_REGISTRY = {}
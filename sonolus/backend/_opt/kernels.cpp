@@ -0,0 +1,20528 @@
+/* Generated by Cython 3.3.0 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [
+            "sonolus/backend/_opt/_ops_gen.h"
+        ],
+        "include_dirs": [
+            "sonolus/backend/_opt"
+        ],
+        "language": "c++",
+        "name": "sonolus.backend._opt.kernels",
+        "sources": [
+            "sonolus/backend/_opt/kernels.pyx"
+        ]
+    },
+    "module_name": "sonolus.backend._opt.kernels"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+/* InitLimitedAPI */
+#if defined(Py_LIMITED_API)
+  #if !defined(CYTHON_LIMITED_API)
+  #define CYTHON_LIMITED_API 1
+  #endif
+#elif defined(CYTHON_LIMITED_API)
+  #ifdef _MSC_VER
+  #pragma message ("Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.")
+  #else
+  #warning Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.
+  #endif
+#endif
+
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x03090000
+    #error Cython requires Python 3.9+.
+#elif defined(Py_LIMITED_API) && (Py_LIMITED_API & 0xFFFF0000) > (PY_VERSION_HEX & 0xFFFF0000)
+    #error 'Py_LIMITED_API' can only select past Python X.Y versions, not future ones.
+#else
+#define __PYX_ABI_VERSION "3_3_0"
+#define CYTHON_HEX_VERSION 0x030300F0
+#define CYTHON_FUTURE_DIVISION 1
+/* CModulePreamble */
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(_WIN32) && !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifdef __has_builtin
+  #define __Pyx_has_cbuiltin(name) __has_builtin(name)
+#else
+  #define __Pyx_has_cbuiltin(name) (0)
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#define __PYX_LIMITED_VERSION_HEX PY_VERSION_HEX
+#if defined(CYTHON_LIMITED_API)
+  #ifdef Py_LIMITED_API
+    #undef __PYX_LIMITED_VERSION_HEX
+    #define __PYX_LIMITED_VERSION_HEX Py_LIMITED_API
+    #if Py_LIMITED_API < 0x03090000
+      #error "Cython 3.3 requires the Python Limited API version to be 3.9 or greater."
+    #endif
+  #endif
+  #if defined(GRAALVM_PYTHON) || defined(PYPY_VERSION)
+    #ifdef _MSC_VER
+      #pragma message ("Py_LIMITED_API is defined on PyPy or GraalPy. This takes precedence over Cython's specialized\
+        code for PyPy and GraalPy and is unlikely to work.")
+    #else
+      #warning "Py_LIMITED_API is defined on PyPy or GraalPy. This takes precedence over Cython's specialized\
+        code for PyPy and GraalPy and is unlikely to work."
+    #endif
+  #endif
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 1
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #endif
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_VECTORCALL
+  #define CYTHON_VECTORCALL (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
+  #ifndef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW (CYTHON_VECTORCALL && __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (__PYX_LIMITED_VERSION_HEX >= 0x030F0000 && PY_VERSION_HEX > 0x030F00A8)
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND (__PYX_LIMITED_VERSION_HEX >= 0x030A0000)
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 1
+  #endif
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #if __PYX_LIMITED_VERSION_HEX < 0x030E0000
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+  #elif !defined(CYTHON_OPAQUE_OBJECTS)
+  #define CYTHON_OPAQUE_OBJECTS (__PYX_LIMITED_VERSION_HEX >= 0x030F0000)
+  #endif
+#elif defined(GRAALVM_PYTHON)
+  /* For very preliminary testing purposes. Most variables are set the same as PyPy.
+     The existence of this section does not imply that anything works or is even tested */
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 1
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 0
+  #endif
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW CYTHON_VECTORCALL
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 1
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+#elif defined(PYPY_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 1
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW (PYPY_VERSION_NUM >= 0x07030800 && CYTHON_VECTORCALL)
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PYPY_VERSION_NUM >= 0x07030C00)
+  #endif
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC (PYPY_VERSION_NUM >= 0x07031100)
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #ifdef Py_GIL_DISABLED
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 1
+  #else
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #endif
+  #if PY_VERSION_HEX < 0x030A0000
+    #undef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #elif !defined(CYTHON_USE_TYPE_SLOTS)
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #ifndef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #ifndef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLIST_INTERNALS)
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #elif !defined(CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS)
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #ifndef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_FAST_GIL
+    #define CYTHON_FAST_GIL 0
+  #elif !defined(CYTHON_FAST_GIL)
+    #define CYTHON_FAST_GIL (PY_VERSION_HEX < 0x030C00A6)
+  #endif
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW CYTHON_VECTORCALL
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #ifndef CYTHON_USE_SYS_MONITORING
+    #define CYTHON_USE_SYS_MONITORING (PY_VERSION_HEX >= 0x030d00B1)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS 0
+  #elif !defined(CYTHON_USE_DICT_VERSIONS)
+    #define CYTHON_USE_DICT_VERSIONS  (PY_VERSION_HEX < 0x030C00A5 && !CYTHON_USE_MODULE_STATE)
+  #endif
+  #ifndef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 1
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR (PY_VERSION_HEX < 0x030C00B2)
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+    #define CYTHON_USE_FREELISTS (!CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+  #if defined(CYTHON_IMMORTAL_CONSTANTS) && PY_VERSION_HEX < 0x030C0000
+    #undef CYTHON_IMMORTAL_CONSTANTS
+    #define CYTHON_IMMORTAL_CONSTANTS 0  // definitely won't work
+  #elif !defined(CYTHON_IMMORTAL_CONSTANTS)
+    #define CYTHON_IMMORTAL_CONSTANTS (PY_VERSION_HEX >= 0x030C0000 && !CYTHON_USE_MODULE_STATE && CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+  #ifndef CYTHON_OPAQUE_OBJECTS
+    #define CYTHON_OPAQUE_OBJECTS 0
+  #endif
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(maybe_unused) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(maybe_unused)
+        #define CYTHON_UNUSED [[maybe_unused]]
+      #endif
+    #endif
+  #elif defined(__STDC_VERSION__) && __STDC_VERSION__ >= 202311L
+    #define CYTHON_UNUSED [[maybe_unused]]
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+  #define CYTHON_MAYBE_UNUSED_VAR(x) CYTHON_UNUSED_VAR(x)
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_USE_CPP_STD_MOVE
+  #if defined(__cplusplus) && (\
+    __cplusplus >= 201103L || (defined(_MSC_VER) && _MSC_VER >= 1600))
+    #define CYTHON_USE_CPP_STD_MOVE 1
+  #else
+    #define CYTHON_USE_CPP_STD_MOVE 0
+  #endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#include <stdint.h>
+typedef uintptr_t  __pyx_uintptr_t;
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(fallthrough) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(fallthrough)
+        #define CYTHON_FALLTHROUGH [[fallthrough]]
+      #endif
+    #endif
+    #ifndef CYTHON_FALLTHROUGH
+      #if __has_cpp_attribute(clang::fallthrough)
+        #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+      #elif __has_cpp_attribute(gnu::fallthrough)
+        #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+      #endif
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+#ifdef Py_UNREACHABLE
+  #define __Pyx_UNREACHABLE() Py_UNREACHABLE()
+#elif __Pyx_has_cbuiltin(__builtin_unreachable)
+  #define __Pyx_UNREACHABLE() __builtin_unreachable()
+#elif defined(__clang__) || defined(__INTEL_COMPILER) || (defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 5)))
+  #define __Pyx_UNREACHABLE() __builtin_unreachable()
+#elif defined(_MSC_VER)
+  #define __Pyx_UNREACHABLE() __assume(0)
+#else
+  #define __Pyx_UNREACHABLE() Py_FatalError("Unreachable C code path reached")
+#endif
+#ifndef Py_UNREACHABLE
+  #define Py_UNREACHABLE() __Pyx_UNREACHABLE()
+#endif
+#ifdef __cplusplus
+  template <typename T>
+  struct __PYX_IS_UNSIGNED_IMPL {static const bool value = T(0) < T(-1);};
+  #define __PYX_IS_UNSIGNED(type) (__PYX_IS_UNSIGNED_IMPL<type>::value)
+#else
+  #define __PYX_IS_UNSIGNED(type) (((type)-1) > 0)
+#endif
+#if CYTHON_COMPILING_IN_PYPY == 1
+  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX < 0x030A0000)
+#else
+  #define __PYX_NEED_TP_PRINT_SLOT  0
+#endif
+#define __PYX_REINTERPRET_FUNCION(func_pointer, other_pointer) ((func_pointer)(void(*)(void))(other_pointer))
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+#define __Pyx_PyErr_FetchException(petype, peval, petb) PyErr_Fetch(petype, peval, petb)
+#define __Pyx_PyErr_RestoreException(etype, eval, etb) PyErr_Restore(etype, eval, etb)
+#else
+#define __Pyx_PyErr_FetchException(petype, peval, petb) *(petype)=NULL; *(peval)=PyErr_GetRaisedException(); *(petb)=NULL
+#define __Pyx_PyErr_RestoreException(etype, eval, etb) PyErr_SetRaisedException(eval)
+#endif
+
+/* CppInitCode */
+#ifndef __cplusplus
+  #error "Cython files generated with the C++ option must be compiled with a C++ compiler."
+#endif
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #else
+    #define CYTHON_INLINE inline
+  #endif
+#endif
+template<typename T>
+void __Pyx_call_destructor(T& x) {
+    x.~T();
+}
+template<typename T>
+class __Pyx_FakeReference {
+  public:
+    __Pyx_FakeReference() : ptr(NULL) { }
+    __Pyx_FakeReference(const T& ref) : ptr(const_cast<T*>(&ref)) { }
+    T *operator->() { return ptr; }
+    T *operator&() { return ptr; }
+    operator T&() { return *ptr; }
+    template<typename U> bool operator ==(const U& other) const { return *ptr == other; }
+    template<typename U> bool operator !=(const U& other) const { return *ptr != other; }
+    template<typename U> bool operator==(const __Pyx_FakeReference<U>& other) const { return *ptr == *other.ptr; }
+    template<typename U> bool operator!=(const __Pyx_FakeReference<U>& other) const { return *ptr != *other.ptr; }
+  private:
+    T *ptr;
+};
+
+/* PythonCompatibility */
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#define __Pyx_BUILTIN_MODULE_NAME "builtins"
+#define __Pyx_DefaultClassType PyType_Type
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #ifndef CO_OPTIMIZED
+    static int CO_OPTIMIZED;
+    #endif
+    #ifndef CO_NEWLOCALS
+    static int CO_NEWLOCALS;
+    #endif
+    #ifndef CO_VARARGS
+    static int CO_VARARGS;
+    #endif
+    #ifndef CO_VARKEYWORDS
+    static int CO_VARKEYWORDS;
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+    static int CO_ASYNC_GENERATOR;
+    #endif
+    #ifndef CO_GENERATOR
+    static int CO_GENERATOR;
+    #endif
+    #ifndef CO_COROUTINE
+    static int CO_COROUTINE;
+    #endif
+#else
+    #ifndef CO_COROUTINE
+      #define CO_COROUTINE 0x80
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+      #define CO_ASYNC_GENERATOR 0x200
+    #endif
+#endif
+static int __Pyx_init_co_variables(void);
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_Is)
+  #define __Pyx_Py_Is(x, y)  Py_Is(x, y)
+#else
+  #define __Pyx_Py_Is(x, y) ((x) == (y))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsNone)
+  #define __Pyx_Py_IsNone(ob) Py_IsNone(ob)
+#else
+  #define __Pyx_Py_IsNone(ob) __Pyx_Py_Is((ob), Py_None)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsTrue)
+  #define __Pyx_Py_IsTrue(ob) Py_IsTrue(ob)
+#else
+  #define __Pyx_Py_IsTrue(ob) __Pyx_Py_Is((ob), Py_True)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsFalse)
+  #define __Pyx_Py_IsFalse(ob) Py_IsFalse(ob)
+#else
+  #define __Pyx_Py_IsFalse(ob) __Pyx_Py_Is((ob), Py_False)
+#endif
+#define __Pyx_NoneAsNull(obj)  (__Pyx_Py_IsNone(obj) ? NULL : (obj))
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static unsigned long __Pyx_Runtime_TPFLAGS_SEQUENCE;
+static unsigned long __Pyx_Runtime_TPFLAGS_MAPPING;
+#else
+#define __Pyx_Runtime_TPFLAGS_SEQUENCE Py_TPFLAGS_SEQUENCE
+#define __Pyx_Runtime_TPFLAGS_MAPPING Py_TPFLAGS_MAPPING
+#endif
+static int __Pyx_init_tpflags_variables(void);
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef Py_TPFLAGS_SEQUENCE
+  #define Py_TPFLAGS_SEQUENCE (CYTHON_COMPILING_IN_LIMITED_API ? 0 : 1 << 5)
+#endif
+#ifndef Py_TPFLAGS_MAPPING
+  #define Py_TPFLAGS_MAPPING (CYTHON_COMPILING_IN_LIMITED_API ? 0 : 1 << 6)
+#endif
+#ifndef Py_TPFLAGS_IMMUTABLETYPE
+  #define Py_TPFLAGS_IMMUTABLETYPE (1UL << 8)
+#endif
+#ifndef Py_TPFLAGS_DISALLOW_INSTANTIATION
+  #define Py_TPFLAGS_DISALLOW_INSTANTIATION (1UL << 7)
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if !defined(METH_FASTCALL) || CYTHON_COMPILING_IN_PYPY
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #if PY_VERSION_HEX >= 0x030d00A4
+  #  define __Pyx_PyCFunctionFast PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords PyCFunctionFastWithKeywords
+  #else
+  #  define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+  #endif
+#endif
+#if CYTHON_VECTORCALL
+  #define __Pyx_METH_FASTCALL METH_FASTCALL
+  #define __Pyx_PyCFunction_FastCall __Pyx_PyCFunctionFast
+  #define __Pyx_PyCFunction_FastCallWithKeywords __Pyx_PyCFunctionFastWithKeywords
+#else
+  #define __Pyx_METH_FASTCALL METH_VARARGS
+  #define __Pyx_PyCFunction_FastCall PyCFunction
+  #define __Pyx_PyCFunction_FastCallWithKeywords PyCFunctionWithKeywords
+#endif
+#if CYTHON_VECTORCALL
+  #define __pyx_vectorcallfunc vectorcallfunc
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  PY_VECTORCALL_ARGUMENTS_OFFSET
+  #define __Pyx_PyVectorcall_NARGS(n)  PyVectorcall_NARGS((size_t)(n))
+#else
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  0
+  #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(n))
+#endif
+#define __Pyx_PyCFunction_CheckExact(func) PyCFunction_CheckExact(func)
+#define __Pyx_CyOrPyCFunction_Check(func)  PyCFunction_Check(func)
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  (((PyCFunctionObject*)(func))->m_ml->ml_meth)
+#elif !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  PyCFunction_GET_FUNCTION(func)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FLAGS(func)  (((PyCFunctionObject*)(func))->m_ml->ml_flags)
+static CYTHON_INLINE PyObject* __Pyx_CyOrPyCFunction_GET_SELF(PyObject *func) {
+    return (__Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_STATIC) ? NULL : ((PyCFunctionObject*)func)->m_self;
+}
+#endif
+static CYTHON_INLINE int __Pyx__IsSameCFunction(PyObject *func, void (*cfunc)(void)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    return PyCFunction_Check(func) && PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+#else
+    return PyCFunction_Check(func) && PyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+#endif
+}
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCFunction(func, cfunc)
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  ((void)m, PyType_FromSpecWithBases(s, b))
+#else
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  PyType_FromModuleAndSpec(m, s, b)
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
+#else
+  #define __Pyx_PyCMethod  PyCMethod
+#endif
+#ifndef METH_METHOD
+  #define METH_METHOD 0x200
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)
+#elif CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) GraalPyFrame_SetLineNumber((frame), (lineno))
+#elif CYTHON_COMPILING_IN_GRAAL
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) _PyFrame_SetLineNumber((frame), (lineno))
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyThreadState_Current PyThreadState_Get()
+#elif !CYTHON_FAST_THREAD_STATE
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x030d00A1
+  #define __Pyx_PyThreadState_Current PyThreadState_GetUnchecked()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#endif
+#if CYTHON_OPAQUE_OBJECTS && CYTHON_COMPILING_IN_LIMITED_API
+    #define __PYX_SHARED_SIZEOF(T) -((int)sizeof(T))
+    #define __PYX_SHARED_RELATIVE_OFFSET Py_RELATIVE_OFFSET
+    #define CYTHON_OPAQUE_SHARED_TYPES 1
+#else
+    #define __PYX_SHARED_SIZEOF(T) sizeof(T)
+    #define __PYX_SHARED_RELATIVE_OFFSET 0
+    #define CYTHON_OPAQUE_SHARED_TYPES 0
+#endif
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_INLINE void *__Pyx__PyModule_GetState(PyObject *op)
+{
+    void *result;
+    result = PyModule_GetState(op);
+    if (!result)
+        Py_FatalError("Couldn't find the module state");
+    return result;
+}
+#define __Pyx_PyModule_GetState(o) (__pyx_mstatetype *)__Pyx__PyModule_GetState(o)
+#else
+#define __Pyx_PyModule_GetState(op) ((void)op,__pyx_mstate_global)
+#endif
+#define __Pyx_PyObject_GetSlot(obj, name, func_ctype)  __Pyx_PyType_GetSlot(Py_TYPE((PyObject *) obj), name, func_ctype)
+#define __Pyx_PyObject_TryGetSlot(obj, name, func_ctype) __Pyx_PyType_TryGetSlot(Py_TYPE(obj), name, func_ctype)
+#define __Pyx_PyObject_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#define __Pyx_PyObject_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((type)->name)
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype) __Pyx_PyType_GetSlot(type, name, func_ctype)
+  #define __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype) (((type)->sub) ? ((type)->sub->name) : NULL)
+  #define __Pyx_PyType_TryGetSubSlot(type, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype)
+#else
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((func_ctype) PyType_GetSlot((type), Py_##name))
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype)\
+    ((__PYX_LIMITED_VERSION_HEX >= 0x030A0000 ||\
+     (PyType_GetFlags(type) & Py_TPFLAGS_HEAPTYPE) || __Pyx_get_runtime_version() >= 0x030A0000) ?\
+     __Pyx_PyType_GetSlot(type, name, func_ctype) : NULL)
+  #define __Pyx_PyType_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSlot(obj, name, func_ctype)
+  #define __Pyx_PyType_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSlot(obj, name, func_ctype)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+#define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStrWithError(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStr(PyObject *dict, PyObject *name) {
+    PyObject *res = __Pyx_PyDict_GetItemStrWithError(dict, name);
+    if (res == NULL && PyErr_Occurred()) {
+        PyErr_WriteUnraisable(NULL);
+    }
+    return res;
+}
+#elif !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
+#define __Pyx_PyDict_GetItemStrWithError  PyDict_GetItemWithError
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#else
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict, PyObject *name) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyDict_GetItem(dict, name);
+#else
+    PyDictEntry *ep;
+    PyDictObject *mp = (PyDictObject*) dict;
+    long hash = ((PyStringObject *) name)->ob_shash;
+    assert(hash != -1);
+    ep = (mp->ma_lookup)(mp, name, hash);
+    if (ep == NULL) {
+        return NULL;
+    }
+    return ep->me_value;
+#endif
+}
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetFlags(tp)   (((PyTypeObject *)tp)->tp_flags)
+  #define __Pyx_PyType_HasFeature(type, feature)  ((__Pyx_PyType_GetFlags(type) & (feature)) != 0)
+#else
+  #define __Pyx_PyType_GetFlags(tp)   (PyType_GetFlags((PyTypeObject *)tp))
+  #define __Pyx_PyType_HasFeature(type, feature)  PyType_HasFeature(type, feature)
+#endif
+#define __Pyx_PyObject_GetIterNextFunc(iterator)  __Pyx_PyObject_GetSlot(iterator, tp_iternext, iternextfunc)
+#if CYTHON_USE_TYPE_SPECS
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  {\
+    PyTypeObject *type = Py_TYPE((PyObject*)obj);\
+    assert(__Pyx_PyType_HasFeature(type, Py_TPFLAGS_HEAPTYPE));\
+    PyObject_GC_Del(obj);\
+    Py_DECREF(type);\
+}
+#else
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  PyObject_GC_Del(obj)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_ReadChar(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((void)u, 1114111U)
+  #define __Pyx_PyUnicode_KIND(u)         ((void)u, (0))
+  #define __Pyx_PyUnicode_KIND_04(u)      __Pyx_PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)k, PyUnicode_ReadChar((PyObject*)(d), i))
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GetLength(u))
+#else
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         ((int)PyUnicode_KIND(u))
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, (Py_UCS4) ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+  static CYTHON_INLINE int __Pyx_PyUnicode_KIND_04(PyObject *o) {
+      return __Pyx_PyUnicode_KIND(o) - (int) !!PyUnicode_IS_ASCII(o);
+  }
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #if !defined(PyUnicode_DecodeUnicodeEscape)
+    #define PyUnicode_DecodeUnicodeEscape(s, size, errors)  PyUnicode_Decode(s, size, "unicode_escape", errors)
+  #endif
+  #if !defined(PyUnicode_Contains)
+    #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+  #endif
+  #if !defined(PyByteArray_Check)
+    #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+  #endif
+  #if !defined(PyObject_Format)
+    #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+  #endif
+#endif
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && PyUnstable_Object_IsUniquelyReferenced(obj)) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#elif CYTHON_COMPILING_IN_CPYTHON
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && Py_REFCNT(obj) == 1) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#else
+  #define __Pyx_PySequence_ListKeepNew(obj)  PySequence_List(obj)
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        Py_IS_TYPE(obj, &PySet_Type)
+#endif
+enum __Pyx_ReferenceSharing {
+  __Pyx_ReferenceSharing_DefinitelyUnique, // We created it so we know it's unshared - no need to check
+  __Pyx_ReferenceSharing_OwnStrongReference,
+  __Pyx_ReferenceSharing_FunctionArgument,
+  __Pyx_ReferenceSharing_SharedReference, // Never trust it to be unshared because it's a global or similar
+};
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX >= 0x030E0000
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing)\
+    (sharing == __Pyx_ReferenceSharing_DefinitelyUnique ? 1 :\
+      (sharing == __Pyx_ReferenceSharing_FunctionArgument ? PyUnstable_Object_IsUniqueReferencedTemporary(o) :\
+      (sharing == __Pyx_ReferenceSharing_OwnStrongReference ? PyUnstable_Object_IsUniquelyReferenced(o) : 0)))
+#elif (CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING) || CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)sharing), Py_REFCNT(o) == 1)
+#else
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)o), ((void)sharing), 0)
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+  #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyList_GetItemRef(o, i) (likely((i) >= 0) ? PySequence_GetItem(o, i) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+  #else
+    #define __Pyx_PyList_GetItemRef(o, i) PySequence_ITEM(o, i)
+  #endif
+#elif CYTHON_COMPILING_IN_LIMITED_API || !(CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE)
+  #define __Pyx_PyList_GetItemRef(o, i) __Pyx_XNewRef(PyList_GetItem(o, i))
+#else
+  #define __Pyx_PyList_GetItemRef(o, i) (likely(__Pyx_is_valid_index(i, PyList_GET_SIZE(o))) ?\
+    __Pyx_NewRef(PyList_GET_ITEM(o, i)) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+#endif
+#if CYTHON_AVOID_BORROWED_REFS || CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_PyList_GetItemRef(o, i))
+#elif CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared) (\
+      __Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+      __Pyx_NewRef(PyList_GET_ITEM(o, i)) : __Pyx_PyList_GetItemRef(o, i))
+  #else
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared) (\
+      __Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+      __Pyx_XNewRef(PyList_GetItem(o, i)) : __Pyx_PyList_GetItemRef(o, i))
+  #endif
+#elif CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_NewRef(PyList_GET_ITEM(o, i)))
+#else
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_XNewRef(PyList_GetItem(o, i)))
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_PyDict_GetItemRef(dict, key, result) PyDict_GetItemRef(dict, key, result)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyObject_GetItem(dict, key);
+  if (*result == NULL) {
+    if (PyErr_ExceptionMatches(PyExc_KeyError)) {
+      PyErr_Clear();
+      return 0;
+    }
+    return -1;
+  }
+  return 1;
+}
+#else
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyDict_GetItemWithError(dict, key);
+  if (*result == NULL) {
+    return PyErr_Occurred() ? -1 : 0;
+  }
+  Py_INCREF(*result);
+  return 1;
+}
+#endif
+#if defined(CYTHON_DEBUG_VISIT_CONST) && CYTHON_DEBUG_VISIT_CONST
+  #define __Pyx_VISIT_CONST(obj)  Py_VISIT(obj)
+#else
+  #define __Pyx_VISIT_CONST(obj)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_ITEM(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) (PyTuple_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GET_ITEM(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) (PyList_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GET_ITEM(o, i)
+#else
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_GetItem(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) PyTuple_SetItem(o, i, v)
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GetItem(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) PyList_SetItem(o, i, v)
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GetItem(o, i)
+#endif
+#if CYTHON_ASSUME_SAFE_SIZE
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_GET_SIZE(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_GET_SIZE(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_GET_SIZE(o)
+  #define __Pyx_PyDict_GET_SIZE(o) PyDict_GET_SIZE(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_GET_SIZE(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_GET_SIZE(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GET_LENGTH(o)
+#else
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_Size(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_Size(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_Size(o)
+  #define __Pyx_PyDict_GET_SIZE(o) PyDict_Size(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_Size(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_Size(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GetLength(o)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_InternFromString)
+  #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+#endif
+#define __Pyx_PyLong_FromHash_t PyLong_FromSsize_t
+#define __Pyx_PyLong_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#if __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+    #define __Pyx_PySendResult PySendResult
+#else
+    typedef enum {
+        PYGEN_RETURN = 0,
+        PYGEN_ERROR = -1,
+        PYGEN_NEXT = 1,
+    } __Pyx_PySendResult;
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX < 0x030A00A3
+  typedef __Pyx_PySendResult (*__Pyx_pyiter_sendfunc)(PyObject *iter, PyObject *value, PyObject **result);
+#else
+  #define __Pyx_pyiter_sendfunc sendfunc
+#endif
+#if !CYTHON_USE_AM_SEND
+#define __PYX_HAS_PY_AM_SEND 0
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+#define __PYX_HAS_PY_AM_SEND 1
+#else
+#define __PYX_HAS_PY_AM_SEND 2  // our own backported implementation
+#endif
+#if __PYX_HAS_PY_AM_SEND < 2
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+#else
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+        __Pyx_pyiter_sendfunc am_send;
+    } __Pyx_PyAsyncMethodsStruct;
+    #define __Pyx_SlotTpAsAsync(s) ((PyAsyncMethods*)(s))
+#endif
+#if CYTHON_USE_AM_SEND && PY_VERSION_HEX < 0x030A00F0
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (1UL << 21)
+#else
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (0)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030A0000
+#ifdef __cplusplus
+extern "C"
+#endif
+PyAPI_FUNC(void *) PyMem_Calloc(size_t nelem, size_t elsize);
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_init_co_variable(PyObject *inspect, const char* name, int *write_to) {
+    int value;
+    PyObject *py_value = PyObject_GetAttrString(inspect, name);
+    if (!py_value) return 0;
+    value = (int) PyLong_AsLong(py_value);
+    Py_DECREF(py_value);
+    *write_to = value;
+    return value != -1 || !PyErr_Occurred();
+}
+static int __Pyx_init_co_variables(void) {
+    PyObject *inspect;
+    int result;
+    inspect = PyImport_ImportModule("inspect");
+    result =
+#if !defined(CO_OPTIMIZED)
+        __Pyx_init_co_variable(inspect, "CO_OPTIMIZED", &CO_OPTIMIZED) &&
+#endif
+#if !defined(CO_NEWLOCALS)
+        __Pyx_init_co_variable(inspect, "CO_NEWLOCALS", &CO_NEWLOCALS) &&
+#endif
+#if !defined(CO_VARARGS)
+        __Pyx_init_co_variable(inspect, "CO_VARARGS", &CO_VARARGS) &&
+#endif
+#if !defined(CO_VARKEYWORDS)
+        __Pyx_init_co_variable(inspect, "CO_VARKEYWORDS", &CO_VARKEYWORDS) &&
+#endif
+#if !defined(CO_ASYNC_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_ASYNC_GENERATOR", &CO_ASYNC_GENERATOR) &&
+#endif
+#if !defined(CO_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_GENERATOR", &CO_GENERATOR) &&
+#endif
+#if !defined(CO_COROUTINE)
+        __Pyx_init_co_variable(inspect, "CO_COROUTINE", &CO_COROUTINE) &&
+#endif
+        1;
+    Py_DECREF(inspect);
+    return result ? 0 : -1;
+}
+static int __Pyx_init_tpflags_bitcount(unsigned long flag) {
+    int count = 0;
+    while (flag) {
+        count += (int) (flag & 1);
+        flag >>= 1;
+    }
+    return count;
+}
+static int __Pyx_init_tpflags_variables(void) {
+    if (__Pyx_Runtime_TPFLAGS_SEQUENCE != 0 && __Pyx_Runtime_TPFLAGS_MAPPING != 0) {
+        return 0;
+    }
+    PyObject *collections_abc = PyImport_ImportModule("collections.abc");
+    if (!collections_abc) return -1;
+    int result = 0;
+    PyObject *sequence = NULL, *mapping = NULL;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030D0000
+    if (PyObject_GetOptionalAttrString(collections_abc, "Sequence", &sequence) != 1) goto fail;
+    if (PyObject_GetOptionalAttrString(collections_abc, "Mapping", &mapping) != 1) goto fail;
+#else
+    sequence = PyObject_GetAttrString(collections_abc, "Sequence");
+    if (!sequence) goto fail_attr_lookup;
+    mapping = PyObject_GetAttrString(collections_abc, "Mapping");
+    if (!mapping) goto fail_attr_lookup;
+#endif
+    if (!PyType_Check(sequence) || !PyType_Check(mapping)) goto fail;
+    {
+        unsigned long sequence_flags = PyType_GetFlags((PyTypeObject*)sequence);
+        unsigned long mapping_flags = PyType_GetFlags((PyTypeObject*)mapping);
+        unsigned long mutual_flags = sequence_flags & mapping_flags;
+        sequence_flags = sequence_flags ^ mutual_flags;
+        mapping_flags = mapping_flags ^ mutual_flags;
+        if (__Pyx_Runtime_TPFLAGS_SEQUENCE == 0 && __Pyx_init_tpflags_bitcount(sequence_flags) == 1) {
+            __Pyx_Runtime_TPFLAGS_SEQUENCE = sequence_flags;
+        }
+        if (__Pyx_Runtime_TPFLAGS_MAPPING == 0 && __Pyx_init_tpflags_bitcount(mapping_flags) == 1) {
+            __Pyx_Runtime_TPFLAGS_MAPPING = mapping_flags;
+        }
+    }
+    cleanup:
+    Py_XDECREF(mapping);
+    Py_XDECREF(sequence);
+    Py_DECREF(collections_abc);
+    return result;
+#if __PYX_LIMITED_VERSION_HEX < 0x030D0000
+    fail_attr_lookup:
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    }
+#endif
+    fail:
+    result = PyErr_Occurred() ? -1 : 0;
+    goto cleanup;
+}
+#else
+static int __Pyx_init_co_variables(void) {
+    return 0;  // It's a limited API-only feature
+}
+static int __Pyx_init_tpflags_variables(void) {
+    return 0;  // It's a limited API-only feature
+}
+#endif
+
+/* MathInitCode */
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #ifndef _USE_MATH_DEFINES
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#ifndef CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#define CYTHON_CLINE_IN_TRACEBACK_RUNTIME 0
+#endif
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+#define CYTHON_CLINE_IN_TRACEBACK CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#endif
+#if CYTHON_CLINE_IN_TRACEBACK
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; __pyx_clineno = __LINE__; (void) __pyx_clineno; }
+#else
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; (void) __pyx_clineno; }
+#endif
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifdef CYTHON_EXTERN_C
+    #undef __PYX_EXTERN_C
+    #define __PYX_EXTERN_C CYTHON_EXTERN_C
+#elif defined(__PYX_EXTERN_C)
+    #ifdef _MSC_VER
+    #pragma message ("Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.")
+    #else
+    #warning Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.
+    #endif
+#else
+    #define __PYX_EXTERN_C extern "C++"
+#endif
+
+#define __PYX_HAVE__sonolus__backend___opt__kernels
+#define __PYX_HAVE_API__sonolus__backend___opt__kernels
+/* Early includes */
+#include <stdint.h>
+#include <math.h>
+#include <string.h>
+#include <stdlib.h>
+#include "_ops_gen.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+#ifdef CYTHON_FREETHREADING_COMPATIBLE
+#if CYTHON_FREETHREADING_COMPATIBLE
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_NOT_USED
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char*);
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AS_STRING(s)
+#else
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AsString(s)
+#endif
+#define __Pyx_PyObject_AsWritableString(s)    ((char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromOrdinal(o)       PyUnicode_FromOrdinal((int)o)
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+static CYTHON_INLINE PyObject *__Pyx_NewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_NewRef)
+    return Py_NewRef(obj);
+#else
+    Py_INCREF(obj);
+    return obj;
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_XNewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_XNewRef)
+    return Py_XNewRef(obj);
+#else
+    Py_XINCREF(obj);
+    return obj;
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b);
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x);
+#define __Pyx_PyObject_RichCompareBool(a,b,cmp)  __Pyx_PyObject_IsTrueAndDecref(PyObject_RichCompare((a),(b),(cmp)))
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __Pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AS_DOUBLE(x)
+#define __Pyx_PyFloat_IsNonZero(x) (PyFloat_AS_DOUBLE(x) != 0.0)
+#else
+#define __Pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_IsNonZero(x) PyObject_IsTrue(x)
+#endif
+#define __Pyx_PyFloat_AsFloat(x) ((float) __Pyx_PyFloat_AsDouble(x))
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_VERSION_HEX >= 0x030C00A7
+  #ifndef _PyLong_SIGN_MASK
+    #define _PyLong_SIGN_MASK 3
+  #endif
+  #ifndef _PyLong_NON_SIZE_BITS
+    #define _PyLong_NON_SIZE_BITS 3
+  #endif
+  #define __Pyx_PyLong_SignBits(x)  ((int) (((PyLongObject*)x)->long_value.lv_tag & _PyLong_SIGN_MASK))
+  #define __Pyx_PyLong_Sign(x)  (1 - __Pyx_PyLong_SignBits(x))
+  #define __Pyx_PyLong_IsNeg(x)  ((__Pyx_PyLong_SignBits(x) & 2) != 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (!__Pyx_PyLong_IsNeg(x))
+  #define __Pyx_PyLong_IsZero(x)  (__Pyx_PyLong_SignBits(x) & 1)
+  #define __Pyx_PyLong_IsPos(x)  (__Pyx_PyLong_SignBits(x) == 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  (__Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  ((Py_ssize_t) (((PyLongObject*)x)->long_value.lv_tag >> _PyLong_NON_SIZE_BITS))
+  #define __Pyx_PyLong_SignedDigitCount(x)\
+        (((Py_ssize_t) __Pyx_PyLong_Sign(x)) * __Pyx_PyLong_DigitCount(x))
+  #if defined(PyUnstable_Long_IsCompact) && defined(PyUnstable_Long_CompactValue)
+    #define __Pyx_PyLong_IsCompact(x)     PyUnstable_Long_IsCompact((PyLongObject*) x)
+    #define __Pyx_PyLong_CompactValue(x)  PyUnstable_Long_CompactValue((PyLongObject*) x)
+  #else
+    #define __Pyx_PyLong_IsCompact(x)     (((PyLongObject*)x)->long_value.lv_tag < (2 << _PyLong_NON_SIZE_BITS))
+    #define __Pyx_PyLong_CompactValue(x)  (((Py_ssize_t) __Pyx_PyLong_Sign(x)) * (Py_ssize_t) __Pyx_PyLong_Digits(x)[0])
+  #endif
+  static CYTHON_INLINE Py_ssize_t __Pyx_PyLong_CompareSignAndSize(PyObject *a, PyObject *b) {
+      uintptr_t tag_a = ((PyLongObject*)a)->long_value.lv_tag;
+      uintptr_t tag_b = ((PyLongObject*)b)->long_value.lv_tag;
+      if (tag_a == tag_b) return 0;
+      int sign_a = (int) (tag_a & _PyLong_SIGN_MASK);
+      int sign_b = (int) (tag_b & _PyLong_SIGN_MASK);
+      if (sign_a > sign_b) return -1;
+      if (sign_a < sign_b) return 1;
+      Py_ssize_t size_a = (Py_ssize_t) (tag_a >> _PyLong_NON_SIZE_BITS);
+      Py_ssize_t size_b = (Py_ssize_t) (tag_b >> _PyLong_NON_SIZE_BITS);
+      return (1 - sign_a) * (size_a - size_b);
+  }
+  typedef Py_ssize_t  __Pyx_compact_pylong;
+  typedef size_t  __Pyx_compact_upylong;
+  #else
+  #define __Pyx_PyLong_Sign(x)  ((int) ((Py_SIZE(x) == 0) ? 0 : (Py_SIZE(x) < 0) ? -1 : 1))
+  #define __Pyx_PyLong_IsNeg(x)  (Py_SIZE(x) < 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (Py_SIZE(x) >= 0)
+  #define __Pyx_PyLong_IsZero(x)  (Py_SIZE(x) == 0)
+  #define __Pyx_PyLong_IsPos(x)  (Py_SIZE(x) > 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  ((Py_SIZE(x) == 0) ? 0 : __Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  __Pyx_sst_abs(Py_SIZE(x))
+  #define __Pyx_PyLong_SignedDigitCount(x)  Py_SIZE(x)
+  #define __Pyx_PyLong_IsCompact(x)  (Py_SIZE(x) == 0 || Py_SIZE(x) == 1 || Py_SIZE(x) == -1)
+  #define __Pyx_PyLong_CompactValue(x)\
+        ((Py_SIZE(x) == 0) ? (sdigit) 0 : ((Py_SIZE(x) < 0) ? -(sdigit)__Pyx_PyLong_Digits(x)[0] : (sdigit)__Pyx_PyLong_Digits(x)[0]))
+  #define __Pyx_PyLong_CompareSignAndSize(a, b)  (Py_SIZE(a) - Py_SIZE(b))
+  typedef sdigit  __Pyx_compact_pylong;
+  typedef digit  __Pyx_compact_upylong;
+  #endif
+  #if PY_VERSION_HEX >= 0x030C00A5
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->long_value.ob_digit)
+  #else
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->ob_digit)
+  #endif
+  #define __Pyx_PyLong_IsNonZero(x)  (!__Pyx_PyLong_IsZero(x))
+#else
+  #define __Pyx_PyLong_IsNonZero(x)  PyObject_IsTrue(x)
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#elif __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeASCII(c_str, size, NULL)
+#else
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+/* PretendToInitialize */
+#ifdef __cplusplus
+#if __cplusplus > 201103L
+#include <type_traits>
+#endif
+template <typename T>
+static void __Pyx_pretend_to_initialize(T* ptr) {
+#if __cplusplus > 201103L
+    if ((std::is_trivially_default_constructible<T>::value))
+#endif
+        *ptr = T();
+    (void)ptr;
+}
+#else
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+#endif
+
+
+#if !CYTHON_USE_MODULE_STATE
+static PyObject *__pyx_m = NULL;
+#endif
+static const char * const __pyx_cfilenm = __FILE__;
+
+/* #### Code section: filename_table ### */
+
+static const char* const __pyx_f[] = {
+  "sonolus/backend/_opt/kernels.pyx",
+};
+/* #### Code section: utility_code_proto_before_types ### */
+/* Atomics.proto (used by UnpackUnboundCMethod) */
+#include <pythread.h>
+#ifndef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 1
+#endif
+#define __PYX_CYTHON_ATOMICS_ENABLED() CYTHON_ATOMICS
+#define __PYX_GET_CYTHON_COMPILING_IN_CPYTHON_FREETHREADING() CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __pyx_atomic_int_type int
+#define __pyx_nonatomic_int_type int
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__))
+    #include <stdatomic.h>
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)))
+    #include <atomic>
+#endif
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__) &&\
+                       ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type atomic_int
+    #define __pyx_atomic_ptr_type atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) atomic_fetch_add_explicit(value, 1, memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) atomic_fetch_add_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) atomic_fetch_sub_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) atomic_load_explicit(value, memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) atomic_load_explicit(value, memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C atomics"
+    #endif
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)) &&\
+                    ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type std::atomic_int
+    #define __pyx_atomic_ptr_type std::atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) std::atomic_fetch_sub_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) std::atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) std::atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) std::atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) std::atomic_load_explicit(value, std::memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) std::atomic_load_explicit(value, std::memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) std::atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C++ atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C++ atomics"
+    #endif
+#elif CYTHON_ATOMICS && (__GNUC__ >= 5 || (__GNUC__ == 4 &&\
+                    (__GNUC_MINOR__ > 1 ||\
+                    (__GNUC_MINOR__ == 1 && __GNUC_PATCHLEVEL__ >= 2))))
+    #define __pyx_atomic_ptr_type void*
+    #define __pyx_nonatomic_ptr_type void*
+    #define __pyx_atomic_incr_relaxed(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) __sync_fetch_and_sub(value, 1)
+    #define __pyx_atomic_sub(value, arg) __sync_fetch_and_sub(value, arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_store(value, new_value) __sync_lock_test_and_set(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_load_acquire(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) __sync_lock_test_and_set(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_nonatomic_ptr_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Using GNU atomics"
+    #endif
+#elif CYTHON_ATOMICS && defined(_MSC_VER)
+    #include <intrin.h>
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type long
+    #define __pyx_atomic_ptr_type void*
+    #undef __pyx_nonatomic_int_type
+    #define __pyx_nonatomic_int_type long
+    #define __pyx_nonatomic_ptr_type void*
+    #pragma intrinsic (_InterlockedExchangeAdd, _InterlockedExchange, _InterlockedCompareExchange, _InterlockedCompareExchangePointer, _InterlockedExchangePointer)
+    #define __pyx_atomic_incr_relaxed(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) _InterlockedExchangeAdd(value, -1)
+    #define __pyx_atomic_sub(value, arg) _InterlockedExchangeAdd(value, -arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = _InterlockedCompareExchange(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) _InterlockedExchangeAdd(value, 0)
+    #define __pyx_atomic_store(value, new_value) _InterlockedExchange(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) *(void * volatile *)value
+    #define __pyx_atomic_pointer_load_acquire(value) _InterlockedCompareExchangePointer(value, 0, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) _InterlockedExchangePointer(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_atomic_ptr_type old = _InterlockedCompareExchangePointer(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #pragma message ("Using MSVC atomics")
+    #endif
+#else
+    #undef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 0
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Not using atomics"
+    #endif
+#endif
+
+/* CriticalSectionsDefinition.proto (used by CriticalSections) */
+#if !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyCriticalSection void*
+#define __Pyx_PyCriticalSection2 void*
+#define __Pyx_PyCriticalSection_End(cs)
+#define __Pyx_PyCriticalSection2_End(cs)
+#else
+#define __Pyx_PyCriticalSection PyCriticalSection
+#define __Pyx_PyCriticalSection2 PyCriticalSection2
+#define __Pyx_PyCriticalSection_End PyCriticalSection_End
+#define __Pyx_PyCriticalSection2_End PyCriticalSection2_End
+#endif
+
+/* CriticalSections.proto (used by ParseKeywordsImpl) */
+#if !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyCriticalSection_Begin(cs, arg) (void)(cs)
+#define __Pyx_PyCriticalSection2_Begin(cs, arg1, arg2) (void)(cs)
+#else
+#define __Pyx_PyCriticalSection_Begin PyCriticalSection_Begin
+#define __Pyx_PyCriticalSection2_Begin PyCriticalSection2_Begin
+#endif
+#if PY_VERSION_HEX < 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_BEGIN_CRITICAL_SECTION(o) {
+#define __Pyx_END_CRITICAL_SECTION() }
+#else
+#define __Pyx_BEGIN_CRITICAL_SECTION Py_BEGIN_CRITICAL_SECTION
+#define __Pyx_END_CRITICAL_SECTION Py_END_CRITICAL_SECTION
+#endif
+
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+/* IncludeStructmemberH.proto (used by CythonFunctionShared) */
+#include <structmember.h>
+
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+/* #### Code section: numeric_typedefs ### */
+/* #### Code section: complex_type_declarations ### */
+/* #### Code section: type_declarations ### */
+
+/*--- Type declarations ---*/
+
+/* "sonolus/backend/_opt/_ops_gen.pxd":7
+ * # declaration order (id == enumeration index); the synthetic mid-end opcodes
+ * # follow. OP_TABLE_SIZE is the total, and the metadata arrays are sized to it.
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     OP_Abs = 0
+ *     OP_Add = 1
+*/
+enum  {
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Abs = 0,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Add = 1,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_AddLifeScheduled = 2,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_And = 3,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arccos = 4,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arcsin = 5,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arctan = 6,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arctan2 = 7,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_BeatToBPM = 8,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_BeatToStartingBeat = 9,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_BeatToStartingTime = 10,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_BeatToTime = 11,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Block = 12,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Break = 13,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Ceil = 14,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Clamp = 15,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Copy = 16,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Cos = 17,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Cosh = 18,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DebugLog = 19,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DebugPause = 20,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPost = 21,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPostPointed = 22,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPostShifted = 23,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPre = 24,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPrePointed = 25,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DecrementPreShifted = 26,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Degree = 27,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DestroyParticleEffect = 28,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Divide = 29,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DoWhile = 30,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Draw = 31,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedB = 32,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedBT = 33,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedL = 34,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedLR = 35,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedR = 36,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_DrawCurvedT = 37,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInBack = 38,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInCirc = 39,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInCubic = 40,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInElastic = 41,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInExpo = 42,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutBack = 43,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutCirc = 44,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutCubic = 45,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutElastic = 46,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutExpo = 47,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutQuad = 48,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutQuart = 49,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutQuint = 50,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutSine = 51,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInQuad = 52,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInQuart = 53,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInQuint = 54,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInSine = 55,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutBack = 56,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutCirc = 57,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutCubic = 58,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutElastic = 59,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutExpo = 60,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInBack = 61,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInCirc = 62,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInCubic = 63,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInElastic = 64,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInExpo = 65,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInQuad = 66,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInQuart = 67,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInQuint = 68,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInSine = 69,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutQuad = 70,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutQuart = 71,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutQuint = 72,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutSine = 73,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Equal = 74,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Execute = 75,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Execute0 = 76,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_ExportValue = 77,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Floor = 78,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Frac = 79,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Get = 80,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_GetPointed = 81,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_GetShifted = 82,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Greater = 83,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_GreaterOr = 84,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_HasEffectClip = 85,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_HasParticleEffect = 86,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_HasSkinSprite = 87,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_If = 88,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPost = 89,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPostPointed = 90,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPostShifted = 91,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPre = 92,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPrePointed = 93,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_IncrementPreShifted = 94,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Judge = 95,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_JudgeSimple = 96,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_JumpLoop = 97,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Lerp = 98,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_LerpClamped = 99,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Less = 0x64,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_LessOr = 0x65,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Log = 0x66,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Max = 0x67,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Min = 0x68,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Mod = 0x69,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_MoveParticleEffect = 0x6A,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Multiply = 0x6B,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Negate = 0x6C,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Not = 0x6D,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_NotEqual = 0x6E,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Or = 0x6F,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Paint = 0x70,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Play = 0x71,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_PlayLooped = 0x72,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_PlayLoopedScheduled = 0x73,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_PlayScheduled = 0x74,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Power = 0x75,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Print = 0x76,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Radian = 0x77,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Random = 0x78,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_RandomInteger = 0x79,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Rem = 0x7A,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Remap = 0x7B,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_RemapClamped = 0x7C,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Round = 0x7D,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Set = 0x7E,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetAdd = 0x7F,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetAddPointed = 0x80,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetAddShifted = 0x81,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetDivide = 0x82,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetDividePointed = 0x83,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetDivideShifted = 0x84,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetMod = 0x85,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetModPointed = 0x86,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetModShifted = 0x87,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetMultiply = 0x88,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetMultiplyPointed = 0x89,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetMultiplyShifted = 0x8A,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetPointed = 0x8B,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetPower = 0x8C,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetPowerPointed = 0x8D,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetPowerShifted = 0x8E,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetRem = 0x8F,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetRemPointed = 0x90,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetRemShifted = 0x91,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetShifted = 0x92,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetSubtract = 0x93,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetSubtractPointed = 0x94,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SetSubtractShifted = 0x95,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Sign = 0x96,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Sin = 0x97,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Sinh = 0x98,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Spawn = 0x99,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SpawnParticleEffect = 0x9A,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackEnter = 0x9B,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackGet = 0x9C,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackGetFrame = 0x9D,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackGetFramePointer = 0x9E,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackGetPointer = 0x9F,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackGrow = 0xA0,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackInit = 0xA1,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackLeave = 0xA2,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackPop = 0xA3,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackPush = 0xA4,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackSet = 0xA5,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackSetFrame = 0xA6,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackSetFramePointer = 0xA7,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StackSetPointer = 0xA8,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StopLooped = 0xA9,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StopLoopedScheduled = 0xAA,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StreamGetNextKey = 0xAB,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StreamGetPreviousKey = 0xAC,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StreamGetValue = 0xAD,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StreamHas = 0xAE,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_StreamSet = 0xAF,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Subtract = 0xB0,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Switch = 0xB1,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SwitchInteger = 0xB2,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SwitchIntegerWithDefault = 0xB3,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SwitchWithDefault = 0xB4,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Tan = 0xB5,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Tanh = 0xB6,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TimeToScaledTime = 0xB7,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TimeToStartingScaledTime = 0xB8,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TimeToStartingTime = 0xB9,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TimeToTimeScale = 0xBA,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Trunc = 0xBB,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Unlerp = 0xBC,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_UnlerpClamped = 0xBD,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_While = 0xBE,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_PHI = 0xBF,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_CONST = 0xC0,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_GET = 0xC1,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_SET = 0xC2,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OPX_UNDEF = 0xC3,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_RUNTIME_COUNT = 0xBF,
+  __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TABLE_SIZE = 0xC4
+};
+
+/* "sonolus/backend/_opt/kernels.pxd":23
+ * 
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     FOLD_OK = 0            # *out was set to the folded double
+ *     FOLD_NOT_CONSTANT = 1  # not a compile-time constant (would raise / complex /
+*/
+enum  {
+  __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK = 0,
+  __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT = 1
+};
+/* #### Code section: utility_code_proto ### */
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, Py_ssize_t);
+    void (*DECREF)(void*, PyObject*, Py_ssize_t);
+    void (*GOTREF)(void*, PyObject*, Py_ssize_t);
+    void (*GIVEREF)(void*, PyObject*, Py_ssize_t);
+    void* (*SetupContext)(const char*, Py_ssize_t, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_XINCREF(r)  do { if((r) == NULL); else {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) == NULL); else {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) == NULL); else {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) == NULL); else {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContextNogil()
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_Py_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; Py_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* FastTypeChecks.proto (used by GivenExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
+#define __Pyx_PyAnySet_Check(obj)  __Pyx_TypeCheck2(obj, &PySet_Type, &PyFrozenSet_Type)
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
+#define __Pyx_PyAnySet_Check(obj)  PyAnySet_Check(obj)
+#endif
+
+/* PyThreadStateGet.proto (used by PyErrFetchRestore) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#if PY_VERSION_HEX >= 0x030C00A6
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
+#else
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
+#endif
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto (used by GivenExceptionMatches) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* GivenExceptionMatches.proto (used by PyErrExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2) {
+    return PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2);
+}
+#endif
+#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
+
+/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStr.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto (used by GetBuiltinName) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* CopyObjectArray.proto (used by TupleOrListFromArrayImpl) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length);
+#endif
+
+/* TupleOrListFromArrayImpl.proto (used by TupleFromArray) */
+#if PY_VERSION_HEX >= 0x030F0000 && !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_PyTuple_FromArray(src, n) PyTuple_FromArray(src, ((n)<0) ? 0 : (n))
+#else
+CYTHON_UNUSED static PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n);
+#endif
+
+/* TupleFromArray.proto (used by fastcall) */
+
+
+/* IncludeStringH.proto (used by PyObjectCompare) */
+#include <string.h>
+
+/* PyObjectCompare.proto (used by UnicodeEquals) */
+static CYTHON_INLINE int __Pyx_PyObject_CompareBoolEq_str_str(PyObject *op1, PyObject *op2, int pyop);
+
+/* UnicodeEquals.proto (used by fastcall) */
+#define __Pyx_PyUnicode_Equals(s1, s2)  __Pyx_PyObject_CompareBoolEq_str_str(s1, s2, Py_EQ)
+
+/* fastcall.proto */
+#if CYTHON_AVOID_BORROWED_REFS
+    #define __Pyx_ArgRef_VARARGS(args, i) __Pyx_PySequence_ITEM(args, i)
+#elif CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_ArgRef_VARARGS(args, i) __Pyx_NewRef(__Pyx_PyTuple_GET_ITEM(args, i))
+#else
+    #define __Pyx_ArgRef_VARARGS(args, i) __Pyx_XNewRef(PyTuple_GetItem(args, i))
+#endif
+#define __Pyx_NumKwargs_VARARGS(kwds) PyDict_Size(kwds)
+#define __Pyx_KwValues_VARARGS(args, nargs) NULL
+#define __Pyx_GetKwValue_VARARGS(kw, kwvalues, s) __Pyx_PyDict_GetItemStrWithError(kw, s)
+#define __Pyx_KwargsAsDict_VARARGS(kw, kwvalues) PyDict_Copy(kw)
+#if CYTHON_VECTORCALL
+    #define __Pyx_ArgRef_FASTCALL(args, i) __Pyx_NewRef(args[i])
+    #define __Pyx_NumKwargs_FASTCALL(kwds) __Pyx_PyTuple_GET_SIZE(kwds)
+    #define __Pyx_KwValues_FASTCALL(args, nargs) ((args) + (nargs))
+    static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_GRAAL
+    CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues);
+  #else
+    #define __Pyx_KwargsAsDict_FASTCALL(kw, kwvalues) _PyStack_AsDict(kwvalues, kw)
+  #endif
+#else
+    #define __Pyx_ArgRef_FASTCALL __Pyx_ArgRef_VARARGS
+    #define __Pyx_NumKwargs_FASTCALL __Pyx_NumKwargs_VARARGS
+    #define __Pyx_KwValues_FASTCALL __Pyx_KwValues_VARARGS
+    #define __Pyx_GetKwValue_FASTCALL __Pyx_GetKwValue_VARARGS
+    #define __Pyx_KwargsAsDict_FASTCALL __Pyx_KwargsAsDict_VARARGS
+#endif
+#if CYTHON_VECTORCALL_TPNEW
+    #if !CYTHON_VECTORCALL
+        #error Enabling CYTHON_VECTORCALL_TPNEW without CYTHON_VECTORCALL is not supported
+    #endif
+    #define __Pyx_ArgRef_FASTCALL_TPNEW __Pyx_ArgRef_FASTCALL
+    #define __Pyx_NumKwargs_FASTCALL_TPNEW __Pyx_NumKwargs_FASTCALL
+    #define __Pyx_KwValues_FASTCALL_TPNEW __Pyx_KwValues_FASTCALL
+    #define __Pyx_GetKwValue_FASTCALL_TPNEW __Pyx_GetKwValue_FASTCALL
+    #define __Pyx_KwargsAsDict_FASTCALL_TPNEW __Pyx_KwargsAsDict_FASTCALL
+#else
+    #define __Pyx_ArgRef_FASTCALL_TPNEW __Pyx_ArgRef_VARARGS
+    #define __Pyx_NumKwargs_FASTCALL_TPNEW __Pyx_NumKwargs_VARARGS
+    #define __Pyx_KwValues_FASTCALL_TPNEW __Pyx_KwValues_VARARGS
+    #define __Pyx_GetKwValue_FASTCALL_TPNEW __Pyx_GetKwValue_VARARGS
+    #define __Pyx_KwargsAsDict_FASTCALL_TPNEW __Pyx_KwargsAsDict_VARARGS
+#endif
+#define __Pyx_ArgsSlice_VARARGS(args, start, stop) PyTuple_GetSlice(args, start, stop)
+#if CYTHON_VECTORCALL
+#define __Pyx_ArgsSlice_FASTCALL(args, start, stop) __Pyx_PyTuple_FromArray(args + start, stop - start)
+#else
+#define __Pyx_ArgsSlice_FASTCALL __Pyx_ArgsSlice_VARARGS
+#endif
+
+/* py_dict_items.proto (used by OwnedDictNext) */
+#define __Pyx_PyDict_items_TypePtr  (&PyDictKeys_Type)
+#define __Pyx_PyDict_items_Check(obj)  PyObject_TypeCheck((obj), __Pyx_PyDictItems_TypePtr)
+#define __Pyx_PyDict_items_CheckExact(obj)  Py_IS_TYPE((obj), __Pyx_PyDictItems_TypePtr)
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Items(PyObject* d);
+
+/* CallCFunction.proto (used by CallUnboundCMethod0) */
+#define __Pyx_CallCFunction(cfunc, self, args)\
+    ((PyCFunction)(void(*)(void))(cfunc)->func)(self, args)
+#define __Pyx_CallCFunctionWithKeywords(cfunc, self, args, kwargs)\
+    ((PyCFunctionWithKeywords)(void(*)(void))(cfunc)->func)(self, args, kwargs)
+#define __Pyx_CallCFunctionFast(cfunc, self, args, nargs)\
+    ((__Pyx_PyCFunctionFast)(void(*)(void))(PyCFunction)(cfunc)->func)(self, args, nargs)
+#define __Pyx_CallCFunctionFastWithKeywords(cfunc, self, args, nargs, kwnames)\
+    ((__Pyx_PyCFunctionFastWithKeywords)(void(*)(void))(PyCFunction)(cfunc)->func)(self, args, nargs, kwnames)
+
+/* PyObjectCall.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectFastCall.proto (used by PyObjectCallOneArg) */
+#define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject * const*args, size_t nargsf, PyObject *kwargs);
+
+/* PyObjectCallOneArg.proto (used by CallUnboundCMethod0) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* UnpackUnboundCMethod_decl.proto (used by UnpackUnboundCMethod) */
+typedef struct {
+    PyObject *type;
+    PyObject **method_name;
+    PyCFunction func;
+    PyObject *method;
+    int flag;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && CYTHON_ATOMICS
+    __pyx_atomic_int_type initialized;
+#endif
+} __Pyx_CachedCFunction;
+
+/* IgnoreException.proto (used by UnpackUnboundCMethod_impl) */
+static CYTHON_INLINE int __Pyx_IgnoreGivenException(PyObject *given_exception, PyObject *ignorable_exception);
+#define __Pyx_IgnoreException(ignorable_exception) __Pyx_IgnoreGivenException(NULL, ignorable_exception)
+
+/* UnpackUnboundCMethod_impl.export */
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target);
+
+/* UnpackUnboundCMethod.proto (used by CallUnboundCMethod0) */
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+static CYTHON_INLINE int __Pyx_CachedCFunction_GetAndSetInitializing(__Pyx_CachedCFunction *cfunc) {
+#if !CYTHON_ATOMICS
+    return 1;
+#else
+    __pyx_nonatomic_int_type expected = 0;
+    if (__pyx_atomic_int_cmp_exchange(&cfunc->initialized, &expected, 1)) {
+        return 0;
+    }
+    return expected;
+#endif
+}
+static CYTHON_INLINE void __Pyx_CachedCFunction_SetFinishedInitializing(__Pyx_CachedCFunction *cfunc) {
+#if CYTHON_ATOMICS
+    __pyx_atomic_store(&cfunc->initialized, 2);
+#endif
+}
+#else
+#define __Pyx_CachedCFunction_GetAndSetInitializing(cfunc) 2
+#define __Pyx_CachedCFunction_SetFinishedInitializing(cfunc)
+#endif
+
+/* CallUnboundCMethod0.proto */
+CYTHON_UNUSED
+static PyObject* __Pyx__CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self);
+#else
+#define __Pyx_CallUnboundCMethod0(cfunc, self)  __Pyx__CallUnboundCMethod0(cfunc, self)
+#endif
+
+/* py_dict_values.proto (used by OwnedDictNext) */
+#define __Pyx_PyDict_values_TypePtr  (&PyDictKeys_Type)
+#define __Pyx_PyDict_values_Check(obj)  PyObject_TypeCheck((obj), __Pyx_PyDictValues_TypePtr)
+#define __Pyx_PyDict_values_CheckExact(obj)  Py_IS_TYPE((obj), __Pyx_PyDictValues_TypePtr)
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Values(PyObject* d);
+
+/* OwnedDictNext.proto (used by ParseKeywordsImpl) */
+#if CYTHON_AVOID_BORROWED_REFS
+static int __Pyx_PyDict_NextRef(PyObject *p, PyObject **ppos, PyObject **pkey, PyObject **pvalue);
+#else
+CYTHON_INLINE
+static int __Pyx_PyDict_NextRef(PyObject *p, Py_ssize_t *ppos, PyObject **pkey, PyObject **pvalue);
+#endif
+
+/* RaiseDoubleKeywords.proto (used by ParseKeywordsImpl) */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywordsImpl.export */
+static int __Pyx_ParseKeywordsTuple(
+    PyObject *kwds,
+    PyObject * const *kwvalues,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs
+);
+static int __Pyx_ParseKeywordDictToDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name
+);
+static int __Pyx_ParseKeywordDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs
+);
+
+/* CallUnboundCMethod2.proto */
+CYTHON_UNUSED
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2);
+#else
+#define __Pyx_CallUnboundCMethod2(cfunc, self, arg1, arg2)  __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2)
+#endif
+
+/* ParseKeywords.proto */
+static CYTHON_INLINE int __Pyx_ParseKeywords(
+    PyObject *kwds, PyObject *const *kwvalues, PyObject ** const argnames[],
+    PyObject *kwds2, PyObject *values[],
+    Py_ssize_t num_pos_args, Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs
+);
+
+/* RaiseArgTupleInvalid.export */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* PyDictVersioning.proto (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __Pyx_XNewRef(__pyx_dict_cached_value);\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_mstate_global->__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyFrozenDict.proto (used by GetItemInt) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_PyFrozenDict_TypePtr  ((PyTypeObject*) __pyx_mstate_global->__Pyx_PyFrozenDictType)
+#define __Pyx_PyFrozenDict_New(it)  __Pyx__PyFrozenDict_New(__pyx_mstate_global->__Pyx_PyFrozenDictType, it)
+static CYTHON_INLINE PyObject* __Pyx__PyFrozenDict_New(PyObject* frozendict_type, PyObject* it);
+#define __Pyx_PyFrozenDict_NewEmpty()  __Pyx_PyFrozenDict_New(NULL)
+#define __Pyx_PyFrozenDict_Check(obj)  PyObject_TypeCheck((obj), __Pyx_PyFrozenDict_TypePtr)
+#define __Pyx_PyFrozenDict_CheckExact(obj)  Py_IS_TYPE((obj), __Pyx_PyFrozenDict_TypePtr)
+#define __Pyx_PyAnyDict_Check(obj)   __Pyx__PyAnyDict_Check(obj, __Pyx_PyFrozenDict_TypePtr)
+static CYTHON_INLINE int __Pyx__PyAnyDict_Check(PyObject *obj, PyTypeObject* frozendict_type) {
+    return PyObject_TypeCheck(obj, &PyDict_Type) || PyObject_TypeCheck(obj, frozendict_type);
+}
+#define __Pyx_PyAnyDict_CheckExact(obj)  __Pyx__PyAnyDict_CheckExact(obj, __Pyx_PyFrozenDict_TypePtr)
+static CYTHON_INLINE int __Pyx__PyAnyDict_CheckExact(PyObject *obj, PyTypeObject* frozendict_type) {
+    return Py_IS_TYPE(obj, &PyDict_Type) || Py_IS_TYPE(obj, frozendict_type);
+}
+#elif PY_VERSION_HEX >= 0x030f00a6 ||\
+    (defined(PyFrozenDict_Check) && defined(PyAnyDict_Check) && defined(PyFrozenDict_New))
+#define __Pyx_PyFrozenDict_TypePtr  (&PyFrozenDict_Type)
+#define __Pyx_PyFrozenDict_New(it)  PyFrozenDict_New(it)
+#define __Pyx_PyFrozenDict_NewEmpty()  PyFrozenDict_New(NULL)
+#define __Pyx_PyFrozenDict_Check(obj)  PyFrozenDict_Check(obj)
+#define __Pyx_PyFrozenDict_CheckExact(obj)  PyFrozenDict_CheckExact(obj)
+#define __Pyx_PyAnyDict_Check(obj)  PyAnyDict_Check(obj)
+#define __Pyx_PyAnyDict_CheckExact(obj)  PyAnyDict_CheckExact(obj)
+#else
+#define __Pyx_PyFrozenDict_TypePtr  (&PyDict_Type)
+static CYTHON_INLINE PyObject* __Pyx_PyFrozenDict_New(PyObject* it) {
+    if (!it) {
+        return PyDict_New();
+    } else if (PyDict_Check(it)) {
+        return PyDict_Copy(it);
+    } else {
+        PyObject *dict = PyDict_New();
+        if (!dict) return NULL;
+        PyObject *result = PyNumber_InPlaceOr(dict, it);
+        Py_DECREF(dict);
+        return result;
+    }
+}
+#define __Pyx_PyFrozenDict_NewEmpty()  PyDict_New()
+#define __Pyx_PyFrozenDict_Check(obj)  PyDict_Check(obj)
+#define __Pyx_PyFrozenDict_CheckExact(obj)  PyDict_CheckExact(obj)
+#define __Pyx_PyAnyDict_Check(obj)  PyDict_Check(obj)
+#define __Pyx_PyAnyDict_CheckExact(obj)  PyDict_CheckExact(obj)
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, wraparound, boundscheck, has_gil, unsafe_shared)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, wraparound, boundscheck, unsafe_shared) :\
+    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, wraparound, boundscheck, has_gil, unsafe_shared)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck, unsafe_shared) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, wraparound, boundscheck, has_gil, unsafe_shared)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck, unsafe_shared) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int wraparound, int boundscheck, int unsafe_shared);
+
+/* FormatTypeName.proto (used by RaiseErrorWithObjectType) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%N"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) Py_NewRef((PyObject*)tp)
+#define __Pyx_DECREF_TypeName(obj) Py_DECREF(obj)
+#elif CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%U"
+#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
+static __Pyx_TypeName __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp);
+#else  // !LIMITED_API
+typedef const char *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%.200s"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) ((tp)->tp_name)
+#define __Pyx_DECREF_TypeName(obj)
+#endif
+
+/* RaiseErrorWithObjectType.proto (used by ObjectGetItem) */
+#define __Pyx_RaiseTypeErrorWithObjectType(message, obj)  __Pyx_RaiseErrorWithObjectType(PyExc_TypeError, message, obj)
+#define __Pyx_RaiseErrorWithObjectType(exc_type, message, obj)  __Pyx_RaiseErrorWithType(exc_type, message, Py_TYPE(obj))
+CYTHON_UNUSED
+static void __Pyx_RaiseErrorWithType(PyObject* exc_type, const char* message, PyTypeObject *type_obj);
+
+/* ObjectGetItem.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject *key);
+#else
+#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
+#endif
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* GetTopmostException.proto (used by SaveResetException) */
+#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* PyIndexError_Check.proto */
+#define __Pyx_PyExc_IndexError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_IndexError)
+
+/* RaiseException.export */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x);
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* FunctionExport.proto */
+static int __Pyx_ExportFunction(PyObject *api_dict, const char *name, void (*f)(void), const char *sig);
+
+/* GetApiDict.proto */
+static PyObject *__Pyx_ApiExport_GetApiDict(void);
+
+/* HasAttr.proto (used by ImportImpl) */
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_HasAttr(o, n)  PyObject_HasAttrWithError(o, n)
+#else
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+#endif
+
+/* TupleOrListFromArrayImpl.proto (used by ListFromArray) */
+CYTHON_UNUSED static PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n);
+
+/* ListFromArray.proto (used by ImportImpl) */
+
+
+/* ImportImpl.export */
+static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level);
+
+/* Import.proto */
+static CYTHON_INLINE PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level);
+
+/* ImportFrom.export */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* PyLongBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
+/* dict_setdefault.proto (used by FetchCommonType) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value);
+
+/* AddModuleRef.proto (used by FetchSharedCythonModule) */
+#if ((CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX < 0x030F00a3) ||\
+     __PYX_LIMITED_VERSION_HEX < 0x030d0000)
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name);
+#else
+  #define __Pyx_PyImport_AddModuleRef(name) PyImport_AddModuleRef(name)
+#endif
+
+/* FetchSharedCythonModule.proto (used by FetchCommonType) */
+static PyObject *__Pyx_FetchSharedCythonABIModule(void);
+
+/* VerifyCachedType.proto (used by FetchCommonType) */
+static int __Pyx_VerifyCachedType(PyObject *cached_type,
+                               const char *name,
+                               Py_ssize_t expected_basicsize);
+
+/* FetchCommonType.proto (used by CommonTypesMetaclass) */
+static PyTypeObject* __Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases);
+
+/* CommonTypesMetaclass.proto (used by CythonFunctionShared) */
+static int __pyx_CommonTypesMetaclass_init(PyObject *module);
+#define __Pyx_CommonTypesMetaclass_USED
+
+/* CythonFunctionPerModule.proto (used by CythonFunctionShared) */
+#define __Pyx_CyFunction_USED
+#if CYTHON_OPAQUE_SHARED_TYPES
+#define __Pyx_as_CyFunctionObject(o) ((__pyx_CyFunctionObject *)PyObject_GetTypeData((o), __pyx_mstate_global->__pyx_CyFunctionType))
+#else
+#define __Pyx_as_CyFunctionObject(o) ((__pyx_CyFunctionObject *)o)
+#endif
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CYFUNCTION_COROUTINE     0x08
+#define __Pyx_CyFunction_GetClosure(f)\
+    ((__Pyx_as_CyFunctionObject(f))->func_closure)
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx__CyFunction_GetClassObj(f)\
+      ((f)->func_classobj)
+#else
+  #define __Pyx__CyFunction_GetClassObj(f)\
+      ((PyObject*) ((PyCMethodObject *) (f))->mm_class)
+#endif
+#define __Pyx_CyFunction_GetClassObj(f)\
+    __Pyx__CyFunction_GetClassObj(__Pyx_as_CyFunctionObject(f))
+#define __Pyx_CyFunction_SetClassObj(f, classobj)\
+    __Pyx__CyFunction_SetClassObj(__Pyx_as_CyFunctionObject(f), (classobj))
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)((__Pyx_as_CyFunctionObject(f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    (__Pyx_as_CyFunctionObject(f))->defaults_getter = (g)
+typedef struct {
+#if CYTHON_COMPILING_IN_LIMITED_API
+#if !CYTHON_OPAQUE_OBJECTS
+    PyObject_HEAD
+#endif
+    PyMethodDef *func_methoddef;
+    PyObject *func_module;
+#else
+    PyCMethodObject func;
+#endif
+#if (CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY) && CYTHON_VECTORCALL
+    __pyx_vectorcallfunc func_vectorcall;
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_weakreflist;
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_dict;
+#endif
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_classobj;
+#endif
+    PyObject *defaults;
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+    PyObject *func_is_coroutine;
+#endif
+} __pyx_CyFunctionObject;
+#undef __Pyx_CyOrPyCFunction_Check
+#define __Pyx_CyFunction_Check(obj)  __Pyx_TypeCheck(obj, __pyx_mstate_global->__pyx_CyFunctionType)
+#define __Pyx_CyOrPyCFunction_Check(obj)  __Pyx_TypeCheck2(obj, __pyx_mstate_global->__pyx_CyFunctionType, &PyCFunction_Type)
+#define __Pyx_CyFunction_CheckExact(obj)  Py_IS_TYPE(obj, __pyx_mstate_global->__pyx_CyFunctionType)
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void));
+#undef __Pyx_IsSameCFunction
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCyOrCFunction(func, cfunc)
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj);
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_InitDefaults(PyObject *func,
+                                                         PyTypeObject *defaults_type);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(PyObject *module);
+#if CYTHON_VECTORCALL
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+#define __Pyx_CyFunction_func_vectorcall(f) ((f)->func_vectorcall)
+#else
+#define __Pyx_CyFunction_func_vectorcall(f) (((PyCFunctionObject*)f)->vectorcall)
+#endif
+#endif
+
+/* CallTypeTraverse.proto (used by CythonFunctionShared) */
+#if !CYTHON_USE_TYPE_SPECS
+#define __Pyx_call_type_traverse(o, always_call, visit, arg) 0
+#else
+static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg);
+#endif
+
+/* PyMethodNew.proto (used by CythonFunctionShared) */
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ);
+
+/* PyVectorcallFastCallDict.proto (used by CythonFunctionShared) */
+#if CYTHON_VECTORCALL
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw);
+#endif
+
+/* CythonFunctionShared.proto (used by CythonFunction) */
+static PyObject *__Pyx_CyFunction_Init(PyObject *op_in, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+#if CYTHON_VECTORCALL
+static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+#endif
+
+/* CythonFunction.export */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static PyTypeObject *__Pyx_Get_CyFunction_Type(void);
+
+/* CLineInTraceback.proto (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#else
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#endif
+
+/* CodeObjectCache.proto (used by AddTraceback) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject __Pyx_CachedCodeObjectType;
+#else
+typedef PyCodeObject __Pyx_CachedCodeObjectType;
+#endif
+typedef struct {
+    __Pyx_CachedCodeObjectType* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_int_type accessor_count;
+  #endif
+};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
+
+/* PyObjectVectorcallKwds.proto (used by PyObjectVectorcallMethodKwds) */
+#if CYTHON_VECTORCALL
+#define __Pyx_Object_VectorcallKwds PyObject_Vectorcall
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject *kwnames, Py_ssize_t i);
+#else
+#define __Pyx_Object_VectorcallKwds __Pyx_PyObject_FastCallDict
+CYTHON_UNUSED static PyObject *__Pyx_MakeKwargDict(PyObject **keys, PyObject **values, Py_ssize_t n);
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject **kwnames, Py_ssize_t i);
+#endif
+
+/* PyObjectVectorcallMethodKwds.proto (used by CIntToPy) */
+#if CYTHON_VECTORCALL
+#define __Pyx_Object_VectorcallMethodKwds PyObject_VectorcallMethod
+#else
+static PyObject *__Pyx_Object_VectorcallMethodKwds(PyObject *name, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From___pyx_anon_enum(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
+
+/* GetRuntimeVersion.proto */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+static unsigned long __Pyx_cached_runtime_version = 0;
+static void __Pyx_init_runtime_version(void);
+#else
+#define __Pyx_init_runtime_version()
+#endif
+static unsigned long __Pyx_get_runtime_version(void);
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer);
+
+/* MultiPhaseInitModuleState.proto */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#include <stdlib.h>
+static PyObject *__Pyx_State_FindModule(void*);
+static int __Pyx_State_AddModule(PyObject* module, void*);
+static int __Pyx_State_RemoveModule(void*);
+#elif CYTHON_USE_MODULE_STATE
+#define __Pyx_State_FindModule PyState_FindModule
+#define __Pyx_State_AddModule PyState_AddModule
+#define __Pyx_State_RemoveModule PyState_RemoveModule
+#endif
+
+/* #### Code section: module_declarations ### */
+/* CythonABIVersion.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #if CYTHON_VECTORCALL
+        #define __PYX_VECTORCALL_ABI_SUFFIX  "_vectorcall"
+    #else
+        #define __PYX_VECTORCALL_ABI_SUFFIX
+    #endif
+    #define __PYX_LIMITED_ABI_SUFFIX "limited" __PYX_VECTORCALL_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
+#else
+    #define __PYX_LIMITED_ABI_SUFFIX
+#endif
+#if __PYX_HAS_PY_AM_SEND == 1
+    #define __PYX_AM_SEND_ABI_SUFFIX
+#elif __PYX_HAS_PY_AM_SEND == 2
+    #define __PYX_AM_SEND_ABI_SUFFIX "amsendbackport"
+#else
+    #define __PYX_AM_SEND_ABI_SUFFIX "noamsend"
+#endif
+#ifndef __PYX_MONITORING_ABI_SUFFIX
+    #define __PYX_MONITORING_ABI_SUFFIX
+#endif
+#if CYTHON_USE_TP_FINALIZE
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX
+#else
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX "nofinalize"
+#endif
+#if CYTHON_USE_FREELISTS || !defined(__Pyx_AsyncGen_USED)
+    #define __PYX_FREELISTS_ABI_SUFFIX
+#else
+    #define __PYX_FREELISTS_ABI_SUFFIX "nofreelists"
+#endif
+#if CYTHON_OPAQUE_OBJECTS && CYTHON_COMPILING_IN_LIMITED_API
+    #define __PYX_OPAQUE_OBJECTS_ABI_SUFFIX "opaque"
+#else
+    #define __PYX_OPAQUE_OBJECTS_ABI_SUFFIX
+#endif
+#define CYTHON_ABI  __PYX_ABI_VERSION __PYX_LIMITED_ABI_SUFFIX __PYX_MONITORING_ABI_SUFFIX __PYX_TP_FINALIZE_ABI_SUFFIX __PYX_FREELISTS_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX __PYX_OPAQUE_OBJECTS_ABI_SUFFIX
+#define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
+#define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
+
+
+/* Module declarations from "libc.stdint" */
+
+/* Module declarations from "libc.math" */
+
+/* Module declarations from "libc.string" */
+
+/* Module declarations from "libc.stdlib" */
+
+/* Module declarations from "sonolus.backend._opt._ops_gen" */
+
+/* Module declarations from "sonolus.backend._opt.kernels" */
+static PyObject *__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_i;
+static PyObject *__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_op;
+static int __pyx_f_7sonolus_7backend_4_opt_7kernels_fold_op(uint16_t, double const *, int, double *); /*proto*/
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_7kernels__is_odd_int(double); /*proto*/
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__pymin2(double, double); /*proto*/
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__pymax2(double, double); /*proto*/
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__clamp01(double); /*proto*/
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_7kernels__f32_exact(double); /*proto*/
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__pymod(double, double); /*proto*/
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(double, double, double *); /*proto*/
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_7kernels__m2(double, double, double, double *); /*proto*/
+static int __pyx_f_7sonolus_7backend_4_opt_7kernels__float_pow(double, double, double *); /*proto*/
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(double, double); /*proto*/
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__judge(double, double, double, double, double, double, double); /*proto*/
+static int __pyx_f_7sonolus_7backend_4_opt_7kernels__fold_ease(uint16_t, double, double *); /*proto*/
+/* #### Code section: typeinfo ### */
+/* #### Code section: before_global_var ### */
+#define __Pyx_MODULE_NAME "sonolus.backend._opt.kernels"
+extern int __pyx_module_is_main_sonolus__backend___opt__kernels;
+int __pyx_module_is_main_sonolus__backend___opt__kernels = 0;
+
+/* Implementation of "sonolus.backend._opt.kernels" */
+/* #### Code section: global_var ### */
+static PyObject *__pyx_builtin_enumerate;
+/* #### Code section: string_decls ### */
+static const char __pyx_k_Constant_fold_kernels_C_double_e[] = "Constant-fold kernels: C-double evaluation of every foldable op.\n\nOwns the numeric semantics SCCP folds with.\nThe single dispatcher `fold_op` evaluates one all-constant-operand\ninstance of a foldable op and returns ``FOLD_OK`` (with ``*out`` set) or\n``FOLD_NOT_CONSTANT``.\n\n================================================================================\nCONTRACT (read before touching a kernel)\n================================================================================\n\n* **Literal transcription of the oracle** ``sonolus/backend/interpret.py``\n  (and the reference bodies it mirrors: ``math_impls`` for ``Rem``/``Frac``,\n  ``easing.py`` for the 36 ``Ease*``, ``bucket.py`` for ``Judge``/``JudgeSimple``,\n  JS ``Math.sign`` for ``Sign``). The differential tests\n  (``tests/backend/test_fold_kernels.py``) assert bit-for-bit equality with the\n  oracle over Hypothesis-generated operands, so drift is caught.\n\n* **NOT_CONSTANT iff the oracle would not yield a finite-domain real double.**\n  If ``Interpreter().run(...)`` would raise ``ZeroDivisionError`` /\n  ``ValueError`` / ``OverflowError`` (division-by-zero, ``Log``/``Arcsin``/...\n  domain errors, ``sinh`` overflow, ``ceil``/``round`` of inf/nan) or would\n  return a *complex* (``Power(-2, 0.5)``), ``fold_op`` returns\n  ``FOLD_NOT_CONSTANT`` rather than folding or trapping. Otherwise it reproduces\n  the oracle\047s double exactly, **including -0.0 and NaN payloads** (per IEEE;\n  the differential tests treat any NaN bit-pattern as equal, matching the const\n  table\047s NaN canonicalization). One exception to the \"iff\": the ``If``/``Switch*``\n  selects also return ``FOLD_NOT_CONSTANT`` when the test or an examined key is\n  not f32-roundtrip-exact (``_f32_exact``), so compile-time f64 selection matches\n  the 32-bit runtime exactly.\n\n* **Arity is fixed/exact.** The mid-end IR is *binary* for the associative ops\n  (``Add``/``Subtract``/``Multiply``/``Divide``/``Power``/``Mod``/``Rem`` take\n  ex""actly 2 operands here -- n-ary fusion happens only at emission, after SCCP),\n  and most other ops have a fixed arity (unary; ``If``/``Clamp``/``Lerp``/... 3;\n  ``Remap``/``JudgeSimple`` 5; ``Judge`` 8; the 36 ``Ease*`` 1). Variadic:\n  ``And``/``Or`` (any arity; short-circuit value fold) and the four ``Switch*``\n  selects (``Switch`` odd n >= 1, ``SwitchWithDefault`` even n >= 2,\n  ``SwitchInteger`` n >= 1, ``SwitchIntegerWithDefault`` n >= 2). A wrong\n  arity/parity yields ``FOLD_NOT_CONSTANT``.\n\n* **Value semantics only -- SCCP layers its policy exceptions separately.**\n  Those exceptions (``Multiply`` by a *known* 0 -> 0 with the other\n  operand unknown; ``And``-with-0 / ``Or``-with-1 short-circuits assuming\n  boolean) are *SCCP-lattice* decisions about partially-unknown operands. This\n  file only ever sees all-constant operands, so it folds ``And``/``Or``/\n  ``Multiply`` by strict value semantics (``Multiply(0, inf) = nan``,\n  ``And(2, 3) = 3``, ``Or(0, 5) = 5``). SCCP can then apply its exceptions on\n  top without contradicting the kernel.\n\nThe Python-visible `fold` wrapper (``None`` == NOT_CONSTANT) and the\nfoldability-table readers exist for the tests; the compiled hot path is\n``fold_op``.\n";
+/* #### Code section: decls ### */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_7kernels_fold(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_op, PyObject *__pyx_v_args); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_7kernels_2is_op_foldable(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_op_id); /* proto */
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_7kernels_4foldable_op_ids(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+/* #### Code section: late_includes ### */
+/* #### Code section: module_state ### */
+/* SmallCodeConfig */
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+#ifdef __cplusplus
+namespace {
+  #endif
+  typedef struct {
+    PyObject *__pyx_d;
+    PyObject *__pyx_b;
+    PyObject *__pyx_cython_runtime;
+    PyObject *__pyx_empty_tuple;
+    PyObject *__pyx_empty_bytes;
+    PyObject *__pyx_empty_unicode;
+    __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_items;
+    __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
+    __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
+    PyObject *__pyx_codeobj_tab[3];
+    PyObject *__pyx_string_tab[44];
+    PyObject *__pyx_number_tab[2];
+/* #### Code section: module_state_contents ### */
+/* PyFrozenDict.module_state_decls */
+#if CYTHON_COMPILING_IN_LIMITED_API
+PyObject *__Pyx_PyFrozenDictType;
+#endif
+
+/* CommonTypesMetaclass.module_state_decls */
+PyTypeObject *__pyx_CommonTypesMetaclassType;
+
+/* CachedMethodType.module_state_decls */
+#if CYTHON_COMPILING_IN_LIMITED_API
+PyObject *__Pyx_CachedMethodType;
+#endif
+
+/* CythonFunctionPerModule.module_state_decls */
+PyTypeObject *__pyx_CyFunctionType;
+
+/* CodeObjectCache.module_state_decls */
+struct __Pyx_CodeObjectCache __pyx_code_cache;
+
+/* #### Code section: module_state_end ### */
+} __pyx_mstatetype;
+#ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+
+#if CYTHON_USE_MODULE_STATE
+#ifdef __cplusplus
+namespace {
+extern struct PyModuleDef __pyx_moduledef;
+} /* anonymous namespace */
+#else
+static struct PyModuleDef __pyx_moduledef;
+#endif
+
+#define __pyx_mstate_global (__Pyx_PyModule_GetState(__Pyx_State_FindModule(&__pyx_moduledef)))
+
+#define __pyx_m (__Pyx_State_FindModule(&__pyx_moduledef))
+#else
+static __pyx_mstatetype __pyx_mstate_global_static =
+#ifdef __cplusplus
+    {};
+#else
+    {0};
+#endif
+static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_static;
+#endif
+/* #### Code section: constant_name_defines ### */
+#define __pyx_kp_u__2 __pyx_string_tab[0]
+#define __pyx_kp_u_ __pyx_string_tab[1]
+#define __pyx_kp_u_Op_id_out_of_range __pyx_string_tab[2]
+#define __pyx_kp_u_sonolus_backend__opt_kernels_pyx __pyx_string_tab[3]
+#define __pyx_n_u_Op __pyx_string_tab[4]
+#define __pyx_n_u_OP_IDS __pyx_string_tab[5]
+#define __pyx_n_u_Op_2 __pyx_string_tab[6]
+#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[7]
+#define __pyx_n_u_annotate __pyx_string_tab[8]
+#define __pyx_n_u_class_getitem __pyx_string_tab[9]
+#define __pyx_n_u_func __pyx_string_tab[10]
+#define __pyx_n_u_main __pyx_string_tab[11]
+#define __pyx_n_u_module __pyx_string_tab[12]
+#define __pyx_n_u_name __pyx_string_tab[13]
+#define __pyx_n_u_pyx_capi __pyx_string_tab[14]
+#define __pyx_n_u_qualname __pyx_string_tab[15]
+#define __pyx_n_u_test __pyx_string_tab[16]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[17]
+#define __pyx_n_u_args __pyx_string_tab[18]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[19]
+#define __pyx_n_u_buf __pyx_string_tab[20]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[21]
+#define __pyx_n_u_enumerate __pyx_string_tab[22]
+#define __pyx_n_u_fold __pyx_string_tab[23]
+#define __pyx_n_u_foldable_op_ids __pyx_string_tab[24]
+#define __pyx_n_u_i __pyx_string_tab[25]
+#define __pyx_n_u_is_op_foldable __pyx_string_tab[26]
+#define __pyx_n_u_items __pyx_string_tab[27]
+#define __pyx_n_u_n __pyx_string_tab[28]
+#define __pyx_n_u_op __pyx_string_tab[29]
+#define __pyx_n_u_op_id __pyx_string_tab[30]
+#define __pyx_n_u_pop __pyx_string_tab[31]
+#define __pyx_n_u_result __pyx_string_tab[32]
+#define __pyx_n_u_setdefault __pyx_string_tab[33]
+#define __pyx_n_u_sonolus_backend__opt_kernels __pyx_string_tab[34]
+#define __pyx_n_u_sonolus_backend_ops __pyx_string_tab[35]
+#define __pyx_n_u_stackbuf __pyx_string_tab[36]
+#define __pyx_n_u_status __pyx_string_tab[37]
+#define __pyx_n_u_value __pyx_string_tab[38]
+#define __pyx_n_u_values __pyx_string_tab[39]
+#define __pyx_kp_b_int_uint16_t_double_const_int_do __pyx_string_tab[40]
+#define __pyx_kp_b_iso88591_vRr_F_Q_j_awc __pyx_string_tab[41]
+#define __pyx_kp_b_iso88591_Q_U_1_as_Q_1 __pyx_string_tab[42]
+#define __pyx_kp_b_iso88591_q_z_a_q_1D_q_1A_r_1_ivQhb_4s_E __pyx_string_tab[43]
+#define __pyx_int_0 __pyx_number_tab[0]
+#define __pyx_int_1 __pyx_number_tab[1]
+/* #### Code section: module_state_clear ### */
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
+  __pyx_mstatetype *clear_module_state = __Pyx_PyModule_GetState(m);
+  if (!clear_module_state) return 0;
+  Py_CLEAR(clear_module_state->__pyx_d);
+  Py_CLEAR(clear_module_state->__pyx_b);
+  Py_CLEAR(clear_module_state->__pyx_cython_runtime);
+  Py_CLEAR(clear_module_state->__pyx_empty_tuple);
+  Py_CLEAR(clear_module_state->__pyx_empty_bytes);
+  Py_CLEAR(clear_module_state->__pyx_empty_unicode);
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __Pyx_State_RemoveModule(NULL);
+  #endif
+  Py_CLEAR(clear_module_state->__pyx_umethod_PyDict_Type_items.method);
+  Py_CLEAR(clear_module_state->__pyx_umethod_PyDict_Type_pop.method);
+  Py_CLEAR(clear_module_state->__pyx_umethod_PyDict_Type_values.method);
+  for (int i=0; i<3; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<44; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
+/* #### Code section: module_state_clear_contents ### */
+/* CommonTypesMetaclass.module_state_clear */
+Py_CLEAR(clear_module_state->__pyx_CommonTypesMetaclassType);
+
+/* CythonFunctionPerModule.module_state_clear */
+Py_CLEAR(clear_module_state->__pyx_CyFunctionType);
+
+/* #### Code section: module_state_clear_end ### */
+return 0;
+}
+#endif
+/* #### Code section: module_state_traverse ### */
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
+  __pyx_mstatetype *traverse_module_state = __Pyx_PyModule_GetState(m);
+  if (!traverse_module_state) return 0;
+  Py_VISIT(traverse_module_state->__pyx_d);
+  Py_VISIT(traverse_module_state->__pyx_b);
+  Py_VISIT(traverse_module_state->__pyx_cython_runtime);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_tuple);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
+  Py_VISIT(traverse_module_state->__pyx_umethod_PyDict_Type_items.method);
+  Py_VISIT(traverse_module_state->__pyx_umethod_PyDict_Type_pop.method);
+  Py_VISIT(traverse_module_state->__pyx_umethod_PyDict_Type_values.method);
+  for (int i=0; i<3; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<44; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
+/* #### Code section: module_state_traverse_contents ### */
+/* CommonTypesMetaclass.module_state_traverse */
+Py_VISIT(traverse_module_state->__pyx_CommonTypesMetaclassType);
+
+/* CythonFunctionPerModule.module_state_traverse */
+Py_VISIT(traverse_module_state->__pyx_CyFunctionType);
+
+/* #### Code section: module_state_traverse_end ### */
+return 0;
+}
+#endif
+/* #### Code section: module_code ### */
+
+/* "sonolus/backend/_opt/kernels.pyx":93
+ * # ==========================================================================
+ * 
+ * cdef inline bint _is_odd_int(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # CPython's DOUBLE_IS_ODD_INTEGER.
+ *     return fmod(fabs(x), 2.0) == 1.0
+*/
+
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_7kernels__is_odd_int(double __pyx_v_x) {
+  int __pyx_r;
+
+  /* "sonolus/backend/_opt/kernels.pyx":95
+ * cdef inline bint _is_odd_int(double x) noexcept nogil:
+ *     # CPython's DOUBLE_IS_ODD_INTEGER.
+ *     return fmod(fabs(x), 2.0) == 1.0             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = (fmod(fabs(__pyx_v_x), 2.0) == 1.0);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":93
+ * # ==========================================================================
+ * 
+ * cdef inline bint _is_odd_int(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # CPython's DOUBLE_IS_ODD_INTEGER.
+ *     return fmod(fabs(x), 2.0) == 1.0
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":98
+ * 
+ * 
+ * cdef inline double _pymin2(double a, double b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Python ``min(a, b)``: keep the first unless the second is strictly less
+ *     # (so min(1, nan) == 1, min(0.0, -0.0) == 0.0).
+*/
+
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__pymin2(double __pyx_v_a, double __pyx_v_b) {
+  double __pyx_r;
+  double __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "sonolus/backend/_opt/kernels.pyx":101
+ *     # Python ``min(a, b)``: keep the first unless the second is strictly less
+ *     # (so min(1, nan) == 1, min(0.0, -0.0) == 0.0).
+ *     return b if b < a else a             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_2 = (__pyx_v_b < __pyx_v_a);
+
+  if (__pyx_t_2) {
+
+    __pyx_t_1 = __pyx_v_b;
+  } else {
+
+    __pyx_t_1 = __pyx_v_a;
+  }
+
+  {
+    __pyx_r = __pyx_t_1;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":98
+ * 
+ * 
+ * cdef inline double _pymin2(double a, double b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Python ``min(a, b)``: keep the first unless the second is strictly less
+ *     # (so min(1, nan) == 1, min(0.0, -0.0) == 0.0).
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":104
+ * 
+ * 
+ * cdef inline double _pymax2(double a, double b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Python ``max(a, b)``: keep the first unless the second is strictly greater.
+ *     return b if b > a else a
+*/
+
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__pymax2(double __pyx_v_a, double __pyx_v_b) {
+  double __pyx_r;
+  double __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "sonolus/backend/_opt/kernels.pyx":106
+ * cdef inline double _pymax2(double a, double b) noexcept nogil:
+ *     # Python ``max(a, b)``: keep the first unless the second is strictly greater.
+ *     return b if b > a else a             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_2 = (__pyx_v_b > __pyx_v_a);
+
+  if (__pyx_t_2) {
+
+    __pyx_t_1 = __pyx_v_b;
+  } else {
+
+    __pyx_t_1 = __pyx_v_a;
+  }
+
+  {
+    __pyx_r = __pyx_t_1;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":104
+ * 
+ * 
+ * cdef inline double _pymax2(double a, double b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Python ``max(a, b)``: keep the first unless the second is strictly greater.
+ *     return b if b > a else a
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":109
+ * 
+ * 
+ * cdef inline double _clamp01(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # ``max(0, min(1, x))`` == clamp(x, 0, 1) with Python min/max semantics.
+ *     # NaN -> 1.0 (min(1, nan)=1 then max(0, 1)=1); -0.0 -> +0.0.
+*/
+
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__clamp01(double __pyx_v_x) {
+  double __pyx_v_m;
+  double __pyx_r;
+  double __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "sonolus/backend/_opt/kernels.pyx":112
+ *     # ``max(0, min(1, x))`` == clamp(x, 0, 1) with Python min/max semantics.
+ *     # NaN -> 1.0 (min(1, nan)=1 then max(0, 1)=1); -0.0 -> +0.0.
+ *     cdef double m = x if x < 1.0 else 1.0             # <<<<<<<<<<<<<<
+ *     return m if m > 0.0 else 0.0
+ * 
+*/
+  __pyx_t_2 = (__pyx_v_x < 1.0);
+
+  if (__pyx_t_2) {
+
+    __pyx_t_1 = __pyx_v_x;
+  } else {
+
+    __pyx_t_1 = 1.0;
+  }
+
+  __pyx_v_m = __pyx_t_1;
+
+  /* "sonolus/backend/_opt/kernels.pyx":113
+ *     # NaN -> 1.0 (min(1, nan)=1 then max(0, 1)=1); -0.0 -> +0.0.
+ *     cdef double m = x if x < 1.0 else 1.0
+ *     return m if m > 0.0 else 0.0             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_2 = (__pyx_v_m > 0.0);
+
+  if (__pyx_t_2) {
+
+    __pyx_t_1 = __pyx_v_m;
+  } else {
+
+    __pyx_t_1 = 0.0;
+  }
+
+  {
+    __pyx_r = __pyx_t_1;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":109
+ * 
+ * 
+ * cdef inline double _clamp01(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # ``max(0, min(1, x))`` == clamp(x, 0, 1) with Python min/max semantics.
+ *     # NaN -> 1.0 (min(1, nan)=1 then max(0, 1)=1); -0.0 -> +0.0.
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":116
+ * 
+ * 
+ * cdef inline bint _f32_exact(double v) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Fold guard for the If/Switch* test and keys: fold only when `v` survives an
+ *     # f32 roundtrip, so compile-time f64 selection agrees exactly with the 32-bit
+*/
+
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_7kernels__f32_exact(double __pyx_v_v) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "sonolus/backend/_opt/kernels.pyx":120
+ *     # f32 roundtrip, so compile-time f64 selection agrees exactly with the 32-bit
+ *     # runtime. NaN folds through (truthiness and `==` key-miss agree in both widths).
+ *     return isnan(v) or v == <double><float>v             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_2 = isnan(__pyx_v_v);
+
+  if (!__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_v == ((double)((float)__pyx_v_v)));
+
+
+  __pyx_t_1 = __pyx_t_2;
+
+  __pyx_L3_bool_binop_done:;
+  {
+    __pyx_r = __pyx_t_1;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":116
+ * 
+ * 
+ * cdef inline bint _f32_exact(double v) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Fold guard for the If/Switch* test and keys: fold only when `v` survives an
+ *     # f32 roundtrip, so compile-time f64 selection agrees exactly with the 32-bit
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":123
+ * 
+ * 
+ * cdef inline double _pymod(double a, double b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # CPython float_rem (``a % b``); caller must ensure b != 0. Remainder takes
+ *     # the sign of the divisor; zero remainder -> copysign(0, b).
+*/
+
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__pymod(double __pyx_v_a, double __pyx_v_b) {
+  double __pyx_v_mod;
+  double __pyx_r;
+  int __pyx_t_1;
+
+  /* "sonolus/backend/_opt/kernels.pyx":126
+ *     # CPython float_rem (``a % b``); caller must ensure b != 0. Remainder takes
+ *     # the sign of the divisor; zero remainder -> copysign(0, b).
+ *     cdef double mod = fmod(a, b)             # <<<<<<<<<<<<<<
+ *     if mod != 0.0:
+ *         if (b < 0.0) != (mod < 0.0):
+*/
+  __pyx_v_mod = fmod(__pyx_v_a, __pyx_v_b);
+
+  /* "sonolus/backend/_opt/kernels.pyx":127
+ *     # the sign of the divisor; zero remainder -> copysign(0, b).
+ *     cdef double mod = fmod(a, b)
+ *     if mod != 0.0:             # <<<<<<<<<<<<<<
+ *         if (b < 0.0) != (mod < 0.0):
+ *             mod += b
+*/
+  __pyx_t_1 = (__pyx_v_mod != 0.0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":128
+ *     cdef double mod = fmod(a, b)
+ *     if mod != 0.0:
+ *         if (b < 0.0) != (mod < 0.0):             # <<<<<<<<<<<<<<
+ *             mod += b
+ *     else:
+*/
+    __pyx_t_1 = ((__pyx_v_b < 0.0) != (__pyx_v_mod < 0.0));
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":129
+ *     if mod != 0.0:
+ *         if (b < 0.0) != (mod < 0.0):
+ *             mod += b             # <<<<<<<<<<<<<<
+ *     else:
+ *         mod = copysign(0.0, b)
+*/
+      __pyx_v_mod = (__pyx_v_mod + __pyx_v_b);
+
+      /* "sonolus/backend/_opt/kernels.pyx":128
+ *     cdef double mod = fmod(a, b)
+ *     if mod != 0.0:
+ *         if (b < 0.0) != (mod < 0.0):             # <<<<<<<<<<<<<<
+ *             mod += b
+ *     else:
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":127
+ *     # the sign of the divisor; zero remainder -> copysign(0, b).
+ *     cdef double mod = fmod(a, b)
+ *     if mod != 0.0:             # <<<<<<<<<<<<<<
+ *         if (b < 0.0) != (mod < 0.0):
+ *             mod += b
+*/
+    goto __pyx_L3;
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":131
+ *             mod += b
+ *     else:
+ *         mod = copysign(0.0, b)             # <<<<<<<<<<<<<<
+ *     return mod
+ * 
+*/
+  /*else*/ {
+    __pyx_v_mod = copysign(0.0, __pyx_v_b);
+  }
+  __pyx_L3:;
+
+  /* "sonolus/backend/_opt/kernels.pyx":132
+ *     else:
+ *         mod = copysign(0.0, b)
+ *     return mod             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = __pyx_v_mod;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":123
+ * 
+ * 
+ * cdef inline double _pymod(double a, double b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # CPython float_rem (``a % b``); caller must ensure b != 0. Remainder takes
+ *     # the sign of the divisor; zero remainder -> copysign(0, b).
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":135
+ * 
+ * 
+ * cdef inline int _m1(double r, double x, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # CPython ``math_1`` error rule: domain error (nan out from non-nan in) and
+ *     # singularity/overflow (inf out from finite in) both raise -> NOT_CONSTANT.
+*/
+
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(double __pyx_v_r, double __pyx_v_x, double *__pyx_v_out) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "sonolus/backend/_opt/kernels.pyx":138
+ *     # CPython ``math_1`` error rule: domain error (nan out from non-nan in) and
+ *     # singularity/overflow (inf out from finite in) both raise -> NOT_CONSTANT.
+ *     if isnan(r) and not isnan(x):             # <<<<<<<<<<<<<<
+ *         return FOLD_NOT_CONSTANT
+ *     if isinf(r) and isfinite(x):
+*/
+  __pyx_t_2 = isnan(__pyx_v_r);
+
+  if (__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (!isnan(__pyx_v_x));
+
+
+  __pyx_t_1 = __pyx_t_2;
+
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":139
+ *     # singularity/overflow (inf out from finite in) both raise -> NOT_CONSTANT.
+ *     if isnan(r) and not isnan(x):
+ *         return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *     if isinf(r) and isfinite(x):
+ *         return FOLD_NOT_CONSTANT
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":138
+ *     # CPython ``math_1`` error rule: domain error (nan out from non-nan in) and
+ *     # singularity/overflow (inf out from finite in) both raise -> NOT_CONSTANT.
+ *     if isnan(r) and not isnan(x):             # <<<<<<<<<<<<<<
+ *         return FOLD_NOT_CONSTANT
+ *     if isinf(r) and isfinite(x):
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":140
+ *     if isnan(r) and not isnan(x):
+ *         return FOLD_NOT_CONSTANT
+ *     if isinf(r) and isfinite(x):             # <<<<<<<<<<<<<<
+ *         return FOLD_NOT_CONSTANT
+ *     out[0] = r
+*/
+  __pyx_t_2 = (isinf(__pyx_v_r) != 0);
+
+  if (__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L7_bool_binop_done;
+  }
+  __pyx_t_2 = isfinite(__pyx_v_x);
+
+
+  __pyx_t_1 = __pyx_t_2;
+
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":141
+ *         return FOLD_NOT_CONSTANT
+ *     if isinf(r) and isfinite(x):
+ *         return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *     out[0] = r
+ *     return FOLD_OK
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":140
+ *     if isnan(r) and not isnan(x):
+ *         return FOLD_NOT_CONSTANT
+ *     if isinf(r) and isfinite(x):             # <<<<<<<<<<<<<<
+ *         return FOLD_NOT_CONSTANT
+ *     out[0] = r
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":142
+ *     if isinf(r) and isfinite(x):
+ *         return FOLD_NOT_CONSTANT
+ *     out[0] = r             # <<<<<<<<<<<<<<
+ *     return FOLD_OK
+ * 
+*/
+  (__pyx_v_out[0]) = __pyx_v_r;
+
+  /* "sonolus/backend/_opt/kernels.pyx":143
+ *         return FOLD_NOT_CONSTANT
+ *     out[0] = r
+ *     return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":135
+ * 
+ * 
+ * cdef inline int _m1(double r, double x, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # CPython ``math_1`` error rule: domain error (nan out from non-nan in) and
+ *     # singularity/overflow (inf out from finite in) both raise -> NOT_CONSTANT.
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":146
+ * 
+ * 
+ * cdef inline int _m2(double r, double x, double y, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # CPython ``math_2`` error rule (atan2).
+ *     if isnan(r) and not isnan(x) and not isnan(y):
+*/
+
+static CYTHON_INLINE int __pyx_f_7sonolus_7backend_4_opt_7kernels__m2(double __pyx_v_r, double __pyx_v_x, double __pyx_v_y, double *__pyx_v_out) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "sonolus/backend/_opt/kernels.pyx":148
+ * cdef inline int _m2(double r, double x, double y, double* out) noexcept nogil:
+ *     # CPython ``math_2`` error rule (atan2).
+ *     if isnan(r) and not isnan(x) and not isnan(y):             # <<<<<<<<<<<<<<
+ *         return FOLD_NOT_CONSTANT
+ *     if isinf(r) and isfinite(x) and isfinite(y):
+*/
+  __pyx_t_2 = isnan(__pyx_v_r);
+
+  if (__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (!isnan(__pyx_v_x));
+
+  if (__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (!isnan(__pyx_v_y));
+
+
+  __pyx_t_1 = __pyx_t_2;
+
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":149
+ *     # CPython ``math_2`` error rule (atan2).
+ *     if isnan(r) and not isnan(x) and not isnan(y):
+ *         return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *     if isinf(r) and isfinite(x) and isfinite(y):
+ *         return FOLD_NOT_CONSTANT
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":148
+ * cdef inline int _m2(double r, double x, double y, double* out) noexcept nogil:
+ *     # CPython ``math_2`` error rule (atan2).
+ *     if isnan(r) and not isnan(x) and not isnan(y):             # <<<<<<<<<<<<<<
+ *         return FOLD_NOT_CONSTANT
+ *     if isinf(r) and isfinite(x) and isfinite(y):
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":150
+ *     if isnan(r) and not isnan(x) and not isnan(y):
+ *         return FOLD_NOT_CONSTANT
+ *     if isinf(r) and isfinite(x) and isfinite(y):             # <<<<<<<<<<<<<<
+ *         return FOLD_NOT_CONSTANT
+ *     out[0] = r
+*/
+  __pyx_t_2 = (isinf(__pyx_v_r) != 0);
+
+  if (__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = isfinite(__pyx_v_x);
+
+  if (__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = isfinite(__pyx_v_y);
+
+
+  __pyx_t_1 = __pyx_t_2;
+
+  __pyx_L8_bool_binop_done:;
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":151
+ *         return FOLD_NOT_CONSTANT
+ *     if isinf(r) and isfinite(x) and isfinite(y):
+ *         return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *     out[0] = r
+ *     return FOLD_OK
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":150
+ *     if isnan(r) and not isnan(x) and not isnan(y):
+ *         return FOLD_NOT_CONSTANT
+ *     if isinf(r) and isfinite(x) and isfinite(y):             # <<<<<<<<<<<<<<
+ *         return FOLD_NOT_CONSTANT
+ *     out[0] = r
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":152
+ *     if isinf(r) and isfinite(x) and isfinite(y):
+ *         return FOLD_NOT_CONSTANT
+ *     out[0] = r             # <<<<<<<<<<<<<<
+ *     return FOLD_OK
+ * 
+*/
+  (__pyx_v_out[0]) = __pyx_v_r;
+
+  /* "sonolus/backend/_opt/kernels.pyx":153
+ *         return FOLD_NOT_CONSTANT
+ *     out[0] = r
+ *     return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":146
+ * 
+ * 
+ * cdef inline int _m2(double r, double x, double y, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # CPython ``math_2`` error rule (atan2).
+ *     if isnan(r) and not isnan(x) and not isnan(y):
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":156
+ * 
+ * 
+ * cdef int _float_pow(double iv, double iw, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """CPython ``float.__pow__`` (``operator.pow``) semantics for ``Op.Power``.
+ * 
+*/
+
+static int __pyx_f_7sonolus_7backend_4_opt_7kernels__float_pow(double __pyx_v_iv, double __pyx_v_iw, double *__pyx_v_out) {
+  double __pyx_v_ix;
+  double __pyx_v_aiv;
+  int __pyx_v_negate;
+  int __pyx_r;
+  int __pyx_t_1;
+  double __pyx_t_2;
+
+
+  /* "sonolus/backend/_opt/kernels.pyx":166
+ *     cdef double aiv
+ *     cdef bint negate
+ *     if iw == 0.0:            # v ** 0 == 1, even nan/0/inf ** 0             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_iw == 0.0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":167
+ *     cdef bint negate
+ *     if iw == 0.0:            # v ** 0 == 1, even nan/0/inf ** 0
+ *         out[0] = 1.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if isnan(iv):            # nan ** w == nan (w != 0)
+*/
+    (__pyx_v_out[0]) = 1.0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":168
+ *     if iw == 0.0:            # v ** 0 == 1, even nan/0/inf ** 0
+ *         out[0] = 1.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if isnan(iv):            # nan ** w == nan (w != 0)
+ *         out[0] = iv
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":166
+ *     cdef double aiv
+ *     cdef bint negate
+ *     if iw == 0.0:            # v ** 0 == 1, even nan/0/inf ** 0             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":169
+ *         out[0] = 1.0
+ *         return FOLD_OK
+ *     if isnan(iv):            # nan ** w == nan (w != 0)             # <<<<<<<<<<<<<<
+ *         out[0] = iv
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = isnan(__pyx_v_iv);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":170
+ *         return FOLD_OK
+ *     if isnan(iv):            # nan ** w == nan (w != 0)
+ *         out[0] = iv             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if isnan(iw):            # v ** nan == nan, except 1 ** nan == 1
+*/
+    (__pyx_v_out[0]) = __pyx_v_iv;
+
+    /* "sonolus/backend/_opt/kernels.pyx":171
+ *     if isnan(iv):            # nan ** w == nan (w != 0)
+ *         out[0] = iv
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if isnan(iw):            # v ** nan == nan, except 1 ** nan == 1
+ *         out[0] = 1.0 if iv == 1.0 else iw
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":169
+ *         out[0] = 1.0
+ *         return FOLD_OK
+ *     if isnan(iv):            # nan ** w == nan (w != 0)             # <<<<<<<<<<<<<<
+ *         out[0] = iv
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":172
+ *         out[0] = iv
+ *         return FOLD_OK
+ *     if isnan(iw):            # v ** nan == nan, except 1 ** nan == 1             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if iv == 1.0 else iw
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = isnan(__pyx_v_iw);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":173
+ *         return FOLD_OK
+ *     if isnan(iw):            # v ** nan == nan, except 1 ** nan == 1
+ *         out[0] = 1.0 if iv == 1.0 else iw             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if isinf(iw):
+*/
+    __pyx_t_1 = (__pyx_v_iv == 1.0);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = 1.0;
+    } else {
+
+      __pyx_t_2 = __pyx_v_iw;
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":174
+ *     if isnan(iw):            # v ** nan == nan, except 1 ** nan == 1
+ *         out[0] = 1.0 if iv == 1.0 else iw
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if isinf(iw):
+ *         aiv = fabs(iv)
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":172
+ *         out[0] = iv
+ *         return FOLD_OK
+ *     if isnan(iw):            # v ** nan == nan, except 1 ** nan == 1             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if iv == 1.0 else iw
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":175
+ *         out[0] = 1.0 if iv == 1.0 else iw
+ *         return FOLD_OK
+ *     if isinf(iw):             # <<<<<<<<<<<<<<
+ *         aiv = fabs(iv)
+ *         if aiv == 1.0:
+*/
+  __pyx_t_1 = (isinf(__pyx_v_iw) != 0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":176
+ *         return FOLD_OK
+ *     if isinf(iw):
+ *         aiv = fabs(iv)             # <<<<<<<<<<<<<<
+ *         if aiv == 1.0:
+ *             out[0] = 1.0
+*/
+    __pyx_v_aiv = fabs(__pyx_v_iv);
+
+    /* "sonolus/backend/_opt/kernels.pyx":177
+ *     if isinf(iw):
+ *         aiv = fabs(iv)
+ *         if aiv == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = 1.0
+ *         elif (iw > 0.0) == (aiv > 1.0):
+*/
+    __pyx_t_1 = (__pyx_v_aiv == 1.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":178
+ *         aiv = fabs(iv)
+ *         if aiv == 1.0:
+ *             out[0] = 1.0             # <<<<<<<<<<<<<<
+ *         elif (iw > 0.0) == (aiv > 1.0):
+ *             out[0] = fabs(iw)   # +inf
+*/
+      (__pyx_v_out[0]) = 1.0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":177
+ *     if isinf(iw):
+ *         aiv = fabs(iv)
+ *         if aiv == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = 1.0
+ *         elif (iw > 0.0) == (aiv > 1.0):
+*/
+      goto __pyx_L7;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":179
+ *         if aiv == 1.0:
+ *             out[0] = 1.0
+ *         elif (iw > 0.0) == (aiv > 1.0):             # <<<<<<<<<<<<<<
+ *             out[0] = fabs(iw)   # +inf
+ *         else:
+*/
+    __pyx_t_1 = ((__pyx_v_iw > 0.0) == (__pyx_v_aiv > 1.0));
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":180
+ *             out[0] = 1.0
+ *         elif (iw > 0.0) == (aiv > 1.0):
+ *             out[0] = fabs(iw)   # +inf             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = 0.0
+*/
+      (__pyx_v_out[0]) = fabs(__pyx_v_iw);
+
+      /* "sonolus/backend/_opt/kernels.pyx":179
+ *         if aiv == 1.0:
+ *             out[0] = 1.0
+ *         elif (iw > 0.0) == (aiv > 1.0):             # <<<<<<<<<<<<<<
+ *             out[0] = fabs(iw)   # +inf
+ *         else:
+*/
+      goto __pyx_L7;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":182
+ *             out[0] = fabs(iw)   # +inf
+ *         else:
+ *             out[0] = 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if isinf(iv):
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = 0.0;
+    }
+    __pyx_L7:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":183
+ *         else:
+ *             out[0] = 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if isinf(iv):
+ *         if iw > 0.0:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":175
+ *         out[0] = 1.0 if iv == 1.0 else iw
+ *         return FOLD_OK
+ *     if isinf(iw):             # <<<<<<<<<<<<<<
+ *         aiv = fabs(iv)
+ *         if aiv == 1.0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":184
+ *             out[0] = 0.0
+ *         return FOLD_OK
+ *     if isinf(iv):             # <<<<<<<<<<<<<<
+ *         if iw > 0.0:
+ *             out[0] = iv if _is_odd_int(iw) else fabs(iv)
+*/
+  __pyx_t_1 = (isinf(__pyx_v_iv) != 0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":185
+ *         return FOLD_OK
+ *     if isinf(iv):
+ *         if iw > 0.0:             # <<<<<<<<<<<<<<
+ *             out[0] = iv if _is_odd_int(iw) else fabs(iv)
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_iw > 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":186
+ *     if isinf(iv):
+ *         if iw > 0.0:
+ *             out[0] = iv if _is_odd_int(iw) else fabs(iv)             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = copysign(0.0, iv) if _is_odd_int(iw) else 0.0
+*/
+      __pyx_t_1 = __pyx_f_7sonolus_7backend_4_opt_7kernels__is_odd_int(__pyx_v_iw);
+
+      if (__pyx_t_1) {
+
+        __pyx_t_2 = __pyx_v_iv;
+      } else {
+
+        __pyx_t_2 = fabs(__pyx_v_iv);
+      }
+
+      (__pyx_v_out[0]) = __pyx_t_2;
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":185
+ *         return FOLD_OK
+ *     if isinf(iv):
+ *         if iw > 0.0:             # <<<<<<<<<<<<<<
+ *             out[0] = iv if _is_odd_int(iw) else fabs(iv)
+ *         else:
+*/
+      goto __pyx_L9;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":188
+ *             out[0] = iv if _is_odd_int(iw) else fabs(iv)
+ *         else:
+ *             out[0] = copysign(0.0, iv) if _is_odd_int(iw) else 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if iv == 0.0:
+*/
+    /*else*/ {
+      __pyx_t_1 = __pyx_f_7sonolus_7backend_4_opt_7kernels__is_odd_int(__pyx_v_iw);
+
+      if (__pyx_t_1) {
+
+        __pyx_t_2 = copysign(0.0, __pyx_v_iv);
+      } else {
+
+        __pyx_t_2 = 0.0;
+      }
+
+      (__pyx_v_out[0]) = __pyx_t_2;
+
+    }
+    __pyx_L9:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":189
+ *         else:
+ *             out[0] = copysign(0.0, iv) if _is_odd_int(iw) else 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if iv == 0.0:
+ *         if iw < 0.0:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":184
+ *             out[0] = 0.0
+ *         return FOLD_OK
+ *     if isinf(iv):             # <<<<<<<<<<<<<<
+ *         if iw > 0.0:
+ *             out[0] = iv if _is_odd_int(iw) else fabs(iv)
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":190
+ *             out[0] = copysign(0.0, iv) if _is_odd_int(iw) else 0.0
+ *         return FOLD_OK
+ *     if iv == 0.0:             # <<<<<<<<<<<<<<
+ *         if iw < 0.0:
+ *             return FOLD_NOT_CONSTANT   # 0 ** negative -> ZeroDivisionError
+*/
+  __pyx_t_1 = (__pyx_v_iv == 0.0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":191
+ *         return FOLD_OK
+ *     if iv == 0.0:
+ *         if iw < 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT   # 0 ** negative -> ZeroDivisionError
+ *         out[0] = iv if _is_odd_int(iw) else 0.0
+*/
+    __pyx_t_1 = (__pyx_v_iw < 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":192
+ *     if iv == 0.0:
+ *         if iw < 0.0:
+ *             return FOLD_NOT_CONSTANT   # 0 ** negative -> ZeroDivisionError             # <<<<<<<<<<<<<<
+ *         out[0] = iv if _is_odd_int(iw) else 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":191
+ *         return FOLD_OK
+ *     if iv == 0.0:
+ *         if iw < 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT   # 0 ** negative -> ZeroDivisionError
+ *         out[0] = iv if _is_odd_int(iw) else 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":193
+ *         if iw < 0.0:
+ *             return FOLD_NOT_CONSTANT   # 0 ** negative -> ZeroDivisionError
+ *         out[0] = iv if _is_odd_int(iw) else 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     negate = False
+*/
+    __pyx_t_1 = __pyx_f_7sonolus_7backend_4_opt_7kernels__is_odd_int(__pyx_v_iw);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = __pyx_v_iv;
+    } else {
+
+      __pyx_t_2 = 0.0;
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":194
+ *             return FOLD_NOT_CONSTANT   # 0 ** negative -> ZeroDivisionError
+ *         out[0] = iv if _is_odd_int(iw) else 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     negate = False
+ *     if iv < 0.0:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":190
+ *             out[0] = copysign(0.0, iv) if _is_odd_int(iw) else 0.0
+ *         return FOLD_OK
+ *     if iv == 0.0:             # <<<<<<<<<<<<<<
+ *         if iw < 0.0:
+ *             return FOLD_NOT_CONSTANT   # 0 ** negative -> ZeroDivisionError
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":195
+ *         out[0] = iv if _is_odd_int(iw) else 0.0
+ *         return FOLD_OK
+ *     negate = False             # <<<<<<<<<<<<<<
+ *     if iv < 0.0:
+ *         if iw != floor(iw):
+*/
+  __pyx_v_negate = 0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":196
+ *         return FOLD_OK
+ *     negate = False
+ *     if iv < 0.0:             # <<<<<<<<<<<<<<
+ *         if iw != floor(iw):
+ *             return FOLD_NOT_CONSTANT   # negative ** fractional -> complex
+*/
+  __pyx_t_1 = (__pyx_v_iv < 0.0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":197
+ *     negate = False
+ *     if iv < 0.0:
+ *         if iw != floor(iw):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT   # negative ** fractional -> complex
+ *         iv = -iv
+*/
+    __pyx_t_1 = (__pyx_v_iw != floor(__pyx_v_iw));
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":198
+ *     if iv < 0.0:
+ *         if iw != floor(iw):
+ *             return FOLD_NOT_CONSTANT   # negative ** fractional -> complex             # <<<<<<<<<<<<<<
+ *         iv = -iv
+ *         negate = _is_odd_int(iw)
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":197
+ *     negate = False
+ *     if iv < 0.0:
+ *         if iw != floor(iw):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT   # negative ** fractional -> complex
+ *         iv = -iv
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":199
+ *         if iw != floor(iw):
+ *             return FOLD_NOT_CONSTANT   # negative ** fractional -> complex
+ *         iv = -iv             # <<<<<<<<<<<<<<
+ *         negate = _is_odd_int(iw)
+ *     ix = c_pow(iv, iw)
+*/
+    __pyx_v_iv = (-__pyx_v_iv);
+
+    /* "sonolus/backend/_opt/kernels.pyx":200
+ *             return FOLD_NOT_CONSTANT   # negative ** fractional -> complex
+ *         iv = -iv
+ *         negate = _is_odd_int(iw)             # <<<<<<<<<<<<<<
+ *     ix = c_pow(iv, iw)
+ *     if isinf(ix):
+*/
+    __pyx_v_negate = __pyx_f_7sonolus_7backend_4_opt_7kernels__is_odd_int(__pyx_v_iw);
+
+    /* "sonolus/backend/_opt/kernels.pyx":196
+ *         return FOLD_OK
+ *     negate = False
+ *     if iv < 0.0:             # <<<<<<<<<<<<<<
+ *         if iw != floor(iw):
+ *             return FOLD_NOT_CONSTANT   # negative ** fractional -> complex
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":201
+ *         iv = -iv
+ *         negate = _is_odd_int(iw)
+ *     ix = c_pow(iv, iw)             # <<<<<<<<<<<<<<
+ *     if isinf(ix):
+ *         return FOLD_NOT_CONSTANT       # finite ** finite -> inf == overflow
+*/
+  __pyx_v_ix = pow(__pyx_v_iv, __pyx_v_iw);
+
+  /* "sonolus/backend/_opt/kernels.pyx":202
+ *         negate = _is_odd_int(iw)
+ *     ix = c_pow(iv, iw)
+ *     if isinf(ix):             # <<<<<<<<<<<<<<
+ *         return FOLD_NOT_CONSTANT       # finite ** finite -> inf == overflow
+ *     out[0] = -ix if negate else ix
+*/
+  __pyx_t_1 = (isinf(__pyx_v_ix) != 0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":203
+ *     ix = c_pow(iv, iw)
+ *     if isinf(ix):
+ *         return FOLD_NOT_CONSTANT       # finite ** finite -> inf == overflow             # <<<<<<<<<<<<<<
+ *     out[0] = -ix if negate else ix
+ *     return FOLD_OK
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":202
+ *         negate = _is_odd_int(iw)
+ *     ix = c_pow(iv, iw)
+ *     if isinf(ix):             # <<<<<<<<<<<<<<
+ *         return FOLD_NOT_CONSTANT       # finite ** finite -> inf == overflow
+ *     out[0] = -ix if negate else ix
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":204
+ *     if isinf(ix):
+ *         return FOLD_NOT_CONSTANT       # finite ** finite -> inf == overflow
+ *     out[0] = -ix if negate else ix             # <<<<<<<<<<<<<<
+ *     return FOLD_OK
+ * 
+*/
+  if (__pyx_v_negate) {
+
+    __pyx_t_2 = (-__pyx_v_ix);
+  } else {
+
+    __pyx_t_2 = __pyx_v_ix;
+  }
+  (__pyx_v_out[0]) = __pyx_t_2;
+
+
+  /* "sonolus/backend/_opt/kernels.pyx":205
+ *         return FOLD_NOT_CONSTANT       # finite ** finite -> inf == overflow
+ *     out[0] = -ix if negate else ix
+ *     return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":156
+ * 
+ * 
+ * cdef int _float_pow(double iv, double iw, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """CPython ``float.__pow__`` (``operator.pow``) semantics for ``Op.Power``.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":208
+ * 
+ * 
+ * cdef inline double _fpow(double iv, double iw) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """``float.__pow__`` restricted to the cases the ``Ease*`` bodies produce.
+ * 
+*/
+
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(double __pyx_v_iv, double __pyx_v_iw) {
+  double __pyx_v_ix;
+  int __pyx_v_negate;
+  double __pyx_r;
+  int __pyx_t_1;
+  double __pyx_t_2;
+
+
+  /* "sonolus/backend/_opt/kernels.pyx":218
+ *     cdef double ix
+ *     cdef bint negate
+ *     if iw == 0.0:             # <<<<<<<<<<<<<<
+ *         return 1.0
+ *     if iv == 0.0:
+*/
+  __pyx_t_1 = (__pyx_v_iw == 0.0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":219
+ *     cdef bint negate
+ *     if iw == 0.0:
+ *         return 1.0             # <<<<<<<<<<<<<<
+ *     if iv == 0.0:
+ *         return iv if _is_odd_int(iw) else 0.0
+*/
+    {
+
+      __pyx_r = 1.0;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":218
+ *     cdef double ix
+ *     cdef bint negate
+ *     if iw == 0.0:             # <<<<<<<<<<<<<<
+ *         return 1.0
+ *     if iv == 0.0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":220
+ *     if iw == 0.0:
+ *         return 1.0
+ *     if iv == 0.0:             # <<<<<<<<<<<<<<
+ *         return iv if _is_odd_int(iw) else 0.0
+ *     negate = False
+*/
+  __pyx_t_1 = (__pyx_v_iv == 0.0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":221
+ *         return 1.0
+ *     if iv == 0.0:
+ *         return iv if _is_odd_int(iw) else 0.0             # <<<<<<<<<<<<<<
+ *     negate = False
+ *     if iv < 0.0:
+*/
+    __pyx_t_1 = __pyx_f_7sonolus_7backend_4_opt_7kernels__is_odd_int(__pyx_v_iw);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = __pyx_v_iv;
+    } else {
+
+      __pyx_t_2 = 0.0;
+    }
+
+    {
+      __pyx_r = __pyx_t_2;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":220
+ *     if iw == 0.0:
+ *         return 1.0
+ *     if iv == 0.0:             # <<<<<<<<<<<<<<
+ *         return iv if _is_odd_int(iw) else 0.0
+ *     negate = False
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":222
+ *     if iv == 0.0:
+ *         return iv if _is_odd_int(iw) else 0.0
+ *     negate = False             # <<<<<<<<<<<<<<
+ *     if iv < 0.0:
+ *         iv = -iv
+*/
+  __pyx_v_negate = 0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":223
+ *         return iv if _is_odd_int(iw) else 0.0
+ *     negate = False
+ *     if iv < 0.0:             # <<<<<<<<<<<<<<
+ *         iv = -iv
+ *         negate = _is_odd_int(iw)
+*/
+  __pyx_t_1 = (__pyx_v_iv < 0.0);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":224
+ *     negate = False
+ *     if iv < 0.0:
+ *         iv = -iv             # <<<<<<<<<<<<<<
+ *         negate = _is_odd_int(iw)
+ *     ix = c_pow(iv, iw)
+*/
+    __pyx_v_iv = (-__pyx_v_iv);
+
+    /* "sonolus/backend/_opt/kernels.pyx":225
+ *     if iv < 0.0:
+ *         iv = -iv
+ *         negate = _is_odd_int(iw)             # <<<<<<<<<<<<<<
+ *     ix = c_pow(iv, iw)
+ *     return -ix if negate else ix
+*/
+    __pyx_v_negate = __pyx_f_7sonolus_7backend_4_opt_7kernels__is_odd_int(__pyx_v_iw);
+
+    /* "sonolus/backend/_opt/kernels.pyx":223
+ *         return iv if _is_odd_int(iw) else 0.0
+ *     negate = False
+ *     if iv < 0.0:             # <<<<<<<<<<<<<<
+ *         iv = -iv
+ *         negate = _is_odd_int(iw)
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":226
+ *         iv = -iv
+ *         negate = _is_odd_int(iw)
+ *     ix = c_pow(iv, iw)             # <<<<<<<<<<<<<<
+ *     return -ix if negate else ix
+ * 
+*/
+  __pyx_v_ix = pow(__pyx_v_iv, __pyx_v_iw);
+
+  /* "sonolus/backend/_opt/kernels.pyx":227
+ *         negate = _is_odd_int(iw)
+ *     ix = c_pow(iv, iw)
+ *     return -ix if negate else ix             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  if (__pyx_v_negate) {
+
+    __pyx_t_2 = (-__pyx_v_ix);
+  } else {
+
+    __pyx_t_2 = __pyx_v_ix;
+  }
+  {
+    __pyx_r = __pyx_t_2;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":208
+ * 
+ * 
+ * cdef inline double _fpow(double iv, double iw) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """``float.__pow__`` restricted to the cases the ``Ease*`` bodies produce.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":230
+ * 
+ * 
+ * cdef inline double _judge(             # <<<<<<<<<<<<<<
+ *     double diff,
+ *     double perfect_min,
+*/
+
+static CYTHON_INLINE double __pyx_f_7sonolus_7backend_4_opt_7kernels__judge(double __pyx_v_diff, double __pyx_v_perfect_min, double __pyx_v_perfect_max, double __pyx_v_great_min, double __pyx_v_great_max, double __pyx_v_good_min, double __pyx_v_good_max) {
+  double __pyx_r;
+  int __pyx_t_1;
+
+  /* "sonolus/backend/_opt/kernels.pyx":240
+ * ) noexcept nogil:
+ *     # bucket._judge: first inclusive window wins; else 0 (miss).
+ *     if perfect_min <= diff <= perfect_max:             # <<<<<<<<<<<<<<
+ *         return 1.0
+ *     if great_min <= diff <= great_max:
+*/
+  __pyx_t_1 = (__pyx_v_perfect_min <= __pyx_v_diff);
+  if (__pyx_t_1) {
+    __pyx_t_1 = (__pyx_v_diff <= __pyx_v_perfect_max);
+  }
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":241
+ *     # bucket._judge: first inclusive window wins; else 0 (miss).
+ *     if perfect_min <= diff <= perfect_max:
+ *         return 1.0             # <<<<<<<<<<<<<<
+ *     if great_min <= diff <= great_max:
+ *         return 2.0
+*/
+    {
+
+      __pyx_r = 1.0;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":240
+ * ) noexcept nogil:
+ *     # bucket._judge: first inclusive window wins; else 0 (miss).
+ *     if perfect_min <= diff <= perfect_max:             # <<<<<<<<<<<<<<
+ *         return 1.0
+ *     if great_min <= diff <= great_max:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":242
+ *     if perfect_min <= diff <= perfect_max:
+ *         return 1.0
+ *     if great_min <= diff <= great_max:             # <<<<<<<<<<<<<<
+ *         return 2.0
+ *     if good_min <= diff <= good_max:
+*/
+  __pyx_t_1 = (__pyx_v_great_min <= __pyx_v_diff);
+  if (__pyx_t_1) {
+    __pyx_t_1 = (__pyx_v_diff <= __pyx_v_great_max);
+  }
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":243
+ *         return 1.0
+ *     if great_min <= diff <= great_max:
+ *         return 2.0             # <<<<<<<<<<<<<<
+ *     if good_min <= diff <= good_max:
+ *         return 3.0
+*/
+    {
+
+      __pyx_r = 2.0;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":242
+ *     if perfect_min <= diff <= perfect_max:
+ *         return 1.0
+ *     if great_min <= diff <= great_max:             # <<<<<<<<<<<<<<
+ *         return 2.0
+ *     if good_min <= diff <= good_max:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":244
+ *     if great_min <= diff <= great_max:
+ *         return 2.0
+ *     if good_min <= diff <= good_max:             # <<<<<<<<<<<<<<
+ *         return 3.0
+ *     return 0.0
+*/
+  __pyx_t_1 = (__pyx_v_good_min <= __pyx_v_diff);
+  if (__pyx_t_1) {
+    __pyx_t_1 = (__pyx_v_diff <= __pyx_v_good_max);
+  }
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":245
+ *         return 2.0
+ *     if good_min <= diff <= good_max:
+ *         return 3.0             # <<<<<<<<<<<<<<
+ *     return 0.0
+ * 
+*/
+    {
+
+      __pyx_r = 3.0;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":244
+ *     if great_min <= diff <= great_max:
+ *         return 2.0
+ *     if good_min <= diff <= good_max:             # <<<<<<<<<<<<<<
+ *         return 3.0
+ *     return 0.0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":246
+ *     if good_min <= diff <= good_max:
+ *         return 3.0
+ *     return 0.0             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = 0.0;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":230
+ * 
+ * 
+ * cdef inline double _judge(             # <<<<<<<<<<<<<<
+ *     double diff,
+ *     double perfect_min,
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":254
+ * # ==========================================================================
+ * 
+ * cdef int _fold_ease(uint16_t op, double x, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double c1, c2, c3, c4, c5, arg
+ *     x = _clamp01(x)
+*/
+
+static int __pyx_f_7sonolus_7backend_4_opt_7kernels__fold_ease(uint16_t __pyx_v_op, double __pyx_v_x, double *__pyx_v_out) {
+  double __pyx_v_c1;
+  double __pyx_v_c2;
+  double __pyx_v_c3;
+  double __pyx_v_c4;
+  double __pyx_v_c5;
+  double __pyx_v_arg;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  double __pyx_t_3;
+
+
+  /* "sonolus/backend/_opt/kernels.pyx":256
+ * cdef int _fold_ease(uint16_t op, double x, double* out) noexcept nogil:
+ *     cdef double c1, c2, c3, c4, c5, arg
+ *     x = _clamp01(x)             # <<<<<<<<<<<<<<
+ * 
+ *     # ---- Back ----
+*/
+  __pyx_v_x = __pyx_f_7sonolus_7backend_4_opt_7kernels__clamp01(__pyx_v_x);
+
+  /* "sonolus/backend/_opt/kernels.pyx":259
+ * 
+ *     # ---- Back ----
+ *     if op == OP_EaseInBack:             # <<<<<<<<<<<<<<
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInBack);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":260
+ *     # ---- Back ----
+ *     if op == OP_EaseInBack:
+ *         c1 = 1.70158             # <<<<<<<<<<<<<<
+ *         c3 = c1 + 1.0
+ *         out[0] = c3 * _fpow(x, 3.0) - c1 * _fpow(x, 2.0)
+*/
+    __pyx_v_c1 = 1.70158;
+
+    /* "sonolus/backend/_opt/kernels.pyx":261
+ *     if op == OP_EaseInBack:
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0             # <<<<<<<<<<<<<<
+ *         out[0] = c3 * _fpow(x, 3.0) - c1 * _fpow(x, 2.0)
+ *         return FOLD_OK
+*/
+    __pyx_v_c3 = (__pyx_v_c1 + 1.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":262
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0
+ *         out[0] = c3 * _fpow(x, 3.0) - c1 * _fpow(x, 2.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutBack:
+*/
+    (__pyx_v_out[0]) = ((__pyx_v_c3 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 3.0)) - (__pyx_v_c1 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 2.0)));
+
+    /* "sonolus/backend/_opt/kernels.pyx":263
+ *         c3 = c1 + 1.0
+ *         out[0] = c3 * _fpow(x, 3.0) - c1 * _fpow(x, 2.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutBack:
+ *         c1 = 1.70158
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":259
+ * 
+ *     # ---- Back ----
+ *     if op == OP_EaseInBack:             # <<<<<<<<<<<<<<
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":264
+ *         out[0] = c3 * _fpow(x, 3.0) - c1 * _fpow(x, 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutBack:             # <<<<<<<<<<<<<<
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutBack);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":265
+ *         return FOLD_OK
+ *     if op == OP_EaseOutBack:
+ *         c1 = 1.70158             # <<<<<<<<<<<<<<
+ *         c3 = c1 + 1.0
+ *         out[0] = 1.0 + c3 * _fpow(x - 1.0, 3.0) + c1 * _fpow(x - 1.0, 2.0)
+*/
+    __pyx_v_c1 = 1.70158;
+
+    /* "sonolus/backend/_opt/kernels.pyx":266
+ *     if op == OP_EaseOutBack:
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 + c3 * _fpow(x - 1.0, 3.0) + c1 * _fpow(x - 1.0, 2.0)
+ *         return FOLD_OK
+*/
+    __pyx_v_c3 = (__pyx_v_c1 + 1.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":267
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0
+ *         out[0] = 1.0 + c3 * _fpow(x - 1.0, 3.0) + c1 * _fpow(x - 1.0, 2.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutBack:
+*/
+    (__pyx_v_out[0]) = ((1.0 + (__pyx_v_c3 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((__pyx_v_x - 1.0), 3.0))) + (__pyx_v_c1 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((__pyx_v_x - 1.0), 2.0)));
+
+    /* "sonolus/backend/_opt/kernels.pyx":268
+ *         c3 = c1 + 1.0
+ *         out[0] = 1.0 + c3 * _fpow(x - 1.0, 3.0) + c1 * _fpow(x - 1.0, 2.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseInOutBack:
+ *         c1 = 1.70158
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":264
+ *         out[0] = c3 * _fpow(x, 3.0) - c1 * _fpow(x, 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutBack:             # <<<<<<<<<<<<<<
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":269
+ *         out[0] = 1.0 + c3 * _fpow(x - 1.0, 3.0) + c1 * _fpow(x - 1.0, 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutBack:             # <<<<<<<<<<<<<<
+ *         c1 = 1.70158
+ *         c2 = c1 * 1.525
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutBack);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":270
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutBack:
+ *         c1 = 1.70158             # <<<<<<<<<<<<<<
+ *         c2 = c1 * 1.525
+ *         if x < 0.5:
+*/
+    __pyx_v_c1 = 1.70158;
+
+    /* "sonolus/backend/_opt/kernels.pyx":271
+ *     if op == OP_EaseInOutBack:
+ *         c1 = 1.70158
+ *         c2 = c1 * 1.525             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = (_fpow(2.0 * x, 2.0) * ((c2 + 1.0) * 2.0 * x - c2)) / 2.0
+*/
+    __pyx_v_c2 = (__pyx_v_c1 * 1.525);
+
+    /* "sonolus/backend/_opt/kernels.pyx":272
+ *         c1 = 1.70158
+ *         c2 = c1 * 1.525
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (_fpow(2.0 * x, 2.0) * ((c2 + 1.0) * 2.0 * x - c2)) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":273
+ *         c2 = c1 * 1.525
+ *         if x < 0.5:
+ *             out[0] = (_fpow(2.0 * x, 2.0) * ((c2 + 1.0) * 2.0 * x - c2)) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 2.0, 2.0) * ((c2 + 1.0) * (2.0 * x - 2.0) + c2) + 2.0) / 2.0
+*/
+      (__pyx_v_out[0]) = ((__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((2.0 * __pyx_v_x), 2.0) * ((((__pyx_v_c2 + 1.0) * 2.0) * __pyx_v_x) - __pyx_v_c2)) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":272
+ *         c1 = 1.70158
+ *         c2 = c1 * 1.525
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (_fpow(2.0 * x, 2.0) * ((c2 + 1.0) * 2.0 * x - c2)) / 2.0
+ *         else:
+*/
+      goto __pyx_L6;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":275
+ *             out[0] = (_fpow(2.0 * x, 2.0) * ((c2 + 1.0) * 2.0 * x - c2)) / 2.0
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 2.0, 2.0) * ((c2 + 1.0) * (2.0 * x - 2.0) + c2) + 2.0) / 2.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInBack:
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = (((__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 2.0), 2.0) * (((__pyx_v_c2 + 1.0) * ((2.0 * __pyx_v_x) - 2.0)) + __pyx_v_c2)) + 2.0) / 2.0);
+    }
+    __pyx_L6:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":276
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 2.0, 2.0) * ((c2 + 1.0) * (2.0 * x - 2.0) + c2) + 2.0) / 2.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutInBack:
+ *         c1 = 1.70158
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":269
+ *         out[0] = 1.0 + c3 * _fpow(x - 1.0, 3.0) + c1 * _fpow(x - 1.0, 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutBack:             # <<<<<<<<<<<<<<
+ *         c1 = 1.70158
+ *         c2 = c1 * 1.525
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":277
+ *             out[0] = (_fpow(2.0 * x - 2.0, 2.0) * ((c2 + 1.0) * (2.0 * x - 2.0) + c2) + 2.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInBack:             # <<<<<<<<<<<<<<
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInBack);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":278
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInBack:
+ *         c1 = 1.70158             # <<<<<<<<<<<<<<
+ *         c3 = c1 + 1.0
+ *         if x < 0.5:
+*/
+    __pyx_v_c1 = 1.70158;
+
+    /* "sonolus/backend/_opt/kernels.pyx":279
+ *     if op == OP_EaseOutInBack:
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = (1.0 + c3 * _fpow(2.0 * x - 1.0, 3.0) + c1 * _fpow(2.0 * x - 1.0, 2.0)) / 2.0
+*/
+    __pyx_v_c3 = (__pyx_v_c1 + 1.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":280
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 + c3 * _fpow(2.0 * x - 1.0, 3.0) + c1 * _fpow(2.0 * x - 1.0, 2.0)) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":281
+ *         c3 = c1 + 1.0
+ *         if x < 0.5:
+ *             out[0] = (1.0 + c3 * _fpow(2.0 * x - 1.0, 3.0) + c1 * _fpow(2.0 * x - 1.0, 2.0)) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (c3 * _fpow(2.0 * x - 1.0, 3.0) - c1 * _fpow(2.0 * x - 1.0, 2.0)) / 2.0 + 0.5
+*/
+      (__pyx_v_out[0]) = (((1.0 + (__pyx_v_c3 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 1.0), 3.0))) + (__pyx_v_c1 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 1.0), 2.0))) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":280
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 + c3 * _fpow(2.0 * x - 1.0, 3.0) + c1 * _fpow(2.0 * x - 1.0, 2.0)) / 2.0
+ *         else:
+*/
+      goto __pyx_L8;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":283
+ *             out[0] = (1.0 + c3 * _fpow(2.0 * x - 1.0, 3.0) + c1 * _fpow(2.0 * x - 1.0, 2.0)) / 2.0
+ *         else:
+ *             out[0] = (c3 * _fpow(2.0 * x - 1.0, 3.0) - c1 * _fpow(2.0 * x - 1.0, 2.0)) / 2.0 + 0.5             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = ((((__pyx_v_c3 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 1.0), 3.0)) - (__pyx_v_c1 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 1.0), 2.0))) / 2.0) + 0.5);
+    }
+    __pyx_L8:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":284
+ *         else:
+ *             out[0] = (c3 * _fpow(2.0 * x - 1.0, 3.0) - c1 * _fpow(2.0 * x - 1.0, 2.0)) / 2.0 + 0.5
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ---- Circ (sqrt of a value proven >= 0; guard mirrors math.sqrt raising) ----
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":277
+ *             out[0] = (_fpow(2.0 * x - 2.0, 2.0) * ((c2 + 1.0) * (2.0 * x - 2.0) + c2) + 2.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInBack:             # <<<<<<<<<<<<<<
+ *         c1 = 1.70158
+ *         c3 = c1 + 1.0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":287
+ * 
+ *     # ---- Circ (sqrt of a value proven >= 0; guard mirrors math.sqrt raising) ----
+ *     if op == OP_EaseInCirc:             # <<<<<<<<<<<<<<
+ *         arg = 1.0 - _fpow(x, 2.0)
+ *         if arg < 0.0:
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInCirc);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":288
+ *     # ---- Circ (sqrt of a value proven >= 0; guard mirrors math.sqrt raising) ----
+ *     if op == OP_EaseInCirc:
+ *         arg = 1.0 - _fpow(x, 2.0)             # <<<<<<<<<<<<<<
+ *         if arg < 0.0:
+ *             return FOLD_NOT_CONSTANT
+*/
+    __pyx_v_arg = (1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 2.0));
+
+    /* "sonolus/backend/_opt/kernels.pyx":289
+ *     if op == OP_EaseInCirc:
+ *         arg = 1.0 - _fpow(x, 2.0)
+ *         if arg < 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 - sqrt(arg)
+*/
+    __pyx_t_1 = (__pyx_v_arg < 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":290
+ *         arg = 1.0 - _fpow(x, 2.0)
+ *         if arg < 0.0:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - sqrt(arg)
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":289
+ *     if op == OP_EaseInCirc:
+ *         arg = 1.0 - _fpow(x, 2.0)
+ *         if arg < 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 - sqrt(arg)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":291
+ *         if arg < 0.0:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 - sqrt(arg)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutCirc:
+*/
+    (__pyx_v_out[0]) = (1.0 - sqrt(__pyx_v_arg));
+
+    /* "sonolus/backend/_opt/kernels.pyx":292
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 - sqrt(arg)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutCirc:
+ *         arg = 1.0 - _fpow(x - 1.0, 2.0)
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":287
+ * 
+ *     # ---- Circ (sqrt of a value proven >= 0; guard mirrors math.sqrt raising) ----
+ *     if op == OP_EaseInCirc:             # <<<<<<<<<<<<<<
+ *         arg = 1.0 - _fpow(x, 2.0)
+ *         if arg < 0.0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":293
+ *         out[0] = 1.0 - sqrt(arg)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutCirc:             # <<<<<<<<<<<<<<
+ *         arg = 1.0 - _fpow(x - 1.0, 2.0)
+ *         if arg < 0.0:
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutCirc);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":294
+ *         return FOLD_OK
+ *     if op == OP_EaseOutCirc:
+ *         arg = 1.0 - _fpow(x - 1.0, 2.0)             # <<<<<<<<<<<<<<
+ *         if arg < 0.0:
+ *             return FOLD_NOT_CONSTANT
+*/
+    __pyx_v_arg = (1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((__pyx_v_x - 1.0), 2.0));
+
+    /* "sonolus/backend/_opt/kernels.pyx":295
+ *     if op == OP_EaseOutCirc:
+ *         arg = 1.0 - _fpow(x - 1.0, 2.0)
+ *         if arg < 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = sqrt(arg)
+*/
+    __pyx_t_1 = (__pyx_v_arg < 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":296
+ *         arg = 1.0 - _fpow(x - 1.0, 2.0)
+ *         if arg < 0.0:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = sqrt(arg)
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":295
+ *     if op == OP_EaseOutCirc:
+ *         arg = 1.0 - _fpow(x - 1.0, 2.0)
+ *         if arg < 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = sqrt(arg)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":297
+ *         if arg < 0.0:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = sqrt(arg)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutCirc:
+*/
+    (__pyx_v_out[0]) = sqrt(__pyx_v_arg);
+
+    /* "sonolus/backend/_opt/kernels.pyx":298
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = sqrt(arg)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseInOutCirc:
+ *         if x < 0.5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":293
+ *         out[0] = 1.0 - sqrt(arg)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutCirc:             # <<<<<<<<<<<<<<
+ *         arg = 1.0 - _fpow(x - 1.0, 2.0)
+ *         if arg < 0.0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":299
+ *         out[0] = sqrt(arg)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutCirc:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             arg = 1.0 - _fpow(2.0 * x, 2.0)
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutCirc);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":300
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutCirc:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             arg = 1.0 - _fpow(2.0 * x, 2.0)
+ *             if arg < 0.0:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":301
+ *     if op == OP_EaseInOutCirc:
+ *         if x < 0.5:
+ *             arg = 1.0 - _fpow(2.0 * x, 2.0)             # <<<<<<<<<<<<<<
+ *             if arg < 0.0:
+ *                 return FOLD_NOT_CONSTANT
+*/
+      __pyx_v_arg = (1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((2.0 * __pyx_v_x), 2.0));
+
+      /* "sonolus/backend/_opt/kernels.pyx":302
+ *         if x < 0.5:
+ *             arg = 1.0 - _fpow(2.0 * x, 2.0)
+ *             if arg < 0.0:             # <<<<<<<<<<<<<<
+ *                 return FOLD_NOT_CONSTANT
+ *             out[0] = (1.0 - sqrt(arg)) / 2.0
+*/
+      __pyx_t_1 = (__pyx_v_arg < 0.0);
+
+      if (__pyx_t_1) {
+
+
+        /* "sonolus/backend/_opt/kernels.pyx":303
+ *             arg = 1.0 - _fpow(2.0 * x, 2.0)
+ *             if arg < 0.0:
+ *                 return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - sqrt(arg)) / 2.0
+ *         else:
+*/
+        {
+
+          __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+        }
+        goto __pyx_L0;
+
+        /* "sonolus/backend/_opt/kernels.pyx":302
+ *         if x < 0.5:
+ *             arg = 1.0 - _fpow(2.0 * x, 2.0)
+ *             if arg < 0.0:             # <<<<<<<<<<<<<<
+ *                 return FOLD_NOT_CONSTANT
+ *             out[0] = (1.0 - sqrt(arg)) / 2.0
+*/
+      }
+
+      /* "sonolus/backend/_opt/kernels.pyx":304
+ *             if arg < 0.0:
+ *                 return FOLD_NOT_CONSTANT
+ *             out[0] = (1.0 - sqrt(arg)) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             arg = 1.0 - _fpow(2.0 * x - 2.0, 2.0)
+*/
+      (__pyx_v_out[0]) = ((1.0 - sqrt(__pyx_v_arg)) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":300
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutCirc:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             arg = 1.0 - _fpow(2.0 * x, 2.0)
+ *             if arg < 0.0:
+*/
+      goto __pyx_L14;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":306
+ *             out[0] = (1.0 - sqrt(arg)) / 2.0
+ *         else:
+ *             arg = 1.0 - _fpow(2.0 * x - 2.0, 2.0)             # <<<<<<<<<<<<<<
+ *             if arg < 0.0:
+ *                 return FOLD_NOT_CONSTANT
+*/
+    /*else*/ {
+      __pyx_v_arg = (1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 2.0), 2.0));
+
+      /* "sonolus/backend/_opt/kernels.pyx":307
+ *         else:
+ *             arg = 1.0 - _fpow(2.0 * x - 2.0, 2.0)
+ *             if arg < 0.0:             # <<<<<<<<<<<<<<
+ *                 return FOLD_NOT_CONSTANT
+ *             out[0] = (sqrt(arg) + 1.0) / 2.0
+*/
+      __pyx_t_1 = (__pyx_v_arg < 0.0);
+
+      if (__pyx_t_1) {
+
+
+        /* "sonolus/backend/_opt/kernels.pyx":308
+ *             arg = 1.0 - _fpow(2.0 * x - 2.0, 2.0)
+ *             if arg < 0.0:
+ *                 return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *             out[0] = (sqrt(arg) + 1.0) / 2.0
+ *         return FOLD_OK
+*/
+        {
+
+          __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+        }
+        goto __pyx_L0;
+
+        /* "sonolus/backend/_opt/kernels.pyx":307
+ *         else:
+ *             arg = 1.0 - _fpow(2.0 * x - 2.0, 2.0)
+ *             if arg < 0.0:             # <<<<<<<<<<<<<<
+ *                 return FOLD_NOT_CONSTANT
+ *             out[0] = (sqrt(arg) + 1.0) / 2.0
+*/
+      }
+
+      /* "sonolus/backend/_opt/kernels.pyx":309
+ *             if arg < 0.0:
+ *                 return FOLD_NOT_CONSTANT
+ *             out[0] = (sqrt(arg) + 1.0) / 2.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInCirc:
+*/
+      (__pyx_v_out[0]) = ((sqrt(__pyx_v_arg) + 1.0) / 2.0);
+    }
+    __pyx_L14:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":310
+ *                 return FOLD_NOT_CONSTANT
+ *             out[0] = (sqrt(arg) + 1.0) / 2.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutInCirc:
+ *         arg = 1.0 - _fpow(2.0 * x - 1.0, 2.0)
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":299
+ *         out[0] = sqrt(arg)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutCirc:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             arg = 1.0 - _fpow(2.0 * x, 2.0)
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":311
+ *             out[0] = (sqrt(arg) + 1.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInCirc:             # <<<<<<<<<<<<<<
+ *         arg = 1.0 - _fpow(2.0 * x - 1.0, 2.0)
+ *         if arg < 0.0:
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInCirc);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":312
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInCirc:
+ *         arg = 1.0 - _fpow(2.0 * x - 1.0, 2.0)             # <<<<<<<<<<<<<<
+ *         if arg < 0.0:
+ *             return FOLD_NOT_CONSTANT
+*/
+    __pyx_v_arg = (1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 1.0), 2.0));
+
+    /* "sonolus/backend/_opt/kernels.pyx":313
+ *     if op == OP_EaseOutInCirc:
+ *         arg = 1.0 - _fpow(2.0 * x - 1.0, 2.0)
+ *         if arg < 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if x < 0.5:
+*/
+    __pyx_t_1 = (__pyx_v_arg < 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":314
+ *         arg = 1.0 - _fpow(2.0 * x - 1.0, 2.0)
+ *         if arg < 0.0:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = sqrt(arg) / 2.0
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":313
+ *     if op == OP_EaseOutInCirc:
+ *         arg = 1.0 - _fpow(2.0 * x - 1.0, 2.0)
+ *         if arg < 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if x < 0.5:
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":315
+ *         if arg < 0.0:
+ *             return FOLD_NOT_CONSTANT
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = sqrt(arg) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":316
+ *             return FOLD_NOT_CONSTANT
+ *         if x < 0.5:
+ *             out[0] = sqrt(arg) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (1.0 - sqrt(arg)) / 2.0 + 0.5
+*/
+      (__pyx_v_out[0]) = (sqrt(__pyx_v_arg) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":315
+ *         if arg < 0.0:
+ *             return FOLD_NOT_CONSTANT
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = sqrt(arg) / 2.0
+ *         else:
+*/
+      goto __pyx_L19;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":318
+ *             out[0] = sqrt(arg) / 2.0
+ *         else:
+ *             out[0] = (1.0 - sqrt(arg)) / 2.0 + 0.5             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = (((1.0 - sqrt(__pyx_v_arg)) / 2.0) + 0.5);
+    }
+    __pyx_L19:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":319
+ *         else:
+ *             out[0] = (1.0 - sqrt(arg)) / 2.0 + 0.5
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ---- Cubic ----
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":311
+ *             out[0] = (sqrt(arg) + 1.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInCirc:             # <<<<<<<<<<<<<<
+ *         arg = 1.0 - _fpow(2.0 * x - 1.0, 2.0)
+ *         if arg < 0.0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":322
+ * 
+ *     # ---- Cubic ----
+ *     if op == OP_EaseInCubic:             # <<<<<<<<<<<<<<
+ *         out[0] = _fpow(x, 3.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInCubic);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":323
+ *     # ---- Cubic ----
+ *     if op == OP_EaseInCubic:
+ *         out[0] = _fpow(x, 3.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutCubic:
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 3.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":324
+ *     if op == OP_EaseInCubic:
+ *         out[0] = _fpow(x, 3.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutCubic:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 3.0)
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":322
+ * 
+ *     # ---- Cubic ----
+ *     if op == OP_EaseInCubic:             # <<<<<<<<<<<<<<
+ *         out[0] = _fpow(x, 3.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":325
+ *         out[0] = _fpow(x, 3.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutCubic:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - _fpow(1.0 - x, 3.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutCubic);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":326
+ *         return FOLD_OK
+ *     if op == OP_EaseOutCubic:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 3.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutCubic:
+*/
+    (__pyx_v_out[0]) = (1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((1.0 - __pyx_v_x), 3.0));
+
+    /* "sonolus/backend/_opt/kernels.pyx":327
+ *     if op == OP_EaseOutCubic:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 3.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseInOutCubic:
+ *         if x < 0.5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":325
+ *         out[0] = _fpow(x, 3.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutCubic:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - _fpow(1.0 - x, 3.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":328
+ *         out[0] = 1.0 - _fpow(1.0 - x, 3.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutCubic:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = 4.0 * _fpow(x, 3.0)
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutCubic);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":329
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutCubic:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = 4.0 * _fpow(x, 3.0)
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":330
+ *     if op == OP_EaseInOutCubic:
+ *         if x < 0.5:
+ *             out[0] = 4.0 * _fpow(x, 3.0)             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 3.0) / 2.0
+*/
+      (__pyx_v_out[0]) = (4.0 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 3.0));
+
+      /* "sonolus/backend/_opt/kernels.pyx":329
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutCubic:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = 4.0 * _fpow(x, 3.0)
+ *         else:
+*/
+      goto __pyx_L23;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":332
+ *             out[0] = 4.0 * _fpow(x, 3.0)
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 3.0) / 2.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInCubic:
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = (1.0 - (__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((-2.0 * __pyx_v_x) + 2.0), 3.0) / 2.0));
+    }
+    __pyx_L23:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":333
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 3.0) / 2.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutInCubic:
+ *         if x < 0.5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":328
+ *         out[0] = 1.0 - _fpow(1.0 - x, 3.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutCubic:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = 4.0 * _fpow(x, 3.0)
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":334
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 3.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInCubic:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 3.0)) / 2.0
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInCubic);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":335
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInCubic:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 3.0)) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":336
+ *     if op == OP_EaseOutInCubic:
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 3.0)) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 3.0)) / 2.0 + 0.5
+*/
+      (__pyx_v_out[0]) = ((1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((1.0 - (2.0 * __pyx_v_x)), 3.0)) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":335
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInCubic:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 3.0)) / 2.0
+ *         else:
+*/
+      goto __pyx_L25;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":338
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 3.0)) / 2.0
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 3.0)) / 2.0 + 0.5             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = ((__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 1.0), 3.0) / 2.0) + 0.5);
+    }
+    __pyx_L25:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":339
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 3.0)) / 2.0 + 0.5
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ---- Elastic ----
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":334
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 3.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInCubic:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 3.0)) / 2.0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":342
+ * 
+ *     # ---- Elastic ----
+ *     if op == OP_EaseInElastic:             # <<<<<<<<<<<<<<
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x == 0.0 or x == 1.0:
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInElastic);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":343
+ *     # ---- Elastic ----
+ *     if op == OP_EaseInElastic:
+ *         c4 = (2.0 * M_PI) / 3.0             # <<<<<<<<<<<<<<
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+*/
+    __pyx_v_c4 = ((2.0 * M_PI) / 3.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":344
+ *     if op == OP_EaseInElastic:
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x == 0.0 or x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         else:
+*/
+    __pyx_t_2 = (__pyx_v_x == 0.0);
+
+    if (!__pyx_t_2) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_2;
+
+      goto __pyx_L28_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_x == 1.0);
+
+
+    __pyx_t_1 = __pyx_t_2;
+
+    __pyx_L28_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":345
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = -_fpow(2.0, 10.0 * x - 10.0) * sin((x * 10.0 - 10.75) * c4)
+*/
+      (__pyx_v_out[0]) = __pyx_v_x;
+
+      /* "sonolus/backend/_opt/kernels.pyx":344
+ *     if op == OP_EaseInElastic:
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x == 0.0 or x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         else:
+*/
+      goto __pyx_L27;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":347
+ *             out[0] = x
+ *         else:
+ *             out[0] = -_fpow(2.0, 10.0 * x - 10.0) * sin((x * 10.0 - 10.75) * c4)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutElastic:
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = ((-__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, ((10.0 * __pyx_v_x) - 10.0))) * sin((((__pyx_v_x * 10.0) - 10.75) * __pyx_v_c4)));
+    }
+    __pyx_L27:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":348
+ *         else:
+ *             out[0] = -_fpow(2.0, 10.0 * x - 10.0) * sin((x * 10.0 - 10.75) * c4)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutElastic:
+ *         c4 = (2.0 * M_PI) / 3.0
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":342
+ * 
+ *     # ---- Elastic ----
+ *     if op == OP_EaseInElastic:             # <<<<<<<<<<<<<<
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x == 0.0 or x == 1.0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":349
+ *             out[0] = -_fpow(2.0, 10.0 * x - 10.0) * sin((x * 10.0 - 10.75) * c4)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutElastic:             # <<<<<<<<<<<<<<
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x == 0.0 or x == 1.0:
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutElastic);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":350
+ *         return FOLD_OK
+ *     if op == OP_EaseOutElastic:
+ *         c4 = (2.0 * M_PI) / 3.0             # <<<<<<<<<<<<<<
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+*/
+    __pyx_v_c4 = ((2.0 * M_PI) / 3.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":351
+ *     if op == OP_EaseOutElastic:
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x == 0.0 or x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         else:
+*/
+    __pyx_t_2 = (__pyx_v_x == 0.0);
+
+    if (!__pyx_t_2) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_2;
+
+      goto __pyx_L32_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_x == 1.0);
+
+
+    __pyx_t_1 = __pyx_t_2;
+
+    __pyx_L32_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":352
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = _fpow(2.0, -10.0 * x) * sin((x * 10.0 - 0.75) * c4) + 1.0
+*/
+      (__pyx_v_out[0]) = __pyx_v_x;
+
+      /* "sonolus/backend/_opt/kernels.pyx":351
+ *     if op == OP_EaseOutElastic:
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x == 0.0 or x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         else:
+*/
+      goto __pyx_L31;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":354
+ *             out[0] = x
+ *         else:
+ *             out[0] = _fpow(2.0, -10.0 * x) * sin((x * 10.0 - 0.75) * c4) + 1.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutElastic:
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = ((__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, (-10.0 * __pyx_v_x)) * sin((((__pyx_v_x * 10.0) - 0.75) * __pyx_v_c4))) + 1.0);
+    }
+    __pyx_L31:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":355
+ *         else:
+ *             out[0] = _fpow(2.0, -10.0 * x) * sin((x * 10.0 - 0.75) * c4) + 1.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseInOutElastic:
+ *         c5 = (2.0 * M_PI) / 4.5
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":349
+ *             out[0] = -_fpow(2.0, 10.0 * x - 10.0) * sin((x * 10.0 - 10.75) * c4)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutElastic:             # <<<<<<<<<<<<<<
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x == 0.0 or x == 1.0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":356
+ *             out[0] = _fpow(2.0, -10.0 * x) * sin((x * 10.0 - 0.75) * c4) + 1.0
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutElastic:             # <<<<<<<<<<<<<<
+ *         c5 = (2.0 * M_PI) / 4.5
+ *         if x == 0.0 or x == 1.0:
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutElastic);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":357
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutElastic:
+ *         c5 = (2.0 * M_PI) / 4.5             # <<<<<<<<<<<<<<
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+*/
+    __pyx_v_c5 = ((2.0 * M_PI) / 4.5);
+
+    /* "sonolus/backend/_opt/kernels.pyx":358
+ *     if op == OP_EaseInOutElastic:
+ *         c5 = (2.0 * M_PI) / 4.5
+ *         if x == 0.0 or x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         elif x < 0.5:
+*/
+    __pyx_t_2 = (__pyx_v_x == 0.0);
+
+    if (!__pyx_t_2) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_2;
+
+      goto __pyx_L36_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_x == 1.0);
+
+
+    __pyx_t_1 = __pyx_t_2;
+
+    __pyx_L36_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":359
+ *         c5 = (2.0 * M_PI) / 4.5
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x             # <<<<<<<<<<<<<<
+ *         elif x < 0.5:
+ *             out[0] = -(_fpow(2.0, 20.0 * x - 10.0) * sin((20.0 * x - 11.125) * c5)) / 2.0
+*/
+      (__pyx_v_out[0]) = __pyx_v_x;
+
+      /* "sonolus/backend/_opt/kernels.pyx":358
+ *     if op == OP_EaseInOutElastic:
+ *         c5 = (2.0 * M_PI) / 4.5
+ *         if x == 0.0 or x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         elif x < 0.5:
+*/
+      goto __pyx_L35;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":360
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+ *         elif x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = -(_fpow(2.0, 20.0 * x - 10.0) * sin((20.0 * x - 11.125) * c5)) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":361
+ *             out[0] = x
+ *         elif x < 0.5:
+ *             out[0] = -(_fpow(2.0, 20.0 * x - 10.0) * sin((20.0 * x - 11.125) * c5)) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (_fpow(2.0, -20.0 * x + 10.0) * sin((20.0 * x - 11.125) * c5)) / 2.0 + 1.0
+*/
+      (__pyx_v_out[0]) = ((-(__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, ((20.0 * __pyx_v_x) - 10.0)) * sin((((20.0 * __pyx_v_x) - 11.125) * __pyx_v_c5)))) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":360
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+ *         elif x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = -(_fpow(2.0, 20.0 * x - 10.0) * sin((20.0 * x - 11.125) * c5)) / 2.0
+ *         else:
+*/
+      goto __pyx_L35;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":363
+ *             out[0] = -(_fpow(2.0, 20.0 * x - 10.0) * sin((20.0 * x - 11.125) * c5)) / 2.0
+ *         else:
+ *             out[0] = (_fpow(2.0, -20.0 * x + 10.0) * sin((20.0 * x - 11.125) * c5)) / 2.0 + 1.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInElastic:
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = (((__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, ((-20.0 * __pyx_v_x) + 10.0)) * sin((((20.0 * __pyx_v_x) - 11.125) * __pyx_v_c5))) / 2.0) + 1.0);
+    }
+    __pyx_L35:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":364
+ *         else:
+ *             out[0] = (_fpow(2.0, -20.0 * x + 10.0) * sin((20.0 * x - 11.125) * c5)) / 2.0 + 1.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutInElastic:
+ *         c4 = (2.0 * M_PI) / 3.0
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":356
+ *             out[0] = _fpow(2.0, -10.0 * x) * sin((x * 10.0 - 0.75) * c4) + 1.0
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutElastic:             # <<<<<<<<<<<<<<
+ *         c5 = (2.0 * M_PI) / 4.5
+ *         if x == 0.0 or x == 1.0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":365
+ *             out[0] = (_fpow(2.0, -20.0 * x + 10.0) * sin((20.0 * x - 11.125) * c5)) / 2.0 + 1.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInElastic:             # <<<<<<<<<<<<<<
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x < 0.5:
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInElastic);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":366
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInElastic:
+ *         c4 = (2.0 * M_PI) / 3.0             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             if x == 0.0:
+*/
+    __pyx_v_c4 = ((2.0 * M_PI) / 3.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":367
+ *     if op == OP_EaseOutInElastic:
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             if x == 0.0:
+ *                 out[0] = 0.0
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":368
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x < 0.5:
+ *             if x == 0.0:             # <<<<<<<<<<<<<<
+ *                 out[0] = 0.0
+ *             else:
+*/
+      __pyx_t_1 = (__pyx_v_x == 0.0);
+
+      if (__pyx_t_1) {
+
+
+        /* "sonolus/backend/_opt/kernels.pyx":369
+ *         if x < 0.5:
+ *             if x == 0.0:
+ *                 out[0] = 0.0             # <<<<<<<<<<<<<<
+ *             else:
+ *                 out[0] = (_fpow(2.0, -20.0 * x) * sin((20.0 * x - 0.75) * c4)) / 2.0 + 0.5
+*/
+        (__pyx_v_out[0]) = 0.0;
+
+        /* "sonolus/backend/_opt/kernels.pyx":368
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x < 0.5:
+ *             if x == 0.0:             # <<<<<<<<<<<<<<
+ *                 out[0] = 0.0
+ *             else:
+*/
+        goto __pyx_L40;
+      }
+
+      /* "sonolus/backend/_opt/kernels.pyx":371
+ *                 out[0] = 0.0
+ *             else:
+ *                 out[0] = (_fpow(2.0, -20.0 * x) * sin((20.0 * x - 0.75) * c4)) / 2.0 + 0.5             # <<<<<<<<<<<<<<
+ *         elif x == 1.0:
+ *             out[0] = 1.0
+*/
+      /*else*/ {
+        (__pyx_v_out[0]) = (((__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, (-20.0 * __pyx_v_x)) * sin((((20.0 * __pyx_v_x) - 0.75) * __pyx_v_c4))) / 2.0) + 0.5);
+      }
+      __pyx_L40:;
+
+      /* "sonolus/backend/_opt/kernels.pyx":367
+ *     if op == OP_EaseOutInElastic:
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             if x == 0.0:
+ *                 out[0] = 0.0
+*/
+      goto __pyx_L39;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":372
+ *             else:
+ *                 out[0] = (_fpow(2.0, -20.0 * x) * sin((20.0 * x - 0.75) * c4)) / 2.0 + 0.5
+ *         elif x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = 1.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x == 1.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":373
+ *                 out[0] = (_fpow(2.0, -20.0 * x) * sin((20.0 * x - 0.75) * c4)) / 2.0 + 0.5
+ *         elif x == 1.0:
+ *             out[0] = 1.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (-_fpow(2.0, 10.0 * (2.0 * x - 1.0) - 10.0) * sin((20.0 * x - 20.75) * c4)) / 2.0 + 0.5
+*/
+      (__pyx_v_out[0]) = 1.0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":372
+ *             else:
+ *                 out[0] = (_fpow(2.0, -20.0 * x) * sin((20.0 * x - 0.75) * c4)) / 2.0 + 0.5
+ *         elif x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = 1.0
+ *         else:
+*/
+      goto __pyx_L39;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":375
+ *             out[0] = 1.0
+ *         else:
+ *             out[0] = (-_fpow(2.0, 10.0 * (2.0 * x - 1.0) - 10.0) * sin((20.0 * x - 20.75) * c4)) / 2.0 + 0.5             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = ((((-__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, ((10.0 * ((2.0 * __pyx_v_x) - 1.0)) - 10.0))) * sin((((20.0 * __pyx_v_x) - 20.75) * __pyx_v_c4))) / 2.0) + 0.5);
+    }
+    __pyx_L39:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":376
+ *         else:
+ *             out[0] = (-_fpow(2.0, 10.0 * (2.0 * x - 1.0) - 10.0) * sin((20.0 * x - 20.75) * c4)) / 2.0 + 0.5
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ---- Expo ----
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":365
+ *             out[0] = (_fpow(2.0, -20.0 * x + 10.0) * sin((20.0 * x - 11.125) * c5)) / 2.0 + 1.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInElastic:             # <<<<<<<<<<<<<<
+ *         c4 = (2.0 * M_PI) / 3.0
+ *         if x < 0.5:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":379
+ * 
+ *     # ---- Expo ----
+ *     if op == OP_EaseInExpo:             # <<<<<<<<<<<<<<
+ *         out[0] = 0.0 if x == 0.0 else _fpow(2.0, 10.0 * x - 10.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInExpo);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":380
+ *     # ---- Expo ----
+ *     if op == OP_EaseInExpo:
+ *         out[0] = 0.0 if x == 0.0 else _fpow(2.0, 10.0 * x - 10.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutExpo:
+*/
+    __pyx_t_1 = (__pyx_v_x == 0.0);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_3 = 0.0;
+    } else {
+
+      __pyx_t_3 = __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, ((10.0 * __pyx_v_x) - 10.0));
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_3;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":381
+ *     if op == OP_EaseInExpo:
+ *         out[0] = 0.0 if x == 0.0 else _fpow(2.0, 10.0 * x - 10.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutExpo:
+ *         out[0] = 1.0 if x == 1.0 else 1.0 - _fpow(2.0, -10.0 * x)
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":379
+ * 
+ *     # ---- Expo ----
+ *     if op == OP_EaseInExpo:             # <<<<<<<<<<<<<<
+ *         out[0] = 0.0 if x == 0.0 else _fpow(2.0, 10.0 * x - 10.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":382
+ *         out[0] = 0.0 if x == 0.0 else _fpow(2.0, 10.0 * x - 10.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutExpo:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if x == 1.0 else 1.0 - _fpow(2.0, -10.0 * x)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutExpo);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":383
+ *         return FOLD_OK
+ *     if op == OP_EaseOutExpo:
+ *         out[0] = 1.0 if x == 1.0 else 1.0 - _fpow(2.0, -10.0 * x)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutExpo:
+*/
+    __pyx_t_1 = (__pyx_v_x == 1.0);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_3 = 1.0;
+    } else {
+
+      __pyx_t_3 = (1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, (-10.0 * __pyx_v_x)));
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_3;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":384
+ *     if op == OP_EaseOutExpo:
+ *         out[0] = 1.0 if x == 1.0 else 1.0 - _fpow(2.0, -10.0 * x)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseInOutExpo:
+ *         if x == 0.0 or x == 1.0:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":382
+ *         out[0] = 0.0 if x == 0.0 else _fpow(2.0, 10.0 * x - 10.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutExpo:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if x == 1.0 else 1.0 - _fpow(2.0, -10.0 * x)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":385
+ *         out[0] = 1.0 if x == 1.0 else 1.0 - _fpow(2.0, -10.0 * x)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutExpo:             # <<<<<<<<<<<<<<
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutExpo);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":386
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutExpo:
+ *         if x == 0.0 or x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         elif x < 0.5:
+*/
+    __pyx_t_2 = (__pyx_v_x == 0.0);
+
+    if (!__pyx_t_2) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_2;
+
+      goto __pyx_L45_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_x == 1.0);
+
+
+    __pyx_t_1 = __pyx_t_2;
+
+    __pyx_L45_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":387
+ *     if op == OP_EaseInOutExpo:
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x             # <<<<<<<<<<<<<<
+ *         elif x < 0.5:
+ *             out[0] = _fpow(2.0, 20.0 * x - 10.0) / 2.0
+*/
+      (__pyx_v_out[0]) = __pyx_v_x;
+
+      /* "sonolus/backend/_opt/kernels.pyx":386
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutExpo:
+ *         if x == 0.0 or x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         elif x < 0.5:
+*/
+      goto __pyx_L44;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":388
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+ *         elif x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = _fpow(2.0, 20.0 * x - 10.0) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":389
+ *             out[0] = x
+ *         elif x < 0.5:
+ *             out[0] = _fpow(2.0, 20.0 * x - 10.0) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (2.0 - _fpow(2.0, -20.0 * x + 10.0)) / 2.0
+*/
+      (__pyx_v_out[0]) = (__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, ((20.0 * __pyx_v_x) - 10.0)) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":388
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+ *         elif x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = _fpow(2.0, 20.0 * x - 10.0) / 2.0
+ *         else:
+*/
+      goto __pyx_L44;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":391
+ *             out[0] = _fpow(2.0, 20.0 * x - 10.0) / 2.0
+ *         else:
+ *             out[0] = (2.0 - _fpow(2.0, -20.0 * x + 10.0)) / 2.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInExpo:
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = ((2.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, ((-20.0 * __pyx_v_x) + 10.0))) / 2.0);
+    }
+    __pyx_L44:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":392
+ *         else:
+ *             out[0] = (2.0 - _fpow(2.0, -20.0 * x + 10.0)) / 2.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutInExpo:
+ *         if x == 0.0 or x == 1.0:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":385
+ *         out[0] = 1.0 if x == 1.0 else 1.0 - _fpow(2.0, -10.0 * x)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutExpo:             # <<<<<<<<<<<<<<
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":393
+ *             out[0] = (2.0 - _fpow(2.0, -20.0 * x + 10.0)) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInExpo:             # <<<<<<<<<<<<<<
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInExpo);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":394
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInExpo:
+ *         if x == 0.0 or x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         elif x < 0.5:
+*/
+    __pyx_t_2 = (__pyx_v_x == 0.0);
+
+    if (!__pyx_t_2) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_2;
+
+      goto __pyx_L49_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_x == 1.0);
+
+
+    __pyx_t_1 = __pyx_t_2;
+
+    __pyx_L49_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":395
+ *     if op == OP_EaseOutInExpo:
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x             # <<<<<<<<<<<<<<
+ *         elif x < 0.5:
+ *             out[0] = (1.0 - _fpow(2.0, -20.0 * x)) / 2.0
+*/
+      (__pyx_v_out[0]) = __pyx_v_x;
+
+      /* "sonolus/backend/_opt/kernels.pyx":394
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInExpo:
+ *         if x == 0.0 or x == 1.0:             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         elif x < 0.5:
+*/
+      goto __pyx_L48;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":396
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+ *         elif x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - _fpow(2.0, -20.0 * x)) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":397
+ *             out[0] = x
+ *         elif x < 0.5:
+ *             out[0] = (1.0 - _fpow(2.0, -20.0 * x)) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (_fpow(2.0, 20.0 * x - 20.0)) / 2.0 + 0.5
+*/
+      (__pyx_v_out[0]) = ((1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, (-20.0 * __pyx_v_x))) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":396
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+ *         elif x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - _fpow(2.0, -20.0 * x)) / 2.0
+ *         else:
+*/
+      goto __pyx_L48;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":399
+ *             out[0] = (1.0 - _fpow(2.0, -20.0 * x)) / 2.0
+ *         else:
+ *             out[0] = (_fpow(2.0, 20.0 * x - 20.0)) / 2.0 + 0.5             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = ((__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(2.0, ((20.0 * __pyx_v_x) - 20.0)) / 2.0) + 0.5);
+    }
+    __pyx_L48:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":400
+ *         else:
+ *             out[0] = (_fpow(2.0, 20.0 * x - 20.0)) / 2.0 + 0.5
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ---- Quad ----
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":393
+ *             out[0] = (2.0 - _fpow(2.0, -20.0 * x + 10.0)) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInExpo:             # <<<<<<<<<<<<<<
+ *         if x == 0.0 or x == 1.0:
+ *             out[0] = x
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":403
+ * 
+ *     # ---- Quad ----
+ *     if op == OP_EaseInQuad:             # <<<<<<<<<<<<<<
+ *         out[0] = _fpow(x, 2.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInQuad);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":404
+ *     # ---- Quad ----
+ *     if op == OP_EaseInQuad:
+ *         out[0] = _fpow(x, 2.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuad:
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 2.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":405
+ *     if op == OP_EaseInQuad:
+ *         out[0] = _fpow(x, 2.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutQuad:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 2.0)
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":403
+ * 
+ *     # ---- Quad ----
+ *     if op == OP_EaseInQuad:             # <<<<<<<<<<<<<<
+ *         out[0] = _fpow(x, 2.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":406
+ *         out[0] = _fpow(x, 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuad:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - _fpow(1.0 - x, 2.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutQuad);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":407
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuad:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 2.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuad:
+*/
+    (__pyx_v_out[0]) = (1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((1.0 - __pyx_v_x), 2.0));
+
+    /* "sonolus/backend/_opt/kernels.pyx":408
+ *     if op == OP_EaseOutQuad:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 2.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseInOutQuad:
+ *         if x < 0.5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":406
+ *         out[0] = _fpow(x, 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuad:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - _fpow(1.0 - x, 2.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":409
+ *         out[0] = 1.0 - _fpow(1.0 - x, 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuad:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = 2.0 * _fpow(x, 2.0)
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutQuad);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":410
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuad:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = 2.0 * _fpow(x, 2.0)
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":411
+ *     if op == OP_EaseInOutQuad:
+ *         if x < 0.5:
+ *             out[0] = 2.0 * _fpow(x, 2.0)             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 2.0) / 2.0
+*/
+      (__pyx_v_out[0]) = (2.0 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 2.0));
+
+      /* "sonolus/backend/_opt/kernels.pyx":410
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuad:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = 2.0 * _fpow(x, 2.0)
+ *         else:
+*/
+      goto __pyx_L54;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":413
+ *             out[0] = 2.0 * _fpow(x, 2.0)
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 2.0) / 2.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuad:
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = (1.0 - (__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((-2.0 * __pyx_v_x) + 2.0), 2.0) / 2.0));
+    }
+    __pyx_L54:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":414
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 2.0) / 2.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutInQuad:
+ *         if x < 0.5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":409
+ *         out[0] = 1.0 - _fpow(1.0 - x, 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuad:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = 2.0 * _fpow(x, 2.0)
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":415
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 2.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuad:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 2.0)) / 2.0
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInQuad);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":416
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuad:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 2.0)) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":417
+ *     if op == OP_EaseOutInQuad:
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 2.0)) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 2.0)) / 2.0 + 0.5
+*/
+      (__pyx_v_out[0]) = ((1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((1.0 - (2.0 * __pyx_v_x)), 2.0)) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":416
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuad:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 2.0)) / 2.0
+ *         else:
+*/
+      goto __pyx_L56;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":419
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 2.0)) / 2.0
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 2.0)) / 2.0 + 0.5             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = ((__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 1.0), 2.0) / 2.0) + 0.5);
+    }
+    __pyx_L56:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":420
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 2.0)) / 2.0 + 0.5
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ---- Quart ----
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":415
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 2.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuad:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 2.0)) / 2.0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":423
+ * 
+ *     # ---- Quart ----
+ *     if op == OP_EaseInQuart:             # <<<<<<<<<<<<<<
+ *         out[0] = _fpow(x, 4.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInQuart);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":424
+ *     # ---- Quart ----
+ *     if op == OP_EaseInQuart:
+ *         out[0] = _fpow(x, 4.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuart:
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 4.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":425
+ *     if op == OP_EaseInQuart:
+ *         out[0] = _fpow(x, 4.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutQuart:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 4.0)
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":423
+ * 
+ *     # ---- Quart ----
+ *     if op == OP_EaseInQuart:             # <<<<<<<<<<<<<<
+ *         out[0] = _fpow(x, 4.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":426
+ *         out[0] = _fpow(x, 4.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuart:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - _fpow(1.0 - x, 4.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutQuart);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":427
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuart:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 4.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuart:
+*/
+    (__pyx_v_out[0]) = (1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((1.0 - __pyx_v_x), 4.0));
+
+    /* "sonolus/backend/_opt/kernels.pyx":428
+ *     if op == OP_EaseOutQuart:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 4.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseInOutQuart:
+ *         if x < 0.5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":426
+ *         out[0] = _fpow(x, 4.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuart:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - _fpow(1.0 - x, 4.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":429
+ *         out[0] = 1.0 - _fpow(1.0 - x, 4.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuart:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = 8.0 * _fpow(x, 4.0)
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutQuart);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":430
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuart:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = 8.0 * _fpow(x, 4.0)
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":431
+ *     if op == OP_EaseInOutQuart:
+ *         if x < 0.5:
+ *             out[0] = 8.0 * _fpow(x, 4.0)             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 4.0) / 2.0
+*/
+      (__pyx_v_out[0]) = (8.0 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 4.0));
+
+      /* "sonolus/backend/_opt/kernels.pyx":430
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuart:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = 8.0 * _fpow(x, 4.0)
+ *         else:
+*/
+      goto __pyx_L60;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":433
+ *             out[0] = 8.0 * _fpow(x, 4.0)
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 4.0) / 2.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuart:
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = (1.0 - (__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((-2.0 * __pyx_v_x) + 2.0), 4.0) / 2.0));
+    }
+    __pyx_L60:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":434
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 4.0) / 2.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutInQuart:
+ *         if x < 0.5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":429
+ *         out[0] = 1.0 - _fpow(1.0 - x, 4.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuart:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = 8.0 * _fpow(x, 4.0)
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":435
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 4.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuart:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 4.0)) / 2.0
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInQuart);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":436
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuart:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 4.0)) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":437
+ *     if op == OP_EaseOutInQuart:
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 4.0)) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 4.0)) / 2.0 + 0.5
+*/
+      (__pyx_v_out[0]) = ((1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((1.0 - (2.0 * __pyx_v_x)), 4.0)) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":436
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuart:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 4.0)) / 2.0
+ *         else:
+*/
+      goto __pyx_L62;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":439
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 4.0)) / 2.0
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 4.0)) / 2.0 + 0.5             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = ((__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 1.0), 4.0) / 2.0) + 0.5);
+    }
+    __pyx_L62:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":440
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 4.0)) / 2.0 + 0.5
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ---- Quint ----
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":435
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 4.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuart:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 4.0)) / 2.0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":443
+ * 
+ *     # ---- Quint ----
+ *     if op == OP_EaseInQuint:             # <<<<<<<<<<<<<<
+ *         out[0] = _fpow(x, 5.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInQuint);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":444
+ *     # ---- Quint ----
+ *     if op == OP_EaseInQuint:
+ *         out[0] = _fpow(x, 5.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuint:
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 5.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":445
+ *     if op == OP_EaseInQuint:
+ *         out[0] = _fpow(x, 5.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutQuint:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 5.0)
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":443
+ * 
+ *     # ---- Quint ----
+ *     if op == OP_EaseInQuint:             # <<<<<<<<<<<<<<
+ *         out[0] = _fpow(x, 5.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":446
+ *         out[0] = _fpow(x, 5.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuint:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - _fpow(1.0 - x, 5.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutQuint);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":447
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuint:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 5.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuint:
+*/
+    (__pyx_v_out[0]) = (1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((1.0 - __pyx_v_x), 5.0));
+
+    /* "sonolus/backend/_opt/kernels.pyx":448
+ *     if op == OP_EaseOutQuint:
+ *         out[0] = 1.0 - _fpow(1.0 - x, 5.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseInOutQuint:
+ *         if x < 0.5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":446
+ *         out[0] = _fpow(x, 5.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutQuint:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - _fpow(1.0 - x, 5.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":449
+ *         out[0] = 1.0 - _fpow(1.0 - x, 5.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuint:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = 16.0 * _fpow(x, 5.0)
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutQuint);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":450
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuint:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = 16.0 * _fpow(x, 5.0)
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":451
+ *     if op == OP_EaseInOutQuint:
+ *         if x < 0.5:
+ *             out[0] = 16.0 * _fpow(x, 5.0)             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 5.0) / 2.0
+*/
+      (__pyx_v_out[0]) = (16.0 * __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(__pyx_v_x, 5.0));
+
+      /* "sonolus/backend/_opt/kernels.pyx":450
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuint:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = 16.0 * _fpow(x, 5.0)
+ *         else:
+*/
+      goto __pyx_L66;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":453
+ *             out[0] = 16.0 * _fpow(x, 5.0)
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 5.0) / 2.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuint:
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = (1.0 - (__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((-2.0 * __pyx_v_x) + 2.0), 5.0) / 2.0));
+    }
+    __pyx_L66:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":454
+ *         else:
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 5.0) / 2.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutInQuint:
+ *         if x < 0.5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":449
+ *         out[0] = 1.0 - _fpow(1.0 - x, 5.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutQuint:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = 16.0 * _fpow(x, 5.0)
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":455
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 5.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuint:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 5.0)) / 2.0
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInQuint);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":456
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuint:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 5.0)) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":457
+ *     if op == OP_EaseOutInQuint:
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 5.0)) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 5.0)) / 2.0 + 0.5
+*/
+      (__pyx_v_out[0]) = ((1.0 - __pyx_f_7sonolus_7backend_4_opt_7kernels__fpow((1.0 - (2.0 * __pyx_v_x)), 5.0)) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":456
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuint:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 5.0)) / 2.0
+ *         else:
+*/
+      goto __pyx_L68;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":459
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 5.0)) / 2.0
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 5.0)) / 2.0 + 0.5             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = ((__pyx_f_7sonolus_7backend_4_opt_7kernels__fpow(((2.0 * __pyx_v_x) - 1.0), 5.0) / 2.0) + 0.5);
+    }
+    __pyx_L68:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":460
+ *         else:
+ *             out[0] = (_fpow(2.0 * x - 1.0, 5.0)) / 2.0 + 0.5
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ---- Sine ----
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":455
+ *             out[0] = 1.0 - _fpow(-2.0 * x + 2.0, 5.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInQuint:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = (1.0 - _fpow(1.0 - 2.0 * x, 5.0)) / 2.0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":463
+ * 
+ *     # ---- Sine ----
+ *     if op == OP_EaseInSine:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - cos((x * M_PI) / 2.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInSine);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":464
+ *     # ---- Sine ----
+ *     if op == OP_EaseInSine:
+ *         out[0] = 1.0 - cos((x * M_PI) / 2.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutSine:
+*/
+    (__pyx_v_out[0]) = (1.0 - cos(((__pyx_v_x * M_PI) / 2.0)));
+
+    /* "sonolus/backend/_opt/kernels.pyx":465
+ *     if op == OP_EaseInSine:
+ *         out[0] = 1.0 - cos((x * M_PI) / 2.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutSine:
+ *         out[0] = sin((x * M_PI) / 2.0)
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":463
+ * 
+ *     # ---- Sine ----
+ *     if op == OP_EaseInSine:             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 - cos((x * M_PI) / 2.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":466
+ *         out[0] = 1.0 - cos((x * M_PI) / 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutSine:             # <<<<<<<<<<<<<<
+ *         out[0] = sin((x * M_PI) / 2.0)
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutSine);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":467
+ *         return FOLD_OK
+ *     if op == OP_EaseOutSine:
+ *         out[0] = sin((x * M_PI) / 2.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutSine:
+*/
+    (__pyx_v_out[0]) = sin(((__pyx_v_x * M_PI) / 2.0));
+
+    /* "sonolus/backend/_opt/kernels.pyx":468
+ *     if op == OP_EaseOutSine:
+ *         out[0] = sin((x * M_PI) / 2.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseInOutSine:
+ *         out[0] = -(cos(M_PI * x) - 1.0) / 2.0
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":466
+ *         out[0] = 1.0 - cos((x * M_PI) / 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseOutSine:             # <<<<<<<<<<<<<<
+ *         out[0] = sin((x * M_PI) / 2.0)
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":469
+ *         out[0] = sin((x * M_PI) / 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutSine:             # <<<<<<<<<<<<<<
+ *         out[0] = -(cos(M_PI * x) - 1.0) / 2.0
+ *         return FOLD_OK
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInOutSine);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":470
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutSine:
+ *         out[0] = -(cos(M_PI * x) - 1.0) / 2.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInSine:
+*/
+    (__pyx_v_out[0]) = ((-(cos((M_PI * __pyx_v_x)) - 1.0)) / 2.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":471
+ *     if op == OP_EaseInOutSine:
+ *         out[0] = -(cos(M_PI * x) - 1.0) / 2.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_EaseOutInSine:
+ *         if x < 0.5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":469
+ *         out[0] = sin((x * M_PI) / 2.0)
+ *         return FOLD_OK
+ *     if op == OP_EaseInOutSine:             # <<<<<<<<<<<<<<
+ *         out[0] = -(cos(M_PI * x) - 1.0) / 2.0
+ *         return FOLD_OK
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":472
+ *         out[0] = -(cos(M_PI * x) - 1.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInSine:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = sin(M_PI * x) / 2.0
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutInSine);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":473
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInSine:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = sin(M_PI * x) / 2.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":474
+ *     if op == OP_EaseOutInSine:
+ *         if x < 0.5:
+ *             out[0] = sin(M_PI * x) / 2.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = 1.0 - sin(M_PI * x) / 2.0
+*/
+      (__pyx_v_out[0]) = (sin((M_PI * __pyx_v_x)) / 2.0);
+
+      /* "sonolus/backend/_opt/kernels.pyx":473
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInSine:
+ *         if x < 0.5:             # <<<<<<<<<<<<<<
+ *             out[0] = sin(M_PI * x) / 2.0
+ *         else:
+*/
+      goto __pyx_L73;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":476
+ *             out[0] = sin(M_PI * x) / 2.0
+ *         else:
+ *             out[0] = 1.0 - sin(M_PI * x) / 2.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = (1.0 - (sin((M_PI * __pyx_v_x)) / 2.0));
+    }
+    __pyx_L73:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":477
+ *         else:
+ *             out[0] = 1.0 - sin(M_PI * x) / 2.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     return FOLD_NOT_CONSTANT
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":472
+ *         out[0] = -(cos(M_PI * x) - 1.0) / 2.0
+ *         return FOLD_OK
+ *     if op == OP_EaseOutInSine:             # <<<<<<<<<<<<<<
+ *         if x < 0.5:
+ *             out[0] = sin(M_PI * x) / 2.0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":479
+ *         return FOLD_OK
+ * 
+ *     return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":254
+ * # ==========================================================================
+ * 
+ * cdef int _fold_ease(uint16_t op, double x, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double c1, c2, c3, c4, c5, arg
+ *     x = _clamp01(x)
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+
+
+
+
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":486
+ * # ==========================================================================
+ * 
+ * cdef int fold_op(uint16_t op, const double* a, int n, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double x, denom, r
+ *     cdef int i
+*/
+
+static int __pyx_f_7sonolus_7backend_4_opt_7kernels_fold_op(uint16_t __pyx_v_op, double const *__pyx_v_a, int __pyx_v_n, double *__pyx_v_out) {
+  double __pyx_v_x;
+  double __pyx_v_denom;
+  double __pyx_v_r;
+  int __pyx_v_i;
+  int __pyx_r;
+  int __pyx_t_1;
+  double __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+
+  /* "sonolus/backend/_opt/kernels.pyx":491
+ * 
+ *     # ------------------------- unary -------------------------
+ *     if op == OP_Not:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Not);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":492
+ *     # ------------------------- unary -------------------------
+ *     if op == OP_Not:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] == 0.0 else 0.0
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":493
+ *     if op == OP_Not:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if a[0] == 0.0 else 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":492
+ *     # ------------------------- unary -------------------------
+ *     if op == OP_Not:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] == 0.0 else 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":494
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] == 0.0 else 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Negate:
+*/
+    __pyx_t_1 = ((__pyx_v_a[0]) == 0.0);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = 1.0;
+    } else {
+
+      __pyx_t_2 = 0.0;
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":495
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] == 0.0 else 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Negate:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":491
+ * 
+ *     # ------------------------- unary -------------------------
+ *     if op == OP_Not:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":496
+ *         out[0] = 1.0 if a[0] == 0.0 else 0.0
+ *         return FOLD_OK
+ *     if op == OP_Negate:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Negate);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":497
+ *         return FOLD_OK
+ *     if op == OP_Negate:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = -a[0]
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":498
+ *     if op == OP_Negate:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = -a[0]
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":497
+ *         return FOLD_OK
+ *     if op == OP_Negate:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = -a[0]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":499
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = -a[0]             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Abs:
+*/
+    (__pyx_v_out[0]) = (-(__pyx_v_a[0]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":500
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = -a[0]
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Abs:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":496
+ *         out[0] = 1.0 if a[0] == 0.0 else 0.0
+ *         return FOLD_OK
+ *     if op == OP_Negate:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":501
+ *         out[0] = -a[0]
+ *         return FOLD_OK
+ *     if op == OP_Abs:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Abs);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":502
+ *         return FOLD_OK
+ *     if op == OP_Abs:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = fabs(a[0])
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":503
+ *     if op == OP_Abs:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = fabs(a[0])
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":502
+ *         return FOLD_OK
+ *     if op == OP_Abs:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = fabs(a[0])
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":504
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = fabs(a[0])             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Sign:
+*/
+    (__pyx_v_out[0]) = fabs((__pyx_v_a[0]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":505
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = fabs(a[0])
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Sign:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":501
+ *         out[0] = -a[0]
+ *         return FOLD_OK
+ *     if op == OP_Abs:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":506
+ *         out[0] = fabs(a[0])
+ *         return FOLD_OK
+ *     if op == OP_Sign:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Sign);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":507
+ *         return FOLD_OK
+ *     if op == OP_Sign:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":508
+ *     if op == OP_Sign:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         x = a[0]
+ *         if isnan(x):
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":507
+ *         return FOLD_OK
+ *     if op == OP_Sign:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":509
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]             # <<<<<<<<<<<<<<
+ *         if isnan(x):
+ *             out[0] = x
+*/
+    __pyx_v_x = (__pyx_v_a[0]);
+
+    /* "sonolus/backend/_opt/kernels.pyx":510
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if isnan(x):             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         elif x > 0.0:
+*/
+    __pyx_t_1 = isnan(__pyx_v_x);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":511
+ *         x = a[0]
+ *         if isnan(x):
+ *             out[0] = x             # <<<<<<<<<<<<<<
+ *         elif x > 0.0:
+ *             out[0] = 1.0
+*/
+      (__pyx_v_out[0]) = __pyx_v_x;
+
+      /* "sonolus/backend/_opt/kernels.pyx":510
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if isnan(x):             # <<<<<<<<<<<<<<
+ *             out[0] = x
+ *         elif x > 0.0:
+*/
+      goto __pyx_L11;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":512
+ *         if isnan(x):
+ *             out[0] = x
+ *         elif x > 0.0:             # <<<<<<<<<<<<<<
+ *             out[0] = 1.0
+ *         elif x < 0.0:
+*/
+    __pyx_t_1 = (__pyx_v_x > 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":513
+ *             out[0] = x
+ *         elif x > 0.0:
+ *             out[0] = 1.0             # <<<<<<<<<<<<<<
+ *         elif x < 0.0:
+ *             out[0] = -1.0
+*/
+      (__pyx_v_out[0]) = 1.0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":512
+ *         if isnan(x):
+ *             out[0] = x
+ *         elif x > 0.0:             # <<<<<<<<<<<<<<
+ *             out[0] = 1.0
+ *         elif x < 0.0:
+*/
+      goto __pyx_L11;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":514
+ *         elif x > 0.0:
+ *             out[0] = 1.0
+ *         elif x < 0.0:             # <<<<<<<<<<<<<<
+ *             out[0] = -1.0
+ *         else:
+*/
+    __pyx_t_1 = (__pyx_v_x < 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":515
+ *             out[0] = 1.0
+ *         elif x < 0.0:
+ *             out[0] = -1.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             out[0] = x  # +-0.0 preserved
+*/
+      (__pyx_v_out[0]) = -1.0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":514
+ *         elif x > 0.0:
+ *             out[0] = 1.0
+ *         elif x < 0.0:             # <<<<<<<<<<<<<<
+ *             out[0] = -1.0
+ *         else:
+*/
+      goto __pyx_L11;
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":517
+ *             out[0] = -1.0
+ *         else:
+ *             out[0] = x  # +-0.0 preserved             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Ceil:
+*/
+    /*else*/ {
+      (__pyx_v_out[0]) = __pyx_v_x;
+    }
+    __pyx_L11:;
+
+    /* "sonolus/backend/_opt/kernels.pyx":518
+ *         else:
+ *             out[0] = x  # +-0.0 preserved
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Ceil:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":506
+ *         out[0] = fabs(a[0])
+ *         return FOLD_OK
+ *     if op == OP_Sign:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":519
+ *             out[0] = x  # +-0.0 preserved
+ *         return FOLD_OK
+ *     if op == OP_Ceil:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Ceil);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":520
+ *         return FOLD_OK
+ *     if op == OP_Ceil:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":521
+ *     if op == OP_Ceil:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":520
+ *         return FOLD_OK
+ *     if op == OP_Ceil:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":522
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]             # <<<<<<<<<<<<<<
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT  # math.ceil(inf/nan) raises
+*/
+    __pyx_v_x = (__pyx_v_a[0]);
+
+    /* "sonolus/backend/_opt/kernels.pyx":523
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT  # math.ceil(inf/nan) raises
+ *         out[0] = ceil(x) + 0.0       # +0.0: oracle returns a Python int (no -0.0)
+*/
+    __pyx_t_3 = isnan(__pyx_v_x);
+
+    if (!__pyx_t_3) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_3;
+
+      goto __pyx_L15_bool_binop_done;
+    }
+    __pyx_t_3 = (isinf(__pyx_v_x) != 0);
+
+
+    __pyx_t_1 = __pyx_t_3;
+
+    __pyx_L15_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":524
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT  # math.ceil(inf/nan) raises             # <<<<<<<<<<<<<<
+ *         out[0] = ceil(x) + 0.0       # +0.0: oracle returns a Python int (no -0.0)
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":523
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT  # math.ceil(inf/nan) raises
+ *         out[0] = ceil(x) + 0.0       # +0.0: oracle returns a Python int (no -0.0)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":525
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT  # math.ceil(inf/nan) raises
+ *         out[0] = ceil(x) + 0.0       # +0.0: oracle returns a Python int (no -0.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Floor:
+*/
+    (__pyx_v_out[0]) = (ceil(__pyx_v_x) + 0.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":526
+ *             return FOLD_NOT_CONSTANT  # math.ceil(inf/nan) raises
+ *         out[0] = ceil(x) + 0.0       # +0.0: oracle returns a Python int (no -0.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Floor:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":519
+ *             out[0] = x  # +-0.0 preserved
+ *         return FOLD_OK
+ *     if op == OP_Ceil:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":527
+ *         out[0] = ceil(x) + 0.0       # +0.0: oracle returns a Python int (no -0.0)
+ *         return FOLD_OK
+ *     if op == OP_Floor:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Floor);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":528
+ *         return FOLD_OK
+ *     if op == OP_Floor:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":529
+ *     if op == OP_Floor:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":528
+ *         return FOLD_OK
+ *     if op == OP_Floor:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":530
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]             # <<<<<<<<<<<<<<
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT
+*/
+    __pyx_v_x = (__pyx_v_a[0]);
+
+    /* "sonolus/backend/_opt/kernels.pyx":531
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = floor(x) + 0.0
+*/
+    __pyx_t_3 = isnan(__pyx_v_x);
+
+    if (!__pyx_t_3) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_3;
+
+      goto __pyx_L20_bool_binop_done;
+    }
+    __pyx_t_3 = (isinf(__pyx_v_x) != 0);
+
+
+    __pyx_t_1 = __pyx_t_3;
+
+    __pyx_L20_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":532
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = floor(x) + 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":531
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = floor(x) + 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":533
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = floor(x) + 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Trunc:
+*/
+    (__pyx_v_out[0]) = (floor(__pyx_v_x) + 0.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":534
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = floor(x) + 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Trunc:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":527
+ *         out[0] = ceil(x) + 0.0       # +0.0: oracle returns a Python int (no -0.0)
+ *         return FOLD_OK
+ *     if op == OP_Floor:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":535
+ *         out[0] = floor(x) + 0.0
+ *         return FOLD_OK
+ *     if op == OP_Trunc:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Trunc);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":536
+ *         return FOLD_OK
+ *     if op == OP_Trunc:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":537
+ *     if op == OP_Trunc:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":536
+ *         return FOLD_OK
+ *     if op == OP_Trunc:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":538
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]             # <<<<<<<<<<<<<<
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT
+*/
+    __pyx_v_x = (__pyx_v_a[0]);
+
+    /* "sonolus/backend/_opt/kernels.pyx":539
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = c_trunc(x) + 0.0
+*/
+    __pyx_t_3 = isnan(__pyx_v_x);
+
+    if (!__pyx_t_3) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_3;
+
+      goto __pyx_L25_bool_binop_done;
+    }
+    __pyx_t_3 = (isinf(__pyx_v_x) != 0);
+
+
+    __pyx_t_1 = __pyx_t_3;
+
+    __pyx_L25_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":540
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = c_trunc(x) + 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":539
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = c_trunc(x) + 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":541
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = c_trunc(x) + 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Round:
+*/
+    (__pyx_v_out[0]) = (trunc(__pyx_v_x) + 0.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":542
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = c_trunc(x) + 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Round:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":535
+ *         out[0] = floor(x) + 0.0
+ *         return FOLD_OK
+ *     if op == OP_Trunc:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":543
+ *         out[0] = c_trunc(x) + 0.0
+ *         return FOLD_OK
+ *     if op == OP_Round:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Round);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":544
+ *         return FOLD_OK
+ *     if op == OP_Round:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":545
+ *     if op == OP_Round:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":544
+ *         return FOLD_OK
+ *     if op == OP_Round:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":546
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]             # <<<<<<<<<<<<<<
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT
+*/
+    __pyx_v_x = (__pyx_v_a[0]);
+
+    /* "sonolus/backend/_opt/kernels.pyx":547
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # CPython float.__round__(None): round-half-away then fix up ties to even.
+*/
+    __pyx_t_3 = isnan(__pyx_v_x);
+
+    if (!__pyx_t_3) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_3;
+
+      goto __pyx_L30_bool_binop_done;
+    }
+    __pyx_t_3 = (isinf(__pyx_v_x) != 0);
+
+
+    __pyx_t_1 = __pyx_t_3;
+
+    __pyx_L30_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":548
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         # CPython float.__round__(None): round-half-away then fix up ties to even.
+ *         r = c_round(x)
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":547
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if isnan(x) or isinf(x):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # CPython float.__round__(None): round-half-away then fix up ties to even.
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":550
+ *             return FOLD_NOT_CONSTANT
+ *         # CPython float.__round__(None): round-half-away then fix up ties to even.
+ *         r = c_round(x)             # <<<<<<<<<<<<<<
+ *         if fabs(x - r) == 0.5:
+ *             r = 2.0 * c_round(x / 2.0)
+*/
+    __pyx_v_r = round(__pyx_v_x);
+
+    /* "sonolus/backend/_opt/kernels.pyx":551
+ *         # CPython float.__round__(None): round-half-away then fix up ties to even.
+ *         r = c_round(x)
+ *         if fabs(x - r) == 0.5:             # <<<<<<<<<<<<<<
+ *             r = 2.0 * c_round(x / 2.0)
+ *         out[0] = r + 0.0
+*/
+    __pyx_t_1 = (fabs((__pyx_v_x - __pyx_v_r)) == 0.5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":552
+ *         r = c_round(x)
+ *         if fabs(x - r) == 0.5:
+ *             r = 2.0 * c_round(x / 2.0)             # <<<<<<<<<<<<<<
+ *         out[0] = r + 0.0
+ *         return FOLD_OK
+*/
+      __pyx_v_r = (2.0 * round((__pyx_v_x / 2.0)));
+
+      /* "sonolus/backend/_opt/kernels.pyx":551
+ *         # CPython float.__round__(None): round-half-away then fix up ties to even.
+ *         r = c_round(x)
+ *         if fabs(x - r) == 0.5:             # <<<<<<<<<<<<<<
+ *             r = 2.0 * c_round(x / 2.0)
+ *         out[0] = r + 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":553
+ *         if fabs(x - r) == 0.5:
+ *             r = 2.0 * c_round(x / 2.0)
+ *         out[0] = r + 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Frac:
+*/
+    (__pyx_v_out[0]) = (__pyx_v_r + 0.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":554
+ *             r = 2.0 * c_round(x / 2.0)
+ *         out[0] = r + 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Frac:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":543
+ *         out[0] = c_trunc(x) + 0.0
+ *         return FOLD_OK
+ *     if op == OP_Round:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":555
+ *         out[0] = r + 0.0
+ *         return FOLD_OK
+ *     if op == OP_Frac:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Frac);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":556
+ *         return FOLD_OK
+ *     if op == OP_Frac:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # interpret.py: r = x % 1; return r if r >= 0 else r + 1 (r in [0,1); nan->nan).
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":557
+ *     if op == OP_Frac:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         # interpret.py: r = x % 1; return r if r >= 0 else r + 1 (r in [0,1); nan->nan).
+ *         r = _pymod(a[0], 1.0)
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":556
+ *         return FOLD_OK
+ *     if op == OP_Frac:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # interpret.py: r = x % 1; return r if r >= 0 else r + 1 (r in [0,1); nan->nan).
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":559
+ *             return FOLD_NOT_CONSTANT
+ *         # interpret.py: r = x % 1; return r if r >= 0 else r + 1 (r in [0,1); nan->nan).
+ *         r = _pymod(a[0], 1.0)             # <<<<<<<<<<<<<<
+ *         out[0] = r if r >= 0.0 else r + 1.0
+ *         return FOLD_OK
+*/
+    __pyx_v_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__pymod((__pyx_v_a[0]), 1.0);
+
+    /* "sonolus/backend/_opt/kernels.pyx":560
+ *         # interpret.py: r = x % 1; return r if r >= 0 else r + 1 (r in [0,1); nan->nan).
+ *         r = _pymod(a[0], 1.0)
+ *         out[0] = r if r >= 0.0 else r + 1.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Sin:
+*/
+    __pyx_t_1 = (__pyx_v_r >= 0.0);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = __pyx_v_r;
+    } else {
+
+      __pyx_t_2 = (__pyx_v_r + 1.0);
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":561
+ *         r = _pymod(a[0], 1.0)
+ *         out[0] = r if r >= 0.0 else r + 1.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Sin:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":555
+ *         out[0] = r + 0.0
+ *         return FOLD_OK
+ *     if op == OP_Frac:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":562
+ *         out[0] = r if r >= 0.0 else r + 1.0
+ *         return FOLD_OK
+ *     if op == OP_Sin:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Sin);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":563
+ *         return FOLD_OK
+ *     if op == OP_Sin:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(sin(a[0]), a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":564
+ *     if op == OP_Sin:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m1(sin(a[0]), a[0], out)
+ *     if op == OP_Cos:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":563
+ *         return FOLD_OK
+ *     if op == OP_Sin:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(sin(a[0]), a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":565
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(sin(a[0]), a[0], out)             # <<<<<<<<<<<<<<
+ *     if op == OP_Cos:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(sin((__pyx_v_a[0])), (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":562
+ *         out[0] = r if r >= 0.0 else r + 1.0
+ *         return FOLD_OK
+ *     if op == OP_Sin:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":566
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(sin(a[0]), a[0], out)
+ *     if op == OP_Cos:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Cos);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":567
+ *         return _m1(sin(a[0]), a[0], out)
+ *     if op == OP_Cos:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(cos(a[0]), a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":568
+ *     if op == OP_Cos:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m1(cos(a[0]), a[0], out)
+ *     if op == OP_Tan:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":567
+ *         return _m1(sin(a[0]), a[0], out)
+ *     if op == OP_Cos:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(cos(a[0]), a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":569
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(cos(a[0]), a[0], out)             # <<<<<<<<<<<<<<
+ *     if op == OP_Tan:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(cos((__pyx_v_a[0])), (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":566
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(sin(a[0]), a[0], out)
+ *     if op == OP_Cos:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":570
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(cos(a[0]), a[0], out)
+ *     if op == OP_Tan:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Tan);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":571
+ *         return _m1(cos(a[0]), a[0], out)
+ *     if op == OP_Tan:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(tan(a[0]), a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":572
+ *     if op == OP_Tan:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m1(tan(a[0]), a[0], out)
+ *     if op == OP_Sinh:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":571
+ *         return _m1(cos(a[0]), a[0], out)
+ *     if op == OP_Tan:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(tan(a[0]), a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":573
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(tan(a[0]), a[0], out)             # <<<<<<<<<<<<<<
+ *     if op == OP_Sinh:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(tan((__pyx_v_a[0])), (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":570
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(cos(a[0]), a[0], out)
+ *     if op == OP_Tan:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":574
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(tan(a[0]), a[0], out)
+ *     if op == OP_Sinh:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Sinh);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":575
+ *         return _m1(tan(a[0]), a[0], out)
+ *     if op == OP_Sinh:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(sinh(a[0]), a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":576
+ *     if op == OP_Sinh:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m1(sinh(a[0]), a[0], out)
+ *     if op == OP_Cosh:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":575
+ *         return _m1(tan(a[0]), a[0], out)
+ *     if op == OP_Sinh:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(sinh(a[0]), a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":577
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(sinh(a[0]), a[0], out)             # <<<<<<<<<<<<<<
+ *     if op == OP_Cosh:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(sinh((__pyx_v_a[0])), (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":574
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(tan(a[0]), a[0], out)
+ *     if op == OP_Sinh:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":578
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(sinh(a[0]), a[0], out)
+ *     if op == OP_Cosh:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Cosh);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":579
+ *         return _m1(sinh(a[0]), a[0], out)
+ *     if op == OP_Cosh:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(cosh(a[0]), a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":580
+ *     if op == OP_Cosh:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m1(cosh(a[0]), a[0], out)
+ *     if op == OP_Tanh:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":579
+ *         return _m1(sinh(a[0]), a[0], out)
+ *     if op == OP_Cosh:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(cosh(a[0]), a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":581
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(cosh(a[0]), a[0], out)             # <<<<<<<<<<<<<<
+ *     if op == OP_Tanh:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(cosh((__pyx_v_a[0])), (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":578
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(sinh(a[0]), a[0], out)
+ *     if op == OP_Cosh:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":582
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(cosh(a[0]), a[0], out)
+ *     if op == OP_Tanh:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Tanh);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":583
+ *         return _m1(cosh(a[0]), a[0], out)
+ *     if op == OP_Tanh:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(tanh(a[0]), a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":584
+ *     if op == OP_Tanh:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m1(tanh(a[0]), a[0], out)
+ *     if op == OP_Arcsin:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":583
+ *         return _m1(cosh(a[0]), a[0], out)
+ *     if op == OP_Tanh:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(tanh(a[0]), a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":585
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(tanh(a[0]), a[0], out)             # <<<<<<<<<<<<<<
+ *     if op == OP_Arcsin:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(tanh((__pyx_v_a[0])), (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":582
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(cosh(a[0]), a[0], out)
+ *     if op == OP_Tanh:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":586
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(tanh(a[0]), a[0], out)
+ *     if op == OP_Arcsin:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arcsin);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":587
+ *         return _m1(tanh(a[0]), a[0], out)
+ *     if op == OP_Arcsin:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(asin(a[0]), a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":588
+ *     if op == OP_Arcsin:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m1(asin(a[0]), a[0], out)
+ *     if op == OP_Arccos:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":587
+ *         return _m1(tanh(a[0]), a[0], out)
+ *     if op == OP_Arcsin:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(asin(a[0]), a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":589
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(asin(a[0]), a[0], out)             # <<<<<<<<<<<<<<
+ *     if op == OP_Arccos:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(asin((__pyx_v_a[0])), (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":586
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(tanh(a[0]), a[0], out)
+ *     if op == OP_Arcsin:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":590
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(asin(a[0]), a[0], out)
+ *     if op == OP_Arccos:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arccos);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":591
+ *         return _m1(asin(a[0]), a[0], out)
+ *     if op == OP_Arccos:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(acos(a[0]), a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":592
+ *     if op == OP_Arccos:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m1(acos(a[0]), a[0], out)
+ *     if op == OP_Arctan:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":591
+ *         return _m1(asin(a[0]), a[0], out)
+ *     if op == OP_Arccos:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(acos(a[0]), a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":593
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(acos(a[0]), a[0], out)             # <<<<<<<<<<<<<<
+ *     if op == OP_Arctan:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(acos((__pyx_v_a[0])), (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":590
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(asin(a[0]), a[0], out)
+ *     if op == OP_Arccos:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":594
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(acos(a[0]), a[0], out)
+ *     if op == OP_Arctan:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arctan);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":595
+ *         return _m1(acos(a[0]), a[0], out)
+ *     if op == OP_Arctan:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(atan(a[0]), a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":596
+ *     if op == OP_Arctan:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m1(atan(a[0]), a[0], out)
+ *     if op == OP_Log:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":595
+ *         return _m1(acos(a[0]), a[0], out)
+ *     if op == OP_Arctan:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(atan(a[0]), a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":597
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(atan(a[0]), a[0], out)             # <<<<<<<<<<<<<<
+ *     if op == OP_Log:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(atan((__pyx_v_a[0])), (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":594
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(acos(a[0]), a[0], out)
+ *     if op == OP_Arctan:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":598
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(atan(a[0]), a[0], out)
+ *     if op == OP_Log:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Log);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":599
+ *         return _m1(atan(a[0]), a[0], out)
+ *     if op == OP_Log:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(log(a[0]), a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":600
+ *     if op == OP_Log:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m1(log(a[0]), a[0], out)
+ *     if op == OP_Degree:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":599
+ *         return _m1(atan(a[0]), a[0], out)
+ *     if op == OP_Log:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(log(a[0]), a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":601
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(log(a[0]), a[0], out)             # <<<<<<<<<<<<<<
+ *     if op == OP_Degree:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m1(log((__pyx_v_a[0])), (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":598
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(atan(a[0]), a[0], out)
+ *     if op == OP_Log:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":602
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(log(a[0]), a[0], out)
+ *     if op == OP_Degree:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Degree);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":603
+ *         return _m1(log(a[0]), a[0], out)
+ *     if op == OP_Degree:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # math.degrees/radians are a bare multiply -- they never raise (overflow
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":604
+ *     if op == OP_Degree:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         # math.degrees/radians are a bare multiply -- they never raise (overflow
+ *         # to +-inf is returned, not an error), so no math_1 guard.
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":603
+ *         return _m1(log(a[0]), a[0], out)
+ *     if op == OP_Degree:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # math.degrees/radians are a bare multiply -- they never raise (overflow
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":607
+ *         # math.degrees/radians are a bare multiply -- they never raise (overflow
+ *         # to +-inf is returned, not an error), so no math_1 guard.
+ *         out[0] = a[0] * (180.0 / M_PI)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Radian:
+*/
+    (__pyx_v_out[0]) = ((__pyx_v_a[0]) * (180.0 / ((double)M_PI)));
+
+    /* "sonolus/backend/_opt/kernels.pyx":608
+ *         # to +-inf is returned, not an error), so no math_1 guard.
+ *         out[0] = a[0] * (180.0 / M_PI)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Radian:
+ *         if n != 1:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":602
+ *             return FOLD_NOT_CONSTANT
+ *         return _m1(log(a[0]), a[0], out)
+ *     if op == OP_Degree:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":609
+ *         out[0] = a[0] * (180.0 / M_PI)
+ *         return FOLD_OK
+ *     if op == OP_Radian:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Radian);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":610
+ *         return FOLD_OK
+ *     if op == OP_Radian:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] * (M_PI / 180.0)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":611
+ *     if op == OP_Radian:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = a[0] * (M_PI / 180.0)
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":610
+ *         return FOLD_OK
+ *     if op == OP_Radian:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] * (M_PI / 180.0)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":612
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] * (M_PI / 180.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    (__pyx_v_out[0]) = ((__pyx_v_a[0]) * (((double)M_PI) / 180.0));
+
+    /* "sonolus/backend/_opt/kernels.pyx":613
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] * (M_PI / 180.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ------------------------- comparisons (binary) -------------------------
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":609
+ *         out[0] = a[0] * (180.0 / M_PI)
+ *         return FOLD_OK
+ *     if op == OP_Radian:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":616
+ * 
+ *     # ------------------------- comparisons (binary) -------------------------
+ *     if op == OP_Equal:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Equal);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":617
+ *     # ------------------------- comparisons (binary) -------------------------
+ *     if op == OP_Equal:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] == a[1] else 0.0
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":618
+ *     if op == OP_Equal:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if a[0] == a[1] else 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":617
+ *     # ------------------------- comparisons (binary) -------------------------
+ *     if op == OP_Equal:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] == a[1] else 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":619
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] == a[1] else 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_NotEqual:
+*/
+    __pyx_t_1 = ((__pyx_v_a[0]) == (__pyx_v_a[1]));
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = 1.0;
+    } else {
+
+      __pyx_t_2 = 0.0;
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":620
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] == a[1] else 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_NotEqual:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":616
+ * 
+ *     # ------------------------- comparisons (binary) -------------------------
+ *     if op == OP_Equal:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":621
+ *         out[0] = 1.0 if a[0] == a[1] else 0.0
+ *         return FOLD_OK
+ *     if op == OP_NotEqual:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_NotEqual);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":622
+ *         return FOLD_OK
+ *     if op == OP_NotEqual:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] != a[1] else 0.0
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":623
+ *     if op == OP_NotEqual:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if a[0] != a[1] else 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":622
+ *         return FOLD_OK
+ *     if op == OP_NotEqual:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] != a[1] else 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":624
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] != a[1] else 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Greater:
+*/
+    __pyx_t_1 = ((__pyx_v_a[0]) != (__pyx_v_a[1]));
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = 1.0;
+    } else {
+
+      __pyx_t_2 = 0.0;
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":625
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] != a[1] else 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Greater:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":621
+ *         out[0] = 1.0 if a[0] == a[1] else 0.0
+ *         return FOLD_OK
+ *     if op == OP_NotEqual:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":626
+ *         out[0] = 1.0 if a[0] != a[1] else 0.0
+ *         return FOLD_OK
+ *     if op == OP_Greater:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Greater);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":627
+ *         return FOLD_OK
+ *     if op == OP_Greater:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] > a[1] else 0.0
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":628
+ *     if op == OP_Greater:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if a[0] > a[1] else 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":627
+ *         return FOLD_OK
+ *     if op == OP_Greater:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] > a[1] else 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":629
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] > a[1] else 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_GreaterOr:
+*/
+    __pyx_t_1 = ((__pyx_v_a[0]) > (__pyx_v_a[1]));
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = 1.0;
+    } else {
+
+      __pyx_t_2 = 0.0;
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":630
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] > a[1] else 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_GreaterOr:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":626
+ *         out[0] = 1.0 if a[0] != a[1] else 0.0
+ *         return FOLD_OK
+ *     if op == OP_Greater:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":631
+ *         out[0] = 1.0 if a[0] > a[1] else 0.0
+ *         return FOLD_OK
+ *     if op == OP_GreaterOr:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_GreaterOr);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":632
+ *         return FOLD_OK
+ *     if op == OP_GreaterOr:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] >= a[1] else 0.0
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":633
+ *     if op == OP_GreaterOr:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if a[0] >= a[1] else 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":632
+ *         return FOLD_OK
+ *     if op == OP_GreaterOr:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] >= a[1] else 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":634
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] >= a[1] else 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Less:
+*/
+    __pyx_t_1 = ((__pyx_v_a[0]) >= (__pyx_v_a[1]));
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = 1.0;
+    } else {
+
+      __pyx_t_2 = 0.0;
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":635
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] >= a[1] else 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Less:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":631
+ *         out[0] = 1.0 if a[0] > a[1] else 0.0
+ *         return FOLD_OK
+ *     if op == OP_GreaterOr:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":636
+ *         out[0] = 1.0 if a[0] >= a[1] else 0.0
+ *         return FOLD_OK
+ *     if op == OP_Less:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Less);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":637
+ *         return FOLD_OK
+ *     if op == OP_Less:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] < a[1] else 0.0
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":638
+ *     if op == OP_Less:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if a[0] < a[1] else 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":637
+ *         return FOLD_OK
+ *     if op == OP_Less:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] < a[1] else 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":639
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] < a[1] else 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_LessOr:
+*/
+    __pyx_t_1 = ((__pyx_v_a[0]) < (__pyx_v_a[1]));
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = 1.0;
+    } else {
+
+      __pyx_t_2 = 0.0;
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":640
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] < a[1] else 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_LessOr:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":636
+ *         out[0] = 1.0 if a[0] >= a[1] else 0.0
+ *         return FOLD_OK
+ *     if op == OP_Less:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":641
+ *         out[0] = 1.0 if a[0] < a[1] else 0.0
+ *         return FOLD_OK
+ *     if op == OP_LessOr:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_LessOr);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":642
+ *         return FOLD_OK
+ *     if op == OP_LessOr:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] <= a[1] else 0.0
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":643
+ *     if op == OP_LessOr:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = 1.0 if a[0] <= a[1] else 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":642
+ *         return FOLD_OK
+ *     if op == OP_LessOr:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] <= a[1] else 0.0
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":644
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] <= a[1] else 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    __pyx_t_1 = ((__pyx_v_a[0]) <= (__pyx_v_a[1]));
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = 1.0;
+    } else {
+
+      __pyx_t_2 = 0.0;
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":645
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = 1.0 if a[0] <= a[1] else 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ------------------------- And / Or (value semantics, any arity) --------
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":641
+ *         out[0] = 1.0 if a[0] < a[1] else 0.0
+ *         return FOLD_OK
+ *     if op == OP_LessOr:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":648
+ * 
+ *     # ------------------------- And / Or (value semantics, any arity) --------
+ *     if op == OP_And:             # <<<<<<<<<<<<<<
+ *         # First zero arg, else the last; empty -> 0.0 (matches the oracle loop).
+ *         r = 0.0
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_And);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":650
+ *     if op == OP_And:
+ *         # First zero arg, else the last; empty -> 0.0 (matches the oracle loop).
+ *         r = 0.0             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             r = a[i]
+*/
+    __pyx_v_r = 0.0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":651
+ *         # First zero arg, else the last; empty -> 0.0 (matches the oracle loop).
+ *         r = 0.0
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             r = a[i]
+ *             if r == 0.0:
+*/
+
+    __pyx_t_4 = __pyx_v_n;
+    __pyx_t_5 = __pyx_t_4;
+
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
+
+      /* "sonolus/backend/_opt/kernels.pyx":652
+ *         r = 0.0
+ *         for i in range(n):
+ *             r = a[i]             # <<<<<<<<<<<<<<
+ *             if r == 0.0:
+ *                 break
+*/
+      __pyx_v_r = (__pyx_v_a[__pyx_v_i]);
+
+      /* "sonolus/backend/_opt/kernels.pyx":653
+ *         for i in range(n):
+ *             r = a[i]
+ *             if r == 0.0:             # <<<<<<<<<<<<<<
+ *                 break
+ *         out[0] = r
+*/
+      __pyx_t_1 = (__pyx_v_r == 0.0);
+
+      if (__pyx_t_1) {
+
+
+        /* "sonolus/backend/_opt/kernels.pyx":654
+ *             r = a[i]
+ *             if r == 0.0:
+ *                 break             # <<<<<<<<<<<<<<
+ *         out[0] = r
+ *         return FOLD_OK
+*/
+        goto __pyx_L73_break;
+
+        /* "sonolus/backend/_opt/kernels.pyx":653
+ *         for i in range(n):
+ *             r = a[i]
+ *             if r == 0.0:             # <<<<<<<<<<<<<<
+ *                 break
+ *         out[0] = r
+*/
+      }
+    }
+    __pyx_L73_break:;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":655
+ *             if r == 0.0:
+ *                 break
+ *         out[0] = r             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Or:
+*/
+    (__pyx_v_out[0]) = __pyx_v_r;
+
+    /* "sonolus/backend/_opt/kernels.pyx":656
+ *                 break
+ *         out[0] = r
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Or:
+ *         r = 0.0
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":648
+ * 
+ *     # ------------------------- And / Or (value semantics, any arity) --------
+ *     if op == OP_And:             # <<<<<<<<<<<<<<
+ *         # First zero arg, else the last; empty -> 0.0 (matches the oracle loop).
+ *         r = 0.0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":657
+ *         out[0] = r
+ *         return FOLD_OK
+ *     if op == OP_Or:             # <<<<<<<<<<<<<<
+ *         r = 0.0
+ *         for i in range(n):
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Or);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":658
+ *         return FOLD_OK
+ *     if op == OP_Or:
+ *         r = 0.0             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             r = a[i]
+*/
+    __pyx_v_r = 0.0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":659
+ *     if op == OP_Or:
+ *         r = 0.0
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             r = a[i]
+ *             if r != 0.0:
+*/
+
+    __pyx_t_4 = __pyx_v_n;
+    __pyx_t_5 = __pyx_t_4;
+
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
+
+      /* "sonolus/backend/_opt/kernels.pyx":660
+ *         r = 0.0
+ *         for i in range(n):
+ *             r = a[i]             # <<<<<<<<<<<<<<
+ *             if r != 0.0:
+ *                 break
+*/
+      __pyx_v_r = (__pyx_v_a[__pyx_v_i]);
+
+      /* "sonolus/backend/_opt/kernels.pyx":661
+ *         for i in range(n):
+ *             r = a[i]
+ *             if r != 0.0:             # <<<<<<<<<<<<<<
+ *                 break
+ *         out[0] = r
+*/
+      __pyx_t_1 = (__pyx_v_r != 0.0);
+
+      if (__pyx_t_1) {
+
+
+        /* "sonolus/backend/_opt/kernels.pyx":662
+ *             r = a[i]
+ *             if r != 0.0:
+ *                 break             # <<<<<<<<<<<<<<
+ *         out[0] = r
+ *         return FOLD_OK
+*/
+        goto __pyx_L77_break;
+
+        /* "sonolus/backend/_opt/kernels.pyx":661
+ *         for i in range(n):
+ *             r = a[i]
+ *             if r != 0.0:             # <<<<<<<<<<<<<<
+ *                 break
+ *         out[0] = r
+*/
+      }
+    }
+    __pyx_L77_break:;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":663
+ *             if r != 0.0:
+ *                 break
+ *         out[0] = r             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    (__pyx_v_out[0]) = __pyx_v_r;
+
+    /* "sonolus/backend/_opt/kernels.pyx":664
+ *                 break
+ *         out[0] = r
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # -------------------- If / Switch* (strict value selects) ----------------
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":657
+ *         out[0] = r
+ *         return FOLD_OK
+ *     if op == OP_Or:             # <<<<<<<<<<<<<<
+ *         r = 0.0
+ *         for i in range(n):
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":671
+ *     # f32 guard (_f32_exact) applies to the test and each examined key only;
+ *     # arm/key *values* are returned verbatim and need no guard.
+ *     if op == OP_If:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_If);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":672
+ *     # arm/key *values* are returned verbatim and need no guard.
+ *     if op == OP_If:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+*/
+    __pyx_t_1 = (__pyx_v_n != 3);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":673
+ *     if op == OP_If:
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":672
+ *     # arm/key *values* are returned verbatim and need no guard.
+ *     if op == OP_If:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":674
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[1] if a[0] != 0.0 else a[2]  # NaN test is truthy (NaN != 0.0)
+*/
+    __pyx_t_1 = (!__pyx_f_7sonolus_7backend_4_opt_7kernels__f32_exact((__pyx_v_a[0])));
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":675
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = a[1] if a[0] != 0.0 else a[2]  # NaN test is truthy (NaN != 0.0)
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":674
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[1] if a[0] != 0.0 else a[2]  # NaN test is truthy (NaN != 0.0)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":676
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[1] if a[0] != 0.0 else a[2]  # NaN test is truthy (NaN != 0.0)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Switch:
+*/
+    __pyx_t_1 = ((__pyx_v_a[0]) != 0.0);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_2 = (__pyx_v_a[1]);
+    } else {
+
+      __pyx_t_2 = (__pyx_v_a[2]);
+    }
+
+    (__pyx_v_out[0]) = __pyx_t_2;
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":677
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[1] if a[0] != 0.0 else a[2]  # NaN test is truthy (NaN != 0.0)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Switch:
+ *         # a[0] test, then (key, value) pairs; first f64 match wins, else 0.0.
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":671
+ *     # f32 guard (_f32_exact) applies to the test and each examined key only;
+ *     # arm/key *values* are returned verbatim and need no guard.
+ *     if op == OP_If:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":678
+ *         out[0] = a[1] if a[0] != 0.0 else a[2]  # NaN test is truthy (NaN != 0.0)
+ *         return FOLD_OK
+ *     if op == OP_Switch:             # <<<<<<<<<<<<<<
+ *         # a[0] test, then (key, value) pairs; first f64 match wins, else 0.0.
+ *         if n < 1 or (n & 1) == 0:
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Switch);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":680
+ *     if op == OP_Switch:
+ *         # a[0] test, then (key, value) pairs; first f64 match wins, else 0.0.
+ *         if n < 1 or (n & 1) == 0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+*/
+    __pyx_t_3 = (__pyx_v_n < 1);
+
+    if (!__pyx_t_3) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_3;
+
+      goto __pyx_L84_bool_binop_done;
+    }
+    __pyx_t_3 = ((__pyx_v_n & 1) == 0);
+
+
+    __pyx_t_1 = __pyx_t_3;
+
+    __pyx_L84_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":681
+ *         # a[0] test, then (key, value) pairs; first f64 match wins, else 0.0.
+ *         if n < 1 or (n & 1) == 0:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":680
+ *     if op == OP_Switch:
+ *         # a[0] test, then (key, value) pairs; first f64 match wins, else 0.0.
+ *         if n < 1 or (n & 1) == 0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":682
+ *         if n < 1 or (n & 1) == 0:
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         i = 1
+*/
+    __pyx_t_1 = (!__pyx_f_7sonolus_7backend_4_opt_7kernels__f32_exact((__pyx_v_a[0])));
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":683
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         i = 1
+ *         while i < n:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":682
+ *         if n < 1 or (n & 1) == 0:
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         i = 1
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":684
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT
+ *         i = 1             # <<<<<<<<<<<<<<
+ *         while i < n:
+ *             if not _f32_exact(a[i]):
+*/
+    __pyx_v_i = 1;
+
+    /* "sonolus/backend/_opt/kernels.pyx":685
+ *             return FOLD_NOT_CONSTANT
+ *         i = 1
+ *         while i < n:             # <<<<<<<<<<<<<<
+ *             if not _f32_exact(a[i]):
+ *                 return FOLD_NOT_CONSTANT
+*/
+    while (1) {
+      __pyx_t_1 = (__pyx_v_i < __pyx_v_n);
+
+
+      if (!__pyx_t_1) break;
+
+      /* "sonolus/backend/_opt/kernels.pyx":686
+ *         i = 1
+ *         while i < n:
+ *             if not _f32_exact(a[i]):             # <<<<<<<<<<<<<<
+ *                 return FOLD_NOT_CONSTANT
+ *             if a[0] == a[i]:  # NaN key never matches; -0.0 key matches 0 test
+*/
+      __pyx_t_1 = (!__pyx_f_7sonolus_7backend_4_opt_7kernels__f32_exact((__pyx_v_a[__pyx_v_i])));
+
+      if (__pyx_t_1) {
+
+
+        /* "sonolus/backend/_opt/kernels.pyx":687
+ *         while i < n:
+ *             if not _f32_exact(a[i]):
+ *                 return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *             if a[0] == a[i]:  # NaN key never matches; -0.0 key matches 0 test
+ *                 out[0] = a[i + 1]
+*/
+        {
+
+          __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+        }
+        goto __pyx_L0;
+
+        /* "sonolus/backend/_opt/kernels.pyx":686
+ *         i = 1
+ *         while i < n:
+ *             if not _f32_exact(a[i]):             # <<<<<<<<<<<<<<
+ *                 return FOLD_NOT_CONSTANT
+ *             if a[0] == a[i]:  # NaN key never matches; -0.0 key matches 0 test
+*/
+      }
+
+      /* "sonolus/backend/_opt/kernels.pyx":688
+ *             if not _f32_exact(a[i]):
+ *                 return FOLD_NOT_CONSTANT
+ *             if a[0] == a[i]:  # NaN key never matches; -0.0 key matches 0 test             # <<<<<<<<<<<<<<
+ *                 out[0] = a[i + 1]
+ *                 return FOLD_OK
+*/
+      __pyx_t_1 = ((__pyx_v_a[0]) == (__pyx_v_a[__pyx_v_i]));
+
+      if (__pyx_t_1) {
+
+
+        /* "sonolus/backend/_opt/kernels.pyx":689
+ *                 return FOLD_NOT_CONSTANT
+ *             if a[0] == a[i]:  # NaN key never matches; -0.0 key matches 0 test
+ *                 out[0] = a[i + 1]             # <<<<<<<<<<<<<<
+ *                 return FOLD_OK
+ *             i += 2
+*/
+        (__pyx_v_out[0]) = (__pyx_v_a[(__pyx_v_i + 1)]);
+
+        /* "sonolus/backend/_opt/kernels.pyx":690
+ *             if a[0] == a[i]:  # NaN key never matches; -0.0 key matches 0 test
+ *                 out[0] = a[i + 1]
+ *                 return FOLD_OK             # <<<<<<<<<<<<<<
+ *             i += 2
+ *         out[0] = 0.0
+*/
+        {
+
+          __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+        }
+        goto __pyx_L0;
+
+        /* "sonolus/backend/_opt/kernels.pyx":688
+ *             if not _f32_exact(a[i]):
+ *                 return FOLD_NOT_CONSTANT
+ *             if a[0] == a[i]:  # NaN key never matches; -0.0 key matches 0 test             # <<<<<<<<<<<<<<
+ *                 out[0] = a[i + 1]
+ *                 return FOLD_OK
+*/
+      }
+
+      /* "sonolus/backend/_opt/kernels.pyx":691
+ *                 out[0] = a[i + 1]
+ *                 return FOLD_OK
+ *             i += 2             # <<<<<<<<<<<<<<
+ *         out[0] = 0.0
+ *         return FOLD_OK
+*/
+      __pyx_v_i = (__pyx_v_i + 2);
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":692
+ *                 return FOLD_OK
+ *             i += 2
+ *         out[0] = 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_SwitchWithDefault:
+*/
+    (__pyx_v_out[0]) = 0.0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":693
+ *             i += 2
+ *         out[0] = 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_SwitchWithDefault:
+ *         # a[0] test, (key, value) pairs, trailing default a[n-1].
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":678
+ *         out[0] = a[1] if a[0] != 0.0 else a[2]  # NaN test is truthy (NaN != 0.0)
+ *         return FOLD_OK
+ *     if op == OP_Switch:             # <<<<<<<<<<<<<<
+ *         # a[0] test, then (key, value) pairs; first f64 match wins, else 0.0.
+ *         if n < 1 or (n & 1) == 0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":694
+ *         out[0] = 0.0
+ *         return FOLD_OK
+ *     if op == OP_SwitchWithDefault:             # <<<<<<<<<<<<<<
+ *         # a[0] test, (key, value) pairs, trailing default a[n-1].
+ *         if n < 2 or (n & 1) != 0:
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SwitchWithDefault);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":696
+ *     if op == OP_SwitchWithDefault:
+ *         # a[0] test, (key, value) pairs, trailing default a[n-1].
+ *         if n < 2 or (n & 1) != 0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+*/
+    __pyx_t_3 = (__pyx_v_n < 2);
+
+    if (!__pyx_t_3) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_3;
+
+      goto __pyx_L93_bool_binop_done;
+    }
+    __pyx_t_3 = ((__pyx_v_n & 1) != 0);
+
+
+    __pyx_t_1 = __pyx_t_3;
+
+    __pyx_L93_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":697
+ *         # a[0] test, (key, value) pairs, trailing default a[n-1].
+ *         if n < 2 or (n & 1) != 0:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":696
+ *     if op == OP_SwitchWithDefault:
+ *         # a[0] test, (key, value) pairs, trailing default a[n-1].
+ *         if n < 2 or (n & 1) != 0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":698
+ *         if n < 2 or (n & 1) != 0:
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         i = 1
+*/
+    __pyx_t_1 = (!__pyx_f_7sonolus_7backend_4_opt_7kernels__f32_exact((__pyx_v_a[0])));
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":699
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         i = 1
+ *         while i < n - 1:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":698
+ *         if n < 2 or (n & 1) != 0:
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         i = 1
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":700
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT
+ *         i = 1             # <<<<<<<<<<<<<<
+ *         while i < n - 1:
+ *             if not _f32_exact(a[i]):
+*/
+    __pyx_v_i = 1;
+
+    /* "sonolus/backend/_opt/kernels.pyx":701
+ *             return FOLD_NOT_CONSTANT
+ *         i = 1
+ *         while i < n - 1:             # <<<<<<<<<<<<<<
+ *             if not _f32_exact(a[i]):
+ *                 return FOLD_NOT_CONSTANT
+*/
+    while (1) {
+      __pyx_t_1 = (__pyx_v_i < (__pyx_v_n - 1));
+
+
+      if (!__pyx_t_1) break;
+
+      /* "sonolus/backend/_opt/kernels.pyx":702
+ *         i = 1
+ *         while i < n - 1:
+ *             if not _f32_exact(a[i]):             # <<<<<<<<<<<<<<
+ *                 return FOLD_NOT_CONSTANT
+ *             if a[0] == a[i]:
+*/
+      __pyx_t_1 = (!__pyx_f_7sonolus_7backend_4_opt_7kernels__f32_exact((__pyx_v_a[__pyx_v_i])));
+
+      if (__pyx_t_1) {
+
+
+        /* "sonolus/backend/_opt/kernels.pyx":703
+ *         while i < n - 1:
+ *             if not _f32_exact(a[i]):
+ *                 return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *             if a[0] == a[i]:
+ *                 out[0] = a[i + 1]
+*/
+        {
+
+          __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+        }
+        goto __pyx_L0;
+
+        /* "sonolus/backend/_opt/kernels.pyx":702
+ *         i = 1
+ *         while i < n - 1:
+ *             if not _f32_exact(a[i]):             # <<<<<<<<<<<<<<
+ *                 return FOLD_NOT_CONSTANT
+ *             if a[0] == a[i]:
+*/
+      }
+
+      /* "sonolus/backend/_opt/kernels.pyx":704
+ *             if not _f32_exact(a[i]):
+ *                 return FOLD_NOT_CONSTANT
+ *             if a[0] == a[i]:             # <<<<<<<<<<<<<<
+ *                 out[0] = a[i + 1]
+ *                 return FOLD_OK
+*/
+      __pyx_t_1 = ((__pyx_v_a[0]) == (__pyx_v_a[__pyx_v_i]));
+
+      if (__pyx_t_1) {
+
+
+        /* "sonolus/backend/_opt/kernels.pyx":705
+ *                 return FOLD_NOT_CONSTANT
+ *             if a[0] == a[i]:
+ *                 out[0] = a[i + 1]             # <<<<<<<<<<<<<<
+ *                 return FOLD_OK
+ *             i += 2
+*/
+        (__pyx_v_out[0]) = (__pyx_v_a[(__pyx_v_i + 1)]);
+
+        /* "sonolus/backend/_opt/kernels.pyx":706
+ *             if a[0] == a[i]:
+ *                 out[0] = a[i + 1]
+ *                 return FOLD_OK             # <<<<<<<<<<<<<<
+ *             i += 2
+ *         out[0] = a[n - 1]
+*/
+        {
+
+          __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+        }
+        goto __pyx_L0;
+
+        /* "sonolus/backend/_opt/kernels.pyx":704
+ *             if not _f32_exact(a[i]):
+ *                 return FOLD_NOT_CONSTANT
+ *             if a[0] == a[i]:             # <<<<<<<<<<<<<<
+ *                 out[0] = a[i + 1]
+ *                 return FOLD_OK
+*/
+      }
+
+      /* "sonolus/backend/_opt/kernels.pyx":707
+ *                 out[0] = a[i + 1]
+ *                 return FOLD_OK
+ *             i += 2             # <<<<<<<<<<<<<<
+ *         out[0] = a[n - 1]
+ *         return FOLD_OK
+*/
+      __pyx_v_i = (__pyx_v_i + 2);
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":708
+ *                 return FOLD_OK
+ *             i += 2
+ *         out[0] = a[n - 1]             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_SwitchInteger:
+*/
+    (__pyx_v_out[0]) = (__pyx_v_a[(__pyx_v_n - 1)]);
+
+    /* "sonolus/backend/_opt/kernels.pyx":709
+ *             i += 2
+ *         out[0] = a[n - 1]
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_SwitchInteger:
+ *         # a[0] selects branch a[1 + int(t)] iff 0 <= t < (n-1) and t integral (exact
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":694
+ *         out[0] = 0.0
+ *         return FOLD_OK
+ *     if op == OP_SwitchWithDefault:             # <<<<<<<<<<<<<<
+ *         # a[0] test, (key, value) pairs, trailing default a[n-1].
+ *         if n < 2 or (n & 1) != 0:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":710
+ *         out[0] = a[n - 1]
+ *         return FOLD_OK
+ *     if op == OP_SwitchInteger:             # <<<<<<<<<<<<<<
+ *         # a[0] selects branch a[1 + int(t)] iff 0 <= t < (n-1) and t integral (exact
+ *         # equals-to-n dispatch, NOT truncation); else 0.0. -0.0 selects branch 0.
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SwitchInteger);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":713
+ *         # a[0] selects branch a[1 + int(t)] iff 0 <= t < (n-1) and t integral (exact
+ *         # equals-to-n dispatch, NOT truncation); else 0.0. -0.0 selects branch 0.
+ *         if n < 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+*/
+    __pyx_t_1 = (__pyx_v_n < 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":714
+ *         # equals-to-n dispatch, NOT truncation); else 0.0. -0.0 selects branch 0.
+ *         if n < 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":713
+ *         # a[0] selects branch a[1 + int(t)] iff 0 <= t < (n-1) and t integral (exact
+ *         # equals-to-n dispatch, NOT truncation); else 0.0. -0.0 selects branch 0.
+ *         if n < 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":715
+ *         if n < 1:
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    __pyx_t_1 = (!__pyx_f_7sonolus_7backend_4_opt_7kernels__f32_exact((__pyx_v_a[0])));
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":716
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         x = a[0]
+ *         if x >= 0.0 and x < <double>(n - 1) and c_trunc(x) == x:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":715
+ *         if n < 1:
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":717
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]             # <<<<<<<<<<<<<<
+ *         if x >= 0.0 and x < <double>(n - 1) and c_trunc(x) == x:
+ *             out[0] = a[1 + <int>x]
+*/
+    __pyx_v_x = (__pyx_v_a[0]);
+
+    /* "sonolus/backend/_opt/kernels.pyx":718
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if x >= 0.0 and x < <double>(n - 1) and c_trunc(x) == x:             # <<<<<<<<<<<<<<
+ *             out[0] = a[1 + <int>x]
+ *             return FOLD_OK
+*/
+    __pyx_t_3 = (__pyx_v_x >= 0.0);
+
+    if (__pyx_t_3) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_3;
+
+      goto __pyx_L104_bool_binop_done;
+    }
+    __pyx_t_3 = (__pyx_v_x < ((double)(__pyx_v_n - 1)));
+
+    if (__pyx_t_3) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_3;
+
+      goto __pyx_L104_bool_binop_done;
+    }
+    __pyx_t_3 = (trunc(__pyx_v_x) == __pyx_v_x);
+
+
+    __pyx_t_1 = __pyx_t_3;
+
+    __pyx_L104_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":719
+ *         x = a[0]
+ *         if x >= 0.0 and x < <double>(n - 1) and c_trunc(x) == x:
+ *             out[0] = a[1 + <int>x]             # <<<<<<<<<<<<<<
+ *             return FOLD_OK
+ *         out[0] = 0.0
+*/
+      (__pyx_v_out[0]) = (__pyx_v_a[(1 + ((int)__pyx_v_x))]);
+
+      /* "sonolus/backend/_opt/kernels.pyx":720
+ *         if x >= 0.0 and x < <double>(n - 1) and c_trunc(x) == x:
+ *             out[0] = a[1 + <int>x]
+ *             return FOLD_OK             # <<<<<<<<<<<<<<
+ *         out[0] = 0.0
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":718
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if x >= 0.0 and x < <double>(n - 1) and c_trunc(x) == x:             # <<<<<<<<<<<<<<
+ *             out[0] = a[1 + <int>x]
+ *             return FOLD_OK
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":721
+ *             out[0] = a[1 + <int>x]
+ *             return FOLD_OK
+ *         out[0] = 0.0             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_SwitchIntegerWithDefault:
+*/
+    (__pyx_v_out[0]) = 0.0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":722
+ *             return FOLD_OK
+ *         out[0] = 0.0
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_SwitchIntegerWithDefault:
+ *         # like SwitchInteger over (n-2) branches, with trailing default a[n-1].
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":710
+ *         out[0] = a[n - 1]
+ *         return FOLD_OK
+ *     if op == OP_SwitchInteger:             # <<<<<<<<<<<<<<
+ *         # a[0] selects branch a[1 + int(t)] iff 0 <= t < (n-1) and t integral (exact
+ *         # equals-to-n dispatch, NOT truncation); else 0.0. -0.0 selects branch 0.
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":723
+ *         out[0] = 0.0
+ *         return FOLD_OK
+ *     if op == OP_SwitchIntegerWithDefault:             # <<<<<<<<<<<<<<
+ *         # like SwitchInteger over (n-2) branches, with trailing default a[n-1].
+ *         if n < 2:
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_SwitchIntegerWithDefault);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":725
+ *     if op == OP_SwitchIntegerWithDefault:
+ *         # like SwitchInteger over (n-2) branches, with trailing default a[n-1].
+ *         if n < 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+*/
+    __pyx_t_1 = (__pyx_v_n < 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":726
+ *         # like SwitchInteger over (n-2) branches, with trailing default a[n-1].
+ *         if n < 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":725
+ *     if op == OP_SwitchIntegerWithDefault:
+ *         # like SwitchInteger over (n-2) branches, with trailing default a[n-1].
+ *         if n < 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":727
+ *         if n < 2:
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    __pyx_t_1 = (!__pyx_f_7sonolus_7backend_4_opt_7kernels__f32_exact((__pyx_v_a[0])));
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":728
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         x = a[0]
+ *         if x >= 0.0 and x < <double>(n - 2) and c_trunc(x) == x:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":727
+ *         if n < 2:
+ *             return FOLD_NOT_CONSTANT
+ *         if not _f32_exact(a[0]):             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":729
+ *         if not _f32_exact(a[0]):
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]             # <<<<<<<<<<<<<<
+ *         if x >= 0.0 and x < <double>(n - 2) and c_trunc(x) == x:
+ *             out[0] = a[1 + <int>x]
+*/
+    __pyx_v_x = (__pyx_v_a[0]);
+
+    /* "sonolus/backend/_opt/kernels.pyx":730
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if x >= 0.0 and x < <double>(n - 2) and c_trunc(x) == x:             # <<<<<<<<<<<<<<
+ *             out[0] = a[1 + <int>x]
+ *             return FOLD_OK
+*/
+    __pyx_t_3 = (__pyx_v_x >= 0.0);
+
+    if (__pyx_t_3) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_3;
+
+      goto __pyx_L111_bool_binop_done;
+    }
+    __pyx_t_3 = (__pyx_v_x < ((double)(__pyx_v_n - 2)));
+
+    if (__pyx_t_3) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_3;
+
+      goto __pyx_L111_bool_binop_done;
+    }
+    __pyx_t_3 = (trunc(__pyx_v_x) == __pyx_v_x);
+
+
+    __pyx_t_1 = __pyx_t_3;
+
+    __pyx_L111_bool_binop_done:;
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":731
+ *         x = a[0]
+ *         if x >= 0.0 and x < <double>(n - 2) and c_trunc(x) == x:
+ *             out[0] = a[1 + <int>x]             # <<<<<<<<<<<<<<
+ *             return FOLD_OK
+ *         out[0] = a[n - 1]
+*/
+      (__pyx_v_out[0]) = (__pyx_v_a[(1 + ((int)__pyx_v_x))]);
+
+      /* "sonolus/backend/_opt/kernels.pyx":732
+ *         if x >= 0.0 and x < <double>(n - 2) and c_trunc(x) == x:
+ *             out[0] = a[1 + <int>x]
+ *             return FOLD_OK             # <<<<<<<<<<<<<<
+ *         out[0] = a[n - 1]
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":730
+ *             return FOLD_NOT_CONSTANT
+ *         x = a[0]
+ *         if x >= 0.0 and x < <double>(n - 2) and c_trunc(x) == x:             # <<<<<<<<<<<<<<
+ *             out[0] = a[1 + <int>x]
+ *             return FOLD_OK
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":733
+ *             out[0] = a[1 + <int>x]
+ *             return FOLD_OK
+ *         out[0] = a[n - 1]             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    (__pyx_v_out[0]) = (__pyx_v_a[(__pyx_v_n - 1)]);
+
+    /* "sonolus/backend/_opt/kernels.pyx":734
+ *             return FOLD_OK
+ *         out[0] = a[n - 1]
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ------------------------- arithmetic (binary) -------------------------
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":723
+ *         out[0] = 0.0
+ *         return FOLD_OK
+ *     if op == OP_SwitchIntegerWithDefault:             # <<<<<<<<<<<<<<
+ *         # like SwitchInteger over (n-2) branches, with trailing default a[n-1].
+ *         if n < 2:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":737
+ * 
+ *     # ------------------------- arithmetic (binary) -------------------------
+ *     if op == OP_Add:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Add);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":738
+ *     # ------------------------- arithmetic (binary) -------------------------
+ *     if op == OP_Add:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] + a[1]
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":739
+ *     if op == OP_Add:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = a[0] + a[1]
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":738
+ *     # ------------------------- arithmetic (binary) -------------------------
+ *     if op == OP_Add:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] + a[1]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":740
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] + a[1]             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Subtract:
+*/
+    (__pyx_v_out[0]) = ((__pyx_v_a[0]) + (__pyx_v_a[1]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":741
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] + a[1]
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Subtract:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":737
+ * 
+ *     # ------------------------- arithmetic (binary) -------------------------
+ *     if op == OP_Add:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":742
+ *         out[0] = a[0] + a[1]
+ *         return FOLD_OK
+ *     if op == OP_Subtract:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Subtract);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":743
+ *         return FOLD_OK
+ *     if op == OP_Subtract:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] - a[1]
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":744
+ *     if op == OP_Subtract:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = a[0] - a[1]
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":743
+ *         return FOLD_OK
+ *     if op == OP_Subtract:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] - a[1]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":745
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] - a[1]             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Multiply:
+*/
+    (__pyx_v_out[0]) = ((__pyx_v_a[0]) - (__pyx_v_a[1]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":746
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] - a[1]
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Multiply:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":742
+ *         out[0] = a[0] + a[1]
+ *         return FOLD_OK
+ *     if op == OP_Subtract:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":747
+ *         out[0] = a[0] - a[1]
+ *         return FOLD_OK
+ *     if op == OP_Multiply:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Multiply);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":748
+ *         return FOLD_OK
+ *     if op == OP_Multiply:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] * a[1]
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":749
+ *     if op == OP_Multiply:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = a[0] * a[1]
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":748
+ *         return FOLD_OK
+ *     if op == OP_Multiply:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] * a[1]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":750
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] * a[1]             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Divide:
+*/
+    (__pyx_v_out[0]) = ((__pyx_v_a[0]) * (__pyx_v_a[1]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":751
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] * a[1]
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Divide:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":747
+ *         out[0] = a[0] - a[1]
+ *         return FOLD_OK
+ *     if op == OP_Multiply:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":752
+ *         out[0] = a[0] * a[1]
+ *         return FOLD_OK
+ *     if op == OP_Divide:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Divide);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":753
+ *         return FOLD_OK
+ *     if op == OP_Divide:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":754
+ *     if op == OP_Divide:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         if a[1] == 0.0:
+ *             return FOLD_NOT_CONSTANT  # ZeroDivisionError
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":753
+ *         return FOLD_OK
+ *     if op == OP_Divide:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":755
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT  # ZeroDivisionError
+ *         out[0] = a[0] / a[1]
+*/
+    __pyx_t_1 = ((__pyx_v_a[1]) == 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":756
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:
+ *             return FOLD_NOT_CONSTANT  # ZeroDivisionError             # <<<<<<<<<<<<<<
+ *         out[0] = a[0] / a[1]
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":755
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT  # ZeroDivisionError
+ *         out[0] = a[0] / a[1]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":757
+ *         if a[1] == 0.0:
+ *             return FOLD_NOT_CONSTANT  # ZeroDivisionError
+ *         out[0] = a[0] / a[1]             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Mod:
+*/
+    (__pyx_v_out[0]) = (((double)(__pyx_v_a[0])) / ((double)(__pyx_v_a[1])));
+
+    /* "sonolus/backend/_opt/kernels.pyx":758
+ *             return FOLD_NOT_CONSTANT  # ZeroDivisionError
+ *         out[0] = a[0] / a[1]
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Mod:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":752
+ *         out[0] = a[0] * a[1]
+ *         return FOLD_OK
+ *     if op == OP_Divide:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":759
+ *         out[0] = a[0] / a[1]
+ *         return FOLD_OK
+ *     if op == OP_Mod:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Mod);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":760
+ *         return FOLD_OK
+ *     if op == OP_Mod:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":761
+ *     if op == OP_Mod:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         if a[1] == 0.0:
+ *             return FOLD_NOT_CONSTANT
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":760
+ *         return FOLD_OK
+ *     if op == OP_Mod:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":762
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymod(a[0], a[1])
+*/
+    __pyx_t_1 = ((__pyx_v_a[1]) == 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":763
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = _pymod(a[0], a[1])
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":762
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymod(a[0], a[1])
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":764
+ *         if a[1] == 0.0:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymod(a[0], a[1])             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Rem:
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__pymod((__pyx_v_a[0]), (__pyx_v_a[1]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":765
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymod(a[0], a[1])
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Rem:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":759
+ *         out[0] = a[0] / a[1]
+ *         return FOLD_OK
+ *     if op == OP_Mod:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":766
+ *         out[0] = _pymod(a[0], a[1])
+ *         return FOLD_OK
+ *     if op == OP_Rem:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Rem);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":767
+ *         return FOLD_OK
+ *     if op == OP_Rem:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":768
+ *     if op == OP_Rem:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         if a[1] == 0.0:
+ *             return FOLD_NOT_CONSTANT  # abs(a) % abs(b) with b==0 -> ZeroDivisionError
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":767
+ *         return FOLD_OK
+ *     if op == OP_Rem:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":769
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT  # abs(a) % abs(b) with b==0 -> ZeroDivisionError
+ *         out[0] = copysign(fmod(fabs(a[0]), fabs(a[1])), a[0])
+*/
+    __pyx_t_1 = ((__pyx_v_a[1]) == 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":770
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:
+ *             return FOLD_NOT_CONSTANT  # abs(a) % abs(b) with b==0 -> ZeroDivisionError             # <<<<<<<<<<<<<<
+ *         out[0] = copysign(fmod(fabs(a[0]), fabs(a[1])), a[0])
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":769
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         if a[1] == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT  # abs(a) % abs(b) with b==0 -> ZeroDivisionError
+ *         out[0] = copysign(fmod(fabs(a[0]), fabs(a[1])), a[0])
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":771
+ *         if a[1] == 0.0:
+ *             return FOLD_NOT_CONSTANT  # abs(a) % abs(b) with b==0 -> ZeroDivisionError
+ *         out[0] = copysign(fmod(fabs(a[0]), fabs(a[1])), a[0])             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Power:
+*/
+    (__pyx_v_out[0]) = copysign(fmod(fabs((__pyx_v_a[0])), fabs((__pyx_v_a[1]))), (__pyx_v_a[0]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":772
+ *             return FOLD_NOT_CONSTANT  # abs(a) % abs(b) with b==0 -> ZeroDivisionError
+ *         out[0] = copysign(fmod(fabs(a[0]), fabs(a[1])), a[0])
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Power:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":766
+ *         out[0] = _pymod(a[0], a[1])
+ *         return FOLD_OK
+ *     if op == OP_Rem:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":773
+ *         out[0] = copysign(fmod(fabs(a[0]), fabs(a[1])), a[0])
+ *         return FOLD_OK
+ *     if op == OP_Power:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Power);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":774
+ *         return FOLD_OK
+ *     if op == OP_Power:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _float_pow(a[0], a[1], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":775
+ *     if op == OP_Power:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _float_pow(a[0], a[1], out)
+ * 
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":774
+ *         return FOLD_OK
+ *     if op == OP_Power:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _float_pow(a[0], a[1], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":776
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         return _float_pow(a[0], a[1], out)             # <<<<<<<<<<<<<<
+ * 
+ *     # ------------------------- Max / Min / Arctan2 (binary) -----------------
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__float_pow((__pyx_v_a[0]), (__pyx_v_a[1]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":773
+ *         out[0] = copysign(fmod(fabs(a[0]), fabs(a[1])), a[0])
+ *         return FOLD_OK
+ *     if op == OP_Power:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":779
+ * 
+ *     # ------------------------- Max / Min / Arctan2 (binary) -----------------
+ *     if op == OP_Max:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Max);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":780
+ *     # ------------------------- Max / Min / Arctan2 (binary) -----------------
+ *     if op == OP_Max:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymax2(a[0], a[1])
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":781
+ *     if op == OP_Max:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = _pymax2(a[0], a[1])
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":780
+ *     # ------------------------- Max / Min / Arctan2 (binary) -----------------
+ *     if op == OP_Max:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymax2(a[0], a[1])
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":782
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymax2(a[0], a[1])             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Min:
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__pymax2((__pyx_v_a[0]), (__pyx_v_a[1]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":783
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymax2(a[0], a[1])
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Min:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":779
+ * 
+ *     # ------------------------- Max / Min / Arctan2 (binary) -----------------
+ *     if op == OP_Max:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":784
+ *         out[0] = _pymax2(a[0], a[1])
+ *         return FOLD_OK
+ *     if op == OP_Min:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Min);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":785
+ *         return FOLD_OK
+ *     if op == OP_Min:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymin2(a[0], a[1])
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":786
+ *     if op == OP_Min:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = _pymin2(a[0], a[1])
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":785
+ *         return FOLD_OK
+ *     if op == OP_Min:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymin2(a[0], a[1])
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":787
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymin2(a[0], a[1])             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Arctan2:
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__pymin2((__pyx_v_a[0]), (__pyx_v_a[1]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":788
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _pymin2(a[0], a[1])
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Arctan2:
+ *         if n != 2:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":784
+ *         out[0] = _pymax2(a[0], a[1])
+ *         return FOLD_OK
+ *     if op == OP_Min:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":789
+ *         out[0] = _pymin2(a[0], a[1])
+ *         return FOLD_OK
+ *     if op == OP_Arctan2:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Arctan2);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":790
+ *         return FOLD_OK
+ *     if op == OP_Arctan2:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m2(atan2(a[0], a[1]), a[0], a[1], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 2);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":791
+ *     if op == OP_Arctan2:
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _m2(atan2(a[0], a[1]), a[0], a[1], out)
+ * 
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":790
+ *         return FOLD_OK
+ *     if op == OP_Arctan2:
+ *         if n != 2:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _m2(atan2(a[0], a[1]), a[0], a[1], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":792
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+ *         return _m2(atan2(a[0], a[1]), a[0], a[1], out)             # <<<<<<<<<<<<<<
+ * 
+ *     # ------------------------- ternary -------------------------
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__m2(atan2((__pyx_v_a[0]), (__pyx_v_a[1])), (__pyx_v_a[0]), (__pyx_v_a[1]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":789
+ *         out[0] = _pymin2(a[0], a[1])
+ *         return FOLD_OK
+ *     if op == OP_Arctan2:             # <<<<<<<<<<<<<<
+ *         if n != 2:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":795
+ * 
+ *     # ------------------------- ternary -------------------------
+ *     if op == OP_Clamp:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Clamp);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":796
+ *     # ------------------------- ternary -------------------------
+ *     if op == OP_Clamp:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # max(a, min(b, x)) with x=a[0], a=a[1], b=a[2].
+*/
+    __pyx_t_1 = (__pyx_v_n != 3);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":797
+ *     if op == OP_Clamp:
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         # max(a, min(b, x)) with x=a[0], a=a[1], b=a[2].
+ *         out[0] = _pymax2(a[1], _pymin2(a[2], a[0]))
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":796
+ *     # ------------------------- ternary -------------------------
+ *     if op == OP_Clamp:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # max(a, min(b, x)) with x=a[0], a=a[1], b=a[2].
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":799
+ *             return FOLD_NOT_CONSTANT
+ *         # max(a, min(b, x)) with x=a[0], a=a[1], b=a[2].
+ *         out[0] = _pymax2(a[1], _pymin2(a[2], a[0]))             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Lerp:
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__pymax2((__pyx_v_a[1]), __pyx_f_7sonolus_7backend_4_opt_7kernels__pymin2((__pyx_v_a[2]), (__pyx_v_a[0])));
+
+    /* "sonolus/backend/_opt/kernels.pyx":800
+ *         # max(a, min(b, x)) with x=a[0], a=a[1], b=a[2].
+ *         out[0] = _pymax2(a[1], _pymin2(a[2], a[0]))
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Lerp:
+ *         if n != 3:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":795
+ * 
+ *     # ------------------------- ternary -------------------------
+ *     if op == OP_Clamp:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":801
+ *         out[0] = _pymax2(a[1], _pymin2(a[2], a[0]))
+ *         return FOLD_OK
+ *     if op == OP_Lerp:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Lerp);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":802
+ *         return FOLD_OK
+ *     if op == OP_Lerp:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # x + (y - x) * s
+*/
+    __pyx_t_1 = (__pyx_v_n != 3);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":803
+ *     if op == OP_Lerp:
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         # x + (y - x) * s
+ *         out[0] = a[0] + (a[1] - a[0]) * a[2]
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":802
+ *         return FOLD_OK
+ *     if op == OP_Lerp:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # x + (y - x) * s
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":805
+ *             return FOLD_NOT_CONSTANT
+ *         # x + (y - x) * s
+ *         out[0] = a[0] + (a[1] - a[0]) * a[2]             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_LerpClamped:
+*/
+    (__pyx_v_out[0]) = ((__pyx_v_a[0]) + (((__pyx_v_a[1]) - (__pyx_v_a[0])) * (__pyx_v_a[2])));
+
+    /* "sonolus/backend/_opt/kernels.pyx":806
+ *         # x + (y - x) * s
+ *         out[0] = a[0] + (a[1] - a[0]) * a[2]
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_LerpClamped:
+ *         if n != 3:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":801
+ *         out[0] = _pymax2(a[1], _pymin2(a[2], a[0]))
+ *         return FOLD_OK
+ *     if op == OP_Lerp:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":807
+ *         out[0] = a[0] + (a[1] - a[0]) * a[2]
+ *         return FOLD_OK
+ *     if op == OP_LerpClamped:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_LerpClamped);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":808
+ *         return FOLD_OK
+ *     if op == OP_LerpClamped:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] + (a[1] - a[0]) * _clamp01(a[2])
+*/
+    __pyx_t_1 = (__pyx_v_n != 3);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":809
+ *     if op == OP_LerpClamped:
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = a[0] + (a[1] - a[0]) * _clamp01(a[2])
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":808
+ *         return FOLD_OK
+ *     if op == OP_LerpClamped:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] + (a[1] - a[0]) * _clamp01(a[2])
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":810
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] + (a[1] - a[0]) * _clamp01(a[2])             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_Unlerp:
+*/
+    (__pyx_v_out[0]) = ((__pyx_v_a[0]) + (((__pyx_v_a[1]) - (__pyx_v_a[0])) * __pyx_f_7sonolus_7backend_4_opt_7kernels__clamp01((__pyx_v_a[2]))));
+
+    /* "sonolus/backend/_opt/kernels.pyx":811
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[0] + (a[1] - a[0]) * _clamp01(a[2])
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_Unlerp:
+ *         if n != 3:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":807
+ *         out[0] = a[0] + (a[1] - a[0]) * a[2]
+ *         return FOLD_OK
+ *     if op == OP_LerpClamped:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":812
+ *         out[0] = a[0] + (a[1] - a[0]) * _clamp01(a[2])
+ *         return FOLD_OK
+ *     if op == OP_Unlerp:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Unlerp);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":813
+ *         return FOLD_OK
+ *     if op == OP_Unlerp:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]  # hi - lo
+*/
+    __pyx_t_1 = (__pyx_v_n != 3);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":814
+ *     if op == OP_Unlerp:
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         denom = a[1] - a[0]  # hi - lo
+ *         if denom == 0.0:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":813
+ *         return FOLD_OK
+ *     if op == OP_Unlerp:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]  # hi - lo
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":815
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]  # hi - lo             # <<<<<<<<<<<<<<
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT
+*/
+    __pyx_v_denom = ((__pyx_v_a[1]) - (__pyx_v_a[0]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":816
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]  # hi - lo
+ *         if denom == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = (a[2] - a[0]) / denom
+*/
+    __pyx_t_1 = (__pyx_v_denom == 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":817
+ *         denom = a[1] - a[0]  # hi - lo
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = (a[2] - a[0]) / denom
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":816
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]  # hi - lo
+ *         if denom == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = (a[2] - a[0]) / denom
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":818
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = (a[2] - a[0]) / denom             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_UnlerpClamped:
+*/
+    (__pyx_v_out[0]) = (((__pyx_v_a[2]) - (__pyx_v_a[0])) / __pyx_v_denom);
+
+    /* "sonolus/backend/_opt/kernels.pyx":819
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = (a[2] - a[0]) / denom
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_UnlerpClamped:
+ *         if n != 3:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":812
+ *         out[0] = a[0] + (a[1] - a[0]) * _clamp01(a[2])
+ *         return FOLD_OK
+ *     if op == OP_Unlerp:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":820
+ *         out[0] = (a[2] - a[0]) / denom
+ *         return FOLD_OK
+ *     if op == OP_UnlerpClamped:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_UnlerpClamped);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":821
+ *         return FOLD_OK
+ *     if op == OP_UnlerpClamped:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]
+*/
+    __pyx_t_1 = (__pyx_v_n != 3);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":822
+ *     if op == OP_UnlerpClamped:
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":821
+ *         return FOLD_OK
+ *     if op == OP_UnlerpClamped:
+ *         if n != 3:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":823
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]             # <<<<<<<<<<<<<<
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT
+*/
+    __pyx_v_denom = ((__pyx_v_a[1]) - (__pyx_v_a[0]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":824
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _clamp01((a[2] - a[0]) / denom)
+*/
+    __pyx_t_1 = (__pyx_v_denom == 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":825
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = _clamp01((a[2] - a[0]) / denom)
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":824
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _clamp01((a[2] - a[0]) / denom)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":826
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _clamp01((a[2] - a[0]) / denom)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__clamp01((((__pyx_v_a[2]) - (__pyx_v_a[0])) / __pyx_v_denom));
+
+    /* "sonolus/backend/_opt/kernels.pyx":827
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = _clamp01((a[2] - a[0]) / denom)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ------------------------- 5-ary -------------------------
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":820
+ *         out[0] = (a[2] - a[0]) / denom
+ *         return FOLD_OK
+ *     if op == OP_UnlerpClamped:             # <<<<<<<<<<<<<<
+ *         if n != 3:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":830
+ * 
+ *     # ------------------------- 5-ary -------------------------
+ *     if op == OP_Remap:             # <<<<<<<<<<<<<<
+ *         if n != 5:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Remap);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":831
+ *     # ------------------------- 5-ary -------------------------
+ *     if op == OP_Remap:
+ *         if n != 5:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # from_min a0, from_max a1, to_min a2, to_max a3, value a4
+*/
+    __pyx_t_1 = (__pyx_v_n != 5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":832
+ *     if op == OP_Remap:
+ *         if n != 5:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         # from_min a0, from_max a1, to_min a2, to_max a3, value a4
+ *         denom = a[1] - a[0]
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":831
+ *     # ------------------------- 5-ary -------------------------
+ *     if op == OP_Remap:
+ *         if n != 5:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # from_min a0, from_max a1, to_min a2, to_max a3, value a4
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":834
+ *             return FOLD_NOT_CONSTANT
+ *         # from_min a0, from_max a1, to_min a2, to_max a3, value a4
+ *         denom = a[1] - a[0]             # <<<<<<<<<<<<<<
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT
+*/
+    __pyx_v_denom = ((__pyx_v_a[1]) - (__pyx_v_a[0]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":835
+ *         # from_min a0, from_max a1, to_min a2, to_max a3, value a4
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[2] + (a[3] - a[2]) * (a[4] - a[0]) / denom
+*/
+    __pyx_t_1 = (__pyx_v_denom == 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":836
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = a[2] + (a[3] - a[2]) * (a[4] - a[0]) / denom
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":835
+ *         # from_min a0, from_max a1, to_min a2, to_max a3, value a4
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[2] + (a[3] - a[2]) * (a[4] - a[0]) / denom
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":837
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[2] + (a[3] - a[2]) * (a[4] - a[0]) / denom             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_RemapClamped:
+*/
+    (__pyx_v_out[0]) = ((__pyx_v_a[2]) + ((((__pyx_v_a[3]) - (__pyx_v_a[2])) * ((__pyx_v_a[4]) - (__pyx_v_a[0]))) / __pyx_v_denom));
+
+    /* "sonolus/backend/_opt/kernels.pyx":838
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[2] + (a[3] - a[2]) * (a[4] - a[0]) / denom
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_RemapClamped:
+ *         if n != 5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":830
+ * 
+ *     # ------------------------- 5-ary -------------------------
+ *     if op == OP_Remap:             # <<<<<<<<<<<<<<
+ *         if n != 5:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":839
+ *         out[0] = a[2] + (a[3] - a[2]) * (a[4] - a[0]) / denom
+ *         return FOLD_OK
+ *     if op == OP_RemapClamped:             # <<<<<<<<<<<<<<
+ *         if n != 5:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_RemapClamped);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":840
+ *         return FOLD_OK
+ *     if op == OP_RemapClamped:
+ *         if n != 5:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]
+*/
+    __pyx_t_1 = (__pyx_v_n != 5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":841
+ *     if op == OP_RemapClamped:
+ *         if n != 5:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":840
+ *         return FOLD_OK
+ *     if op == OP_RemapClamped:
+ *         if n != 5:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":842
+ *         if n != 5:
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]             # <<<<<<<<<<<<<<
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT
+*/
+    __pyx_v_denom = ((__pyx_v_a[1]) - (__pyx_v_a[0]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":843
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[2] + (a[3] - a[2]) * _clamp01((a[4] - a[0]) / denom)
+*/
+    __pyx_t_1 = (__pyx_v_denom == 0.0);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":844
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         out[0] = a[2] + (a[3] - a[2]) * _clamp01((a[4] - a[0]) / denom)
+ *         return FOLD_OK
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":843
+ *             return FOLD_NOT_CONSTANT
+ *         denom = a[1] - a[0]
+ *         if denom == 0.0:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[2] + (a[3] - a[2]) * _clamp01((a[4] - a[0]) / denom)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":845
+ *         if denom == 0.0:
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[2] + (a[3] - a[2]) * _clamp01((a[4] - a[0]) / denom)             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ *     if op == OP_JudgeSimple:
+*/
+    (__pyx_v_out[0]) = ((__pyx_v_a[2]) + (((__pyx_v_a[3]) - (__pyx_v_a[2])) * __pyx_f_7sonolus_7backend_4_opt_7kernels__clamp01((((__pyx_v_a[4]) - (__pyx_v_a[0])) / __pyx_v_denom))));
+
+    /* "sonolus/backend/_opt/kernels.pyx":846
+ *             return FOLD_NOT_CONSTANT
+ *         out[0] = a[2] + (a[3] - a[2]) * _clamp01((a[4] - a[0]) / denom)
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ *     if op == OP_JudgeSimple:
+ *         if n != 5:
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":839
+ *         out[0] = a[2] + (a[3] - a[2]) * (a[4] - a[0]) / denom
+ *         return FOLD_OK
+ *     if op == OP_RemapClamped:             # <<<<<<<<<<<<<<
+ *         if n != 5:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":847
+ *         out[0] = a[2] + (a[3] - a[2]) * _clamp01((a[4] - a[0]) / denom)
+ *         return FOLD_OK
+ *     if op == OP_JudgeSimple:             # <<<<<<<<<<<<<<
+ *         if n != 5:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_JudgeSimple);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":848
+ *         return FOLD_OK
+ *     if op == OP_JudgeSimple:
+ *         if n != 5:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # source a0, target a1, max_perfect a2, max_great a3, max_good a4
+*/
+    __pyx_t_1 = (__pyx_v_n != 5);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":849
+ *     if op == OP_JudgeSimple:
+ *         if n != 5:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         # source a0, target a1, max_perfect a2, max_great a3, max_good a4
+ *         out[0] = _judge(a[0] - a[1], -a[2], a[2], -a[3], a[3], -a[4], a[4])
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":848
+ *         return FOLD_OK
+ *     if op == OP_JudgeSimple:
+ *         if n != 5:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # source a0, target a1, max_perfect a2, max_great a3, max_good a4
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":851
+ *             return FOLD_NOT_CONSTANT
+ *         # source a0, target a1, max_perfect a2, max_great a3, max_good a4
+ *         out[0] = _judge(a[0] - a[1], -a[2], a[2], -a[3], a[3], -a[4], a[4])             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__judge(((__pyx_v_a[0]) - (__pyx_v_a[1])), (-(__pyx_v_a[2])), (__pyx_v_a[2]), (-(__pyx_v_a[3])), (__pyx_v_a[3]), (-(__pyx_v_a[4])), (__pyx_v_a[4]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":852
+ *         # source a0, target a1, max_perfect a2, max_great a3, max_good a4
+ *         out[0] = _judge(a[0] - a[1], -a[2], a[2], -a[3], a[3], -a[4], a[4])
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ------------------------- 8-ary -------------------------
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":847
+ *         out[0] = a[2] + (a[3] - a[2]) * _clamp01((a[4] - a[0]) / denom)
+ *         return FOLD_OK
+ *     if op == OP_JudgeSimple:             # <<<<<<<<<<<<<<
+ *         if n != 5:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":855
+ * 
+ *     # ------------------------- 8-ary -------------------------
+ *     if op == OP_Judge:             # <<<<<<<<<<<<<<
+ *         if n != 8:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_v_op == __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_Judge);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":856
+ *     # ------------------------- 8-ary -------------------------
+ *     if op == OP_Judge:
+ *         if n != 8:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # source a0, target a1, then perfect/great/good min/max a2..a7
+*/
+    __pyx_t_1 = (__pyx_v_n != 8);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":857
+ *     if op == OP_Judge:
+ *         if n != 8:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         # source a0, target a1, then perfect/great/good min/max a2..a7
+ *         out[0] = _judge(a[0] - a[1], a[2], a[3], a[4], a[5], a[6], a[7])
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":856
+ *     # ------------------------- 8-ary -------------------------
+ *     if op == OP_Judge:
+ *         if n != 8:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         # source a0, target a1, then perfect/great/good min/max a2..a7
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":859
+ *             return FOLD_NOT_CONSTANT
+ *         # source a0, target a1, then perfect/great/good min/max a2..a7
+ *         out[0] = _judge(a[0] - a[1], a[2], a[3], a[4], a[5], a[6], a[7])             # <<<<<<<<<<<<<<
+ *         return FOLD_OK
+ * 
+*/
+    (__pyx_v_out[0]) = __pyx_f_7sonolus_7backend_4_opt_7kernels__judge(((__pyx_v_a[0]) - (__pyx_v_a[1])), (__pyx_v_a[2]), (__pyx_v_a[3]), (__pyx_v_a[4]), (__pyx_v_a[5]), (__pyx_v_a[6]), (__pyx_v_a[7]));
+
+    /* "sonolus/backend/_opt/kernels.pyx":860
+ *         # source a0, target a1, then perfect/great/good min/max a2..a7
+ *         out[0] = _judge(a[0] - a[1], a[2], a[3], a[4], a[5], a[6], a[7])
+ *         return FOLD_OK             # <<<<<<<<<<<<<<
+ * 
+ *     # ------------------------- Ease* (unary) -------------------------
+*/
+    {
+
+      __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK;
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":855
+ * 
+ *     # ------------------------- 8-ary -------------------------
+ *     if op == OP_Judge:             # <<<<<<<<<<<<<<
+ *         if n != 8:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":863
+ * 
+ *     # ------------------------- Ease* (unary) -------------------------
+ *     if OP_EaseInBack <= op <= OP_EaseOutSine:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  __pyx_t_1 = (__pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseInBack <= __pyx_v_op);
+  if (__pyx_t_1) {
+    __pyx_t_1 = (__pyx_v_op <= __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_EaseOutSine);
+  }
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":864
+ *     # ------------------------- Ease* (unary) -------------------------
+ *     if OP_EaseInBack <= op <= OP_EaseOutSine:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _fold_ease(op, a[0], out)
+*/
+    __pyx_t_1 = (__pyx_v_n != 1);
+
+    if (__pyx_t_1) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":865
+ *     if OP_EaseInBack <= op <= OP_EaseOutSine:
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ *         return _fold_ease(op, a[0], out)
+ * 
+*/
+      {
+
+        __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+      }
+      goto __pyx_L0;
+
+      /* "sonolus/backend/_opt/kernels.pyx":864
+ *     # ------------------------- Ease* (unary) -------------------------
+ *     if OP_EaseInBack <= op <= OP_EaseOutSine:
+ *         if n != 1:             # <<<<<<<<<<<<<<
+ *             return FOLD_NOT_CONSTANT
+ *         return _fold_ease(op, a[0], out)
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":866
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+ *         return _fold_ease(op, a[0], out)             # <<<<<<<<<<<<<<
+ * 
+ *     return FOLD_NOT_CONSTANT
+*/
+    {
+
+      __pyx_r = __pyx_f_7sonolus_7backend_4_opt_7kernels__fold_ease(__pyx_v_op, (__pyx_v_a[0]), __pyx_v_out);
+    }
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":863
+ * 
+ *     # ------------------------- Ease* (unary) -------------------------
+ *     if OP_EaseInBack <= op <= OP_EaseOutSine:             # <<<<<<<<<<<<<<
+ *         if n != 1:
+ *             return FOLD_NOT_CONSTANT
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":868
+ *         return _fold_ease(op, a[0], out)
+ * 
+ *     return FOLD_NOT_CONSTANT             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_NOT_CONSTANT;
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":486
+ * # ==========================================================================
+ * 
+ * cdef int fold_op(uint16_t op, const double* a, int n, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double x, denom, r
+ *     cdef int i
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":880
+ * 
+ * 
+ * def fold(op, args):             # <<<<<<<<<<<<<<
+ *     """Fold ``op`` over constant ``args``; return the double or ``None``.
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_7kernels_1fold(PyObject *__pyx_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_7sonolus_7backend_4_opt_7kernels_fold, "Fold ``op`` over constant ``args``; return the double or ``None``.\n\n    ``op`` may be an `Op`, its name ``str``, or the\n    integer op id. ``None`` == FOLD_NOT_CONSTANT.\n    ");
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_7kernels_1fold = {"fold", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_7kernels_1fold, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7sonolus_7backend_4_opt_7kernels_fold};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_7kernels_1fold(PyObject *__pyx_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_op = 0;
+  PyObject *__pyx_v_args = 0;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("fold (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_op,&__pyx_mstate_global->__pyx_n_u_args,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(0, 880, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 880, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 880, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "fold", 0) < (0)) __PYX_ERR(0, 880, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("fold", 1, 2, 2, i); __PYX_ERR(0, 880, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 880, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 880, __pyx_L3_error)
+    }
+    __pyx_v_op = values[0];
+    __pyx_v_args = values[1];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("fold", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 880, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("sonolus.backend._opt.kernels.fold", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_7kernels_fold(__pyx_self, __pyx_v_op, __pyx_v_args);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_7kernels_fold(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_op, PyObject *__pyx_v_args) {
+  int __pyx_v_op_id;
+  int __pyx_v_n;
+  int __pyx_v_i;
+  int __pyx_v_status;
+  double __pyx_v_stackbuf[16];
+  double *__pyx_v_buf;
+  double __pyx_v_result;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  double __pyx_t_9;
+  char const *__pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("fold", 0);
+
+  /* "sonolus/backend/_opt/kernels.pyx":891
+ *     cdef int status
+ *     cdef double stackbuf[16]
+ *     cdef double* buf = stackbuf             # <<<<<<<<<<<<<<
+ *     cdef double result = 0.0
+ *     if isinstance(op, str):          # Op is a StrEnum, so this catches Op too
+*/
+  __pyx_v_buf = __pyx_v_stackbuf;
+
+  /* "sonolus/backend/_opt/kernels.pyx":892
+ *     cdef double stackbuf[16]
+ *     cdef double* buf = stackbuf
+ *     cdef double result = 0.0             # <<<<<<<<<<<<<<
+ *     if isinstance(op, str):          # Op is a StrEnum, so this catches Op too
+ *         op_id = _OP_IDS[op]
+*/
+  __pyx_v_result = 0.0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":893
+ *     cdef double* buf = stackbuf
+ *     cdef double result = 0.0
+ *     if isinstance(op, str):          # Op is a StrEnum, so this catches Op too             # <<<<<<<<<<<<<<
+ *         op_id = _OP_IDS[op]
+ *     elif isinstance(op, int):
+*/
+  __pyx_t_1 = PyUnicode_Check(__pyx_v_op); 
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":894
+ *     cdef double result = 0.0
+ *     if isinstance(op, str):          # Op is a StrEnum, so this catches Op too
+ *         op_id = _OP_IDS[op]             # <<<<<<<<<<<<<<
+ *     elif isinstance(op, int):
+ *         op_id = op
+*/
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_OP_IDS); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 894, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_t_2, __pyx_v_op); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 894, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_4 = __Pyx_PyLong_As_int(__pyx_t_3); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 894, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_op_id = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/kernels.pyx":893
+ *     cdef double* buf = stackbuf
+ *     cdef double result = 0.0
+ *     if isinstance(op, str):          # Op is a StrEnum, so this catches Op too             # <<<<<<<<<<<<<<
+ *         op_id = _OP_IDS[op]
+ *     elif isinstance(op, int):
+*/
+    goto __pyx_L3;
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":895
+ *     if isinstance(op, str):          # Op is a StrEnum, so this catches Op too
+ *         op_id = _OP_IDS[op]
+ *     elif isinstance(op, int):             # <<<<<<<<<<<<<<
+ *         op_id = op
+ *     else:
+*/
+  __pyx_t_1 = PyLong_Check(__pyx_v_op); 
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":896
+ *         op_id = _OP_IDS[op]
+ *     elif isinstance(op, int):
+ *         op_id = op             # <<<<<<<<<<<<<<
+ *     else:
+ *         op_id = _OP_IDS[op.value]
+*/
+    __pyx_t_4 = __Pyx_PyLong_As_int(__pyx_v_op); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 896, __pyx_L1_error)
+    __pyx_v_op_id = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/kernels.pyx":895
+ *     if isinstance(op, str):          # Op is a StrEnum, so this catches Op too
+ *         op_id = _OP_IDS[op]
+ *     elif isinstance(op, int):             # <<<<<<<<<<<<<<
+ *         op_id = op
+ *     else:
+*/
+    goto __pyx_L3;
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":898
+ *         op_id = op
+ *     else:
+ *         op_id = _OP_IDS[op.value]             # <<<<<<<<<<<<<<
+ *     n = len(args)
+ *     # 16-slot stack fast path; heap-fallback for wider variadic ops (large Switch*)
+*/
+  /*else*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_OP_IDS); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 898, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_op, __pyx_mstate_global->__pyx_n_u_value); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 898, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 898, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_4 = __Pyx_PyLong_As_int(__pyx_t_5); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 898, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_v_op_id = __pyx_t_4;
+  }
+  __pyx_L3:;
+
+  /* "sonolus/backend/_opt/kernels.pyx":899
+ *     else:
+ *         op_id = _OP_IDS[op.value]
+ *     n = len(args)             # <<<<<<<<<<<<<<
+ *     # 16-slot stack fast path; heap-fallback for wider variadic ops (large Switch*)
+ *     # so >16-arg folds are exercisable here just as in the SCCP call site.
+*/
+  __pyx_t_6 = PyObject_Length(__pyx_v_args); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 899, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_6;
+
+  /* "sonolus/backend/_opt/kernels.pyx":902
+ *     # 16-slot stack fast path; heap-fallback for wider variadic ops (large Switch*)
+ *     # so >16-arg folds are exercisable here just as in the SCCP call site.
+ *     if n > 16:             # <<<<<<<<<<<<<<
+ *         buf = <double*>malloc(<size_t>n * sizeof(double))
+ *         if buf == NULL:
+*/
+  __pyx_t_1 = (__pyx_v_n > 16);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":903
+ *     # so >16-arg folds are exercisable here just as in the SCCP call site.
+ *     if n > 16:
+ *         buf = <double*>malloc(<size_t>n * sizeof(double))             # <<<<<<<<<<<<<<
+ *         if buf == NULL:
+ *             raise MemoryError
+*/
+    __pyx_v_buf = ((double *)malloc((((size_t)__pyx_v_n) * (sizeof(double)))));
+
+    /* "sonolus/backend/_opt/kernels.pyx":904
+ *     if n > 16:
+ *         buf = <double*>malloc(<size_t>n * sizeof(double))
+ *         if buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *     try:
+*/
+    __pyx_t_1 = (__pyx_v_buf == NULL);
+
+    if (unlikely(__pyx_t_1)) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":905
+ *         buf = <double*>malloc(<size_t>n * sizeof(double))
+ *         if buf == NULL:
+ *             raise MemoryError             # <<<<<<<<<<<<<<
+ *     try:
+ *         for i in range(n):
+*/
+      PyErr_NoMemory(); __PYX_ERR(0, 905, __pyx_L1_error)
+
+      /* "sonolus/backend/_opt/kernels.pyx":904
+ *     if n > 16:
+ *         buf = <double*>malloc(<size_t>n * sizeof(double))
+ *         if buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *     try:
+*/
+    }
+
+    /* "sonolus/backend/_opt/kernels.pyx":902
+ *     # 16-slot stack fast path; heap-fallback for wider variadic ops (large Switch*)
+ *     # so >16-arg folds are exercisable here just as in the SCCP call site.
+ *     if n > 16:             # <<<<<<<<<<<<<<
+ *         buf = <double*>malloc(<size_t>n * sizeof(double))
+ *         if buf == NULL:
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":906
+ *         if buf == NULL:
+ *             raise MemoryError
+ *     try:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             buf[i] = <double>args[i]
+*/
+  /*try:*/ {
+
+    /* "sonolus/backend/_opt/kernels.pyx":907
+ *             raise MemoryError
+ *     try:
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             buf[i] = <double>args[i]
+ *         with nogil:
+*/
+
+    __pyx_t_4 = __pyx_v_n;
+    __pyx_t_7 = __pyx_t_4;
+
+    for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+      __pyx_v_i = __pyx_t_8;
+
+      /* "sonolus/backend/_opt/kernels.pyx":908
+ *     try:
+ *         for i in range(n):
+ *             buf[i] = <double>args[i]             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             status = fold_op(<uint16_t>op_id, buf, n, &result)
+*/
+      __pyx_t_5 = __Pyx_GetItemInt(__pyx_v_args, __pyx_v_i, int, 1, __Pyx_PyLong_From_int, 0, 0, 1, __Pyx_ReferenceSharing_FunctionArgument); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 908, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_9 = __Pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 908, __pyx_L7_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      (__pyx_v_buf[__pyx_v_i]) = ((double)__pyx_t_9);
+
+    }
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":909
+ *         for i in range(n):
+ *             buf[i] = <double>args[i]
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             status = fold_op(<uint16_t>op_id, buf, n, &result)
+ *     finally:
+*/
+    {
+        PyThreadState * _save;
+        _save = PyEval_SaveThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+
+          /* "sonolus/backend/_opt/kernels.pyx":910
+ *             buf[i] = <double>args[i]
+ *         with nogil:
+ *             status = fold_op(<uint16_t>op_id, buf, n, &result)             # <<<<<<<<<<<<<<
+ *     finally:
+ *         if n > 16:
+*/
+          __pyx_v_status = __pyx_f_7sonolus_7backend_4_opt_7kernels_fold_op(((uint16_t)__pyx_v_op_id), __pyx_v_buf, __pyx_v_n, (&__pyx_v_result));
+        }
+
+        /* "sonolus/backend/_opt/kernels.pyx":909
+ *         for i in range(n):
+ *             buf[i] = <double>args[i]
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             status = fold_op(<uint16_t>op_id, buf, n, &result)
+ *     finally:
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            PyEval_RestoreThread(_save);
+            goto __pyx_L13;
+          }
+          __pyx_L13:;
+        }
+    }
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":912
+ *             status = fold_op(<uint16_t>op_id, buf, n, &result)
+ *     finally:
+ *         if n > 16:             # <<<<<<<<<<<<<<
+ *             free(buf)
+ *     if status == FOLD_OK:
+*/
+  /*finally:*/ {
+    /*normal exit:*/{
+      __pyx_t_1 = (__pyx_v_n > 16);
+
+      if (__pyx_t_1) {
+
+
+        /* "sonolus/backend/_opt/kernels.pyx":913
+ *     finally:
+ *         if n > 16:
+ *             free(buf)             # <<<<<<<<<<<<<<
+ *     if status == FOLD_OK:
+ *         return result
+*/
+        free(__pyx_v_buf);
+
+        /* "sonolus/backend/_opt/kernels.pyx":912
+ *             status = fold_op(<uint16_t>op_id, buf, n, &result)
+ *     finally:
+ *         if n > 16:             # <<<<<<<<<<<<<<
+ *             free(buf)
+ *     if status == FOLD_OK:
+*/
+      }
+      goto __pyx_L8;
+    }
+    __pyx_L7_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+       __Pyx_ExceptionSwap(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16);
+      if ( unlikely(__Pyx_GetException(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13) < 0)) __Pyx_ErrFetch(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __Pyx_XGOTREF(__pyx_t_15);
+      __Pyx_XGOTREF(__pyx_t_16);
+      __pyx_t_4 = __pyx_lineno; __pyx_t_7 = __pyx_clineno; __pyx_t_10 = __pyx_filename;
+      {
+        __pyx_t_1 = (__pyx_v_n > 16);
+
+        if (__pyx_t_1) {
+
+
+          /* "sonolus/backend/_opt/kernels.pyx":913
+ *     finally:
+ *         if n > 16:
+ *             free(buf)             # <<<<<<<<<<<<<<
+ *     if status == FOLD_OK:
+ *         return result
+*/
+          free(__pyx_v_buf);
+
+          /* "sonolus/backend/_opt/kernels.pyx":912
+ *             status = fold_op(<uint16_t>op_id, buf, n, &result)
+ *     finally:
+ *         if n > 16:             # <<<<<<<<<<<<<<
+ *             free(buf)
+ *     if status == FOLD_OK:
+*/
+        }
+      }
+      __Pyx_XGIVEREF(__pyx_t_14);
+      __Pyx_XGIVEREF(__pyx_t_15);
+      __Pyx_XGIVEREF(__pyx_t_16);
+      __Pyx_ExceptionReset(__pyx_t_14, __pyx_t_15, __pyx_t_16);
+      __Pyx_XGIVEREF(__pyx_t_11);
+      __Pyx_XGIVEREF(__pyx_t_12);
+      __Pyx_XGIVEREF(__pyx_t_13);
+      __Pyx_ErrRestore(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+      __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0;
+      __pyx_lineno = __pyx_t_4; __pyx_clineno = __pyx_t_7; __pyx_filename = __pyx_t_10;
+      goto __pyx_L1_error;
+    }
+    __pyx_L8:;
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":914
+ *         if n > 16:
+ *             free(buf)
+ *     if status == FOLD_OK:             # <<<<<<<<<<<<<<
+ *         return result
+ *     return None
+*/
+  __pyx_t_1 = (__pyx_v_status == __pyx_e_7sonolus_7backend_4_opt_7kernels_FOLD_OK);
+
+  if (__pyx_t_1) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":915
+ *             free(buf)
+ *     if status == FOLD_OK:
+ *         return result             # <<<<<<<<<<<<<<
+ *     return None
+ * 
+*/
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_result); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 915, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    {
+      PyObject *__pyx_temp;
+      {
+        __pyx_temp = __pyx_r;
+        __pyx_r = __pyx_t_5;
+      }
+      __Pyx_XDECREF(__pyx_temp);
+    }
+    __pyx_t_5 = 0;
+    goto __pyx_L0;
+
+    /* "sonolus/backend/_opt/kernels.pyx":914
+ *         if n > 16:
+ *             free(buf)
+ *     if status == FOLD_OK:             # <<<<<<<<<<<<<<
+ *         return result
+ *     return None
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":916
+ *     if status == FOLD_OK:
+ *         return result
+ *     return None             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":880
+ * 
+ * 
+ * def fold(op, args):             # <<<<<<<<<<<<<<
+ *     """Fold ``op`` over constant ``args``; return the double or ``None``.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("sonolus.backend._opt.kernels.fold", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+
+
+
+
+
+
+
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":919
+ * 
+ * 
+ * def is_op_foldable(int op_id):             # <<<<<<<<<<<<<<
+ *     """Whether op id ``op_id`` is marked FOLDABLE in the generated table."""
+ *     if op_id < 0 or op_id >= OP_TABLE_SIZE:
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_7kernels_3is_op_foldable(PyObject *__pyx_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_7sonolus_7backend_4_opt_7kernels_2is_op_foldable, "Whether op id ``op_id`` is marked FOLDABLE in the generated table.");
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_7kernels_3is_op_foldable = {"is_op_foldable", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7sonolus_7backend_4_opt_7kernels_3is_op_foldable, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7sonolus_7backend_4_opt_7kernels_2is_op_foldable};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_7kernels_3is_op_foldable(PyObject *__pyx_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  int __pyx_v_op_id;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_op_foldable (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_op_id,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(0, 919, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 919, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "is_op_foldable", 0) < (0)) __PYX_ERR(0, 919, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("is_op_foldable", 1, 1, 1, i); __PYX_ERR(0, 919, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 919, __pyx_L3_error)
+    }
+    __pyx_v_op_id = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_op_id == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 919, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("is_op_foldable", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 919, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("sonolus.backend._opt.kernels.is_op_foldable", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_7kernels_2is_op_foldable(__pyx_self, __pyx_v_op_id);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_7kernels_2is_op_foldable(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_op_id) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  size_t __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("is_op_foldable", 0);
+
+  /* "sonolus/backend/_opt/kernels.pyx":921
+ * def is_op_foldable(int op_id):
+ *     """Whether op id ``op_id`` is marked FOLDABLE in the generated table."""
+ *     if op_id < 0 or op_id >= OP_TABLE_SIZE:             # <<<<<<<<<<<<<<
+ *         raise IndexError("Op id out of range")
+ *     return SONOLUS_OP_FOLDABLE[op_id] != 0
+*/
+  __pyx_t_2 = (__pyx_v_op_id < 0);
+
+  if (!__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_op_id >= __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TABLE_SIZE);
+
+
+  __pyx_t_1 = __pyx_t_2;
+
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_1)) {
+
+
+    /* "sonolus/backend/_opt/kernels.pyx":922
+ *     """Whether op id ``op_id`` is marked FOLDABLE in the generated table."""
+ *     if op_id < 0 or op_id >= OP_TABLE_SIZE:
+ *         raise IndexError("Op id out of range")             # <<<<<<<<<<<<<<
+ *     return SONOLUS_OP_FOLDABLE[op_id] != 0
+ * 
+*/
+    __pyx_t_4 = NULL;
+    __pyx_t_5 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_kp_u_Op_id_out_of_range};
+      __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_IndexError)), __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 922, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 922, __pyx_L1_error)
+
+    /* "sonolus/backend/_opt/kernels.pyx":921
+ * def is_op_foldable(int op_id):
+ *     """Whether op id ``op_id`` is marked FOLDABLE in the generated table."""
+ *     if op_id < 0 or op_id >= OP_TABLE_SIZE:             # <<<<<<<<<<<<<<
+ *         raise IndexError("Op id out of range")
+ *     return SONOLUS_OP_FOLDABLE[op_id] != 0
+*/
+  }
+
+  /* "sonolus/backend/_opt/kernels.pyx":923
+ *     if op_id < 0 or op_id >= OP_TABLE_SIZE:
+ *         raise IndexError("Op id out of range")
+ *     return SONOLUS_OP_FOLDABLE[op_id] != 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_3 = __Pyx_PyBool_FromLong(((SONOLUS_OP_FOLDABLE[__pyx_v_op_id]) != 0)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 923, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_3;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":919
+ * 
+ * 
+ * def is_op_foldable(int op_id):             # <<<<<<<<<<<<<<
+ *     """Whether op id ``op_id`` is marked FOLDABLE in the generated table."""
+ *     if op_id < 0 or op_id >= OP_TABLE_SIZE:
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("sonolus.backend._opt.kernels.is_op_foldable", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sonolus/backend/_opt/kernels.pyx":926
+ * 
+ * 
+ * def foldable_op_ids():             # <<<<<<<<<<<<<<
+ *     """Sorted list of op ids marked FOLDABLE in the compiled static table."""
+ *     cdef int i
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_7kernels_5foldable_op_ids(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+PyDoc_STRVAR(__pyx_doc_7sonolus_7backend_4_opt_7kernels_4foldable_op_ids, "Sorted list of op ids marked FOLDABLE in the compiled static table.");
+static PyMethodDef __pyx_mdef_7sonolus_7backend_4_opt_7kernels_5foldable_op_ids = {"foldable_op_ids", (PyCFunction)__pyx_pw_7sonolus_7backend_4_opt_7kernels_5foldable_op_ids, METH_NOARGS, __pyx_doc_7sonolus_7backend_4_opt_7kernels_4foldable_op_ids};
+static PyObject *__pyx_pw_7sonolus_7backend_4_opt_7kernels_5foldable_op_ids(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("foldable_op_ids (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_7sonolus_7backend_4_opt_7kernels_4foldable_op_ids(__pyx_self);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7sonolus_7backend_4_opt_7kernels_4foldable_op_ids(CYTHON_UNUSED PyObject *__pyx_self) {
+  int __pyx_v_i;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("foldable_op_ids", 0);
+
+  /* "sonolus/backend/_opt/kernels.pyx":929
+ *     """Sorted list of op ids marked FOLDABLE in the compiled static table."""
+ *     cdef int i
+ *     result = []             # <<<<<<<<<<<<<<
+ *     for i in range(OP_TABLE_SIZE):
+ *         if SONOLUS_OP_FOLDABLE[i] != 0:
+*/
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 929, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_result = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":930
+ *     cdef int i
+ *     result = []
+ *     for i in range(OP_TABLE_SIZE):             # <<<<<<<<<<<<<<
+ *         if SONOLUS_OP_FOLDABLE[i] != 0:
+ *             result.append(i)
+*/
+
+  __pyx_t_2 = __pyx_e_7sonolus_7backend_4_opt_8_ops_gen_OP_TABLE_SIZE;
+  __pyx_t_3 = __pyx_t_2;
+
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "sonolus/backend/_opt/kernels.pyx":931
+ *     result = []
+ *     for i in range(OP_TABLE_SIZE):
+ *         if SONOLUS_OP_FOLDABLE[i] != 0:             # <<<<<<<<<<<<<<
+ *             result.append(i)
+ *     return result
+*/
+    __pyx_t_5 = ((SONOLUS_OP_FOLDABLE[__pyx_v_i]) != 0);
+
+    if (__pyx_t_5) {
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":932
+ *     for i in range(OP_TABLE_SIZE):
+ *         if SONOLUS_OP_FOLDABLE[i] != 0:
+ *             result.append(i)             # <<<<<<<<<<<<<<
+ *     return result
+*/
+      __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_i); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 932, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_result, __pyx_t_1); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 932, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+
+      /* "sonolus/backend/_opt/kernels.pyx":931
+ *     result = []
+ *     for i in range(OP_TABLE_SIZE):
+ *         if SONOLUS_OP_FOLDABLE[i] != 0:             # <<<<<<<<<<<<<<
+ *             result.append(i)
+ *     return result
+*/
+    }
+  }
+
+
+  /* "sonolus/backend/_opt/kernels.pyx":933
+ *         if SONOLUS_OP_FOLDABLE[i] != 0:
+ *             result.append(i)
+ *     return result             # <<<<<<<<<<<<<<
+*/
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __Pyx_INCREF(__pyx_v_result);
+      __pyx_r = __pyx_v_result;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  goto __pyx_L0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":926
+ * 
+ * 
+ * def foldable_op_ids():             # <<<<<<<<<<<<<<
+ *     """Sorted list of op ids marked FOLDABLE in the compiled static table."""
+ *     cdef int i
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("sonolus.backend._opt.kernels.foldable_op_ids", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+/* #### Code section: module_exttypes ### */
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+/* #### Code section: initfunc_declarations ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitAfterSharedUtility(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
+/* #### Code section: init_module ### */
+
+static int __Pyx_modinit_Global_init_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Global_init_code", 0);
+  /*--- Global init code ---*/
+  __pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_i = Py_None; Py_INCREF(Py_None);
+  __pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_op = Py_None; Py_INCREF(Py_None);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Variable_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Function_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Function_export_code", 0);
+  /*--- Function export code ---*/
+  {
+    __pyx_t_1 = __Pyx_ApiExport_GetApiDict(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    const char * __pyx_export_signature = __Pyx_PyBytes_AsString(__pyx_mstate_global->__pyx_kp_b_int_uint16_t_double_const_int_do);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (unlikely(!__pyx_export_signature)) __PYX_ERR(0, 1, __pyx_L1_error)
+    #endif
+    const char * __pyx_export_name = __pyx_export_signature + 46;
+    void (*const __pyx_export_pointers[])(void) = {(void (*)(void))&__pyx_f_7sonolus_7backend_4_opt_7kernels_fold_op, (void (*)(void)) NULL};
+    void (*const *__pyx_export_pointer)(void) = __pyx_export_pointers;
+    const char *__pyx_export_current_signature = __pyx_export_signature;
+    while (*__pyx_export_pointer) {
+      if (__Pyx_ExportFunction(__pyx_t_1, __pyx_export_name, *__pyx_export_pointer, __pyx_export_current_signature) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+      ++__pyx_export_pointer;
+      __pyx_export_name = strchr(__pyx_export_name, '\0') + 1;
+      __pyx_export_signature = strchr(__pyx_export_signature, '\0') + 1;
+      if (*__pyx_export_signature != '\0') __pyx_export_current_signature = __pyx_export_signature;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_Type_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Type_import_code", 0);
+  /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Variable_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Function_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_kernels(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_kernels},
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  {Py_mod_gil, __Pyx_FREETHREADING_COMPATIBLE},
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000 && CYTHON_USE_MODULE_STATE
+  {Py_mod_multiple_interpreters, Py_MOD_MULTIPLE_INTERPRETERS_NOT_SUPPORTED},
+  #endif
+  {0, NULL}
+};
+#endif
+
+#ifdef __cplusplus
+namespace {
+  struct PyModuleDef __pyx_moduledef =
+  #else
+  static struct PyModuleDef __pyx_moduledef =
+  #endif
+  {
+      PyModuleDef_HEAD_INIT,
+      "kernels",
+      __pyx_k_Constant_fold_kernels_C_double_e, /* m_doc */
+    #if CYTHON_USE_MODULE_STATE
+      sizeof(__pyx_mstatetype), /* m_size */
+    #else
+      (CYTHON_PEP489_MULTI_PHASE_INIT) ? 0 : -1, /* m_size */
+    #endif
+      __pyx_methods /* m_methods */,
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      __pyx_moduledef_slots, /* m_slots */
+    #else
+      NULL, /* m_reload */
+    #endif
+    #if CYTHON_USE_MODULE_STATE
+      __pyx_m_traverse, /* m_traverse */
+      __pyx_m_clear, /* m_clear */
+      NULL /* m_free */
+    #else
+      NULL, /* m_traverse */
+      NULL, /* m_clear */
+      NULL /* m_free */
+    #endif
+  };
+  #ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+
+/* PyModInitFuncType */
+#ifndef CYTHON_NO_PYINIT_EXPORT
+  #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#else
+  #ifdef __cplusplus
+  #define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+  #else
+  #define __Pyx_PyMODINIT_FUNC PyObject *
+  #endif
+#endif
+
+__Pyx_PyMODINIT_FUNC PyInit_kernels(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_kernels(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+/* ModuleCreationPEP489 */
+#if CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x030A0000 &&\
+      (defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)))
+static PY_INT64_T __Pyx_GetCurrentInterpreterId(void) {
+    {
+        PyObject *module = PyImport_ImportModule("_interpreters"); // 3.13+ I think
+        if (!module) {
+            if (!PyErr_ExceptionMatches(PyExc_Exception)) {
+                goto bad; // BaseException
+            }
+            PyErr_Clear(); // just try the 3.8-3.12 version
+            module = PyImport_ImportModule("_xxsubinterpreters");
+            if (!module) goto bad;
+        }
+        PyObject *current = PyObject_CallMethod(module, "get_current", NULL);
+        Py_DECREF(module);
+        if (!current) goto bad;
+        if (PyTuple_Check(current)) {
+            PyObject *new_current = PySequence_GetItem(current, 0);
+            Py_DECREF(current);
+            current = new_current;
+            if (!new_current) goto bad;
+        }
+        long long as_c_int = PyLong_AsLongLong(current);
+        Py_DECREF(current);
+        return as_c_int;
+    }
+  bad:
+    PySys_WriteStderr("__Pyx_GetCurrentInterpreterId failed. Try setting the C define CYTHON_PEP489_MULTI_PHASE_INIT=0\n");
+    return -1;
+}
+#endif
+#if !CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    static PY_INT64_T main_interpreter_id = -1;
+#if CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+    PY_INT64_T current_id = GraalPyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_GRAAL
+    PY_INT64_T current_id = PyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x030A0000 &&\
+      (defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)))
+    PY_INT64_T current_id = __Pyx_GetCurrentInterpreterId();
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+#else
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+#endif
+    if (unlikely(current_id == -1)) {
+        return -1;
+    }
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return 0;
+    } else if (unlikely(main_interpreter_id != current_id)) {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+#endif
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
+{
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    CYTHON_UNUSED_VAR(def);
+    #if !CYTHON_USE_MODULE_STATE
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    #endif
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_kernels(PyObject *__pyx_pyinit_module)
+#endif
+{
+  int stringtab_initialized = 0;
+  #if CYTHON_USE_MODULE_STATE
+  int pystate_addmodule_run = 0;
+  #endif
+  __pyx_mstatetype *__pyx_mstate = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *(*__pyx_t_7)(PyObject *);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'kernels' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #else
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_t_1 = __pyx_pyinit_module;
+  Py_INCREF(__pyx_t_1);
+  #else
+  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  {
+    int add_module_result = __Pyx_State_AddModule(__pyx_t_1, &__pyx_moduledef);
+    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "kernels" pseudovariable */
+    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    pystate_addmodule_run = 1;
+  }
+  #else
+  __pyx_m = __pyx_t_1;
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  PyUnstable_Module_SetGIL(__pyx_m, Py_MOD_GIL_USED);
+  #endif
+  __pyx_mstate = __pyx_mstate_global;
+  CYTHON_UNUSED_VAR(__pyx_t_1);
+  __pyx_mstate->__pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_mstate->__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_mstate->__pyx_d);
+  __pyx_mstate->__pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_mstate->__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_cython_runtime = __Pyx_PyImport_AddModuleRef("cython_runtime"); if (unlikely(!__pyx_mstate->__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_mstate->__pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /* ImportRefnannyAPI */
+  #if CYTHON_REFNANNY
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+  if (!__Pyx_RefNanny) {
+    if (PyErr_ExceptionMatches(PyExc_Exception)) {
+      PyErr_Clear();
+      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+    }
+    if (!__Pyx_RefNanny)
+        Py_FatalError("failed to import 'refnanny' module");
+  }
+  #endif
+  
+__Pyx_RefNannySetupContext("PyInit_kernels", 0);
+  __Pyx_init_runtime_version();
+  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_mstate->__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Library function declarations ---*/
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  stringtab_initialized = 1;
+  if (__Pyx_InitGlobals() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_module_is_main_sonolus__backend___opt__kernels) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_name, __pyx_mstate_global->__pyx_n_u_main) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "sonolus.backend._opt.kernels")) {
+      if (unlikely((PyDict_SetItemString(modules, "sonolus.backend._opt.kernels", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_CreateCodeObjects(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_Global_init_code(__pyx_mstate);
+  (void)__Pyx_modinit_Variable_export_code(__pyx_mstate);
+  if (unlikely((__Pyx_modinit_Function_export_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Type init code ---*/
+  (void)__Pyx_modinit_Type_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_Variable_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_Function_import_code(__pyx_mstate);
+  if (__Pyx_InitAfterSharedUtility() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Execution code ---*/
+
+  /* "sonolus/backend/_opt/kernels.pyx":875
+ * # ==========================================================================
+ * 
+ * from sonolus.backend.ops import Op as _Op             # <<<<<<<<<<<<<<
+ * 
+ * _OP_IDS = {op.value: i for i, op in enumerate(_Op)}
+*/
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_Op};
+    __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_sonolus_backend_ops, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 875, __pyx_L1_error)
+  }
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_Op};
+    __pyx_t_3 = 0; {
+      __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_2, __pyx_imported_names[__pyx_t_3]); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 875, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      switch (__pyx_t_3) {
+        case 0:
+        if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_Op_2, __pyx_t_4) < (0)) __PYX_ERR(0, 875, __pyx_L1_error)
+        break;
+        default:;
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":877
+ * from sonolus.backend.ops import Op as _Op
+ * 
+ * _OP_IDS = {op.value: i for i, op in enumerate(_Op)}             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  { /* enter inner scope */
+    __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 877, __pyx_L4_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_mstate_global->__pyx_int_0);
+    __pyx_t_4 = __pyx_mstate_global->__pyx_int_0;
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_Op_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 877, __pyx_L4_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
+      __pyx_t_6 = __pyx_t_5; __Pyx_INCREF(__pyx_t_6);
+      __pyx_t_3 = 0;
+      __pyx_t_7 = NULL;
+    } else {
+      __pyx_t_3 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 877, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 877, __pyx_L4_error)
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_7)) {
+        if (likely(PyList_CheckExact(__pyx_t_6))) {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_6);
+            #if !CYTHON_ASSUME_SAFE_SIZE
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 877, __pyx_L4_error)
+            #endif
+            if (__pyx_t_3 >= __pyx_temp) break;
+          }
+          __pyx_t_5 = __Pyx_PyList_GET_ITEM_REF(__pyx_t_6, __pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference);
+          ++__pyx_t_3;
+        } else {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_6);
+            #if !CYTHON_ASSUME_SAFE_SIZE
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 877, __pyx_L4_error)
+            #endif
+            if (__pyx_t_3 >= __pyx_temp) break;
+          }
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_3));
+          #else
+          __pyx_t_5 = __Pyx_PySequence_ITEM(__pyx_t_6, __pyx_t_3);
+          #endif
+          ++__pyx_t_3;
+        }
+        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 877, __pyx_L4_error)
+      } else {
+        __pyx_t_5 = __pyx_t_7(__pyx_t_6);
+        if (unlikely(!__pyx_t_5)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 877, __pyx_L4_error)
+            PyErr_Clear();
+          }
+          break;
+        }
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_XGOTREF(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_op);
+      __Pyx_DECREF_SET(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_op, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_5);
+      __pyx_t_5 = 0;
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_XGOTREF(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_i);
+      __Pyx_DECREF_SET(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_i, __pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_4);
+      __pyx_t_5 = __Pyx_PyLong_AddObjC(__pyx_t_4, __pyx_mstate_global->__pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 877, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4);
+      __pyx_t_4 = __pyx_t_5;
+      __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_op, __pyx_mstate_global->__pyx_n_u_value); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 877, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(PyDict_SetItem(__pyx_t_2, __pyx_t_5, __pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_i))) __PYX_ERR(0, 877, __pyx_L4_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_i);
+    __Pyx_DECREF_SET(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_i, Py_None);
+    __Pyx_GOTREF(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_op);
+    __Pyx_DECREF_SET(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_op, Py_None);
+    goto __pyx_L8_exit_scope;
+    __pyx_L4_error:;
+    __Pyx_GOTREF(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_i);
+    __Pyx_DECREF_SET(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_i, Py_None);
+    __Pyx_GOTREF(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_op);
+    __Pyx_DECREF_SET(__pyx_7genexpr__pyx_v_7sonolus_7backend_4_opt_7kernels_op, Py_None);
+    goto __pyx_L1_error;
+    __pyx_L8_exit_scope:;
+  } /* exit inner scope */
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_OP_IDS, __pyx_t_2) < (0)) __PYX_ERR(0, 877, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":880
+ * 
+ * 
+ * def fold(op, args):             # <<<<<<<<<<<<<<
+ *     """Fold ``op`` over constant ``args``; return the double or ``None``.
+ * 
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_7kernels_1fold, 0, __pyx_mstate_global->__pyx_n_u_fold, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_kernels, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 880, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_fold, __pyx_t_2) < (0)) __PYX_ERR(0, 880, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":919
+ * 
+ * 
+ * def is_op_foldable(int op_id):             # <<<<<<<<<<<<<<
+ *     """Whether op id ``op_id`` is marked FOLDABLE in the generated table."""
+ *     if op_id < 0 or op_id >= OP_TABLE_SIZE:
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_7kernels_3is_op_foldable, 0, __pyx_mstate_global->__pyx_n_u_is_op_foldable, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_kernels, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 919, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_is_op_foldable, __pyx_t_2) < (0)) __PYX_ERR(0, 919, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":926
+ * 
+ * 
+ * def foldable_op_ids():             # <<<<<<<<<<<<<<
+ *     """Sorted list of op ids marked FOLDABLE in the compiled static table."""
+ *     cdef int i
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7sonolus_7backend_4_opt_7kernels_5foldable_op_ids, 0, __pyx_mstate_global->__pyx_n_u_foldable_op_ids, NULL, __pyx_mstate_global->__pyx_n_u_sonolus_backend__opt_kernels, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 926, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_foldable_op_ids, __pyx_t_2) < (0)) __PYX_ERR(0, 926, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sonolus/backend/_opt/kernels.pyx":1
+ * # cython: language_level=3             # <<<<<<<<<<<<<<
+ * """Constant-fold kernels: C-double evaluation of every foldable op.
+ * 
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_2) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  if (__pyx_m) {
+    if (__pyx_mstate->__pyx_d && stringtab_initialized) {
+      __Pyx_AddTraceback("init sonolus.backend._opt.kernels", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    #if !CYTHON_USE_MODULE_STATE
+    Py_CLEAR(__pyx_m);
+    #else
+    Py_DECREF(__pyx_m);
+    if (pystate_addmodule_run) {
+      PyObject *tp, *value, *tb;
+      __Pyx_PyErr_FetchException(&tp, &value, &tb);
+      __Pyx_State_RemoveModule(&__pyx_moduledef);
+      __Pyx_PyErr_RestoreException(tp, value, tb);
+    }
+    #endif
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init sonolus.backend._opt.kernels");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #else
+  return __pyx_m;
+  #endif
+}
+/* #### Code section: pystring_table ### */
+/* #### Code section: cached_builtins ### */
+
+static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 877, __pyx_L1_error)
+
+  /* Cached unbound methods */
+  __pyx_mstate->__pyx_umethod_PyDict_Type_items.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_items.method_name = &__pyx_mstate->__pyx_n_u_items;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_pop.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_pop.method_name = &__pyx_mstate->__pyx_n_u_pop;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_values.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_values.method_name = &__pyx_mstate->__pyx_n_u_values;
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: cached_constants ### */
+
+static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+/* #### Code section: init_constants ### */
+
+static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  {
+    const struct { const unsigned int length: 6; } str_length_index[] = {{1},{1},{18},{32},{2},{7},{3},{20},{12},{17},{8},{8},{10},{8},{12},{12},{8},{13},{4},{18},{3},{18},{9},{4},{15},{1},{14},{5},{1},{2},{5},{3},{6},{10},{28},{19},{8},{6},{5},{6}};
+    const struct { const unsigned int length: 8; } bytes_length_index[] = {{53},{42},{48},{194}};
+    /* compression: none (719 bytes) */
+static const char bytes[] = ".?Op id out of rangesonolus/backend/_opt/kernels.pyxOp_OP_IDS_Op__Pyx_PyDict_NextRef__annotate____class_getitem____func____main____module____name____pyx_capi____qualname____test___is_coroutineargsasyncio.coroutinesbufcline_in_tracebackenumeratefoldfoldable_op_idsiis_op_foldableitemsnopop_idpopresultsetdefaultsonolus.backend._opt.kernelssonolus.backend.opsstackbufstatusvaluevaluesint (uint16_t, double const *, int, double *)\000fold_op\200\001\340\004\007\200v\210R\210r\220\023\220F\230#\230Q\330\010\016\210j\230\001\230\021\330\004\013\320\013\036\230a\230w\240c\250\021\200\001\360\006\000\005\016\210Q\330\004\010\210\005\210U\220!\2201\330\010\013\320\013\036\230a\230s\240#\240Q\330\014\022\220\047\230\021\230!\330\004\013\2101\200\001\360\026\000\005\030\220q\330\004\031\230\021\330\004\007\200z\220\021\220$\220a\330\010\020\220\007\220q\230\001\330\t\023\2201\220D\230\001\330\010\020\220\001\340\010\020\220\007\220q\230\002\230!\330\004\010\210\003\2101\210A\360\006\000\005\010\200r\210\022\2101\330\010\016\210i\220v\230Q\230h\240b\250\002\250!\330\010\013\2104\210s\220!\330\014\r\330\004\005\330\010\014\210E\220\025\220a\220q\330\014\017\210q\220\005\220X\230T\240\021\240!\330\r\016\330\014\025\220W\230A\230Z\240w\250e\2603\260a\260q\340\010\013\2102\210R\210q\330\014\020\220\001\220\021\330\004\007\200w\210c\220\021\330\010\017\210q\330\004\013\2101";
+    PyObject *data = NULL;
+    PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
+    Py_ssize_t pos = 0;
+    for (int i = 0; i < 40; i++) {
+      Py_ssize_t bytes_length = str_length_index[i].length;
+      PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
+      if (likely(string) && i >= 4) PyUnicode_InternInPlace(&string);
+      if (unlikely(!string)) {
+        Py_XDECREF(data);
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+      stringtab[i] = string;
+      pos += bytes_length;
+    }
+    for (int i = 40; i < 44; i++) {
+      Py_ssize_t bytes_length = bytes_length_index[i-40].length;
+      PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
+      stringtab[i] = string;
+      pos += bytes_length;
+      if (unlikely(!string)) {
+        Py_XDECREF(data);
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+    }
+    Py_XDECREF(data);
+    for (Py_ssize_t i = 0; i < 44; i++) {
+      if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+    }
+    #if CYTHON_IMMORTAL_CONSTANTS
+    {
+      PyObject **table = stringtab + 40;
+      for (Py_ssize_t i=0; i<4; ++i) {
+        #if PY_VERSION_HEX >= 0x030F0000
+        PyUnstable_SetImmortal(table[i]);
+        #elif CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+        if ((PY_SSIZE_T_MAX <= _Py_IMMORTAL_REFCNT_LOCAL)) break;
+        #if PY_VERSION_HEX < 0x030E0000
+        if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
+        #else
+        if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
+        #endif
+        {
+          Py_SET_REFCNT(table[i], ((Py_ssize_t)_Py_IMMORTAL_REFCNT_LOCAL + 1));
+        }
+        #else
+        if ((PY_SSIZE_T_MAX < _Py_IMMORTAL_INITIAL_REFCNT)) break;
+        Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
+        #endif
+      }
+    }
+    #endif
+  }
+  {
+    PyObject **numbertab = __pyx_mstate->__pyx_number_tab + 0;
+    int8_t const cint_constants_1[] = {0,1};
+    for (int i = 0; i < 2; i++) {
+      numbertab[i] = PyLong_FromLong(cint_constants_1[i - 0]);
+      if (unlikely(!numbertab[i])) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #if CYTHON_IMMORTAL_CONSTANTS
+  {
+    PyObject **table = __pyx_mstate->__pyx_number_tab;
+    for (Py_ssize_t i=0; i<2; ++i) {
+      #if PY_VERSION_HEX >= 0x030F0000
+      PyUnstable_SetImmortal(table[i]);
+      #elif CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+      if ((PY_SSIZE_T_MAX <= _Py_IMMORTAL_REFCNT_LOCAL)) break;
+      #if PY_VERSION_HEX < 0x030E0000
+      if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
+      #else
+      if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
+      #endif
+      {
+        Py_SET_REFCNT(table[i], ((Py_ssize_t)_Py_IMMORTAL_REFCNT_LOCAL + 1));
+      }
+      #else
+      if ((PY_SSIZE_T_MAX < _Py_IMMORTAL_INITIAL_REFCNT)) break;
+      Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
+      #endif
+    }
+  }
+  #endif
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_codeobjects ### */
+#ifdef __cplusplus
+namespace {
+#endif
+typedef struct {
+    unsigned int argcount : 2;
+    unsigned int num_posonly_args : 1;
+    unsigned int num_kwonly_args : 1;
+    unsigned int nlocals : 4;
+    unsigned int flags : 10;
+    unsigned int first_line : 10;
+} __Pyx_PyCode_New_function_description;
+#ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+/* NewCodeObj.proto */
+static PyObject* __Pyx_PyCode_New(
+        const __Pyx_PyCode_New_function_description descr,
+        PyObject * const *varnames,
+        PyObject *filename,
+        PyObject *funcname,
+        PyObject *line_table,
+        PyObject *tuple_dedup_map
+);
+
+
+static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
+  PyObject* tuple_dedup_map = PyDict_New();
+  if (unlikely(!tuple_dedup_map)) return -1;
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 9, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 880};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_op, __pyx_mstate->__pyx_n_u_args, __pyx_mstate->__pyx_n_u_op_id, __pyx_mstate->__pyx_n_u_n, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_status, __pyx_mstate->__pyx_n_u_stackbuf, __pyx_mstate->__pyx_n_u_buf, __pyx_mstate->__pyx_n_u_result};
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_kernels_pyx, __pyx_mstate->__pyx_n_u_fold, __pyx_mstate->__pyx_kp_b_iso88591_q_z_a_q_1D_q_1A_r_1_ivQhb_4s_E, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 919};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_op_id};
+    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_kernels_pyx, __pyx_mstate->__pyx_n_u_is_op_foldable, __pyx_mstate->__pyx_kp_b_iso88591_vRr_F_Q_j_awc, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 926};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_result};
+    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_sonolus_backend__opt_kernels_pyx, __pyx_mstate->__pyx_n_u_foldable_op_ids, __pyx_mstate->__pyx_kp_b_iso88591_Q_U_1_as_Q_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+  }
+  Py_DECREF(tuple_dedup_map);
+  return 0;
+  bad:
+  Py_DECREF(tuple_dedup_map);
+  return -1;
+}
+/* #### Code section: init_globals ### */
+
+static int __Pyx_InitGlobals(void) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  /* PythonCompatibility.init */
+  if (likely(__Pyx_init_co_variables() == 0 && __Pyx_init_tpflags_variables() == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* PyFrozenDict.init */
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  {
+      PyObject *builtins = PyEval_GetBuiltins(); // borrowed
+      if (likely(builtins)) {
+          PyObject *type_name = PyUnicode_FromStringAndSize("frozendict", sizeof("frozendict")-1);
+          if (likely(type_name)) {
+              PyObject *frozendict_type = PyObject_GetItem(builtins, type_name);
+              Py_DECREF(type_name);
+              if (!frozendict_type && PyErr_ExceptionMatches(PyExc_KeyError)) {
+                  PyErr_Clear();
+                  frozendict_type = (PyObject*) &PyDict_Type;
+                  Py_INCREF(frozendict_type);
+              }
+              __pyx_mstate_global->__Pyx_PyFrozenDictType = frozendict_type;
+          }
+      }
+  } // error handling follows
+  #endif
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* CommonTypesMetaclass.init */
+  if (likely(__pyx_CommonTypesMetaclass_init(__pyx_m) == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* CachedMethodType.init */
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  {
+      PyObject *typesModule=NULL;
+      typesModule = PyImport_ImportModule("types");
+      if (typesModule) {
+          __pyx_mstate_global->__Pyx_CachedMethodType = PyObject_GetAttrString(typesModule, "MethodType");
+          Py_DECREF(typesModule);
+      }
+  } // error handling follows
+  #endif
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_after_shared_utility ### */
+
+static int __Pyx_InitAfterSharedUtility(void) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  /* CythonFunctionPerModule.init */
+  if (likely(__pyx_CyFunction_init(__pyx_m) == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#ifdef _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
+#endif
+
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* FastTypeChecks (used by GivenExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+}
+#endif
+
+/* PyErrFetchRestore (used by GivenExceptionMatches) */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
+    }
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
+}
+#endif
+
+/* GivenExceptionMatches (used by PyErrExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+}
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
+
+/* PyObjectGetAttrStr (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError (used by GetBuiltinName) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    return result;
+#else
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+#endif
+}
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_mstate_global->__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+            "name '%U' is not defined", name);
+    }
+    return result;
+}
+
+/* CopyObjectArray (used by TupleOrListFromArrayImpl) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
+    }
+}
+#endif
+
+/* TupleOrListFromArrayImpl (used by TupleFromArray) */
+#if !(PY_VERSION_HEX >= 0x030F0000 && !CYTHON_COMPILING_IN_LIMITED_API)
+CYTHON_UNUSED static PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n) {
+    if (n <= 0) {
+        return __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_tuple);
+    }
+    PyObject *res = PyTuple_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    __Pyx_copy_object_array(src, ((PyTupleObject*)res)->ob_item, n);
+    #else
+    Py_ssize_t i;
+    for (i = 0; i < n; i++) {
+        Py_INCREF(src[i]);
+        if (unlikely(__Pyx_PyTuple_SET_ITEM(res, i, src[i]) < (0))) {
+            Py_DECREF(res);
+            return NULL;
+        }
+    }
+    #endif
+    return res;
+}
+#endif
+
+/* PyObjectCompare (used by UnicodeEquals) */
+#ifndef __Pyx_DEFINED_PyObject_CompareStrStrBoolEq
+#define __Pyx_DEFINED_PyObject_CompareStrStrBoolEq
+static CYTHON_INLINE int __Pyx_PyObject_CompareStrStrBoolEq(PyObject* s1, PyObject* s2) {
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030e0000
+    int result = PyUnicode_Equal(s1, s2);
+    #if !CYTHON_COMPILING_IN_CPYTHON
+    if (unlikely(result == -1)) return -1;
+    #endif
+    if (result == 0) goto __pyx_return_false; else goto __pyx_return_true;
+    #else
+    int result = PyUnicode_Compare(s1, s2);
+    if (unlikely((result == -1) && PyErr_Occurred())) return -1;
+    if (result == 0) goto __pyx_return_true; else goto __pyx_return_false;
+    #endif
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
+}
+#endif
+static CYTHON_INLINE int __Pyx_PyObject_CompareBoolEq_str_str(PyObject *op1, PyObject *op2, int pyop) {
+    CYTHON_UNUSED_VAR(pyop);
+    if (unlikely(op1 == Py_None)) {
+        if (op2 == Py_None) goto __pyx_return_true; else goto __pyx_return_false;
+    }
+    if (unlikely(op2 == Py_None)) {
+        if (op1 == Py_None) goto __pyx_return_true; else goto __pyx_return_false;
+    }
+    
+    if (likely(op1 != Py_None)) {
+        if (op1 == op2) goto __pyx_return_true;
+        if (likely(op2 != Py_None)) {
+            return __Pyx_PyObject_CompareStrStrBoolEq(op1, op2);
+        }
+        goto __pyx_richcmp;
+    }
+    
+    if ((0)) goto __pyx_richcmp;
+    if ((0)) goto __pyx_return_true;
+    if ((0)) goto __pyx_return_false;
+__pyx_richcmp:
+    return __Pyx_PyObject_RichCompareBool(op1, op2, Py_EQ);
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
+}
+
+/* fastcall */
+#if CYTHON_VECTORCALL
+static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s)
+{
+    Py_ssize_t i, n = __Pyx_PyTuple_GET_SIZE(kwnames);
+    #if !CYTHON_ASSUME_SAFE_SIZE
+    if (unlikely(n == -1)) return NULL;
+    #endif
+    for (i = 0; i < n; i++)
+    {
+        PyObject *namei = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(!namei)) return NULL;
+        #endif
+        if (s == namei) return kwvalues[i];
+    }
+    for (i = 0; i < n; i++)
+    {
+        PyObject *namei = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(!namei)) return NULL;
+        #endif
+        int eq = __Pyx_PyUnicode_Equals(s, namei);
+        if (unlikely(eq != 0)) {
+            if (unlikely(eq < 0)) return NULL;
+            return kwvalues[i];
+        }
+    }
+    return NULL;
+}
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_GRAAL
+CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues) {
+    Py_ssize_t i, nkwargs;
+    PyObject *dict;
+#if !CYTHON_ASSUME_SAFE_SIZE
+    nkwargs = PyTuple_Size(kwnames);
+    if (unlikely(nkwargs < 0)) return NULL;
+#else
+    nkwargs = PyTuple_GET_SIZE(kwnames);
+#endif
+    dict = PyDict_New();
+    if (unlikely(!dict))
+        return NULL;
+    for (i=0; i<nkwargs; i++) {
+#if !CYTHON_ASSUME_SAFE_MACROS
+        PyObject *key = PyTuple_GetItem(kwnames, i);
+        if (!key) goto bad;
+#else
+        PyObject *key = PyTuple_GET_ITEM(kwnames, i);
+#endif
+        if (unlikely(PyDict_SetItem(dict, key, kwvalues[i]) < 0))
+            goto bad;
+    }
+    return dict;
+bad:
+    Py_DECREF(dict);
+    return NULL;
+}
+#endif
+#endif
+
+/* PyObjectCall (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = __Pyx_CyOrPyCFunction_GET_FUNCTION(func);
+    self = __Pyx_CyOrPyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectFastCall (used by PyObjectCallOneArg) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs) {
+    PyObject *argstuple;
+    PyObject *result = 0;
+    size_t i;
+    argstuple = PyTuple_New((Py_ssize_t)nargs);
+    if (unlikely(!argstuple)) return NULL;
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        if (__Pyx_PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]) != (0)) goto bad;
+    }
+    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
+  bad:
+    Py_DECREF(argstuple);
+    return result;
+}
+#endif
+#if CYTHON_VECTORCALL && !(CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY)
+  #if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE vectorcallfunc __Pyx_PyVectorcall_Function(PyObject *callable) {
+    PyTypeObject *tp = Py_TYPE(callable);
+    #if defined(__Pyx_CyFunction_USED)
+    if (__Pyx_CyFunction_CheckExact(callable)) {
+        return __Pyx_CyFunction_func_vectorcall(callable);
+    }
+    #endif
+    if (!PyType_HasFeature(tp, Py_TPFLAGS_HAVE_VECTORCALL)) {
+        return NULL;
+    }
+    assert(PyCallable_Check(callable));
+    Py_ssize_t offset = tp->tp_vectorcall_offset;
+    assert(offset > 0);
+    vectorcallfunc ptr;
+    memcpy(&ptr, (char *) callable + offset, sizeof(ptr));
+    return ptr;
+}
+  #else
+    #define __Pyx_PyVectorcall_Function(callable) PyVectorcall_Function(callable)
+  #endif
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwargs) {
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(nargsf);
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (nargs == 0 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
+            return __Pyx_PyObject_CallMethO(func, NULL);
+    }
+    else if (nargs == 1 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_O))
+            return __Pyx_PyObject_CallMethO(func, args[0]);
+    }
+#endif
+    if (kwargs == NULL) {
+        #if CYTHON_VECTORCALL
+          #if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+            return PyObject_Vectorcall(func, args, nargsf, NULL);
+          #else
+            vectorcallfunc f = __Pyx_PyVectorcall_Function(func);
+            if (f) {
+                return f(func, args, nargsf, NULL);
+            }
+          #endif
+        #endif
+    }
+    if (nargs == 0) {
+        return __Pyx_PyObject_Call(func, __pyx_mstate_global->__pyx_empty_tuple, kwargs);
+    }
+    #if CYTHON_COMPILING_IN_LIMITED_API
+    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
+    #elif CYTHON_COMPILING_IN_PYPY
+    return PyObject_VectorcallDict(func, args, (size_t) nargs, kwargs);
+    #else
+    return PyObject_VectorcallDict(func, args, nargsf, kwargs);
+    #endif
+}
+
+/* PyObjectCallOneArg (used by CallUnboundCMethod0) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *args[2] = {NULL, arg};
+    return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* IgnoreException (used by UnpackUnboundCMethod_impl) */
+static CYTHON_INLINE int __Pyx_IgnoreGivenException(PyObject *given_exception, PyObject *ignorable_exception) {
+    if (PyErr_GivenExceptionMatches(given_exception ? given_exception : PyErr_Occurred(), ignorable_exception)) {
+        PyErr_Clear();
+        return 1;
+    }
+    return 0;
+}
+
+/* UnpackUnboundCMethod_impl (used by UnpackUnboundCMethod) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030C0000
+static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+    PyObject *selfless_args = PyTuple_GetSlice(args, 1, PyTuple_Size(args));
+    if (unlikely(!selfless_args)) return NULL;
+    result = PyObject_Call(method, selfless_args, kwargs);
+    Py_DECREF(selfless_args);
+    return result;
+}
+#else
+static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return PyObject_Vectorcall(method, args ? args+1 : NULL, nargs ? (size_t) nargs-1 : 0, kwnames);
+}
+#endif
+static PyMethodDef __Pyx_UnboundCMethod_Def = {
+     "CythonUnboundCMethod",
+     __PYX_REINTERPRET_FUNCION(PyCFunction, __Pyx_SelflessCall),
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030C0000
+     METH_VARARGS | METH_KEYWORDS,
+#else
+     METH_FASTCALL | METH_KEYWORDS,
+#endif
+     NULL
+};
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
+    PyObject *method, *result=NULL;
+    method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
+    if (unlikely(!method))
+        return -1;
+    result = method;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (likely(__Pyx_TypeCheck(method, &PyMethodDescr_Type)))
+    {
+        PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
+        target->func = descr->d_method->ml_meth;
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST);
+    } else
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+#else
+    if (PyCFunction_Check(method))
+#endif
+    {
+        PyObject *self;
+        int self_found;
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+        self = PyObject_GetAttrString(method, "__self__");
+        if (!self && !__Pyx_IgnoreException(PyExc_AttributeError)) {
+            return -1;
+        }
+#else
+        self = PyCFunction_GET_SELF(method);
+#endif
+        self_found = (self && self != Py_None);
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+        Py_XDECREF(self);
+#endif
+        if (self_found) {
+            PyObject *unbound_method = PyCFunction_New(&__Pyx_UnboundCMethod_Def, method);
+            if (unlikely(!unbound_method)) return -1;
+            Py_DECREF(method);
+            result = unbound_method;
+        }
+    }
+#if !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    if (unlikely(target->method)) {
+        Py_DECREF(result);
+    } else
+#endif
+    target->method = result;
+    return 0;
+}
+
+/* CallUnboundCMethod0 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self) {
+    int was_initialized = __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
+    if (likely(was_initialized == 2 && cfunc->func)) {
+        if (likely(cfunc->flag == METH_NOARGS))
+            return __Pyx_CallCFunction(cfunc, self, NULL);
+        if (likely(cfunc->flag == METH_FASTCALL))
+            return __Pyx_CallCFunctionFast(cfunc, self, NULL, 0);
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, NULL, 0, NULL);
+        if (likely(cfunc->flag == (METH_VARARGS | METH_KEYWORDS)))
+            return __Pyx_CallCFunctionWithKeywords(cfunc, self, __pyx_mstate_global->__pyx_empty_tuple, NULL);
+        if (cfunc->flag == METH_VARARGS)
+            return __Pyx_CallCFunction(cfunc, self, __pyx_mstate_global->__pyx_empty_tuple);
+        return __Pyx__CallUnboundCMethod0(cfunc, self);
+    }
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    else if (unlikely(was_initialized == 1)) {
+        __Pyx_CachedCFunction tmp_cfunc = {
+#ifndef __cplusplus
+            0
+#endif
+        };
+        tmp_cfunc.type = cfunc->type;
+        tmp_cfunc.method_name = cfunc->method_name;
+        return __Pyx__CallUnboundCMethod0(&tmp_cfunc, self);
+    }
+#endif
+    PyObject *result = __Pyx__CallUnboundCMethod0(cfunc, self);
+    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
+    return result;
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self) {
+    PyObject *result;
+    if (unlikely(!cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+    result = __Pyx_PyObject_CallOneArg(cfunc->method, self);
+    return result;
+}
+
+/* py_dict_items (used by OwnedDictNext) */
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Items(PyObject* d) {
+    return __Pyx_CallUnboundCMethod0(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_items, d);
+}
+
+/* py_dict_values (used by OwnedDictNext) */
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Values(PyObject* d) {
+    return __Pyx_CallUnboundCMethod0(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_values, d);
+}
+
+/* OwnedDictNext (used by ParseKeywordsImpl) */
+#if CYTHON_AVOID_BORROWED_REFS
+static int __Pyx_PyDict_NextRef(PyObject *p, PyObject **ppos, PyObject **pkey, PyObject **pvalue) {
+    PyObject *next = NULL;
+    if (!*ppos) {
+        if (pvalue) {
+            PyObject *dictview = pkey ? __Pyx_PyDict_Items(p) : __Pyx_PyDict_Values(p);
+            if (unlikely(!dictview)) goto bad;
+            *ppos = PyObject_GetIter(dictview);
+            Py_DECREF(dictview);
+        } else {
+            *ppos = PyObject_GetIter(p);
+        }
+        if (unlikely(!*ppos)) goto bad;
+    }
+    next = PyIter_Next(*ppos);
+    if (!next) {
+        if (PyErr_Occurred()) goto bad;
+        return 0;
+    }
+    if (pkey && pvalue) {
+        *pkey = __Pyx_PySequence_ITEM(next, 0);
+        if (unlikely(*pkey)) goto bad;
+        *pvalue = __Pyx_PySequence_ITEM(next, 1);
+        if (unlikely(*pvalue)) goto bad;
+        Py_DECREF(next);
+    } else if (pkey) {
+        *pkey = next;
+    } else {
+        assert(pvalue);
+        *pvalue = next;
+    }
+    return 1;
+  bad:
+    Py_XDECREF(next);
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+    PyErr_FormatUnraisable("Exception ignored in __Pyx_PyDict_NextRef");
+#else
+    PyErr_WriteUnraisable(__pyx_mstate_global->__pyx_n_u_Pyx_PyDict_NextRef);
+#endif
+    if (pkey) *pkey = NULL;
+    if (pvalue) *pvalue = NULL;
+    return 0;
+}
+#else // !CYTHON_AVOID_BORROWED_REFS
+static int __Pyx_PyDict_NextRef(PyObject *p, Py_ssize_t *ppos, PyObject **pkey, PyObject **pvalue) {
+    int result = PyDict_Next(p, ppos, pkey, pvalue);
+    if (likely(result == 1)) {
+        if (pkey) Py_INCREF(*pkey);
+        if (pvalue) Py_INCREF(*pvalue);
+    }
+    return result;
+}
+#endif
+
+/* RaiseDoubleKeywords (used by ParseKeywordsImpl) */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+}
+
+/* CallUnboundCMethod2 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2) {
+    int was_initialized = __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
+    if (likely(was_initialized == 2 && cfunc->func)) {
+        PyObject *args[2] = {arg1, arg2};
+        if (cfunc->flag == METH_FASTCALL) {
+            return __Pyx_CallCFunctionFast(cfunc, self, args, 2);
+        }
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, args, 2, NULL);
+    }
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    else if (unlikely(was_initialized == 1)) {
+        __Pyx_CachedCFunction tmp_cfunc = {
+#ifndef __cplusplus
+            0
+#endif
+        };
+        tmp_cfunc.type = cfunc->type;
+        tmp_cfunc.method_name = cfunc->method_name;
+        return __Pyx__CallUnboundCMethod2(&tmp_cfunc, self, arg1, arg2);
+    }
+#endif
+    PyObject *result = __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2);
+    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
+    return result;
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2){
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        PyObject *result = NULL;
+        PyObject *args = PyTuple_New(2);
+        if (unlikely(!args)) return NULL;
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 0, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 1, arg2);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = __Pyx_CallCFunctionWithKeywords(cfunc, self, args, NULL);
+        else
+            result = __Pyx_CallCFunction(cfunc, self, args);
+        Py_DECREF(args);
+        return result;
+    }
+#endif
+    {
+        PyObject *args[4] = {NULL, self, arg1, arg2};
+        return __Pyx_PyObject_FastCall(cfunc->method, args+1, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+    }
+}
+
+/* ParseKeywordsImpl (used by ParseKeywords) */
+static int __Pyx_ValidateDuplicatePosArgs(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    const char* function_name)
+{
+    PyObject ** const *name = argnames;
+    while (name != first_kw_arg) {
+        PyObject *key = **name;
+        int found = PyDict_Contains(kwds, key);
+        if (unlikely(found)) {
+            if (found == 1) __Pyx_RaiseDoubleKeywordsError(function_name, key);
+            goto bad;
+        }
+        name++;
+    }
+    return 0;
+bad:
+    return -1;
+}
+#if CYTHON_USE_UNICODE_INTERNALS
+static CYTHON_INLINE int __Pyx_UnicodeKeywordsEqual(PyObject *s1, PyObject *s2) {
+    int kind;
+    Py_ssize_t len = PyUnicode_GET_LENGTH(s1);
+    if (len != PyUnicode_GET_LENGTH(s2)) return 0;
+    kind = PyUnicode_KIND(s1);
+    if (kind != PyUnicode_KIND(s2)) return 0;
+    const void *data1 = PyUnicode_DATA(s1);
+    const void *data2 = PyUnicode_DATA(s2);
+    return (memcmp(data1, data2, (size_t) len * (size_t) kind) == 0);
+}
+#endif
+static int __Pyx_MatchKeywordArg_str(
+    PyObject *key,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    size_t *index_found,
+    const char *function_name)
+{
+    PyObject ** const *name;
+    #if CYTHON_USE_UNICODE_INTERNALS
+    Py_hash_t key_hash = ((PyASCIIObject*)key)->hash;
+    if (unlikely(key_hash == -1)) {
+        key_hash = PyObject_Hash(key);
+        if (unlikely(key_hash == -1))
+            goto bad;
+    }
+    #endif
+    name = first_kw_arg;
+    while (*name) {
+        PyObject *name_str = **name;
+        #if CYTHON_USE_UNICODE_INTERNALS
+        if (key_hash == ((PyASCIIObject*)name_str)->hash && __Pyx_UnicodeKeywordsEqual(name_str, key)) {
+            *index_found = (size_t) (name - argnames);
+            return 1;
+        }
+        #else
+        #if CYTHON_ASSUME_SAFE_SIZE
+        if (PyUnicode_GET_LENGTH(name_str) == PyUnicode_GET_LENGTH(key))
+        #endif
+        {
+            int cmp = PyUnicode_Compare(name_str, key);
+            if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+            if (cmp == 0) {
+                *index_found = (size_t) (name - argnames);
+                return 1;
+            }
+        }
+        #endif
+        name++;
+    }
+    name = argnames;
+    while (name != first_kw_arg) {
+        PyObject *name_str = **name;
+        #if CYTHON_USE_UNICODE_INTERNALS
+        if (unlikely(key_hash == ((PyASCIIObject*)name_str)->hash)) {
+            if (__Pyx_UnicodeKeywordsEqual(name_str, key))
+                goto arg_passed_twice;
+        }
+        #else
+        #if CYTHON_ASSUME_SAFE_SIZE
+        if (PyUnicode_GET_LENGTH(name_str) == PyUnicode_GET_LENGTH(key))
+        #endif
+        {
+            if (unlikely(name_str == key)) goto arg_passed_twice;
+            int cmp = PyUnicode_Compare(name_str, key);
+            if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+            if (cmp == 0) goto arg_passed_twice;
+        }
+        #endif
+        name++;
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+bad:
+    return -1;
+}
+static int __Pyx_MatchKeywordArg_nostr(
+    PyObject *key,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    size_t *index_found,
+    const char *function_name)
+{
+    PyObject ** const *name;
+    if (unlikely(!PyUnicode_Check(key))) goto invalid_keyword_type;
+    name = first_kw_arg;
+    while (*name) {
+        int cmp = PyObject_RichCompareBool(**name, key, Py_EQ);
+        if (cmp == 1) {
+            *index_found = (size_t) (name - argnames);
+            return 1;
+        }
+        if (unlikely(cmp == -1)) goto bad;
+        name++;
+    }
+    name = argnames;
+    while (name != first_kw_arg) {
+        int cmp = PyObject_RichCompareBool(**name, key, Py_EQ);
+        if (unlikely(cmp != 0)) {
+            if (cmp == 1) goto arg_passed_twice;
+            else goto bad;
+        }
+        name++;
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+bad:
+    return -1;
+}
+static CYTHON_INLINE int __Pyx_MatchKeywordArg(
+    PyObject *key,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    size_t *index_found,
+    const char *function_name)
+{
+    return likely(PyUnicode_CheckExact(key)) ?
+        __Pyx_MatchKeywordArg_str(key, argnames, first_kw_arg, index_found, function_name) :
+        __Pyx_MatchKeywordArg_nostr(key, argnames, first_kw_arg, index_found, function_name);
+}
+static void __Pyx_RejectUnknownKeyword(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    const char *function_name)
+{
+    #if CYTHON_AVOID_BORROWED_REFS
+    PyObject *pos = NULL;
+    #else
+    Py_ssize_t pos = 0;
+    #endif
+    PyObject *key = NULL;
+    __Pyx_BEGIN_CRITICAL_SECTION(kwds);
+    #if CYTHON_AVOID_BORROWED_REFS
+    while (__Pyx_PyDict_NextRef(kwds, &pos, &key, NULL))
+    #else
+    (void) __Pyx_PyDict_NextRef;
+    while (PyDict_Next(kwds, &pos, &key, NULL))
+    #endif
+    {
+        PyObject** const *name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (!*name) {
+            size_t index_found = 0;
+            int cmp = __Pyx_MatchKeywordArg(key, argnames, first_kw_arg, &index_found, function_name);
+            if (cmp != 1) {
+                if (cmp == 0) {
+                    PyErr_Format(PyExc_TypeError,
+                        "%s() got an unexpected keyword argument '%U'",
+                        function_name, key);
+                }
+                #if CYTHON_AVOID_BORROWED_REFS
+                Py_DECREF(key);
+                #endif
+                break;
+            }
+        }
+        #if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(key);
+        #endif
+    }
+    __Pyx_END_CRITICAL_SECTION();
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_XDECREF(pos);
+    #endif
+    assert(PyErr_Occurred());
+}
+static int __Pyx_ParseKeywordDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs)
+{
+    PyObject** const *name;
+    PyObject** const *first_kw_arg = argnames + num_pos_args;
+    Py_ssize_t extracted = 0;
+#if !CYTHON_COMPILING_IN_PYPY || defined(PyArg_ValidateKeywordArguments)
+    if (unlikely(!PyArg_ValidateKeywordArguments(kwds))) return -1;
+#endif
+    name = first_kw_arg;
+    while (*name && num_kwargs > extracted) {
+        PyObject * key = **name;
+        PyObject *value;
+        int found = 0;
+        #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+        found = PyDict_GetItemRef(kwds, key, &value);
+        #else
+        value = PyDict_GetItemWithError(kwds, key);
+        if (value) {
+            Py_INCREF(value);
+            found = 1;
+        } else {
+            if (unlikely(PyErr_Occurred())) goto bad;
+        }
+        #endif
+        if (found) {
+            if (unlikely(found < 0)) goto bad;
+            values[name-argnames] = value;
+            extracted++;
+        }
+        name++;
+    }
+    if (num_kwargs > extracted) {
+        if (ignore_unknown_kwargs) {
+            if (unlikely(__Pyx_ValidateDuplicatePosArgs(kwds, argnames, first_kw_arg, function_name) == -1))
+                goto bad;
+        } else {
+            __Pyx_RejectUnknownKeyword(kwds, argnames, first_kw_arg, function_name);
+            goto bad;
+        }
+    }
+    return 0;
+bad:
+    return -1;
+}
+static int __Pyx_ParseKeywordDictToDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject** const *name;
+    PyObject** const *first_kw_arg = argnames + num_pos_args;
+    Py_ssize_t len;
+#if !CYTHON_COMPILING_IN_PYPY || defined(PyArg_ValidateKeywordArguments)
+    if (unlikely(!PyArg_ValidateKeywordArguments(kwds))) return -1;
+#endif
+    if (PyDict_Update(kwds2, kwds) < 0) goto bad;
+    name = first_kw_arg;
+    while (*name) {
+        PyObject *key = **name;
+        PyObject *value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && (PY_VERSION_HEX >= 0x030d00A2 || defined(PyDict_Pop))
+        int found = PyDict_Pop(kwds2, key, &value);
+        if (found) {
+            if (unlikely(found < 0)) goto bad;
+            values[name-argnames] = value;
+        }
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+        int found = PyDict_GetItemRef(kwds2, key, &value);
+        if (found) {
+            if (unlikely(found < 0)) goto bad;
+            values[name-argnames] = value;
+            if (unlikely(PyDict_DelItem(kwds2, key) < 0)) goto bad;
+        }
+#else
+    #if CYTHON_COMPILING_IN_CPYTHON
+        value = _PyDict_Pop(kwds2, key, kwds2);
+    #else
+        value = __Pyx_CallUnboundCMethod2(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_pop, kwds2, key, kwds2);
+    #endif
+        if (value == kwds2) {
+            Py_DECREF(value);
+        } else {
+            if (unlikely(!value)) goto bad;
+            values[name-argnames] = value;
+        }
+#endif
+        name++;
+    }
+    len = PyDict_Size(kwds2);
+    if (len > 0) {
+        return __Pyx_ValidateDuplicatePosArgs(kwds, argnames, first_kw_arg, function_name);
+    } else if (unlikely(len == -1)) {
+        goto bad;
+    }
+    return 0;
+bad:
+    return -1;
+}
+static int __Pyx_ParseKeywordsTuple(
+    PyObject *kwds,
+    PyObject * const *kwvalues,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs)
+{
+    PyObject *key = NULL;
+    PyObject** const * name;
+    PyObject** const *first_kw_arg = argnames + num_pos_args;
+    for (Py_ssize_t pos = 0; pos < num_kwargs; pos++) {
+#if CYTHON_AVOID_BORROWED_REFS
+        key = __Pyx_PySequence_ITEM(kwds, pos);
+#else
+        key = __Pyx_PyTuple_GET_ITEM(kwds, pos);
+#endif
+#if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(!key)) goto bad;
+#endif
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            PyObject *value = kwvalues[pos];
+            values[name-argnames] = __Pyx_NewRef(value);
+        } else {
+            size_t index_found = 0;
+            int cmp = __Pyx_MatchKeywordArg(key, argnames, first_kw_arg, &index_found, function_name);
+            if (cmp == 1) {
+                PyObject *value = kwvalues[pos];
+                values[index_found] = __Pyx_NewRef(value);
+            } else {
+                if (unlikely(cmp == -1)) goto bad;
+                if (kwds2) {
+                    PyObject *value = kwvalues[pos];
+                    if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+                } else if (!ignore_unknown_kwargs) {
+                    goto invalid_keyword;
+                }
+            }
+        }
+        #if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(key);
+        key = NULL;
+        #endif
+    }
+    return 0;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    goto bad;
+bad:
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_XDECREF(key);
+    #endif
+    return -1;
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseKeywords(
+    PyObject *kwds,
+    PyObject * const *kwvalues,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs)
+{
+    if (CYTHON_VECTORCALL && likely(PyTuple_Check(kwds)))
+        return __Pyx_ParseKeywordsTuple(kwds, kwvalues, argnames, kwds2, values, num_pos_args, num_kwargs, function_name, ignore_unknown_kwargs);
+    else if (kwds2)
+        return __Pyx_ParseKeywordDictToDict(kwds, argnames, kwds2, values, num_pos_args, function_name);
+    else
+        return __Pyx_ParseKeywordDict(kwds, argnames, values, num_pos_args, num_kwargs, function_name, ignore_unknown_kwargs);
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* PyDictVersioning (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        if (!PyErr_Occurred())
+            PyErr_SetNone(PyExc_NameError);
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+    if (!__Pyx_IgnoreException(PyExc_Exception)) {
+        return NULL; // BaseException
+    }
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) {
+        if (!__Pyx_IgnoreException(PyExc_Exception)) {
+            return NULL; // BaseException
+        }
+    }
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyObject *exc = PyErr_Occurred();
+    if (unlikely(exc) && !__Pyx_IgnoreGivenException(exc, PyExc_Exception)) {
+        return NULL; // BaseException
+    }
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyFrozenDict (used by GetItemInt) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_INLINE PyObject* __Pyx__PyFrozenDict_New(PyObject* frozendict_type, PyObject* it) {
+    return PyObject_CallFunctionObjArgs(frozendict_type, it, NULL);
+}
+#endif
+
+/* GettItemInt_wraparound (used by GetItemInt) */
+#if CYTHON_USE_TYPE_SLOTS && !CYTHON_COMPILING_IN_PYPY
+static int __Pyx_GetItemInt_wraparound(PyObject *o, PySequenceMethods *sm, Py_ssize_t *i) {
+    assert(*i < 0);
+    if (likely(sm->sq_length)) {
+        Py_ssize_t l = sm->sq_length(o);
+        if (likely(l >= 0)) {
+            *i += l;
+        } else {
+            if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                return -1;
+            PyErr_Clear();
+        }
+    }
+    return 0;
+}
+#endif
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (unlikely(!j)) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static PyObject *__Pyx_GetItemInt_Generic_size(PyObject *o, Py_ssize_t i) {
+    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared) {
+    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
+#if CYTHON_AVOID_BORROWED_REFS
+    CYTHON_UNUSED_VAR(boundscheck);
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        Py_ssize_t size = __Pyx_PyList_GET_SIZE(o);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(size < 0)) return NULL;
+        #endif
+        wrapped_i += size;
+    }
+    return __Pyx_PyList_GetItemRef(o, wrapped_i);
+#elif CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS
+    Py_ssize_t wrapped_i = i;
+    Py_ssize_t size = (wraparound | boundscheck) ? PyList_GET_SIZE(o) : -1;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += size;
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, size))) {
+        return __Pyx_PyList_GET_ITEM_REF(o, wrapped_i, unsafe_shared);
+    }
+    return __Pyx_GetItemInt_Generic_size(o, i);
+#else
+    (void)wraparound;
+    (void)boundscheck;
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared) {
+    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
+#if CYTHON_AVOID_BORROWED_REFS
+    CYTHON_UNUSED_VAR(boundscheck);
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        Py_ssize_t size = __Pyx_PyTuple_GET_SIZE(o);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(size < 0)) return NULL;
+        #endif
+        wrapped_i += size;
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_COMPILING_IN_LIMITED_API
+    return PySequence_ITEM(o, wrapped_i);
+    #else
+    if (unlikely(wrapped_i < 0)) {
+        PyErr_SetString(PyExc_IndexError, "tuple index out of range");
+        return NULL;
+    }
+    return PySequence_GetItem(o, wrapped_i);
+    #endif
+#elif CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS
+    Py_ssize_t wrapped_i = i;
+    Py_ssize_t size = (wraparound | boundscheck) ? PyTuple_GET_SIZE(o) : -1;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += size;
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, size))) {
+        return __Pyx_NewRef(__Pyx_PyTuple_GET_ITEM(o, wrapped_i));
+    }
+    return __Pyx_GetItemInt_Generic_size(o, i);
+#else
+    (void)wraparound;
+    (void)boundscheck;
+    return PySequence_GetItem(o, i);
+#endif
+}
+#if CYTHON_USE_TYPE_SLOTS && !CYTHON_COMPILING_IN_PYPY
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast_mapping(PyObject *o, binaryfunc getitem, Py_ssize_t i) {
+    PyObject *r, *key = PyLong_FromSsize_t(i);
+    if (unlikely(!key)) return NULL;
+    r = getitem(o, key);
+    Py_DECREF(key);
+    return r;
+}
+#endif
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int wraparound, int boundscheck, int unsafe_shared) {
+    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
+#if CYTHON_ASSUME_SAFE_SIZE
+    if (PyList_CheckExact(o)) {
+        return __Pyx_GetItemInt_List_Fast(o, i, wraparound, boundscheck, unsafe_shared);
+    } else
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (PyTuple_CheckExact(o)) {
+        return __Pyx_GetItemInt_Tuple_Fast(o, i, wraparound, boundscheck, unsafe_shared);
+    } else
+    #endif
+#else
+    if ((!wraparound || i >= 0) & PyList_CheckExact(o)) {
+        return boundscheck ? __Pyx_PyList_GetItemRef(o, i) : __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared);
+    } else
+#endif
+#if CYTHON_USE_TYPE_SLOTS && !CYTHON_COMPILING_IN_PYPY
+    if (PyDict_CheckExact(o)) {
+        return __Pyx_GetItemInt_Fast_mapping(o, PyDict_Type.tp_as_mapping->mp_subscript, i);
+    #if defined(PyFrozenDict_CheckExact)
+    } else if (PyFrozenDict_CheckExact(o)) {
+        return __Pyx_GetItemInt_Fast_mapping(o, PyFrozenDict_Type.tp_as_mapping->mp_subscript, i);
+    #endif
+    } else
+    {
+        PyTypeObject *obj_type = Py_TYPE(o);
+        int seq_or_mapping = __Pyx_PyType_GetFlags(obj_type) & (Py_TPFLAGS_SEQUENCE|Py_TPFLAGS_MAPPING);
+        if (seq_or_mapping != Py_TPFLAGS_SEQUENCE) {
+            PyMappingMethods *mm = obj_type->tp_as_mapping;
+            if (mm && mm->mp_subscript)
+                return __Pyx_GetItemInt_Fast_mapping(o, mm->mp_subscript, i);
+        }
+        PySequenceMethods *sm = obj_type->tp_as_sequence;
+        if (likely(sm && sm->sq_item)) {
+            if (wraparound && (i < 0) && unlikely(__Pyx_GetItemInt_wraparound(o, sm, &i) == -1))
+                return NULL;
+            return sm->sq_item(o, i);
+        }
+        if (seq_or_mapping == Py_TPFLAGS_SEQUENCE) {
+            PyMappingMethods *mm = obj_type->tp_as_mapping;
+            if (likely(mm && mm->mp_subscript))
+                return __Pyx_GetItemInt_Fast_mapping(o, mm->mp_subscript, i);
+        }
+    }
+#else
+    if (!PyMapping_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    (void)wraparound;
+    (void)boundscheck;
+    return __Pyx_GetItemInt_Generic_size(o, i);
+}
+
+/* FormatTypeName (used by RaiseErrorWithObjectType) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static __Pyx_TypeName
+__Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
+{
+    PyObject *module = NULL, *name = NULL, *result = NULL;
+    #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+    name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_qualname);
+    #else
+    name = PyType_GetQualName(tp);
+    #endif
+    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) goto bad;
+    module = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_module);
+    if (unlikely(module == NULL) || unlikely(!PyUnicode_Check(module))) goto bad;
+    if (PyUnicode_CompareWithASCIIString(module, "builtins") == 0) {
+        result = name;
+        name = NULL;
+        goto done;
+    }
+    result = PyUnicode_FromFormat("%U.%U", module, name);
+    if (unlikely(result == NULL)) goto bad;
+  done:
+    Py_XDECREF(name);
+    Py_XDECREF(module);
+    return result;
+  bad:
+    PyErr_Clear();
+    if (name) {
+        result = name;
+        name = NULL;
+    } else {
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u_);
+    }
+    goto done;
+}
+#endif
+
+/* RaiseErrorWithObjectType (used by ObjectGetItem) */
+static void __Pyx_RaiseErrorWithType(PyObject* exc_type, const char* message, PyTypeObject *type_obj) {
+    __Pyx_TypeName type_name = __Pyx_PyType_GetFullyQualifiedName(type_obj);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name)) return;
+    #endif
+    PyErr_Format(exc_type, message, type_name);
+    __Pyx_DECREF_TypeName(type_name);
+}
+
+/* ObjectGetItem */
+#if CYTHON_USE_TYPE_SLOTS
+static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject *index) {
+    PyObject *runerr = NULL;
+    Py_ssize_t key_value;
+    key_value = __Pyx_PyIndex_AsSsize_t(index);
+    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
+        return __Pyx_GetItemInt_Fast(obj, key_value, 1, 1, 1);
+    }
+    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
+        PyErr_Clear();
+        __Pyx_RaiseErrorWithObjectType(
+            PyExc_IndexError,
+            "cannot fit '" __Pyx_FMT_TYPENAME "' into an index-sized integer",
+            index);
+    }
+    return NULL;
+}
+static PyObject *__Pyx_PyObject_GetItem_Slow(PyObject *obj, PyObject *key) {
+    if (likely(PyType_Check(obj))) {
+        if ((PyTypeObject*)obj == &PyType_Type) {
+            return Py_GenericAlias(obj, key);
+        }
+        PyObject *meth = __Pyx_PyObject_GetAttrStrNoError(obj, __pyx_mstate_global->__pyx_n_u_class_getitem);
+        if (!meth) {
+            if (PyErr_Occurred()) {
+                return NULL;
+            }
+        } else {
+            PyObject *result = __Pyx_PyObject_CallOneArg(meth, key);
+            Py_DECREF(meth);
+            return result;
+        }
+    }
+    __Pyx_RaiseTypeErrorWithObjectType(
+        "'" __Pyx_FMT_TYPENAME "' object is not subscriptable", obj);
+    return NULL;
+}
+static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject *key) {
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyMappingMethods *mm = tp->tp_as_mapping;
+    PySequenceMethods *sm = tp->tp_as_sequence;
+    if (likely(mm && mm->mp_subscript)) {
+        return mm->mp_subscript(obj, key);
+    }
+    if (likely(sm && sm->sq_item)) {
+        return __Pyx_PyObject_GetIndex(obj, key);
+    }
+    return __Pyx_PyObject_GetItem_Slow(obj, key);
+}
+#endif
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type = NULL, *local_value, *local_tb = NULL;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+  #if PY_VERSION_HEX >= 0x030C0000
+    local_value = tstate->current_exception;
+    tstate->current_exception = 0;
+  #else
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+  #endif
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    local_value = PyErr_GetRaisedException();
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    if (likely(local_value)) {
+        local_type = (PyObject*) Py_TYPE(local_value);
+        Py_INCREF(local_type);
+        local_tb = PyException_GetTraceback(local_value);
+    }
+#else
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+#endif // __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+      #if PY_VERSION_HEX >= 0x030B00a4
+        tmp_value = exc_info->exc_value;
+        exc_info->exc_value = local_value;
+        tmp_type = NULL;
+        tmp_tb = NULL;
+        Py_XDECREF(local_type);
+        Py_XDECREF(local_tb);
+      #else
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+      #endif
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+    PyErr_SetHandledException(local_value);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+#endif
+}
+
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_value = exc_info->exc_value;
+    exc_info->exc_value = *value;
+    if (tmp_value == NULL || tmp_value == Py_None) {
+        Py_XDECREF(tmp_value);
+        tmp_value = NULL;
+        tmp_type = NULL;
+        tmp_tb = NULL;
+    } else {
+        tmp_type = (PyObject*) Py_TYPE(tmp_value);
+        Py_INCREF(tmp_type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        tmp_tb = ((PyBaseExceptionObject*) tmp_value)->traceback;
+        Py_XINCREF(tmp_tb);
+        #else
+        tmp_tb = PyException_GetTraceback(tmp_value);
+        #endif
+    }
+  #elif CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+  #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+  #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
+/* GetTopmostException (used by SaveResetException) */
+#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_value == NULL || exc_info->exc_value == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    PyObject *exc_value = exc_info->exc_value;
+    if (exc_value == NULL || exc_value == Py_None) {
+        *value = NULL;
+        *type = NULL;
+        *tb = NULL;
+    } else {
+        *value = exc_value;
+        Py_INCREF(*value);
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        *tb = PyException_GetTraceback(exc_value);
+    }
+  #elif CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+  #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+  #endif
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    PyObject *tmp_value = exc_info->exc_value;
+    exc_info->exc_value = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+  #else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+  #endif
+}
+#endif
+
+/* RaiseException */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+        PyException_SetTraceback(value, tb);
+#elif CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+
+/* ListAppendAndDecrefInternal (used by ListAppend) */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+static CYTHON_INLINE void __Pyx__ListComp_AppendAndDecref(PyObject* list, Py_ssize_t len, PyObject* x) {
+    PyList_SET_ITEM(list, len, x);
+    Py_SET_SIZE(list, len + 1);
+}
+#endif
+
+/* ListAppend */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        __Pyx__ListComp_AppendAndDecref(list, len, x);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#endif
+
+/* FunctionExport */
+static int __Pyx_ExportFunction(PyObject *api_dict, const char *name, void (*f)(void), const char *sig) {
+    PyObject *cobj;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    tmp.fp = f;
+    cobj = PyCapsule_New(tmp.p, sig, 0);
+    if (!cobj)
+        goto bad;
+    if (PyDict_SetItemString(api_dict, name, cobj) < 0)
+        goto bad;
+    Py_DECREF(cobj);
+    return 0;
+bad:
+    Py_XDECREF(cobj);
+    return -1;
+}
+
+/* GetApiDict */
+static PyObject *__Pyx_ApiExport_GetApiDict(void) {
+    PyObject *d;
+    if (__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_pyx_capi, &d) == -1)
+        return NULL;
+    if (!d) {
+        d = PyDict_New();
+        if (!d)
+            goto bad;
+        if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_pyx_capi, d) < 0)
+            goto bad;
+    }
+    return d;
+bad:
+    Py_XDECREF(d);
+    return NULL;
+}
+
+/* HasAttr (used by ImportImpl) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!PyUnicode_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_PyObject_GetAttrStrNoError(o, n);
+    if (!r) {
+        return (unlikely(PyErr_Occurred())) ? -1 : 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+#endif
+
+/* TupleOrListFromArrayImpl (used by ListFromArray) */
+CYTHON_UNUSED static PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n) {
+    PyObject *res = PyList_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    __Pyx_copy_object_array(src, ((PyListObject*)res)->ob_item, n);
+    #else
+    Py_ssize_t i;
+    for (i = 0; i < n; i++) {
+        Py_INCREF(src[i]);
+        if (unlikely(__Pyx_PyList_SET_ITEM(res, i, src[i]) < (0))) {
+            Py_DECREF(res);
+            return NULL;
+        }
+    }
+    #endif
+    return res;
+}
+
+/* ImportImpl (used by Import) */
+static int __Pyx__Import_GetModule(PyObject *qualname, PyObject **module) {
+    PyObject *imported_module = PyImport_GetModule(qualname);
+    if (unlikely(!imported_module)) {
+        *module = NULL;
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+        return 0;
+    }
+    *module = imported_module;
+    return 1;
+}
+static int __Pyx__Import_Lookup(PyObject *qualname, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject **module) {
+    PyObject *imported_module;
+    PyObject *top_level_package_name;
+    Py_ssize_t i;
+    int status, module_found;
+    Py_ssize_t dot_index;
+    module_found = __Pyx__Import_GetModule(qualname, &imported_module);
+    if (unlikely(!module_found || module_found == -1)) {
+        *module = NULL;
+        return module_found;
+    }
+    if (imported_names) {
+        for (i = 0; i < len_imported_names; i++) {
+            PyObject *imported_name = imported_names[i];
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+            int has_imported_attribute = PyObject_HasAttr(imported_module, imported_name);
+#else
+            int has_imported_attribute = PyObject_HasAttrWithError(imported_module, imported_name);
+            if (unlikely(has_imported_attribute == -1)) goto error;
+#endif
+            if (!has_imported_attribute) {
+                goto not_found;
+            }
+        }
+        *module = imported_module;
+        return 1;
+    }
+    dot_index = PyUnicode_FindChar(qualname, '.', 0, PY_SSIZE_T_MAX, 1);
+    if (dot_index == -1) {
+        *module = imported_module;
+        return 1;
+    }
+    if (unlikely(dot_index == -2)) goto error;
+    top_level_package_name = PyUnicode_Substring(qualname, 0, dot_index);
+    if (unlikely(!top_level_package_name)) goto error;
+    Py_DECREF(imported_module);
+    status = __Pyx__Import_GetModule(top_level_package_name, module);
+    Py_DECREF(top_level_package_name);
+    return status;
+error:
+    Py_DECREF(imported_module);
+    *module = NULL;
+    return -1;
+not_found:
+    Py_DECREF(imported_module);
+    *module = NULL;
+    return 0;
+}
+static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level) {
+    PyObject *module = 0;
+    PyObject *empty_dict = 0;
+    PyObject *from_list = 0;
+    int module_found;
+    if (!qualname) {
+        qualname = name;
+    }
+    module_found = __Pyx__Import_Lookup(qualname, imported_names, len_imported_names, &module);
+    if (likely(module_found == 1)) {
+        return module;
+    } else if (unlikely(module_found == -1)) {
+        return NULL;
+    }
+    #if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030f00a6
+    empty_dict = PyFrozenDict_New(NULL);
+    #else
+    empty_dict = PyDict_New();
+    #endif
+    if (unlikely(!empty_dict))
+        goto bad;
+    if (imported_names) {
+        from_list = __Pyx_PyList_FromArray(imported_names, len_imported_names);
+        if (unlikely(!from_list))
+            goto bad;
+    }
+    if (level == -1) {
+        const char* package_sep = strchr(__Pyx_MODULE_NAME, '.');
+        if (package_sep != (0)) {
+            module = PyImport_ImportModuleLevelObject(
+                name, moddict, empty_dict, from_list, 1);
+            if (unlikely(!module)) {
+                if (unlikely(!PyErr_ExceptionMatches(PyExc_ImportError)))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        level = 0;
+    }
+    if (!module) {
+        module = PyImport_ImportModuleLevelObject(
+            name, moddict, empty_dict, from_list, level);
+    }
+bad:
+    Py_XDECREF(from_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level) {
+    return __Pyx__Import(name, imported_names, len_imported_names, qualname, __pyx_mstate_global->__pyx_d, level);
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        const char* module_name_str = 0;
+        PyObject* module_name = 0;
+        PyObject* module_dot = 0;
+        PyObject* full_name = 0;
+        PyErr_Clear();
+        module_name_str = PyModule_GetName(module);
+        if (unlikely(!module_name_str)) { goto modbad; }
+        module_name = PyUnicode_FromString(module_name_str);
+        if (unlikely(!module_name)) { goto modbad; }
+        module_dot = PyUnicode_Concat(module_name, __pyx_mstate_global->__pyx_kp_u__2);
+        if (unlikely(!module_dot)) { goto modbad; }
+        full_name = PyUnicode_Concat(module_dot, name);
+        if (unlikely(!full_name)) { goto modbad; }
+        #if (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400) ||\
+                CYTHON_COMPILING_IN_GRAAL
+        {
+            PyObject *modules = PyImport_GetModuleDict();
+            if (unlikely(!modules))
+                goto modbad;
+            value = PyObject_GetItem(modules, full_name);
+        }
+        #else
+        value = PyImport_GetModule(full_name);
+        #endif
+      modbad:
+        Py_XDECREF(full_name);
+        Py_XDECREF(module_dot);
+        Py_XDECREF(module_name);
+    }
+    if (unlikely(!value)) {
+        PyErr_Format(PyExc_ImportError, "cannot import name %S", name);
+    }
+    return value;
+}
+
+/* PyLongBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_Fallback___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, int inplace) {
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#if CYTHON_USE_PYLONG_INTERNALS
+static PyObject* __Pyx_Unpacked___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(inplace);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    const long b = intval;
+    long a;
+    const PY_LONG_LONG llb = intval;
+    PY_LONG_LONG lla;
+    if (unlikely(__Pyx_PyLong_IsZero(op1))) {
+        return __Pyx_NewRef(op2);
+    }
+    const int is_positive = __Pyx_PyLong_IsPos(op1);
+    const digit* digits = __Pyx_PyLong_Digits(op1);
+    const Py_ssize_t size = __Pyx_PyLong_DigitCount(op1);
+    if (likely(size == 1)) {
+        a = (long) digits[0];
+        if (!is_positive) a *= -1;
+    } else {
+        if (size == 2 && 8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+            a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+            if (!is_positive) a *= -1;
+            goto calculate_long;
+        } else if (size == 2 && 8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+            lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+            if (!is_positive) lla *= -1;
+            goto calculate_long_long;
+        } else
+        if (size == 3 && 8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+            a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+            if (!is_positive) a *= -1;
+            goto calculate_long;
+        } else if (size == 3 && 8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+            lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+            if (!is_positive) lla *= -1;
+            goto calculate_long_long;
+        } else
+        if (size == 4 && 8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+            a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+            if (!is_positive) a *= -1;
+            goto calculate_long;
+        } else if (size == 4 && 8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+            lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+            if (!is_positive) lla *= -1;
+            goto calculate_long_long;
+        } else
+        {}
+        return PyLong_Type.tp_as_number->nb_add(op1, op2);
+    }
+    calculate_long:
+        {
+            long x;
+            x = a + b;
+            return PyLong_FromLong(x);
+        }
+    calculate_long_long:
+        {
+            PY_LONG_LONG llx;
+            llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+        }
+    
+}
+#endif
+static PyObject* __Pyx_Float___Pyx_PyLong_AddObjC(PyObject *float_val, long intval, int zerodivision_check) {
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    const long b = intval;
+    double a = __Pyx_PyFloat_AS_DOUBLE(float_val);
+        double result;
+        
+        result = ((double)a) + (double)b;
+        return PyFloat_FromDouble(result);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(intval);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        return __Pyx_Unpacked___Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check);
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        return __Pyx_Float___Pyx_PyLong_AddObjC(op1, intval, zerodivision_check);
+    }
+    return __Pyx_Fallback___Pyx_PyLong_AddObjC(op1, op2, inplace);
+}
+#endif
+
+/* dict_setdefault (used by FetchCommonType) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value) {
+    PyObject* value;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030F0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4)
+    PyDict_SetDefaultRef(d, key, default_value, &value);
+#elif CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    PyObject *args[] = {d, key, default_value};
+    value = PyObject_VectorcallMethod(__pyx_mstate_global->__pyx_n_u_setdefault, args, 3 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    value = PyObject_CallMethodObjArgs(d, __pyx_mstate_global->__pyx_n_u_setdefault, key, default_value, NULL);
+#else
+    value = PyDict_SetDefault(d, key, default_value);
+    if (unlikely(!value)) return NULL;
+    Py_INCREF(value);
+#endif
+    return value;
+}
+
+/* AddModuleRef (used by FetchSharedCythonModule) */
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX < 0x030F00a3
+  static PyObject *__Pyx_PyImport_AddModuleObjectRef(PyObject *name) {
+      PyObject *module_dict = PyImport_GetModuleDict();
+      PyObject *m;
+      if (PyMapping_GetOptionalItem(module_dict, name, &m) < 0) {
+          return NULL;
+      }
+      if (m != NULL && PyModule_Check(m)) {
+          return m;
+      }
+      Py_XDECREF(m);
+      m = PyModule_NewObject(name);
+      if (m == NULL)
+          return NULL;
+      if (PyDict_CheckExact(module_dict)) {
+          PyObject *new_m;
+          (void)PyDict_SetDefaultRef(module_dict, name, m, &new_m);
+          Py_DECREF(m);
+          return new_m;
+      } else {
+           if (PyObject_SetItem(module_dict, name, m) != 0) {
+                Py_DECREF(m);
+                return NULL;
+            }
+            return m;
+      }
+  }
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      if ((PY_VERSION_HEX >= 0x030E0000) &&  Py_Version >= 0x030E0100) {
+          return PyImport_AddModuleRef(name);
+      }
+      PyObject *py_name = PyUnicode_FromString(name);
+      if (!py_name) return NULL;
+      PyObject *module = __Pyx_PyImport_AddModuleObjectRef(py_name);
+      Py_DECREF(py_name);
+      return module;
+  }
+#elif __PYX_LIMITED_VERSION_HEX < 0x030d0000
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      PyObject *module = PyImport_AddModule(name);
+      Py_XINCREF(module);
+      return module;
+  }
+#endif
+
+/* FetchSharedCythonModule (used by FetchCommonType) */
+static PyObject *__Pyx_FetchSharedCythonABIModule(void) {
+    return __Pyx_PyImport_AddModuleRef(__PYX_ABI_MODULE_NAME);
+}
+
+/* VerifyCachedType (used by FetchCommonType) */
+static int __Pyx_VerifyCachedType(PyObject *cached_type,
+                               const char *name,
+                               Py_ssize_t expected_basicsize) {
+    Py_ssize_t basicsize;
+    if (!PyType_Check(cached_type)) {
+        PyErr_Format(PyExc_TypeError,
+            "Shared Cython type %.200s is not a type object", name);
+        return -1;
+    }
+    if (expected_basicsize == 0) {
+        return 0; // size is inherited, nothing useful to check
+    }
+#if CYTHON_COMPILING_IN_LIMITED_API && CYTHON_OPAQUE_OBJECTS
+    if (expected_basicsize < 0) {
+        basicsize = PyType_GetTypeDataSize((PyTypeObject*)cached_type);
+    } else
+#endif
+    {
+    #if CYTHON_COMPILING_IN_LIMITED_API
+        PyObject *py_basicsize;
+        py_basicsize = PyObject_GetAttrString(cached_type, "__basicsize__");
+        if (unlikely(!py_basicsize)) return -1;
+        basicsize = PyLong_AsSsize_t(py_basicsize);
+        Py_DECREF(py_basicsize);
+        py_basicsize = NULL;
+        if (unlikely(basicsize == (Py_ssize_t)-1) && PyErr_Occurred()) return -1;
+    #else
+        basicsize = ((PyTypeObject*) cached_type)->tp_basicsize;
+    #endif
+    }
+    if ((expected_basicsize >= 0) ?
+            (basicsize != expected_basicsize) :
+            (basicsize < -expected_basicsize)) {
+        PyErr_Format(PyExc_TypeError,
+            "Shared Cython type %.200s has the wrong size, try recompiling",
+            name);
+        return -1;
+    }
+    return 0;
+}
+
+/* FetchCommonType (used by CommonTypesMetaclass) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+static PyObject* __Pyx_PyType_FromMetaclass(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases) {
+    PyObject *result = __Pyx_PyType_FromModuleAndSpec(module, spec, bases);
+    if (result && metaclass) {
+        PyObject *old_tp = (PyObject*)Py_TYPE(result);
+        Py_INCREF((PyObject*)metaclass);
+        Py_SET_TYPE(result, metaclass);
+        Py_DECREF(old_tp);
+        PyType_Modified((PyTypeObject*)result);
+    }
+    return result;
+}
+#else
+#define __Pyx_PyType_FromMetaclass(me, mo, s, b) PyType_FromMetaclass(me, mo, s, b)
+#endif
+static PyTypeObject *__Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases) {
+    PyObject *abi_module = NULL, *cached_type = NULL, *abi_module_dict, *new_cached_type, *py_object_name;
+    int get_item_ref_result;
+    const char* object_name = strrchr(spec->name, '.');
+    object_name = object_name ? object_name+1 : spec->name;
+    py_object_name = PyUnicode_FromString(object_name);
+    if (!py_object_name) return NULL;
+    abi_module = __Pyx_FetchSharedCythonABIModule();
+    if (!abi_module) goto done;
+    abi_module_dict = PyModule_GetDict(abi_module);
+    if (!abi_module_dict) goto done;
+    get_item_ref_result = __Pyx_PyDict_GetItemRef(abi_module_dict, py_object_name, &cached_type);
+    if (get_item_ref_result == 1) {
+        if (__Pyx_VerifyCachedType(
+              cached_type,
+              object_name,
+              spec->basicsize) < 0) {
+            goto bad;
+        }
+        goto done;
+    } else if (unlikely(get_item_ref_result == -1)) {
+        goto bad;
+    }
+    cached_type = __Pyx_PyType_FromMetaclass(
+        metaclass,
+        CYTHON_USE_MODULE_STATE ? module : abi_module,
+        spec, bases);
+    if (unlikely(!cached_type)) goto bad;
+    new_cached_type = __Pyx_PyDict_SetDefault(abi_module_dict, py_object_name, cached_type);
+    if (unlikely(new_cached_type != cached_type)) {
+        if (unlikely(!new_cached_type)) goto bad;
+        Py_DECREF(cached_type);
+        cached_type = new_cached_type;
+        if (__Pyx_VerifyCachedType(
+                cached_type,
+                object_name,
+                spec->basicsize) < 0) {
+            goto bad;
+        }
+        goto done;
+    } else {
+        Py_DECREF(new_cached_type);
+    }
+done:
+    Py_XDECREF(abi_module);
+    Py_DECREF(py_object_name);
+    assert(cached_type == NULL || PyType_Check(cached_type));
+    return (PyTypeObject *) cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+
+/* CommonTypesMetaclass (used by CythonFunctionShared) */
+static PyObject* __pyx_CommonTypesMetaclass_get_module(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED void* context) {
+    return PyUnicode_FromString(__PYX_ABI_MODULE_NAME);
+}
+#if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+static PyObject* __pyx_CommonTypesMetaclass_call(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED PyObject *args, CYTHON_UNUSED PyObject *kwds) {
+    PyErr_SetString(PyExc_TypeError, "Cannot instantiate Cython internal types");
+    return NULL;
+}
+static int __pyx_CommonTypesMetaclass_setattr(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED PyObject *attr, CYTHON_UNUSED PyObject *value) {
+    PyErr_SetString(PyExc_TypeError, "Cython internal types are immutable");
+    return -1;
+}
+#endif
+static PyGetSetDef __pyx_CommonTypesMetaclass_getset[] = {
+    {"__module__", __pyx_CommonTypesMetaclass_get_module, NULL, NULL, NULL},
+    {0, 0, 0, 0, 0}
+};
+static PyType_Slot __pyx_CommonTypesMetaclass_slots[] = {
+    {Py_tp_getset, (void *)__pyx_CommonTypesMetaclass_getset},
+    #if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+    {Py_tp_call, (void*)__pyx_CommonTypesMetaclass_call},
+    {Py_tp_new, (void*)__pyx_CommonTypesMetaclass_call},
+    {Py_tp_setattro, (void*)__pyx_CommonTypesMetaclass_setattr},
+    #endif
+    {0, 0}
+};
+static PyType_Spec __pyx_CommonTypesMetaclass_spec = {
+    __PYX_TYPE_MODULE_PREFIX "_common_types_metatype",
+    0,
+    0,
+    Py_TPFLAGS_IMMUTABLETYPE |
+    Py_TPFLAGS_DISALLOW_INSTANTIATION |
+    Py_TPFLAGS_DEFAULT,
+    __pyx_CommonTypesMetaclass_slots
+};
+static int __pyx_CommonTypesMetaclass_init(PyObject *module) {
+    __pyx_mstatetype *mstate = __Pyx_PyModule_GetState(module);
+    PyObject *bases = PyTuple_Pack(1, &PyType_Type);
+    if (unlikely(!bases)) {
+        return -1;
+    }
+    mstate->__pyx_CommonTypesMetaclassType = __Pyx_FetchCommonTypeFromSpec(NULL, module, &__pyx_CommonTypesMetaclass_spec, bases);
+    Py_DECREF(bases);
+    if (unlikely(mstate->__pyx_CommonTypesMetaclassType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+
+/* CythonFunctionPerModule (used by CythonFunctionShared) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunctionNoMethod(PyObject *func, void (*cfunc)(void)) {
+    if (__Pyx_CyFunction_Check(func)) {
+        return __Pyx_as_CyFunctionObject(func)->func_methoddef->ml_meth == (PyCFunction) cfunc;
+    } else if (PyCFunction_Check(func)) {
+        return PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void)) {
+    if ((PyObject*)Py_TYPE(func) == __pyx_mstate_global->__Pyx_CachedMethodType) {
+        int result;
+        PyObject *newFunc = PyObject_GetAttr(func, __pyx_mstate_global->__pyx_n_u_func);
+        if (unlikely(!newFunc)) {
+            PyErr_Clear(); // It's only an optimization, so don't throw an error
+            return 0;
+        }
+        result = __Pyx__IsSameCyOrCFunctionNoMethod(newFunc, cfunc);
+        Py_DECREF(newFunc);
+        return result;
+    }
+    return __Pyx__IsSameCyOrCFunctionNoMethod(func, cfunc);
+}
+#else
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void)) {
+    if (PyMethod_Check(func)) {
+        func = PyMethod_GET_FUNCTION(func);
+    }
+    return __Pyx_CyOrPyCFunction_Check(func) && __Pyx_CyOrPyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+}
+#endif
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    __Pyx_Py_XDECREF_SET(
+        __Pyx__CyFunction_GetClassObj(f),
+            ((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#else
+    __Pyx_Py_XDECREF_SET(
+        ((PyCMethodObject *) (f))->mm_class,
+        (PyTypeObject*)((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_InitDefaults(PyObject *func, PyTypeObject *defaults_type) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->defaults = PyObject_CallObject((PyObject*)defaults_type, NULL); // _PyObject_New(defaults_type);
+    if (unlikely(!m->defaults))
+        return NULL;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* CallTypeTraverse (used by CythonFunctionShared) */
+#if !CYTHON_USE_TYPE_SPECS
+#else
+static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg) {
+    if (!always_call) {
+        PyTypeObject *base = __Pyx_PyObject_GetSlot(o, tp_base, PyTypeObject*);
+        unsigned long flags = PyType_GetFlags(base);
+        if (flags & Py_TPFLAGS_HEAPTYPE) {
+            return 0;
+        }
+    }
+    Py_VISIT((PyObject*)Py_TYPE(o));
+    return 0;
+}
+#endif
+
+/* PyMethodNew (used by CythonFunctionShared) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ) {
+    PyObject *result;
+    CYTHON_UNUSED_VAR(typ);
+    if (!self)
+        return __Pyx_NewRef(func);
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    {
+        PyObject *args[] = {func, self};
+        result = PyObject_Vectorcall(__pyx_mstate_global->__Pyx_CachedMethodType, args, 2, NULL);
+    }
+    #else
+    result = PyObject_CallFunctionObjArgs(__pyx_mstate_global->__Pyx_CachedMethodType, func, self, NULL);
+    #endif
+    return result;
+}
+#else
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ) {
+    CYTHON_UNUSED_VAR(typ);
+    if (!self)
+        return __Pyx_NewRef(func);
+    return PyMethod_New(func, self);
+}
+#endif
+
+/* PyVectorcallFastCallDict (used by CythonFunctionShared) */
+#if CYTHON_VECTORCALL
+static PyObject *__Pyx_PyVectorcall_FastCallDict_kw(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
+{
+    PyObject *res = NULL;
+    PyObject *kwnames;
+    PyObject **newargs;
+    PyObject **kwvalues;
+    Py_ssize_t i;
+    #if CYTHON_AVOID_BORROWED_REFS
+    PyObject *pos;
+    #else
+    Py_ssize_t pos;
+    #endif
+    size_t j;
+    PyObject *key, *value;
+    unsigned long keys_are_strings;
+    #if !CYTHON_ASSUME_SAFE_SIZE
+    Py_ssize_t nkw = PyDict_Size(kw);
+    if (unlikely(nkw == -1)) return NULL;
+    #else
+    Py_ssize_t nkw = PyDict_GET_SIZE(kw);
+    #endif
+    newargs = (PyObject **)PyMem_Malloc((nargs + (size_t)nkw) * sizeof(args[0]));
+    if (unlikely(newargs == NULL)) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    for (j = 0; j < nargs; j++) newargs[j] = args[j];
+    kwnames = PyTuple_New(nkw);
+    if (unlikely(kwnames == NULL)) {
+        PyMem_Free(newargs);
+        return NULL;
+    }
+    kwvalues = newargs + nargs;
+    pos = 0;
+    i = 0;
+    keys_are_strings = Py_TPFLAGS_UNICODE_SUBCLASS;
+    while (__Pyx_PyDict_NextRef(kw, &pos, &key, &value)) {
+        keys_are_strings &=
+        #if CYTHON_COMPILING_IN_LIMITED_API
+            PyType_GetFlags(Py_TYPE(key));
+        #else
+            Py_TYPE(key)->tp_flags;
+        #endif
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(PyTuple_SetItem(kwnames, i, key) < 0)) goto cleanup;
+        #else
+        PyTuple_SET_ITEM(kwnames, i, key);
+        #endif
+        kwvalues[i] = value;
+        i++;
+    }
+    if (unlikely(!keys_are_strings)) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        goto cleanup;
+    }
+    res = vc(func, newargs, nargs, kwnames);
+cleanup:
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(pos);
+    #endif
+    Py_DECREF(kwnames);
+    for (i = 0; i < nkw; i++)
+        Py_DECREF(kwvalues[i]);
+    PyMem_Free(newargs);
+    return res;
+}
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
+{
+    Py_ssize_t kw_size =
+        likely(kw == NULL) ?
+        0 :
+#if !CYTHON_ASSUME_SAFE_SIZE
+        PyDict_Size(kw);
+#else
+        PyDict_GET_SIZE(kw);
+#endif
+    if (kw_size == 0) {
+        return vc(func, args, nargs, NULL);
+    }
+#if !CYTHON_ASSUME_SAFE_SIZE
+    else if (unlikely(kw_size == -1)) {
+        return NULL;
+    }
+#endif
+    return __Pyx_PyVectorcall_FastCallDict_kw(func, vc, args, nargs, kw);
+}
+#endif
+
+/* CythonFunctionShared (used by CythonFunction) */
+static PyObject *
+__Pyx_CyFunction_get_doc_locked(__pyx_CyFunctionObject *op)
+{
+    if (unlikely(op->func_doc == NULL)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+        const char *doc = op->func_methoddef->ml_doc;
+#else
+        const char *doc = ((PyCFunctionObject*)op)->m_ml->ml_doc;
+#endif
+        if (doc) {
+            op->func_doc = PyUnicode_FromString(doc);
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static PyObject *
+__Pyx_CyFunction_get_doc(PyObject *op_in, void *closure) {
+    PyObject *result;
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    CYTHON_UNUSED_VAR(closure);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    result = __Pyx_CyFunction_get_doc_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_doc(PyObject *op_in, PyObject *value, void *context)
+{
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    CYTHON_UNUSED_VAR(context);
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_doc, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name_locked(__pyx_CyFunctionObject *op)
+{
+    if (unlikely(op->func_name == NULL)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+        const char *name = op->func_methoddef->ml_name;
+#else
+        const char *name = ((PyCFunctionObject*)op)->m_ml->ml_name;
+#endif
+        op->func_name = PyUnicode_InternFromString(name);
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(PyObject *op, void *context)
+{
+    PyObject *result = NULL;
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_name_locked(__Pyx_as_CyFunctionObject(op));
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_name(PyObject *op_in, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(value == NULL || !PyUnicode_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_name, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(PyObject *op_in, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject *result;
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    Py_INCREF(op->func_qualname);
+    result = op->func_qualname;
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_qualname(PyObject *op_in, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(value == NULL || !PyUnicode_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_qualname, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+#endif
+static PyObject *
+__Pyx_CyFunction_get_globals(PyObject *op_in, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(PyObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(op);
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(PyObject *op_in, void *context)
+{
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op, PyObject *op_obj) {
+    int result = 0;
+    PyObject *res = op->defaults_getter(op_obj);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = __Pyx_PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = __Pyx_PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(PyObject *op_in, PyObject* value, void *context) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    CYTHON_UNUSED_VAR(context);
+    if (!value) {
+        value = Py_None;
+    } else if (unlikely(value != Py_None && !PyTuple_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__defaults__ will not "
+                 "currently affect the values used in function calls", 1);
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->defaults_tuple, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults_locked(PyObject *op_in) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject* result = op->defaults_tuple;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (unlikely(__Pyx_CyFunction_init_defaults(op, op_in) < 0)) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(PyObject *op, void *context) {
+    PyObject* result = NULL;
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_defaults_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(PyObject *op_in, PyObject* value, void *context) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    CYTHON_UNUSED_VAR(context);
+    if (!value) {
+        value = Py_None;
+    } else if (unlikely(value != Py_None && !PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__kwdefaults__ will not "
+                 "currently affect the values used in function calls", 1);
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->defaults_kwdict, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults_locked(PyObject *op_in) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject* result = op->defaults_kwdict;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (unlikely(__Pyx_CyFunction_init_defaults(op, op_in) < 0)) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(PyObject *op, void *context) {
+    PyObject* result;
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_kwdefaults_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int __Pyx_CyFunction_set_annotate_in_dict_if_exists(PyObject *op_in, PyObject *value);
+static int
+__Pyx_CyFunction_set_annotations(PyObject *op_in, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_XINCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_annotations, value);
+    __Pyx_END_CRITICAL_SECTION();
+    if (unlikely(__Pyx_CyFunction_set_annotate_in_dict_if_exists(op_in, Py_None) < 0)) return -1;
+    return 0;
+}
+static int
+__Pyx_CyFunction_get_dict_if_exists(PyObject *op_in, PyObject **dict) {
+    /* Return 1 if the function dict exists, 0 otherwise.  This cannot fail:
+     * _PyObject_GetDictPtr() may clear errors internally, but never reports them. */
+#if CYTHON_COMPILING_IN_PYPY
+    *dict = PyObject_GenericGetDict(op_in, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX < 0x030C0000
+    *dict = __Pyx_as_CyFunctionObject(op_in)->func_dict;
+#else
+    PyObject **dictptr = _PyObject_GetDictPtr(op_in);
+    *dict = likely(dictptr) ? *dictptr : NULL;
+#endif
+    return *dict ? 1 : 0;
+}
+static int
+__Pyx_CyFunction_get_annotate_from_dict_if_exists(PyObject *op_in, PyObject **annotate) {
+    PyObject *dict;
+    int dict_found;
+    *annotate = NULL;
+    dict_found = __Pyx_CyFunction_get_dict_if_exists(op_in, &dict);
+    if (!dict_found) return 0;
+    return __Pyx_PyDict_GetItemRef(dict, __pyx_mstate_global->__pyx_n_u_annotate, annotate);
+}
+static int
+__Pyx_CyFunction_set_annotate_in_dict_if_exists(PyObject *op_in, PyObject *value) {
+    PyObject *dict;
+    int dict_found;
+    dict_found = __Pyx_CyFunction_get_dict_if_exists(op_in, &dict);
+    if (!dict_found) return 0;
+    if (value) {
+        return PyDict_SetItem(dict, __pyx_mstate_global->__pyx_n_u_annotate, value);
+    } else {
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+        return PyDict_Pop(dict, __pyx_mstate_global->__pyx_n_u_annotate, NULL);
+#else
+        int result = PyDict_Contains(dict, __pyx_mstate_global->__pyx_n_u_annotate);
+        if (result == 1) {
+            result = PyDict_DelItem(dict, __pyx_mstate_global->__pyx_n_u_annotate);
+        }
+        return result;
+#endif
+    }
+}
+static int
+__Pyx_CyFunction_set_annotate_in_dict(PyObject *op_in, PyObject *value) {
+    PyObject *dict;
+    int result;
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+    dict = __Pyx_CyFunction_get_dict(__Pyx_as_CyFunctionObject(op_in), NULL);
+#else
+    dict = PyObject_GenericGetDict(op_in, NULL);
+#endif
+    if (unlikely(!dict)) return -1;
+    result = PyDict_SetItem(dict, __pyx_mstate_global->__pyx_n_u_annotate, value);
+    Py_DECREF(dict);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations_locked(__pyx_CyFunctionObject *op) {
+    PyObject* result = op->func_annotations;
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(PyObject *op_in, void *context) {
+    PyObject *annotate = NULL;
+    PyObject *result = NULL;
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    result = __Pyx_XNewRef(op->func_annotations);
+    __Pyx_END_CRITICAL_SECTION();
+    if (result) return result;
+    if (unlikely(__Pyx_CyFunction_get_annotate_from_dict_if_exists(op_in, &annotate) < 0)) return NULL;
+    if (!annotate || annotate == Py_None) {
+        Py_XDECREF(annotate);
+        __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+        result = __Pyx_CyFunction_get_annotations_locked(op);
+        __Pyx_END_CRITICAL_SECTION();
+        return result;
+    }
+    PyObject *format = PyLong_FromLong(1L);  // annotationlib.Format.VALUE
+    if (likely(format)) {
+        if (!Py_EnterRecursiveCall(" cyfunction __annotations__.__get__")) {
+            result = __Pyx_PyObject_CallOneArg(annotate, format);
+            Py_LeaveRecursiveCall();
+            Py_DECREF(format);
+        }
+    }
+    Py_DECREF(annotate);
+    if (unlikely(!result)) return NULL;
+    if (unlikely(!PyDict_Check(result))) {
+        PyErr_SetString(PyExc_TypeError, "__annotate__ must return a dict");
+        Py_DECREF(result);
+        return NULL;
+    }
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_annotations, __Pyx_NewRef(result));
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static PyObject *__Pyx_CyFunction_annotate_impl(PyObject *self, PyObject *arg) {
+    CYTHON_UNUSED_VAR(arg);
+    if (unlikely(!self)) {
+        PyErr_SetString(PyExc_SystemError, "cython __annotate__ called without 'self' argument");
+        return NULL;
+    }
+    PyObject *result;
+    if (Py_EnterRecursiveCall(" in cyfunction annotate")) {
+        return NULL;
+    }
+    result = __Pyx_CyFunction_get_annotations(self, NULL);
+    Py_LeaveRecursiveCall();
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotate(PyObject *op_in, void *context);
+static int
+__Pyx_CyFunction_set_annotate(PyObject *op_in, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (value == NULL) {
+        PyErr_SetString(PyExc_TypeError, "__annotate__ cannot be deleted");
+        return -1;
+    }
+    if (unlikely(value != Py_None && !PyCallable_Check(value))) {
+        PyErr_SetString(PyExc_TypeError, "__annotate__ must be callable or None");
+        return -1;
+    }
+    if (unlikely(__Pyx_TypeCheck(value, &PyCFunction_Type))) {
+#if !CYTHON_ASSUME_SAFE_MACROS && !CYTHON_COMPILING_IN_PYPY
+        PyCFunction cfunction = PyCFunction_GetFunction(value);
+        if (unlikely(!cfunction)) return -1;
+        PyObject *value_self = PyCFunction_GetSelf(value);
+        if (unlikely(!value_self && PyErr_Occurred())) return -1;
+#else
+        PyCFunction cfunction = PyCFunction_GET_FUNCTION(value);
+        PyObject *value_self = PyCFunction_GET_SELF(value);
+#endif
+        if (cfunction == __Pyx_CyFunction_annotate_impl && value_self == op_in) {
+            return __Pyx_CyFunction_set_annotate_in_dict_if_exists(op_in, NULL);
+        }
+    }
+    if (value != Py_None) {
+        __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+        __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+        Py_CLEAR(op->func_annotations);
+        __Pyx_END_CRITICAL_SECTION();
+    }
+    return __Pyx_CyFunction_set_annotate_in_dict(op_in, value);
+}
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+static PyObject *
+__Pyx_CyFunction_get_is_coroutine_value(__pyx_CyFunctionObject *op) {
+    int is_coroutine = op->flags & __Pyx_CYFUNCTION_COROUTINE;
+    if (is_coroutine) {
+        PyObject *is_coroutine_value, *module, *fromlist, *marker = __pyx_mstate_global->__pyx_n_u_is_coroutine;
+        fromlist = PyList_New(1);
+        if (unlikely(!fromlist)) return NULL;
+        Py_INCREF(marker);
+#if CYTHON_ASSUME_SAFE_MACROS
+        PyList_SET_ITEM(fromlist, 0, marker);
+#else
+        if (unlikely(PyList_SetItem(fromlist, 0, marker) < 0)) {
+            Py_DECREF(fromlist);
+            return NULL;
+        }
+#endif
+        module = PyImport_ImportModuleLevelObject(__pyx_mstate_global->__pyx_n_u_asyncio_coroutines, NULL, NULL, fromlist, 0);
+        Py_DECREF(fromlist);
+        if (unlikely(!module)) {
+            goto ignore_or_error;
+        }
+        is_coroutine_value = __Pyx_PyObject_GetAttrStr(module, marker);
+        Py_DECREF(module);
+        if (likely(is_coroutine_value)) {
+            return is_coroutine_value;
+        }
+ignore_or_error:
+        if (!__Pyx_IgnoreException(PyExc_Exception)) {
+            return NULL;
+        }
+    }
+    return __Pyx_PyBool_FromLong(is_coroutine);
+}
+static PyObject *
+__Pyx_CyFunction_get_is_coroutine(PyObject *op_in, void *context) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject *result;
+    CYTHON_UNUSED_VAR(context);
+    if (op->func_is_coroutine) {
+        return __Pyx_NewRef(op->func_is_coroutine);
+    }
+    result = __Pyx_CyFunction_get_is_coroutine_value(op);
+    if (unlikely(!result))
+        return NULL;
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    if (op->func_is_coroutine) {
+        Py_DECREF(result);
+        result = __Pyx_NewRef(op->func_is_coroutine);
+    } else {
+        op->func_is_coroutine = __Pyx_NewRef(result);
+    }
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+#endif
+static void __Pyx_CyFunction_raise_argument_count_error(PyObject *func, const char* message, Py_ssize_t size) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *py_name = __Pyx_CyFunction_get_name(func, NULL);
+    if (!py_name) return;
+    PyErr_Format(PyExc_TypeError,
+        "%.200S() %s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+        py_name, message, size);
+    Py_DECREF(py_name);
+#else
+    const char* name = ((PyCFunctionObject*)func)->m_ml->ml_name;
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() %s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+        name, message, size);
+#endif
+}
+static void __Pyx_CyFunction_raise_type_error(PyObject *func, const char* message) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *py_name = __Pyx_CyFunction_get_name(func, NULL);
+    if (!py_name) return;
+    PyErr_Format(PyExc_TypeError,
+        "%.200S() %s",
+        py_name, message);
+    Py_DECREF(py_name);
+#else
+    const char* name = ((PyCFunctionObject*)func)->m_ml->ml_name;
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() %s",
+        name, message);
+#endif
+}
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *
+__Pyx_CyFunction_get_module(PyObject *op_in, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_INCREF(op->func_module);
+    return op->func_module;
+}
+static int
+__Pyx_CyFunction_set_module(PyObject *op_in, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    PyObject *old = op->func_module;
+    op->func_module = value;
+    Py_DECREF(old);
+    return 0;
+}
+#endif
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {"func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {"__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {"func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {"__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {"__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+    {"func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)PyObject_GenericSetDict, 0, 0},
+    {"__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)PyObject_GenericSetDict, 0, 0},
+#else
+    {"func_dict", (getter)PyObject_GenericGetDict, (setter)PyObject_GenericSetDict, 0, 0},
+    {"__dict__", (getter)PyObject_GenericGetDict, (setter)PyObject_GenericSetDict, 0, 0},
+#endif
+    {"func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {"__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {"func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {"__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {"func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {"__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {"func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {"__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {"__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {"__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {"__annotate__", (getter)__Pyx_CyFunction_get_annotate, (setter)__Pyx_CyFunction_set_annotate, 0, 0},
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+    {"_is_coroutine", (getter)__Pyx_CyFunction_get_is_coroutine, 0, 0, 0},
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {"__module__", (getter)__Pyx_CyFunction_get_module, (setter)__Pyx_CyFunction_set_module, 0, 0},
+#endif
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    {"__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), 0, 0},
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    {"__dictoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_dict),
+        __PYX_SHARED_RELATIVE_OFFSET | READONLY, 0},
+#endif
+#if CYTHON_VECTORCALL
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+    {"__vectorcalloffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_vectorcall),
+        __PYX_SHARED_RELATIVE_OFFSET | READONLY, 0},
+#else
+    {"__vectorcalloffset__", T_PYSSIZET, offsetof(PyCFunctionObject, vectorcall), READONLY, 0},
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {"__weaklistoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_weakreflist),
+        __PYX_SHARED_RELATIVE_OFFSET | READONLY, 0},
+#else
+    {"__weaklistoffset__", T_PYSSIZET, offsetof(PyCFunctionObject, m_weakreflist), READONLY, 0},
+#endif
+#endif
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(PyObject *m_in, PyObject *args)
+{
+    PyObject *result = NULL;
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(m_in);
+    CYTHON_UNUSED_VAR(args);
+    __Pyx_BEGIN_CRITICAL_SECTION(m_in);
+    Py_INCREF(m->func_qualname);
+    result = m->func_qualname;
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__annotate_cython__", __Pyx_CyFunction_annotate_impl, METH_O,
+        "Placeholder __annotate__ function to allow 'functools.wraps' to work "
+        "on Cython functions."},
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_NOARGS, 0},
+    {0, 0, 0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_get_annotate(PyObject *op_in, void *context) {
+    PyObject *annotate = NULL;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(__Pyx_CyFunction_get_annotate_from_dict_if_exists(op_in, &annotate) < 0)) return NULL;
+    if (annotate) return annotate;
+    PyObject *method = PyCFunction_New(
+        &__pyx_CyFunction_methods[0],
+        op_in);
+    return method;
+}
+#if CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) (((PyCFunctionObject*)cyfunc)->m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(PyObject *op_in,
+                                       PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    __pyx_CyFunctionObject* op = __Pyx_as_CyFunctionObject(op_in);
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunctionObject *cf = (PyCFunctionObject*) op;
+#endif
+    if (unlikely(op == NULL))
+        return NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    op->func_methoddef = ml;
+    Py_INCREF(module);
+    op->func_module = module;
+#endif
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    cf->m_ml = ml;
+    cf->m_self = (PyObject *) op;
+#endif
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    Py_XINCREF(module);
+    cf->m_module = module;
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    op->func_dict = NULL;
+#endif
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    op->func_classobj = NULL;
+#else
+    ((PyCMethodObject*)op)->mm_class = NULL;
+#endif
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+    op->func_is_coroutine = NULL;
+#endif
+#if CYTHON_VECTORCALL
+    switch (ml->ml_flags & (METH_VARARGS | METH_FASTCALL | METH_NOARGS | METH_O | METH_KEYWORDS | METH_METHOD)) {
+    case METH_NOARGS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_NOARGS;
+        break;
+    case METH_O:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_O;
+        break;
+    case METH_METHOD | METH_FASTCALL | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD;
+        break;
+    case METH_FASTCALL | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS;
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = NULL;
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
+        Py_DECREF(op_in);
+        return NULL;
+    }
+#endif
+    return op_in;
+}
+static int __Pyx__CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_CLEAR(m->func_module);
+#else
+    Py_CLEAR(((PyCFunctionObject*)m)->m_module);
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    Py_CLEAR(m->func_dict);
+#elif PY_VERSION_HEX < 0x030d0000
+    _PyObject_ClearManagedDict((PyObject*)m);
+#else
+    PyObject_ClearManagedDict((PyObject*)m);
+#endif
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_CLEAR(m->func_classobj);
+#else
+    {
+        PyObject *cls = (PyObject*) ((PyCMethodObject *) (m))->mm_class;
+        ((PyCMethodObject *) (m))->mm_class = NULL;
+        Py_XDECREF(cls);
+    }
+#endif
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+    Py_CLEAR(m->func_is_coroutine);
+#endif
+    Py_CLEAR(m->defaults);
+    return 0;
+}
+static int
+__Pyx_CyFunction_clear(PyObject *m)
+{
+    return __Pyx__CyFunction_clear(__Pyx_as_CyFunctionObject(m));
+}
+static void __Pyx__CyFunction_dealloc(PyObject *m)
+{
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(m);
+    if (__Pyx_CyFunction_weakreflist(cyfunc) != NULL)
+        PyObject_ClearWeakRefs(m);
+    __Pyx__CyFunction_clear(cyfunc);
+    __Pyx_PyHeapTypeObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(PyObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(PyObject *m_in, visitproc visit, void *arg)
+{
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(m_in);
+    {
+        int e = __Pyx_call_type_traverse(m_in, 1, visit, arg);
+        if (e) return e;
+    }
+    Py_VISIT(m->func_closure);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_VISIT(m->func_module);
+#else
+    Py_VISIT(((PyCFunctionObject*)m)->m_module);
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    Py_VISIT(m->func_dict);
+#else
+    {
+        int e =
+#if PY_VERSION_HEX < 0x030d0000
+            _PyObject_VisitManagedDict
+#else
+            PyObject_VisitManagedDict
+#endif
+                ((PyObject*)m, visit, arg);
+        if (e != 0) return e;
+    }
+#endif
+    __Pyx_VISIT_CONST(m->func_name);
+    __Pyx_VISIT_CONST(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    __Pyx_VISIT_CONST(m->func_code);
+    Py_VISIT(__Pyx__CyFunction_GetClassObj(m));
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    Py_VISIT(m->func_annotations);
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+    Py_VISIT(m->func_is_coroutine);
+#endif
+    Py_VISIT(m->defaults);
+    return 0;
+}
+static PyObject*
+__Pyx_CyFunction_repr(PyObject *op_in)
+{
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    PyObject *repr;
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    repr = PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+    __Pyx_END_CRITICAL_SECTION();
+    return repr;
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    int flags = cyfunc->func_methoddef->ml_flags;
+#else
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    int flags = f->m_ml->ml_flags;
+#endif
+    Py_ssize_t size;
+    switch (flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void(*)(void))meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+#if CYTHON_ASSUME_SAFE_SIZE
+            size = PyTuple_GET_SIZE(arg);
+#else
+            size = PyTuple_Size(arg);
+            if (unlikely(size < 0)) return NULL;
+#endif
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            __Pyx_CyFunction_raise_argument_count_error(
+                func,
+                "takes no arguments", size);
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+#if CYTHON_ASSUME_SAFE_SIZE
+            size = PyTuple_GET_SIZE(arg);
+#else
+            size = PyTuple_Size(arg);
+            if (unlikely(size < 0)) return NULL;
+#endif
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = __Pyx_PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+            __Pyx_CyFunction_raise_argument_count_error(
+                func,
+                "takes exactly one argument", size);
+            return NULL;
+        }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
+        return NULL;
+    }
+    __Pyx_CyFunction_raise_type_error(
+        func, "takes no keyword arguments");
+    return NULL;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    result = __Pyx_CyFunction_CallMethod(func, func, arg, kw);
+    return result;
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+#if CYTHON_VECTORCALL
+     __pyx_vectorcallfunc vc = __Pyx_CyFunction_func_vectorcall(cyfunc);
+    if (vc) {
+#if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+        return __Pyx_PyVectorcall_FastCallDict(func, vc, &PyTuple_GET_ITEM(args, 0), (size_t)PyTuple_GET_SIZE(args), kw);
+#else
+        (void) &__Pyx_PyVectorcall_FastCallDict;
+        return PyVectorcall_Call(func, args, kw);
+#endif
+    }
+#endif
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+#if CYTHON_ASSUME_SAFE_SIZE
+        argc = PyTuple_GET_SIZE(args);
+#else
+        argc = PyTuple_Size(args);
+        if (unlikely(argc < 0)) return NULL;
+#endif
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
+    }
+    return result;
+}
+#if CYTHON_VECTORCALL
+static CYTHON_INLINE int __Pyx_CyFunction_Vectorcall_CheckArgs(PyObject *func, __pyx_CyFunctionObject *cyfunc, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int ret = 0;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        if (unlikely(nargs < 1)) {
+            __Pyx_CyFunction_raise_type_error(
+                func, "needs an argument");
+            return -1;
+        }
+        ret = 1;
+    }
+    if (unlikely(kwnames) && unlikely(__Pyx_PyTuple_GET_SIZE(kwnames))) {
+        __Pyx_CyFunction_raise_type_error(
+            func, "takes no keyword arguments");
+        return -1;
+    }
+    return ret;
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, kwnames)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = func;
+        break;
+    default:
+        return NULL;
+    }
+    if (unlikely(nargs != 0)) {
+        __Pyx_CyFunction_raise_argument_count_error(
+            func, "takes no arguments", nargs);
+        return NULL;
+    }
+    return meth(self, NULL);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, kwnames)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = func;
+        break;
+    default:
+        return NULL;
+    }
+    if (unlikely(nargs != 1)) {
+        __Pyx_CyFunction_raise_argument_count_error(
+            func, "takes exactly one argument", nargs);
+        return NULL;
+    }
+    return meth(self, args[0]);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = func;
+        break;
+    default:
+        return NULL;
+    }
+    return ((__Pyx_PyCFunctionFastWithKeywords)(void(*)(void))meth)(self, args, nargs, kwnames);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    PyTypeObject *cls = (PyTypeObject *) __Pyx__CyFunction_GetClassObj(cyfunc);
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = func;
+        break;
+    default:
+        return NULL;
+    }
+    #if PY_VERSION_HEX < 0x030e00A6
+    size_t nargs_value = (size_t) nargs;
+    #else
+    Py_ssize_t nargs_value = nargs;
+    #endif
+    return ((__Pyx_PyCMethod)(void(*)(void))meth)(self, cls, args, nargs_value, kwnames);
+}
+#endif
+static PyType_Slot __pyx_CyFunctionType_slots[] = {
+    {Py_tp_dealloc, (void *)__Pyx_CyFunction_dealloc},
+    {Py_tp_repr, (void *)__Pyx_CyFunction_repr},
+    {Py_tp_call, (void *)__Pyx_CyFunction_CallAsMethod},
+    {Py_tp_traverse, (void *)__Pyx_CyFunction_traverse},
+    {Py_tp_clear, (void *)__Pyx_CyFunction_clear},
+    {Py_tp_methods, (void *)__pyx_CyFunction_methods},
+    {Py_tp_members, (void *)__pyx_CyFunction_members},
+    {Py_tp_getset, (void *)__pyx_CyFunction_getsets},
+    {Py_tp_descr_get, (void *)__Pyx_PyMethod_New},
+    {0, 0},
+};
+static PyType_Spec __pyx_CyFunctionType_spec = {
+    __PYX_TYPE_MODULE_PREFIX "cython_function_or_method",
+    __PYX_SHARED_SIZEOF(__pyx_CyFunctionObject),
+    0,
+#ifdef Py_TPFLAGS_METHOD_DESCRIPTOR
+    Py_TPFLAGS_METHOD_DESCRIPTOR |
+#endif
+#if CYTHON_VECTORCALL
+#if defined(Py_TPFLAGS_HAVE_VECTORCALL)
+    Py_TPFLAGS_HAVE_VECTORCALL |
+#elif defined(_Py_TPFLAGS_HAVE_VECTORCALL)
+    _Py_TPFLAGS_HAVE_VECTORCALL |
+#endif
+#endif // CYTHON_VECTORCALL
+#if PY_VERSION_HEX >= 0x030C0000 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_TPFLAGS_MANAGED_DICT |
+#endif
+    Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_DISALLOW_INSTANTIATION |
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    __pyx_CyFunctionType_slots
+};
+static int __pyx_CyFunction_init(PyObject *module) {
+    __pyx_mstatetype *mstate = __Pyx_PyModule_GetState(module);
+    mstate->__pyx_CyFunctionType = __Pyx_FetchCommonTypeFromSpec(
+        mstate->__pyx_CommonTypesMetaclassType, module, &__pyx_CyFunctionType_spec, NULL);
+    if (unlikely(mstate->__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    (void)&__Pyx_Get_CyFunction_Type;
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(PyObject, __pyx_mstate_global->__pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
+}
+static PyTypeObject *__Pyx_Get_CyFunction_Type(void) {
+    PyTypeObject *tp = __pyx_mstate_global->__pyx_CyFunctionType;
+    Py_INCREF((PyObject*)tp);
+    return tp;
+}
+
+/* CLineInTraceback (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+#define __Pyx_PyProbablyModule_GetDict(o) __Pyx_XNewRef(PyModule_GetDict(o))
+#elif !CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyProbablyModule_GetDict(o) PyObject_GenericGetDict(o, NULL);
+#else
+PyObject* __Pyx_PyProbablyModule_GetDict(PyObject *o) {
+    PyObject **dict_ptr = _PyObject_GetDictPtr(o);
+    return dict_ptr ? __Pyx_XNewRef(*dict_ptr) : NULL;
+}
+#endif
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+    PyObject *use_cline = NULL;
+    PyObject *ptype, *pvalue, *ptraceback;
+    PyObject *cython_runtime_dict;
+    CYTHON_MAYBE_UNUSED_VAR(tstate);
+    if (unlikely(!__pyx_mstate_global->__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+    cython_runtime_dict = __Pyx_PyProbablyModule_GetDict(__pyx_mstate_global->__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, cython_runtime_dict,
+            __Pyx_PyDict_SetDefault(cython_runtime_dict, __pyx_mstate_global->__pyx_n_u_cline_in_traceback, Py_False))
+    }
+    if (use_cline == NULL || use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    Py_XDECREF(use_cline);
+    Py_XDECREF(cython_runtime_dict);
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache (used by AddTraceback) */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static __Pyx_CachedCodeObjectType *__pyx__find_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line) {
+    __Pyx_CachedCodeObjectType* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!code_cache->entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if (unlikely(pos >= code_cache->count) || unlikely(code_cache->entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = code_cache->entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__find_code_object;
+    return NULL; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just miss.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type old_count = __pyx_atomic_incr_acq_rel(&code_cache->accessor_count);
+    if (old_count < 0) {
+        __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+        return NULL;
+    }
+#endif
+    __Pyx_CachedCodeObjectType *result = __pyx__find_code_object(code_cache, code_line);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+#endif
+    return result;
+#endif
+}
+static void __pyx__insert_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line, __Pyx_CachedCodeObjectType* code_object)
+{
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = code_cache->entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            code_cache->entries = entries;
+            code_cache->max_count = 64;
+            code_cache->count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if ((pos < code_cache->count) && unlikely(code_cache->entries[pos].code_line == code_line)) {
+        __Pyx_CachedCodeObjectType* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_INCREF(code_object);
+        Py_DECREF(tmp);
+        return;
+    }
+    if (code_cache->count == code_cache->max_count) {
+        int new_max = code_cache->max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            code_cache->entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        code_cache->entries = entries;
+        code_cache->max_count = new_max;
+    }
+    for (i=code_cache->count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    code_cache->count++;
+    Py_INCREF(code_object);
+}
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__insert_code_object;
+    return; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just fail.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type expected = 0;
+    if (!__pyx_atomic_int_cmp_exchange(&code_cache->accessor_count, &expected, INT_MIN)) {
+        return;
+    }
+#endif
+    __pyx__insert_code_object(code_cache, code_line, code_object);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_sub(&code_cache->accessor_count, INT_MIN);
+#endif
+#endif
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API && !defined(PYPY_VERSION)
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
+                                                       PyObject *firstlineno, PyObject *name) {
+    PyObject *replace = NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
+    replace = PyObject_GetAttrString(code, "replace");
+    if (likely(replace)) {
+        PyObject *result = PyObject_Call(replace, __pyx_mstate_global->__pyx_empty_tuple, scratch_dict);
+        Py_DECREF(replace);
+        return result;
+    }
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
+    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
+    PyObject *exc_type, *exc_value, *exc_traceback;
+    int success = 0;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+    }
+    __Pyx_PyErr_FetchException(&exc_type, &exc_value, &exc_traceback);
+    code_object = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!code_object) {
+        code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
+        if (unlikely(!code_object)) goto bad;
+        py_py_line = PyLong_FromLong(py_line);
+        if (unlikely(!py_py_line)) goto bad;
+        if (c_line) {
+            py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        } else {
+            py_funcname = PyUnicode_FromString(funcname);
+        }
+        if (unlikely(!py_funcname)) goto bad;
+        dict = PyDict_New();
+        if (unlikely(!dict)) goto bad;
+        {
+            PyObject *old_code_object = code_object;
+            code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
+            Py_DECREF(old_code_object);
+        }
+        if (unlikely(!code_object)) goto bad;
+        __pyx_insert_code_object(c_line ? -c_line : py_line, code_object);
+    } else {
+        dict = PyDict_New();
+    }
+    getframe = PySys_GetObject("_getframe");
+    if (unlikely(!getframe)) goto bad;
+    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
+    frame = PyEval_EvalCode(code_object, dict, dict);
+    if (unlikely(!frame) || frame == Py_None) goto bad;
+    success = 1;
+  bad:
+    __Pyx_PyErr_RestoreException(exc_type, exc_value, exc_traceback);
+    Py_XDECREF(code_object);
+    Py_XDECREF(py_py_line);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(dict);
+    Py_XDECREF(replace);
+    if (success) {
+        PyTraceBack_Here(
+            (struct _frame*)frame);
+    }
+    Py_XDECREF(frame);
+}
+#else
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    if (c_line) {
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+    }
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    Py_XDECREF(py_funcname);
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_mstate_global->__pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+#endif
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static int __Pyx_LargePyLong___Pyx_PyLong_As_int(PyObject *x);
+static int __Pyx_raise_neg_overflow___Pyx_PyLong_As_int(void) {
+    const char* type_name = "int";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (int) -1;
+}
+static int __Pyx_raise_overflow___Pyx_PyLong_As_int(void) {
+    const char* type_name = "int";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (int) -1;
+}
+static CYTHON_INLINE int __Pyx_PyULong___Pyx_PyLong_As_int(PyObject *x) {
+    const int is_unsigned = 1;
+#if CYTHON_USE_PYLONG_INTERNALS
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (int) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
+#endif
+    if ((sizeof(int) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static CYTHON_INLINE int __Pyx_PySLong___Pyx_PyLong_As_int(PyObject *x) {
+    const int is_unsigned = 0;
+#if CYTHON_USE_PYLONG_INTERNALS
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        {}
+    }
+#endif
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(int) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(int) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+    } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static int __Pyx_LargePyLong___Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    int val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
+    } else {
+        ret = 0;
+    }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
+#else
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (int) -1;
+        assert(PyLong_CheckExact(v));
+    }
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
+            return (int) -1;
+        }
+        is_negative = result == 1;
+    }
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to int");
+        return (int) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (int) -1;
+    } else {
+        stepval = v;
+    }
+    v = NULL;
+    val = (int) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((int) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((int) idigit) << bits;
+    }
+    if (!is_unsigned) {
+        if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
+    }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
+#endif
+    if (unlikely(ret))
+        return (int) -1;
+    return val;
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static CYTHON_INLINE int __Pyx_PyLong___Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else
+        #endif
+        {
+            return __Pyx_PyULong___Pyx_PyLong_As_int(x);
+        }
+    } else {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else
+        #endif
+        {
+            return __Pyx_PySLong___Pyx_PyLong_As_int(x);
+        }
+    }
+#if CYTHON_USE_PYLONG_INTERNALS
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+#endif
+}
+static int __Pyx_NonPyLong___Pyx_PyLong_As_int(PyObject *x) {
+    int val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (int) -1;
+    val = __Pyx_PyLong_As_int(tmp);
+    Py_DECREF(tmp);
+    return val;
+}
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+    if (likely(PyLong_Check(x))) {
+        return __Pyx_PyLong___Pyx_PyLong_As_int(x);
+    } else {
+        return __Pyx_NonPyLong___Pyx_PyLong_As_int(x);
+    }
+}
+
+/* PyObjectVectorcallKwds (used by PyObjectVectorcallMethodKwds) */
+#if CYTHON_VECTORCALL
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject *kwnames, Py_ssize_t i) {
+    PyObject *key = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+#if !CYTHON_ASSUME_SAFE_MACROS
+    if (unlikely(!key)) return -1;
+#endif
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return 0;
+}
+#else
+CYTHON_UNUSED static PyObject *__Pyx_MakeKwargDict(PyObject **keys, PyObject **values, Py_ssize_t n) {
+    PyObject *out = PyDict_New();
+    if (unlikely(!out)) return NULL;
+    for (Py_ssize_t i=0; i<n; ++i) {
+        if (unlikely(PyDict_SetItem(out, keys[i], values[i]) < 0)) {
+            Py_DECREF(out);
+            return NULL;
+        }
+    }
+    return out;
+}
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject **kwnames, Py_ssize_t i) {
+    PyObject *key = kwnames[i];
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return 0;
+}
+#endif
+
+/* PyObjectVectorcallMethodKwds (used by CIntToPy) */
+#if !CYTHON_VECTORCALL
+static PyObject *__Pyx_Object_VectorcallMethodKwds(PyObject *name, PyObject *const *args, size_t nargsf, PyObject *kwnames) {
+    PyObject *result;
+    PyObject *obj = PyObject_GetAttr(args[0], name);
+    if (unlikely(!obj))
+        return NULL;
+    result = __Pyx_Object_VectorcallKwds(obj, args+1, nargsf-1, kwnames);
+    Py_DECREF(obj);
+    return result;
+}
+#endif
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From___pyx_anon_enum(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
+    }
+}
+
+/* CIntFromPy */
+static long __Pyx_LargePyLong___Pyx_PyLong_As_long(PyObject *x);
+static long __Pyx_raise_neg_overflow___Pyx_PyLong_As_long(void) {
+    const char* type_name = "long";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (long) -1;
+}
+static long __Pyx_raise_overflow___Pyx_PyLong_As_long(void) {
+    const char* type_name = "long";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (long) -1;
+}
+static CYTHON_INLINE long __Pyx_PyULong___Pyx_PyLong_As_long(PyObject *x) {
+    const int is_unsigned = 1;
+#if CYTHON_USE_PYLONG_INTERNALS
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (long) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
+#endif
+    if ((sizeof(long) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_long(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static CYTHON_INLINE long __Pyx_PySLong___Pyx_PyLong_As_long(PyObject *x) {
+    const int is_unsigned = 0;
+#if CYTHON_USE_PYLONG_INTERNALS
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        {}
+    }
+#endif
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(long) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(long) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+    } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_long(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static long __Pyx_LargePyLong___Pyx_PyLong_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    long val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
+    } else {
+        ret = 0;
+    }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
+#else
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (long) -1;
+        assert(PyLong_CheckExact(v));
+    }
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
+            return (long) -1;
+        }
+        is_negative = result == 1;
+    }
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to long");
+        return (long) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (long) -1;
+    } else {
+        stepval = v;
+    }
+    v = NULL;
+    val = (long) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((long) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((long) idigit) << bits;
+    }
+    if (!is_unsigned) {
+        if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
+    }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
+#endif
+    if (unlikely(ret))
+        return (long) -1;
+    return val;
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static CYTHON_INLINE long __Pyx_PyLong___Pyx_PyLong_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else
+        #endif
+        {
+            return __Pyx_PyULong___Pyx_PyLong_As_long(x);
+        }
+    } else {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else
+        #endif
+        {
+            return __Pyx_PySLong___Pyx_PyLong_As_long(x);
+        }
+    }
+#if CYTHON_USE_PYLONG_INTERNALS
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+#endif
+}
+static long __Pyx_NonPyLong___Pyx_PyLong_As_long(PyObject *x) {
+    long val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (long) -1;
+    val = __Pyx_PyLong_As_long(tmp);
+    Py_DECREF(tmp);
+    return val;
+}
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
+    if (likely(PyLong_Check(x))) {
+        return __Pyx_PyLong___Pyx_PyLong_As_long(x);
+    } else {
+        return __Pyx_NonPyLong___Pyx_PyLong_As_long(x);
+    }
+}
+
+/* GetRuntimeVersion */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+void __Pyx_init_runtime_version(void) {
+    if (__Pyx_cached_runtime_version == 0) {
+        const char* rt_version = Py_GetVersion();
+        unsigned long version = 0;
+        unsigned long factor = 0x01000000UL;
+        unsigned int digit = 0;
+        int i = 0;
+        while (factor) {
+            while ('0' <= rt_version[i] && rt_version[i] <= '9') {
+                digit = digit * 10 + (unsigned int) (rt_version[i] - '0');
+                ++i;
+            }
+            version += factor * digit;
+            if (rt_version[i] != '.')
+                break;
+            digit = 0;
+            factor >>= 8;
+            ++i;
+        }
+        __Pyx_cached_runtime_version = version;
+    }
+}
+#endif
+static unsigned long __Pyx_get_runtime_version(void) {
+#if __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+    return Py_Version & ~0xFFUL;
+#else
+    return __Pyx_cached_runtime_version;
+#endif
+}
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer) {
+    const unsigned long MAJOR_MINOR = 0xFFFF0000UL;
+    if ((rt_version & MAJOR_MINOR) == (ct_version & MAJOR_MINOR))
+        return 0;
+    if (likely(allow_newer && (rt_version & MAJOR_MINOR) > (ct_version & MAJOR_MINOR)))
+        return 1;
+    {
+        char message[200];
+        PyOS_snprintf(message, sizeof(message),
+                      "compile time Python version %d.%d "
+                      "of module '%.100s' "
+                      "%s "
+                      "runtime version %d.%d",
+                       (int) (ct_version >> 24), (int) ((ct_version >> 16) & 0xFF),
+                       __Pyx_MODULE_NAME,
+                       (allow_newer) ? "was newer than" : "does not match",
+                       (int) (rt_version >> 24), (int) ((rt_version >> 16) & 0xFF)
+       );
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+}
+
+/* NewCodeObj */
+#if CYTHON_COMPILING_IN_LIMITED_API
+    static PyObject* __Pyx__PyCode_New(int a, int p, int k, int l, int s, int f,
+                                       PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                       PyObject *fv, PyObject *cell, PyObject* fn,
+                                       PyObject *name, int fline, PyObject *lnos) {
+        PyObject *exception_table = NULL;
+        PyObject *types_module=NULL, *code_type=NULL, *result=NULL;
+        #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+        PyObject *version_info;
+        PyObject *py_minor_version = NULL;
+        #endif
+        long minor_version = 0;
+        #if __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+        minor_version = 11;
+        #else
+        if (!(version_info = PySys_GetObject("version_info"))) goto end;
+        if (!(py_minor_version = PySequence_GetItem(version_info, 1))) goto end;
+        minor_version = PyLong_AsLong(py_minor_version);
+        Py_DECREF(py_minor_version);
+        if (minor_version == -1 && PyErr_Occurred()) goto end;
+        #endif
+        if (!(types_module = PyImport_ImportModule("types"))) goto end;
+        if (!(code_type = PyObject_GetAttrString(types_module, "CodeType"))) goto end;
+        if (minor_version <= 10) {
+            result = PyObject_CallFunction(code_type, "iiiiiiOOOOOOiOOO", a,p, k, l, s, f, code,
+                          c, n, v, fn, name, fline, lnos, fv, cell);
+        } else {
+            if (!(exception_table = PyBytes_FromStringAndSize(NULL, 0))) goto end;
+            result = PyObject_CallFunction(code_type, "iiiiiiOOOOOOOiOOOO", a,p, k, l, s, f, code,
+                          c, n, v, fn, name, name, fline, lnos, exception_table, fv, cell);
+        }
+    end:
+        Py_XDECREF(code_type);
+        Py_XDECREF(exception_table);
+        Py_XDECREF(types_module);
+        if (!result) {
+            PyObject *exc_type, *exc_value, *exc_tb;
+            PyErr_Fetch(&exc_type, &exc_value, &exc_tb);
+            if (PyErr_WarnFormat(
+                    PyExc_RuntimeWarning, 1,
+                    "Code object creation failed in Cython module: %S\nTry recompiling with a more recent version of Cython.",
+                    exc_value ? exc_value : exc_type) == 0) {
+                result = Py_None;
+                Py_INCREF(result);
+            }
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+        }
+        return result;
+    }
+#elif PY_VERSION_HEX >= 0x030B0000
+  static PyCodeObject* __Pyx__PyCode_New(int a, int p, int k, int l, int s, int f,
+                                         PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                         PyObject *fv, PyObject *cell, PyObject* fn,
+                                         PyObject *name, int fline, PyObject *lnos) {
+    PyCodeObject *result;
+    result =
+      #if PY_VERSION_HEX >= 0x030C0000
+        PyUnstable_Code_NewWithPosOnlyArgs
+      #else
+        PyCode_NewWithPosOnlyArgs
+      #endif
+        (a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, name, fline, lnos, __pyx_mstate_global->__pyx_empty_bytes);
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030c00A1
+    if (likely(result))
+        result->_co_firsttraceable = 0;
+    #endif
+    return result;
+  }
+#elif !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx__PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_NewWithPosOnlyArgs(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#else
+  #define __Pyx__PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+static PyObject* __Pyx_PyCode_New(
+        const __Pyx_PyCode_New_function_description descr,
+        PyObject * const *varnames,
+        PyObject *filename,
+        PyObject *funcname,
+        PyObject *line_table,
+        PyObject *tuple_dedup_map
+) {
+    PyObject *code_obj = NULL, *varnames_tuple_dedup = NULL, *code_bytes = NULL;
+    Py_ssize_t var_count = (Py_ssize_t) descr.nlocals;
+    PyObject *varnames_tuple = PyTuple_New(var_count);
+    if (unlikely(!varnames_tuple)) return NULL;
+    for (Py_ssize_t i=0; i < var_count; i++) {
+        Py_INCREF(varnames[i]);
+        if (__Pyx_PyTuple_SET_ITEM(varnames_tuple, i, varnames[i]) != (0)) goto done;
+    }
+    #if CYTHON_COMPILING_IN_LIMITED_API
+    varnames_tuple_dedup = PyDict_GetItem(tuple_dedup_map, varnames_tuple);
+    if (!varnames_tuple_dedup) {
+        if (unlikely(PyDict_SetItem(tuple_dedup_map, varnames_tuple, varnames_tuple) < 0)) goto done;
+        varnames_tuple_dedup = varnames_tuple;
+    }
+    #else
+    varnames_tuple_dedup = PyDict_SetDefault(tuple_dedup_map, varnames_tuple, varnames_tuple);
+    if (unlikely(!varnames_tuple_dedup)) goto done;
+    #endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(varnames_tuple_dedup);
+    #endif
+    if (__PYX_LIMITED_VERSION_HEX >= (0x030b0000) && line_table != NULL && !CYTHON_COMPILING_IN_GRAAL) {
+        Py_ssize_t line_table_length = __Pyx_PyBytes_GET_SIZE(line_table);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(line_table_length == -1)) goto done;
+        #endif
+        Py_ssize_t code_len = (line_table_length * 2 + 4) & ~3LL;
+        code_bytes = PyBytes_FromStringAndSize(NULL, code_len);
+        if (unlikely(!code_bytes)) goto done;
+        char* c_code_bytes = PyBytes_AsString(code_bytes);
+        if (unlikely(!c_code_bytes)) goto done;
+        memset(c_code_bytes, 0, (size_t) code_len);
+    }
+    code_obj = (PyObject*) __Pyx__PyCode_New(
+        (int) descr.argcount,
+        (int) descr.num_posonly_args,
+        (int) descr.num_kwonly_args,
+        (int) descr.nlocals,
+        0,
+        (int) descr.flags,
+        code_bytes ? code_bytes : __pyx_mstate_global->__pyx_empty_bytes,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        varnames_tuple_dedup,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        filename,
+        funcname,
+        (int) descr.first_line,
+        (__PYX_LIMITED_VERSION_HEX >= (0x030b0000) && line_table) ? line_table : __pyx_mstate_global->__pyx_empty_bytes
+    );
+done:
+    Py_XDECREF(code_bytes);
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_XDECREF(varnames_tuple_dedup);
+    #endif
+    Py_DECREF(varnames_tuple);
+    return code_obj;
+}
+
+#include <string.h>
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s) {
+    size_t len = strlen(s);
+    if (unlikely(len > (size_t) PY_SSIZE_T_MAX)) {
+        PyErr_SetString(PyExc_OverflowError, "byte string is too long");
+        return -1;
+    }
+    return (Py_ssize_t) len;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return PyByteArray_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {
+        const char* result;
+        Py_ssize_t unicode_length;
+        CYTHON_MAYBE_UNUSED_VAR(unicode_length); // only for __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        #if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+        if (unlikely(PyArg_Parse(o, "s#", &result, length) < 0)) return NULL;
+        #else
+        result = PyUnicode_AsUTF8AndSize(o, length);
+        #endif
+        #if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        unicode_length = PyUnicode_GetLength(o);
+        if (unlikely(unicode_length < 0)) return NULL;
+        if (unlikely(unicode_length != *length)) {
+            PyUnicode_AsASCIIString(o);
+            return NULL;
+        }
+        #endif
+        return result;
+    }
+#else
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+#endif
+}
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+    if (PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+    if (PyByteArray_Check(o)) {
+#if (CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS) || (CYTHON_COMPILING_IN_PYPY && (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE)))
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+#else
+        *length = PyByteArray_Size(o);
+        if (*length == -1) return NULL;
+        return PyByteArray_AsString(o);
+#endif
+    } else
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_LongWrongResultType(PyObject* result) {
+    __Pyx_TypeName result_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(result));
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!result_type_name)) goto bad;
+    #endif
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ").  "
+                "The ability to return an instance of a strict subclass of int is deprecated, "
+                "and may be removed in a future version of Python.",
+                result_type_name)) {
+            __Pyx_DECREF_TypeName(result_type_name);
+            goto bad;
+        }
+        __Pyx_DECREF_TypeName(result_type_name);
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ")",
+                 result_type_name);
+    __Pyx_DECREF_TypeName(result_type_name);
+bad:
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  PyObject *res = NULL;
+  if (likely(PyLong_Check(x)))
+      return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  if (likely(m && m->nb_int)) {
+      res = m->nb_int(x);
+  }
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+      res = PyNumber_Long(x);
+  }
+#endif
+  if (likely(res)) {
+      if (unlikely(!PyLong_CheckExact(res))) {
+          return __Pyx_PyNumber_LongWrongResultType(res);
+      }
+  }
+  else if (!PyErr_Occurred()) {
+      PyErr_SetString(PyExc_TypeError,
+                      "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyLong_AsSsize_t(PyObject* b) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    Py_ssize_t ival;
+    const Py_ssize_t size = __Pyx_PyLong_DigitCount(b);
+    const int is_neg = __Pyx_PyLong_IsNeg(b);
+    const digit* digits = __Pyx_PyLong_Digits(b);
+    if (size == 0) return 0;
+    #if SIZEOF_SIZE_T * 8 > 1 * PyLong_SHIFT
+    if (size == 1) {
+        ival = (Py_ssize_t) (((size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 2 * PyLong_SHIFT
+    if (size == 2) {
+        ival = (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 3 * PyLong_SHIFT
+    if (size == 3) {
+        ival = (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 4 * PyLong_SHIFT
+    if (size == 4) {
+        ival = (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+        return PyLong_AsSsize_t(b);
+    return is_neg ? -ival : ival;
+    #else
+    return PyLong_AsSsize_t(b);
+    #endif
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+    if (likely(PyLong_Check(b))) {
+        return __Pyx_PyLong_AsSsize_t(b);
+    } else {
+        Py_ssize_t ival;
+        PyObject *x = PyNumber_Index(b);
+        if (unlikely(!x)) return -1;
+        ival = __Pyx_PyLong_AsSsize_t(x);
+        Py_DECREF(x);
+        return ival;
+    }
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyLong_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b) {
+    CYTHON_UNUSED_VAR(b);
+    return __Pyx_NewRef(Py_None);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return __Pyx_NewRef(b ? Py_True: Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t ival) {
+    return PyLong_FromSize_t(ival);
+}
+
+
+/* MultiPhaseInitModuleState */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#ifndef CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#if (CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX >= 0x030C0000)
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 1
+#else
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 0
+#endif
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE && !CYTHON_ATOMICS
+#error "Module state with PEP489 requires atomics. Currently that's one of\
+ C11, C++11, gcc atomic intrinsics or MSVC atomic intrinsics"
+#endif
+#if !CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#define __Pyx_ModuleStateLookup_Lock()
+#define __Pyx_ModuleStateLookup_Unlock()
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+static PyMutex __Pyx_ModuleStateLookup_mutex = {0};
+#define __Pyx_ModuleStateLookup_Lock() PyMutex_Lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() PyMutex_Unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(__cplusplus) && __cplusplus >= 201103L
+#include <mutex>
+static std::mutex __Pyx_ModuleStateLookup_mutex;
+#define __Pyx_ModuleStateLookup_Lock() __Pyx_ModuleStateLookup_mutex.lock()
+#define __Pyx_ModuleStateLookup_Unlock() __Pyx_ModuleStateLookup_mutex.unlock()
+#elif defined(__STDC_VERSION__) && (__STDC_VERSION__ > 201112L) && !defined(__STDC_NO_THREADS__)
+#include <threads.h>
+static mtx_t __Pyx_ModuleStateLookup_mutex;
+static once_flag __Pyx_ModuleStateLookup_mutex_once_flag = ONCE_FLAG_INIT;
+static void __Pyx_ModuleStateLookup_initialize_mutex(void) {
+    mtx_init(&__Pyx_ModuleStateLookup_mutex, mtx_plain);
+}
+#define __Pyx_ModuleStateLookup_Lock()\
+  call_once(&__Pyx_ModuleStateLookup_mutex_once_flag, __Pyx_ModuleStateLookup_initialize_mutex);\
+  mtx_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() mtx_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(HAVE_PTHREAD_H)
+#include <pthread.h>
+static pthread_mutex_t __Pyx_ModuleStateLookup_mutex = PTHREAD_MUTEX_INITIALIZER;
+#define __Pyx_ModuleStateLookup_Lock() pthread_mutex_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() pthread_mutex_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(_WIN32)
+#include <Windows.h>  // synchapi.h on its own doesn't work
+static SRWLOCK __Pyx_ModuleStateLookup_mutex = SRWLOCK_INIT;
+#define __Pyx_ModuleStateLookup_Lock() AcquireSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() ReleaseSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#else
+#error "No suitable lock available for CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE.\
+ Requires C standard >= C11, or C++ standard >= C++11,\
+ or pthreads, or the Windows 32 API, or Python >= 3.13."
+#endif
+typedef struct {
+    int64_t id;
+    PyObject *module;
+} __Pyx_InterpreterIdAndModule;
+typedef struct {
+    char interpreter_id_as_index;
+    Py_ssize_t count;
+    Py_ssize_t allocated;
+    __Pyx_InterpreterIdAndModule table[1];
+} __Pyx_ModuleStateLookupData;
+#define __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE 32
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_int_type __Pyx_ModuleStateLookup_read_counter = 0;
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_ptr_type __Pyx_ModuleStateLookup_data = 0;
+#else
+static __Pyx_ModuleStateLookupData* __Pyx_ModuleStateLookup_data = NULL;
+#endif
+static __Pyx_InterpreterIdAndModule* __Pyx_State_FindModuleStateLookupTableLowerBound(
+        __Pyx_InterpreterIdAndModule* table,
+        Py_ssize_t count,
+        int64_t interpreterId) {
+    __Pyx_InterpreterIdAndModule* begin = table;
+    __Pyx_InterpreterIdAndModule* end = begin + count;
+    if (begin->id == interpreterId) {
+        return begin;
+    }
+    while ((end - begin) > __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+        __Pyx_InterpreterIdAndModule* halfway = begin + (end - begin)/2;
+        if (halfway->id == interpreterId) {
+            return halfway;
+        }
+        if (halfway->id < interpreterId) {
+            begin = halfway;
+        } else {
+            end = halfway;
+        }
+    }
+    for (; begin < end; ++begin) {
+        if (begin->id >= interpreterId) return begin;
+    }
+    return begin;
+}
+static PyObject *__Pyx_State_FindModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return NULL;
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData* data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+    {
+        __pyx_atomic_incr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        if (likely(data)) {
+            __Pyx_ModuleStateLookupData* new_data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_acquire(&__Pyx_ModuleStateLookup_data);
+            if (likely(data == new_data)) {
+                goto read_finished;
+            }
+        }
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        __Pyx_ModuleStateLookup_Lock();
+        __pyx_atomic_incr_relaxed(&__Pyx_ModuleStateLookup_read_counter);
+        data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+        __Pyx_ModuleStateLookup_Unlock();
+    }
+  read_finished:;
+#else
+    __Pyx_ModuleStateLookupData* data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_InterpreterIdAndModule* found = NULL;
+    if (unlikely(!data)) goto end;
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            found = data->table+interpreter_id;
+        }
+    } else {
+        found = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+    }
+  end:
+    {
+        PyObject *result=NULL;
+        if (found && found->id == interpreter_id) {
+            result = found->module;
+        }
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+#endif
+        return result;
+    }
+}
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static void __Pyx_ModuleStateLookup_wait_until_no_readers(void) {
+    while (__pyx_atomic_load(&__Pyx_ModuleStateLookup_read_counter) != 0);
+}
+#else
+#define __Pyx_ModuleStateLookup_wait_until_no_readers()
+#endif
+static int __Pyx_State_AddModuleInterpIdAsIndex(__Pyx_ModuleStateLookupData **old_data, PyObject* module, int64_t interpreter_id) {
+    Py_ssize_t to_allocate = (*old_data)->allocated;
+    while (to_allocate <= interpreter_id) {
+        if (to_allocate == 0) to_allocate = 1;
+        else to_allocate *= 2;
+    }
+    __Pyx_ModuleStateLookupData *new_data = *old_data;
+    if (to_allocate != (*old_data)->allocated) {
+         new_data = (__Pyx_ModuleStateLookupData *)realloc(
+            *old_data,
+            sizeof(__Pyx_ModuleStateLookupData)+(to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+        if (!new_data) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (Py_ssize_t i = new_data->allocated; i < to_allocate; ++i) {
+            new_data->table[i].id = i;
+            new_data->table[i].module = NULL;
+        }
+        new_data->allocated = to_allocate;
+    }
+    new_data->table[interpreter_id].module = module;
+    if (new_data->count < interpreter_id+1) {
+        new_data->count = interpreter_id+1;
+    }
+    *old_data = new_data;
+    return 0;
+}
+static void __Pyx_State_ConvertFromInterpIdAsIndex(__Pyx_ModuleStateLookupData *data) {
+    __Pyx_InterpreterIdAndModule *read = data->table;
+    __Pyx_InterpreterIdAndModule *write = data->table;
+    __Pyx_InterpreterIdAndModule *end = read + data->count;
+    for (; read<end; ++read) {
+        if (read->module) {
+            write->id = read->id;
+            write->module = read->module;
+            ++write;
+        }
+    }
+    data->count = write - data->table;
+    for (; write<end; ++write) {
+        write->id = 0;
+        write->module = NULL;
+    }
+    data->interpreter_id_as_index = 0;
+}
+static int __Pyx_State_AddModule(PyObject* module, CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    int result = 0;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *old_data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *old_data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_ModuleStateLookupData *new_data = old_data;
+    if (!new_data) {
+        new_data = (__Pyx_ModuleStateLookupData *)calloc(1, sizeof(__Pyx_ModuleStateLookupData));
+        if (!new_data) {
+            result = -1;
+            PyErr_NoMemory();
+            goto end;
+        }
+        new_data->allocated = 1;
+        new_data->interpreter_id_as_index = 1;
+    }
+    __Pyx_ModuleStateLookup_wait_until_no_readers();
+    if (new_data->interpreter_id_as_index) {
+        if (interpreter_id < __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+            result = __Pyx_State_AddModuleInterpIdAsIndex(&new_data, module, interpreter_id);
+            goto end;
+        }
+        __Pyx_State_ConvertFromInterpIdAsIndex(new_data);
+    }
+    {
+        Py_ssize_t insert_at = 0;
+        {
+            __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+                new_data->table, new_data->count, interpreter_id);
+            assert(lower_bound);
+            insert_at = lower_bound - new_data->table;
+            if (unlikely(insert_at < new_data->count && lower_bound->id == interpreter_id)) {
+                lower_bound->module = module;
+                goto end;  // already in table, nothing more to do
+            }
+        }
+        if (new_data->count+1 >= new_data->allocated) {
+            Py_ssize_t to_allocate = (new_data->count+1)*2;
+            new_data =
+                (__Pyx_ModuleStateLookupData*)realloc(
+                    new_data,
+                    sizeof(__Pyx_ModuleStateLookupData) +
+                    (to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+            if (!new_data) {
+                result = -1;
+                new_data = old_data;
+                PyErr_NoMemory();
+                goto end;
+            }
+            new_data->allocated = to_allocate;
+        }
+        ++new_data->count;
+        int64_t last_id = interpreter_id;
+        PyObject *last_module = module;
+        for (Py_ssize_t i=insert_at; i<new_data->count; ++i) {
+            int64_t current_id = new_data->table[i].id;
+            new_data->table[i].id = last_id;
+            last_id = current_id;
+            PyObject *current_module = new_data->table[i].module;
+            new_data->table[i].module = last_module;
+            last_module = current_module;
+        }
+    }
+  end:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, new_data);
+#else
+    __Pyx_ModuleStateLookup_data = new_data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return result;
+}
+static int __Pyx_State_RemoveModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *data = __Pyx_ModuleStateLookup_data;
+#endif
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            data->table[interpreter_id].module = NULL;
+        }
+        goto done;
+    }
+    {
+        __Pyx_ModuleStateLookup_wait_until_no_readers();
+        __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+        if (!lower_bound) goto done;
+        if (lower_bound->id != interpreter_id) goto done;
+        __Pyx_InterpreterIdAndModule *end = data->table+data->count;
+        for (;lower_bound<end-1; ++lower_bound) {
+            lower_bound->id = (lower_bound+1)->id;
+            lower_bound->module = (lower_bound+1)->module;
+        }
+    }
+    --data->count;
+    if (data->count == 0) {
+        free(data);
+        data = NULL;
+    }
+  done:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, data);
+#else
+    __Pyx_ModuleStateLookup_data = data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return 0;
+}
+#endif
+
+/* #### Code section: utility_code_pragmas_end ### */
+#ifdef _MSC_VER
+#pragma warning( pop )
+#endif
+
+
+
+/* #### Code section: end ### */
+#endif /* Py_PYTHON_H */
@@ -54,6 +54,7 @@ from sonolus.backend._opt.ir cimport (
     PLACE_WRITABLE,
     PlaceInfo,
     TempInfo,
+    take_loc,
 )
 from sonolus.backend._opt._ops_gen cimport (
     OP_Add,
@@ -781,6 +782,7 @@ cdef class _Lower:
     def __cinit__(self, Func src):
         self.src = src
         self.dst = Func()
+        self.dst._inherit_locs(src)
         self.se_prefix = NULL
         self.nb = src.n_blocks
         self.array_temp_map = {}
@@ -1195,6 +1197,7 @@ cdef class _Lower:
     def _emit_ref(self, int32_t v, int32_t block):
         cdef Func src = self.src
         cdef int32_t op = src.instrs[v].op
+        take_loc(self.dst, src, v)
         if op == OPX_CONST:
             return self.dst._emit(OPX_CONST, src.instrs[v].flags, block, src.instrs[v].aux, [])
         if op == OPX_UNDEF:
@@ -1211,10 +1214,12 @@ cdef class _Lower:
         cdef list args
         if op == OPX_GET:
             pid = self._new_place(src.instrs[v].aux, block)
+            take_loc(self.dst, src, v)
             return self.dst._emit(OPX_GET, src.instrs[v].flags, block, pid, [])
         astart = src.instrs[v].arg_start
         nargs = src.instrs[v].nargs
         args = [self._emit_ref(<int32_t>src.args[astart + k], block) for k in range(nargs)]
+        take_loc(self.dst, src, v)
         return self._emit_op(op, src.instrs[v].flags, args, block)
 
     def _is_dst_const(self, int32_t a, double val):
@@ -1270,6 +1275,7 @@ cdef class _Lower:
         cdef int32_t nargs = src.instrs[v].nargs
         cdef int32_t k
         cdef list args = [self._emit_ref(<int32_t>src.args[astart + k], block) for k in range(nargs)]
+        take_loc(self.dst, src, v)
         cdef int32_t r = self.dst._emit(src.instrs[v].op, src.instrs[v].flags, block, -1, args)
         self.dst.instrs[r].flags = <uint8_t>(self.dst.instrs[r].flags | FLAG_STMT_ROOT)
 
@@ -1304,6 +1310,7 @@ cdef class _Lower:
         cdef list seq = _seq_parallel_copies(copies, self._make_cycle_temp)
         for dtemp, skey in seq:
             dplace = self._scalar_place_of(<int32_t>dtemp)
+            self.dst.cur_loc = -1  # phi copies belong to no source line
             if isinstance(skey, tuple):
                 if skey[0] == "c":
                     ref = self.dst._emit(OPX_CONST, <int32_t>skey[2], block, <int32_t>skey[1], [])
@@ -1311,6 +1318,7 @@ cdef class _Lower:
                     ref = self.dst._emit(OPX_GET, FLAG_PINNED, block, self._get_undef_place(), [])
                 else:
                     ref = self._emit_tree(<int32_t>skey[1], block)
+                    self.dst.cur_loc = -1
             else:
                 ref = self.dst._emit(OPX_GET, FLAG_PINNED, block, self._scalar_place_of(<int32_t>skey), [])
             self.dst._emit(OPX_SET, FLAG_SIDE_EFFECT | FLAG_PINNED | FLAG_STMT_ROOT, block, dplace, [ref])
@@ -1406,6 +1414,7 @@ cdef class _Lower:
                     if op == OPX_SET:
                         val = self._emit_ref(<int32_t>src.args[src.instrs[i].arg_start], b)
                         pid = self._new_place(src.instrs[i].aux, b)
+                        take_loc(dst, src, i)
                         dst._emit(OPX_SET, src.instrs[i].flags, b, pid, [val])
                     else:
                         self._emit_tree_root(i, b)
@@ -1413,6 +1422,7 @@ cdef class _Lower:
                     continue
                 elif <bint>self.materialize[i]:
                     val = self._emit_tree(i, b)
+                    take_loc(dst, src, i)
                     dst._emit(OPX_SET, FLAG_SIDE_EFFECT | FLAG_PINNED | FLAG_STMT_ROOT, b,
                               self._scalar_place_of(<int32_t>self.value_temp[i]), [val])
             # phi copies at the end of b for a single-successor phi target;
@@ -1900,6 +1910,7 @@ cdef void _normalize_switch(Func func) except *:
         strv = <double>str_i
         tv = func.blocks[b].test_val
         new_tv = tv
+        take_loc(func, func, tv)
         if off_i != 0:
             cid = func._intern_const(offv)
             coff = func._emit(OPX_CONST, FLAG_PURE | FLAG_CONST_IS_INT, b, cid, [])
@@ -2473,6 +2484,7 @@ cdef class _IfConv:
         dst.n_blocks = nb_new
         dst.cap_blocks = nb_new
         dst.entry_block = <int32_t>newblk[src.entry_block]
+        dst._inherit_locs(src)
 
         # Pass B: fill instrs.
         place_map = {}
@@ -2509,6 +2521,8 @@ cdef class _IfConv:
                     p = <int32_t>desc[1]
                     ef = <int32_t>desc[2]
                     op = src.instrs[p].op
+                    if dst.locs != NULL:
+                        dst.locs[ni] = src.locs[p]
                     dst.instrs[ni].flags = <uint8_t>(src.instrs[p].flags | ef)
                     if op == OPX_CONST:
                         dst.instrs[ni].op = OPX_CONST
@@ -2542,12 +2556,16 @@ cdef class _IfConv:
                         dst.instrs[ni].nargs = <int16_t>nargs
                 elif tag == "const":
                     conv = desc[1]
+                    if dst.locs != NULL:
+                        dst.locs[ni] = src.locs[<int32_t>conv["test_old"]]
                     dst.instrs[ni].op = OPX_CONST
                     dst.instrs[ni].flags = <uint8_t>(FLAG_PURE | (FLAG_CONST_IS_INT if conv["cond_is_int"] else 0))
                     dst.instrs[ni].aux = <int32_t>conv["_cid"]
                     dst.instrs[ni].nargs = 0
                 elif tag == "eq":
                     conv = desc[1]
+                    if dst.locs != NULL:
+                        dst.locs[ni] = src.locs[<int32_t>conv["test_old"]]
                     test_new = <int32_t>self._resolve(newidx, subst_phi, <int32_t>conv["test_old"])
                     dst.args[arg_cursor] = <uint32_t>test_new
                     arg_cursor += 1
@@ -2560,6 +2578,9 @@ cdef class _IfConv:
                 else:  # "sel"
                     conv = desc[1]
                     p = <int32_t>desc[2]
+                    # A select stands for the branch it replaced: the test's line.
+                    if dst.locs != NULL:
+                        dst.locs[ni] = src.locs[<int32_t>conv["test_old"]]
                     if conv["kind"] == 0:
                         test_new = <int32_t>self._resolve(newidx, subst_phi, <int32_t>conv["test_old"])
                     else:
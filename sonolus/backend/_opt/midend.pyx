@@ -56,7 +56,7 @@ carried over 1:1, so identity is preserved), which keeps ``verify()`` green and
 lets ``to_basic_blocks`` export it unchanged.
 """
 
-from libc.stdint cimport int16_t, int32_t, int64_t, uint8_t, uint16_t, uint32_t, uint64_t
+from libc.stdint cimport int8_t, int16_t, int32_t, int64_t, uint8_t, uint16_t, uint32_t, uint64_t
 from libc.stdlib cimport calloc, free, malloc, realloc
 from libc.string cimport memcpy
 from libc.math cimport floor, isfinite, isinf, isnan, signbit
@@ -82,6 +82,7 @@ from sonolus.backend._opt.ir cimport (
     PLACE_RUNTIME_CONST,
     PLACE_WRITABLE,
     TempInfo,
+    take_loc,
 )
 from sonolus.backend._opt._ops_gen cimport (
     OPX_CONST,
@@ -135,6 +136,15 @@ from sonolus.backend._opt._ops_gen cimport (
 )
 from sonolus.backend._opt.analysis cimport Dominators, LoopForest, compute_dominators, compute_loops
 from sonolus.backend._opt.kernels cimport FOLD_OK, fold_op
+from sonolus.backend._opt._khash cimport (
+    khint_t,
+    kh_del_i64i32,
+    kh_destroy_i64i32,
+    kh_get_i64i32,
+    kh_i64i32_t,
+    kh_init_i64i32,
+    kh_put_i64i32,
+)
 
 from sonolus.backend._opt.ir import marshal_in, register_phase, to_basic_blocks
 
@@ -889,14 +899,17 @@ cdef class _Cleaner:
         cdef int32_t pid, j
         cdef list new_args
         if op == OPX_CONST:
+            take_loc(dst, self.src, vid)
             return dst._emit(OPX_CONST, flags, k, ins.aux, [])
         if op == OPX_GET:
             pid = self._copy_place(dst, ins.aux, k)
+            take_loc(dst, self.src, vid)
             return dst._emit(OPX_GET, flags, k, pid, [])
         if op == OPX_SET:
             raise AssertionError("OPX_SET in value position")
         new_args = [self._copy_value(dst, <int32_t>self.src.args[ins.arg_start + j], k)
                     for j in range(ins.nargs)]
+        take_loc(dst, self.src, vid)
         return dst._emit(op, flags, k, -1, new_args)
 
     cdef void _copy_stmt(self, Func dst, int32_t i, int32_t k) except *:
@@ -905,6 +918,7 @@ cdef class _Cleaner:
         if ins.op == OPX_SET:
             val = self._copy_value(dst, <int32_t>self.src.args[ins.arg_start], k)
             pid = self._copy_place(dst, ins.aux, k)
+            take_loc(dst, self.src, i)
             dst._emit(OPX_SET, ins.flags, k, pid, [val])
         else:
             self._copy_value(dst, i, k)
@@ -912,6 +926,7 @@ cdef class _Cleaner:
     cdef Func rebuild(self):
         cdef Func src = self.src
         cdef Func dst = Func()
+        dst._inherit_locs(src)
         cdef list order = self._rpo_order()
         cdef int32_t nb_out = len(order)
         cdef int32_t k, h, node, sb, i, tail_block
@@ -1072,6 +1087,8 @@ cdef class _SSABuilder:
     cdef list val_aux
     cdef list val_args      # list[list[int]] (per-edge operands for phis)
     cdef list val_dead
+    cdef list val_loc       # source location id (filled only when src tracks locations)
+    cdef int32_t cur_loc    # location stamped on the next non-phi value
     cdef dict subst         # eliminated phi -> replacement value
     cdef set undef_widened  # values used out of dominance region via phi(UNDEF,v)=v
     cdef dict phi_users     # value -> set of phi values referencing it
@@ -1103,6 +1120,8 @@ cdef class _SSABuilder:
         self.val_aux = []
         self.val_args = []
         self.val_dead = []
+        self.val_loc = []
+        self.cur_loc = -1
         self.subst = {}
         self.undef_widened = set()
         self.phi_users = {}
@@ -1142,6 +1161,7 @@ cdef class _SSABuilder:
         self.val_aux.append(aux)
         self.val_args.append(args)
         self.val_dead.append(False)
+        self.val_loc.append(-1 if op == OPX_PHI else self.cur_loc)
         if op == OPX_PHI:
             (<list>self.block_phis[block]).append(vid)
         else:
@@ -1157,6 +1177,7 @@ cdef class _SSABuilder:
             self.val_aux.append(-1)
             self.val_args.append([])
             self.val_dead.append(False)
+            self.val_loc.append(-1)
         return self.undef_val
 
     cdef int32_t _translate_place(self, int32_t pid, int32_t block):
@@ -1189,6 +1210,7 @@ cdef class _SSABuilder:
         cdef int32_t pid, kind, temp, spid, astart, nargs, k
         cdef list args
         if op == OPX_CONST:
+            self._take_loc(src_vid)
             return self._new_val(OPX_CONST, ins.flags, block, ins.aux, [])
         if op == OPX_GET:
             pid = ins.aux
@@ -1197,14 +1219,20 @@ cdef class _SSABuilder:
                 temp = self.src.places[pid].block_ref
                 return self._read_variable(temp, block)
             spid = self._translate_place(pid, block)
+            self._take_loc(src_vid)
             return self._new_val(OPX_GET, ins.flags, block, spid, [])
         if op == OPX_SET:
             raise AssertionError("OPX_SET in value position")
         astart = ins.arg_start
         nargs = ins.nargs
         args = [self._translate(<int32_t>self.src.args[astart + k], block) for k in range(nargs)]
+        self._take_loc(src_vid)
         return self._new_val(op, ins.flags, block, -1, args)
 
+    cdef void _take_loc(self, int32_t src_vid):
+        if self.src.locs != NULL:
+            self.cur_loc = self.src.locs[src_vid]
+
     # -- Braun value numbering --------------------------------------------
 
     cdef int32_t _resolve(self, int32_t v):
@@ -1418,6 +1446,7 @@ cdef class _SSABuilder:
                     self._write_variable(temp, block, v)
                 else:
                     spid = self._translate_place(pid, block)
+                    self._take_loc(i)
                     self._new_val(OPX_SET, FLAG_SIDE_EFFECT | FLAG_PINNED | FLAG_STMT_ROOT, block, spid, [v])
             else:
                 v = self._translate(i, block)
@@ -1531,6 +1560,7 @@ cdef class _SSABuilder:
         dst.cap_instrs = total_instrs
         dst.n_args = total_args
         dst.cap_args = total_args
+        dst._inherit_locs(src)
 
         cdef int32_t arg_cursor = 0
         cdef int32_t op, flags, aux, nargs, nphi, tv, phi_first
@@ -1571,6 +1601,8 @@ cdef class _SSABuilder:
                 dst.instrs[ni].arg_start = arg_cursor
                 dst.instrs[ni].nargs = <int16_t>nargs
                 dst.instrs[ni].aux = aux
+                if dst.locs != NULL:
+                    dst.locs[ni] = <int32_t>self.val_loc[v]
                 for o in raw_args:
                     dst.args[arg_cursor] = <uint32_t>(<int32_t>newidx[self._resolve(<int32_t>o)])
                     arg_cursor += 1
@@ -1763,6 +1795,7 @@ cdef class _UnSSA:
     def __cinit__(self, Func src):
         self.src = src
         self.dst = Func()
+        self.dst._inherit_locs(src)
         self.nb = src.n_blocks
         self.array_temp_map = {}
         self.scalar_place = {}
@@ -1920,6 +1953,7 @@ cdef class _UnSSA:
         # A value in operand position -> a dst instruction id.
         cdef Func src = self.src
         cdef int32_t op = src.instrs[v].op
+        take_loc(self.dst, src, v)
         if op == OPX_CONST:
             return self.dst._emit(OPX_CONST, src.instrs[v].flags, block, src.instrs[v].aux, [])
         if op == OPX_UNDEF:
@@ -1936,10 +1970,12 @@ cdef class _UnSSA:
         cdef list args
         if op == OPX_GET:
             pid = self._new_place(src.instrs[v].aux, block)
+            take_loc(self.dst, src, v)
             return self.dst._emit(OPX_GET, src.instrs[v].flags, block, pid, [])
         astart = src.instrs[v].arg_start
         nargs = src.instrs[v].nargs
         args = [self._emit_ref(<int32_t>src.args[astart + k], block) for k in range(nargs)]
+        take_loc(self.dst, src, v)
         return self.dst._emit(op, src.instrs[v].flags, block, -1, args)
 
     # -- phi copies --------------------------------------------------------
@@ -1968,6 +2004,7 @@ cdef class _UnSSA:
             copies.append((dtemp, skey))
         cdef list seq = _seq_parallel_copies(copies, self._make_cycle_temp)
         cdef int32_t ref, dplace
+        self.dst.cur_loc = -1  # phi copies belong to no source line
         for dtemp, skey in seq:
             dplace = self._scalar_place_of(<int32_t>dtemp)
             if isinstance(skey, tuple):
@@ -2057,6 +2094,7 @@ cdef class _UnSSA:
                     if op == OPX_SET:
                         val = self._emit_ref(<int32_t>src.args[src.instrs[i].arg_start], b)
                         pid = self._new_place(src.instrs[i].aux, b)
+                        take_loc(dst, src, i)
                         dst._emit(OPX_SET, src.instrs[i].flags, b, pid, [val])
                     else:
                         # bare side-effecting root (operands emitted then the op).
@@ -2065,6 +2103,7 @@ cdef class _UnSSA:
                     continue
                 elif <bint>self.materialize[i]:
                     val = self._emit_tree(i, b)
+                    take_loc(dst, src, i)
                     dst._emit(OPX_SET, FLAG_SIDE_EFFECT | FLAG_PINNED | FLAG_STMT_ROOT, b,
                               self._scalar_place_of(<int32_t>self.value_temp[i]), [val])
             # phi copies at the end of b for a single-successor phi target;
@@ -2121,6 +2160,7 @@ cdef class _UnSSA:
         cdef int32_t nargs = src.instrs[v].nargs
         cdef int32_t k
         cdef list args = [self._emit_ref(<int32_t>src.args[astart + k], block) for k in range(nargs)]
+        take_loc(self.dst, src, v)
         cdef int32_t r = self.dst._emit(src.instrs[v].op, src.instrs[v].flags, block, -1, args)
         self.dst.instrs[r].flags = <uint8_t>(self.dst.instrs[r].flags | FLAG_STMT_ROOT)
 
@@ -2198,9 +2238,9 @@ cdef enum:
 # const 0/1, comparisons, Not, And/Or/phi of boolean values.
 # --------------------------------------------------------------------------
 
-cdef list _compute_bool(Func f):
+cdef void _compute_bool_c(Func f, uint8_t* isb) noexcept nogil:
+    # ``isb`` must be zeroed, [n_instrs].
     cdef int32_t n = f.n_instrs
-    cdef list isb = [False] * n
     cdef int32_t i, op, a, k, astart, nargs
     cdef bint changed = True
     cdef bint bval
@@ -2208,7 +2248,7 @@ cdef list _compute_bool(Func f):
     while changed:
         changed = False
         for i in range(n):
-            if <bint>isb[i]:
+            if isb[i]:
                 continue
             op = f.instrs[i].op
             bval = False
@@ -2225,13 +2265,25 @@ cdef list _compute_bool(Func f):
                 nargs = f.instrs[i].nargs
                 for k in range(nargs):
                     a = <int32_t>f.args[astart + k]
-                    if not <bint>isb[a]:
+                    if not isb[a]:
                         bval = False
                         break
             if bval:
-                isb[i] = True
+                isb[i] = 1
                 changed = True
-    return isb
+
+
+cdef list _compute_bool(Func f):
+    cdef int32_t n = f.n_instrs
+    cdef int32_t i
+    cdef uint8_t* isb = <uint8_t*>calloc(<size_t>(n if n > 0 else 1), sizeof(uint8_t))
+    if isb == NULL:
+        raise MemoryError()
+    try:
+        _compute_bool_c(f, isb)
+        return [isb[i] != 0 for i in range(n)]
+    finally:
+        free(isb)
 
 
 # --------------------------------------------------------------------------
@@ -2793,40 +2845,601 @@ cdef class _SCCP:
 
 
 # --------------------------------------------------------------------------
-# Shared arena rebuilder: emit a fresh compacted SSA Func from a kept-block RPO
-# order, per-instr keep mask, const overrides, and per-block surviving-edge spec
-# (5-tuples ``(dst_old, cond_kind, cond, cond_is_int, old_edge)``). Realigns phi
-# operands to the surviving incoming edges in the new global-edge-index order.
+# Shared arena rebuilder. Every SSA pass that drops values or reshapes blocks
+# (SCCP, DCE, LICM, rewrite_switch) describes its output as a ``_Plan`` and
+# ``_rebuild`` emits a fresh SSA Func from it:
+#
+# * plan blocks (ids 0..n_pb-1, filled in id order), each with an item list --
+#   a source value id (>= 0, copied from the source arena) or a new phi
+#   ``-(token + 1)`` -- an optional test reference, and outgoing edges
+#   ``(target plan block, cond_kind, cond, cond_is_int, key)``;
+# * the output block order (``order``; ``compute_rpo`` derives it from the plan
+#   edges). Plan blocks missing from it are dropped;
+# * phi operands: a phi gets one operand per incoming edge of its output block,
+#   in new global-edge-index order, looked up by the edge's key. By default a key
+#   is a source edge index and a source phi's operand is its own operand for that
+#   edge; a source phi or a new phi can carry an explicit (key -> ref) map instead;
+# * const overrides: a source value re-emitted as the given const (interned in
+#   override order).
+#
+# Places are re-interned by first use and consts/temps/names carry over 1:1. The
+# plan and the rebuild core are flat C arrays and run nogil; only the ``Func``
+# shell and its boundary dicts are set up under the GIL.
 # --------------------------------------------------------------------------
 
-cdef int32_t _remap_place_c(Func dst, Func src, int32_t old_pid, dict newidx, dict place_map) except -1:
-    cdef int32_t kind = src.places[old_pid].kind
-    cdef int32_t flags = src.places[old_pid].flags
-    cdef int32_t br = src.places[old_pid].block_ref
-    cdef int32_t iv = src.places[old_pid].index_val
-    cdef int32_t off = src.places[old_pid].offset
-    if kind == PLACE_DYNAMIC_BLOCK:
-        br = <int32_t>newidx[br]
-    if iv >= 0:
-        iv = <int32_t>newidx[iv]
-    key = (kind, flags, br, iv, off)
-    cached = place_map.get(key)
-    if cached is not None:
-        return <int32_t>cached
-    cdef int32_t pid = _add_place(dst, <uint8_t>kind, <uint8_t>flags, br, iv, off)
-    place_map[key] = pid
-    return pid
+cdef enum:
+    _NO_REF = -2147483647   # no test / unmapped
 
 
-def _build_compacted(Func src, list order, list keep_instr, dict const_override, dict out_spec):
-    cdef Func dst = Func()
-    cdef int32_t nb_old = src.n_blocks
-    cdef int32_t nb_new = len(order)
-    cdef int32_t i, b, bi, k, e, kk
+cdef class _Plan:
+    cdef Func src
+    cdef int32_t n_pb
+    cdef int32_t entry              # entry plan block
+    cdef int32_t cur                # last plan block begun (-1 before the first)
+
+    cdef int32_t* item_head         # [n_pb + 1]  CSR into ``items``
+    cdef int32_t* items
+    cdef int32_t n_items
+    cdef int32_t cap_items
+    cdef int32_t* edge_head         # [n_pb + 1]  CSR into the e_* arrays
+    cdef int32_t* e_dst
+    cdef uint8_t* e_ck
+    cdef uint8_t* e_ci
+    cdef double* e_cond
+    cdef int32_t* e_key
+    cdef int32_t n_e
+    cdef int32_t cap_e
+    cdef int32_t* test              # [n_pb]  value ref, or _NO_REF
+
+    cdef int32_t* order             # [n_pb]  output block order
+    cdef int32_t n_order
+
+    cdef int32_t n_tok              # new phis
+    cdef int32_t* tok_aux           # [n_tok]  temp id (naming only)
+    cdef int32_t* tok_map           # [n_tok]  operand map id
+
+    # Explicit phi operand maps: map m's (key, ref) pairs are
+    # map_key/map_ref[map_head[m]:map_head[m + 1]].
+    cdef int32_t* map_head          # [cap_maps + 1]
+    cdef int32_t* map_key
+    cdef int32_t* map_ref
+    cdef int32_t n_maps
+    cdef int32_t cap_maps
+    cdef int32_t n_pairs
+    cdef int32_t cap_pairs
+    cdef int32_t* phi_map           # [src.n_instrs]  explicit map id of a source phi, or -1
+
+    cdef int32_t* ov_vid            # const overrides, in interning order
+    cdef double* ov_val
+    cdef int32_t n_ov
+
+    def __cinit__(self, Func src, int32_t n_pb, int32_t cap_items, int32_t cap_e,
+                  int32_t n_tok=0, int32_t cap_maps=0, int32_t cap_pairs=0, int32_t cap_ov=0):
+        cdef int32_t i
+        self.src = src
+        self.n_pb = n_pb
+        self.entry = src.entry_block
+        self.cur = -1
+        self.n_items = 0
+        self.cap_items = cap_items
+        self.n_e = 0
+        self.cap_e = cap_e
+        self.n_order = 0
+        self.n_tok = n_tok
+        self.n_maps = 0
+        self.cap_maps = cap_maps
+        self.n_pairs = 0
+        self.cap_pairs = cap_pairs
+        self.n_ov = 0
+        self.item_head = <int32_t*>malloc(<size_t>(n_pb + 1) * sizeof(int32_t))
+        self.items = <int32_t*>malloc(<size_t>(cap_items if cap_items > 0 else 1) * sizeof(int32_t))
+        self.edge_head = <int32_t*>malloc(<size_t>(n_pb + 1) * sizeof(int32_t))
+        self.e_dst = <int32_t*>malloc(<size_t>(cap_e if cap_e > 0 else 1) * sizeof(int32_t))
+        self.e_ck = <uint8_t*>malloc(<size_t>(cap_e if cap_e > 0 else 1) * sizeof(uint8_t))
+        self.e_ci = <uint8_t*>malloc(<size_t>(cap_e if cap_e > 0 else 1) * sizeof(uint8_t))
+        self.e_cond = <double*>malloc(<size_t>(cap_e if cap_e > 0 else 1) * sizeof(double))
+        self.e_key = <int32_t*>malloc(<size_t>(cap_e if cap_e > 0 else 1) * sizeof(int32_t))
+        self.test = <int32_t*>malloc(<size_t>(n_pb if n_pb > 0 else 1) * sizeof(int32_t))
+        self.order = <int32_t*>malloc(<size_t>(n_pb if n_pb > 0 else 1) * sizeof(int32_t))
+        self.tok_aux = <int32_t*>malloc(<size_t>(n_tok if n_tok > 0 else 1) * sizeof(int32_t))
+        self.tok_map = <int32_t*>malloc(<size_t>(n_tok if n_tok > 0 else 1) * sizeof(int32_t))
+        self.map_head = <int32_t*>malloc(<size_t>(cap_maps + 1) * sizeof(int32_t))
+        self.map_key = <int32_t*>malloc(<size_t>(cap_pairs if cap_pairs > 0 else 1) * sizeof(int32_t))
+        self.map_ref = <int32_t*>malloc(<size_t>(cap_pairs if cap_pairs > 0 else 1) * sizeof(int32_t))
+        self.phi_map = <int32_t*>malloc(<size_t>(src.n_instrs if src.n_instrs > 0 else 1) * sizeof(int32_t))
+        self.ov_vid = <int32_t*>malloc(<size_t>(cap_ov if cap_ov > 0 else 1) * sizeof(int32_t))
+        self.ov_val = <double*>malloc(<size_t>(cap_ov if cap_ov > 0 else 1) * sizeof(double))
+        if (self.item_head == NULL or self.items == NULL or self.edge_head == NULL or self.e_dst == NULL
+                or self.e_ck == NULL or self.e_ci == NULL or self.e_cond == NULL or self.e_key == NULL
+                or self.test == NULL or self.order == NULL or self.tok_aux == NULL or self.tok_map == NULL
+                or self.map_head == NULL or self.map_key == NULL or self.map_ref == NULL or self.phi_map == NULL
+                or self.ov_vid == NULL or self.ov_val == NULL):
+            raise MemoryError()
+        self.map_head[0] = 0
+        for i in range(n_pb):
+            self.test[i] = _NO_REF
+        for i in range(src.n_instrs):
+            self.phi_map[i] = -1
+
+    def __dealloc__(self):
+        free(self.item_head)
+        free(self.items)
+        free(self.edge_head)
+        free(self.e_dst)
+        free(self.e_ck)
+        free(self.e_ci)
+        free(self.e_cond)
+        free(self.e_key)
+        free(self.test)
+        free(self.order)
+        free(self.tok_aux)
+        free(self.tok_map)
+        free(self.map_head)
+        free(self.map_key)
+        free(self.map_ref)
+        free(self.phi_map)
+        free(self.ov_vid)
+        free(self.ov_val)
+
+    # ---- filling (plan blocks strictly in id order) ---------------------------
+
+    cdef void begin_block(self, int32_t pb) noexcept nogil:
+        while self.cur < pb:
+            self.cur += 1
+            self.item_head[self.cur] = self.n_items
+            self.edge_head[self.cur] = self.n_e
+
+    cdef void end_blocks(self) noexcept nogil:
+        self.begin_block(self.n_pb - 1)
+        self.item_head[self.n_pb] = self.n_items
+        self.edge_head[self.n_pb] = self.n_e
+
+    cdef int add_item(self, int32_t ref) except -1 nogil:
+        if self.n_items >= self.cap_items:
+            with gil:
+                raise AssertionError("rebuild plan item capacity exceeded")
+        self.items[self.n_items] = ref
+        self.n_items += 1
+        return 0
+
+    cdef int add_edge(self, int32_t dst, uint8_t ck, double cond, uint8_t ci, int32_t key) except -1 nogil:
+        cdef int32_t e = self.n_e
+        if e >= self.cap_e:
+            with gil:
+                raise AssertionError("rebuild plan edge capacity exceeded")
+        self.e_dst[e] = dst
+        self.e_ck[e] = ck
+        self.e_cond[e] = cond
+        self.e_ci[e] = ci
+        self.e_key[e] = key
+        self.n_e = e + 1
+        return 0
+
+    cdef int32_t new_map(self) except -1 nogil:
+        # Start an explicit operand map; pairs added next belong to it.
+        if self.n_maps >= self.cap_maps:
+            with gil:
+                raise AssertionError("rebuild plan map capacity exceeded")
+        self.n_maps += 1
+        self.map_head[self.n_maps] = self.n_pairs
+        return self.n_maps - 1
+
+    cdef int map_add(self, int32_t key, int32_t ref) except -1 nogil:
+        if self.n_pairs >= self.cap_pairs:
+            with gil:
+                raise AssertionError("rebuild plan map capacity exceeded")
+        self.map_key[self.n_pairs] = key
+        self.map_ref[self.n_pairs] = ref
+        self.n_pairs += 1
+        self.map_head[self.n_maps] = self.n_pairs
+        return 0
+
+    cdef void add_override(self, int32_t vid, double value) noexcept nogil:
+        self.ov_vid[self.n_ov] = vid
+        self.ov_val[self.n_ov] = value
+        self.n_ov += 1
+
+    cdef void identity_order(self) noexcept nogil:
+        cdef int32_t k
+        for k in range(self.n_pb):
+            self.order[k] = k
+        self.n_order = self.n_pb
+
+    cdef int compute_rpo(self, int32_t entry) except -1 nogil:
+        # Reverse postorder over the plan edges from ``entry`` (iterative DFS,
+        # successors in edge order); unreachable plan blocks are left out.
+        cdef int32_t n = self.n_pb
+        cdef int32_t* node = <int32_t*>malloc(<size_t>(n if n > 0 else 1) * sizeof(int32_t))
+        cdef int32_t* pos = <int32_t*>malloc(<size_t>(n if n > 0 else 1) * sizeof(int32_t))
+        cdef uint8_t* visited = <uint8_t*>calloc(<size_t>(n if n > 0 else 1), sizeof(uint8_t))
+        cdef int32_t top, b, e, ch, n_post = 0, k
+        self.entry = entry
+        if node == NULL or pos == NULL or visited == NULL:
+            free(node)
+            free(pos)
+            free(visited)
+            with gil:
+                raise MemoryError()
+        node[0] = entry
+        pos[0] = self.edge_head[entry]
+        visited[entry] = 1
+        top = 1
+        while top > 0:
+            b = node[top - 1]
+            e = pos[top - 1]
+            if e < self.edge_head[b + 1]:
+                pos[top - 1] = e + 1
+                ch = self.e_dst[e]
+                if not visited[ch]:
+                    visited[ch] = 1
+                    node[top] = ch
+                    pos[top] = self.edge_head[ch]
+                    top += 1
+            else:
+                self.order[n_post] = b
+                n_post += 1
+                top -= 1
+        for k in range(n_post // 2):
+            b = self.order[k]
+            self.order[k] = self.order[n_post - 1 - k]
+            self.order[n_post - 1 - k] = b
+        self.n_order = n_post
+        free(node)
+        free(pos)
+        free(visited)
+        return 0
+
+
+cdef class _Rebuilder:
+    """Workspace of one ``_rebuild`` (source -> fresh SSA Func)."""
+
+    cdef Func src
+    cdef Func dst
+    cdef _Plan plan
+    cdef int32_t* new_bid           # [n_pb]       output block of a plan block, or -1
+    cdef int32_t* newidx            # [src instrs] output value id, or -1
+    cdef int32_t* tok_new           # [n_tok]      output value id of a new phi
+    cdef int32_t* const_cid         # [src instrs] override const id, or -1
+    cdef uint8_t* const_int         # [src instrs] override display bit
+    cdef int32_t* src_inpos         # [src edges]  position among its dst's incoming edges
+    cdef int32_t* inc_head          # [nb_new + 1] incoming edge keys of each output block
+    cdef int32_t* inc_key
+    cdef int32_t* block_start       # [nb_new]
+    cdef int32_t* place_new         # [src places] output place, or -1
+    cdef int32_t* place_next        # [src places] older output place with the same hash, or -1
+    cdef kh_i64i32_t* place_index   # place key hash -> newest output place
+
+    def __cinit__(self, Func src, _Plan plan):
+        cdef int32_t n = src.n_instrs
+        cdef int32_t i
+        self.src = src
+        self.dst = Func()
+        self.plan = plan
+        self.new_bid = <int32_t*>malloc(<size_t>(plan.n_pb if plan.n_pb > 0 else 1) * sizeof(int32_t))
+        self.newidx = <int32_t*>malloc(<size_t>(n if n > 0 else 1) * sizeof(int32_t))
+        self.tok_new = <int32_t*>malloc(<size_t>(plan.n_tok if plan.n_tok > 0 else 1) * sizeof(int32_t))
+        self.const_cid = <int32_t*>malloc(<size_t>(n if n > 0 else 1) * sizeof(int32_t))
+        self.const_int = <uint8_t*>calloc(<size_t>(n if n > 0 else 1), sizeof(uint8_t))
+        self.src_inpos = <int32_t*>malloc(<size_t>(src.n_edges if src.n_edges > 0 else 1) * sizeof(int32_t))
+        self.inc_head = <int32_t*>calloc(<size_t>(plan.n_order + 1), sizeof(int32_t))
+        self.inc_key = <int32_t*>malloc(<size_t>(plan.n_e if plan.n_e > 0 else 1) * sizeof(int32_t))
+        self.block_start = <int32_t*>malloc(<size_t>(plan.n_order if plan.n_order > 0 else 1) * sizeof(int32_t))
+        self.place_new = <int32_t*>malloc(<size_t>(src.n_places if src.n_places > 0 else 1) * sizeof(int32_t))
+        self.place_next = <int32_t*>malloc(<size_t>(src.n_places if src.n_places > 0 else 1) * sizeof(int32_t))
+        self.place_index = kh_init_i64i32()
+        if (self.new_bid == NULL or self.newidx == NULL or self.tok_new == NULL or self.const_cid == NULL
+                or self.const_int == NULL or self.src_inpos == NULL or self.inc_head == NULL or self.inc_key == NULL
+                or self.block_start == NULL or self.place_new == NULL or self.place_next == NULL
+                or self.place_index == NULL):
+            raise MemoryError()
+        for i in range(n):
+            self.newidx[i] = -1
+            self.const_cid[i] = -1
+        for i in range(src.n_places):
+            self.place_new[i] = -1
+        # Position of each source edge among its dst's incoming edges (ascending
+        # global edge index, i.e. the phi operand order).
+        seen = [0] * src.n_blocks
+        for i in range(src.n_edges):
+            d = src.edges[i].dst
+            self.src_inpos[i] = seen[d]
+            seen[d] += 1
+
+    def __dealloc__(self):
+        free(self.new_bid)
+        free(self.newidx)
+        free(self.tok_new)
+        free(self.const_cid)
+        free(self.const_int)
+        free(self.src_inpos)
+        free(self.inc_head)
+        free(self.inc_key)
+        free(self.block_start)
+        free(self.place_new)
+        free(self.place_next)
+        kh_destroy_i64i32(self.place_index)  # NULL-safe
+
+    cdef int32_t _value(self, int32_t ref) except -1 nogil:
+        cdef int32_t v
+        if ref >= 0:
+            v = self.newidx[ref]
+        else:
+            v = self.tok_new[-ref - 1]
+        if v < 0:
+            with gil:
+                raise AssertionError(f"rebuild plan references dropped value {ref}")
+        return v
+
+    cdef int32_t _phi_operand(self, int32_t ref, int32_t key) except _NO_REF nogil:
+        # Operand (a plan ref) of phi ``ref`` for the incoming edge with ``key``. A
+        # plan ref may be any negative token, so _NO_REF is the error value.
+        cdef int32_t m, k, e, v
+        if ref < 0:
+            m = self.plan.tok_map[-ref - 1]
+        else:
+            m = self.plan.phi_map[ref]
+        if m >= 0:
+            for k in range(self.plan.map_head[m], self.plan.map_head[m + 1]):
+                if self.plan.map_key[k] == key:
+                    return self.plan.map_ref[k]
+        else:
+            v = ref
+            e = key
+            if 0 <= e < self.src.n_edges and self.src.edges[e].dst == self.src.instrs[v].block:
+                if self.src_inpos[e] < self.src.instrs[v].nargs:
+                    return <int32_t>self.src.args[self.src.instrs[v].arg_start + self.src_inpos[e]]
+        with gil:
+            raise AssertionError(f"phi {ref} has no operand for incoming edge key {key}")
+
+    cdef int32_t _remap_place(self, int32_t old_pid) except -1 nogil:
+        cdef int32_t pid = self.place_new[old_pid]
+        cdef uint8_t kind, flags
+        cdef int32_t br, iv, off, q
+        cdef uint64_t h
+        cdef khint_t it
+        cdef int ret
+        if pid >= 0:
+            return pid
+        kind = self.src.places[old_pid].kind
+        flags = self.src.places[old_pid].flags
+        br = self.src.places[old_pid].block_ref
+        iv = self.src.places[old_pid].index_val
+        off = self.src.places[old_pid].offset
+        if kind == PLACE_DYNAMIC_BLOCK:
+            br = self._value(br)
+        if iv >= 0:
+            iv = self._value(iv)
+        h = _hmix(_hmix(_hmix(_hmix(_hmix(0, kind), flags), <uint64_t>br), <uint64_t>iv), <uint64_t>off)
+        it = kh_get_i64i32(self.place_index, h)
+        q = self.place_index.vals[it] if it != self.place_index.n_buckets else -1
+        while q >= 0:
+            if (self.dst.places[q].kind == kind and self.dst.places[q].flags == flags
+                    and self.dst.places[q].block_ref == br and self.dst.places[q].index_val == iv
+                    and self.dst.places[q].offset == off):
+                self.place_new[old_pid] = q
+                return q
+            q = self.place_next[q]
+        pid = self.dst.n_places
+        self.dst.places[pid].kind = kind
+        self.dst.places[pid].flags = flags
+        self.dst.places[pid].block_ref = br
+        self.dst.places[pid].index_val = iv
+        self.dst.places[pid].offset = off
+        self.dst.n_places = pid + 1
+        it = kh_put_i64i32(self.place_index, h, &ret)
+        if ret < 0:
+            with gil:
+                raise MemoryError()
+        self.place_next[pid] = self.place_index.vals[it] if ret == 0 else -1
+        self.place_index.vals[it] = pid
+        self.place_new[old_pid] = pid
+        return pid
+
+    cdef int _alloc(self, int32_t nb_new, int32_t nen, int32_t total_instrs, int32_t total_args) except -1 nogil:
+        cdef int32_t np = self.src.n_places
+        self.dst.instrs = <Instr*>malloc(<size_t>(total_instrs if total_instrs > 0 else 1) * sizeof(Instr))
+        self.dst.args = <uint32_t*>malloc(<size_t>(total_args if total_args > 0 else 1) * sizeof(uint32_t))
+        self.dst.blocks = <BlockInfo*>malloc(<size_t>(nb_new if nb_new > 0 else 1) * sizeof(BlockInfo))
+        self.dst.edges = <Edge*>malloc(<size_t>(nen if nen > 0 else 1) * sizeof(Edge))
+        # At most one output place per source place.
+        self.dst.places = <PlaceInfo*>malloc(<size_t>(np if np > 0 else 1) * sizeof(PlaceInfo))
+        if (self.dst.instrs == NULL or self.dst.args == NULL or self.dst.blocks == NULL
+                or self.dst.edges == NULL or self.dst.places == NULL):
+            with gil:
+                raise MemoryError()
+        self.dst.n_instrs = total_instrs
+        self.dst.cap_instrs = total_instrs
+        self.dst.cap_args = total_args
+        self.dst.n_blocks = nb_new
+        self.dst.cap_blocks = nb_new
+        self.dst.n_edges = nen
+        self.dst.cap_edges = nen
+        self.dst.cap_places = np if np > 0 else 1
+        if self.src.locs != NULL:
+            with gil:
+                self.dst._inherit_locs(self.src)
+        return 0
+
+    cdef int run(self) except -1 nogil:
+        cdef int32_t nb_new = self.plan.n_order
+        cdef int32_t k, pb, e, ie, nei, nen, it, ref, ov, op, ni, ninc, total_args, arg_cursor
+        cdef int32_t phi_first, phi_cnt, astart, nn, kk, d
+        cdef bint has_value_edge
+
+        for pb in range(self.plan.n_pb):
+            self.new_bid[pb] = -1
+        for k in range(nb_new):
+            self.new_bid[self.plan.order[k]] = k
+
+        # --- edges (block-by-block in output order) + per-block incoming keys ---
+        nen = 0
+        for k in range(nb_new):
+            pb = self.plan.order[k]
+            for ie in range(self.plan.edge_head[pb], self.plan.edge_head[pb + 1]):
+                d = self.new_bid[self.plan.e_dst[ie]]
+                if d >= 0:
+                    self.inc_head[d + 1] += 1
+                nen += 1
+        for k in range(nb_new):
+            self.inc_head[k + 1] += self.inc_head[k]
+
+        # --- new value ids + operand slot count ---
+        ni = 0
+        total_args = 0
+        for k in range(nb_new):
+            pb = self.plan.order[k]
+            self.block_start[k] = ni
+            ninc = self.inc_head[k + 1] - self.inc_head[k]
+            for it in range(self.plan.item_head[pb], self.plan.item_head[pb + 1]):
+                ref = self.plan.items[it]
+                if ref < 0:
+                    self.tok_new[-ref - 1] = ni
+                    total_args += ninc
+                else:
+                    self.newidx[ref] = ni
+                    op = self.src.instrs[ref].op
+                    if self.const_cid[ref] >= 0:
+                        pass
+                    elif op == OPX_PHI:
+                        total_args += ninc
+                    elif op == OPX_CONST or op == OPX_UNDEF or op == OPX_GET:
+                        pass
+                    elif op == OPX_SET:
+                        total_args += 1
+                    else:
+                        total_args += self.src.instrs[ref].nargs
+                ni += 1
+        self._alloc(nb_new, nen, ni, total_args)
+        self.dst.entry_block = self.new_bid[self.plan.entry]
+
+        nei = 0
+        for k in range(nb_new):
+            pb = self.plan.order[k]
+            self.dst.blocks[k].edge_start = nei
+            for ie in range(self.plan.edge_head[pb], self.plan.edge_head[pb + 1]):
+                d = self.new_bid[self.plan.e_dst[ie]]
+                self.dst.edges[nei].src = k
+                self.dst.edges[nei].dst = d
+                self.dst.edges[nei].cond_kind = self.plan.e_ck[ie]
+                self.dst.edges[nei].cond = self.plan.e_cond[ie]
+                self.dst.edges[nei].cond_is_int = self.plan.e_ci[ie]
+                if d >= 0:
+                    # inc_head[d] is the next free incoming slot of d (restored below).
+                    self.inc_key[self.inc_head[d]] = self.plan.e_key[ie]
+                    self.inc_head[d] += 1
+                nei += 1
+            self.dst.blocks[k].edge_count = nei - self.dst.blocks[k].edge_start
+        for k in range(nb_new - 1, 0, -1):
+            self.inc_head[k] = self.inc_head[k - 1]
+        if nb_new > 0:
+            self.inc_head[0] = 0
+
+        # --- instructions ---
+        arg_cursor = 0
+        for k in range(nb_new):
+            pb = self.plan.order[k]
+            ni = self.block_start[k]
+            phi_first = -1
+            phi_cnt = 0
+            for it in range(self.plan.item_head[pb], self.plan.item_head[pb + 1]):
+                ref = self.plan.items[it]
+                self.dst.instrs[ni].block = k
+                self.dst.instrs[ni].arg_start = arg_cursor
+                if ref < 0:
+                    for ie in range(self.inc_head[k], self.inc_head[k + 1]):
+                        self.dst.args[arg_cursor] = <uint32_t>self._value(self._phi_operand(ref, self.inc_key[ie]))
+                        arg_cursor += 1
+                    self.dst.instrs[ni].op = OPX_PHI
+                    self.dst.instrs[ni].flags = 0
+                    self.dst.instrs[ni].aux = self.plan.tok_aux[-ref - 1]
+                    self.dst.instrs[ni].nargs = <int16_t>(self.inc_head[k + 1] - self.inc_head[k])
+                    if phi_first == -1:
+                        phi_first = ni
+                    phi_cnt += 1
+                    ni += 1
+                    continue
+                ov = ref
+                if self.dst.locs != NULL:
+                    self.dst.locs[ni] = self.src.locs[ov]
+                op = self.src.instrs[ov].op
+                if self.const_cid[ov] >= 0:
+                    self.dst.instrs[ni].op = OPX_CONST
+                    self.dst.instrs[ni].flags = <uint8_t>(FLAG_PURE | (FLAG_CONST_IS_INT if self.const_int[ov] else 0))
+                    self.dst.instrs[ni].aux = self.const_cid[ov]
+                    self.dst.instrs[ni].nargs = 0
+                elif op == OPX_PHI:
+                    for ie in range(self.inc_head[k], self.inc_head[k + 1]):
+                        self.dst.args[arg_cursor] = <uint32_t>self._value(self._phi_operand(ov, self.inc_key[ie]))
+                        arg_cursor += 1
+                    self.dst.instrs[ni].op = OPX_PHI
+                    self.dst.instrs[ni].flags = self.src.instrs[ov].flags
+                    self.dst.instrs[ni].aux = self.src.instrs[ov].aux
+                    self.dst.instrs[ni].nargs = <int16_t>(self.inc_head[k + 1] - self.inc_head[k])
+                    if phi_first == -1:
+                        phi_first = ni
+                    phi_cnt += 1
+                elif op == OPX_CONST:
+                    self.dst.instrs[ni].op = OPX_CONST
+                    self.dst.instrs[ni].flags = self.src.instrs[ov].flags
+                    self.dst.instrs[ni].aux = self.src.instrs[ov].aux
+                    self.dst.instrs[ni].nargs = 0
+                elif op == OPX_UNDEF:
+                    self.dst.instrs[ni].op = OPX_UNDEF
+                    self.dst.instrs[ni].flags = self.src.instrs[ov].flags
+                    self.dst.instrs[ni].aux = -1
+                    self.dst.instrs[ni].nargs = 0
+                elif op == OPX_GET:
+                    self.dst.instrs[ni].op = OPX_GET
+                    self.dst.instrs[ni].flags = self.src.instrs[ov].flags
+                    self.dst.instrs[ni].aux = self._remap_place(self.src.instrs[ov].aux)
+                    self.dst.instrs[ni].nargs = 0
+                elif op == OPX_SET:
+                    self.dst.args[arg_cursor] = <uint32_t>self._value(<int32_t>self.src.args[self.src.instrs[ov].arg_start])
+                    arg_cursor += 1
+                    self.dst.instrs[ni].op = OPX_SET
+                    self.dst.instrs[ni].flags = self.src.instrs[ov].flags
+                    self.dst.instrs[ni].aux = self._remap_place(self.src.instrs[ov].aux)
+                    self.dst.instrs[ni].nargs = 1
+                else:
+                    astart = self.src.instrs[ov].arg_start
+                    nn = self.src.instrs[ov].nargs
+                    for kk in range(nn):
+                        self.dst.args[arg_cursor] = <uint32_t>self._value(<int32_t>self.src.args[astart + kk])
+                        arg_cursor += 1
+                    self.dst.instrs[ni].op = <uint16_t>op
+                    self.dst.instrs[ni].flags = self.src.instrs[ov].flags
+                    self.dst.instrs[ni].aux = self.src.instrs[ov].aux
+                    self.dst.instrs[ni].nargs = <int16_t>nn
+                ni += 1
+            self.dst.blocks[k].instr_start = self.block_start[k]
+            self.dst.blocks[k].instr_count = ni - self.block_start[k]
+            self.dst.blocks[k].phi_start = phi_first if phi_cnt > 0 else self.block_start[k]
+            self.dst.blocks[k].phi_count = phi_cnt
+            self.dst.blocks[k].rpo = k
+            self.dst.blocks[k].idom = -1
+            has_value_edge = False
+            for ie in range(self.plan.edge_head[pb], self.plan.edge_head[pb + 1]):
+                if self.plan.e_ck[ie] == EDGE_COND_VALUE:
+                    has_value_edge = True
+                    break
+            if self.plan.test[pb] != _NO_REF and has_value_edge:
+                self.dst.blocks[k].test_val = self._value(self.plan.test[pb])
+            else:
+                self.dst.blocks[k].test_val = -1
+        self.dst.n_args = arg_cursor
+        if self.src.undef_val >= 0 and self.newidx[self.src.undef_val] >= 0:
+            self.dst.undef_val = self.newidx[self.src.undef_val]
+        else:
+            self.dst.undef_val = -1
+        return 0
 
-    newblk = [-1] * nb_old
-    for k in range(nb_new):
-        newblk[<int32_t>order[k]] = k
+
+cdef Func _rebuild(Func src, _Plan plan):
+    """Emit a fresh SSA ``Func`` from ``plan`` over ``src`` (see ``_Plan``)."""
+    cdef _Rebuilder rb = _Rebuilder(src, plan)
+    cdef Func dst = rb.dst
+    cdef int32_t i, cid
+    cdef double val
 
     # consts / temps carry over 1:1 (ids preserved); override consts interned on top.
     if src.n_consts > 0:
@@ -2851,370 +3464,110 @@ def _build_compacted(Func src, list order, list keep_instr, dict const_override,
     dst.callback = src.callback
     dst._block_map = dict(src._block_map)
     dst.is_ssa = True
-
-    override_cinfo = {}
-    cdef double val
-    cdef bint is_int
-    cdef int32_t cid
-    for i, oval in const_override.items():
-        val = <double>oval
+    for i in range(plan.n_ov):
+        val = plan.ov_val[i]
         cid = dst._intern_const(val)
-        is_int = (not isinf(val)) and (not isnan(val)) and (val == floor(val))
-        override_cinfo[i] = (cid, is_int)
-
-    # phi operand maps keyed by old incoming edge.
-    src_incoming = [[] for _ in range(nb_old)]
-    for e in range(src.n_edges):
-        src_incoming[src.edges[e].dst].append(e)
-    phi_opmap = {}
-    cdef int32_t pstart, pcount, p, astart
-    for b in order:
-        bi = <int32_t>b
-        pstart = src.blocks[bi].phi_start
-        pcount = src.blocks[bi].phi_count
-        inclist = <list>src_incoming[bi]
-        for p in range(pstart, pstart + pcount):
-            astart = src.instrs[p].arg_start
-            m = {}
-            for k in range(src.instrs[p].nargs):
-                m[<int32_t>inclist[k]] = <int32_t>src.args[astart + k]
-            phi_opmap[p] = m
-
-    # Emit new edges block-by-block; build per-old-block incoming (new order).
-    new_edges = []
-    incoming_new = [[] for _ in range(nb_old)]
-    block_edge_start = [0] * nb_new
-    block_edge_count = [0] * nb_new
-    for k in range(nb_new):
-        b = <int32_t>order[k]
-        block_edge_start[k] = len(new_edges)
-        for spec in out_spec.get(b, []):
-            dst_old = <int32_t>spec[0]
-            nei = len(new_edges)
-            new_edges.append((k, newblk[dst_old], spec[1], spec[2], spec[3]))
-            (<list>incoming_new[dst_old]).append((nei, spec[4]))
-        block_edge_count[k] = len(new_edges) - block_edge_start[k]
-
-    # Assign new instr ids + count args.
-    newidx = {}
-    block_instrs = [[] for _ in range(nb_new)]
-    block_start = [0] * nb_new
-    cdef int32_t next_idx = 0
-    cdef int32_t total_args = 0
-    cdef int32_t istart, icount, op
-    for k in range(nb_new):
-        b = <int32_t>order[k]
-        block_start[k] = next_idx
-        istart = src.blocks[b].instr_start
-        icount = src.blocks[b].instr_count
-        for i in range(istart, istart + icount):
-            if not <bint>keep_instr[i]:
-                continue
-            (<list>block_instrs[k]).append(i)
-            newidx[i] = next_idx
-            next_idx += 1
-            op = src.instrs[i].op
-            if i in const_override:
-                pass
-            elif op == OPX_PHI:
-                total_args += len(<list>incoming_new[b])
-            elif op == OPX_CONST or op == OPX_UNDEF:
-                pass
-            else:
-                total_args += src.instrs[i].nargs
-    cdef int32_t total_instrs = next_idx
+        rb.const_cid[plan.ov_vid[i]] = cid
+        rb.const_int[plan.ov_vid[i]] = (not isinf(val)) and (not isnan(val)) and (val == floor(val))
 
-    dst.instrs = <Instr*>malloc(<size_t>(total_instrs if total_instrs > 0 else 1) * sizeof(Instr))
-    dst.args = <uint32_t*>malloc(<size_t>(total_args if total_args > 0 else 1) * sizeof(uint32_t))
-    if dst.instrs == NULL or dst.args == NULL:
-        raise MemoryError()
-    dst.n_instrs = total_instrs
-    dst.cap_instrs = total_instrs
-    dst.cap_args = total_args
-
-    dst.blocks = <BlockInfo*>malloc(<size_t>(nb_new if nb_new > 0 else 1) * sizeof(BlockInfo))
-    if dst.blocks == NULL:
-        raise MemoryError()
-    dst.n_blocks = nb_new
-    dst.cap_blocks = nb_new
-    dst.entry_block = newblk[src.entry_block]
-
-    place_map = {}
-    cdef int32_t arg_cursor = 0
-    cdef int32_t ni, oldv, phi_first, phi_cnt, cnt, nn, val_new, pid, old_edge, operand
-    cdef bint has_value_edge
-    for k in range(nb_new):
-        b = <int32_t>order[k]
-        phi_first = -1
-        phi_cnt = 0
-        for oldv in <list>block_instrs[k]:
-            ni = <int32_t>newidx[oldv]
-            op = src.instrs[oldv].op
-            dst.instrs[ni].block = k
-            dst.instrs[ni].arg_start = arg_cursor
-            if oldv in const_override:
-                cid = <int32_t>override_cinfo[oldv][0]
-                is_int = <bint>override_cinfo[oldv][1]
-                dst.instrs[ni].op = OPX_CONST
-                dst.instrs[ni].flags = <uint8_t>(FLAG_PURE | (FLAG_CONST_IS_INT if is_int else 0))
-                dst.instrs[ni].aux = cid
-                dst.instrs[ni].nargs = 0
-            elif op == OPX_PHI:
-                if phi_first == -1:
-                    phi_first = ni
-                phi_cnt += 1
-                m = <dict>phi_opmap[oldv]
-                cnt = 0
-                for pair in <list>incoming_new[b]:
-                    old_edge = <int32_t>pair[1]
-                    operand = <int32_t>m[old_edge]
-                    dst.args[arg_cursor] = <uint32_t><int32_t>newidx[operand]
-                    arg_cursor += 1
-                    cnt += 1
-                dst.instrs[ni].op = OPX_PHI
-                dst.instrs[ni].flags = src.instrs[oldv].flags
-                dst.instrs[ni].aux = src.instrs[oldv].aux
-                dst.instrs[ni].nargs = <int16_t>cnt
-            elif op == OPX_CONST:
-                dst.instrs[ni].op = OPX_CONST
-                dst.instrs[ni].flags = src.instrs[oldv].flags
-                dst.instrs[ni].aux = src.instrs[oldv].aux
-                dst.instrs[ni].nargs = 0
-            elif op == OPX_UNDEF:
-                dst.instrs[ni].op = OPX_UNDEF
-                dst.instrs[ni].flags = src.instrs[oldv].flags
-                dst.instrs[ni].aux = -1
-                dst.instrs[ni].nargs = 0
-            elif op == OPX_GET:
-                pid = _remap_place_c(dst, src, src.instrs[oldv].aux, newidx, place_map)
-                dst.instrs[ni].op = OPX_GET
-                dst.instrs[ni].flags = src.instrs[oldv].flags
-                dst.instrs[ni].aux = pid
-                dst.instrs[ni].nargs = 0
-            elif op == OPX_SET:
-                val_new = <int32_t>newidx[<int32_t>src.args[src.instrs[oldv].arg_start]]
-                pid = _remap_place_c(dst, src, src.instrs[oldv].aux, newidx, place_map)
-                dst.args[arg_cursor] = <uint32_t>val_new
-                arg_cursor += 1
-                dst.instrs[ni].op = OPX_SET
-                dst.instrs[ni].flags = src.instrs[oldv].flags
-                dst.instrs[ni].aux = pid
-                dst.instrs[ni].nargs = 1
-            else:
-                astart = src.instrs[oldv].arg_start
-                nn = src.instrs[oldv].nargs
-                for kk in range(nn):
-                    dst.args[arg_cursor] = <uint32_t><int32_t>newidx[<int32_t>src.args[astart + kk]]
-                    arg_cursor += 1
-                dst.instrs[ni].op = <uint16_t>op
-                dst.instrs[ni].flags = src.instrs[oldv].flags
-                dst.instrs[ni].aux = src.instrs[oldv].aux
-                dst.instrs[ni].nargs = <int16_t>nn
-        dst.blocks[k].instr_start = <int32_t>block_start[k]
-        dst.blocks[k].instr_count = len(<list>block_instrs[k])
-        dst.blocks[k].phi_start = phi_first if phi_cnt > 0 else <int32_t>block_start[k]
-        dst.blocks[k].phi_count = phi_cnt
-        dst.blocks[k].rpo = k
-        dst.blocks[k].idom = -1
-        dst.blocks[k].edge_start = <int32_t>block_edge_start[k]
-        dst.blocks[k].edge_count = <int32_t>block_edge_count[k]
-        has_value_edge = False
-        for spec in out_spec.get(b, []):
-            if spec[1] == EDGE_COND_VALUE:
-                has_value_edge = True
-                break
-        if has_value_edge and src.blocks[b].test_val >= 0:
-            dst.blocks[k].test_val = <int32_t>newidx[src.blocks[b].test_val]
-        else:
-            dst.blocks[k].test_val = -1
-    dst.n_args = arg_cursor
+    with nogil:
+        rb.run()
 
-    # Edges array.
-    cdef int32_t nen = len(new_edges)
-    dst.edges = <Edge*>malloc(<size_t>(nen if nen > 0 else 1) * sizeof(Edge))
-    if dst.edges == NULL:
-        raise MemoryError()
-    for e in range(nen):
-        ne_t = new_edges[e]
-        dst.edges[e].src = <int32_t>ne_t[0]
-        dst.edges[e].dst = <int32_t>ne_t[1]
-        dst.edges[e].cond_kind = <uint8_t>ne_t[2]
-        dst.edges[e].cond = <double>ne_t[3]
-        dst.edges[e].cond_is_int = <uint8_t>ne_t[4]
-    dst.n_edges = nen
-    dst.cap_edges = nen
-
-    if src.undef_val >= 0 and <bint>keep_instr[src.undef_val]:
-        dst.undef_val = <int32_t>newidx[src.undef_val]
-    else:
-        dst.undef_val = -1
     widened = set()
     if src._ssa_undef:
         for wv in src._ssa_undef:
-            if <bint>keep_instr[wv]:
-                widened.add(<int32_t>newidx[wv])
+            if rb.newidx[<int32_t>wv] >= 0:
+                widened.add(rb.newidx[<int32_t>wv])
     dst._ssa_undef = widened
 
     compute_dominators(dst)
     return dst
 
 
+def _build_compacted(Func src, list order, list keep_instr, dict const_override, dict out_spec):
+    # Compacted rebuild from SCCP's decisions: a kept-block order, per-instr keep
+    # mask, const overrides, and per-block surviving-edge specs (5-tuples
+    # ``(dst_old, cond_kind, cond, cond_is_int, old_edge)``).
+    cdef int32_t nb = src.n_blocks
+    cdef _Plan plan = _Plan(src, nb, src.n_instrs, src.n_edges, 0, 0, 0, len(const_override))
+    cdef int32_t b, i, k
+    for b in range(nb):
+        plan.begin_block(b)
+        for i in range(src.blocks[b].instr_start, src.blocks[b].instr_start + src.blocks[b].instr_count):
+            if <bint>keep_instr[i]:
+                plan.add_item(i)
+        for spec in out_spec.get(b, ()):
+            plan.add_edge(<int32_t>spec[0], <uint8_t>spec[1], <double>spec[2], <uint8_t>spec[3], <int32_t>spec[4])
+        if src.blocks[b].test_val >= 0:
+            plan.test[b] = src.blocks[b].test_val
+    plan.end_blocks()
+    for k in range(len(order)):
+        plan.order[k] = <int32_t>order[k]
+    plan.n_order = len(order)
+    for i, oval in const_override.items():
+        plan.add_override(i, <double>oval)
+    return _rebuild(src, plan)
+
+
 # --------------------------------------------------------------------------
 # GVN -- dominator-scoped hash value numbering + algebraic identities.
 # Rewrites operands in place (uses -> dominating canonical value); the redundant
 # defs become unused and DCE reclaims them.
+#
+# Runs nogil over flat arrays: ``subst`` is a per-value forwarding array (-1 ==
+# canonical), and the available-expression table is a khash from a 64-bit key
+# hash to the newest entry with that hash, entries chaining to older ones with
+# the same hash and compared exactly on lookup. Entries live on a stack in
+# insertion order; a dominator scope only ever removes the entries it pushed,
+# newest first, so every removed entry is the head of its hash chain.
 # --------------------------------------------------------------------------
 
-cdef int32_t _resolve(dict subst, int32_t v):
-    while v in subst:
-        v = <int32_t>subst[v]
-    return v
+cdef enum:
+    _GVN_KEY_CONST = 0    # (const id)
+    _GVN_KEY_GET = 1      # (block_ref, resolved index value, offset)
+    _GVN_KEY_OP = 2       # (op, resolved operands) -- compared against the entry's own args
 
 
-cdef bint _is_c(Func f, int32_t v, double c):
-    return f.instrs[v].op == OPX_CONST and f.consts[f.instrs[v].aux] == c
+cdef inline uint64_t _hmix(uint64_t h, uint64_t v) noexcept nogil:
+    # splitmix64 finalizer over the running hash combined with the next word.
+    h ^= v + <uint64_t>0x9E3779B97F4A7C15 + (h << 6) + (h >> 2)
+    h = (h ^ (h >> 30)) * <uint64_t>0xBF58476D1CE4E5B9
+    h = (h ^ (h >> 27)) * <uint64_t>0x94D049BB133111EB
+    return h ^ (h >> 31)
 
 
-def _gvn_instr(Func f, int32_t i, dict avail, list undo, dict subst, list is_bool, object widened, list changed):
-    cdef int32_t op = f.instrs[i].op
-    cdef int32_t astart = f.instrs[i].arg_start
-    cdef int32_t n = f.instrs[i].nargs
-    cdef int32_t pid, iv, ivr, inner, k, av, innerarg, neg_inner
-    if i in widened:
-        return
-    if op == OPX_UNDEF or op == OPX_SET or op == OPX_PHI:
-        return
-    if op == OPX_CONST:
-        key = ("c", f.instrs[i].aux)
-        prev = avail.get(key)
-        if prev is not None:
-            subst[i] = <int32_t>prev
-            changed[0] = True
-            return
-        undo.append(key)
-        avail[key] = i
-        return
-    if op == OPX_GET:
-        pid = f.instrs[i].aux
-        if f.places[pid].kind == PLACE_REAL_BLOCK and not (f.places[pid].flags & PLACE_WRITABLE):
-            iv = f.places[pid].index_val
-            if iv >= 0:
-                ivr = _resolve(subst, iv)
-                if ivr in widened:
-                    return
-            else:
-                ivr = -1
-            key = ("g", f.places[pid].block_ref, ivr, f.places[pid].offset)
-            prev = avail.get(key)
-            if prev is not None:
-                subst[i] = <int32_t>prev
-                changed[0] = True
-                return
-            undo.append(key)
-            avail[key] = i
-        return
-    if not (f.instrs[i].flags & FLAG_PURE):
-        return
-    # resolve operands (skip GVN if any operand is a dominance-relaxed UNDEF value).
-    a = []
-    for k in range(n):
-        av = _resolve(subst, <int32_t>f.args[astart + k])
-        if av in widened:
-            return
-        a.append(av)
-    # algebraic identities (binary/unary forms).
-    if op == OP_Add and n == 2:
-        if _is_c(f, <int32_t>a[1], 0.0):
-            subst[i] = <int32_t>a[0]; changed[0] = True; return
-        if _is_c(f, <int32_t>a[0], 0.0):
-            subst[i] = <int32_t>a[1]; changed[0] = True; return
-        if f.instrs[<int32_t>a[1]].op == OP_Negate and f.instrs[<int32_t>a[1]].nargs == 1:
-            # x + (-y) -> x - y  (bit-exact IEEE: a + (-y) == a - y). Only the
-            # trailing arg (args[1]); the Add spine's FP order is preserved.
-            neg_inner = _resolve(subst, <int32_t>f.args[f.instrs[<int32_t>a[1]].arg_start])
-            f.instrs[i].op = OP_Subtract
-            f.args[astart + 1] = <uint32_t>neg_inner
-            op = OP_Subtract
-            a[1] = neg_inner
-            changed[0] = True
-    elif op == OP_Subtract and n == 2:
-        if _is_c(f, <int32_t>a[1], 0.0):
-            subst[i] = <int32_t>a[0]; changed[0] = True; return
-        if _is_c(f, <int32_t>a[0], 0.0):
-            # 0 - x -> Negate(x)  (deliberate -0.0 tolerance: 0 - 0.0 == +0.0 but
-            # Negate(0.0) == -0.0)
-            f.instrs[i].op = OP_Negate
-            f.args[astart] = <uint32_t><int32_t>a[1]
-            f.instrs[i].nargs = 1
-            op = OP_Negate
-            n = 1
-            a = [a[1]]
-            changed[0] = True
-        elif f.instrs[<int32_t>a[1]].op == OP_Negate and f.instrs[<int32_t>a[1]].nargs == 1:
-            # x - (-y) -> x + y  (bit-exact IEEE: a - (-y) == a + y).
-            neg_inner = _resolve(subst, <int32_t>f.args[f.instrs[<int32_t>a[1]].arg_start])
-            f.instrs[i].op = OP_Add
-            f.args[astart + 1] = <uint32_t>neg_inner
-            op = OP_Add
-            a[1] = neg_inner
-            changed[0] = True
-    elif op == OP_Multiply and n == 2:
-        if _is_c(f, <int32_t>a[1], 1.0):
-            subst[i] = <int32_t>a[0]; changed[0] = True; return
-        if _is_c(f, <int32_t>a[0], 1.0):
-            subst[i] = <int32_t>a[1]; changed[0] = True; return
-    elif op == OP_Divide and n == 2:
-        if _is_c(f, <int32_t>a[1], 1.0):
-            subst[i] = <int32_t>a[0]; changed[0] = True; return
-    if op == OP_Negate and n == 1:
-        inner = <int32_t>a[0]
-        if f.instrs[inner].op == OP_Negate:
-            subst[i] = _resolve(subst, <int32_t>f.args[f.instrs[inner].arg_start])
-            changed[0] = True
-            return
-    if op == OP_Not and n == 1:
-        inner = <int32_t>a[0]
-        if f.instrs[inner].op == OP_Not:
-            innerarg = _resolve(subst, <int32_t>f.args[f.instrs[inner].arg_start])
-            if <bint>is_bool[innerarg]:
-                subst[i] = innerarg
-                changed[0] = True
-                return
-    if (op == OP_Min or op == OP_Max) and n == 2 and a[0] == a[1]:
-        subst[i] = <int32_t>a[0]; changed[0] = True; return
-    # commutative canonicalization by value id (Equal/NotEqual/Max/Min only).
-    if (op == OP_Equal or op == OP_NotEqual or op == OP_Max or op == OP_Min) and n == 2 and a[0] > a[1]:
-        tmp = a[0]; a[0] = a[1]; a[1] = tmp
-        changed[0] = True
-    # persist resolved + canonical operands.
-    for k in range(n):
-        f.args[astart + k] = <uint32_t><int32_t>a[k]
-    key = ("o", op, tuple(a))
-    prev = avail.get(key)
-    if prev is not None:
-        subst[i] = <int32_t>prev
-        changed[0] = True
-        return
-    undo.append(key)
-    avail[key] = i
-
-
-def _apply_subst(Func f, dict subst):
+cdef inline int32_t _resolve_c(const int32_t* subst, int32_t v) noexcept nogil:
+    while subst[v] >= 0:
+        v = subst[v]
+    return v
+
+
+cdef void _apply_subst_c(Func f, const int32_t* subst) noexcept nogil:
     cdef int32_t i, b, k, astart, nargs, tv, pid
     for i in range(f.n_instrs):
         astart = f.instrs[i].arg_start
         nargs = f.instrs[i].nargs
         for k in range(nargs):
-            f.args[astart + k] = <uint32_t>_resolve(subst, <int32_t>f.args[astart + k])
+            f.args[astart + k] = <uint32_t>_resolve_c(subst, <int32_t>f.args[astart + k])
     for b in range(f.n_blocks):
         tv = f.blocks[b].test_val
         if tv >= 0:
-            f.blocks[b].test_val = _resolve(subst, tv)
+            f.blocks[b].test_val = _resolve_c(subst, tv)
     for pid in range(f.n_places):
         if f.places[pid].kind == PLACE_DYNAMIC_BLOCK:
-            f.places[pid].block_ref = _resolve(subst, f.places[pid].block_ref)
+            f.places[pid].block_ref = _resolve_c(subst, f.places[pid].block_ref)
         if f.places[pid].index_val >= 0:
-            f.places[pid].index_val = _resolve(subst, f.places[pid].index_val)
+            f.places[pid].index_val = _resolve_c(subst, f.places[pid].index_val)
+
+
+cdef int32_t* _new_subst(int32_t n) except NULL:
+    cdef int32_t* subst = <int32_t*>malloc(<size_t>(n if n > 0 else 1) * sizeof(int32_t))
+    cdef int32_t i
+    if subst == NULL:
+        raise MemoryError()
+    for i in range(n):
+        subst[i] = -1
+    return subst
 
 
 def _collapse_trivial_phis(Func f):
@@ -3227,70 +3580,363 @@ def _collapse_trivial_phis(Func f):
     1-phi) resolve through the subst map.
     """
     cdef int32_t b, ps, pc, p, e, d, operand
+    cdef int32_t nb = f.n_blocks
+    cdef bint changed = False
     # A 1-operand phi has exactly one incoming edge. Record, per block, whether
     # that sole incoming edge is a self-edge (src == dst): such a phi's operand is
     # NOT guaranteed to dominate the block (it may be the phi itself -> a subst[p]=p
-    # cycle that hangs _resolve, or a value defined later in the same block ->
+    # cycle that hangs _resolve_c, or a value defined later in the same block ->
     # def-before-use). Leave those degenerate phis for DCE/later rounds.
-    cdef list in_count = [0] * f.n_blocks
-    cdef list sole_in_src = [-1] * f.n_blocks
-    for e in range(f.n_edges):
-        d = f.edges[e].dst
-        in_count[d] = <int32_t>in_count[d] + 1
-        sole_in_src[d] = f.edges[e].src
-    subst = {}
-    for b in range(f.n_blocks):
-        if <int32_t>in_count[b] == 1 and <int32_t>sole_in_src[b] == b:
-            continue  # sole incoming edge is a self-edge: skip all 1-op phis here
-        ps = f.blocks[b].phi_start
-        pc = f.blocks[b].phi_count
-        for p in range(ps, ps + pc):
-            if f.instrs[p].nargs == 1:
-                operand = <int32_t>f.args[f.instrs[p].arg_start]
-                if operand == p:
-                    continue  # self-referential single operand: not a copy
-                subst[p] = operand
-    if subst:
-        _apply_subst(f, subst)
-        return (f, True)
-    return (f, False)
+    cdef int32_t* in_count = <int32_t*>calloc(<size_t>(nb if nb > 0 else 1), sizeof(int32_t))
+    cdef int32_t* sole_in_src = <int32_t*>malloc(<size_t>(nb if nb > 0 else 1) * sizeof(int32_t))
+    cdef int32_t* subst = NULL
+    if in_count == NULL or sole_in_src == NULL:
+        free(in_count)
+        free(sole_in_src)
+        raise MemoryError()
+    try:
+        subst = _new_subst(f.n_instrs)
+        with nogil:
+            for e in range(f.n_edges):
+                d = f.edges[e].dst
+                in_count[d] += 1
+                sole_in_src[d] = f.edges[e].src
+            for b in range(nb):
+                if in_count[b] == 1 and sole_in_src[b] == b:
+                    continue  # sole incoming edge is a self-edge: skip all 1-op phis here
+                ps = f.blocks[b].phi_start
+                pc = f.blocks[b].phi_count
+                for p in range(ps, ps + pc):
+                    if f.instrs[p].nargs == 1:
+                        operand = <int32_t>f.args[f.instrs[p].arg_start]
+                        if operand == p:
+                            continue  # self-referential single operand: not a copy
+                        subst[p] = operand
+                        changed = True
+            if changed:
+                _apply_subst_c(f, subst)
+    finally:
+        free(in_count)
+        free(sole_in_src)
+        free(subst)
+    return (f, changed)
 
 
-def _run_gvn_inplace(Func f):
-    cdef Dominators D = compute_dominators(f)
-    is_bool = _compute_bool(f)
-    widened = f._ssa_undef if f._ssa_undef is not None else set()
-    subst = {}
-    avail = {}
-    changed = [False]
-    cdef int32_t entry = f.entry_block
-    cdef int32_t b, i, istart, icount, ci, ch_start, ch_end
-    work = [("enter", entry)]
-    while work:
-        frame = work.pop()
-        if frame[0] == "exit":
-            # Unwind this dominator scope: GVN inserts a key only when it was absent,
-            # so every undo entry is a fresh insertion -- unwinding always deletes it.
-            for key in <list>frame[1]:
-                del avail[key]
-            continue
-        b = <int32_t>frame[1]
-        undo = []
-        istart = f.blocks[b].instr_start
-        icount = f.blocks[b].instr_count
-        for i in range(istart, istart + icount):
-            if f.instrs[i].op == OPX_PHI:
+cdef class _GVN:
+    """Dominator-scoped value numbering working state over one SSA ``Func``."""
+
+    cdef Func f
+    cdef Dominators D
+    cdef Instr* instrs
+    cdef uint32_t* args
+    cdef BlockInfo* blocks
+    cdef PlaceInfo* places
+    cdef double* consts
+
+    cdef int32_t* subst         # [n_instrs]  forwarding value id, or -1
+    cdef uint8_t* is_bool       # [n_instrs]  structurally 0/1 (see _compute_bool_c)
+    cdef uint8_t* widened       # [n_instrs]  dominance-relaxed UNDEF values (skip)
+    cdef int32_t* operands      # [max nargs] resolved operands of the current instr
+
+    # Available-expression entries (a stack, at most one per instr).
+    cdef kh_i64i32_t* table     # key hash -> newest entry with that hash
+    cdef int32_t* ent_vid
+    cdef uint64_t* ent_hash
+    cdef int32_t* ent_next      # older entry with the same hash, or -1
+    cdef uint8_t* ent_kind
+    cdef int32_t* ent_k0
+    cdef int32_t* ent_k1
+    cdef int32_t* ent_k2
+    cdef int32_t n_ent
+
+    cdef int32_t* work          # dominator-tree walk: block id, or -(mark + 1) on scope exit
+    cdef bint changed
+
+    def __cinit__(self, Func f):
+        cdef int32_t n = f.n_instrs
+        cdef size_t sz = <size_t>(n if n > 0 else 1)
+        cdef int32_t i, max_args = 1
+        self.f = f
+        self.D = compute_dominators(f)
+        self.instrs = f.instrs
+        self.args = f.args
+        self.blocks = f.blocks
+        self.places = f.places
+        self.consts = f.consts
+        self.n_ent = 0
+        self.changed = False
+        for i in range(n):
+            if f.instrs[i].nargs > max_args:
+                max_args = f.instrs[i].nargs
+        self.subst = <int32_t*>malloc(sz * sizeof(int32_t))
+        self.is_bool = <uint8_t*>calloc(sz, sizeof(uint8_t))
+        self.widened = <uint8_t*>calloc(sz, sizeof(uint8_t))
+        self.operands = <int32_t*>malloc(<size_t>max_args * sizeof(int32_t))
+        self.table = kh_init_i64i32()
+        self.ent_vid = <int32_t*>malloc(sz * sizeof(int32_t))
+        self.ent_hash = <uint64_t*>malloc(sz * sizeof(uint64_t))
+        self.ent_next = <int32_t*>malloc(sz * sizeof(int32_t))
+        self.ent_kind = <uint8_t*>malloc(sz * sizeof(uint8_t))
+        self.ent_k0 = <int32_t*>malloc(sz * sizeof(int32_t))
+        self.ent_k1 = <int32_t*>malloc(sz * sizeof(int32_t))
+        self.ent_k2 = <int32_t*>malloc(sz * sizeof(int32_t))
+        # Each block is entered once and leaves one exit marker.
+        self.work = <int32_t*>malloc(<size_t>(2 * f.n_blocks + 1) * sizeof(int32_t))
+        if (self.subst == NULL or self.is_bool == NULL or self.widened == NULL or self.operands == NULL
+                or self.table == NULL or self.ent_vid == NULL or self.ent_hash == NULL or self.ent_next == NULL
+                or self.ent_kind == NULL or self.ent_k0 == NULL or self.ent_k1 == NULL or self.ent_k2 == NULL
+                or self.work == NULL):
+            raise MemoryError()
+        for i in range(n):
+            self.subst[i] = -1
+        _compute_bool_c(f, self.is_bool)
+        if f._ssa_undef:
+            for i in f._ssa_undef:
+                self.widened[i] = 1
+
+    def __dealloc__(self):
+        free(self.subst)
+        free(self.is_bool)
+        free(self.widened)
+        free(self.operands)
+        kh_destroy_i64i32(self.table)  # NULL-safe
+        free(self.ent_vid)
+        free(self.ent_hash)
+        free(self.ent_next)
+        free(self.ent_kind)
+        free(self.ent_k0)
+        free(self.ent_k1)
+        free(self.ent_k2)
+        free(self.work)
+
+    # ---- available-expression table ---------------------------------------
+
+    cdef int32_t _find(self, uint64_t h, uint8_t kind, int32_t k0, int32_t k1, int32_t k2, int32_t n) noexcept nogil:
+        # Entry matching the key, or -1. For _GVN_KEY_OP, k0 is the op and the
+        # operands are ``self.operands[:n]``.
+        cdef khint_t it = kh_get_i64i32(self.table, h)
+        cdef int32_t e, v, k, astart
+        if it == self.table.n_buckets:
+            return -1
+        e = self.table.vals[it]
+        while e >= 0:
+            if self.ent_kind[e] == kind:
+                if kind == _GVN_KEY_OP:
+                    v = self.ent_vid[e]
+                    if self.instrs[v].op == k0 and self.instrs[v].nargs == n:
+                        astart = self.instrs[v].arg_start
+                        for k in range(n):
+                            if <int32_t>self.args[astart + k] != self.operands[k]:
+                                break
+                        else:
+                            return e
+                elif self.ent_k0[e] == k0 and self.ent_k1[e] == k1 and self.ent_k2[e] == k2:
+                    return e
+            e = self.ent_next[e]
+        return -1
+
+    cdef int _push(self, uint64_t h, uint8_t kind, int32_t k0, int32_t k1, int32_t k2, int32_t vid) except -1 nogil:
+        cdef int ret
+        cdef khint_t it = kh_put_i64i32(self.table, h, &ret)
+        cdef int32_t e = self.n_ent
+        if ret < 0:
+            with gil:
+                raise MemoryError()
+        self.ent_next[e] = self.table.vals[it] if ret == 0 else -1
+        self.table.vals[it] = e
+        self.ent_vid[e] = vid
+        self.ent_hash[e] = h
+        self.ent_kind[e] = kind
+        self.ent_k0[e] = k0
+        self.ent_k1[e] = k1
+        self.ent_k2[e] = k2
+        self.n_ent = e + 1
+        return 0
+
+    cdef void _pop_to(self, int32_t mark) noexcept nogil:
+        cdef int32_t e
+        cdef khint_t it
+        while self.n_ent > mark:
+            e = self.n_ent - 1
+            it = kh_get_i64i32(self.table, self.ent_hash[e])
+            if self.ent_next[e] >= 0:
+                self.table.vals[it] = self.ent_next[e]
+            else:
+                kh_del_i64i32(self.table, it)
+            self.n_ent = e
+
+    # ---- per-instruction value numbering -----------------------------------
+
+    cdef inline bint _is_c(self, int32_t v, double c) noexcept nogil:
+        return self.instrs[v].op == OPX_CONST and self.consts[self.instrs[v].aux] == c
+
+    cdef inline void _forward(self, int32_t i, int32_t to) noexcept nogil:
+        self.subst[i] = to
+        self.changed = True
+
+    cdef int _number(self, int32_t i) except -1 nogil:
+        cdef Instr* instrs = self.instrs
+        cdef int32_t* a = self.operands
+        cdef int32_t op = instrs[i].op
+        cdef int32_t astart = instrs[i].arg_start
+        cdef int32_t n = instrs[i].nargs
+        cdef int32_t pid, iv, ivr, inner, k, av, innerarg, neg_inner, tmp, prev
+        cdef uint64_t h
+        if self.widened[i]:
+            return 0
+        if op == OPX_UNDEF or op == OPX_SET or op == OPX_PHI:
+            return 0
+        if op == OPX_CONST:
+            h = _hmix(_GVN_KEY_CONST, <uint64_t>instrs[i].aux)
+            prev = self._find(h, _GVN_KEY_CONST, instrs[i].aux, 0, 0, 0)
+            if prev >= 0:
+                self._forward(i, self.ent_vid[prev])
+                return 0
+            return self._push(h, _GVN_KEY_CONST, instrs[i].aux, 0, 0, i)
+        if op == OPX_GET:
+            pid = instrs[i].aux
+            if self.places[pid].kind == PLACE_REAL_BLOCK and not (self.places[pid].flags & PLACE_WRITABLE):
+                iv = self.places[pid].index_val
+                if iv >= 0:
+                    ivr = _resolve_c(self.subst, iv)
+                    if self.widened[ivr]:
+                        return 0
+                else:
+                    ivr = -1
+                h = _hmix(_hmix(_hmix(_GVN_KEY_GET, <uint64_t>self.places[pid].block_ref), <uint64_t>ivr),
+                          <uint64_t>self.places[pid].offset)
+                prev = self._find(h, _GVN_KEY_GET, self.places[pid].block_ref, ivr, self.places[pid].offset, 0)
+                if prev >= 0:
+                    self._forward(i, self.ent_vid[prev])
+                    return 0
+                return self._push(h, _GVN_KEY_GET, self.places[pid].block_ref, ivr, self.places[pid].offset, i)
+            return 0
+        if not (instrs[i].flags & FLAG_PURE):
+            return 0
+        # resolve operands (skip GVN if any operand is a dominance-relaxed UNDEF value).
+        for k in range(n):
+            av = _resolve_c(self.subst, <int32_t>self.args[astart + k])
+            if self.widened[av]:
+                return 0
+            a[k] = av
+        # algebraic identities (binary/unary forms).
+        if op == OP_Add and n == 2:
+            if self._is_c(a[1], 0.0):
+                self._forward(i, a[0])
+                return 0
+            if self._is_c(a[0], 0.0):
+                self._forward(i, a[1])
+                return 0
+            if instrs[a[1]].op == OP_Negate and instrs[a[1]].nargs == 1:
+                # x + (-y) -> x - y  (bit-exact IEEE: a + (-y) == a - y). Only the
+                # trailing arg (args[1]); the Add spine's FP order is preserved.
+                neg_inner = _resolve_c(self.subst, <int32_t>self.args[instrs[a[1]].arg_start])
+                instrs[i].op = OP_Subtract
+                self.args[astart + 1] = <uint32_t>neg_inner
+                op = OP_Subtract
+                a[1] = neg_inner
+                self.changed = True
+        elif op == OP_Subtract and n == 2:
+            if self._is_c(a[1], 0.0):
+                self._forward(i, a[0])
+                return 0
+            if self._is_c(a[0], 0.0):
+                # 0 - x -> Negate(x)  (deliberate -0.0 tolerance: 0 - 0.0 == +0.0 but
+                # Negate(0.0) == -0.0)
+                instrs[i].op = OP_Negate
+                self.args[astart] = <uint32_t>a[1]
+                instrs[i].nargs = 1
+                op = OP_Negate
+                n = 1
+                a[0] = a[1]
+                self.changed = True
+            elif instrs[a[1]].op == OP_Negate and instrs[a[1]].nargs == 1:
+                # x - (-y) -> x + y  (bit-exact IEEE: a - (-y) == a + y).
+                neg_inner = _resolve_c(self.subst, <int32_t>self.args[instrs[a[1]].arg_start])
+                instrs[i].op = OP_Add
+                self.args[astart + 1] = <uint32_t>neg_inner
+                op = OP_Add
+                a[1] = neg_inner
+                self.changed = True
+        elif op == OP_Multiply and n == 2:
+            if self._is_c(a[1], 1.0):
+                self._forward(i, a[0])
+                return 0
+            if self._is_c(a[0], 1.0):
+                self._forward(i, a[1])
+                return 0
+        elif op == OP_Divide and n == 2:
+            if self._is_c(a[1], 1.0):
+                self._forward(i, a[0])
+                return 0
+        if op == OP_Negate and n == 1:
+            inner = a[0]
+            if instrs[inner].op == OP_Negate:
+                self._forward(i, _resolve_c(self.subst, <int32_t>self.args[instrs[inner].arg_start]))
+                return 0
+        if op == OP_Not and n == 1:
+            inner = a[0]
+            if instrs[inner].op == OP_Not:
+                innerarg = _resolve_c(self.subst, <int32_t>self.args[instrs[inner].arg_start])
+                if self.is_bool[innerarg]:
+                    self._forward(i, innerarg)
+                    return 0
+        if (op == OP_Min or op == OP_Max) and n == 2 and a[0] == a[1]:
+            self._forward(i, a[0])
+            return 0
+        # commutative canonicalization by value id (Equal/NotEqual/Max/Min only).
+        if (op == OP_Equal or op == OP_NotEqual or op == OP_Max or op == OP_Min) and n == 2 and a[0] > a[1]:
+            tmp = a[0]
+            a[0] = a[1]
+            a[1] = tmp
+            self.changed = True
+        # persist resolved + canonical operands.
+        h = _hmix(_hmix(_GVN_KEY_OP, <uint64_t>op), <uint64_t>n)
+        for k in range(n):
+            self.args[astart + k] = <uint32_t>a[k]
+            h = _hmix(h, <uint64_t>a[k])
+        prev = self._find(h, _GVN_KEY_OP, op, 0, 0, n)
+        if prev >= 0:
+            self._forward(i, self.ent_vid[prev])
+            return 0
+        return self._push(h, _GVN_KEY_OP, op, 0, 0, i)
+
+    cdef int run(self) except -1 nogil:
+        cdef int32_t top = 0
+        cdef int32_t b, frame, i, istart, icount, ci, mark
+        self.work[top] = self.f.entry_block
+        top += 1
+        while top > 0:
+            top -= 1
+            frame = self.work[top]
+            if frame < 0:
+                # Unwind this dominator scope: GVN inserts a key only when it was
+                # absent, so every entry above the mark is a fresh insertion.
+                self._pop_to(-frame - 1)
                 continue
-            _gvn_instr(f, i, avail, undo, subst, is_bool, widened, changed)
-        work.append(("exit", undo))
-        ch_start = D.child_head[b]
-        ch_end = D.child_head[b + 1]
-        for ci in range(ch_end - 1, ch_start - 1, -1):
-            work.append(("enter", D.child_list[ci]))
-    if subst or <bint>changed[0]:
-        _apply_subst(f, subst)
-        return (f, True)
-    return (f, False)
+            b = frame
+            istart = self.blocks[b].instr_start
+            icount = self.blocks[b].instr_count
+            mark = self.n_ent
+            for i in range(istart, istart + icount):
+                if self.instrs[i].op == OPX_PHI:
+                    continue
+                self._number(i)
+            self.work[top] = -(mark + 1)
+            top += 1
+            for ci in range(self.D.child_head[b + 1] - 1, self.D.child_head[b] - 1, -1):
+                self.work[top] = self.D.child_list[ci]
+                top += 1
+        if self.changed:
+            _apply_subst_c(self.f, self.subst)
+        return 0
+
+
+def _run_gvn_inplace(Func f):
+    cdef _GVN g = _GVN(f)
+    with nogil:
+        g.run()
+    return (f, g.changed)
 
 
 # --------------------------------------------------------------------------
@@ -3358,16 +4004,19 @@ def _canon_branch_not(Func f):
 # then compact away everything unmarked.
 # --------------------------------------------------------------------------
 
-def _run_dce(Func f):
+cdef bint _dce_mark(Func f, uint8_t* live, int32_t* wl) noexcept nogil:
+    # Mark ``live`` (zeroed, n_instrs) from the roots; ``wl`` is an n_instrs
+    # worklist (every value is pushed at most once). Returns whether any value is
+    # dead.
     cdef int32_t n = f.n_instrs
-    live = [False] * n
-    wl = []
-    cdef int32_t i, b, tv, op, astart, nargs, k, a, pid, br, ivv, v, e, es, ec
+    cdef int32_t top = 0
+    cdef int32_t i, b, tv, op, astart, nargs, k, a, pid, br, ivv, v
     for b in range(f.n_blocks):
         tv = f.blocks[b].test_val
-        if tv >= 0 and not <bint>live[tv]:
-            live[tv] = True
-            wl.append(tv)
+        if tv >= 0 and not live[tv]:
+            live[tv] = 1
+            wl[top] = tv
+            top += 1
     for i in range(n):
         # Roots: bare statement roots AND every side-effecting instruction
         # (side effects are never deletable). A side-effecting value can lack
@@ -3376,11 +4025,13 @@ def _run_dce(Func f):
         # persist. FLAG_SIDE_EFFECT excludes ``Random`` (side_effects=False), which
         # stays deletable-when-unused, matching lower.pyx's materialize logic.
         if f.instrs[i].flags & (FLAG_STMT_ROOT | FLAG_SIDE_EFFECT):
-            if not <bint>live[i]:
-                live[i] = True
-                wl.append(i)
-    while wl:
-        v = <int32_t>wl.pop()
+            if not live[i]:
+                live[i] = 1
+                wl[top] = i
+                top += 1
+    while top > 0:
+        top -= 1
+        v = wl[top]
         op = f.instrs[v].op
         if op == OPX_CONST or op == OPX_UNDEF:
             continue
@@ -3388,38 +4039,70 @@ def _run_dce(Func f):
         nargs = f.instrs[v].nargs
         for k in range(nargs):
             a = <int32_t>f.args[astart + k]
-            if not <bint>live[a]:
-                live[a] = True
-                wl.append(a)
+            if not live[a]:
+                live[a] = 1
+                wl[top] = a
+                top += 1
         if op == OPX_GET or op == OPX_SET:
             pid = f.instrs[v].aux
             if f.places[pid].kind == PLACE_DYNAMIC_BLOCK:
                 br = f.places[pid].block_ref
-                if not <bint>live[br]:
-                    live[br] = True
-                    wl.append(br)
+                if not live[br]:
+                    live[br] = 1
+                    wl[top] = br
+                    top += 1
             ivv = f.places[pid].index_val
-            if ivv >= 0 and not <bint>live[ivv]:
-                live[ivv] = True
-                wl.append(ivv)
-    changed = False
+            if ivv >= 0 and not live[ivv]:
+                live[ivv] = 1
+                wl[top] = ivv
+                top += 1
     for i in range(n):
-        if not <bint>live[i]:
-            changed = True
-            break
-    if not changed:
-        return (f, False)
-    order = list(range(f.n_blocks))
-    out_spec = {}
+        if not live[i]:
+            return True
+    return False
+
+
+cdef int _dce_plan(Func f, _Plan plan, const uint8_t* live) except -1 nogil:
+    # Every block, in id order, keeping its live values and all of its edges.
+    cdef int32_t b, i, e, istart, es
     for b in range(f.n_blocks):
+        plan.begin_block(b)
+        istart = f.blocks[b].instr_start
+        for i in range(istart, istart + f.blocks[b].instr_count):
+            if live[i]:
+                plan.add_item(i)
         es = f.blocks[b].edge_start
-        ec = f.blocks[b].edge_count
-        spec = []
-        for e in range(es, es + ec):
-            spec.append((f.edges[e].dst, f.edges[e].cond_kind, f.edges[e].cond, f.edges[e].cond_is_int, e))
-        out_spec[b] = spec
-    newf = _build_compacted(f, order, live, {}, out_spec)
-    return (newf, True)
+        for e in range(es, es + f.blocks[b].edge_count):
+            plan.add_edge(f.edges[e].dst, f.edges[e].cond_kind, f.edges[e].cond, f.edges[e].cond_is_int, e)
+        if f.blocks[b].test_val >= 0:
+            plan.test[b] = f.blocks[b].test_val
+    plan.end_blocks()
+    plan.identity_order()
+    return 0
+
+
+def _run_dce(Func f):
+    cdef int32_t n = f.n_instrs
+    cdef uint8_t* live = <uint8_t*>calloc(<size_t>(n if n > 0 else 1), sizeof(uint8_t))
+    cdef int32_t* wl = <int32_t*>malloc(<size_t>(n if n > 0 else 1) * sizeof(int32_t))
+    cdef bint changed
+    cdef _Plan plan
+    if live == NULL or wl == NULL:
+        free(live)
+        free(wl)
+        raise MemoryError()
+    try:
+        with nogil:
+            changed = _dce_mark(f, live, wl)
+        if not changed:
+            return (f, False)
+        plan = _Plan(f, f.n_blocks, n, f.n_edges)
+        with nogil:
+            _dce_plan(f, plan, live)
+    finally:
+        free(live)
+        free(wl)
+    return (_rebuild(f, plan), True)
 
 
 # ==========================================================================
@@ -3427,284 +4110,11 @@ def _run_dce(Func f):
 #
 # Both reshape the CFG on SSA form (phis live). ``rewrite_switch`` rewrites block
 # tests + edge conds/targets, drops dead blocks, and relocates escaping consts to
-# entry; LICM relocates instructions into a fresh preheader block. Both rebuild
-# through the general model-driven rebuilder ``_emit_from_model`` below.
+# entry; LICM relocates instructions into a fresh preheader block. Both describe
+# the result as a ``_Plan`` and rebuild through ``_rebuild``.
 # ==========================================================================
 
 
-# ---- general model-driven SSA arena rebuilder ----------------------------
-# A "model" is a list of plan-blocks (``pblocks``; arbitrary order, entry given).
-# Each plan-block is a dict:
-#   "items": value items in schedule order (phis first):
-#       ("i",  old_vid, opmap|None)   copy src instr old_vid. If it is an OPX_PHI,
-#                                     ``opmap`` {edge_key: vref} gives per-edge
-#                                     operands; otherwise opmap is None (operands
-#                                     copied from src and remapped).
-#       ("np", token, temp_id, opmap) a brand-new phi ({edge_key: vref}).
-#   "test":  vref | None
-#   "edges": list of [dst_pb, cond_kind, cond, cond_is_int, edge_key]
-# vref = ("o", old_vid) | ("n", token). ``edge_key`` is any hashable, matched
-# between an incoming edge spec and a phi's opmap. Produces a fresh SSA ``Func``.
-
-cdef int32_t _resolve_vref(object ref, dict oldmap, dict tokenmap) except -1:
-    if <str>ref[0] == "o":
-        return <int32_t>oldmap[<int32_t>ref[1]]
-    return <int32_t>tokenmap[ref[1]]
-
-
-def _emit_from_model(Func src, list pblocks, int entry_pb):
-    cdef Func dst = Func()
-    cdef int32_t npb = len(pblocks)
-    cdef int32_t i, k, pb, kk, nn, astart, ov, op, pid, val_new, ni, arg_cursor
-    cdef int32_t total_instrs, total_args, nb_new, ninc
-
-    # --- reachability + RPO from entry over model edges ---
-    succ = [[] for _ in range(npb)]
-    for pb in range(npb):
-        for espec in <list>(<dict>pblocks[pb])["edges"]:
-            (<list>succ[pb]).append(<int32_t>espec[0])
-    visited = [False] * npb
-    post = []
-    stack = [(entry_pb, 0)]
-    visited[entry_pb] = True
-    while stack:
-        top = stack[len(stack) - 1]
-        node = <int32_t>top[0]
-        idx = <int32_t>top[1]
-        slist = <list>succ[node]
-        if idx < len(slist):
-            stack[len(stack) - 1] = (node, idx + 1)
-            ch = <int32_t>slist[idx]
-            if not <bint>visited[ch]:
-                visited[ch] = True
-                stack.append((ch, 0))
-        else:
-            post.append(node)
-            stack.pop()
-    rpo = list(reversed(post))
-    nb_new = len(rpo)
-    new_bid = {}
-    for k in range(nb_new):
-        new_bid[<int32_t>rpo[k]] = k
-
-    # --- consts / temps / names carry over 1:1 (ids preserved) ---
-    if src.n_consts > 0:
-        dst.consts = <double*>malloc(<size_t>src.n_consts * sizeof(double))
-        if dst.consts == NULL:
-            raise MemoryError()
-        memcpy(dst.consts, src.consts, <size_t>src.n_consts * sizeof(double))
-    dst.n_consts = src.n_consts
-    dst.cap_consts = src.n_consts
-    dst._rebuild_const_intern()
-    if src.n_temps > 0:
-        dst.temps = <TempInfo*>malloc(<size_t>src.n_temps * sizeof(TempInfo))
-        if dst.temps == NULL:
-            raise MemoryError()
-        memcpy(dst.temps, src.temps, <size_t>src.n_temps * sizeof(TempInfo))
-    dst.n_temps = src.n_temps
-    dst.cap_temps = src.n_temps
-    dst.names = list(src.names)
-    dst._temp_intern = dict(src._temp_intern)
-    dst._block_enum_by_id = dict(src._block_enum_by_id)
-    dst.blocks_type = src.blocks_type
-    dst.callback = src.callback
-    dst._block_map = dict(src._block_map)
-    dst.is_ssa = True
-
-    # --- edges (block-by-block in RPO) + per-dst incoming (new-edge-index order) ---
-    new_edges = []
-    incoming_new = [[] for _ in range(nb_new)]
-    block_edge_start = [0] * nb_new
-    block_edge_count = [0] * nb_new
-    for k in range(nb_new):
-        pb = <int32_t>rpo[k]
-        block_edge_start[k] = len(new_edges)
-        for espec in <list>(<dict>pblocks[pb])["edges"]:
-            dst_pb = <int32_t>espec[0]
-            nb_dst = <int32_t>new_bid[dst_pb]
-            nei = len(new_edges)
-            new_edges.append((k, nb_dst, <int32_t>espec[1], <double>espec[2], <int32_t>espec[3]))
-            (<list>incoming_new[nb_dst]).append((nei, espec[4]))
-        block_edge_count[k] = len(new_edges) - block_edge_start[k]
-
-    # --- assign new value ids (phis first per block already, by item order) ---
-    oldmap = {}
-    tokenmap = {}
-    block_items = [None] * nb_new
-    block_start = [0] * nb_new
-    ni = 0
-    for k in range(nb_new):
-        pb = <int32_t>rpo[k]
-        items = <list>(<dict>pblocks[pb])["items"]
-        block_items[k] = items
-        block_start[k] = ni
-        for it in items:
-            if <str>it[0] == "i":
-                oldmap[<int32_t>it[1]] = ni
-            else:
-                tokenmap[it[1]] = ni
-            ni += 1
-    total_instrs = ni
-
-    # --- count operand slots ---
-    total_args = 0
-    for k in range(nb_new):
-        ninc = len(<list>incoming_new[k])
-        for it in <list>block_items[k]:
-            if <str>it[0] == "np":
-                total_args += ninc
-            else:
-                ov = <int32_t>it[1]
-                op = src.instrs[ov].op
-                if op == OPX_PHI:
-                    total_args += ninc
-                elif op == OPX_CONST or op == OPX_UNDEF or op == OPX_GET:
-                    pass
-                elif op == OPX_SET:
-                    total_args += 1
-                else:
-                    total_args += src.instrs[ov].nargs
-
-    dst.instrs = <Instr*>malloc(<size_t>(total_instrs if total_instrs > 0 else 1) * sizeof(Instr))
-    dst.args = <uint32_t*>malloc(<size_t>(total_args if total_args > 0 else 1) * sizeof(uint32_t))
-    if dst.instrs == NULL or dst.args == NULL:
-        raise MemoryError()
-    dst.n_instrs = total_instrs
-    dst.cap_instrs = total_instrs
-    dst.cap_args = total_args
-
-    dst.blocks = <BlockInfo*>malloc(<size_t>(nb_new if nb_new > 0 else 1) * sizeof(BlockInfo))
-    if dst.blocks == NULL:
-        raise MemoryError()
-    dst.n_blocks = nb_new
-    dst.cap_blocks = nb_new
-    dst.entry_block = <int32_t>new_bid[entry_pb]
-
-    place_map = {}
-    arg_cursor = 0
-    cdef int32_t phi_first, phi_cnt
-    for k in range(nb_new):
-        pb = <int32_t>rpo[k]
-        inclist = <list>incoming_new[k]
-        ninc = len(inclist)
-        phi_first = -1
-        phi_cnt = 0
-        ni = <int32_t>block_start[k]
-        for it in <list>block_items[k]:
-            dst.instrs[ni].block = k
-            dst.instrs[ni].arg_start = arg_cursor
-            if <str>it[0] == "np":
-                opmap = <dict>it[3]
-                for pair in inclist:
-                    dst.args[arg_cursor] = <uint32_t>_resolve_vref(opmap[pair[1]], oldmap, tokenmap)
-                    arg_cursor += 1
-                dst.instrs[ni].op = OPX_PHI
-                dst.instrs[ni].flags = 0
-                dst.instrs[ni].aux = <int32_t>it[2]
-                dst.instrs[ni].nargs = <int16_t>ninc
-                if phi_first == -1:
-                    phi_first = ni
-                phi_cnt += 1
-            else:
-                ov = <int32_t>it[1]
-                op = src.instrs[ov].op
-                if op == OPX_PHI:
-                    opmap = <dict>it[2]
-                    for pair in inclist:
-                        dst.args[arg_cursor] = <uint32_t>_resolve_vref(opmap[pair[1]], oldmap, tokenmap)
-                        arg_cursor += 1
-                    dst.instrs[ni].op = OPX_PHI
-                    dst.instrs[ni].flags = src.instrs[ov].flags
-                    dst.instrs[ni].aux = src.instrs[ov].aux
-                    dst.instrs[ni].nargs = <int16_t>ninc
-                    if phi_first == -1:
-                        phi_first = ni
-                    phi_cnt += 1
-                elif op == OPX_CONST:
-                    dst.instrs[ni].op = OPX_CONST
-                    dst.instrs[ni].flags = src.instrs[ov].flags
-                    dst.instrs[ni].aux = src.instrs[ov].aux
-                    dst.instrs[ni].nargs = 0
-                elif op == OPX_UNDEF:
-                    dst.instrs[ni].op = OPX_UNDEF
-                    dst.instrs[ni].flags = src.instrs[ov].flags
-                    dst.instrs[ni].aux = -1
-                    dst.instrs[ni].nargs = 0
-                elif op == OPX_GET:
-                    pid = _remap_place_c(dst, src, src.instrs[ov].aux, oldmap, place_map)
-                    dst.instrs[ni].op = OPX_GET
-                    dst.instrs[ni].flags = src.instrs[ov].flags
-                    dst.instrs[ni].aux = pid
-                    dst.instrs[ni].nargs = 0
-                elif op == OPX_SET:
-                    val_new = <int32_t>oldmap[<int32_t>src.args[src.instrs[ov].arg_start]]
-                    pid = _remap_place_c(dst, src, src.instrs[ov].aux, oldmap, place_map)
-                    dst.args[arg_cursor] = <uint32_t>val_new
-                    arg_cursor += 1
-                    dst.instrs[ni].op = OPX_SET
-                    dst.instrs[ni].flags = src.instrs[ov].flags
-                    dst.instrs[ni].aux = pid
-                    dst.instrs[ni].nargs = 1
-                else:
-                    astart = src.instrs[ov].arg_start
-                    nn = src.instrs[ov].nargs
-                    for kk in range(nn):
-                        dst.args[arg_cursor] = <uint32_t><int32_t>oldmap[<int32_t>src.args[astart + kk]]
-                        arg_cursor += 1
-                    dst.instrs[ni].op = <uint16_t>op
-                    dst.instrs[ni].flags = src.instrs[ov].flags
-                    dst.instrs[ni].aux = src.instrs[ov].aux
-                    dst.instrs[ni].nargs = <int16_t>nn
-            ni += 1
-        dst.blocks[k].instr_start = <int32_t>block_start[k]
-        dst.blocks[k].instr_count = len(<list>block_items[k])
-        dst.blocks[k].phi_start = phi_first if phi_cnt > 0 else <int32_t>block_start[k]
-        dst.blocks[k].phi_count = phi_cnt
-        dst.blocks[k].rpo = k
-        dst.blocks[k].idom = -1
-        dst.blocks[k].edge_start = <int32_t>block_edge_start[k]
-        dst.blocks[k].edge_count = <int32_t>block_edge_count[k]
-        tref = (<dict>pblocks[pb])["test"]
-        has_value_edge = False
-        for espec in <list>(<dict>pblocks[pb])["edges"]:
-            if <int32_t>espec[1] == EDGE_COND_VALUE:
-                has_value_edge = True
-                break
-        if tref is not None and has_value_edge:
-            dst.blocks[k].test_val = _resolve_vref(tref, oldmap, tokenmap)
-        else:
-            dst.blocks[k].test_val = -1
-    dst.n_args = arg_cursor
-
-    cdef int32_t nen = len(new_edges)
-    dst.edges = <Edge*>malloc(<size_t>(nen if nen > 0 else 1) * sizeof(Edge))
-    if dst.edges == NULL:
-        raise MemoryError()
-    for i in range(nen):
-        ne_t = new_edges[i]
-        dst.edges[i].src = <int32_t>ne_t[0]
-        dst.edges[i].dst = <int32_t>ne_t[1]
-        dst.edges[i].cond_kind = <uint8_t>ne_t[2]
-        dst.edges[i].cond = <double>ne_t[3]
-        dst.edges[i].cond_is_int = <uint8_t>ne_t[4]
-    dst.n_edges = nen
-    dst.cap_edges = nen
-
-    if src.undef_val >= 0 and src.undef_val in oldmap:
-        dst.undef_val = <int32_t>oldmap[src.undef_val]
-    else:
-        dst.undef_val = -1
-    widened = set()
-    if src._ssa_undef:
-        for wv in src._ssa_undef:
-            if wv in oldmap:
-                widened.add(<int32_t>oldmap[wv])
-    dst._ssa_undef = widened
-
-    compute_dominators(dst)
-    return dst
-
-
 # ---- LICM -----------------------------------------------------------------
 # Loop forest from dominators + back edges. For each loop (inner-first), hoist
 # pure / effectively-pure (non-writable static real-block reads), loop-invariant,
@@ -3717,71 +4127,6 @@ def _emit_from_model(Func src, list pblocks, int entry_pb):
 # stay aligned with the runtime cost model.
 
 
-cdef bint _licm_is_rtc(Func f, int32_t v, dict memo) except -1:
-    # True iff the whole subtree rooted at v is runtime-constant.
-    cached = memo.get(v)
-    if cached is not None:
-        return <bint>cached
-    cdef uint16_t op = f.instrs[v].op
-    cdef int32_t astart, n, k, pid
-    cdef bint r = False
-    if op == OPX_CONST:
-        r = True
-    elif op == OPX_GET:
-        pid = f.instrs[v].aux
-        r = (f.places[pid].flags & PLACE_RUNTIME_CONST) != 0
-    elif op < OP_RUNTIME_COUNT and (f.instrs[v].flags & FLAG_PURE):
-        r = True
-        astart = f.instrs[v].arg_start
-        n = f.instrs[v].nargs
-        for k in range(n):
-            if not _licm_is_rtc(f, <int32_t>f.args[astart + k], memo):
-                r = False
-                break
-    memo[v] = r
-    return r
-
-
-cdef int32_t _licm_eff_cost(Func f, int32_t v, dict memo, dict memo_rtc) except -1:
-    # Effective cost (runtime cost model), with the runtime-constant refinement.
-    # Memoised per value id.
-    cached = memo.get(v)
-    if cached is not None:
-        return <int32_t>cached
-    if _licm_is_rtc(f, v, memo_rtc):
-        memo[v] = 1
-        return 1
-    cdef uint16_t op = f.instrs[v].op
-    cdef int32_t astart, n, k, pid, iv, c
-    if op == OPX_CONST:
-        c = 1
-    elif op == OPX_UNDEF:
-        c = 3
-    elif op == OPX_GET:
-        pid = f.instrs[v].aux
-        c = 1
-        if f.places[pid].kind == PLACE_DYNAMIC_BLOCK:
-            c += _licm_eff_cost(f, f.places[pid].block_ref, memo, memo_rtc)
-        else:
-            c += 1
-        iv = f.places[pid].index_val
-        if iv < 0:
-            c += 1
-        else:
-            c += _licm_eff_cost(f, iv, memo, memo_rtc)
-    elif op < OP_RUNTIME_COUNT and (f.instrs[v].flags & FLAG_PURE):
-        c = 1
-        astart = f.instrs[v].arg_start
-        n = f.instrs[v].nargs
-        for k in range(n):
-            c += _licm_eff_cost(f, <int32_t>f.args[astart + k], memo, memo_rtc)
-    else:
-        # phi / impure / Random -- a materialized scalar value reference.
-        c = 3
-    memo[v] = c
-    return c
-
-
 cdef bint _licm_hoist_kind(Func f, int32_t v) noexcept nogil:
     cdef uint16_t op = f.instrs[v].op
     cdef int32_t pid
@@ -3793,270 +4138,367 @@ cdef bint _licm_hoist_kind(Func f, int32_t v) noexcept nogil:
     return False
 
 
-cdef list _licm_operands(Func f, int32_t v):
-    # Value ids this value directly consumes (for the hoist-set closure).
-    cdef int32_t pid, astart, n, k
-    res = []
-    if f.instrs[v].op == OPX_GET:
-        pid = f.instrs[v].aux
-        if f.places[pid].kind == PLACE_DYNAMIC_BLOCK:
-            res.append(f.places[pid].block_ref)
-        if f.places[pid].index_val >= 0:
-            res.append(f.places[pid].index_val)
-        return res
-    astart = f.instrs[v].arg_start
-    n = f.instrs[v].nargs
-    for k in range(n):
-        res.append(<int32_t>f.args[astart + k])
-    return res
-
-
-cdef bint _licm_operand_inv(Func f, LoopForest F, int32_t L, int32_t a, dict inv) except -1:
-    # An operand is loop-invariant if defined outside the loop, or invariant itself.
-    if not F.in_loop(L, f.instrs[a].block):
-        return True
-    return <bint>inv.get(a, False)
+cdef class _LICM:
+    """LICM over one Func: cost memos shared by its loops, plus per-loop scratch."""
 
+    cdef Func f
+    cdef Dominators D
+    cdef LoopForest F
+    cdef int8_t* rtc                # [n]  runtime-constant subtree memo (-1 unknown)
+    cdef int32_t* cost              # [n]  effective cost memo (-1 unknown)
+    cdef uint8_t* inv               # [n]  loop-invariant (valid for the current loop body)
+    cdef uint8_t* hoist             # [n]  hoist set of the current loop
+    cdef int32_t* work              # [n]  hoist-set closure worklist
+    cdef int32_t* latches           # [ne] tails of the current header's back edges
+    cdef uint8_t* entry_edge        # [ne] edge enters the current header from outside the loop
+    cdef int32_t n_latches
+
+    def __cinit__(self, Func f, Dominators D, LoopForest F):
+        cdef int32_t n = f.n_instrs
+        cdef int32_t ne = f.n_edges
+        cdef int32_t i
+        self.f = f
+        self.D = D
+        self.F = F
+        self.rtc = <int8_t*>malloc(<size_t>(n if n > 0 else 1) * sizeof(int8_t))
+        self.cost = <int32_t*>malloc(<size_t>(n if n > 0 else 1) * sizeof(int32_t))
+        self.inv = <uint8_t*>calloc(<size_t>(n if n > 0 else 1), sizeof(uint8_t))
+        self.hoist = <uint8_t*>calloc(<size_t>(n if n > 0 else 1), sizeof(uint8_t))
+        self.work = <int32_t*>malloc(<size_t>(n if n > 0 else 1) * sizeof(int32_t))
+        self.latches = <int32_t*>malloc(<size_t>(ne if ne > 0 else 1) * sizeof(int32_t))
+        self.entry_edge = <uint8_t*>calloc(<size_t>(ne if ne > 0 else 1), sizeof(uint8_t))
+        if (self.rtc == NULL or self.cost == NULL or self.inv == NULL or self.hoist == NULL
+                or self.work == NULL or self.latches == NULL or self.entry_edge == NULL):
+            raise MemoryError()
+        for i in range(n):
+            self.rtc[i] = -1
+            self.cost[i] = -1
 
-cdef bint _licm_is_invariant(Func f, LoopForest F, int32_t L, int32_t v, dict inv) except -1:
-    cdef uint16_t op = f.instrs[v].op
-    cdef int32_t pid, astart, n, k, iv
-    if op == OPX_PHI:
-        return False
-    if op == OPX_UNDEF or op == OPX_CONST:
-        return True
-    if op == OPX_GET:
-        pid = f.instrs[v].aux
-        if f.places[pid].kind != PLACE_REAL_BLOCK:
-            return False
-        if f.places[pid].flags & PLACE_WRITABLE:
-            return False
-        iv = f.places[pid].index_val
-        if iv >= 0 and not _licm_operand_inv(f, F, L, iv, inv):
+    def __dealloc__(self):
+        free(self.rtc)
+        free(self.cost)
+        free(self.inv)
+        free(self.hoist)
+        free(self.work)
+        free(self.latches)
+        free(self.entry_edge)
+
+    cdef bint _is_rtc(self, int32_t v) noexcept nogil:
+        # True iff the whole subtree rooted at v is runtime-constant.
+        cdef uint16_t op
+        cdef int32_t astart, n, k, pid
+        cdef bint r = False
+        if self.rtc[v] >= 0:
+            return <bint>self.rtc[v]
+        op = self.f.instrs[v].op
+        if op == OPX_CONST:
+            r = True
+        elif op == OPX_GET:
+            pid = self.f.instrs[v].aux
+            r = (self.f.places[pid].flags & PLACE_RUNTIME_CONST) != 0
+        elif op < OP_RUNTIME_COUNT and (self.f.instrs[v].flags & FLAG_PURE):
+            r = True
+            astart = self.f.instrs[v].arg_start
+            n = self.f.instrs[v].nargs
+            for k in range(n):
+                if not self._is_rtc(<int32_t>self.f.args[astart + k]):
+                    r = False
+                    break
+        self.rtc[v] = r
+        return r
+
+    cdef int32_t _eff_cost(self, int32_t v) noexcept nogil:
+        # Effective cost (runtime cost model), with the runtime-constant refinement.
+        cdef uint16_t op
+        cdef int32_t astart, n, k, pid, iv, c
+        if self.cost[v] >= 0:
+            return self.cost[v]
+        if self._is_rtc(v):
+            self.cost[v] = 1
+            return 1
+        op = self.f.instrs[v].op
+        if op == OPX_CONST:
+            c = 1
+        elif op == OPX_UNDEF:
+            c = 3
+        elif op == OPX_GET:
+            pid = self.f.instrs[v].aux
+            c = 1
+            if self.f.places[pid].kind == PLACE_DYNAMIC_BLOCK:
+                c += self._eff_cost(self.f.places[pid].block_ref)
+            else:
+                c += 1
+            iv = self.f.places[pid].index_val
+            if iv < 0:
+                c += 1
+            else:
+                c += self._eff_cost(iv)
+        elif op < OP_RUNTIME_COUNT and (self.f.instrs[v].flags & FLAG_PURE):
+            c = 1
+            astart = self.f.instrs[v].arg_start
+            n = self.f.instrs[v].nargs
+            for k in range(n):
+                c += self._eff_cost(<int32_t>self.f.args[astart + k])
+        else:
+            # phi / impure / Random -- a materialized scalar value reference.
+            c = 3
+        self.cost[v] = c
+        return c
+
+    cdef inline bint _operand_inv(self, int32_t L, int32_t a) noexcept nogil:
+        # An operand is loop-invariant if defined outside the loop, or invariant itself.
+        return not self.F.in_loop(L, self.f.instrs[a].block) or self.inv[a]
+
+    cdef bint _is_invariant(self, int32_t L, int32_t v) noexcept nogil:
+        cdef uint16_t op = self.f.instrs[v].op
+        cdef int32_t pid, astart, n, k, iv
+        if op == OPX_PHI:
             return False
-        return True
-    if op < OP_RUNTIME_COUNT and (f.instrs[v].flags & FLAG_PURE):
-        astart = f.instrs[v].arg_start
-        n = f.instrs[v].nargs
-        for k in range(n):
-            if not _licm_operand_inv(f, F, L, <int32_t>f.args[astart + k], inv):
+        if op == OPX_UNDEF or op == OPX_CONST:
+            return True
+        if op == OPX_GET:
+            pid = self.f.instrs[v].aux
+            if self.f.places[pid].kind != PLACE_REAL_BLOCK:
                 return False
-        return True
-    return False
-
-
-cdef list _incoming_by_block(Func f):
-    # incoming[b] = ascending-global-edge-index list of edges with dst == b (the
-    # phi operand <-> incoming-edge contract order).
-    cdef list incoming = [[] for _ in range(f.n_blocks)]
-    cdef int32_t e
-    for e in range(f.n_edges):
-        (<list>incoming[f.edges[e].dst]).append(e)
-    return incoming
-
-
-def _phi_opmap_src(Func f, int32_t vid, list incoming):
-    # {src_edge_index: ("o", operand_vid)} for a phi, by incoming-edge order.
-    cdef int32_t astart = f.instrs[vid].arg_start
-    cdef int32_t nargs = f.instrs[vid].nargs
-    cdef int32_t k
-    cdef list inc = <list>incoming[f.instrs[vid].block]
-    opmap = {}
-    for k in range(nargs):
-        opmap[<int32_t>inc[k]] = ("o", <int32_t>f.args[astart + k])
-    return opmap
-
+            if self.f.places[pid].flags & PLACE_WRITABLE:
+                return False
+            iv = self.f.places[pid].index_val
+            if iv >= 0 and not self._operand_inv(L, iv):
+                return False
+            return True
+        if op < OP_RUNTIME_COUNT and (self.f.instrs[v].flags & FLAG_PURE):
+            astart = self.f.instrs[v].arg_start
+            n = self.f.instrs[v].nargs
+            for k in range(n):
+                if not self._operand_inv(L, <int32_t>self.f.args[astart + k]):
+                    return False
+            return True
+        return False
 
-def _licm_try_loop(Func f, Dominators D, LoopForest F, int32_t L):
-    cdef int32_t header = F.header[L]
-    cdef int32_t entry = f.entry_block
-    cdef int32_t nb = f.n_blocks
-    cdef int32_t e, u, vid, b, a
-    cdef int32_t w, bit, base, istart, icount
-    cdef int64_t body_off
-    cdef uint64_t word
-    if header == entry:
-        return None
+    cdef void _push(self, int32_t L, int32_t* top, int32_t v) noexcept nogil:
+        # Add an in-loop invariant value to the hoist set (and the closure worklist).
+        if self.hoist[v] or not self.F.in_loop(L, self.f.instrs[v].block) or not self.inv[v]:
+            return
+        self.hoist[v] = 1
+        self.work[top[0]] = v
+        top[0] += 1
+
+    cdef bint analyze(self, int32_t L) noexcept nogil:
+        # Fill ``hoist`` with the values to hoist out of loop L; False if none.
+        cdef int32_t header = self.F.header[L]
+        cdef int32_t e, k, vid, b, w, bit, base, istart, icount, top, v, pid
+        cdef int64_t body_off = <int64_t>L * self.F.nwb
+        cdef uint64_t word
+        cdef bint guaranteed, any_root = False
+        if header == self.f.entry_block:
+            return False
 
-    # latches: tails of back edges into the header.
-    latches = []
-    for e in range(f.n_edges):
-        if f.edges[e].dst == header and D.dominates(header, f.edges[e].src):
-            latches.append(f.edges[e].src)
-    if not latches:
-        return None
+        # latches: tails of back edges into the header.
+        self.n_latches = 0
+        for e in range(self.f.n_edges):
+            if self.f.edges[e].dst == header and self.D.dominates(header, self.f.edges[e].src):
+                self.latches[self.n_latches] = self.f.edges[e].src
+                self.n_latches += 1
+        if self.n_latches == 0:
+            return False
 
-    # invariant set: single forward pass over loop-body values (operands of a
-    # non-phi value have strictly smaller ids, so one pass suffices; phis are
-    # never invariant and break any cycle). The bitset walk visits vids ascending
-    # via the arena layout contract (ir.pxd: block instr slices partition the
-    # stream in block-id order, ids == RPO); a producer violating that would only
-    # cause missed hoists (unvisited operand -> non-invariant), never an unsound one.
-    inv = {}
-    body_off = <int64_t>L * F.nwb
-    for w in range(F.nwb):
-        word = F.body[body_off + w]
-        if word == 0:
-            continue
-        base = w << 6
-        for bit in range(64):
-            if not ((word >> bit) & <uint64_t>1):
-                continue
-            b = base + bit
-            istart = f.blocks[b].instr_start
-            icount = f.blocks[b].instr_count
-            for vid in range(istart, istart + icount):
-                inv[vid] = _licm_is_invariant(f, F, L, vid, inv)
-
-    # hoist roots: invariant, hoistable kind, guaranteed-to-execute, cost >= 4.
-    memo_cost = {}
-    memo_rtc = {}
-    roots = []
-    for w in range(F.nwb):
-        word = F.body[body_off + w]
-        if word == 0:
-            continue
-        base = w << 6
-        for bit in range(64):
-            if not ((word >> bit) & <uint64_t>1):
-                continue
-            b = base + bit
-            istart = f.blocks[b].instr_start
-            icount = f.blocks[b].instr_count
-            for vid in range(istart, istart + icount):
-                if not <bint>inv.get(vid, False):
+        # invariant set: single forward pass over loop-body values (operands of a
+        # non-phi value have strictly smaller ids, so one pass suffices; phis are
+        # never invariant and break any cycle). The bitset walk visits vids ascending
+        # via the arena layout contract (ir.pxd: block instr slices partition the
+        # stream in block-id order, ids == RPO); a producer violating that would only
+        # cause missed hoists (unvisited operand -> non-invariant), never an unsound one.
+        # ``inv``/``hoist`` are reset over the body first: they only hold this loop.
+        for w in range(self.F.nwb):
+            word = self.F.body[body_off + w]
+            base = w << 6
+            for bit in range(64):
+                if (word >> bit) & <uint64_t>1:
+                    b = base + bit
+                    istart = self.f.blocks[b].instr_start
+                    for vid in range(istart, istart + self.f.blocks[b].instr_count):
+                        self.inv[vid] = 0
+                        self.hoist[vid] = 0
+        for w in range(self.F.nwb):
+            word = self.F.body[body_off + w]
+            base = w << 6
+            for bit in range(64):
+                if (word >> bit) & <uint64_t>1:
+                    b = base + bit
+                    istart = self.f.blocks[b].instr_start
+                    for vid in range(istart, istart + self.f.blocks[b].instr_count):
+                        self.inv[vid] = self._is_invariant(L, vid)
+
+        # hoist roots: invariant, hoistable kind, guaranteed-to-execute, cost >= 4;
+        # then the closure over in-loop (invariant) operands so the preheader is
+        # self-contained.
+        top = 0
+        for w in range(self.F.nwb):
+            word = self.F.body[body_off + w]
+            base = w << 6
+            for bit in range(64):
+                if not ((word >> bit) & <uint64_t>1):
                     continue
-                if not _licm_hoist_kind(f, vid):
-                    continue
-                guaranteed = True
-                for u in latches:
-                    if not D.dominates(b, u):
-                        guaranteed = False
-                        break
-                if not guaranteed:
-                    continue
-                if _licm_eff_cost(f, vid, memo_cost, memo_rtc) < 4:
-                    continue
-                roots.append(vid)
-    if not roots:
-        return None
-
-    # closure over in-loop (invariant) operands so the preheader is self-contained.
-    H = set()
-    work = list(roots)
-    while work:
-        v = <int32_t>work.pop()
-        if v in H:
-            continue
-        if not F.in_loop(L, f.instrs[v].block):
-            continue
-        if not <bint>inv.get(v, False):
-            continue
-        H.add(v)
-        for a in _licm_operands(f, v):
-            work.append(a)
-    if not H:
-        return None
-
-    return _licm_apply(f, D, F, L, header, H)
-
-
-def _licm_apply(Func f, Dominators D, LoopForest F, int32_t L, int32_t header, set H):
-    cdef int32_t nb = f.n_blocks
-    cdef int32_t b, vid, istart, icount, es, ec, e, pred
-    cdef list incoming = _incoming_by_block(f)
-
-    # base model: one plan-block per src block (index == src block id).
-    pblocks = []
-    for b in range(nb):
-        items = []
-        istart = f.blocks[b].instr_start
-        icount = f.blocks[b].instr_count
-        for vid in range(istart, istart + icount):
-            if vid in H:
-                continue  # hoisted values are relocated to the preheader
-            if f.instrs[vid].op == OPX_PHI:
-                items.append(("i", vid, _phi_opmap_src(f, vid, incoming)))
+                b = base + bit
+                istart = self.f.blocks[b].instr_start
+                icount = self.f.blocks[b].instr_count
+                for vid in range(istart, istart + icount):
+                    if not self.inv[vid] or not _licm_hoist_kind(self.f, vid):
+                        continue
+                    guaranteed = True
+                    for k in range(self.n_latches):
+                        if not self.D.dominates(b, self.latches[k]):
+                            guaranteed = False
+                            break
+                    if not guaranteed or self._eff_cost(vid) < 4:
+                        continue
+                    any_root = True
+                    self._push(L, &top, vid)
+        if not any_root:
+            return False
+        while top > 0:
+            top -= 1
+            v = self.work[top]
+            if self.f.instrs[v].op == OPX_GET:
+                pid = self.f.instrs[v].aux
+                if self.f.places[pid].kind == PLACE_DYNAMIC_BLOCK:
+                    self._push(L, &top, self.f.places[pid].block_ref)
+                if self.f.places[pid].index_val >= 0:
+                    self._push(L, &top, self.f.places[pid].index_val)
             else:
-                items.append(("i", vid, None))
-        test = ("o", f.blocks[b].test_val) if f.blocks[b].test_val >= 0 else None
-        edges = []
-        es = f.blocks[b].edge_start
-        ec = f.blocks[b].edge_count
-        for e in range(es, es + ec):
-            edges.append([f.edges[e].dst, f.edges[e].cond_kind, f.edges[e].cond, f.edges[e].cond_is_int, e])
-        pblocks.append({"items": items, "test": test, "edges": edges})
+                istart = self.f.instrs[v].arg_start
+                for k in range(self.f.instrs[v].nargs):
+                    self._push(L, &top, <int32_t>self.f.args[istart + k])
+        return True
 
-    entry_pb = f.entry_block
+    cdef int _fill_plan(self, _Plan plan, int32_t L, int32_t reuse_pre, int32_t n_entry) except -1 nogil:
+        # Every source block keeps its non-hoisted values and its edges. The hoisted
+        # values (ascending id == def-before-use) go to the end of ``reuse_pre``, or
+        # to a new preheader (plan block ``n_blocks``, edge key ``n_edges``) that
+        # the entry edges are retargeted to. With a new preheader, each header phi
+        # takes its entry operand through the preheader edge -- directly for a
+        # single entry edge, else through a new preheader phi over the entry edges.
+        cdef int32_t nb = self.f.n_blocks
+        cdef int32_t header = self.F.header[L]
+        cdef int32_t pre_pb = nb
+        cdef int32_t p_key = self.f.n_edges
+        cdef int32_t ps = self.f.blocks[header].phi_start
+        cdef int32_t pc = self.f.blocks[header].phi_count
+        cdef int32_t b, vid, e, es, pos, p, t, istart
+
+        if reuse_pre < 0:
+            # Operand maps: one per new preheader phi (token t <-> the t-th header
+            # phi), then one per header phi.
+            if n_entry > 1:
+                for t in range(pc):
+                    p = ps + t
+                    plan.tok_aux[t] = self.f.instrs[p].aux
+                    plan.tok_map[t] = plan.new_map()
+                    pos = 0
+                    for e in range(self.f.n_edges):
+                        if self.f.edges[e].dst != header:
+                            continue
+                        if self.entry_edge[e]:
+                            plan.map_add(e, <int32_t>self.f.args[self.f.instrs[p].arg_start + pos])
+                        pos += 1
+            for t in range(pc):
+                p = ps + t
+                plan.phi_map[p] = plan.new_map()
+                pos = 0
+                for e in range(self.f.n_edges):
+                    if self.f.edges[e].dst != header:
+                        continue
+                    if self.entry_edge[e]:
+                        if n_entry == 1:
+                            plan.map_add(p_key, <int32_t>self.f.args[self.f.instrs[p].arg_start + pos])
+                    pos += 1
+                if n_entry > 1:
+                    plan.map_add(p_key, -(t + 1))
+                pos = 0
+                for e in range(self.f.n_edges):
+                    if self.f.edges[e].dst != header:
+                        continue
+                    if not self.entry_edge[e]:
+                        plan.map_add(e, <int32_t>self.f.args[self.f.instrs[p].arg_start + pos])
+                    pos += 1
 
-    # header incoming edges: entry (from outside the loop) vs back (from inside).
-    entry_edges = []
-    back_edges = []
-    for e in range(f.n_edges):
-        if f.edges[e].dst != header:
-            continue
-        if F.in_loop(L, f.edges[e].src):
-            back_edges.append(e)
-        else:
-            entry_edges.append(e)
-    if not entry_edges:
-        return None
+        for b in range(nb):
+            plan.begin_block(b)
+            istart = self.f.blocks[b].instr_start
+            for vid in range(istart, istart + self.f.blocks[b].instr_count):
+                if not self.hoist[vid]:
+                    plan.add_item(vid)
+            if b == reuse_pre:
+                self._add_hoisted(plan, L)
+            es = self.f.blocks[b].edge_start
+            for e in range(es, es + self.f.blocks[b].edge_count):
+                plan.add_edge(pre_pb if (reuse_pre < 0 and self.entry_edge[e]) else self.f.edges[e].dst,
+                              self.f.edges[e].cond_kind, self.f.edges[e].cond, self.f.edges[e].cond_is_int, e)
+            if self.f.blocks[b].test_val >= 0:
+                plan.test[b] = self.f.blocks[b].test_val
+        if reuse_pre < 0:
+            plan.begin_block(pre_pb)
+            if n_entry > 1:
+                for t in range(pc):
+                    plan.add_item(-(t + 1))
+            self._add_hoisted(plan, L)
+            plan.add_edge(header, EDGE_COND_NONE, 0.0, 0, p_key)
+        plan.end_blocks()
+        plan.compute_rpo(self.f.entry_block)
+        return 0
+
+    cdef int _add_hoisted(self, _Plan plan, int32_t L) except -1 nogil:
+        cdef int32_t w, bit, b, vid, istart
+        cdef int64_t body_off = <int64_t>L * self.F.nwb
+        cdef uint64_t word
+        for w in range(self.F.nwb):
+            word = self.F.body[body_off + w]
+            for bit in range(64):
+                if (word >> bit) & <uint64_t>1:
+                    b = (w << 6) + bit
+                    istart = self.f.blocks[b].instr_start
+                    for vid in range(istart, istart + self.f.blocks[b].instr_count):
+                        if self.hoist[vid]:
+                            plan.add_item(vid)
+        return 0
+
+    cdef object try_loop(self, int32_t L):
+        # The rebuilt Func with loop L's invariants hoisted, or None.
+        cdef Func f = self.f
+        cdef int32_t header = self.F.header[L]
+        cdef int32_t e, pred, n_entry = 0, last_entry = -1, reuse_pre = -1, n_pb, pc, ninc = 0
+        cdef bint found
+        cdef _Plan plan
+        with nogil:
+            found = self.analyze(L)
+        if not found:
+            return None
 
-    # hoisted values in dependency order (ascending id == def-before-use).
-    hoist_items = [("i", v, None) for v in sorted(H)]
-
-    # reuse an existing clean preheader (single entry edge whose src has exactly
-    # one outgoing edge and no phis), else create one.
-    reuse_pre = -1
-    if len(entry_edges) == 1:
-        pred = f.edges[entry_edges[0]].src
-        if f.blocks[pred].edge_count == 1 and f.blocks[pred].phi_count == 0:
-            reuse_pre = pred
-
-    if reuse_pre >= 0:
-        (<dict>pblocks[reuse_pre])["items"].extend(hoist_items)
-        return _emit_from_model(f, pblocks, entry_pb)
-
-    # create a new preheader.
-    pre_pb = len(pblocks)
-    p_key = ("licm_pre", header)
-    pre_phis = []
-    tok_ctr = 0
-    header_pb = <dict>pblocks[header]
-    new_header_items = []
-    for it in <list>header_pb["items"]:
-        if <str>it[0] == "i" and f.instrs[<int32_t>it[1]].op == OPX_PHI:
-            old_opmap = <dict>it[2]
-            if len(entry_edges) == 1:
-                pre_operand = old_opmap[entry_edges[0]]
-            else:
-                tok = ("licm_np", header, tok_ctr)
-                tok_ctr += 1
-                np_opmap = {}
-                for e in entry_edges:
-                    np_opmap[e] = old_opmap[e]
-                pre_phis.append(("np", tok, f.instrs[<int32_t>it[1]].aux, np_opmap))
-                pre_operand = ("n", tok)
-            new_opmap = {p_key: pre_operand}
-            for e in back_edges:
-                new_opmap[e] = old_opmap[e]
-            new_header_items.append(("i", <int32_t>it[1], new_opmap))
-        else:
-            new_header_items.append(it)
-    header_pb["items"] = new_header_items
-
-    # retarget entry edges to the preheader (keep their edge keys).
-    for e in entry_edges:
-        src_b = f.edges[e].src
-        for espec in <list>(<dict>pblocks[src_b])["edges"]:
-            if espec[4] == e:
-                espec[0] = pre_pb
-                break
+        # header incoming edges: entry (from outside the loop) vs back (from inside).
+        for e in range(f.n_edges):
+            self.entry_edge[e] = 0
+            if f.edges[e].dst != header:
+                continue
+            ninc += 1
+            if not self.F.in_loop(L, f.edges[e].src):
+                self.entry_edge[e] = 1
+                n_entry += 1
+                last_entry = e
+        if n_entry == 0:
+            return None
 
-    pre_items = list(pre_phis) + hoist_items
-    pre_edges = [[header, EDGE_COND_NONE, 0.0, 0, p_key]]
-    pblocks.append({"items": pre_items, "test": None, "edges": pre_edges})
-    return _emit_from_model(f, pblocks, entry_pb)
+        # reuse an existing clean preheader (single entry edge whose src has exactly
+        # one outgoing edge and no phis), else create one.
+        if n_entry == 1:
+            pred = f.edges[last_entry].src
+            if f.blocks[pred].edge_count == 1 and f.blocks[pred].phi_count == 0:
+                reuse_pre = pred
+        pc = f.blocks[header].phi_count if reuse_pre < 0 else 0
+        n_pb = f.n_blocks + (1 if reuse_pre < 0 else 0)
+        plan = _Plan(f, n_pb, f.n_instrs + pc, f.n_edges + 1, pc if n_entry > 1 else 0, 2 * pc, 2 * pc * (ninc + 1))
+        with nogil:
+            self._fill_plan(plan, L, reuse_pre, n_entry)
+        return _rebuild(f, plan)
 
 
 def _licm_pass_once(Func f):
@@ -4064,13 +4506,15 @@ def _licm_pass_once(Func f):
     cdef LoopForest F = compute_loops(f, D)
     cdef int32_t nl = F.n_loops
     cdef int32_t L
+    cdef _LICM state
     if nl == 0:
         return None
     # inner-first: process loops by header block id descending (an inner header's
     # RPO id is always greater than its enclosing header's).
     order = sorted(range(nl), key=lambda li: F.header[li], reverse=True)
+    state = _LICM(f, D, F)
     for L in order:
-        nf = _licm_try_loop(f, D, F, <int32_t>L)
+        nf = state.try_loop(<int32_t>L)
         if nf is not None:
             return nf
     return None
@@ -4097,8 +4541,8 @@ def _run_licm(Func f):
 # edge carrying cond=C and the false edge becoming the NONE default; (2) chain
 # splicing: while the default target is an empty single-pred block with the same
 # test, splice its cases up (dropping duplicate conds) and let it die. Runs on SSA
-# via the general model builder _emit_from_model, rebuilding tests + edges and
-# relocating escaping consts to entry.
+# through ``_rebuild``, replanning tests + edges and relocating escaping consts
+# to entry.
 
 
 cdef bint _rsw_block_empty(Func f, int32_t b) noexcept nogil:
@@ -4339,34 +4783,14 @@ def _run_rewrite_switch(Func f):
     if not changed:
         return (f, False)
 
-    # apply: build a value model reflecting the mutated tests + edges, relocating
-    # any externally-referenced const from a now-unreachable block into entry (its
-    # own block dies but its value is still a live phi operand / operand elsewhere),
-    # then rebuild via the general model builder.
+    # apply: plan the mutated tests + edges, relocating any externally-referenced
+    # const from a now-unreachable block into entry (its own block dies but its
+    # value is still a live phi operand / operand elsewhere), then rebuild.
     reach = set(_rsw_rpo(out, entry, nb))
-    pblocks = []
-    cdef int32_t vid, istart, icount
-    cdef list incoming = _incoming_by_block(f)
-    for b in range(nb):
-        items = []
-        istart = f.blocks[b].instr_start
-        icount = f.blocks[b].instr_count
-        for vid in range(istart, istart + icount):
-            if f.instrs[vid].op == OPX_PHI:
-                items.append(("i", vid, _phi_opmap_src(f, vid, incoming)))
-            else:
-                items.append(("i", vid, None))
-        tv2 = <int32_t>test_val[b]
-        test = ("o", tv2) if tv2 >= 0 else None
-        edges = []
-        for ed in <list>out[b]:
-            edges.append([
-                <int32_t>(<dict>ed)["dst"], <int32_t>(<dict>ed)["ck"],
-                <double>(<dict>ed)["cond"], <int32_t>(<dict>ed)["ci"], <int32_t>(<dict>ed)["key"],
-            ])
-        pblocks.append({"items": items, "test": test, "edges": edges})
     relocate = []
+    cdef int32_t vid, istart, icount, n_out = 0
     for b in range(nb):
+        n_out += len(<list>out[b])
         if b in reach:
             continue
         istart = f.blocks[b].instr_start
@@ -4374,10 +4798,25 @@ def _run_rewrite_switch(Func f):
         for vid in range(istart, istart + icount):
             if f.instrs[vid].op == OPX_CONST and vid in ext:
                 relocate.append(vid)
-    if relocate:
-        (<dict>pblocks[entry])["items"].extend([("i", v, None) for v in relocate])
-    newf = _emit_from_model(f, pblocks, entry)
-    return (newf, True)
+    cdef _Plan plan = _Plan(f, nb, f.n_instrs + len(relocate), n_out)
+    for b in range(nb):
+        plan.begin_block(b)
+        istart = f.blocks[b].instr_start
+        for vid in range(istart, istart + f.blocks[b].instr_count):
+            plan.add_item(vid)
+        if b == entry:
+            for vid in relocate:
+                plan.add_item(vid)
+        for ed in <list>out[b]:
+            plan.add_edge(
+                <int32_t>(<dict>ed)["dst"], <uint8_t>(<dict>ed)["ck"],
+                <double>(<dict>ed)["cond"], <uint8_t>(<dict>ed)["ci"], <int32_t>(<dict>ed)["key"],
+            )
+        if <int32_t>test_val[b] >= 0:
+            plan.test[b] = <int32_t>test_val[b]
+    plan.end_blocks()
+    plan.compute_rpo(entry)
+    return (_rebuild(f, plan), True)
 
 
 def _run_sccp(Func f):
@@ -0,0 +1,284 @@
+# cython: language_level=3
+"""Per-mode output node table.
+
+``compile_mode`` registers every callback's emitted ``EngineNode`` tree in one
+``NodeTable`` and converts the table into the final node list
+(``[{"func": ..., "args": [...]}, {"value": ...}, ...]``) once, at the end. It
+produces exactly the list of the pure-Python ``sonolus.build.node.
+OutputNodeGenerator`` it replaces in the build:
+
+* nodes are numbered in the same first-visit post-order (children left to right,
+  then the parent);
+* nodes are deduplicated by the same structural equality: a function node by its
+  op and child indexes, a leaf by Python value equality, so ``5`` and ``5.0`` share
+  the index of whichever was registered first, as in the reference dict.
+
+Function nodes live in parallel C arrays (op id, child start, child count) over a
+flat child-index array, and are looked up through a khash keyed on a 64-bit hash
+of (op id, child indexes), with collisions chained through ``_next`` and resolved
+by comparing the arrays. Registering a node therefore costs O(children), where
+the reference implementation re-hashes the node's whole subtree (``FunctionNode``
+is a tuple, whose hash is recursive and not cached) at every level.
+
+Emitted trees are hash-consed (see emit.pyx), so ``add`` walks a tree with an
+identity memo: a shared subtree is visited once per ``add`` call.
+"""
+
+from libc.stdint cimport int32_t, uint64_t
+from libc.stdlib cimport free, realloc
+
+from cpython.object cimport PyObject
+
+from sonolus.backend._opt._khash cimport (
+    khint_t,
+    kh_clear_i64i32,
+    kh_destroy_i64i32,
+    kh_get_i64i32,
+    kh_i64i32_t,
+    kh_init_i64i32,
+    kh_put_i64i32,
+)
+
+from sonolus.backend.node import FunctionNode
+from sonolus.backend.ops import Op as _Op
+
+cdef inline uint64_t _addr(object obj) noexcept:
+    # Object address as a khash key. The low bits are always zero (allocation
+    # alignment) and khash's 64-bit hash keeps them, so drop them to avoid
+    # clustering every key into a fraction of the buckets.
+    return (<uint64_t><Py_ssize_t><PyObject*>obj) >> 4
+
+
+# Op id -> emitted name (``Op.value``, precomputed as in build/node.py).
+_OP_NAMES = [op.value for op in _Op]
+
+# Op member address -> op id. ``Op`` members are singletons, and hashing an enum
+# member goes through ``Enum.__hash__`` in Python, which would dominate ``add``.
+cdef kh_i64i32_t* _op_ids = kh_init_i64i32()
+
+
+cdef int _init_op_ids() except -1:
+    cdef int ret
+    cdef khint_t it
+    if _op_ids == NULL:
+        raise MemoryError()
+    for i, op in enumerate(_Op):
+        it = kh_put_i64i32(_op_ids, _addr(op), &ret)
+        if ret < 0:
+            raise MemoryError()
+        _op_ids.vals[it] = i
+    return 0
+
+
+_init_op_ids()
+
+
+cdef int32_t _op_id(object op) except -1:
+    cdef khint_t it = kh_get_i64i32(_op_ids, _addr(op))
+    if it == _op_ids.n_buckets:
+        raise TypeError(f"Expected an Op, got {op!r}")
+    return _op_ids.vals[it]
+
+
+cdef inline uint64_t _mix(uint64_t h, uint64_t v) noexcept nogil:
+    # splitmix64 finalizer over the running hash xor the next word.
+    h ^= v + <uint64_t>0x9E3779B97F4A7C15 + (h << 6) + (h >> 2)
+    h = (h ^ (h >> 30)) * <uint64_t>0xBF58476D1CE4E5B9
+    h = (h ^ (h >> 27)) * <uint64_t>0x94D049BB133111EB
+    return h ^ (h >> 31)
+
+
+cdef int32_t* _realloc_i32(int32_t* p, Py_ssize_t n) except NULL:
+    if n > 2147483647:
+        raise MemoryError()
+    cdef int32_t* q = <int32_t*>realloc(p, n * sizeof(int32_t))
+    if q == NULL:
+        raise MemoryError()
+    return q
+
+
+cdef class NodeTable:
+    """Deduplicated output nodes of one mode, in output order."""
+
+    # Per output index: op id (-1 for a leaf), start into ``_args`` (a leaf's
+    # index into ``_values`` instead), child count, and the next index with the
+    # same hash (-1 ends the chain).
+    cdef int32_t* _ops
+    cdef int32_t* _starts
+    cdef int32_t* _counts
+    cdef int32_t* _next
+    cdef Py_ssize_t _n
+    cdef Py_ssize_t _cap
+    cdef int32_t* _args
+    cdef Py_ssize_t _n_args
+    cdef Py_ssize_t _cap_args
+    # Child indexes of the node being registered.
+    cdef int32_t* _scratch
+    cdef Py_ssize_t _cap_scratch
+    cdef kh_i64i32_t* _fn_index
+    # Per ``add`` call: object address -> index. The tree being added keeps
+    # every object alive, so addresses are unique for the duration of the call.
+    cdef kh_i64i32_t* _memo
+    cdef dict _leaf_index
+    cdef list _values
+
+    def __cinit__(self):
+        self._ops = NULL
+        self._starts = NULL
+        self._counts = NULL
+        self._next = NULL
+        self._n = 0
+        self._cap = 0
+        self._args = NULL
+        self._n_args = 0
+        self._cap_args = 0
+        self._scratch = NULL
+        self._cap_scratch = 0
+        self._fn_index = kh_init_i64i32()
+        self._memo = kh_init_i64i32()
+        if self._fn_index == NULL or self._memo == NULL:
+            raise MemoryError()
+        self._leaf_index = {}
+        self._values = []
+
+    def __dealloc__(self):
+        free(self._ops)
+        free(self._starts)
+        free(self._counts)
+        free(self._next)
+        free(self._args)
+        free(self._scratch)
+        kh_destroy_i64i32(self._fn_index)  # NULL-safe
+        kh_destroy_i64i32(self._memo)
+
+    def __len__(self):
+        return self._n
+
+    cdef int _reserve(self, Py_ssize_t n_args) except -1:
+        cdef Py_ssize_t cap
+        if self._n + 1 > self._cap:
+            cap = self._cap * 2 if self._cap else 256
+            self._ops = _realloc_i32(self._ops, cap)
+            self._starts = _realloc_i32(self._starts, cap)
+            self._counts = _realloc_i32(self._counts, cap)
+            self._next = _realloc_i32(self._next, cap)
+            self._cap = cap
+        if self._n_args + n_args > self._cap_args:
+            cap = self._cap_args * 2 if self._cap_args else 1024
+            while cap < self._n_args + n_args:
+                cap *= 2
+            self._args = _realloc_i32(self._args, cap)
+            self._cap_args = cap
+        return 0
+
+    cdef int32_t _intern_leaf(self, object value) except -1:
+        index = self._leaf_index.get(value)
+        if index is not None:
+            return <int32_t>index
+        self._reserve(0)
+        cdef int32_t i = <int32_t>self._n
+        self._ops[i] = -1
+        self._starts[i] = <int32_t>len(self._values)
+        self._counts[i] = 0
+        self._next[i] = -1
+        self._values.append(value)
+        self._leaf_index[value] = i
+        self._n += 1
+        return i
+
+    cdef int32_t _intern_fn(self, int32_t op, int32_t* children, int32_t count) except -1:
+        cdef uint64_t h = _mix(<uint64_t>op, <uint64_t>count)
+        cdef int32_t k, j, start
+        for k in range(count):
+            h = _mix(h, <uint64_t>children[k])
+        cdef khint_t it = kh_get_i64i32(self._fn_index, h)
+        cdef int32_t head = -1
+        if it != self._fn_index.n_buckets:
+            head = self._fn_index.vals[it]
+            j = head
+            while j >= 0:
+                if self._ops[j] == op and self._counts[j] == count:
+                    start = self._starts[j]
+                    for k in range(count):
+                        if self._args[start + k] != children[k]:
+                            break
+                    else:
+                        return j
+                j = self._next[j]
+        self._reserve(count)
+        cdef int32_t i = <int32_t>self._n
+        self._ops[i] = op
+        self._starts[i] = <int32_t>self._n_args
+        self._counts[i] = count
+        self._next[i] = head
+        for k in range(count):
+            self._args[self._n_args + k] = children[k]
+        self._n_args += count
+        self._n += 1
+        cdef int ret
+        it = kh_put_i64i32(self._fn_index, h, &ret)
+        if ret < 0:
+            raise MemoryError()
+        self._fn_index.vals[it] = i
+        return i
+
+    def add(self, node):
+        """Register an ``EngineNode`` tree and return the index of its root."""
+        cdef kh_i64i32_t* memo = self._memo
+        cdef list stack = [node]
+        cdef tuple args
+        cdef object current
+        cdef uint64_t key
+        cdef khint_t it
+        cdef Py_ssize_t count, k
+        cdef int32_t index
+        cdef int ret
+        cdef bint ready
+        kh_clear_i64i32(memo)
+        while stack:
+            current = stack[len(stack) - 1]
+            key = _addr(current)
+            if kh_get_i64i32(memo, key) != memo.n_buckets:
+                stack.pop()
+                continue
+            if type(current) is FunctionNode:
+                args = (<tuple>current)[1]
+                count = len(args)
+                ready = True
+                # Push unvisited children last-first so they are numbered left to right.
+                for k in range(count - 1, -1, -1):
+                    if kh_get_i64i32(memo, _addr(args[k])) == memo.n_buckets:
+                        stack.append(args[k])
+                        ready = False
+                if not ready:
+                    continue
+                if count > self._cap_scratch:
+                    self._scratch = _realloc_i32(self._scratch, count)
+                    self._cap_scratch = count
+                for k in range(count):
+                    it = kh_get_i64i32(memo, _addr(args[k]))
+                    self._scratch[k] = memo.vals[it]
+                index = self._intern_fn(_op_id((<tuple>current)[0]), self._scratch, <int32_t>count)
+            else:
+                index = self._intern_leaf(current)
+            it = kh_put_i64i32(memo, key, &ret)
+            if ret < 0:
+                raise MemoryError()
+            memo.vals[it] = index
+            stack.pop()
+        return index
+
+    def get(self):
+        """Return the node list in output form."""
+        cdef list nodes = []
+        cdef Py_ssize_t i
+        cdef int32_t start, k
+        cdef list args
+        for i in range(self._n):
+            start = self._starts[i]
+            if self._ops[i] < 0:
+                nodes.append({"value": self._values[start]})
+            else:
+                args = [self._args[start + k] for k in range(self._counts[i])]
+                nodes.append({"func": _OP_NAMES[self._ops[i]], "args": args})
+        return nodes
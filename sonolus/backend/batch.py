@@ -0,0 +1,654 @@
+"""Batched evaluation of one node tree over many lanes at once, with NumPy.
+
+`BatchInterpreter` evaluates a node tree for N lanes together, e.g. the
+`updateParallel` callback of N entities of an archetype. The blocks that differ
+between lanes (each entity's own memory, and scratch memory) are kept per lane,
+one NumPy column per accessed cell; every other block is shared by the lanes and
+only read. Pure ops become elementwise NumPy operations over the lanes, and control
+flow splits the lanes by the way they go (`If`, `Switch*`, `And`/`Or`, loops,
+`JumpLoop`, `Block`/`Break`), running each part on its own subset of lanes.
+
+This is only sound when lanes cannot observe each other, which `batchable` checks
+statically: the tree writes only lane blocks, at constant block ids, and uses no op
+whose effect depends on the order lanes run in (`Random*`, `DebugLog`, `Copy`,
+writes through pointers, and runtime functions other than the given ones).
+
+Results match running the tree on each lane with `Interpreter`, bit for bit:
+arithmetic uses the same IEEE operations, and ops without an exactly matching NumPy
+operation (transcendental functions, easing, `Mod`, `Power`, ...) apply the
+interpreter's own scalar implementation to each lane. The one exception is that
+lane values are always floats, while the interpreter keeps integer constants as
+Python ints: where lanes take different paths, a zero from an integer constant can
+come out as `-0.0` from, say, `Negate` (as it would on the JavaScript runtime) where
+the interpreter returns `0`. An error in any lane (an
+out-of-range index, a division by zero, ...) is raised without touching the memory
+of the lanes, so callers can rerun the lanes one at a time to get the error the
+interpreter would raise; the lane memory is only updated by `write_back`.
+
+Requires NumPy, which is not a dependency of Sonolus.py.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Collection, Iterable, Mapping, MutableSequence, Sequence
+
+import numpy as np
+
+from sonolus.backend.interpret import (
+    _ADDRESS_ARITY,
+    _BINARY_FUNCS,
+    _COMPARISONS,
+    _FIXED_FUNCS,
+    _REDUCE_FUNCS,
+    _RMW_OPS,
+    _STEP_OPS,
+    _UNARY_FUNCS,
+    RUNTIME_FUNCTIONS,
+    Memory,
+    _ensure_int,
+    _judge_op,
+    _judge_simple,
+)
+from sonolus.backend.node import EngineNode, FunctionNode
+from sonolus.backend.ops import Op
+
+# A value for every lane alike, or one value per lane of the lanes it was computed for.
+type Value = float | np.ndarray
+
+_NO_LANES = np.zeros(0, dtype=np.intp)
+
+
+def batchable(node: EngineNode, writable: Collection[int], runtime_ops: Collection[Op] = ()) -> bool:
+    """Return whether `BatchInterpreter` can evaluate `node`.
+
+    Args:
+        node: The node tree.
+        writable: The blocks the lanes have their own copy of and may write.
+        runtime_ops: The `RUNTIME_FUNCTIONS` the interpreter's `call_runtime` provides.
+    """
+    seen = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, FunctionNode) or id(node) in seen:
+            continue
+        seen.add(id(node))
+        if not _supported(node, writable, runtime_ops):
+            return False
+        stack.extend(node.args)
+    return True
+
+
+def _supported(node: FunctionNode, writable: Collection[int], runtime_ops: Collection[Op]) -> bool:
+    func = node.func
+    args = node.args
+    n = len(args)
+    if func in _STEP_OPS:
+        addressing = _STEP_OPS[func][0]
+        return addressing != "Pointed" and n == _ADDRESS_ARITY[addressing] and _constant_in(args[0], writable)
+    if func in _RMW_OPS:
+        addressing = _RMW_OPS[func][0]
+        return addressing != "Pointed" and n == _ADDRESS_ARITY[addressing] + 1 and _constant_in(args[0], writable)
+    if func in _UNARY_FUNCS:
+        return n == 1
+    if func in _BINARY_FUNCS or func in _COMPARISONS:
+        return n == 2
+    if func in _REDUCE_FUNCS:
+        return True
+    if func in _FIXED_FUNCS:
+        return func != Op.Random and n == _FIXED_FUNCS[func][0]
+    match func:
+        case Op.Execute | Op.Execute0 | Op.And | Op.Or | Op.JumpLoop | Op.DebugPause:
+            return True
+        case Op.If | Op.GetPointed:
+            return n == 3
+        case Op.Switch | Op.SwitchWithDefault:
+            # Emitted switches always have constant keys, so the lanes split by key without evaluating them.
+            keys = args[1:-1:2] if func == Op.Switch else args[1:-2:2]
+            valid = n % 2 == 1 if func == Op.Switch else n >= 2 and n % 2 == 0
+            return valid and not any(isinstance(key, FunctionNode) for key in keys)
+        case Op.SwitchInteger:
+            return n >= 1
+        case Op.SwitchIntegerWithDefault:
+            return n >= 2
+        case Op.While | Op.DoWhile | Op.Break | Op.Get:
+            return n == 2
+        case Op.Not | Op.Block:
+            return n == 1
+        case Op.GetShifted:
+            return n == 4
+        case Op.Set:
+            return n == 3 and _constant_in(args[0], writable)
+        case Op.SetShifted:
+            return n == 5 and _constant_in(args[0], writable)
+        case _ if func in RUNTIME_FUNCTIONS:
+            return func in runtime_ops
+    return False
+
+
+def _constant_in(arg: EngineNode, blocks: Collection[int]) -> bool:
+    return not isinstance(arg, FunctionNode) and arg in blocks
+
+
+class _LaneBlock:
+    """One block of per-lane memory, as a column of lane values per accessed index."""
+
+    __slots__ = ("columns", "count", "dirty", "initial", "size", "sources")
+
+    def __init__(self, count: int, size: int, sources: Sequence[MutableSequence[float]] | None, initial=None):
+        self.count = count
+        self.size = size
+        # The memory of each lane, read on first access and updated by `write_back`;
+        # without sources, every lane starts from the values of `initial`.
+        self.sources = sources
+        self.initial = initial
+        self.columns: dict[int, np.ndarray] = {}
+        self.dirty: set[int] = set()
+
+    def column(self, index: int) -> np.ndarray:
+        column = self.columns.get(index)
+        if column is None:
+            if self.sources is None:
+                column = np.full(self.count, self.initial[index])
+            else:
+                column = np.fromiter((values[index] for values in self.sources), dtype=float, count=self.count)
+            self.columns[index] = column
+        return column
+
+    def write_back(self) -> None:
+        if self.sources is None:
+            return
+        for index in sorted(self.dirty):
+            for values, value in zip(self.sources, self.columns[index].tolist(), strict=True):
+                values[index] = value
+        self.dirty.clear()
+
+
+class BatchInterpreter:
+    """Evaluates node trees for a number of lanes at once; see the module docstring.
+
+    Args:
+        blocks: The memory the lanes share. It is only read.
+        lane_blocks: Block id -> the memory of that block for each lane, in lane order.
+        scratch_blocks: Blocks each lane gets its own copy of, starting from their
+            contents in `blocks`. Their lane copies are discarded afterwards.
+    """
+
+    blocks: Memory
+    count: int
+    # Function nodes evaluated so far, summed over the lanes that evaluated them.
+    executed: int
+
+    def __init__(
+        self,
+        blocks: Memory,
+        lane_blocks: Mapping[int, Sequence[MutableSequence[float]]],
+        scratch_blocks: Iterable[int] = (),
+    ):
+        counts = {len(sources) for sources in lane_blocks.values()}
+        if len(counts) != 1:
+            raise ValueError("Every lane block needs the memory of the same, nonzero number of lanes")
+        self.blocks = blocks
+        self.count = counts.pop()
+        self.lanes: dict[int, _LaneBlock] = {
+            int(block): _LaneBlock(self.count, len(sources[0]), sources) for block, sources in lane_blocks.items()
+        }
+        for block in scratch_blocks:
+            initial = blocks[block]
+            self.lanes[int(block)] = _LaneBlock(self.count, len(initial), None, initial)
+        self.executed = 0
+        # Lanes unwinding from a `Break`, with the number of blocks left to exit and the value.
+        self.unwinding = np.zeros(self.count, dtype=bool)
+        self.depth = np.zeros(self.count, dtype=np.int64)
+        self.break_value = np.zeros(self.count)
+        self.unwinding_count = 0
+
+    def run(self, node: EngineNode) -> np.ndarray:
+        """Evaluate `node` for every lane; return the value of each lane."""
+        with np.errstate(all="ignore"):
+            value = self._eval(node, np.arange(self.count))
+        if self.unwinding_count:
+            raise RuntimeError("Break out of the evaluated node")
+        return np.broadcast_to(np.asarray(value, dtype=float), (self.count,)).copy()
+
+    def write_back(self) -> None:
+        """Store the values the lanes wrote to their lane blocks in the lanes' memory."""
+        for block in self.lanes.values():
+            block.write_back()
+
+    def call_runtime(self, func: Op, args: list[Value], count: int) -> Value:
+        """Evaluate a runtime function for `count` lanes on their evaluated arguments; subclasses provide them."""
+        raise NotImplementedError(f"Unsupported operation: {func}")
+
+    # -- evaluation ---------------------------------------------------------
+
+    def _eval(self, node: EngineNode, lanes: np.ndarray) -> Value:
+        """Evaluate `node` for `lanes`; the values of lanes that start unwinding are unspecified."""
+        if not isinstance(node, FunctionNode):
+            return node
+        self.executed += len(lanes)
+        func = node.func
+        args = node.args
+        match func:
+            case Op.Execute | Op.Execute0:
+                result = 0.0
+                live = lanes
+                for arg in args:
+                    result = self._eval(arg, live)
+                    live, keep = self._unbroken(live)
+                    result = _take(result, keep)
+                    if not len(live):
+                        break
+                return 0.0 if func == Op.Execute0 else self._widen(result, lanes, live)
+            case Op.If:
+                live, (test,) = self._operands(args[:1], lanes)
+                if not isinstance(test, np.ndarray):
+                    result = self._eval(args[1] if test != 0.0 else args[2], live)
+                else:
+                    taken = test != 0.0
+                    result = self._split(live, [(taken, args[1]), (~taken, args[2])])
+                return self._widen(result, lanes, live)
+            case Op.Switch | Op.SwitchWithDefault:
+                live, (test,) = self._operands(args[:1], lanes)
+                pairs = args[1:] if func == Op.Switch else args[1:-1]
+                remaining = np.ones(len(live), dtype=bool)
+                parts = []
+                for key, branch in zip(pairs[::2], pairs[1::2], strict=True):
+                    matches = remaining & (test == key)
+                    parts.append((matches, branch))
+                    remaining &= ~matches
+                parts.append((remaining, 0.0 if func == Op.Switch else args[-1]))
+                return self._widen(self._split(live, parts), lanes, live)
+            case Op.SwitchInteger | Op.SwitchIntegerWithDefault:
+                live, (test,) = self._operands(args[:1], lanes)
+                branches = args[1:] if func == Op.SwitchInteger else args[1:-1]
+                test = np.broadcast_to(np.asarray(test, dtype=float), (len(live),))
+                valid = (test >= 0) & (test < len(branches)) & (np.trunc(test) == test)
+                parts = [(valid & (test == i), branch) for i, branch in enumerate(branches)]
+                parts.append((~valid, 0.0 if func == Op.SwitchInteger else args[-1]))
+                return self._widen(self._split(live, parts), lanes, live)
+            case Op.While | Op.DoWhile:
+                test, body = args if func == Op.While else args[::-1]
+                live = lanes
+                if func == Op.DoWhile:
+                    live = self._run_body(body, live)
+                while len(live):
+                    live, (value,) = self._operands((test,), live)
+                    live = live[np.broadcast_to(value != 0.0, (len(live),))]
+                    live = self._run_body(body, live)
+                return 0.0
+            case Op.And | Op.Or:
+                # Values every lane agrees on are returned as they are, as with `If` (see `_split`).
+                value = 0.0
+                result = None
+                at = np.arange(len(lanes))
+                for arg in args:
+                    value = self._eval(arg, lanes[at])
+                    _, keep = self._unbroken(lanes[at])
+                    if keep is not None:
+                        at, value = at[keep], _take(value, keep)
+                    if result is None and not isinstance(value, np.ndarray):
+                        if (value == 0.0) == (func == Op.And):
+                            return value
+                        continue
+                    if result is None:
+                        result = np.zeros(len(lanes))
+                    result[at] = value
+                    stop = np.broadcast_to(value == 0.0 if func == Op.And else value != 0.0, (len(at),))
+                    at = at[~stop]
+                    if not len(at):
+                        break
+                return value if result is None else result
+            case Op.JumpLoop:
+                return self._jump_loop(args, lanes)
+            case Op.Block:
+                result = self._eval(args[0], lanes)
+                if not self.unwinding_count:
+                    return result
+                unwinding = self.unwinding[lanes]
+                if not unwinding.any():
+                    return result
+                depth = self.depth[lanes]
+                caught = unwinding & (depth <= 1)
+                result = np.where(caught, self.break_value[lanes], result)
+                self.unwinding[lanes[caught]] = False
+                self.unwinding_count -= int(caught.sum())
+                self.depth[lanes[unwinding & ~caught]] -= 1
+                return result
+            case Op.Break:
+                live, (count, value) = self._operands(args, lanes)
+                count = _ints(count)
+                self.unwinding[live] = True
+                self.depth[live] = count
+                self.break_value[live] = value
+                self.unwinding_count += len(live)
+                return 0.0
+            case Op.Not:
+                live, (value,) = self._operands(args, lanes)
+                return self._widen(_select(value == 0.0), lanes, live)
+            case Op.DebugPause:
+                return 0.0
+            case Op.Get | Op.GetShifted:
+                live, values = self._operands(args, lanes)
+                block, index = _address(func == Op.GetShifted, [_ints(value) for value in values])
+                return self._widen(self._read(block, index, live), lanes, live)
+            case Op.GetPointed:
+                live, values = self._operands(args, lanes)
+                block, index = self._deref(*(_ints(value) for value in values), live)
+                return self._widen(self._read(block, index, live), lanes, live)
+            case Op.Set | Op.SetShifted:
+                live, (*address, value) = self._operands(args, lanes)
+                block, index = _address(func == Op.SetShifted, [_ints(value) for value in address])
+                self._write(block, index, value, live)
+                return self._widen(value, lanes, live)
+            case _ if func in _RMW_OPS:
+                addressing, fn = _RMW_OPS[func]
+                live, (*address, value) = self._operands(args, lanes)
+                block, index = _address(addressing == "Shifted", [_ints(value) for value in address])
+                result = _apply(fn, _VECTOR_REDUCE.get(fn), [self._read(block, index, live), value], len(live))
+                self._write(block, index, result, live)
+                return self._widen(result, lanes, live)
+            case _ if func in _STEP_OPS:
+                addressing, fn, returns_new = _STEP_OPS[func]
+                live, address = self._operands(args, lanes)
+                block, index = _address(addressing == "Shifted", [_ints(value) for value in address])
+                old = self._read(block, index, live)
+                new = _apply(fn, _VECTOR_REDUCE.get(fn), [old, 1], len(live))
+                self._write(block, index, new, live)
+                return self._widen(new if returns_new else old, lanes, live)
+            case _ if func in RUNTIME_FUNCTIONS:
+                live, values = self._operands(args, lanes)
+                return self._widen(self.call_runtime(func, values, len(live)), lanes, live)
+        live, values = self._operands(args, lanes)
+        return self._widen(_pure(func, values, len(live)), lanes, live)
+
+    def _operands(self, args: Sequence[EngineNode], lanes: np.ndarray) -> tuple[np.ndarray, list[Value]]:
+        """Evaluate `args` in order; return the lanes that did not start unwinding, with their values."""
+        values = []
+        for arg in args:
+            value = self._eval(arg, lanes)
+            lanes, keep = self._unbroken(lanes)
+            if keep is not None:
+                values = [_take(v, keep) for v in values]
+                value = _take(value, keep)
+            values.append(value)
+        return lanes, values
+
+    def _unbroken(self, lanes: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+        """Return the `lanes` that are not unwinding, and the mask selecting them if that is not all."""
+        if not self.unwinding_count:
+            return lanes, None
+        keep = ~self.unwinding[lanes]
+        if keep.all():
+            return lanes, None
+        return lanes[keep], keep
+
+    def _run_body(self, body: EngineNode, lanes: np.ndarray) -> np.ndarray:
+        if len(lanes):
+            self._eval(body, lanes)
+        return self._unbroken(lanes)[0]
+
+    @staticmethod
+    def _widen(value: Value, lanes: np.ndarray, live: np.ndarray) -> Value:
+        """Align the values of the `live` subset of `lanes` with `lanes`."""
+        if live is lanes or not isinstance(value, np.ndarray):
+            return value
+        result = np.zeros(len(lanes))
+        result[np.searchsorted(lanes, live)] = value
+        return result
+
+    def _split(self, lanes: np.ndarray, parts: list[tuple[np.ndarray, EngineNode]]) -> Value:
+        """Evaluate each node of `parts` for the lanes its mask selects; return the combined values.
+
+        The masks partition the lanes. When they all go the same way, its value is returned
+        as it is, so a constant stays the Python number the interpreter would return.
+        """
+        parts = [(mask, node) for mask, node in parts if np.any(mask)]
+        if len(parts) == 1:
+            return self._eval(parts[0][1], lanes)
+        result = np.zeros(len(lanes))
+        for mask, node in parts:
+            mask = np.broadcast_to(mask, (len(lanes),))
+            result[mask] = self._eval(node, lanes[mask])
+        return result
+
+    def _jump_loop(self, args: Sequence[EngineNode], lanes: np.ndarray) -> Value:
+        n = len(args)
+        result = np.zeros(len(lanes))
+        index = np.zeros(len(lanes), dtype=np.int64)
+        at = np.arange(len(lanes))
+        while len(at):
+            at = at[(index[at] >= 0) & (index[at] < n)]
+            jumped = []
+            current = index[at]
+            for i in np.unique(current).tolist():
+                part = at[current == i]
+                value = self._eval(args[i], lanes[part])
+                _, keep = self._unbroken(lanes[part])
+                if keep is not None:
+                    part, value = part[keep], _take(value, keep)
+                if i == n - 1:
+                    result[part] = value
+                else:
+                    index[part] = _truncate(value)
+                    jumped.append(part)
+            at = np.sort(np.concatenate(jumped)) if jumped else _NO_LANES
+        return result
+
+    # -- memory -------------------------------------------------------------
+
+    def _size(self, block: int) -> int:
+        lane_block = self.lanes.get(block)
+        return len(self.blocks[block]) if lane_block is None else lane_block.size
+
+    def _read(self, block: int | np.ndarray, index: int | np.ndarray, lanes: np.ndarray) -> Value:
+        if isinstance(block, np.ndarray):
+            result = np.zeros(len(lanes))
+            index = np.broadcast_to(index, (len(lanes),))
+            for b in np.unique(block).tolist():
+                at = block == b
+                result[at] = self._read(b, index[at], lanes[at])
+            return result
+        _check_index(index, self._size(block))
+        lane_block = self.lanes.get(block)
+        if lane_block is None:
+            values = self.blocks[block]
+            if not isinstance(index, np.ndarray):
+                return values[index]
+            return np.fromiter((values[i] for i in index.tolist()), dtype=float, count=len(index))
+        if not isinstance(index, np.ndarray):
+            return lane_block.column(index)[lanes]
+        result = np.zeros(len(lanes))
+        for i in np.unique(index).tolist():
+            at = index == i
+            result[at] = lane_block.column(i)[lanes[at]]
+        return result
+
+    def _write(self, block: int | np.ndarray, index: int | np.ndarray, value: Value, lanes: np.ndarray) -> None:
+        lane_block = self.lanes.get(block) if not isinstance(block, np.ndarray) else None
+        if lane_block is None:
+            raise NotImplementedError("Only lane blocks at a constant block id can be written")
+        _check_index(index, lane_block.size)
+        if not isinstance(index, np.ndarray):
+            lane_block.column(index)[lanes] = value
+            lane_block.dirty.add(index)
+            return
+        value = np.broadcast_to(value, (len(lanes),))
+        for i in np.unique(index).tolist():
+            at = index == i
+            lane_block.column(i)[lanes[at]] = value[at]
+            lane_block.dirty.add(i)
+
+    def _deref(self, block, index, offset, lanes: np.ndarray) -> tuple[int | np.ndarray, int | np.ndarray]:
+        deref_block = self._read(block, index, lanes)
+        deref_index = _add(self._read(block, index + 1, lanes), offset)
+        return _ints(deref_block), _ints(deref_index)
+
+
+def _take(value: Value, keep: np.ndarray | None) -> Value:
+    if keep is None or not isinstance(value, np.ndarray):
+        return value
+    return value[keep]
+
+
+def _add(a: Value, b: Value) -> Value:
+    return a + b if not isinstance(a, np.ndarray) and not isinstance(b, np.ndarray) else np.add(a, b)
+
+
+def _select(condition) -> Value:
+    if isinstance(condition, np.ndarray):
+        return np.where(condition, 1.0, 0.0)
+    return 1.0 if condition else 0.0
+
+
+def _ints(value: Value) -> int | np.ndarray:
+    """`ensure_int` for every lane."""
+    if not isinstance(value, np.ndarray):
+        return _ensure_int(value)
+    if not (np.isfinite(value).all() and (np.trunc(value) == value).all()):
+        raise AssertionError("Value must be an integer")
+    return value.astype(np.int64)
+
+
+def _truncate(value: Value) -> int | np.ndarray:
+    """`int()` for every lane."""
+    if not isinstance(value, np.ndarray):
+        return int(value)
+    if not np.isfinite(value).all():
+        raise ValueError("Cannot convert a non-finite value to an integer")
+    return np.trunc(value).astype(np.int64)
+
+
+def _check_index(index: int | np.ndarray, size: int) -> None:
+    if isinstance(index, np.ndarray):
+        if len(index) and (index.min() < 0 or index.max() >= size):
+            raise AssertionError("Index out of range")
+        return
+    assert index >= 0, "Index must be non-negative"
+    assert index < size, "Index is too large"
+
+
+def _address(shifted: bool, values: list) -> tuple[int | np.ndarray, int | np.ndarray]:
+    if not shifted:
+        return values[0], values[1]
+    block, offset, index, stride = values
+    return block, offset + index * stride
+
+
+# -- pure ops ---------------------------------------------------------------
+
+
+def _pure(func: Op, values: list[Value], count: int) -> Value:
+    """Evaluate a pure op for `count` lanes; with no per-lane operand, once with the interpreter's function."""
+    vector = any(isinstance(value, np.ndarray) for value in values)
+    if func in _UNARY_FUNCS:
+        fn = _UNARY_FUNCS[func]
+        return _apply(fn, _VECTOR_UNARY.get(func), values, count) if vector else fn(values[0])
+    if func in _BINARY_FUNCS:
+        fn = _BINARY_FUNCS[func]
+        return _apply(fn, _VECTOR_BINARY.get(func), values, count) if vector else fn(*values)
+    if func in _COMPARISONS:
+        result = _COMPARISONS[func](*values)
+        return _select(result)
+    if func in _REDUCE_FUNCS:
+        if not values:
+            return 0.0
+        fn = _REDUCE_FUNCS[func]
+        acc, *rest = values
+        for value in rest:
+            acc = _apply(fn, _VECTOR_REDUCE.get(fn), [acc, value], count)
+        return acc
+    _, fn = _FIXED_FUNCS[func]
+    if not vector:
+        return fn(*values)
+    return _VECTOR_FIXED[func](*values) if func in _VECTOR_FIXED else elementwise(fn, values, count)
+
+
+def _apply(fn: Callable, vector_fn: Callable | None, values: list[Value], count: int) -> Value:
+    if not any(isinstance(value, np.ndarray) for value in values):
+        return fn(*values)
+    if vector_fn is None:
+        return elementwise(fn, values, count)
+    return vector_fn(*values)
+
+
+def elementwise(fn: Callable[..., float], values: Sequence[Value], count: int) -> np.ndarray:
+    """Apply a scalar `fn` to the values of each of `count` lanes, e.g. to match the interpreter exactly."""
+    columns = [value.tolist() if isinstance(value, np.ndarray) else itertools.repeat(value, count) for value in values]
+    return np.fromiter(map(fn, *columns), dtype=float, count=count)
+
+
+def _rounding(fn: Callable[[np.ndarray], np.ndarray]) -> Callable[[np.ndarray], np.ndarray]:
+    # `math.floor` and the like return an int, so they fail on infinities and NaN, and never give -0.0.
+    def rounded(x: np.ndarray) -> np.ndarray:
+        if not np.isfinite(x).all():
+            raise ValueError("Cannot convert a non-finite value to an integer")
+        return fn(x) + 0.0
+
+    return rounded
+
+
+def _sign(x: np.ndarray) -> np.ndarray:
+    return np.where(x > 0, 1.0, np.where(x < 0, -1.0, x))
+
+
+def _max(a: Value, b: Value) -> Value:
+    # `max(a, b)` keeps `a` unless `b` is greater, including when either is NaN.
+    if not isinstance(a, np.ndarray) and not isinstance(b, np.ndarray):
+        return max(a, b)
+    return np.where(b > a, b, a)
+
+
+def _min(a: Value, b: Value) -> Value:
+    if not isinstance(a, np.ndarray) and not isinstance(b, np.ndarray):
+        return min(a, b)
+    return np.where(b < a, b, a)
+
+
+def _divide(a: Value, b: Value) -> Value:
+    if np.any(np.asarray(b) == 0):
+        raise ZeroDivisionError("division by zero")
+    return np.divide(a, b)
+
+
+_VECTOR_UNARY: dict[Op, Callable[[np.ndarray], np.ndarray]] = {
+    Op.Abs: np.abs,
+    Op.Ceil: _rounding(np.ceil),
+    Op.Floor: _rounding(np.floor),
+    Op.Negate: np.negative,
+    Op.Round: _rounding(np.rint),
+    Op.Sign: _sign,
+    Op.Trunc: _rounding(np.trunc),
+}
+_VECTOR_BINARY: dict[Op, Callable[[Value, Value], Value]] = {
+    Op.Max: _max,
+    Op.Min: _min,
+}
+# Keyed by the interpreter's scalar function, as the read-modify-write and step ops share them.
+_VECTOR_REDUCE: dict[Callable, Callable[[Value, Value], Value]] = {
+    _REDUCE_FUNCS[Op.Add]: np.add,
+    _REDUCE_FUNCS[Op.Divide]: _divide,
+    _REDUCE_FUNCS[Op.Multiply]: np.multiply,
+    _REDUCE_FUNCS[Op.Subtract]: np.subtract,
+}
+# The interpreter's formulas, operation for operation.
+_VECTOR_FIXED: dict[Op, Callable[..., Value]] = {
+    Op.Clamp: lambda x, a, b: _max(a, _min(b, x)),
+    Op.Lerp: lambda x, y, s: x + (y - x) * s,
+    Op.LerpClamped: lambda x, y, s: x + (y - x) * _max(0, _min(1, s)),
+    Op.Unlerp: lambda lo, hi, value: _divide(value - lo, hi - lo),
+    Op.UnlerpClamped: lambda lo, hi, value: _max(0, _min(1, _divide(value - lo, hi - lo))),
+    Op.Remap: lambda from_min, from_max, to_min, to_max, value: (
+        to_min + _divide((to_max - to_min) * (value - from_min), from_max - from_min)
+    ),
+    Op.RemapClamped: lambda from_min, from_max, to_min, to_max, value: (
+        to_min + (to_max - to_min) * _max(0, _min(1, _divide(value - from_min, from_max - from_min)))
+    ),
+    Op.Judge: lambda *args: elementwise(_judge_op, list(args), _count(args)),
+    Op.JudgeSimple: lambda *args: elementwise(_judge_simple, list(args), _count(args)),
+}
+
+
+def _count(values: Sequence[Value]) -> int:
+    return next(len(value) for value in values if isinstance(value, np.ndarray))
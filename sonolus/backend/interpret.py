@@ -1,11 +1,19 @@
+from __future__ import annotations
+
 import math
 import operator
 import random
-from collections.abc import Callable
+from array import array
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING
 
+from sonolus.backend.blocks import BLOCK_MEMORY_SIZES
 from sonolus.backend.node import EngineNode, FunctionNode
 from sonolus.backend.ops import Op
 
+if TYPE_CHECKING:
+    from sonolus.backend.profiler import RuntimeProfile
+
 
 class BreakException(Exception):  # noqa: N818
     n: int
@@ -366,19 +374,161 @@ def _ease_out_in_sine(x: float) -> float:
         return 1 - math.sin(math.pi * x) / 2
 
 
+# Size of the blocks without a declared size in `BLOCK_MEMORY_SIZES`: the runtime's largest index is 65535.
+DEFAULT_BLOCK_SIZE = 65536
+
+type MemorySnapshot = dict[int, bytes]
+
+
+class Memory(dict[int, array]):  # noqa: FURB189
+    """Interpreter memory: block id -> an `array('d')` of the block's full size.
+
+    A block is allocated, filled with `fill` (-1.0 by default), the first time it is
+    accessed; its size is taken from `BLOCK_MEMORY_SIZES`, or `DEFAULT_BLOCK_SIZE` for
+    undeclared blocks, so an index is valid exactly when it is below
+    `len(self[block])`. Assigning any sequence of floats to a block pads it to the
+    block's size, while `bind` installs an array as is (e.g. the memory of the
+    entity a simulated callback runs for).
+
+    `snapshot` copies every allocated block in one go; `restore` and `diff` use a
+    snapshot to reset memory or find the cells that changed since it was taken.
+    """
+
+    sizes: Mapping[int, int]
+    filler: array
+
+    def __init__(self, sizes: Mapping[int, int] | None = None, fill: float = -1.0):
+        super().__init__()
+        self.sizes = _BLOCK_SIZES if sizes is None else sizes
+        self.filler = array("d", [fill])
+
+    def size(self, block: int) -> int:
+        return self.sizes.get(block, DEFAULT_BLOCK_SIZE)
+
+    def __missing__(self, block: int) -> array:
+        values = self.filler * self.size(block)
+        super().__setitem__(block, values)
+        return values
+
+    def __setitem__(self, block: int, values: Iterable[float]) -> None:
+        values = array("d", values)
+        size = self.size(block)
+        if len(values) > size:
+            raise ValueError(f"Block {block} holds {size} values, got {len(values)}")
+        if len(values) < size:
+            values.extend(self.filler * (size - len(values)))
+        super().__setitem__(block, values)
+
+    def bind(self, block: int, values: array) -> None:
+        """Use `values` itself as `block`, whatever its size; writes to the block go to it."""
+        super().__setitem__(block, values)
+
+    def snapshot(self) -> MemorySnapshot:
+        """Return a copy of every allocated block."""
+        return {block: values.tobytes() for block, values in self.items()}
+
+    def restore(self, snapshot: MemorySnapshot) -> None:
+        """Reset memory to `snapshot`; blocks allocated since it was taken are dropped."""
+        self.clear()
+        for block, data in snapshot.items():
+            values = array("d")
+            values.frombytes(data)
+            super().__setitem__(block, values)
+
+    def diff(self, snapshot: MemorySnapshot) -> dict[int, list[int]]:
+        """Return `{block: indices}` of the cells whose bits changed since `snapshot`.
+
+        Blocks allocated since the snapshot are compared against the fill value.
+        """
+        changed = {}
+        for block, values in self.items():
+            data = values.tobytes()
+            before = snapshot.get(block)
+            if before is None:
+                before = (self.filler * len(values)).tobytes()
+            if data == before:
+                continue
+            # Compare bit patterns, so that NaNs compare equal and -0.0 differs from 0.0.
+            old, new = array("Q", before), array("Q", data)
+            changed[block] = [i for i, (a, b) in enumerate(zip(old, new, strict=True)) if a != b]
+        return changed
+
+
+_BLOCK_SIZES = {int(block): size for block, size in BLOCK_MEMORY_SIZES.items()}
+
+# Ops implemented by the Sonolus runtime rather than computed from memory: drawing,
+# audio, particles, spawning, timing lookups, and the like. The interpreter evaluates
+# their arguments and hands them to `Interpreter.call_runtime`.
+RUNTIME_FUNCTIONS: frozenset[Op] = frozenset(
+    {
+        Op.AddLifeScheduled,
+        Op.BeatToBPM,
+        Op.BeatToStartingBeat,
+        Op.BeatToStartingTime,
+        Op.BeatToTime,
+        Op.DestroyParticleEffect,
+        Op.Draw,
+        Op.DrawCurvedB,
+        Op.DrawCurvedBT,
+        Op.DrawCurvedL,
+        Op.DrawCurvedLR,
+        Op.DrawCurvedR,
+        Op.DrawCurvedT,
+        Op.ExportValue,
+        Op.HasEffectClip,
+        Op.HasParticleEffect,
+        Op.HasSkinSprite,
+        Op.MoveParticleEffect,
+        Op.Paint,
+        Op.Play,
+        Op.PlayLooped,
+        Op.PlayLoopedScheduled,
+        Op.PlayScheduled,
+        Op.Print,
+        Op.Spawn,
+        Op.SpawnParticleEffect,
+        Op.StopLooped,
+        Op.StopLoopedScheduled,
+        Op.StreamGetNextKey,
+        Op.StreamGetPreviousKey,
+        Op.StreamGetValue,
+        Op.StreamHas,
+        Op.StreamSet,
+        Op.TimeToScaledTime,
+        Op.TimeToStartingScaledTime,
+        Op.TimeToStartingTime,
+        Op.TimeToTimeScale,
+    }
+)
+
+
 class Interpreter:
-    blocks: dict[int, list[float]]
+    blocks: Memory
     log: list[float]
-
-    def __init__(self):
-        self.blocks = {}
+    # Function nodes evaluated so far, by `run` and by closures compiled with `count=True`.
+    executed: int
+    # Where `run` and closures compiled with `profile=True` count ops and memory accesses.
+    profile: RuntimeProfile | None
+
+    def __init__(
+        self,
+        block_sizes: Mapping[int, int] | None = None,
+        fill: float = -1.0,
+        profile: RuntimeProfile | None = None,
+    ):
+        self.blocks = Memory(block_sizes, fill) if profile is None else profile.memory(block_sizes, fill)
         self.log = []
+        self.executed = 0
+        self.profile = profile
 
     def run(self, node: EngineNode) -> float:
         if not isinstance(node, FunctionNode):
             return node
+        self.executed += 1
         func = node.func
         args = node.args
+        if self.profile is not None:
+            self.profile.current_ops[func] += 1
         match func:
             case Op.Execute:
                 result = 0.0
@@ -745,9 +895,15 @@ class Interpreter:
                 )
             case _ if func in _EASE_FUNCS:
                 return _EASE_FUNCS[func](self.run(args[0]))
+            case _ if func in RUNTIME_FUNCTIONS:
+                return self.call_runtime(func, [self.run(arg) for arg in args])
             case _:
                 raise NotImplementedError(f"Unsupported operation: {func}")
 
+    def call_runtime(self, func: Op, args: list[float]) -> float:
+        """Evaluate a `RUNTIME_FUNCTIONS` op on its evaluated arguments; subclasses provide them."""
+        raise NotImplementedError(f"Unsupported operation: {func}")
+
     def reduce_args(self, args: list[EngineNode], operator) -> float:
         if not args:
             return 0.0
@@ -790,25 +946,730 @@ class Interpreter:
         block = self.ensure_int(block)
         index = self.ensure_int(index)
         assert index >= 0, "Index must be non-negative"
-        assert index <= 65535, "Index is too large"
-        if block not in self.blocks:
-            self.blocks[block] = []
-        if len(self.blocks[block]) <= index:
-            self.blocks[block] += [-1.0] * (index - len(self.blocks[block]) + 1)
-        return self.blocks[block][index]
+        values = self.blocks[block]
+        assert index < len(values), "Index is too large"
+        return values[index]
 
     def set(self, block: float, index: float, value: float):
         block = self.ensure_int(block)
         index = self.ensure_int(index)
         assert index >= 0, "Index must be non-negative"
-        assert index <= 65535, "Index is too large"
-        if block not in self.blocks:
-            self.blocks[block] = []
-        if len(self.blocks[block]) <= index:
-            self.blocks[block] += [-1.0] * (index - len(self.blocks[block]) + 1)
-        self.blocks[block][index] = value
+        values = self.blocks[block]
+        assert index < len(values), "Index is too large"
+        values[index] = value
         return value
 
     def ensure_int(self, value: float) -> int:
         assert value == int(value), "Value must be an integer"
         return int(value)
+
+    def run_compiled(self, node: EngineNode, *, count: bool = False) -> float:
+        """Evaluate `node` like `run`, through a closure compiled by `compile_node`.
+
+        Faster when the node has more than a handful of function nodes; the result,
+        memory, log, and any exception raised are the same as with `run`, and so is
+        `executed` with `count`. With a `profile`, nodes are always counted and profiled.
+        """
+        return compile_node(node, count=count, profile=self.profile is not None)(self)
+
+
+type CompiledNode = Callable[[Interpreter], float]
+
+
+def compile_node(node: EngineNode, *, count: bool = False, profile: bool = False) -> CompiledNode:
+    """Compile `node` once into nested closures that evaluate it on a given `Interpreter`.
+
+    Each op and arity gets a specialized closure, with constant operands bound at
+    compile time; a subtree shared within `node` is compiled only once, and the
+    branches of `If`, `Switch*` and `JumpLoop` only when first taken. The
+    result can be called on any number of interpreters and behaves exactly like
+    `Interpreter.run`, including evaluation order, memory growth, and the exceptions
+    raised. Nodes whose shape `run` only supports through a failure (e.g. a wrong
+    number of arguments) fall back to calling `run` on them.
+
+    With `count`, every evaluated function node adds one to `Interpreter.executed`,
+    as it does under `run`; this costs about a call per node. `profile` also counts
+    each node by op in the interpreter's `profile`, if it has one, again as `run` does.
+    """
+    return _Compiler(count, profile).compile(node)
+
+
+def _ensure_int(value: float) -> int:
+    if type(value) is int:
+        return value
+    assert value == int(value), "Value must be an integer"
+    return int(value)
+
+
+def _read(blocks: Memory, block: int, index: int) -> float:
+    # `Interpreter.get` for an already-checked int block and index.
+    assert index >= 0, "Index must be non-negative"
+    values = blocks[block]
+    assert index < len(values), "Index is too large"
+    return values[index]
+
+
+def _write(blocks: Memory, block: int, index: int, value: float) -> float:
+    # `Interpreter.set` for an already-checked int block and index.
+    assert index >= 0, "Index must be non-negative"
+    values = blocks[block]
+    assert index < len(values), "Index is too large"
+    values[index] = value
+    return value
+
+
+def _deref(blocks: Memory, block: int, index: int, offset: int) -> tuple[int, int]:
+    # The `(block, index)` a pointed op addresses, read from `block[index:index + 2]`.
+    deref_block = _read(blocks, block, index)
+    deref_index = _read(blocks, block, index + 1) + offset
+    return _ensure_int(deref_block), _ensure_int(deref_index)
+
+
+def _frac(x: float) -> float:
+    result = x % 1
+    return result if result >= 0 else result + 1
+
+
+def _clamp(x: float, a: float, b: float) -> float:
+    return max(a, min(b, x))
+
+
+def _lerp(x: float, y: float, s: float) -> float:
+    return x + (y - x) * s
+
+
+def _lerp_clamped(x: float, y: float, s: float) -> float:
+    return x + (y - x) * max(0, min(1, s))
+
+
+def _unlerp(lo: float, hi: float, value: float) -> float:
+    return (value - lo) / (hi - lo)
+
+
+def _unlerp_clamped(lo: float, hi: float, value: float) -> float:
+    return max(0, min(1, (value - lo) / (hi - lo)))
+
+
+def _remap(from_min: float, from_max: float, to_min: float, to_max: float, value: float) -> float:
+    return to_min + (to_max - to_min) * (value - from_min) / (from_max - from_min)
+
+
+def _remap_clamped(from_min: float, from_max: float, to_min: float, to_max: float, value: float) -> float:
+    return to_min + (to_max - to_min) * max(0, min(1, (value - from_min) / (from_max - from_min)))
+
+
+def _judge_op(source, target, perfect_min, perfect_max, great_min, great_max, good_min, good_max) -> float:
+    return _judge(source - target, perfect_min, perfect_max, great_min, great_max, good_min, good_max)
+
+
+def _judge_simple(source, target, max_perfect, max_great, max_good) -> float:
+    return _judge(source - target, -max_perfect, max_perfect, -max_great, max_great, -max_good, max_good)
+
+
+# Ops reading only `args[0]`.
+_UNARY_FUNCS: dict[Op, Callable[[float], float]] = {
+    Op.Abs: abs,
+    Op.Arccos: math.acos,
+    Op.Arcsin: math.asin,
+    Op.Arctan: math.atan,
+    Op.Ceil: math.ceil,
+    Op.Cos: math.cos,
+    Op.Cosh: math.cosh,
+    Op.Degree: math.degrees,
+    Op.Floor: math.floor,
+    Op.Frac: _frac,
+    Op.Log: math.log,
+    Op.Negate: operator.neg,
+    Op.Radian: math.radians,
+    Op.Round: round,
+    Op.Sign: _sign,
+    Op.Sin: math.sin,
+    Op.Sinh: math.sinh,
+    Op.Tan: math.tan,
+    Op.Tanh: math.tanh,
+    Op.Trunc: math.trunc,
+    **_EASE_FUNCS,
+}
+# Ops reading only `args[0]` and `args[1]`.
+_BINARY_FUNCS: dict[Op, Callable[[float, float], float]] = {
+    Op.Arctan2: math.atan2,
+    Op.Max: max,
+    Op.Min: min,
+}
+_COMPARISONS: dict[Op, Callable[[float, float], bool]] = {
+    Op.Equal: operator.eq,
+    Op.Greater: operator.gt,
+    Op.GreaterOr: operator.ge,
+    Op.Less: operator.lt,
+    Op.LessOr: operator.le,
+    Op.NotEqual: operator.ne,
+}
+# Ops folding all of their arguments left to right, after evaluating every one.
+_REDUCE_FUNCS: dict[Op, Callable[[float, float], float]] = {
+    Op.Add: operator.add,
+    Op.Divide: operator.truediv,
+    Op.Mod: operator.mod,
+    Op.Multiply: operator.mul,
+    Op.Power: operator.pow,
+    Op.Rem: _rem,
+    Op.Subtract: operator.sub,
+}
+# Ops taking exactly this many float arguments, all evaluated first.
+_FIXED_FUNCS: dict[Op, tuple[int, Callable[..., float]]] = {
+    Op.Clamp: (3, _clamp),
+    Op.Lerp: (3, _lerp),
+    Op.LerpClamped: (3, _lerp_clamped),
+    Op.Unlerp: (3, _unlerp),
+    Op.UnlerpClamped: (3, _unlerp_clamped),
+    Op.Remap: (5, _remap),
+    Op.RemapClamped: (5, _remap_clamped),
+    Op.Random: (2, random.uniform),
+    Op.Judge: (8, _judge_op),
+    Op.JudgeSimple: (5, _judge_simple),
+}
+# Fused read-modify-write ops: op -> (addressing, operator).
+_RMW_OPS: dict[Op, tuple[str, Callable[[float, float], float]]] = {
+    getattr(Op, f"Set{name}{addressing}"): (addressing, fn)
+    for name, fn in (
+        ("Add", operator.add),
+        ("Subtract", operator.sub),
+        ("Multiply", operator.mul),
+        ("Divide", operator.truediv),
+        ("Mod", operator.mod),
+        ("Rem", _rem),
+        ("Power", operator.pow),
+    )
+    for addressing in ("", "Pointed", "Shifted")
+}
+# Increment/decrement ops: op -> (addressing, operator, whether the new value is returned).
+_STEP_OPS: dict[Op, tuple[str, Callable[[float, int], float], bool]] = {
+    getattr(Op, f"{name}{order}{addressing}"): (addressing, fn, order == "Post")
+    for name, fn in (("Increment", operator.add), ("Decrement", operator.sub))
+    for order in ("Post", "Pre")
+    for addressing in ("", "Pointed", "Shifted")
+}
+# Number of integer address arguments of each addressing mode.
+_ADDRESS_ARITY = {"": 2, "Pointed": 3, "Shifted": 4}
+
+
+def _counted(f: CompiledNode) -> CompiledNode:
+    def counted(it):
+        it.executed += 1
+        return f(it)
+
+    return counted
+
+
+def _profiled(f: CompiledNode, func: Op) -> CompiledNode:
+    def profiled(it):
+        it.executed += 1
+        profile = it.profile
+        if profile is not None:
+            profile.current_ops[func] += 1
+        return f(it)
+
+    return profiled
+
+
+class _Compiler:
+    """Compiles one node tree; `compiled` memoizes shared subtrees by identity.
+
+    Branches are compiled lazily (see `_lazy`), so the compiler lives as long as the
+    closures it returns.
+    """
+
+    def __init__(self, count: bool = False, profile: bool = False):
+        self.count = count
+        self.profile = profile
+        self.compiled: dict[int, CompiledNode] = {}
+
+    def compile(self, node: EngineNode) -> CompiledNode:
+        if not isinstance(node, FunctionNode):
+            return lambda it: node
+        key = id(node)
+        result = self.compiled.get(key)
+        if result is None:
+            result = self._compile_function(node)
+            if result is None:
+                # A shape `run` does not support: defer to it, so it fails (or not) identically.
+                result = lambda it: it.run(node)  # noqa: E731
+            elif self.profile:
+                result = _profiled(result, node.func)
+            elif self.count:
+                result = _counted(result)
+            self.compiled[key] = result
+        return result
+
+    def _compile_function(self, node: FunctionNode) -> CompiledNode | None:
+        func = node.func
+        args = node.args
+        n = len(args)
+        if func in _UNARY_FUNCS and n >= 1:
+            return self._unary(_UNARY_FUNCS[func], args[0])
+        if func in _COMPARISONS and n >= 2:
+            return self._comparison(_COMPARISONS[func], args[0], args[1])
+        if func in _BINARY_FUNCS and n >= 2:
+            fn = _BINARY_FUNCS[func]
+            a, b = self.compile(args[0]), self.compile(args[1])
+            return lambda it: fn(a(it), b(it))
+        if func in _REDUCE_FUNCS:
+            return self._reduce(_REDUCE_FUNCS[func], args)
+        if func in _FIXED_FUNCS and n == _FIXED_FUNCS[func][0]:
+            return self._fixed(_FIXED_FUNCS[func][1], args)
+        if func in _RMW_OPS and n == _ADDRESS_ARITY[_RMW_OPS[func][0]] + 1:
+            return self._rmw(*_RMW_OPS[func], args)
+        if func in _STEP_OPS and n == _ADDRESS_ARITY[_STEP_OPS[func][0]]:
+            return self._step(*_STEP_OPS[func], args)
+        match func:
+            case Op.Execute | Op.Execute0:
+                return self._execute(args, func == Op.Execute0)
+            case Op.If if n == 3:
+                test = self.compile(args[0])
+                branches = self._lazy(args[1:])
+                return lambda it: branches[0](it) if test(it) != 0.0 else branches[1](it)
+            case Op.Switch if n % 2 == 1:
+                return self._switch(args[0], args[1:], None)
+            case Op.SwitchWithDefault if n >= 2 and n % 2 == 0:
+                return self._switch(args[0], args[1:-1], args[-1])
+            case Op.SwitchInteger if n >= 1:
+                return self._switch_integer(args[0], args[1:], None)
+            case Op.SwitchIntegerWithDefault if n >= 2:
+                return self._switch_integer(args[0], args[1:-1], args[-1])
+            case Op.While if n == 2:
+                return self._while(self.compile(args[0]), self.compile(args[1]))
+            case Op.DoWhile if n == 2:
+                return self._do_while(self.compile(args[0]), self.compile(args[1]))
+            case Op.And | Op.Or:
+                return self._short_circuit(args, func == Op.And)
+            case Op.JumpLoop:
+                return self._jump_loop(args)
+            case Op.Block if n >= 1:
+                return self._block(self.compile(args[0]))
+            case Op.Break if n >= 2:
+                count, value = self.compile(args[0]), self.compile(args[1])
+
+                def run_break(it):
+                    raise BreakException(_ensure_int(count(it)), value(it))
+
+                return run_break
+            case Op.Not if n >= 1:
+                a = self.compile(args[0])
+                return lambda it: 1.0 if a(it) == 0.0 else 0.0
+            case Op.Get if n == 2:
+                return self._get(args)
+            case Op.GetPointed if n == 3:
+                address = self._address("Pointed", args)
+                return lambda it: _read(it.blocks, *address(it))
+            case Op.GetShifted if n == 4:
+                block, offset, index, stride = (self._int(arg) for arg in args)
+
+                def get_shifted(it):
+                    b, o, i, s = block(it), offset(it), index(it), stride(it)
+                    return _read(it.blocks, b, o + i * s)
+
+                return get_shifted
+            case Op.Set if n == 3:
+                return self._set(args)
+            case Op.SetPointed if n == 4:
+                block, index, offset, value = (self.compile(arg) for arg in args)
+
+                def set_pointed(it):
+                    b, i, o, v = block(it), index(it), offset(it), value(it)
+                    blocks = it.blocks
+                    return _write(blocks, *_deref(blocks, _ensure_int(b), _ensure_int(i), _ensure_int(o)), v)
+
+                return set_pointed
+            case Op.SetShifted if n == 5:
+                block, offset, index, stride, value = (self.compile(arg) for arg in args)
+
+                def set_shifted(it):
+                    b, o, i, s, v = block(it), offset(it), index(it), stride(it), value(it)
+                    b, o, i, s = _ensure_int(b), _ensure_int(o), _ensure_int(i), _ensure_int(s)
+                    return _write(it.blocks, b, o + i * s, v)
+
+                return set_shifted
+            case Op.Copy if n == 5:
+                return self._copy(args)
+            case Op.RandomInteger if n == 2:
+                lo, hi = (self._int(arg) for arg in args)
+
+                def random_integer(it):
+                    a = lo(it)
+                    return random.randrange(a, hi(it))
+
+                return random_integer
+            case Op.DebugLog if n >= 1:
+                a = self.compile(args[0])
+
+                def debug_log(it):
+                    it.log.append(a(it))
+                    return 0.0
+
+                return debug_log
+            case Op.DebugPause:
+                return lambda it: 0.0
+            case _ if func in RUNTIME_FUNCTIONS:
+                fs = [self.compile(arg) for arg in args]
+                return lambda it: it.call_runtime(func, [f(it) for f in fs])
+        return None
+
+    # -- operands -----------------------------------------------------------
+
+    def _int(self, arg: EngineNode) -> Callable[[Interpreter], int]:
+        """Compile an operand `run` passes through `ensure_int` right after evaluating it."""
+        if not isinstance(arg, FunctionNode):
+            try:
+                value = _ensure_int(arg)
+            except (AssertionError, ValueError, OverflowError, TypeError):
+                pass
+            else:
+                return lambda it: value
+        a = self.compile(arg)
+        return lambda it: _ensure_int(a(it))
+
+    def _lazy(self, args: tuple[EngineNode, ...]) -> list[CompiledNode]:
+        """Compile branch operands on first use, as most branches of a callback never run.
+
+        The returned list initially holds stubs; the first call of each compiles its
+        operand and replaces it in the list, so callers must call through the list.
+        """
+        fs: list[CompiledNode] = []
+        for i, arg in enumerate(args):
+            if not isinstance(arg, FunctionNode):
+                fs.append(lambda it, value=arg: value)
+                continue
+
+            def stub(it, i=i, arg=arg):
+                f = fs[i] = self.compile(arg)
+                return f(it)
+
+            fs.append(stub)
+        return fs
+
+    # -- arithmetic ---------------------------------------------------------
+
+    def _unary(self, fn: Callable[[float], float], arg: EngineNode) -> CompiledNode:
+        a = self.compile(arg)
+        return lambda it: fn(a(it))
+
+    def _comparison(self, cmp: Callable[[float, float], bool], lhs: EngineNode, rhs: EngineNode) -> CompiledNode:
+        a = self.compile(lhs)
+        if not isinstance(rhs, FunctionNode):
+            return lambda it: 1.0 if cmp(a(it), rhs) else 0.0
+        b = self.compile(rhs)
+        return lambda it: 1.0 if cmp(a(it), b(it)) else 0.0
+
+    def _reduce(self, fn: Callable[[float, float], float], args: tuple[EngineNode, ...]) -> CompiledNode:
+        match len(args):
+            case 0:
+                return lambda it: 0.0
+            case 1:
+                return self.compile(args[0])
+            case 2:
+                a = self.compile(args[0])
+                if not isinstance(args[1], FunctionNode):
+                    const = args[1]
+                    return lambda it: fn(a(it), const)
+                b = self.compile(args[1])
+                return lambda it: fn(a(it), b(it))
+        first, *rest = (self.compile(arg) for arg in args)
+
+        def reduce_args(it):
+            acc = first(it)
+            values = [f(it) for f in rest]
+            for value in values:
+                acc = fn(acc, value)
+            return acc
+
+        return reduce_args
+
+    def _fixed(self, fn: Callable[..., float], args: tuple[EngineNode, ...]) -> CompiledNode:
+        fs = [self.compile(arg) for arg in args]
+        if len(fs) == 3:
+            a, b, c = fs
+            return lambda it: fn(a(it), b(it), c(it))
+        return lambda it: fn(*[f(it) for f in fs])
+
+    # -- control flow -------------------------------------------------------
+
+    def _execute(self, args: tuple[EngineNode, ...], discard: bool) -> CompiledNode:
+        fs = [self.compile(arg) for arg in args]
+        if not fs:
+            return lambda it: 0.0
+        *head, last = fs
+
+        def execute(it):
+            for f in head:
+                f(it)
+            return last(it)
+
+        if not discard:
+            return execute
+
+        def execute0(it):
+            execute(it)
+            return 0.0
+
+        return execute0
+
+    def _switch(self, test: EngineNode, cases: tuple[EngineNode, ...], default: EngineNode | None) -> CompiledNode:
+        t = self.compile(test)
+        keys = cases[::2]
+        # The branches, then the default.
+        fs = self._lazy((*cases[1::2], 0.0 if default is None else default))
+        if not any(isinstance(key, FunctionNode) or math.isnan(key) for key in keys):
+            # Constant keys: the first branch of each key, found by hashing.
+            table: dict[float, int] = {}
+            for i, key in enumerate(keys):
+                table.setdefault(key, i)
+            lookup = table.get
+            default_index = len(keys)
+
+            def switch_table(it):
+                return fs[lookup(t(it), default_index)](it)
+
+            return switch_table
+        compiled_keys = [self.compile(key) for key in keys]
+
+        def switch(it):
+            value = t(it)
+            for i, key in enumerate(compiled_keys):
+                if value == key(it):
+                    return fs[i](it)
+            return fs[-1](it)
+
+        return switch
+
+    def _switch_integer(
+        self, test: EngineNode, branches: tuple[EngineNode, ...], default: EngineNode | None
+    ) -> CompiledNode:
+        t = self.compile(test)
+        fs = self._lazy((*branches, 0.0 if default is None else default))
+        count = len(branches)
+
+        def switch_integer(it):
+            value = t(it)
+            if 0 <= value < count and int(value) == value:
+                return fs[int(value)](it)
+            return fs[count](it)
+
+        return switch_integer
+
+    @staticmethod
+    def _while(test: CompiledNode, body: CompiledNode) -> CompiledNode:
+        def run_while(it):
+            while test(it) != 0.0:
+                body(it)
+            return 0.0
+
+        return run_while
+
+    @staticmethod
+    def _do_while(body: CompiledNode, test: CompiledNode) -> CompiledNode:
+        def do_while(it):
+            while True:
+                body(it)
+                if test(it) == 0.0:
+                    break
+            return 0.0
+
+        return do_while
+
+    def _short_circuit(self, args: tuple[EngineNode, ...], is_and: bool) -> CompiledNode:
+        fs = [self.compile(arg) for arg in args]
+
+        def run_and(it):
+            result = 0.0
+            for f in fs:
+                result = f(it)
+                if result == 0.0:
+                    break
+            return result
+
+        def run_or(it):
+            result = 0.0
+            for f in fs:
+                result = f(it)
+                if result != 0.0:
+                    break
+            return result
+
+        return run_and if is_and else run_or
+
+    def _jump_loop(self, args: tuple[EngineNode, ...]) -> CompiledNode:
+        fs = self._lazy(args)
+        count = len(fs)
+        last = count - 1
+
+        def jump_loop(it):
+            index = 0
+            while 0 <= index < count:
+                if index == last:
+                    return fs[index](it)
+                index = int(fs[index](it))
+            return 0.0
+
+        return jump_loop
+
+    @staticmethod
+    def _block(body: CompiledNode) -> CompiledNode:
+        def block(it):
+            try:
+                return body(it)
+            except BreakException as e:
+                if e.n > 1:
+                    e.n -= 1
+                    raise e from None
+                return e.value
+
+        return block
+
+    # -- memory -------------------------------------------------------------
+
+    def _get(self, args: tuple[EngineNode, ...]) -> CompiledNode:
+        block_arg, index_arg = args
+        if not isinstance(block_arg, FunctionNode) and not isinstance(index_arg, FunctionNode):
+            try:
+                block, index = _ensure_int(block_arg), _ensure_int(index_arg)
+            except (AssertionError, ValueError, OverflowError, TypeError):
+                pass
+            else:
+                if index >= 0:
+
+                    def get_const(it):
+                        values = it.blocks[block]
+                        if index < len(values):
+                            return values[index]
+                        return _read(it.blocks, block, index)
+
+                    return get_const
+        block, index = self._int(block_arg), self._int(index_arg)
+
+        def get(it):
+            b = block(it)
+            return _read(it.blocks, b, index(it))
+
+        return get
+
+    def _set(self, args: tuple[EngineNode, ...]) -> CompiledNode:
+        block_arg, index_arg, value_arg = args
+        value = self.compile(value_arg)
+        if not isinstance(block_arg, FunctionNode) and not isinstance(index_arg, FunctionNode):
+            try:
+                b, i = _ensure_int(block_arg), _ensure_int(index_arg)
+            except (AssertionError, ValueError, OverflowError, TypeError):
+                pass
+            else:
+                if i >= 0:
+
+                    def set_const(it):
+                        v = value(it)
+                        values = it.blocks[b]
+                        if i < len(values):
+                            values[i] = v
+                            return v
+                        return _write(it.blocks, b, i, v)
+
+                    return set_const
+        block, index = self.compile(block_arg), self.compile(index_arg)
+
+        def set_value(it):
+            b, i, v = block(it), index(it), value(it)
+            return _write(it.blocks, _ensure_int(b), _ensure_int(i), v)
+
+        return set_value
+
+    def _address(self, addressing: str, args: tuple[EngineNode, ...]) -> Callable[[Interpreter], tuple[int, int]]:
+        """Compile the address arguments of a pointed or stepping op into `(it) -> (block, index)`.
+
+        Each argument is passed through `ensure_int` right after it is evaluated.
+        """
+        fs = [self._int(arg) for arg in args]
+        match addressing:
+            case "":
+                block, index = fs
+
+                def address(it):
+                    b = block(it)
+                    return b, index(it)
+
+            case "Pointed":
+                block, index, offset = fs
+
+                def address(it):
+                    b = block(it)
+                    i = index(it)
+                    return _deref(it.blocks, b, i, offset(it))
+
+            case _:
+                block, offset, index, stride = fs
+
+                def address(it):
+                    b = block(it)
+                    o = offset(it)
+                    i = index(it)
+                    return b, o + i * stride(it)
+
+        return address
+
+    def _rmw(self, addressing: str, fn: Callable[[float, float], float], args: tuple[EngineNode, ...]) -> CompiledNode:
+        # Every argument, the value included, is evaluated before the address is checked.
+        *address, value = (self.compile(arg) for arg in args)
+
+        match addressing:
+            case "":
+                block, index = address
+
+                def rmw(it):
+                    b, i, v = block(it), index(it), value(it)
+                    b, i = _ensure_int(b), _ensure_int(i)
+                    blocks = it.blocks
+                    return _write(blocks, b, i, fn(_read(blocks, b, i), v))
+
+            case "Pointed":
+                block, index, offset = address
+
+                def rmw(it):
+                    b, i, o, v = block(it), index(it), offset(it), value(it)
+                    blocks = it.blocks
+                    b, i = _deref(blocks, _ensure_int(b), _ensure_int(i), _ensure_int(o))
+                    return _write(blocks, b, i, fn(_read(blocks, b, i), v))
+
+            case _:
+                block, offset, index, stride = address
+
+                def rmw(it):
+                    b, o, i, s, v = block(it), offset(it), index(it), stride(it), value(it)
+                    b, o, i, s = _ensure_int(b), _ensure_int(o), _ensure_int(i), _ensure_int(s)
+                    blocks = it.blocks
+                    addr = o + i * s
+                    return _write(blocks, b, addr, fn(_read(blocks, b, addr), v))
+
+        return rmw
+
+    def _step(self, addressing: str, fn: Callable[[float, int], float], returns_new: bool, args) -> CompiledNode:
+        address = self._address(addressing, args)
+
+        def step(it):
+            b, i = address(it)
+            blocks = it.blocks
+            old = _read(blocks, b, i)
+            new = fn(old, 1)
+            _write(blocks, b, i, new)
+            return new if returns_new else old
+
+        return step
+
+    def _copy(self, args: tuple[EngineNode, ...]) -> CompiledNode:
+        fs = [self._int(arg) for arg in args]
+
+        def copy(it):
+            src_id, src_index, dst_id, dst_index, count = (f(it) for f in fs)
+            assert count >= 0, "Count must be non-negative"
+            blocks = it.blocks
+            values = [_read(blocks, src_id, src_index + i) for i in range(count)]
+            for i, value in enumerate(values):
+                _write(blocks, dst_id, dst_index + i, value)
+            return 0.0
+
+        return copy
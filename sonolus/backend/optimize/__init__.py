@@ -8,11 +8,15 @@ lifting lives in the Cython `sonolus.backend._opt` package
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from sonolus.backend.mode import Mode
 from sonolus.backend.node import EngineNode
 from sonolus.backend.optimize.flow import BasicBlock
 
+if TYPE_CHECKING:
+    from sonolus.backend.optimize.cache import CompileCache, SharedNodes
+
 # NOTE: the compiled `_opt` modules (`driver`/`emit`) are imported lazily
 # inside the functions below, not at module top. `_opt.ir` imports
 # `sonolus.backend.optimize.flow`, which requires *this* package to initialize
@@ -86,16 +90,28 @@ def optimize_and_finalize(
     entry: BasicBlock,
     level: OptimizationLevel,
     config: OptimizerConfig | None = None,
+    *,
+    cache: CompileCache | None = None,
+    attribution: dict[int, list[int]] | None = None,
+    shared: SharedNodes | None = None,
 ) -> EngineNode:
     """Optimize `entry` at `level` and emit its `EngineNode` in one fused pass.
 
     Equivalent to `cfg_to_engine_node(run_passes(entry, level, config))` but
-    without the intermediate `BasicBlock` export/re-import.
+    without the intermediate `BasicBlock` export/re-import. With a `cache`, a
+    callback whose marshalled arena was optimized before is served from it, and
+    with a `shared` table, so is one whose arena was optimized earlier in the build.
+    With an `attribution` dict, both are bypassed and the dict is filled with
+    the node counts per source location (see `sonolus.build.report.attribute_node`)
+    if `entry` carries statement locations. `entry` may also be an arena the frontend
+    traced straight into (see `sonolus.build.compile.callback_to_arena`).
     """
     from sonolus.backend._opt import driver
 
     config = config or OptimizerConfig()
-    return driver.optimize_and_finalize_cfg(entry, _level_name(level), config.mode, config.callback)
+    return driver.optimize_and_finalize_cfg(
+        entry, _level_name(level), config.mode, config.callback, cache, attribution, shared
+    )
 
 
 def cfg_to_engine_node(entry: BasicBlock) -> EngineNode:
@@ -0,0 +1,215 @@
+"""Persistent, content-addressed cache of optimized callbacks.
+
+An entry maps a key -- a hash of the marshalled arena (`Func.digest()`), the
+optimization level, the mode, the callback name, and a fingerprint of the
+optimizer itself -- to the emitted `EngineNode` of that callback. A hit skips the
+whole optimizer pipeline and emit; only frontend tracing and marshal-in still run.
+
+Entries are one file each under the cache directory (e.g. `build/.cache/opt/`),
+written atomically, so concurrent builds and the `jobs > 1` thread pool can share
+a directory. Recency is the file mtime (bumped on every hit); `prune()` evicts the
+least recently used entries until the directory fits within `max_bytes`.
+
+Nodes are stored as a flat table (`encode_node` / `decode_node`): each distinct
+node once, children before parents, function nodes as `(op index, *child
+indices)`. Shared subtrees stay shared when the tree is rebuilt.
+
+`SharedNodes` is the in-memory counterpart for a single build: it lets callbacks
+of different modes (or archetypes) that trace to the same arena share one
+optimization, with or without the persistent cache.
+"""
+
+from __future__ import annotations
+
+import marshal
+import os
+import sys
+from contextlib import suppress
+from hashlib import blake2b
+from pathlib import Path
+from threading import Lock
+
+from sonolus.backend.node import EngineNode, FunctionNode
+from sonolus.backend.ops import Op
+from sonolus.backend.optimize import profiling
+
+# Bump when the entry format or key derivation changes.
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_OPS = list(Op)
+_OP_INDEX = {op: i for i, op in enumerate(_OPS)}
+_ENTRY_SUFFIX = ".node"
+
+_fingerprint: str | None = None
+
+
+def optimizer_fingerprint() -> str:
+    """Return a fingerprint of the optimizer build, folded into every cache key.
+
+    Combines the cache format, the Python version (for `marshal`), the op table,
+    and the size and mtime of each compiled optimizer module, so rebuilding the
+    extension or upgrading the package invalidates every entry.
+    """
+    global _fingerprint  # noqa: PLW0603
+    if _fingerprint is None:
+        from sonolus.backend._opt import analysis, driver, emit, ir, kernels, lower, midend
+
+        h = blake2b(digest_size=16)
+        h.update(f"{CACHE_FORMAT_VERSION}:{sys.version_info[:2]}:{','.join(op.name for op in _OPS)}".encode())
+        for module in (analysis, driver, emit, ir, kernels, lower, midend):
+            stat = Path(module.__file__).stat()
+            h.update(f"{module.__name__}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        _fingerprint = h.hexdigest()
+    return _fingerprint
+
+
+def encode_node(node: EngineNode) -> bytes:
+    """Serialize an `EngineNode` tree into the compact flat-table form."""
+    table = []
+    index_of: dict[int, int] = {}
+    # Iterative post-order walk; `index_of` is keyed by identity because emitted
+    # trees are hash-consed, so identity matches structural sharing.
+    stack = [(node, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if id(current) in index_of:
+            continue
+        if not isinstance(current, FunctionNode):
+            index_of[id(current)] = len(table)
+            table.append(current)
+        elif expanded:
+            index_of[id(current)] = len(table)
+            table.append((_OP_INDEX[current.func], *(index_of[id(arg)] for arg in current.args)))
+        else:
+            stack.append((current, True))
+            stack.extend((arg, False) for arg in reversed(current.args))
+    return marshal.dumps(table)
+
+
+def decode_node(data: bytes) -> EngineNode:
+    """Rebuild an `EngineNode` tree from `encode_node` output."""
+    nodes = []
+    for entry in marshal.loads(data):
+        if isinstance(entry, tuple):
+            nodes.append(FunctionNode(_OPS[entry[0]], tuple(nodes[i] for i in entry[1:])))
+        else:
+            nodes.append(entry)
+    return nodes[-1]
+
+
+class CompileCache:
+    """An on-disk cache of optimized callback nodes.
+
+    Args:
+        path: The cache directory. Created on first write.
+        max_bytes: The size the directory is pruned down to by `prune()`.
+    """
+
+    def __init__(self, path: os.PathLike | str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def key(self, digest: str, level: str, mode: object, callback: str | None) -> str:
+        """Derive the cache key of one callback from its arena digest and compile settings."""
+        h = blake2b(digest_size=20)
+        h.update(f"{optimizer_fingerprint()}\0{level}\0{getattr(mode, 'name', mode)}\0{callback}\0".encode())
+        h.update(digest.encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> EngineNode | None:
+        """Return the cached node for `key`, or None on a miss."""
+        path = self.path / f"{key}{_ENTRY_SUFFIX}"
+        try:
+            data = path.read_bytes()
+            node = decode_node(data)
+        except (OSError, ValueError, EOFError, TypeError, IndexError):
+            # Missing, concurrently evicted, or corrupt (e.g. a truncated write from
+            # a killed build): treat as a miss, and the entry is simply rewritten.
+            self._count(hit=False)
+            return None
+        with suppress(OSError):
+            os.utime(path)
+        self._count(hit=True)
+        return node
+
+    def put(self, key: str, node: EngineNode) -> None:
+        """Store `node` under `key`. Failures to write are ignored."""
+        path = self.path / f"{key}{_ENTRY_SUFFIX}"
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{id(node)}.tmp")
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(encode_node(node))
+            tmp_path.replace(path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def prune(self) -> None:
+        """Evict least recently used entries until the cache fits within `max_bytes`."""
+        try:
+            entries = [
+                (stat.st_mtime_ns, stat.st_size, entry)
+                for entry in self.path.iterdir()
+                if entry.suffix == _ENTRY_SUFFIX and (stat := entry.stat())
+            ]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        entries.sort(key=lambda item: item[0])
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if profiling.enabled:
+            profiling.count("opt_cache_hit" if hit else "opt_cache_miss")
+
+
+class SharedNodes:
+    """The callback nodes optimized so far in one build, for reuse by callbacks that trace to the same arena.
+
+    Play, watch, and preview archetypes often share drawing and layout code or whole callbacks, which then trace to
+    equal arenas. Unlike `CompileCache`, entries are keyed by the arena digest and the optimization level only, not
+    the mode or callback name: what those decide for the optimizer -- which blocks the callback may write and which
+    reads are runtime constants -- is resolved at marshal-in into flags on the places of the arena, so it is part of
+    the digest, and arenas with equal digests optimize to equal nodes.
+    """
+
+    def __init__(self):
+        self.nodes: dict[tuple[str, str], EngineNode] = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def key(self, digest: str, level: str) -> tuple[str, str]:
+        """Derive the key of one callback from its arena digest and optimization level."""
+        return digest, level
+
+    def get(self, key: tuple[str, str]) -> EngineNode | None:
+        """Return the node optimized earlier in the build for `key`, or None."""
+        node = self.nodes.get(key)
+        with self._lock:
+            if node is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if profiling.enabled:
+            profiling.count("shared_node_miss" if node is None else "shared_node_hit")
+        return node
+
+    def put(self, key: tuple[str, str], node: EngineNode) -> None:
+        """Store `node` under `key`, keeping the first node stored under it."""
+        self.nodes.setdefault(key, node)
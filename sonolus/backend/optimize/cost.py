@@ -0,0 +1,468 @@
+"""Static estimate of the runtime cost of an emitted callback.
+
+`estimate_cost` returns the expected number of nodes the runtime evaluates per call
+of a callback, each weighted by its op (`CostModel.op_weights`). With unit weights
+and no branches or loops it is exactly the node count an interpreter run reports.
+
+The estimate walks the emitted node, so it sees what the runtime executes, after the
+optimizer has folded every branch and loop bound it could prove constant. A
+callback's `Block(JumpLoop(...))` skeleton is rebuilt into a control-flow graph and
+each block weighted by its expected execution frequency (Wu & Larus, "Static Branch
+Frequency and Program Profile Analysis"):
+
+- Branches with a constant test take that arm; other branches split evenly.
+- The edges that leave a loop are taken once per `trip + 1` visits of its blocks,
+  where `trip` is the loop's trip count: the number of iterations of a counter loop
+  (a constant start in the preheader, a single constant step, and a header test
+  against a constant), or `CostModel.loop_trip_count` otherwise.
+- Frequencies are propagated through each loop from the innermost outwards; a loop
+  header's frequency is scaled by `1 / (1 - p)`, where `p` is the probability of
+  returning to it.
+
+Within an expression, each arm of an `If` or `Switch*` is equally likely, every
+`And`/`Or` operand is evaluated with half the probability of the one before it, and
+`While`/`DoWhile` loops run `CostModel.loop_trip_count` times.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from operator import ge, gt, le, lt, ne
+
+from sonolus.backend.node import EngineNode, FunctionNode
+from sonolus.backend.ops import Op
+
+# Relative weights of the ops that cost more than a node evaluation: runtime
+# functions that render, play audio, or touch the level, and the heavier math.
+DEFAULT_OP_WEIGHTS: Mapping[Op, float] = {
+    **dict.fromkeys(
+        (
+            Op.Draw,
+            Op.DrawCurvedB,
+            Op.DrawCurvedBT,
+            Op.DrawCurvedL,
+            Op.DrawCurvedLR,
+            Op.DrawCurvedR,
+            Op.DrawCurvedT,
+            Op.Paint,
+            Op.Spawn,
+            Op.SpawnParticleEffect,
+            Op.MoveParticleEffect,
+        ),
+        8.0,
+    ),
+    **dict.fromkeys((Op.Play, Op.PlayLooped, Op.PlayLoopedScheduled, Op.PlayScheduled), 4.0),
+    **dict.fromkeys((Op.StopLooped, Op.StopLoopedScheduled, Op.DestroyParticleEffect), 2.0),
+    **dict.fromkeys((Op.StreamGetNextKey, Op.StreamGetPreviousKey, Op.StreamGetValue, Op.StreamHas), 4.0),
+    Op.StreamSet: 2.0,
+    **dict.fromkeys(
+        (
+            *(op for op in Op if op.name.startswith("Ease")),
+            Op.Sin,
+            Op.Cos,
+            Op.Tan,
+            Op.Sinh,
+            Op.Cosh,
+            Op.Tanh,
+            Op.Arcsin,
+            Op.Arccos,
+            Op.Arctan,
+            Op.Arctan2,
+            Op.Power,
+            Op.Log,
+            Op.Judge,
+            Op.JudgeSimple,
+        ),
+        2.0,
+    ),
+    Op.Print: 4.0,
+    Op.DebugLog: 2.0,
+}
+
+# Counter loops with more iterations than this are costed with the default trip count.
+MAX_TRIP_COUNT = 1 << 16
+
+
+@dataclass(frozen=True)
+class CostModel:
+    """The parameters of `estimate_cost`."""
+
+    loop_trip_count: float = 8
+    """The number of iterations assumed for a loop whose trip count is not known statically."""
+
+    op_weights: Mapping[Op | str, float] = field(default_factory=dict)
+    """Weights of ops (or op names), overriding `DEFAULT_OP_WEIGHTS`; ops not in either weigh 1."""
+
+    def weights(self) -> dict[Op, float]:
+        """Return the weight of every op that does not weigh 1."""
+        return {
+            **DEFAULT_OP_WEIGHTS,
+            **{Op[op] if isinstance(op, str) else op: weight for op, weight in self.op_weights.items()},
+        }
+
+
+_SWITCHES = frozenset({Op.Switch, Op.SwitchWithDefault, Op.SwitchInteger, Op.SwitchIntegerWithDefault})
+_COMPARISONS = {Op.Less: lt, Op.LessOr: le, Op.Greater: gt, Op.GreaterOr: ge, Op.NotEqual: ne}
+_STEPS = {Op.IncrementPost: 1, Op.IncrementPre: 1, Op.DecrementPost: -1, Op.DecrementPre: -1}
+_WRITES = frozenset(op for op in Op if op.name.startswith(("Set", "Increment", "Decrement")) or op is Op.Copy)
+
+
+def estimate_cost(node: EngineNode, model: CostModel | None = None) -> float:
+    """Return the expected weighted number of nodes evaluated per call of `node`; see the module docstring."""
+    return _Estimator(model or CostModel()).cost(node)
+
+
+def _is_value(node) -> bool:
+    return not isinstance(node, FunctionNode)
+
+
+def _switch_arms(node: FunctionNode) -> tuple[list, list]:
+    """Return the `(cases, arms)` of a `Switch*` node, the default last among the arms."""
+    args = node.args[1:]
+    match node.func:
+        case Op.Switch:
+            return list(args[0::2]), list(args[1::2])
+        case Op.SwitchWithDefault:
+            return list(args[:-1:2]), [*args[1:-1:2], args[-1]]
+        case _:
+            return [], list(args)
+
+
+class _Estimator:
+    def __init__(self, model: CostModel):
+        self.trip = float(model.loop_trip_count)
+        self.weights = model.weights()
+        # id(node) -> expected cost; nodes are kept alive by the tree being costed.
+        self.costs: dict[int, float] = {}
+
+    def weight(self, op: Op) -> float:
+        return self.weights.get(op, 1.0)
+
+    def cost(self, node) -> float:
+        if _is_value(node):
+            return 0.0
+        key = id(node)
+        result = self.costs.get(key)
+        if result is None:
+            result = self.costs[key] = self._cost(node)
+        return result
+
+    def _cost(self, node: FunctionNode) -> float:
+        op = node.func
+        args = node.args
+        weight = self.weight(op)
+        match op:
+            case Op.If:
+                test, then, otherwise = args
+                if _is_value(test):
+                    return weight + self.cost(then if test != 0 else otherwise)
+                return weight + self.cost(test) + (self.cost(then) + self.cost(otherwise)) / 2
+            case op if op in _SWITCHES:
+                cases, arms = _switch_arms(node)
+                return (
+                    weight
+                    + self.cost(args[0])
+                    + sum(self.cost(case) for case in cases)
+                    + (sum(self.cost(arm) for arm in arms) / len(arms) if arms else 0.0)
+                )
+            case Op.And | Op.Or:
+                return weight + sum(self.cost(arg) * 0.5**i for i, arg in enumerate(args))
+            case Op.While:
+                test, body = args
+                return weight + (self.trip + 1) * self.cost(test) + self.trip * self.cost(body)
+            case Op.DoWhile:
+                body, test = args
+                return weight + self.trip * (self.cost(body) + self.cost(test))
+            case Op.Execute | Op.Execute0:
+                total = weight
+                for arg in args:
+                    total += self.cost(arg)
+                    if isinstance(arg, FunctionNode) and arg.func is Op.Break:
+                        break
+                return total
+            case Op.JumpLoop:
+                return weight + _Graph(self, args).cost()
+            case _:
+                return weight + sum(self.cost(arg) for arg in args)
+
+
+class _Graph:
+    """The blocks of a `JumpLoop`, with their expected frequencies per evaluation of it."""
+
+    def __init__(self, estimator: _Estimator, blocks: tuple):
+        self.estimator = estimator
+        self.nodes = blocks[:-1]
+        self.exit_node = blocks[-1]
+        self.exit = len(self.nodes)
+        self.statements: list[tuple] = []
+        self.terminators: list = []
+        # Block -> [(successor, probability)], where `self.exit` leaves the loop.
+        self.successors: list[list[tuple[int, float]]] = []
+        for block in self.nodes:
+            if isinstance(block, FunctionNode) and block.func is Op.Execute and block.args:
+                statements, terminator = block.args[:-1], block.args[-1]
+            else:
+                statements, terminator = (), block
+            self.statements.append(statements)
+            self.terminators.append(terminator)
+            self.successors.append(self._targets(statements, terminator))
+
+    def _target(self, node) -> int | None:
+        if not _is_value(node) or not (0 <= node <= self.exit) or int(node) != node:
+            return None
+        return int(node)
+
+    def _targets(self, statements: tuple, terminator) -> list[tuple[int, float]]:
+        """Return the successors of a block, each arm of its terminator equally likely."""
+        if any(isinstance(statement, FunctionNode) and statement.func is Op.Break for statement in statements):
+            return []
+        if _is_value(terminator):
+            arms = [terminator]
+        elif terminator.func is Op.If and _is_value(terminator.args[0]):
+            arms = [terminator.args[1] if terminator.args[0] != 0 else terminator.args[2]]
+        elif terminator.func is Op.If:
+            arms = list(terminator.args[1:])
+        elif terminator.func in _SWITCHES:
+            arms = _switch_arms(terminator)[1]
+        else:
+            return []
+        targets = [self._target(arm) for arm in arms]
+        if not targets or None in targets:
+            # Not a jump to a constant block index: the JumpLoop ends with this value.
+            return []
+        result: dict[int, float] = {}
+        for target in targets:
+            result[target] = result.get(target, 0.0) + 1 / len(targets)
+        return list(result.items())
+
+    def block_cost(self, index: int) -> float:
+        estimator = self.estimator
+        node = self.nodes[index]
+        terminator = self.terminators[index]
+        total = 0.0
+        if isinstance(node, FunctionNode) and node is not terminator:
+            total += estimator.weight(node.func)
+        for statement in self.statements[index]:
+            total += estimator.cost(statement)
+            if isinstance(statement, FunctionNode) and statement.func is Op.Break:
+                return total
+        if isinstance(terminator, FunctionNode) and self.successors[index]:
+            # The arms are block indexes; only the terminator and its test are evaluated.
+            total += estimator.weight(terminator.func) + estimator.cost(terminator.args[0])
+        else:
+            total += estimator.cost(terminator)
+        return total
+
+    def cost(self) -> float:
+        if not self.nodes:
+            return self.estimator.cost(self.exit_node)
+        frequencies = self.frequencies()
+        total = sum(frequency * self.block_cost(index) for index, frequency in enumerate(frequencies))
+        exits = sum(
+            frequencies[index] * probability
+            for index, successors in enumerate(self.successors)
+            for successor, probability in successors
+            if successor == self.exit
+        )
+        return total + exits * self.estimator.cost(self.exit_node)
+
+    def frequencies(self) -> list[float]:
+        count = self.exit
+        succs = [[s for s, _ in successors if s != self.exit] for successors in self.successors]
+        preds: list[list[int]] = [[] for _ in range(count)]
+        for index, successors in enumerate(succs):
+            for successor in successors:
+                preds[successor].append(index)
+
+        # Depth-first order from the entry: reverse postorder and back edges.
+        order: list[int] = []
+        back_edges: set[tuple[int, int]] = set()
+        state = [0] * count  # 0: unvisited, 1: on the stack, 2: done
+        state[0] = 1
+        stack = [(0, iter(succs[0]))]
+        while stack:
+            index, successors = stack[-1]
+            for successor in successors:
+                if state[successor] == 0:
+                    state[successor] = 1
+                    stack.append((successor, iter(succs[successor])))
+                    break
+                if state[successor] == 1:
+                    back_edges.add((index, successor))
+            else:
+                stack.pop()
+                state[index] = 2
+                order.append(index)
+        order.reverse()
+        rank = {index: i for i, index in enumerate(order)}
+
+        # Natural loops, one per header, from the innermost (smallest) out.
+        loops: dict[int, set[int]] = {}
+        for latch, header in back_edges:
+            body = loops.setdefault(header, {header})
+            work = [latch]
+            while work:
+                index = work.pop()
+                if index not in body and index in rank:
+                    body.add(index)
+                    work.extend(preds[index])
+        nested = sorted(loops.items(), key=lambda item: len(item[1]))
+        innermost: dict[int, int] = {}
+        for header, body in nested:
+            for index in body:
+                innermost.setdefault(index, header)
+
+        probabilities = self._probabilities(loops, innermost)
+        # (latch, header) -> probability of taking the back edge per visit of the header.
+        back_probability: dict[tuple[int, int], float] = {}
+        frequency = [0.0] * count
+
+        def propagate(header: int, body: set[int] | None) -> None:
+            for index in order:
+                if body is not None and index not in body:
+                    continue
+                if index == header:
+                    frequency[index] = 1.0
+                else:
+                    frequency[index] = sum(
+                        frequency[pred] * probabilities[pred].get(index, 0.0)
+                        for pred in preds[index]
+                        if (pred, index) not in back_edges and (body is None or pred in body) and pred in rank
+                    )
+                if index in loops and index != header:
+                    cyclic = sum(back_probability.get((pred, index), 0.0) for pred in preds[index])
+                    scale = 1 / (1 - cyclic) if cyclic < 1 - 1e-9 else self.estimator.trip + 1
+                    frequency[index] *= scale
+                for successor, probability in probabilities[index].items():
+                    if successor == header and (index, header) in back_edges:
+                        back_probability[index, header] = frequency[index] * probability
+
+        for header, body in nested:
+            propagate(header, body)
+        propagate(0, None)
+        if 0 in loops:
+            cyclic = sum(back_probability.get((pred, 0), 0.0) for pred in preds[0])
+            scale = 1 / (1 - cyclic) if cyclic < 1 - 1e-9 else self.estimator.trip + 1
+            frequency = [value * scale for value in frequency]
+        return frequency
+
+    def _probabilities(self, loops: dict[int, set[int]], innermost: dict[int, int]) -> list[dict[int, float]]:
+        """Return the branch probabilities of every block, with loop exits taken once per trip."""
+        result = []
+        for index, successors in enumerate(self.successors):
+            header = innermost.get(index)
+            exits = [(s, p) for s, p in successors if header is not None and s not in loops[header]]
+            stays = [(s, p) for s, p in successors if header is None or s in loops[header]]
+            if not exits or not stays:
+                result.append(dict(successors))
+                continue
+            trip = self._trip_count(header, loops[header]) if index == header else None
+            trip = self.estimator.trip if trip is None else trip
+            exit_share = 1 / (trip + 1)
+            exit_total = sum(p for _, p in exits)
+            stay_total = sum(p for _, p in stays)
+            probabilities = {s: exit_share * p / exit_total for s, p in exits}
+            for s, p in stays:
+                probabilities[s] = probabilities.get(s, 0.0) + (1 - exit_share) * p / stay_total
+            result.append(probabilities)
+        return result
+
+    def _trip_count(self, header: int, body: set[int]) -> float | None:
+        """Return the iterations of a counter loop tested in its `header`, or None if not one."""
+        terminator = self.terminators[header]
+        if not (isinstance(terminator, FunctionNode) and terminator.func is Op.If):
+            return None
+        test, then, _ = terminator.args
+        if not isinstance(test, FunctionNode) or test.func not in _COMPARISONS:
+            return None
+        compare = _COMPARISONS[test.func]
+        counter, bound = test.args
+        if _is_value(counter) and not _is_value(bound):
+            # `bound < counter` tests the counter from the other side.
+            counter, bound = bound, counter
+            compare = {lt: gt, le: ge, gt: lt, ge: le, ne: ne}[compare]
+        if not (
+            isinstance(counter, FunctionNode)
+            and counter.func is Op.Get
+            and all(_is_value(arg) for arg in counter.args)
+            and _is_value(bound)
+        ):
+            return None
+        place = counter.args
+        steps = [step for index in body for step in self._writes(index, place)]
+        if len(steps) != 1 or steps[0] is None:
+            return None
+        outside = [
+            pred for pred, successors in enumerate(self.successors) if pred not in body and header in dict(successors)
+        ]
+        if len(outside) != 1:
+            return None
+        starts = list(self._writes(outside[0], place))
+        if not starts or not isinstance(starts[-1], tuple):
+            return None
+        value = starts[-1][0]
+        stays_on = self._target(then) in body
+        trip = 0
+        while compare(value, bound) == stays_on:
+            if trip >= MAX_TRIP_COUNT or not math.isfinite(value):
+                return None
+            value += steps[0]
+            trip += 1
+        return trip
+
+    def _writes(self, index: int, place: tuple):
+        """Yield each write of a block to the memory cell `place`.
+
+        A constant step is yielded as a number, a constant store as a one-tuple, and any
+        other write, or one that could reach `place` indirectly, as None.
+        """
+        block = place[0]
+        for statement in self.statements[index]:
+            for node in _walk(statement):
+                op = node.func
+                if op not in _WRITES:
+                    continue
+                if op.name.endswith("Pointed"):
+                    # The target block and index are read from memory.
+                    yield None
+                    continue
+                if op is Op.Copy or op.name.endswith("Shifted"):
+                    target_block = node.args[2] if op is Op.Copy else node.args[0]
+                    if not _is_value(target_block) or target_block == block:
+                        yield None
+                    continue
+                target = node.args[:2]
+                if not all(_is_value(arg) for arg in target):
+                    if not _is_value(target[0]) or target[0] == block:
+                        yield None
+                    continue
+                if tuple(target) != tuple(place):
+                    continue
+                value = node.args[2] if len(node.args) > 2 else None
+                if op in _STEPS:
+                    yield _STEPS[op]
+                elif op is Op.Set and _is_value(value):
+                    yield (value,)
+                elif op in {Op.SetAdd, Op.SetSubtract} and _is_value(value):
+                    yield value if op is Op.SetAdd else -value
+                elif (
+                    op is Op.Set
+                    and value.func in {Op.Add, Op.Subtract}
+                    and len(value.args) == 2
+                    and value.args[0] == FunctionNode(Op.Get, tuple(place))
+                    and _is_value(value.args[1])
+                ):
+                    yield value.args[1] if value.func is Op.Add else -value.args[1]
+                else:
+                    yield None
+
+
+def _walk(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, FunctionNode):
+            yield node
+            stack.extend(node.args)
@@ -25,6 +25,8 @@ class BasicBlock:
     test: IRExpr
     incoming: set[FlowEdge]
     outgoing: set[FlowEdge]
+    # Source location id per statement, set only while attributing nodes to source lines.
+    statement_locs: list[int] | None = None
 
     def __init__(
         self,
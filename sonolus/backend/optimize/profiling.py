@@ -10,21 +10,46 @@ Zero cost when disabled: the instrumented hot paths check `enabled` and skip
 the timing calls entirely.
 
 The accumulator is process-global; it is never touched from a nogil region (all
-recording happens at the GIL-held Python/marshal boundaries), and builds are
-serial, so no locking is needed. Call `reset()` before a build to measure just
-that build.
+recording happens at the GIL-held Python/marshal boundaries). Callbacks may be
+optimized on several threads (`BuildConfig.jobs`), so `record` takes a lock;
+stage totals then sum the time spent on every thread rather than wall time.
+Event counters (`count`, e.g. compile-cache hits and misses) are reported next
+to the stages. Call `reset()` before a build to measure just that build.
+
+`enable_trace()` (the CLI `--profile-trace` flag) additionally keeps every
+recorded sample as a timeline event, tagged with the thread and process that
+recorded it and with the mode, archetype and callback of the enclosing
+`callback_scope`. `write_trace` saves them in the Chrome trace-event format,
+which Perfetto and `chrome://tracing` open directly. Events recorded in worker
+processes are shipped back with `take_events` / `add_events`, and
+`callback_totals` sums them per callback for the build report (`--report`).
 """
 
 from __future__ import annotations
 
+import json
 import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
 from time import perf_counter_ns
 
 enabled: bool = os.environ.get("SONOLUS_OPT_PROFILE") == "1"
+tracing: bool = False
 
 # stage name -> [total_ns, call_count]. Insertion order is preserved for stable
 # reporting; it reflects first-touch order, not hash order.
 _stages: dict[str, list[int]] = {}
+# counter name -> count, in first-touch order.
+_counters: dict[str, int] = {}
+# Timeline events: (name, category, start_ns, duration_ns, pid, tid, args).
+_events: list[tuple[str, str, int, int, int, int, dict[str, str] | None]] = []
+# (pid, tid) -> thread name, for the trace's track labels.
+_threads: dict[tuple[int, int], str] = {}
+_lock = Lock()
+# Per-thread args of the innermost `callback_scope`.
+_scope = threading.local()
 
 
 def enable() -> None:
@@ -33,9 +58,19 @@ def enable() -> None:
     enabled = True
 
 
+def enable_trace() -> None:
+    """Turn profiling and timeline event recording on (the CLI `--profile-trace` flag)."""
+    global tracing  # noqa: PLW0603
+    enable()
+    tracing = True
+
+
 def reset() -> None:
-    """Clear all accumulated stage timings."""
+    """Clear all accumulated stage timings, counters, and timeline events."""
     _stages.clear()
+    _counters.clear()
+    _events.clear()
+    _threads.clear()
 
 
 def now_ns() -> int:
@@ -44,13 +79,86 @@ def now_ns() -> int:
 
 
 def record(name: str, ns: int) -> None:
-    """Add a `ns`-nanosecond sample to stage `name`."""
-    entry = _stages.get(name)
-    if entry is None:
-        _stages[name] = [ns, 1]
-    else:
-        entry[0] += ns
-        entry[1] += 1
+    """Add a `ns`-nanosecond sample, ending now, to stage `name`."""
+    with _lock:
+        entry = _stages.get(name)
+        if entry is None:
+            _stages[name] = [ns, 1]
+        else:
+            entry[0] += ns
+            entry[1] += 1
+    if tracing:
+        _add_event(name, "stage", perf_counter_ns() - ns, ns, getattr(_scope, "args", None))
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add `n` to counter `name`."""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+@contextmanager
+def callback_scope(mode: object, archetype: str | None, callback: str):
+    """Attribute the samples recorded on this thread to one callback.
+
+    While tracing, the scope itself is recorded as a `callback` event spanning the
+    stage events it encloses. A no-op otherwise.
+    """
+    if not tracing:
+        yield
+        return
+    args = {"mode": getattr(mode, "name", str(mode)), "callback": callback}
+    if archetype is not None:
+        args["archetype"] = archetype
+    outer = getattr(_scope, "args", None)
+    _scope.args = args
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        _scope.args = outer
+        label = callback if archetype is None else f"{archetype}.{callback}"
+        _add_event(label, "callback", start, perf_counter_ns() - start, args)
+
+
+@contextmanager
+def span(name: str, category: str = "build"):
+    """Record the enclosed block as one timeline event while tracing (e.g. a whole mode)."""
+    if not tracing:
+        yield
+        return
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        _add_event(name, category, start, perf_counter_ns() - start, getattr(_scope, "args", None))
+
+
+def _add_event(name: str, category: str, start: int, duration: int, args: dict[str, str] | None) -> None:
+    thread = threading.current_thread()
+    key = (os.getpid(), thread.native_id or 0)
+    with _lock:
+        _events.append((name, category, start, duration, *key, args))
+        if key not in _threads:
+            _threads[key] = thread.name
+
+
+def take_events() -> list:
+    """Remove and return the recorded timeline events with their thread names (picklable)."""
+    with _lock:
+        taken = [list(_events), dict(_threads)]
+        _events.clear()
+        _threads.clear()
+    return taken
+
+
+def add_events(taken: list) -> None:
+    """Merge events returned by `take_events` in another process."""
+    events, threads = taken
+    with _lock:
+        _events.extend(events)
+        for key, name in threads.items():
+            _threads.setdefault(key, name)
 
 
 def snapshot() -> dict[str, dict[str, int]]:
@@ -59,10 +167,66 @@ def snapshot() -> dict[str, dict[str, int]]:
 
 
 def summary() -> dict:
-    """Return the full profile: per-stage totals plus the summed stage time."""
+    """Return the full profile: per-stage totals, the summed stage time, and the counters."""
     stages = snapshot()
     total_ns = sum(entry["total_ns"] for entry in stages.values())
-    return {"stages": stages, "total_ns": total_ns}
+    return {"stages": stages, "total_ns": total_ns, "counters": dict(_counters)}
+
+
+def callback_totals() -> dict[tuple[str, str | None, str], dict[str, int]]:
+    """Sum the traced stage samples per callback: `{(mode, archetype, callback): {stage: total_ns}}`.
+
+    Only samples recorded inside a `callback_scope` while tracing are counted.
+    """
+    totals: dict[tuple[str, str | None, str], dict[str, int]] = {}
+    with _lock:
+        events = list(_events)
+    for name, category, _, duration, _, _, args in events:
+        if category != "stage" or not args:
+            continue
+        stages = totals.setdefault((args["mode"], args.get("archetype"), args["callback"]), {})
+        stages[name] = stages.get(name, 0) + duration
+    return totals
+
+
+def trace_events() -> list[dict]:
+    """Return the timeline as Chrome trace-event dicts (timestamps in microseconds).
+
+    Every sample becomes a complete (`"ph": "X"`) event on the track of the thread
+    that recorded it; metadata events name the tracks. Timestamps are relative to
+    the earliest event.
+    """
+    with _lock:
+        events = sorted(_events, key=lambda e: (e[2], -e[3]))
+        threads = dict(_threads)
+    origin = events[0][2] if events else 0
+    main_pid = os.getpid()
+    result: list[dict] = []
+    for pid in sorted({pid for pid, _ in threads}):
+        name = "sonolus-py" if pid == main_pid else f"worker {pid}"
+        result.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}})
+    for (pid, tid), name in sorted(threads.items()):
+        result.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+    for name, category, start, duration, pid, tid, args in events:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - origin) / 1000,
+            "dur": duration / 1000,
+            "pid": pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        result.append(event)
+    return result
+
+
+def write_trace(path: str | os.PathLike) -> None:
+    """Write the timeline to `path` as Chrome trace-event JSON."""
+    data = {"traceEvents": trace_events(), "displayTimeUnit": "ms"}
+    Path(path).write_text(json.dumps(data), encoding="utf-8")
 
 
 def format_text() -> str:
@@ -77,4 +241,7 @@ def format_text() -> str:
         ms = entry["total_ns"] / 1_000_000
         share = 100 * entry["total_ns"] / total
         lines.append(f"  {name:<16}{ms:>8.1f}ms{share:>7.1f}%{entry['count']:>9}")
+    if _counters:
+        lines.append(f"  {'counter':<16}{'count':>10}")
+        lines.extend(f"  {name:<16}{value:>10}" for name, value in _counters.items())
     return "\n".join(lines)
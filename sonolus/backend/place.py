@@ -169,6 +169,12 @@ class SSAPlace:
 
 
 PREALLOCATED_TEMP_PLACE_COUNT = 16384
-preallocated_temp_block_places: list[BlockPlace] = [
-    BlockPlace(TempBlock(f"v{i}", 1), 0) for i in range(PREALLOCATED_TEMP_PLACE_COUNT)
-]
+# Filled in as the places are first used rather than at import, which most of the places never are.
+preallocated_temp_block_places: list[BlockPlace] = []
+
+
+def preallocate_temp_block_places(count: int):
+    """Make sure the first `count` entries of `preallocated_temp_block_places` exist."""
+    places = preallocated_temp_block_places
+    for i in range(len(places), count):
+        places.append(BlockPlace(TempBlock(f"v{i}", 1), 0))
@@ -0,0 +1,239 @@
+"""Runtime op profiling: what the nodes a callback executes do, per op and per memory cell.
+
+An `Interpreter` given a `RuntimeProfile` counts every function node it evaluates by
+op, and every memory cell read or written by an op, under the label of the running
+callback (see `RuntimeProfile.begin`). `Interpreter.run` and closures compiled with
+`compile_node(..., profile=True)` report the same counts. `PlaySimulator.run` labels
+the callbacks it runs `"<archetype>.<callback>"`.
+
+`RuntimeProfile.to_dict` exports the counts as JSON-compatible data, and `format_text`
+and `format_heatmap` render that data for the terminal; the op names are those of the
+static `per_op_counts` of `tools/metrics.py` and `sonolus-py build --report`.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+
+from sonolus.backend.interpret import Memory
+from sonolus.backend.ops import Op
+
+# Label of the counts made before the first `RuntimeProfile.begin`.
+UNLABELLED = "<unlabelled>"
+
+# Blocks `format_heatmap` draws by default: the memory entities and levels keep state in.
+HEATMAP_BLOCKS = ("EntityMemory", "EntitySharedMemory", "LevelMemory")
+
+# Cells per heatmap row, and the glyphs for increasing access counts (a blank is none).
+_HEATMAP_WIDTH = 32
+_HEATMAP_GLYPHS = ".:-=+*#%@"
+
+
+class RuntimeProfile:
+    """Op and memory access counts of the callbacks an interpreter ran, by callback label.
+
+    `ops`, `reads`, and `writes` map each label to its counts by op and by
+    `(block, index)`; `calls` counts the `begin` calls of each label.
+    """
+
+    calls: dict[str, int]
+    ops: dict[str, Counter[Op]]
+    reads: dict[str, Counter[tuple[int, int]]]
+    writes: dict[str, Counter[tuple[int, int]]]
+
+    def __init__(self):
+        self.calls = {}
+        self.ops = {}
+        self.reads = {}
+        self.writes = {}
+        self._select(UNLABELLED)
+
+    def begin(self, label: str) -> None:
+        """Count what runs from now on, until the next `begin`, as one call of `label`."""
+        self.calls[label] = self.calls.get(label, 0) + 1
+        self._select(label)
+
+    def _select(self, label: str) -> None:
+        if label not in self.ops:
+            self.ops[label] = Counter()
+            self.reads[label] = Counter()
+            self.writes[label] = Counter()
+        # The counters of the running callback, updated by the interpreter and `ProfiledMemory`.
+        self.current_ops = self.ops[label]
+        self.current_reads = self.reads[label]
+        self.current_writes = self.writes[label]
+
+    def memory(self, sizes: Mapping[int, int] | None = None, fill: float = -1.0) -> ProfiledMemory:
+        """Return interpreter memory that counts its accesses in this profile."""
+        return ProfiledMemory(self, sizes, fill)
+
+    def labels(self) -> list[str]:
+        """Return the labels with any counts, most nodes executed first."""
+        labels = [label for label in self.ops if self.ops[label] or self.reads[label] or self.writes[label]]
+        return sorted(labels, key=lambda label: (-self.ops[label].total(), label))
+
+    def to_dict(self, block_names: Mapping[int, str] | None = None) -> dict:
+        """Return the counts as JSON-compatible data, naming blocks after `block_names` where given."""
+        block_names = block_names or {}
+        callbacks = []
+        for label in self.labels():
+            calls = self.calls.get(label, 0)
+            executed = self.ops[label].total()
+            callbacks.append(
+                {
+                    "callback": label,
+                    "calls": calls,
+                    "executed": executed,
+                    "per_call": executed / calls if calls else None,
+                    "ops": _op_counts(self.ops[label]),
+                    "blocks": _block_rows(self.reads[label], self.writes[label], block_names),
+                    "cells": _cell_rows(self.reads[label], self.writes[label], block_names),
+                }
+            )
+        ops = sum(self.ops.values(), Counter())
+        reads = sum(self.reads.values(), Counter())
+        writes = sum(self.writes.values(), Counter())
+        return {
+            "executed": ops.total(),
+            "ops": _op_counts(ops),
+            "blocks": _block_rows(reads, writes, block_names),
+            "cells": _cell_rows(reads, writes, block_names),
+            "callbacks": callbacks,
+        }
+
+
+class ProfiledMemory(Memory):
+    """`Memory` whose blocks count the reads and writes of single cells in a `RuntimeProfile`.
+
+    Indexing returns a view of the block; slices pass through uncounted, so code
+    setting up memory around the callbacks does not show in the profile.
+    """
+
+    profile: RuntimeProfile
+
+    def __init__(self, profile: RuntimeProfile, sizes: Mapping[int, int] | None = None, fill: float = -1.0):
+        super().__init__(sizes, fill)
+        self.profile = profile
+
+    def __getitem__(self, block: int) -> _TracedBlock:
+        return _TracedBlock(super().__getitem__(block), block, self.profile)
+
+
+class _TracedBlock:
+    __slots__ = ("block", "profile", "values")
+
+    def __init__(self, values, block: int, profile: RuntimeProfile):
+        self.values = values
+        self.block = block
+        self.profile = profile
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if type(index) is int:
+            self.profile.current_reads[self.block, index] += 1
+        return self.values[index]
+
+    def __setitem__(self, index, value) -> None:
+        if type(index) is int:
+            self.profile.current_writes[self.block, index] += 1
+        self.values[index] = value
+
+
+def _op_counts(ops: Counter[Op]) -> dict[str, int]:
+    return {op.value: count for op, count in sorted(ops.items(), key=lambda item: (-item[1], item[0].value))}
+
+
+def _block_name(block: int, block_names: Mapping[int, str]) -> str:
+    return block_names.get(block, str(block))
+
+
+def _block_rows(reads: Counter, writes: Counter, block_names: Mapping[int, str]) -> list[dict]:
+    totals: dict[int, list[int]] = {}
+    for (block, _), count in reads.items():
+        totals.setdefault(block, [0, 0])[0] += count
+    for (block, _), count in writes.items():
+        totals.setdefault(block, [0, 0])[1] += count
+    return [
+        {"block": block, "name": _block_name(block, block_names), "reads": r, "writes": w}
+        for block, (r, w) in sorted(totals.items(), key=lambda item: (-sum(item[1]), item[0]))
+    ]
+
+
+def _cell_rows(reads: Counter, writes: Counter, block_names: Mapping[int, str]) -> list[dict]:
+    return [
+        {
+            "block": block,
+            "name": _block_name(block, block_names),
+            "index": index,
+            "reads": reads[block, index],
+            "writes": writes[block, index],
+        }
+        for block, index in sorted(reads.keys() | writes.keys())
+    ]
+
+
+def format_text(data: dict, top: int = 10) -> str:
+    """Render the `top` callbacks of a profile's `to_dict`, with their main ops and blocks, for the terminal."""
+    lines = [f"runtime profile: {data['executed']} nodes executed"]
+    callbacks = data["callbacks"][:top]
+    if callbacks:
+        lines.append(f"  top {len(callbacks)} callbacks (calls / nodes per call / total):")
+        width = max(len(row["callback"]) for row in callbacks)
+        for row in callbacks:
+            per_call = "" if row["per_call"] is None else f"{row['per_call']:.1f}"
+            lines.append(f"    {row['callback']:<{width}}  {row['calls']:>8}  {per_call:>10}  {row['executed']:>10}")
+            ops = ", ".join(f"{op} {count}" for op, count in list(row["ops"].items())[:5])
+            if ops:
+                lines.append(f"      ops: {ops}")
+            calls = row["calls"] or 1
+            blocks = ", ".join(
+                f"{block['name']} {block['reads'] / calls:.1f}r/{block['writes'] / calls:.1f}w"
+                for block in row["blocks"][:5]
+            )
+            if blocks:
+                lines.append(f"      per call: {blocks}")
+    ops = list(data["ops"].items())[:top]
+    if ops:
+        lines.append(f"  top {len(ops)} ops:")
+        width = max(len(op) for op, _ in ops)
+        lines.extend(f"    {op:<{width}}  {count:>10}" for op, count in ops)
+    return "\n".join(lines)
+
+
+def format_heatmap(data: dict, blocks: Iterable[str] = HEATMAP_BLOCKS, callback: str | None = None) -> str:
+    """Draw the reads plus writes of each cell of `blocks` (by name) as a text heatmap.
+
+    The counts are those of `callback`, or of every callback by default. Each row
+    shows `_HEATMAP_WIDTH` cells, starting at the index on its left; rows with no
+    accesses are left out. Glyphs scale linearly up to the busiest cell of the block.
+    """
+    if callback is None:
+        cells = data["cells"]
+    else:
+        cells = next((row["cells"] for row in data["callbacks"] if row["callback"] == callback), [])
+    lines = []
+    for name in blocks:
+        counts = {cell["index"]: cell["reads"] + cell["writes"] for cell in cells if cell["name"] == name}
+        counts = {index: count for index, count in counts.items() if count}
+        if not counts:
+            continue
+        peak = max(counts.values())
+        reads = sum(cell["reads"] for cell in cells if cell["name"] == name)
+        writes = sum(cell["writes"] for cell in cells if cell["name"] == name)
+        lines.append(f"{name}: {reads} reads, {writes} writes over {len(counts)} cells, at most {peak} per cell")
+        for start in sorted({index - index % _HEATMAP_WIDTH for index in counts}):
+            row = "".join(
+                _heatmap_glyph(counts.get(index, 0), peak) + (" " if index % 8 == 7 else "")
+                for index in range(start, start + _HEATMAP_WIDTH)
+            )
+            lines.append(f"  {start:>5} |{row.rstrip()}")
+    return "\n".join(lines)
+
+
+def _heatmap_glyph(count: int, peak: int) -> str:
+    if count == 0:
+        return " "
+    return _HEATMAP_GLYPHS[min((count * len(_HEATMAP_GLYPHS) - 1) // peak, len(_HEATMAP_GLYPHS) - 1)]
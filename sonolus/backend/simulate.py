@@ -0,0 +1,701 @@
+"""Headless simulation of a built engine's play mode over a level (the CLI `simulate` command).
+
+Runs the packaged `EnginePlayData` of an engine over a level's data, frame by frame,
+the way the Sonolus runtime would: entities are created from the level entities with
+the entity-data layout of their archetype's imports, every entity is preprocessed
+and given its spawn order, and then each frame spawns the entities whose
+`shouldSpawn` passes (in spawn order), initializes them, runs `updateSequential`,
+`touch` (while there are touches) and `updateParallel` on the active entities, and
+terminates the entities that set their despawn flag. Touches are scripted
+(`SimulatedTouch`).
+
+Callbacks run through the closure-compiled interpreter (`compile_node`) with node
+counting on, and the report gives the number of function nodes executed in each
+frame per archetype and callback: a deterministic, local estimate of the runtime
+cost per frame of a chart. Given a `RuntimeProfile`, `PlaySimulator.run` also counts
+the ops and memory accesses of each callback (see `sonolus.backend.profiler`).
+
+With `batch=True`, `updateParallel` runs for all active entities of an archetype at
+once on a `BatchInterpreter` (see `sonolus.backend.batch`, which needs NumPy), when
+its callback only writes the entity's own memory and temporary memory; the report is
+the same as without. Callbacks that cannot be batched, groups smaller than
+`BATCH_MIN_LANES`, and groups that fail in the batch run entity by entity as usual.
+
+Runtime functions are modelled only as far as callbacks can observe them: timing
+functions follow the level's `#BPM_CHANGE` and `#TIMESCALE_CHANGE` entities
+(timescale groups are not modelled), `Spawn` creates an entity that is active from
+the next frame, looped effects and particles return fresh ids, the `Has*` queries
+return true, and drawing, audio, exports, and stream writes are counted but have no
+effect. Reading streams is for watch mode and unsupported.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import cache, partial
+from importlib.util import find_spec
+from itertools import pairwise, starmap
+
+from sonolus.backend.blocks import PlayBlock
+from sonolus.backend.interpret import CompiledNode, Interpreter, compile_node
+from sonolus.backend.node import EngineNode, FunctionNode
+from sonolus.backend.ops import Op
+from sonolus.backend.profiler import RuntimeProfile
+
+# Per-entity block sizes of play mode.
+ENTITY_MEMORY_SIZE = 64
+ENTITY_DATA_SIZE = 32
+ENTITY_SHARED_MEMORY_SIZE = 32
+ENTITY_INFO_SIZE = 3
+ENTITY_INPUT_SIZE = 4
+# Values per touch in `RuntimeTouchArray`: id, started, ended, time, start time, and
+# the position, start position, delta, and velocity vectors, speed, and angle.
+TOUCH_SIZE = 15
+
+# `EntityInfo` states.
+WAITING = 0
+ACTIVE = 1
+DESPAWNED = 2
+
+# Tempo of a level without `#BPM_CHANGE` entities.
+_DEFAULT_BPM = 60.0
+
+# Fewest entities of an archetype `updateParallel` is batched for.
+BATCH_MIN_LANES = 32
+
+_ENTITY_BLOCKS = (
+    PlayBlock.EntityMemory,
+    PlayBlock.EntityData,
+    PlayBlock.EntitySharedMemory,
+    PlayBlock.EntityInfo,
+    PlayBlock.EntityDespawn,
+    PlayBlock.EntityInput,
+)
+# The `_Entity` attribute holding each of `_ENTITY_BLOCKS`.
+_ENTITY_ATTRS = ("memory", "data", "shared", "info", "despawn", "input")
+
+# Runtime functions with no effect on what callbacks can observe; they are only counted.
+_COUNTED_ONLY = frozenset(
+    {
+        Op.AddLifeScheduled,
+        Op.DestroyParticleEffect,
+        Op.Draw,
+        Op.DrawCurvedB,
+        Op.DrawCurvedBT,
+        Op.DrawCurvedL,
+        Op.DrawCurvedLR,
+        Op.DrawCurvedR,
+        Op.DrawCurvedT,
+        Op.ExportValue,
+        Op.MoveParticleEffect,
+        Op.Paint,
+        Op.Play,
+        Op.PlayScheduled,
+        Op.Print,
+        Op.StopLooped,
+        Op.StopLoopedScheduled,
+        Op.StreamSet,
+    }
+)
+# Runtime functions whose result does not depend on the order entities call them in.
+_TIMING_FUNCTIONS = frozenset(
+    {
+        Op.BeatToBPM,
+        Op.BeatToStartingBeat,
+        Op.BeatToStartingTime,
+        Op.BeatToTime,
+        Op.TimeToScaledTime,
+        Op.TimeToStartingScaledTime,
+        Op.TimeToStartingTime,
+        Op.TimeToTimeScale,
+    }
+)
+_BATCH_RUNTIME = _COUNTED_ONLY | _TIMING_FUNCTIONS | {Op.HasEffectClip, Op.HasParticleEffect, Op.HasSkinSprite}
+# Blocks `updateParallel` may write, each entity its own copy.
+_BATCH_WRITABLE = frozenset(
+    {PlayBlock.EntityMemory, PlayBlock.EntityDespawn, PlayBlock.EntityInput, PlayBlock.TemporaryMemory}
+)
+
+
+class SimulationError(Exception):
+    """The engine or level cannot be simulated."""
+
+
+@dataclass(frozen=True)
+class SimulatedTouch:
+    """A scripted touch, held at (`x`, `y`) from the first frame at or after `start`.
+
+    It ends on the first frame at or after `end`, which may be its first frame.
+    """
+
+    start: float
+    end: float
+    x: float
+    y: float
+
+
+@dataclass
+class FrameStats:
+    """What one simulated frame executed."""
+
+    time: float
+    # Entities active at the end of the frame.
+    active: int
+    # (archetype, callback) -> function nodes executed.
+    executed: dict[tuple[str, str], int] = field(default_factory=dict)
+    # Runtime function name -> number of calls.
+    runtime_calls: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.executed.values())
+
+
+@dataclass
+class SimulationReport:
+    """Per-frame node execution counts of a simulation; see `PlaySimulator.run`."""
+
+    fps: float
+    # (archetype, callback) -> function nodes executed by `preprocess` and `spawnOrder`.
+    preprocess: dict[tuple[str, str], int]
+    frames: list[FrameStats]
+
+    def by_callback(self) -> dict[tuple[str, str], int]:
+        """Return the nodes executed over all frames per (archetype, callback), largest first."""
+        totals: dict[tuple[str, str], int] = {}
+        for frame in self.frames:
+            for key, count in frame.executed.items():
+                totals[key] = totals.get(key, 0) + count
+        return dict(sorted(totals.items(), key=lambda item: (-item[1], item[0])))
+
+    def by_archetype(self) -> dict[str, int]:
+        """Return the nodes executed over all frames per archetype, largest first."""
+        totals: dict[str, int] = {}
+        for (archetype, _), count in self.by_callback().items():
+            totals[archetype] = totals.get(archetype, 0) + count
+        return dict(sorted(totals.items(), key=lambda item: (-item[1], item[0])))
+
+    def to_dict(self) -> dict:
+        """Return the report as JSON-compatible data."""
+        totals = [frame.total for frame in self.frames]
+        peak = max(range(len(totals)), key=totals.__getitem__, default=None)
+        return {
+            "fps": self.fps,
+            "frame_count": len(self.frames),
+            "executed": sum(totals),
+            "mean_per_frame": sum(totals) / len(totals) if totals else 0.0,
+            "peak_frame": None
+            if peak is None
+            else {"index": peak, "time": self.frames[peak].time, "executed": totals[peak]},
+            "preprocess": list(starmap(_callback_row, self.preprocess.items())),
+            "callbacks": list(starmap(_callback_row, self.by_callback().items())),
+            "archetypes": [{"archetype": name, "executed": count} for name, count in self.by_archetype().items()],
+            "frames": [
+                {
+                    "time": frame.time,
+                    "active": frame.active,
+                    "executed": frame.total,
+                    "callbacks": {
+                        f"{archetype}.{callback}": count for (archetype, callback), count in frame.executed.items()
+                    },
+                    "runtime_calls": frame.runtime_calls,
+                }
+                for frame in self.frames
+            ],
+        }
+
+
+def _callback_row(key: tuple[str, str], count: int) -> dict:
+    archetype, callback = key
+    return {"archetype": archetype, "callback": callback, "executed": count}
+
+
+def format_text(data: dict, top: int = 10) -> str:
+    """Render the totals and the `top` callbacks and archetypes of a report's `to_dict` for the terminal."""
+    lines = [
+        f"simulation: {data['frame_count']} frames at {data['fps']:g} fps, {data['executed']} nodes executed, "
+        f"{data['mean_per_frame']:.1f} per frame"
+    ]
+    if data["peak_frame"] is not None:
+        peak = data["peak_frame"]
+        lines.append(f"  peak frame: #{peak['index']} at {peak['time']:.3f}s, {peak['executed']} nodes")
+    frame_count = data["frame_count"] or 1
+    tables = (
+        ("callbacks", [(f"{row['archetype']}.{row['callback']}", row["executed"]) for row in data["callbacks"]]),
+        ("archetypes", [(row["archetype"], row["executed"]) for row in data["archetypes"]]),
+    )
+    for title, rows in tables:
+        rows = rows[:top]
+        if not rows:
+            continue
+        lines.append(f"  top {len(rows)} {title} (nodes per frame / total):")
+        width = max(len(label) for label, _ in rows)
+        lines.extend(f"    {label:<{width}}  {count / frame_count:>10.1f}  {count:>10}" for label, count in rows)
+    return "\n".join(lines)
+
+
+def decode_nodes(nodes: list[dict]) -> list[EngineNode]:
+    """Rebuild the node trees of an engine mode's output node list, sharing common subtrees.
+
+    Node lists are in post-order, so the arguments of every node precede it.
+    """
+    result: list[EngineNode] = []
+    for entry in nodes:
+        if "value" in entry:
+            result.append(entry["value"])
+        else:
+            result.append(FunctionNode(Op(entry["func"]), tuple(result[i] for i in entry["args"])))
+    return result
+
+
+class _Timing:
+    """The level's tempo and timescale changes, for the timing runtime functions."""
+
+    def __init__(self, bpm_changes: list[tuple[float, float]], timescale_changes: list[tuple[float, float]]):
+        # (beat, bpm) sorted by beat, starting at beat 0.
+        bpm_changes = sorted(bpm_changes) or [(0.0, _DEFAULT_BPM)]
+        if bpm_changes[0][0] > 0:
+            bpm_changes.insert(0, (0.0, bpm_changes[0][1]))
+        self.beats = [beat for beat, _ in bpm_changes]
+        self.bpms = [bpm for _, bpm in bpm_changes]
+        self.beat_times = [0.0]
+        for (beat, bpm), (next_beat, _) in pairwise(bpm_changes):
+            self.beat_times.append(self.beat_times[-1] + (next_beat - beat) * 60 / bpm)
+        # (time, timescale) sorted by time, starting at time 0 with timescale 1.
+        changes = sorted((self.beat_to_time(beat), scale) for beat, scale in timescale_changes)
+        if not changes or changes[0][0] > 0:
+            changes.insert(0, (0.0, 1.0))
+        self.times = [time for time, _ in changes]
+        self.scales = [scale for _, scale in changes]
+        self.scaled_times = [0.0]
+        for (time, scale), (next_time, _) in pairwise(changes):
+            self.scaled_times.append(self.scaled_times[-1] + (next_time - time) * scale)
+
+    def _bpm_section(self, beat: float) -> int:
+        return max(bisect.bisect_right(self.beats, beat) - 1, 0)
+
+    def _timescale_section(self, time: float) -> int:
+        return max(bisect.bisect_right(self.times, time) - 1, 0)
+
+    def beat_to_time(self, beat: float) -> float:
+        i = self._bpm_section(beat)
+        return self.beat_times[i] + (beat - self.beats[i]) * 60 / self.bpms[i]
+
+    def time_to_scaled_time(self, time: float) -> float:
+        i = self._timescale_section(time)
+        return self.scaled_times[i] + (time - self.times[i]) * self.scales[i]
+
+    def call(self, func: Op, value: float) -> float:
+        match func:
+            case Op.BeatToBPM:
+                return self.bpms[self._bpm_section(value)]
+            case Op.BeatToTime:
+                return self.beat_to_time(value)
+            case Op.BeatToStartingBeat:
+                return self.beats[self._bpm_section(value)]
+            case Op.BeatToStartingTime:
+                return self.beat_times[self._bpm_section(value)]
+            case Op.TimeToScaledTime:
+                return self.time_to_scaled_time(value)
+            case Op.TimeToStartingScaledTime:
+                return self.scaled_times[self._timescale_section(value)]
+            case Op.TimeToStartingTime:
+                return self.times[self._timescale_section(value)]
+            case Op.TimeToTimeScale:
+                return self.scales[self._timescale_section(value)]
+        raise NotImplementedError(f"Unsupported operation: {func}")
+
+
+class _Entity:
+    __slots__ = ("archetype", "data", "despawn", "index", "info", "input", "memory", "shared", "spawn_order")
+
+    def __init__(self, index: int, archetype: int, data: array):
+        self.index = index
+        self.archetype = archetype
+        self.memory = array("d", bytes(8 * ENTITY_MEMORY_SIZE))
+        self.data = data
+        self.shared = array("d", bytes(8 * ENTITY_SHARED_MEMORY_SIZE))
+        self.info = array("d", [index, archetype, WAITING])
+        self.despawn = array("d", [0.0])
+        self.input = array("d", bytes(8 * ENTITY_INPUT_SIZE))
+        self.spawn_order = 0.0
+
+
+class _Runtime(Interpreter):
+    """The interpreter callbacks run on, providing the runtime functions."""
+
+    def __init__(self, simulator: PlaySimulator, profile: RuntimeProfile | None):
+        super().__init__(fill=0.0, profile=profile)
+        self.simulator = simulator
+        self.runtime_calls: dict[str, int] = {}
+        self.next_id = 1
+
+    def call_runtime(self, func: Op, args: list[float]) -> float:
+        name = func.value
+        self.runtime_calls[name] = self.runtime_calls.get(name, 0) + 1
+        if func in _COUNTED_ONLY:
+            return 0.0
+        match func:
+            case Op.HasEffectClip | Op.HasParticleEffect | Op.HasSkinSprite:
+                return 1.0
+            case Op.PlayLooped | Op.PlayLoopedScheduled | Op.SpawnParticleEffect:
+                self.next_id += 1
+                return float(self.next_id)
+            case Op.Spawn:
+                self.simulator.spawn(int(args[0]), args[1:])
+                return 0.0
+            case _ if len(args) == 1 and func in _TIMING_FUNCTIONS:
+                return self.simulator.timing.call(func, args[0])
+        raise NotImplementedError(f"Unsupported operation: {func}")
+
+
+@cache
+def _batch_runtime_class() -> type:
+    """Return the `BatchInterpreter` batched callbacks run on, imported once needed as it needs NumPy."""
+    from sonolus.backend.batch import BatchInterpreter, elementwise
+
+    class BatchRuntime(BatchInterpreter):
+        """Runs a callback for entities of one archetype at once, providing `_BATCH_RUNTIME`."""
+
+        def __init__(self, simulator: PlaySimulator, entities: list[_Entity]):
+            super().__init__(
+                simulator.rt.blocks,
+                {
+                    block: [getattr(entity, attr) for entity in entities]
+                    for block, attr in zip(_ENTITY_BLOCKS, _ENTITY_ATTRS, strict=True)
+                },
+                scratch_blocks=[PlayBlock.TemporaryMemory],
+            )
+            self.timing = simulator.timing
+            # Like `_Runtime.runtime_calls`, merged into it once the batch succeeded.
+            self.runtime_calls: dict[str, int] = {}
+
+        def call_runtime(self, func, args, count):
+            name = func.value
+            self.runtime_calls[name] = self.runtime_calls.get(name, 0) + count
+            if func in _COUNTED_ONLY:
+                return 0.0
+            if func in _TIMING_FUNCTIONS and len(args) == 1:
+                return elementwise(partial(self.timing.call, func), args, count)
+            if func in _BATCH_RUNTIME:
+                return 1.0
+            return super().call_runtime(func, args, count)
+
+    return BatchRuntime
+
+
+class PlaySimulator:
+    """Simulates the play mode of a built engine over one level; see the module docstring.
+
+    Args:
+        play_data: The unpackaged `EnginePlayData` (its archetypes and node list).
+        rom: The values of the packaged `EngineRom`.
+        level_data: The unpackaged level data (its entities).
+        configuration: The unpackaged `EngineConfiguration`; its option defaults fill
+            `LevelOption`. Options read as 0 without it.
+    """
+
+    def __init__(
+        self,
+        play_data: dict,
+        rom: Sequence[float],
+        level_data: dict,
+        configuration: dict | None = None,
+    ):
+        self.archetypes: list[dict] = play_data["archetypes"]
+        self.archetype_ids = {archetype["name"]: i for i, archetype in enumerate(self.archetypes)}
+        nodes = decode_nodes(play_data["nodes"])
+        # Per archetype: callback name -> node.
+        self.callback_nodes: list[dict[str, EngineNode]] = [
+            {
+                name: nodes[entry["index"]]
+                for name, entry in archetype.items()
+                if isinstance(entry, dict) and "index" in entry
+            }
+            for archetype in self.archetypes
+        ]
+        # Per archetype: callback name -> (compiled node, order).
+        self.callbacks: list[dict[str, tuple[CompiledNode, int]]] = [
+            {
+                name: (compile_node(node, count=True), archetype[name].get("order", 0))
+                for name, node in callback_nodes.items()
+            }
+            for archetype, callback_nodes in zip(self.archetypes, self.callback_nodes, strict=True)
+        ]
+        # Per archetype: callback name -> node compiled with `profile=True`, once needed.
+        self.profiled_callbacks: list[dict[str, CompiledNode]] | None = None
+        # Per archetype: whether its `updateParallel` can be batched, once needed.
+        self.batchable: list[bool | None] = [None] * len(self.archetypes)
+        self.rom = list(rom)
+        self.options = [option["def"] for option in (configuration or {}).get("options", [])]
+        self.level_entities: list[dict] = level_data["entities"]
+        self.timing = _Timing(
+            [
+                (_entity_value(entity, "#BEAT"), _entity_value(entity, "#BPM", _DEFAULT_BPM))
+                for entity in self.level_entities
+                if entity["archetype"] == "#BPM_CHANGE"
+            ],
+            [
+                (_entity_value(entity, "#BEAT"), _entity_value(entity, "#TIMESCALE", 1.0))
+                for entity in self.level_entities
+                if entity["archetype"] == "#TIMESCALE_CHANGE"
+            ],
+        )
+
+    def run(
+        self,
+        duration: float,
+        fps: float = 60.0,
+        touches: Sequence[SimulatedTouch] = (),
+        profile: RuntimeProfile | None = None,
+        batch: bool = False,
+    ) -> SimulationReport:
+        """Simulate the first `duration` seconds at `fps` frames per second with the scripted `touches`.
+
+        With a `profile`, each callback call is also profiled in it as `"<archetype>.<callback>"`.
+        With `batch`, `updateParallel` is batched across entities where possible; this
+        needs NumPy and is not done while profiling.
+        """
+        if batch and find_spec("numpy") is None:
+            raise SimulationError("Batched simulation requires NumPy")
+        batch = batch and profile is None
+        if profile is not None and self.profiled_callbacks is None:
+            self.profiled_callbacks = [
+                {name: compile_node(node, profile=True) for name, node in callback_nodes.items()}
+                for callback_nodes in self.callback_nodes
+            ]
+        self._reset(profile)
+        counts: dict[tuple[str, str], int] = {}
+        self._preprocess(counts)
+        self.pending.sort(key=lambda entity: (entity.spawn_order, entity.index))
+        frames = []
+        delta_time = 1 / fps
+        self.touch_starts: dict[int, float] = {}
+        self.ended_touches: set[int] = set()
+        for frame in range(math.ceil(duration * fps)):
+            time = frame * delta_time
+            counts = {}
+            self.rt.runtime_calls = {}
+            touch_count = self._update_touches(time, touches)
+            update = self.rt.blocks[PlayBlock.RuntimeUpdate]
+            update[0:4] = array("d", [time, delta_time, self.timing.time_to_scaled_time(time), touch_count])
+            self._spawn(counts)
+            active = self.active
+            self._call_all(active, "updateSequential", counts)
+            if touch_count:
+                self._call_all(active, "touch", counts)
+            if batch:
+                self._update_parallel(active, counts)
+            else:
+                self._call_all(active, "updateParallel", counts)
+            despawned = [entity for entity in active if entity.despawn[0] != 0]
+            self._call_all(despawned, "terminate", counts)
+            for entity in despawned:
+                self._set_state(entity, DESPAWNED)
+            self.active = [entity for entity in active if entity.despawn[0] == 0]
+            frames.append(FrameStats(time, len(self.active), counts, self.rt.runtime_calls))
+        return SimulationReport(fps, self.preprocess_counts, frames)
+
+    def spawn(self, archetype: int, data: Sequence[float]) -> None:
+        """Create an entity of `archetype` with `data` as its entity data, active from the next frame."""
+        if not 0 <= archetype < len(self.archetypes):
+            raise SimulationError(f"Cannot spawn an entity of unknown archetype {archetype}")
+        values = array("d", data[:ENTITY_DATA_SIZE])
+        values.extend(array("d", bytes(8 * (ENTITY_DATA_SIZE - len(values)))))
+        entity = self._add_entity(archetype, values)
+        self.spawned.append(entity)
+
+    def _reset(self, profile: RuntimeProfile | None) -> None:
+        self.rt = _Runtime(self, profile)
+        blocks = self.rt.blocks
+        blocks[PlayBlock.EngineRom] = self.rom
+        blocks[PlayBlock.LevelOption] = self.options
+        environment = blocks[PlayBlock.RuntimeEnvironment]
+        # Not debug, 16:9, no audio or input offset, single player, safe area = screen.
+        environment[0:9] = array("d", [0, 16 / 9, 0, 0, 0, -16 / 9, 16 / 9, -1, 1])
+        for transform in (PlayBlock.RuntimeSkinTransform, PlayBlock.RuntimeParticleTransform):
+            blocks[transform][0:16] = array("d", [1.0 if i % 5 == 0 else 0.0 for i in range(16)])
+        ui_configuration = blocks[PlayBlock.RuntimeUIConfiguration]
+        ui_configuration[:] = array("d", [1.0]) * len(ui_configuration)
+        self.entities: list[_Entity] = []
+        self.data_array = array("d")
+        self.shared_array = array("d")
+        self.info_array = array("d")
+        blocks.bind(PlayBlock.EntityDataArray, self.data_array)
+        blocks.bind(PlayBlock.EntitySharedMemoryArray, self.shared_array)
+        blocks.bind(PlayBlock.EntityInfoArray, self.info_array)
+        level_indexes = {entity["name"]: i for i, entity in enumerate(self.level_entities) if "name" in entity}
+        for entity in self.level_entities:
+            archetype = self.archetype_ids.get(entity["archetype"])
+            if archetype is None:
+                raise SimulationError(f"Level entity archetype '{entity['archetype']}' is not in the engine")
+            self._add_entity(archetype, self._entity_data(archetype, entity, level_indexes))
+        self.pending = list(self.entities)
+        self.active: list[_Entity] = []
+        self.spawned: list[_Entity] = []
+
+    def _entity_data(self, archetype: int, entity: dict, level_indexes: dict[str, int]) -> array:
+        values = {}
+        for entry in entity.get("data", []):
+            if "value" in entry:
+                values[entry["name"]] = entry["value"]
+            elif entry.get("ref") in level_indexes:
+                values[entry["name"]] = level_indexes[entry["ref"]]
+        data = array("d", bytes(8 * ENTITY_DATA_SIZE))
+        for imported in self.archetypes[archetype].get("imports", []):
+            data[imported["index"]] = values.get(imported["name"], imported.get("def", 0))
+        return data
+
+    def _add_entity(self, archetype: int, data: array) -> _Entity:
+        entity = _Entity(len(self.entities), archetype, data)
+        self.entities.append(entity)
+        self.data_array.extend(data)
+        self.shared_array.extend(entity.shared)
+        self.info_array.extend(entity.info)
+        return entity
+
+    def _set_state(self, entity: _Entity, state: int) -> None:
+        entity.info[2] = state
+        self.info_array[entity.index * ENTITY_INFO_SIZE + 2] = state
+
+    def _preprocess(self, counts: dict[tuple[str, str], int]) -> None:
+        self._call_all(self.entities, "preprocess", counts)
+        for entity in self.entities:
+            entity.spawn_order = self._call(entity, "spawnOrder", counts, 0.0)
+        self.preprocess_counts = counts
+
+    def _spawn(self, counts: dict[tuple[str, str], int]) -> None:
+        new = self.spawned
+        self.spawned = []
+        pending = self.pending
+        spawned = 0
+        while spawned < len(pending) and self._call(pending[spawned], "shouldSpawn", counts, 1.0) != 0:
+            new.append(pending[spawned])
+            spawned += 1
+        if spawned:
+            del pending[:spawned]
+        if not new:
+            return
+        for entity in new:
+            self._set_state(entity, ACTIVE)
+        self._call_all(new, "initialize", counts)
+        self.active = sorted(self.active + new, key=lambda entity: entity.index)
+
+    def _call_all(self, entities: list[_Entity], callback: str, counts: dict[tuple[str, str], int]) -> None:
+        """Run `callback` for each of `entities`, in callback order and then entity order."""
+        callbacks = self.callbacks
+        ordered = [
+            (callbacks[entity.archetype][callback][1], entity.index, entity)
+            for entity in entities
+            if callback in callbacks[entity.archetype]
+        ]
+        ordered.sort(key=lambda item: item[:2])
+        for _, _, entity in ordered:
+            self._call(entity, callback, counts, 0.0)
+
+    def _update_parallel(self, entities: list[_Entity], counts: dict[tuple[str, str], int]) -> None:
+        """Run `updateParallel` for `entities`, batching the archetypes that allow it."""
+        groups: dict[int, list[_Entity]] = {}
+        for entity in entities:
+            groups.setdefault(entity.archetype, []).append(entity)
+        rest = []
+        for archetype, group in groups.items():
+            if len(group) < BATCH_MIN_LANES or not self._batchable(archetype) or not self._run_batch(group, counts):
+                rest.extend(group)
+        self._call_all(sorted(rest, key=lambda entity: entity.index), "updateParallel", counts)
+
+    def _batchable(self, archetype: int) -> bool:
+        if self.batchable[archetype] is None:
+            from sonolus.backend.batch import batchable
+
+            node = self.callback_nodes[archetype].get("updateParallel")
+            self.batchable[archetype] = node is not None and batchable(node, _BATCH_WRITABLE, _BATCH_RUNTIME)
+        return self.batchable[archetype]
+
+    def _run_batch(self, entities: list[_Entity], counts: dict[tuple[str, str], int]) -> bool:
+        """Run `updateParallel` for `entities` of one archetype at once; return whether it succeeded.
+
+        On failure nothing has changed, and the entities are left to run one by one.
+        """
+        rt = self.rt
+        batch = _batch_runtime_class()(self, entities)
+        try:
+            batch.run(self.callback_nodes[entities[0].archetype]["updateParallel"])
+        except Exception:
+            return False
+        batch.write_back()
+        rt.executed += batch.executed
+        key = (self.archetypes[entities[0].archetype]["name"], "updateParallel")
+        counts[key] = counts.get(key, 0) + batch.executed
+        for name, count in batch.runtime_calls.items():
+            rt.runtime_calls[name] = rt.runtime_calls.get(name, 0) + count
+        return True
+
+    def _call(self, entity: _Entity, callback: str, counts: dict[tuple[str, str], int], default: float) -> float:
+        entry = self.callbacks[entity.archetype].get(callback)
+        if entry is None:
+            return default
+        rt = self.rt
+        bind = rt.blocks.bind
+        for block, values in zip(
+            _ENTITY_BLOCKS,
+            (entity.memory, entity.data, entity.shared, entity.info, entity.despawn, entity.input),
+            strict=True,
+        ):
+            bind(block, values)
+        name = self.archetypes[entity.archetype]["name"]
+        run = entry[0]
+        if rt.profile is not None:
+            rt.profile.begin(f"{name}.{callback}")
+            run = self.profiled_callbacks[entity.archetype][callback]
+        before = rt.executed
+        try:
+            result = run(rt)
+        except Exception as e:
+            e.add_note(f"in {name}.{callback} of entity {entity.index}")
+            raise
+        key = (name, callback)
+        counts[key] = counts.get(key, 0) + rt.executed - before
+        # Other entities see this entity's data and shared memory through the array blocks.
+        start = entity.index * ENTITY_DATA_SIZE
+        self.data_array[start : start + ENTITY_DATA_SIZE] = entity.data
+        start = entity.index * ENTITY_SHARED_MEMORY_SIZE
+        self.shared_array[start : start + ENTITY_SHARED_MEMORY_SIZE] = entity.shared
+        return result
+
+    def _update_touches(self, time: float, touches: Sequence[SimulatedTouch]) -> int:
+        """Write the touches held at `time` to `RuntimeTouchArray`; return their number.
+
+        Touch `i` of `touches` has id `i + 1`; `touch_starts` holds the start time of
+        each held touch by id, and `ended_touches` the ids of the touches that ended.
+        """
+        values = array("d")
+        for touch_id, touch in enumerate(touches, 1):
+            if time < touch.start or touch_id in self.ended_touches:
+                continue
+            is_new = touch_id not in self.touch_starts
+            if is_new:
+                self.touch_starts[touch_id] = time
+            ended = time >= touch.end
+            start_time = self.touch_starts[touch_id]
+            values.extend([touch_id, is_new, ended, time, start_time, touch.x, touch.y, touch.x, touch.y])
+            values.extend(array("d", bytes(8 * (TOUCH_SIZE - 9))))
+            if ended:
+                del self.touch_starts[touch_id]
+                self.ended_touches.add(touch_id)
+        touch_array = self.rt.blocks[PlayBlock.RuntimeTouchArray]
+        if len(values) > len(touch_array):
+            raise SimulationError(f"Too many simultaneous touches at {time:.3f}s")
+        touch_array[0 : len(values)] = values
+        return len(values) // TOUCH_SIZE
+
+
+def _entity_value(entity: dict, name: str, default: float = 0.0) -> float:
+    for entry in entity.get("data", []):
+        if entry["name"] == name and "value" in entry:
+            return entry["value"]
+    return default
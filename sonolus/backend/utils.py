@@ -1,5 +1,8 @@
 import ast
 import inspect
+import os
+import symtable
+from collections import OrderedDict
 from collections.abc import Callable
 from functools import cache
 from pathlib import Path
@@ -10,9 +13,8 @@ def get_function(fn: Callable) -> tuple[str, ast.FunctionDef]:
     # This preserves both line number and column number in the returned node
     source_file = inspect.getsourcefile(fn)
     _, start_line = inspect.getsourcelines(fn)
-    base_tree = get_tree_from_file(source_file)
     try:
-        return source_file, find_function(base_tree, start_line)
+        return source_file, source_cache.function(source_file, start_line)
     except ValueError:
         raise ValueError(f"Function {fn} not found in source file {source_file}") from None
 
@@ -22,9 +24,100 @@ def get_signature(fn: Callable) -> inspect.Signature:
     return inspect.signature(fn)
 
 
-@cache
 def get_tree_from_file(file: str | Path) -> ast.Module:
-    return ast.parse(Path(file).read_text(encoding="utf-8"))
+    return source_cache.tree(file)
+
+
+class _SourceFile:
+    __slots__ = ("functions_by_line", "global_names", "mtime_ns", "path", "size", "source", "tree")
+
+    def __init__(self, path: str, source: str, mtime_ns: int, size: int):
+        self.path = path
+        self.source = source
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.tree = ast.parse(source)
+        self.functions_by_line: dict[int, ast.FunctionDef | ast.Lambda] | None = None
+        self.global_names: dict[ast.AST, frozenset[str]] | None = None
+
+
+class SourceCache:
+    """Parsed source files, kept across rebuilds for as long as the files are unchanged.
+
+    A file is considered unchanged while its modification time and size are. Each file
+    is checked the first time it is used after `revalidate()` (e.g. once per dev-server
+    rebuild) and trusted until the next one, so a build only stats each file once. The
+    least recently used files are evicted beyond `max_files`.
+    """
+
+    def __init__(self, max_files: int = 1024):
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+        self._files: OrderedDict[str, _SourceFile] = OrderedDict()
+        self._checked: set[str] = set()
+
+    def revalidate(self) -> None:
+        """Check each file for changes again the next time it is used."""
+        self._checked.clear()
+
+    def clear(self) -> None:
+        self._files.clear()
+        self._checked.clear()
+
+    def tree(self, file: str | Path) -> ast.Module:
+        """Return the parsed module of `file`."""
+        return self._get(os.fspath(file)).tree
+
+    def function(self, file: str | Path, line: int) -> ast.FunctionDef | ast.Lambda:
+        """Return the function or lambda of `file` that starts at `line` (see `find_function`)."""
+        entry = self._get(os.fspath(file))
+        if entry.functions_by_line is None:
+            entry.functions_by_line = _index_functions(entry.tree)
+        try:
+            return entry.functions_by_line[line]
+        except KeyError:
+            raise ValueError("Function not found") from None
+
+    def global_names(self, file: str | Path, node: ast.AST) -> frozenset[str]:
+        """Return the names that `node`, a function, lambda, or generator expression of `file`, can only read as globals.
+
+        These are the names that neither `node` nor an enclosing function binds. This is empty if `node` is not part
+        of the current tree of `file`.
+        """
+        entry = self._get(os.fspath(file))
+        if entry.global_names is None:
+            entry.global_names = _index_global_names(entry)
+        return entry.global_names.get(node, frozenset())
+
+    def _get(self, path: str) -> _SourceFile:
+        entry = self._files.get(path)
+        if entry is not None and path in self._checked:
+            self._files.move_to_end(path)
+            self.hits += 1
+            return entry
+        stat = Path(path).stat()
+        if entry is None or (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+            source = Path(path).read_text(encoding="utf-8")
+            if entry is None or entry.source != source:
+                self.misses += 1
+                entry = _SourceFile(path, source, stat.st_mtime_ns, stat.st_size)
+            else:
+                # Touched but unchanged: keep the tree, so its nodes stay the same objects.
+                self.hits += 1
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+        else:
+            self.hits += 1
+        self._files[path] = entry
+        self._files.move_to_end(path)
+        self._checked.add(path)
+        while len(self._files) > self.max_files:
+            evicted, _ = self._files.popitem(last=False)
+            self._checked.discard(evicted)
+        return entry
+
+
+source_cache = SourceCache()
 
 
 class FindFunction(ast.NodeVisitor):
@@ -56,13 +149,57 @@ class FindFunction(ast.NodeVisitor):
         self.current_fn.has_yield = True
 
 
-@cache
 def get_functions(tree: ast.Module) -> list[ast.FunctionDef | ast.Lambda]:
     visitor = FindFunction(0)
     visitor.visit(tree)
     return visitor.results
 
 
+def _index_functions(tree: ast.Module) -> dict[int, ast.FunctionDef | ast.Lambda]:
+    """Map each line `find_function` can be called with to the function it returns."""
+    index = {}
+    for node in get_functions(tree):
+        index.setdefault(node.lineno, node)
+        if isinstance(node, ast.FunctionDef) and node.decorator_list:
+            index.setdefault(node.decorator_list[0].lineno, node)
+    return index
+
+
+def _index_global_names(entry: _SourceFile) -> dict[ast.AST, frozenset[str]]:
+    # Symbol tables are matched to nodes by name and line, skipping any that share both.
+    try:
+        top = symtable.symtable(entry.source, entry.path, "exec")
+    except SyntaxError:
+        return {}
+    tables = {}
+    pending = [top]
+    while pending:
+        table = pending.pop()
+        if table.get_type() == "function":
+            tables.setdefault((table.get_name(), table.get_lineno()), []).append(table)
+        pending.extend(table.get_children())
+    nodes = {}
+    for node in ast.walk(entry.tree):
+        match node:
+            case ast.FunctionDef(name=name):
+                pass
+            case ast.Lambda():
+                name = "lambda"
+            case ast.GeneratorExp():
+                name = "genexpr"
+            case _:
+                continue
+        nodes.setdefault((name, node.lineno), []).append(node)
+    index = {}
+    for key, matches in nodes.items():
+        candidates = tables.get(key, ())
+        if len(matches) == 1 and len(candidates) == 1:
+            index[matches[0]] = frozenset(
+                symbol.get_name() for symbol in candidates[0].get_symbols() if symbol.is_global()
+            )
+    return index
+
+
 def find_function(tree: ast.Module, line: int):
     for node in get_functions(tree):
         if node.lineno == line or (
@@ -1,24 +1,34 @@
+from __future__ import annotations
+
 import argparse
 import gc
 import importlib
 import json
 import shutil
 import sys
+from dataclasses import replace
 from pathlib import Path
 from time import perf_counter
 from types import ModuleType
+from typing import TYPE_CHECKING
 
 from sonolus.backend.excepthook import print_simple_traceback
 from sonolus.backend.optimize import FAST_PASSES, MINIMAL_PASSES, STANDARD_PASSES, profiling
-from sonolus.build.collection import Collection
-from sonolus.build.dev_server import run_server
-from sonolus.build.engine import package_engine, validate_engine
-from sonolus.build.level import package_level_data
+from sonolus.build.engine import package_engine, unpackage_data, unpackage_rom, validate_engine
+from sonolus.build.level import build_level_data, package_level_data
 from sonolus.build.project import build_project_to_collection, get_project_schema
+from sonolus.build.report import CompileReport, SourceLocations, format_attribution_text
+from sonolus.build.report import format_text as format_report
 from sonolus.script.internal.context import ProjectContextState, RuntimeChecks
 from sonolus.script.internal.error import CompilationError
 from sonolus.script.project import BuildConfig, Project
 
+if TYPE_CHECKING:
+    # The simulator and the development server are only imported by the commands that use them.
+    from sonolus.backend.profiler import RuntimeProfile
+    from sonolus.backend.simulate import SimulatedTouch, SimulationReport
+    from sonolus.build.collection import Collection
+
 
 def find_default_module() -> str | None:
     current_dir = Path.cwd()
@@ -71,14 +81,19 @@ def import_project(module_path: str) -> tuple[Project, ModuleType, set[str]] | t
         raise e from None
 
 
-def build_project(project: Project, build_dir: Path, config: BuildConfig):
+def build_project(
+    project: Project,
+    build_dir: Path,
+    config: BuildConfig,
+    project_state: ProjectContextState | None = None,
+):
     dist_dir = build_dir / "dist"
     levels_dir = dist_dir / "levels"
     shutil.rmtree(dist_dir, ignore_errors=True)
     dist_dir.mkdir(parents=True, exist_ok=True)
     levels_dir.mkdir(parents=True, exist_ok=True)
 
-    package_engine(project.engine.data, config).write(dist_dir / "engine")
+    package_engine(project.engine.data, config, project_state=project_state).write(dist_dir / "engine")
 
     for level in project.levels:
         level_path = levels_dir / level.name
@@ -89,6 +104,89 @@ def validate_project(project: Project, config: BuildConfig):
     validate_engine(project.engine.data, config)
 
 
+def simulate_project(
+    project: Project,
+    level_name: str | None,
+    config: BuildConfig,
+    duration: float,
+    fps: float,
+    touches: list[SimulatedTouch],
+    profile: RuntimeProfile | None = None,
+    batch: bool = False,
+) -> SimulationReport:
+    from sonolus.backend.simulate import PlaySimulator, SimulationError
+
+    levels = {level.name: level for level in project.levels}
+    if level_name is None:
+        if not project.levels:
+            raise SimulationError("The project has no levels to simulate")
+        level = project.levels[0]
+    elif level_name in levels:
+        level = levels[level_name]
+    else:
+        raise SimulationError(f"The project has no level named '{level_name}'")
+    config = replace(config, build_play=True, build_watch=False, build_preview=False, build_tutorial=False)
+    engine = package_engine(project.engine.data, config)
+    simulator = PlaySimulator(
+        unpackage_data(engine.play_data),
+        unpackage_rom(engine.rom),
+        build_level_data(level.data),
+        unpackage_data(engine.configuration),
+    )
+    return simulator.run(duration, fps, touches, profile, batch)
+
+
+def load_touches(path: str | None) -> list[SimulatedTouch]:
+    """Read a touch script: a JSON list of `{"start", "end", "x", "y"}` objects."""
+    from sonolus.backend.simulate import SimulatedTouch
+
+    if path is None:
+        return []
+    entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [SimulatedTouch(entry["start"], entry["end"], entry["x"], entry["y"]) for entry in entries]
+
+
+def run_simulation(project: Project, args: argparse.Namespace, print_stages: bool):
+    from sonolus.backend.blocks import PlayBlock
+    from sonolus.backend.profiler import RuntimeProfile, format_heatmap
+    from sonolus.backend.profiler import format_text as format_runtime_profile
+    from sonolus.backend.simulate import SimulationError
+    from sonolus.backend.simulate import format_text as format_simulation
+
+    start_time = perf_counter()
+    config = get_config(args)
+    runtime_profile = RuntimeProfile() if args.op_profile else None
+    try:
+        report = simulate_project(
+            project,
+            args.level,
+            config,
+            args.duration,
+            args.fps,
+            load_touches(args.touches),
+            runtime_profile,
+            args.batch,
+        )
+    except SimulationError as e:
+        print(f"Simulation failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    end_time = perf_counter()
+    data = report.to_dict()
+    print(format_simulation(data, top=args.top))
+    if runtime_profile is not None:
+        profile_data = runtime_profile.to_dict({block.value: block.name for block in PlayBlock})
+        print(format_runtime_profile(profile_data, top=args.top))
+        print(format_heatmap(profile_data))
+    print(f"Simulated {args.duration:g}s in {end_time - start_time:.2f}s")
+    if args.output:
+        Path(args.output).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        print(f"Wrote simulation report to {args.output}")
+    if runtime_profile is not None:
+        Path(args.op_profile).write_text(json.dumps(profile_data, indent=2), encoding="utf-8")
+        print(f"Wrote runtime profile to {args.op_profile}")
+    emit_profile(args, print_stages=print_stages)
+
+
 def build_collection(
     project: Project,
     build_dir: Path,
@@ -136,10 +234,20 @@ def get_config(args: argparse.Namespace) -> BuildConfig:
         build_preview=build_preview,
         build_tutorial=build_tutorial,
         runtime_checks=get_runtime_checks(args),
+        jobs=getattr(args, "jobs", 1),
+        workers=getattr(args, "workers", 1),
+        concurrent_modes=getattr(args, "concurrent_modes", False),
+        cache_dir=get_cache_dir(args),
         verbose=hasattr(args, "verbose") and args.verbose,
     )
 
 
+def get_cache_dir(args: argparse.Namespace) -> Path | None:
+    if getattr(args, "no_cache", False) or getattr(args, "build_dir", None) is None:
+        return None
+    return Path(args.build_dir) / ".cache" / "opt"
+
+
 def get_runtime_checks(args: argparse.Namespace) -> RuntimeChecks:
     if hasattr(args, "runtime_checks") and args.runtime_checks:
         return {
@@ -150,14 +258,32 @@ def get_runtime_checks(args: argparse.Namespace) -> RuntimeChecks:
     return RuntimeChecks.NOTIFY_AND_TERMINATE if args.command == "dev" else RuntimeChecks.NONE
 
 
-def emit_profile(args: argparse.Namespace) -> None:
+def emit_profile(args: argparse.Namespace, *, print_stages: bool = True) -> None:
     """Print / write the accumulated compile profile if profiling is enabled."""
-    if profiling.enabled:
+    if profiling.enabled and print_stages:
         print(profiling.format_text(), file=sys.stderr)
     json_path = getattr(args, "profile_json", None)
     if json_path:
         Path(json_path).write_text(json.dumps(profiling.summary(), indent=2), encoding="utf-8")
         print(f"Wrote compile profile to {json_path}", file=sys.stderr)
+    trace_path = getattr(args, "profile_trace", None)
+    if trace_path:
+        profiling.write_trace(trace_path)
+        print(f"Wrote compile timeline to {trace_path}", file=sys.stderr)
+
+
+def emit_report(args: argparse.Namespace, report: CompileReport | None) -> None:
+    """Write the per-callback compile report and node attribution and print their top-N tables."""
+    if report is None:
+        return
+    if args.report:
+        data = report.write(args.report, top=args.report_top)
+        print(format_report(data))
+        print(f"Wrote compile report to {args.report}")
+    if args.node_attribution:
+        data = report.write_attribution(args.node_attribution, top=args.report_top)
+        print(format_attribution_text(data, top=args.report_top))
+        print(f"Wrote node attribution to {args.node_attribution}")
 
 
 def main():
@@ -194,6 +320,34 @@ def main():
         build_components.add_argument("--preview", action="store_true", help="Build preview component")
         build_components.add_argument("--tutorial", action="store_true", help="Build tutorial component")
 
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            metavar="N",
+            help="Optimize callbacks on N threads (default: 1); the output is identical for any N",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            metavar="N",
+            help="Optimize callbacks in N worker processes (default: 1); overrides --jobs when greater than 1",
+        )
+
+        parser.add_argument(
+            "--concurrent-modes",
+            action="store_true",
+            help="Build the engine modes concurrently in worker processes; the output is identical",
+        )
+
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Do not read or write the cache of optimized callbacks in the build directory",
+        )
+
         parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output")
 
         profile_group = parser.add_argument_group("compile profiling")
@@ -203,6 +357,11 @@ def main():
         profile_group.add_argument(
             "--profile-json", metavar="PATH", help="Write per-stage compile timings as JSON to PATH"
         )
+        profile_group.add_argument(
+            "--profile-trace",
+            metavar="PATH",
+            help="Write a per-callback compile timeline to PATH in Chrome trace format (opens in Perfetto)",
+        )
 
     build_parser = subparsers.add_parser("build")
     build_parser.add_argument(
@@ -213,6 +372,24 @@ def main():
     )
     build_parser.add_argument("--build-dir", type=str, default="./build")
     add_common_arguments(build_parser)
+    report_group = build_parser.add_argument_group("compile report")
+    report_group.add_argument(
+        "--report",
+        metavar="PATH",
+        help="Write per-callback compile time, node counts and temporary memory usage as JSON to PATH",
+    )
+    report_group.add_argument(
+        "--report-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of callbacks in each top-N table of the report (default: 10)",
+    )
+    report_group.add_argument(
+        "--node-attribution",
+        metavar="PATH",
+        help="Write the emitted node counts per source line and function as JSON to PATH (bypasses the cache)",
+    )
 
     dev_parser = subparsers.add_parser("dev")
     dev_parser.add_argument(
@@ -242,10 +419,61 @@ def main():
     )
     add_common_arguments(check_parser)
 
+    simulate_parser = subparsers.add_parser("simulate")
+    simulate_parser.add_argument(
+        "module",
+        type=str,
+        nargs="?",
+        help="Module path (e.g., 'module.name'). If omitted, will auto-detect if only one module exists.",
+    )
+    simulate_parser.add_argument("--build-dir", type=str, default="./build")
+    simulate_parser.add_argument("--level", metavar="NAME", help="Level to simulate (default: the first level)")
+    simulate_parser.add_argument(
+        "--duration", type=float, default=60.0, metavar="SECONDS", help="Time to simulate (default: 60)"
+    )
+    simulate_parser.add_argument("--fps", type=float, default=60.0, help="Frames per second (default: 60)")
+    simulate_parser.add_argument(
+        "--touches", metavar="PATH", help='Touch script: a JSON list of {"start", "end", "x", "y"} objects'
+    )
+    simulate_parser.add_argument("--output", metavar="PATH", help="Write the per-frame node counts as JSON to PATH")
+    simulate_parser.add_argument(
+        "--op-profile",
+        metavar="PATH",
+        help="Count the ops and memory accesses of each callback and write them as JSON to PATH",
+    )
+    simulate_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Run updateParallel for all entities of an archetype at once where possible (requires NumPy)",
+    )
+    simulate_parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of callbacks and archetypes in the printed tables (default: 10)",
+    )
+    add_common_arguments(simulate_parser)
+
     args = parser.parse_args()
 
-    if args.command == "dev" and (getattr(args, "profile", False) or getattr(args, "profile_json", None)):
-        parser.error("--profile/--profile-json are not supported for 'dev'; use 'build' or 'check' instead")
+    profile_requested = any(getattr(args, attr, None) for attr in ("profile", "profile_json", "profile_trace"))
+    if args.command == "dev" and profile_requested:
+        parser.error(
+            "--profile/--profile-json/--profile-trace are not supported for 'dev'; use 'build' or 'check' instead"
+        )
+
+    if getattr(args, "jobs", 1) < 1:
+        parser.error("--jobs must be at least 1")
+
+    if getattr(args, "workers", 1) < 1:
+        parser.error("--workers must be at least 1")
+
+    if getattr(args, "report_top", 1) < 1:
+        parser.error("--report-top must be at least 1")
+
+    if args.command == "simulate" and (args.duration <= 0 or args.fps <= 0 or args.top < 1):
+        parser.error("--duration and --fps must be positive and --top at least 1")
 
     if not args.module:
         default_module = find_default_module()
@@ -256,7 +484,7 @@ def main():
         else:
             parser.error("Module argument is required when multiple or no modules are found")
 
-    if args.command in {"build", "check", "dev"}:
+    if args.command in {"build", "check", "dev", "simulate"}:
         if hasattr(args, "gc") and args.gc:
             gc.enable()
         elif hasattr(args, "no_gc") and args.no_gc:
@@ -273,7 +501,11 @@ def main():
     print(f"Project imported in {end_time - start_time:.2f}s")
 
     # Enable profiling (if requested) after the import so only the build is timed.
-    if getattr(args, "profile", False) or getattr(args, "profile_json", None):
+    # The report takes its timings from the timeline, but prints no stage table itself.
+    print_stages = profiling.enabled or profile_requested
+    if getattr(args, "profile_trace", None) or getattr(args, "report", None):
+        profiling.enable_trace()
+    elif profile_requested:
         profiling.enable()
     if profiling.enabled:
         profiling.reset()
@@ -283,11 +515,19 @@ def main():
             build_dir = Path(args.build_dir)
             start_time = perf_counter()
             config = get_config(args)
-            build_project(project, build_dir, config)
+            project_state = ProjectContextState.from_build_config(config)
+            if args.report or args.node_attribution:
+                project_state.compile_report = CompileReport(config.cost_model)
+            if args.node_attribution:
+                project_state.source_locations = SourceLocations()
+            build_project(project, build_dir, config, project_state)
             end_time = perf_counter()
             print(f"Project built successfully to '{build_dir.resolve()}' in {end_time - start_time:.2f}s")
-            emit_profile(args)
+            emit_profile(args, print_stages=print_stages)
+            emit_report(args, project_state.compile_report)
         elif args.command == "dev":
+            from sonolus.build.dev_server import run_server
+
             build_dir = Path(args.build_dir)
             config = get_config(args)
             run_server(
@@ -301,7 +541,9 @@ def main():
             validate_project(project, config)
             end_time = perf_counter()
             print(f"Project validation completed successfully in {end_time - start_time:.2f}s")
-            emit_profile(args)
+            emit_profile(args, print_stages=print_stages)
+        elif args.command == "simulate":
+            run_simulation(project, args, print_stages)
     except CompilationError:
         if args.verbose:
             raise
@@ -3,7 +3,6 @@ from __future__ import annotations
 import gzip
 import hashlib
 import json
-import urllib.request
 import warnings
 import zipfile
 from io import BytesIO
@@ -332,6 +331,9 @@ class Srl(TypedDict):
 def load_asset(value: Asset) -> bytes:
     match value:
         case str() if value.startswith(("http://", "https://")):
+            # Importing urllib.request is slow, and most projects have no remote assets.
+            import urllib.request
+
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
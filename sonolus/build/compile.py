@@ -1,10 +1,12 @@
 from collections.abc import Callable
 
 from sonolus.backend._opt import driver
+from sonolus.backend._opt.ir import Func, marshal_context
 from sonolus.backend.ir import IRConst, IRInstr
 from sonolus.backend.mode import Mode
 from sonolus.backend.ops import Op
 from sonolus.backend.optimize import OptimizationLevel, profiling
+from sonolus.backend.optimize.cache import CompileCache
 from sonolus.backend.optimize.flow import BasicBlock
 from sonolus.script.archetype import _BaseArchetype
 from sonolus.script.internal.callbacks import CallbackInfo
@@ -17,7 +19,6 @@ from sonolus.script.internal.context import (
     ctx,
     using_ctx,
 )
-from sonolus.script.internal.error import CompilationError
 from sonolus.script.internal.visitor import compile_and_call_at_definition
 from sonolus.script.num import _is_num
 
@@ -29,6 +30,9 @@ def compile_mode(
     global_callbacks: list[tuple[CallbackInfo, Callable]] | None,
     level: OptimizationLevel | None = None,
     validate_only: bool = False,
+    jobs: int = 1,
+    cache: CompileCache | None = None,
+    workers: int = 1,
 ) -> dict:
     """Delegates to `sonolus.backend._opt.driver.compile_mode`; this wrapper keeps `compile_mode` importable from here (engine.py imports it)."""
     return driver.compile_mode(
@@ -36,9 +40,12 @@ def compile_mode(
         project_state,
         archetypes,
         global_callbacks,
-        callback_to_cfg,
+        callback_to_arena,
         level,
         validate_only,
+        jobs,
+        cache,
+        workers,
     )
 
 
@@ -49,25 +56,53 @@ def callback_to_cfg(
     name: str,
     archetype: type[_BaseArchetype] | None = None,
 ) -> BasicBlock:
+    return context_to_cfg(_trace_callback(project_state, mode_state, callback, name, archetype))
+
+
+def callback_to_arena(
+    project_state: ProjectContextState,
+    mode_state: ModeContextState,
+    callback: Callable,
+    name: str,
+    archetype: type[_BaseArchetype] | None = None,
+) -> Func:
+    """Like `callback_to_cfg`, but marshals the trace straight into the optimizer's arena.
+
+    The result is the arena `callback_to_cfg`'s CFG would be marshalled into, without building the CFG first.
+    """
+    context = _trace_callback(project_state, mode_state, callback, name, archetype)
+    t0 = profiling.now_ns() if profiling.enabled else 0
+    try:
+        return marshal_context(context, mode_state.mode, name)
+    finally:
+        if profiling.enabled:
+            profiling.record("marshal_in", profiling.now_ns() - t0)
+
+
+def _trace_callback(
+    project_state: ProjectContextState,
+    mode_state: ModeContextState,
+    callback: Callable,
+    name: str,
+    archetype: type[_BaseArchetype] | None,
+) -> Context:
     t0 = profiling.now_ns() if profiling.enabled else 0
     try:
-        # Default to no_eval=True for performance unless there's an error.
-        return _callback_to_cfg(project_state, mode_state, callback, name, archetype, no_eval=True)
-    except CompilationError:
-        return _callback_to_cfg(project_state, mode_state, callback, name, archetype, no_eval=False)
+        # Errors are still reported at the nodes that raised them, so there is no need to trace again without no_eval.
+        return _trace(project_state, mode_state, callback, name, archetype, no_eval=True)
     finally:
         if profiling.enabled:
             profiling.record("frontend", profiling.now_ns() - t0)
 
 
-def _callback_to_cfg(
+def _trace(
     project_state: ProjectContextState,
     mode_state: ModeContextState,
     callback: Callable,
     name: str,
     archetype: type[_BaseArchetype] | None,
     no_eval: bool,
-) -> BasicBlock:
+) -> Context:
     callback_state = CallbackContextState(name, no_eval=no_eval)
     context = Context(project_state, mode_state, callback_state)
     with using_ctx(context):
@@ -77,4 +112,4 @@ def _callback_to_cfg(
             result = compile_and_call_at_definition(callback)
         if _is_num(result):
             ctx().add_statements(IRInstr(Op.Break, [IRConst(1), result.ir()]))
-    return context_to_cfg(context)
+    return context
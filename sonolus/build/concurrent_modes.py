@@ -0,0 +1,233 @@
+"""Building the engine modes concurrently, with output identical to a serial build.
+
+A serial build traces play, watch, preview, and tutorial in that order against one
+`ProjectContextState`, so ROM offsets, constant indexes, and debug-message codes are
+assigned in a single first-touch order shared by all modes. Here each mode is built
+in a forked worker process against its own copy of those tables, seeded with the
+tables of the previous build, and the worker logs every entry it looks up in
+first-touch order.
+
+The logs are then replayed in the fixed mode order into the real project state,
+which assigns every entry exactly the index a serial build would. A mode whose
+worker used those same indexes keeps its output. A mode that saw a different index
+(entries added or reordered since the seed was taken) is rebuilt in this process
+against the merged tables, which by then hold every entry it uses at its final
+index. Without a seed (e.g. the first build) the modes are built serially and their
+tables become the seed of the next build.
+"""
+
+from __future__ import annotations
+
+import marshal
+import multiprocessing
+import os
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from sonolus.backend.optimize import profiling
+from sonolus.build.report import CompileReport, SourceLocations
+from sonolus.script.internal.context import ProjectContextState
+
+if TYPE_CHECKING:
+    from sonolus.script.project import BuildConfig
+
+type ModeBuilder = Callable[..., dict]
+
+# Bump when the layout of the seed file changes.
+TABLES_FORMAT_VERSION = 1
+
+_TABLES_FILE_NAME = "mode-tables"
+
+
+class SharedTables(NamedTuple):
+    """The engine-wide, first-touch-ordered tables of a build, in index order."""
+
+    rom: tuple[tuple[float, ...], ...]
+    constants: tuple[Any, ...]
+    debug_messages: tuple[str, ...]
+
+
+def snapshot_tables(project_state: ProjectContextState) -> SharedTables:
+    return SharedTables(
+        rom=tuple(project_state.rom.indexes),
+        constants=tuple(project_state.const_mappings),
+        debug_messages=tuple(project_state.debug_str_mappings),
+    )
+
+
+def seed_tables(project_state: ProjectContextState, tables: SharedTables) -> None:
+    """Fill the tables of a fresh `project_state` so every entry gets its index in `tables`."""
+    for values in tables.rom:
+        # Indexing the ROM allocates the entry.
+        project_state.rom[values]
+    for value in tables.constants:
+        project_state.const_mappings[value] = len(project_state.const_mappings)
+    for message in tables.debug_messages:
+        project_state.debug_str_mappings[message] = len(project_state.debug_str_mappings) + 1
+
+
+_last_tables: SharedTables | None = None
+
+
+def previous_tables(cache_dir: os.PathLike | None) -> SharedTables | None:
+    """Return the tables of the last build in this process, else those saved in `cache_dir`."""
+    if _last_tables is not None or cache_dir is None:
+        return _last_tables
+    try:
+        version, *tables = marshal.loads((Path(cache_dir) / _TABLES_FILE_NAME).read_bytes())
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if version != TABLES_FORMAT_VERSION:
+        return None
+    return SharedTables(*tables)
+
+
+def remember_tables(project_state: ProjectContextState, cache_dir: os.PathLike | None) -> None:
+    """Keep the tables of a finished build as the seed of the next one."""
+    global _last_tables  # noqa: PLW0603
+    _last_tables = tables = snapshot_tables(project_state)
+    if cache_dir is None:
+        return
+    path = Path(cache_dir) / _TABLES_FILE_NAME
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        data = marshal.dumps((TABLES_FORMAT_VERSION, *tables))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+    except (OSError, ValueError):
+        # Unmarshallable constants or an unwritable directory: the seed just stays in memory.
+        with suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+
+
+class _TableLog:
+    """Stands in for a `TraceRecorder`, keeping only the log of shared-table lookups."""
+
+    def __init__(self):
+        self.entries: list[tuple[str, Any, int]] = []
+        self._seen: set[tuple[str, Any]] = set()
+
+    def log_entry(self, kind: str, key: Any, index: int) -> None:
+        if (kind, key) not in self._seen:
+            self._seen.add((kind, key))
+            self.entries.append((kind, key, index))
+
+    def add_function(self, fn: Any, source_file: str, node: Any) -> None:
+        pass
+
+    def log_global(self, info: Any, offset: int) -> None:
+        pass
+
+    def mark_opaque(self) -> None:
+        pass
+
+
+def _replay(project_state: ProjectContextState, entries: list[tuple[str, Any, int]]) -> bool:
+    """Apply a worker's log to `project_state`; return whether every index matched."""
+    matched = True
+    for kind, key, index in entries:
+        match kind:
+            case "rom":
+                current = project_state.rom[key].index
+            case "const":
+                current = project_state.const_mappings.setdefault(key, len(project_state.const_mappings))
+            case "debug":
+                current = project_state.debug_str_mappings.setdefault(key, len(project_state.debug_str_mappings) + 1)
+            case _:
+                raise ValueError(f"Unexpected table log entry kind {kind!r}")
+        # Keep going after a mismatch: later entries must still be assigned in order.
+        matched = matched and current == index
+    return matched
+
+
+# Set in the parent right before the pool forks; the workers inherit it.
+_worker_state: tuple[Mapping[str, ModeBuilder], BuildConfig, SharedTables, bool, bool] | None = None
+
+
+def _build_in_worker(name: str):
+    builders, config, tables, reporting, attributing = _worker_state
+    if profiling.tracing:
+        # Forked with the parent's timeline; only this mode's events are sent back.
+        profiling.take_events()
+    project_state = ProjectContextState.from_build_config(config)
+    seed_tables(project_state, tables)
+    log = _TableLog()
+    project_state.trace_recorder = log
+    project_state.rom.recorder = log
+    if reporting:
+        project_state.compile_report = CompileReport(config.cost_model)
+    if attributing:
+        project_state.source_locations = SourceLocations()
+    data = builders[name](project_state=project_state)
+    events = profiling.take_events() if profiling.tracing else None
+    report = project_state.compile_report if reporting else None
+    return data, log.entries, project_state.visit_stats, events, report
+
+
+def build_modes(
+    builders: Mapping[str, ModeBuilder],
+    project_state: ProjectContextState,
+    config: BuildConfig,
+    seed: SharedTables | None,
+) -> dict[str, dict]:
+    """Build every mode, concurrently when a seed is available; returns the mode data by name.
+
+    `builders` must be in the serial build order. Each is called with a `project_state`
+    keyword argument.
+    """
+    global _worker_state  # noqa: PLW0603
+    names = list(builders)
+    if seed is None or len(names) < 2 or "fork" not in multiprocessing.get_all_start_methods():
+        return {name: builders[name](project_state=project_state) for name in names}
+
+    _worker_state = (
+        builders,
+        config,
+        seed,
+        project_state.compile_report is not None,
+        project_state.source_locations is not None,
+    )
+    outcomes = {}
+    try:
+        with ProcessPoolExecutor(max_workers=len(names), mp_context=multiprocessing.get_context("fork")) as executor:
+            futures = {name: executor.submit(_build_in_worker, name) for name in names}
+            for name, future in futures.items():
+                try:
+                    outcomes[name] = future.result()
+                except Exception:
+                    # Rebuilt below, so the error is reported exactly as in a serial build.
+                    outcomes[name] = None
+    finally:
+        _worker_state = None
+
+    results: dict[str, dict | None] = {}
+    for i, name in enumerate(names):
+        outcome = outcomes[name]
+        if outcome is None:
+            # Without this mode's log the later modes cannot be merged either.
+            for rest in names[i:]:
+                results[rest] = builders[rest](project_state=project_state)
+            break
+        data, entries, visit_stats, events, report = outcome
+        if events is not None:
+            profiling.add_events(events)
+        if _replay(project_state, entries):
+            results[name] = data
+            for function_name, stats in visit_stats.items():
+                merged = project_state.visit_stats.setdefault(function_name, stats)
+                if merged is not stats:
+                    merged.total_time += stats.total_time
+                    merged.own_time += stats.own_time
+                    merged.call_count += stats.call_count
+            if report is not None:
+                project_state.compile_report.merge(report)
+        else:
+            results[name] = None
+    for name in names:
+        if results[name] is None:
+            results[name] = builders[name](project_state=project_state)
+    return results
@@ -20,8 +20,9 @@ from time import perf_counter, time
 from typing import TYPE_CHECKING, NamedTuple, Protocol
 
 from sonolus.backend.excepthook import print_simple_traceback
-from sonolus.backend.utils import get_function, get_functions, get_tree_from_file
+from sonolus.backend.utils import get_function, source_cache
 from sonolus.build.collection import Collection
+from sonolus.build.incremental import TraceCache
 from sonolus.build.project import (
     build_project_to_existing_collection,
     load_resources_files_to_collection,
@@ -99,6 +100,7 @@ class ServerState:
     project_state: ProjectContextState
     collection: Collection
     last_build_time: float
+    trace_cache: TraceCache
 
 
 class Command(Protocol):
@@ -121,8 +123,8 @@ class RebuildCommand:
             return
 
         get_function.cache_clear()
-        get_tree_from_file.cache_clear()
-        get_functions.cache_clear()
+        # Unchanged files keep their parsed trees; only edited ones are parsed again.
+        source_cache.revalidate()
         clear_frontend_caches()
         print("Rebuilding...")
         try:
@@ -131,7 +133,10 @@ class RebuildCommand:
             if path_was_modified_after(server_state.project.resources, server_state.last_build_time):
                 server_state.collection = load_resources_files_to_collection(server_state.project.resources)
 
-            server_state.project_state = ProjectContextState.from_build_config(server_state.config)
+            server_state.project_state = ProjectContextState.from_build_config(
+                server_state.config, trace_cache=server_state.trace_cache
+            )
+            server_state.trace_cache.begin_build()
             server_state.project = project_module.project
             build_project_to_existing_collection(
                 server_state.project,
@@ -142,7 +147,11 @@ class RebuildCommand:
             write_collection(server_state.collection, server_state.build_dir, clear=False)
             server_state.last_build_time = time()
             end_time = perf_counter()
-            print(f"Rebuild completed in {end_time - start_time:.2f} seconds")
+            trace_cache = server_state.trace_cache
+            print(
+                f"Rebuild completed in {end_time - start_time:.2f} seconds "
+                f"({trace_cache.reused} of {trace_cache.reused + trace_cache.traced} callbacks unchanged)"
+            )
         except CompilationError:
             exc_info = sys.exc_info()
             if server_state.config.verbose:
@@ -294,7 +303,8 @@ def run_server(
 ):
     from sonolus.build.cli import build_collection
 
-    project_state = ProjectContextState.from_build_config(config)
+    trace_cache = TraceCache()
+    project_state = ProjectContextState.from_build_config(config, trace_cache=trace_cache)
 
     start_time = perf_counter()
     collection = build_collection(project, build_dir, config, project_state=project_state)
@@ -331,6 +341,7 @@ def run_server(
                 project_state=project_state,
                 collection=collection,
                 last_build_time=time(),
+                trace_cache=trace_cache,
             )
 
             threading.Thread(target=httpd.serve_forever, daemon=True).start()
@@ -3,10 +3,13 @@ import json
 import struct
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
 from sonolus.backend.mode import Mode
+from sonolus.backend.optimize.cache import CompileCache
 from sonolus.build.compile import compile_mode
+from sonolus.build.concurrent_modes import build_modes, previous_tables, remember_tables
 from sonolus.script.archetype import _BaseArchetype
 from sonolus.script.bucket import Buckets
 from sonolus.script.effect import Effects
@@ -74,55 +77,71 @@ def package_engine(
     watch_mode = engine.watch if config.build_watch else empty_watch_mode()
     preview_mode = engine.preview if config.build_preview else empty_preview_mode()
     tutorial_mode = engine.tutorial if config.build_tutorial else empty_tutorial_mode()
+    cache = CompileCache(config.cache_dir) if config.cache_dir is not None else None
 
-    # Modes are built sequentially. The frontend tracing of every callback -- across
-    # all four modes -- runs in one fixed order, which keeps the engine-wide,
+    # Modes are built in this fixed order. The frontend tracing of every callback --
+    # across all four modes -- runs in one fixed order, which keeps the engine-wide,
     # first-touch-ordered shared state deterministic (project_state.rom and
-    # const/debug-string maps are shared across modes).
-    play_data = build_play_mode(
-        archetypes=play_mode.archetypes,
-        skin=play_mode.skin,
-        effects=play_mode.effects,
-        particles=play_mode.particles,
-        buckets=play_mode.buckets,
-        project_state=project_state,
-        config=config,
-    )
-    watch_data = build_watch_mode(
-        archetypes=watch_mode.archetypes,
-        skin=watch_mode.skin,
-        effects=watch_mode.effects,
-        particles=watch_mode.particles,
-        buckets=watch_mode.buckets,
-        project_state=project_state,
-        update_spawn=watch_mode.update_spawn,
-        config=config,
-    )
-    preview_data = build_preview_mode(
-        archetypes=preview_mode.archetypes,
-        skin=preview_mode.skin,
-        project_state=project_state,
-        config=config,
-    )
-    tutorial_data = build_tutorial_mode(
-        skin=tutorial_mode.skin,
-        effects=tutorial_mode.effects,
-        particles=tutorial_mode.particles,
-        instructions=tutorial_mode.instructions,
-        instruction_icons=tutorial_mode.instruction_icons,
-        preprocess=tutorial_mode.preprocess,
-        navigate=tutorial_mode.navigate,
-        update=tutorial_mode.update,
-        project_state=project_state,
-        config=config,
-    )
+    # const/debug-string maps are shared across modes). With concurrent_modes, the
+    # modes are traced in worker processes and their tables merged in this same order.
+    builders = {
+        "play": partial(
+            build_play_mode,
+            archetypes=play_mode.archetypes,
+            skin=play_mode.skin,
+            effects=play_mode.effects,
+            particles=play_mode.particles,
+            buckets=play_mode.buckets,
+            config=config,
+            cache=cache,
+        ),
+        "watch": partial(
+            build_watch_mode,
+            archetypes=watch_mode.archetypes,
+            skin=watch_mode.skin,
+            effects=watch_mode.effects,
+            particles=watch_mode.particles,
+            buckets=watch_mode.buckets,
+            update_spawn=watch_mode.update_spawn,
+            config=config,
+            cache=cache,
+        ),
+        "preview": partial(
+            build_preview_mode,
+            archetypes=preview_mode.archetypes,
+            skin=preview_mode.skin,
+            config=config,
+            cache=cache,
+        ),
+        "tutorial": partial(
+            build_tutorial_mode,
+            skin=tutorial_mode.skin,
+            effects=tutorial_mode.effects,
+            particles=tutorial_mode.particles,
+            instructions=tutorial_mode.instructions,
+            instruction_icons=tutorial_mode.instruction_icons,
+            preprocess=tutorial_mode.preprocess,
+            navigate=tutorial_mode.navigate,
+            update=tutorial_mode.update,
+            config=config,
+            cache=cache,
+        ),
+    }
+    if config.concurrent_modes and project_state.trace_cache is None:
+        mode_data = build_modes(builders, project_state, config, previous_tables(config.cache_dir))
+        remember_tables(project_state, config.cache_dir)
+    else:
+        mode_data = {name: build(project_state=project_state) for name, build in builders.items()}
+
+    if cache is not None:
+        cache.prune()
 
     return PackagedEngine(
         configuration=package_data(configuration),
-        play_data=package_data(play_data),
-        watch_data=package_data(watch_data),
-        preview_data=package_data(preview_data),
-        tutorial_data=package_data(tutorial_data),
+        play_data=package_data(mode_data["play"]),
+        watch_data=package_data(mode_data["watch"]),
+        preview_data=package_data(mode_data["preview"]),
+        tutorial_data=package_data(mode_data["tutorial"]),
         rom=package_rom(project_state.rom),
     )
 
@@ -207,6 +226,7 @@ def build_play_mode(
     project_state: ProjectContextState,
     config: BuildConfig,
     validate_only: bool = False,
+    cache: CompileCache | None = None,
 ):
     return {
         **compile_mode(
@@ -216,6 +236,9 @@ def build_play_mode(
             global_callbacks=None,
             level=config.passes,
             validate_only=validate_only,
+            jobs=config.jobs,
+            cache=cache,
+            workers=config.workers,
         ),
         "skin": build_skin(skin),
         "effect": build_effects(effects),
@@ -234,6 +257,7 @@ def build_watch_mode(
     update_spawn: Callable[[], float],
     config: BuildConfig,
     validate_only: bool = False,
+    cache: CompileCache | None = None,
 ):
     return {
         **compile_mode(
@@ -243,6 +267,9 @@ def build_watch_mode(
             global_callbacks=[(update_spawn_callback, update_spawn)],
             level=config.passes,
             validate_only=validate_only,
+            jobs=config.jobs,
+            cache=cache,
+            workers=config.workers,
         ),
         "skin": build_skin(skin),
         "effect": build_effects(effects),
@@ -257,6 +284,7 @@ def build_preview_mode(
     project_state: ProjectContextState,
     config: BuildConfig,
     validate_only: bool = False,
+    cache: CompileCache | None = None,
 ):
     return {
         **compile_mode(
@@ -266,6 +294,9 @@ def build_preview_mode(
             global_callbacks=None,
             level=config.passes,
             validate_only=validate_only,
+            jobs=config.jobs,
+            cache=cache,
+            workers=config.workers,
         ),
         "skin": build_skin(skin),
     }
@@ -283,6 +314,7 @@ def build_tutorial_mode(
     project_state: ProjectContextState,
     config: BuildConfig,
     validate_only: bool = False,
+    cache: CompileCache | None = None,
 ):
     return {
         **compile_mode(
@@ -296,6 +328,9 @@ def build_tutorial_mode(
             ],
             level=config.passes,
             validate_only=validate_only,
+            jobs=config.jobs,
+            cache=cache,
+            workers=config.workers,
         ),
         "skin": build_skin(skin),
         "effect": build_effects(effects),
@@ -340,6 +375,11 @@ def package_rom(rom: ReadOnlyMemory) -> bytes:
     return gzip.compress(bytes(output), mtime=0)
 
 
+def unpackage_rom(data: bytes) -> list[float]:
+    raw = gzip.decompress(data)
+    return [value for (value,) in struct.iter_unpack("<f", raw)]
+
+
 def package_data(value: JsonValue) -> bytes:
     json_data = json.dumps(value, separators=(",", ":")).encode("utf-8")
     return gzip.compress(json_data, mtime=0)
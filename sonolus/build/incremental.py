@@ -0,0 +1,426 @@
+"""Incremental rebuilds: reuse the output of callbacks whose dependencies did not change.
+
+The development server keeps one `TraceCache` across rebuilds. While a callback is
+traced, a `TraceRecorder` installed on the `ProjectContextState` collects:
+
+* the source files of every function the frontend visited (by content hash), plus
+  the files defining the archetype's classes and any class/function/module read
+  from a global,
+* a fingerprint of every global and closure variable those functions can read, and
+* a log of the first-touch interactions with the engine-wide state that callbacks
+  share: ROM entries, constant and debug-message mappings, and allocations of
+  global memory.
+
+On the next rebuild, a callback whose files and globals are unchanged is not
+traced again. Its log is first checked against the current state -- every entry
+must resolve to the index recorded last time, given the callbacks rebuilt before
+it -- and then replayed, so the ROM layout and every index come out exactly as a
+full rebuild would produce them and the recorded `EngineNode` can be reused. If
+any check fails, the callback is traced as usual.
+
+Anything the recorder cannot reproduce (a global with no stable fingerprint, a
+closure of a function created at runtime, a new archetype registration) marks the
+callback as always traced.
+"""
+
+from __future__ import annotations
+
+import ast
+import sys
+from enum import Enum
+from hashlib import blake2b
+from pathlib import Path
+from types import FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sonolus.backend.node import EngineNode
+    from sonolus.script.internal.context import ModeContextState, ProjectContextState
+
+_MISSING = object()
+
+
+class _Opaque(Exception):  # noqa: N818
+    """Raised when a dependency has no stable fingerprint."""
+
+
+class TraceCache:
+    """Recorded dependencies and outputs of traced callbacks, kept across rebuilds."""
+
+    def __init__(self):
+        self._entries: dict[tuple, _Entry] = {}
+        self._file_hashes: dict[str, str | None] = {}
+        self._global_names: dict[int, frozenset[str]] = {}
+        self.reused = 0
+        self.traced = 0
+
+    def begin_build(self) -> None:
+        """Forget per-build memos (file hashes, parsed names) and reset the counters."""
+        self._file_hashes.clear()
+        self._global_names.clear()
+        self.reused = 0
+        self.traced = 0
+
+    def lookup(
+        self,
+        project_state: ProjectContextState,
+        mode_state: ModeContextState,
+        archetype: type | None,
+        callback: str,
+        level: Any,
+    ) -> EngineNode | None:
+        """Return the recorded node of a callback if it can be reused, replaying its log."""
+        entry = self._entries.get(_entry_key(mode_state, archetype, callback))
+        if entry is None or entry.stamp != _stamp(project_state, mode_state, level):
+            return None
+        if any(self.file_hash(path) != digest for path, digest in entry.files.items()):
+            return None
+        try:
+            if any(_current_fingerprint(key, set()) != fp for key, fp in entry.globals.items()):
+                return None
+            plan = _plan_replay(entry.log, project_state, mode_state)
+        except _Opaque:
+            return None
+        if plan is None:
+            return None
+        _apply_replay(plan, project_state, mode_state)
+        self.reused += 1
+        return entry.node
+
+    def recorder(
+        self,
+        project_state: ProjectContextState,
+        mode_state: ModeContextState,
+        archetype: type | None,
+        callback: str,
+        level: Any,
+    ) -> TraceRecorder:
+        """Create a recorder for one callback; install it with `TraceRecorder.installed`."""
+        self.traced += 1
+        recorder = TraceRecorder(
+            self, _entry_key(mode_state, archetype, callback), _stamp(project_state, mode_state, level)
+        )
+        if archetype is not None:
+            for cls in archetype.__mro__:
+                recorder.add_module_file(cls.__module__)
+        return recorder
+
+    def file_hash(self, path: str) -> str | None:
+        digest = self._file_hashes.get(path, _MISSING)
+        if digest is _MISSING:
+            try:
+                digest = blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+            except OSError:
+                digest = None
+            self._file_hashes[path] = digest
+        return digest
+
+    def global_names(self, node: ast.AST) -> frozenset[str]:
+        names = self._global_names.get(id(node))
+        if names is None:
+            names = frozenset(n.id for n in ast.walk(node) if isinstance(n, ast.Name))
+            self._global_names[id(node)] = names
+        return names
+
+
+class TraceRecorder:
+    """Collects the dependencies and shared-state log of one callback while it is traced."""
+
+    def __init__(self, cache: TraceCache, key: tuple, stamp: tuple):
+        self.cache = cache
+        self.key = key
+        self.stamp = stamp
+        self.files: dict[str, str | None] = {}
+        self.globals: dict[tuple, Any] = {}
+        self.log: list[tuple] = []
+        self.opaque = False
+        self._seen: set[Any] = set()
+
+    def installed(self, project_state: ProjectContextState):
+        """Context manager making this the active recorder of `project_state`."""
+        return _Installed(self, project_state)
+
+    def add_function(self, fn: Any, source_file: str, node: ast.AST) -> None:
+        """Record a function visited by the frontend."""
+        func = fn.__func__ if isinstance(fn, MethodType) else fn
+        code = getattr(func, "__code__", None)
+        if code in self._seen:
+            return
+        self._seen.add(code)
+        self._add_file(source_file)
+        fn_globals = getattr(func, "__globals__", None)
+        if fn_globals is None:
+            self.opaque = True
+            return
+        module = fn_globals.get("__name__")
+        try:
+            for name in self.cache.global_names(node):
+                key = ("global", module, name)
+                if key not in self.globals and name in fn_globals:
+                    self.globals[key] = self._fingerprint(fn_globals[name])
+            if func.__closure__:
+                if "<locals>" in func.__qualname__ or module not in sys.modules:
+                    raise _Opaque
+                for var, cell in zip(code.co_freevars, func.__closure__, strict=True):
+                    key = ("closure", module, func.__qualname__, var)
+                    self.globals[key] = self._fingerprint(cell.cell_contents)
+        except _Opaque:
+            self.opaque = True
+
+    def add_module_file(self, module_name: str) -> None:
+        module = sys.modules.get(module_name)
+        path = getattr(module, "__file__", None)
+        if path is not None:
+            self._add_file(path)
+
+    def mark_opaque(self) -> None:
+        self.opaque = True
+
+    def log_entry(self, kind: str, key: Any, index: int) -> None:
+        """Record a first-touch interaction with the shared state."""
+        if (kind, key) not in self._seen:
+            self._seen.add((kind, key))
+            self.log.append((kind, key, index))
+
+    def log_global(self, info: Any, offset: int) -> None:
+        if ("global", id(info)) in self._seen:
+            return
+        self._seen.add(("global", id(info)))
+        owner = getattr(info, "owner", None)
+        if owner is None:
+            self.opaque = True
+            return
+        self.add_module_file(owner.__module__)
+        self.log.append(("global", (owner.__module__, owner.__qualname__), offset))
+
+    def store(self, node: EngineNode) -> None:
+        """Keep the emitted node of the callback for the next rebuild (unless it is opaque)."""
+        if self.opaque or None in self.files.values():
+            self.cache._entries.pop(self.key, None)
+            return
+        self.cache._entries[self.key] = _Entry(self.stamp, self.files, self.globals, self.log, node)
+
+    def _add_file(self, path: str) -> None:
+        if path not in self.files:
+            self.files[path] = self.cache.file_hash(path)
+
+    def _fingerprint(self, value: Any) -> Any:
+        modules: set[str] = set()
+        fp = _fingerprint(value, modules)
+        for module in modules:
+            self.add_module_file(module)
+        return fp
+
+
+class _Installed:
+    def __init__(self, recorder: TraceRecorder, project_state: ProjectContextState):
+        self.recorder = recorder
+        self.project_state = project_state
+
+    def __enter__(self) -> TraceRecorder:
+        self.project_state.trace_recorder = self.recorder
+        self.project_state.rom.recorder = self.recorder
+        return self.recorder
+
+    def __exit__(self, *exc_info):
+        self.project_state.trace_recorder = None
+        self.project_state.rom.recorder = None
+
+
+class _Entry:
+    __slots__ = ("files", "globals", "log", "node", "stamp")
+
+    def __init__(self, stamp: tuple, files: dict, globals_: dict, log: list, node: EngineNode):
+        self.stamp = stamp
+        self.files = files
+        self.globals = globals_
+        self.log = log
+        self.node = node
+
+
+def _class_ref(cls: type) -> tuple[str, str]:
+    return cls.__module__, cls.__qualname__
+
+
+def _entry_key(mode_state: ModeContextState, archetype: type | None, callback: str) -> tuple:
+    return mode_state.mode, None if archetype is None else _class_ref(archetype), callback
+
+
+def _stamp(project_state: ProjectContextState, mode_state: ModeContextState, level: Any) -> tuple:
+    # Archetype ids, keys and scoring are baked into the emitted nodes.
+    archetypes = tuple(
+        (
+            _class_ref(type_),
+            getattr(type_, "name", None),
+            getattr(type_, "_key_", -1),
+            getattr(type_, "_is_scored_", False),
+            type_ in mode_state.compile_time_only_archetypes,
+        )
+        for type_ in mode_state.archetypes
+    )
+    return getattr(level, "name", level), project_state.runtime_checks, archetypes
+
+
+class _Identity:
+    """Fingerprint of an object with no reload-stable description: equal only to itself."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is _Identity and other.value is self.value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+
+# Nesting depth up to which plain objects are fingerprinted by their attributes.
+_MAX_DEPTH = 4
+
+
+def _fingerprint(value: Any, modules: set[str], depth: int = 0) -> Any:
+    """Return a reload-stable stand-in for `value`; adds defining modules to `modules`.
+
+    Objects without a stable description (e.g. a default repr and no attributes)
+    fall back to their identity, which survives a rebuild only for objects in
+    modules the dev server does not reload.
+    """
+    type_ = type(value)
+    if value is None or type_ in {bool, int, float, str, bytes}:
+        return type_.__name__, repr(value)
+    if type_ in {tuple, list, frozenset, set}:
+        items = sorted(value, key=repr) if type_ in {frozenset, set} else value
+        return type_.__name__, tuple(_fingerprint(item, modules, depth) for item in items)
+    if type_ is dict:
+        return "dict", tuple(
+            (_fingerprint(k, modules, depth), _fingerprint(v, modules, depth)) for k, v in value.items()
+        )
+    if isinstance(value, ModuleType):
+        modules.add(value.__name__)
+        return "module", value.__name__
+    if isinstance(value, type | FunctionType):
+        if "<locals>" in value.__qualname__:
+            raise _Opaque
+        modules.add(value.__module__)
+        return "ref", value.__module__, value.__qualname__
+    if isinstance(value, Enum):
+        modules.add(type_.__module__)
+        return "enum", _class_ref(type_), value.name
+    if hasattr(type_, "_global_info_"):
+        # An instance created by a global memory decorator (e.g. `@level_memory`).
+        modules.add(type_.__module__)
+        return "global", _class_ref(type_)
+    if type_.__repr__ is not object.__repr__:
+        text = repr(value)
+        if " at 0x" not in text:
+            modules.add(type_.__module__)
+            return "repr", _class_ref(type_), text
+    attributes = getattr(value, "__dict__", None)
+    if attributes is not None and depth < _MAX_DEPTH:
+        modules.add(type_.__module__)
+        return "object", _class_ref(type_), _fingerprint(attributes, modules, depth + 1)
+    return _Identity(value)
+
+
+def _resolve(module_name: str, qualname: str) -> Any:
+    value = sys.modules.get(module_name, _MISSING)
+    for part in qualname.split("."):
+        if value is _MISSING:
+            break
+        value = getattr(value, part, _MISSING)
+    return value
+
+
+def _current_fingerprint(key: tuple, modules: set[str]) -> Any:
+    match key:
+        case ("global", module_name, name):
+            module = sys.modules.get(module_name)
+            value = _MISSING if module is None else module.__dict__.get(name, _MISSING)
+        case ("closure", module_name, qualname, var):
+            func = _resolve(module_name, qualname)
+            code = getattr(func, "__code__", None)
+            if code is None or var not in code.co_freevars or not func.__closure__:
+                return _MISSING
+            value = func.__closure__[code.co_freevars.index(var)].cell_contents
+        case _:
+            raise _Opaque
+    if value is _MISSING:
+        return _MISSING
+    return _fingerprint(value, modules)
+
+
+def _plan_replay(log: list[tuple], project_state: ProjectContextState, mode_state: ModeContextState):
+    """Check every log entry against the current state without mutating it.
+
+    Returns the resolved entries to apply, or None if any entry would resolve to a
+    different index than when it was recorded.
+    """
+    rom = project_state.rom
+    rom_size = len(rom.values)
+    new_rom: dict[tuple, int] = {}
+    const_count = len(project_state.const_mappings)
+    new_consts: dict[Any, int] = {}
+    debug_count = len(project_state.debug_str_mappings)
+    new_debug: dict[str, int] = {}
+    new_offsets: dict[Any, int] = {}
+    new_globals: dict[Any, int] = {}
+    plan = []
+    for kind, key, index in log:
+        match kind:
+            case "rom":
+                current = rom.indexes.get(key, new_rom.get(key))
+                if current is None:
+                    current = new_rom[key] = rom_size
+                    rom_size += len(key)
+                    plan.append((kind, key))
+            case "const":
+                current = project_state.const_mappings.get(key, new_consts.get(key))
+                if current is None:
+                    current = new_consts[key] = const_count
+                    const_count += 1
+                    plan.append((kind, key))
+            case "debug":
+                current = project_state.debug_str_mappings.get(key, new_debug.get(key))
+                if current is None:
+                    debug_count += 1
+                    current = new_debug[key] = debug_count
+                    plan.append((kind, key))
+            case "global":
+                owner = _resolve(*key)
+                info = getattr(owner, "_global_info_", None)
+                if info is None or info.offset is not None:
+                    return None
+                block = info.blocks.get(mode_state.mode)
+                if block is None:
+                    return None
+                current = mode_state.environment_mappings.get(info, new_globals.get(info))
+                if current is None:
+                    current = new_offsets.get(block, mode_state.environment_offsets.get(block, 0))
+                    new_globals[info] = current
+                    new_offsets[block] = current + info.size
+                    plan.append((kind, (info, block, current)))
+            case _:
+                raise _Opaque
+        if current != index:
+            return None
+    return plan
+
+
+def _apply_replay(plan: list[tuple], project_state: ProjectContextState, mode_state: ModeContextState) -> None:
+    for kind, key in plan:
+        match kind:
+            case "rom":
+                # Indexing the ROM allocates the entry if it is not present yet.
+                project_state.rom[key]
+            case "const":
+                mappings = project_state.const_mappings
+                mappings[key] = len(mappings)
+            case "debug":
+                mappings = project_state.debug_str_mappings
+                mappings[key] = len(mappings) + 1
+            case "global":
+                info, block, offset = key
+                mode_state.environment_mappings[info] = offset
+                mode_state.environment_offsets[block] = offset + info.size
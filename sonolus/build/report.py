@@ -0,0 +1,638 @@
+"""Per-callback compile cost and node-count report (the CLI `--report` flag).
+
+For every callback a build emits, records its emitted node counts, effective node
+count, estimated runtime cost, and temporary memory usage, and joins them with the frontend and optimizer
+time the profiler attributed to that callback. Written as JSON, with top-N tables
+of the largest and most expensive callbacks, so a project can follow its engine
+size and compile cost from one build to the next.
+
+Node counts are per reference over the expanded node tree (a shared, hash-consed
+node is executed once per reference by the runtime). The effective count
+additionally counts every maximal runtime-constant subtree as a single node,
+modelling the runtime's own constant folding; `tools/metrics.py` and its gate test
+use the same analysis. The estimated cost is the expected number of weighted nodes
+evaluated per call (`sonolus.backend.optimize.cost`).
+
+With `--node-attribution`, the frontend also tags every IR statement with the
+source line it was traced from (`SourceLocations`), the optimizer carries the tag
+through to emission, and `attribute_node` splits each callback's emitted and
+effective node counts by source line, so the lines and helper functions a large
+callback's nodes come from can be found.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import warnings
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+
+from sonolus.backend._opt.ir import RUNTIME_CONSTANT_BLOCKS
+from sonolus.backend.node import FunctionNode
+from sonolus.backend.ops import Op
+from sonolus.backend.optimize import profiling
+from sonolus.backend.optimize.cost import CostModel, estimate_cost
+from sonolus.script.internal import callbacks
+from sonolus.script.internal.error import CompilationError
+
+# Block id of the temporary memory block; the same in every mode.
+TEMPORARY_MEMORY_BLOCK = 10000
+
+# Metrics the top-N tables rank callbacks by, with their table titles.
+TOP_METRICS = {
+    "effective_node_count": "effective nodes",
+    "estimated_cost": "estimated cost per call",
+    "function_node_count": "emitted nodes",
+    "frontend_ms": "frontend time (ms)",
+    "optimize_ms": "optimizer time (ms)",
+    "temp_memory": "temporary memory",
+}
+
+# Stages that are not part of optimizing a callback.
+_NON_OPTIMIZER_STAGES = frozenset({"frontend", "nodes"})
+
+# Pseudo location ids of attributed node counts: nodes the optimizer synthesized
+# with no source line behind them (e.g. copies between loop variables), and the
+# control-flow skeleton of a callback (its Block, JumpLoop, Execute, and branch nodes).
+UNATTRIBUTED = -1
+STRUCTURE = -2
+
+_PSEUDO_LOCATIONS = {
+    UNATTRIBUTED: (None, 0, "<unattributed>"),
+    STRUCTURE: (None, 0, "<control flow>"),
+}
+
+_LIBRARY_DIR = str(Path(__file__).resolve().parent.parent)
+
+
+def _is_value_node(node) -> bool:
+    return isinstance(node, (int, float)) and not isinstance(node, bool)
+
+
+def _block_is_runtime_constant(block, mode, callback_name: str) -> bool:
+    """The optimizer's runtime-constant block rule.
+
+    The block id must resolve to a BlockData whose name is in RUNTIME_CONSTANT_BLOCKS
+    AND that is not writable in the current callback (a block the callback can write is
+    not constant at runtime even if the runtime treats it as constant elsewhere).
+    """
+    if isinstance(block, float):
+        if not block.is_integer():
+            return False
+        block = int(block)
+    if not isinstance(block, int) or isinstance(block, bool):
+        return False
+    try:
+        block_data = mode.blocks(block)
+    except ValueError:
+        return False
+    return block_data.name in RUNTIME_CONSTANT_BLOCKS and callback_name not in block_data.writable
+
+
+def _node_is_runtime_constant(node: FunctionNode, is_rc: dict[int, bool], mode, callback_name: str) -> bool:
+    op = node.func
+    if op is Op.Get and len(node.args) == 2:
+        block, index = node.args
+        return (
+            _is_value_node(block) and _is_value_node(index) and _block_is_runtime_constant(block, mode, callback_name)
+        )
+    if op.pure:
+        # Pure ops (including And/Or/If/Switch appearing *inside* statement trees) fold
+        # when all args are runtime-constant. Classification is value-based; the CFG
+        # skeleton is handled positionally by _skeleton_effective, not by excluding
+        # nodes here, so a terminator that the emitter interned to the same object as a
+        # statement select still folds correctly at its statement occurrence.
+        return all(is_rc[id(arg)] for arg in node.args)
+    return False
+
+
+def _skeleton_effective(root, sub_eff: dict[int, int]) -> int:
+    """Effective node count with the CFG skeleton classified by *position*.
+
+    The runtime compiles the block *structure* to bytecode and constant-folds only the
+    expressions within, so the outer Block, the JumpLoop, each per-block Execute, and
+    each Execute's final terminator (If/Switch* over block indexes) are structural
+    containers that never fold: each counts 1, and its operand subtrees (statements,
+    terminator test expressions) contribute their value-based ``sub_eff``.
+
+    Position-based, not identity-based: the hash-consing emitter can intern a terminator
+    node to the very same object as a statement-level select, so an identity set would
+    wrongly force that shared statement subtree to never fold (inflating the count).
+    Walking the Block -> JumpLoop -> Execute* -> terminator spine by position keeps each
+    occurrence classified by where it sits in the tree.
+    """
+    if not (isinstance(root, FunctionNode) and root.func is Op.Block and len(root.args) == 1):
+        return sub_eff[id(root)]
+    jump_loop = root.args[0]
+    if not (isinstance(jump_loop, FunctionNode) and jump_loop.func is Op.JumpLoop):
+        return sub_eff[id(root)]
+    total = 2  # Block + JumpLoop container nodes
+    for execute in jump_loop.args:
+        if not (isinstance(execute, FunctionNode) and execute.func is Op.Execute):
+            total += sub_eff[id(execute)]
+            continue
+        total += 1  # Execute container node
+        args = execute.args
+        for stmt in args[:-1]:
+            total += sub_eff[id(stmt)]
+        if args:
+            terminator = args[-1]
+            if isinstance(terminator, FunctionNode):
+                total += 1  # terminator container node
+                for targ in terminator.args:
+                    total += sub_eff[id(targ)]
+            else:
+                total += sub_eff[id(terminator)]
+    return total
+
+
+def _post_order(root):
+    """Return unique nodes (by identity) in topological post-order.
+
+    Every node appears after all of its descendants. Works for trees and DAGs
+    (the emitted node tree is hash-consed, so shared subtrees are DAG edges);
+    each unique node appears exactly once. The tree is acyclic by construction.
+    """
+    order = []
+    entered: set[int] = set()
+    done: set[int] = set()
+    stack = [(root, False)]
+    while stack:
+        node, processed = stack.pop()
+        nid = id(node)
+        if processed:
+            if nid in done:
+                continue
+            done.add(nid)
+            order.append(node)
+            continue
+        if nid in entered:
+            continue
+        entered.add(nid)
+        stack.append((node, True))
+        if isinstance(node, FunctionNode):
+            stack.extend((arg, False) for arg in node.args if id(arg) not in entered)
+    return order
+
+
+def analyze_node(root, mode, callback_name: str) -> dict:
+    """Compute per-reference node counts, effective count, and per-op counts.
+
+    Counts are memoized per unique node and combined so shared subtrees are
+    counted once per reference without exponential expansion.
+    """
+    post = _post_order(root)
+
+    is_rc: dict[int, bool] = {}
+    sub_fn: dict[int, int] = {}
+    sub_val: dict[int, int] = {}
+    sub_eff: dict[int, int] = {}
+    sub_ops: dict[int, Counter] = {}
+
+    for node in post:
+        nid = id(node)
+        if isinstance(node, FunctionNode):
+            is_rc[nid] = _node_is_runtime_constant(node, is_rc, mode, callback_name)
+            fn = 1
+            val = 0
+            ops: Counter = Counter()
+            ops[node.func.name] += 1
+            for arg in node.args:
+                aid = id(arg)
+                fn += sub_fn[aid]
+                val += sub_val[aid]
+                ops += sub_ops[aid]
+            sub_fn[nid] = fn
+            sub_val[nid] = val
+            sub_ops[nid] = ops
+            if is_rc[nid]:
+                sub_eff[nid] = 1
+            else:
+                sub_eff[nid] = 1 + sum(sub_eff[id(arg)] for arg in node.args)
+        else:  # value node (int/float): always runtime-constant
+            is_rc[nid] = True
+            sub_fn[nid] = 0
+            sub_val[nid] = 1
+            sub_eff[nid] = 1
+            sub_ops[nid] = Counter()
+
+    rid = id(root)
+    return {
+        "function_node_count": sub_fn[rid],
+        "value_node_count": sub_val[rid],
+        "effective_node_count": _skeleton_effective(root, sub_eff),
+        "per_op_counts": dict(sub_ops[rid]),
+    }
+
+
+def attribute_node(root, node_locs: dict[int, int], mode, callback_name: str) -> dict[int, list[int]]:
+    """Split the node counts of `analyze_node` by source location.
+
+    `node_locs` maps the `id` of each emitted function node to the location id it
+    was emitted for. Returns `{location id: [emitted, effective]}`; the counts sum to
+    `function_node_count` and `effective_node_count`. A value node counts toward the
+    location of the node using it, and a folded runtime-constant subtree toward the
+    location of its root. The control-flow skeleton is counted under `STRUCTURE`.
+    """
+    is_rc: dict[int, bool] = {}
+    sub_fn: dict[int, Counter] = {}
+    sub_eff: dict[int, Counter] = {}
+
+    for node in _post_order(root):
+        nid = id(node)
+        if not isinstance(node, FunctionNode):
+            is_rc[nid] = True
+            continue
+        loc = node_locs.get(nid, UNATTRIBUTED)
+        is_rc[nid] = _node_is_runtime_constant(node, is_rc, mode, callback_name)
+        fn = Counter({loc: 1})
+        eff = Counter({loc: 1})
+        for arg in node.args:
+            aid = id(arg)
+            if aid in sub_fn:
+                fn += sub_fn[aid]
+                if not is_rc[nid]:
+                    eff += sub_eff[aid]
+            elif not is_rc[nid]:
+                eff[loc] += 1
+        sub_fn[nid] = fn
+        sub_eff[nid] = eff
+
+    fn_total: Counter = Counter()
+    eff_total: Counter = Counter()
+
+    def add_operand(arg):
+        # An operand of a skeleton node: a statement, branch test, or block index.
+        aid = id(arg)
+        if aid in sub_fn:
+            fn_total.update(sub_fn[aid])
+            eff_total.update(sub_eff[aid])
+        else:
+            eff_total[STRUCTURE] += 1
+
+    # Walk the skeleton by position, as _skeleton_effective does.
+    containers = 0
+    jump_loop = root.args[0] if isinstance(root, FunctionNode) and root.func is Op.Block and root.args else None
+    if not (isinstance(jump_loop, FunctionNode) and jump_loop.func is Op.JumpLoop and len(root.args) == 1):
+        add_operand(root)
+    else:
+        containers += 2  # Block + JumpLoop
+        for execute in jump_loop.args:
+            if not (isinstance(execute, FunctionNode) and execute.func is Op.Execute):
+                add_operand(execute)
+                continue
+            containers += 1
+            for stmt in execute.args[:-1]:
+                add_operand(stmt)
+            if execute.args:
+                terminator = execute.args[-1]
+                if isinstance(terminator, FunctionNode):
+                    containers += 1
+                    for targ in terminator.args:
+                        add_operand(targ)
+                else:
+                    add_operand(terminator)
+    fn_total[STRUCTURE] += containers
+    eff_total[STRUCTURE] += containers
+
+    return {loc: [fn_total[loc], eff_total[loc]] for loc in fn_total.keys() | eff_total.keys()}
+
+
+class SourceLocations:
+    """Interns the source locations the frontend tags IR statements with.
+
+    Set as `ProjectContextState.source_locations` (the CLI `--node-attribution`
+    flag), it is asked by `Context.add_statement` for the location of every
+    statement. Ids are only meaningful within the process that interned them, so
+    counts keyed by them are `resolve`d before they leave it.
+    """
+
+    def __init__(self):
+        self._ids: dict[tuple[str, int, str], int] = {}
+        self.locations: list[tuple[str, int, str]] = []
+
+    def intern(self, file: str, line: int, function: str) -> int:
+        """Return the id of a `(file, line, function)` location."""
+        key = (file, line, function)
+        loc = self._ids.get(key)
+        if loc is None:
+            loc = self._ids[key] = len(self.locations)
+            self.locations.append(key)
+        return loc
+
+    def current(self) -> int:
+        """Return the id of the source line being traced, or `UNATTRIBUTED` outside the frontend.
+
+        This is the innermost line of project code on the stack. Library code (the
+        sonolus package itself) is attributed to the project line that called it,
+        and only to its own lines when no project code is being traced.
+        """
+        from sonolus.script.internal.visitor import Visitor
+
+        visit_code = Visitor.visit.__code__
+        fallback = None
+        frame = sys._getframe(1)
+        while frame is not None:
+            if frame.f_code is visit_code:
+                f_locals = frame.f_locals
+                line = getattr(f_locals["node"], "lineno", None)
+                if line is not None:
+                    visitor = f_locals["self"]
+                    location = (visitor.source_file, line, visitor.qualified_name)
+                    if not visitor.source_file.startswith(_LIBRARY_DIR):
+                        return self.intern(*location)
+                    if fallback is None:
+                        fallback = location
+            frame = frame.f_back
+        return UNATTRIBUTED if fallback is None else self.intern(*fallback)
+
+    def resolve(self, counts: dict[int, list[int]]) -> dict[tuple[str | None, int, str], list[int]]:
+        """Key `attribute_node` counts by `(file, line, function)` instead of location id."""
+        resolved = {}
+        for loc, value in counts.items():
+            key = _PSEUDO_LOCATIONS[loc] if loc < 0 else self.locations[loc]
+            total = resolved.setdefault(key, [0, 0])
+            total[0] += value[0]
+            total[1] += value[1]
+        return resolved
+
+
+def _memory_accesses(node: FunctionNode):
+    """Yield the `(block, index, extent)` memory accesses of one node.
+
+    `index` is the constant part of the address; `extent` is the number of
+    consecutive slots accessed from there. Pointed accesses read their block and
+    index from memory and are skipped.
+    """
+    name = node.func.name
+    args = node.args
+    if name == "Copy":
+        # Copy(srcBlock, srcIndex, dstBlock, dstIndex, count)
+        count = args[4] if _is_value_node(args[4]) else 1
+        yield args[0], args[1], count
+        yield args[2], args[3], count
+    elif name.endswith("Pointed"):
+        return
+    elif name.endswith("Shifted"):
+        # *Shifted(block, offset, index, stride, ...): slot offset + index * stride.
+        block, offset, index, stride = args[:4]
+        if _is_value_node(offset) and _is_value_node(index) and _is_value_node(stride):
+            yield block, offset + index * stride, 1
+        else:
+            yield block, offset, 1
+    elif name.startswith(("Get", "Set", "Increment", "Decrement")):
+        yield args[0], args[1], 1
+
+
+def temp_memory_usage(root) -> int:
+    """Return the number of temporary memory slots a callback's node tree addresses.
+
+    This is one past the highest constant temporary memory slot it accesses. An
+    access with a dynamic index (e.g. into a temporary array) counts only its
+    constant base, so the result is a lower bound for such callbacks.
+    """
+    used = 0
+    for node in _post_order(root):
+        if not isinstance(node, FunctionNode):
+            continue
+        for block, index, extent in _memory_accesses(node):
+            if block == TEMPORARY_MEMORY_BLOCK and _is_value_node(index) and _is_value_node(extent):
+                used = max(used, int(index + extent))
+    return used
+
+
+def _ms(ns: int) -> float:
+    return round(ns / 1_000_000, 3)
+
+
+class CompileReport:
+    """Collects the per-callback entries of one build; see the module docstring.
+
+    Set as `ProjectContextState.compile_report`, it is filled as each callback's node
+    is registered. Timings come from the profiler's timeline, so the build must run
+    with `profiling.enable_trace()`. With `ProjectContextState.source_locations` set
+    as well, the node counts of each callback are also recorded per source line.
+    """
+
+    def __init__(self, cost_model: CostModel | None = None):
+        self.cost_model = cost_model
+        # (mode, archetype, callback) -> counts, in registration order.
+        self.entries: dict[tuple[str, str | None, str], dict] = {}
+        # (mode, archetype, callback) -> {(file, line, function): [emitted, effective]}.
+        self.attribution: dict[tuple[str, str | None, str], dict[tuple[str | None, int, str], list[int]]] = {}
+
+    def add(self, mode, archetype: str | None, callback: str, node, attribution=None) -> None:
+        """Record the emitted `node` of one callback, and its resolved per-line `attribution` if any."""
+        counts = analyze_node(node, mode, callback)
+        counts["estimated_cost"] = round(estimate_cost(node, self.cost_model), 3)
+        counts["temp_memory"] = temp_memory_usage(node)
+        key = (getattr(mode, "name", str(mode)), archetype, callback)
+        self.entries[key] = counts
+        if attribution is not None:
+            self.attribution[key] = attribution
+
+    def merge(self, other: CompileReport) -> None:
+        """Merge the entries of a report filled in another process."""
+        self.entries.update(other.entries)
+        self.attribution.update(other.attribution)
+
+    def rows(self) -> list[dict]:
+        """Return one row per callback, with its timings from the profiler's timeline."""
+        timings = profiling.callback_totals()
+        rows = []
+        for key, counts in self.entries.items():
+            stages = timings.get(key, {})
+            mode, archetype, callback = key
+            rows.append(
+                {
+                    "mode": mode,
+                    "archetype": archetype,
+                    "callback": callback,
+                    "frontend_ms": _ms(stages.get("frontend", 0)),
+                    "optimize_ms": _ms(sum(ns for stage, ns in stages.items() if stage not in _NON_OPTIMIZER_STAGES)),
+                    **counts,
+                }
+            )
+        return rows
+
+    def summary(self, top: int = 10) -> dict:
+        """Return the report: every callback's row, totals, and the `top` callbacks per metric."""
+        rows = self.rows()
+        totals = {
+            "callback_count": len(rows),
+            "frontend_ms": round(sum(row["frontend_ms"] for row in rows), 3),
+            "optimize_ms": round(sum(row["optimize_ms"] for row in rows), 3),
+            "function_node_count": sum(row["function_node_count"] for row in rows),
+            "value_node_count": sum(row["value_node_count"] for row in rows),
+            "effective_node_count": sum(row["effective_node_count"] for row in rows),
+        }
+        top_rows = {
+            metric: [
+                {"mode": row["mode"], "archetype": row["archetype"], "callback": row["callback"], metric: row[metric]}
+                for row in sorted(rows, key=lambda row: row[metric], reverse=True)[:top]
+            ]
+            for metric in TOP_METRICS
+        }
+        return {"callbacks": rows, "totals": totals, "top": top_rows}
+
+    def write(self, path: str | os.PathLike, top: int = 10) -> dict:
+        """Write the report to `path` as JSON and return it."""
+        data = self.summary(top)
+        Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return data
+
+    def attribution_summary(self, top: int = 10) -> dict:
+        """Return the node counts per source line and per function, summed over every callback.
+
+        Lines and functions are sorted by effective node count; each callback also
+        lists its own `top` lines.
+        """
+        lines: dict[tuple[str | None, int, str], list[int]] = {}
+        functions: dict[tuple[str | None, str], list[int]] = {}
+        callbacks = []
+        for (mode, archetype, callback), counts in self.attribution.items():
+            for (file, line, function), (emitted, effective) in counts.items():
+                for table, key in ((lines, (file, line, function)), (functions, (file, function))):
+                    total = table.setdefault(key, [0, 0])
+                    total[0] += emitted
+                    total[1] += effective
+            callbacks.append(
+                {
+                    "mode": mode,
+                    "archetype": archetype,
+                    "callback": callback,
+                    "lines": _location_rows(counts)[:top],
+                }
+            )
+        return {
+            "lines": _location_rows(lines),
+            "functions": [
+                {"file": _display_path(file), "function": function, "emitted": emitted, "effective": effective}
+                for (file, function), (emitted, effective) in sorted(functions.items(), key=_by_effective)
+            ],
+            "callbacks": callbacks,
+        }
+
+    def write_attribution(self, path: str | os.PathLike, top: int = 10) -> dict:
+        """Write the per-line attribution to `path` as JSON and return it."""
+        data = self.attribution_summary(top)
+        Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return data
+
+
+# Python callback name -> Sonolus callback name, e.g. update_parallel -> updateParallel.
+_CALLBACK_NAMES = {
+    info.py_name: info.name for info in vars(callbacks).values() if isinstance(info, callbacks.CallbackInfo)
+}
+
+
+class CostBudget:
+    """Checks the estimated runtime cost of each callback against `BuildConfig.cost_budgets`.
+
+    Set as `ProjectContextState.cost_budget` by `ProjectContextState.from_build_config`,
+    it checks each callback as its node is registered. A callback over its budget raises
+    a `CompilationError`, or with `fail=False` emits a warning.
+    """
+
+    def __init__(self, budgets: Mapping[str, float], cost_model: CostModel | None = None, *, fail: bool = True):
+        self.budgets = {self._normalize(key): budget for key, budget in budgets.items()}
+        self.cost_model = cost_model
+        self.fail = fail
+
+    @staticmethod
+    def _normalize(key: str) -> str:
+        archetype, _, callback = key.rpartition(".")
+        callback = _CALLBACK_NAMES.get(callback, callback)
+        return f"{archetype}.{callback}" if archetype else callback
+
+    def budget(self, archetype: str | None, callback: str) -> float | None:
+        """Return the budget of a callback, or None if it has none."""
+        budget = self.budgets.get(f"{archetype}.{callback}") if archetype is not None else None
+        return self.budgets.get(callback) if budget is None else budget
+
+    def check(self, mode, archetype: str | None, callback: str, node) -> None:
+        """Fail or warn if the emitted `node` of a callback is over its budget."""
+        budget = self.budget(archetype, callback)
+        if budget is None:
+            return
+        cost = estimate_cost(node, self.cost_model)
+        if cost <= budget:
+            return
+        name = callback if archetype is None else f"{archetype}.{callback}"
+        mode_name = getattr(mode, "name", str(mode)).lower()
+        message = (
+            f"Callback {name} in {mode_name} mode has an estimated cost of {cost:.1f} weighted nodes per call, "
+            f"over its budget of {budget:g}"
+        )
+        if self.fail:
+            raise CompilationError(message)
+        warnings.warn(message, stacklevel=2)
+
+
+def _display_path(file: str | None) -> str | None:
+    if file is None:
+        return None
+    try:
+        return os.path.relpath(file)
+    except ValueError:  # On another drive
+        return file
+
+
+def _by_effective(item) -> tuple:
+    key, (emitted, effective) = item
+    return -effective, -emitted, tuple(str(part) for part in key)
+
+
+def _location_rows(counts: dict[tuple[str | None, int, str], list[int]]) -> list[dict]:
+    return [
+        {"file": _display_path(file), "line": line, "function": function, "emitted": emitted, "effective": effective}
+        for (file, line, function), (emitted, effective) in sorted(counts.items(), key=_by_effective)
+    ]
+
+
+def _label(row: dict) -> str:
+    callback = row["callback"] if row["archetype"] is None else f"{row['archetype']}.{row['callback']}"
+    return f"{row['mode'].lower()}: {callback}"
+
+
+def format_text(data: dict) -> str:
+    """Render the totals and top-N tables of a report `summary` for the terminal."""
+    totals = data["totals"]
+    lines = [
+        f"compile report: {totals['callback_count']} callbacks, "
+        f"{totals['effective_node_count']} effective / {totals['function_node_count']} emitted nodes, "
+        f"frontend {totals['frontend_ms']:.1f}ms, optimizer {totals['optimize_ms']:.1f}ms"
+    ]
+    for metric, title in TOP_METRICS.items():
+        rows = data["top"][metric]
+        if not rows:
+            continue
+        lines.append(f"  top {len(rows)} by {title}:")
+        width = max(len(_label(row)) for row in rows)
+        for row in rows:
+            value = row[metric]
+            text = f"{value:.1f}" if isinstance(value, float) else str(value)
+            lines.append(f"    {_label(row):<{width}}  {text:>10}")
+    return "\n".join(lines)
+
+
+def _location_label(row: dict) -> str:
+    if row["file"] is None:
+        return row["function"]
+    line = f":{row['line']}" if "line" in row else ""
+    return f"{row['file']}{line} ({row['function']})"
+
+
+def format_attribution_text(data: dict, top: int = 10) -> str:
+    """Render the top `top` source lines and functions of an `attribution_summary` for the terminal."""
+    lines = ["node attribution (effective / emitted nodes, all callbacks):"]
+    for title, rows in (("source lines", data["lines"][:top]), ("functions", data["functions"][:top])):
+        if not rows:
+            continue
+        lines.append(f"  top {len(rows)} {title}:")
+        width = max(len(_location_label(row)) for row in rows)
+        lines.extend(f"    {_location_label(row):<{width}}  {row['effective']:>8} / {row['emitted']}" for row in rows)
+    return "\n".join(lines)
@@ -10,11 +10,12 @@ from sonolus.script.internal.value import Value
 
 
 class _GlobalInfo:
-    def __init__(self, name: str, size: int, blocks: dict[Mode, Block], offset: int | None):
+    def __init__(self, name: str, size: int, blocks: dict[Mode, Block], offset: int | None, owner: type | None = None):
         self.name = name
         self.size = size
         self.blocks = blocks
         self.offset = offset
+        self.owner = owner
 
 
 class _GlobalField(SonolusDescriptor):
@@ -96,7 +97,7 @@ def _create_global(cls: type, blocks: dict[Mode, Block], offset: int | None):
         type_ = validate_concrete_type(annotation)
         setattr(cls, name, _GlobalField(name, type_, i, field_offset))
         field_offset += type_._size_()
-    cls._global_info_ = _GlobalInfo(cls.__name__, field_offset, blocks, offset)  # type: ignore
+    cls._global_info_ = _GlobalInfo(cls.__name__, field_offset, blocks, offset, cls)  # type: ignore
     cls._is_comptime_value_ = True  # type: ignore
     return cls()
 
@@ -6,7 +6,6 @@ from sonolus.script.internal.introspection import get_field_specifiers
 from sonolus.script.internal.native import native_function
 from sonolus.script.record import Record
 from sonolus.script.runtime import _TutorialInstruction
-from sonolus.script.text import StandardText
 from sonolus.script.vec import Vec2
 
 
@@ -149,20 +148,20 @@ def instruction_icons[T](cls: type[T]) -> T | TutorialInstructionIcons:
 class StandardInstruction:
     """Standard instructions."""
 
-    TAP = Annotated[Instruction, instruction(StandardText.TAP)]
-    TAP_HOLD = Annotated[Instruction, instruction(StandardText.TAP_HOLD)]
-    TAP_RELEASE = Annotated[Instruction, instruction(StandardText.TAP_RELEASE)]
-    TAP_FLICK = Annotated[Instruction, instruction(StandardText.TAP_FLICK)]
-    TAP_SLIDE = Annotated[Instruction, instruction(StandardText.TAP_SLIDE)]
-    HOLD = Annotated[Instruction, instruction(StandardText.HOLD)]
-    HOLD_SLIDE = Annotated[Instruction, instruction(StandardText.HOLD_SLIDE)]
-    HOLD_FOLLOW = Annotated[Instruction, instruction(StandardText.HOLD_FOLLOW)]
-    RELEASE = Annotated[Instruction, instruction(StandardText.RELEASE)]
-    FLICK = Annotated[Instruction, instruction(StandardText.FLICK)]
-    SLIDE = Annotated[Instruction, instruction(StandardText.SLIDE)]
-    SLIDE_FLICK = Annotated[Instruction, instruction(StandardText.SLIDE_FLICK)]
-    AVOID = Annotated[Instruction, instruction(StandardText.AVOID)]
-    JIGGLE = Annotated[Instruction, instruction(StandardText.JIGGLE)]
+    TAP = Annotated[Instruction, instruction("#TAP")]
+    TAP_HOLD = Annotated[Instruction, instruction("#TAP_HOLD")]
+    TAP_RELEASE = Annotated[Instruction, instruction("#TAP_RELEASE")]
+    TAP_FLICK = Annotated[Instruction, instruction("#TAP_FLICK")]
+    TAP_SLIDE = Annotated[Instruction, instruction("#TAP_SLIDE")]
+    HOLD = Annotated[Instruction, instruction("#HOLD")]
+    HOLD_SLIDE = Annotated[Instruction, instruction("#HOLD_SLIDE")]
+    HOLD_FOLLOW = Annotated[Instruction, instruction("#HOLD_FOLLOW")]
+    RELEASE = Annotated[Instruction, instruction("#RELEASE")]
+    FLICK = Annotated[Instruction, instruction("#FLICK")]
+    SLIDE = Annotated[Instruction, instruction("#SLIDE")]
+    SLIDE_FLICK = Annotated[Instruction, instruction("#SLIDE_FLICK")]
+    AVOID = Annotated[Instruction, instruction("#AVOID")]
+    JIGGLE = Annotated[Instruction, instruction("#JIGGLE")]
 
 
 class StandardInstructionIcon:
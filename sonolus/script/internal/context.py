@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Hashable, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from itertools import count
 from threading import Lock
 from typing import TYPE_CHECKING, Any, Literal, Self
 
@@ -16,12 +17,16 @@ from sonolus.backend.place import (
     Block,
     BlockPlace,
     TempBlock,
+    preallocate_temp_block_places,
     preallocated_temp_block_places,
 )
 from sonolus.script.internal.error import CompilationError
 from sonolus.script.internal.value import Value
 
 if TYPE_CHECKING:
+    from sonolus.backend.optimize.cache import SharedNodes
+    from sonolus.build.incremental import TraceCache, TraceRecorder
+    from sonolus.build.report import CompileReport, CostBudget, SourceLocations
     from sonolus.script.globals import _GlobalInfo, _GlobalPlaceholder
     from sonolus.script.project import BuildConfig
 
@@ -78,6 +83,12 @@ class ProjectContextState:
     lock: Lock
     runtime_checks: RuntimeChecks
     visit_stats: dict[str, FunctionVisitStatistics]
+    trace_cache: TraceCache | None
+    trace_recorder: TraceRecorder | None
+    compile_report: CompileReport | None
+    source_locations: SourceLocations | None
+    cost_budget: CostBudget | None
+    shared_nodes: SharedNodes | None
 
     def __init__(
         self,
@@ -85,6 +96,7 @@ class ProjectContextState:
         const_mappings: dict[Any, int] | None = None,
         debug_str_mappings: dict[str, int] | None = None,
         runtime_checks: RuntimeChecks = RuntimeChecks.NONE,
+        trace_cache: TraceCache | None = None,
     ):
         self.rom = ReadOnlyMemory() if rom is None else rom
         self.const_mappings = {} if const_mappings is None else const_mappings
@@ -92,6 +104,12 @@ class ProjectContextState:
         self.lock = Lock()
         self.runtime_checks = runtime_checks
         self.visit_stats = {}
+        self.trace_cache = trace_cache
+        self.trace_recorder = None
+        self.compile_report = None
+        self.source_locations = None
+        self.cost_budget = None
+        self.shared_nodes = None
 
     @classmethod
     def from_build_config(
@@ -100,13 +118,23 @@ class ProjectContextState:
         rom: ReadOnlyMemory | None = None,
         const_mappings: dict[Any, int] | None = None,
         debug_str_mappings: dict[str, int] | None = None,
+        trace_cache: TraceCache | None = None,
     ) -> Self:
-        return cls(
+        state = cls(
             rom=rom,
             const_mappings=const_mappings,
             debug_str_mappings=debug_str_mappings,
             runtime_checks=config.runtime_checks,
+            trace_cache=trace_cache,
         )
+        if config.cost_budgets:
+            from sonolus.build.report import CostBudget
+
+            state.cost_budget = CostBudget(config.cost_budgets, config.cost_model, fail=config.fail_on_cost_budget)
+        from sonolus.backend.optimize.cache import SharedNodes
+
+        state.shared_nodes = SharedNodes()
+        return state
 
 
 class ModeContextState:
@@ -119,6 +147,7 @@ class ModeContextState:
     archetype_mro_id_array_rom_indexes: Sequence[int] | None = None
     environment_mappings: dict[_GlobalInfo, int]
     environment_offsets: dict[Block, int]
+    specializations: dict[Hashable, Any]
     mode: Mode
     lock: Lock
 
@@ -148,6 +177,7 @@ class ModeContextState:
         )
         self.environment_mappings = {}
         self.environment_offsets = {}
+        self.specializations = {}
         self.mode = mode
         self.lock = Lock()
 
@@ -195,6 +225,7 @@ class Context:
     mode_state: ModeContextState
     callback_state: CallbackContextState
     statements: list[IRStmt]
+    statement_locs: list[int] | None
     test: IRExpr
     outgoing: dict[float | None, Context]
     scope: Scope
@@ -213,6 +244,7 @@ class Context:
         self.mode_state = mode_state
         self.callback_state = callback_state
         self.statements = []
+        self.statement_locs = None if project_state.source_locations is None else []
         self.test = IRConst(0)
         self.outgoing = {}
         self.scope = scope if scope is not None else Scope()
@@ -280,6 +312,8 @@ class Context:
         if not self.live:
             return
         self.statements.append(statement)
+        if self.statement_locs is not None:
+            self.statement_locs.append(self.project_state.source_locations.current())
 
     def add_statements(self, *statements: IRStmt):
         for statement in statements:
@@ -291,6 +325,8 @@ class Context:
         name = name or ("v" if size == 1 else "a")
         num = self._get_alloc_number(name)
         if name == "v" and num < PREALLOCATED_TEMP_PLACE_COUNT:
+            if num >= len(preallocated_temp_block_places):
+                preallocate_temp_block_places(num + 1)
             return preallocated_temp_block_places[num]
         return BlockPlace(TempBlock(f"{name}{num}", size), 0)
 
@@ -402,6 +438,8 @@ class Context:
             const_mappings = self.project_state.const_mappings
             if value not in const_mappings:
                 const_mappings[value] = len(const_mappings)
+            if self.project_state.trace_recorder is not None:
+                self.project_state.trace_recorder.log_entry("const", value, const_mappings[value])
             return const_mappings[value]
 
     def map_debug_message(self, message: str) -> int:
@@ -410,6 +448,10 @@ class Context:
             debug_str_mappings = self.project_state.debug_str_mappings
             if message_with_trace not in debug_str_mappings:
                 debug_str_mappings[message_with_trace] = len(debug_str_mappings) + 1
+            if self.project_state.trace_recorder is not None:
+                self.project_state.trace_recorder.log_entry(
+                    "debug", message_with_trace, debug_str_mappings[message_with_trace]
+                )
             return debug_str_mappings[message_with_trace]
 
     def get_global_base(self, value: _GlobalInfo | _GlobalPlaceholder) -> BlockPlace:
@@ -432,6 +474,8 @@ class Context:
                     self.mode_state.environment_offsets[block] = new_size
                 else:
                     self.mode_state.environment_mappings[value] = value.offset
+            if value.offset is None and self.project_state.trace_recorder is not None:
+                self.project_state.trace_recorder.log_global(value, self.mode_state.environment_mappings[value])
             return BlockPlace(block, self.mode_state.environment_mappings[value])
 
     @classmethod
@@ -458,6 +502,8 @@ class Context:
             if type_ not in self.mode_state.archetypes:
                 self.mode_state.archetypes[type_] = len(self.mode_state.archetypes)
                 self.mode_state.subclass_ids_cache.clear()
+                if self.project_state.trace_recorder is not None:
+                    self.project_state.trace_recorder.mark_opaque()
             return self.mode_state.archetypes[type_]
 
     def get_archetype_mro_id_array(self, archetype_id: int) -> Sequence[int]:
@@ -495,6 +541,7 @@ def using_ctx(value: Context | None):
 class ReadOnlyMemory:
     values: list[float]
     indexes: dict[tuple[float, ...], int]
+    recorder: TraceRecorder | None
     _lock: Lock
 
     def __init__(self):
@@ -504,6 +551,7 @@ class ReadOnlyMemory:
             float("-inf"),
         ]
         self.indexes = {}
+        self.recorder = None
         self._lock = Lock()
 
     def __getitem__(self, item: tuple[float, ...]) -> BlockPlace:
@@ -514,6 +562,8 @@ class ReadOnlyMemory:
                 self.values.extend(item)
             else:
                 index = self.indexes[item]
+            if self.recorder is not None:
+                self.recorder.log_entry("rom", item, index)
             return BlockPlace(self.block, index)
 
     @property
@@ -569,17 +619,151 @@ Binding = ValueBinding | ConflictBinding | EmptyBinding
 _EMPTY_BINDING = EmptyBinding()
 
 
+# Large scopes keep their bindings in a persistent hash array mapped trie, so copies share everything but the path to
+# each binding set since. Each entry is a (name, binding, stamp) tuple, where stamps order names like the insertion
+# order of a flat bindings dict would, which is the order merges go through names in.
+_binding_stamps = count()
+
+# Scopes with more bindings than this are shared with their copies rather than copied.
+_FLAT_SCOPE_LIMIT = 32
+
+_HASH_BITS = 60
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+
+class _Node:
+    """A trie node. Below _HASH_BITS, a node holds only the entries whose full hashes collide."""
+
+    __slots__ = ("bitmap", "items")
+
+    def __init__(self, bitmap: int, items: tuple):
+        self.bitmap = bitmap
+        self.items = items
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+def _trie_get(node: _Node, name: str, h: int) -> tuple | None:
+    shift = 0
+    while shift < _HASH_BITS:
+        bit = 1 << ((h >> shift) & 31)
+        bitmap = node.bitmap
+        if not bitmap & bit:
+            return None
+        item = node.items[(bitmap & (bit - 1)).bit_count()]
+        if type(item) is not _Node:
+            return item if item[0] == name else None
+        node = item
+        shift += 5
+    for item in node.items:
+        if item[0] == name:
+            return item
+    return None
+
+
+def _trie_set(node: _Node, h: int, entry: tuple, shift: int = 0) -> _Node:
+    if shift >= _HASH_BITS:
+        return _Node(0, (*(item for item in node.items if item[0] != entry[0]), entry))
+    bit = 1 << ((h >> shift) & 31)
+    bitmap = node.bitmap
+    items = node.items
+    index = (bitmap & (bit - 1)).bit_count()
+    if not bitmap & bit:
+        return _Node(bitmap | bit, (*items[:index], entry, *items[index:]))
+    item = items[index]
+    if type(item) is _Node:
+        item = _trie_set(item, h, entry, shift + 5)
+    elif item[0] == entry[0]:
+        item = entry
+    else:
+        item = _trie_set(_trie_set(_EMPTY_NODE, hash(item[0]) & _HASH_MASK, item, shift + 5), h, entry, shift + 5)
+    return _Node(bitmap, (*items[:index], item, *items[index + 1 :]))
+
+
+def _trie_remove(node: _Node, name: str, h: int, shift: int = 0) -> _Node:
+    if shift >= _HASH_BITS:
+        items = tuple(item for item in node.items if item[0] != name)
+        return node if len(items) == len(node.items) else _Node(0, items)
+    bit = 1 << ((h >> shift) & 31)
+    bitmap = node.bitmap
+    if not bitmap & bit:
+        return node
+    items = node.items
+    index = (bitmap & (bit - 1)).bit_count()
+    item = items[index]
+    if type(item) is _Node:
+        child = _trie_remove(item, name, h, shift + 5)
+        if child is item:
+            return node
+        if child.items:
+            return _Node(bitmap, (*items[:index], child, *items[index + 1 :]))
+    elif item[0] != name:
+        return node
+    return _Node(bitmap ^ bit, (*items[:index], *items[index + 1 :]))
+
+
+def _trie_diff(a: _Node, b: _Node, shift: int, names: set[str]):
+    """Add the names that may be bound differently in a and b to names, skipping subtrees they share."""
+    if a is b:
+        return
+    if shift >= _HASH_BITS:
+        _trie_names(a, names)
+        _trie_names(b, names)
+        return
+    bits = a.bitmap | b.bitmap
+    while bits:
+        bit = bits & -bits
+        bits ^= bit
+        item_a = a.items[(a.bitmap & (bit - 1)).bit_count()] if a.bitmap & bit else None
+        item_b = b.items[(b.bitmap & (bit - 1)).bit_count()] if b.bitmap & bit else None
+        if item_a is item_b:
+            continue
+        if type(item_a) is _Node and type(item_b) is _Node:
+            _trie_diff(item_a, item_b, shift + 5, names)
+            continue
+        for item in (item_a, item_b):
+            if type(item) is _Node:
+                _trie_names(item, names)
+            elif item is not None:
+                names.add(item[0])
+
+
+def _trie_names(node: _Node, names: set[str]):
+    for item in node.items:
+        if type(item) is _Node:
+            _trie_names(item, names)
+        else:
+            names.add(item[0])
+
+
 class Scope:
-    bindings: dict[str, Binding]
+    """The variable bindings of a context.
+
+    A small scope keeps its bindings in local and is copied as a whole. Once a copied or merged scope holds more than
+    _FLAT_SCOPE_LIMIT bindings, they move into a trie shared with its copies, and only the bindings set since the last
+    copy are kept in local, so copying does not copy the bindings and merging only goes through the names that differ
+    between the sources.
+    """
+
+    __slots__ = ("local", "root")
 
-    def __init__(self, bindings: dict[str, Binding] | None = None):
-        self.bindings = bindings or {}
+    local: dict[str, Binding]
+    root: _Node
+
+    def __init__(self, local: dict[str, Binding] | None = None, root: _Node = _EMPTY_NODE):
+        self.local = local or {}
+        self.root = root
 
     def get_binding(self, name: str) -> Binding:
-        return self.bindings.get(name, _EMPTY_BINDING)
+        binding = self.local.get(name)
+        if binding is not None:
+            return binding
+        entry = _trie_get(self.root, name, hash(name) & _HASH_MASK)
+        return _EMPTY_BINDING if entry is None else entry[1]
 
     def set_binding(self, name: str, binding: Binding):
-        self.bindings[name] = binding
+        self.local[name] = binding
 
     def get_value(self, name: str) -> Value | Any:
         binding = self.get_binding(name)
@@ -601,27 +785,77 @@ class Scope:
             from sonolus.script.internal.impl import validate_value
 
             _validate_value = validate_value
-        self.bindings[name] = ValueBinding(_validate_value(value))
+        self.local[name] = ValueBinding(_validate_value(value))
 
     def delete_binding(self, name: str):
-        del self.bindings[name]
+        self.local.pop(name, None)
+        if self.root is not _EMPTY_NODE:
+            self.root = _trie_remove(self.root, name, hash(name) & _HASH_MASK)
+
+    def freeze(self) -> _Node:
+        """Move the bindings in local into the trie and return it."""
+        if self.local:
+            root = self.root
+            for name, binding in self.local.items():
+                h = hash(name) & _HASH_MASK
+                entry = _trie_get(root, name, h)
+                stamp = next(_binding_stamps) if entry is None else entry[2]
+                root = _trie_set(root, h, (name, binding, stamp))
+            self.root = root
+            self.local = {}
+        return self.root
 
     def copy(self) -> Scope:
-        return Scope(self.bindings.copy())
+        if self.root is _EMPTY_NODE and len(self.local) <= _FLAT_SCOPE_LIMIT:
+            return Scope(self.local.copy())
+        return Scope(None, self.freeze())
 
     @classmethod
     def apply_merge(cls, target: Context, incoming: list[Context]):
         if not incoming:
             return
-        bindings_by_source = [context.scope.bindings for context in incoming]
-        first_bindings = bindings_by_source[0]
-        rest_bindings = bindings_by_source[1:]
-        target_bindings = target.scope.bindings
+        scopes = [context.scope for context in incoming]
+        if all(scope.root is _EMPTY_NODE for scope in scopes):
+            cls._apply_flat_merge(target, incoming)
+            return
+        roots = [scope.freeze() for scope in scopes]
+        first_root = roots[0]
+        # Names outside these are bound the same in every source, and so in the target.
+        changed: set[str] = set()
+        for root in roots[1:]:
+            _trie_diff(first_root, root, 0, changed)
+        # Merge in the order of a flat merge, which goes through the names of each source in turn.
+        order = []
+        for name in changed:
+            h = hash(name) & _HASH_MASK
+            entries = [_trie_get(root, name, h) for root in roots]
+            i = next(i for i, entry in enumerate(entries) if entry is not None)
+            order.append((i, entries[i][2], name, h, [_EMPTY_BINDING if e is None else e[1] for e in entries]))
+        order.sort(key=lambda item: item[:2])
+        target.scope = Scope(None, first_root)
+        root = first_root
+        for i, stamp, name, h, bindings in order:
+            first = bindings[0]
+            if all(binding is first for binding in bindings):
+                # Fast path, as in _apply_flat_merge.
+                binding = first if isinstance(first, ValueBinding) else ConflictBinding()
+            else:
+                binding = cls._merge_binding(target, incoming, name, bindings)
+            # A name the first source does not bind comes after all those it does.
+            root = _trie_set(root, h, (name, binding, stamp if i == 0 else next(_binding_stamps)))
+        target.scope.root = root
+
+    @classmethod
+    def _apply_flat_merge(cls, target: Context, incoming: list[Context]):
+        bindings_by_source = [context.scope.local for context in incoming]
+        target_bindings = target.scope.local
         # Keys in first-seen order across sources, matching
         # unique(key for source in sources for key in source.bindings).
         keys: dict[str, Binding] = {}
         for bindings in bindings_by_source:
             keys.update(bindings)
+        first_bindings = bindings_by_source[0]
+        rest_bindings = bindings_by_source[1:]
         for key in keys:
             first = first_bindings.get(key, _EMPTY_BINDING)
             for bindings in rest_bindings:
@@ -633,38 +867,36 @@ class Scope:
                 # load-bearing: the loop-header read-before-rebind check relies on
                 # identity with header.loop_variables and on read counts accrued
                 # through merges.
-                if isinstance(first, ValueBinding):
-                    target_bindings[key] = first
-                else:
-                    target_bindings[key] = ConflictBinding()
-                continue
-            bindings = [source.get(key, _EMPTY_BINDING) for source in bindings_by_source]
-            if not all(isinstance(binding, ValueBinding) for binding in bindings):
-                target_bindings[key] = ConflictBinding()
+                target_bindings[key] = first if isinstance(first, ValueBinding) else ConflictBinding()
                 continue
-            values = [binding.value for binding in bindings]
-            if len({id(value) for value in values}) == 1:
-                target_bindings[key] = ValueBinding(values[0])
-                continue
-            types = {type(value) for value in values}
-            if len(types) > 1:
-                target_bindings[key] = ConflictBinding()
-                continue
-            common_type: type[Value] = types.pop()
-            with using_ctx(target):
-                target_value = common_type._get_merge_target_(values)
-            if target_value is not NotImplemented:
-                for inc in incoming:
-                    with using_ctx(inc):
-                        target_value._set_(inc.scope.get_value(key))
-                target.scope.set_value(key, target_value)
-                continue
-            else:
-                target_bindings[key] = ConflictBinding()
-                continue
-
+            target_bindings[key] = cls._merge_binding(
+                target, incoming, key, [source.get(key, _EMPTY_BINDING) for source in bindings_by_source]
+            )
 
-def _new_cfg_block(statements, test) -> BasicBlock:
+    @staticmethod
+    def _merge_binding(target: Context, incoming: list[Context], name: str, bindings: list[Binding]) -> Binding:
+        if not all(isinstance(binding, ValueBinding) for binding in bindings):
+            return ConflictBinding()
+        values = [binding.value for binding in bindings]
+        if len({id(value) for value in values}) == 1:
+            return ValueBinding(values[0])
+        types = {type(value) for value in values}
+        if len(types) > 1:
+            return ConflictBinding()
+        common_type: type[Value] = types.pop()
+        with using_ctx(target):
+            target_value = common_type._get_merge_target_(values)
+        if target_value is NotImplemented:
+            return ConflictBinding()
+        for inc in incoming:
+            with using_ctx(inc):
+                target_value._set_(inc.scope.get_value(name))
+        from sonolus.script.internal.impl import validate_value
+
+        return ValueBinding(validate_value(target_value))
+
+
+def _new_cfg_block(statements, test, statement_locs) -> BasicBlock:
     # Fast constructor for the transient blocks context_to_cfg feeds straight to the
     # optimizer: bypass BasicBlock.__init__'s keyword handling and per-block
     # ``x or default`` allocations. ``incoming`` is left as None: this path's
@@ -673,6 +905,8 @@ def _new_cfg_block(statements, test) -> BasicBlock:
     block = BasicBlock.__new__(BasicBlock)
     block.phis = {}
     block.statements = statements
+    if statement_locs is not None:
+        block.statement_locs = statement_locs
     block.test = test
     block.incoming = None
     block.outgoing = set()
@@ -680,7 +914,7 @@ def _new_cfg_block(statements, test) -> BasicBlock:
 
 
 def context_to_cfg(context: Context) -> BasicBlock:
-    result = _new_cfg_block(context.statements, context.test)
+    result = _new_cfg_block(context.statements, context.test, context.statement_locs)
     blocks = {context: result}
     seen = set()
     visited = []
@@ -696,7 +930,7 @@ def context_to_cfg(context: Context) -> BasicBlock:
         for condition, target in current.outgoing.items():
             target_block = blocks.get(target)
             if target_block is None:
-                target_block = _new_cfg_block(target.statements, target.test)
+                target_block = _new_cfg_block(target.statements, target.test, target.statement_locs)
                 blocks[target] = target_block
             current_outgoing.add(FlowEdge(src=current_block, dst=target_block, cond=condition))
             queue.append(target)
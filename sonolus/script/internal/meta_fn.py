@@ -34,16 +34,20 @@ def meta_fn(fn=None, *, show_in_stack: bool = True):
             qualified_name = f"{module}.{getattr(base_fn, '__qualname__', function_name)}"
         else:
             qualified_name = f"<unknown>.{getattr(base_fn, '__qualname__', function_name)}"
-        source_file, node = get_function(base_fn)
-        stack_entry = f'File "{source_file}", line {node.lineno}, in {function_name}'
+        stack_entry = None
 
         @wraps(fn)
         def wrapper(*args, **kwargs):
+            nonlocal stack_entry
             if ctx():
                 completion_timer = visitor.mark_start(qualified_name)
                 debug_stack = ctx().callback_state.debug_stack
                 try:
                     if show_in_stack:
+                        if stack_entry is None:
+                            # Parsing the source is slow, so it waits for the first call rather than the import.
+                            source_file, node = get_function(base_fn)
+                            stack_entry = f'File "{source_file}", line {node.lineno}, in {function_name}'
                         debug_stack.append(stack_entry)
                     return fn(*args, **kwargs)
                 finally:
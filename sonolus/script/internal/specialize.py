@@ -0,0 +1,614 @@
+"""Specializations of script functions, reused by later calls with the same kinds of arguments.
+
+Helpers such as the vector, quad, and interval operations are called many times per callback, and most calls only
+differ in the temporary places that hold their arguments. Once a function has been called a few times with a given
+kind of arguments, the next call is traced with stand-in arguments, and the code it emits is kept as a template. Later
+calls with the same kind of arguments replay the template, substituting their own argument places and fresh temporary
+places, instead of visiting the function again. Functions whose first call emits little code are cheaper to visit than
+to replay, and are never specialized.
+
+Two calls have the same kind of arguments if their arguments have the same types, equal compile-time constants, and
+equal places outside of temporary memory, and refer to the same temporary memory and objects in the same pattern.
+Anything else the frontend can tell apart, like other values that are not plain data, is compared by identity.
+Templates are kept per mode, and only reused by calls in the same callback with the same settings.
+
+A function is not specialized if a call emits debug messages, whose text includes the call stack, or returns a value
+that cannot be rebuilt from the template.
+"""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable, Hashable
+from itertools import islice
+from string import digits
+from typing import Any
+
+from sonolus.backend.ir import IRConst, IRGet, IRInstr, IRPureInstr, IRSet
+from sonolus.backend.optimize import profiling
+from sonolus.backend.place import BlockPlace, TempBlock
+from sonolus.script.internal.constant import ConstantValue
+from sonolus.script.internal.context import Context, Scope, ctx, debug_config, set_ctx, using_ctx
+from sonolus.script.internal.impl import validate_value
+from sonolus.script.internal.transient import TransientValue
+from sonolus.script.internal.tuple_impl import TupleImpl
+from sonolus.script.internal.value import ExprBackingValue, Value
+from sonolus.script.num import Num
+from sonolus.script.record import Record
+
+_compiler_internal_ = True
+
+_MISSING = object()
+
+# Functions that emit fewer statements are not specialized.
+_MIN_STATEMENTS = 16
+# Calls with the same kind of arguments that run normally before the template is recorded.
+_RUNS_BEFORE_RECORDING = 2
+# Names of the stand-in temporary blocks; allocated names never start with "$".
+_ARG_TEMP_PREFIX = "$t"
+_ARG_EXPR_PREFIX = "$e"
+
+
+class _Unsupported(Exception):  # noqa: N818
+    pass
+
+
+class _Same:
+    """Compares by the identity of the wrapped object."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other):
+        return type(other) is _Same and other.value is self.value
+
+    def __hash__(self):
+        return id(self.value)
+
+
+def call_specialized(fn: Callable, bound_args: inspect.BoundArguments, run: Callable[[inspect.BoundArguments], Value]):
+    """Call `fn` with `bound_args`, replaying its template if an earlier call had the same kind of arguments.
+
+    `run` traces a call of `fn` with the given arguments.
+    """
+    c = ctx()
+    if not c.live or c.project_state.source_locations is not None:
+        # Attributed statements carry the location of their call, which differs between calls.
+        return run(bound_args)
+    callback_state = c.callback_state
+    table = c.mode_state.specializations
+    fn_key = (fn, c.project_state, callback_state.callback, callback_state.no_eval, callback_state.is_in_generator)
+    specialized = table.get(fn_key)
+    if specialized is None:
+        statement_count = len(c.statements)
+        result = run(bound_args)
+        # Replaying small functions saves less than making their keys costs.
+        table[fn_key] = _emitted_statements(c) - statement_count >= _MIN_STATEMENTS
+        return result
+    if not specialized:
+        return run(bound_args)
+    args = _Arguments()
+    try:
+        values = {name: validate_value(value) for name, value in bound_args.arguments.items()}
+        arg_key = tuple(args.key(value) for value in values.values())
+    except Exception:
+        # Unsupported arguments, or arguments the call itself rejects when run.
+        return run(bound_args)
+    key = (fn_key, debug_config(), arg_key)
+    template = table.get(key, 0)
+    if type(template) is int:
+        if template < _RUNS_BEFORE_RECORDING:
+            # Most calls are not repeated often with the same kind of arguments, and recording costs more than a run.
+            table[key] = template + 1
+            return run(bound_args)
+        if profiling.enabled:
+            profiling.count("specialization_miss")
+        template = _record(bound_args.signature, values, args, run)
+        if template is None:
+            table[fn_key] = False
+            return run(bound_args)
+        table[key] = template
+    elif profiling.enabled:
+        profiling.count("specialization_hit")
+    return template.replay(args)
+
+
+def _emitted_statements(start: Context) -> int:
+    """Return the number of statements in `start` and the contexts after it."""
+    count = 0
+    seen = {start}
+    contexts = [start]
+    while contexts:
+        context = contexts.pop()
+        count += len(context.statements)
+        for target in context.outgoing.values():
+            if target not in seen:
+                seen.add(target)
+                contexts.append(target)
+    return count
+
+
+class _Arguments:
+    """The distinct objects, temporary blocks, and expressions that make up the arguments of one call."""
+
+    __slots__ = ("_expr_ids", "_object_ids", "_temp_ids", "exprs", "objects", "temps")
+
+    def __init__(self):
+        self.objects: list[Any] = []
+        self.temps: list[TempBlock] = []
+        self.exprs: list[ExprBackingValue] = []
+        self._object_ids: dict[int, int] = {}
+        self._temp_ids: dict[str, int] = {}
+        self._expr_ids: dict[int, int] = {}
+
+    def key(self, value: Any) -> Hashable:
+        index = self._object_ids.get(id(value))
+        if index is not None:
+            return index
+        self._object_ids[id(value)] = len(self.objects)
+        self.objects.append(value)
+        type_ = type(value)
+        if type_ is Num:
+            data = value.data
+            if type(data) is float:
+                # Unlike the floats themselves, this tells 0.0 from -0.0.
+                return repr(data)
+            if type(data) is BlockPlace:
+                block = data.block
+                if type(block) is TempBlock and type(data.index) is int:
+                    return "t", self._temp_id(block), block.size, data.index, data.offset
+                return "p", data
+            if type(data) is ExprBackingValue:
+                index = self._expr_ids.get(id(data))
+                if index is None:
+                    index = self._expr_ids[id(data)] = len(self.exprs)
+                    self.exprs.append(data)
+                return "e", index
+            return "o", _Same(value)
+        if isinstance(value, Record):
+            return type_, value._is_frozen_, tuple(self.key(field) for field in value._value_.values())
+        if type_ is TupleImpl:
+            return "u", tuple(self.key(entry) for entry in value.value)
+        if isinstance(value, ConstantValue):
+            return type_
+        if isinstance(value, TransientValue):
+            raise _Unsupported
+        return "o", _Same(value)
+
+    def _temp_id(self, block: TempBlock) -> int:
+        index = self._temp_ids.get(block.name)
+        if index is None:
+            index = self._temp_ids[block.name] = len(self.temps)
+            self.temps.append(block)
+        return index
+
+    def stand_ins(self) -> tuple[list[Any], dict[int, int]]:
+        """Return stand-ins for the objects, and the index of the object each stand-in replaces by its id.
+
+        Temporary places and expressions are replaced by places in stand-in temporary blocks. Other leaves are their
+        own stand-ins, since calls with the same key have equal leaves there.
+        """
+        made = [_MISSING] * len(self.objects)
+        temps = [TempBlock(f"{_ARG_TEMP_PREFIX}{i}", block.size) for i, block in enumerate(self.temps)]
+        exprs = [IRGet(BlockPlace(TempBlock(f"{_ARG_EXPR_PREFIX}{i}", 1))) for i in range(len(self.exprs))]
+
+        def stand_in(value: Any) -> Any:
+            index = self._object_ids[id(value)]
+            result = made[index]
+            if result is not _MISSING:
+                return result
+            type_ = type(value)
+            result = value
+            if type_ is Num:
+                data = value.data
+                if type(data) is BlockPlace and type(data.block) is TempBlock and type(data.index) is int:
+                    result = Num(BlockPlace(temps[self._temp_ids[data.block.name]], data.index, data.offset))
+                elif type(data) is ExprBackingValue:
+                    result = Num(ExprBackingValue(exprs[self._expr_ids[id(data)]]))
+            elif isinstance(value, Record):
+                result = _rebuild_record(
+                    type_, value._is_frozen_, {name: stand_in(field) for name, field in value._value_.items()}
+                )
+            elif type_ is TupleImpl:
+                result = TupleImpl(tuple(stand_in(entry) for entry in value.value))
+            made[index] = result
+            return result
+
+        for value in self.objects:
+            stand_in(value)
+        return made, {id(result): index for index, result in enumerate(made)}
+
+    def index(self, value: Any) -> int:
+        return self._object_ids[id(value)]
+
+
+class _RecorderLog:
+    """Stands in for a trace recorder while a template is recorded, keeping the calls to replay with the template."""
+
+    def __init__(self, recorder: Any):
+        self.recorder = recorder
+        self.calls: list[tuple[str, tuple]] = []
+        self.has_debug_messages = False
+
+    def add_function(self, fn: Any, source_file: str, node: Any) -> None:
+        self._call("add_function", fn, source_file, node)
+
+    def log_entry(self, kind: str, key: Any, index: int) -> None:
+        if kind == "debug":
+            self.has_debug_messages = True
+        self._call("log_entry", kind, key, index)
+
+    def log_global(self, info: Any, offset: int) -> None:
+        self._call("log_global", info, offset)
+
+    def mark_opaque(self) -> None:
+        self._call("mark_opaque")
+
+    def _call(self, name: str, *args: Any) -> None:
+        self.calls.append((name, args))
+        if self.recorder is not None:
+            getattr(self.recorder, name)(*args)
+
+
+def _record(
+    signature: inspect.Signature,
+    values: dict[str, Value],
+    args: _Arguments,
+    run: Callable[[inspect.BoundArguments], Value],
+) -> _Template | None:
+    """Trace a call with stand-ins for the arguments, and return its template, or None if it cannot be replayed."""
+    c = ctx()
+    project_state = c.project_state
+    callback_state = c.callback_state
+    rom = project_state.rom
+    stand_ins, stand_in_ids = args.stand_ins()
+    bound_args = inspect.BoundArguments(
+        signature, {name: stand_ins[args.index(value)] for name, value in values.items()}
+    )
+    used_names = callback_state.used_names.copy()
+    constant_count = len(ConstantValue._parameterized_)
+    was_in_generator = callback_state.is_in_generator
+    # The recorders also see whether the call emits debug messages.
+    recorder_log = _RecorderLog(project_state.trace_recorder)
+    rom_log = _RecorderLog(rom.recorder)
+    project_state.trace_recorder = recorder_log
+    rom.recorder = rom_log
+    # The code is emitted into a scratch context, and only the template is kept.
+    entry = c.copy_with_scope(Scope())
+    try:
+        with using_ctx(entry):
+            result = run(bound_args)
+            exit_ = ctx()
+    except Exception:
+        # Calling again without a template reports the error.
+        return None
+    finally:
+        project_state.trace_recorder = recorder_log.recorder
+        rom.recorder = rom_log.recorder
+        used_names_after = callback_state.used_names
+        callback_state.used_names = used_names
+        callback_state.is_in_generator = was_in_generator
+    if recorder_log.has_debug_messages:
+        return None
+    # Constants first wrapped during the call, such as an archetype instance for a reference, were made by the call
+    # and may hold its temporary places.
+    constants = ConstantValue._parameterized_
+    made_constants = {
+        id(constant.instance) for constant in islice(reversed(constants.values()), len(constants) - constant_count)
+    }
+    try:
+        return _Template(
+            entry, exit_, result, stand_in_ids, made_constants, used_names, used_names_after, recorder_log, rom_log
+        )
+    except _Unsupported:
+        return None
+
+
+class _Template:
+    """The code emitted by a call traced with stand-in arguments."""
+
+    __slots__ = ("blocks", "exit", "recorder_calls", "result", "rom_calls", "slots", "used_names")
+
+    def __init__(
+        self,
+        entry: Context,
+        exit_: Context,
+        result: Value,
+        stand_in_ids: dict[int, int],
+        made_constants: set[int],
+        used_names: dict[str, int],
+        used_names_after: dict[str, int],
+        recorder_log: _RecorderLog,
+        rom_log: _RecorderLog,
+    ):
+        start = entry.outgoing.get(None)
+        if entry.statements or len(entry.outgoing) != 1 or start is None or exit_.outgoing:
+            raise _Unsupported
+        contexts = [start]
+        indexes = {start: 0}
+        i = 0
+        while i < len(contexts):
+            for target in contexts[i].outgoing.values():
+                if target not in indexes:
+                    indexes[target] = len(contexts)
+                    contexts.append(target)
+            i += 1
+        if exit_ not in indexes:
+            raise _Unsupported
+        self.exit = indexes[exit_]
+        encoded_result = _encode(result, stand_in_ids, made_constants, {})
+        compiler = _Compiler(used_names)
+        self.blocks = tuple(
+            (
+                context.live,
+                tuple((compiler.expr(statement), statement) for statement in context.statements),
+                (compiler.expr(context.test), context.test),
+                tuple((condition, indexes[target]) for condition, target in context.outgoing.items()),
+            )
+            for context in contexts
+        )
+        self.result = compiler.result(encoded_result)
+        self.slots = tuple(compiler.sources)
+        self.used_names = tuple(
+            (prefix, count - used_names.get(prefix, 0))
+            for prefix, count in used_names_after.items()
+            if count != used_names.get(prefix, 0)
+        )
+        self.recorder_calls = tuple(recorder_log.calls)
+        self.rom_calls = tuple(rom_log.calls)
+
+    def replay(self, args: _Arguments) -> Value:
+        c = ctx()
+        used_names = c.callback_state.used_names
+        env = []
+        for source in self.slots:
+            match source:
+                case ("t", index):
+                    env.append(args.temps[index])
+                case ("e", index):
+                    env.append(args.exprs[index].read())
+                case ("n", prefix, count, size):
+                    env.append(TempBlock(f"{prefix}{used_names.get(prefix, 0) + count}", size))
+                case ("p", slot, index, offset):
+                    env.append(BlockPlace(env[slot], index, offset))
+                case ("g", slot):
+                    env.append(IRGet(env[slot]))
+        for prefix, count in self.used_names:
+            used_names[prefix] = used_names.get(prefix, 0) + count
+        contexts = []
+        for live, statements, (build_test, test), _ in self.blocks:
+            context = c.copy_with_scope(Scope())
+            context.live = live
+            context.statements = [statement if build is None else build(env) for build, statement in statements]
+            context.test = test if build_test is None else build_test(env)
+            contexts.append(context)
+        for context, (_, _, _, outgoing) in zip(contexts, self.blocks, strict=True):
+            for condition, target in outgoing:
+                context.outgoing[condition] = contexts[target]
+        exit_ = contexts[self.exit]
+        exit_.scope = c.scope.copy()
+        c.outgoing[None] = contexts[0]
+        set_ctx(exit_)
+        project_state = c.project_state
+        if project_state.trace_recorder is not None:
+            for name, call_args in self.recorder_calls:
+                getattr(project_state.trace_recorder, name)(*call_args)
+        if project_state.rom.recorder is not None:
+            for name, call_args in self.rom_calls:
+                getattr(project_state.rom.recorder, name)(*call_args)
+        return _decode(self.result, args.objects, env, [])
+
+
+def _encode(value: Any, stand_in_ids: dict[int, int], made_constants: set[int], made: dict[int, int]) -> tuple:
+    """Describe how to rebuild `value` for another call, in terms of the arguments of the call."""
+    index = stand_in_ids.get(id(value))
+    if index is not None:
+        return "a", index
+    if isinstance(value, ConstantValue):
+        if id(value) in made_constants:
+            raise _Unsupported
+        return "k", value
+    index = made.get(id(value))
+    if index is not None:
+        return "m", index
+    type_ = type(value)
+    if type_ is Num:
+        data = value.data
+        if type(data) is float:
+            result = "c", data
+        elif type(data) is BlockPlace:
+            result = "p", data
+        elif type(data) is ExprBackingValue:
+            result = "x", data.read()
+        else:
+            raise _Unsupported
+    elif isinstance(value, Record):
+        result = (
+            "r",
+            type_,
+            value._is_frozen_,
+            tuple((name, _encode(field, stand_in_ids, made_constants, made)) for name, field in value._value_.items()),
+        )
+    elif type_ is TupleImpl:
+        result = "u", tuple(_encode(entry, stand_in_ids, made_constants, made) for entry in value.value)
+    else:
+        raise _Unsupported
+    # Rebuilt in the same order, so equal objects are rebuilt once.
+    made[id(value)] = len(made)
+    return result
+
+
+def _decode(node: tuple, objects: list[Any], env: list[Any], made: list) -> Any:
+    match node:
+        case ("a", index):
+            return objects[index]
+        case ("k", value):
+            return value
+        case ("m", index):
+            return made[index]
+        case ("c", data):
+            result = Num(data)
+        case ("p", place, build):
+            result = Num(place if build is None else build(env))
+        case ("x", expr, build):
+            result = Num(ExprBackingValue(expr if build is None else build(env)))
+        case ("r", type_, frozen, fields):
+            result = _rebuild_record(
+                type_, frozen, {name: _decode(field, objects, env, made) for name, field in fields}
+            )
+        case ("u", entries):
+            result = TupleImpl(tuple(_decode(entry, objects, env, made) for entry in entries))
+        case _:
+            raise ValueError(f"Unexpected template node {node!r}")
+    made.append(result)
+    return result
+
+
+def _rebuild_record(type_: type[Record], frozen: bool, fields: dict[str, Value]) -> Record:
+    result = type_._raw(**fields)
+    if frozen:
+        # Fields of frozen records are not copied when read.
+        result._is_frozen_ = True
+    return result
+
+
+class _Compiler:
+    """Compiles the code of a template into functions that rebuild it for a call.
+
+    The functions take the values that replace the stand-in and fresh temporary blocks of the template, in the order
+    of `sources`, and return None for code that is the same for every call. Places in those blocks, and reads of them,
+    are made once per call and shared by the code that uses them.
+    """
+
+    def __init__(self, used_names: dict[str, int]):
+        self.used_names = used_names
+        self.slots: dict[Hashable, int] = {}
+        self.sources: list[tuple] = []
+
+    def slot(self, block: TempBlock) -> int | None:
+        name = block.name
+        slot = self.slots.get(name)
+        if slot is None:
+            if name.startswith(_ARG_TEMP_PREFIX):
+                source = "t", int(name[len(_ARG_TEMP_PREFIX) :])
+            elif name.startswith(_ARG_EXPR_PREFIX):
+                source = "e", int(name[len(_ARG_EXPR_PREFIX) :])
+            else:
+                prefix = name.rstrip(digits)
+                count = int(name[len(prefix) :]) - self.used_names.get(prefix, 0) if prefix != name else 0
+                if count <= 0:
+                    # Already in use by the caller.
+                    return None
+                source = "n", prefix, count, block.size
+            slot = self._add(name, source)
+        return slot
+
+    def place_slot(self, place: BlockPlace) -> int | None:
+        block = place.block
+        if block.name.startswith(_ARG_EXPR_PREFIX):
+            # An expression used as a place.
+            raise _Unsupported
+        key = "p", block.name, place.index, place.offset
+        slot = self.slots.get(key)
+        if slot is None:
+            block_slot = self.slot(block)
+            if block_slot is None:
+                return None
+            slot = self._add(key, ("p", block_slot, place.index, place.offset))
+        return slot
+
+    def _add(self, key: Hashable, source: tuple) -> int:
+        slot = self.slots[key] = len(self.sources)
+        self.sources.append(source)
+        return slot
+
+    def _load(self, slot: int) -> Callable[[list], Any]:
+        return lambda env: env[slot]
+
+    def expr(self, node: Any) -> Callable[[list], Any] | None:
+        type_ = type(node)
+        if type_ is IRConst:
+            return None
+        if type_ is IRGet:
+            block = node.place.block
+            if type(block) is TempBlock:
+                if block.name.startswith(_ARG_EXPR_PREFIX):
+                    return self._load(self.slot(block))
+                if type(node.place.index) is int:
+                    place_slot = self.place_slot(node.place)
+                    if place_slot is None:
+                        return None
+                    key = "g", place_slot
+                    slot = self.slots.get(key)
+                    if slot is None:
+                        slot = self._add(key, key)
+                    return self._load(slot)
+            build_place = self.place(node.place)
+            if build_place is None:
+                return None
+            return lambda env: IRGet(build_place(env))
+        if type_ is IRSet:
+            place, value = node.place, node.value
+            build_place = self.place(place)
+            build_value = self.expr(value)
+            if build_value is None:
+                if build_place is None:
+                    return None
+                return lambda env: IRSet(build_place(env), value)
+            if build_place is None:
+                return lambda env: IRSet(place, build_value(env))
+            return lambda env: IRSet(build_place(env), build_value(env))
+        if type_ is not IRPureInstr and type_ is not IRInstr:
+            raise _Unsupported
+        builds = [self.expr(arg) for arg in node.args]
+        if not any(builds):
+            return None
+        op = node.op
+        parts = tuple(zip(builds, node.args, strict=True))
+        return lambda env: type_(op, [arg if build is None else build(env) for build, arg in parts])
+
+    def place(self, place: BlockPlace) -> Callable[[list], BlockPlace] | None:
+        if type(place) is not BlockPlace:
+            raise _Unsupported
+        block, index, offset = place.block, place.index, place.offset
+        build_block = None
+        if type(block) is TempBlock:
+            if type(index) is int:
+                slot = self.place_slot(place)
+                return None if slot is None else self._load(slot)
+            if block.name.startswith(_ARG_EXPR_PREFIX):
+                raise _Unsupported
+            slot = self.slot(block)
+            if slot is not None:
+                build_block = self._load(slot)
+        elif type(block) is BlockPlace:
+            build_block = self.place(block)
+        elif not isinstance(block, int):
+            build_block = self.expr(block)
+        build_index = None
+        if type(index) is BlockPlace:
+            build_index = self.place(index)
+        elif type(index) is not int:
+            build_index = self.expr(index)
+        if build_index is None:
+            if build_block is None:
+                return None
+            return lambda env: BlockPlace(build_block(env), index, offset)
+        if build_block is None:
+            return lambda env: BlockPlace(block, build_index(env), offset)
+        return lambda env: BlockPlace(build_block(env), build_index(env), offset)
+
+    def result(self, node: tuple) -> tuple:
+        match node:
+            case ("p", place):
+                return "p", place, self.place(place)
+            case ("x", expr):
+                return "x", expr, self.expr(expr)
+            case ("r", type_, frozen, fields):
+                return "r", type_, frozen, tuple((name, self.result(field)) for name, field in fields)
+            case ("u", entries):
+                return "u", tuple(self.result(entry) for entry in entries)
+            case _:
+                return node
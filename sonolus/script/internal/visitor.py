@@ -13,7 +13,7 @@ from types import FunctionType, MethodType, MethodWrapperType
 from typing import Any, Never
 
 from sonolus.backend.excepthook import install_excepthook
-from sonolus.backend.utils import get_function, get_signature, scan_writes
+from sonolus.backend.utils import get_function, get_signature, scan_writes, source_cache
 from sonolus.script.debug import assert_true
 from sonolus.script.internal.builtin_impls import BUILTIN_IMPLS, _bool, _float, _int, _len, _super
 from sonolus.script.internal.constant import ConstantValue
@@ -32,6 +32,7 @@ from sonolus.script.internal.descriptor import SonolusDescriptor
 from sonolus.script.internal.error import CompilationError
 from sonolus.script.internal.impl import validate_value
 from sonolus.script.internal.meta_fn import meta_fn
+from sonolus.script.internal.specialize import call_specialized
 from sonolus.script.internal.transient import TransientValue
 from sonolus.script.internal.tuple_impl import has_tuple_iter, tuple_iter
 from sonolus.script.internal.value import Value
@@ -60,13 +61,22 @@ def compile_and_call_at_definition[**P, R](fn: Callable[P, R], /, *args: P.args,
     if getattr(fn, "_meta_fn_", False):
         return validate_value(fn(*args, **kwargs))
     source_file, node = get_function(fn)
-    if ctx().no_eval:
-        debug_stack = ctx().callback_state.debug_stack
-        try:
-            debug_stack.append(f'File "{source_file}", line {node.lineno}, in <callback>')
-            return compile_and_call(fn, *args, **kwargs)
-        finally:
-            debug_stack.pop()
+    debug_stack = ctx().callback_state.debug_stack
+    try:
+        debug_stack.append(f'File "{source_file}", line {node.lineno}, in <callback>')
+        if ctx().no_eval:
+            try:
+                return compile_and_call(fn, *args, **kwargs)
+            except Exception as e:
+                # Raise the error again from the frame it would have passed through, so the traceback is the same.
+                return _call_at_definition(source_file, node, _reraise, e)
+        return _call_at_definition(source_file, node, compile_and_call, fn, *args, **kwargs)
+    finally:
+        debug_stack.pop()
+
+
+def _call_at_definition(source_file: str, node: ast.FunctionDef, fn: Callable, /, *args, **kwargs):
+    """Call `fn` from a frame at the definition of a callback, which starts the traceback of compilation errors."""
     location_args = {
         "lineno": node.lineno,
         "col_offset": node.col_offset,
@@ -81,16 +91,14 @@ def compile_and_call_at_definition[**P, R](fn: Callable[P, R], /, *args: P.args,
             **location_args,
         )
     )
+    return eval(
+        compile(expr, filename=source_file, mode="eval").replace(co_name="<callback>"),
+        {"fn": lambda: fn(*args, **kwargs), "_filter_traceback_": True, "_traceback_root_": True},
+    )
 
-    debug_stack = ctx().callback_state.debug_stack
-    try:
-        debug_stack.append(f'File "{source_file}", line {node.lineno}, in <callback>')
-        return eval(
-            compile(expr, filename=source_file, mode="eval").replace(co_name="<callback>"),
-            {"fn": lambda: compile_and_call(fn, *args, **kwargs), "_filter_traceback_": True, "_traceback_root_": True},
-        )
-    finally:
-        debug_stack.pop()
+
+def _reraise(e: Exception) -> Never:
+    raise e
 
 
 @functools.cache
@@ -158,6 +166,9 @@ _get_fast_binder = functools.cache(_compute_fast_binder)
 def eval_fn(fn: Callable, /, *args, **kwargs):
     _ensure_excepthook()
     source_file, node = get_function(fn)
+    trace_recorder = ctx().project_state.trace_recorder
+    if trace_recorder is not None:
+        trace_recorder.add_function(fn, source_file, node)
     if type(fn) is FunctionType:
         sig = get_signature(fn)
         function_name, qualified_name, global_base = _get_fn_info(fn)
@@ -189,9 +200,21 @@ def eval_fn(fn: Callable, /, *args, **kwargs):
             var: cell.cell_contents for var, cell in zip(code.co_freevars, closure, strict=True) if cell is not None
         }
         global_vars = ChainMap(nonlocal_vars, *global_base.maps)
-    return Visitor(
-        source_file, bound_args, global_vars, parent=None, function_name=function_name, qualified_name=qualified_name
-    ).run(node)
+
+    def run(bound_args: inspect.BoundArguments) -> Value:
+        return Visitor(
+            source_file,
+            bound_args,
+            global_vars,
+            parent=None,
+            function_name=function_name,
+            qualified_name=qualified_name,
+        ).run(node)
+
+    # Closures may change between calls, and generators keep contexts in the returned value.
+    if binder is not None and closure is None and not getattr(node, "has_yield", False):
+        return call_specialized(fn, bound_args, run)
+    return run(bound_args)
 
 
 unary_ops = {
@@ -311,8 +334,12 @@ _NUM_BIN_OP_NAMES = frozenset(
     }
 )
 
-# Type-keyed dispatch cache for Visitor.visit. AST node classes are a small closed set.
-_VISITOR_DISPATCH: dict[type, Callable] = {}
+# Visit plans keyed by AST node: each node is lowered once into a closure that evaluates it for a given visitor,
+# with its fields, operator method names, and child plans resolved up front (see _plan).
+_visit_plans: dict[ast.AST, Callable[[Visitor], Any]] = {}
+
+# Names that each function node can only read from its globals, keyed by function node (see Visitor.run).
+_function_global_names: dict[ast.AST, frozenset[str]] = {}
 
 # Cache of resolved descriptors (or None) keyed by (type, attribute name) for handle_getattr/handle_setattr.
 # Within a single build session, classes and their signatures are assumed immutable, so a resolved
@@ -329,6 +356,8 @@ def clear_frontend_caches() -> None:
     _get_fast_binder.cache_clear()
     get_signature.cache_clear()
     _descriptor_cache.clear()
+    _visit_plans.clear()
+    _function_global_names.clear()
 
 
 def _resolve_descriptor(target_type: type, key: str) -> Any:
@@ -397,6 +426,8 @@ class Visitor(ast.NodeVisitor):
     used_parent_binding_values: dict[str, Value]  # Values of parent bindings used in this
     function_name: str
     qualified_name: str
+    global_maps: Sequence[dict[str, Any]]  # The mappings of globals, searched in order
+    global_names: frozenset[str]  # Names that the function can only read from its globals
 
     def __init__(
         self,
@@ -409,6 +440,8 @@ class Visitor(ast.NodeVisitor):
     ):
         self.source_file = source_file
         self.globals = global_vars
+        self.global_maps = global_vars.maps if isinstance(global_vars, ChainMap) else (global_vars,)
+        self.global_names = frozenset()
         self.bound_args = bound_args
         self.used_names = {}
         self.return_ctxs = []
@@ -432,6 +465,10 @@ class Visitor(ast.NodeVisitor):
         from sonolus.script.internal.set_impl import SetImpl
 
         completion_timer = mark_start(self.qualified_name)
+        global_names = _function_global_names.get(node)
+        if global_names is None:
+            global_names = _function_global_names[node] = source_cache.global_names(self.source_file, node)
+        self.global_names = global_names
         before_ctx = ctx()
         before_alloc_state = ctx().save_alloc_state()
         start_ctx = before_ctx.branch_with_scope(None, Scope())
@@ -611,18 +648,10 @@ class Visitor(ast.NodeVisitor):
 
     def visit(self, node):
         """Visit a node."""
-        # We want this here so this is filtered out of tracebacks
-        node_cls = node.__class__
-        visitor = _VISITOR_DISPATCH.get(node_cls)
-        if visitor is None:
-            visitor = getattr(Visitor, "visit_" + node_cls.__name__, Visitor.generic_visit)
-            _VISITOR_DISPATCH[node_cls] = visitor
-        try:
-            return visitor(self, node)
-        except Exception as e:
-            if isinstance(e, CompilationError):
-                raise
-            self.raise_exception_at_node(node, e)
+        plan = _visit_plans.get(node)
+        if plan is None:
+            plan = _plan(node, self.global_names)
+        return plan(self)
 
     def visit_FunctionDef(self, node):
         name = node.name
@@ -654,12 +683,6 @@ class Visitor(ast.NodeVisitor):
     def visit_ClassDef(self, node):
         raise NotImplementedError("Classes within functions are not supported")
 
-    def visit_Return(self, node):
-        value = self.visit(node.value) if node.value else validate_value(None)
-        ctx().scope.set_value("$return", value)
-        self.return_ctxs.append(ctx())
-        set_ctx(ctx().into_dead())
-
     def visit_Delete(self, node):
         for target in node.targets:
             match target:
@@ -672,11 +695,6 @@ class Visitor(ast.NodeVisitor):
                 case _:
                     raise NotImplementedError("Unsupported delete target")
 
-    def visit_Assign(self, node):
-        value = self.visit(node.value)
-        for target in node.targets:
-            self.handle_assign(target, value)
-
     def visit_TypeAlias(self, node):
         raise NotImplementedError("Type aliases are not supported")
 
@@ -1115,9 +1133,6 @@ class Visitor(ast.NodeVisitor):
     def visit_Nonlocal(self, node):
         raise NotImplementedError("Nonlocal statements are not supported")
 
-    def visit_Expr(self, node):
-        return self.visit(node.value)
-
     def visit_Pass(self, node):
         pass
 
@@ -1133,62 +1148,11 @@ class Visitor(ast.NodeVisitor):
             ctx().branch_to_loop_header(loop_head)
         set_ctx(ctx().into_dead())
 
-    def visit_BoolOp(self, node) -> Value:
-        match node.op:
-            case ast.And():
-                handler = self.handle_and
-            case ast.Or():
-                handler = self.handle_or
-            case _:
-                raise NotImplementedError(f"Unsupported bool operator {op_to_symbol[type(node.op)]}")
-
-        if not node.values:
-            raise ValueError("Bool operator requires at least one operand")
-        if len(node.values) == 1:
-            return self.visit(node.values[0])
-        initial, *rest = node.values
-        return handler(self.visit(initial), ast.copy_location(ast.BoolOp(op=node.op, values=rest), node))
-
     def visit_NamedExpr(self, node):
         value = self.visit(node.value)
         self.handle_assign(node.target, value)
         return value
 
-    def visit_BinOp(self, node):
-        lhs = self.visit(node.left)
-        rhs = self.visit(node.right)
-        op = bin_ops[type(node.op)]
-        if (
-            type(lhs) is Num
-            and type(rhs) is Num
-            and op in _NUM_BIN_OP_NAMES
-            and (active_ctx := ctx()).callback_state.no_eval
-        ):
-            # Num operators never return NotImplemented for Num operands, so the negotiation can be skipped
-            self.active_ctx = active_ctx
-            return getattr(lhs, op)(rhs)
-        if lhs._is_py_() and rhs._is_py_():
-            lhs_py = lhs._as_py_()
-            rhs_py = rhs._as_py_()
-            if (
-                (isinstance(lhs_py, type) or getattr(lhs_py, "_is_comptime_value_", False))
-                and (isinstance(rhs_py, type) or getattr(rhs_py, "_is_comptime_value_", False))
-                and hasattr(type(lhs_py), op)
-            ):
-                return validate_value(getattr(lhs_py, op)(rhs_py))
-        if hasattr(lhs, op):
-            result = self.handle_call(node, getattr(lhs, op), rhs)
-            if not self.is_not_implemented(result):
-                return result
-        if hasattr(rhs, rbin_ops[type(node.op)]) and type(lhs) is not type(rhs):
-            result = self.handle_call(node, getattr(rhs, rbin_ops[type(node.op)]), lhs)
-            if not self.is_not_implemented(result):
-                return result
-        raise TypeError(
-            f"unsupported operand type(s) for {op_to_symbol[type(node.op)]}: "
-            f"'{type(lhs).__name__}' and '{type(rhs).__name__}'"
-        )
-
     def visit_UnaryOp(self, node):
         operand = self.visit(node.operand)
         if isinstance(node.op, ast.Not):
@@ -1245,7 +1209,7 @@ class Visitor(ast.NodeVisitor):
         ctx_false = ctx()
 
         set_ctx(Context.meet([ctx_true, ctx_false]))
-        return ctx().scope.get_value(res_name)
+        return self.pop_temp(res_name)
 
     def visit_Dict(self, node):
         results = {}
@@ -1389,51 +1353,7 @@ class Visitor(ast.NodeVisitor):
                 l_val = r_val
         last_ctx = ctx()  # This is the result of the last comparison returning true
         set_ctx(Context.meet([last_ctx, *false_ctxs]))
-        return ctx().scope.get_value(result_name)
-
-    def visit_Call(self, node):
-        from sonolus.script.internal.dict_impl import DictImpl
-
-        fn = self.visit(node.func)
-        args = []
-        kwargs = {}
-        for arg in node.args:
-            if not ctx().live:
-                return validate_value(None)
-            if isinstance(arg, ast.Starred):
-                args.extend(self.handle_starred(self.visit(arg.value)))
-            else:
-                args.append(self.visit(arg))
-        for keyword in node.keywords:
-            if not ctx().live:
-                return validate_value(None)
-            if keyword.arg:
-                kwargs[keyword.arg] = self.visit(keyword.value)
-            else:
-                value = self.visit(keyword.value)
-                if isinstance(value, DictImpl):
-                    value_dict = value._as_dict_with_py_keys()
-                    if not all(isinstance(k, str) for k in value_dict):
-                        raise ValueError("Keyword arguments must be strings")
-                    kwargs.update(value_dict)
-                else:
-                    raise ValueError("Starred keyword arguments (**kwargs) must be dictionaries")
-        if not ctx().live:
-            return validate_value(None)
-        if fn._is_py_() and fn._as_py_() is _super and not args and not kwargs and "__class__" in self.globals:
-            class_value = self.get_name("__class__")
-            first_param_name = next(
-                (
-                    name
-                    for name, param in self.bound_args.signature.parameters.items()
-                    if param.kind in {inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD}
-                ),
-                None,
-            )
-            if first_param_name is not None:
-                first_param_value = self.get_name(first_param_name)
-                args = (validate_value(class_value), validate_value(first_param_value))
-        return self.handle_call(node, fn, *args, **kwargs)
+        return self.pop_temp(result_name)
 
     def visit_FormattedValue(self, node):
         raise NotImplementedError("F-strings are not supported")
@@ -1441,23 +1361,9 @@ class Visitor(ast.NodeVisitor):
     def visit_JoinedStr(self, node):
         raise NotImplementedError("F-strings are not supported")
 
-    def visit_Constant(self, node):
-        return validate_value(node.value)
-
-    def visit_Attribute(self, node):
-        return self.handle_getattr(node, self.visit(node.value), node.attr)
-
-    def visit_Subscript(self, node):
-        value = self.visit(node.value)
-        slice_value = self.visit(node.slice)
-        return self.handle_getitem(node, value, slice_value)
-
     def visit_Starred(self, node):
         raise NotImplementedError("Starred expressions are not supported")
 
-    def visit_Name(self, node):
-        return self.get_name(node.id)
-
     def get_name(self, name: str):
         used_parent_binding_values = self.used_parent_binding_values
         if name in used_parent_binding_values:
@@ -1465,8 +1371,11 @@ class Visitor(ast.NodeVisitor):
         self.active_ctx = ctx()
         v = self
         while v:
-            binding = v.active_ctx.scope.bindings.get(name)
-            if binding is not None and type(binding) is not EmptyBinding:
+            scope = v.active_ctx.scope
+            binding = scope.local.get(name)
+            if binding is None:
+                binding = scope.get_binding(name)
+            if type(binding) is not EmptyBinding:
                 if type(binding) is ValueBinding:
                     binding.read_count += 1
                     result = binding.value
@@ -1477,12 +1386,18 @@ class Visitor(ast.NodeVisitor):
                     used_parent_binding_values[name] = result
                 return result
             v = v.parent
-        if name in self.globals:
-            value = self.globals[name]
-            if value is ctx:
-                raise ValueError("Unexpected use of ctx in non meta-function")
-            return validate_value(BUILTIN_IMPLS.get(id(value), value))
-        raise NameError(f"Name {name} is not defined")
+        return self.get_global(name)
+
+    def get_global(self, name: str):
+        for mapping in self.global_maps:
+            if name in mapping:
+                value = mapping[name]
+                break
+        else:
+            raise NameError(f"Name {name} is not defined")
+        if value is ctx:
+            raise ValueError("Unexpected use of ctx in non meta-function")
+        return validate_value(BUILTIN_IMPLS.get(id(value), value))
 
     def visit_List(self, node):
         raise NotImplementedError("List literals are not supported")
@@ -1547,7 +1462,7 @@ class Visitor(ast.NodeVisitor):
         set_ctx(Context.meet([ctx_true, ctx_false]))
         if l_val._is_py_() and r_val._is_py_():
             return Num._accept_(l_val._as_py_() and r_val._as_py_())
-        return ctx().scope.get_value(res_name)
+        return self.pop_temp(res_name)
 
     def handle_or(self, l_val: Value, r_expr: ast.expr) -> Value:
         ctx_init = ctx()
@@ -1575,7 +1490,7 @@ class Visitor(ast.NodeVisitor):
         set_ctx(Context.meet([ctx_true, ctx_false]))
         if l_val._is_py_() and r_val._is_py_():
             return Num._accept_(l_val._as_py_() or r_val._as_py_())
-        return ctx().scope.get_value(res_name)
+        return self.pop_temp(res_name)
 
     def generic_visit(self, node):
         if isinstance(node, ast.stmt | ast.expr):
@@ -1634,15 +1549,23 @@ class Visitor(ast.NodeVisitor):
                 and issubclass(fn._as_py_(), Value)
             ):
                 if callback_state.no_eval:
-                    # Fast path equivalent to execute_at_node, which is a passthrough when no_eval is set
-                    return validate_value(fn._as_py_()(*args, **kwargs))
+                    # Fast path equivalent to execute_at_node, which only evaluates at the node on errors when
+                    # no_eval is set
+                    try:
+                        result = fn._as_py_()(*args, **kwargs)
+                    except Exception as e:
+                        self.reraise_at_node(node, e)
+                    return validate_value(result)
                 return validate_value(self.execute_at_node(node, fn._as_py_(), *args, **kwargs))
             elif callback_state.no_eval:
-                # Fast path: execute_at_node is a passthrough when no_eval is set, so skip it and delegate
-                # to compile_and_call (ctx() is known to be set here). compile_and_call validates its own
-                # result and owns the callable dispatch -- including the FunctionType->eval_fn fast path --
+                # Fast path: execute_at_node only evaluates at the node on errors when no_eval is set, so skip it
+                # and delegate to compile_and_call (ctx() is known to be set here). compile_and_call validates its
+                # own result and owns the callable dispatch -- including the FunctionType->eval_fn fast path --
                 # so there's no outer validate_value and no duplicated dispatch logic here.
-                return compile_and_call(fn, *args, **kwargs)
+                try:
+                    return compile_and_call(fn, *args, **kwargs)
+                except Exception as e:
+                    self.reraise_at_node(node, e)
             else:
                 return self.execute_at_node(node, lambda: validate_value(compile_and_call(fn, *args, **kwargs)))
         finally:
@@ -1781,8 +1704,20 @@ class Visitor(ast.NodeVisitor):
     ) -> R:
         """Executes the given function at the given node for a better traceback."""
         if ctx().no_eval:
-            return fn(*args, **kwargs)
-
+            # Evaluating at the node is slow, so it is only done for errors, which then have the same traceback.
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                self.reraise_at_node(node, e)
+        return self._eval_at_node(node, fn, *args, **kwargs)
+
+    def reraise_at_node(self, node: ast.stmt | ast.expr, e: Exception) -> Never:
+        """Raises the given exception again from a frame at the given node, as if it had been executed there."""
+        self._eval_at_node(node, _reraise, e)
+
+    def _eval_at_node[**P, R](
+        self, node: ast.stmt | ast.expr, fn: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs
+    ) -> R:
         location_args = {
             "lineno": node.lineno,
             "col_offset": node.col_offset,
@@ -1822,6 +1757,321 @@ class Visitor(ast.NodeVisitor):
         self.used_names[name] = self.used_names.get(name, 0) + 1
         return f"${name}_{self.used_names[name]}"
 
+    def pop_temp(self, name: str) -> Value:
+        """Read a binding made under a name from new_name and unbind it, since it is not read again."""
+        scope = ctx().scope
+        value = scope.get_value(name)
+        scope.delete_binding(name)
+        return value
+
+
+def _plan(node: ast.AST, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    """Return the plan of `node`, a function of the visitor that evaluates it, building it on first use.
+
+    `global_names` are the names that the function containing `node` can only read from its globals.
+    Common node types have dedicated plans that call the plans of their children directly; others run the
+    matching `visit_*` method. Like those methods, a plan reports errors other than `CompilationError` at its node.
+    """
+    plan = _visit_plans.get(node)
+    if plan is None:
+        builder = _PLAN_BUILDERS.get(node.__class__)
+        plan = builder(node, global_names) if builder is not None else _plan_visit_method(node)
+        _visit_plans[node] = plan
+    return plan
+
+
+def _plan_visit_method(node: ast.AST) -> Callable[[Visitor], Any]:
+    method = getattr(Visitor, "visit_" + node.__class__.__name__, Visitor.generic_visit)
+
+    def plan(visitor: Visitor):
+        try:
+            return method(visitor, node)
+        except CompilationError:
+            raise
+        except Exception as e:
+            visitor.raise_exception_at_node(node, e)
+
+    return plan
+
+
+def _plan_name(node: ast.Name, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    name = node.id
+    if name in global_names:
+        # No enclosing function binds the name, so skip looking it up in their scopes.
+        def plan(visitor: Visitor):
+            try:
+                visitor.active_ctx = ctx()
+                return visitor.get_global(name)
+            except CompilationError:
+                raise
+            except Exception as e:
+                visitor.raise_exception_at_node(node, e)
+    else:
+
+        def plan(visitor: Visitor):
+            try:
+                return visitor.get_name(name)
+            except CompilationError:
+                raise
+            except Exception as e:
+                visitor.raise_exception_at_node(node, e)
+
+    return plan
+
+
+def _plan_constant(node: ast.Constant, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    value = node.value
+
+    def plan(visitor: Visitor):
+        try:
+            return validate_value(value)
+        except CompilationError:
+            raise
+        except Exception as e:
+            visitor.raise_exception_at_node(node, e)
+
+    return plan
+
+
+def _plan_attribute(node: ast.Attribute, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    value = _plan(node.value, global_names)
+    attr = node.attr
+
+    def plan(visitor: Visitor):
+        try:
+            return visitor.handle_getattr(node, value(visitor), attr)
+        except CompilationError:
+            raise
+        except Exception as e:
+            visitor.raise_exception_at_node(node, e)
+
+    return plan
+
+
+def _plan_subscript(node: ast.Subscript, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    value = _plan(node.value, global_names)
+    slice_ = _plan(node.slice, global_names)
+
+    def plan(visitor: Visitor):
+        try:
+            target = value(visitor)
+            return visitor.handle_getitem(node, target, slice_(visitor))
+        except CompilationError:
+            raise
+        except Exception as e:
+            visitor.raise_exception_at_node(node, e)
+
+    return plan
+
+
+def _plan_expr(node: ast.Expr, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    # The value's plan already reports its errors, so there is nothing left to do at the statement.
+    return _plan(node.value, global_names)
+
+
+def _plan_assign(node: ast.Assign, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    value = _plan(node.value, global_names)
+    targets = node.targets
+    if len(targets) == 1 and isinstance(targets[0], ast.Name):
+        name = targets[0].id
+
+        def plan(visitor: Visitor):
+            try:
+                result = value(visitor)
+                ctx().scope.set_value(name, result)
+            except CompilationError:
+                raise
+            except Exception as e:
+                visitor.raise_exception_at_node(node, e)
+    else:
+
+        def plan(visitor: Visitor):
+            try:
+                result = value(visitor)
+                for target in targets:
+                    visitor.handle_assign(target, result)
+            except CompilationError:
+                raise
+            except Exception as e:
+                visitor.raise_exception_at_node(node, e)
+
+    return plan
+
+
+def _plan_return(node: ast.Return, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    value = _plan(node.value, global_names) if node.value else None
+
+    def plan(visitor: Visitor):
+        try:
+            result = value(visitor) if value is not None else validate_value(None)
+            ctx().scope.set_value("$return", result)
+            visitor.return_ctxs.append(ctx())
+            set_ctx(ctx().into_dead())
+        except CompilationError:
+            raise
+        except Exception as e:
+            visitor.raise_exception_at_node(node, e)
+
+    return plan
+
+
+def _plan_bool_op(node: ast.BoolOp, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    # The parser only produces and/or operators with at least two operands.
+    handler = Visitor.handle_and if isinstance(node.op, ast.And) else Visitor.handle_or
+    if len(node.values) == 1:
+        return _plan(node.values[0], global_names)
+    initial = _plan(node.values[0], global_names)
+    # The remaining operands, evaluated by the handler if needed. This is its own node so that it gets a plan too.
+    rest = ast.copy_location(ast.BoolOp(op=node.op, values=node.values[1:]), node)
+
+    def plan(visitor: Visitor):
+        try:
+            return handler(visitor, initial(visitor), rest)
+        except CompilationError:
+            raise
+        except Exception as e:
+            visitor.raise_exception_at_node(node, e)
+
+    return plan
+
+
+def _plan_bin_op(node: ast.BinOp, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    left = _plan(node.left, global_names)
+    right = _plan(node.right, global_names)
+    op = bin_ops[type(node.op)]
+    is_num_op = op in _NUM_BIN_OP_NAMES
+
+    def plan(visitor: Visitor):
+        try:
+            lhs = left(visitor)
+            rhs = right(visitor)
+            if type(lhs) is Num and type(rhs) is Num and is_num_op and (active_ctx := ctx()).callback_state.no_eval:
+                # Num operators never return NotImplemented for Num operands, so the negotiation can be skipped
+                visitor.active_ctx = active_ctx
+                return getattr(lhs, op)(rhs)
+            return _bin_op(visitor, node, lhs, rhs)
+        except CompilationError:
+            raise
+        except Exception as e:
+            visitor.raise_exception_at_node(node, e)
+
+    return plan
+
+
+def _bin_op(visitor: Visitor, node: ast.BinOp, lhs: Value, rhs: Value) -> Value:
+    op = bin_ops[type(node.op)]
+    if lhs._is_py_() and rhs._is_py_():
+        lhs_py = lhs._as_py_()
+        rhs_py = rhs._as_py_()
+        if (
+            (isinstance(lhs_py, type) or getattr(lhs_py, "_is_comptime_value_", False))
+            and (isinstance(rhs_py, type) or getattr(rhs_py, "_is_comptime_value_", False))
+            and hasattr(type(lhs_py), op)
+        ):
+            return validate_value(getattr(lhs_py, op)(rhs_py))
+    if hasattr(lhs, op):
+        result = visitor.handle_call(node, getattr(lhs, op), rhs)
+        if not visitor.is_not_implemented(result):
+            return result
+    if hasattr(rhs, rbin_ops[type(node.op)]) and type(lhs) is not type(rhs):
+        result = visitor.handle_call(node, getattr(rhs, rbin_ops[type(node.op)]), lhs)
+        if not visitor.is_not_implemented(result):
+            return result
+    raise TypeError(
+        f"unsupported operand type(s) for {op_to_symbol[type(node.op)]}: "
+        f"'{type(lhs).__name__}' and '{type(rhs).__name__}'"
+    )
+
+
+def _plan_call(node: ast.Call, global_names: frozenset[str]) -> Callable[[Visitor], Any]:
+    func = _plan(node.func, global_names)
+    args = tuple(
+        (True, _plan(arg.value, global_names)) if isinstance(arg, ast.Starred) else (False, _plan(arg, global_names))
+        for arg in node.args
+    )
+    keywords = tuple((keyword.arg, _plan(keyword.value, global_names)) for keyword in node.keywords)
+
+    def plan(visitor: Visitor):
+        try:
+            return _call(visitor, node, func, args, keywords)
+        except CompilationError:
+            raise
+        except Exception as e:
+            visitor.raise_exception_at_node(node, e)
+
+    return plan
+
+
+def _call(
+    visitor: Visitor,
+    node: ast.Call,
+    func: Callable[[Visitor], Any],
+    args: tuple[tuple[bool, Callable[[Visitor], Any]], ...],
+    keywords: tuple[tuple[str | None, Callable[[Visitor], Any]], ...],
+):
+    from sonolus.script.internal.dict_impl import DictImpl
+
+    fn = func(visitor)
+    arg_values = []
+    kwarg_values = {}
+    for is_starred, arg in args:
+        if not ctx().live:
+            return validate_value(None)
+        if is_starred:
+            arg_values.extend(visitor.handle_starred(arg(visitor)))
+        else:
+            arg_values.append(arg(visitor))
+    for name, keyword in keywords:
+        if not ctx().live:
+            return validate_value(None)
+        if name:
+            kwarg_values[name] = keyword(visitor)
+        else:
+            value = keyword(visitor)
+            if isinstance(value, DictImpl):
+                value_dict = value._as_dict_with_py_keys()
+                if not all(isinstance(k, str) for k in value_dict):
+                    raise ValueError("Keyword arguments must be strings")
+                kwarg_values.update(value_dict)
+            else:
+                raise ValueError("Starred keyword arguments (**kwargs) must be dictionaries")
+    if not ctx().live:
+        return validate_value(None)
+    if (
+        fn._is_py_()
+        and fn._as_py_() is _super
+        and not arg_values
+        and not kwarg_values
+        and "__class__" in visitor.globals
+    ):
+        class_value = visitor.get_name("__class__")
+        first_param_name = next(
+            (
+                name
+                for name, param in visitor.bound_args.signature.parameters.items()
+                if param.kind in {inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD}
+            ),
+            None,
+        )
+        if first_param_name is not None:
+            first_param_value = visitor.get_name(first_param_name)
+            arg_values = (validate_value(class_value), validate_value(first_param_value))
+    return visitor.handle_call(node, fn, *arg_values, **kwarg_values)
+
+
+_PLAN_BUILDERS: dict[type, Callable[[Any, frozenset[str]], Callable[[Visitor], Any]]] = {
+    ast.Name: _plan_name,
+    ast.Constant: _plan_constant,
+    ast.Attribute: _plan_attribute,
+    ast.Subscript: _plan_subscript,
+    ast.Expr: _plan_expr,
+    ast.Assign: _plan_assign,
+    ast.Return: _plan_return,
+    ast.BoolOp: _plan_bool_op,
+    ast.BinOp: _plan_bin_op,
+    ast.Call: _plan_call,
+}
+
 
 # Not using @contextmanager so it doesn't end up in tracebacks
 class ReportingErrorsAtNode:
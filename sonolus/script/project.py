@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from os import PathLike
 from pathlib import Path
 from typing import ClassVar, TypedDict
 
 from sonolus.backend import optimize
+from sonolus.backend.optimize.cost import CostModel
 from sonolus.script.archetype import ArchetypeSchema
 from sonolus.script.engine import Engine
 from sonolus.script.internal.context import RuntimeChecks
@@ -149,4 +150,45 @@ class BuildConfig:
     runtime_checks: RuntimeChecks = RuntimeChecks.NONE
     """Runtime error checking mode."""
 
+    jobs: int = 1
+    """The number of threads used to optimize callbacks in parallel.
+
+    Callbacks are still traced serially and the output is identical regardless of this setting.
+    """
+
+    workers: int = 1
+    """The number of worker processes used to optimize callbacks in parallel.
+
+    Takes precedence over `jobs` when greater than 1. Callbacks are still traced serially in the main process and the
+    output is identical regardless of this setting.
+    """
+
+    concurrent_modes: bool = False
+    """Whether to build the play, watch, preview, and tutorial modes concurrently in worker processes.
+
+    The output is identical to a serial build. The engine-wide tables of the previous build (kept in memory and in
+    `cache_dir`) predict the indexes each mode uses; without them, or on platforms without `fork`, modes are built
+    serially.
+    """
+
+    cache_dir: PathLike | None = None
+    """The directory of the persistent cache of optimized callbacks, or None to disable it.
+
+    Callbacks whose traced code is unchanged since an earlier build reuse that build's optimizer output.
+    """
+
+    cost_budgets: Mapping[str, float] | None = None
+    """Budgets of the estimated runtime cost of callbacks, in weighted nodes evaluated per call.
+
+    Keys are callback names, either as in Sonolus (e.g. `updateParallel`) or as in Python (e.g. `update_parallel`),
+    and apply to the callback of every archetype. A key prefixed with an archetype name (e.g. `Note.update_parallel`)
+    applies only to that archetype and takes precedence. See `cost_model` for how the cost is estimated.
+    """
+
+    fail_on_cost_budget: bool = True
+    """Whether a callback over its cost budget fails the build, rather than only emitting a warning."""
+
+    cost_model: CostModel | None = None
+    """The loop trip count and op weights of the estimated runtime cost, or None for the defaults."""
+
     verbose: bool = False
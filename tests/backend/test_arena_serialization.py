@@ -0,0 +1,105 @@
+"""Binary serialization of the arena IR (``Func.to_bytes`` / ``func_from_bytes``).
+
+A deserialized arena must export to exactly the CFG the original exports to
+(``to_basic_blocks``), hash to the same digest, and optimize to the same node.
+Malformed input is rejected with ValueError rather than trusted.
+"""
+
+from __future__ import annotations
+
+import marshal
+
+import pytest
+
+from sonolus.backend._opt import ir  # noqa: PLC2701
+from sonolus.backend.blocks import PlayBlock
+from sonolus.backend.ir import IRConst, IRGet, IRInstr, IRPureInstr, IRSet
+from sonolus.backend.mode import Mode
+from sonolus.backend.ops import Op
+from sonolus.backend.optimize import STANDARD_PASSES, OptimizerConfig, cfg_to_engine_node, run_passes
+from sonolus.backend.optimize.flow import BasicBlock, cfg_to_text
+from sonolus.backend.place import BlockPlace, TempBlock
+from sonolus.build.compile import callback_to_arena
+from tests.backend import _corpus
+from tests.backend._corpus import iter_callbacks
+
+
+def _scalar(name):
+    return BlockPlace(TempBlock(name, 1), 0, 0)
+
+
+def _branchy_cfg():
+    b0 = BasicBlock()
+    t = BasicBlock()
+    f = BasicBlock()
+    b0.statements = [
+        IRSet(_scalar("a"), IRGet(BlockPlace(PlayBlock.EntityData, 4, 0))),
+        IRSet(BlockPlace(TempBlock("arr", 4), IRGet(_scalar("a")), 1), IRConst(-2.5)),
+    ]
+    b0.test = IRPureInstr(Op.Less, [IRGet(_scalar("a")), IRConst(3)])
+    b0.connect_to(f, 0)
+    b0.connect_to(t, None)
+    t.statements = [IRInstr(Op.DebugLog, [IRGet(BlockPlace(IRGet(_scalar("a")), 2, 0))])]
+    f.statements = [IRSet(BlockPlace(PlayBlock.EntityMemory, 0, 1), IRConst(float("nan")))]
+    return b0
+
+
+def _round_trip(func):
+    return ir.func_from_bytes(func.to_bytes())
+
+
+@pytest.mark.parametrize("mode", [None, Mode.PLAY])
+def test_round_trip_exports_the_same_cfg(mode):
+    func = ir.marshal_in(_branchy_cfg(), mode, "updateSequential")
+    restored = _round_trip(func)
+
+    assert cfg_to_text(ir.to_basic_blocks(restored)) == cfg_to_text(ir.to_basic_blocks(func))
+    assert restored.digest() == func.digest()
+    assert restored.stats() == func.stats()
+    assert restored.to_bytes() == func.to_bytes()
+
+
+def test_round_trip_over_callback_corpus():
+    count = 0
+    for label, callback_name, factory in iter_callbacks(Mode.PLAY):
+        cfg = factory()
+        config = OptimizerConfig(mode=Mode.PLAY, callback=callback_name)
+        for form in (cfg, run_passes(cfg, STANDARD_PASSES, config)):
+            func = ir.marshal_in(form, Mode.PLAY, callback_name)
+            exported = ir.to_basic_blocks(func)
+            restored = ir.to_basic_blocks(_round_trip(func))
+            assert cfg_to_text(restored) == cfg_to_text(exported), label
+        # The last form is the optimized one, which must also emit the same node.
+        assert cfg_to_engine_node(restored) == cfg_to_engine_node(exported), label
+        count += 1
+    assert count > 0
+
+
+def test_tracing_into_the_arena_matches_marshal_in(monkeypatch):
+    expected = {
+        label: ir.marshal_in(factory(), Mode.PLAY, callback_name).to_bytes()
+        for label, callback_name, factory in iter_callbacks(Mode.PLAY)
+    }
+    monkeypatch.setattr(_corpus, "callback_to_cfg", callback_to_arena)
+    for label, _, factory in iter_callbacks(Mode.PLAY):
+        assert factory().to_bytes() == expected[label], label
+
+
+def test_malformed_data_is_rejected():
+    data = ir.marshal_in(_branchy_cfg(), Mode.PLAY, "updateSequential").to_bytes()
+    version, byteorder, packed, *rest = marshal.loads(data)
+
+    with pytest.raises(ValueError, match="Malformed"):
+        ir.func_from_bytes(data[:10])
+    with pytest.raises(ValueError, match="version"):
+        ir.func_from_bytes(marshal.dumps((version + 1, byteorder, packed, *rest)))
+    with pytest.raises(ValueError, match="size"):
+        ir.func_from_bytes(marshal.dumps((version, byteorder, packed[:-4], *rest)))
+
+    # Point the first instruction's block at a block that does not exist.
+    corrupt = bytearray(packed)
+    header_words, instr_block_word = 10, 2
+    offset = 4 * (header_words + instr_block_word)
+    corrupt[offset : offset + 4] = (1000).to_bytes(4, byteorder)
+    with pytest.raises(ValueError, match="Invalid arena data"):
+        ir.func_from_bytes(marshal.dumps((version, byteorder, bytes(corrupt), *rest)))
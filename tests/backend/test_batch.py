@@ -0,0 +1,144 @@
+"""Tests for batched evaluation across lanes (``sonolus.backend.batch``) against the scalar interpreter."""
+
+from array import array
+
+import pytest
+from hypothesis import assume, given, settings
+
+from sonolus.backend.interpret import Interpreter
+from sonolus.backend.node import FunctionNode
+from sonolus.backend.ops import Op
+from tests.backend.test_interpret_compiled import _bits, _trees
+
+np = pytest.importorskip("numpy")
+
+from sonolus.backend.batch import BatchInterpreter, batchable
+
+# Blocks 0 and 1 differ per lane and may be written; block 2 is shared.
+_LANES = [
+    {0: [0, 1, 2, 1, 0, 2], 1: [2.0, 0.5, -1.0, 1.0]},
+    {0: [1, 0, 0, 2, 2, 1], 1: [0.0, 1.0, 3.0, -0.0]},
+    {0: [2, 2, 1, 0, 1, 0], 1: [1.5, 2.0, 0.0, 1.0]},
+    {0: [0, 0, 0, 0, 0, 0], 1: [1.0, 1.0, 1.0, 1.0]},
+]
+_SHARED = {2: [1, 1, 0, 0]}
+# Small blocks keep comparing the lanes' memory cheap.
+_SIZES = {0: 8, 1: 8, 2: 8}
+
+
+def _scalar(node, lane: dict[int, list[float]]) -> tuple:
+    it = Interpreter(_SIZES)
+    for block, values in {**_SHARED, **lane}.items():
+        it.blocks[block] = values
+    try:
+        result = _bits(float(it.run(node)))
+    except Exception:
+        return None, None, None
+    return result, {block: [_bits(value) for value in it.blocks[block]] for block in lane}, it.executed
+
+
+def _batched(node, lanes: list[dict[int, list[float]]]) -> tuple:
+    shared = Interpreter(_SIZES).blocks
+    for block, values in _SHARED.items():
+        shared[block] = values
+    memory = {block: [array("d", values) for values in (lane[block] for lane in lanes)] for block in lanes[0]}
+    for block, sources in memory.items():
+        for values in sources:
+            values.extend(array("d", [-1.0]) * (_SIZES[block] - len(values)))
+    batch = BatchInterpreter(shared, memory)
+    result = batch.run(node)
+    batch.write_back()
+    return result, memory, batch.executed
+
+
+def assert_same_as_scalar(node, lanes=_LANES) -> None:
+    expected = [_scalar(node, lane) for lane in lanes]
+    try:
+        result, memory, executed = _batched(node, lanes)
+    except Exception:
+        # Callers rerun the lanes one by one, which must then fail too.
+        assert any(outcome[0] is None for outcome in expected)
+        return
+    assert all(outcome[0] is not None for outcome in expected)
+    assert [_bits(value) for value in result.tolist()] == [outcome[0] for outcome in expected]
+    for i, (_, blocks, _) in enumerate(expected):
+        assert {block: [_bits(value) for value in memory[block][i]] for block in blocks} == blocks
+    assert executed == sum(outcome[2] for outcome in expected)
+
+
+def _floats(node):
+    # Lane values are floats, so integer constants could give `-0.0` where the interpreter gives `0`.
+    if isinstance(node, FunctionNode):
+        return FunctionNode(node.func, tuple(_floats(arg) for arg in node.args))
+    return float(node)
+
+
+@settings(max_examples=500, deadline=None)
+@given(_trees)
+def test_random_trees_match_scalar(node):
+    assume(batchable(node, {0, 1}))
+    assert_same_as_scalar(_floats(node))
+
+
+def test_loops_and_breaks_split_lanes():
+    i = FunctionNode(Op.Get, (1, 3))
+    # Count block 1[3] up to block 0[lane-dependent] with a while loop, breaking out early at 2.
+    loop = FunctionNode(
+        Op.Block,
+        (
+            FunctionNode(
+                Op.While,
+                (
+                    FunctionNode(Op.Less, (i, FunctionNode(Op.Add, (FunctionNode(Op.Get, (0, 0)), 2)))),
+                    FunctionNode(
+                        Op.Execute,
+                        (
+                            FunctionNode(Op.If, (FunctionNode(Op.Equal, (i, 2)), FunctionNode(Op.Break, (1, i)), 0)),
+                            FunctionNode(Op.IncrementPost, (1, 3)),
+                        ),
+                    ),
+                ),
+            ),
+        ),
+    )
+    # A jump loop whose lanes take different paths: 0 -> 2 -> 3 or 0 -> 1 -> 3, based on block 0[1].
+    jumps = FunctionNode(
+        Op.JumpLoop,
+        (
+            FunctionNode(Op.If, (FunctionNode(Op.Get, (0, 1)), 1, 2)),
+            FunctionNode(Op.Execute, (FunctionNode(Op.SetAdd, (1, 0, 10)), 3)),
+            FunctionNode(Op.Execute, (FunctionNode(Op.SetMultiply, (1, 0, 2)), 3)),
+            FunctionNode(Op.Get, (1, 0)),
+        ),
+    )
+    lanes = [{0: [k % 3, k % 2], 1: [float(k), 0.5, 0.0, 0.0]} for k in range(10)]
+    assert batchable(loop, {0, 1})
+    assert batchable(jumps, {0, 1})
+    assert_same_as_scalar(loop, lanes)
+    assert_same_as_scalar(jumps, lanes)
+    assert_same_as_scalar(FunctionNode(Op.Execute, (loop, jumps)), lanes)
+
+
+def test_unbatchable_nodes():
+    assert not batchable(FunctionNode(Op.Set, (2, 0, 1)), {0, 1})
+    assert not batchable(FunctionNode(Op.Set, (FunctionNode(Op.Get, (0, 0)), 0, 1)), {0, 1})
+    assert not batchable(FunctionNode(Op.SetPointed, (0, 0, 0, 1)), {0, 1})
+    assert not batchable(FunctionNode(Op.Random, (0, 1)), {0, 1})
+    assert not batchable(FunctionNode(Op.Draw, (0,) * 10), {0, 1})
+    assert batchable(FunctionNode(Op.Draw, (0,) * 10), {0, 1}, {Op.Draw})
+
+
+def test_failed_batch_leaves_memory_alone():
+    memory = [array("d", [1.0, 0.0]), array("d", [0.0, 0.0])]
+    # The second lane divides by zero after both lanes wrote.
+    node = FunctionNode(
+        Op.Execute, (FunctionNode(Op.Set, (0, 1, 5)), FunctionNode(Op.Divide, (1, FunctionNode(Op.Get, (0, 0)))))
+    )
+    batch = BatchInterpreter(Interpreter().blocks, {0: memory})
+    with pytest.raises(ZeroDivisionError):
+        batch.run(node)
+    assert memory == [array("d", [1.0, 0.0]), array("d", [0.0, 0.0])]
+    batch = BatchInterpreter(Interpreter().blocks, {0: memory[:1]})
+    assert batch.run(node).tolist() == [1.0]
+    batch.write_back()
+    assert memory[0] == array("d", [1.0, 5.0])
@@ -0,0 +1,113 @@
+"""Tests for the persistent compile cache (``sonolus.backend.optimize.cache``)."""
+
+from __future__ import annotations
+
+import os
+
+from sonolus.backend._opt.ir import marshal_in  # noqa: PLC2701
+
+from sonolus.backend.ir import IRConst, IRGet, IRInstr, IRPureInstr
+from sonolus.backend.mode import Mode
+from sonolus.backend.node import FunctionNode
+from sonolus.backend.ops import Op
+from sonolus.backend.optimize import STANDARD_PASSES, OptimizerConfig, optimize_and_finalize
+from sonolus.backend.optimize.cache import CompileCache, SharedNodes, decode_node, encode_node
+from sonolus.backend.optimize.flow import BasicBlock
+from sonolus.backend.place import BlockPlace
+
+
+def _cfg(value):
+    return BasicBlock(
+        statements=[IRInstr(Op.DebugLog, [IRPureInstr(Op.Add, [IRConst(value), IRConst(2)])])],
+    )
+
+
+def test_encode_decode_round_trip_preserves_sharing_and_number_types():
+    shared = FunctionNode(Op.Add, (1, 2.5))
+    node = FunctionNode(Op.Block, (FunctionNode(Op.Execute, (shared, shared, -0.0)), 3))
+
+    decoded = decode_node(encode_node(node))
+
+    assert decoded == node
+    execute = decoded.args[0]
+    assert execute.args[0] is execute.args[1]
+    assert type(execute.args[0].args[0]) is int
+    assert type(execute.args[0].args[1]) is float
+    assert str(execute.args[2]) == "-0.0"
+
+
+def test_arena_digest_is_stable_and_content_sensitive():
+    assert marshal_in(_cfg(1)).digest() == marshal_in(_cfg(1)).digest()
+    assert marshal_in(_cfg(1)).digest() != marshal_in(_cfg(3)).digest()
+
+
+def test_get_after_put_counts_hits_and_misses(tmp_path):
+    cache = CompileCache(tmp_path / "opt")
+    key = cache.key(marshal_in(_cfg(1)).digest(), "standard", None, "cb")
+    node = FunctionNode(Op.Execute, (FunctionNode(Op.DebugLog, (3,)), 0))
+
+    assert cache.get(key) is None
+    cache.put(key, node)
+    assert cache.get(key) == node
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    assert cache.key(marshal_in(_cfg(1)).digest(), "fast", None, "cb") != key
+    assert cache.key(marshal_in(_cfg(1)).digest(), "standard", None, "other") != key
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = CompileCache(tmp_path)
+    cache.put("k", 1)
+    (tmp_path / "k.node").write_bytes(b"\x00garbage")
+    assert cache.get("k") is None
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    cache = CompileCache(tmp_path)
+    node = FunctionNode(Op.Execute, tuple(range(100)))
+    for i, key in enumerate(["old", "mid", "new"]):
+        cache.put(key, node)
+        os.utime(tmp_path / f"{key}.node", ns=(i * 10**9, i * 10**9))
+    size = (tmp_path / "old.node").stat().st_size
+
+    # Reading "old" makes it the most recently used entry.
+    assert cache.get("old") == node
+    cache.max_bytes = 2 * size
+    cache.prune()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["new.node", "old.node"]
+
+
+def _block_2000_cfg():
+    # LevelMemory in play and watch mode, writable in updateSequential, and PreviewData in preview mode.
+    read = IRGet(BlockPlace(2000, 0))
+    return BasicBlock(statements=[IRInstr(Op.DebugLog, [IRPureInstr(Op.Add, [read, read])])])
+
+
+def test_shared_nodes_reuse_equal_arenas_across_modes():
+    shared = SharedNodes()
+    play = optimize_and_finalize(
+        _block_2000_cfg(), STANDARD_PASSES, OptimizerConfig(Mode.PLAY, "updateParallel"), shared=shared
+    )
+    watch = optimize_and_finalize(
+        _block_2000_cfg(), STANDARD_PASSES, OptimizerConfig(Mode.WATCH, "updateParallel"), shared=shared
+    )
+
+    assert watch is play
+    assert (shared.hits, shared.misses) == (1, 1)
+
+
+def test_shared_nodes_tell_apart_mode_dependent_arenas():
+    shared = SharedNodes()
+    configs = [
+        OptimizerConfig(Mode.PLAY, "updateParallel"),
+        # Writable here.
+        OptimizerConfig(Mode.PLAY, "updateSequential"),
+        # A runtime-constant block here.
+        OptimizerConfig(Mode.PREVIEW, "render"),
+    ]
+    for config in configs:
+        node = optimize_and_finalize(_block_2000_cfg(), STANDARD_PASSES, config, shared=shared)
+        assert node == optimize_and_finalize(_block_2000_cfg(), STANDARD_PASSES, config)
+
+    assert (shared.hits, shared.misses) == (0, 3)
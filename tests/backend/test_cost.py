@@ -0,0 +1,86 @@
+"""Tests for the static runtime cost estimate (``sonolus.backend.optimize.cost``) against the interpreter."""
+
+import pytest
+
+from sonolus.backend.interpret import Interpreter
+from sonolus.backend.node import FunctionNode
+from sonolus.backend.ops import Op
+from sonolus.backend.optimize.cost import CostModel, estimate_cost
+
+_UNIT = CostModel(op_weights=dict.fromkeys(Op, 1))
+_K = FunctionNode(Op.Get, (10000, 0))
+
+
+def _callback(*blocks) -> FunctionNode:
+    return FunctionNode(Op.Block, (FunctionNode(Op.JumpLoop, (*blocks, 0)),))
+
+
+def _execute(*args) -> FunctionNode:
+    return FunctionNode(Op.Execute, args)
+
+
+def _counter_loop(bound) -> list[FunctionNode]:
+    # k = 0; while k < bound: block 1[0] += k; k += 1
+    return [
+        _execute(FunctionNode(Op.Set, (10000, 0, 0)), 1),
+        _execute(FunctionNode(Op.If, (FunctionNode(Op.Less, (_K, bound)), 2, 3))),
+        _execute(FunctionNode(Op.SetAdd, (1, 0, _K)), FunctionNode(Op.IncrementPost, (10000, 0)), 1),
+    ]
+
+
+def _executed(node, **blocks) -> int:
+    it = Interpreter()
+    for block, values in blocks.items():
+        it.blocks[int(block[1:])] = values
+    it.run(node)
+    return it.executed
+
+
+def test_straight_line_matches_the_interpreter():
+    node = _callback(
+        _execute(FunctionNode(Op.Set, (1, 0, FunctionNode(Op.Add, (FunctionNode(Op.Get, (1, 1)), 2)))), 1),
+        _execute(FunctionNode(Op.If, (1, 3, 2))),
+        _execute(FunctionNode(Op.DebugLog, (1,)), 3),
+        _execute(FunctionNode(Op.Break, (1, FunctionNode(Op.Get, (1, 0)))), FunctionNode(Op.DebugLog, (1,)), 4),
+    )
+    # Block 1 always jumps to block 3, which breaks out before its second statement.
+    assert estimate_cost(node, _UNIT) == _executed(node) == 11
+
+
+@pytest.mark.parametrize("bound", [0, 1, 5])
+def test_constant_trip_counts_are_exact(bound):
+    node = _callback(*_counter_loop(bound))
+    assert estimate_cost(node, _UNIT) == pytest.approx(_executed(node))
+
+
+def test_dynamic_loops_use_the_default_trip_count():
+    node = _callback(*_counter_loop(FunctionNode(Op.Get, (2, 0))))
+    for trip in (3, 8):
+        model = CostModel(loop_trip_count=trip, op_weights=_UNIT.op_weights)
+        assert estimate_cost(node, model) == pytest.approx(_executed(node, b2=[float(trip)]))
+
+
+def test_nested_loops_multiply():
+    # for i in range(3): for k in range(4): ...
+    i = FunctionNode(Op.Get, (10000, 1))
+    node = _callback(
+        _execute(FunctionNode(Op.Set, (10000, 1, 0)), 1),
+        _execute(FunctionNode(Op.If, (FunctionNode(Op.Less, (i, 3)), 2, 6))),
+        _execute(FunctionNode(Op.Set, (10000, 0, 0)), 3),
+        _execute(FunctionNode(Op.If, (FunctionNode(Op.Less, (_K, 4)), 4, 5))),
+        _execute(FunctionNode(Op.SetAdd, (1, 0, _K)), FunctionNode(Op.IncrementPost, (10000, 0)), 3),
+        _execute(FunctionNode(Op.IncrementPost, (10000, 1)), 1),
+    )
+    assert estimate_cost(node, _UNIT) == pytest.approx(_executed(node))
+
+
+def test_branches_and_weights():
+    test = FunctionNode(Op.Get, (1, 0))
+    draw = FunctionNode(Op.Draw, (0,) * 10)
+    # One arm draws, the other adds two numbers.
+    node = FunctionNode(Op.If, (test, draw, FunctionNode(Op.Add, (1, 2))))
+    assert estimate_cost(node, _UNIT) == 1 + 1 + (1 + 1) / 2
+    assert estimate_cost(node) == 1 + 1 + (8 + 1) / 2
+    assert estimate_cost(node, CostModel(op_weights={"Draw": 20})) == 1 + 1 + (20 + 1) / 2
+    both = FunctionNode(Op.And, (test, test, test))
+    assert estimate_cost(both) == 1 + 1 + 0.5 + 0.25
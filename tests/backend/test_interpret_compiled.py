@@ -0,0 +1,236 @@
+"""Differential tests for the closure-compiled interpreter path (``compile_node``).
+
+``Interpreter.run_compiled`` must be indistinguishable from the tree-walking
+``Interpreter.run`` oracle: same return value (bit-for-bit), same memory and debug
+log afterwards, and the same exception (type and message) when evaluation fails.
+Checked on Hypothesis-generated expression trees and on every pydori callback.
+"""
+
+import math
+import random
+import struct
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from sonolus.backend.blocks import PlayBlock, TutorialBlock, WatchBlock
+from sonolus.backend.interpret import Interpreter, compile_node
+from sonolus.backend.mode import Mode
+from sonolus.backend.node import FunctionNode
+from sonolus.backend.ops import Op
+from sonolus.backend.optimize import FAST_PASSES, OptimizerConfig, cfg_to_engine_node, run_passes
+from tests.backend._corpus import iter_callbacks
+
+
+def _bits(value) -> object:
+    if isinstance(value, float):
+        return "nan" if math.isnan(value) else struct.pack(">d", value)
+    return value
+
+
+def _outcome(node, compiled: bool, seed: dict[int, list[float]] | None = None, count: bool = False) -> tuple:
+    """Run `node` on a fresh interpreter; return everything observable about the run.
+
+    The number of executed nodes is included when it is counted (always by `run`).
+    """
+    it = Interpreter()
+    for block, values in (seed or {}).items():
+        it.blocks[block] = list(values)
+    random.seed(0)
+    try:
+        result = ("ok", _bits(it.run_compiled(node, count=count) if compiled else it.run(node)))
+    except Exception as e:
+        result = ("error", type(e), str(e))
+    executed = it.executed if count or not compiled else None
+    return result, it.blocks.snapshot(), [_bits(v) for v in it.log], executed
+
+
+def assert_same_as_oracle(node, seed: dict[int, list[float]] | None = None) -> None:
+    expected = _outcome(node, False, seed)
+    assert _outcome(node, True, seed, count=True) == expected
+    assert _outcome(node, True, seed)[:3] == expected[:3]
+
+
+# Memory blocks 0-2 hold small integers, so computed addresses are often valid.
+_SEED = {0: [0, 1, 2, 1, 0, 2], 1: [2.0, 0.5, -1.0, 1.0], 2: [1, 1, 0, 0]}
+
+_leaves = st.sampled_from([0, 1, 2, 3, -1, 0.5, -0.0, 1.5, 2.0, math.inf, math.nan, 65536])
+
+_FIXED_ARITY = {
+    Op.Abs: 1,
+    Op.Floor: 1,
+    Op.Frac: 1,
+    Op.Negate: 1,
+    Op.Not: 1,
+    Op.Sign: 1,
+    Op.Round: 1,
+    Op.Log: 1,
+    Op.EaseInOutBack: 1,
+    Op.DebugLog: 1,
+    Op.Equal: 2,
+    Op.Less: 2,
+    Op.GreaterOr: 2,
+    Op.Max: 2,
+    Op.Arctan2: 2,
+    Op.Get: 2,
+    Op.RandomInteger: 2,
+    Op.Random: 2,
+    Op.Break: 2,
+    Op.If: 3,
+    Op.Set: 3,
+    Op.Clamp: 3,
+    Op.Lerp: 3,
+    Op.GetPointed: 3,
+    Op.SetAdd: 3,
+    Op.IncrementPost: 2,
+    Op.DecrementPre: 2,
+    Op.GetShifted: 4,
+    Op.SetPointed: 4,
+    Op.SetRemPointed: 4,
+    Op.IncrementPrePointed: 3,
+    Op.SetShifted: 5,
+    Op.SetPowerShifted: 5,
+    Op.DecrementPostShifted: 4,
+    Op.Copy: 5,
+    Op.Remap: 5,
+    Op.JudgeSimple: 5,
+}
+_VARIADIC = [
+    Op.Add,
+    Op.Subtract,
+    Op.Multiply,
+    Op.Divide,
+    Op.Mod,
+    Op.Rem,
+    Op.Power,
+    Op.And,
+    Op.Or,
+    Op.Execute,
+    Op.Execute0,
+    Op.Block,
+    Op.Switch,
+    Op.SwitchWithDefault,
+    Op.SwitchInteger,
+    Op.SwitchIntegerWithDefault,
+]
+
+
+def _extend(children):
+    fixed = st.sampled_from(sorted(_FIXED_ARITY)).flatmap(
+        lambda op: st.lists(children, min_size=_FIXED_ARITY[op], max_size=_FIXED_ARITY[op]).map(
+            lambda args: FunctionNode(op, tuple(args))
+        )
+    )
+    variadic = st.builds(
+        lambda op, args: FunctionNode(op, tuple(args)),
+        st.sampled_from(_VARIADIC),
+        st.lists(children, max_size=5),
+    )
+    # A wrong arity exercises the fallback to `run`.
+    any_arity = st.builds(
+        lambda op, args: FunctionNode(op, tuple(args)),
+        st.sampled_from(sorted(_FIXED_ARITY)),
+        st.lists(children, max_size=3),
+    )
+    return st.one_of(fixed, fixed, variadic, any_arity)
+
+
+_trees = st.recursive(_leaves, _extend, max_leaves=24)
+
+
+@settings(max_examples=500, deadline=None)
+@given(_trees)
+def test_random_trees_match_oracle(node):
+    assert_same_as_oracle(node, _SEED)
+
+
+@given(_trees)
+def test_shared_subtrees_match_oracle(node):
+    # The same subtree object used several times is compiled once and must still be
+    # evaluated once per use.
+    counter = FunctionNode(Op.IncrementPost, (3, 0))
+    assert_same_as_oracle(FunctionNode(Op.Execute, (counter, node, counter, FunctionNode(Op.Add, (counter, counter)))))
+
+
+def test_loops_match_oracle():
+    # for i in range(5): log(i * i), as While, DoWhile, and a JumpLoop with a Break out of a Block.
+    i = FunctionNode(Op.Get, (5, 0))
+    body = FunctionNode(
+        Op.Execute,
+        (FunctionNode(Op.DebugLog, (FunctionNode(Op.Multiply, (i, i)),)), FunctionNode(Op.IncrementPost, (5, 0))),
+    )
+    test = FunctionNode(Op.Less, (i, 5))
+    init = FunctionNode(Op.Set, (5, 0, 0))
+    jump_loop = FunctionNode(
+        Op.JumpLoop,
+        (
+            FunctionNode(Op.Execute, (init, 1)),
+            FunctionNode(Op.If, (test, 2, 3)),
+            FunctionNode(Op.Execute, (body, 1)),
+            FunctionNode(Op.Break, (1, 42)),
+        ),
+    )
+    for node in (
+        FunctionNode(Op.Execute, (init, FunctionNode(Op.While, (test, body)))),
+        FunctionNode(Op.Execute, (init, FunctionNode(Op.DoWhile, (body, test)))),
+        FunctionNode(Op.Block, (jump_loop,)),
+        FunctionNode(Op.Block, (FunctionNode(Op.Block, (FunctionNode(Op.Break, (2, 7)),)),)),
+        FunctionNode(Op.Block, (FunctionNode(Op.Block, (FunctionNode(Op.Break, (3, 7)),)),)),
+    ):
+        assert_same_as_oracle(node)
+
+
+def test_unsupported_op_raises_like_oracle():
+    assert_same_as_oracle(FunctionNode(Op.Draw, (1, 2, 3)))
+    assert_same_as_oracle(FunctionNode(Op.StackPush, (1,)))
+
+
+class _Runtime(Interpreter):
+    def call_runtime(self, func, args):
+        self.log.append(func.value)
+        self.log.extend(args)
+        return len(args)
+
+
+def test_runtime_functions_are_delegated():
+    node = FunctionNode(
+        Op.Add,
+        (FunctionNode(Op.Draw, (1, FunctionNode(Op.Get, (1, 0)), 3)), FunctionNode(Op.HasSkinSprite, (4,))),
+    )
+    for compiled in (False, True):
+        it = _Runtime()
+        assert (it.run_compiled(node, count=True) if compiled else it.run(node)) == 4
+        assert it.log == ["Draw", 1, -1.0, 3, "HasSkinSprite", 4]
+        assert it.executed == 4
+
+
+def test_compiled_node_is_reusable_across_interpreters():
+    node = FunctionNode(Op.Execute, (FunctionNode(Op.SetAdd, (1, 0, 2)), FunctionNode(Op.Get, (1, 0))))
+    run = compile_node(node)
+    first, second = Interpreter(), Interpreter()
+    second.blocks[1] = [10.0]
+    assert run(first) == 1.0
+    assert run(first) == 3.0
+    assert run(second) == 12.0
+
+
+def _corpus_nodes():
+    for mode in (Mode.PLAY, Mode.WATCH, Mode.TUTORIAL):
+        for label, callback, factory in iter_callbacks(mode):
+            if label.endswith("_dev"):
+                continue
+            yield (
+                label,
+                cfg_to_engine_node(run_passes(factory(), FAST_PASSES, OptimizerConfig(mode=mode, callback=callback))),
+            )
+
+
+@pytest.mark.parametrize("fill", [0, 1])
+def test_pydori_callbacks_match_oracle(fill):
+    # Memory is pre-filled with small integers so callbacks run past their first reads.
+    rng = random.Random(fill)
+    blocks = sorted({int(block) for blocks in (PlayBlock, WatchBlock, TutorialBlock) for block in blocks})
+    seed = {block: [rng.randrange(3) if fill else 0 for _ in range(512)] for block in blocks}
+    for label, node in _corpus_nodes():
+        assert _outcome(node, True, seed, count=True) == _outcome(node, False, seed), label
@@ -0,0 +1,73 @@
+"""Tests for the interpreter's fixed-size memory blocks (``sonolus.backend.interpret.Memory``)."""
+
+import math
+
+import pytest
+
+from sonolus.backend.blocks import PlayBlock
+from sonolus.backend.interpret import DEFAULT_BLOCK_SIZE, Interpreter, Memory
+from sonolus.backend.node import FunctionNode
+from sonolus.backend.ops import Op
+
+
+def test_blocks_are_allocated_at_their_declared_size():
+    it = Interpreter()
+    assert it.get(PlayBlock.LevelMemory, 0) == -1.0
+    assert len(it.blocks[PlayBlock.LevelMemory]) == 4096
+    assert len(it.blocks[PlayBlock.EntityMemory]) == DEFAULT_BLOCK_SIZE
+    assert set(it.blocks) == {PlayBlock.LevelMemory, PlayBlock.EntityMemory}
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_index_is_checked_against_the_declared_size(compiled):
+    it = Interpreter()
+    run = it.run_compiled if compiled else it.run
+    assert run(FunctionNode(Op.Set, (PlayBlock.LevelMemory, 4095, 3))) == 3
+    with pytest.raises(AssertionError, match="Index is too large"):
+        run(FunctionNode(Op.Get, (PlayBlock.LevelMemory, 4096)))
+    with pytest.raises(AssertionError, match="Index is too large"):
+        run(FunctionNode(Op.Set, (PlayBlock.LevelMemory, 4096, 3)))
+    with pytest.raises(AssertionError, match="Index is too large"):
+        run(FunctionNode(Op.Get, (500, DEFAULT_BLOCK_SIZE)))
+
+
+def test_custom_block_sizes():
+    it = Interpreter(block_sizes={7: 2})
+    it.set(7, 1, 5.0)
+    with pytest.raises(AssertionError, match="Index is too large"):
+        it.set(7, 2, 5.0)
+
+
+def test_assigned_values_are_padded_to_the_block_size():
+    memory = Memory({1: 4})
+    memory[1] = [1, 2.5]
+    assert list(memory[1]) == [1.0, 2.5, -1.0, -1.0]
+    with pytest.raises(ValueError, match="holds 4 values"):
+        memory[1] = [0.0] * 5
+
+
+def test_snapshot_restore_and_diff():
+    it = Interpreter(block_sizes={1: 8, 2: 8})
+    it.set(1, 0, 1.0)
+    snapshot = it.blocks.snapshot()
+    it.set(1, 0, 1.0)
+    it.set(1, 3, math.nan)
+    it.set(1, 4, -1.0)
+    it.set(2, 5, -0.0)
+    assert it.blocks.diff(snapshot) == {1: [3], 2: [5]}
+    it.blocks.restore(snapshot)
+    assert it.blocks.diff(snapshot) == {}
+    assert set(it.blocks) == {1}
+    assert it.get(1, 0) == 1.0
+    assert it.get(1, 3) == -1.0
+
+
+def test_snapshot_is_independent_of_later_writes():
+    it = Interpreter()
+    it.set(1, 0, 2.0)
+    snapshot = it.blocks.snapshot()
+    it.blocks.restore(snapshot)
+    it.set(1, 0, 3.0)
+    other = Interpreter()
+    other.blocks.restore(snapshot)
+    assert other.get(1, 0) == 2.0
@@ -35,7 +35,11 @@ finite_floats = st.floats(allow_nan=False, allow_infinity=False, width=64)
 
 
 def run_node(op: Op, *args) -> float:
-    return Interpreter().run(FunctionNode(op, tuple(args)))
+    node = FunctionNode(op, tuple(args))
+    result = Interpreter().run(node)
+    # The closure-compiled path must agree with the oracle on every case below.
+    assert same_bits(Interpreter().run_compiled(node), result)
+    return result
 
 
 def bits(value) -> bytes:
@@ -0,0 +1,80 @@
+"""Tests for the output node table (``sonolus.backend._opt.nodes.NodeTable``).
+
+``NodeTable`` replaces ``OutputNodeGenerator`` in ``compile_mode`` and must
+produce exactly its node list and root indexes: the same post-order numbering
+and the same structural dedup, including Python value equality of leaves.
+"""
+
+from __future__ import annotations
+
+from sonolus.backend._opt.nodes import NodeTable  # noqa: PLC2701
+
+from sonolus.backend.mode import Mode
+from sonolus.backend.node import FunctionNode
+from sonolus.backend.ops import Op
+from sonolus.backend.optimize import STANDARD_PASSES, OptimizerConfig, optimize_and_finalize
+from sonolus.build.node import OutputNodeGenerator
+from tests.backend._corpus import iter_callbacks
+
+
+def _assert_same_output(trees):
+    table = NodeTable()
+    reference = OutputNodeGenerator()
+    for tree in trees:
+        assert table.add(tree) == reference.add(tree)
+    assert table.get() == reference.get()
+    assert len(table) == len(reference.get())
+
+
+def test_leaves_dedup_by_value_equality():
+    nan = float("nan")
+    _assert_same_output(
+        [
+            FunctionNode(Op.Add, (5, 5.0, -0.0, 0.0, True, 1)),
+            FunctionNode(Op.Add, (5.0, 5)),
+            FunctionNode(Op.Multiply, (nan, nan, float("nan"))),
+            7.5,
+            7.5,
+        ]
+    )
+
+
+def test_structurally_equal_trees_share_indexes():
+    def tree():
+        return FunctionNode(Op.Execute, (FunctionNode(Op.Get, (1, 2)), FunctionNode(Op.Get, (1, 2)), 0))
+
+    shared = FunctionNode(Op.Get, (3, 4))
+    _assert_same_output(
+        [
+            tree(),
+            tree(),
+            FunctionNode(Op.Add, (shared, shared, FunctionNode(Op.Subtract, (shared, 1)))),
+            FunctionNode(Op.Get, (2, 1)),
+            FunctionNode(Op.Execute, ()),
+        ]
+    )
+
+
+def test_wide_and_deep_trees():
+    wide = FunctionNode(Op.Execute, tuple(FunctionNode(Op.Get, (1, i)) for i in range(1000)))
+    deep = 0
+    for i in range(5000):
+        deep = FunctionNode(Op.Add, (deep, i % 7))
+    table = NodeTable()
+    reference = OutputNodeGenerator()
+    assert table.add(wide) == reference.add(wide)
+    # Deeper than the reference generator's recursion limit, so only check the shape.
+    root = table.add(deep)
+    nodes = table.get()
+    assert nodes[: len(reference.get())] == reference.get()
+    assert nodes[root]["func"] == "Add"
+    assert root == len(nodes) - 1
+
+
+def test_matches_reference_over_callback_corpus():
+    trees = [
+        optimize_and_finalize(factory(), STANDARD_PASSES, OptimizerConfig(mode=Mode.PLAY, callback=callback_name))
+        for _, callback_name, factory in iter_callbacks(Mode.PLAY)
+    ]
+    assert trees
+    _assert_same_output(trees)
@@ -0,0 +1,111 @@
+"""Tests for runtime op profiling (``sonolus.backend.profiler``) under both interpreter paths."""
+
+from array import array
+
+import pytest
+
+from sonolus.backend.interpret import Interpreter, compile_node
+from sonolus.backend.node import FunctionNode
+from sonolus.backend.ops import Op
+from sonolus.backend.profiler import UNLABELLED, RuntimeProfile, format_heatmap, format_text
+
+# for i in range(3): block 7[i] += block 6[0]
+_I = FunctionNode(Op.Get, (5, 0))
+_LOOP = FunctionNode(
+    Op.Execute,
+    (
+        FunctionNode(Op.Set, (5, 0, 0)),
+        FunctionNode(
+            Op.While,
+            (
+                FunctionNode(Op.Less, (_I, 3)),
+                FunctionNode(
+                    Op.Execute,
+                    (
+                        FunctionNode(Op.SetAdd, (7, _I, FunctionNode(Op.Get, (6, 0)))),
+                        FunctionNode(Op.IncrementPost, (5, 0)),
+                    ),
+                ),
+            ),
+        ),
+    ),
+)
+
+
+def _profile(node, compiled: bool) -> tuple[RuntimeProfile, Interpreter]:
+    profile = RuntimeProfile()
+    it = Interpreter(profile=profile)
+    it.blocks[6] = [2.0]
+    profile.begin("loop")
+    if compiled:
+        it.run_compiled(node)
+    else:
+        it.run(node)
+    return profile, it
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_counts_ops_and_cells(compiled):
+    profile, it = _profile(_LOOP, compiled)
+    ops = profile.ops["loop"]
+    assert ops.total() == it.executed
+    assert ops[Op.SetAdd] == 3
+    assert ops[Op.Less] == 4
+    assert ops[Op.Get] == 4 + 3 + 3
+    assert profile.reads["loop"][5, 0] == 4 + 3 + 3
+    assert profile.writes["loop"][5, 0] == 1 + 3
+    assert [profile.writes["loop"][7, i] for i in range(4)] == [1, 1, 1, 0]
+    assert profile.reads["loop"][6, 0] == 3
+    assert profile.calls == {"loop": 1}
+    assert it.blocks[7][0] == 1.0
+
+
+def test_run_and_compiled_profiles_match():
+    assert _profile(_LOOP, False)[0].to_dict() == _profile(_LOOP, True)[0].to_dict()
+
+
+def test_labels_split_the_counts():
+    profile = RuntimeProfile()
+    it = Interpreter(profile=profile)
+    get = compile_node(FunctionNode(Op.Get, (1, 0)), profile=True)
+    it.blocks[1] = [1.0]
+    get(it)
+    for _ in range(2):
+        profile.begin("a")
+        get(it)
+    profile.begin("b")
+    it.run(FunctionNode(Op.Set, (1, 2, 3)))
+    assert profile.calls == {"a": 2, "b": 1}
+    assert profile.ops[UNLABELLED] == {Op.Get: 1}
+    assert profile.ops["a"] == {Op.Get: 2}
+    assert profile.writes["b"] == {(1, 2): 1}
+    # Setting up memory (slices included) outside the interpreter is not counted.
+    assert not profile.writes[UNLABELLED]
+    it.blocks[1][0:2] = array("d", [4.0, 5.0])
+    assert not profile.writes["b"][1, 0]
+
+
+def test_profiled_closure_runs_without_a_profile():
+    it = Interpreter()
+    assert compile_node(FunctionNode(Op.Add, (1, 2)), profile=True)(it) == 3
+    assert it.executed == 1
+
+
+def test_export_and_text():
+    profile, _ = _profile(_LOOP, True)
+    data = profile.to_dict({5: "Counter", 7: "EntityMemory"})
+    (row,) = data["callbacks"]
+    assert row["callback"] == "loop"
+    assert row["per_call"] == row["executed"] == data["executed"]
+    assert next(iter(row["ops"])) == "Get"
+    assert row["blocks"][0] == {"block": 5, "name": "Counter", "reads": 10, "writes": 4}
+    assert {"block": 7, "name": "EntityMemory", "index": 2, "reads": 1, "writes": 1} in data["cells"]
+    assert "loop" in format_text(data)
+    heatmap = format_heatmap(data, blocks=("EntityMemory", "Counter"), callback="loop")
+    assert heatmap.splitlines() == [
+        "EntityMemory: 3 reads, 3 writes over 3 cells, at most 2 per cell",
+        "      0 |@@@",
+        "Counter: 10 reads, 4 writes over 1 cells, at most 14 per cell",
+        "      0 |@",
+    ]
+    assert not format_heatmap(data, callback="missing")
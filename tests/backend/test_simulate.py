@@ -0,0 +1,137 @@
+"""Tests for the headless play-mode simulator (``sonolus.backend.simulate``) on the pydori demo level."""
+
+import pytest
+
+from sonolus.backend import simulate
+from sonolus.backend.blocks import PlayBlock
+from sonolus.backend.node import FunctionNode
+from sonolus.backend.ops import Op
+from sonolus.backend.optimize import FAST_PASSES
+from sonolus.backend.profiler import RuntimeProfile
+from sonolus.backend.simulate import (
+    ACTIVE,
+    DESPAWNED,
+    PlaySimulator,
+    SimulatedTouch,
+    SimulationError,
+    _Timing,  # ruff: ignore[import-private-name]
+    decode_nodes,
+    format_text,
+)
+from sonolus.build.cli import simulate_project
+from sonolus.build.engine import package_engine, unpackage_data, unpackage_rom
+from sonolus.build.level import build_level_data
+from sonolus.build.node import OutputNodeGenerator
+from sonolus.script.project import BuildConfig
+from tests.regressions import pydori_project
+
+# The first tap note of the demo level is in lane 0 at beat 1, i.e. 1s in at 60 BPM.
+_TAP = SimulatedTouch(1.0, 1.05, 0.0, -0.6)
+
+
+@pytest.fixture(scope="module")
+def simulator() -> PlaySimulator:
+    config = BuildConfig(passes=FAST_PASSES, build_watch=False, build_preview=False, build_tutorial=False)
+    engine = package_engine(pydori_project.engine.data, config)
+    return PlaySimulator(
+        unpackage_data(engine.play_data),
+        unpackage_rom(engine.rom),
+        build_level_data(pydori_project.levels[0].data),
+        unpackage_data(engine.configuration),
+    )
+
+
+def test_decode_nodes_rebuilds_shared_trees():
+    shared = FunctionNode(Op.Get, (1, 2))
+    root = FunctionNode(Op.Add, (shared, FunctionNode(Op.Multiply, (shared, 2.5)), 1))
+    generator = OutputNodeGenerator()
+    index = generator.add(root)
+    nodes = decode_nodes(generator.get())
+    assert nodes[index] == root
+    assert nodes[index].args[0] is nodes[index].args[1].args[0]
+
+
+def test_timing_follows_bpm_and_timescale_changes():
+    timing = _Timing([(0, 60), (4, 120)], [(2, 0.5), (6, 2.0)])
+    assert timing.beat_to_time(3) == 3.0
+    assert timing.beat_to_time(6) == 5.0
+    assert timing.call(Op.BeatToBPM, 5) == 120
+    assert timing.call(Op.BeatToStartingTime, 5) == 4.0
+    # Timescale 1 until 2s, 0.5 until 5s (beat 6), then 2.
+    assert timing.time_to_scaled_time(4) == 3.0
+    assert timing.time_to_scaled_time(6) == 5.5
+    assert timing.call(Op.TimeToStartingScaledTime, 6) == 3.5
+    assert timing.call(Op.TimeToTimeScale, 1) == 1.0
+
+
+def test_level_without_touches_plays_out(simulator):
+    report = simulator.run(25)
+    assert len(report.frames) == 25 * 60
+    assert all(frame.total > 0 for frame in report.frames)
+    assert report.preprocess
+    # Every note spawns, is missed, and despawns; only the stage and the timing entities remain.
+    assert max(frame.active for frame in report.frames) > report.frames[-1].active
+    states = {entity.info[2] for entity in simulator.entities if entity.archetype == simulator.archetype_ids["Tap"]}
+    assert states == {DESPAWNED}
+    assert {entity.info[2] for entity in simulator.active} == {ACTIVE}
+    assert ("Tap", "touch") not in report.by_callback()
+
+
+def test_simulation_is_deterministic(simulator):
+    assert simulator.run(3, touches=[_TAP]).to_dict() == simulator.run(3, touches=[_TAP]).to_dict()
+
+
+def test_touch_hits_a_note(simulator):
+    report = simulator.run(1.5, touches=[_TAP])
+    frame = report.frames[60]
+    assert frame.time == 1.0
+    assert frame.executed["Tap", "touch"] > 0
+    assert frame.executed["Tap", "terminate"] > 0
+    assert frame.runtime_calls["Play"] == 1
+    # The touch ended on its first frame, so the next frame has none.
+    assert ("Tap", "touch") not in report.frames[61].executed
+
+
+def test_report_summaries(simulator):
+    report = simulator.run(2)
+    data = report.to_dict()
+    assert data["executed"] == sum(report.by_archetype().values()) == sum(report.by_callback().values())
+    assert data["frame_count"] == 120
+    assert data["peak_frame"]["executed"] == max(frame.total for frame in report.frames)
+    text = format_text(data, top=2)
+    assert "120 frames at 60 fps" in text
+    assert "Stage.updateParallel" in text
+
+
+def test_spawning_an_unknown_archetype_fails(simulator):
+    simulator.run(0.1)
+    with pytest.raises(SimulationError, match="unknown archetype"):
+        simulator.spawn(len(simulator.archetypes), [])
+
+
+def test_simulate_project_rejects_unknown_level():
+    with pytest.raises(SimulationError, match="no level named"):
+        simulate_project(pydori_project, "missing", BuildConfig(), 1, 60, [])
+
+
+def test_profile_matches_the_report(simulator):
+    profile = RuntimeProfile()
+    report = simulator.run(2, touches=[_TAP], profile=profile)
+    counts = {**report.by_callback()}
+    for (archetype, callback), count in report.preprocess.items():
+        counts[archetype, callback] = counts.get((archetype, callback), 0) + count
+    assert {tuple(label.split(".")): ops.total() for label, ops in profile.ops.items() if ops} == counts
+    # Each tap note reads its entity data, through the entity's own block.
+    data = profile.to_dict({block.value: block.name for block in PlayBlock})
+    (tap,) = (row for row in data["callbacks"] if row["callback"] == "Tap.updateParallel")
+    assert any(block["name"] == "EntityData" and block["reads"] >= tap["calls"] for block in tap["blocks"])
+    assert simulator.run(2, touches=[_TAP]).to_dict() == report.to_dict()
+
+
+def test_batched_update_parallel_matches(simulator, monkeypatch):
+    pytest.importorskip("numpy")
+    # The demo level has few notes at a time, so batch even single entities.
+    monkeypatch.setattr(simulate, "BATCH_MIN_LANES", 1)
+    report = simulator.run(25, touches=[_TAP], batch=True)
+    assert any(simulator.batchable)
+    assert report.to_dict() == simulator.run(25, touches=[_TAP]).to_dict()
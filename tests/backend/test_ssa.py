@@ -319,7 +319,7 @@ def test_array_semantics():
         return b0
 
     orig, _ = _assert_semantics_preserved(build)
-    assert orig.blocks[500][:2] == [11, 22]
+    assert orig.blocks[500][:2].tolist() == [11, 22]
 
 
 # ---------------------------------------------------------------------------
@@ -1,6 +1,9 @@
 import ast
+import os
 
-from sonolus.backend.utils import find_function, get_function
+import pytest
+
+from sonolus.backend.utils import SourceCache, find_function, get_function
 
 
 def _identity_deco(*args, **kwargs):
@@ -46,3 +49,35 @@ def test_find_function_lambda_inside_multiline_decorator_resolves_to_lambda():
     tree = ast.parse(src)
     node = find_function(tree, 2)  # the lambda's line
     assert isinstance(node, ast.Lambda)
+
+
+def test_source_cache_reparses_only_changed_files(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("def f():\n    return 1\n")
+    cache = SourceCache(max_files=2)
+    tree = cache.tree(path)
+    assert cache.function(path, 1).name == "f"
+    assert cache.tree(path) is tree
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # Without a revalidation, edits are not seen, as within a single build.
+    path.write_text("def g():\n    yield 2\n")
+    assert cache.tree(path) is tree
+    cache.revalidate()
+    assert cache.function(path, 1).name == "g"
+    assert cache.function(path, 1).has_yield
+
+    # A file that was touched but not changed keeps its tree.
+    tree = cache.tree(path)
+    os.utime(path, ns=(0, 0))
+    cache.revalidate()
+    assert cache.tree(path) is tree
+
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text("")
+        cache.tree(tmp_path / name)
+    misses = cache.misses
+    cache.tree(path)
+    assert cache.misses == misses + 1
+    with pytest.raises(ValueError, match="Function not found"):
+        cache.function(path, 2)
@@ -1,3 +1,5 @@
+import os
+import subprocess
 import sys
 
 import pytest
@@ -80,3 +82,44 @@ def test_import_project_plain_import_error_in_project_submodule_propagates(tmp_p
         import_project("pkg_circ_xyz")
     assert not isinstance(exc_info.value, ModuleNotFoundError)
     assert exc_info.value.name == "pkg_circ_xyz.project"
+
+
+# Checked with `python -X importtime`; `sonolus-py check` runs in pre-commit hooks, so startup time matters.
+CLI_IMPORT_BUDGET_SECONDS = 0.4
+
+
+def cli_import_times(pycache_prefix) -> dict[str, int]:
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": str(pycache_prefix)}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import sonolus.build.cli"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_skips_unused_modules(tmp_path):
+    times = cli_import_times(tmp_path)
+    for module in (
+        "sonolus.build.dev_server",
+        "sonolus.backend.simulate",
+        "sonolus.backend.profiler",
+        "sonolus.script.text",
+        "urllib.request",
+    ):
+        assert module not in times
+
+
+def test_cli_import_time_within_budget(tmp_path):
+    cli_import_times(tmp_path)  # Write the bytecode cache so only the import itself is measured
+    best = min(cli_import_times(tmp_path)["sonolus.build.cli"] for _ in range(3))
+    assert best < CLI_IMPORT_BUDGET_SECONDS * 1_000_000
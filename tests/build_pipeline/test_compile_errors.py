@@ -0,0 +1,117 @@
+import contextlib
+import io
+
+import pytest
+
+from sonolus.backend.excepthook import print_simple_traceback
+from sonolus.backend.mode import Mode
+from sonolus.build import compile as compile_module
+from sonolus.build.compile import callback_to_cfg
+from sonolus.script.internal.context import ModeContextState, ProjectContextState
+from sonolus.script.internal.error import CompilationError
+from sonolus.script.internal.meta_fn import meta_fn
+from sonolus.script.record import Record
+from sonolus.script.runtime import time
+from sonolus.script.vec import Vec2
+
+
+def inner(v: Vec2):
+    return v.x + undefined_name  # noqa: F821
+
+
+def middle(v: Vec2):
+    w = v * 2
+    return inner(w) + 1
+
+
+@meta_fn
+def failing_meta_fn():
+    raise CompilationError("failed at compile time")
+
+
+class Pair(Record):
+    a: int
+    b: int
+
+    def total(self):
+        return self.a + self.c
+
+
+def gen():
+    for i in range(3):
+        yield i + undefined_name  # noqa: F821
+
+
+def nested_error():
+    i = 0
+    while i < time():
+        i += 1
+        middle(Vec2(i, 1))
+
+
+def meta_fn_error():
+    failing_meta_fn()
+
+
+def attribute_error():
+    Pair(1, 2).total()
+
+
+def generator_error():
+    for x in gen():
+        Vec2(x, 1)
+
+
+def unpack_error():
+    a, _ = Vec2(1, 2), 3, 4
+    return a
+
+
+def closure_error():
+    k = time()
+
+    def helper(y):
+        return y + k + Vec2(1, 2).z
+
+    helper(1)
+
+
+def compile_error_output(trace) -> str:
+    with pytest.raises(CompilationError) as exc_info:
+        trace()
+    output = io.StringIO()
+    with contextlib.redirect_stderr(output):
+        print_simple_traceback(exc_info.type, exc_info.value, exc_info.tb)
+    return output.getvalue()
+
+
+@pytest.mark.parametrize(
+    "callback", [nested_error, meta_fn_error, attribute_error, generator_error, unpack_error, closure_error]
+)
+def test_compile_error_traceback_matches_evaluating_at_nodes(callback, monkeypatch):
+    traces = []
+    trace = compile_module._trace
+    monkeypatch.setattr(compile_module, "_trace", lambda *args, **kwargs: traces.append(args) or trace(*args, **kwargs))
+
+    output = compile_error_output(
+        lambda: callback_to_cfg(ProjectContextState(), ModeContextState(Mode.PLAY), callback, "updateSequential")
+    )
+    expected = compile_error_output(
+        lambda: trace(ProjectContextState(), ModeContextState(Mode.PLAY), callback, "updateSequential", None, False)
+    )
+
+    assert output == expected
+    assert len(traces) == 1
+
+
+def test_compile_error_traceback_frames():
+    output = compile_error_output(
+        lambda: callback_to_cfg(ProjectContextState(), ModeContextState(Mode.PLAY), nested_error, "updateSequential")
+    )
+    assert [line.strip() for line in output.splitlines() if line.lstrip().startswith("File ")] == [
+        f'File "{__file__}", line {nested_error.__code__.co_firstlineno}, in <callback>',
+        f'File "{__file__}", line {nested_error.__code__.co_firstlineno + 4}, in nested_error',
+        f'File "{__file__}", line {middle.__code__.co_firstlineno + 2}, in middle',
+        f'File "{__file__}", line {inner.__code__.co_firstlineno + 1}, in inner',
+    ]
+    assert output.rstrip().endswith("CompilationError: Name undefined_name is not defined")
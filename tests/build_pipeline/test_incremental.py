@@ -0,0 +1,78 @@
+"""Tests for incremental rebuilds (``sonolus.build.incremental``)."""
+
+import importlib
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from sonolus.backend.utils import get_function, source_cache
+from sonolus.build.engine import package_engine
+from sonolus.build.incremental import TraceCache
+from sonolus.script.internal.context import ProjectContextState
+from sonolus.script.internal.visitor import clear_frontend_caches
+from sonolus.script.project import BuildConfig
+
+PYDORI_PATH = Path(__file__).parents[2] / "test_projects" / "pydori"
+
+
+def _is_pydori_module(name: str) -> bool:
+    return name == "pydori" or name.startswith("pydori.")
+
+
+@pytest.fixture
+def pydori_copy(tmp_path, monkeypatch):
+    # A private copy of the pydori project that can be edited and re-imported the
+    # way the dev server reloads a project, without disturbing the shared import.
+    shutil.copytree(PYDORI_PATH, tmp_path / "pydori")
+    saved = {name: module for name, module in sys.modules.items() if _is_pydori_module(name)}
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path / "pydori"
+    for name in [name for name in sys.modules if _is_pydori_module(name)]:
+        del sys.modules[name]
+    sys.modules.update(saved)
+    get_function.cache_clear()
+    source_cache.clear()
+    clear_frontend_caches()
+
+
+def _rebuild(config: BuildConfig, trace_cache: TraceCache | None):
+    for name in [name for name in sys.modules if _is_pydori_module(name)]:
+        del sys.modules[name]
+    get_function.cache_clear()
+    source_cache.revalidate()
+    clear_frontend_caches()
+    project = importlib.import_module("pydori.project").project
+    if trace_cache is not None:
+        trace_cache.begin_build()
+    project_state = ProjectContextState.from_build_config(config, trace_cache=trace_cache)
+    return package_engine(project.engine.data, config, project_state)
+
+
+def test_unchanged_rebuild_reuses_every_callback(pydori_copy):
+    config = BuildConfig()
+    trace_cache = TraceCache()
+
+    first = _rebuild(config, trace_cache)
+    assert trace_cache.reused == 0
+
+    assert _rebuild(config, trace_cache) == first
+    assert trace_cache.traced == 0
+    assert trace_cache.reused > 0
+
+
+def test_rebuild_after_edit_matches_full_build(pydori_copy):
+    config = BuildConfig()
+    trace_cache = TraceCache()
+    _rebuild(config, trace_cache)
+    total = trace_cache.traced
+
+    note_file = pydori_copy / "play" / "note.py"
+    source = note_file.read_text()
+    assert "<= 0.005" in source
+    note_file.write_text(source.replace("<= 0.005", "<= 0.01"))
+
+    incremental = _rebuild(config, trace_cache)
+    assert 0 < trace_cache.traced < total
+    assert incremental == _rebuild(config, None)
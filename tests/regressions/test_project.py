@@ -8,6 +8,7 @@ from sonolus.backend.node import format_engine_node
 from sonolus.backend.optimize import OptimizerConfig, cfg_to_engine_node, run_passes
 from sonolus.backend.optimize.flow import cfg_to_text
 from sonolus.build.compile import callback_to_cfg
+from sonolus.build.concurrent_modes import remember_tables
 from sonolus.build.engine import package_engine
 from sonolus.script.archetype import _BaseArchetype
 from sonolus.script.internal.callbacks import (
@@ -58,6 +59,64 @@ def test_project_build_is_deterministic():
     assert first == second
 
 
+def test_parallel_build_matches_serial_build():
+    # Optimizing callbacks on a thread pool must not change the output: tracing stays
+    # serial and nodes are registered in trace order.
+    engine = PROJECTS["pydori"].engine.data
+    serial = package_engine(engine, BuildConfig(passes=BuildConfig.STANDARD_PASSES))
+    parallel = package_engine(engine, BuildConfig(passes=BuildConfig.STANDARD_PASSES, jobs=4))
+    assert parallel == serial
+
+
+def test_process_pool_build_matches_serial_build():
+    # Optimizing callbacks in worker processes ships each traced arena as bytes and the
+    # emitted node back as a table; the output must match a serial build exactly.
+    engine = PROJECTS["pydori"].engine.data
+    serial = package_engine(engine, BuildConfig(passes=BuildConfig.STANDARD_PASSES))
+    pooled = package_engine(engine, BuildConfig(passes=BuildConfig.STANDARD_PASSES, workers=2))
+    assert pooled == serial
+
+
+def test_concurrent_mode_build_matches_serial_build(tmp_path):
+    # Modes built in worker processes are merged in the serial order; a stale seed whose
+    # indexes no longer match forces the modes to be rebuilt, and a fresh one does not.
+    engine = PROJECTS["pydori"].engine.data
+    serial = package_engine(engine, BuildConfig(passes=BuildConfig.STANDARD_PASSES))
+    config = BuildConfig(passes=BuildConfig.STANDARD_PASSES, concurrent_modes=True, cache_dir=tmp_path)
+
+    stale = ProjectContextState()
+    stale.rom[1.0, 2.0, 3.0]
+    stale.debug_str_mappings["stale"] = 1
+    remember_tables(stale, tmp_path)
+
+    assert package_engine(engine, config) == serial
+    assert package_engine(engine, config) == serial
+
+
+def test_cached_build_matches_uncached_build(tmp_path):
+    # A build served from the persistent optimizer cache must match a fresh build, and
+    # an unchanged rebuild must hit the cache for every callback.
+    engine = PROJECTS["pydori"].engine.data
+    uncached = package_engine(engine, BuildConfig(passes=BuildConfig.STANDARD_PASSES))
+    config = BuildConfig(passes=BuildConfig.STANDARD_PASSES, cache_dir=tmp_path)
+    assert package_engine(engine, config) == uncached
+
+    from sonolus.backend.optimize import profiling
+
+    was_enabled = profiling.enabled
+    profiling.enable()
+    profiling.reset()
+    try:
+        assert package_engine(engine, config) == uncached
+        counters = profiling.summary()["counters"]
+    finally:
+        profiling.enabled = was_enabled
+        profiling.reset()
+
+    assert counters["opt_cache_hit"] > 0
+    assert "opt_cache_miss" not in counters
+
+
 def test_compile_profiling_records_stages():
     # With profiling enabled, a build records a per-stage timing breakdown whose
     # JSON summary has the documented shape.
@@ -73,7 +132,7 @@ def test_compile_profiling_records_stages():
         profiling.enabled = was_enabled
         profiling.reset()
 
-    assert set(summary) == {"stages", "total_ns"}
+    assert set(summary) == {"stages", "total_ns", "counters"}
     stages = summary["stages"]
     # The fast pipeline exercises the frontend, marshal-in, every fast-level pass, and emit.
     assert {"frontend", "marshal_in", "cfg_cleanup", "build_ssa", "midend", "lower", "allocate", "emit"} <= set(stages)
@@ -84,6 +143,160 @@ def test_compile_profiling_records_stages():
     assert summary["total_ns"] == sum(stage["total_ns"] for stage in stages.values())
 
 
+@pytest.mark.parametrize("parallelism", [{}, {"jobs": 2}, {"workers": 2}])
+def test_compile_profiling_trace_attributes_stages_to_callbacks(tmp_path, parallelism):
+    # With timeline tracing, every stage sample becomes a Chrome trace event tagged
+    # with its mode and callback, including samples recorded on worker threads and
+    # in worker processes.
+    import json
+
+    from sonolus.backend.optimize import profiling
+
+    was_enabled, was_tracing = profiling.enabled, profiling.tracing
+    profiling.enable_trace()
+    profiling.reset()
+    try:
+        package_engine(
+            PROJECTS["pydori"].engine.data,
+            BuildConfig(passes=BuildConfig.FAST_PASSES, build_watch=False, build_tutorial=False, **parallelism),
+        )
+        profiling.write_trace(tmp_path / "trace.json")
+    finally:
+        profiling.enabled, profiling.tracing = was_enabled, was_tracing
+        profiling.reset()
+
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    complete = [e for e in events if e["ph"] == "X"]
+    assert {e["name"] for e in complete if e["cat"] == "mode"} >= {"PLAY", "PREVIEW"}
+    stages = [e for e in complete if e["cat"] == "stage"]
+    assert {"frontend", "marshal_in", "midend", "emit", "nodes"} <= {e["name"] for e in stages}
+    assert all(e["args"]["mode"] in {"PLAY", "WATCH", "PREVIEW", "TUTORIAL"} and e["args"]["callback"] for e in stages)
+    callbacks = [e for e in complete if e["cat"] == "callback"]
+    assert any(e["args"].get("archetype") for e in callbacks)
+    for event in complete:
+        assert event["ts"] >= 0
+        assert event["dur"] >= 0
+    tracks = {(e["pid"], e["tid"]) for e in complete}
+    named = {(e["pid"], e["tid"]) for e in events if e["ph"] == "M" and e["name"] == "thread_name"}
+    assert tracks <= named
+    if "workers" in parallelism:
+        assert len({pid for pid, _ in tracks}) > 1
+
+
+@pytest.mark.parametrize("parallelism", [{}, {"workers": 2}, {"concurrent_modes": True}])
+def test_compile_report_covers_every_callback(tmp_path, parallelism):
+    # The build report has one row per emitted callback, with the node counts of its
+    # node and the time profiled for it, however the build was parallelized.
+    import json
+
+    from sonolus.backend.optimize import profiling
+    from sonolus.build.report import CompileReport
+
+    engine = PROJECTS["pydori"].engine.data
+    config = BuildConfig(passes=BuildConfig.FAST_PASSES, build_tutorial=False, **parallelism)
+    if config.concurrent_modes:
+        # The first build seeds the tables that let the next one run the modes concurrently.
+        package_engine(engine, config)
+
+    was_enabled, was_tracing = profiling.enabled, profiling.tracing
+    profiling.enable_trace()
+    profiling.reset()
+    try:
+        project_state = ProjectContextState.from_build_config(config)
+        project_state.compile_report = CompileReport()
+        package_engine(engine, config, project_state=project_state)
+        data = project_state.compile_report.write(tmp_path / "report.json", top=3)
+    finally:
+        profiling.enabled, profiling.tracing = was_enabled, was_tracing
+        profiling.reset()
+
+    assert json.loads((tmp_path / "report.json").read_text()) == data
+    rows = data["callbacks"]
+    assert {row["mode"] for row in rows} >= {"PLAY", "WATCH", "PREVIEW"}
+    assert len({(row["mode"], row["archetype"], row["callback"]) for row in rows}) == len(rows)
+    assert any(row["archetype"] is None for row in rows)
+    for row in rows:
+        assert row["frontend_ms"] > 0
+        assert row["optimize_ms"] > 0
+        assert 0 < row["function_node_count"] == sum(row["per_op_counts"].values())
+        assert row["effective_node_count"] <= row["function_node_count"] + row["value_node_count"]
+        assert row["temp_memory"] >= 0
+        assert row["estimated_cost"] > 0
+    assert data["totals"]["callback_count"] == len(rows)
+    assert data["totals"]["effective_node_count"] == sum(row["effective_node_count"] for row in rows)
+    for metric, top in data["top"].items():
+        assert len(top) == 3
+        assert top[0][metric] == max(row[metric] for row in rows)
+
+
+def test_cost_budgets_fail_or_warn():
+    # A callback's budget applies to every archetype unless an archetype-specific key overrides it.
+    from sonolus.script.internal.error import CompilationError
+
+    engine = PROJECTS["pydori"].engine.data
+    config = BuildConfig(
+        passes=BuildConfig.FAST_PASSES,
+        build_watch=False,
+        build_preview=False,
+        build_tutorial=False,
+        cost_budgets={"update_parallel": 1, "Note.updateParallel": 1e9, "HoldManager.update_parallel": 1e9},
+    )
+    with pytest.raises(CompilationError, match=r"Callback (Stage|HoldConnector|SimLine)\.updateParallel in play mode"):
+        package_engine(engine, config)
+
+    config = BuildConfig(
+        passes=BuildConfig.FAST_PASSES,
+        build_watch=False,
+        build_preview=False,
+        build_tutorial=False,
+        cost_budgets={"updateParallel": 1},
+        fail_on_cost_budget=False,
+    )
+    with pytest.warns(UserWarning, match="over its budget of 1") as record:
+        package_engine(engine, config)
+    assert any("Note.updateParallel" in str(warning.message) for warning in record)
+
+    config = BuildConfig(passes=BuildConfig.FAST_PASSES, cost_budgets={"update_parallel": 1e9})
+    package_engine(engine, config)
+
+
+@pytest.mark.parametrize("parallelism", [{}, {"workers": 2}, {"concurrent_modes": True}])
+def test_node_attribution_sums_to_report_counts(tmp_path, parallelism):
+    # Every emitted node of a callback is attributed to exactly one source line, and
+    # most of them to the project's own code rather than to the library.
+    import json
+    from pathlib import Path
+
+    import pydori
+
+    from sonolus.build.report import CompileReport, SourceLocations
+
+    engine = PROJECTS["pydori"].engine.data
+    config = BuildConfig(passes=BuildConfig.FAST_PASSES, build_tutorial=False, **parallelism)
+    if config.concurrent_modes:
+        package_engine(engine, config)
+
+    project_state = ProjectContextState.from_build_config(config)
+    project_state.compile_report = CompileReport()
+    project_state.source_locations = SourceLocations()
+    package_engine(engine, config, project_state=project_state)
+    report = project_state.compile_report
+    data = report.write_attribution(tmp_path / "attribution.json", top=3)
+
+    assert json.loads((tmp_path / "attribution.json").read_text()) == data
+    assert report.attribution.keys() == report.entries.keys()
+    for key, counts in report.attribution.items():
+        entry = report.entries[key]
+        assert sum(emitted for emitted, _ in counts.values()) == entry["function_node_count"]
+        assert sum(effective for _, effective in counts.values()) == entry["effective_node_count"]
+    project_dir = Path(pydori.__file__).parent
+    in_project = [
+        row for row in data["lines"] if row["file"] and Path(row["file"]).resolve().is_relative_to(project_dir)
+    ]
+    assert sum(row["emitted"] for row in in_project) > sum(row["emitted"] for row in data["lines"]) // 2
+    assert all(len(callback["lines"]) <= 3 for callback in data["callbacks"])
+
+
 @pytest.mark.parametrize("project", ["pydori"])
 @pytest.mark.parametrize("passes", ["fast", "standard"])
 def test_project_method_build_regressions(
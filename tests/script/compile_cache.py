@@ -0,0 +1,197 @@
+"""Compile cache for the script test helpers (`run_and_validate` and `run_compiled`).
+
+The helpers compile the same function once per optimization level and closure
+variant, and Hypothesis reruns the same examples while shrinking and replaying.
+`CompiledScripts` keeps the traced CFG of each function, keyed by its code, the
+values of its closure, defaults, and referenced globals, its arguments, and the
+compile settings, together with the emitted node at each optimization level.
+
+Traces are only kept in memory, since the frontend itself may change between runs.
+Emitted nodes are also written to a `CompileCache` (under `.pytest_cache` unless the
+cache provider is disabled), keyed by the traced code itself, so later runs and
+xdist workers skip the optimizer for unchanged functions.
+"""
+
+from __future__ import annotations
+
+import types
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from sonolus.backend.node import EngineNode
+from sonolus.backend.optimize import OptimizationLevel, OptimizerConfig, optimize_and_finalize
+from sonolus.backend.optimize.cache import CompileCache
+from sonolus.backend.optimize.flow import BasicBlock
+from sonolus.script.internal.value import Value
+
+# Traces kept in memory; each holds a CFG and up to one node per optimization level.
+MAX_ENTRIES = 512
+
+_ATOMS = (type(None), bool, int, str, bytes, complex, range, types.BuiltinFunctionType, types.ModuleType)
+
+
+_EMPTY_CELL = object()
+
+
+class _UncacheableError(Exception):
+    pass
+
+
+@dataclass
+class CompiledScript:
+    cfg: BasicBlock
+    rom_values: list[float]
+    # Set by the traced wrapper as a side effect of tracing.
+    result_type: Any = None
+    nodes: dict[OptimizationLevel, EngineNode] = field(default_factory=dict)
+
+
+class CompiledScripts:
+    def __init__(self, disk: CompileCache | None = None):
+        self.disk = disk
+        self.entries: OrderedDict[Hashable, CompiledScript] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def trace(self, key: Hashable | None, trace: Callable[[], CompiledScript]) -> CompiledScript:
+        """Return the entry of `key`, calling `trace` on a miss. A None key is never cached."""
+        if key is None:
+            return trace()
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = self.entries[key] = trace()
+        if len(self.entries) > MAX_ENTRIES:
+            self.entries.popitem(last=False)
+        return entry
+
+    def node(self, entry: CompiledScript, level: OptimizationLevel) -> EngineNode:
+        """Return the emitted node of `entry` optimized at `level`."""
+        node = entry.nodes.get(level)
+        if node is None:
+            node = entry.nodes[level] = optimize_and_finalize(entry.cfg, level, OptimizerConfig(), cache=self.disk)
+        return node
+
+
+def script_key(fn: Callable, args: tuple, kwargs: dict) -> Hashable | None:
+    """Return the cache key of compiling `fn(*args, **kwargs)`, or None if it cannot be cached."""
+    try:
+        return _freeze(fn, set()), _freeze(args, set()), _freeze(kwargs, set())
+    except _UncacheableError:
+        return None
+
+
+def _freeze(value: Any, seen: set[int]) -> Hashable:
+    """Return a hashable key that is equal for values that compile the same."""
+    if isinstance(value, float):
+        # Unlike the floats themselves, this tells 0.0 from -0.0 and matches nan with itself.
+        return float, repr(value)
+    if isinstance(value, _ATOMS) or value is Ellipsis:
+        return value
+    if isinstance(value, Enum):
+        return type(value), value.name
+    if id(value) in seen:
+        if isinstance(value, types.FunctionType):
+            # A recursive function: its code and closure are already part of the key.
+            return value.__code__
+        if isinstance(value, type):
+            return value
+        raise _UncacheableError
+    seen.add(id(value))
+    try:
+        match value:
+            case Value():
+                if not value._is_py_():
+                    raise _UncacheableError
+                try:
+                    entries = value._to_list_()
+                except TypeError:
+                    # E.g. Maybe, which has no flat representation.
+                    raise _UncacheableError from None
+                return type(value), tuple(_freeze(entry, seen) for entry in entries)
+            case tuple() | list():
+                return type(value), tuple(_freeze(entry, seen) for entry in value)
+            case dict():
+                return type(value), tuple((_freeze(k, seen), _freeze(v, seen)) for k, v in value.items())
+            case set() | frozenset():
+                return type(value), frozenset(_freeze(entry, seen) for entry in value)
+            case types.FunctionType():
+                return _freeze_function(value, seen)
+            case types.MethodType():
+                return types.MethodType, _freeze(value.__func__, seen), _freeze(value.__self__, seen)
+            case type():
+                return _freeze_class(value, seen)
+            case _:
+                raise _UncacheableError
+    finally:
+        seen.discard(id(value))
+
+
+def _freeze_function(fn: types.FunctionType, seen: set[int]) -> Hashable:
+    if _is_library(fn):
+        # Library functions do not change within a run.
+        return fn
+    closure = tuple(_freeze_cell(cell, seen) for cell in fn.__closure__ or ())
+    fn_globals = fn.__globals__
+    referenced = tuple(
+        (name, _freeze(fn_globals[name], seen)) for name in sorted(_global_names(fn.__code__)) if name in fn_globals
+    )
+    return (
+        fn.__code__,
+        closure,
+        _freeze(fn.__defaults__, seen),
+        _freeze(fn.__kwdefaults__, seen),
+        referenced,
+        getattr(fn, "_meta_fn_", False),
+    )
+
+
+def _freeze_class(cls: type, seen: set[int]) -> Hashable:
+    # Classes are mutable, so test classes are keyed by their attributes, e.g. to notice a replaced property.
+    return cls, tuple(
+        (name, _freeze_attribute(attr, seen))
+        for base in cls.__mro__
+        if not _is_library(base)
+        for name, attr in vars(base).items()
+    )
+
+
+def _freeze_attribute(attr: Any, seen: set[int]) -> Hashable:
+    match attr:
+        case property():
+            return property, _freeze(attr.fget, seen), _freeze(attr.fset, seen), _freeze(attr.fdel, seen)
+        case staticmethod() | classmethod():
+            return type(attr), _freeze(attr.__func__, seen)
+    try:
+        return _freeze(attr, seen)
+    except _UncacheableError:
+        # Other class data, such as the fields of a record, is only ever replaced as a whole.
+        return type(attr), id(attr)
+
+
+def _is_library(obj: Any) -> bool:
+    module = obj.__module__ or ""
+    return module in {"builtins", "abc", "typing"} or module.startswith("sonolus.")
+
+
+def _freeze_cell(cell: types.CellType, seen: set[int]) -> Hashable:
+    try:
+        contents = cell.cell_contents
+    except ValueError:
+        # Not assigned yet.
+        return _EMPTY_CELL
+    return _freeze(contents, seen)
+
+
+def _global_names(code: types.CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
@@ -8,6 +8,7 @@ from collections.abc import Callable
 from datetime import timedelta
 from types import CellType
 
+import pytest
 from hypothesis import settings
 
 from sonolus.backend.blocks import PlayBlock
@@ -17,10 +18,8 @@ from sonolus.backend.optimize import (
     FAST_PASSES,
     MINIMAL_PASSES,
     STANDARD_PASSES,
-    OptimizerConfig,
-    cfg_to_engine_node,
-    run_passes,
 )
+from sonolus.backend.optimize.cache import CompileCache
 from sonolus.backend.optimize.flow import BasicBlock
 from sonolus.backend.place import BlockPlace
 from sonolus.build.compile import callback_to_cfg
@@ -35,6 +34,7 @@ from sonolus.script.internal.tuple_impl import TupleImpl
 from sonolus.script.internal.visitor import clear_frontend_caches, compile_and_call
 from sonolus.script.num import Num
 from sonolus.script.vec import Vec2
+from tests.script.compile_cache import CompiledScript, CompiledScripts, script_key
 
 PRIMARY_PYTHON_VERSION = (3, 14)
 
@@ -66,6 +66,21 @@ optimization_levels = [
 if is_ci() and sys.version_info < PRIMARY_PYTHON_VERSION:
     optimization_levels = [STANDARD_PASSES]
 
+# Compiled functions shared by every test of the session; see tests/script/compile_cache.py.
+compiled_scripts = CompiledScripts()
+# A full run writes about 430 MiB of optimized nodes.
+DISK_CACHE_BYTES = 512 * 1024 * 1024
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if getattr(config, "cache", None) is not None:
+        compiled_scripts.disk = CompileCache(config.cache.mkdir("sonolus-compiled-scripts"), max_bytes=DISK_CACHE_BYTES)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    if compiled_scripts.disk is not None:
+        compiled_scripts.disk.prune()
+
 
 def compile_fn(
     callback: Callable, runtime_checks: RuntimeChecks = RuntimeChecks.NONE
@@ -163,14 +178,24 @@ def run_and_validate[**P, R](
             target._copy_from_(result)
         return result
 
+    key = script_key(fn, args, kwargs)
+
+    def compile_variant(read_closure_from_rom: bool, runtime_checks: RuntimeChecks) -> CompiledScript:
+        def trace() -> CompiledScript:
+            cfg, rom_values = compile_fn(
+                run_compiled_with_closure_from_rom if read_closure_from_rom else run_compiled,
+                runtime_checks=runtime_checks,
+            )
+            return CompiledScript(cfg, rom_values, result_type)
+
+        variant = ("run_and_validate", read_closure_from_rom, runtime_checks)
+        return compiled_scripts.trace(None if key is None else (key, variant), trace)
+
     # Check that it compiles with runtime checks set to None. Exception behavior can differ though, so we don't
     # bother actually running with runtime checks fully disabled.
     for read_closure_from_rom in (False, True):
         try:
-            compile_fn(
-                run_compiled_with_closure_from_rom if read_closure_from_rom else run_compiled,
-                runtime_checks=RuntimeChecks.NONE,
-            )
+            compile_variant(read_closure_from_rom, RuntimeChecks.NONE)
         except CompilationError as e:
             if exception is None:
                 raise
@@ -182,10 +207,7 @@ def run_and_validate[**P, R](
 
     for read_closure_from_rom, passes in itertools.product((False, True), optimization_levels):
         try:
-            cfg, rom_values = compile_fn(
-                run_compiled_with_closure_from_rom if read_closure_from_rom else run_compiled,
-                runtime_checks=RuntimeChecks.TERMINATE,
-            )
+            compiled = compile_variant(read_closure_from_rom, RuntimeChecks.TERMINATE)
         except CompilationError as e:
             if exception is None:
                 raise
@@ -195,12 +217,12 @@ def run_and_validate[**P, R](
             assert type(e) is type(exception)  # noqa: PT017
             raise exception from None
 
-        cfg = run_passes(cfg, passes, OptimizerConfig())
-        entry = cfg_to_engine_node(cfg)
+        result_type = compiled.result_type
+        entry = compiled_scripts.node(compiled, passes)
         interpreter = Interpreter()
-        interpreter.blocks[PlayBlock.EngineRom] = rom_values
+        interpreter.blocks[PlayBlock.EngineRom] = compiled.rom_values
 
-        num_result = interpreter.run(entry)
+        num_result = interpreter.run_compiled(entry)
         if exception is None:
             if result_type == Num:
                 assert num_result == regular_result
@@ -243,18 +265,21 @@ def run_compiled[**P](
         None: (RuntimeChecks.NONE, RuntimeChecks.TERMINATE, RuntimeChecks.NOTIFY_AND_TERMINATE),
     }[runtime_checks]
 
+    key = script_key(fn, args, kwargs)
     results = []
     logs = []
     initial_random_state = random.getstate()
     for passes in optimization_levels:
         for runtime_checks_value in runtime_checks_values:
             random.setstate(initial_random_state)
-            cfg, rom_values = compile_fn(wrapper, runtime_checks=runtime_checks_value)
-            cfg = run_passes(cfg, passes, OptimizerConfig())
-            entry = cfg_to_engine_node(cfg)
+            compiled = compiled_scripts.trace(
+                None if key is None else (key, ("run_compiled", runtime_checks_value)),
+                lambda checks=runtime_checks_value: CompiledScript(*compile_fn(wrapper, runtime_checks=checks)),
+            )
+            entry = compiled_scripts.node(compiled, passes)
             interpreter = Interpreter()
-            interpreter.blocks[PlayBlock.EngineRom] = rom_values
-            result = interpreter.run(entry)
+            interpreter.blocks[PlayBlock.EngineRom] = compiled.rom_values
+            result = interpreter.run_compiled(entry)
             results.append(result)
             logs.append(interpreter.log.copy())
 
@@ -982,3 +982,39 @@ def test_loop_redefinition_of_reference_type_with_invalid_read():
 
     with pytest.raises(CompilationError, match="conflicting definitions"):
         run_compiled(fn)
+
+
+def test_merges_in_large_scope():
+    # Enough bindings that scopes are shared with their copies rather than copied.
+    def fn():
+        a0 = a1 = a2 = a3 = a4 = a5 = a6 = a7 = a8 = a9 = 1
+        b0 = b1 = b2 = b3 = b4 = b5 = b6 = b7 = b8 = b9 = 2
+        c0 = c1 = c2 = c3 = c4 = c5 = c6 = c7 = c8 = c9 = 3
+        d0 = d1 = d2 = d3 = d4 = d5 = d6 = d7 = d8 = d9 = 4
+        x = 0
+        for i in range(5):
+            if black_box():
+                a3 = a3 + i
+            elif i < 2:
+                c7 = c7 * 2
+            else:
+                d9 = d9 - 1
+            x = x + a3 + c7 + d9
+        debug_log(x + a0 + b5 + d0)
+
+    run_and_validate(fn)
+
+
+def test_error_if_conflicting_definitions_in_large_scope():
+    def fn():
+        a0 = a1 = a2 = a3 = a4 = a5 = a6 = a7 = a8 = a9 = 1
+        b0 = b1 = b2 = b3 = b4 = b5 = b6 = b7 = b8 = b9 = 2
+        c0 = c1 = c2 = c3 = c4 = c5 = c6 = c7 = c8 = c9 = 3
+        d0 = d1 = d2 = d3 = d4 = d5 = d6 = d7 = d8 = d9 = 4
+        x = Pair(1, 2)
+        if black_box():
+            x = Pair(3, 4)
+        debug_log(x.first + a0)
+
+    with pytest.raises(CompilationError, match="conflicting definitions"):
+        run_compiled(fn)
@@ -1,8 +1,16 @@
+import linecache
+import traceback
+
+import pytest
+
 from sonolus.script.array import Array
 from sonolus.script.debug import debug_log
-from tests.script.conftest import run_and_validate
+from sonolus.script.internal.error import CompilationError
+from tests.script.conftest import run_and_validate, run_compiled
 from tests.script.test_record import Pair
 
+offset = 10
+
 
 def call_function(f, *args, **kwargs):
     return f(*args, **kwargs)
@@ -1252,3 +1260,32 @@ def test_augassign_subscript_index_evaluated_once():
         return Array(arr[0], arr[1], arr[2], state[0])
 
     assert run_and_validate(fn) == Array(10, 0, 0, 1)
+
+
+def test_global_and_enclosing_names():
+    # `offset` is only read as a global in `fn`, but is bound by the function enclosing `inner`.
+    def fn():
+        def shadowing():
+            offset = 1
+
+            def inner():
+                return offset + 1
+
+            return inner()
+
+        read = lambda: offset  # noqa: E731
+        return offset + shadowing() + read()
+
+    assert run_and_validate(fn) == 22
+
+
+def test_error_location_in_nested_expression():
+    def fn():
+        x = 1
+        return x + (2 * undefined_name)  # noqa: F821
+
+    with pytest.raises(CompilationError, match="undefined_name") as exc_info:
+        run_compiled(fn)
+    frame = [frame for frame in traceback.extract_tb(exc_info.tb) if frame.filename == __file__][-1]
+    assert (frame.filename, frame.name, frame.lineno) == (__file__, "fn", fn.__code__.co_firstlineno + 2)
+    assert linecache.getline(__file__, frame.lineno)[frame.colno : frame.end_colno] == "undefined_name"
@@ -0,0 +1,64 @@
+from sonolus.backend.mode import Mode
+from sonolus.backend.optimize import profiling
+from sonolus.backend.optimize.flow import cfg_to_text
+from sonolus.build.compile import callback_to_cfg
+from sonolus.script.debug import debug_log
+from sonolus.script.internal import visitor
+from sonolus.script.internal.context import ModeContextState, ProjectContextState
+from sonolus.script.quad import Quad
+from sonolus.script.runtime import time
+from sonolus.script.vec import Vec2
+from tests.script.conftest import run_and_validate
+
+
+def transform(quad: Quad, angle: float, scale: float, offset: Vec2) -> Quad:
+    return quad.rotate(angle).scale(Vec2(scale, scale)).translate(offset)
+
+
+def area(quad: Quad) -> float:
+    return abs(quad.bl.x * quad.tl.y - quad.tl.x * quad.bl.y + quad.tr.x * quad.br.y - quad.br.x * quad.tr.y) / 2
+
+
+def callback():
+    quad = Quad(bl=Vec2(0, 0), tl=Vec2(0, time()), tr=Vec2(1, time()), br=Vec2(1, 0))
+    a = transform(quad, time(), 2, Vec2(1, time()))
+    b = transform(a, 0.5, 2, Vec2(time(), 0))
+    c = transform(b, time(), 0.5, a.tl)
+    d = transform(quad, time(), 2, Vec2(1, time()))
+    e = transform(c, 1, time(), b.br)
+    debug_log(area(a) + area(b) + area(c) + area(d) + area(e))
+
+
+def trace() -> str:
+    return cfg_to_text(
+        callback_to_cfg(ProjectContextState(), ModeContextState(Mode.PLAY), callback, "updateSequential")
+    )
+
+
+def test_specialized_trace_matches_unspecialized(monkeypatch):
+    was_enabled = profiling.enabled
+    profiling.enable()
+    profiling.reset()
+    try:
+        specialized = trace()
+        counters = profiling.summary()["counters"]
+    finally:
+        profiling.enabled = was_enabled
+        profiling.reset()
+
+    monkeypatch.setattr(visitor, "call_specialized", lambda fn, bound_args, run: run(bound_args))
+    assert specialized == trace()
+    assert counters["specialization_hit"] > 0
+
+
+def test_repeated_helper_calls():
+    def fn():
+        quad = Quad(bl=Vec2(-1, 0), tl=Vec2(0, 2), tr=Vec2(2, 1), br=Vec2(1, -1))
+        a = transform(quad, 0.25, 2, Vec2(1, -1))
+        b = transform(a, 0.5, 0.5, Vec2(-1, 1))
+        c = transform(b, 1, 3, Vec2(0, 0))
+        d = transform(quad, 0.25, 2, Vec2(1, -1))
+        e = transform(d, 2, 1, c.bl)
+        return area(a) + 2 * area(b) + 3 * area(c) + 5 * area(d) + 7 * area(e) + 11 * e.tr.x + 13 * e.tr.y
+
+    run_and_validate(fn)
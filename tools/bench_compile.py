@@ -69,12 +69,12 @@ def _bench_full(engine, passes, repeat: int) -> list[float]:
 def _phase_split(engine, passes) -> dict:
     """One instrumented build: frontend vs optimize+emit wall time.
 
-    Wraps ``callback_to_cfg`` (frontend tracing) and ``optimize_and_finalize``
+    Wraps ``callback_to_arena`` (frontend tracing) and ``optimize_and_finalize``
     (optimize+emit) to accumulate the time spent in each; the remainder of the
     total is packaging overhead.
     """
     acc = {"frontend": 0.0, "optimize": 0.0}
-    orig_cb = _compile_mod.callback_to_cfg
+    orig_cb = _compile_mod.callback_to_arena
     orig_of = _opt_mod.optimize_and_finalize
     import sonolus.backend._opt.driver as _drv  # noqa: PLC2701 - reset the driver's cached finalize
 
@@ -92,7 +92,7 @@ def _phase_split(engine, passes) -> dict:
         finally:
             acc["optimize"] += perf_counter() - t
 
-    _compile_mod.callback_to_cfg = timed_cb
+    _compile_mod.callback_to_arena = timed_cb
     _opt_mod.optimize_and_finalize = timed_of
     _drv._OPT_FINALIZE = timed_of  # driver caches the finalize callable
     try:
@@ -100,7 +100,7 @@ def _phase_split(engine, passes) -> dict:
         package_engine(engine, BuildConfig(passes=passes))
         total = perf_counter() - start
     finally:
-        _compile_mod.callback_to_cfg = orig_cb
+        _compile_mod.callback_to_arena = orig_cb
         _opt_mod.optimize_and_finalize = orig_of
         _drv._OPT_FINALIZE = orig_of
 
@@ -0,0 +1,101 @@
+"""Frontend benchmark for callbacks with many branches over a large scope.
+
+Generates a callback that binds N locals and then branches N times in an ``if``/``elif``
+chain, each arm rebinding one local, and times tracing it with ``callback_to_cfg``. Every
+branch copies the scope and every join merges it, so the time per branch should stay flat
+as N grows; the last column is the ratio to the previous size, which is about 2 when
+tracing scales linearly and about 4 when it scales quadratically.
+
+Each ``elif`` is nested in the ``else`` of the one before it. The chain is generated
+rather than written out as nested ``if`` statements since Python limits indentation to
+100 levels.
+
+Standard library only (plus the ``sonolus`` package).
+
+Usage::
+
+    uv run python tools/bench_scopes.py
+    uv run python tools/bench_scopes.py --sizes 125,250,500,1000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+# Each elif is traced one level deeper than the one before it.
+sys.setrecursionlimit(100_000)
+
+from sonolus.backend.mode import Mode
+from sonolus.build.compile import callback_to_cfg
+from sonolus.script.internal.context import ModeContextState, ProjectContextState
+
+
+def generate_source(n: int) -> str:
+    lines = ["from sonolus.script.runtime import time", "", "", "def callback():"]
+    lines += [f"    v{i} = {i}" for i in range(n)]
+    lines.append("    acc = 0")
+    for i in range(n):
+        lines.append(f"    {'if' if i == 0 else 'elif'} time() > {i}:")
+        lines.append(f"        acc = acc + v{i}")
+    lines.append("    return acc")
+    return "\n".join(lines) + "\n"
+
+
+def load_callback(n: int, directory: Path):
+    path = directory / f"bench_scopes_{n}.py"
+    path.write_text(generate_source(n), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.callback
+
+
+def bench(callback, repeat: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        callback_to_cfg(ProjectContextState(), ModeContextState(Mode.PLAY), callback, "updateSequential")
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="125,250,500", help="Comma-separated branch counts (default: 125,250,500)")
+    parser.add_argument("--repeat", type=int, default=3, help="Traces per size (default: 3)")
+    args = parser.parse_args(argv)
+
+    try:
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError:
+        parser.error("--sizes must be comma-separated integers")
+    if not sizes or min(sizes) < 1:
+        parser.error("--sizes must be positive")
+    if args.repeat < 1:
+        parser.error("--repeat must be >= 1")
+
+    print(f"{'branches':>10}{'min':>10}{'median':>10}{'per branch':>14}{'ratio':>8}")
+    print("-" * 52)
+    previous = None
+    with tempfile.TemporaryDirectory() as directory:
+        for n in sizes:
+            samples = bench(load_callback(n, Path(directory)), args.repeat)
+            best = min(samples)
+            ratio = f"{best / previous:>8.2f}" if previous else f"{'':>8}"
+            print(f"{n:>10}{best:>9.3f}s{median(samples):>9.3f}s{best / n * 1e6:>12.1f}us{ratio}")
+            previous = best
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
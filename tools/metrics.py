@@ -51,18 +51,13 @@ for _p in (str(_REPO_ROOT / "test_projects"), str(_REPO_ROOT)):
         sys.path.insert(0, _p)
 
 # Frontend tracing can recurse; match the limit the CLI uses for builds (sonolus/build/cli.py).
-# Node/CFG *analysis* in this module is iterative, so it does not depend on this.
+# The node analysis (sonolus/build/report.py) is iterative, so it does not depend on this.
 sys.setrecursionlimit(10_000)
 
-# Blocks whose constant-index read the real runtime constant-folds. Imported from
-# the optimizer core so there is a single source of truth, not a drifting duplicate.
-from sonolus.backend._opt.ir import RUNTIME_CONSTANT_BLOCKS  # noqa: PLC2701
-
 from sonolus.backend.mode import Mode
-from sonolus.backend.node import FunctionNode
-from sonolus.backend.ops import Op
 from sonolus.backend.optimize import OptimizerConfig, cfg_to_engine_node, run_passes
 from sonolus.build.compile import callback_to_cfg
+from sonolus.build.report import analyze_node  # shared with `sonolus-py build --report`
 from sonolus.script.internal.callbacks import (
     navigate_callback,
     preprocess_callback,
@@ -163,171 +158,6 @@ def iter_callback_tasks(project_name, project):
     )
 
 
-# --------------------------------------------------------------------------------------
-# Runtime-constant classification + node counting over the emitted tree
-# --------------------------------------------------------------------------------------
-
-
-def _is_value_node(node) -> bool:
-    return isinstance(node, (int, float)) and not isinstance(node, bool)
-
-
-def _block_is_runtime_constant(block, mode, callback_name: str) -> bool:
-    """The optimizer's runtime-constant block rule.
-
-    The block id must resolve to a BlockData whose name is in RUNTIME_CONSTANT_BLOCKS
-    AND that is not writable in the current callback (a block the callback can write is
-    not constant at runtime even if the runtime treats it as constant elsewhere).
-    """
-    if isinstance(block, float):
-        if not block.is_integer():
-            return False
-        block = int(block)
-    if not isinstance(block, int) or isinstance(block, bool):
-        return False
-    try:
-        block_data = mode.blocks(block)
-    except ValueError:
-        return False
-    return block_data.name in RUNTIME_CONSTANT_BLOCKS and callback_name not in block_data.writable
-
-
-def _node_is_runtime_constant(node: FunctionNode, is_rc: dict[int, bool], mode, callback_name: str) -> bool:
-    op = node.func
-    if op is Op.Get and len(node.args) == 2:
-        block, index = node.args
-        return (
-            _is_value_node(block) and _is_value_node(index) and _block_is_runtime_constant(block, mode, callback_name)
-        )
-    if op.pure:
-        # Pure ops (including And/Or/If/Switch appearing *inside* statement trees) fold
-        # when all args are runtime-constant. Classification is value-based; the CFG
-        # skeleton is handled positionally by _skeleton_effective, not by excluding
-        # nodes here, so a terminator that the emitter interned to the same object as a
-        # statement select still folds correctly at its statement occurrence.
-        return all(is_rc[id(arg)] for arg in node.args)
-    return False
-
-
-def _skeleton_effective(root, sub_eff: dict[int, int]) -> int:
-    """Effective node count with the CFG skeleton classified by *position*.
-
-    The runtime compiles the block *structure* to bytecode and constant-folds only the
-    expressions within, so the outer Block, the JumpLoop, each per-block Execute, and
-    each Execute's final terminator (If/Switch* over block indexes) are structural
-    containers that never fold: each counts 1, and its operand subtrees (statements,
-    terminator test expressions) contribute their value-based ``sub_eff``.
-
-    Position-based, not identity-based: the hash-consing emitter can intern a terminator
-    node to the very same object as a statement-level select, so an identity set would
-    wrongly force that shared statement subtree to never fold (inflating the count).
-    Walking the Block -> JumpLoop -> Execute* -> terminator spine by position keeps each
-    occurrence classified by where it sits in the tree.
-    """
-    if not (isinstance(root, FunctionNode) and root.func is Op.Block and len(root.args) == 1):
-        return sub_eff[id(root)]
-    jump_loop = root.args[0]
-    if not (isinstance(jump_loop, FunctionNode) and jump_loop.func is Op.JumpLoop):
-        return sub_eff[id(root)]
-    total = 2  # Block + JumpLoop container nodes
-    for execute in jump_loop.args:
-        if not (isinstance(execute, FunctionNode) and execute.func is Op.Execute):
-            total += sub_eff[id(execute)]
-            continue
-        total += 1  # Execute container node
-        args = execute.args
-        for stmt in args[:-1]:
-            total += sub_eff[id(stmt)]
-        if args:
-            terminator = args[-1]
-            if isinstance(terminator, FunctionNode):
-                total += 1  # terminator container node
-                for targ in terminator.args:
-                    total += sub_eff[id(targ)]
-            else:
-                total += sub_eff[id(terminator)]
-    return total
-
-
-def _post_order(root):
-    """Return unique nodes (by identity) in topological post-order.
-
-    Every node appears after all of its descendants. Works for trees and DAGs
-    (the emitted node tree is hash-consed, so shared subtrees are DAG edges);
-    each unique node appears exactly once. The tree is acyclic by construction.
-    """
-    order = []
-    entered: set[int] = set()
-    done: set[int] = set()
-    stack = [(root, False)]
-    while stack:
-        node, processed = stack.pop()
-        nid = id(node)
-        if processed:
-            if nid in done:
-                continue
-            done.add(nid)
-            order.append(node)
-            continue
-        if nid in entered:
-            continue
-        entered.add(nid)
-        stack.append((node, True))
-        if isinstance(node, FunctionNode):
-            stack.extend((arg, False) for arg in node.args if id(arg) not in entered)
-    return order
-
-
-def analyze_node(root, mode, callback_name: str) -> dict:
-    """Compute per-reference node counts, effective count, and per-op counts.
-
-    Counts are memoized per unique node and combined so shared subtrees are
-    counted once per reference without exponential expansion.
-    """
-    post = _post_order(root)
-
-    is_rc: dict[int, bool] = {}
-    sub_fn: dict[int, int] = {}
-    sub_val: dict[int, int] = {}
-    sub_eff: dict[int, int] = {}
-    sub_ops: dict[int, Counter] = {}
-
-    for node in post:
-        nid = id(node)
-        if isinstance(node, FunctionNode):
-            is_rc[nid] = _node_is_runtime_constant(node, is_rc, mode, callback_name)
-            fn = 1
-            val = 0
-            ops: Counter = Counter()
-            ops[node.func.name] += 1
-            for arg in node.args:
-                aid = id(arg)
-                fn += sub_fn[aid]
-                val += sub_val[aid]
-                ops += sub_ops[aid]
-            sub_fn[nid] = fn
-            sub_val[nid] = val
-            sub_ops[nid] = ops
-            if is_rc[nid]:
-                sub_eff[nid] = 1
-            else:
-                sub_eff[nid] = 1 + sum(sub_eff[id(arg)] for arg in node.args)
-        else:  # value node (int/float): always runtime-constant
-            is_rc[nid] = True
-            sub_fn[nid] = 0
-            sub_val[nid] = 1
-            sub_eff[nid] = 1
-            sub_ops[nid] = Counter()
-
-    rid = id(root)
-    return {
-        "function_node_count": sub_fn[rid],
-        "value_node_count": sub_val[rid],
-        "effective_node_count": _skeleton_effective(root, sub_eff),
-        "per_op_counts": dict(sub_ops[rid]),
-    }
-
-
 # --------------------------------------------------------------------------------------
 # Per-callback measurement
 # --------------------------------------------------------------------------------------